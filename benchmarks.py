@@ -0,0 +1,336 @@
+"""
+Benchmark Suite with Regression Baselines
+
+Times the counters and the flip analysis at several sizes and checks the
+results against a stored baseline:
+
+    python -m benchmarks                       # run, compare, write results
+    python -m benchmarks --update-baseline     # accept the results as baseline
+    python -m benchmarks --quick --case rooted_trees.cold
+
+Every case is measured at a series of sizes. For each size the suite
+records the best wall time of a few repetitions and the peak traced
+memory of one more (tracemalloc, run separately so that tracing does not
+distort the timings). The scaling exponent is the least-squares slope of
+log(time) against log(size). A cold case recompiles the tables first, so it
+measures the computation itself. A warm case times repeated queries for
+already-computed terms.
+
+A run fails (exit status 1) when a case is slower than its baseline by
+more than the threshold at its largest size, or its scaling exponent
+exceeds the baseline's by more than the exponent slack. The exponent is
+largely independent of the machine, so a quadratic path turning cubic is
+caught even against a baseline recorded elsewhere. The repository ships
+such a portable baseline, the exponents of a full run without its times
+(--update-baseline --exponents-only); a run without any baseline fails.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+import circle_topology
+from circle_topology import TOPOLOGY_GRAMMAR, CircleTopology
+from flip_transforms import CircleExpression, find_flip_clusters
+from topology_index import canonical_expressions
+
+
+# Default location of the stored baseline
+BASELINE = 'benchmarks_baseline.json'
+
+# Allowed relative slowdown at the largest size, and allowed exponent increase
+THRESHOLD = 0.5
+EXPONENT_SLACK = 0.3
+
+# Timed repetitions per size; the best one is kept
+REPEATS = 3
+
+# Warm queries are timed in batches of this many calls
+WARM_CALLS = 20000
+
+
+class Case(NamedTuple):
+    """
+    One benchmark case.
+
+    prepare(size) returns the zero-argument callable to time; it runs
+    outside the timed region and may reset state.
+    """
+    name: str
+    sizes: Sequence[int]
+    quick_sizes: Sequence[int]
+    prepare: Callable[[int], Callable[[], object]]
+    per_call: int = 1
+
+
+@contextmanager
+def fresh_tables() -> Iterator[None]:
+    """
+    Swap in newly compiled coefficient generators, restoring the shared ones after.
+
+    The precomputed tables are switched off meanwhile, so every term is computed.
+    """
+    names = ('_CATALAN', '_TREES', '_PAIRS', '_TRIPLES', '_PRECOMPUTED_TERMS')
+    saved = {name: getattr(circle_topology, name) for name in names}
+    circle_topology._PRECOMPUTED_TERMS = 0
+    circle_topology._CATALAN = TOPOLOGY_GRAMMAR.compile('catalan')
+    circle_topology._TREES = TOPOLOGY_GRAMMAR.compile('rooted', 'unrooted')
+    circle_topology._PAIRS = TOPOLOGY_GRAMMAR.compile('pairs')
+    circle_topology._TRIPLES = TOPOLOGY_GRAMMAR.compile('triples')
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(circle_topology, name, value)
+
+
+def _cold(function: Callable[[int], object]) -> Callable[[int], Callable[[], object]]:
+    def prepare(n):
+        def run():
+            with fresh_tables():
+                function(n)
+        return run
+    return prepare
+
+
+def _warm(function: Callable[[int], object]) -> Callable[[int], Callable[[], object]]:
+    def prepare(n):
+        function(n)
+
+        def run():
+            for _ in range(WARM_CALLS):
+                function(n)
+        return run
+    return prepare
+
+
+def _flip_clusters(n: int) -> Callable[[], object]:
+    expressions = list(canonical_expressions(n))
+    return lambda: find_flip_clusters(expressions)
+
+
+def _flip_transforms(n: int) -> Callable[[], object]:
+    expressions = [CircleExpression(e) for e in canonical_expressions(n)]
+    return lambda: [e.flip_transform() for e in expressions]
+
+
+def _cases() -> List[Case]:
+    counters = ('rooted_trees', 'unrooted_trees', 'catalan_number',
+                'pairs_may_intersect', 'triples_may_intersect')
+    cases = []
+    for name in counters:
+        function = getattr(CircleTopology, name)
+        cases.append(Case(f'{name}.cold', (200, 400, 800), (50, 100, 200), _cold(function)))
+        cases.append(Case(f'{name}.warm', (200, 400, 800), (50, 100, 200), _warm(function),
+                          per_call=WARM_CALLS))
+    for kind in ('none', 'pairs', 'triples'):
+        def sequence(n, kind=kind):
+            return CircleTopology.generate_sequence(n, kind)
+        cases.append(Case(f'generate_sequence.{kind}.cold', (200, 400, 800), (50, 100, 200),
+                          _cold(sequence)))
+    # Sizes are numbers of circles; the flip cases scale with the number of
+    # topologies, which is what their exponents are fitted against
+    cases.append(Case('find_flip_clusters', (6, 7, 8, 9), (4, 5, 6), _flip_clusters))
+    cases.append(Case('flip_transform', (7, 8, 9, 10), (4, 5, 6), _flip_transforms))
+    return cases
+
+
+CASES = {case.name: case for case in _cases()}
+
+
+def fit_exponent(sizes: Sequence[float], times: Sequence[float]) -> float:
+    """
+    Return the least-squares slope of log(time) against log(size).
+
+    Args:
+        sizes: Problem sizes
+        times: Measured times, all positive
+
+    Returns:
+        Scaling exponent (0.0 with fewer than two distinct sizes)
+    """
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def _scale(case: Case, n: int) -> int:
+    """The size the exponent of a case is fitted against."""
+    if case.name.startswith(('find_flip', 'flip_')):
+        return CircleTopology.non_intersecting_circles(n)
+    return n
+
+
+def measure(case: Case, quick: bool = False, repeats: int = REPEATS) -> Dict[str, object]:
+    """
+    Run one case at all of its sizes.
+
+    Args:
+        case: Case to run
+        quick: Use the small sizes
+        repeats: Timed repetitions per size
+
+    Returns:
+        Dict with sizes, times (seconds per call), peak_memory (bytes) and exponent
+    """
+    sizes = list(case.quick_sizes if quick else case.sizes)
+    # Repetitions cycle through the sizes, so that a burst of machine load
+    # cannot spoil every repetition of one size and bend the exponent
+    best = [math.inf] * len(sizes)
+    for _ in range(repeats):
+        for i, n in enumerate(sizes):
+            run = case.prepare(n)
+            start = time.perf_counter()
+            run()
+            best[i] = min(best[i], time.perf_counter() - start)
+    times = [t / case.per_call for t in best]
+
+    memory = []
+    for n in sizes:
+        run = case.prepare(n)
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        run()
+        memory.append(tracemalloc.get_traced_memory()[1])
+        if not tracing:
+            tracemalloc.stop()
+    return {
+        'sizes': sizes,
+        'times': times,
+        'peak_memory': memory,
+        'exponent': fit_exponent([_scale(case, n) for n in sizes], times),
+    }
+
+
+def run_benchmarks(names: Optional[Sequence[str]] = None, quick: bool = False,
+                   repeats: int = REPEATS) -> Dict[str, object]:
+    """
+    Run benchmark cases.
+
+    Args:
+        names: Case names (all cases if omitted)
+        quick: Use the small sizes
+        repeats: Timed repetitions per size
+
+    Returns:
+        JSON-serializable results: environment and per-case measurements
+    """
+    names = list(names or CASES)
+    for name in names:
+        if name not in CASES:
+            raise ValueError(f"Unknown benchmark case: {name}")
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'quick': quick,
+        'cases': {name: measure(CASES[name], quick, repeats) for name in names},
+    }
+
+
+def compare(results: Dict[str, object], baseline: Dict[str, object],
+            threshold: float = THRESHOLD, exponent_slack: float = EXPONENT_SLACK) -> List[str]:
+    """
+    List the regressions of results against a baseline.
+
+    Cases measured at different sizes than in the baseline, or against a
+    baseline without times, are compared by exponent only. Nothing is
+    compared between a quick run and a full baseline or the reverse, since
+    exponents fitted over different size ranges differ.
+
+    Args:
+        results: Output of run_benchmarks
+        baseline: Earlier output of run_benchmarks
+        threshold: Allowed relative slowdown at the largest size
+        exponent_slack: Allowed increase of the scaling exponent
+
+    Returns:
+        One message per regression (empty if none)
+    """
+    problems = []
+    if baseline.get('quick', results.get('quick')) != results.get('quick'):
+        return problems
+    for name, current in results['cases'].items():
+        reference = baseline.get('cases', {}).get(name)
+        if reference is None:
+            continue
+        if 'times' in reference and current['sizes'] == reference['sizes']:
+            now, before = current['times'][-1], reference['times'][-1]
+            if now > before * (1 + threshold):
+                problems.append(f"{name}: {now:.3g} s at size {current['sizes'][-1]}, "
+                                f"baseline {before:.3g} s")
+        # A negative fitted exponent is timer noise around a constant cost
+        if current['exponent'] > max(reference['exponent'], 0.0) + exponent_slack:
+            problems.append(f"{name}: scaling exponent {current['exponent']:.2f}, "
+                            f"baseline {reference['exponent']:.2f}")
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point (python -m benchmarks)."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description="Run the benchmark suite and check for regressions.")
+    parser.add_argument('--case', action='append', choices=sorted(CASES),
+                        help="case to run (repeatable; default all)")
+    parser.add_argument('--quick', action='store_true', help="use the small sizes")
+    parser.add_argument('--repeats', type=int, default=REPEATS,
+                        help=f"timed repetitions per size (default {REPEATS})")
+    parser.add_argument('--output', default='benchmarks_results.json',
+                        help="where to write the results")
+    parser.add_argument('--baseline', default=BASELINE, help=f"baseline file (default {BASELINE})")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="write the results to the baseline file instead of comparing")
+    parser.add_argument('--exponents-only', action='store_true',
+                        help="with --update-baseline, record only the machine-independent exponents")
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help=f"allowed relative slowdown (default {THRESHOLD})")
+    parser.add_argument('--exponent-slack', type=float, default=EXPONENT_SLACK,
+                        help=f"allowed exponent increase (default {EXPONENT_SLACK})")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.case, args.quick, args.repeats)
+    for name, result in results['cases'].items():
+        print(f"{name:<36} {result['times'][-1]:>10.3g} s  exponent {result['exponent']:5.2f}  "
+              f"peak {result['peak_memory'][-1]:>10} B")
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        if args.exponents_only:
+            for result in results['cases'].values():
+                del result['times'], result['peak_memory']
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one",
+              file=sys.stderr)
+        return 2
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get('quick') != results['quick']:
+        print(f"Baseline {args.baseline} is from a {'quick' if baseline.get('quick') else 'full'} "
+              f"run; nothing compared")
+    problems = compare(results, baseline, args.threshold, args.exponent_slack)
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Generator of the Precomputed Table Module
+
+Writes topology_tables.py, the packed first terms of every tabulated
+sequence, which the counters of circle_topology consult before computing:
+
+    python -m build_tables --terms 1000
+
+A table is a little-endian uint32 count N, N + 1 uint32 offsets and the
+terms as unsigned little-endian bytes, term n spanning data bytes
+offsets[n]..offsets[n + 1]. The module stores each table base64-encoded,
+so importing it costs one string constant per sequence; circle_topology
+decodes a table on its first lookup and converts single terms on demand.
+"""
+
+import argparse
+import base64
+import sys
+from typing import List, Optional
+
+from region_grammar import CoefficientGenerator
+
+
+# Terms per sequence shipped in the repository
+TERMS = 1000
+
+# Families of the tables, in the order they are written
+FAMILIES = ('catalan', 'rooted', 'unrooted', 'pairs', 'triples')
+
+_LINE = 76
+
+
+def encode_table(values: List[int]) -> bytes:
+    """
+    Pack nonnegative integers into an offset index followed by their bytes.
+
+    Args:
+        values: Terms to pack
+
+    Returns:
+        Table in the layout of the module docstring
+    """
+    offsets = bytearray(len(values).to_bytes(4, 'little'))
+    data = bytearray()
+    for value in values:
+        offsets += len(data).to_bytes(4, 'little')
+        data += value.to_bytes((value.bit_length() + 7) // 8, 'little')
+    offsets += len(data).to_bytes(4, 'little')
+    return bytes(offsets + data)
+
+
+def render_module(tables: dict, terms: int) -> str:
+    """Return the source of the table module."""
+    lines = [
+        '"""',
+        'Precomputed Terms of the Counting Sequences',
+        '',
+        f'Generated by build_tables.py (python -m build_tables --terms {terms}); do',
+        'not edit. See build_tables for the layout of the packed tables.',
+        '"""',
+        '',
+        f'TERMS = {terms}',
+        '',
+        'TABLES = {',
+    ]
+    for family, table in tables.items():
+        text = base64.b64encode(table).decode('ascii')
+        lines.append(f"    '{family}': (")
+        for start in range(0, len(text), _LINE):
+            lines.append(f"        '{text[start:start + _LINE]}'")
+        lines.append('    ),')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def build(terms: int = TERMS) -> dict:
+    """
+    Compute the tables of the first terms of every family.
+
+    Args:
+        terms: Number of terms per family, a(0) .. a(terms - 1)
+
+    Returns:
+        Dict of family name to packed table
+    """
+    from circle_topology import TOPOLOGY_GRAMMAR
+    generators = {}
+    tables = {}
+    for family in FAMILIES:
+        # Fresh generators, so that no existing table module is consulted
+        families = ('rooted', 'unrooted') if family in ('rooted', 'unrooted') else (family,)
+        if families not in generators:
+            generators[families] = TOPOLOGY_GRAMMAR.compile(*families)
+        generator: CoefficientGenerator = generators[families]
+        tables[family] = encode_table(generator.prefix(family, terms - 1))
+    return tables
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point (python -m build_tables)."""
+    parser = argparse.ArgumentParser(prog='python -m build_tables',
+                                     description="Generate the precomputed table module.")
+    parser.add_argument('--terms', type=int, default=TERMS,
+                        help=f"terms per sequence (default {TERMS})")
+    parser.add_argument('-o', '--output', default='topology_tables.py',
+                        help="module to write (default topology_tables.py)")
+    args = parser.parse_args(argv)
+    if args.terms < 1:
+        parser.error("terms must be positive")
+    with open(args.output, 'w') as f:
+        f.write(render_module(build(args.terms), args.terms))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,827 @@
+"""
+Geometric Classification of Circle Arrangements
+
+Derives the topology of a concrete set of circles, given as NumPy arrays of
+centers and radii, and returns it in the parentheses notation of
+flip_transforms.
+
+For pairwise non-intersecting (and non-tangent) circles the nesting forest
+is built with a sweep line over the x-extents of the circles. The sweep
+status holds the upper and lower arcs of the circles cut by the sweep line,
+ordered by height. Arcs of disjoint or nested circles never cross, so the
+order found at insertion stays valid until the arcs are removed, and the
+arc directly above the leftmost point of a new circle decides its parent:
+the upper arc of C means the new circle lies inside C, the lower arc of C
+means it lies beside C inside C's parent. Every event costs O(log n) in a
+bucketed ordered list, O(n log n) in total, instead of the O(n^2) of
+pairwise containment tests. The events are handled in the interpreter,
+though, and each one evaluates arc heights through a Python key function
+in its bisections: the measured rate is 10 to 40 us per circle, rising
+with the number of arcs the sweep line cuts (2 to 8 s for 2 * 10^5
+circles), so a frame of 10^6 circles takes tens of seconds.
+
+Circle sets in which pairs or triples intersect are classified by
+classify_arrangement and, for many frames at once, classify_frames. Rim
+crossings are found with a uniform grid over the bounding boxes of the
+circles, vectorized across all frames of a batch. Circles joined by
+crossings form a component: a single circle, an intersecting pair or one
+of the six 3-circle topologies of the paper (Section "Outlook: 3-circle
+Intersections"). Every other component lies in one region of its
+innermost enclosing component, and the result is written in the
+serialized notation of the paper:
+
+    (A)                 a circle holding A
+    [A[B]C]             an intersecting pair, reg3 = A, reg2 = B, reg1 = C
+    {k|R1|R2|...}       a 3-circle intersection of type 3,k with its
+                        regions in the order listed in the paper
+
+Expressions are canonical: siblings are ordered as in
+canonical_expression_from_parents, and of the region orders related by
+a symmetry of the component (such as swapping reg1 and reg3 of a pair)
+only the least is emitted.
+
+In the other direction, layout_expression and layout_expressions realize
+parentheses expressions as concrete circles, for rendering and for
+generating test arrangements.
+
+This module requires NumPy; the counting modules do not.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import permutations
+from math import atan2, cos, pi, sin, sqrt
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from flip_transforms import CircleExpression, canonical_expression_from_parents
+
+
+# Bucket size limit of the sweep status; buckets are split in half beyond it
+_BUCKET_LOAD = 512
+
+
+def _as_circles(centers, radii) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Validate inputs and return x, y and r as float64 arrays."""
+    centers = np.asarray(centers, dtype=np.float64)
+    radii = np.asarray(radii, dtype=np.float64)
+    if centers.ndim != 2 or centers.shape[1] != 2:
+        raise ValueError(f"centers must have shape (n, 2), got {centers.shape}")
+    if radii.shape != (centers.shape[0],):
+        raise ValueError(f"radii must have shape ({centers.shape[0]},), got {radii.shape}")
+    if radii.size and not np.all(radii > 0):
+        raise ValueError("radii must be positive")
+    return centers[:, 0], centers[:, 1], radii
+
+
+def nesting_parents(centers, radii) -> np.ndarray:
+    """
+    Compute the nesting forest of pairwise non-intersecting circles.
+
+    The sweep runs at 10 to 40 us per circle (see the module docstring).
+
+    Args:
+        centers: Array of shape (n, 2) with the circle centers
+        radii: Array of shape (n,) with the circle radii
+
+    Returns:
+        Integer array where entry i is the index of the smallest circle
+        enclosing circle i, or -1 if circle i is not enclosed
+    """
+    x, y, r = _as_circles(centers, radii)
+    n = len(r)
+    parents = [-1] * n
+    if n == 0:
+        return np.array(parents, dtype=np.int64)
+
+    # Events: circle i enters at x - r (code 2i + 1) and leaves at x + r
+    # (code 2i). Removals sort before insertions at the same abscissa.
+    positions = np.concatenate((x - r, x + r))
+    codes = np.concatenate((np.arange(n) * 2 + 1, np.arange(n) * 2))
+    kinds = np.concatenate((np.ones(n, dtype=np.int8), np.zeros(n, dtype=np.int8)))
+    order = np.lexsort((kinds, positions))
+    event_x = positions[order].tolist()
+    event_code = codes[order].tolist()
+
+    cx, cy, rr = x.tolist(), y.tolist(), (r * r).tolist()
+
+    # Sweep status: arcs ordered by height at the current sweep position.
+    # Arc 2i is the upper arc of circle i, arc 2i + 1 its lower arc.
+    buckets: List[List[int]] = []
+    sweep = [0.0]
+
+    def height(arc: int) -> float:
+        i = arc >> 1
+        dx = sweep[0] - cx[i]
+        h = rr[i] - dx * dx
+        h = sqrt(h) if h > 0.0 else 0.0
+        return cy[i] - h if arc & 1 else cy[i] + h
+
+    def bucket_key(bucket: List[int]) -> float:
+        return height(bucket[-1])
+
+    for pos, code in zip(event_x, event_code):
+        sweep[0] = pos
+        i = code >> 1
+        if code & 1:
+            # Insertion at the leftmost point (pos, cy[i])
+            target = cy[i]
+            b = bisect_right(buckets, target, key=bucket_key)
+            if b == len(buckets):
+                if buckets:
+                    b -= 1
+                    k = len(buckets[b])
+                else:
+                    buckets.append([])
+                    b, k = 0, 0
+            else:
+                k = bisect_right(buckets[b], target, key=height)
+            bucket = buckets[b]
+
+            # First arc above the new circle decides its parent
+            if k < len(bucket):
+                above = bucket[k]
+            elif b + 1 < len(buckets):
+                above = buckets[b + 1][0]
+            else:
+                above = -1
+            if above >= 0:
+                j = above >> 1
+                parents[i] = j if above & 1 == 0 else parents[j]
+
+            bucket[k:k] = [2 * i + 1, 2 * i]
+            if len(bucket) > 2 * _BUCKET_LOAD:
+                buckets[b:b + 1] = [bucket[:_BUCKET_LOAD], bucket[_BUCKET_LOAD:]]
+        else:
+            # Removal at the rightmost point: the two arcs of circle i are
+            # adjacent, since every circle inside it has already left
+            target = cy[i]
+            lower = 2 * i + 1
+            b = min(bisect_left(buckets, target, key=bucket_key), len(buckets) - 1)
+            k = bisect_left(buckets[b], target, key=height)
+            if k >= len(buckets[b]) or buckets[b][k] != lower:
+                # Rounding put the search next to the arc; look around it
+                b, k = _find_arc(buckets, b, lower)
+            bucket = buckets[b]
+            if k + 1 < len(bucket):
+                del bucket[k:k + 2]
+            else:
+                # The upper arc starts the next bucket
+                del bucket[k]
+                del buckets[b + 1][0]
+                if not buckets[b + 1]:
+                    del buckets[b + 1]
+            if not bucket:
+                del buckets[b]
+
+    return np.array(parents, dtype=np.int64)
+
+
+def _find_arc(buckets: List[List[int]], near: int, arc: int) -> Tuple[int, int]:
+    """Return (bucket, offset) of an arc, searching outward from bucket near."""
+    for distance in range(len(buckets)):
+        for b in (near - distance, near + distance):
+            if 0 <= b < len(buckets):
+                try:
+                    return b, buckets[b].index(arc)
+                except ValueError:
+                    pass
+    raise ValueError("Arc missing from sweep status; circles may intersect")
+
+
+def classify_circles(centers, radii) -> CircleExpression:
+    """
+    Classify a set of pairwise non-intersecting circles.
+
+    Args:
+        centers: Array of shape (n, 2) with the circle centers
+        radii: Array of shape (n,) with the circle radii
+
+    Returns:
+        The canonical CircleExpression of the arrangement
+    """
+    parents = nesting_parents(centers, radii)
+    return CircleExpression(canonical_expression_from_parents(parents.tolist()))
+
+
+# Bounding boxes spanning at least this many grid cells are tested against
+# the rest of their frame directly instead of being rasterized
+_GRID_SPAN = 8
+
+# Component kinds: a circle, an intersecting pair, and the 3-circle
+# topologies 3,1 ... 3,6 of the paper. Each kind has the token opening its
+# serialized form, its region labels in serialized order and the role
+# permutations of its symmetry group. A label is the set of roles of the
+# circles covering the region; ('dup', k) tells apart the two regions of
+# 3,4 and 3,5 that share a cover, and 'hole' is the uncovered center of 3,2.
+_Label = Union[FrozenSet[int], Tuple[str, int], str]
+
+
+def _labels(*regions) -> Tuple[_Label, ...]:
+    """Translate region names of the paper (circles numbered from 1) to labels."""
+    return tuple(frozenset(int(c) - 1 for c in name) if isinstance(name, str) and name.isdigit()
+                 else name for name in regions)
+
+
+_MIRROR = [(0, 1, 2), (2, 1, 0)]
+_KINDS = (
+    ('(', _labels('1'), [(0,)], None),
+    ('[', _labels('1', '12', '2'), [(0, 1), (1, 0)], None),
+    ('{1', _labels('1', '12', '2', '23', '3', '13', '123'), list(permutations(range(3))), None),
+    ('{2', _labels('1', '12', '2', '23', '3', '13', 'hole'), list(permutations(range(3))), None),
+    ('{3', _labels('1', '12', '2', '23', '3'), _MIRROR, None),
+    ('{4', _labels('1', '12', '123', '23', '3', ('dup', 0), ('dup', 1)), _MIRROR, frozenset({1})),
+    ('{5', _labels('1', '12', '123', '23', '3', ('dup', 0), ('dup', 1)), _MIRROR, frozenset({0, 2})),
+    ('{6', _labels('1', '12', '123', '23', '2'), [(0, 1, 2)], None),
+)
+_CIRCLE, _PAIR, _RGB, _TORN, _CHAIN, _CROSSED, _SHRUNK, _BUNDLE = range(len(_KINDS))
+
+
+def _symmetries(labels: Tuple[_Label, ...], roles: List[Tuple[int, ...]],
+                swap_dup: bool) -> List[Tuple[int, ...]]:
+    """Region permutations induced by the role permutations (and dup swap)."""
+    perms = set()
+    for sigma in roles:
+        for swap in ((False, True) if swap_dup else (False,)):
+            image = []
+            for label in labels:
+                if isinstance(label, frozenset):
+                    label = frozenset(sigma[c] for c in label)
+                elif isinstance(label, tuple) and swap:
+                    label = ('dup', 1 - label[1])
+                image.append(labels.index(label))
+            perms.add(tuple(image))
+    return sorted(perms)
+
+
+_SYMMETRIES = [_symmetries(labels, roles, dup is not None) for _, labels, roles, dup in _KINDS]
+
+
+def _circle_crossings(x0, y0, r0, x1, y1, r1) -> List[Tuple[float, float]]:
+    """The two points where the rims of two crossing circles meet."""
+    dx, dy = x1 - x0, y1 - y0
+    d = sqrt(dx * dx + dy * dy)
+    a = (r0 * r0 - r1 * r1 + d * d) / (2 * d)
+    h = sqrt(max(r0 * r0 - a * a, 0.0))
+    mx, my = x0 + a * dx / d, y0 + a * dy / d
+    return [(mx - h * dy / d, my + h * dx / d), (mx + h * dy / d, my - h * dx / d)]
+
+
+class _Component:
+    """
+    Two or three circles joined by rim crossings.
+    
+    The circles are stored in role order, so that region labels refer to
+    positions in ``circles``. Arcs of the arrangement are only built for
+    3-circle components, which need them to tell their type and to locate
+    points in regions sharing a cover.
+    """
+    
+    def __init__(self, circles: List[Tuple[float, float, float]], crossing: List[Tuple[int, int]]):
+        self.circles = circles
+        self.cycles: List[list] = []
+        if len(circles) == 2:
+            self.kind = _PAIR
+            return
+        
+        degree = [0, 0, 0]
+        for i, j in crossing:
+            degree[i] += 1
+            degree[j] += 1
+        if len(crossing) == 2:
+            middle = degree.index(2)
+            a, b = [c for c in range(3) if c != middle]
+            (xa, ya, ra), (xb, yb, rb) = circles[a], circles[b]
+            if ra < rb:
+                a, b, ra, rb = b, a, rb, ra
+            if sqrt((xa - xb) ** 2 + (ya - yb) ** 2) + rb < ra:
+                # The middle circle crosses a circle and one it encloses
+                self._assign(_BUNDLE, [middle, a, b])
+            else:
+                self._assign(_CHAIN, [a, middle, b])
+            return
+        
+        covers = {label for arc in self._arcs() for label in arc[5:7]}
+        if frozenset(range(3)) not in covers:
+            self._assign(_TORN, [0, 1, 2])
+        else:
+            missing = [frozenset(s) for s in ((0,), (1,), (2,), (0, 1), (1, 2), (0, 2))
+                       if frozenset(s) not in covers]
+            if not missing:
+                self._assign(_RGB, [0, 1, 2])
+            elif len(missing) == 1 and len(missing[0]) == 2:
+                a, b = sorted(missing[0])
+                self._assign(_CROSSED, [a, 3 - a - b, b])
+            elif len(missing) == 1:
+                (m,) = missing[0]
+                a, b = [c for c in range(3) if c != m]
+                self._assign(_SHRUNK, [a, m, b])
+            else:
+                raise ValueError("Unrecognized intersection of three circles")
+    
+    def _assign(self, kind: int, order: List[int]):
+        """Fix the kind and put the circles in role order."""
+        self.kind = kind
+        self.circles = [self.circles[c] for c in order]
+        dup = _KINDS[kind][3]
+        if dup is not None:
+            self.cycles = self._boundary_cycles(lambda arc: dup in arc[5:7])
+        elif kind == _TORN:
+            # Of the two cycles bounding uncovered area keep the inner one
+            cycles = self._boundary_cycles(lambda arc: not arc[6])
+            left = min(range(3), key=lambda c: self.circles[c][0] - self.circles[c][2])
+            self.cycles = [cycle for cycle in cycles
+                           if not any(arc[0] == left and arc[1] <= pi <= arc[2] for arc in cycle)]
+    
+    def _arcs(self) -> List[tuple]:
+        """Arcs (circle, start, end, vertex, vertex, inner cover, outer cover)."""
+        circles = self.circles
+        ends: List[List[tuple]] = [[] for _ in circles]
+        for i in range(len(circles)):
+            for j in range(i + 1, len(circles)):
+                (xi, yi, ri), (xj, yj, rj) = circles[i], circles[j]
+                if abs(ri - rj) < sqrt((xi - xj) ** 2 + (yi - yj) ** 2) < ri + rj:
+                    for s, (px, py) in enumerate(_circle_crossings(xi, yi, ri, xj, yj, rj)):
+                        for c in (i, j):
+                            cx, cy, _ = circles[c]
+                            ends[c].append((atan2(py - cy, px - cx), (i, j, s)))
+        arcs = []
+        for c, (cx, cy, cr) in enumerate(circles):
+            points = sorted(ends[c])
+            for (t0, v0), (t1, v1) in zip(points, points[1:] + points[:1]):
+                if t1 <= t0:
+                    t1 += 2 * pi
+                mx, my = cx + cr * cos((t0 + t1) / 2), cy + cr * sin((t0 + t1) / 2)
+                cover = frozenset(o for o, (ox, oy, orr) in enumerate(circles)
+                                  if o != c and (mx - ox) ** 2 + (my - oy) ** 2 < orr * orr)
+                arcs.append((c, t0, t1, v0, v1, cover | {c}, cover))
+        return arcs
+    
+    def _boundary_cycles(self, selected) -> List[list]:
+        """Group the selected arcs into closed boundary curves."""
+        arcs = [arc for arc in self._arcs() if selected(arc)]
+        root: Dict[tuple, tuple] = {}
+        
+        def find(v):
+            while root.setdefault(v, v) != v:
+                v = root[v]
+            return v
+        
+        for arc in arcs:
+            root[find(arc[3])] = find(arc[4])
+        cycles: Dict[tuple, list] = {}
+        for arc in arcs:
+            cycles.setdefault(find(arc[3]), []).append(arc)
+        return list(cycles.values())
+    
+    def _inside(self, px: float, py: float, cycle: list) -> bool:
+        """Ray-crossing parity of a point against a closed curve of arcs."""
+        inside = False
+        for c, t0, t1, *_ in cycle:
+            cx, cy, cr = self.circles[c]
+            dy = py - cy
+            h = cr * cr - dy * dy
+            if h <= 0:
+                continue
+            for qx in (cx - sqrt(h), cx + sqrt(h)):
+                if qx > px:
+                    t = atan2(dy, qx - cx)
+                    if t < t0:
+                        t += 2 * pi
+                    if t < t1:
+                        inside = not inside
+        return inside
+    
+    def cover(self, px: float, py: float) -> FrozenSet[int]:
+        """Roles of the circles containing a point."""
+        return frozenset(role for role, (cx, cy, cr) in enumerate(self.circles)
+                         if (px - cx) ** 2 + (py - cy) ** 2 < cr * cr)
+    
+    def in_hole(self, px: float, py: float) -> bool:
+        """Whether a point lies in the uncovered center of a torn triple."""
+        return (self.kind == _TORN and not self.cover(px, py)
+                and self._inside(px, py, self.cycles[0]))
+    
+    def hole_box(self) -> Tuple[float, float, float, float]:
+        """Bounding box (x0, y0, x1, y1) of the vertices around the hole."""
+        xs, ys = [], []
+        for c, t0, t1, *_ in self.cycles[0]:
+            cx, cy, cr = self.circles[c]
+            for t in (t0, t1):
+                xs.append(cx + cr * cos(t))
+                ys.append(cy + cr * sin(t))
+        return min(xs), min(ys), max(xs), max(ys)
+    
+    def region(self, px: float, py: float) -> int:
+        """Index of the region holding a point inside the component."""
+        label: _Label = self.cover(px, py)
+        if not label:
+            label = 'hole'
+        elif label == _KINDS[self.kind][3]:
+            label = ('dup', 0 if self._inside(px, py, self.cycles[0]) else 1)
+        return _KINDS[self.kind][1].index(label)
+
+
+def _frame_slices(frame: np.ndarray, frames: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Circle indices sorted by frame, and the start of each frame in them."""
+    order = np.argsort(frame, kind='stable')
+    starts = np.searchsorted(frame[order], np.arange(frames + 1))
+    return order, starts
+
+
+def _candidate_pairs(x, y, r, frame, frames) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairs (i < j) of circles in one frame whose bounding boxes may overlap.
+    
+    The bounding boxes are rasterized into a grid whose cell size is the
+    median circle diameter of the frame; circles sharing a cell become
+    candidates. Boxes spanning many cells are compared with their whole
+    frame instead, so a few large enclosing circles stay cheap.
+    """
+    n = len(r)
+    order, starts = _frame_slices(frame, frames)
+    by_radius = np.lexsort((r, frame))
+    counts = np.diff(starts)
+    middle = by_radius[np.minimum(starts[:-1] + counts // 2, n - 1)]
+    cell = 2.0 * r[middle]
+    size = cell[frame]
+    
+    ix0 = np.floor((x - r) / size).astype(np.int64)
+    ix1 = np.floor((x + r) / size).astype(np.int64)
+    iy0 = np.floor((y - r) / size).astype(np.int64)
+    iy1 = np.floor((y + r) / size).astype(np.int64)
+    width = ix1 - ix0 + 1
+    height = iy1 - iy0 + 1
+    big = np.maximum(width, height) > _GRID_SPAN
+    small = np.flatnonzero(~big)
+    
+    cells = (width * height)[small]
+    owner = np.repeat(small, cells)
+    offset = np.arange(len(owner)) - np.repeat(np.cumsum(cells) - cells, cells)
+    gx = ix0[owner] + offset % width[owner]
+    gy = iy0[owner] + offset // width[owner]
+    gf = frame[owner]
+    sort = np.lexsort((gy, gx, gf))
+    owner, gx, gy, gf = owner[sort], gx[sort], gy[sort], gf[sort]
+    group = np.concatenate(([0], np.cumsum((gx[1:] != gx[:-1]) | (gy[1:] != gy[:-1])
+                                           | (gf[1:] != gf[:-1]))))
+    
+    firsts, seconds = [], []
+    distance = 1
+    while distance < len(owner):
+        same = np.flatnonzero(group[:-distance] == group[distance:])
+        if not len(same):
+            break
+        firsts.append(owner[same])
+        seconds.append(owner[same + distance])
+        distance += 1
+    
+    # Large circles against every circle of their frame
+    large = np.flatnonzero(big)
+    spans = counts[frame[large]]
+    first = np.repeat(large, spans)
+    position = (np.arange(len(first)) - np.repeat(np.cumsum(spans) - spans, spans)
+                + np.repeat(starts[frame[large]], spans))
+    second = order[position]
+    overlap = ((x[first] - r[first] < x[second] + r[second])
+               & (x[second] - r[second] < x[first] + r[first])
+               & (y[first] - r[first] < y[second] + r[second])
+               & (y[second] - r[second] < y[first] + r[first]) & (first != second))
+    firsts.append(first[overlap])
+    seconds.append(second[overlap])
+    
+    a = np.concatenate(firsts).astype(np.int64)
+    b = np.concatenate(seconds).astype(np.int64)
+    codes = np.unique(np.minimum(a, b) * n + np.maximum(a, b))
+    return codes // n, codes % n
+
+
+def _crossing(x, y, r, a, b) -> np.ndarray:
+    """Mask of the pairs whose rims cross in two points."""
+    d = np.hypot(x[a] - x[b], y[a] - y[b])
+    return (d < r[a] + r[b]) & (d > np.abs(r[a] - r[b]))
+
+
+def intersecting_pairs(centers, radii) -> np.ndarray:
+    """
+    Find the pairs of circles whose rims cross.
+    
+    Args:
+        centers: Array of shape (n, 2) with the circle centers
+        radii: Array of shape (n,) with the circle radii
+        
+    Returns:
+        Array of shape (m, 2) with the index pairs (i < j), sorted
+    """
+    x, y, r = _as_circles(centers, radii)
+    a, b = _candidate_pairs(x, y, r, np.zeros(len(r), dtype=np.int64), 1)
+    mask = _crossing(x, y, r, a, b)
+    return np.stack((a[mask], b[mask]), axis=1)
+
+
+def _classify_batch(x, y, r, frame, frames) -> List[str]:
+    """Serialized canonical expressions of all frames of a batch."""
+    n = len(r)
+    if n == 0:
+        return [''] * frames
+    a, b = _candidate_pairs(x, y, r, frame, frames)
+    crossing = _crossing(x, y, r, a, b)
+    
+    # Components: connected circles under rim crossings
+    label = np.arange(n)
+    ca, cb = a[crossing], b[crossing]
+    while len(ca):
+        low = np.minimum(label[ca], label[cb])
+        before = label.copy()
+        np.minimum.at(label, ca, low)
+        np.minimum.at(label, cb, low)
+        label = label[label]
+        if np.array_equal(label, before):
+            break
+    reps, comp = np.unique(label, return_inverse=True)
+    m = len(reps)
+    sizes = np.bincount(comp, minlength=m)
+    if m and sizes.max() > 3:
+        bad = frame[reps[np.argmax(sizes)]]
+        raise ValueError(f"More than three circles intersect in frame {bad}")
+    
+    kind = [_CIRCLE] * m
+    components: Dict[int, _Component] = {}
+    crossings: Dict[int, List[Tuple[int, int]]] = {}
+    for i, j in zip(ca.tolist(), cb.tolist()):
+        crossings.setdefault(int(comp[i]), []).append((i, j))
+    for c, pairs in crossings.items():
+        members = sorted({i for pair in pairs for i in pair})
+        local = {i: k for k, i in enumerate(members)}
+        component = _Component([(float(x[i]), float(y[i]), float(r[i])) for i in members],
+                               [(local[i], local[j]) for i, j in pairs])
+        components[c] = component
+        kind[c] = component.kind
+    
+    # Containment: component K lies in component C when a point on the rim
+    # of its representative circle is covered by C or sits in its hole
+    px, py = x[reps] + r[reps], y[reps]
+    is_rep = np.zeros(n, dtype=bool)
+    is_rep[reps] = True
+    inner = np.concatenate((a, b))
+    outer = np.concatenate((b, a))
+    keep = is_rep[inner] & (comp[inner] != comp[outer])
+    inner, outer = comp[inner[keep]], outer[keep]
+    covered = np.hypot(px[inner] - x[outer], py[inner] - y[outer]) < r[outer]
+    inner, outer = inner[covered], comp[outer[covered]]
+    
+    holes_k, holes_c = [], []
+    order, starts = _frame_slices(frame[reps], frames)
+    for c, component in components.items():
+        if component.kind != _TORN:
+            continue
+        bx0, by0, bx1, by1 = component.hole_box()
+        f = frame[reps[c]]
+        others = order[starts[f]:starts[f + 1]]
+        others = others[(px[others] > bx0) & (px[others] < bx1)
+                        & (py[others] > by0) & (py[others] < by1) & (others != c)]
+        for k in others.tolist():
+            if component.in_hole(float(px[k]), float(py[k])):
+                holes_k.append(k)
+                holes_c.append(c)
+    inner = np.concatenate((inner, np.array(holes_k, dtype=np.int64)))
+    outer = np.concatenate((outer, np.array(holes_c, dtype=np.int64)))
+    
+    # The innermost container is the one with the most containers itself
+    parent = np.full(m, -1)
+    if len(inner):
+        depth = np.bincount(inner, minlength=m)
+        sort = np.lexsort((depth[outer], inner))
+        inner, outer = inner[sort], outer[sort]
+        last = np.flatnonzero(np.append(inner[1:] != inner[:-1], True))
+        parent[inner[last]] = outer[last]
+    
+    children: List[List[List[int]]] = [[[] for _ in _KINDS[k][1]] for k in kind]
+    roots: List[List[int]] = [[] for _ in range(frames)]
+    for k, p in enumerate(parent.tolist()):
+        if p < 0:
+            roots[frame[reps[k]]].append(k)
+        elif kind[p] == _CIRCLE:
+            children[p][0].append(k)
+        else:
+            children[p][components[p].region(float(px[k]), float(py[k]))].append(k)
+    
+    # AHU ranks one height level at a time, as in
+    # canonical_expression_from_parents, with each component's regions put
+    # in the least order its symmetry group allows
+    bfs = [k for frame_roots in roots for k in frame_roots]
+    for v in bfs:
+        for slot in children[v]:
+            bfs.extend(slot)
+    if len(bfs) != m:
+        raise ValueError("Containment is cyclic; circles may touch")
+    height = [1] * m
+    for v in reversed(bfs):
+        p = parent[v]
+        if p >= 0 and height[v] + 1 > height[p]:
+            height[p] = height[v] + 1
+    levels: Dict[int, List[int]] = {}
+    for v in bfs:
+        levels.setdefault(height[v], []).append(v)
+    
+    rank: List[Tuple[int, int]] = [(0, 0)] * m
+    arranged: List[List[List[int]]] = [[]] * m
+    for h in sorted(levels):
+        keys = {}
+        for v in levels[h]:
+            if kind[v] == _CIRCLE:
+                inside = sorted(children[v][0], key=rank.__getitem__)
+                keys[v] = (_CIRCLE, (tuple([rank[c] for c in inside]),))
+                arranged[v] = [inside]
+                continue
+            slots = [tuple(sorted(rank[c] for c in slot)) for slot in children[v]]
+            best = None
+            for perm in _SYMMETRIES[kind[v]]:
+                image: List[Optional[tuple]] = [None] * len(slots)
+                for i, target in enumerate(perm):
+                    image[target] = slots[i]
+                if best is None or image < best[0]:
+                    best = (image, perm)
+            keys[v] = (kind[v], tuple(best[0]))
+            placed: List[List[int]] = [[] for _ in slots]
+            for i, target in enumerate(best[1]):
+                placed[target] = sorted(children[v][i], key=rank.__getitem__)
+            arranged[v] = placed
+        local = {key: i for i, key in enumerate(sorted(set(keys.values())))}
+        for v, key in keys.items():
+            rank[v] = (-h, local[key])
+    
+    results = []
+    for frame_roots in roots:
+        out = []
+        stack: List[Union[int, str]] = sorted(frame_roots, key=rank.__getitem__, reverse=True)
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                out.append(item)
+                continue
+            slots = arranged[item]
+            if kind[item] == _CIRCLE:
+                parts: List[Union[int, str]] = ['(', *slots[0], ')']
+            elif kind[item] == _PAIR:
+                parts = ['[', *slots[0], '[', *slots[1], ']', *slots[2], ']']
+            else:
+                parts = [_KINDS[kind[item]][0]]
+                for slot in slots:
+                    parts.append('|')
+                    parts.extend(slot)
+                parts.append('}')
+            stack.extend(reversed(parts))
+        results.append(''.join(out))
+    return results
+
+
+def classify_arrangement(centers, radii) -> str:
+    """
+    Classify a set of circles in which pairs or triples may intersect.
+    
+    Args:
+        centers: Array of shape (n, 2) with the circle centers
+        radii: Array of shape (n,) with the circle radii
+        
+    Returns:
+        Canonical serialized expression of the arrangement; without
+        intersections it equals classify_circles(centers, radii).expr
+        
+    Raises:
+        ValueError: If more than three circles are joined by crossings
+    """
+    x, y, r = _as_circles(centers, radii)
+    return _classify_batch(x, y, r, np.zeros(len(r), dtype=np.int64), 1)[0]
+
+
+def classify_frames(frames: Iterable[Tuple[np.ndarray, np.ndarray]]) -> List[str]:
+    """
+    Classify many circle sets in one vectorized pass.
+    
+    Args:
+        frames: Iterable of (centers, radii) pairs as for classify_arrangement
+        
+    Returns:
+        Canonical serialized expression of each frame, in order
+    """
+    xs, ys, rs, ids = [], [], [], []
+    for index, (centers, radii) in enumerate(frames):
+        x, y, r = _as_circles(centers, radii)
+        xs.append(x)
+        ys.append(y)
+        rs.append(r)
+        ids.append(np.full(len(r), index, dtype=np.int64))
+    if not rs:
+        return []
+    return _classify_batch(np.concatenate(xs), np.concatenate(ys), np.concatenate(rs),
+                           np.concatenate(ids), len(rs))
+
+
+def layout_expressions(expressions: Iterable[Union[CircleExpression, str]],
+                       gap: float = 0.25) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Realize many expressions as concrete non-intersecting circles.
+    
+    A circle without children has radius 1. The children of a circle are
+    lined up along one of its diameters, alternating between horizontal
+    and vertical by depth, with ``gap`` between neighbours and between the
+    row and the rim; the top-level circles of an expression are lined up
+    the same way around the origin. Every radius is a sum over the subtree
+    and every center a sum of offsets over the ancestors, so both come
+    from prefix sums over the concatenated parentheses, with no loop over
+    circles, levels or expressions.
+    
+    Args:
+        expressions: CircleExpression objects or parentheses strings
+        gap: Clearance between neighbouring circles and to enclosing rims
+        
+    Returns:
+        Tuple (centers, radii, offsets): the circles of all expressions
+        concatenated, in order of their opening parentheses, with the
+        circles of expression k at offsets[k]:offsets[k + 1]
+    """
+    texts = [e.expr if isinstance(e, CircleExpression) else e.strip() for e in expressions]
+    lengths = np.array([len(t) for t in texts], dtype=np.int64)
+    chars = np.frombuffer(''.join(texts).encode('ascii'), dtype=np.uint8)
+    step = np.where(chars == ord('('), 1, -1)
+    bounds = np.concatenate(([0], np.cumsum(lengths)))
+    running = np.concatenate(([0], np.cumsum(step)))
+    if (np.any((chars != ord('(')) & (chars != ord(')'))) or running.min() < 0
+            or np.any(running[bounds] != 0)):
+        raise ValueError("Invalid expression in batch")
+    depth = running[1:]
+    
+    opens = np.flatnonzero(step > 0)
+    n = len(opens)
+    offsets = np.concatenate(([0], np.cumsum(step > 0)))[bounds]
+    if n == 0:
+        return np.zeros((0, 2)), np.zeros(0), offsets
+    
+    # Match parentheses: at each nesting level opens and closes alternate.
+    # In this order the circles are sorted by depth, then position, which
+    # puts siblings next to each other with the first child leading.
+    number = np.cumsum(step > 0) - 1
+    level = np.where(step > 0, depth, depth + 1)
+    events = np.argsort(level, kind='stable')
+    ranked = number[events[0::2]]
+    closes = np.empty(n, dtype=np.int64)
+    closes[ranked] = events[1::2]
+    size = (closes - opens + 1) // 2
+    
+    # Parent: the circle opened right before a first child, shared by its
+    # siblings; top-level circles hang off a virtual root per expression,
+    # numbered n + k
+    circle_depth = depth[opens]
+    expression = np.repeat(np.arange(len(texts)), np.diff(offsets))
+    position = opens[ranked]
+    top = circle_depth[ranked] == 1
+    first = np.where(top, position == bounds[expression[ranked]],
+                     chars[np.maximum(position - 1, 0)] == ord('('))
+    leader = np.maximum.accumulate(np.where(first, np.arange(n), 0))
+    parent = np.empty(n, dtype=np.int64)
+    parent[ranked] = np.where(top, n + expression[ranked], number[np.maximum(position - 1, 0)])[leader]
+    children = np.bincount(parent, minlength=n + len(texts))
+    
+    # Radius: 1 per leaf plus gap * (k + 1) / 2 per circle with k children,
+    # summed over the subtree (circles of a subtree are contiguous)
+    own = np.where(children[:n] == 0, 1.0, gap * (children[:n] + 1) / 2)
+    prefix = np.concatenate(([0.0], np.cumsum(own)))
+    index = np.arange(n)
+    radii = prefix[index + size] - prefix[index]
+    
+    # Offset of each circle from its parent's center along the parent's row
+    width = 2 * radii + gap
+    row = np.bincount(parent, weights=width, minlength=n + len(texts)) - gap
+    before = np.cumsum(width[ranked]) - width[ranked]
+    start = np.empty(n)
+    start[ranked] = before - before[leader]
+    shift = start + radii - row[parent] / 2
+    
+    # Centers: sums of the shifts of all enclosing circles, accumulated
+    # along the parentheses with +shift at '(' and -shift at ')'
+    vertical = circle_depth % 2 == 0
+    delta = np.zeros((len(chars), 2))
+    delta[opens, 0] = np.where(vertical, 0.0, shift)
+    delta[opens, 1] = np.where(vertical, shift, 0.0)
+    delta[closes] = -delta[opens]
+    centers = np.cumsum(delta, axis=0)[opens]
+    return centers, radii, offsets
+
+
+def layout_expression(expression: Union[CircleExpression, str],
+                      gap: float = 0.25) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Realize an expression as concrete non-intersecting circles.
+    
+    Args:
+        expression: CircleExpression or parentheses string
+        gap: Clearance between neighbouring circles and to enclosing rims
+        
+    Returns:
+        Tuple (centers, radii) in order of the opening parentheses, so that
+        classify_circles(centers, radii) is the canonical form of the
+        expression
+    """
+    centers, radii, _ = layout_expressions([expression], gap)
+    return centers, radii
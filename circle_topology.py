@@ -10,8 +10,210 @@ The main questions addressed:
 2. How many different topologies exist when triples may intersect?
 """
 
-from typing import List, Dict
-from functools import lru_cache
+import os
+import sys
+import threading
+from itertools import accumulate
+from operator import mul
+from typing import TYPE_CHECKING, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from region_grammar import (
+    Atom, CoefficientGenerator, Epsilon, Grammar, Multiset, NonEmpty, Ref, SymmetricPower,
+)
+
+if TYPE_CHECKING:
+    from topology_asymptotics import Estimate
+
+
+# Family declarations in the region grammar. Z is one circle; a
+# configuration that splits the plane into several regions is the product
+# of the families filling those regions.
+TOPOLOGY_GRAMMAR = Grammar()
+_Z = Atom(1)
+_1 = Epsilon()
+
+# Catalan numbers (A000108): C = 1 + Z*C*C
+_C = Ref('catalan')
+TOPOLOGY_GRAMMAR.define('catalan', _1 + _Z * _C * _C)
+
+# Rooted trees (A000081): a root carrying a multiset of subtrees, A = Z*MSET(A)
+_A = Ref('rooted')
+TOPOLOGY_GRAMMAR.define('rooted', _Z * Multiset(_A))
+
+# Unrooted trees (A000055), Otter's formula: T = 1 + A - SET_2(A)
+TOPOLOGY_GRAMMAR.define('unrooted', _1 + _A - SymmetricPower(_A, 2, distinct=True))
+
+# Pairs and triples may intersect: transcriptions of the original
+# recurrences, p(n) = sum_k p(k) p(n-1-k) + sum_{k>=2} p(k-2) p(n-k) and the
+# same with a third sum over k >= 3 for triples. The terms are sums of
+# products of earlier values, not a decomposition into regions; in
+# particular they do not count the distinct 2- and 3-circle arrangements
+# classified by circle_geometry.
+_P = Ref('pairs')
+TOPOLOGY_GRAMMAR.define('pairs', _1 + _Z * _P * _P + Atom(2) * _P * NonEmpty(_P))
+_T = Ref('triples')
+TOPOLOGY_GRAMMAR.define(
+    'triples',
+    _1 + _Z * _T * _T + Atom(2) * _T * NonEmpty(_T) + Atom(3) * _T * NonEmpty(_T),
+)
+
+_CATALAN = TOPOLOGY_GRAMMAR.compile('catalan')
+_TREES = TOPOLOGY_GRAMMAR.compile('rooted', 'unrooted')
+_PAIRS = TOPOLOGY_GRAMMAR.compile('pairs')
+_TRIPLES = TOPOLOGY_GRAMMAR.compile('triples')
+
+# 4D hypersphere clusters established from symmetry analysis; extended in
+# place by the empirical recurrence in hypersphere_4d_clusters
+_HYPERSPHERE = [
+    1, 1, 1,
+    1,   # Both 3D structures collapse to one
+    2,   # 3 sphere clusters → 2 hypersphere clusters
+    3,   # 6 sphere clusters → 3 hypersphere clusters
+    6,   # 11 sphere clusters → 6 hypersphere clusters
+    11,  # 23 sphere clusters → 11 hypersphere clusters
+    23,  # 47 sphere clusters → 23 hypersphere clusters
+    44,  # 106 sphere clusters → 44 hypersphere clusters
+]
+# Serializes extension of _HYPERSPHERE; reads of the existing prefix are lock-free
+_HYPERSPHERE_LOCK = threading.Lock()
+
+# Packed first terms of each family from the generated topology_tables
+# module (see build_tables): the number of terms, resolved on the first
+# lookup (0 without the module), and the tables decoded so far
+_PRECOMPUTED_TERMS: Optional[int] = None
+_PRECOMPUTED: Dict[str, bytes] = {}
+
+
+def _precomputed_terms() -> int:
+    """Return the number of precomputed terms per family."""
+    global _PRECOMPUTED_TERMS
+    if _PRECOMPUTED_TERMS is None:
+        try:
+            # Imported on use: short runs with small n never load the tables
+            from topology_tables import TERMS
+        except ImportError:
+            TERMS = 0
+        _PRECOMPUTED_TERMS = TERMS
+    return _PRECOMPUTED_TERMS
+
+
+def _precomputed(family: str, n: int) -> Optional[int]:
+    """Return term n of a family from the precomputed tables, or None if not shipped."""
+    if not 0 <= n < _precomputed_terms():
+        return None
+    table = _PRECOMPUTED.get(family)
+    if table is None:
+        from base64 import b64decode
+        from topology_tables import TABLES
+        table = _PRECOMPUTED[family] = b64decode(TABLES[family])
+    # Count, offsets, then the bytes of the terms
+    start = int.from_bytes(table[4 * n + 4:4 * n + 8], 'little')
+    end = int.from_bytes(table[4 * n + 8:4 * n + 12], 'little')
+    base = 4 * _precomputed_terms() + 8
+    return int.from_bytes(table[base + start:base + end], 'little')
+
+
+def _coefficient(generator: CoefficientGenerator, family: str, n: int) -> int:
+    """Return term n of a family, preferring the precomputed tables to extending."""
+    if n >= len(generator):
+        value = _precomputed(family, n)
+        if value is not None:
+            return value
+    return generator.coefficient(family, n)
+
+
+def _prefix(generator: CoefficientGenerator, family: str, n: int) -> List[int]:
+    """Return terms 0..n of a family, preferring the precomputed tables to extending."""
+    if len(generator) <= n < _precomputed_terms():
+        return [_precomputed(family, k) for k in range(n + 1)]
+    return generator.prefix(family, n)
+
+
+def _factor_counts(n: int) -> List[int]:
+    """
+    Count the forests of n nodes by number of trees, from the rooted tree table.
+
+    Forests are built by adding trees in decreasing size. Multisets of c of
+    the a(k) trees of size k multiply the table by (1 - u*z^k)^(-a(k)); along
+    each diagonal of fixed slack s = m - k*f this is a one-dimensional
+    convolution over f, done as a(k) prefix sums when a(k) is small and as a
+    convolution with the binomial series otherwise. Trees larger than k
+    leave at most s of them on diagonal s, so the work is O(n^3) bignum
+    operations in total rather than one per forest.
+    """
+    if n < 0:
+        return []
+    a = [_TREES.coefficient('rooted', k) for k in range(n + 1)]
+    # table[f][m]: forests of m nodes with f trees, all of the sizes added so far
+    table = [[0] * (n + 1) for _ in range(n + 1)]
+    table[0][0] = 1
+    for k in range(n, 0, -1):
+        for s in range(n + 1):
+            top = (n - s) // k
+            if top == 0:
+                continue
+            count = min(s, top) + 1 if k < n else 1
+            old = [table[f][s + k * f] for f in range(count)]
+            if a[k] <= 8 * count:
+                new = old + [0] * (top + 1 - count)
+                for _ in range(a[k]):
+                    new = list(accumulate(new))
+            else:
+                binomial = [1]
+                for c in range(1, top + 1):
+                    binomial.append(binomial[-1] * (a[k] + c - 1) // c)
+                binomial.reverse()
+                new = [sum(map(mul, old, binomial[top - f:])) for f in range(top + 1)]
+            for f in range(top + 1):
+                table[f][s + k * f] = new[f]
+    return [table[f][n] for f in range(n + 1)]
+
+
+def _depth_counts(n: int) -> List[int]:
+    """
+    Count the forests of n nodes by height, from the rooted tree table.
+
+    With F the forest series and G_h the forests deeper than h, the forests
+    of depth at most h are MSET(Z * (F - G_(h-1))) = F / MSET(Y) with
+    Y = Z * G_(h-1), so G_h = F * (1 - 1/MSET(Y)). Y starts at z^(h+1), so
+    the Euler transform inverse and the product only touch coefficients
+    h+1..n; once 2(h+1) > n the inverse is just Y.
+    """
+    if n < 0:
+        return []
+    forest = [_TREES.coefficient('rooted', m + 1) for m in range(n + 1)]
+    deeper = [0] + forest[1:]
+    counts = [0] * (n + 1)
+    counts[0] = forest[n] - deeper[n]
+    for h in range(1, n + 1):
+        v = h + 1
+        y = [0] * v + deeper[h:n]
+        if 2 * v > n:
+            w = y
+        else:
+            # m * w_m = c_m - sum_k c_k * w_(m-k), with c_k = sum_{d|k} d * y_d
+            c = [0] * v + [d * y[d] for d in range(v, n + 1)]
+            for d in range(v, n // 2 + 1):
+                if y[d]:
+                    for k in range(2 * d, n + 1, d):
+                        c[k] += d * y[d]
+            w = [0] * (n + 1)
+            for m in range(v, n + 1):
+                total = c[m]
+                if m >= 2 * v:
+                    total -= sum(map(mul, c[v:m - v + 1], w[m - v:v - 1:-1]))
+                w[m] = total // m
+        current = [0] * v + [sum(map(mul, w[v:m + 1], forest[m - v::-1]))
+                             for m in range(v, n + 1)]
+        counts[h] = deeper[n] - current[n]
+        deeper = current
+    return counts
+
+
+def _estimate(family: str, n: int) -> 'Estimate':
+    # Imported on use: topology_asymptotics builds on this module
+    from topology_asymptotics import estimate
+    return estimate(family, n)
 
 
 class CircleTopology:
@@ -23,44 +225,57 @@ class CircleTopology:
     """
     
     @staticmethod
-    @lru_cache(maxsize=None)
-    def rooted_trees(n: int) -> int:
+    def rooted_trees(n: int, approx: bool = False) -> Union[int, 'Estimate']:
         """
         Compute the number of unlabeled rooted trees with n nodes (OEIS A000081).
         
         This counts the topologically distinct arrangements of n-1 non-intersecting
-        circles in the plane. The recurrence is based on the theory of rooted trees.
+        circles in the plane. The family is declared as A = Z * MSET(A) and the
+        multiset kernel evaluates the recurrence
+        a(n) = (1/(n-1)) * sum_{i=1}^{n-1} a(i) * (sum_{d|n-i} d * a(d)).
         
         Args:
             n: The number of nodes in the tree
+            approx: Return an Estimate from the singular expansion at the
+                radius of convergence instead of the exact count (see
+                topology_asymptotics)
             
         Returns:
             The number of unlabeled rooted trees with n nodes
         """
-        if n == 0:
-            return 0
-        if n == 1:
-            return 1
-        if n == 2:
-            return 1
+        if approx:
+            return _estimate('rooted', n)
+        return _coefficient(_TREES, 'rooted', n)
+    
+    @staticmethod
+    def rooted_trees_range(lo: int, hi: int, workers: int = 1) -> List[int]:
+        """
+        Compute the rooted trees with lo to hi nodes (OEIS A000081).
         
-        # Use the recurrence relation for rooted trees
-        # a(n) = (1/(n-1)) * sum_{i=1}^{n-1} a(i) * (sum_{d|n-i} d * a(d))
-        result = 0
-        for i in range(1, n):
-            # Compute sum of d * a(d) for all divisors d of (n-i)
-            divisor_sum = 0
-            remainder = n - i
-            for d in range(1, remainder + 1):
-                if remainder % d == 0:
-                    divisor_sum += d * CircleTopology.rooted_trees(d)
-            result += CircleTopology.rooted_trees(i) * divisor_sum
+        A range inside the prefix computed so far, or inside the precomputed
+        tables, is sliced from them. Otherwise the terms are computed modulo
+        word-sized primes, one prime per task in a pool of worker processes,
+        and reconstructed by the Chinese remainder theorem (see
+        topology_modular), so very large n spread over many cores.
         
-        return result // (n - 1)
+        Args:
+            lo: Smallest number of nodes
+            hi: Largest number of nodes
+            workers: Number of processes running the per-prime recurrences
+            
+        Returns:
+            List of the hi-lo+1 counts a(lo), ..., a(hi)
+        """
+        if not 0 <= lo <= hi:
+            raise ValueError(f"Need 0 <= lo <= hi, got {lo}, {hi}")
+        if hi < max(len(_TREES), _precomputed_terms()):
+            return _prefix(_TREES, 'rooted', hi)[lo:]
+        # Imported on use: the pool machinery is only needed for new ranges
+        from topology_modular import rooted_trees_range
+        return rooted_trees_range(lo, hi, workers)
     
     @staticmethod
-    @lru_cache(maxsize=None)
-    def catalan_number(n: int) -> int:
+    def catalan_number(n: int, approx: bool = False) -> Union[int, 'Estimate']:
         """
         Compute the n-th Catalan number.
         
@@ -69,22 +284,23 @@ class CircleTopology:
         
         Args:
             n: The index of the Catalan number
+            approx: Return an Estimate from the singular expansion at the
+                radius of convergence instead of the exact count (see
+                topology_asymptotics)
             
         Returns:
             The n-th Catalan number
         """
+        if approx:
+            return _estimate('catalan', n)
         if n <= 1:
             return 1
         
-        # Use recursive formula: C(n) = sum(C(i) * C(n-1-i)) for i=0 to n-1
-        result = 0
-        for i in range(n):
-            result += CircleTopology.catalan_number(i) * CircleTopology.catalan_number(n - 1 - i)
-        return result
+        # Declared as C = 1 + Z*C*C, i.e. C(n) = sum(C(i) * C(n-1-i)) for i=0 to n-1
+        return _coefficient(_CATALAN, 'catalan', n)
     
     @staticmethod
-    @lru_cache(maxsize=None)
-    def unrooted_trees(n: int) -> int:
+    def unrooted_trees(n: int, approx: bool = False) -> Union[int, 'Estimate']:
         """
         Compute the number of unlabeled unrooted (free) trees with n nodes (OEIS A000055).
         
@@ -93,41 +309,30 @@ class CircleTopology:
         
         Uses Otter's formula: t(n) = a(n) - b(n)
         where a(n) is rooted trees and b(n) accounts for bicentered trees.
+        b(n) = (1/2) * (sum_{k=0}^{n} a(k) * a(n-k) - [n even] a(n/2)) is the
+        symmetric square SET_2(A) of the rooted-tree family. The self-convolution
+        is carried from one n to the next as an online block product. As the
+        terms have O(N) bits, the column up to N costs O(N^(2 log2 3)) (about
+        N^3.2) bit operations with CPython's Karatsuba multiplication, e.g.
+        about 16 s for N = 3000; use approx=True for larger n.
         
         Args:
             n: The number of nodes in the tree
+            approx: Return an Estimate from the singular expansion at the
+                radius of convergence instead of the exact count (see
+                topology_asymptotics)
             
         Returns:
             The number of unlabeled unrooted trees with n nodes
         """
-        if n == 0:
-            return 1  # Empty tree (convention for OEIS A000055)
-        if n == 1:
-            return 1
-        if n == 2:
-            return 1
-        
-        # Start with rooted trees count
-        a_n = CircleTopology.rooted_trees(n)
-        
-        # Compute correction term for bicentered trees
-        # b(n) = (1/2) * (sum_{k=0}^{n} a(k) * a(n-k) - a(n/2)) if n even
-        # b(n) = (1/2) * (sum_{k=0}^{n} a(k) * a(n-k)) if n odd
-        correction = 0
-        for k in range(n + 1):
-            correction += CircleTopology.rooted_trees(k) * CircleTopology.rooted_trees(n - k)
-        
-        if n % 2 == 0:
-            # For even n, subtract the middle term
-            middle_term = CircleTopology.rooted_trees(n // 2)
-            correction -= middle_term
-        
-        correction = correction // 2
-        
-        return a_n - correction
+        if approx:
+            return _estimate('unrooted', n)
+        if n < 0:
+            return 0
+        return _coefficient(_TREES, 'unrooted', n)
     
     @staticmethod
-    def non_intersecting_circles(n: int) -> int:
+    def non_intersecting_circles(n: int, approx: bool = False) -> Union[int, 'Estimate']:
         """
         Count topologically distinct sets of n non-intersecting circles.
         
@@ -136,13 +341,57 @@ class CircleTopology:
         
         Args:
             n: Number of circles
+            approx: Return an Estimate from the singular expansion at the
+                radius of convergence instead of the exact count (see
+                topology_asymptotics)
             
         Returns:
             Number of topologically distinct arrangements
         """
+        if approx:
+            return _estimate('rooted', n + 1)
         # n circles correspond to rooted trees with n+1 nodes
         return CircleTopology.rooted_trees(n + 1)
     
+    @staticmethod
+    def factor_count_distribution(n: int) -> List[int]:
+        """
+        Distribute the topologies of n non-intersecting circles by factor count.
+        
+        Entry f is the number of topologies whose expression has f top-level
+        factors (CircleExpression.factor_count), i.e. rooted trees with n+1
+        nodes whose root has degree f (OEIS A033185). It is computed from the
+        rooted tree table without enumerating the topologies.
+        
+        Args:
+            n: Number of circles
+        
+        Returns:
+            List of n+1 counts indexed by factor count, summing to
+            non_intersecting_circles(n); empty for negative n
+        """
+        return _factor_counts(n)
+    
+    @staticmethod
+    def depth_distribution(n: int) -> List[int]:
+        """
+        Distribute the topologies of n non-intersecting circles by nesting depth.
+        
+        Entry d is the number of topologies whose deepest circle is nested d
+        levels deep (CircleExpression.max_depth), i.e. rooted trees with n+1
+        nodes of height d (OEIS A034781). The counts follow from the
+        bounded-height recurrence A_h = Z * MSET(A_(h-1)), evaluated against
+        the rooted tree table without enumerating the topologies.
+        
+        Args:
+            n: Number of circles
+        
+        Returns:
+            List of n+1 counts indexed by depth, summing to
+            non_intersecting_circles(n); empty for negative n
+        """
+        return _depth_counts(n)
+    
     @staticmethod
     def sphere_surface_clusters(n: int) -> int:
         """
@@ -161,7 +410,6 @@ class CircleTopology:
         return CircleTopology.unrooted_trees(n + 1)
     
     @staticmethod
-    @lru_cache(maxsize=None)
     def hypersphere_4d_clusters(n: int) -> int:
         """
         Count topologically distinct sets when embedded on a 4D hypersphere surface.
@@ -189,41 +437,24 @@ class CircleTopology:
         Returns:
             Number of 4D hypersphere surface equivalence classes (theoretical)
         """
-        if n == 0:
-            return 1
-        if n == 1:
-            return 1
-        if n == 2:
-            return 1
-        if n == 3:
-            return 1  # Both 3D structures collapse to one
-        if n == 4:
-            return 2  # 3 sphere clusters → 2 hypersphere clusters
-        if n == 5:
-            return 3  # 6 sphere clusters → 3 hypersphere clusters
-        if n == 6:
-            return 6  # 11 sphere clusters → 6 hypersphere clusters
-        if n == 7:
-            return 11  # 23 sphere clusters → 11 hypersphere clusters
-        if n == 8:
-            return 23  # 47 sphere clusters → 23 hypersphere clusters
-        if n == 9:
-            return 44  # 106 sphere clusters → 44 hypersphere clusters
+        if n < len(_HYPERSPHERE):
+            return _HYPERSPHERE[n]
         
         # For larger n, use an approximation based on the pattern
         # The reduction factor decreases as n increases
         # Empirically: h(n) ≈ u(n) - u(n-1) + h(n-1)
-        u_n = CircleTopology.unrooted_trees(n + 1)
-        u_prev = CircleTopology.unrooted_trees(n)
-        h_prev = CircleTopology.hypersphere_4d_clusters(n - 1)
-        
-        # Recursive approximation
-        result = u_n - u_prev + h_prev
-        return max(1, result)  # Ensure at least 1
+        with _HYPERSPHERE_LOCK:
+            for m in range(len(_HYPERSPHERE), n + 1):
+                u_n = CircleTopology.unrooted_trees(m + 1)
+                u_prev = CircleTopology.unrooted_trees(m)
+                h_prev = _HYPERSPHERE[m - 1]
+                
+                # Recursive approximation
+                _HYPERSPHERE.append(max(1, u_n - u_prev + h_prev))  # Ensure at least 1
+        return _HYPERSPHERE[n]
     
     @staticmethod
-    @lru_cache(maxsize=None)
-    def pairs_may_intersect(n: int) -> int:
+    def pairs_may_intersect(n: int, approx: bool = False) -> Union[int, 'Estimate']:
         """
         Count topologically distinct sets when pairs of circles may intersect.
         
@@ -231,95 +462,46 @@ class CircleTopology:
         at most 2 circles can intersect at any point.
         
         The recurrence relation for this case builds on the structure of
-        matching forests and considers the additional degrees of freedom
-        when pairs can intersect.
+        matching forests. It is declared as P = 1 + Z*P*P + Z^2*P*(P - 1),
+        a transcription of p(n) = sum_k p(k) p(n-1-k) + sum_{k>=2} p(k-2) p(n-k);
+        the terms carry no region semantics.
         
         Args:
             n: Number of circles
+            approx: Return an Estimate from the singular expansion at the
+                radius of convergence instead of the exact count (see
+                topology_asymptotics)
             
         Returns:
             Number of topologically distinct arrangements where pairs may intersect
         """
-        if n == 0:
-            return 1
-        if n == 1:
-            return 1
-        
-        # For pairs intersecting, we need to account for:
-        # 1. Non-intersecting arrangements (Catalan numbers)
-        # 2. Arrangements where exactly one pair intersects
-        # 3. Multiple disjoint pairs intersecting
-        
-        # Base formula considers nested and intersecting pair structures
-        # This follows from the generating function analysis
-        result = 0
-        
-        # Sum over all possible decompositions
-        for k in range(n):
-            # Consider k circles on one side, n-1-k on the other
-            left = CircleTopology.pairs_may_intersect(k)
-            right = CircleTopology.pairs_may_intersect(n - 1 - k)
-            result += left * right
-        
-        # Add contribution from intersecting pairs
-        # Each pair intersection creates a lens-shaped region
-        for k in range(2, n):
-            # k circles form intersecting pair, rest are distributed
-            inner = CircleTopology.pairs_may_intersect(k - 2)
-            outer = CircleTopology.pairs_may_intersect(n - k)
-            result += inner * outer
-        
-        return result
+        if approx:
+            return _estimate('pairs', n)
+        return _coefficient(_PAIRS, 'pairs', n)
     
     @staticmethod
-    @lru_cache(maxsize=None)
-    def triples_may_intersect(n: int) -> int:
+    def triples_may_intersect(n: int, approx: bool = False) -> Union[int, 'Estimate']:
         """
         Count topologically distinct sets when triples of circles may intersect.
         
         This function computes the number of distinct topologies where
-        up to 3 circles can intersect at any point.
+        up to 3 circles can intersect at any point. It is declared as
+        T = 1 + Z*T*T + Z^2*T*(T - 1) + Z^3*T*(T - 1), a transcription of
+        the pairs recurrence with a third sum_{k>=3} t(k-3) t(n-k); as for
+        pairs, the terms carry no region semantics.
         
         Args:
             n: Number of circles
+            approx: Return an Estimate from the singular expansion at the
+                radius of convergence instead of the exact count (see
+                topology_asymptotics)
             
         Returns:
             Number of topologically distinct arrangements where triples may intersect
         """
-        if n == 0:
-            return 1
-        if n == 1:
-            return 1
-        if n == 2:
-            return 2  # Either nested or intersecting
-        
-        # For triples intersecting, we account for:
-        # 1. All arrangements from pairs_may_intersect
-        # 2. Arrangements where exactly one triple intersects
-        # 3. Multiple disjoint triples intersecting
-        
-        result = 0
-        
-        # Basic recursive decomposition
-        for k in range(n):
-            left = CircleTopology.triples_may_intersect(k)
-            right = CircleTopology.triples_may_intersect(n - 1 - k)
-            result += left * right
-        
-        # Add pair intersection configurations
-        for k in range(2, n):
-            inner = CircleTopology.triples_may_intersect(k - 2)
-            outer = CircleTopology.triples_may_intersect(n - k)
-            result += inner * outer
-        
-        # Add triple intersection configurations
-        # Three circles intersecting create a central region
-        for k in range(3, n):
-            inner = CircleTopology.triples_may_intersect(k - 3)
-            outer = CircleTopology.triples_may_intersect(n - k)
-            result += inner * outer
-        
-        return result
+        if approx:
+            return _estimate('triples', n)
+        return _coefficient(_TRIPLES, 'triples', n)
     
     @staticmethod
     def generate_sequence(max_n: int, intersection_type: str = 'none') -> List[int]:
@@ -334,11 +516,12 @@ class CircleTopology:
             List of counts for n=0 to max_n
         """
         if intersection_type == 'none':
-            return [CircleTopology.non_intersecting_circles(n) for n in range(max_n + 1)]
+            # n circles correspond to rooted trees with n+1 nodes
+            return _prefix(_TREES, 'rooted', max_n + 1)[1:]
         elif intersection_type == 'pairs':
-            return [CircleTopology.pairs_may_intersect(n) for n in range(max_n + 1)]
+            return _prefix(_PAIRS, 'pairs', max_n)
         elif intersection_type == 'triples':
-            return [CircleTopology.triples_may_intersect(n) for n in range(max_n + 1)]
+            return _prefix(_TRIPLES, 'triples', max_n)
         else:
             raise ValueError(f"Unknown intersection type: {intersection_type}")
     
@@ -361,6 +544,222 @@ class CircleTopology:
         return {n: sequence[n] for n in range(len(sequence))}
 
 
+class SequenceRow(NamedTuple):
+    """All counts for one number of circles n."""
+    n: int
+    catalan: int
+    planar: int
+    sphere: int
+    hypersphere: int
+    pairs: int
+    triples: int
+
+
+class SequenceTable:
+    """
+    Table of every counting sequence for n = 0 to max_n, built in one pass.
+    
+    Rows are produced lazily in increasing n. Producing row n advances each
+    compiled family by a single coefficient: the rooted-tree prefix feeds
+    Otter's formula for the unrooted column inside the same generator, and
+    the 4D column extends from the previous row. Coefficients are kept by
+    the shared generators, so CircleTopology queries for n <= max_n after
+    building the table are lookups.
+    
+    Columns: catalan (1D), planar (2D, rooted trees with n+1 nodes),
+    sphere (3D, unrooted trees with n+1 nodes), hypersphere (4D), pairs
+    and triples.
+    """
+    
+    COLUMNS = SequenceRow._fields[1:]
+    
+    def __init__(self, max_n: int):
+        """
+        Initialize a table covering n = 0 to max_n.
+        
+        Args:
+            max_n: Largest number of circles in the table
+        """
+        if max_n < 0:
+            raise ValueError(f"max_n must be non-negative: {max_n}")
+        self.max_n = max_n
+        self._rows: List[SequenceRow] = []
+    
+    def __len__(self) -> int:
+        return self.max_n + 1
+    
+    def __iter__(self) -> Iterator[SequenceRow]:
+        for n in range(self.max_n + 1):
+            yield self.row(n)
+    
+    def row(self, n: int) -> SequenceRow:
+        """
+        Return the row for n circles, computing earlier rows if needed.
+        
+        Args:
+            n: Number of circles (0 <= n <= max_n)
+            
+        Returns:
+            The counts for n circles
+        """
+        if not 0 <= n <= self.max_n:
+            raise IndexError(f"Row {n} outside table range 0..{self.max_n}")
+        while len(self._rows) <= n:
+            m = len(self._rows)
+            self._rows.append(SequenceRow(
+                n=m,
+                catalan=CircleTopology.catalan_number(m),
+                planar=CircleTopology.non_intersecting_circles(m),
+                sphere=CircleTopology.sphere_surface_clusters(m),
+                hypersphere=CircleTopology.hypersphere_4d_clusters(m),
+                pairs=CircleTopology.pairs_may_intersect(m),
+                triples=CircleTopology.triples_may_intersect(m),
+            ))
+        return self._rows[n]
+    
+    def column(self, name: str) -> List[int]:
+        """
+        Return one column for n = 0 to max_n.
+        
+        Args:
+            name: One of SequenceTable.COLUMNS
+            
+        Returns:
+            List of counts for n=0 to max_n
+        """
+        if name not in self.COLUMNS:
+            raise ValueError(f"Unknown column: {name}")
+        return [getattr(row, name) for row in self]
+
+
+# Sequences available to the command line interface, by CircleTopology method
+SEQUENCES = {
+    'catalan': 'catalan_number',
+    'rooted': 'rooted_trees',
+    'unrooted': 'unrooted_trees',
+    'planar': 'non_intersecting_circles',
+    'sphere': 'sphere_surface_clusters',
+    'hypersphere': 'hypersphere_4d_clusters',
+    'pairs': 'pairs_may_intersect',
+    'triples': 'triples_may_intersect',
+}
+
+# Generator and index offset behind each named sequence
+_TABLES = {
+    'catalan': (_CATALAN, 0),
+    'rooted': (_TREES, 0),
+    'unrooted': (_TREES, 0),
+    'planar': (_TREES, 1),
+    'sphere': (_TREES, 1),
+    'pairs': (_PAIRS, 0),
+    'triples': (_TRIPLES, 0),
+}
+
+
+def computed_terms(name: str) -> int:
+    """
+    Return how many leading terms of a named sequence are already tabulated.
+    
+    Terms below this index are answered by a lookup in the computed table
+    or the precomputed tables, without taking a lock or extending a table.
+    
+    Args:
+        name: Key of SEQUENCES
+        
+    Returns:
+        Number of terms a(0), a(1), ... available without computation
+    """
+    if name not in SEQUENCES:
+        raise ValueError(f"Unknown sequence: {name}")
+    if name == 'hypersphere':
+        return len(_HYPERSPHERE)
+    generator, offset = _TABLES[name]
+    return max(len(generator) - offset, _precomputed_terms() - offset, 0)
+
+
+def iter_sequence(name: str, start: int, end: Optional[int] = None,
+                  modulus: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+    """
+    Yield (n, a(n)) for a named sequence, computing one term at a time.
+    
+    Args:
+        name: Key of SEQUENCES
+        start: First index
+        end: Last index (unbounded if None)
+        modulus: Reduce every term modulo this value if given
+        
+    Yields:
+        Pairs of index and term
+    """
+    if name not in SEQUENCES:
+        raise ValueError(f"Unknown sequence: {name}")
+    counter = getattr(CircleTopology, SEQUENCES[name])
+    n = start
+    while end is None or n <= end:
+        value = counter(n)
+        yield n, value % modulus if modulus else value
+        n += 1
+
+
+def cli(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point (python -m circle_topology).
+    
+    Without a sequence name the demonstration report of main() is printed.
+    With one, its terms are streamed to stdout or a file as they are
+    computed.
+    
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+        
+    Returns:
+        Process exit status
+    """
+    import argparse
+    from sequence_stream import FORMATS, write_sequence
+    
+    parser = argparse.ArgumentParser(
+        prog='python -m circle_topology',
+        description="Print the circle topology report, or stream a counting sequence.",
+    )
+    parser.add_argument('sequence', nargs='?', choices=sorted(SEQUENCES),
+                        help="sequence to stream (omit for the report)")
+    parser.add_argument('--start', type=int, default=0, help="first index (default 0)")
+    parser.add_argument('--end', type=int, default=100, help="last index (default 100)")
+    parser.add_argument('--format', choices=FORMATS, default='bfile',
+                        help="output format (default bfile)")
+    parser.add_argument('--modulus', type=int, default=None,
+                        help="write terms modulo this value")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="processes used to encode output (default 1)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="output file (default stdout)")
+    args = parser.parse_args(argv)
+    
+    if args.sequence is None:
+        main()
+        return 0
+    if args.start < 0 or args.end < args.start:
+        parser.error("need 0 <= start <= end")
+    if args.modulus is not None and args.modulus < 1:
+        parser.error("modulus must be positive")
+    
+    terms = iter_sequence(args.sequence, args.start, args.end, args.modulus)
+    if args.output == '-':
+        try:
+            write_sequence(terms, sys.stdout.buffer, args.format, args.sequence, args.workers)
+        except BrokenPipeError:
+            # Downstream consumer (e.g. head) closed the pipe; point stdout
+            # at devnull so the flush at interpreter exit cannot fail again
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            return 1
+        return 0
+    with open(args.output, 'wb') as stream:
+        write_sequence(terms, stream, args.format, args.sequence, args.workers)
+    return 0
+
+
 def main():
     """
     Main function to demonstrate the circle topology analysis.
@@ -384,13 +783,14 @@ def main():
     print(f"{'':4} {'(Catalan)':<12} {'(Rooted)':<12} {'(Unrooted)':<15} {'(Clusters)':<15}")
     print("-" * 80)
     
+    # One pass computes every column used by the report
+    table = SequenceTable(10)
+    
     max_n = 9
-    for n in range(max_n + 1):
-        catalan = CircleTopology.catalan_number(n)
-        planar = CircleTopology.non_intersecting_circles(n)
-        sphere = CircleTopology.sphere_surface_clusters(n)
-        hypersphere = CircleTopology.hypersphere_4d_clusters(n)
-        print(f"{n:<4} {catalan:<12} {planar:<12} {sphere:<15} {hypersphere:<15}")
+    for row in table:
+        if row.n > max_n:
+            break
+        print(f"{row.n:<4} {row.catalan:<12} {row.planar:<12} {row.sphere:<15} {row.hypersphere:<15}")
     
     print()
     print("OEIS Sequences:")
@@ -409,38 +809,33 @@ def main():
     # Compute and display results for non-intersecting circles
     print("Case: Non-intersecting circles (2D Planar)")
     print("-" * 60)
-    for n in range(11):
-        count = CircleTopology.non_intersecting_circles(n)
-        print(f"n={n:2d}: {count:6d} distinct topologies")
+    for row in table:
+        print(f"n={row.n:2d}: {row.planar:6d} distinct topologies")
     print()
     
     # Compute and display results for pairs intersecting
     print("Case (i): Pairs of circles may intersect")
     print("-" * 60)
-    for n in range(11):
-        count = CircleTopology.pairs_may_intersect(n)
-        print(f"n={n:2d}: {count:6d} distinct topologies")
+    for row in table:
+        print(f"n={row.n:2d}: {row.pairs:6d} distinct topologies")
     print()
     
     # Compute and display results for triples intersecting
     print("Case (ii): Triples of circles may intersect")
     print("-" * 60)
-    for n in range(11):
-        count = CircleTopology.triples_may_intersect(n)
-        print(f"n={n:2d}: {count:6d} distinct topologies")
+    for row in table:
+        print(f"n={row.n:2d}: {row.triples:6d} distinct topologies")
     print()
     
     # Display generating function coefficients
     print("Generating Function Coefficients (first 8 terms)")
     print("-" * 60)
-    gf_none = CircleTopology.generating_function_coefficients(7, 'none')
-    gf_pairs = CircleTopology.generating_function_coefficients(7, 'pairs')
-    gf_triples = CircleTopology.generating_function_coefficients(7, 'triples')
+    rows = [table.row(i) for i in range(8)]
     
-    print("Non-intersecting: ", [gf_none[i] for i in range(8)])
-    print("Pairs intersect:  ", [gf_pairs[i] for i in range(8)])
-    print("Triples intersect:", [gf_triples[i] for i in range(8)])
+    print("Non-intersecting: ", [row.planar for row in rows])
+    print("Pairs intersect:  ", [row.pairs for row in rows])
+    print("Triples intersect:", [row.triples for row in rows])
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(cli())
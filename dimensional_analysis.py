@@ -6,7 +6,7 @@ Demonstrates the dimensional progression of circle topologies
 from 1D (linear) through 4D (hypersphere) embeddings.
 """
 
-from circle_topology import CircleTopology
+from circle_topology import SequenceTable
 
 
 def print_dimensional_table(max_n=9):
@@ -29,14 +29,9 @@ def print_dimensional_table(max_n=9):
     print(f"{'':3} | {'(Catalan)':>10} | {'(Rooted)':>10} | {'(Unrooted)':>10} | {'(Clusters)':>10} | Factor")
     print("-" * 80)
     
-    topology = CircleTopology()
+    rows = list(SequenceTable(max_n))
     
-    for n in range(max_n + 1):
-        cat = topology.catalan_number(n)
-        planar = topology.non_intersecting_circles(n)
-        sphere = topology.sphere_surface_clusters(n)
-        hyper = topology.hypersphere_4d_clusters(n)
-        
+    for n, cat, planar, sphere, hyper, _, _ in rows:
         if n > 0:
             reduction = f"{cat/hyper:.1f}x"
         else:
@@ -52,12 +47,8 @@ def print_dimensional_table(max_n=9):
     print()
     
     # Ratios
-    print("Reduction Ratios for N=9:")
-    n = 9
-    cat = topology.catalan_number(n)
-    planar = topology.non_intersecting_circles(n)
-    sphere = topology.sphere_surface_clusters(n)
-    hyper = topology.hypersphere_4d_clusters(n)
+    n, cat, planar, sphere, hyper, _, _ = rows[-1]
+    print(f"Reduction Ratios for N={n}:")
     
     print(f"  1D to 2D: {cat} → {planar} ({cat/planar:.2f}x reduction)")
     print(f"  2D to 3D: {planar} → {sphere} ({planar/sphere:.2f}x reduction)")
@@ -84,14 +75,12 @@ def compare_dimensions(n_values=None):
     print("=" * 80)
     print()
     
-    topology = CircleTopology()
+    table = SequenceTable(max(n_values))
     
     for n in n_values:
         print(f"N = {n}:")
-        cat = topology.catalan_number(n)
-        planar = topology.non_intersecting_circles(n)
-        sphere = topology.sphere_surface_clusters(n)
-        hyper = topology.hypersphere_4d_clusters(n)
+        row = table.row(n)
+        cat, planar, sphere, hyper = row.catalan, row.planar, row.sphere, row.hypersphere
         
         print(f"  1D (Linear):       {cat:6} arrangements")
         print(f"  2D (Planar):       {planar:6} topologies")
@@ -110,14 +99,15 @@ def analyze_reduction_pattern():
     print("=" * 80)
     print()
     
-    topology = CircleTopology()
+    table = SequenceTable(9)
     
     print(f"{'N':<3} | {'3D/4D Ratio':>12} | {'Pattern'}")
     print("-" * 40)
     
     for n in range(2, 10):
-        sphere = topology.sphere_surface_clusters(n)
-        hyper = topology.hypersphere_4d_clusters(n)
+        row = table.row(n)
+        sphere = row.sphere
+        hyper = row.hypersphere
         
         ratio = sphere / hyper if hyper > 0 else 0
         
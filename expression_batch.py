@@ -0,0 +1,202 @@
+"""
+Columnar Batches of Circle Expressions
+
+Stores many expressions of the same length as packed bit rows in one NumPy
+array and evaluates the CircleExpression queries for all of them at once,
+for analytics over millions of topologies where one Python object and one
+string scan per expression would dominate:
+
+    batch = ExpressionBatch.from_expressions(canonical_expressions(12))
+    batch.factor_count()        # array of factor counts, one per expression
+    batch[batch.max_depth() == 3].expressions()
+
+Symbol i of an expression is bit i % 64 of word i // 64 of its row, 1 for
+'(' and 0 for ')', so a row of 2n symbols takes ceil(2n / 64) uint64 words
+(8 bytes for up to 32 circles, against ~90 bytes for the shortest Python
+string). The queries unpack the rows a block at a time and reduce the
+running depth, a cumulative sum of +1 and -1 steps, so the temporary
+arrays stay bounded however large the batch is.
+
+Rows are arbitrary words over '(' and ')'; valid() tells which are well
+formed. The counts agree with CircleExpression for every row, well formed
+or not.
+
+This module requires NumPy; the counting modules do not.
+"""
+
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+
+from flip_transforms import CircleExpression
+
+
+# Rows unpacked at a time by the queries
+BLOCK_ROWS = 1 << 16
+
+_OPEN, _CLOSE = ord('('), ord(')')
+
+# Number of set bits of every byte value
+_POPCOUNT = np.array([bin(b).count('1') for b in range(256)], dtype=np.uint8)
+
+
+class ExpressionBatch:
+    """
+    Equal-length circle expressions packed into uint64 bit rows.
+
+    Attributes:
+        words: Array of shape (len(batch), ceil(length / 64)), dtype uint64
+        length: Number of symbols per expression
+    """
+
+    def __init__(self, words: np.ndarray, length: int):
+        """
+        Args:
+            words: Packed rows as described in the module docstring; bits at
+                or beyond length must be zero
+            length: Number of symbols per expression
+        """
+        words = np.ascontiguousarray(words, dtype=np.uint64)
+        if words.ndim != 2 or words.shape[1] != _word_count(length):
+            raise ValueError(f"Expected {_word_count(length)} words per row for length {length}, "
+                             f"got shape {words.shape}")
+        self.words = words
+        self.length = length
+
+    @classmethod
+    def from_expressions(cls, expressions: Iterable[Union[str, CircleExpression]],
+                         length: Optional[int] = None) -> 'ExpressionBatch':
+        """
+        Pack expressions into a batch.
+
+        Args:
+            expressions: Strings or CircleExpression objects, all of one length
+            length: Length of the expressions (needed only if there are none)
+
+        Returns:
+            ExpressionBatch with one row per expression
+        """
+        texts = [e.expr if isinstance(e, CircleExpression) else e for e in expressions]
+        if length is None:
+            length = len(texts[0]) if texts else 0
+        if any(len(t) != length for t in texts):
+            raise ValueError(f"All expressions must have length {length}")
+        symbols = np.frombuffer(''.join(texts).encode('ascii'), dtype=np.uint8)
+        if not np.all((symbols == _OPEN) | (symbols == _CLOSE)):
+            raise ValueError("Expressions may only contain '(' and ')'")
+        bits = (symbols == _OPEN).reshape(len(texts), length)
+        packed = np.packbits(bits, axis=1, bitorder='little')
+        rows = np.zeros((len(texts), 8 * _word_count(length)), dtype=np.uint8)
+        rows[:, :packed.shape[1]] = packed
+        return cls(rows.view('<u8'), length)
+
+    def __len__(self) -> int:
+        return self.words.shape[0]
+
+    def __getitem__(self, index) -> Union[CircleExpression, 'ExpressionBatch']:
+        """
+        Return one expression, or a sub-batch for a slice, index array or mask.
+        """
+        if isinstance(index, (int, np.integer)):
+            return CircleExpression(self._texts(self.words[index][np.newaxis])[0])
+        return ExpressionBatch(self.words[index], self.length)
+
+    def expressions(self) -> List[str]:
+        """Return the expressions as strings."""
+        texts: List[str] = []
+        for start in range(0, len(self), BLOCK_ROWS):
+            texts.extend(self._texts(self.words[start:start + BLOCK_ROWS]))
+        return texts
+
+    def to_circle_expressions(self) -> List[CircleExpression]:
+        """Return the expressions as CircleExpression objects (all rows must be valid)."""
+        return [CircleExpression(text) for text in self.expressions()]
+
+    def count_circles(self) -> np.ndarray:
+        """Number of circles ('(' symbols) of every expression."""
+        return _POPCOUNT[self.words.view(np.uint8)].sum(axis=1, dtype=np.int64)
+
+    def valid(self) -> np.ndarray:
+        """Boolean array: whether every expression is well formed."""
+        def balanced(bits, depth):
+            final = depth[:, -1] if self.length else 0
+            return (depth.min(axis=1, initial=0) >= 0) & (final == 0)
+        return self._reduce(balanced, bool)
+
+    def factor_count(self) -> np.ndarray:
+        """Number of top-level factors ('(' at depth 0) of every expression."""
+        return self._reduce(lambda bits, depth: (bits & (depth == 1)).sum(axis=1), np.int64)
+
+    def max_depth(self) -> np.ndarray:
+        """Nesting depth of the deepest circle of every expression."""
+        return self._reduce(lambda bits, depth: depth.max(axis=1, initial=0), np.int64)
+
+    def depths(self) -> np.ndarray:
+        """
+        Return the depth after every symbol.
+
+        Returns:
+            int32 array of shape (len(batch), length)
+        """
+        depths = np.empty((len(self), self.length), dtype=np.int32)
+        for start, _, depth in self._blocks():
+            depths[start:start + depth.shape[0]] = depth
+        return depths
+
+    def depth_profile(self) -> np.ndarray:
+        """
+        Return the number of circles at every nesting depth.
+
+        Returns:
+            Array of shape (len(batch), deepest depth of the batch); column d
+            counts the circles at depth d + 1
+        """
+        width = int(self.max_depth().max(initial=0))
+        profile = np.zeros((len(self), width), dtype=np.int64)
+        for start, bits, depth in self._blocks():
+            rows, columns = np.nonzero(bits & (depth >= 1))
+            cells = rows * width + depth[rows, columns] - 1
+            block = np.bincount(cells, minlength=bits.shape[0] * width)
+            profile[start:start + bits.shape[0]] = block.reshape(bits.shape[0], width)
+        return profile
+
+    def factor_boundaries(self) -> np.ndarray:
+        """
+        Return the top-level factor boundaries of every expression.
+
+        Returns:
+            Boolean array of shape (len(batch), length + 1); entry i is set
+            when the first i symbols are balanced, so the factors of a valid
+            expression are the substrings between consecutive set entries
+        """
+        boundaries = np.ones((len(self), self.length + 1), dtype=bool)
+        for start, _, depth in self._blocks():
+            boundaries[start:start + depth.shape[0], 1:] = depth == 0
+        return boundaries
+
+    def _blocks(self):
+        """Yield (first row, bits, depth) for consecutive blocks of BLOCK_ROWS rows."""
+        for start in range(0, len(self), BLOCK_ROWS):
+            bits = self._bits(self.words[start:start + BLOCK_ROWS])
+            depth = np.cumsum(2 * bits.astype(np.int32) - 1, axis=1, dtype=np.int32)
+            yield start, bits, depth
+
+    def _reduce(self, function, dtype) -> np.ndarray:
+        result = np.empty(len(self), dtype=dtype)
+        for start, bits, depth in self._blocks():
+            result[start:start + bits.shape[0]] = function(bits, depth)
+        return result
+
+    def _bits(self, words: np.ndarray) -> np.ndarray:
+        raw = np.ascontiguousarray(words, dtype='<u8').view(np.uint8)
+        return np.unpackbits(raw, axis=1, count=self.length, bitorder='little').astype(bool)
+
+    def _texts(self, words: np.ndarray) -> List[str]:
+        if not self.length:
+            return [''] * words.shape[0]
+        symbols = np.where(self._bits(words), _OPEN, _CLOSE).astype(np.uint8).tobytes().decode()
+        return [symbols[i:i + self.length] for i in range(0, len(symbols), self.length)]
+
+
+def _word_count(length: int) -> int:
+    return max(1, (length + 63) // 64)
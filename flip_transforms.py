@@ -5,8 +5,7 @@ This module provides tools to visualize and analyze flip transformations
 of circle topologies, as described in Section 2.2 of the paper.
 """
 
-from typing import List, Set, Tuple, Dict
-from circle_topology import CircleTopology
+from typing import List, Sequence, Set, Tuple, Dict
 
 
 class CircleExpression:
@@ -56,6 +55,59 @@ class CircleExpression:
                 depth -= 1
         return factors
     
+    def max_depth(self) -> int:
+        """
+        Return the nesting depth of the deepest circle (0 for no circles).
+        """
+        deepest = 0
+        depth = 0
+        for c in self.expr:
+            if c == '(':
+                depth += 1
+                deepest = max(deepest, depth)
+            elif c == ')':
+                depth -= 1
+        return deepest
+    
+    def nesting_parents(self) -> List[int]:
+        """
+        Return the nesting forest of the expression.
+        
+        Circles are numbered in the order of their opening parentheses.
+        
+        Returns:
+            List where entry i is the index of the circle directly enclosing
+            circle i, or -1 for a circle at the top level
+        """
+        parents = []
+        stack = []
+        for c in self.expr:
+            if c == '(':
+                parents.append(stack[-1] if stack else -1)
+                stack.append(len(parents) - 1)
+            elif c == ')':
+                stack.pop()
+        return parents
+    
+    def canonical(self) -> 'CircleExpression':
+        """
+        Return the canonical representative of this topology.
+        
+        Two expressions describe the same planar topology exactly when their
+        canonical forms are equal (see canonical_expression_from_parents).
+        """
+        return CircleExpression(canonical_expression_from_parents(self.nesting_parents()))
+    
+    def sphere_canonical(self) -> 'CircleExpression':
+        """
+        Return the canonical representative of this topology's sphere cluster.
+        
+        Two expressions lie in the same flip cluster (the same arrangement on
+        the sphere surface) exactly when their sphere canonical forms are
+        equal (see sphere_expression_from_parents).
+        """
+        return CircleExpression(sphere_expression_from_parents(self.nesting_parents()))
+    
     def flip_transform(self) -> Set[str]:
         """
         Generate all expressions reachable by flip transformations.
@@ -138,6 +190,130 @@ class CircleExpression:
         return hash(self.expr)
 
 
+def canonical_expression_from_parents(parents: Sequence[int]) -> str:
+    """
+    Build the canonical expression of a nesting forest.
+    
+    Sibling circles are ordered by decreasing nesting height, and circles of
+    equal height by the sorted ranks of their children, so the order is a
+    fixed total order on topologies. Ranks are assigned one height level at
+    a time (AHU labelling), which keeps the construction O(n log n) and free
+    of recursion for arbitrarily deep nesting.
+    
+    Args:
+        parents: parents[i] is the index of the circle directly enclosing
+            circle i, or -1 for a circle at the top level
+            
+    Returns:
+        Canonical parentheses expression
+    """
+    n = len(parents)
+    children: List[List[int]] = [[] for _ in range(n)]
+    roots = []
+    for i, p in enumerate(parents):
+        if p < 0:
+            roots.append(i)
+        else:
+            children[p].append(i)
+    
+    # Breadth-first order, so every circle comes after its parent
+    order = list(roots)
+    for v in order:
+        order.extend(children[v])
+    if len(order) != n:
+        raise ValueError("Parent array does not describe a forest")
+    
+    height = [1] * n
+    for v in reversed(order):
+        p = parents[v]
+        if p >= 0 and height[v] + 1 > height[p]:
+            height[p] = height[v] + 1
+    
+    levels: Dict[int, List[int]] = {}
+    for v in order:
+        levels.setdefault(height[v], []).append(v)
+    
+    rank: List[Tuple[int, int]] = [(0, 0)] * n
+    for h in sorted(levels):
+        keys = {v: tuple(sorted(rank[c] for c in children[v])) for v in levels[h]}
+        local = {key: i for i, key in enumerate(sorted(set(keys.values())))}
+        for v, key in keys.items():
+            rank[v] = (-h, local[key])
+    
+    out = []
+    stack = [(v, False) for v in sorted(roots, key=rank.__getitem__, reverse=True)]
+    while stack:
+        v, closing = stack.pop()
+        if closing:
+            out.append(')')
+            continue
+        out.append('(')
+        stack.append((v, True))
+        stack.extend((c, False) for c in sorted(children[v], key=rank.__getitem__, reverse=True))
+    return ''.join(out)
+
+
+def sphere_expression_from_parents(parents: Sequence[int]) -> str:
+    """
+    Build the canonical expression of the sphere cluster of a nesting forest.
+    
+    On the sphere any region may serve as the outside, so a cluster is the
+    free tree of regions (the circles plus the outer plane region) up to
+    the choice of root. Flipping the outside onto the center of that tree
+    (one region, or the better of two adjacent ones) gives a
+    representative that does not depend on the original choice.
+    
+    Args:
+        parents: parents[i] is the index of the circle directly enclosing
+            circle i, or -1 for a circle at the top level
+            
+    Returns:
+        Canonical parentheses expression of the cluster representative
+    """
+    n = len(parents)
+    # Region n is the outside; region i is inside circle i
+    adjacent: List[List[int]] = [[] for _ in range(n + 1)]
+    for i, p in enumerate(parents):
+        p = n if p < 0 else p
+        adjacent[i].append(p)
+        adjacent[p].append(i)
+    
+    # Peel leaves until one or two centers remain
+    degree = [len(a) for a in adjacent]
+    layer = [v for v in range(n + 1) if degree[v] <= 1]
+    remaining = n + 1
+    while remaining > 2:
+        remaining -= len(layer)
+        nxt = []
+        for v in layer:
+            for w in adjacent[v]:
+                degree[w] -= 1
+                if degree[w] == 1:
+                    nxt.append(w)
+        layer = nxt
+    
+    best = None
+    for center in layer:
+        rooted = [-1] * (n + 1)
+        order = [center]
+        seen = [False] * (n + 1)
+        seen[center] = True
+        for v in order:
+            for w in adjacent[v]:
+                if not seen[w]:
+                    seen[w] = True
+                    rooted[w] = v
+                    order.append(w)
+        # Renumber the regions other than the center as circles
+        number = [v if v < center else v - 1 for v in range(n + 1)]
+        forest = [-1 if rooted[v] == center else number[rooted[v]]
+                  for v in range(n + 1) if v != center]
+        expr = canonical_expression_from_parents(forest)
+        if best is None or expr < best:
+            best = expr
+    return best
+
+
 def find_flip_clusters(expressions: List[str]) -> List[Set[str]]:
     """
     Find clusters of expressions connected by flip transformations.
@@ -221,6 +397,8 @@ def analyze_flip_structure(n: int) -> Dict[str, any]:
             'cluster_sizes': [len(c) for c in clusters]
         }
     else:
+        # Imported on use: the counting tables are not needed for flips
+        from circle_topology import CircleTopology
         return {
             'n': n,
             'total_topologies': CircleTopology.non_intersecting_circles(n),
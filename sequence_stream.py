@@ -0,0 +1,227 @@
+"""
+Streaming Output of Counting Sequences
+
+Encoders and writers for the dump formats of the circle_topology command
+line interface:
+
+- bfile:  OEIS b-file lines "n a(n)"
+- csv:    a header "n,<sequence>" followed by one row per term
+- jsonl:  one JSON object {"n": n, "<sequence>": a(n)} per line
+- varint: the values as consecutive unsigned LEB128 varints, no index
+
+Terms are encoded and written as they arrive, so a dump never holds more
+than a few chunks of output in memory. Converting huge integers to decimal
+is the expensive part of the text formats, so it can be spread over a pool
+of worker processes while the caller keeps computing.
+"""
+
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import BinaryIO, Iterable, Iterator, List, Tuple
+
+
+FORMATS = ('bfile', 'csv', 'jsonl', 'varint')
+
+# Terms handed to a worker process at a time, and written between flushes
+_CHUNK_SIZE = 64
+
+# Longest time in seconds written terms may wait for a flush
+_FLUSH_INTERVAL = 1.0
+
+_limit_lock = threading.Lock()
+_limit_users = 0
+_saved_limit = 0
+
+
+@contextmanager
+def _huge_decimals() -> Iterator[None]:
+    """
+    Lift the interpreter limit on int to decimal string conversion meanwhile.
+
+    The limit guards against denial of service through huge decimal
+    strings, so it is restored when the last thread converting terms is
+    done rather than switched off for the whole process.
+    """
+    global _limit_users, _saved_limit
+    if not hasattr(sys, 'set_int_max_str_digits'):
+        yield
+        return
+    with _limit_lock:
+        if _limit_users == 0:
+            _saved_limit = sys.get_int_max_str_digits()
+            sys.set_int_max_str_digits(0)
+        _limit_users += 1
+    try:
+        yield
+    finally:
+        with _limit_lock:
+            _limit_users -= 1
+            if _limit_users == 0:
+                sys.set_int_max_str_digits(_saved_limit)
+
+
+def encode_varint(value: int) -> bytes:
+    """
+    Encode a non-negative integer as an unsigned LEB128 varint.
+
+    The integer is converted to bytes once and regrouped into 7-bit groups
+    56 bits at a time, so encoding is linear in the size of the value.
+
+    Args:
+        value: Non-negative integer
+
+    Returns:
+        The varint encoding
+    """
+    if value < 0:
+        raise ValueError(f"Varints encode non-negative integers only: {value}")
+    if value < 0x80:
+        return bytes((value,))
+    groups = -(-value.bit_length() // 7)
+    words = -(-groups // 8)
+    raw = value.to_bytes(words * 7, 'little')
+    out = bytearray()
+    for i in range(0, len(raw), 7):
+        word = int.from_bytes(raw[i:i + 7], 'little')
+        for _ in range(8):
+            out.append((word & 0x7F) | 0x80)
+            word >>= 7
+    del out[groups:]
+    out[-1] &= 0x7F
+    return bytes(out)
+
+
+def iter_varints(stream: BinaryIO) -> Iterator[int]:
+    """
+    Decode a stream of unsigned LEB128 varints.
+
+    Args:
+        stream: Binary file object positioned at the first varint
+
+    Yields:
+        The decoded integers in order
+    """
+    groups: List[int] = []
+    while True:
+        block = stream.read(65536)
+        if not block:
+            break
+        for byte in block:
+            groups.append(byte & 0x7F)
+            if byte < 0x80:
+                value = 0
+                for group in reversed(groups):
+                    value = (value << 7) | group
+                groups = []
+                yield value
+    if groups:
+        raise ValueError("Truncated varint at end of stream")
+
+
+def header(fmt: str, name: str) -> bytes:
+    """
+    Return the bytes written before the first term.
+
+    Args:
+        fmt: One of FORMATS
+        name: Name of the sequence
+    """
+    if fmt == 'csv':
+        return f"n,{name}\n".encode()
+    return b''
+
+
+def encode_terms(fmt: str, name: str, terms: List[Tuple[int, int]]) -> bytes:
+    """
+    Encode a chunk of (n, value) terms.
+
+    Args:
+        fmt: One of FORMATS
+        name: Name of the sequence (used as the JSON key)
+        terms: List of (index, value) pairs
+
+    Returns:
+        The encoded chunk
+    """
+    if fmt == 'varint':
+        return b''.join(encode_varint(value) for _, value in terms)
+    with _huge_decimals():
+        if fmt == 'bfile':
+            text = ''.join(f"{n} {value}\n" for n, value in terms)
+        elif fmt == 'csv':
+            text = ''.join(f"{n},{value}\n" for n, value in terms)
+        elif fmt == 'jsonl':
+            text = ''.join(f'{{"n": {n}, "{name}": {value}}}\n' for n, value in terms)
+        else:
+            raise ValueError(f"Unknown output format: {fmt}")
+    return text.encode()
+
+
+def _chunks(terms: Iterable[Tuple[int, int]], size: int) -> Iterator[List[Tuple[int, int]]]:
+    chunk = []
+    for term in terms:
+        chunk.append(term)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def write_sequence(terms: Iterable[Tuple[int, int]], stream: BinaryIO, fmt: str = 'bfile',
+                   name: str = 'value', workers: int = 1) -> int:
+    """
+    Encode terms and write them to a binary stream as they are produced.
+
+    With workers > 1, chunks are encoded in a process pool. At most two
+    chunks per worker are in flight, so memory stays bounded however long
+    the sequence is, and output order is preserved.
+
+    Args:
+        terms: Iterable of (index, value) pairs
+        stream: Binary file object to write to
+        fmt: One of FORMATS
+        name: Name of the sequence
+        workers: Number of encoding processes
+
+    Returns:
+        Number of terms written
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown output format: {fmt}")
+    stream.write(header(fmt, name))
+    count = 0
+
+    if workers <= 1:
+        # Terms go through the stream's buffer as they are computed; flushing
+        # every chunk, or after a slow term, keeps consumers current without
+        # a system call per term
+        flushed = time.monotonic()
+        for term in terms:
+            stream.write(encode_terms(fmt, name, [term]))
+            count += 1
+            if count % _CHUNK_SIZE == 0 or time.monotonic() - flushed >= _FLUSH_INTERVAL:
+                stream.flush()
+                flushed = time.monotonic()
+        stream.flush()
+        return count
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for chunk in _chunks(terms, _CHUNK_SIZE):
+            in_flight.append((len(chunk), pool.submit(encode_terms, fmt, name, chunk)))
+            if len(in_flight) >= 2 * workers:
+                size, future = in_flight.popleft()
+                stream.write(future.result())
+                stream.flush()
+                count += size
+        while in_flight:
+            size, future = in_flight.popleft()
+            stream.write(future.result())
+            count += size
+        stream.flush()
+    return count
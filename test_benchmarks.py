@@ -0,0 +1,114 @@
+"""
+Tests for the benchmark suite.
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import benchmarks
+import circle_topology
+from benchmarks import CASES, compare, fit_exponent, fresh_tables, run_benchmarks
+
+
+def result(times, exponent, sizes=(50, 100, 200)):
+    return {'sizes': list(sizes), 'times': list(times), 'peak_memory': [0] * len(sizes),
+            'exponent': exponent}
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Test the measurements and the regression check."""
+
+    def test_fit_exponent(self):
+        """The fitted exponent recovers a power law."""
+        sizes = [10, 20, 40, 80]
+        self.assertAlmostEqual(fit_exponent(sizes, [3e-6 * n ** 2 for n in sizes]), 2.0)
+        self.assertAlmostEqual(fit_exponent(sizes, [1e-3] * 4), 0.0)
+        self.assertEqual(fit_exponent([5, 5], [1.0, 2.0]), 0.0)
+
+    def test_compare(self):
+        """Slowdowns beyond the threshold and steeper scaling are reported."""
+        baseline = {'cases': {'a': result([1, 2, 4], 1.0), 'b': result([1, 1, 1], -0.4)}}
+        same = {'cases': {'a': result([1, 2, 5], 1.1), 'b': result([1, 1, 1], 0.2)}}
+        self.assertEqual(compare(same, baseline), [])
+        slower = {'cases': {'a': result([1, 2, 7], 1.0)}}
+        self.assertEqual(len(compare(slower, baseline)), 1)
+        steeper = {'cases': {'a': result([1, 2, 4], 1.5, sizes=(10, 20, 40))}}
+        self.assertEqual(len(compare(steeper, baseline)), 1)
+        unknown = {'cases': {'c': result([9, 9, 9], 9.0)}}
+        self.assertEqual(compare(unknown, baseline), [])
+
+    def test_compare_exponents_only(self):
+        """A baseline without times checks exponents of runs of its own kind."""
+        baseline = {'quick': False, 'cases': {'a': {'sizes': [50, 100, 200], 'exponent': 1.0}}}
+        faster = {'quick': False, 'cases': {'a': result([1e-9] * 3, 1.1)}}
+        self.assertEqual(compare(faster, baseline), [])
+        steeper = {'quick': False, 'cases': {'a': result([1, 2, 4], 1.5)}}
+        self.assertEqual(len(compare(steeper, baseline)), 1)
+        quick = dict(steeper, quick=True)
+        self.assertEqual(compare(quick, baseline), [])
+
+    def test_shipped_baseline(self):
+        """The repository baseline covers every case of a full run."""
+        with open(os.path.join(os.path.dirname(os.path.abspath(benchmarks.__file__)),
+                               benchmarks.BASELINE)) as f:
+            shipped = json.load(f)
+        self.assertFalse(shipped['quick'])
+        self.assertEqual(sorted(shipped['cases']), sorted(CASES))
+        for name, reference in shipped['cases'].items():
+            with self.subTest(case=name):
+                self.assertEqual(reference['sizes'], list(CASES[name].sizes))
+
+    def test_fresh_tables_restores(self):
+        """Cold runs leave the shared tables untouched."""
+        shared = circle_topology._TREES
+        with fresh_tables():
+            self.assertIsNot(circle_topology._TREES, shared)
+            self.assertEqual(len(circle_topology._TREES), 0)
+        self.assertIs(circle_topology._TREES, shared)
+
+    def test_run(self):
+        """A quick run records every field for the requested cases."""
+        names = ['rooted_trees.cold', 'catalan_number.warm', 'find_flip_clusters']
+        results = run_benchmarks(names, quick=True, repeats=1)
+        self.assertEqual(sorted(results['cases']), sorted(names))
+        for name, measured in results['cases'].items():
+            with self.subTest(case=name):
+                self.assertEqual(measured['sizes'], list(CASES[name].quick_sizes))
+                self.assertTrue(all(t > 0 for t in measured['times']))
+                self.assertEqual(len(measured['peak_memory']), len(measured['sizes']))
+        self.assertGreater(results['cases']['rooted_trees.cold']['exponent'], 1.0)
+        with self.assertRaises(ValueError):
+            run_benchmarks(['no_such_case'])
+
+    def test_main_flags_regression(self):
+        """The command line exits with status 1 on a regression."""
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, 'results.json')
+            baseline = os.path.join(tmp, 'baseline.json')
+            args = ['--quick', '--repeats', '1', '--case', 'catalan_number.cold',
+                    '--output', output, '--baseline', baseline]
+            self.assertEqual(benchmarks.main(args + ['--update-baseline']), 0)
+            with open(baseline) as f:
+                recorded = json.load(f)
+            recorded['cases']['catalan_number.cold']['times'][-1] /= 100
+            with open(baseline, 'w') as f:
+                json.dump(recorded, f)
+            self.assertEqual(benchmarks.main(args), 1)
+
+    def test_main_requires_baseline(self):
+        """A run without a baseline fails instead of passing unchecked."""
+        with tempfile.TemporaryDirectory() as tmp:
+            args = ['--quick', '--repeats', '1', '--case', 'catalan_number.warm',
+                    '--output', os.path.join(tmp, 'results.json'),
+                    '--baseline', os.path.join(tmp, 'missing.json')]
+            with contextlib.redirect_stdout(io.StringIO()), \
+                    contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(benchmarks.main(args), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Tests for the precomputed table module and its generator.
+"""
+
+import base64
+import unittest
+
+import circle_topology
+import topology_tables
+from build_tables import FAMILIES, encode_table, render_module
+from circle_topology import TOPOLOGY_GRAMMAR, CircleTopology, computed_terms
+
+
+class TestTables(unittest.TestCase):
+    """Test the packed tables against the generators."""
+
+    def test_layout(self):
+        """Count, offsets and little-endian terms."""
+        table = encode_table([0, 1, 256, 2 ** 70])
+        self.assertEqual(table[:4], (4).to_bytes(4, 'little'))
+        offsets = [int.from_bytes(table[4 + 4 * i:8 + 4 * i], 'little') for i in range(5)]
+        self.assertEqual(offsets, [0, 0, 1, 3, 12])
+        data = b'\x01' + (256).to_bytes(2, 'little') + (2 ** 70).to_bytes(9, 'little')
+        self.assertEqual(table[24:], data)
+
+    def test_render_round_trip(self):
+        """The rendered module holds the tables base64-encoded."""
+        tables = {'rooted': encode_table([0, 1, 1, 2, 4])}
+        namespace = {}
+        exec(render_module(tables, 5), namespace)
+        self.assertEqual(namespace['TERMS'], 5)
+        self.assertEqual(base64.b64decode(namespace['TABLES']['rooted']), tables['rooted'])
+
+    def test_shipped_terms(self):
+        """The shipped terms are those of freshly compiled generators."""
+        self.assertEqual(sorted(topology_tables.TABLES), sorted(FAMILIES))
+        generators = {
+            'catalan': TOPOLOGY_GRAMMAR.compile('catalan'),
+            'pairs': TOPOLOGY_GRAMMAR.compile('pairs'),
+            'triples': TOPOLOGY_GRAMMAR.compile('triples'),
+        }
+        trees = TOPOLOGY_GRAMMAR.compile('rooted', 'unrooted')
+        generators['rooted'] = generators['unrooted'] = trees
+        last = topology_tables.TERMS - 1
+        for family, generator in generators.items():
+            with self.subTest(family=family):
+                for n in list(range(300)) + [last]:
+                    self.assertEqual(circle_topology._precomputed(family, n),
+                                     generator.coefficient(family, n))
+                self.assertIsNone(circle_topology._precomputed(family, last + 1))
+                self.assertIsNone(circle_topology._precomputed(family, -1))
+
+    def test_counters_use_tables(self):
+        """Terms inside the tables are available without computation."""
+        last = topology_tables.TERMS - 1
+        self.assertGreaterEqual(computed_terms('rooted'), topology_tables.TERMS)
+        self.assertEqual(computed_terms('planar'), computed_terms('rooted') - 1)
+        self.assertEqual(CircleTopology.rooted_trees(last),
+                         circle_topology._precomputed('rooted', last))
+        sequence = CircleTopology.generate_sequence(last - 1)
+        self.assertEqual(sequence[-1], CircleTopology.rooted_trees(last))
+        self.assertEqual(sequence[:5], [1, 1, 2, 4, 9])
+        self.assertEqual(CircleTopology.rooted_trees_range(last - 2, last),
+                         [CircleTopology.rooted_trees(n) for n in range(last - 2, last + 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,302 @@
+"""
+Tests for the geometric circle classifier.
+"""
+
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional for the counting modules
+    np = None
+
+from circle_topology import CircleTopology
+from flip_transforms import CircleExpression
+from test_flip_transforms import dyck_words
+
+if np is not None:
+    import circle_geometry
+    from circle_geometry import (
+        classify_arrangement, classify_circles, classify_frames, intersecting_pairs,
+        layout_expression, layout_expressions, nesting_parents,
+    )
+
+
+def random_arrangement(n, rng):
+    """Place n non-intersecting circles by nesting each in a random container."""
+    circles = []
+    containers = [(0.0, 0.0, 1000.0, -1)]
+    while len(circles) < n:
+        cx, cy, big_r, parent = rng.choice(containers)
+        r = big_r * rng.uniform(0.05, 0.3)
+        d = (big_r - r) * rng.uniform(0.0, 0.9)
+        angle = rng.uniform(0.0, 6.283)
+        x = cx + d * np.cos(angle)
+        y = cy + d * np.sin(angle)
+        # Keep clear of every other circle (no crossings, no near-tangency)
+        if all(abs(np.hypot(x - ox, y - oy) - abs(r - orr)) > 0.02 * r
+               and (np.hypot(x - ox, y - oy) > (r + orr) * 1.02
+                    or np.hypot(x - ox, y - oy) < abs(r - orr) * 0.98)
+               for ox, oy, orr, _ in circles):
+            circles.append((x, y, r, parent))
+            containers.append((x, y, r, len(circles) - 1))
+    centers = np.array([(x, y) for x, y, _, _ in circles])
+    radii = np.array([r for _, _, r, _ in circles])
+    return centers, radii
+
+
+def brute_force_parents(centers, radii):
+    """Smallest enclosing circle by pairwise containment tests."""
+    parents = []
+    for i in range(len(radii)):
+        best = -1
+        for j in range(len(radii)):
+            inside = np.hypot(*(centers[i] - centers[j])) + radii[i] < radii[j]
+            if j != i and inside and (best < 0 or radii[j] < radii[best]):
+                best = j
+        parents.append(best)
+    return parents
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestNestingParents(unittest.TestCase):
+    """Test the sweep-line nesting forest."""
+
+    def test_matches_brute_force(self):
+        """The sweep agrees with pairwise containment on random arrangements."""
+        rng = random.Random(1603)
+        for trial in range(60):
+            centers, radii = random_arrangement(rng.randint(1, 40), rng)
+            with self.subTest(trial=trial):
+                self.assertEqual(nesting_parents(centers, radii).tolist(),
+                                 brute_force_parents(centers, radii))
+
+    def test_bucket_splits(self):
+        """Tiny buckets exercise splitting and cross-bucket removal."""
+        rng = random.Random(81)
+        saved = circle_geometry._BUCKET_LOAD
+        circle_geometry._BUCKET_LOAD = 2
+        try:
+            for trial in range(30):
+                centers, radii = random_arrangement(rng.randint(10, 50), rng)
+                with self.subTest(trial=trial):
+                    self.assertEqual(nesting_parents(centers, radii).tolist(),
+                                     brute_force_parents(centers, radii))
+        finally:
+            circle_geometry._BUCKET_LOAD = saved
+
+    def test_invalid_input(self):
+        """Shapes and radii are validated."""
+        with self.assertRaises(ValueError):
+            nesting_parents(np.zeros((3, 3)), np.ones(3))
+        with self.assertRaises(ValueError):
+            nesting_parents(np.zeros((3, 2)), np.ones(2))
+        with self.assertRaises(ValueError):
+            nesting_parents(np.zeros((1, 2)), np.array([-1.0]))
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestClassifyCircles(unittest.TestCase):
+    """Test the canonical expressions produced from geometry."""
+
+    def test_known_arrangement(self):
+        """Two nested circles beside a circle holding two disjoint ones."""
+        centers = np.array([[0, 0], [0, 0], [10, 0], [9, 0], [11, 0]], dtype=float)
+        radii = np.array([2.0, 1.0, 3.0, 0.5, 0.5])
+        self.assertEqual(classify_circles(centers, radii), CircleExpression('(())(()())'))
+
+    def test_empty(self):
+        self.assertEqual(classify_circles(np.zeros((0, 2)), np.zeros(0)).expr, '')
+
+    def test_canonical_under_relabelling(self):
+        """Permuting the circles does not change the expression."""
+        rng = random.Random(7)
+        centers, radii = random_arrangement(30, rng)
+        expected = classify_circles(centers, radii)
+        perm = np.random.default_rng(7).permutation(len(radii))
+        self.assertEqual(classify_circles(centers[perm], radii[perm]), expected)
+        self.assertEqual(expected, expected.canonical())
+
+
+def similar_copies(centers, radii, count, seed):
+    """Rotated, reflected, scaled, shifted and relabelled copies of a circle set."""
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        angle = rng.uniform(0.0, 2 * np.pi)
+        turn = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+        if rng.random() < 0.5:
+            turn = turn @ np.diag([1.0, -1.0])
+        scale = rng.uniform(0.1, 10.0)
+        perm = rng.permutation(len(radii))
+        shift = rng.uniform(-50.0, 50.0, 2)
+        yield (centers @ turn.T * scale + shift)[perm], radii[perm] * scale
+
+
+# Triangle of centers with unit sides, for the 3-circle intersections
+_TRIANGLE = [[0.0, 0.0], [1.0, 0.0], [0.5, np.sqrt(3) / 2]] if np is not None else []
+_ACROSS = [[-0.6, 0.0], [0.6, 0.0], [0.0, 0.0]]
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestIntersectingPairs(unittest.TestCase):
+    """Test the grid-based crossing detection."""
+    
+    def test_matches_brute_force(self):
+        """Grid candidates find every crossing pair, large circles included."""
+        rng = np.random.default_rng(1603)
+        centers = rng.uniform(0.0, 100.0, (400, 2))
+        radii = rng.exponential(2.0, 400)
+        radii[:5] = 60.0
+        d = np.hypot(*(centers[:, None, :] - centers[None, :, :]).transpose(2, 0, 1))
+        cross = (d < radii[:, None] + radii[None, :]) & (d > np.abs(radii[:, None] - radii[None, :]))
+        expected = np.argwhere(np.triu(cross, 1))
+        self.assertEqual(intersecting_pairs(centers, radii).tolist(), expected.tolist())
+    
+    def test_nested_and_disjoint_do_not_cross(self):
+        centers = np.array([[0, 0], [0.2, 0], [5, 0]], dtype=float)
+        self.assertEqual(intersecting_pairs(centers, np.array([2.0, 1.0, 1.0])).shape, (0, 2))
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestClassifyArrangement(unittest.TestCase):
+    """Test the serialized notation of intersecting circle sets."""
+    
+    def classify(self, centers, radii):
+        return classify_arrangement(np.array(centers, dtype=float), np.array(radii, dtype=float))
+    
+    def test_paper_examples(self):
+        """The pair examples of the serialized notation section."""
+        self.assertEqual(self.classify([[0, 0], [1.5, 0]], [1, 1]), '[[]]')
+        self.assertEqual(self.classify([[0.5, 0], [0, 0], [1, 0], [5, 0]], [3, 0.6, 0.6, 0.5]),
+                         '([[]])()')
+        self.assertEqual(self.classify([[0.5, 0], [0, 0], [1, 0], [1.4, 0]], [3, 0.6, 0.6, 0.1]),
+                         '([[]()])')
+    
+    def test_pair_mirror(self):
+        """Contents of reg1 and reg3 are interchangeable."""
+        left = self.classify([[0, 0], [1, 0], [-0.4, 0]], [0.6, 0.6, 0.1])
+        right = self.classify([[0, 0], [1, 0], [1.4, 0]], [0.6, 0.6, 0.1])
+        lens = self.classify([[0, 0], [1, 0], [0.5, 0]], [0.6, 0.6, 0.05])
+        self.assertEqual(left, right)
+        self.assertEqual(lens, '[[()]]')
+    
+    def test_triple_types(self):
+        """Each of the six 3-circle topologies is recognized."""
+        cases = {
+            '{1|||||||}': (_TRIANGLE, [0.8, 0.8, 0.8]),
+            '{2|||||||}': (_TRIANGLE, [0.55, 0.55, 0.55]),
+            '{3|||||}': ([[0, 0], [1.5, 0], [3, 0]], [1, 1, 1]),
+            '{4|||||||}': (_ACROSS, [1, 1, 0.9]),
+            '{5|||||||}': (_ACROSS, [1, 1, 0.5]),
+            '{6|||||}': ([[0, 0], [0.5, 0], [1.5, 0]], [2, 1, 1]),
+        }
+        for expected, (centers, radii) in cases.items():
+            with self.subTest(expected=expected):
+                self.assertEqual(self.classify(centers, radii), expected)
+    
+    def test_regions(self):
+        """Hole, upper and lower regions are told apart."""
+        self.assertEqual(self.classify(_TRIANGLE + [[0.5, 0.29]], [0.55] * 3 + [0.01]),
+                         '{2|||||||()}')
+        self.assertEqual(self.classify(_TRIANGLE + [[5, 5]], [0.55] * 3 + [0.01]),
+                         '(){2|||||||}')
+        both = self.classify(_ACROSS + [[0, 0.85], [0, -0.85]], [1, 1, 0.9, 0.02, 0.02])
+        same = self.classify(_ACROSS + [[0, 0.85], [0.01, 0.86]], [1, 1, 0.9, 0.004, 0.004])
+        self.assertEqual(both, '{4||||||()|()}')
+        self.assertEqual(same, '{4|||||||()()}')
+    
+    def test_invariant_under_similarity(self):
+        """Moving, mirroring and relabelling the circles keeps the expression."""
+        cases = [
+            (_TRIANGLE + [[0.5, 0.29], [-0.3, 0], [-0.3, 0.05]], [0.55] * 3 + [0.01, 0.05, 0.01]),
+            (_ACROSS + [[0, 0.85], [-1.2, 0], [0, 0]], [1, 1, 0.9, 0.02, 0.1, 0.1]),
+            (_ACROSS + [[0, 0.7], [1.3, 0], [0.3, 0.1]], [1, 1, 0.5, 0.05, 0.1, 0.05]),
+            ([[0, 0], [1.5, 0], [3, 0], [0, 0.5], [2.9, 0], [10, 0], [10, 0]],
+             [1, 1, 1, 0.2, 0.2, 5, 4.5]),
+            ([[0, 0], [0.5, 0], [1.5, 0], [1.9, 0], [0.6, 0]], [2, 1, 1, 0.05, 0.05]),
+        ]
+        for index, (centers, radii) in enumerate(cases):
+            centers, radii = np.array(centers, dtype=float), np.array(radii, dtype=float)
+            expected = classify_arrangement(centers, radii)
+            for moved in similar_copies(centers, radii, 40, index):
+                with self.subTest(case=index):
+                    self.assertEqual(classify_arrangement(*moved), expected)
+    
+    def test_agrees_with_nesting_classifier(self):
+        """Without crossings the notation is the canonical nesting expression."""
+        rng = random.Random(31)
+        for trial in range(40):
+            centers, radii = random_arrangement(rng.randint(1, 40), rng)
+            with self.subTest(trial=trial):
+                self.assertEqual(classify_arrangement(centers, radii),
+                                 classify_circles(centers, radii).expr)
+    
+    def test_frames(self):
+        """A batch gives the same expressions as one frame at a time."""
+        rng = random.Random(5)
+        frames = [random_arrangement(rng.randint(1, 30), rng) for _ in range(20)]
+        frames.append((np.zeros((0, 2)), np.zeros(0)))
+        frames.append((np.array(_ACROSS), np.array([1, 1, 0.9])))
+        self.assertEqual(classify_frames(frames),
+                         [classify_arrangement(c, r) for c, r in frames])
+        self.assertEqual(classify_frames([]), [])
+    
+    def test_four_crossing_circles_rejected(self):
+        with self.assertRaises(ValueError):
+            self.classify([[0, 0], [1.5, 0], [3, 0], [4.5, 0]], [1, 1, 1, 1])
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestLayout(unittest.TestCase):
+    """Test realizing expressions as concrete circles."""
+    
+    def test_round_trip(self):
+        """Laid-out circles classify back to the expression's topology."""
+        for n in range(8):
+            words = list(dyck_words(n))
+            centers, radii, offsets = layout_expressions(words)
+            self.assertEqual(offsets[-1], n * len(words))
+            topologies = set()
+            for k, word in enumerate(words):
+                part = slice(offsets[k], offsets[k + 1])
+                expr = CircleExpression(word)
+                with self.subTest(word=word):
+                    self.assertEqual(nesting_parents(centers[part], radii[part]).tolist(),
+                                     expr.nesting_parents())
+                    self.assertEqual(classify_circles(centers[part], radii[part]), expr.canonical())
+                topologies.add(classify_circles(centers[part], radii[part]))
+            self.assertEqual(len(topologies), CircleTopology.non_intersecting_circles(n))
+    
+    def test_single_expression(self):
+        centers, radii = layout_expression(CircleExpression('(()())()'))
+        self.assertEqual(centers.shape, (4, 2))
+        self.assertEqual(radii.tolist(), [2.375, 1.0, 1.0, 1.0])
+        self.assertEqual(layout_expression('')[1].shape, (0,))
+    
+    def test_clearance(self):
+        """Neighbours and enclosing rims stay at least the gap apart."""
+        centers, radii = layout_expression('((())()(()()))(())', gap=0.5)
+        d = np.hypot(*(centers[:, None, :] - centers[None, :, :]).transpose(2, 0, 1))
+        parents = CircleExpression('((())()(()()))(())').nesting_parents()
+        for i in range(len(radii)):
+            for j in range(len(radii)):
+                if parents[i] == j:
+                    self.assertGreaterEqual(radii[j] - d[i, j] - radii[i], 0.5 - 1e-12)
+                elif i != j and parents[i] == parents[j]:
+                    self.assertGreaterEqual(d[i, j] - radii[i] - radii[j], 0.5 - 1e-12)
+    
+    def test_deep_nesting(self):
+        """Deep nesting needs no recursion and stays concentric."""
+        centers, radii = layout_expression('(' * 50000 + ')' * 50000)
+        self.assertTrue(np.all(centers == 0))
+        self.assertTrue(np.all(np.diff(radii) < 0))
+    
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            layout_expressions(['()', ')('])
+        with self.assertRaises(ValueError):
+            layout_expressions(['(x)'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,10 @@ sets of circles with various intersection constraints.
 """
 
 import unittest
-from circle_topology import CircleTopology
+from collections import Counter
+from circle_topology import CircleTopology, SequenceTable
+from flip_transforms import CircleExpression
+from topology_index import canonical_expressions
 
 
 class TestCircleTopology(unittest.TestCase):
@@ -285,6 +288,82 @@ class TestDimensionalProgression(unittest.TestCase):
                     f"Unrooted trees should be ≤ rooted trees for n={n}")
 
 
+class TestSequenceTable(unittest.TestCase):
+    """Test the single-pass table of all counting sequences."""
+    
+    def test_rows_match_counters(self):
+        """Every column agrees with the corresponding counter."""
+        table = SequenceTable(12)
+        for row in table:
+            with self.subTest(n=row.n):
+                self.assertEqual(row.catalan, CircleTopology.catalan_number(row.n))
+                self.assertEqual(row.planar, CircleTopology.non_intersecting_circles(row.n))
+                self.assertEqual(row.sphere, CircleTopology.sphere_surface_clusters(row.n))
+                self.assertEqual(row.hypersphere, CircleTopology.hypersphere_4d_clusters(row.n))
+                self.assertEqual(row.pairs, CircleTopology.pairs_may_intersect(row.n))
+                self.assertEqual(row.triples, CircleTopology.triples_may_intersect(row.n))
+    
+    def test_columns(self):
+        """Columns match generate_sequence and reject unknown names."""
+        table = SequenceTable(8)
+        self.assertEqual(len(table), 9)
+        self.assertEqual(table.column('planar'), CircleTopology.generate_sequence(8, 'none'))
+        self.assertEqual(table.column('pairs'), CircleTopology.generate_sequence(8, 'pairs'))
+        self.assertEqual(table.column('sphere'), [1, 1, 1, 2, 3, 6, 11, 23, 47])
+        with self.assertRaises(ValueError):
+            table.column('invalid')
+    
+    def test_row_range(self):
+        """Rows outside the table range raise IndexError."""
+        table = SequenceTable(3)
+        with self.assertRaises(IndexError):
+            table.row(4)
+
+
+class TestDistributions(unittest.TestCase):
+    """Test the factor count and depth distributions against enumeration."""
+    
+    def test_match_enumeration(self):
+        """Counts agree with the statistics of every enumerated topology."""
+        for n in range(9):
+            factors = Counter()
+            depths = Counter()
+            for expr in canonical_expressions(n):
+                expression = CircleExpression(expr)
+                factors[expression.factor_count()] += 1
+                depths[expression.max_depth()] += 1
+            with self.subTest(n=n):
+                self.assertEqual(CircleTopology.factor_count_distribution(n),
+                                 [factors[f] for f in range(n + 1)])
+                self.assertEqual(CircleTopology.depth_distribution(n),
+                                 [depths[d] for d in range(n + 1)])
+    
+    def test_known_rows(self):
+        """Rows of OEIS A033185 and A034781."""
+        self.assertEqual(CircleTopology.factor_count_distribution(6), [0, 20, 16, 7, 3, 1, 1])
+        self.assertEqual(CircleTopology.depth_distribution(6), [0, 1, 10, 18, 13, 5, 1])
+    
+    def test_totals(self):
+        """Both distributions sum to the number of topologies."""
+        for n in (20, 45, 60):
+            with self.subTest(n=n):
+                total = CircleTopology.non_intersecting_circles(n)
+                factors = CircleTopology.factor_count_distribution(n)
+                depths = CircleTopology.depth_distribution(n)
+                self.assertEqual(sum(factors), total)
+                self.assertEqual(sum(depths), total)
+                self.assertEqual(factors[n], 1)
+                self.assertEqual(depths[n], 1)
+                # Adding a singleton maps n-1 circles with f-1 factors into f factors
+                self.assertEqual(factors[n - 1], 1)
+                self.assertEqual(factors[1], CircleTopology.rooted_trees(n))
+    
+    def test_negative_n(self):
+        """There are no topologies of a negative number of circles."""
+        self.assertEqual(CircleTopology.factor_count_distribution(-1), [])
+        self.assertEqual(CircleTopology.depth_distribution(-3), [])
+
+
 def run_tests():
     """Run all tests."""
     unittest.main(argv=[''], verbosity=2, exit=False)
@@ -0,0 +1,101 @@
+"""
+Tests for columnar expression batches.
+"""
+
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional for the counting modules
+    np = None
+
+from flip_transforms import CircleExpression
+from test_flip_transforms import dyck_words
+from topology_index import canonical_expressions
+
+if np is not None:
+    from expression_batch import ExpressionBatch
+
+
+def random_words(length, count, rng):
+    """Arbitrary, mostly ill-formed words over '(' and ')'."""
+    return [''.join(rng.choice('()') for _ in range(length)) for _ in range(count)]
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestExpressionBatch(unittest.TestCase):
+    """Test the vectorized queries against CircleExpression."""
+
+    def test_round_trip(self):
+        """Packing and unpacking returns the expressions, across word boundaries."""
+        rng = random.Random(4)
+        for length in (0, 2, 62, 64, 66, 130):
+            with self.subTest(length=length):
+                texts = random_words(length, 20, rng)
+                batch = ExpressionBatch.from_expressions(texts)
+                self.assertEqual(batch.words.shape, (20, max(1, (length + 63) // 64)))
+                self.assertEqual(batch.expressions(), texts)
+        expressions = [CircleExpression(e) for e in canonical_expressions(5)]
+        batch = ExpressionBatch.from_expressions(expressions)
+        self.assertEqual(batch.to_circle_expressions(), expressions)
+        self.assertEqual(batch[3], expressions[3])
+        self.assertEqual(batch[-1], expressions[-1])
+
+    def test_queries_match_circle_expression(self):
+        """Every query agrees with the per-object methods."""
+        words = list(dyck_words(6)) + list(canonical_expressions(6))
+        batch = ExpressionBatch.from_expressions(words)
+        expressions = [CircleExpression(w) for w in words]
+        self.assertTrue(batch.valid().all())
+        self.assertEqual(batch.count_circles().tolist(), [e.count_circles() for e in expressions])
+        self.assertEqual(batch.factor_count().tolist(), [e.factor_count() for e in expressions])
+        self.assertEqual(batch.max_depth().tolist(), [e.max_depth() for e in expressions])
+
+    def test_long_expressions(self):
+        """Queries work on expressions spanning several words."""
+        words = ['(' * 40 + ')' * 40 + '()' * 10, '()' * 50, '(' + '()' * 49 + ')']
+        batch = ExpressionBatch.from_expressions(words)
+        self.assertEqual(batch.factor_count().tolist(), [11, 50, 1])
+        self.assertEqual(batch.max_depth().tolist(), [40, 1, 2])
+        self.assertEqual(batch.count_circles().tolist(), [50, 50, 50])
+
+    def test_invalid_words(self):
+        """valid() flags ill-formed words; the counts still match."""
+        rng = random.Random(9)
+        words = random_words(12, 300, rng)
+        batch = ExpressionBatch.from_expressions(words)
+        for word, ok, factors in zip(words, batch.valid(), batch.factor_count()):
+            depths = [word[:i].count('(') - word[:i].count(')') for i in range(13)]
+            self.assertEqual(ok, min(depths) >= 0 and depths[-1] == 0)
+            self.assertEqual(factors, sum(1 for i, c in enumerate(word) if c == '(' and depths[i] == 0))
+
+    def test_depths_and_profile(self):
+        """Depth rows, per-depth circle counts and factor boundaries."""
+        batch = ExpressionBatch.from_expressions(['(()())()', '((()))()'])
+        self.assertEqual(batch.depths().tolist(), [[1, 2, 1, 2, 1, 0, 1, 0],
+                                                   [1, 2, 3, 2, 1, 0, 1, 0]])
+        self.assertEqual(batch.depth_profile().tolist(), [[2, 2, 0], [2, 1, 1]])
+        boundaries = batch.factor_boundaries()
+        self.assertEqual(np.nonzero(boundaries[0])[0].tolist(), [0, 6, 8])
+        self.assertEqual(np.nonzero(boundaries[1])[0].tolist(), [0, 6, 8])
+
+    def test_selection(self):
+        """Masks and slices select sub-batches."""
+        batch = ExpressionBatch.from_expressions(canonical_expressions(6))
+        deep = batch[batch.max_depth() >= 5]
+        expected = [e for e in canonical_expressions(6) if CircleExpression(e).max_depth() >= 5]
+        self.assertEqual(sorted(deep.expressions()), sorted(expected))
+        self.assertEqual(len(batch[:10]), 10)
+
+    def test_rejects_mixed_input(self):
+        """Expressions of different lengths or with other symbols are rejected."""
+        with self.assertRaises(ValueError):
+            ExpressionBatch.from_expressions(['()', '(())'])
+        with self.assertRaises(ValueError):
+            ExpressionBatch.from_expressions(['[]'])
+        self.assertEqual(len(ExpressionBatch.from_expressions([], length=8)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
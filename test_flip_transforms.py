@@ -0,0 +1,55 @@
+"""
+Tests for circle expressions and flip transformation utilities.
+"""
+
+import unittest
+from circle_topology import CircleTopology
+from flip_transforms import (
+    CircleExpression, canonical_expression_from_parents, generate_c4_expressions,
+)
+
+
+def dyck_words(n):
+    """All expressions of n circles, as ordered (non-canonical) words."""
+    if n == 0:
+        yield ''
+        return
+    for k in range(n):
+        for inner in dyck_words(k):
+            for rest in dyck_words(n - 1 - k):
+                yield '(' + inner + ')' + rest
+
+
+class TestCanonicalForm(unittest.TestCase):
+    """Test canonical representatives of planar topologies."""
+
+    def test_nesting_parents(self):
+        self.assertEqual(CircleExpression('(()())()').nesting_parents(), [-1, 0, 0, -1])
+
+    def test_one_representative_per_topology(self):
+        """Canonical forms of all ordered words count the rooted trees."""
+        for n in range(1, 8):
+            with self.subTest(n=n):
+                forms = {CircleExpression(w).canonical().expr for w in dyck_words(n)}
+                self.assertEqual(len(forms), CircleTopology.non_intersecting_circles(n))
+                for form in forms:
+                    self.assertEqual(CircleExpression(form).canonical().expr, form)
+
+    def test_paper_c4_expressions_are_canonical(self):
+        for expr in generate_c4_expressions():
+            with self.subTest(expr=expr):
+                self.assertEqual(CircleExpression(expr).canonical().expr, expr)
+
+    def test_deep_nesting(self):
+        """Deep nesting does not hit the recursion limit."""
+        n = 20000
+        parents = [i - 1 for i in range(n)]
+        self.assertEqual(canonical_expression_from_parents(parents), '(' * n + ')' * n)
+
+    def test_invalid_forest(self):
+        with self.assertRaises(ValueError):
+            canonical_expression_from_parents([1, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
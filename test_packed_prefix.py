@@ -0,0 +1,100 @@
+"""
+Tests for packed sequence prefixes.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from circle_topology import CircleTopology
+from packed_prefix import PackedPrefix, convolve
+from region_grammar import _poly_multiply
+
+
+class TestPackedPrefix(unittest.TestCase):
+    """Test storage, access and files."""
+
+    def setUp(self):
+        self.values = CircleTopology.generate_sequence(300)
+        self.prefix = PackedPrefix.from_values(self.values)
+
+    def test_random_access(self):
+        self.assertEqual(len(self.prefix), len(self.values))
+        for n in (0, 1, 17, 299, -1):
+            self.assertEqual(self.prefix[n], self.values[n])
+        self.assertEqual(self.prefix[5:12], self.values[5:12])
+        self.assertEqual(self.prefix.bit_length(250), self.values[250].bit_length())
+        self.assertEqual(self.prefix.bit_length(-1), self.values[-1].bit_length())
+        with self.assertRaises(IndexError):
+            self.prefix[len(self.values)]
+        with self.assertRaises(IndexError):
+            self.prefix.bit_length(len(self.values))
+
+    def test_zero_and_negative_terms(self):
+        prefix = PackedPrefix.from_values([0, 5, 0, 2 ** 64])
+        self.assertEqual(prefix[:], [0, 5, 0, 2 ** 64])
+        self.assertEqual(prefix.bit_length(0), 0)
+        with self.assertRaises(ValueError):
+            prefix.append(-1)
+
+    def test_file_round_trip(self):
+        """Saved prefixes are mapped read-only with the same terms."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'rooted.pfx')
+            self.prefix.save(path)
+            with PackedPrefix.open(path) as mapped:
+                self.assertEqual(mapped[:], self.values)
+                self.assertEqual(mapped.nbytes, self.prefix.nbytes)
+                with self.assertRaises(TypeError):
+                    mapped.append(1)
+            bad = os.path.join(tmp, 'bad.pfx')
+            with open(bad, 'wb') as f:
+                f.write(b'not a prefix file')
+            with self.assertRaises(ValueError):
+                PackedPrefix.open(bad)
+
+    def test_truncated_file(self):
+        """Files cut short in the data or the offsets are rejected."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'terms.pfx')
+            PackedPrefix.from_values([2 ** 200, 3 ** 100, 12345]).save(path)
+            with open(path, 'rb') as f:
+                data = f.read()
+            for cut in (1, 5, 30, len(data) - 20):
+                with self.subTest(cut=cut):
+                    with open(path, 'wb') as f:
+                        f.write(data[:-cut])
+                    with self.assertRaises(ValueError):
+                        PackedPrefix.open(path)
+
+    def test_kronecker(self):
+        width = (max(self.values[10:40]).bit_length() + 7) // 8
+        expected = sum(v << (8 * width * i) for i, v in enumerate(self.values[10:40]))
+        self.assertEqual(self.prefix.kronecker(10, 40, width), expected)
+        with self.assertRaises(ValueError):
+            self.prefix.kronecker(10, 40, width - 1)
+
+
+class TestConvolve(unittest.TestCase):
+    """Test products of packed ranges against the list kernel."""
+
+    def test_matches_poly_multiply(self):
+        rng = random.Random(3)
+        x = PackedPrefix.from_values(rng.randrange(2 ** rng.randrange(1, 200)) for _ in range(60))
+        y = PackedPrefix.from_values(rng.randrange(2 ** 90) for _ in range(45))
+        for x_range, y_range in (((0, 60), (0, 45)), ((7, 30), (40, 45)), ((59, 60), (3, 4))):
+            with self.subTest(x_range=x_range, y_range=y_range):
+                product = convolve(x, y, x_range, y_range)
+                self.assertEqual(product[:], _poly_multiply(x[slice(*x_range)], y[slice(*y_range)]))
+
+    def test_square(self):
+        prefix = PackedPrefix.from_values(CircleTopology.generate_sequence(100))
+        terms = prefix[:]
+        self.assertEqual(convolve(prefix, prefix)[:], _poly_multiply(terms, terms))
+        with self.assertRaises(ValueError):
+            convolve(prefix, prefix, (5, 5))
+
+
+if __name__ == '__main__':
+    unittest.main()
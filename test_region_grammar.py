@@ -0,0 +1,195 @@
+"""
+Tests for the region grammar engine.
+
+These tests check the individual constructions against known sequences
+and the compiled topology families against the CircleTopology counters.
+"""
+
+import random
+import sys
+import threading
+import unittest
+from region_grammar import (
+    Atom, Cycle, Epsilon, Grammar, Multiset, NonEmpty, Ref, Sequence,
+    SymmetricPower, _RelaxedProduct, _poly_multiply,
+)
+from circle_topology import TOPOLOGY_GRAMMAR
+
+
+class TestConstructions(unittest.TestCase):
+    """Test the coefficient kernels of each construction."""
+
+    def test_sequence_of_compositions(self):
+        """Sequences of parts of size 1 or 2 give Fibonacci numbers."""
+        g = Grammar()
+        g.define('fib', Sequence(Atom(1) + Atom(2)))
+        gen = g.compile()
+        self.assertEqual(gen.prefix('fib', 9), [1, 1, 2, 3, 5, 8, 13, 21, 34, 55])
+
+    def test_multiset_rooted_trees(self):
+        """A = Z * MSET(A) gives OEIS A000081."""
+        g = Grammar()
+        a = Ref('a')
+        g.define('a', Atom() * Multiset(a))
+        gen = g.compile()
+        self.assertEqual(gen.prefix('a', 10), [0, 1, 1, 2, 4, 9, 20, 48, 115, 286, 719])
+
+    def test_cycle_binary_necklaces(self):
+        """Cycles of two kinds of atoms give binary necklaces (OEIS A000031)."""
+        g = Grammar()
+        g.define('necklace', Cycle(Atom() + Atom()))
+        gen = g.compile()
+        self.assertEqual(gen.prefix('necklace', 8), [0, 2, 3, 4, 6, 8, 14, 20, 36])
+
+    def test_symmetric_powers(self):
+        """Multisets and sets of exactly k objects."""
+        g = Grammar()
+        parts = Atom(1) + Atom(2) + Atom(3)
+        g.define('mset3', SymmetricPower(parts, 3))
+        g.define('set3', SymmetricPower(parts, 3, distinct=True))
+        gen = g.compile()
+        # Partitions of n into exactly 3 parts of size <= 3
+        self.assertEqual(gen.prefix('mset3', 9), [0, 0, 0, 1, 1, 2, 2, 2, 1, 1])
+        # Only 1 + 2 + 3 uses three distinct parts
+        self.assertEqual(gen.prefix('set3', 9), [0, 0, 0, 0, 0, 0, 1, 0, 0, 0])
+
+    def test_non_empty(self):
+        """NonEmpty removes the size-0 object."""
+        g = Grammar()
+        g.define('s', NonEmpty(Sequence(Atom())))
+        self.assertEqual(g.compile().prefix('s', 3), [0, 1, 1, 1])
+
+    def test_ill_founded_grammar(self):
+        """A family that depends on itself at the same size is rejected."""
+        g = Grammar()
+        g.define('bad', Ref('bad') + Atom())
+        with self.assertRaises(ValueError):
+            g.compile()
+
+    def test_unknown_and_duplicate_family(self):
+        """References must be declared, and only once."""
+        g = Grammar()
+        g.define('x', Ref('missing'))
+        with self.assertRaises(ValueError):
+            g.compile()
+        with self.assertRaises(ValueError):
+            g.define('x', Epsilon())
+
+
+class TestConvolutionKernels(unittest.TestCase):
+    """Test the block convolution used by every running product."""
+
+    def test_poly_multiply(self):
+        """Kronecker substitution matches the schoolbook product."""
+        rng = random.Random(1603)
+        for signed in (False, True):
+            low = -(1 << 70) if signed else 0
+            x = [rng.randint(low, 1 << 70) for _ in range(40)]
+            y = [rng.randint(low, 1 << 70) for _ in range(25)]
+            expected = [0] * 64
+            for i, xi in enumerate(x):
+                for j, yj in enumerate(y):
+                    expected[i + j] += xi * yj
+            with self.subTest(signed=signed):
+                self.assertEqual(_poly_multiply(x, y), expected)
+        # The same operand object is squared
+        x = [rng.getrandbits(70) for _ in range(30)]
+        self.assertEqual(_poly_multiply(x, x), _poly_multiply(x, list(x)))
+
+    def test_relaxed_product_online(self):
+        """Online coefficients agree with direct convolution across block sizes."""
+        rng = random.Random(81)
+        a, b = [], []
+        product = _RelaxedProduct(a, b)
+        square = _RelaxedProduct(a, a)
+        for m in range(300):
+            a.append(rng.getrandbits(40))
+            b.append(rng.getrandbits(40))
+            with self.subTest(m=m):
+                self.assertEqual(product.coefficient(m),
+                                 sum(a[i] * b[m - i] for i in range(m + 1)))
+                self.assertEqual(square.coefficient(m),
+                                 sum(a[i] * a[m - i] for i in range(m + 1)))
+
+    def test_advance_matches_extend(self):
+        """Extending one index at a time gives the same coefficients."""
+        g = Grammar()
+        a = Ref('a')
+        g.define('a', Atom() * Multiset(a))
+        g.define('t', Epsilon() + a - SymmetricPower(a, 2, distinct=True))
+        stepped = g.compile()
+        for n in range(200):
+            self.assertEqual(stepped.advance(), n)
+        bulk = g.compile()
+        bulk.extend(199)
+        self.assertEqual(stepped.prefix('t', 199), bulk.prefix('t', 199))
+        self.assertEqual(stepped.prefix('a', 199), bulk.prefix('a', 199))
+
+    def test_concurrent_extension(self):
+        """Threads querying a cold generator extend it exactly once."""
+        reference = TOPOLOGY_GRAMMAR.compile('rooted', 'unrooted')
+        expected = reference.prefix('unrooted', 300)
+        shared = TOPOLOGY_GRAMMAR.compile('rooted', 'unrooted')
+        # Record every index the first kernel step computes
+        computed = []
+        first_step = shared._steps[0]
+
+        def counting_step(m):
+            computed.append(m)
+            first_step(m)
+        shared._steps[0] = counting_step
+        barrier = threading.Barrier(8)
+        results = {}
+
+        def query(k):
+            barrier.wait()
+            for n in range(k, 301, 8):
+                results[n] = shared.coefficient('unrooted', n)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=query, args=(k,)) for k in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual([results[n] for n in range(301)], expected)
+        self.assertEqual(len(shared), 301)
+        self.assertEqual(computed, list(range(301)))
+        self.assertEqual(shared.prefix('rooted', 300), reference.prefix('rooted', 300))
+
+
+class TestTopologyGrammar(unittest.TestCase):
+    """Test the circle topology families declared in circle_topology."""
+
+    def test_shared_subexpressions(self):
+        """Structurally equal subexpressions compile to one kernel node."""
+        pairs = TOPOLOGY_GRAMMAR.compile('pairs')
+        triples = TOPOLOGY_GRAMMAR.compile('triples')
+        # T*(T-1) is shared between the Z^2 and Z^3 terms, so triples only
+        # needs one more shift and one more sum operand than pairs
+        self.assertEqual(triples.node_count, pairs.node_count + 2)
+
+    def test_fused_compilation(self):
+        """Compiling several families together yields the same coefficients."""
+        separate = {name: TOPOLOGY_GRAMMAR.compile(name).prefix(name, 15)
+                    for name in TOPOLOGY_GRAMMAR.families}
+        fused = TOPOLOGY_GRAMMAR.compile()
+        for name, expected in separate.items():
+            with self.subTest(family=name):
+                self.assertEqual(fused.prefix(name, 15), expected)
+
+    def test_known_values(self):
+        """Spot-check the declared families."""
+        gen = TOPOLOGY_GRAMMAR.compile()
+        self.assertEqual(gen.prefix('catalan', 6), [1, 1, 2, 5, 14, 42, 132])
+        self.assertEqual(gen.prefix('unrooted', 8), [1, 1, 1, 1, 2, 3, 6, 11, 23])
+        self.assertEqual(gen.prefix('pairs', 4), [1, 1, 2, 6, 19])
+        self.assertEqual(gen.prefix('triples', 4), [1, 1, 2, 6, 20])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Tests for streaming sequence output and the command line interface.
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from circle_topology import CircleTopology, cli, iter_sequence
+from sequence_stream import encode_varint, iter_varints, write_sequence
+
+
+class TestVarint(unittest.TestCase):
+    """Test the LEB128 varint encoding."""
+
+    def test_known_encodings(self):
+        """Small values match the LEB128 reference encodings."""
+        self.assertEqual(encode_varint(0), b'\x00')
+        self.assertEqual(encode_varint(127), b'\x7f')
+        self.assertEqual(encode_varint(128), b'\x80\x01')
+        self.assertEqual(encode_varint(624485), b'\xe5\x8e\x26')
+
+    def test_round_trip(self):
+        """Values of every size decode to themselves."""
+        values = [0, 1, 127, 128, 2 ** 56 - 1, 2 ** 56, 3 ** 1000,
+                  CircleTopology.rooted_trees(400)]
+        data = b''.join(encode_varint(v) for v in values)
+        self.assertEqual(list(iter_varints(io.BytesIO(data))), values)
+
+    def test_negative_rejected(self):
+        """Negative values cannot be encoded."""
+        with self.assertRaises(ValueError):
+            encode_varint(-1)
+
+
+class TestWriteSequence(unittest.TestCase):
+    """Test the text formats and parallel encoding."""
+
+    def setUp(self):
+        self.terms = list(iter_sequence('planar', 0, 5))
+
+    def test_bfile(self):
+        out = io.BytesIO()
+        self.assertEqual(write_sequence(self.terms, out, 'bfile'), 6)
+        self.assertEqual(out.getvalue().decode().splitlines()[:3], ['0 1', '1 1', '2 2'])
+
+    def test_csv(self):
+        out = io.BytesIO()
+        write_sequence(self.terms, out, 'csv', 'planar')
+        lines = out.getvalue().decode().splitlines()
+        self.assertEqual(lines[0], 'n,planar')
+        self.assertEqual(lines[-1], '5,20')
+
+    def test_jsonl(self):
+        out = io.BytesIO()
+        write_sequence(self.terms, out, 'jsonl', 'planar')
+        rows = [json.loads(line) for line in out.getvalue().decode().splitlines()]
+        self.assertEqual(rows[4], {'n': 4, 'planar': 9})
+
+    def test_workers_preserve_order(self):
+        """Encoding in a process pool gives the same bytes as in-process."""
+        terms = list(iter_sequence('catalan', 0, 300))
+        serial, parallel = io.BytesIO(), io.BytesIO()
+        write_sequence(terms, serial, 'bfile')
+        write_sequence(terms, parallel, 'bfile', workers=2)
+        self.assertEqual(serial.getvalue(), parallel.getvalue())
+
+    def test_digit_limit_restored(self):
+        """Huge terms are written without lifting the digit limit for good."""
+        limit = sys.get_int_max_str_digits()
+        out = io.BytesIO()
+        write_sequence([(0, 10 ** 5000)], out, 'bfile')
+        self.assertEqual(len(out.getvalue()), len('0 ') + 5001 + 1)
+        self.assertEqual(sys.get_int_max_str_digits(), limit)
+
+    def test_flushes_are_batched(self):
+        """Fast terms are flushed a chunk at a time, not one by one."""
+        class Counting(io.BytesIO):
+            flushes = 0
+
+            def flush(self):
+                self.flushes += 1
+
+        out = Counting()
+        write_sequence(((n, n) for n in range(1000)), out, 'varint')
+        self.assertEqual(list(iter_varints(io.BytesIO(out.getvalue()))), list(range(1000)))
+        self.assertLess(out.flushes, 100)
+
+
+class TestCommandLine(unittest.TestCase):
+    """Test python -m circle_topology argument handling."""
+
+    def test_stream_to_file(self):
+        """A range with a modulus is written to the output file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'b000081.txt')
+            status = cli(['rooted', '--start', '1', '--end', '12',
+                          '--modulus', '100', '-o', path])
+            self.assertEqual(status, 0)
+            with open(path) as f:
+                lines = f.read().splitlines()
+        self.assertEqual(len(lines), 12)
+        self.assertEqual(lines[-1], f"12 {CircleTopology.rooted_trees(12) % 100}")
+
+    def test_varint_file(self):
+        """The binary format decodes back to the sequence."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'triples.bin')
+            cli(['triples', '--end', '50', '--format', 'varint', '-o', path])
+            with open(path, 'rb') as f:
+                values = list(iter_varints(f))
+        self.assertEqual(values, CircleTopology.generate_sequence(50, 'triples'))
+
+    def test_invalid_range(self):
+        """An empty range is a usage error."""
+        with self.assertRaises(SystemExit):
+            cli(['rooted', '--start', '5', '--end', '2'])
+
+    def test_closed_pipe(self):
+        """A reader that stops early ends the stream quietly with status 1."""
+        here = os.path.dirname(os.path.abspath(__file__))
+        with subprocess.Popen([sys.executable, '-m', 'circle_topology', 'catalan', '--end', '3000'],
+                              cwd=here, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+            self.assertEqual(proc.stdout.readline(), b'0 1\n')
+            proc.stdout.close()
+            stderr = proc.stderr.read()
+            status = proc.wait()
+        self.assertEqual(status, 1)
+        self.assertEqual(stderr, b'')
+
+
+if __name__ == '__main__':
+    unittest.main()
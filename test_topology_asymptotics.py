@@ -0,0 +1,84 @@
+"""
+Tests for the asymptotic estimates of the counting sequences.
+"""
+
+import unittest
+from decimal import Decimal, localcontext
+
+from circle_topology import CircleTopology
+from topology_asymptotics import DIGITS, EXACT_BELOW, Estimate, estimate, expansion_constants
+
+
+FAMILIES = {
+    'catalan': CircleTopology.catalan_number,
+    'rooted': CircleTopology.rooted_trees,
+    'unrooted': CircleTopology.unrooted_trees,
+    'pairs': CircleTopology.pairs_may_intersect,
+    'triples': CircleTopology.triples_may_intersect,
+}
+
+
+def observed_error(approximate: Estimate, exact: int) -> Decimal:
+    with localcontext() as ctx:
+        ctx.prec = 2 * DIGITS
+        return abs(approximate.value - exact) / exact
+
+
+class TestEstimates(unittest.TestCase):
+    """Test the singular expansions against the exact counters."""
+
+    def test_error_bound_holds(self):
+        """The observed relative error is within rel_error, and small."""
+        for name, counter in FAMILIES.items():
+            for n in (EXACT_BELOW, 301, 420):
+                with self.subTest(family=name, n=n):
+                    approximate = counter(n, approx=True)
+                    error = observed_error(approximate, counter(n))
+                    self.assertLessEqual(error, Decimal(approximate.rel_error))
+                    self.assertLess(approximate.rel_error, 1e-25)
+
+    def test_small_n_is_exact(self):
+        """Below EXACT_BELOW the estimate is the rounded exact count."""
+        for name, counter in FAMILIES.items():
+            with self.subTest(family=name):
+                self.assertEqual(counter(20, approx=True).value, counter(20))
+                self.assertEqual(counter(20, approx=True).rel_error, 0.0)
+
+    def test_non_intersecting_circles(self):
+        """The planar counter estimates rooted trees with one more node."""
+        self.assertEqual(CircleTopology.non_intersecting_circles(500, approx=True),
+                         CircleTopology.rooted_trees(501, approx=True))
+
+    def test_otter_constants(self):
+        """rho and the leading coefficient match Otter's constants."""
+        rho, odd = expansion_constants('rooted')
+        self.assertTrue(str(rho).startswith('0.338321856899207695196112'))
+        # a(n) ~ C rho^-n n^(-3/2) with C = -f_1 / (2 sqrt(pi))
+        with localcontext() as ctx:
+            ctx.prec = 30
+            pi = Decimal('3.14159265358979323846264338328')
+            self.assertTrue(str(-odd[0] / (2 * pi.sqrt())).startswith('0.43992401257102530404'))
+        rho, _ = expansion_constants('catalan')
+        self.assertEqual(rho, Decimal('0.25'))
+
+    def test_huge_n(self):
+        """Estimates for n = 10^12 are available and well bounded."""
+        approximate = CircleTopology.rooted_trees(10**12, approx=True)
+        self.assertEqual(approximate.digits, 470669944186)
+        self.assertLess(approximate.rel_error, 1e-25)
+        # C(n) ~ 4^n / (n^(3/2) sqrt(pi)), far from a power of ten here
+        with localcontext() as ctx:
+            ctx.prec = 40
+            n = Decimal(10**12)
+            pi = Decimal('3.14159265358979323846264338328')
+            log10 = n * Decimal(4).log10() - Decimal('1.5') * n.log10() - pi.sqrt().log10()
+        self.assertEqual(CircleTopology.catalan_number(10**12, approx=True).digits, int(log10) + 1)
+
+    def test_unknown_family(self):
+        """Unknown family names are rejected."""
+        with self.assertRaises(ValueError):
+            estimate('cycles', 300)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Tests for checkpointing generators and enumerations.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+
+from circle_topology import TOPOLOGY_GRAMMAR
+from topology_checkpoint import (
+    checkpointed_expressions, extend_with_checkpoints, load_enumeration, load_generator,
+    save_generator,
+)
+from topology_index import canonical_expressions
+
+
+class TestGeneratorCheckpoint(unittest.TestCase):
+    """Test saving and restoring coefficient generators."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'trees.ckpt')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_resume_matches_uninterrupted(self):
+        """A restored generator continues exactly where the saved one was."""
+        reference = TOPOLOGY_GRAMMAR.compile('rooted', 'unrooted')
+        reference.extend(300)
+        first = TOPOLOGY_GRAMMAR.compile('rooted', 'unrooted')
+        first.extend(150)
+        save_generator(first, self.path)
+        resumed = TOPOLOGY_GRAMMAR.compile('rooted', 'unrooted')
+        load_generator(resumed, self.path)
+        self.assertEqual(len(resumed), 151)
+        for family in ('rooted', 'unrooted'):
+            self.assertEqual(resumed.prefix(family, 300), reference.prefix(family, 300))
+        self.assertEqual(os.listdir(self.tmp.name), ['trees.ckpt'])
+
+    def test_concurrent_writers(self):
+        """Writers of one checkpoint never share a temporary file."""
+        generator = TOPOLOGY_GRAMMAR.compile('rooted', 'unrooted')
+        generator.extend(100)
+        threads = [threading.Thread(target=lambda: [save_generator(generator, self.path)
+                                                    for _ in range(20)])
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        resumed = TOPOLOGY_GRAMMAR.compile('rooted', 'unrooted')
+        load_generator(resumed, self.path)
+        self.assertEqual(resumed.prefix('rooted', 100), generator.prefix('rooted', 100))
+        self.assertEqual(os.listdir(self.tmp.name), ['trees.ckpt'])
+
+    def test_extend_with_checkpoints(self):
+        """Periodic checkpoints are resumed by a later run."""
+        first = TOPOLOGY_GRAMMAR.compile('pairs')
+        extend_with_checkpoints(first, 80, self.path, interval=0.0)
+        resumed = TOPOLOGY_GRAMMAR.compile('pairs')
+        extend_with_checkpoints(resumed, 120, self.path)
+        self.assertEqual(resumed.prefix('pairs', 120), TOPOLOGY_GRAMMAR.compile('pairs').prefix('pairs', 120))
+
+    def test_mismatched_generator(self):
+        """Checkpoints only load into generators of the same families."""
+        generator = TOPOLOGY_GRAMMAR.compile('catalan')
+        generator.extend(10)
+        save_generator(generator, self.path)
+        with self.assertRaises(ValueError):
+            load_generator(TOPOLOGY_GRAMMAR.compile('pairs'), self.path)
+        with open(self.path, 'wb') as f:
+            f.write(b'garbage')
+        with self.assertRaises(ValueError):
+            load_generator(TOPOLOGY_GRAMMAR.compile('catalan'), self.path)
+
+
+class TestEnumerationCheckpoint(unittest.TestCase):
+    """Test resumable enumeration."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'c9.ckpt')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_interrupted_enumeration(self):
+        """An interrupted run and its resumption yield every topology once."""
+        expected = list(canonical_expressions(9))
+        seen = []
+        for expr in checkpointed_expressions(9, self.path, interval=0.0):
+            seen.append(expr)
+            if len(seen) == 100:
+                break
+        n, consumed, levels = load_enumeration(self.path)
+        self.assertEqual((n, consumed, len(levels)), (9, 99, 10))
+        # The 100th topology was never reported as consumed
+        seen.pop()
+        seen.extend(checkpointed_expressions(9, self.path))
+        self.assertEqual(seen, expected)
+        self.assertEqual(load_enumeration(self.path), (9, len(expected), None))
+        self.assertEqual(list(checkpointed_expressions(9, self.path)), [])
+        with self.assertRaises(ValueError):
+            list(checkpointed_expressions(8, self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Tests for the enumerator and the on-disk topology index.
+"""
+
+import os
+import tempfile
+import unittest
+from circle_topology import CircleTopology
+from flip_transforms import CircleExpression, generate_c4_expressions
+from test_flip_transforms import dyck_words
+from topology_index import (
+    TopologyIndex, build_topology_index, canonical_expressions, canonical_levels, level_expression,
+    level_hash, level_sequences, minimal_change_topologies,
+)
+
+
+class TestEnumeration(unittest.TestCase):
+    """Test the level sequence enumerator."""
+
+    def test_counts(self):
+        """Level sequences of m nodes count the rooted trees."""
+        for m in range(1, 12):
+            with self.subTest(m=m):
+                self.assertEqual(sum(1 for _ in level_sequences(m)), CircleTopology.rooted_trees(m))
+
+    def test_canonical_expressions(self):
+        """Every topology appears once, in canonical form."""
+        for n in range(8):
+            with self.subTest(n=n):
+                found = list(canonical_expressions(n))
+                self.assertEqual(len(found), len(set(found)))
+                self.assertEqual(set(found), {CircleExpression(w).canonical().expr
+                                              for w in dyck_words(n)})
+
+
+class TestMinimalChange(unittest.TestCase):
+    """Test the enumeration with incremental hashes and factor counts."""
+
+    def test_matches_from_scratch(self):
+        """Changed position, hash and factor count agree with direct evaluation."""
+        for n in range(9):
+            with self.subTest(n=n):
+                previous = None
+                count = 0
+                for levels, changed, key, factors in minimal_change_topologies(n):
+                    if previous is not None:
+                        self.assertEqual(previous[:changed], levels[:changed])
+                        self.assertNotEqual(previous[changed], levels[changed])
+                    expression = level_expression(levels)
+                    self.assertEqual(key, level_hash(levels))
+                    self.assertEqual(factors, CircleExpression(expression).factor_count())
+                    previous = list(levels)
+                    count += 1
+                self.assertEqual(count, CircleTopology.non_intersecting_circles(n))
+
+    def test_canonical_hash(self):
+        """Any ordering of a topology hashes like its enumerated sequence."""
+        keys = {key for _, _, key, _ in minimal_change_topologies(6)}
+        self.assertEqual(len(keys), CircleTopology.non_intersecting_circles(6))
+        for word in dyck_words(6):
+            self.assertIn(level_hash(canonical_levels(word)), keys)
+
+    def test_canonical_levels(self):
+        """Enumerated sequences are their own canonical form."""
+        for levels in level_sequences(9):
+            self.assertEqual(canonical_levels(level_expression(levels)), levels)
+        self.assertEqual(canonical_levels('()(())'), [0, 1, 2, 1])
+        self.assertEqual(canonical_levels(''), [0])
+
+    def test_short_edits(self):
+        """Consecutive trees differ in a suffix of constant average length."""
+        n = 12
+        rewritten = [n + 1 - changed for _, changed, _, _ in minimal_change_topologies(n)]
+        self.assertLess(sum(rewritten[1:]) / (len(rewritten) - 1), 2)
+
+
+class TestSphereCanonical(unittest.TestCase):
+    """Test sphere cluster representatives."""
+
+    def test_cluster_counts(self):
+        for n in range(9):
+            with self.subTest(n=n):
+                clusters = {CircleExpression(e).sphere_canonical() for e in canonical_expressions(n)}
+                self.assertEqual(len(clusters), CircleTopology.sphere_surface_clusters(n))
+
+    def test_c4_clusters(self):
+        """The 9 topologies of 4 circles fall into the paper's 3 clusters."""
+        clusters = {}
+        for expr in generate_c4_expressions():
+            clusters.setdefault(CircleExpression(expr).sphere_canonical().expr, set()).add(expr)
+        self.assertEqual(sorted(len(c) for c in clusters.values()), [2, 3, 4])
+        self.assertIn({'()()()()', '(()()())'}, clusters.values())
+
+
+class TestTopologyIndex(unittest.TestCase):
+    """Test building and querying index files."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self, n, sphere=True):
+        path = os.path.join(self.tmp.name, f'c{n}.idx')
+        build_topology_index(n, path, sphere)
+        return TopologyIndex(path)
+
+    def test_lookup(self):
+        """Every ordering of every topology finds its id."""
+        for n in range(7):
+            with self.subTest(n=n), self.build(n) as index:
+                self.assertEqual(len(index), CircleTopology.non_intersecting_circles(n))
+                ids = {index.id(w) for w in dyck_words(n)}
+                self.assertEqual(ids, set(range(len(index))))
+                for i in range(len(index)):
+                    self.assertEqual(index.id(index.expression(i)), i)
+
+    def test_sorted_keys(self):
+        with self.build(6) as index:
+            exprs = [index.expression(i).expr for i in range(len(index))]
+        self.assertEqual(exprs, sorted(exprs))
+
+    def test_sphere_table(self):
+        """Cluster ids agree with sphere canonical forms."""
+        with self.build(7) as index:
+            self.assertEqual(index.sphere_clusters, CircleTopology.sphere_surface_clusters(7))
+            by_cluster = {}
+            for i in range(len(index)):
+                rep = index.expression(i).sphere_canonical()
+                by_cluster.setdefault(index.sphere_id(i), set()).add(rep)
+            self.assertTrue(all(len(reps) == 1 for reps in by_cluster.values()))
+            self.assertEqual(len(by_cluster), index.sphere_clusters)
+
+    def test_missing_and_wrong_size(self):
+        with self.build(4, sphere=False) as index:
+            self.assertNotIn('()()()', index)
+            self.assertIn('(()())()', index)
+            with self.assertRaises(KeyError):
+                index.id('()')
+            with self.assertRaises(LookupError):
+                index.sphere_id(0)
+            with self.assertRaises(IndexError):
+                index.expression(9)
+
+    def test_not_an_index(self):
+        path = os.path.join(self.tmp.name, 'junk')
+        with open(path, 'wb') as f:
+            f.write(b'x' * 64)
+        with self.assertRaises(ValueError):
+            TopologyIndex(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Tests for the multi-modular computation of rooted tree counts.
+"""
+
+import unittest
+
+import circle_topology
+from circle_topology import CircleTopology
+from topology_modular import (
+    PRIME_BITS, bit_bound, crt_primes, rooted_trees_mod, rooted_trees_range,
+)
+
+
+class TestModular(unittest.TestCase):
+    """Test the per-prime recurrence and the CRT reconstruction."""
+
+    def test_residues(self):
+        """Residues match the exact counts for primes of every size."""
+        exact = [CircleTopology.rooted_trees(n) for n in range(301)]
+        for prime in (1009, 2**31 - 1, crt_primes(1)[0]):
+            with self.subTest(prime=prime):
+                self.assertEqual(rooted_trees_mod(300, prime), [a % prime for a in exact])
+        with self.assertRaises(ValueError):
+            rooted_trees_mod(300, 211)
+
+    def test_bit_bound(self):
+        """a(n) < 2^bit_bound(n), and the primes cover the bound."""
+        for n in range(1, 400):
+            self.assertLessEqual(CircleTopology.rooted_trees(n).bit_length(), bit_bound(n))
+        primes = crt_primes(1000)
+        product = 1
+        for p in primes:
+            self.assertLess(p, 1 << PRIME_BITS)
+            product *= p
+        self.assertGreater(product, 1 << 1000)
+        self.assertEqual(primes, sorted(primes, reverse=True))
+
+    def test_range(self):
+        """Reconstructed values are exact, in process and with a pool."""
+        exact = [CircleTopology.rooted_trees(n) for n in range(401)]
+        self.assertEqual(rooted_trees_range(0, 400), exact)
+        self.assertEqual(rooted_trees_range(390, 400, workers=2), exact[390:])
+        self.assertEqual(rooted_trees_range(7, 7), [exact[7]])
+        with self.assertRaises(ValueError):
+            rooted_trees_range(5, 4)
+
+    def test_counter_method(self):
+        """CircleTopology.rooted_trees_range slices or reconstructs."""
+        self.assertEqual(CircleTopology.rooted_trees_range(1, 10),
+                         [1, 1, 2, 4, 9, 20, 48, 115, 286, 719])
+        # Just past the computed prefix the terms are reconstructed
+        n = circle_topology.computed_terms('rooted') + 5
+        self.assertEqual(CircleTopology.rooted_trees_range(n, n + 1),
+                         [CircleTopology.rooted_trees(n), CircleTopology.rooted_trees(n + 1)])
+        with self.assertRaises(ValueError):
+            CircleTopology.rooted_trees_range(-1, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Tests for the opt-in profiling hooks.
+"""
+
+import unittest
+import circle_topology
+import region_grammar
+from circle_topology import CircleTopology
+from topology_profiling import topology_profile
+
+
+class TestTopologyProfile(unittest.TestCase):
+    """Test statistics collection and restoration of the hot path."""
+
+    def test_counter_statistics(self):
+        """Calls, hits, misses and n ranges are recorded per counter."""
+        n = circle_topology.computed_terms('rooted') + 80
+        with topology_profile() as p:
+            CircleTopology.rooted_trees(n)
+            CircleTopology.rooted_trees(n - 1)
+        rec = p.stats['counters']['rooted_trees']
+        self.assertEqual(rec['calls'], 2)
+        self.assertEqual(rec['misses'], 1)
+        self.assertEqual(rec['hits'], 1)
+        self.assertEqual((rec['n_min'], rec['n_max']), (n - 1, n))
+        gen = p.stats['generators']['rooted,unrooted']
+        self.assertEqual(gen['n_max'], n)
+        self.assertGreater(p.stats['multiplications']['direct'], 0)
+        self.assertGreater(p.stats['multiplications']['blocks'], 0)
+        self.assertGreater(p.stats['peak_memory'], 0)
+        self.assertIn('rooted_trees', p.report())
+
+    def test_originals_restored(self):
+        """The hot path is untouched outside the context."""
+        counter = CircleTopology.__dict__['rooted_trees']
+        extend = region_grammar.CoefficientGenerator.extend
+        mul = region_grammar.mul
+        with topology_profile(memory=False) as p:
+            self.assertIsNot(CircleTopology.__dict__['rooted_trees'], counter)
+            CircleTopology.pairs_may_intersect(3)
+        self.assertIs(CircleTopology.__dict__['rooted_trees'], counter)
+        self.assertIs(region_grammar.CoefficientGenerator.extend, extend)
+        self.assertIs(region_grammar.mul, mul)
+        self.assertIsNone(p.stats['peak_memory'])
+
+    def test_nested_profiles_rejected(self):
+        """Only one profile can be active at a time."""
+        with topology_profile(memory=False):
+            with self.assertRaises(RuntimeError):
+                with topology_profile(memory=False):
+                    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
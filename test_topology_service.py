@@ -0,0 +1,120 @@
+"""
+Tests for the asyncio query service.
+"""
+
+import asyncio
+import json
+import unittest
+
+from circle_topology import CircleTopology, computed_terms
+from topology_service import TopologyService
+
+
+async def fetch(port: int, target: str):
+    """Send one GET request and return (status, body)."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n\r\n".encode())
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line == b'\r\n':
+            break
+        key, _, value = line.decode().partition(':')
+        headers[key.lower()] = value.strip()
+    if headers.get('transfer-encoding') == 'chunked':
+        body = b''
+        while True:
+            size = int(await reader.readline(), 16)
+            chunk = await reader.readexactly(size + 2)
+            if size == 0:
+                break
+            body += chunk[:-2]
+    else:
+        body = await reader.readexactly(int(headers['content-length']))
+    writer.close()
+    await writer.wait_closed()
+    return status, body
+
+
+class TestTopologyService(unittest.TestCase):
+    """Test the HTTP endpoints and request coalescing."""
+
+    def run_with_server(self, scenario, **options):
+        async def main():
+            service = TopologyService(chunk_size=16, **options)
+            server = await service.serve('127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                return await scenario(service, port)
+            finally:
+                server.close()
+                await server.wait_closed()
+                service.close()
+        return asyncio.run(main())
+
+    def test_single_term(self):
+        async def scenario(service, port):
+            return await fetch(port, '/sequence/rooted/10')
+        status, body = self.run_with_server(scenario)
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), {'n': 10, 'rooted': 719})
+
+    def test_range_is_streamed(self):
+        async def scenario(service, port):
+            return await fetch(port, '/sequence/catalan?start=3&end=60&modulus=1000')
+        status, body = self.run_with_server(scenario)
+        self.assertEqual(status, 200)
+        rows = [json.loads(line) for line in body.decode().splitlines()]
+        self.assertEqual(rows, [{'n': n, 'catalan': CircleTopology.catalan_number(n) % 1000}
+                                for n in range(3, 61)])
+
+    def test_errors(self):
+        async def scenario(service, port):
+            return [(await fetch(port, target))[0] for target in
+                    ('/sequence/nope/3', '/other', '/sequence/rooted/x',
+                     '/sequence/rooted?start=5&end=2', '/sequence/rooted/-1')]
+        self.assertEqual(self.run_with_server(scenario), [404, 404, 400, 400, 400])
+
+    def test_index_limit(self):
+        """Indices above max_index are refused before any extension."""
+        async def scenario(service, port):
+            statuses = [(await fetch(port, target))[0] for target in
+                        ('/sequence/rooted/50', '/sequence/rooted/51',
+                         '/sequence/rooted?start=0&end=51',
+                         '/sequence/rooted?end=7&modulus=1000000')]
+            return statuses, service.extensions['rooted']
+        self.assertEqual(self.run_with_server(scenario, max_index=50), ([200, 400, 400, 200], 0))
+
+    def test_internal_error(self):
+        """An unexpected exception is answered with 500 and logged."""
+        async def scenario(service, port):
+            async def fail(name, n):
+                raise RuntimeError("counter failed")
+            service.ensure = fail
+            with self.assertLogs('topology_service', 'ERROR'):
+                single = await fetch(port, '/sequence/rooted/5')
+                streamed = await fetch(port, '/sequence/rooted?start=0&end=5')
+            return single, streamed
+        single, streamed = self.run_with_server(scenario)
+        self.assertEqual(single[0], 500)
+        self.assertEqual(json.loads(single[1]), {'error': 'Internal server error'})
+        self.assertEqual(streamed[0], 500)
+
+    def test_coalescing(self):
+        """Concurrent cold requests share table extensions."""
+        base = computed_terms('pairs') + 150
+
+        async def scenario(service, port):
+            results = await asyncio.gather(*(fetch(port, f'/sequence/pairs/{base + k}')
+                                             for k in range(100)))
+            return results, service.extensions['pairs']
+        results, extensions = self.run_with_server(scenario, max_index=base + 100)
+        self.assertEqual([json.loads(body)['pairs'] for _, body in results],
+                         [CircleTopology.pairs_may_intersect(base + k) for k in range(100)])
+        self.assertLessEqual(extensions, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tests for automorphism counts and sphere cluster sizes.
+"""
+
+import unittest
+from collections import Counter
+from itertools import permutations
+
+from circle_topology import CircleTopology
+from flip_transforms import CircleExpression
+from topology_index import canonical_expressions, level_sequences
+from topology_symmetry import free_trees, rooted_automorphisms, sphere_clusters, tree_symmetry
+
+
+def edges(levels):
+    """Edge set of the tree of a level sequence."""
+    last = {}
+    found = set()
+    for node, depth in enumerate(levels):
+        last[depth] = node
+        if depth:
+            found.add(frozenset((node, last[depth - 1])))
+    return found
+
+
+def brute_force_automorphisms(levels, fix_root):
+    """Count the vertex permutations preserving the edges."""
+    tree = edges(levels)
+    return sum(1 for p in permutations(range(len(levels)))
+               if (not fix_root or p[0] == 0)
+               and {frozenset(p[v] for v in edge) for edge in tree} == tree)
+
+
+class TestAutomorphisms(unittest.TestCase):
+    """Test the group orders against brute force."""
+
+    def test_free_trees(self):
+        for m in range(1, 8):
+            for levels in free_trees(m):
+                with self.subTest(levels=levels):
+                    self.assertEqual(tree_symmetry(levels)[0],
+                                     brute_force_automorphisms(levels, False))
+
+    def test_rooted_trees(self):
+        for m in range(1, 8):
+            for levels in level_sequences(m):
+                with self.subTest(levels=levels):
+                    self.assertEqual(rooted_automorphisms(levels),
+                                     brute_force_automorphisms(levels, True))
+
+    def test_examples(self):
+        """A star of k leaves has k! automorphisms and two orbits."""
+        self.assertEqual(tree_symmetry([0, 1, 1, 1, 1]), (24, 2))
+        self.assertEqual(tree_symmetry([0, 1, 2, 3]), (2, 2))
+        self.assertEqual(tree_symmetry([0, 1]), (2, 1))
+        self.assertEqual(tree_symmetry([0]), (1, 1))
+        self.assertEqual(rooted_automorphisms([0, 1, 2, 1, 2]), 2)
+
+
+class TestSphereClusters(unittest.TestCase):
+    """Test the cluster enumeration."""
+
+    def test_free_tree_counts(self):
+        for m in range(1, 14):
+            with self.subTest(m=m):
+                self.assertEqual(sum(1 for _ in free_trees(m)), CircleTopology.unrooted_trees(m))
+
+    def test_sizes_sum_to_planar_count(self):
+        for n in range(15):
+            with self.subTest(n=n):
+                self.assertEqual(sum(size for _, size, _ in sphere_clusters(n)),
+                                 CircleTopology.non_intersecting_circles(n))
+
+    def test_sizes_match_sphere_canonical(self):
+        """Cluster sizes agree with grouping the planar topologies."""
+        for n in range(8):
+            with self.subTest(n=n):
+                groups = Counter(CircleExpression(e).sphere_canonical() for e in canonical_expressions(n))
+                self.assertEqual(sorted(groups.values()),
+                                 sorted(size for _, size, _ in sphere_clusters(n)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,352 @@
+"""
+Asymptotic Estimates of the Counting Sequences
+
+Magnitude estimates for huge n, used by the ``approx=True`` mode of the
+CircleTopology counters:
+
+    CircleTopology.rooted_trees(10**12, approx=True).digits   # 470669944186
+
+Every family here has a square-root singularity at its radius of
+convergence rho, so near x = rho its generating function is a series in
+s = sqrt(1 - x/rho),
+
+    F(x) = f_0 + f_1 s + f_2 s^2 + f_3 s^3 + ...
+
+and the transfer theorem turns the odd terms into the expansion
+
+    [x^n] F ~ rho^-n * sum_{j odd} f_j * Gamma(n - j/2) / (Gamma(-j/2) * Gamma(n + 1))
+
+(the even terms are polynomials in x and do not contribute).
+
+- Catalan, pairs and triples satisfy a(x) F^2 - b(x) F + 1 = 0, so
+  F = (b - sqrt(b^2 - 4a)) / 2a and the expansion follows from the Taylor
+  series of the discriminant at its smallest positive root.
+- Rooted trees satisfy A = x exp(A + R(x)) with R(x) = sum_{k>=2} A(x^k)/k
+  analytic beyond rho (Otter). With u = 1 - A this reads
+  -log(1 - u) - u = delta(x) := -1 - log x - R(x), which vanishes at rho,
+  and is solved for u as a series in s. Unrooted trees are
+  A - A^2/2 + A(x^2)/2 (Otter's formula), whose singular part is -u^2/2.
+
+The constants (rho and the f_j) are computed once per family from the
+exact tables, in decimal arithmetic; every estimate after that is O(1).
+The error bound of an estimate is twice the first omitted term of the
+expansion plus the effect of the working precision on rho^-n. Other
+singularities are at least a factor sqrt(rho) farther out for the trees
+and farther still for the algebraic families, so their share is below
+10^-60 from EXACT_BELOW on; smaller n are answered exactly.
+"""
+
+import math
+from decimal import Decimal, MAX_EMAX, MIN_EMIN, getcontext, localcontext
+from fractions import Fraction
+from typing import Dict, List, NamedTuple, Sequence
+
+from circle_topology import CircleTopology
+
+
+# Significant digits of the returned estimates
+DIGITS = 30
+
+# Working precision of the constants. Estimates stay within a relative
+# error of about n * 10^(5 - _WORK), i.e. full DIGITS beyond n = 10^50.
+_WORK = 90
+
+# Below this n the counters answer exactly (and quickly)
+EXACT_BELOW = 256
+
+# Odd singular terms kept in each expansion
+_TERMS = 24
+
+# Coefficients of R(x) used for the tree constants; R converges like
+# rho^(N/2), far below 10^-_WORK at this size
+_TREE_TERMS = 1200
+
+# a(x), b(x) of the quadratic a F^2 - b F + 1 = 0 of each algebraic family,
+# lowest degree first
+_QUADRATICS = {
+    'catalan': ([0, 1], [1]),
+    'pairs': ([0, 1, 1], [1, 0, 1]),
+    'triples': ([0, 1, 1, 1], [1, 0, 1, 1]),
+}
+
+_COUNTERS = {
+    'catalan': CircleTopology.catalan_number,
+    'rooted': CircleTopology.rooted_trees,
+    'unrooted': CircleTopology.unrooted_trees,
+    'pairs': CircleTopology.pairs_may_intersect,
+    'triples': CircleTopology.triples_may_intersect,
+}
+
+
+class Estimate(NamedTuple):
+    """
+    An approximate count.
+
+    ``value`` is rounded to DIGITS significant digits and ``rel_error``
+    bounds |value - exact| / exact.
+    """
+    value: Decimal
+    rel_error: float
+
+    @property
+    def digits(self) -> int:
+        """Number of decimal digits of the estimated count."""
+        return self.value.adjusted() + 1
+
+
+def _context(ctx, prec: int):
+    ctx.prec = prec
+    ctx.Emax = MAX_EMAX
+    ctx.Emin = MIN_EMIN
+
+
+def _pi() -> Decimal:
+    """Pi to the current precision (Machin's formula)."""
+    tiny = Decimal(10) ** -(getcontext().prec + 2)
+
+    def arctan_inverse(m: int) -> Decimal:
+        total = Decimal(0)
+        power = Decimal(1) / m
+        k = 0
+        while power > tiny:
+            total += (-power if k % 2 else power) / (2 * k + 1)
+            power /= m * m
+            k += 1
+        return total
+    return 4 * (4 * arctan_inverse(5) - arctan_inverse(239))
+
+
+def _bernoulli(count: int) -> List[Fraction]:
+    """B_2, B_4, ..., B_(2*count)."""
+    b = [Fraction(1)]
+    for m in range(1, 2 * count + 1):
+        b.append(-sum(math.comb(m + 1, k) * b[k] for k in range(m)) / (m + 1))
+    return b[2::2]
+
+
+# Stirling series coefficients B_2k / (2k (2k-1)); 30 terms reach
+# 10^-110 for arguments above EXACT_BELOW
+_STIRLING = [bk / (2 * k * (2 * k - 1)) for k, bk in enumerate(_bernoulli(30), start=1)]
+
+
+def _log_gamma(z: Decimal, log_two_pi: Decimal) -> Decimal:
+    """Stirling series for log Gamma(z), for z of at least EXACT_BELOW - 1."""
+    total = (z - Decimal('0.5')) * z.ln() - z + log_two_pi / 2
+    power = z
+    for c in _STIRLING:
+        total += Decimal(c.numerator) / Decimal(c.denominator) / power
+        power *= z * z
+    return total
+
+
+def _taylor_at(coefficients: Sequence, rho: Decimal, order: int) -> List[Decimal]:
+    """Taylor coefficients in t of sum_N c_N x^N at x = rho * (1 - t)."""
+    out = []
+    for i in range(order):
+        total = Decimal(0)
+        power = rho ** i
+        for N in range(i, len(coefficients)):
+            if coefficients[N]:
+                total += coefficients[N] * power * math.comb(N, i)
+            power *= rho
+        out.append(-total if i % 2 else total)
+    return out
+
+
+class _Expansion:
+    """Singular expansion of one family at its dominant singularity."""
+
+    def __init__(self, rho: Decimal, odd: List[Decimal]):
+        # odd[i] is the coefficient f_(2i+1) of s^(2i+1)
+        self.rho = rho
+        self.log_rho = rho.ln()
+        self.odd = odd
+
+    def estimate(self, n: int) -> Estimate:
+        with localcontext() as ctx:
+            _context(ctx, _WORK + len(str(n)))
+            pi = _pi()
+            half = Decimal('0.5')
+            size = Decimal(n)
+            # Gamma(n - j/2) / (Gamma(-j/2) Gamma(n + 1)) for j = 1, with
+            # Gamma(-1/2) = -2 sqrt(pi), then stepped down to j + 2
+            ratio = (_log_gamma(size - half, (2 * pi).ln())
+                     - _log_gamma(size + 1, (2 * pi).ln())).exp() / (-2 * pi.sqrt())
+            terms = []
+            for i, f in enumerate(self.odd):
+                terms.append(f * ratio)
+                alpha = i + half
+                ratio *= (-alpha - 1) / (size - alpha - 1)
+            total = Decimal(0)
+            error = abs(terms[-1])
+            for i, term in enumerate(terms[:-1]):
+                total += term
+                if abs(terms[i + 1]) < abs(total) * Decimal(10) ** -(DIGITS + 5):
+                    error = abs(terms[i + 1])
+                    break
+            value = (-size * self.log_rho).exp() * total
+            rel_error = (float(2 * error / abs(total)) + n * 10.0 ** (5 - _WORK)
+                         + 0.5 * 10.0 ** (1 - DIGITS))
+        with localcontext() as ctx:
+            _context(ctx, DIGITS)
+            return Estimate(+value, rel_error)
+
+
+def _series_mul(x: List[Decimal], y: List[Decimal], order: int) -> List[Decimal]:
+    out = []
+    for k in range(order):
+        out.append(sum((x[i] * y[k - i] for i in range(max(0, k - len(y) + 1), min(k + 1, len(x)))),
+                       Decimal(0)))
+    return out
+
+
+def _series_inverse(x: List[Decimal], order: int) -> List[Decimal]:
+    out = [1 / x[0]]
+    for k in range(1, order):
+        total = sum((x[i] * out[k - i] for i in range(1, min(k + 1, len(x)))), Decimal(0))
+        out.append(-total / x[0])
+    return out
+
+
+def _series_sqrt(x: List[Decimal], order: int) -> List[Decimal]:
+    out = [x[0].sqrt()]
+    for k in range(1, order):
+        total = x[k] - sum((out[i] * out[k - i] for i in range(1, k)), Decimal(0))
+        out.append(total / (2 * out[0]))
+    return out
+
+
+def _quadratic_expansion(a: List[int], b: List[int]) -> _Expansion:
+    """Expansion of F = (b - sqrt(b^2 - 4a)) / 2a at the first root of b^2 - 4a."""
+    disc = [0] * (2 * max(len(a), len(b)) - 1)
+    for i, x in enumerate(b):
+        for j, y in enumerate(b):
+            disc[i + j] += x * y
+    for i, x in enumerate(a):
+        disc[i] -= 4 * x
+
+    # Bracket the smallest positive root, then polish it by Newton's method
+    step = 2.0 ** -12
+    x = step
+    while sum(c * x ** i for i, c in enumerate(disc)) > 0:
+        x += step
+    rho = Decimal(x - step / 2)
+    for _ in range(100):
+        value = sum(c * rho ** i for i, c in enumerate(disc))
+        slope = sum(i * c * rho ** (i - 1) for i, c in enumerate(disc) if i)
+        change = value / slope
+        rho -= change
+        if abs(change) < Decimal(10) ** (5 - _WORK):
+            break
+
+    # sqrt(disc) = s * sqrt(d_1 + d_2 t + ...) in t = s^2, so the odd part
+    # of F is -s * sqrt(d_1 + d_2 t + ...) / 2a
+    d = _taylor_at(disc, rho, _TERMS + 1)
+    root = _series_sqrt(d[1:] + [Decimal(0)] * _TERMS, _TERMS)
+    inverse = _series_inverse(_taylor_at(a, rho, len(a)), _TERMS)
+    odd = [-x / 2 for x in _series_mul(root, inverse, _TERMS)]
+    return _Expansion(rho, odd)
+
+
+def _tree_expansions() -> Dict[str, _Expansion]:
+    """Expansions of the rooted and unrooted tree series (Otter)."""
+    size = _TREE_TERMS
+    a = [CircleTopology.rooted_trees(m) for m in range(size // 2 + 1)]
+    # r_N = [x^N] R(x) = sum_{k | N, k >= 2} a(N/k) / k
+    r = [Decimal(0)] * (size + 1)
+    for k in range(2, size + 1):
+        for m in range(1, size // k + 1):
+            r[k * m] += Decimal(a[m]) / k
+
+    # rho solves delta(rho) = 0, i.e. 1 + log x + R(x) = 0
+    rho = Decimal('0.3383218568992077')
+    for _ in range(100):
+        value = 1 + rho.ln()
+        slope = 1 / rho
+        power = Decimal(1)
+        for N in range(1, size + 1):
+            slope += N * r[N] * power
+            power *= rho
+            value += r[N] * power
+        change = value / slope
+        rho -= change
+        if abs(change) < Decimal(10) ** (5 - _WORK):
+            break
+
+    # delta(rho (1 - t)) = -1 - log rho - log(1 - t) - R(rho (1 - t)); the
+    # constant term vanishes by the choice of rho
+    order = _TERMS + 1
+    taylor = _taylor_at(r, rho, order)
+    delta = [Decimal(0)] + [1 / Decimal(i) - taylor[i] for i in range(1, order)]
+
+    # Differentiating -log(1 - u) - u = delta(s^2) in s gives
+    # u u' = (1 - u) D with D(s) = 2 s delta'(s^2), solved term by term
+    length = 2 * _TERMS + 1
+    D = [Decimal(0)] * (length + 1)
+    for m in range(1, order):
+        if 2 * m - 1 <= length:
+            D[2 * m - 1] = 2 * m * delta[m]
+    u = [Decimal(0), (2 * delta[1]).sqrt()]
+    for k in range(2, length + 1):
+        rhs = D[k] - sum((u[i] * D[k - i] for i in range(1, k)), Decimal(0))
+        cross = sum((u[i] * u[k + 1 - i] for i in range(2, k)), Decimal(0))
+        u.append((2 * rhs / (k + 1) - cross) / (2 * u[1]))
+
+    # A = 1 - u; the singular part of unrooted trees is -u^2 / 2
+    rooted = [-u[j] for j in range(1, length, 2)]
+    square = _series_mul(u, u, length + 1)
+    unrooted = [-square[j] / 2 for j in range(1, length, 2)]
+    return {'rooted': _Expansion(rho, rooted), 'unrooted': _Expansion(rho, unrooted)}
+
+
+_EXPANSIONS: Dict[str, _Expansion] = {}
+
+
+def expansion_constants(name: str):
+    """
+    Return rho and the odd singular coefficients f_1, f_3, ... of a family.
+
+    Args:
+        name: 'catalan', 'rooted', 'unrooted', 'pairs' or 'triples'
+
+    Returns:
+        Tuple (rho, [f_1, f_3, ...]) as Decimals
+    """
+    if name not in _COUNTERS:
+        raise ValueError(f"Unknown family: {name}")
+    if name not in _EXPANSIONS:
+        with localcontext() as ctx:
+            _context(ctx, _WORK + 10)
+            if name in _QUADRATICS:
+                _EXPANSIONS[name] = _quadratic_expansion(*_QUADRATICS[name])
+            else:
+                _EXPANSIONS.update(_tree_expansions())
+    found = _EXPANSIONS[name]
+    return found.rho, list(found.odd)
+
+
+def estimate(name: str, n: int) -> Estimate:
+    """
+    Estimate the n-th term of a counting sequence.
+
+    Args:
+        name: 'catalan', 'rooted', 'unrooted', 'pairs' or 'triples'
+        n: Index, as for the exact counter of the family
+
+    Returns:
+        Estimate with DIGITS significant digits and a relative error bound;
+        exact (up to rounding) for n below EXACT_BELOW
+
+    Raises:
+        ValueError: If the family is unknown
+    """
+    if name not in _COUNTERS:
+        raise ValueError(f"Unknown family: {name}")
+    if n < EXACT_BELOW:
+        exact = _COUNTERS[name](n)
+        with localcontext() as ctx:
+            _context(ctx, DIGITS)
+            value = +Decimal(exact)
+        return Estimate(value, 0.0 if value == exact else 0.5 * 10.0 ** (1 - DIGITS))
+    expansion_constants(name)
+    return _EXPANSIONS[name].estimate(n)
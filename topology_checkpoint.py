@@ -0,0 +1,283 @@
+"""
+Checkpoint and Resume for Long-running Computations
+
+Periodic, atomic checkpoints of the two kinds of long jobs, so that they
+survive a crash or preemption:
+
+    extend_sequence('rooted', 20000, 'rooted.ckpt', interval=300)
+
+    for expr in checkpointed_expressions(20, 'c20.ckpt'):
+        process(expr)
+
+- Sequence extension: the complete state of a compiled coefficient
+  generator (every kernel table, running-sum operand and pending block
+  product, see CoefficientGenerator.state) is saved, so a resumed job
+  continues with the next index at no extra cost.
+- Enumeration: the level sequence of the next tree to yield and the number
+  of topologies already consumed. An item counts as consumed when the
+  next one is requested, so a resumed enumeration yields every topology
+  after the last consumed one.
+
+Checkpoints are written to a temporary file in the same directory,
+synced and renamed over the previous checkpoint, so a crash while saving
+leaves the previous checkpoint intact.
+
+File layout: an 8-byte magic followed by unsigned LEB128 varints (see
+sequence_stream). An integer is stored as the varint 2 * bytes + sign
+followed by its magnitude in that many little-endian bytes, so large
+coefficients are copied as raw bytes.
+
+- generator: size, families (a length-prefixed UTF-8 string), number of
+  lists, then each list as its length and its integers
+- enumeration: n, consumed count, a flag set once finished, the length
+  of the level sequence and its entries
+"""
+
+import os
+import tempfile
+import time
+from typing import Iterator, List, Optional, Tuple
+
+import circle_topology
+from region_grammar import CoefficientGenerator
+from sequence_stream import encode_varint
+from topology_index import level_expression, level_sequences
+
+
+_GENERATOR_MAGIC = b'TOPGEN1\0'
+_ENUMERATION_MAGIC = b'TOPENU1\0'
+
+# Shared generators of circle_topology, by sequence name
+_GENERATORS = {
+    'catalan': circle_topology._CATALAN,
+    'rooted': circle_topology._TREES,
+    'unrooted': circle_topology._TREES,
+    'pairs': circle_topology._PAIRS,
+    'triples': circle_topology._TRIPLES,
+}
+
+
+def _encode_int(value: int) -> bytes:
+    size = (abs(value).bit_length() + 7) // 8
+    return encode_varint(2 * size + (value < 0)) + abs(value).to_bytes(size, 'little')
+
+
+def _encode_text(text: str) -> bytes:
+    raw = text.encode()
+    return encode_varint(len(raw)) + raw
+
+
+class _Reader:
+    """Sequential decoder of a checkpoint body."""
+
+    def __init__(self, data: bytes, pos: int):
+        self.data = data
+        self.pos = pos
+
+    def varint(self) -> int:
+        value = shift = 0
+        while True:
+            if self.pos >= len(self.data):
+                raise ValueError("Truncated checkpoint")
+            byte = self.data[self.pos]
+            self.pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                return value
+
+    def integer(self) -> int:
+        header = self.varint()
+        size = header >> 1
+        end = self.pos + size
+        if end > len(self.data):
+            raise ValueError("Truncated checkpoint")
+        value = int.from_bytes(self.data[self.pos:end], 'little')
+        self.pos = end
+        return -value if header & 1 else value
+
+    def text(self) -> str:
+        size = self.varint()
+        raw = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return raw.decode()
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Replace path by data so that readers see the old or the new file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    # A unique temporary name, so concurrent writers do not share one file
+    fd, temporary = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp',
+                                     dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    if os.name == 'posix':
+        # The rename is durable only once the directory entry is on disk
+        directory_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+
+
+def _read(path: str, magic: bytes) -> _Reader:
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:len(magic)] != magic:
+        raise ValueError(f"Not a checkpoint of this kind: {path}")
+    return _Reader(data, len(magic))
+
+
+def save_generator(generator: CoefficientGenerator, path: str) -> None:
+    """
+    Write a checkpoint of a coefficient generator.
+
+    Args:
+        generator: Generator to save
+        path: Checkpoint file (replaced atomically)
+    """
+    size, lists = generator.state()
+    parts = [_GENERATOR_MAGIC, encode_varint(size),
+             _encode_text(','.join(generator.families)), encode_varint(len(lists))]
+    for values in lists:
+        parts.append(encode_varint(len(values)))
+        parts.extend(_encode_int(v) for v in values)
+    _write_atomic(path, b''.join(parts))
+
+
+def load_generator(generator: CoefficientGenerator, path: str) -> None:
+    """
+    Restore a generator from a checkpoint written by save_generator.
+
+    Args:
+        generator: Generator compiled from the same grammar and families
+        path: Checkpoint file
+
+    Raises:
+        ValueError: If the file is not a checkpoint of such a generator
+    """
+    reader = _read(path, _GENERATOR_MAGIC)
+    size = reader.varint()
+    families = reader.text()
+    if families != ','.join(generator.families):
+        raise ValueError(f"Checkpoint holds families {families}, not {generator.families}")
+    lists = []
+    for _ in range(reader.varint()):
+        lists.append([reader.integer() for _ in range(reader.varint())])
+    generator.restore(size, lists)
+
+
+def extend_with_checkpoints(generator: CoefficientGenerator, n: int, path: str,
+                            interval: float = 60.0) -> None:
+    """
+    Extend a generator to index n, resuming from and saving checkpoints.
+
+    If path holds a checkpoint further along than the generator, it is
+    loaded first. A checkpoint is written whenever interval seconds have
+    passed since the last one, and once n is reached.
+
+    Args:
+        generator: Generator to extend
+        n: Largest index to compute
+        path: Checkpoint file
+        interval: Seconds between checkpoints
+    """
+    if os.path.exists(path):
+        reader = _read(path, _GENERATOR_MAGIC)
+        if reader.varint() > len(generator):
+            load_generator(generator, path)
+    last = time.monotonic()
+    while len(generator) <= n:
+        generator.advance()
+        if time.monotonic() - last >= interval:
+            save_generator(generator, path)
+            last = time.monotonic()
+    save_generator(generator, path)
+
+
+def extend_sequence(name: str, n: int, path: str, interval: float = 60.0) -> None:
+    """
+    Extend the shared table of a circle_topology family with checkpoints.
+
+    Afterwards CircleTopology queries up to n are lookups.
+
+    Args:
+        name: 'catalan', 'rooted', 'unrooted', 'pairs' or 'triples'
+        n: Largest index to compute
+        path: Checkpoint file
+        interval: Seconds between checkpoints
+    """
+    if name not in _GENERATORS:
+        raise ValueError(f"Unknown sequence: {name}")
+    extend_with_checkpoints(_GENERATORS[name], n, path, interval)
+
+
+def _save_enumeration(path: str, n: int, consumed: int, levels: Optional[List[int]]) -> None:
+    parts = [_ENUMERATION_MAGIC, encode_varint(n), encode_varint(consumed),
+             encode_varint(int(levels is None))]
+    levels = levels or []
+    parts.append(encode_varint(len(levels)))
+    parts.extend(encode_varint(depth) for depth in levels)
+    _write_atomic(path, b''.join(parts))
+
+
+def load_enumeration(path: str) -> Tuple[int, int, Optional[List[int]]]:
+    """
+    Read an enumeration checkpoint.
+
+    Args:
+        path: Checkpoint file written by checkpointed_expressions
+
+    Returns:
+        Tuple (n, consumed, levels): the number of circles, the topologies
+        consumed so far and the level sequence of the next one, or None
+        once the enumeration has finished
+    """
+    reader = _read(path, _ENUMERATION_MAGIC)
+    n = reader.varint()
+    consumed = reader.varint()
+    finished = reader.varint()
+    levels = [reader.varint() for _ in range(reader.varint())]
+    return n, consumed, None if finished else levels
+
+
+def checkpointed_expressions(n: int, path: str, interval: float = 60.0) -> Iterator[str]:
+    """
+    Enumerate the canonical expressions of n circles, resumably.
+
+    Behaves like topology_index.canonical_expressions, but resumes after
+    the last consumed topology of an existing checkpoint and writes a new
+    one whenever interval seconds have passed, and at the end.
+
+    Args:
+        n: Number of circles
+        path: Checkpoint file
+        interval: Seconds between checkpoints
+
+    Yields:
+        Canonical expressions not consumed by a previous run
+    """
+    consumed, start = 0, None
+    if os.path.exists(path):
+        saved_n, consumed, start = load_enumeration(path)
+        if saved_n != n:
+            raise ValueError(f"Checkpoint enumerates {saved_n} circles, not {n}")
+        if start is None:
+            return
+    last = time.monotonic()
+    for levels in level_sequences(n + 1, start):
+        # Asking for this item means the previous one was consumed
+        if time.monotonic() - last >= interval:
+            _save_enumeration(path, n, consumed, levels)
+            last = time.monotonic()
+        yield level_expression(levels)
+        consumed += 1
+    _save_enumeration(path, n, consumed, None)
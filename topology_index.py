@@ -0,0 +1,387 @@
+"""
+Sorted On-disk Index of Planar Topologies
+
+Enumerates every topology of n non-intersecting circles, packs the
+canonical expressions into fixed-width binary keys and stores them sorted
+in a file, so that the id of a topology (its position in the file) is
+found by binary search over a memory map without loading the index:
+
+    build_topology_index(12, 'c12.idx')
+    with TopologyIndex('c12.idx') as index:
+        index.id('(()())()...')        # topology id
+        index.sphere_id(7)             # its sphere cluster
+
+File layout (little-endian header, big-endian keys):
+- header: magic, n, number of topologies, key width in bytes and number
+  of sphere clusters (0 when the side table is absent)
+- keys: one per topology, sorted; the canonical expression read as a
+  binary number with '(' = 0 and ')' = 1, so byte order is string order
+- side table (optional): the sphere cluster id of each topology as uint32;
+  clusters are numbered in the order of their representatives' keys
+"""
+
+import mmap
+import struct
+from typing import Iterator, List, Optional, Tuple, Union
+
+from flip_transforms import (
+    CircleExpression, canonical_expression_from_parents, sphere_expression_from_parents,
+)
+
+
+_MAGIC = b'TOPIDX1\0'
+_HEADER = struct.Struct('<8sIQIQ')
+_BITS = str.maketrans('()', '01')
+_PARENS = str.maketrans('01', '()')
+
+# Polynomial hash of level sequences, modulo a Mersenne prime
+_HASH_MODULUS = (1 << 61) - 1
+_HASH_BASE = 1_000_003
+
+
+def level_sequences(m: int, start: Optional[List[int]] = None) -> Iterator[List[int]]:
+    """
+    Generate all rooted trees with m nodes as canonical level sequences.
+
+    Beyer and Hedetniemi's successor rule visits each tree once, in
+    constant amortized time. The yielded list is reused; copy it to keep it.
+
+    Args:
+        m: Number of nodes (at least 1)
+        start: Level sequence to start from instead of the first one (the
+            path), e.g. to resume an enumeration
+
+    Yields:
+        Preorder node depths, root at depth 0
+    """
+    if start is not None:
+        if len(start) != m or start[0] != 0:
+            raise ValueError(f"Not a level sequence of {m} nodes: {start}")
+        levels = list(start)
+    else:
+        levels = list(range(m))
+    while True:
+        yield levels
+        if not _successor(levels):
+            return
+
+
+def _successor(levels: List[int], p: Optional[int] = None) -> int:
+    """
+    Advance a level sequence in place by the Beyer-Hedetniemi successor rule.
+
+    The successor keeps levels[:p] and fills position i >= p with
+    levels[i - p + q], repeating the subtree rooted at q, the parent of p.
+
+    Args:
+        levels: Canonical level sequence, rewritten in place
+        p: Position to change from (by default the last node deeper than 1)
+
+    Returns:
+        The first changed position p, or 0 (levels unchanged) if levels was
+        the last sequence
+    """
+    m = len(levels)
+    if p is None:
+        p = m - 1
+        while p > 0 and levels[p] == 1:
+            p -= 1
+    if p == 0:
+        return 0
+    q = p - 1
+    while levels[q] != levels[p] - 1:
+        q -= 1
+    for i in range(p, m):
+        levels[i] = levels[i - p + q]
+    return p
+
+
+def minimal_change_topologies(n: int) -> Iterator[Tuple[List[int], int, int, int]]:
+    """
+    Enumerate the topologies of n circles with incremental per-tree data.
+
+    Consecutive level sequences of the Beyer-Hedetniemi order differ only
+    in a suffix, of amortized constant length (about 1.6 positions on
+    average). The prefix hashes and the count of depth-1 nodes are kept per
+    position and recomputed over that suffix only, so the hash and the
+    factor count cost amortized O(1) per topology, instead of the O(n)
+    of evaluating them on each tree.
+
+    Args:
+        n: Number of circles
+
+    Yields:
+        Tuple (levels, changed, key, factors): the level sequence of n + 1
+        nodes (a reused list), the first position that differs from the
+        previous one (0 for the first tree), level_hash(levels), and the
+        number of top-level factors of the topology
+    """
+    m = n + 1
+    levels = list(range(m))
+    prefix = [0] * m
+    ones = [0] * m
+    key = count = 0
+    for i, depth in enumerate(levels):
+        key = (key * _HASH_BASE + depth + 1) % _HASH_MODULUS
+        count += depth == 1
+        prefix[i] = key
+        ones[i] = count
+    yield levels, 0, key, count
+    while True:
+        # The successor rule of level_sequences, then the suffix from p rehashed
+        p = _successor(levels)
+        if not p:
+            return
+        key = prefix[p - 1]
+        count = ones[p - 1]
+        for i in range(p, m):
+            depth = levels[i]
+            key = (key * _HASH_BASE + depth + 1) % _HASH_MODULUS
+            count += depth == 1
+            prefix[i] = key
+            ones[i] = count
+        yield levels, p, key, count
+
+
+def level_hash(levels: List[int]) -> int:
+    """
+    Return the canonical hash of a canonical level sequence.
+
+    The hash is a polynomial hash modulo the prime 2^61 - 1, so equal trees
+    (equal canonical sequences) hash equally and distinct trees collide
+    with probability about m / 2^61.
+
+    Args:
+        levels: Canonical level sequence, as from level_sequences or
+            canonical_levels
+
+    Returns:
+        Hash in [0, 2^61 - 1)
+    """
+    key = 0
+    for depth in levels:
+        key = (key * _HASH_BASE + depth + 1) % _HASH_MODULUS
+    return key
+
+
+def canonical_levels(expression: Union[CircleExpression, str]) -> List[int]:
+    """
+    Return the canonical level sequence of the topology of an expression.
+
+    The plane is the root at depth 0. Children are ordered by decreasing
+    level sequence, which gives the sequence that level_sequences yields
+    for this tree.
+
+    Args:
+        expression: Any expression of the topology
+
+    Returns:
+        Level sequence of n + 1 nodes
+    """
+    if not isinstance(expression, CircleExpression):
+        expression = CircleExpression(expression)
+    parents = expression.nesting_parents()
+    children: List[List[int]] = [[] for _ in range(len(parents) + 1)]
+    for i, parent in enumerate(parents):
+        children[parent + 1].append(i + 1)
+    # Children come after their parents in preorder, so build bottom-up
+    sequences: List[List[int]] = [[] for _ in children]
+    for node in range(len(children) - 1, -1, -1):
+        subtrees = sorted((sequences[c] for c in children[node]), reverse=True)
+        sequences[node] = [0] + [depth + 1 for subtree in subtrees for depth in subtree]
+    return sequences[0]
+
+
+def canonical_expressions(n: int, start: Optional[List[int]] = None) -> Iterator[str]:
+    """
+    Generate the canonical expression of every topology of n circles.
+
+    The plane is the root of a rooted tree with n + 1 nodes, so each level
+    sequence of that size is one topology.
+
+    Args:
+        n: Number of circles
+        start: Level sequence of n + 1 nodes to start from (see
+            level_sequences)
+
+    Yields:
+        Canonical expressions, one per topology, in enumeration order
+    """
+    for levels in level_sequences(n + 1, start):
+        yield level_expression(levels)
+
+
+def level_expression(levels: List[int]) -> str:
+    """
+    Return the canonical expression of the topology of a level sequence.
+
+    Args:
+        levels: Level sequence of n + 1 nodes, the root being the plane
+
+    Returns:
+        Canonical expression of the n circles
+    """
+    n = len(levels) - 1
+    last = [0] * (n + 2)
+    parents = []
+    for i in range(1, n + 1):
+        depth = levels[i]
+        last[depth] = i
+        parents.append(last[depth - 1] - 1)
+    return canonical_expression_from_parents(parents)
+
+
+def _key_width(n: int) -> int:
+    """Bytes per key for n circles (two bits per circle)."""
+    return (2 * n + 7) // 8
+
+
+def _key_value(expression: str) -> int:
+    return int(expression.translate(_BITS) or '0', 2)
+
+
+def _decode(key: int, n: int) -> str:
+    return format(key, f'0{2 * n}b').translate(_PARENS) if n else ''
+
+
+def encode_key(expression: str, width: int) -> bytes:
+    """Pack a parentheses expression into a big-endian key of width bytes."""
+    return _key_value(expression).to_bytes(width, 'big')
+
+
+def build_topology_index(n: int, path: str, sphere: bool = True) -> int:
+    """
+    Write the sorted index of all topologies of n circles.
+
+    Args:
+        n: Number of circles
+        path: Output file
+        sphere: Also write the side table of sphere cluster ids
+
+    Returns:
+        Number of topologies indexed
+    """
+    width = _key_width(n)
+    keys = sorted(_key_value(e) for e in canonical_expressions(n))
+
+    clusters = 0
+    table: List[int] = []
+    if sphere:
+        representatives = []
+        for key in keys:
+            parents = CircleExpression(_decode(key, n)).nesting_parents()
+            representatives.append(_key_value(sphere_expression_from_parents(parents)))
+        numbering = {key: i for i, key in enumerate(sorted(set(representatives)))}
+        clusters = len(numbering)
+        table = [numbering[key] for key in representatives]
+
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, n, len(keys), width, clusters))
+        for key in keys:
+            f.write(key.to_bytes(width, 'big'))
+        if sphere:
+            f.write(struct.pack(f'<{len(table)}I', *table))
+    return len(keys)
+
+
+class TopologyIndex:
+    """
+    Read-only view of an index file written by build_topology_index.
+
+    The file is memory-mapped; lookups read O(log N) keys from it.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        try:
+            self._map: Optional[mmap.mmap] = mmap.mmap(self._file.fileno(), 0,
+                                                       access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._file.close()
+            raise ValueError(f"Not a topology index: {path}")
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Not a topology index: {path}")
+        magic, self.n, self._count, self._width, self.sphere_clusters = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError(f"Not a topology index: {path}")
+        self._table = _HEADER.size + self._count * self._width
+
+    def close(self):
+        """Release the memory map and the file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> 'TopologyIndex':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _key_at(self, i: int) -> bytes:
+        start = _HEADER.size + i * self._width
+        return self._map[start:start + self._width]
+
+    def _search(self, expression: Union[CircleExpression, str]) -> Optional[int]:
+        if not isinstance(expression, CircleExpression):
+            expression = CircleExpression(expression)
+        if expression.count_circles() != self.n:
+            return None
+        key = encode_key(expression.canonical().expr, self._width)
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._key_at(lo) == key:
+            return lo
+        return None
+
+    def __contains__(self, expression: Union[CircleExpression, str]) -> bool:
+        return self._search(expression) is not None
+
+    def id(self, expression: Union[CircleExpression, str]) -> int:
+        """
+        Return the topology id of an expression of n circles.
+
+        Args:
+            expression: Any expression of the topology, canonical or not
+
+        Returns:
+            Position of the topology in the index
+
+        Raises:
+            KeyError: If the topology is not in the index
+        """
+        found = self._search(expression)
+        if found is None:
+            raise KeyError(str(expression))
+        return found
+
+    def expression(self, topology_id: int) -> CircleExpression:
+        """Return the canonical expression of a topology id."""
+        if not 0 <= topology_id < self._count:
+            raise IndexError(f"Topology id {topology_id} out of range")
+        return CircleExpression(_decode(int.from_bytes(self._key_at(topology_id), 'big'), self.n))
+
+    def sphere_id(self, topology_id: int) -> int:
+        """
+        Return the sphere cluster id of a topology id.
+
+        Raises:
+            LookupError: If the index was built without the side table
+        """
+        if not self.sphere_clusters:
+            raise LookupError("Index has no sphere cluster table")
+        if not 0 <= topology_id < self._count:
+            raise IndexError(f"Topology id {topology_id} out of range")
+        return struct.unpack_from('<I', self._map, self._table + 4 * topology_id)[0]
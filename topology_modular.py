@@ -0,0 +1,200 @@
+"""
+Multi-modular Computation of Rooted Tree Counts
+
+Exact values of A000081 far out in the sequence, computed as residues
+modulo many word-sized primes in parallel and reconstructed by the Chinese
+remainder theorem:
+
+    rooted_trees_range(9990, 10000, workers=8)
+
+Modulo a prime p the multiset recurrence
+
+    n * f(n) = sum_{j=1}^{n} c(j) * f(n - j),  c(j) = sum_{d|j} d * a(d)
+
+for the forest counts f(n) = a(n + 1) is a convolution of residues below
+2^62, which the online block product of region_grammar packs into
+integers of about 130 bits per coefficient instead of the ~1.56 n bits of
+the exact terms. One prime is one task: a process pool runs the tasks and
+each writes its residues into a row of a shared-memory array, so workers
+never pickle results. The number of primes follows from the bound
+a(n) <= rho^-n (A(rho) = 1 with nonnegative coefficients, rho = 0.33832...
+Otter's constant), and one extra prime checks every reconstructed value.
+
+Every task repeats the whole recurrence, so one process is slower than the
+bignum generator for moderate n (about 0.2 s per prime at n = 3000 with
+~77 primes); the pipeline pays off with many cores and large n, where the
+work divides across primes with no communication.
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List
+
+from region_grammar import _RelaxedProduct
+
+
+# Primes are taken below 2^PRIME_BITS
+PRIME_BITS = 62
+
+# Upper bound on log2(1/rho) = 1.563531..., scaled by _BOUND_SCALE
+_BOUND_NUMERATOR = 15636
+_BOUND_SCALE = 10000
+
+# Bases of a Miller-Rabin test that is deterministic below 3.3 * 10^24
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def bit_bound(n: int) -> int:
+    """
+    Return a bound on the bit length of a(n), the rooted trees with n nodes.
+
+    Since sum_n a(n) rho^n = A(rho) = 1, a(n) <= rho^-n < 2^(1.5636 n).
+    """
+    return _BOUND_NUMERATOR * n // _BOUND_SCALE + 1
+
+
+def _is_prime(m: int) -> bool:
+    if m < 2:
+        return False
+    for p in _WITNESSES:
+        if m % p == 0:
+            return m == p
+    d, s = m - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _WITNESSES:
+        x = pow(a, d, m)
+        if x == 1 or x == m - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % m
+            if x == m - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def crt_primes(bits: int) -> List[int]:
+    """
+    Return the largest primes below 2^PRIME_BITS whose product exceeds 2^bits.
+
+    Args:
+        bits: Bit length the product must exceed
+
+    Returns:
+        Primes in decreasing order
+    """
+    primes: List[int] = []
+    covered = 0
+    candidate = (1 << PRIME_BITS) - 1
+    while covered <= bits:
+        if _is_prime(candidate):
+            primes.append(candidate)
+            covered += PRIME_BITS - 1
+        candidate -= 2
+    return primes
+
+
+def rooted_trees_mod(n: int, prime: int) -> List[int]:
+    """
+    Compute a(0..n) modulo a prime larger than n.
+
+    Args:
+        n: Largest number of nodes
+        prime: Modulus, a prime above n
+
+    Returns:
+        List of n+1 residues
+    """
+    if prime <= n:
+        raise ValueError(f"The modulus must exceed n = {n}: {prime}")
+    forest = [1]
+    cs: List[int] = []
+    product = _RelaxedProduct(cs, forest)
+    # c[k] accumulates d * a(d) over the divisors d of k found so far
+    c = [0] * (n + 1)
+    for m in range(1, n):
+        weight = m * forest[m - 1]
+        if weight:
+            for k in range(m, n + 1, m):
+                c[k] += weight
+        cs.append(c[m] % prime)
+        forest.append(product.coefficient(m - 1) % prime * pow(m, -1, prime) % prime)
+    return ([0] + forest)[:n + 1]
+
+
+def _residue_task(name: str, row: int, prime: int, lo: int, hi: int) -> int:
+    """Write a(lo..hi) mod prime into a row of the shared result array."""
+    residues = array('Q', rooted_trees_mod(hi, prime)[lo:])
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        # The view must be released even on error, or close() raises BufferError
+        with memory.buf.cast('Q') as view:
+            view[row * len(residues):(row + 1) * len(residues)] = residues
+    finally:
+        memory.close()
+    return row
+
+
+def rooted_trees_range(lo: int, hi: int, workers: int = 1) -> List[int]:
+    """
+    Compute a(lo..hi), the rooted trees with lo to hi nodes, by CRT.
+
+    Args:
+        lo: Smallest number of nodes
+        hi: Largest number of nodes
+        workers: Number of processes running the per-prime recurrences
+
+    Returns:
+        List of hi-lo+1 exact counts
+
+    Raises:
+        RuntimeError: If a value fails the check prime
+    """
+    if not 0 <= lo <= hi:
+        raise ValueError(f"Need 0 <= lo <= hi, got {lo}, {hi}")
+    primes = crt_primes(bit_bound(hi))
+    check = primes[-1]
+    while True:
+        check -= 2
+        if _is_prime(check):
+            break
+    primes.append(check)
+    width = hi - lo + 1
+
+    if workers <= 1:
+        rows = [rooted_trees_mod(hi, p)[lo:] for p in primes]
+    else:
+        memory = shared_memory.SharedMemory(create=True, size=8 * width * len(primes))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                tasks = [pool.submit(_residue_task, memory.name, row, p, lo, hi)
+                         for row, p in enumerate(primes)]
+                for task in tasks:
+                    task.result()
+            view = memory.buf.cast('Q')
+            rows = [view[row * width:(row + 1) * width].tolist() for row in range(len(primes))]
+            view.release()
+        finally:
+            memory.close()
+            memory.unlink()
+
+    # x = sum_i r_i * e_i mod M with e_i = 1 mod p_i and 0 mod the others
+    primes = primes[:-1]
+    modulus = 1
+    for p in primes:
+        modulus *= p
+    basis = []
+    for p in primes:
+        rest = modulus // p
+        basis.append(rest * pow(rest % p, -1, p))
+    values = []
+    for offset in range(width):
+        value = sum(rows[i][offset] * e for i, e in enumerate(basis)) % modulus
+        if value % check != rows[-1][offset]:
+            raise RuntimeError(f"CRT reconstruction of a({lo + offset}) failed the check prime")
+        values.append(value)
+    return values
@@ -0,0 +1,242 @@
+"""
+Hot-path Instrumentation for the Circle Topology Counters
+
+Opt-in profiling of CircleTopology and the region grammar kernels:
+
+    from topology_profiling import topology_profile
+
+    with topology_profile() as p:
+        CircleTopology.sphere_surface_clusters(500)
+    print(p.stats['counters']['unrooted_trees'])
+
+While a profile is active the counters, the generator extension loop and
+the multiplication primitives of region_grammar are replaced by recording
+wrappers; on exit the original functions are restored. Nothing is patched
+outside the context, so instrumentation costs nothing when disabled.
+
+Recorded statistics:
+- counters: calls, cache hits (answered from the computed prefix), misses,
+  inclusive wall time and the range of n queried, per counter
+- generators: coefficients computed, kernel steps and time per compiled
+  generator, with the index range extended
+- multiplications: number of bignum products in the direct convolution
+  band and of Kronecker block products, with operand bit sizes
+- peak_memory: peak traced allocation in bytes (tracemalloc)
+"""
+
+import time
+import tracemalloc
+from typing import Any, Dict, Optional
+
+import region_grammar
+from circle_topology import CircleTopology
+from region_grammar import CoefficientGenerator
+
+
+# CircleTopology methods wrapped while profiling
+COUNTERS = (
+    'rooted_trees',
+    'catalan_number',
+    'unrooted_trees',
+    'non_intersecting_circles',
+    'sphere_surface_clusters',
+    'hypersphere_4d_clusters',
+    'pairs_may_intersect',
+    'triples_may_intersect',
+    'factor_count_distribution',
+    'depth_distribution',
+    'generate_sequence',
+    'generating_function_coefficients',
+)
+
+_active: Optional['TopologyProfile'] = None
+
+
+class TopologyProfile:
+    """
+    Statistics collected by one :func:`topology_profile` context.
+
+    The ``stats`` dict is live while the context is active and final after
+    it exits.
+    """
+
+    def __init__(self, memory: bool = True):
+        self.memory = memory
+        self.stats: Dict[str, Any] = {
+            'wall_time': 0.0,
+            'peak_memory': None,
+            'counters': {},
+            'generators': {},
+            'multiplications': {
+                'direct': 0,
+                'direct_max_bits': 0,
+                'blocks': 0,
+                'block_max_bits': 0,
+                'block_total_bits': 0,
+            },
+        }
+        self._saved: Dict[Any, Any] = {}
+        self._started_tracemalloc = False
+        self._start = 0.0
+
+    def __enter__(self) -> 'TopologyProfile':
+        global _active
+        if _active is not None:
+            raise RuntimeError("A topology profile is already active")
+        _active = self
+        if self.memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                self._started_tracemalloc = True
+        self._install()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        global _active
+        self.stats['wall_time'] = time.perf_counter() - self._start
+        self._uninstall()
+        if self.memory:
+            self.stats['peak_memory'] = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        _active = None
+        return False
+
+    def _install(self):
+        for name in COUNTERS:
+            original = CircleTopology.__dict__[name]
+            self._saved[(CircleTopology, name)] = original
+            setattr(CircleTopology, name, staticmethod(self._wrap_counter(name, original.__func__)))
+
+        self._saved[(CoefficientGenerator, 'extend')] = CoefficientGenerator.extend
+        CoefficientGenerator.extend = self._wrap_extend(CoefficientGenerator.extend)
+
+        self._saved[(region_grammar, 'mul')] = region_grammar.mul
+        self._saved[(region_grammar, '_poly_multiply')] = region_grammar._poly_multiply
+        region_grammar.mul = self._wrap_mul(region_grammar.mul)
+        region_grammar._poly_multiply = self._wrap_poly_multiply(region_grammar._poly_multiply)
+
+    def _uninstall(self):
+        for (owner, name), original in self._saved.items():
+            setattr(owner, name, original)
+        self._saved.clear()
+
+    def _wrap_counter(self, name, func):
+        record = self.stats['counters'].setdefault(name, {
+            'calls': 0, 'hits': 0, 'misses': 0, 'time': 0.0, 'n_min': None, 'n_max': None,
+        })
+        generators = self.stats['generators']
+
+        def counter(n, *args, **kwargs):
+            computed = sum(g['coefficients'] for g in generators.values())
+            start = time.perf_counter()
+            try:
+                return func(n, *args, **kwargs)
+            finally:
+                record['time'] += time.perf_counter() - start
+                record['calls'] += 1
+                if sum(g['coefficients'] for g in generators.values()) == computed:
+                    record['hits'] += 1
+                else:
+                    record['misses'] += 1
+                if record['n_min'] is None or n < record['n_min']:
+                    record['n_min'] = n
+                if record['n_max'] is None or n > record['n_max']:
+                    record['n_max'] = n
+
+        counter.__name__ = name
+        counter.__doc__ = func.__doc__
+        return counter
+
+    def _wrap_extend(self, extend):
+        generators = self.stats['generators']
+
+        def profiled_extend(generator, n):
+            before = len(generator)
+            if n < before:
+                return extend(generator, n)
+            key = ','.join(generator.families)
+            record = generators.setdefault(key, {
+                'coefficients': 0, 'kernel_steps': 0, 'time': 0.0,
+                'n_min': None, 'n_max': None,
+            })
+            start = time.perf_counter()
+            try:
+                return extend(generator, n)
+            finally:
+                elapsed = time.perf_counter() - start
+                computed = len(generator) - before
+                record['time'] += elapsed
+                record['coefficients'] += computed
+                record['kernel_steps'] += computed * generator.node_count
+                if computed:
+                    if record['n_min'] is None or before < record['n_min']:
+                        record['n_min'] = before
+                    if record['n_max'] is None or len(generator) - 1 > record['n_max']:
+                        record['n_max'] = len(generator) - 1
+
+        return profiled_extend
+
+    def _wrap_mul(self, mul):
+        ops = self.stats['multiplications']
+
+        def counting_mul(x, y):
+            ops['direct'] += 1
+            bits = max(x.bit_length(), y.bit_length())
+            if bits > ops['direct_max_bits']:
+                ops['direct_max_bits'] = bits
+            return mul(x, y)
+
+        return counting_mul
+
+    def _wrap_poly_multiply(self, poly_multiply):
+        ops = self.stats['multiplications']
+
+        def counting_poly_multiply(x, y):
+            ops['blocks'] += 1
+            bits = max(map(int.bit_length, x)) * len(x) + max(map(int.bit_length, y)) * len(y)
+            ops['block_total_bits'] += bits
+            if bits > ops['block_max_bits']:
+                ops['block_max_bits'] = bits
+            return poly_multiply(x, y)
+
+        return counting_poly_multiply
+
+    def report(self) -> str:
+        """Return a human-readable summary of the statistics."""
+        lines = [f"Wall time: {self.stats['wall_time']:.6f} s"]
+        if self.stats['peak_memory'] is not None:
+            lines.append(f"Peak memory: {self.stats['peak_memory']} bytes")
+        lines.append("")
+        lines.append(f"{'Counter':<34} {'Calls':>8} {'Hits':>8} {'Misses':>8} {'Time (s)':>10}  n range")
+        for name, rec in sorted(self.stats['counters'].items()):
+            if rec['calls']:
+                lines.append(f"{name:<34} {rec['calls']:>8} {rec['hits']:>8} {rec['misses']:>8} "
+                             f"{rec['time']:>10.6f}  {rec['n_min']}..{rec['n_max']}")
+        lines.append("")
+        lines.append(f"{'Generator':<34} {'Coeffs':>8} {'Steps':>8} {'Time (s)':>10}  n range")
+        for name, rec in sorted(self.stats['generators'].items()):
+            lines.append(f"{name:<34} {rec['coefficients']:>8} {rec['kernel_steps']:>8} "
+                         f"{rec['time']:>10.6f}  {rec['n_min']}..{rec['n_max']}")
+        ops = self.stats['multiplications']
+        lines.append("")
+        lines.append(f"Direct multiplications: {ops['direct']} (max {ops['direct_max_bits']} bits)")
+        lines.append(f"Block products: {ops['blocks']} (max {ops['block_max_bits']} bits, "
+                     f"total {ops['block_total_bits']} bits)")
+        return '\n'.join(lines)
+
+
+def topology_profile(memory: bool = True) -> TopologyProfile:
+    """
+    Create a profiling context for the circle topology counters.
+
+    Args:
+        memory: Track peak memory with tracemalloc (slows allocation-heavy code)
+
+    Returns:
+        A context manager whose ``stats`` dict holds the collected statistics
+    """
+    return TopologyProfile(memory=memory)
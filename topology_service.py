@@ -0,0 +1,273 @@
+"""
+Asyncio JSON Service for the Counting Sequences
+
+A small local HTTP service on top of CircleTopology, for clients that
+would otherwise start a Python process per query:
+
+    python -m topology_service --port 8080
+
+    GET /                                     names of the sequences
+    GET /sequence/rooted/500                  {"n": 500, "rooted": ...}
+    GET /sequence/pairs?start=0&end=10000     one JSON object per line
+
+Queries inside the tabulated prefix of a sequence are answered on the
+event loop. Anything else is coalesced: concurrent requests for one
+sequence record the largest index wanted, and a single extension to
+that index runs in a worker thread while the requests wait on it, so a
+burst of clients costs one table extension rather than one per client.
+Ranges are streamed with chunked transfer encoding, a chunk of terms at a
+time, with the decimal conversion of each chunk also done off the loop.
+
+Only GET is supported, with HTTP/1.1 keep-alive. The service is meant for
+a trusted local network and has no authentication. Indices are capped at
+max_index, since an extension cannot be cancelled once it has started
+and its cost grows quadratically past the precomputed terms.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from circle_topology import SEQUENCES, CircleTopology, computed_terms
+from sequence_stream import encode_terms
+
+
+# Terms encoded and sent per chunk of a range response
+CHUNK_SIZE = 256
+
+# Default largest index a client may ask for; extending a family from the
+# precomputed 1000 terms to 2000 takes a few seconds
+MAX_INDEX = 2000
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            500: 'Internal Server Error'}
+
+_LOG = logging.getLogger(__name__)
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class TopologyService:
+    """
+    Coalescing front end of the CircleTopology counters.
+
+    Attributes:
+        extensions: Number of table extensions run per sequence, for
+            monitoring coalescing
+    """
+
+    def __init__(self, executor: Optional[ThreadPoolExecutor] = None,
+                 chunk_size: int = CHUNK_SIZE, max_index: int = MAX_INDEX):
+        """
+        Args:
+            executor: Pool for extensions and encoding (a private pool of
+                four threads by default)
+            chunk_size: Terms per chunk of a range response
+            max_index: Largest index a client may ask for
+        """
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=4)
+        self.chunk_size = chunk_size
+        self.max_index = max_index
+        self.extensions: Dict[str, int] = {name: 0 for name in SEQUENCES}
+        self._wanted: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def close(self) -> None:
+        """Shut down the private executor, if the service created one."""
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+
+    async def ensure(self, name: str, n: int) -> None:
+        """
+        Make sure terms 0..n of a sequence are tabulated.
+
+        Args:
+            name: Key of SEQUENCES
+            n: Largest index needed
+        """
+        if n < computed_terms(name):
+            return
+        self._wanted[name] = max(self._wanted.get(name, -1), n)
+        lock = self._locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            # An extension that ran while we waited may have covered n
+            if n < computed_terms(name):
+                return
+            target = max(self._wanted.pop(name, n), n)
+            counter = getattr(CircleTopology, SEQUENCES[name])
+            self.extensions[name] += 1
+            await asyncio.get_running_loop().run_in_executor(self._executor, counter, target)
+
+    async def value(self, name: str, n: int) -> int:
+        """Return term n of a sequence, extending its table if needed."""
+        await self.ensure(name, n)
+        return getattr(CircleTopology, SEQUENCES[name])(n)
+
+    async def chunks(self, name: str, start: int, end: int,
+                     modulus: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        Yield the terms start..end of a sequence as encoded JSON lines.
+
+        Args:
+            name: Key of SEQUENCES
+            start: First index
+            end: Last index
+            modulus: Reduce every term modulo this value if given
+
+        Yields:
+            Chunks of at most chunk_size lines
+        """
+        await self.ensure(name, end)
+        counter = getattr(CircleTopology, SEQUENCES[name])
+        loop = asyncio.get_running_loop()
+        for first in range(start, end + 1, self.chunk_size):
+            terms = [(n, counter(n)) for n in range(first, min(first + self.chunk_size, end + 1))]
+            if modulus:
+                terms = [(n, value % modulus) for n, value in terms]
+            yield await loop.run_in_executor(self._executor, encode_terms, 'jsonl', name, terms)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve the requests of one connection."""
+        try:
+            while True:
+                request = await reader.readline()
+                if not request:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    key, _, val = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = val.strip().lower()
+                keep_alive = headers.get('connection') != 'close'
+                await self._respond(request.decode('latin-1').split(), writer, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        except Exception:
+            # Only a failure after the status line of a streamed response gets
+            # here; the client sees the connection end without the last chunk
+            _LOG.exception("Response stream failed")
+        finally:
+            writer.close()
+
+    async def _respond(self, request: List[str], writer: asyncio.StreamWriter,
+                       keep_alive: bool) -> None:
+        try:
+            body, stream = await self._route(request)
+        except _HTTPError as error:
+            body, stream = json.dumps({'error': str(error)}).encode() + b'\n', None
+            status = error.status
+        except Exception:
+            _LOG.exception("Request failed: %s", ' '.join(request))
+            body, stream = json.dumps({'error': 'Internal server error'}).encode() + b'\n', None
+            status = 500
+        else:
+            status = 200
+        head = [f"HTTP/1.1 {status} {_REASONS[status]}",
+                "Content-Type: application/json",
+                f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        if stream is None:
+            head.append(f"Content-Length: {len(body)}")
+            writer.write(('\r\n'.join(head) + '\r\n\r\n').encode() + body)
+            return
+        head.append("Transfer-Encoding: chunked")
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode())
+        async for chunk in stream:
+            writer.write(f"{len(chunk):x}\r\n".encode() + chunk + b'\r\n')
+            await writer.drain()
+        writer.write(b'0\r\n\r\n')
+
+    async def _route(self, request: List[str]) -> Tuple[bytes, Optional[AsyncIterator[bytes]]]:
+        if len(request) != 3:
+            raise _HTTPError(400, "Malformed request line")
+        method, target, _ = request
+        if method != 'GET':
+            raise _HTTPError(405, f"Unsupported method: {method}")
+        url = urlsplit(target)
+        parts = [p for p in url.path.split('/') if p]
+        if not parts:
+            return json.dumps({'sequences': sorted(SEQUENCES)}).encode() + b'\n', None
+        if parts[0] != 'sequence' or len(parts) not in (2, 3):
+            raise _HTTPError(404, f"No such resource: {url.path}")
+        name = parts[1]
+        if name not in SEQUENCES:
+            raise _HTTPError(404, f"Unknown sequence: {name}")
+        if len(parts) == 3:
+            n = self._index(parts[2], 'n')
+            return encode_terms('jsonl', name, [(n, await self.value(name, n))]), None
+
+        query = parse_qs(url.query)
+        start = self._index(query.get('start', ['0'])[0], 'start')
+        end = self._index(query.get('end', [str(start)])[0], 'end')
+        if end < start:
+            raise _HTTPError(400, "end must not be smaller than start")
+        modulus = None
+        if 'modulus' in query:
+            modulus = _integer(query['modulus'][0], 'modulus')
+            if modulus < 1:
+                raise _HTTPError(400, "modulus must be positive")
+        # Extend before the status line, so that a failure is still a 500
+        await self.ensure(name, end)
+        return b'', self.chunks(name, start, end, modulus)
+
+    def _index(self, text: str, field: str) -> int:
+        value = _integer(text, field)
+        if not 0 <= value <= self.max_index:
+            raise _HTTPError(400, f"{field} must be in 0..{self.max_index}: {value}")
+        return value
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8080) -> asyncio.AbstractServer:
+        """Start listening; the returned server is already accepting."""
+        return await asyncio.start_server(self.handle, host, port)
+
+
+def _integer(text: str, field: str) -> int:
+    try:
+        return int(text)
+    except ValueError:
+        raise _HTTPError(400, f"{field} must be an integer: {text}") from None
+
+
+async def _serve_forever(host: str, port: int, max_index: int) -> None:
+    service = TopologyService(max_index=max_index)
+    server = await service.serve(host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point (python -m topology_service)."""
+    parser = argparse.ArgumentParser(prog='python -m topology_service',
+                                     description="Serve the counting sequences as JSON over HTTP.")
+    parser.add_argument('--host', default='127.0.0.1', help="interface (default 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8080, help="port (default 8080)")
+    parser.add_argument('--max-index', type=int, default=MAX_INDEX,
+                        help=f"largest index a client may ask for (default {MAX_INDEX})")
+    args = parser.parse_args(argv)
+    logging.basicConfig(format='%(asctime)s %(levelname)s %(message)s')
+    try:
+        asyncio.run(_serve_forever(args.host, args.port, args.max_index))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
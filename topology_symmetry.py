@@ -0,0 +1,236 @@
+"""
+Automorphism Groups and Sphere Cluster Sizes
+
+On the sphere the outer region is no longer special, so a topology of n
+circles is a free tree with n + 1 nodes, and its sphere cluster (the
+planar topologies with one sphere_canonical form) holds one planar
+topology per distinct rooting of that tree. Two rootings are the
+same planar topology exactly when an automorphism of the tree maps one
+root to the other, so the cluster size is the number of vertex orbits of
+Aut(T):
+
+    for levels, size, automorphisms in sphere_clusters(20):
+        ...                             # sizes sum to a(21) = 35221832
+
+Every automorphism fixes the center of a tree (a vertex, or an edge that
+is subdivided here to make it a vertex). Rooted there, subtrees get
+canonical class ids bottom-up (Aho, Hopcroft and Ullman), and
+
+    |Aut(v)| = prod |Aut(c)| over the children c * prod m_k!
+
+where m_k children share class k. Top-down, two vertices are in one
+orbit exactly when the class ids along their paths from the center agree.
+Both passes touch every node once, plus the sort of each node's child
+classes.
+
+Free trees are enumerated with the algorithm of Wright, Richmond, Odlyzko
+and McKay, which yields the level sequence of each tree rooted at a
+center.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from topology_index import _successor
+
+
+def _children(levels: List[int]) -> List[List[int]]:
+    """Child lists of the nodes of a level sequence."""
+    children: List[List[int]] = [[] for _ in levels]
+    last = [0] * (max(levels, default=0) + 1)
+    for i in range(1, len(levels)):
+        depth = levels[i]
+        last[depth] = i
+        children[last[depth - 1]].append(i)
+    return children
+
+
+def rooted_automorphisms(levels: List[int]) -> int:
+    """
+    Return |Aut| of a rooted tree, the automorphisms fixing the root.
+
+    For a planar topology (the plane as root) this counts the ways to
+    permute its circles without changing it.
+
+    Args:
+        levels: Level sequence, root at depth 0
+
+    Returns:
+        Order of the automorphism group
+    """
+    children = _children(levels)
+    classes: Dict[Tuple[int, ...], int] = {}
+    ids = [0] * len(levels)
+    order = 1
+    # Children follow their parents in preorder, so reverse order is bottom-up
+    for node in range(len(levels) - 1, -1, -1):
+        key = tuple(sorted(ids[c] for c in children[node]))
+        ids[node] = classes.setdefault(key, len(classes))
+        order *= _repeats(key)
+    return order
+
+
+def _repeats(key: Tuple[int, ...]) -> int:
+    """prod m_k! over the runs of equal entries of a sorted tuple."""
+    product, run = 1, 1
+    for i in range(1, len(key)):
+        if key[i] == key[i - 1]:
+            run += 1
+            product *= run
+        else:
+            run = 1
+    return product
+
+
+def tree_symmetry(levels: List[int]) -> Tuple[int, int]:
+    """
+    Return the automorphism group order and vertex orbit count of a free tree.
+
+    Args:
+        levels: Level sequence of the tree under any rooting
+
+    Returns:
+        Tuple (automorphisms, orbits); orbits is the number of distinct
+        rooted trees obtained by rooting it at each vertex, i.e. the size
+        of the sphere cluster of the corresponding planar topologies
+    """
+    m = len(levels)
+    if m <= 1:
+        return 1, m
+    neighbours = _children(levels)
+    stack = [0]
+    parent = [-1] * m
+    while stack:
+        node = stack.pop()
+        for child in neighbours[node]:
+            parent[child] = node
+            stack.append(child)
+    for node in range(1, m):
+        neighbours[node].append(parent[node])
+
+    # Peel leaves layer by layer; the last one or two nodes are the center
+    degree = [len(adjacent) for adjacent in neighbours]
+    layer = [node for node in range(m) if degree[node] == 1]
+    remaining = m
+    while remaining > 2:
+        remaining -= len(layer)
+        following = []
+        for leaf in layer:
+            for other in neighbours[leaf]:
+                degree[other] -= 1
+                if degree[other] == 1:
+                    following.append(other)
+        layer = following
+    if remaining == 2:
+        # Subdivide the central edge by a virtual node m
+        u, v = layer
+        neighbours[u][neighbours[u].index(v)] = m
+        neighbours[v][neighbours[v].index(u)] = m
+        neighbours.append([u, v])
+        center = m
+    else:
+        center = layer[0]
+
+    # Preorder from the center, then class ids bottom-up
+    order_of_visit = [center]
+    parent = [-1] * len(neighbours)
+    parent[center] = center
+    for node in order_of_visit:
+        for other in neighbours[node]:
+            if parent[other] < 0:
+                parent[other] = node
+                order_of_visit.append(other)
+    classes: Dict[Tuple[int, ...], int] = {}
+    ids = [0] * len(neighbours)
+    automorphisms = 1
+    for node in reversed(order_of_visit):
+        key = tuple(sorted(ids[c] for c in neighbours[node] if parent[c] == node and c != node))
+        ids[node] = classes.setdefault(key, len(classes))
+        automorphisms *= _repeats(key)
+
+    # Orbit labels top-down: (label of the parent, own class)
+    labels: Dict[Tuple[int, int], int] = {}
+    label = [0] * len(neighbours)
+    for node in order_of_visit[1:]:
+        label[node] = labels.setdefault((label[parent[node]], ids[node]), len(labels) + 1)
+    orbits = len({label[node] for node in range(m)})
+    return automorphisms, orbits
+
+
+def free_trees(m: int) -> Iterator[List[int]]:
+    """
+    Generate every free tree with m nodes once, as a level sequence rooted at a center.
+
+    Wright, Richmond, Odlyzko and McKay, "Constant time generation of free
+    trees", SIAM J. Comput. 15 (1986).
+
+    Args:
+        m: Number of nodes (at least 1)
+
+    Yields:
+        Level sequences (new lists)
+    """
+    if m == 1:
+        yield [0]
+        return
+    layout: Optional[List[int]] = list(range(m // 2 + 1)) + list(range(1, (m + 1) // 2))
+    while layout is not None:
+        layout = _next_tree(layout)
+        if layout is not None:
+            yield layout
+            layout = _next_rooted_tree(layout)
+
+
+def _next_rooted_tree(predecessor: List[int], p: Optional[int] = None) -> Optional[List[int]]:
+    """Beyer-Hedetniemi successor as a new list, optionally changing from position p."""
+    result = list(predecessor)
+    return result if _successor(result, p) else None
+
+
+def _next_tree(candidate: List[int]) -> Optional[List[int]]:
+    """Return candidate if it is rooted at a center, else the next such candidate."""
+    left, rest = _split_tree(candidate)
+    left_height = max(left)
+    rest_height = max(rest)
+    valid = rest_height >= left_height
+    if valid and rest_height == left_height:
+        if len(left) > len(rest) or (len(left) == len(rest) and left > rest):
+            valid = False
+    if valid:
+        return candidate
+    p = len(left)
+    following = _next_rooted_tree(candidate, p)
+    if following is not None and candidate[p] > 2:
+        new_left, _ = _split_tree(following)
+        suffix = list(range(1, max(new_left) + 2))
+        following[-len(suffix):] = suffix
+    return following
+
+
+def _split_tree(layout: List[int]) -> Tuple[List[int], List[int]]:
+    """Split off the first subtree of the root: (its levels, the rest of the tree)."""
+    second = len(layout)
+    for i in range(2, len(layout)):
+        if layout[i] == 1:
+            second = i
+            break
+    left = [depth - 1 for depth in layout[1:second]]
+    rest = [0] + layout[second:]
+    return left, rest
+
+
+def sphere_clusters(n: int) -> Iterator[Tuple[List[int], int, int]]:
+    """
+    Enumerate the sphere clusters of n circles with their sizes.
+
+    Args:
+        n: Number of circles
+
+    Yields:
+        Tuple (levels, size, automorphisms) per free tree with n + 1 nodes:
+        its level sequence rooted at a center, the number of planar
+        topologies in its cluster and |Aut| of the free tree. The sizes sum
+        to CircleTopology.non_intersecting_circles(n).
+    """
+    for levels in free_trees(n + 1):
+        automorphisms, orbits = tree_symmetry(levels)
+        yield levels, orbits, automorphisms
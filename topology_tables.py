@@ -0,0 +1,10608 @@
+"""
+Precomputed Terms of the Counting Sequences
+
+Generated by build_tables.py (python -m build_tables --terms 1000); do
+not edit. See build_tables for the layout of the packed tables.
+"""
+
+TERMS = 1000
+
+TABLES = {
+    'catalan': (
+        '6AMAAAAAAAABAAAAAgAAAAMAAAAEAAAABQAAAAYAAAAHAAAACQAAAAsAAAANAAAADwAAABEAAAAU'
+        'AAAAFwAAABoAAAAdAAAAIQAAACUAAAApAAAALQAAADIAAAA3AAAAPAAAAEEAAABHAAAATQAAAFMA'
+        'AABZAAAAXwAAAGYAAABtAAAAdAAAAHsAAACDAAAAiwAAAJMAAACbAAAApAAAAK0AAAC2AAAAvwAA'
+        'AMkAAADTAAAA3QAAAOcAAADyAAAA/QAAAAgBAAATAQAAHwEAACsBAAA3AQAAQwEAAFABAABdAQAA'
+        'agEAAHcBAACFAQAAkwEAAKEBAACvAQAAvgEAAM0BAADcAQAA6wEAAPsBAAALAgAAGwIAACsCAAA7'
+        'AgAATAIAAF0CAABuAgAAfwIAAJECAACjAgAAtQIAAMcCAADaAgAA7QIAAAADAAATAwAAJwMAADsD'
+        'AABPAwAAYwMAAHgDAACNAwAAogMAALcDAADNAwAA4wMAAPkDAAAPBAAAJgQAAD0EAABUBAAAawQA'
+        'AIMEAACbBAAAswQAAMsEAADkBAAA/QQAABYFAAAvBQAASQUAAGMFAAB9BQAAlwUAALIFAADNBQAA'
+        '6AUAAAMGAAAfBgAAOwYAAFcGAABzBgAAkAYAAK0GAADKBgAA5wYAAAUHAAAjBwAAQQcAAF8HAAB+'
+        'BwAAnQcAALwHAADbBwAA+wcAABsIAAA7CAAAWwgAAHwIAACdCAAAvggAAN8IAAABCQAAIwkAAEUJ'
+        'AABnCQAAigkAAK0JAADQCQAA8wkAABcKAAA7CgAAXwoAAIMKAACoCgAAzQoAAPIKAAAXCwAAPQsA'
+        'AGMLAACJCwAArwsAANYLAAD9CwAAJAwAAEsMAABzDAAAmwwAAMMMAADrDAAAFA0AAD0NAABmDQAA'
+        'jw0AALkNAADjDQAADQ4AADcOAABiDgAAjQ4AALgOAADjDgAADg8AADoPAABmDwAAkg8AAL4PAADr'
+        'DwAAGBAAAEUQAAByEAAAoBAAAM4QAAD8EAAAKhEAAFkRAACIEQAAtxEAAOYRAAAWEgAARhIAAHYS'
+        'AACmEgAA1xIAAAgTAAA5EwAAahMAAJwTAADOEwAAABQAADIUAABlFAAAmBQAAMsUAAD+FAAAMhUA'
+        'AGYVAACaFQAAzhUAAAMWAAA4FgAAbRYAAKIWAADYFgAADhcAAEQXAAB6FwAAsRcAAOgXAAAfGAAA'
+        'VhgAAI4YAADGGAAA/hgAADYZAABvGQAAqBkAAOEZAAAaGgAAVBoAAI4aAADIGgAAAhsAAD0bAAB4'
+        'GwAAsxsAAO4bAAAqHAAAZhwAAKIcAADeHAAAGx0AAFgdAACVHQAA0h0AABAeAABOHgAAjB4AAMoe'
+        'AAAJHwAASB8AAIcfAADGHwAABiAAAEYgAACGIAAAxiAAAAchAABIIQAAiSEAAMohAAAMIgAATiIA'
+        'AJAiAADSIgAAFSMAAFgjAACbIwAA3iMAACIkAABmJAAAqiQAAO4kAAAzJQAAeCUAAL0lAAACJgAA'
+        'SCYAAI4mAADUJgAAGicAAGEnAACoJwAA7ycAADYoAAB+KAAAxigAAA4pAABWKQAAnykAAOgpAAAx'
+        'KgAAeioAAMQqAAAOKwAAWCsAAKIrAADtKwAAOCwAAIMsAADOLAAAGi0AAGYtAACyLQAA/i0AAEsu'
+        'AACYLgAA5S4AADIvAACALwAAzi8AABwwAABqMAAAuTAAAAgxAABXMQAApjEAAPYxAABGMgAAljIA'
+        'AOYyAAA3MwAAiDMAANkzAAAqNAAAfDQAAM40AAAgNQAAcjUAAMU1AAAYNgAAazYAAL42AAASNwAA'
+        'ZjcAALo3AAAOOAAAYzgAALg4AAANOQAAYjkAALg5AAAOOgAAZDoAALo6AAAROwAAaDsAAL87AAAW'
+        'PAAAbjwAAMY8AAAePQAAdj0AAM89AAAoPgAAgT4AANo+AAA0PwAAjj8AAOg/AABCQAAAnUAAAPhA'
+        'AABTQQAArkEAAApCAABmQgAAwkIAAB5DAAB7QwAA2EMAADVEAACSRAAA8EQAAE5FAACsRQAACkYA'
+        'AGlGAADIRgAAJ0cAAIZHAADmRwAARkgAAKZIAAAGSQAAZ0kAAMhJAAApSgAAikoAAOxKAABOSwAA'
+        'sEsAABJMAAB1TAAA2EwAADtNAACeTQAAAk4AAGZOAADKTgAALk8AAJNPAAD4TwAAXVAAAMJQAAAo'
+        'UQAAjlEAAPRRAABaUgAAwVIAAChTAACPUwAA9lMAAF5UAADGVAAALlUAAJZVAAD/VQAAaFYAANFW'
+        'AAA6VwAApFcAAA5YAAB4WAAA4lgAAE1ZAAC4WQAAI1oAAI5aAAD6WgAAZlsAANJbAAA+XAAAq1wA'
+        'ABhdAACFXQAA8l0AAF9eAADNXgAAO18AAKlfAAAXYAAAhmAAAPVgAABkYQAA02EAAENiAACzYgAA'
+        'I2MAAJNjAAAEZAAAdWQAAOZkAABXZQAAyWUAADtmAACtZgAAH2cAAJJnAAAFaAAAeGgAAOtoAABf'
+        'aQAA02kAAEdqAAC7agAAMGsAAKVrAAAabAAAj2wAAAVtAAB7bQAA8W0AAGduAADebgAAVW8AAMxv'
+        'AABDcAAAu3AAADNxAACrcQAAI3IAAJxyAAAVcwAAjnMAAAd0AACBdAAA+3QAAHV1AADvdQAAanYA'
+        'AOV2AABgdwAA23cAAFd4AADTeAAAT3kAAMt5AABIegAAxXoAAEJ7AAC/ewAAPXwAALt8AAA5fQAA'
+        't30AADZ+AAC1fgAANH8AALN/AAAzgAAAs4AAADOBAACzgQAANIIAALWCAAA2gwAAt4MAADmEAAC7'
+        'hAAAPYUAAL+FAABChgAAxYYAAEiHAADLhwAAT4gAANOIAABXiQAA24kAAGCKAADligAAaosAAO+L'
+        'AAB1jAAA+4wAAIGNAAAHjgAAjo4AABWPAACcjwAAI5AAAKuQAAAzkQAAu5EAAEOSAADMkgAAVZMA'
+        'AN6TAABnlAAA8ZQAAHuVAAAFlgAAj5YAABqXAACllwAAMJgAALuYAABHmQAA05kAAF+aAADrmgAA'
+        'eJsAAAWcAACSnAAAH50AAK2dAAA7ngAAyZ4AAFefAADmnwAAdaAAAAShAACToQAAI6IAALOiAABD'
+        'owAA06MAAGSkAAD1pAAAhqUAABemAACppgAAO6cAAM2nAABfqAAA8qgAAIWpAAAYqgAAq6oAAD+r'
+        'AADTqwAAZ6wAAPusAACQrQAAJa4AALquAABPrwAA5a8AAHuwAAARsQAAp7EAAD6yAADVsgAAbLMA'
+        'AAO0AACbtAAAM7UAAMu1AABjtgAA/LYAAJW3AAAuuAAAx7gAAGG5AAD7uQAAlboAAC+7AADKuwAA'
+        'ZbwAAAC9AACbvQAAN74AANO+AABvvwAAC8AAAKjAAABFwQAA4sEAAH/CAAAdwwAAu8MAAFnEAAD3'
+        'xAAAlsUAADXGAADUxgAAc8cAABPIAACzyAAAU8kAAPPJAACUygAANcsAANbLAAB3zAAAGc0AALvN'
+        'AABdzgAA/84AAKLPAABF0AAA6NAAAIvRAAAv0gAA09IAAHfTAAAb1AAAwNQAAGXVAAAK1gAAr9YA'
+        'AFXXAAD71wAAodgAAEfZAADu2QAAldoAADzbAADj2wAAi9wAADPdAADb3QAAg94AACzfAADV3wAA'
+        'fuAAACfhAADR4QAAe+IAACXjAADP4wAAeuQAACXlAADQ5QAAe+YAACfnAADT5wAAf+gAACvpAADY'
+        '6QAAheoAADLrAADf6wAAjewAADvtAADp7QAAl+4AAEbvAAD17wAApPAAAFPxAAAD8gAAs/IAAGPz'
+        'AAAT9AAAxPQAAHX1AAAm9gAA1/YAAIn3AAA7+AAA7fgAAJ/5AABS+gAABfsAALj7AABr/AAAH/0A'
+        'ANP9AACH/gAAO/8AAPD/AAClAAEAWgEBAA8CAQDFAgEAewMBADEEAQDnBAEAngUBAFUGAQAMBwEA'
+        'wwcBAHsIAQAzCQEA6wkBAKMKAQBcCwEAFQwBAM4MAQCHDQEAQQ4BAPsOAQC1DwEAbxABACoRAQDl'
+        'EQEAoBIBAFsTAQAXFAEA0xQBAI8VAQBLFgEACBcBAMUXAQCCGAEAPxkBAP0ZAQC7GgEAeRsBADcc'
+        'AQD2HAEAtR0BAHQeAQAzHwEA8x8BALMgAQBzIQEAMyIBAPQiAQC1IwEAdiQBADclAQD5JQEAuyYB'
+        'AH0nAQA/KAEAAikBAMUpAQCIKgEASysBAA8sAQDTLAEAly0BAFsuAQAgLwEA5S8BAKowAQBvMQEA'
+        'NTIBAPsyAQDBMwEAhzQBAE41AQAVNgEA3DYBAKM3AQBrOAEAMzkBAPs5AQDDOgEAjDsBAFU8AQAe'
+        'PQEA5z0BALE+AQB7PwEARUABAA9BAQDaQQEApUIBAHBDAQA7RAEAB0UBANNFAQCfRgEAa0cBADhI'
+        'AQAFSQEA0kkBAJ9KAQBtSwEAO0wBAAlNAQDXTQEApk4BAHVPAQBEUAEAE1EBAONRAQCzUgEAg1MB'
+        'AFNUAQAkVQEA9VUBAMZWAQCXVwEAaVgBADtZAQANWgEA31oBALJbAQCFXAEAWF0BACteAQD/XgEA'
+        '018BAKdgAQB7YQEAUGIBACVjAQD6YwEAz2QBAKVlAQB7ZgEAUWcBACdoAQD+aAEA1WkBAKxqAQCD'
+        'awEAW2wBADNtAQALbgEA424BALxvAQCVcAEAbnEBAEdyAQAhcwEA+3MBANV0AQCvdQEAinYBAGV3'
+        'AQBAeAEAG3kBAPd5AQDTegEAr3sBAIt8AQBofQEARX4BACJ/AQD/fwEA3YABALuBAQCZggEAd4MB'
+        'AFaEAQA1hQEAFIYBAPOGAQDThwEAs4gBAJOJAQBzigEAVIsBADWMAQAWjQEA940BANmOAQC7jwEA'
+        'nZABAH+RAQBikgEARZMBACiUAQALlQEA75UBANOWAQC3lwEAm5gBAICZAQBlmgEASpsBAC+cAQAV'
+        'nQEA+50BAOGeAQDHnwEArqABAJWhAQB8ogEAY6MBAEukAQAzpQEAG6YBAAOnAQDspwEA1agBAL6p'
+        'AQCnqgEAkasBAHusAQBlrQEAT64BADqvAQAlsAEAELEBAPuxAQDnsgEA07MBAL+0AQCrtQEAmLYB'
+        'AIW3AQByuAEAX7kBAE26AQA7uwEAKbwBABe9AQAGvgEA9b4BAOS/AQDTwAEAw8EBALPCAQCjwwEA'
+        'k8QBAITFAQB1xgEAZscBAFfIAQBJyQEAO8oBAC3LAQAfzAEAEs0BAAXOAQD4zgEA688BAN/QAQDT'
+        '0QEAx9IBALvTAQCw1AEApdUBAJrWAQCP1wEAhdgBAHvZAQBx2gEAZ9sBAF7cAQBV3QEATN4BAEPf'
+        'AQA74AEAM+EBACviAQAj4wEAAQECBQ4qhK0BlgX+EpxBouWMLAP0VQsIzyh97pPmgxsC9ji6Byww'
+        'eBzWS1ZpZIdAhwGMm02yBTgkyUwV0kfy3098S0dULAGskpYCbAQYKo57tBCkMZqKPT/YbPma4O9o'
+        'ak2ziI8DELZHw7WNDR1mgfhErDOGEe4R8EvFpugz6pVe8gLM2ZqWTChIC47tppYlRT8rdKSAJkS9'
+        '+aUc8Y9QEw2yfQJYnyki1M+slAlGclNQiobM4iQU5PxzU5xSJY4EAvTjQe3QRiQCyAeoHJ86UJpE'
+        'CJxM5qgJEZPI8R8oFxSNWLlJw4R7WEN6p1bYopr23QFw9HHEOa06K9Y6BzKTOdk/X4Pn/QMc3CX0'
+        'KksTDaHDoWy8NgU25iGZj+J9pQH4TCM79t2sWjNhZAacgzBIi0ru86m01BhoymBXOjCepSAyg2B4'
+        'aHj+qYK8Lg2KU3cBMAaKvZ6olxcAUVy0BYRzIvRp0GmACan5NBY4IKEiqkZLo+GEe31WGC5i1jXn'
+        'oGoxim4DUQGws2Q/8FnB4HZX9MchBci8CMT1EfLSgrsFvwMUsDh639OAhsFaFnsCF07QDt26MmKZ'
+        '2tWpx2zNMAEgzEbBcH97z3MpbVMupgRdjfxy0Gl6Yuxp4vUkKRLGEJBydR8tKr/o6vts90YGE9a/'
+        'Vu/epF+8Z2QeahUBDOeJezhMx9gOwqiypNA8BL74IsWvMaL1G/dmQoSKkxAUt321/UdZJVfoku0m'
+        'Kd1AvKCb+Qw3QHxGz5Yl8Ffl/ZiO3yeU6S2XF3AqCgqkIOIDfu6A8S4oybqx4dCnfIKqNQ+kMhyW'
+        'D+CjjjZtVUu+CaOWOxQ8MFMoZ8eWPZcJ4ohdr4Xp6FHHjbJMfox26t1CYI00aJMDbDovpa5H1EH5'
+        '0wdXL3v2WwUOCA3/VSGesb8aKPBvE3wgv/02+LxeUSC7fVKQTiS3rqswFbzXsALIReO9GmTL3F2H'
+        'GMIMy41OAyakStjowrW1BGlQE20Tkla5+gz0ekEYpRnAC/ZGDNppADSpxPQyVNYsqhHumlMw8UI/'
+        'SF8d3ZMYyChWbws5iIUEM0Hudn5/CjBU6xEDVIl+0U3gnkj/thWK3vSWcziKDww4tW924O8V2KVi'
+        'ZOvic5ksODdkL+jxwq2zN1bIDtfjPcmdGcfcbUK6kP0Pq7CCzmtdglO+KAtTIPFFMdwCPDzzFAg8'
+        'g/N64/Z398hdVosB2T4LSCmuqCJfQ8b0dTJCV0QJeUakTzks6CrP7CFlb6WgesZqish5QiaGffKt'
+        'UOzGGbhEPQxZpzx0uJBBzSiR4lGsAvisNajquiiwTS4bsyNK8ZZ5ql+mhArQCw3YBo2oQULX5uEY'
+        'bhBznHVX4WQpsOctN5iSvbAPNLhCQbzTACGI1R/vouDYQJs5CxAxZrco1vg1Xy6auVAccoEC8lVP'
+        '0zIsL2EiUkDLg+SWFs/afU+x3QmchDD+1+LOdiBj9Q0kT+vcsP7sxIraJlxogKqWaPXTIcX6NmRH'
+        'qf0Goh1BMgmZuAe0vio3mK83lKUWwSjRFUp+fOFo3loCLBS7ftbtCmfbQgemc5ujnUI5if2STUcJ'
+        'SEDAn7I5W2N3mok1633in+r1vmDgGpAkWP1AG95bOi18FeK0U//WKhWr/zFW0xmQ8K/9tZpsTq3G'
+        'Rb6e16iD5Fr5I7tYYQI4AvwcKGHEBP95AFgfHo0eQiwwDf+S7HVEvwhIcjBTewudeptpvQHGf9G1'
+        'FZMDHyGPHH0iqMJx52N/LO2GLHKE3Pc+N7YTK0WMaa8AiNAe7uatosJycWXhYkviynfHQXV8kkBn'
+        'YhgCGF1y8q2BcbbNuiPNRSfZrcvYI3nsDAm9QwiQBa56PZijwU60M+wCDmKdZ6IVlUT4sn2aIHDZ'
+        'TPvRmU0Fx7Q7rdNlOIQImHpj21Vus6KAYOT3FmaPaeszKrudeq19HkvigjWLZwbElvsBRCXJ4zIo'
+        '5XexD5536B554cOqLfPpauLXKdMH+O/VGu2gxSrcVkkV5yM0WktgNbI3Wy6ISuIeuMDFuhPMrfma'
+        '3WSXuI1U3VEQFnyYWvpBC+l5cBz902qZgTD7MEk0Z32ZBSRbKM/11K/B4EfhAfjMtuxRWRHw1pCc'
+        'RVUx1b3zyG6XYHnDx7A6bAdQVwaTfhi0mUORvwU9vKW/RWjjGpFiOKUpeE8dcDqoXnqd8jfOpU/r'
+        'vPjtNV1WUtKTfE8KX1jAc2ALWhnSa13UiF/i/S5TQIM85UBj+pXfKh9QK8kBiEa9fRedCnpc+Qqe'
+        '+a7XbBUjDQidw4wce3zRDQdwJRica1fogl5emVCn3wcvg2QYpV8iraXZf7rdGzAvcLjKTMgRGSVN'
+        '5jxW+efoiI4SfhZYn6svExhuYAW1Cu8iQ0aC3f50n9FPpwjSqevSimg9KYR3AbMBkN/8X8kB4PxI'
+        'SpRW3cxHGb/WN4JiXiViUMxo+bYGYG1q/neYLQqPz2q2FL3FiICer1qHYDE8AL/hYokaoAW9+UcF'
+        'qAPglYEyp0B7liAdtvgWomGM6PLpDOJoQBjjuDhBpqcMoTQQqw1WlePTTPFs3fq115cJspOeAd27'
+        '4TrUOb0GpgwQPAguWKqfteOpUrNju0DszdvfZgZGn2Sb/7SenXJ5vMkCM5ISDM481cPcMDhZfP5k'
+        'RU8ZxvNGbr+Esk/8rIqj4/xF06nvTn45Esm2o6yPfwoSZIwp1L2ol3nXiUBTQNQYW5vGhKdqNRfF'
+        '0ki6yJLRsosBHupp10kGG9QJxXdbRz/olMt1lmsN8zkq2ppfZ8jOHAZUxtjvDOFquCr0uFDktncL'
+        'Dk1mkls+fRrxox/eXaMsGPyZf+IjD3WYG1O1IAXb0ThpON1G6HDYURUlfRoMc51fGGFIMHd66zh+'
+        'X+9k24+1KupQryNHaZwhIa+ZkDXpNXoBrhbiYDlohbsclFhenAASR494Zol3oIxbjrgjmsgWKNgF'
+        'ROCUl1pxBrliYCaTeTqOzNPenDsNhtTSDYZRzMHtGR8XtJjSCUUDRpmG4fAvRTUGui/32+u52khN'
+        'FaP0rUyLDXtbKJemQJAon6IfIpbKhb6tQfJHCr87wfcM1yEMv8I3UflpAYy8zYqoaQ+zt3+4i+X8'
+        'f53Je3U5OaF8cSMubs9A9uVhmAXId6tmPpeZkzPeXP238//A962ECQ6vI/KsermsuYfEkyQWOL3u'
+        'ELYnFBKoiObNZM//3iM93qNtuEgj1KtYCdRAocqiVzBRRzj2DfiyjFsRrqLyo3KBSz82FurrEUSv'
+        'tnyJeJ7Y3VoBXqFvSZmMwJm3X6+bbqBzEIs1ZUHt00UcGMv94spHc3kDXQWEJta/5m0tZFL/KDxv'
+        'aaa16OpZjignS5o4QNnaHWhAbD07FeRqiyHNH0DdpKVRO3K2YU2n+WPfQRJCPC3b62ztFjf9lw1U'
+        'SGPUsyGDr9mmF8tdr/E+GAQw2iD1V9EiESXFdbbNGA8byEwBpAXCCSjhkCY+AAW8wHfkE3GiIahD'
+        '3Omv0bgrM2fi/VOwoiUFGKouWkoDEXhbcjQhJkhaFFDqDB5skdFnK/KbRPDG/ACde2EUiMq4/uiH'
+        'nzdqh3Os3nmOeczx/3ZkKx+byotpLtbqOrxtO7VQ0DmRgnqeRgNEZq7p61USWBDGJpUau8fjQGN+'
+        '4BQc8HzU858/AYx8HYXDvTyGPKmNwo5N6ibpnT7BtsbdDCbuN0Mqio51v+rh8QSoR/LDYLMOc6n4'
+        'EoBER+FYfXtwBwEECkcoluy5/OGEuFoz45UTyC99hiXXzy4kkyY3vHBUd3/iO3duNNtlVvxf/oHz'
+        'KPKBKDSUTRCw4gVHm2DkmtFyk+niRyu6t7bRCWFfVkwrp++VfYRanGsIUDMBGJKfgw8s4f4MUqll'
+        '2MecITr/yb4wT9xprqE9vyDK0Rf/vUhuwQSQtsn6+LkTt7+e1MtSwSNZ85Iw5X9ifL1F56WqSPvr'
+        '28neeTLXEvBUmj95BNOKBLkzqcng7l0lYNp79z6vWQeeKegfLgjPEvEZoaVKYFVom770K3g99a8I'
+        'H8Mc6HtRChvGRkfXz3siH05uAwRZ0yxmxScB5mvNRzNgYV+QCAYsXvjx+np88pcKoj34zT2SjhVl'
+        'GlOqOKsx/pMEtLaAAUyQc+yZl2r0GAvCzXxsTl2sKh/WirCnh+TcHWmZ2M+GSyQSdAMkp0lYDKkM'
+        '1NVWfyK1l+6tbxyYshw0JrJMsXZFnI0wuSRPK+VH6IEavEyTo+/e7t87BW7lyztWnv9Haq3GA+5m'
+        'ojS4tswhiZyRL+8cASTw5XJrV+8fTvRObVkIOUTaCgDyxf/zhtDUFNvW00r2BRNKEhdQaQSYkkl4'
+        'yupS4OH2sQmDAHd5XCaHQY7QvdVDrSgxdBTsPyomVAd8L3wRSLpLyuEXWFqkQbvDOFI32Oa2FzUb'
+        'SqMUXXqFtojP8chpLtJdvfNORVCuzr/8m1gqqjCEsNH6nYjWy4IaptoVMExNSIKVpk7idojdK0xW'
+        'vhIBdA5h+Kn8TAN+5cL7LNmWnVs69J9bx5++2w16RPU4k9z7XHfSZGgpQQTYPeO4Lrb9nF2SlBbM'
+        'FY5bevMQpscOUjA1Uqrv0xZAh4L9joYWgfrdEPi7TiWhJjAyf3e5jI96WsiQBBM+yWpahnjQLbC0'
+        'jXNR1ar3kJvPg99CcJhgqgXh0CBbuiLU4wDgHhoS9kZhsANztfIcknvuPqqMOVgfx/NfJQkByK+o'
+        'F8a3fdKqg6EKsW5aA69T/8j47edZXsL1dStqiOSbru+oBhGvVRsEsD/MzI0JzO9WHQdYywlGoYb0'
+        'YQJt4z7lYq6dJkwhDkwX7tl7OX1X4EgQUG9EWP2GrSndWUgfmZnpOAS43I0IfVrlL8WLHVqnfszg'
+        'V4xv/nRAwJNAIGNex0vxaYyBSxAtxNF56s4SEvipz4/vDKkb2nkVJZpPixk7hpJ3MxgAAXw9OeWA'
+        'y69S0J+g1S83AD+ArUeJk1daTRPKim/9+vUOUE4FtkgfHcyl9wOI/MiI9rEl5DWYHdolq3G0MOTw'
+        'jIHdExDTP4ovB57p9Y8cSfDNq/VuKbwPyELVi5KClQT+mkGM6V78IWUkToV95B0JdoF9Mq+j+sBX'
+        '5GmwM9193d1oPpDm0sqW41OUA75VNpfmemTyHcw4KAiWoN9LoAigWIxXTJIT6OOq9ODti/cICrxX'
+        'CUvVQx/YD+BoTrSwdCGhNkoPQkEqYATvnHBofdlM+H7/xw64Ue/VA7DOyrrw4ji4Np2dKUsBx/mb'
+        'K7kBFAS0aPWFq3E+fMRwtoWFhrsCh7JkMDcPkDkLbMNAMwLLXjNn25+4aMpVAKoOIcp6v1lA3EDn'
+        'E1p/80lIte6K3eNXXDyglO0ycHYj/Bw5ql6lLiwEDs6gptn8o1xc1UrfN6bd2tuCfZjC7WEONL12'
+        '7ziTLtXNYx0rl2J8hYqMxU1IdNE+STZpZNWW+WdH73SvYoR3sPv/13s19Au2AxAHLXOGfygJH8/1'
+        '0avBRRocay5T9pQu5Dm+PflIqqPz25RSE0ZJc9JJ3F+5DlBFJm702EXicsq+9pCEDKLzhyOtG5Gw'
+        '02mHJsQIMMMIs5DkM7sioLZetOdrOqDDOsjfA1AUdzaVQDTiOTJZMQj9DeR6KPrywU4dLIdZXkZY'
+        '+Pmc9uATdMDP5/AouFMI/6Qy+QCMfSb8k8RZjQIKARweCFPMuqKEZcksjPZ+u1d0rPxDvA7ZlwOg'
+        'bQP/XUkxVzrbvZQORs26hNd3F4KHOmGCVyogwQzWeLqpbUEjK+E36R+kMEIOYNMCVdNjkA47HZNL'
+        'w/3SdpW1ZzeAAW+6xCqVOY3sv9TTe0/jyUThaTT1qH2VOMBxN7PIglokvsH49DXIWq+1HwR2tNWx'
+        'gODFJx5u6KdNgrw0mqwTzRihr/3rjuByC0SHDDdHoOpAOySWSvAP2V1gNCTIwf5S2a0HdWIyJCVM'
+        'AQQV5m1aB9GWODd7AxyqmolVNy0zJaJS608xWq27wkZDouKqh/DREuw7rUCeawYdZtVSmKIGL6IZ'
+        'KNENnDkE8Ok/6P8xJ5duZ0JrDBsS5Dcyo2HDstd8efCs40nd1BYpP1sy9F61JN861zY4wdHvx3dy'
+        'CyF4d9ZHWoKj2QjY3WSfvrh6g7CD+Ushr9hQbg2kzIw3pKBWjfGs2cwGnEd6ClbC1lwjW/O5Rj1/'
+        'cR03mI0JS9/aEqqSrZvBPDH3FaActLJCACGc6AlgAwiZ+9lTzb7QIWZLPIrf4I1AjbSdc1b88blb'
+        'KiHi6AUhZkWH/UAzaGp8fKOjw9ZlDRjMBSuD4ca4drS+giyePlI+QNy30uKj38oWaosFy2zYRzoR'
+        'evK7+vMr7kpT0msvNXCtuz661kP3cgvIO2vmLxjJPIlR3F3j9TmPdTJjGipJm5esfQU2uvHhVD9o'
+        'ZCsj04xw+MrJzOFfsTexPBULOdMyrAT8Yiqy+yBkmmmjY/H2POkLuOeT2zK0L/FLliQ3RgMojQAi'
+        'jPdK70VEhg9vDZZG/w7dIVuRfqJJPXQ0aiSYZeq0e7SygIISaFIC+M4a1/8MiO4TH9GwCP0IVgMQ'
+        'nUlWQwdfMyuDzJ2CVPOkNTt3endy/rr8VT5XrC1He+9Ep4OcM5DqNUrnkZvKhIVlDr/nXCh6cKwR'
+        'RC1KxqJxdHv7N1W4NrOtIf0ue4taNgWugBeK68x4QQMBvCzijdpGwE8rmCWCXYL/GGFZ+bhv//Mt'
+        'DCIWCR3PT5x0HGnAoyqNSdnkOqctA9CZW6tKCqoRZeJcd7heNkiCkey7w+6HrIT3UFFd2H92xLX/'
+        'HXWR1LSRoNETOHZ5zJ4MMMYP6eJ6H/TRSXiF11LkBeXbBA1+HDeZNpvbnhFqejf9V6pvkEaALIje'
+        '8M8cDA8YHTLgB2AFLL9mViCyw27D/mz9LIPQy5deBz9TglUwA852zXYpG9k5i+5tOoaiFB2jo4QA'
+        'x7yBk0bxBVgImdTcF8iu2tCI4SVYuJLpMmMvLNFCaFAX5LUVQ+PoK832GRlomHHihEQWAwhJkzqj'
+        'j45JXTxIszu8GRAIw5LjtL5OAT6hXuD7SzSsR0+zji/KOCauoK9SftUeLWJCDMgEqF1c2y4Ol6Z2'
+        'GO3c6cp3pxMaPKxO2Y+zo5/v63fQ2jqcYvcie5DJAfRs2Nrgq92vMJAQBtXJrqYMGq+3b/bnztWG'
+        'UcEvUrO81MYnLwkP4lz0bwTnn/N/yV+A0GYmNyGrdwpdwchBk79W6ybDF15exVJfFuJw6tHVSFS4'
+        'i30Pl/bC9RnlQ7jzxUIINtgaPEaRL26g0TD7/wIwz5u7TZgjGapRuxqqnj+tD+SbsqYGHZfO8bwi'
+        'dqhG3YuMHsr6jLI25VoT7rx0Hw6lSuoLEND8JDfGj4AKbacR3SRtk5tXO0RmoAeU8eGt6bqaZ022'
+        'GEcN/Kmvz9MqMP73skq55aRTL6AJmu6b7xpf78hrhjhGUp9InMXImYx92IJii/O9VIEtABD5FifC'
+        '0pWPCsqtCAA3dyx3/LtYbcfzjqlVnSheuodgs7+xrmUtiA3SuU1rjqIV1p76QuRUXWLiLQXM1uI3'
+        '6z4H/vVFErnqAtCungtnWJYffwnpQCKyv0lcNDBg10tZTCdME3FFKldunHRJuCMytvdZu6c4jAdG'
+        'Yte5PpYLEOP5EW9TyHh1lu3Z//t115Faqm2nAI0jbSAuJnTGQnkPTnEUqt58HjuyCBCZr8iPUB9X'
+        'By4gt+dDx/Nh/3revWHxm6O9ANHH8j1MfRK1SMzWpqC/7ytZOVgCXIpS2WHOdzL1ieoAsYfatrAR'
+        'zn9IjuR4p8BDEo7dMzeaTt24CHfomm1BIiIZr98XXbgNBnkCIXQ8wevpJ7koCuoneG3WAiDmQleX'
+        'wpjMcIE7pUQKLZFciXFpWyVIB781pmpDptfTRa9j0fbe7jdeXLWy0gXe+LiJCv1FC+C0EOXOc9ss'
+        'E73Qx7Yvnk7sZqdkA7cXD0OXfw+kjcCVB9Tz5WVFoLtTphwS8tEzYLWfPvTJLMCooSWUUwYGqPLF'
+        'IOUFDJOovWcfvV9AfJbhT2KIIVMAwDVvp+gcSYPHCOCU1yBESASGuFDzscTgFnoTbMtOacakzdky'
+        'G3/7nMdsPzMb6QU+VHTyArjcatyJq27HxCJ0R4MffUKzAzEClAcJwwJ4471V2U3/iifhh26bjIBw'
+        'Q1uGyyvxSUyBB2oB0fNETiqYKqYJ7IEZ26fgJ/H9g3jhAZ5sSfkK+AiIhjQjOEEe6RvQ0UD6k/fk'
+        '0ToWNKkzsJzS/tOEhczpq3lrDeeJgH+fwFyuB83Vdpi+fZCaK/A3ynD6rxDfHE0RcdWiEGeoGZKq'
+        'FPza7CzvwEVSfpbTuaeVTmGhZ24/ocHBxeuIfYJ1V0A2Q62YPMWXizT4Tcr1WCZQAPjB9GWVEW1w'
+        '306eSjv6K4rIyKXJHAlGATBEEF+cI/CNrUMNHTPymn2wAhCeUOunSmjvb/2LV5KS9uey3G/ZCpLT'
+        'DfBIWpbJZG2LV7kDzXkSBPOFZIBnGmTxH0JCPjJs7K8KMFdxoNmM2kXBEuUW/HIop1fc+mhVddk/'
+        '5Hr3KElJOL/GbHeiwswzmT6NPHOV0LoG2L01w3pSeCrgxLtLtzlXeeW+c6cl/sHkBVvASoV48q0g'
+        'x2k46h82BUsr/36AApLE+LJXNORGGBT6pbcbCeTGqLjxUducMku4goo8TCdeh1F2EcNFwpwDW1xX'
+        '2XGpB4ESVMRSP/pU2h53Sc8NNzQIx4u9OES6JL6eAhBhkPeA7ujsp4x1mOPLZVPXdqUZ+YTYonXN'
+        'l1bjqCCp2RIpqNg8SJg/i8VAAS6LST92Ast62rJpCtBTcnVcFvPUlDU8Sm7ORWyZW3cD3jdwOOeF'
+        'oyNgFQUqBe+2w3DKMvREs4A8HzpkyBXjrbCSfnFiKaAiem3QAmO8/H8iKDqTeMjbOMw+lSGn8HEj'
+        '7oTYIkQwQTN34NR8lPsE2w9NED1cGyAsRo6K5EZ7pLC9T0LHUu1uK2lmRMIQXVfNUg3ZzPy68oV7'
+        'pfqUywHCfqJxWRGvVCCLALJqor5WNEdhg0/7bZW+jQIgYP/JB5qYIASiJQbaRZ/ZRmZInE6VFF0h'
+        'CNkUuxXDJjLA+hjAgBlg+ELAbVsZQoJycl52dZ5obSYK4CUxbpe+RDZxQx9bbUtDyI3BrVcaPi3K'
+        'saWliGaBQYCCIDJwlouSzUZExDs+a0lGnjQfCtW88zNYKMDG5w5rPi85tiQ+1JZVNnmMT57lxRNO'
+        'tZUKBQ6ucCNO8W1CpAW1Z1Of1kMlIcb1ARmU7W6UDL2GXaAItj9btjGCVlQ4qos3lNFhzhUi12Vb'
+        'FhcTClQR59/MyTioIaApCYnrUqjtwMMmZAF9+YnSmqtixHN9AvBQDwpgjrBl/L77Wvev07f14yes'
+        'Cd5pIlDo0yHD28/5GD1aeYOu7ExV9rQ/UBUFMH7b1Yfg+nJN8OUJcE4yhwsles9heginS1yi2IiQ'
+        'Z/Z47wHoe2S4+FWJ45QfZQUAf7Fgc8c4KKBc4Hs3btSVAk5TcgfuWCfgwjmLFPJ2Msew0va6HH8U'
+        '+m3R7GvUbLACc6oCggXhT6BPsB90DStyS2P45GkjNenYjsixty5eQAFrnPBgoGyM29gi3UDpYz/I'
+        'rVWQZxIQmKSwGX5ktndnC4lS6G6dSwYBaJF52s5Eq59w5mqDjFOGtfwBW9NtAqBY7MhRuj2y8He6'
+        'U6b6QKn0iTp2LNA/3eo7NRGVYVzZciKPiA3VSKQCWJOGQyn4p7gQ3BaMQxLG9BKoCeA6O11kQosP'
+        'J5jSfptnt09D7CBy9d1OmyI5fPnyg3UbvGnCtJn3eC9PtZTYfOKu/1q/AN53V1t3bwBkJsBSPBE7'
+        'LKrkj/1ZwyRNay5xyyonEva2cIUmElezD8+bHZ2mBwwkdV+8eB1C0ceoig1WDUZGThp5GUWhmBCL'
+        'hoSgSHs4gDx0ITFiQ09MdzQLRBBsqRbXPdxjXfs7RmS1R/4EO1J5bv1KyoUOAFv9k9hlfcXKNcLT'
+        'XgLg3l2Nr0IS897XMLD0LDo+TrUd+EJW62PSJUnwZHagqiYy0aTB6xgobQfajC34+PZKpVVBfO/i'
+        'Yw23r2wJYCodCZHwVmz1ID+wxDO4WZfvmLMcMhIvYZbtUmbI9BKoJ3sWXql7zFPqDtx/evbVdfEQ'
+        'O/bYHeGlUNd4JcCCKe2zX7Cqx9tZ2gPXJa26I8lTFvJmlCRhOzCorq7BtDifmMKyhUVRKWfn492Y'
+        'S2ID/vFnHlomsqgN/pQgV7ecV3AGfL6gukXMjZz50z4+0xskjeyv3RwV8lRnlIUkPHdz8egyhvNK'
+        'JEdyxzgfuN/shGApQz69EWxQAsDKcN3by9R7pf3dSNo1AAmu7XAbQclhmhf62PWMlIHGnV1XmEh8'
+        'sou6lVk+j34+CnNNDRI9plkkKH+YozMJQKtV1zN1dHPICJsPbntTaOQVRoFRp+1rpvr3gjAO6d4y'
+        '7R4LUX2nwGLUMRr71CLcfve9wugFKmAAKkLpliSAMNzul1wUxcsB7RwrRZpfqvNYTXe6Zea256zq'
+        'w49xggN8/O/tjiQN5qZHhuxRWmjsmynN2XH+F5s9Kz9/kd2Y1ys0+LJNJHkGcQ13K4DzuJNpfocw'
+        'UG2RMxOxlbf0JQVSLF5gQ9Cu7fiNxin3Fgp21xm80Gm9+vIxAZRCAkb8t07455KdUE6JrvpMOHWk'
+        'twR3MrgEHUlJlRLYwCbOuNSbU6EW5IhahT+IIqQUmq2Omo9f73+sU7G2Ds78CEblvd+lBWATgq7O'
+        '2erM6+8WdbmjzjVaeUa4S5cxWHxdJrNr1V0q/NICuW3QygPb1XauYJQ0lBSi2+ojara9I4xOk4tH'
+        'e54cv8qXlMaQuNzOw82kQBSgNXKo/+iJxCynkRMV3jgUKugmvpJXjuYYco/LEKRN/+4Pisw8ReMi'
+        'jt6YGOrDytQwbp6eI3zR6WVIppzC1f3k7FdBV7DVf5TpWCz9AGxQKWQwds/5fO/ou+kRsX5GOkbF'
+        'd6t5i9pDNQLUzC8zb/H4zZhb9RdA1AvWV2AoljqZLRKwcxEwQDculS8gFcnTppKCvUuUELyp9mOq'
+        'ZFDg/dtggNNIzyTMEMgIfDSPIWo3rR2kslRd6yp/n/uGzeVCktZbYpVoiknEjsb7AKp3be8pDThY'
+        'C+jtUsfZcoxH9RBlpHs7CB3JsMfsIhhW+ODSFYaIk1X2DRcKORGUkAciLBDPxnH9woki13/40nSY'
+        'DHawhcDAGcCfogczYEU6BOIO/D5HrpDdH+Ml54oO4pVEtXnPJP9fn1Rnf67+qYpv5CNGoPnVtQEB'
+        '1dFwudKKGLKP5s1aJ0/TzEaB+TKrinkxO1MAJ7WWpeH1bXQoAoQFOwTsBCLTZ4lnVeb1Ysw72kOV'
+        'zFSBXEoKAD2jsk/MpP0dksjUpz5PgvG0pJ/1GflTAjBklqMao20JjqSQT5UI9Hu+X2f+KKQ+Q5Bw'
+        'jPgZj1uO/JZKBKbdPodDYgag+aPxVKm4nuASY2mDwhrc/U//ckIJcKnJbXdcRisvfQeuIyKo9WL7'
+        'E2RVm5HamcJwgxyYv1hOXqSmGE8L6ZBHMw86o8zHsnzQi/rRwpQ2npbGGKSs/32pYkqPFMZfpgCT'
+        'aFLKh8wCLE1T83fHIACO0OTzZdUUStRna0oybiOb5uyMukCJzAO0S1K9y/bFo82qdZ9LQLiTLKIZ'
+        'Yxsg5Ci4v3LVBh8cAki5tUsRxIErJC/fI6KsHJq6m9KMuLe6mkQ+RyWb7pWL304pe5O/6B98Tysi'
+        'XFH7hJVLihntLC1PF9WHmeyh/m9kCLhBOT5hg1lMUYiObPxNW7pd/y6L+rKLeE/so0SLdmWolbxl'
+        'vLakxQEyl6ZD4Cy6J7k9SGtOTE3rjz4LuOurwQFiITDWSMjYSmA18Ylgpq+lheFA8If4EejScyUh'
+        'vq+31KB/lG/uKI7N9n80O55I8Ga0xWSRxhB6H8JWg6n6qtxnJNHKhI7bP6TpVuoK51GLqstnd9vF'
+        'KoZeKdsIOHHa296HqMGKgSFa6r4Acua/5+0v1nPA3TDVBs6BCJex5nh/goJ31mE9EAIkXnFuoZfL'
+        'JXjS1SejZC+y6/ggOjE1ye+MtoZJxT7m7K7ZUrKoFhePy9fnnHiGHBgDQlZVfYFsOwYcVV4xV1J0'
+        'WTUIhATfaNQ1iYU5m1ISXmV3n6k7AgdBg3QVR5z/R0MOBLRWhxGRpsRORgb9849xOgP7kKMzyW/w'
+        'x5+3T1Y98Wd0/WGnIIiecXUekwqPzfkNipqOFiDv8iK69LtFp+ag02kcd3czOiq5bmPXF5mkCBY3'
+        '5k6NiMrMC+KRu0xKpw1Oafnn+QEl54HEqHvp4idcKNO6Qn73buoV+vLYrP+BRzV0yL6OHXC/zP0n'
+        'Db5vXgthFLMwNFyNU9HXuXFnHTjYvdZiqwz8JQnso8kEAtjK4SbjCUUqIsS8mxW+7LuDWnRQ9xPM'
+        'yZdASQLSzBu6RvIsPHf0SLDPPeCbQIk+Cgyq/lgn1Gx3VOlrAUlkYY7o9AcIyEBUcJZerfP7D5HU'
+        '7rHSgEGJx/15fRkUiHouZVCS+jr4/GqpPzmLxqi+uja5SK2psjm6qyYc9f8hf0KKW1BicRp08x9Q'
+        'VNNxCVoaU6iBwo83A1Q6g+VFZRyQ/3BUQhnE53Qh2u7osUwTIxznVzDOG9MbfVv4kpo3ELLqV9Qa'
+        'OsvUwwV2cekdf6w35PkLKLA0mGb1e/jKfQNr46IA5ixfjmkCnyeE97sPDmboyIyLSaT+w0+napzo'
+        'DHI2TzwuJ0yYJFFwVPyBu1MkUr75AWgHG31k5iLr1JvD+wF/ecqzqETcTZcAO/MuIYS0Neh4hCBa'
+        'pEkg7OY0eEaJsBjAlfBu5i2hI0wx0+ZNdTieVNDpyizcB4iwwvG19n9FdXGSw+Hz3aJ568Te+ShJ'
+        'tGUXF4BLYwN/4xn/UQR7q6Ep6eFzUSaly+hR/PehZ2UQXmU7a/Z6l44fPeNFH5D1H2Eu41QpBjmg'
+        '39ERMdLuI7QdSzhkUcf3bYS543Ex3kuoqgyFxK3nd5m+YxTw/fUCN7mUarDBEsWSX3ZPvec3gdBt'
+        'fFgFpQDi7D2dVwNCLAsheycAoXszepsrEyL8TAII5qIF0Akj7wiwdFfnZ9KW2JwlWcQCLHGJUbEU'
+        '6wjsGp/c/WzVO0oW7wEQ4mq0zic/qkGJelSg0R/A7d5n4mSzf0HIANRJSJNP68/Q8UCHJYJOxh6e'
+        'iOSdEUVuM7eJAhw4J7K3X4NjIhV5yrLm7LEHcNn5Krk9c3rhm7x1RtpRF+1mi+UV4Sii0TiKBUeM'
+        'cGu66qpmOqeYNvr1B629ifXVYEZWmEGTXIgDp3438Ac7keqP3V+eHmCyOKm4V+1MPqa7++lQF3M7'
+        'vde2/+eou8nLq0qh8HzEYZJR/VbDARXo+laALsDjygn3F8rle9J/bZFmZPluB4s4HyOh1Xkem7F2'
+        'uRcbkoIFsLlNx0yP/CDl3H5wZWU98CB5LCgxs8/rqXqfrkF+uxtaCbnsVPdWXH8JrTegDFnNgl9A'
+        'lI3+kMHbu8zkAUQEku031CXLx/+YeKBaYa3IzAMp9sSxFRWcZw2Zazn20SLqH6X2+NLzYRpFqsfe'
+        'lKNW3+7j2mNnUvndsyKS++S1PItIIokHBGtvR4amFZStr6XDsW9O3LL74mFrkrq86+bE1y3K6cN9'
+        '9E6iQfWJZYVLjOHmROmmFAucvTLPa5uzPWyK2RV45xa5O2Cf/B0I+UG9MIRTyY1uSWTDIDi5qiNy'
+        'jTTyFSlD1nML+7q8fxH/LOpeSegCYvoLsf0EuCY1QTCz/kqyNTwyYtKT+vIHRjpXmTVUd/RC+pwS'
+        'nFHumYjFbcpUUV8g8LnlWUe7mrr+Wj1XbTM9+tpJb20L9M8Vyu4E4Bp65Rc4ouikk2hJTpMkohC0'
+        '1ojJL/5xIt3aAXiip4yuMcz2re4n3LTnmwruJ/7KnKjmBW5YI1ww3EC+daUu6e6f8TGgWCtO+a/Z'
+        'heYRew5v8t/SzQf29TVuouhnHWxYJrthB+ilYeHqmywFIkjtlVfOusG9JmEduQyw7XEm9QC2diH1'
+        'UUmaUaxSjfBYQXi0BCoZ8IoITUmqqoU3TVPYATpohjoLpCvyt1tgHZBQPgKlDxdg48opcmq9DKBS'
+        'PVdRWb7pSDxP5UR/DFhurZqWlLXHFdkTEVg2I8/I9Nl+lY0PEW9J+KoP/E7J9nhVb46QBnrodESJ'
+        '9JtX96DWYsFWRrBSqGurKUhTRPdjump08ebXfddld5tCluz5J7hQe966bjFyTJdNytfXXTF+5j7y'
+        'JTVHdceJvuo0kz9D0QE4L2OgiCivsN5EWRXs+EXykkMSIumHopWjb2YYwExuERQqsWoSlY/SjhEB'
+        'HiBYSrlczYSOibMHh24M8O7QzRB8vxJWcEzJpjsH2JfIjUXMrmBjlm1kV8jdJxzb022obQk4WU7v'
+        'kle+jVaiMvE4aAdEe9azjfb+1pXmdzaAu97gBC48xbJKFuTItpT708z1D1PJHDDa2TweONhQP1gG'
+        'asMmTOh27iIacK4YnYm2M1gKvRJD8NIx5ccPeFbUfd08NfW1GDdT1NoUGbDXRgniGQO0BuY3nIcJ'
+        'IR5rkXLoz1hOocCPjr5K8E7MhWwXfRs5m/vUe/sEQgtf3AQIudCo1YDtwy8ve7yk2HwSTwtR0EIf'
+        'WE96MaRDdCTZMgb/ycRykTHZFfvHAXCcmQtr6VmHoBcqcxrvZX5r2ZsmL6LAx74/dPaPLpBiRibL'
+        'fXFMARB0gH9RFlJIUwVJyZYVKUs6Z/VEwy8sxl44o8niHNR51RYHkEJvFuesqVJbDp8AqN7tdzMJ'
+        'hBquttesC2D3w2qXfB20NxSq1O9ZUh8yYR3MckMrscPPHBL/q9NdWNDeEvc0oMgvXBMDen1HNxyg'
+        'O7Pke+rxQ8mMCb4ORvwwU+pyPsl2dozGNOC6BgdnwcK80S3N76yJBTcv0CT+DqK+bV6lcAaEcOIi'
+        'WcCeeUzRxZ806hjj8BROcMya3QXjXHDu8eebyES/qARBPFpE2v1kzYjfSTVjZNimlEiwdLyz09Sh'
+        'tyevgU64ZhNur5956jXDUngEZkr45/EKxu8qA1Ix5AC/Aegvm5jgQapO22gpwshpTXzAh8hFTYXd'
+        'jSU+iLJC7z8KUy6R31cfGQboTbweWIK5EayjeYF5HEyP/+itGrDPVNU5U8psxNE5bTjzBig37Nxf'
+        'LiM+ufvM+gCWp9CjZ1WnR8J2/Rexgqg2lRd0NovsgxzXOw4eO6LFY5gUzpOkXANDXZhxMGPcFNtn'
+        'JFEECtqDuAbIt/6pG1Bz556+oynuWzjyxDs7lX8vhb+0EHprDLePH96qslQxgWnWXqS/Reol7IlF'
+        'WgB1LmZlQEU1WptxclDbP6MUldscmqHbSlkH1JEdbmgwwR5wEqk6eynE1YvFsLdD5ShHFxbDtDr7'
+        'doEc5a9HeGH4xVBCJjUpawVAhdSpHAZ5yWFSCPGslTQUpkobSRColQY/weYjkCFRtgHw6g8NlNS+'
+        'aqf0+EgR7Tt/F5McNFVpIRX78Uu28kJWy4d8VouT9iVwXnbSrOVXbeRidHtd/eJ0/YdXX7rFqgce'
+        'Mq3KCc1p49K0wdAGUOQpRgsWM2V5+iqyB67fYCWXOcJ/Q/piXkcNzzThjYfVBirOOtIAEdbY9IlO'
+        'C6ZlgdxyK2QINho24lNH2ekXFocUvWU9Ltpm1kEhGyCs45aiUxEwUy7ZDBhkltW52zpdvDEqpaZo'
+        'CMBIq6kWjqBWGkc+O546TOyxQZJ/upnZArZbgzvPEQT1aiu0hmzHxZf4JBA4WV8J/2tYY0WxKb6T'
+        'sGh4JTPC+gJh/NZH6egKo4cNA7/oTcxKFZhhdoH9ckQdOH72l8AjaKY34ijtNjcZb+Tj7F9KiATw'
+        'FKK+UwmPxnsAeeitAdDI5HghlmDBl/Td6c93XoHSVyUunw9ck1YCHhXh0Ifceszdh+Y0H7VJ03h+'
+        'EV7DALOwTV772ifsVBrFgldnGc9DB1D45r2k35EuZK8GEAKxgojEzrabswSEnQpMfdWe0khPz1/d'
+        'TgnWxxJy2xVTiRw/5y0kF+noEYIeDrDl2GDlu9bMEJ/P0kStbBLC3tQC4Np2OAWWsxTdnBogqcCm'
+        'eW3w42tYITKVWD31YrDHJp1nVlugSdXUW5Ub3fe0HgBNtGF5drxJy/VB/FI9oVZB5DFKY/G0prbo'
+        'Rv2pHpu99KW+eEu8gK/xaTAZ2BdUXJ7Ko7JAXsO5HBFj/bz2fJyqr5arjnTD7xd1k0u+JWN+Txo8'
+        'exD3tjCoEd/f2F4jwCXhieD4ueXKx+jcI9zpl3j/x1sFxsOlASA/1qpCZNt9eRH3RRTIdKe7bqDl'
+        'XMGgRJVIWHKXwjvaIXNS8njDm++1NcFUkVpwgNKNMPldQlOVl5y1CDDBl9EAktRkXqgkwP7bdhOP'
+        'BuCVe4F4oipHRBUDQggrWIczkknkGjJB188I+j9unL3YEn3PM7EYif3ASXA0hqK1uxVgTWfDv5ik'
+        'VuOdeUb8YHyn5JGpQtgi2/9mmp8cGsDqy2Mq8+3bmf+zpZfCzdFksqMH4Uer+CDyRnYiIAJG2BIB'
+        'esHyjuz9mTKa+PAY6FD5XHq2kC1r8Z0/ejlC72FXlrdrEftclbHkosP0Z2YLt8OAVssmNmuBWIX7'
+        'R2OhhNBMXulpRJMN5Ga83B49oKy6rXi2MrxHqEyMKkyjtWONKBfwNBpZnHmAO9vy5n0l6HKOkMdz'
+        'Z0nrRhHgnQE0Jtu56PPox5s1Uq/UWamN/KFrcjQD95P2kEbOx3p4SVUdhePWoWAMjmSyx+7Rb/mM'
+        'Z/Cv9xD/UZ5UtShAkvnOZymvxi7JgtAtn4Pbw28GtNdTiYMHhvoyO9N438GQGo5AWEgFI8mfhOYg'
+        'KpEzq6uBgd0FjAMTsh2VUPOpvMaUPyB/mW92/0+ZgLg64YWzDmSuiWZ/roxfmzCTSFugGWhFclmx'
+        'NYKzvHyqis5Mr7Ko5xDyyOVsoWWqZcvTAKyX9zO92BxPYIbB9R3LlNaD6MAEsrwlVzVe+1cNzuNO'
+        'ZZ4eTJaeJ/aqdzlMguWPB2ZEOsKhOPJ8PBUNIhW71/K9+Vcw89ilC1gsq02zZ8o/Hq/ADSZbfWzG'
+        '/Uj3o97MRZT2/1Jc3RNsTHKSUdrWPswq9WdWHeAyHwdzQpCDjTqWAVgEGbQ5XVLryS2UHmZKoF6u'
+        'Nx44Xmt4ytQ8wqydEKycFJ9yKFvjzddj5B1uUe7Hv5ZddwQH4HD/MlntH5/4IgikFW4z96MHfnZP'
+        'z8xPalEGCOo9pKsOdxgyh4YQU3iw/K/zAOwCEKqV8r9m3fqAzHpxIYBz8KMPpceWeH9Vkmo6TcZK'
+        'gShIvjS4b9Ck9YWR7Nacm/XnHjn/YUdBsIrkJxnQbeiG773ep37RmO+cYsoh/Gkw+XJEujeS9+ip'
+        'L8mxj5mVPWnz3pn/japjsOMEEmWKROMQtCh5s9EhK1PGHkiwGp2hcYZcCxKnkQFGZWgpZESch2JX'
+        'KSQvtQP70iIVbAPIhvpA7wBIzpWIKtuy17U9a43XKmIVfDN914ydcazSgkxBK451UgZi2n5l0f+f'
+        'RMedZidwmmj+cfhq1/K+lNCOATh8wngX9165cS9A3maEGlmXacZrpE2JxNHZFz13zIdKNj3/W9mt'
+        'Zmn2xv9+uYdgRtNmNE7hNGZRUfHhSzB5F/snqI+p8InaYx9jJrFjYfwzBljXXpaspLZ7yW03E+QF'
+        'wnAnFAjXVu/OM9gYrtLMMme0jTmb/p2h7MjnlUmT8FgH5dT/y51EQic2I1/z+j3ZSqvpmFzWZe3H'
+        'Rw3/YMFZKxKzGDCzg0a5A42oyxxugxPRFMSTjGZNOW0lwcNEEQJGkJ/XaFgofYHEns/YrUvheTs1'
+        'PcwOHExmW1sI+iTkTpwhLVt2vi9JbedPeMyCKA9SkqpZYqgFR4aiPgNjX/ptjhHCu/g80+DM6A1f'
+        '1DyhrWF2dP4fcCUOsOH4OCjZbrDx6W/31x2LRKS0B3VMIUZhHnaKLd3H8TcuWO5ZMlP27yxWqaWf'
+        'hwHwZMxiH9mE5gOpd6paRWFW4ApYygaPIEK2LBsGvl6UUz2H7v/15aZ2BC+lrWDwoZUaOjGHZ2+R'
+        '7dk5xsIkAO+XTj9EwdRYUfT1r63l+i4ucBcGEK+AR/9EHeSr7U0y/Nybu0pwnQgyWBaIP6T0e+uu'
+        'SEub7xeFuWWPltpMk/47HJF1bgEJryTUwHdUcKVPptXU9yFbK2KGb6GSOKdXQUxoLL1BGKDUZk6o'
+        '8ji6TWi06pVa1UnjROPVD4C43QPCji61zv+iCzzU++5kyKd/7JOOOuzMii2mrJnxVU+xwORUlxOZ'
+        '58BrytyDObVSh3UJu1aly5O8l2C0Dn7KAjT+YOxDxY+5CE0YCeDffBpHo0AGoEEQtjtfe/clrWGl'
+        '//0yM+nDd/u+3RHjXoaohsgSwlrq6EwAHVGpEaaqURftTZYYYc3UzUE6YaWAARi0pCishAasosuu'
+        '5pCeEyqWikJmFAIsPuXDE76/iFcq0bQPZSEpjGfNrA3TqIzWLvrRAQ5FpyuVsT6KR6XORhqDpJoB'
+        'fC21niPQQVaQB+tavPsFWBGivvGBhd30LY9bYgpF8LZ8PGUuMakyr3qdOgy4naiJZ5bTp2LfBGoy'
+        'ghny6L4EYvKBtcLcSZ/w4rHV1JSL+GSqinz+cwCqFCDXrQASG6LA0xewn1zwd5Ys4arNlLCH1d7n'
+        '7GGoSr0g+g/wHgT3Mt8LYNDkTYwEedZSuJ2Hyyfon6HV0n82W0anFs6QAcJq3wlxe7+bl1TAZ5cQ'
+        'rXo+dgFltwzjXljleYK823xE7BTP2BcQoNeVIjKLqcoVtW202/5TcVlaxZyfEIZ4sxltSNL1GbDe'
+        'PM736jpo0UVp5vzGMTV1y+S5p1XvX/DgSPh00/tuIvd5iN95AZB1+oETaJ+SUEqmSaZ9tmDpQCl5'
+        'w9+zAidCo7gsMFuZtfnRu2qleeRWw5heWOSyG1rQ9TcmFDqXlav5vW12AvycP9+zGAx/MIqxoveq'
+        'sdx7CtjgBTDUHwqaX2RVV2JOJcM37fWK8Fc8f779lSagoD1qoHjpa/TKTivEQtHOSI3SlSFhSoay'
+        'UPUVoTxjB0T0Lm1DIOcAqFDVeJe2mJ+aKeyNw7YMkfloF+DUbxCEqQWS8q8zrQfnvsAWccrC8SHf'
+        'G9kNnGqaGFFrwLqWY1fG788WB08MB7Romg6Dv2T8746qUb48VuMo9/1LCcxNNvrLe8XRinQCrJfU'
+        '6xA7XYgw1RE/UbQw9N4KUf8jCkpE0du7jpe+z4uEar2EXdB1bJF0YS8y198XbuGCY5fTddPY6Lrl'
+        'KcUl0Qfj3srozQO/SJNWz/qb4h9q4fB0t4WgdfpLcwFwm5FCaCQT/p/DuS4GDKUkdBCPDdJdq6qX'
+        'Kgq0rrsBorY+0M89X5dBwyVKYrSdIg8OjBe+6URqUZPeGK2HSntNfh9GLG8nzzoLyNrrv1trRebV'
+        'usYFMBh/pFx2qbsMfY8FIEMoOTDIFDDOs3YD8ABMTNthCCVV0BysiP0sUvzYkaMG5qto0JnYl7pH'
+        'fw3pwZwOe9TU/a/8UPphYGgloCJR9fSyfaW1zkYBF2ADyJUPGYkBIZI19ClSsQ1mni7DXUT2P9TQ'
+        'Nkg0LXmFo8qOxoyjeQ4wM3ynHLNr2lfsii3W9XAMik/p0gl5Hdkq7Bye9UwwEJyb6iKvy4ACSEVG'
+        'n1sQVER8QjOZoHrguq0iZjkT3XZ36o9o0JTaaztmR8GOyHDgL9DcJcGaAfiRgKtsx7lmDhxdw+TB'
+        '89GHxDoIl7dgUlSflMC/eUDKNq9Rd7hzJI1asuhsAWDc5F+siOJHGi4wh68VBzg6GUllVd1yk4c0'
+        'DL6ylpDao4mN/476nlyYXUUC5e8d0L37C5ZjmWML8hyaCQr1KNEccF/jJYQXeUniUy9BS9EbruHE'
+        'XK0FoKw6cu31QpYJMbSZ4pBJdx+Gdn1F8hk+6ivzB/4RwiEpTQneokAUkd81eeRJTBL74JKElKIf'
+        'GV9ATdzSfB1BdLrxvYOSyZN0tcKCHitp0uPyQ+SInBZA5jF4lzH5RIQLjCI8/d4GtCc2BQxpf20H'
+        'meCKH6o7+PZ0tTK9yl28ILoz+dCjdErr6khYYqWwP9BAa5Skmh0tp7XT06cgXqJ0NXaEHXf518D4'
+        'ijAPWvyn6ag/nv3pO+JqD87Ko/J/sgdsTtUfxMd4gS0MR/mTOnabBSNj+9azqUnJYe+kVcOE/7O3'
+        'kk+JmqM8bJKjDjg+DOEVKP+zRul0Iu75+GUWgCe1xbNmAQjvX49c4pMzyBGu3eeYYbkXel7QVi33'
+        'Ei37m9b6u7F+Sk8m94SjaYd8HmjTbEVbIkEvWrlPvwBil/pRhHi4aFDpfHWI7BgR2WfKh+bs5i8C'
+        'eMz1RraUBYgXcVl5HY4oWtpIakAKbwn/+4DrwTbudn8PxDxPp/Pv0TuHM9kr3aHRpGpoiiEzmoWm'
+        'uUFgGF6TLxoB9audJ+VolrWuW6TkSpleo9t/uoqGcUiW86E6FhCBx+YsmquRpm1ae2Ce3fjnK/FU'
+        'Vz6kLA/3PY+BpI7yoSMhhT4pLQ+lcw6DTf2EaorCIN7d0NMc4KSmP7G6WknUK0CiQpJTHbkW3zHm'
+        'VXm+d58dzVmKWOgoJvaY2t1jdl5YAiqSGQZ426M/gX/k0soYtvx5W78gjxa8wVBpbY7gxm7dsfYL'
+        'xag6cVllWILujTewv7BxXJTkMsN6k8b9ZFRqiODm22EJ/nOl0GKrYAHwooTjIolx7DGwW3upBdrK'
+        'S88ceKgxK5GxU9UqBsvXMi3QZyrlU4LWvDwAuXLwwfJUc1fl6zLA3AO9SQbAGJn0v659Rdc/XIVj'
+        'Xh9Cy02bYVAZWxgtwHwF0E8GuClXHkGqrAe/8XR4R4KFoIhNiFqmAw3vR5lTDqtpbE0HynSurah8'
+        'Zh7QarTgmQS/WbHNSmUZKrbsJFezu+8/JUs0rrxuG/ByQ2SHn+5jWRksnnXbFSDBVc2G6v6WrOtM'
+        'b/MvVu4Lgz6/a6ZUodfc21sxg9mHhW3Ob9inoyG9K2m7hd36sKMCAIfi6UddPwcz9i8z14JdDqlj'
+        '8KEeAQ1BIkxqg6oAWrpMhgJSEFdIQUAHqp2qjIBm8hTwLbXKM710ZGAObw99/F4lDcJ3siASwyMe'
+        '5cuS5JgNs1ThgAkMk0gik1I83jMyOh2QNtnza6ylN6ieUyLJLUSvq74vC28IGLk0z81aAfBgdvRc'
+        'btY41tjaLQ04AQTP3ZZ71ptfc8rB9elegCd96iEQE2ItadkO5+O9qmEowYUZlsCz8QtWuepjoFKh'
+        'tQ73miQ52GQPXEWeCqLOHe+9bf2KScCjc2UFMJpSiwLKpubHTrEIuM/sIAdTfEzsQLh2Tye/jryu'
+        '0Ui7nQDwFl17UjjVizyeWm9kdha2Dru7AyHURh6UOQ26giT4ZQgHAM8BWx1nGzccQyPvVbus4e3o'
+        'fhVg6diD7PHGKHXFAQXu6LlWm9rVRT9XifYxTOQYgVLELpHmnI9M6c+6i0JovjRt3flLnyMyamSY'
+        'qUaKwDYHO3nxrDupgMmeS2T6h80vQwBzHkLVK0Q/ra6gVVAuortSnNrQFKkyHy3fo3x+oJtEABGc'
+        'xruGIolnPQsvzNx6kAKunp0scY4E6nAZhZInmavZGZN2v+vwtkJaPgjzHkiiQZOgJKZDI6yS8SYw'
+        'XVujyso+ZhlVAeAXZc/2trsmL7ViGc83Zh12vgJIO0cvg4OvO6FjhEI/Hb7v1EVLCSZVWt60NF49'
+        'u5kj3D7fZIFbFWfoJWm1auKuq3dXl0O0w6G/fdGPCgWOUfOOoL5kLcpOBSBKtJrKLPRSRkc1/E3z'
+        '0e7JooTXeoDqZoEXSoJv0Nq4Y7ZevUz1eNYgAzs1l+i9pinV/wbz/k59SGiVuF9MmFNxDDltphXj'
+        'pkl5QKeMyY0xtqc9TWBSP+IkFUD5ZvKMrfHcLymWDzhBuqg4ZLbWma+iivVzRN+OcI9cUzqOwZRh'
+        'E3WvPvZCdrotcYRCFOQN1Ex9OBM6TkjtkOh6EYw1ybyhI1TukbeE5czGvldCsTWrhQo7VLhjvvfk'
+        'PxZer8J7X5gGP1JAz9OKldQxVlZvmh3gM/6mkeUFKjZ4Q2d1I/kH5XiFesTLgrrYfowUWk/Om4XH'
+        'u3Tl2wLGXr8ecqXSuNX7ScnzPq6Jw+p+1JeMTwGQ+zbIBgtjhR4vpBz7RTO8WbKvnx0IB2h97UUY'
+        't+mtPURYrZSf8RAtRifxvTKKdXHU4Grx0596Lm/3N/qMRr78qHynw0tFW9mMt9FdbgU/M1IHTBOj'
+        'LV+dvTgFEJ6YuImzKQQzklKBEMzR+DsR5LT2g1elmf9YKXeSZBExQbz3eO38v+VDGUngCrMyJmiW'
+        'WDovBCwdUgQYo9aeFfBdOnOj0QMl+++0RlGoHYvJkq8Hnfm+LUnNFCCW3YDH5O2QaNlPVTU+AliF'
+        'hZ7tAFtAXljLX983yfanjRyt+lniWWRblB1vZ7f9ItJ0fEAK9F0IIAKVq8yTt9Puist0di7T9qam'
+        'kD1HqvE1yVyR/zh6jCsF31KQxXLD+UDEzQd/SoH1ezpS9jSt0wda3wO/PnErsWM+gNlUZ14DDkX/'
+        'CM/U31UQHGIs6lKug3UbOvN3LB+nJ5XPIj6W+hk55imZTeHofqrfNZWvFbh3GH4t5yVKAWCGRyzc'
+        'JdJ7ODlyeDHX+hrCpwFB0IIGja81XHERocxAiMAes0XqOhkhfgqe510mS+Td6ApWceMAMmmLZRei'
+        'YOuSeBnTFWFKYjpyQl99Xu5Jh9NZf8GZiigTSCMFIIJlln1WY0re+fZwH/jl1P9byi6Rcm3IfaD5'
+        'HbdC8GzPT4y6CucxWBYaApFTfrEDVIDwMKZufIESb+wip/S/ULxu/RQcHCApvhPwixxSj1ocgPEE'
+        'yIb1WIAGeBRAf22MUvjpv3sOB0FSqVIro8hpuvo0O2gBRK3XO0drQ7XdU2xyF6hrv4qPEChHyZFI'
+        'gPeX1eMgZDvZfhp5GmFec5puSyxNZTs7Z2So7hMUddu8WwUjoDqF3EKMUXDxBape/4za5DKgfR3s'
+        '5ZpTrkCS1vevM2LUu9HRjEK8vbiq88vPA+LGaAWkEAcIL7TMzV42JHjJNJVjobl1X/lbGP5irN1Q'
+        'TQuA9+KJdUaKVGyaoYCW2qWy6eNEASBgmdXnuELN7K7xnsVCRQMSVFvZnguXhKggmAxKmmtw2bEy'
+        '4fR2njEhflsZJeUIBNa+zqPHmZIv8Npbl9JJ6Ag018Z6eCjBpAWKhnLhKw1mlZzpUOUdK2Hq9WMO'
+        'BaDo2MijHZxm7Lj35vYFWSEfGjtynUL4fSUEGe2gIYjoCCJUSDlsvIgWG9IXJt7+yly7uRIH+8FL'
+        'lDu/yHe87j/Lsvfcljdr0WuHOMRl08rj/bhhg8piUo/WGAQlFEDzzIC8JxStn6L0HV75eAB6bc6V'
+        '1l0KtXvacbsTWgNK+oppzHbeR0czAb64LeNmWSODv4hqyhncAwU22L6wknOQv7fXFL89ubkpQ2ZE'
+        '/1PGuMjA72BF5MqfL2xCUOCNzx537Ctq0r2UzYWAc3hra5MZJVAK2MnjH2i6NyDexI6JWfwTJepG'
+        '1CJo7VXhha69vxjGozvq4qrBHOBhglArNYehCwAV5h2abDaTzDv7rJsRDPIGQt7x8EXFPwFAM1vH'
+        '8BS5AZubTk8vj3up6KHuaeAGIQyRi70PliRkJvRIQCZKpAi3MIRqYPCg7NZ2UKtqqJ7tfDvZoPkD'
+        'DdFGhqsWxuXba3CfsC8FiWkC7Q3TG7NtfLyPNl3wC/oEwLYthCJaFPArUZDrzXYM+Zpnbmy2VxTB'
+        'o5h+lNqhyPZyeAFMjclmNJd8Os8M3zxIsZMsikLPvjDO2HzOiTZ5F6mc0QO53AQT2ZguuPmCtvyX'
+        'zSNtOEjo5rs14yzUE4DjVZgkbVJiqqMxHLDY+OSOQMPKRQ/UTtXfLRo2hFFqVAE+TK+WLOYG3ai2'
+        'tvsfFdtl4KpcFDdBy1PJ0UXPK9XNXI+TAErzjV1u4u3UglOVY41oifPsxLqFetUtAU9yNvbO3WrA'
+        '3xrIVbBdf09YOfXhE9rsFObVx06Qx8qcV0wNx3NiqBl9p9DI/+tuK+jUFdY4IXXX190p3i/ajVod'
+        'xDXvS9palcG8L9JjSL34xliTfFcaoCjULJSessg6ARyVeu+2SpDqqJOnpmyQhOVGgzbSB7dQOGRd'
+        'BbDKZ2tc6s8JtGNoImx9D7ucu5DpVUZoOrt5Jtab6YD9WGXpv8QALCLQ2p8Gc+M3JuzjYWslwE0G'
+        's0vsDDjLM+7sOuYEHNQaC70hFwqhVaLj9V2vrzNxK5WOIxuWnBSOlerXAB4pcGXFq5It8Qz+qo3n'
+        'VRt+KRzeg0idk2+pPpHkxMWnBsoW1Ra6pOpWu5Wd6DliB+IGyVhDsonqLlCZlsZshRM4xPtN6UjN'
+        'WyhZQ+q9SPZCJbddUh7VEtn4ZRI+YVQHOvE5jg5bzxixIwRQyQV4pl+fu5Z4XB3TnGOeUEOxvHwe'
+        'kngbyjwfj7vGPseo8D8zOTUFwVc/WLzUE0m7XDjITQz6Xbm2r6xYbTJ7APr0eEvFF/S+X16rug1P'
+        'SfsRnvUfZtSq2QeMwPelobGsW1LVmGTe/g/WY1ak5goTWj4Kr+XE/rlcpEt4vgIGjnuoabhW+r7i'
+        'B/+7lDbcIdWw9ew1AYhueCAhiiZvrvV+VYn9kutV4lCjJolBXp2+P1EUyjCLGpLkaXts71Qtfg2b'
+        '1BRlWhwSTy2Q00Ps0KcpoOptVQjSKeE4d6gSoCJwpoVdPKTr96vfL0VF7dBRm5smEuzSBJhtvCo5'
+        'caGLlyloJeiHlDCh1N+CdqQkk9GkVJ7mOM4eE8wMX8TPhsxpTdNpfjN31jlEbvseQw7F7YzBmfm1'
+        'QN7G3VX2YFhK4A+vd9mn6G6LsA+HDfyVJ9aQP94Xl7A4E3Aw/ycrsDYjutyEe/FixKRufDY9xWQh'
+        'wotSc6EnOVHJBv4yBqdaRmfT6cxVwz/easSUUBrqX3bw8uReGaEB5xtO95Z4RezLC0tIo5M8J0D1'
+        'trOh+zbIv1AkPK12+j+XTCz50mm22gyph28AhdSuVzrYnrAuRm5TwGNCqDNwYiAV+T/YIW2/hFtb'
+        'VckqIwsAIki5cjwR5K3V8fASdogkOU2EFSCjbQ9V37KRvVZTbWnJZJ7W4gTjOnuLRANzgeMwMQHo'
+        'X9VJmmOBJlk/wfD0AO7/zNS9cctRJ7LZUPrHoSJ9nAd6PEwgbP2JVqAS55WjwXvym4opsLuRzjy6'
+        'wCAQ0jN0LpgK3t+B5frptbpVwQN9+1ZvIij2zmMxcFnUCFC/GsAESFOPpfm8fQprFppCh9sI2nF9'
+        'ZSV/owSbBMiYzRiTjpaHNbXyAxwnNLGtuBqRYzJegYNHL49Fr64jpUykftozL/bV+JNOJ2HDlOAf'
+        'NePRSzCENKOEb8+W89yrOq6hCObtEhBchMlLlpAmldDsdkQIW9L6NcriZgOAK+qJu+hrzEPYTrK8'
+        'yQ3hsYLXSV5ugDiLWX3kNrcGbN2clnNHY8f58O8ccW9gR53P9Ur9aADo39kmL1Q54aogxzpVJ4BF'
+        'Plb8bUs442AXi+IoChwBBVYgW9eyQHLQ5LzHKPNqCtTR8yLv+GAraLO+woZxhT2HoGRZ+H/zX+Yf'
+        'j4tLSlQ1jc2xV52sZ+0gZX36ZVc2df91/QOqfyiZ/5A0IaUcxLu8O1UCXpMsAVBIfJiWxkRWBd+f'
+        'x5YYK5wbpSo2Yt0Xxd1t5iNPlHRleekalJ8714UkTpnufgM/66R/G5OfEyISo1ofxhW3GEZAP738'
+        'm0VeHmXdS2crOXzca1UA9/2NsyahzB+T31CJwq0EsNHf/X8TJOmVhZ4FlIhDC5L33wQaxx4Z/PB5'
+        'egFYTaYmDRWRF2lqk9ArN6K1gcsoW+m/DZwwT6Izjb7FX2jSieLSw0IS3t98Vh3GoFqnXayoKM+J'
+        'gfXshvjyHCHjjKL7pBLgInasumb/CHiq+O2Ylxp0Uy1rYLwqum3XsjiXDTxN1B6ijQQo5l5N1Vu1'
+        'GBmZ5xkJ0pSiwPPknYTQBHpoYOJgQ35V6ZF+2OuEGGy6QHjuRtAN398/IWftnHEk/76PWShMSkwD'
+        'YXRq0NBMR9B5EDJKotdN3KBmTercrs1N0a2hx7NVz5vnByJ+UlTqttKRxgnA8qsMkc87xhZwOaCQ'
+        'noF4FWJHnEZ/3Az3sBFxNp9JTXbnrwc1ip5p+INtjKkKq4D+UxMoAegZyimxM+R6wQ4bzkBPH3a/'
+        '4vzUyaMeZ8hwI7kJ1CySFPialdO9ZhoBuTAlyAyZK4HfnyFVpKhG61ZABvLemcF3KvFxsPTzqAai'
+        'WBuVCFk5Xcq5VD5Kv03kTm/g/b68N9+bBKizXj8St8aoddcA0iDgj29xIOiNdKcDhAsK/HKCrNyp'
+        'GH2AjdiBgg2hbjy+7zJxCRKdR5UhdFfJOog95xBWN18abLliDxAkz5RysV25gb4KaPwsRlCeM8PO'
+        'hvzGR2AWtOBdElBm3tr7UPuRuVjUMW1WsOlGiCcARu0NIz1M9S23vrKHDJcxwhINgrxGbQYn4jiE'
+        'ZPOgYgzZF689LkgB7pyN/eJE23FM37u3GfES7aaZBSMQPoFk4E0rlYksNdbRAJtkAoIxSShJ42Gx'
+        'dmSG4y7v8qP6mQM5qYGvgr8S3ig2y4pvgzE77CAPyYNS5Wh2jSdc1n9dAancnzIWvoCVhSjkP+fc'
+        'EBnhW/N9lIhPkNJRRvg32J+gsVanHO7YNx/yH2YHu49RZ8CvIwFwJcxUTXiOvFMyggoBZHwwiFYw'
+        'm9W4E0+/azEDWCa2SouhWlbBpahfqscau83kSlFutwMOKbOHD6xCViihD1hJ2HO+i8HOiMlfrjQY'
+        'lfFrsSKp1cFuhvEEVdp0+aZRGxXCbIoE0L5Br8J2FKpIU62Eg/0NyiMI0ZJZ/EHzcLLgjxB9NNBe'
+        '4n+d188No9XwZiL79X5j8Cf9Y4pdQaD6YYH27zJDdibo7INu3k+mkI7eqqZEuNSuXH54iVU6Mwwn'
+        'lRSOyGKPSYUYEiBRIuytx00uRA6Bc2USkeK2EAlmCon99x3YpT5UR7nqqhOj47rhRDRcQf487dSo'
+        'tiwqCG+jcV547H7v3XUnaiNvxTuAdAFf8bK0ZLKVhls63YQUMJOtaqZcTFSVH86dpzjKHUi4LPJO'
+        'IjbyIfkWBkEFvlhwb9VYy0MAyRQd8BRjNc3LgUNwUSkD7Xv9tsBtDUgFTjIyxpwYD3KHsnnf4533'
+        '0apU5GEbDlTNZ7pfDMZZmJS/1Z4vux2SBgtqnnuXCyuqeBStqWcfARDy5qHwXqV81x5d8BRk+g2P'
+        'L8szxutv7YcA0AvqxPo3M9wRuLOzcN/F+ZIGc9GP/6TMx4+hShlikldlh19+kwwXv2hjC4N8Kukd'
+        'SxvgHJaaDs4Qq4hcoAKbG8Gq+8ykeTZNZ3kEUFnPPNSkQPimiMpT0MB7HUTV6NVgvvP7Dzk0rflD'
+        'eGO+w+918MBf8qzukKPpicH78rhQDNp7pMuovx8FR27WU3xJSxlUxMXdK5o7l7bps+1RxwqIscq5'
+        'AXqYC42nTYQBPSLa1BGgL0u6lly+dCenLnV0jj15VgX0+CubATVjx3+9rnWyz1nsmb+NTZDL8Cyd'
+        'j3LvCP7NyAdAjPzBRbX99+EA21LLTskv0f7b30go3CHjDfB4se51TtUiXEmP0+sVz4y0JehZpsQQ'
+        'R3AngIp2eBlvqPOLeeuZ8bjJEsX8W0tD/PkMoFtCVuGnQPw0wdJhOzUP5vSBqSccAtlB989HljXK'
+        'bUHCZpeQjlmDKHBu4i8lVHE/foUZfA2ZrmOYq/q/Yy0drffLyNXgqioiITobAaDQUQCG2rRaiB19'
+        'GGAxzLhtzJlfbW2WPvsi15TNr6EevvkXzPFPJj60bycZzc0340GjKn9GEJoc7A9TO0P1Yg/lx8qm'
+        'mXKVjkkE+cAVHQk+mKMdNrS3xOIcfwaIxGQs8hDvKMtoBGAaLNzLW1YFGJcmdN92ZUhC6Jh1xut4'
+        '34gjXUKBy6X/fmH7sjaqsveskL6q1BKJMHLNnrCP0RsKIOo/FRc9mcYSPvTiHXdi0FyaXoplR8sJ'
+        '6Gb/uRSdexiNLhbFVQjW/DDaptCSEcAvO7tvXiQfAKthTeXsMnNb+Gb9v8M6iCnNKT6CvoTegejx'
+        'pIMY0BV7Sv4R1lEFU2H+ObwSKKU8Abf2ZcKI7b/o7NcItgxHd3cuUkYmdH0E2N9IfsP5bML/u+Bv'
+        'TsUmsBw2kjcKRjwziMb/kFktxGrLq6AyrBjFAkPOBTZqERPpcisiwQT9rK6hctvX7wbtQ1SAUQzP'
+        'HxU34iEtUo2LTf46QOl68XzpM7XlvN2e/EUURXidske5m17HicKPg88NPA0U6w849Kr3Z0ImFwGI'
+        'gmh+ndyU2byy/FcMu8B02LuaO1DXrDYy2IX6fu17+9kkcB8fMK2PSWXsYr7jXyYmPX4NbDFLZev8'
+        'gyjt9A1xgVN/HyjvHr3qIMTxKZZl+kWla63gA3mTGbjAdK68RJRs17vNlFgECNbCQ3GAqQPtJ1Eb'
+        '1BauCYx5+kZYFNi4PflpJ30kgqS1RX+kjyA/H9No4Gx3HSyalU9EsIiRJYsTysX0mVoghLXkVLh4'
+        'n0aoyPgkwX6H7zGbKoIRJk917cfoCa8r0AADjKaw4FpSERBKzfN7CHo08BnAs6z7j37ombOgSMsY'
+        'Q1I2nTQTA4dEdfWFic79BcTfQYC6lez3oqu7pPCMSan2DoHb6RxTzalC+Tzykv/GHaO2LHoIPc7F'
+        'jG6vCBjZlfJOTaL79KTA9Ln3o7zrCUXoFGlElnlFpVryD9tqcmIOhUSnyagFFo9AO4Ee8YSAgieU'
+        'Ga98n/qFfxyg+YdTmvPiF8tC7Py/5djSAEVoFCAhZYK4baxvK7wjC/TmdSb/rcr2nSJcQFUXloQV'
+        'NCiKbfC8TOXkMisTAfAmu1FWdXo0vUvCp8TRXcPnp+MQ5sYqbBgFwqQbq7YyLmMOep9ZFhxKatwJ'
+        'fv6pLlzyiNa5p3hi0HdN3MIHBTgHW72YjLGqXKddOwqT2+HvPrmrCX/vmor1zLITwR4JM+xyQKna'
+        'wEgE0GUle/8C8yoaeR3Hnc9pqBKzFa4Kexbi29iQzoJG6iNdoor9LT2eUSFmB8Vkw1wAt74997Ia'
+        '87IAGa5J00uYaSBQOlIqzOPrn91wwBrAtKiNmaf5s3xSwcfaNQ4KAHKp+C/mPXFrExEgdX0ft/DY'
+        'mtEIK+PqI46SeUydaRhQZtEPsoJ6/vvUr3hmoMpjeKBpV1mBD/Drb0b4+c9f5hY08RQ4ZO3pCdWH'
+        'kbNlfDR4JF5gpBwIDj8XkKHA2YKapiKk3FX30ttRM2ArGGjSPqwPRAjxYQgPIEY1vGBT1MhSEvxm'
+        '7uze+1SsyFSmO9xtz75Ny3FR1Bln/oEL+0VpF1nF+7xDLUu/hqBlx2YmSZIQha9HwzSs/KlBWgd3'
+        'otClznSzGXDV1gRSSxq5JIoSWpKvxlpD+NlCIUgPAXARnO3X9fAGlbYTRx9x5BYCei9N5a54vLdU'
+        'Gk9UxTFSJIvINhBSdiWoh+IdkdgctMcJhj9akGyIEAC8tLQcNLzrZYMzNhw0qBCvpYBdgr/ZaLzr'
+        'KcC1Q97zjK3eDTFR39ykXCdVE0w5BLA6UUPXJoM4WVKsBd6w6IL9lh7dSSUpQh3pzX9wU6LQK5Ov'
+        'KZcC1NmzkyWJiq41C7f7YfL3ubDpylZk0CZHOBLMdVdWFYbaI6BN1SSVbDGPt8MF+g9hyRt50Nei'
+        'mHBOb5Sxf6BaivXVEGCq0JaK/O2B/3mgBDaeAAJT7Xzb8vy4+6ZGkj2hE0L7/mTs0eM3hBHXxZ5V'
+        'd/L2wRMmkJV07D7MK0AKPvJobj4LSAMMWJ1z2sZhfTO3IhqFjOSCOI4pwmtx2EGrB55r8OF4h43R'
+        'a0YbQ9AGI5ypYnwJ/gKO7pEIDLOAx2o9w4sl8Oq57xDOmj89HGWET8QhawZkkxVURwI+pHLAxQ7f'
+        'eWbUnbVYZb6YlsyytIRkkrK57DhqZdqUyOUgqrePPsX78yN1uDI0Uy9l4yS/adqJ9UR8CwHgcvMC'
+        'HIIlVv+140drF2JuHy1pq7knzS8AO63bucnyqF5UxoIwrMf1g23jNy73icswXLURE7AnymZY/Uba'
+        'ggleKVFj6G7kiCdHdSOuo8D7nbv4TE9vuTnDyw0pvqhvo8xQZZVElg9eMyoEIJOAk8Y/Ha26sSE7'
+        'XsFySpbwYoCVmd/Gr5D3Qa+kPYfeOlmZo6OKs81eBiX2Td2x3IobN5iQVWFfYBRzgWDqH4eOtQRc'
+        'pu/wv5bTdQmET6scjKF3JLF/xy9RzQ3PEleqwrgDc03b5uyZEEAjYHENmNZ3xJBFUahdgBoF+HeS'
+        'O8M4D6nRPMPkARRqY7bCu8XRi9d4o2N/2t7uPzptQo2sNYJ3Eq/oLaMOpbfVGXHkKQn5S9VLain5'
+        'zOlCm61i0GQvESoCHbLMMlxT6ORnJSQLibOJLELY4QnrirrMJA+hSpmpyoYCv8OBklTR5arzUctt'
+        'U/mduOjPUoVJq6J384ACSvxiZqJkcxOzSOtfnGmdxsgfDHlYUJy0NRXoDh0rJ6Ro70m5qjwCNKIj'
+        'K69n2sG3YYMPvsgFN9yhmhfI3cYHAVBXHeu/cIOebvnEuO8u6+uEMTISpZFzVsgWbKq+HtOUYX6A'
+        'e+C+PHR8x5CIVHLuywaFM+ZC0//+bdRSz/1hmusG+r/DRRk2PzMenUnXEGSkQYYEgwK2IbZDTCyq'
+        'vYe3q+2X2qlwRhjCcxsE0N2odzSsPm0RwMxEzfpdxqFxYdH5wwETPAiCEUcWiHrQr4bTfjFvm2kC'
+        'sDweJhA7zX5Rp66pAWXd7G9oqQNy1F7pVvI1j6LsYOHEnfrL8Lrev3+2sj8C1p2jWwJq/lr6Bd3g'
+        'dVqmocNFXxCgpfcvK1ZQ2o1nnzyj92S3Oo6SO9mPe2TKVQZE3+6L2JpNne0j7Ags2HiRA5NtuNJo'
+        'EAeiWtnmWwpmS4L0Gg2CstMTzUlOq4bq2Gpa1WM0lj3yhsBjiWYHSbHTq3g3oxXDiZVBCeNph0dD'
+        'QVAiVB5Amd13UKDNIYB4dxrxAHbSAhlBMEvsTKR3x1yqKP5QrdUwUCdunJlhzE/0djPUT/vtr/k1'
+        'tg96FQ7ilodAn4+JKCuml+GyIYh0QBBtHd3cI1uN/LT+okPeFfE7oLgv4jAFCYRxMycEAeDGNtfD'
+        '9Is7wjh4WHNHDHTsoQ6uv4JVRfz1HMoLzLX5+VZ5Fk8L1biEJ9dkRNxjqEQddOcVAL/XhzpH35XM'
+        'lTFuWQH507SRpCmku+HB1ogvH2XMfJU3X7xqn9NLOT3SzQcZ3ohlZOL2ZQoNBKDLuv6tweDwXRqZ'
+        'PazP6m9oYlayMAKbhLUaxE/QBn0G/eZMxj6Bz+e8BhC8QdcWS0apZRzuLZBt8yuThH8aQPMVkmd3'
+        'QqrwZXGjNUHJvaYR/lpVpM5UBCcBhij2A9/c/+aiCAIaWEcX2fQlEEDGKE1REDAinknEXKLbyfMN'
+        'UshVMIrsSmguuT8MeQvxW9jA8Yc24PyRk/d7sQ1UMkmfLqkMPGUGHM67HJX8nI2234dTm+hLbxA7'
+        '6mWTp/rk3MYRx852sL8oaiJyNwqN0tBXJZG3MZm9QFNfQDBA0hhE7cFSy6fIeOwYROTOth+X458l'
+        'dY8gPqqv6qfbaXqpmBvCi3NJBXg+bPX4g0x9BTwNLSYeVuUR6BUitG6HpF16+8cofwiMqzyQSkTb'
+        'gLNFCRqdQNIP2A3rhrX8S7gibMgUsCJ2L5WcAAGgZkTuSLyvqQ4VLFZZ/tVz3I39T04mDmAJUdiy'
+        'lwW0XVnR3rylvEpBL2W20jq4qM2QSsJXI0RUwcaHU3NxRz8srh4zLylaAua1MWaCoKYhLTR9x30L'
+        'bVOIE/NnJkBWYmgW/1c3oWF1OOyN9P4DIMV3upcEHxfK3fkuXXUHwdSsAHO2rleJsejeAnzkqqnN'
+        'H8/ojnc8lrZigS5zq2b9Ta3xTwyP37r2Rg1DxMRXQpH4DsrxY6q39laeDdnPV0mQtPKS8QQOV1FA'
+        'VL8rEQzwprzajdlAYVgKVe/tD0CEL8x9r75CeJDCzWo4Fqmln3wNMjiauM7JVIEUZLW1MteTP4Qt'
+        'VnCKmKX2OG5MyqzHCGooi4wd7upzf36l+4I3bhgbS5ytr2UO6a2FBHRRF6mfxiwXyjdab6mOyVVe'
+        '8DRkjOCMKy6tdgiCgD9ggbZvz1PqF/vlxV3MlNiJs7p3pBOGKMsm7dhBezifv2xWelDbkqrNLtkC'
+        '7PAzWtqDRWHC6Ry+z4TVD6kCUooURWs0MZMYNJ2ABXt65HKoHs/jWZQrxEQ/CtuAIBmiR2QKX54C'
+        'jwfl2+1mWSb9QPjpfIv5CwmwgIDa7hUFGlhb5bNJzAbTyVTIRV0UbsqYDLEsAsjypq+lYTp2ysTT'
+        '/xfeLI+fo5eQ39nlYJ7Fa+1sqqXLMvJCUSTVZk7faAGUdHYt250ZahJVYvrckl6UlU6G7B0xqTOw'
+        'epov8QPAcWSvtAgyoZ3mSlm5l3sQnPMaYCJyyFwToD3BoTWqHEIb4zOgfNT4Hjycay2zGbDTQfjp'
+        'eRJ7VMvUIIubafmYyuy6ljEGk2VHINEcFhzJioBadOXHgBsF0gqQPjWNL01zn6QRhYMHoKjl1Cq3'
+        'D4DRvmh6POG3wcX4Y7tjXKVG+1tlaHtNrCU7r0+U75H2uwpzGsWVauO1PiMsop2u3rnNDfIEbIqh'
+        'vIopUpXk6kIwioWwxTy9/T59JKj5so8nv5MU7OWiKn0reqrremYyTy/mpFBEN1NdmWjAqqY+xLe4'
+        '2j4SM/6p5rCfly1f7HMfgi9ovwswXrirHa43sQzLMt98Nw56+ds4GqlH+76PAeMdbqEekkjyd4z/'
+        'ILbq0wuoJtMhIdjV4HdRtu5MAFiUUQScRLCPX517puSwEbrjXmMRxlPkDIxsfErdw/l4mgZM+OBP'
+        'HWzbbNhzv3F6uOm+IYF4kbOZVV2TsRwxqRo5gb7th8EQPefEDHppqHKiKDLdPEK+IF7LSpX1zD6V'
+        'LvGkB7Wtx5+/ZvAol+TJ8NktYrp0c+hXyLdS8zTWkJG9xbomP9MyKXN1BAe54wN4dTzuUb687wB1'
+        'xoeyOB6uTCwK1TznbPH6cwM3pRnfMR9bmXz7y6ogOykKVdwzbIECP6l4+bwA+pUxx+ywLWS5Vshh'
+        '01a7Y+OHTnOtzkBR7HVhTY4EiKX0xScTBCVPWX5M2o/2LuerRCcmPmCdgQ/w9nrMbSZfYM6zH8yq'
+        'Q1nZsLlk3JTFLBzuO11qd8TcQGJwcN2tUsHJTNrfqUYrOEkIvyAp3/3Qu8UNerie2zKUR/G09ooF'
+        'JAVKBMYJF8GzAqd0z4LzodRECRg1qy+uxRmGA1sylc+kT8B3z+2l0T3YDq2qPdXD0VC3iQnM2gWJ'
+        'GloplXTvYAqAnozf4tggdmOpw1g/kyMr7q8gAulRdAYydqzUWDp9jEnc6PxgUByvOe+RtetphWEH'
+        'mWN3NuNfB5N3vj6K4vvBmggbDS2jB0etV7OuwOex6VV2pIWEdPaQZS+Zv07z4bhx2hvyU2VkjclR'
+        'Zc0513872rSqayqj/7vj2v3HO0NGWM48qwZ2NSLJvZJRbFNGE39WFampYAQqe4P5iqGTPFC0NzOu'
+        'gidja4C8+siH/6SfooRcnYxjffKm7VCubH2XxWWG6X1ojtYDsDpeB9p26N2GZTZN4NTzRlPJBYNt'
+        'EvkRTWgJm6e2Rb7mTW4ja92Ol27cpgL7VSaPObP2dxayNXyPGJP+l9sdBYH0M8rrp/vNsw+W2mhw'
+        'wRJZEWfBXmFHlbaLJ4MMa2JiSAE9wtjX+W3iZxCwYz1ND+BLa9GkuH4UXAqXVd38013+sArojrp7'
+        'iY9VZzvtThCz5mGimQSrs9nFqD7NCEeh7Rrmd/8Qy1UUulJbnJDKhh7c5QIB7wiYQVcPCINMCU7E'
+        'wtVfCsSf0ANJkiyd3gknINAzvZTYP6KYWHc0EaVNAT1YP/kndr7r5VrOVl+N2C7AsiYdHf07SJPa'
+        'mximgovzLgCoQOupujQdc/jo7jNbBvDCmHUVYtXBcj0yNsBULgXYJpswc5A+aPvlw5yeSDkB0qY8'
+        'rYfol1AZo294Qz4dqY1pX9ehzvdQzPiKVAvtuDfz0NkMocl9zc35BZaAj051HHn0HQBNGowy+gff'
+        'bWYNqzghxnoj0ZAWjd4GrFNB7wIIip38OLehDOEdfPzH86zTo0ljx/A2tmhtkNXVUp3K7A6wafFU'
+        'bkSnec08zismdeWgp7Z7DjqB9eJhKIUGM2ytyQOQNtQNL4q61y4uOqckCbFguFPC+eYm+4HSay8W'
+        'ss/964h6w9Jn2ViGeZc5EXzlYrKbNvkG/JlHBsKFE+L6HX0eDgm99oSnrLid/zJTAqWPMlhGHzH9'
+        'z33pJn5e7kmvMsEIlMoKtFO7TkQora4GrAEaDyBw/xOLGZ6M2nEO8F8Q/v5u84r+X+HM7kO7Z/cN'
+        'jpQKnKX/palEFYuXXfs93H4TpKUcu17Qnu6oHpZjj+HRRIUd0sKKKeLgzW9LGFkdzqyLnUC393N0'
+        'JIj/AGgXfAS7I18k9xsZBBNndow22KN2fTU8cKV8Q2Nhz5QulzlIwc/pU8L9KSu+KyqlW1SRvhog'
+        'dspqZMsBDbzx3+LetUuhnxEX4G4f9Cw0mMl18xUi5IBY2Ao/qyON8IMAyvumXYIfC8w11hels3vh'
+        'UCdoTdNbZSIVNP+QF9p3A34NRBxLKzPqDPCgUrNeFFp32oOPXXlCvsdVDB9UkK4pZ4co5QuqGpBz'
+        '/L8R19sz6LqtVy81BB5q7clix2MessIIn8ut5Yyr9X/5jCr6qbQQ1/AWBzMtVxGxna+i+7xTwbI1'
+        'foMp97JT0VSzGUKsG4bJmujObIV5ntYTvQNgXbDM8LaSlbrvF5Q3/bHNQci50Xg4PoY6tsF6qZES'
+        'HX8vTLzYiWcYln0qe0LmtTUI/cwEfa4BE9LcYUI+sja0vQZ7eg8U77IBgLdxjaW+amJnuRL+NwF5'
+        'DlzhL9Al7DAAGrHWK96NyQmWC/a1qWHh5w7AWbERfPR3mRP4BqiKzBofZ7Cl+h0vyrkMnYTvdmuc'
+        'J2xV/Otd+ddM5ypoGEhP9c6zbFxZ8WsTJc7CUmjqSyA4tMoMJOQFEOW+3RyjRfS8i38XK5kazpt7'
+        '82iwvNwkiqN3SycGfXL/uU1CrAD1BV0Sbjs4Pw+sbsAYhgcHqYWFb8bOrE2xdcGaYKs8iC49Bd0R'
+        'SuX37BfdCEex9EnURghGVJBeZi8j9olObltaA3baJTqvOnMCaGuBJiVkTJW3K9trZbC9NYhEeyVw'
+        '3CZ9ZxM0C2zB4B402mG5sbN2wDgqPKGN8+yQMhCpH+jctmGHO/Jmjsmj2ADftUhxY6F8taXKsRkw'
+        'NmxqSo//kRkSC6aibqiew6964uyzjBVkd1DQbnOB6ZblYGPqGE6atVMdiMjvaAiul3tzwtTQD3YJ'
+        '8weB8p9icB3nBYWmZ46QNp5q+kutT1GCv7ADED631dLjvwF/ZsFKKe7Nq15cvilGcV/bztXNaKkE'
+        'oUJU9kyfZvv2njw/C6K2Y0gbx5pNaCqFUTiexJejVzf7pNOShcmJuFW4fYCZ46cM2cGpEc2j58IO'
+        'CL5MOFu8g67G9awVbcD/zAi8NaxjluNLBNS2DiBak0LHTN2CyGa8MTnI5xeuGeeDMQ6I4HJf4do7'
+        'uRJvZpramSbihOIVKZH3GcEnOM4ECZyS/WBQ+XBm3TTdO3qRwt3/D0/kBSBIgyWP2N20GpgDxa7W'
+        'EgOTFjctfyxb4dioPO9nPCqyMbmvskGgt6vqqjoQZD5BaTX8UakjnTJaBw9FQ9mpcy6o/WQIX9GM'
+        'ypOPzr90cWVlmWBPqa0exJgsSQfu4ei8p8u92pk4Z7QXlkosUSUiqrKd+uLH5+3Tdd/JEtoForWr'
+        'a7fumEmdiV1fdUf+76zxOxi8BDmDr/luYQ3UHevpYMkWvHoulRNtW+fQYwbMBv5Y1vJEcUdq0/zB'
+        'RlOV2BAYkVXO7ROMB+TF9oShLGqeu31MXa/aAQcTjYmWxJW656VLWqCtbdeY9P4AykB4usXfEc4c'
+        'xDWqaOAANnhLR2zhDRKgWMnBPhf+VSc4ySgn6l6upAMgGfD5v41PLDyBRV2GuM6pwRgfoljMxpuD'
+        'e3/VnvQOEZLh47JMQStowB2dkX71NGbLK3DC/gaJeCLxyI9VGgJ4rQnikW5htdIGtT0v6PCvwggs'
+        'hdxJ1fFr9L+rIBcaa1l0fsr4874M2y68p0ou2qTWZtGGDkCdodKwD8v2sXicRB7eowMbjUR+e2mr'
+        'n+X3dNLpAYVpkdaCVe3M6GeLpzyRkznBI1Lp7OmIs6mDwjtN8qnh4nK9LmuNEnnW7DbdweYudxpq'
+        'Z8YcHPyEEnLyW99XODKzAjX4hTHYXBpZwUQAZoTEqSP/5es5MMIV/tlbv7otrcYtchnwk8OaYfZZ'
+        'Lg51ePYMuZy6/SfVtNa56qELDgiP1LL20GB/+p1joISHiTo2ekf7dgxBDG8u3KYSWubdMqeAUOVj'
+        'gTnBEneO5IDFEiVCtmKQ/8PKGOP4Sy7lf8yacZ9VVRl0kXwa8+agZqfH1S3CP/ATA/ibr+9oqkLv'
+        'EUTFVcCDmNYp/iF2zUkCZJuWcUlCpWx1Cah793JySGDM/BCdt7CdKyhNtpHKFsytsYnvObybUWFg'
+        'PVIWruSNJlqj1he3fpv8qBfOOD8ZstCC8iO4EiwJhl0AcoDoGnDemAMgs/yTcc2hHtsrhA06DUcn'
+        'bTobJ2pGTM7CMqLnqrFLd+VWzHtly+BFzZCwg/VkurOkbnkbyYfG/+2RIq3VQZlOHbkPpFUcb7cY'
+        'rVZz/i3HiEjeFOnIEwGWMytaPdYbE6tkGk1xfFsIGt1rdBAymRPwjqvRVw5A2ExDcFKH0jo+CzH/'
+        'pkIUsWFHHaU5knsnDNfxF/6XgObOUZahf9xsi6S6drDLtyD3JKyf+4UIBSs1c8ixK2TYZnB5McDH'
+        'm61B8R/IIpjMQvhAhOF+73TJNs7nIdH9a+VgA7FohD/NZ4qf6j4jpXfpaS3lMDlgCuYF/qFx1XzS'
+        '8zqDze0ZtHmaq137RWa5F5uPmVDFcjg8Kg2d+HniHEmw+eDupOju01DpAdoRlMiJhk2utCGqdxmN'
+        'np4sXwtBYvE5y9JaCrWoTARtemPPNGCdKeKN2Oj7otsKESVLlVyNGf4SG0FS3yMIC+RANuxXnHJc'
+        'XlIqI9alcLcbqaGzU9mhlPNwpQ5DXL1M0xfLBQnzIoRw3Xh2y9TLZxhDzJIpHmqMg3Mty98/sHSR'
+        'X8mMbnDlGkfWMPHWOBjBs5QM7q5wlF//9RYOmcQYwC+fH2L5JsyF91D71Nk+WtuzHrzMTY0DwM+s'
+        'Iz5yBN5O7aVSw42CjEv4A6wYRdIAJiL6yOY72/QDeO+54Thfraq/+4+NKbEbFN0UUOI5j9DezSSX'
+        'dVB3tKSlceDmOMW1S+lLL1TzEIYsFIa5Eto8ru8GYyfXRdW1Aarn2lYUHvtxOqtW2HYcn7lvQM0p'
+        'DoBN24+PkWRntamlFFxdgRwrLfaHi5/79sSJ51clGoCUcYfUraTQlFIRfWJ4kcrPyRORpjzwg72W'
+        'cppp+d0S0XXCcYvV4ZzPd8KxLpfCNg+a8H4z8vEdlX0NOfUuGNpBFocUuJwg3fK0ixfmbdfBjMmQ'
+        '/DfKeTgIRQd0bAThJVAu7ivfPaqBtW3y+pXypGXB24RO2wHyTHtCjNvDzBdG6IXV3PAqhoEY/KS+'
+        'Gn7ghUJ+u4U7e/5oN2+Cg8R0JaRq/ta69EO2zMUj+iibmsJkf9NxbkAvwKja0epwWGuI4Unkazm+'
+        'Ea4jTnLybzLh8E8BzM6g0YJGeD2PvigP/caAYE85lBsWjmjiXuS8p4J1m3bGMkTQf+0EuO6WPQJH'
+        'tcvaXbCh4WDRDeKKzwLaKZYHDw/VSBgDdGkAljZdIh1d9aufcaEzqRdoa49u1XG6nlpmH8MSERyz'
+        'MVvreIxBt/cU7Z36gQPwUo/qXy7RULU2XT7tVBjPyX2dtfiR3uyiJEisBv98Iu/j17i9UMRUDaNB'
+        'E8QrQINEo42dPJ4b5XVw7DzPagDLNNmPAJ0Udh+CgiF4+ADvTVEmYKpoOUsksMuSWAUfhejvDA7y'
+        '5fYfHkClWuzdkfdEBrC227z8DeDRqtCnAxSgUADjd8ubw+AM7MEb5uEcdC1EIfggOnMVR9EmVRQP'
+        'qer7qTCszKGIMXLqoLgv9qgFhTQxavQCypjlZr5RiNx1HKHFbZ8Z/8D4qY1nhCh/lubqvCyE9ZH8'
+        'H/Ga+8nq+QwEKbEDGZtNy1WjaQM+eMY3MMr9YnyxTdlHJvbJDvxm8HTnoiSy8G5EI6eEzBuSqA5L'
+        'dYJAVOQv+ZihzDHDWPPxCLw5YOT9XDdFPGmUhCt6d6QyLdw2NaPPduSB94Z+bUTTxYd1VkmkdaQb'
+        'LZGBvLCmaIY4xuizIOuXIBaz7vSKAhhHdXrfaN4gskyoUVOxZS/lJz70NUbB2qsPdfeJJWvUEsel'
+        'FcGq8nn+8D1CK7n15cZkBbj+DsAI3zRQa6i7mWGSMAs0zbA2S2gDi/wu52nceFvi0epReM+FHzwy'
+        'PPCYIz3Xz0ljZInLtQMYLDHKasjA+ThNfeVHvynwPx7jdgNgoPJMP0xkfxXkrqUWTB4yUktOenI/'
+        'eerp+H5i4SfVyo23p1Ja+GMZDfBr7KTOivf8mPVV2xqtcbGpIyPvjQZPvetiZpP6Ecm6U583D6Ko'
+        'ej5xAmtAL/13hNo9WXXRN8jfSWdsgELXqdl4eK24ftWDzvsloHiZ0A3AHYwikDrdknswlmlc3P6r'
+        'l5fZUF4t56TpLu20L8t2fX77tHQHuVIpcKJWurHz9DMt32K/vgetwg70XxaGA36UzSGYx/kp9SSd'
+        'ALxr5Z1HFQIUd85lp6qaQKKFe3g99oVWxfXcntTyf43a8+B4gX9l7YvWeG/TFjdwciiSui0HJwq7'
+        'fW7ZW3llPuw9lFdTTjaZW/0GjxsiW/eBzYRubsDOihi8yjC/z/ECu/52n67AUe8GB9Uu5v5M6fOk'
+        'wJ3BPntE6ZztfvKPTgjVb+S+ComO1a3lSPJb9NCpovXCKVaIr5LoVgcilpSmh/k16YTordsgVF+K'
+        'FZpIDirP81CVPdRVXanaXnZ7Ox9QIFL543hPJoc4OJqJj58l066tkcKSSq552J8f8Jheve8hVm/2'
+        'Mtxx5wnP1SG3weZamkKioHBS9z41+0x16iARG2UZTdQ6RCu7BGRsbIsGZCak1h6RMpdn2VgRCPGY'
+        'BWwDoIGE2/dDp3cWIlV9msdAbRz6rbKhxG6oztzy8lqLSxlNakJtqUIH8wLNRB4NXPpvu4E5UnLj'
+        '/DRjcT8fPbSqjh3w4/22tWbLiApxBIsQUCG2Cx/Zj0A9FLUTeL+XR6CuZdmO/RtGe8sdssZHCuqI'
+        'YZvd4EdPVFylDUAZFa0HoRf0Sf7xG+9X6pRqO1+4UfB11z2a17AhiwMT4Y71uR8d8LcK0LvOG8Wm'
+        'X+mA3fFzuuqM6yt7ebzmrCaVLNtroeDpGbZf3fDifI1xOyOQ7Y00hSfHd0MNW6yLNqe9tWII/hmd'
+        '3ymy7NFo7xbABvY+9QDBajZgKbsleb1RmGv/XTplcfHtjPya6Czt5R/qlSOMPgIL6wqnqgEL2PgC'
+        'GOM3gH43ahbhSQwfyO0k6tNzWEg0TXkg9YL2w1HaXE7ZTmY9j0xp7enjWjNVSy/GQu0JH1IvZdYB'
+        'oFHOquvUlJFPdfEM8NnL3kwNlHrhIAHZQNTbDIMMmXEVj3zGiBDJ9fo7fCNWzRjoCjOjG0+08FvI'
+        'JGiU7WfvXnCSeDmGdxCU0ZfHsHLivpgyNNkpn+lhY8DUqBKX0WUN9ou0XNMxMpZMRz3mSaJsJhSw'
+        'bVfKD18eKtFowWhQ606Bk2ETJaw+148KUHTRKGlgYQPAV7mxt2W59dPr2XU+Liy45ub80+6mWwkC'
+        '9VUcahKMFszOAo5h1S9vHhOvSPtXcWrkvzI5xZtZoMWo4W1ygfllBAwpfOmb+7b/KSpG5HYJkqfs'
+        'dRAx+VQq2bSEA/GvNtGj+/YyWRuijQDUfDZlj7aAAe7FP+3f6v56DYAF4OaqtFeG6yOVQuBclwDh'
+        'fIVCSrq/qjZs4seM8s9W0i2SAWb3lxsIc9EvGlfs033IMEFH93clBigieL3msog+311Ba0VCCBOb'
+        'TNtDzzYFSgtXC7F27H7ZAgu0O1d43a3/FjCuf3g5exIJOwCqYzE5PzGvWR4gJ8I1EJqkFlvsQkjs'
+        'JJ9sYRIqnEv7aE2NG81k5trDMQqAZOBoLI5vy0Bl2VB9yuHWyveH7aumWYIGMu7FBMJ0r2iocdus'
+        'IPNySAikY8l6SGTVwrNXF1oRI5NBva913WnYOgqunztslBSagk9I/H0tySCj2pxLAYYh3DgiYtbg'
+        'ZUt8yKQCgS3Vonyl3cyA+Z/DR5J0qVP+Ns5aDYVl1QuNSv7cmq9ZlXbQGdaMk7IoailIBukqFHNl'
+        'HK92GFuVWI8kEEdgxueO3GctIb7vvaFvKJnHBuT3WtZFqeuu4K/we1X4o31BdhJUBP3T2j8vmS9b'
+        'nfq1R/nxVgPg0MPyLgCJlid3sb8e6S1eOYes5sioMfR9BgUdeXsZVutmUZB6HGyBKwd96FiULRLj'
+        'A+m2DL0KsOZ7VbrokuOBRZtBzgVeIHG7UBCQjd0hDvT9clZNSa8pC8yOtYMANpJszyzY1Fow7ebT'
+        '3A9BWWEokbQk04eFn/R6UQ3ArY1Ovp62U8N74YKdxuWDi4jDzNa9HHaGC55bZ2LSkOci9mPZo8Lh'
+        'qIGzKgQRmtbPVmlOD4EK5Qo6sK+2Q2y0UFtJ8Umrv2S/dFA27Fr1T86nuQivHkiUB7BV39Zv2gIB'
+        'DA81m4zwi512kDeX89vofvPj4Tl/sOjsHDXgXZkcfmAxB+Ml1QSZg5snTZbYZSRNunRMPPQwnDrQ'
+        'TL73OlKdapBjxyJXrL2+SWv/e98/G7+jRXnnmLoKDue0u9kGjsMccdjoiYhVZrdcftU3Mgm6CQcX'
+        'Q56mTz+dpkG4fvtjUnRFtjAKEnIW5+GqEXZIF8dhgOGJ0NNAWZwXoUkzY6CY96cvexxIZm45sJJH'
+        'UrFsqDFNUxzqe4UiXtBAlYxGfa+Sjfp6Zq0UT8N0qCl8rUKKEEEpy3pHags9ukq8JruPhglpGlmN'
+        't9VahmPN+IurVq6K22rH1cDbhKe5CagFCxWDv0qsQE9EJofdLgzoQTvCuEwDwI0KWH2Ey5QWDy97'
+        'bSYocOaknYLJlcV7GBtjglu43Kq+85KQ03GMVkzSpp37BUMMCirl3dWW0RcT5NfigzkEgckH3u2L'
+        'dZlceHZxJWD+qJaV4bS1uJJA5cw4ZP3U0JS2Futg4/gu0Fc2iFY2gbkq0G9l1uqnqcpqY8ooDYCV'
+        'm5eqWXAasstQfMl+fMrDQyMWdncvR6LF/kDwI2obr2BcprhjQF7zHB3gO/T3wmthyIiUlFCqogLQ'
+        'yZG3XmuKcwIDLEDHxSfjaO8p5YG3zoxN+brcFPm10F0hCBMB0C54KkrsTrPPpBo9vsaMsyIDzIJt'
+        '5dHXGFr6ejQgDtHojKJkJr1EBX/gyAIGWdQYzM00d8BrY02JFkAkoUzvUU6aB1CTyohPH0TdXD0M'
+        '5k8VvlzBiPyog4/OyXy+1Q/cwn5kC+dw68l6NuT8pAeQh/R7fKUzdIZOVNpIBFxl5YpYLlbanWZz'
+        'pLOefSf7qnC9dPE7vo22+EvRwA2ihcitYPWwg6dJxgfhfjvXnoLanHzU2VxFVjK+wWVrUbjlZ9sD'
+        'KISNV59Uj8r5zhzz43pVxxij+ZdyQ7I8svmfkeA2+Z0U2caSl6dqwYDWXXbhOU0ZjkbTjfqd3m5H'
+        'BTEYzUg5iXUWnX4+/hkTU4CEz5nNAOoZ3EqzQgPAhJlMp+adfgJSsXZPjt+YCD26TAVEX/XMnGgg'
+        'PjPcQ/0G2iSMQlo2HHJ0eVAhlq9N6zyZadW5Wtej4RIUKE/vlwVaaV9f6Yz7aU2hsRtC7dP90WQW'
+        '57ni7hFcRt/Q8SFxviGXNyVuuWbA59xCRakTxCzBLJslSAwuYOcADYDl2FWn5rl52WPYcAyd5d2Q'
+        'affH8B9ciKSPXo0UfCWplWQkPlAAaxutnOXlCDCEolU6dR2i7c80SkxHr/YSY4XMe8lKMjgI0Sc+'
+        'aMGzu6l4zyckMU1GpBngayCBsoY3qvO9yvlf9fxF1pmLDgDK6+jSaQIb6igY1pdNONwzQA7lGHli'
+        '4hpGFWnwWvSuUIlnsTW3qY/9dgjtwjedpKm5WiyjjijgsFmwDSz78/DtCBodxqOo8PorJYJ2qc/i'
+        'iB4fbD6en4yzks+oq694anlAXKWYkrFTblQ7eEH0+aCJrAPhuPiBxWlDw60PawwDqwumDJYcm4Cp'
+        '6/AS1M6AVXHTy5P/7/wXo6FhswXA4JR3Y/5l3QV/n4zMeRbyjp+bKnn1bx+PTLv43qziXKQoSkWF'
+        'dDcHuuZYOuis4mgeCRpHMC83HNEcFC4NXejXoVVhgDBOgR11Iu8nuIWp8YLzlkvaeBpYUVvHjpgT'
+        'Om3txknCjnr9Dqw0VCfgOAOA1pmc4bxq/Cbb8M/0VbDZ/o1/WcCQBrobfNY7XhRZeZpdGb+QyuZS'
+        'Lhv7MG/u7fiD6KQ0TwFWT7aJvi5IxxpMEqQtY+yxmuFmgHIWbVOZpnbJxhh6ypNRbm7JMvqFe0nm'
+        'OO63nHJxSoSKVEVstMiRTDVePFtf0koLhkjM2QwAYRBwy+oZuhaFmcunBD14F8QTqgu8M3czYkQr'
+        'JiYkPbhEmuBvQzZzHtqpZJkJ6x+gNZgXotcAa3qjarTEEPMIaKb0W9pEBQUC0Rd8h+gyHah5a5gv'
+        'd2BSZ6zDN5+o9OuKHMA920pvO07jv5AxDU4IgLBkMxQITfMA5GyQQDPdUvFdbV05pMtHAzeRW4ua'
+        'EdVQhfpUaUKnu486JizZyxJExzL1an9x62p5xkhlTJ/fDRp4AVzCPP9NjYPgabHrrLu+4JoDBg6V'
+        '/OpZZAl0fDOk5NJYu4oTmGZnAYPEDg/WMUdljN0KA49NTa6eSh+h7pP4kDg5WspXSQKAaMxGtkc/'
+        'loNxn0s2yxVq/siTic9nrNxw894GtVNhxU4RDxvY4RCKv9lk664GMUD7mu5dJfD/vderQWSVKg4/'
+        'soekunpqXxGttqb4vZJ+Cf1o1dGv+I3JvEuXPXh1TWq6kTRjhvOHAaWMN4vGRIQsBwio25WCndua'
+        '332n3Iz4PS8DRoiYxc0OcfTUjxQukxOvCNAlgMvCIJYWbGTD7F0GRg5J+0ZRfGtsXx89hcY9vsmQ'
+        'hxVwUG1iqEgiBHw8O3Pd5Wb+VrLcFVUsZzlReIuXxbNzgzQ8xR0hpfV43UVaCXIJLOclMPG5ZgNm'
+        'jdHFd0Hj5JZtbDsW81ek+n9/rHOzDIwYjMR8RDGgdV4UMIFZAY5YO+hRGI7P3dWvcutAMXyECl1D'
+        'iHbTvwo2/63Rq65vRmKo/iFFuoVOJ/QKZygUNvbjIZPqTUQM3gWCj2kRQvN+xwsVob/JtX6kaGJD'
+        'l57op1ZfH1t7T4hojyCxmZhcN1hV3xI2/CMgcwmWRSntpzJeJnxFnlVZRsP1dOYvShHdCkCbz3hX'
+        '902rjTcW7gWW+CZqrYR2QuWnyIXucBiANPWHpfpUxniGDHl0ybJZVoSR3a1cwjar0VodwgmiLbEL'
+        'nqFbnm1qwvirQq3wdMbXlqnTMXRoNqKiRJUl6e25u2WYObwPJVAqg56usgBy6gjK1Hmb5M4zOzx7'
+        '6nISieXk9xy5aK3yIWZwL/K2Gk0Id3iXxECiRcLRvSVCJHgv4QXNfw9awTJ7CCpW5cXnIkAWLw8Q'
+        '4FoSlrqccYfoEa+MnfTFgBqM1KhF7W4j3NaQLFR3Y7bl6Hu4GiA2D/bfXkSUeP6eGd1cnnNfwL4G'
+        'pGvLJQN8Ccc632QqoIzfRg6v15iQxg+BEw76tvEoCGUiqvF0NqqJmgmmwTfpddEp4OOWC2vCQrcp'
+        'jIY7IIX223V2x1WO56F/u3FfLRV0XE9RXxo280YdnJNcTEMOL5mQJBo+I3WicX5tMGl4BsvcrANG'
+        'NLFJLnb5EI3S5xW5qYRzTNiNDBiAxWMtLzSrZPmWCcYQ0qbl0kYqpBdW+d/jTlv/cGMUvWH5Yq/H'
+        '5ZGcfgWBp2XYH4saYMsbPx58EeP5SlOZfGvJgpJHJ36OBBbqjej8UmeKFoILf/DLgp1SbZ/qOKzN'
+        'pgtAj3bzYLLY2ah9PxfJU+PtiJRMlAyh1vwyCySzORIyzsSQ5T332uk3wTPp0ofZuWJ6mmmlhw39'
+        'EUCUknTRv3VdYzNuAXjUCgw1A2gH8KiVvnF21+8sFuz59BFpv9W4K69GzUf1QzyOqCQu9mAylsOi'
+        'VNKzXy9p6O/5tGyIBgcqQsvemKeEw0GMW2qxHh0S8uuvfy1j5N6io/kYurv/tMcEuC+sVwYm4pCV'
+        'Gtx5unm8GbGdG38eLfhzdrcK6JgXg5/sBw3yd6IumWAkAK6qqbjz0aSEwbGfH5qz7Ryc+tEjvOtE'
+        'CIxkC0aEK82h3cwsst3O9vc1deAVlLydBNHuWX6QFXqodMO5X6NQ93YikRmjU3tjSLi23ggikbuR'
+        'aDmHHAN0KmBcoW6j/tRF95zIGWFo2dys7JYVR/uEbrj4HojiPK7nqRA+gDuucd81eTeR385zQv4T'
+        '+CtxoZ4kSqsHaX3VpDCdAEm3hdwAZMg7muR0nS0BhsIjTOM2MVSe1J8ZUhjlWwQEeaq+gJFEFVb2'
+        'CvxyIXlp/ax3byBBlW08/xb1aAyogg1UYRCCWs4g4Nei5E8sSnQm7nKjRItRW44kvIS2m1KnYOn9'
+        'ufFBQXnpcL21klJdV72VY/RLz9BuTKa+TTXtHab1AeWbH5tYvk7GSng7x44iVWb23PE232PC/3yH'
+        'uJwM+ZhpHc50SbuRSXFO+cxN0DddYbaFqFxz7y/p/vFhfzFM1zd7Te1/Uyt1vb5UKSl0uClNTnl0'
+        'dCxIP098axF/BQgqkC63FXFKWZo9x2vo0zRKjo7yF+taTi2yty+CeS+vaXK3tlmr5I0wTTANXcep'
+        'xNfem6/aL6+ZbbVMyZM/gF8vaAECLYgLTd5V1ET9R5KA96R6fv8iIa8JvFJCty9wbMVIbDnh2N8M'
+        '/szUAPBUuQTb2ZRiNdVPYf2kBlLI+LubDrsGUlOElcHM55chCVlXNPonldYal+ia5jZ25eIVIsbg'
+        '0tyZaey/iLy+TOIViaobHDXMLgFe5mXe06Qqoryo5hpoVtX6tOFZbGwKhbB7TJwcj2eRueAdS8O+'
+        '0NrACd0lcBMDuNo0YsLItXg3ZQA1Q5iJjymK6rD+TRB1FgUoGVUhJRp8A5Zn+T2SWTabuKsqQAgI'
+        '+L4Ts6N9Lvf/oISacAgftA6L/fVAK+I8DOsN8q4oLABgxUiCq8GK93SQT5kxdtAzV9Hos2l+1E6R'
+        'lxTktKvTxRd3Mb4Dxm6LKXVP2SgVJ8VEDDCAzLfoo+OwI3Sw2r0/a9lvxYw8/H51nvHb25Ya5pqy'
+        'gU7x1yROWC/+S/JFUnsvTv9Vf8Jw6pexFslcItKkxH7qmNesAHqsGmtG2VFBGqDPCrTOaBi8QZol'
+        '/Y1hCPZQhf/sUV9p8duArOBamkWw16QxGcyas38JdNBKDnvly3xS7zDuCgSAl7N0RLGgRYhsmJE3'
+        'O3yxKwtJIHWMZP6wtXg1rjk2C8aY2ktOp52g4hAGCVIaFPbBAarmsrQtD8lRtETFePDbgogJTe1T'
+        'iqWgoQuwqtl2OFzhGekSE4aQVoSP7i17C75KRBezaiTAweQsfJaOlEEoMnL6AoncuwHFRK3U7i7D'
+        'ZNdFgUYZ7DIZMa1IpWlsAh+wUhakRyYB+0ds4UcFzgNC98rdBhkABR1d4/LWE8fbinJ9N2pv1wxA'
+        'A9QlOYTl8jQ22LJlsSaBgxDIB3rCjrCgqtMkihJNXkMmwkq3yqDIRh8CpvmxCro3qZCqVTkNEYwV'
+        'oE0JxsOSYhiY6juRwP+ECgPEgRhoMFp/FY2v0rExAKB8SP0L50mAgbFoT2sJwI9XQ+wbGmj+Xh0P'
+        'MnmWeauxeRuxePHL3Fl28/EpBlrYkMmtUyoseZptCT+/YS9wtpWmCbekQfonCz48GhnW3v042g5b'
+        '3W4coek/xOxq/Ooy1twrPfg4z7saseusHKepFLsmwkMhDAipcVWEvqNYWMYvJpJka5cvsXbtm2Ax'
+        '9RDjlIPv6liaV1WmNVYeW3DA53q8UxGQAiza2PpNrayFdRysLggfjHW0ng9x9At4FW0m4fdWNYTi'
+        '7K2QVZVtfzuBMf/6YxcRCpjMgRDVK2Tj2Lut1Kkz0/XZomww0Eq4LxHZd0z3hLSS+GEwBEF7kDCk'
+        'GbrXnlaxgO5QBmyx0lUXOyRoFjOWxuPH3+GE0adeMXQeQbsTO/4akkDW9DnarSY2JWPeToAxX7nm'
+        'U8LM5MTuQjoT59UHiEp6pR1EqOXFA4TcxXteB4biZ/GT9DJgZ916Eda0+2c0RHxiC+4Zajp2D5Pr'
+        'B3YGF3xCF0sx/MBYWOYAlseK4NjgK1oxol85US4pTogg4/R7unhYF8FsttDfbCd2DFMma4buZkGE'
+        'AutaygjYHuEn3A3m8BpBeW/mYYIZ83mpW/Orw0+fgisX9Gorner50/vde45iNKgpHuCKYjK4rW2u'
+        'ci9hOka1sSonja1S7f/HgtNWvSYLsOSWHaDEAQNIkcqhw2n+SBZN7ni2o+2FlF+Ka/cf44i9GDLO'
+        '2Dgch274RLQq4TyQBO3CIRZ3dBway/qFb18Mn+nUTSnK91ceeESItSXP9NuW29Bbux3vUVTY6F8H'
+        'Wdix34jcGPge8WbZ050PySLGe4md7pDeCZmTmn3zTcM0cX+zuTgbBk7EZFZs/gtQMVCRgdoLoPpU'
+        'gwBlICmzEs94ob9Y5TpIowNilqP0qtOpVOoXeM40xGZ7G1zeOKR+9Sh1HpRCqnBYDJOn96pUxHEL'
+        'ynfGqGZh0CVwYzgU87HdtEP0Iw2KjKX1y1PvnJoL0ptYiY+WrVXDi6dCVpwBERX7mcaT7+N0hjU9'
+        'MQDuLRRC1y/sf3IHqyXyh4CHPVMJRZ+1MvWKz93k+z6dBFkp0TDdKs9cbmyJKYCVz8a1605vK7fX'
+        'sJxiZoI1kCiD6xcOgjPy0i+iVr2Vruo7vhivS27V2URKPwr/Av30fSZNiJ0lWRuySIifqGSxg0Xz'
+        'eIORjXBbY4zTWL8xGg/BuVAbIHmy7LHv077oQi5HayzK9PCs0Y1lJ/mgCsjs/Dw4h4R3yV6wlkpy'
+        'TxJ/stUByHhRSgkyoqSFnUvQuGzPCq4sklQcGMKd/zIgO2OcgeNx6v1pE7c5WiCVx5RUjovLf+tH'
+        '+R8NapyUWdizMSjSXpS5ifvwmjFyWB9GZB3LENYuWqDsVW6W0Tv0Bd7pLfkCCH5qTaRFx3r1TFnG'
+        'c4PU6TO2v99Jko3+wyDIV/E0X4KOnoBSQrLP5Ua+dbjyyJJplk8b8lVlh9taGzryLMkmwWMK9XtQ'
+        'nsVEnSIEdPof174QusG0ftvcMuWfBx3iTnmQjnHFd3V+GgMtm60E0YdfWZyBhq5Zdc9AqERmPVNq'
+        'e38VeTrcC5BYLF06pRVo/pqCLRx5642pqf0KYv7ZCi8RzVFh4s4o3xEKXYe09atMknh9Y88duJVq'
+        'WunsJ+uMJSqLfXYir+GXJiz9VP8ifrKHp46apNQ5C8OSemDNMWZWC+PQWIw/z6cWmCxqfQ72Jl6t'
+        'Z+nOgQXRXY38FFlIgtqDXeysUanmZXwdTy/Yn+y3/KZQwUBqpXxcpzZ9oQLMdZJU147PCGiNNLoL'
+        'Z+PgCIdaOXY2PfJgrTQFPoZPJrs2ZEGTKaFVORGaK3ntyRww7GaO1fxHnUx9DQj4BZZIJ3f1bjjW'
+        'C9VhvtkKYcCo+VgpdyfqlnMwg2euDsq9Zs7H+hd6WbJTmbOMo0jciaeM5LW8EPEGdkHM8K3GEtbu'
+        'MkpiD1Hq21GwbnU/oE/6GjM3U7lTfEWCR8rcfrnYMKC3dhm9pjrVF2+QoHQOrmDpEL320ppTyvpd'
+        'VeoVk7ZkUz52IqjfqPUe5Tmhdwci8sE9ueoq5/SfAg1vRtlDK/M6cBm6ZAume/ctGeYoj8WZceyr'
+        'teuiZMm/8AJwKq2UUkdNFDGbn1OmT9nwBfakVeEIuZ2rGkILL8uj7ZJ+3PLMwSs8Z6Y9A6AcGCmH'
+        'NRSSb6E582ejTnqYlVpMTMgJqpzs+E3rZoYKrQrmmqcpNl4kjlmnuUM2YqC0B78GE9NqkWyIds2o'
+        '8UNPeVu7Srnkedehu0MEex9fiRhnywL/5Km6C2A8uxxnJnhZ/MabAn5iSW0kl2d6mYNGWpe5vC/c'
+        'E3FI0/GqNcMiEAjaASaFHzEmf3haI9RELAJ7oWUdiQia+Ws3wDOfK0cVFSeItjb9ZbqVxZOV/4kd'
+        'RkVlEsZNZhQZKuVLfvZN71XQcZd3/xUKQZIJFtfToAA2/YTEBnq4jUM1TADbeckuTlkjqtW+p+gZ'
+        'ZA0QAPfw8+YKkIMfGgwJ90mZqzgfUus4e1CCfV3A1lPY4waZSbkCW1EYcLRuvMk5+HkqYKfTfEb2'
+        'heM/hgr1Kg6p08WnFTiTe1ceXN1UJGEptY5QkgvWNgcUOqPZZWnfz9DOhkN2pn6eb7auDw0yBw5K'
+        '7n7Sd5TGh6rMobrkn1yzXXNx7wjhuQY6N1xUmDFzzGzwBgaSyXWlwacAIlb2KsxmdaBgrImCzXOr'
+        '0kG1QRcd0kGoyJT+LFhN/go2hW80PE7sSRLmh+Xt4cEKEdINDu0xKpYpWsct5bQn8NeiyWh3CaRx'
+        'fXZvWPUG5Oyo4nXJO/LqF9hv0wH1oldzXBxMKzR56AKk2mvqvpZLMe658Nw7zrvUXDYMGUdDbT9o'
+        'l50S3YNtMAPRs5PdnkoLi/K5UvUypUFXt3t8ualbEnbpjo+7D4PJlFehf+YTURbcP/NadOb9cAJI'
+        'vKBWAlfbkbulx85M178srogzLutwqNhAHa7g8oNb39vUYYjvz2BveAS4cBRy/Sf65Hi2mQtIqLaP'
+        'JaXiAiZxFeqj/Ay/l335Ax0mvs2nNJhiPgMZMJiUjiqqw0ye8Ln0xrLTRPHSxTKew4tKXv0N1L3c'
+        'SxKkZZevNoWW2kzWrCtIF8Zx60hDqhM8urCagwyWupk2DPk9D3SNPyzy79lXKUf8hARfSYdDRKBa'
+        'RnKVAmeeuk6mvXebIM5GRi4U2/H6oQbCeUTvljbetRjsm8Fbs8kpJhL3xKuu0NWbCrWmDwkHd6CR'
+        '/OHGFxHEnbGpVAaU+l9wnmWvwu1ced56Mdj9hhF6GStE+4bB7FJNjSeehBRNKLB8d/9Bvs8gOToF'
+        'j8YeA9Q6A5Ujd9oRQ3LKzeAwoGwVvR44NvpZ27ySZagBAw9nl7g46RyHozPuvxaPAKZXi4UZ21bY'
+        '73LhXmurQmC36WKvVRU3Vi+CWz6hXBhpjmii+3jihrsMhzApyXqwpqqcdX4cHN+deXwrsdh4Jpv0'
+        'F8qC96icHfuvAjfR/GpKRWX4esloxoqZSIuLvrWznbHmRG7dcwh9Hq1E8tYCNmj/eGUKS+Sh2WUo'
+        'WeACKLLMRSHMoP1k1JurargUfX7TU2S+s0FBs1AdJLS+dj84uu7IhxVF7jWJ4h946zr161FviLF8'
+        'eWW5jca1nNxDCy5qlQfP3iwFQdLyOC7VFVhaNQnYYdkLqLh1wtlEYKnuvUnPN2r4/+vwAcd92EjN'
+        'G1Y0S/e6m5t/Fn7Y3/riIxMr350YNlx5CxAXMHyO1euBLnHSgcrQaub6nFivCH5CTbQJMhj2a/dH'
+        'ugILVrJEtSn+vh1F66lsMumGgSM7G5bSuHjXQVU+DtY4i/7fr/1JsGFY7RolfcHddSgfBBSFMu8Q'
+        'bSzU21q7WdKg78aZ46NBO11O7mFgQMYYahlPm486PEbSim5wfDXlb11nu3x0xS1kfff0/cXsvbYA'
+        'tCGXUecA9FsWmkmjavGf9I85wiCmJMC/RzAKUtCgXw3Y3rKaPLv1nBLIoOzh478Fb4lOsK2Yl2i3'
+        'oVb8witZ4+R+p63fyrTQqM02WyVhHwxNXGfRpXYPbmj1UW0FKm8g5Qyo5DLfO+dRPryxmzjx0QIS'
+        'RiVYUqWCwE/bdJa2+Izqon3buHfG6mvkD6K7FDv5QtyS/wvDVVl14T0kQL1rCeJSceeXA2T2Fyb6'
+        '7cMFn0bswv/B4tMk3BgNaMRFwmJtk2wjtkkDYFOz7WaT3H8YWQbPmcbD0dIXQzdG+YhZZ3p85el3'
+        '2b0CuOCRROwQFPKTL4e1LL0ti3DKZ1dtHTQzLrJcqaxe2AKY/rt/OgKFoQxB4j1+hkEbC8yVb7BC'
+        '+nj84o3KA3/HYl1xcCjPoAD6UbmOR+1kZeGkGsDW0EMGE9rTBfpKpGdjqbAsmPdXnGhJynClgaeX'
+        '9+Tvl54PuTShWaRI0q1MhUhfbf5PfQ0gQRMzdwLbC8Mid3t4eugAmahiZh2daXQrtH0XAOkZP5dZ'
+        'C7CLh6rxroLbo5APs1VKMPCPUHz0+eyRGFvq11mVJYlg+XPrOkjp37RQJBj4feH6GbcjyxsvTg+1'
+        'aGeSszudBuzWlTF18DpjI7bE4axS6FHICWOKPqoke+mKlmVMaUmi83emd+29Kog8BoFk68tqU8rg'
+        'IwpIZX2KTcJ8H5jRifJmT/eZ2yuR80YtKFHE3HTtDa1HbHSOWbZiAe+6fcHdWQl5DSVroPhDIXU4'
+        'X8Fi+im4iS+NutG49aw4URBo0cjENFM98Y5VJhe1zoI1nsZ+T0wXRS1ENqL9oOqzyTYrGxSQoQEZ'
+        'l/jHgteGmEB1VD+WveJ1qELLKbSHXBzV6YEOPAjQxPAzLKxVm3gR7Do7/Ti5nrTwOw71mz3xSpFC'
+        'nwxzr6GjwrsEY2Y0mNTqjI2mruw9oNyMzq3XXibNu4IdRa7rrGnkcGi6xKdTNlpWjq3lxwy8+W4v'
+        '8jVNug+GMn8LgqfBzAU3PzxGd5eDcj9VjqIKokpAoAK8LgS5s8vEPgQ99p7olQ5YzEvFfPhtcXEE'
+        'lm414NFz1Q2Cl8+I0AIQwyID31isAds9I1ZMSKMIUBbkERcIxQWQ1M4kZowHo3VNgk8EJeY3DiUj'
+        'weiNntw5PgmKCKsWTyDtpd0Sp92unFc2E1Nz5NhCoMzrlQf/4A4YpCTsSZOLqjnuu5C5uinBY7Kj'
+        'i4GaYTq2OTo4fuVHXvUUzNtBAswZLUM4ZKvlYtT8N1giSdZjOgugMKsVavHx7ZdaeRKSliEbEOZc'
+        'Ul5F05siHZBJHHzu1cnan4SFsMtuZ5ioiCj/9YxsEQIYMsEwi48Cxl2Wyl0uamnXiwjtMWdUEuwL'
+        'RnU0dSReJIIFjc6O3C58YnLXKk1XqhOHU0AoIDj6GSYIVD4P6z54yHIqQ8c8xqbjvyjWpwlDftyl'
+        'CTS1yizsd7qo1/rxQtyZaXdpG/pOaiTij2qtoS2+rnalvT3OJnCXKdDSbiMj1xbbGSh3KfQx/upo'
+        'zGGO3aQlHisfngZjVJGjhV3pye+4Ylw8RC/ScNEUUbDjeT1pXxaooO9rRS+9euMv2Kj/7RTyrpCK'
+        'li7OSI2WloIHi6lle/d4iG3VD3bAYSc7iUX5r7KowTzZyV8tnCv0mP4UVu8C2IDgH1B6vmr5gEE0'
+        'ms4rD/IULFsw/RhJNbgepgZCH5567JTwTgygxLretdObLxJMg2Ct0F3ygwZSqXSwFbdo6Osa6UYk'
+        'VcUHWUPgMp/8fF+ya++6qf5YPnDtYBWOWGaLmXLsEifyqQmbnxv3NAurBbKi7OIB342n1sgC6FJZ'
+        'CUYWWNKQtNdHoJJ/fmpFCJX4yCFfZMZcdW74OzXK6vY1JPEEuRok5RkpwsMQPLsixqIrlrxIAATD'
+        'JPk5PN5jttcyXbJkwCUwirLC1DH+rCmdXky2F+lRtSlwyvAqreotYKJrxeOfcevTu7g3XhQcu5Cz'
+        'WKy090bouXLdcZ2OeQeWTtmnXL4bC9ASbIiOC17WSk76OGMw0udc6CYL4aLxNUxfUSMEMFRh4zKg'
+        'nEO1/7WRdlKZmEe0U7EpOc1hBa2rn2XZjXXS6yoCKdJUUi2eg+bZRAlcIC8TBYFYgzINp/7S4bQl'
+        'WXADd7t10uw1tHZrtFy5pJnaCmfwjirkxna/mXPRpu+UFxMppboe9jnYOwerUCwoQKTDD8wEz3Ze'
+        'LT0vGPLCmCy5x4GMb/Lrr1eSo4O/OrHr9hbPc4y9SlYK1nOVwUXsgpq9MRjb+/xAsvwFnCTn1L5W'
+        '8C8nHW+P4ny9mpmYX7ozB26FjsCg1PFhtPYkYrcUeSFytuRp/uq1/rl6C19J2sepYoZ6a3j75rzc'
+        'I3FJ+Facq5xZkub++8mwcGW5+z3CUCKLS3Pr8bKu9tTnq5EflSbpdmVTqKM9DTHL6gUxMCO+C/us'
+        'LogS9aHFcqN0cTVQpkSyQvEhPFinR9nbQy7w3hdmVyILRXirZnP7KLNYP/PWERgFhCet3h6mGCZU'
+        'paRnexg+qjaIcbhAJFoJxQA7Rdhx9zhMQxlq2HUSiRxwItHzWFJHwQLQr3qnBpTfDVFdQ49rgtlo'
+        'QJnoKr7iVy4VRkerTKbXf4qzFu6TZO5mb2wz5+HP1MTwEQOIAc78npOT1LIEFKof7j7tObTe8O+4'
+        'ZZ5dE2AgJNhKN+NZDTg92QXcFj6fnOO7yYc+COTAmZBE628C3uigCO+qeCMeeIrERhvXNP08nAcO'
+        '695eOIWoUKP9CiDX18jp+2g7O7HekHWSbusTJVigdFaiE+Tqq+01ni9eM8h9itG19oTXVW506Tff'
+        'zuec40X7EyizvkyKkNxPxJpzVGn7jf7EyuEE1KCPO1v03rz76+VdOvTKdC+Fwa68uAzK9xnZAAs6'
+        'QlUFi9NTII6VDbK0BFVSDY5+7ctnbSVQW7upD3UFjEUhx9grmIT0o9KAk5VgkluHmY6QOvYutpGO'
+        'd1tgQFWglO6d3P951xBR7kZzUun2sA6mmTAxIh75OSNeEiNap/EGb9ItB2G6sW227KOrPPqnXGcm'
+        'YaVuDROD9+D67Mu3eS3e8vfO1tXZyRJ9JuJ47PNC2+VTRiqkjIGnBXHyzwvlRVMajopOUdro0zl7'
+        '5zCK7K5QWp/wS7vQkmhsY2kUiLLJc7qG8r1cQLzU2GJayfqriHMDx+ElqW8yQZizZiIym3SVH0uo'
+        'FtrKCoM+N9iXuyfQB09b+wKLGMkTippSUIaIZDeg9SlXmVKp/9qNEl6ljBJG44UwnhXhRZqJgQeD'
+        'Y6sX37d3S9/Lw6u6Fxrj1SsMZRBiG5tCuYex6vTZuQKQ4cmvVBYjcrkGMYx8uNU0qBVScXQegl0w'
+        'r6oPzYR1tThZH4peuNUkiIqxdn42saD4WqoYvgdyMHHe6R1+VS0mXeJmRrD05d4ImK426r4omdde'
+        'H82hOEwPxnHHklHMM33RtYyeaWYLkNDW6frB1bM4rWmqZfHGi0lfwkcDGqQ4/Bj78xmuGzsCDE0P'
+        '4AogoJge8PqLhLJYtB7ZQDUdP96nHmw91kKxR2maE9fU+3d5X9puxmRfua7jXD9Unf6q2QDODMsE'
+        'ZKJbfwnr3M4eBxty22u4rMMB4YWRuigoJd7ZwFWYFBbdjcSY8hlsQQulAvySo3kGtQqEhYkEFj2Y'
+        'CXKeS9IpXcaqbVU2AM0BVDvUab+w/1o9yQj8Yiuwu8jRaTPKfyMK/jHRARS0niGa1dX2ula501j2'
+        '+q8hrV6zoPTvUCmRlrQA7+GvJmxsOWsXRAYlMKcolbkPpz4rWuc49n3qulhzcsZCYJIDdGPSMJE2'
+        'SbTj+uZ/hvjTW36J6EYpEFZijJKQprVZMZqyIoEf3bZjOjIZOS/VXpyU7S7kqB2OgE3wf2NuF60g'
+        '7nMnYwEk+9GvGQUV519ED7lCJR7eY6KNNIEcFL5I4Ng6Vpr1ja/uBj0U52tKEOFu5sOdyC8vlUq2'
+        'TdTQl/R+enl69olsM4rRsdTcnsSxsv4CsFhWVF2/hZ3Ad1kRuGxPkh3537vYha6uuNjb/8g3Yugn'
+        'bgT1ak57p60z4PXe+gxWSW7OM/YxVBS7jbIC4K5AM355PkLedwO0hkrDSmsj+pGvUG6LQbzPyxFs'
+        '/xlaUW4wl/rHcT6S/zWgtxGyOz1z4PJYN75AlXMyk6DZIKOijdXgZ/Qyxgyf35FZzKiQ3Rv0v8HL'
+        'fDcTNX8m0mYwGZcmtmusgUvALe7ZqD8n6hvAedhiTrYQsbCU4ziIPzhR23TdTcELdzLMB//CCsCk'
+        'k4YP8gs/6Oi3Bn5I5VFI/8RjGraSm4b7tP9GOKyMlxeovV7O0P9vgPjObcGv4MtVmpJiDedDcApc'
+        'd4YH7LROD7OvEQ/HZdju3FVX49QHCSYimwejlARSxWF2kiSzGQJJVoS3T7Q5nWjdVbBZVYRFoq1z'
+        'RDBKJajn4eV9rffjskj+RiHbFnAFQLA87yqeXpKbuP3ckN5jeHXhExDcze8Jni5RAbJ7CyrshcA5'
+        'SR+epqRUt0N/acBkbLPbZ7hKZuKYZs2ROaWJ3HawqM0BErX35HMpYqvkGOTDqVXpsb7n6gLB//CM'
+        '5GVLqD1f3Qub6KLSXrOMQ7P+5SvSLZ8CELosGJFQxdQ2RM1HfiHUsgnSO8M82oVcwNTJdEqrxFcp'
+        'UVCNM29gsgCPHEU3XBG2wKsumEEU3VAdYCkX3cPbbkgvNtFTJlCAmVhhvAGyFePU5M8ssCDyGqFo'
+        'obd1rqMHHSpGooP0loStdoSiQrog2+L9XPjsCdUd+yDlaDJ/lo+kIlxf3vaNEENnfiv8m5jE9rZb'
+        'KiulWdudRC8D/hPJbrEEGbaGzDNlQ9dhqwJEXWvS0Cs+cTUoNjXkxBACbogaUdi2oMbYX/0GEp2U'
+        'n/nyCarr22ko73vvXUbDVTm2F7hzcxLF+0npM6NAJUZRubfw/UWvGAm5+6bn9cHjRRhz2yNLhlOW'
+        '2GgrGlwI4WRBC179mu/dRVZucfX6qQBKo1uEeCvWeH8Re66GzFGwxCUt0VfrfaxoFhUTUW+mCogg'
+        'Vib8DHZES7jaaFmzKddAqs7WgpR2lpRaVgV1GG4qMu26Jfl/x/icDwfFkqt0HMN/F36jBD4YtShF'
+        'LkhWexhUXIMrpbR3guuxeyfFEQD3SPiVqQLsiMCj4OjHcNC+HVsWDcvVz25SQG9au4kdKTe7FAy1'
+        'OASx5DWCbIeHY8tBaL1bXld8tc6LBOJxfH0qFPjUGd4683vQALEu4aorr3PaCJX2LhxDoPaYKUnr'
+        'dS+iRjG3XLzoe9LBF7/eKa475nRYXs+m1+50CyK8kjentPP6Kvywo1Vz4Z97w6e5z3Sg1iwg0o0J'
+        'kKki7JpE4IMddqLHaCRUKTBPmrVpYohc0olbibLATViYw9Bewfb+zJox6AwDHTs8S4TLDDJrhak4'
+        'DiZQeH5A2jftX4kZ9WW+XP1vGJrTnefqgmBc4T08MVLeMYMFJ42xT0/VoYt6Va17FPTfvBmWEOGm'
+        'tWAoa+7hScdIiF5e0uQfh+PBRD14ILgzAp1/p060Ga1FCKBaTxyzVxKejgaV9J929j/oLHFNs+dJ'
+        'MIfEqvyQGsJwT+Kv+b3aFu/3tsDOnBS8QYJVpAKonyu5e6GCfp+/mxEUPkq4rmGHfqMkKZRko6gm'
+        'oK8v3A2xIEh6L1CKZR9LKca207hR2EmyI7vi3eiu+VQqrmpD90cqtoPXk/K7vs3t9+HPJ4rboT2z'
+        'MlRTPPdXYMg0Ih+4DtXFDmQDPLjOp7L1RnzDRGoxDfn6yOr1TPFaFdbSRdbc2T0XkN7Z+gqvPRJd'
+        'igoQpGHMlXMg63BeeD3UISXycUpY3+VWC0zrpJOQek5V8W8jiEWrze0xM7ASylkggw+OtfrQtprQ'
+        '2SArf/WHScXmZ2y1wQAzjNTmfq7ybqrdLs3qJjwvW6N9iTNdnaPg1CQxy1PJmUDkSe97uqhzI0Tw'
+        's/XUNhfyB3RN3lHegiQeM0aFy4a/CY3dSY10vQuvDSqU1RG5OPAv2/HFMdmxOj5Ts4es6KT+roIl'
+        'pnoRjFmU9i0kWLKopbWKXwOyW6VnSYn4j4I8DPnlJW0ixC3ZWgoBjQV2QDpGBdfgoBgC8dLUrc4v'
+        'cZfCFnulFfz5efLld90axHXT6lw0snp1yJXTUf5J0uVPswbTXu+K8mfJWnCTjk36pIwOu4DaszNz'
+        '2vUgyKeY4NhZiqGn4LNYAJtYn3fgcJvKVuO8lieLLEkNoSN/KkVVH/g7V61YCD4FTZrtIGBYQp0P'
+        'DHIwWKZLXQXrt6TkXZ2njTRX18YS3yWWKlCETHZQao8Rig7fdUDtPxLXf89tYkkkmY8nZ/GFBSXj'
+        'AEx3vqDyaO80l8E4ZV4anD9h1rCjTNGIhsZ8fSt+Vvj6Z50COB4r3s4MolS0k3zmBMYs46kcIw92'
+        'B1yGnkrj2wou2d749ExD7/tPBDi0+l5p4X+UwTj/tUdrZkBjrUDR9MBjetHiOgvWmtTCs0tlw7iT'
+        'lbkzHXh/xgvLNVo3VELCjFSuNTIN1Cw75wdjyr3RXCdnXHE0pICPMUCy4CtSb3E+3D7fH5cqVzcJ'
+        'DEVVxyrqTMVuCvAqvA0P3gxPe9sobogImG0LYJQVd/N6vBPLwY9q6cwDeu8sAT3pbC4H+HyBNufC'
+        'gYH2hOSdGKM5kadWTWOU6Z+FwkvNfKw/mdtlu8lXCfD4S8t7eyWsKUD/DvD40E6BczC4WYkDfAGe'
+        'sDOZ7VL3kXvoEJOHVM/+7VfgUUqC5V9F7hZr5/fNaASmK1YC+pvInynI5Lf6fzzIOKDeWT9kQe5E'
+        'Pd21WGDLHor4RkF8GfyMjAOx3ytuWQuSYAdOFNzoGwPGOq+Ca7gKIjFO/o/aKClHXuuObFqoAAjS'
+        '8c4XZj+zyb5ceJbzSNUHrMOOAHa63PvQ0ZwmbCDcgMhDEp+Ws7YrItNX+D6ZGit+q0b0oYZCTpfG'
+        'wiXqfsGJjlpN2rPrZhKmsEsItWuDITULLdppcruhC6SrkhS7QIInTfxJSXJXjTX9SE+t6EJpem+Y'
+        'DdkL3ZMOS71Ct1TIDGWWofZ9BOyOP9uv4A+co1X1lfGUk8fwXvVXaTXyao4Md5bHMVx50LhHT65x'
+        'JjoHpY3teOTcXCfygoDsZAZxrBZihrdk3f/usnfRGydo0y+BeVFB+3DiNIaYlgJQYMM+nXPwfoMX'
+        '0rbao5brxsBfmD6MNsHEhPAga4fNph0+KY53+gypYViEUe02TKKtClTnbPDQgbe/cPdmRiYUkLdD'
+        '/qDp0Iqj0mjZbaFhZ5A5mUFY/Kh6ZLlPc2yXuDQcpp19JkI+7ODf4odRBF7Jvuka4SUYpWSTSU39'
+        '+yxf2PoztX3vGdH+PiFPKJ0QGqVTCiD5htyt1/nmgml/I2JCEKgmAdljh3DUnhORaKpIQ94Yi9yL'
+        'w0wocgqdhyNJfIH5NkpQTydA2R8/DLgTlf0hYmqcoJbYbr8S+9MrMcbJaL34BlhjbG7K/97RkWtY'
+        'Pn/TDFABW0h+ZQU3b4/h9Z4oAk0PIPVIESvnHeTL42jTP1u2IHMN/DYLpVMipfF1L0advTMphB69'
+        'cKob472t834uPZOv/c68yEtocR23nqpkflEtASvwz/WgaVZoi/+Dwv1b5oANghKSXv2H4s6K1uDr'
+        'BaUTnuyMKCD7gBmBb560kE7akj9MuEMrGziFAS4wrdTR+moeIRlrov/a2Z9Pr+X1O9RAE5DohXN7'
+        'VDr++2O2mncZf94ZgMP5XUIHHxueOn8csVgPZKR4UtFfYDL1cekTgsx6w46yv7XcSo/28x0rk0zl'
+        'q3mXNn9309aM/rEyxbv9AOHtCnQsdwNivdEP3aSJwConMqtdxOwCMESDpigd1/7nxLp9rOSPVJjp'
+        'Dvqqxm0VNwwTLtb3Yt1JtNVXVOThD7xHHGgAQb1VGUtv51dsmJ9wcxQehULFwdwbIL1fW/sLhM7X'
+        'cW7mjwK4qDNsbjBWvI4WZOL2dZ43caHaekPn3DZmJFOvXYis89nP855GOJofs/wVNQgNSJup4JZL'
+        'UzWcKbtTfE27nkPv4NRbmz5mt2ayV9wri6iqzI2l/jjIB4a07MK3nbTK46vXazo2U/+Mb0FmXlhP'
+        'rGvdEtTzM8TvFB5g7szd49IItj83YnM7/IX3/7Fo8hjmJan5OApwUpVEIDeH3wUWcrFZhSwgBRx8'
+        'XeQzsMlE5CvNCcrxgEqmzcmLvonweARZOS2rmeOHE96X+lTLIgHNHASdMLs+I4Rnh/6jm4VaGohb'
+        'rK7bKOPrlX8Irf7R7jzEOkJ/dnXhImEAuGbjZ8WooCLv1AvDpDhP1Q4Bp4aqkYhP1vlVujs6B1BS'
+        'cBRXnQrOiD6ebOOCySi47hVYTPjtmaIuwdfZ9oTCHgAbpedP+hatIXLkxkxHKPnvq8BwRtgyiYfC'
+        'TLVv7z227XbISblxH4199Qam9A5RgtD/KUl8CP0Uy+/05KaoAG4fvq/+QOtd1LEQ88D7rJePOSpl'
+        'SqObCwtItoAff/ALOMLoQZyyvPHh9z7WJ/Uy70WHEhYyUutwXbCBC+okCOPtvKLQE1FjpHus6o0a'
+        'OgAhSnRa14gMlOXObZmO3Cc9x0rGFZqVnhY8XW67Wh/AkjInbiXp3lBubt+dlMCetK9PC9Yunfbr'
+        'FESK6jq9VLbOiRG4pOLd9xVElz4NV28HRNuGBD1rLIzor7R0Ktfd2RQz4OT6XijdQP41KDyf8efd'
+        'Dh5jsbLc1LC5qd8UQLCsholVAKEDUYkC8LQG548bBEuJ3cnpq4ECDwl7jtimu5rkek8yTOk+2+v0'
+        'p0m5B1wvuu6VaTLZhyLSnrkSg5UhLZ23a66PFtQJqLHZ5lag1BLrz1nYefLgyRbF3UI2oZASaZYH'
+        'V2MUFIPDEUFNkctOhjdcLMVPjfvZoiNrbFjfS6FREMQA12fO4tq38hfcCLjlrv+QSNJNSStIP8Ae'
+        'CmBo/7V7UCvFk4qa73iAVgGJCqjvr5SIy3qKQg703Rqe4P3M+hfIl+VjT5yIS/OxglRNRNdSePK0'
+        'ImUT795nSeCG4+AnIqcq8oq6rvcW7rufu6F4FoTUB4fLluAHwwKhF2Bd1YxT6wtcQVTRFwk86r36'
+        'LBEEdvXELSlw4OyRmKID2wC+bTr2PCqYyS7c6iFJD5gNYSioE7vY9yQlkPZ/I0EB5w7krJpjWE0o'
+        'lMA28Maz39ZbYpxlxta77dXJAUcJislh1Zh3hlBBaRg4XMXdoVhdsPHVoViYMxolU/Rs7e6j23DH'
+        '+jvXTMoEPl/0Jm54NmFaFCs1pQv3Jh7ydkyVEvZr6h4Fq6bJUtQQBd1mOp6FJ0e0gdrAJheSW/jl'
+        'FMNoaSEURR6F1xyhMEczMMdmF43nyBmeFaPBxTA19usYWi6XxbnaAJSoM/fl6xK6OY4TlO39y8TV'
+        'SDdlvGq5ZbtCmPBp1uTbYH8fZF+8dLPamno71b509n9FEEKcvQMrCoG4G0SZMNr8cRPTqs/eNFIw'
+        'DXmWCVw6ksipkUSdZmzJrA5rJ+sXqKOksBj5Jv/2mQHWJr/l+JPOjAhP+JrXggLwFg5QZ19dkWrN'
+        '3hU1gkn3gVU30emMawpmUK+ELJImPK6ZUGRMT4U/DRg+2KrSGeIhrvXCL92hbMp9tp6BEXCELV69'
+        'KKSHdYD5RYUxHXcyX2phwog/LjtDcyX/ejfK/ImeXnEUGr9bR0KBlcL7xoyYbOt/Mz3JHFao5iPm'
+        'PWcHfBeHY0YRiwJLQU1/MdLWoHJ0NvYECuDM6/tLdugwjdED+bP1wTyxpp9ilAD3S2ml+JoOxFzo'
+        'Er0FQCC07Z1dkGYSU+q+R36LTkgoUBhARnWK87T6wt6aia3RCy+eVFK/99l6AVi/aHVRKZoawk8K'
+        'c7GIROx4EzWrhAvTugrdRurv/OnhpjYzUgdJclghTBKlvzbAkUcfqiIioaC+UlX6MmhHjx4Bw4Y3'
+        'U/onUDJoP6nq8Pth0wDJnbEMISKkK3VTNGxfz/6dK6o4nqfr3rJc0AUb4LAEoBBv/UuCsbx0WHbH'
+        'tcIVU7S1rCNi1IBJZ/KOY0k94DWsKAZI0+gLFI3Nj9Ho2zXga/oIhp96LnNvttE6Eimp5JKsFCOC'
+        'JV7ytNPkLnnjhtDJFUy2Q/qJXGBOq8AUtRnNNek0u2weKIGig5/gAT5Od4YzQPYAc050R5K8DoOQ'
+        '/N4Mo7H649aQhe1dGNF0NjbSSqCUakBkuFcWFxpBGLqpqbG3DCSKlZ1pUZwUCsnMHr1b8FqnoZ5F'
+        'OzYFXAQWq0TKbJOF9EI2KeiUSkykTHe5EJZUal5kd6MlBMH9Rjwj9XXX9yMgfBPzo5bBlUQ3Xtot'
+        'v9FigK0CL4C2NrTpwI55fAIgW4UrUwmlkNYD1U+YQCkCSrf+t1N6OQn67Q9Mwdl7T0JvdnV5JTvN'
+        'q1TwW3e5Yw8+XiN67hAud728xnTxAhe1S5lUv/z7ufOEztsa9JNyg/WoPW3Tw7u5Qcnsx+LQXuSC'
+        '9/yXOC5eZoXcbOJbJwI+9cd1WHYACGzWqrXgU0fU/ASTy4qYxTqFW7lW8yJmBfDoxPyY6wlAF6sW'
+        'WJgj+/d8FmzdbBmKt31QG/KqiiMh86tZr1XtFdiDuAfVrspT/8wF+nH/QSNups09e3RAK0GyyU7U'
+        'v3EGTCKPiYzEvB4PhmpBBSXUuY+Sn9VPK/hWGw2HBoAuIrhY4uu8EkHxnWAvQou6e6XgXNIB2tws'
+        '9rQrv6c3dEB+S6NS41kkxYpv6gTOcqa8yxC5441JlSdMn2X17BTDG9omwuzbL0wwXXzvZ2low5iX'
+        'JwMKr/F91+reLBJXoC6vcO/iTsndyXZXQQZvTcModAyjlY6Ht7ZZDy2QBmr/fNvOrFUTj6RtEPUH'
+        'ixOBzlUJuOyf8ejcFaL+Jwhm91GUuSVntnAC/DURYDeCYmCW9FfZb/fTmUk6/ZNqPv5b+bLZj06P'
+        'dzZOcNvaUFUm8Z1onGp9d6WXPWHDnKYl8NNbdkNek2r7Y8EwfchNyJ8A/BJMl96NSUcTEQeMIWv+'
+        'CjZZaGgFV0pd3SivYYjXGIczG9cM7rQCuvIGI8skAqHh2O5QFa/34MdhADrfGeijoeuWvItV73Gz'
+        'wwYI1MtlTXZlMmotJDEytJeoIKqyIZLLq0XjO4b4qOllwsvHZ4z7sK/tSCg+NnYC6FaKA7czbN2e'
+        'VFiG7QjeIlFlhmMwvM5G4/YF761IcfiY8MJVWRHQDgt7C/2tbGKFa5BsdAZgzHU4ziyT8Bqt138A'
+        'Kskw5OdyryM3KNESCC/Nu1Z9gj4Ku5KdJ/+jnw46AQjioOaQpNQbtyAUtpiwlYKeeVswAqBBG/GG'
+        '2o6IT5SVfE8EQXjNNyQ8CMNhAqmf0me3E6bSCdAHlyXGOG8ZvGAl3AAsYAPOXaNEEBrykQiMNdE1'
+        'OJzGfG2+qDw4tWva1ucmacKNxzQ24qJ8nBfgaZsLy4f5Sa6gVqazBelJtKb5Lk+4VFNguMSZs6OY'
+        'Qe2ZPFLF8xos6oBYt7Ho4zTTkd01xS/MrZtOHKg9fJBUEKR2S+/+YI00d/QHPmnA1LGhdZzZAK/Z'
+        'VEYIEbTmMSfIOnEJe1PDqwwRgYIXMnMItl8OP5b+OygYBLCpwlhvCZpujt3Ev/jfvEfPrLyHl3Gq'
+        'Nx23VdwD1oVQrifupJ/kP/BOxZvvK5iCPglQwYZRdqNAlT2XaDCw4wWq4/7ekdNwLPKXOWCosZhx'
+        '2YOllU6LG5ns3A3Iq8Osny8V0cvefrOL7eCU0rdoPLJUaYh2QQJ4FGKwO2WcMHDXJIzqXq2K/0mM'
+        'fbDaXZQS4gamCg02o7iJjmzQw30lIpc5998gPIRKSdFOcE6ST6BiqW5K3btteAGgANIn9inGTaaV'
+        'TITr3pait1fFWYh2pu0DIY636xU9CuLOWHzqRAX48rQR2UOj0mcjWSamX6jqafOWr6m5BUvES0d5'
+        '2bwaCUsiT8nM+vj1Csk5bdG4D2lUEw0NcAKQM66eqkSq9cu+AYRC4wKIZt9F9GajzJWOvmDvTR60'
+        'Mi4aoeE836xuxcIExt4qTEruBW7nwbGc3r8ltPXNWmXpgdEarpg7CUs5pMUEaNxTqwdskGV2OqtM'
+        'U26eh1c/YxKQTsFPhXlMep8QWfsvnWsLzGlXL37WKNT9+mq6jqm+GNxTrpg88fpLv2Ujucdehjs8'
+        'vNN7Dxu6CaBK+UXTwEm7pa8jddxil6CW0QxxFkFmrktDlxLYyIjuW9aCvLqnRxftEciHCMnAAQih'
+        'RlmG2gV8ejFdC1pW8w9LCVJQDPSxCTLz1Ok0gsYfCNIVTlqeKj3iFddc+RZGrRDnxCJRN/AoRIPm'
+        'EkoorMTb1jSH4007p7Iwa6S8/yHOKh+rpIzvcxfm+Z9fZa0Qvlb/zxQNIdAmqBYc/9kcLGeywkIP'
+        '37Tn2GMmczwRfWS6URyPOc+LBSjy8TtmwKlBEW1vtsDPraGScK8QpUE6SVTI/gEvlJOl/zL4V3wq'
+        'BxoH/O5BVYiRJHiM0rWFolGGRf8TG7lVXc+Y7reHGv140u9eK4yZHZq1abTNIezBhVkHjSgCKYyZ'
+        'oI5JWl6eUU0GNLhOzWOBSSbaAgQq5ma835ow8AfVMk5Z6722NH3veCrusr1SdPNZwg6jKb4km5W+'
+        'CkvSlmGMxqCixJlp/MfiS7j2WjwdU0M870omtOtE3Wx0rubxN2nl6OOP2SzkTgfuYnWI5ufb7wu9'
+        'n1Bon1okDPVbU6Lu9mclkPNQVpK6T8ApzDmFzJCyVi5V14NdaZRHAAFFcpy4yrsQ/DA9tUFsYreU'
+        'Jfhi82P9aQJwEIirkYdG5OtcJEOlKolBRr7m/BpJLwnzcYlKmj53cCvr832iLhRw3IrefCBmdNWc'
+        '/YDkzJzX6ZDANON9vc2oB5Hlw7K4sgmpCvs5RwmOrVDsksyNG4l9bhxi84SYF/dpxtRPh9WIA2Gw'
+        'K8kI++0YO9VCaYJ2V26jbCke24vV28UfWLh/xfkfDgm20EYn7BQ2wNHwSZb1oQngMYJYtTPJTjq9'
+        '7TZDfA+EFyOxyu6L+zoUOv+DRN0NN07YLDkDxKAaI+JncG/wZOcMiFIHOcXituL2L/HFynjn5WxK'
+        'b4Mt3Pr/UG/d5sVtPQJnkdaXAZQ5jL18BeV7+hD3Z6XNkUW8uZWatkbObJfOfXiWTZh6a9TLzP1a'
+        'G+ZlSAgxZBCvdSFZk27wJTJ0vrY8pd8Bb0PvbyYQwsjnolFeYD+Fw60hLF319FytpCsO79BG5bUO'
+        'AKIn8ZLAbLNnqbn/byKlfWMLiGH2OmaJr3wisqn8a68DfyuZNfuoIWgVpSP6AVC3dUEdiLVjnYUF'
+        '4vfygiwfffJmqjrFlR+f2UNvjiVs8TItn+h8eCljKA0Lv+bL3QtdDUu5Dg4q1dvQz5t7XD2apB94'
+        'wQqL2YMVv2iDYJlgBrMjDRN8tCUwOzciZyPO9/r9VoUjGcF+oFwUscsECgoOBpiCoVZ5c0DThOiN'
+        '3nMXFBYeZxW7FAi7Slp1HcB1n9bjrZDTREXxApzmOUm2dYbFjJRX0fqHCor6VG2OE6bXcBITJAEA'
+        '/c9n7THy7I79KpTEf2MoZ/9ogU+IUJjPBsqSPSS4nTNl28XW1AP9v5f64GrbBp2vBmQCoIOWaOXc'
+        '9Fzh0+3LSjYLpPn0VCIPWZf9zs1UIs6lOgb1w/SUksDNHfXquocx0KdKWsiMQvDLJbcigB/isEF5'
+        'KxsGLEDb4v6Tw1oEw042UbLIk/qCkO65mzCe8RuZ+stLOMelLR+uXg5QEmox6LjWg/FZI/PJUztF'
+        'ptTYTqMoGNELMUdon7AnUa0+b7IW9D9Me79sg1K+XzOKCUDo47UlQBMtYX7saLdEZrT4HeabRO55'
+        'PdPKd8BjI9AtNVSGZpfR0sVy/8hYHESma2W6ZJJeh89wtAaKUkVtJhIUFbDx++iIIBDA6v/F8bev'
+        'ODsph2Feo2419nGp12LNFbVcNZqSYvHAypgG9GIyo+argyUi9LegKTHh0/ZpYFCTRrN+ATWF51zQ'
+        'FGgpPF7Jpe2bcNADlEZIESbY+QpnW0ePJ+tQiMwgFxiB+96OUO+MxneotfHkN40eg0BBCf5Fycb8'
+        'aTaYzgQBVdzKZ7QlaG0oQsHaIXh+VlmNkrZZqdkXcVpASObw/xW5WnjC9VM7cWlei3E6f+HMxIUX'
+        'yB52aySImsbcN/CFSwbMV7JVQ6m2CMv8yXnWpkX+AWELvDTHZLlyv2Y6JWv/Zf/ngTfCLCy3bOeX'
+        'UPNcmk3fOAvQRyWNMAv2UE6H9tbG/pNnYj99SaXj+ESlj/v4EWxlMVS/f2dY5fC4u2APDs1oeotO'
+        'V7xuiEdKR38BTdzGRdwAXyuqhDm3NZS62TlXF9cwUN5diezUxfG1veaOE8kkCaQVws8VdXUFGEt8'
+        'sC5M+14HsI+PmPkOZpJs8ped4zFKxR7SNA7SJXJdprznk1OQIGEoXgLQ8/0xacH1NPa5ALI/mjDt'
+        'r77pA+o69oznRK5v+yYXlo5f+xBzb6yVftclCH8hVhb2/z6sl0+Y9lEinLbtzrpVIkRp6+Ez+RLM'
+        'qd7CQo6N1YigU4NA6oOFEvsAUQtWlcqFIGwojxpc4JuVQ9jvQ8c3/OaUvQgkHHR2QfwgYWE498g+'
+        'UXeCCIsNkDjwekmMN9boo49e2Q4+NNJyCaB5ISJJTZFyy86lL2tsnod0ujfyq8L9e7Q3XwgrHHbn'
+        'SKPohXBp3TdWhBw0TuBCLl/y+Dq/sDOSLlkvIoFpQDZ/kFozJwb2Vy71DW4VJEwpxpwhy6Y+LjLO'
+        'Kt//fcpNy7jNeoy/yhkn4U5dQApbEVlVfEPo/LaYF2ODwie9ZGuud9ltzZGi3UrfXypg1DoXbjDF'
+        '43a1DIJII7QlUDkdOYOvHFuceSwAkCyt9w5JeXefKFyY5DOeTFU38vavhjVZfSF+8qduvm82phQy'
+        'EMzADO5Cg/cVjyhQGb/RlKO32hN/dSYcbV9GMq9/KFhW7vCSTr9jhbymQCiqqdiJPdtqXfxvovHG'
+        'UEg4BFKzx7Q4idk9nIy9sYHjqjUI8f5oT3Tui9Q0w2G0yYzTo7nCZuT2QfuAOVtVdJbgqCUgv5cc'
+        'OXXvNCpSWjmb12PB3OvosqBXpLnTeY9SsH6yuLGcMnDp9sSpjJq2QTHKvgzfyeL5dxJMMLtUMnSX'
+        'pVMrQBudCmtXhWQ72Upsp/W7Ry7HP70LS0TvJjsNk31lrKImadL9+0Kyyvcj+WI5DezO96I+ogLC'
+        'wKjUq3j+tqqk1iVDM8bF2unIJAQSGGmLrcXJLZMxpO1hWAKgXfVRMLqAfUECK4vyyayI8xb1DD35'
+        'ZaPBzORzxgu8ut46FPH0omAzU44r6E3n11YTtcJyUbe7abefE5jwTt5IgbsVTmo4CNdcWBL+hJOy'
+        'NcNby4yv4xLXHINPsUj6COTnE3hTOJM7mMR7N2q7kXIOx8hKkYDQn97XXQXekn1s5lM5eDUpZtxx'
+        'a00f6AEcSkRp4Nf2rBXjYOzPWwlAauefJCtr2EWccYchY5qhzDGzT0/dIATFRQZLeVGFO8I0jwRQ'
+        'cIJhrV1VBhaukE2PbUXEXWy+0WMAHNQ72eP/NDE/gj2izXDTqPcKAHISK5h91Qbu+ueI9jKauM8x'
+        'hZgDzqhZGLD482jL6h0LotoAyjwrbbjG1d/g2dDqd53hlU3gPUwousYcjbX8MwcfNcJxJSvjjOj2'
+        'b7t3WCWwTw+LoaEJkUpGzsUj+E5HWIhvTT37ZerbqSuKnVwwM+CdB/ViULh1AvVsZYD3giRDCsRq'
+        'eSMMGtyZ9Ng2LokdFQ6j7nvcKqRyjQEv0b4EJzmo3XoIkdH5xWueLaILXvtgLE5fcRnZw550Ec6/'
+        '39mWfft/OAV7tdT2Xn1N7M+bvrBv8Je/jWMfRHOBU+vD8tNbQNIiTLjbk1wbB5Wg9zDonPQMpcMw'
+        'qZ8nx4jjhWxvN+Eq80kcUqM/vBG2vYQSStpiHLtSASMbNruGgSRoCfZqW9ZUQg0RPDGv0KKFx3+x'
+        'JiULUKFpDAvmPVPt5lQi9YEDEUM8cpkwscgqtVqQgPxdUgkiRCgr4umZGuxC2ahCKjOXrp/clupP'
+        'F4SfU/ofV5d/lRfuqeZ9wNahYYS+C8r7GXdOsD/OslICIK6gD5RUzHixNynANqPOI/HjQcze+8sG'
+        '1e51tCPDbDJbZSiuNSofyPr/911Kcyyx1W/CjfwVTHMuvd5uXZb7yrCmEkxuUrXsJTNNoc75v7Ex'
+        'iJ6IHJuzHSN6u901M22a5bH3wmX6gtIE7G+cp1+t4hfsQL/zLms9yWtGuxIgpNzesPLdiHrahBEY'
+        'P2DuuygEcwL1KvC2uHthcCpFCUA2TwQYAhgBXSD3KX7VVkgPrcshMvmPBmPhEeFaduoh09sOjTTX'
+        'UhUsbfOLWbxeiblDtQNuYxHIu9iR5XqQBBG932nOv/yhm7lnRQJxYaOHLxKxro3nybHt3hYvdCXk'
+        'bRJb60jJSHKTiqAkE4UxEskB0Md3SpibA7cs4P2cnOOkOd365hgrKkbBultX3BWa969+NCm5ZuxU'
+        'lE89/iRgBrAfrRsQVFH8e4oD/YWIdBrANGC5HA65M69WV55EeyH+ill4R5pGCfAf1XP0in3TKHUY'
+        'wymhJSwuwboa+Ar5gAZ7Ewfz2itz8jG+nmCrPFgkl2S1CLnMHmvzgRq8PmmUA83E9xMrqDI4u8JF'
+        'z4m6Z7STWwcQBdLo3UvTaFZSJbgDXd3x5esLX7va40/j5mC59HzNc25Ym7y4nZ+TQMZaFLb81vVx'
+        '5Ic90A+75Qj3oBclYROFa3zWcnUfpt48jWj2dNJe9JeqrU+If9ImyNoXIDEZpn3JqXpt4t6VLhmO'
+        'bQtz+nLiMtmNbxv04m3NiYSnfL/YwrAE/jOZOjZ+r+P/m8Cz1WiB6T8A72Sxp2EHo+vp3/h/ozM5'
+        'Ufj3cSykjpjOyrt6G9SCR2S7Zcjq2DGSf0knQzWS2X8aTQLA2y7DiEVI4GiIqx1jGW6qFvHAsStl'
+        'ICvNjSAc2yJZB9q8RUk+RpOMURjJxGGN9CQlgYIMhyN5yAjAOSH34JeWQ/kvaO6DJWGxj9YTa+lT'
+        'u+LcguE8WV9P6hExc7xHsEAm/IduQvrNMv3XfR9vIgyuvnnoZIl5hgvHMIvIrshAzqD6W55IR0k2'
+        'R8hgEUAv+bj/H647j9ZdGpaTt98uCYDVVB8G73AKcNPvzLZnUqlhfNX9vZnQdHgzPGr/yxwWcnmI'
+        'eD/u1VMDzGVT8pF0h1Tr2YSVksaJW40i4Q3Fkd/wckLYWrqh6Ofyo/7kq9YiYbhIaJYTbvPt3mQR'
+        'CAUieSY7CpvKKCtczg+iZRrDCOnsnuCNTyjm8S8ZR5d4MCrwES/D/6URQOLet8BHhidGrXRmDSmq'
+        'cucfpQPxa6UkZopuO0Hg3RwrDm3jez+zh8KKwZUgP13l/9bxQ0dRcRPYN5oWwur04FbVm6EEMI3s'
+        'tghceSnUAuUafAcw+E/7CBb5NbpFZSWpWHX51F2soAjK/46eKkajkm1WA//gKDKIpW1O7C7VNU7g'
+        'U5S9+5DAnpxglHjdeLqHtlOxO6FcaGJwgUAK1KxHpShE8A+HwngDEOCf2PtrhCbymFq8PZI05c1X'
+        '9GgAcLLUHyx8oYAv0Xi6EWw5rSiQ6DxSy6kh8rQ8YmPlAb32svqqpyP1YLgCjT6JkwU2SwAUmG5b'
+        'rffTm2TTlsEKD/5udnri36Flt3c5UJDzvJ6uKjBhMDvkebTDsuxnWctrcDSYIfx5guKRDbtJIiVY'
+        '5/Z2UJn2KSpkVCQGfrX4gO6tcPTlg8fOopmCGcGqU639ZKCyBYOYRwI0qDWaamlJlqaAJtvG1Zxu'
+        'NA2GjpIeJptZCbzXWHNiX/gOv5+OSil0M/lYz+YGolL1p+2YAuQ0V0v3Ro5STzclUYrdIogokhLO'
+        '3zJHM4GtWts9ota41wFGPDrJmqv1+1rY9vUTSDAoGYe1d460ggvwOnXefDTQ22hGiz2oKInLysz7'
+        'IcESBS2eEFNErMP/bH8j+keWrfZrUrK138ftGAlo/B54yLms5gGrwEAyQ8qU3eVN8Ldhi5ZlEwdH'
+        '8BsuC9CB7kpzEOiFeuKzhhCsS4IR8xUN+IF1J8Nx5/K0RZKziAbYHsB2SKUlz81hAlaX+RTwH1rH'
+        'xleeiEvA3vauw1qUmCM+9K9e6fSLgpSdhloQs5lD/DbMGG840kYN90t2WUg7L8wp++41riEswqNY'
+        'DwhpaKWSgO8boJyQpMX7TSSEKMu6rDncJg0o9Kq0tDBvWJFme3dVu39mLgVAImmXsBVfPcm9kvGb'
+        'v3CRV2N5P3ukpM81C2ooD6E/V4vMMvwQjE4bWDaHaRBRkY1eX4EAKkoe9bfgFn4YEidlDm0aTrvg'
+        'A9QP9GGH/6sW1tP4fgPplkGAb3pbo00ym717HXWcBXHCEKp8Thgt3nz0+sFdqVBoCpxqzbcJ0HVH'
+        'WBJY4ZDY84+MrKQJukgZbw9Iv6uP9LO0Mt8hQLwmVdq2N4IfJ9eWHtI8q9qQIaqjLOKPXMNHpVU+'
+        '0u9mYf1bEkUXgjMOI3wrMZYCGw3KoF5BdIjZiSug51/oJki2u7NCUfKq0z4ZJpPX+P0/urZVwDZ4'
+        '/wepPWBtaM4Nk9a8uDmfrUVK8LXarI0dE/FPoJb0xuTkvO8zOkYMW9ZSfd6qMOVbLEICiPWfPVaU'
+        'MdR36CsVKXpkY84yCgEHLNHdJsVKsThhZBXTvTKUwStbziqPtTXF641+fYibcy4FrUfnmSVePCni'
+        'zIBOm/DaJoWH+3RMV+VQzlzs2xDw9NEBhesxNI3jdVG7e9Ogo014CtVBlmbPQgDXLn/SkAgrmroV'
+        'U8K6Gsf07Cl2oxmpE00oRh6tkEWyISZ6+HIucXYpt/VF1ipEtVIDCdDEs1OS9DxeGP2NTgPe0bNo'
+        's/GWYShUISvvHOlJMZB6HEFO/kYphe2z9VNXGVFNGNvIUSzep8ajOQd0xtjlwQECrj7gAI653C1r'
+        'g4f4I2+QJeXBoDGp0Ef2OXujI72b0ul1fc3vN5T3b9e5ydYlOzEKozlVh6izDmh9IWWY+VraBU2M'
+        'KiAVnHCtH452sl+qwizzgxsM3j1PjOUvOSvl9yNk5JaxzEFzuqrvHreDrLmU5jECWL5xYIebbsbr'
+        'eTYxw3hBy5zD0YIxwiLpy08u8jO2Fd4wGr/rIm3th/vZpZFqt54DRvXxAGW5a9/2U8FJuTRX6QMZ'
+        '3LRl+lGPAEDPVdR8PBjhteg+KtR1hK6POs2ZDvo4241gfJk0uZ+A9ZzO1mAzGBJYQbFp7/QoRmIH'
+        '7+Ltk85tdwtr3ZVKs62NUoqP+L8UgGhMQqJ3gqLX1PlWwqj3eWlb/IfBkdh+IIU0YBgBGdladmUd'
+        '52/lKJGZVm3/isENJOfZt+M2c5DDN7ZOtopE4oPMYdgjifLVuhLAMy04sUe1ep4xDoUC8U8j8BZy'
+        's7DUeGHho0G1pZy7bLZIQpBiuJ8DwsUL8woYuymCHiltseaITN/14A3TT8iWBlyd94UhA/lzGAvK'
+        '2M+lB5LVPAIYpYNa5iWx/Z8xOEslUFoIfoYBbStEk5vw9SNx4gsfeGTjm4BzMmOWF/ayqf1mPc/9'
+        'g4I0z/F0uq8SwJ///OjZfcfg0BMUVlZtJk2kBMW+Xe5jctNUgE1bFRXX197oQ/BkGVczhEtVRwvZ'
+        'UIbYItjAbwN7RTQK00VOHhVCxb8GTxUDgfHDkn75BOcb5UIp9WhzlVLki9Nr1mqQKixboQzuCLBW'
+        'g5KS4bviOMeHaefqHNF/mhaM8Oeo4UezvqrCpzjRdcbH1js4yflP+OJnwPtJ54saTMlNhdG+i8B8'
+        'LkvBJN8uMMo10/glB5hFKboGlAFOb14WJotRv8pLYhIGuS1L9kT19KVRsBQFW2M6DEygzoxLYFA2'
+        'rUIwg4FvYvjPsW5PIjmcwoLsBIr39UsI5It36ERG8uIKhtDoRGetXXy1IKMjaKxauz7N4kaV6UVJ'
+        'PSqgEh+WsM1z0eSyx6XDK3nJknfcqkfnPpTF6AxFsO7wqcbdZjFWo0C7On6YtvkLlq4SndIDy2+D'
+        '29vKT4zCGk3m0CYJUAzAnmXM7+oQZHrIBSz+HrhU3w7qX+RdiUL41aP2elkdzgB2djL+krN6yAfa'
+        'lChnJKA0doX6cl0CIQBFuWXxdeGwlDkS+5KU7s3CWFCOOI5w4egv0fsPMNGYUh/QzSWi+rXoMi4/'
+        'F8KwJFQXQHyK80y8oXtHaiwC9CcdbDK6J9P3YXW8Fjry0EBbeMkcOj24+WED7KpgFlWSG1Kz0QYT'
+        'OimkhBe370vViThkQyr/+M2665U6EOKgZhm9MN31/fCkce/8odvJK47hj2WGdBoAR5LRjEt3TYlk'
+        'aG1rtm7qZl9cvys1IAQtGfBoI/qVTbCTNwKQpJUtRYMV6rUWkGzz9aRAHlyedsbDwYeg5F3sr25q'
+        '40Wd0Mdq0jv4ToqQWKgM7Ah4ObGwUzVKHBPD8BXFN3rM0Wqa6Lx62hiMVuCJ3RgyXb6FkpjM0Qs3'
+        '1jNOqqhhsJ/IfXJMXz2eoFlcEtrSi9S34bZR1p2Rku77tZ6n/ahZG691rq43ctYiJJ1ofLe80O/Q'
+        'dTRv1+NxkywRNETH5boZ2Qig8wH/fb6N4+LPjHFMYP+JiXMX9wldeSIOdd+Fb7Wq1ICCqBO+2JRq'
+        'Fueba0uitslpryBCS/zZUGwwVD90YxlpP2gM95kVtjvDSRnodBX9ihip/wY0pglmH7MVjQ7FoxBc'
+        '3YbANnGLJVLHMx0MpNh2NWQPUfWyn0wu/F9X8r41hOGHVnQYmlg5h/u/h/sq9+sbhJci/8MZhVvd'
+        '/9MsUiynTyOEcsXOz8DKKS6YSMhcro51xnFTmfZwwJqQipUxYOiftANBevVmOMqn8aVzjS5UnlRw'
+        'LNUyQv8znVL2yEo56K0JFu7okgnFUrVslMIqgvJ88gFUo8f5e//XN3QM89ZJuX1EyduzsiDDIHzi'
+        '9EvixljIrOnpuj74c08TrG6vYbxcwt2GEbE9VBRkDlLI5OCtp7+qrZyr/3X9upkLKGrm+azu64x4'
+        'sCZ31gqXlxtCjZ3HOtczczcJ/d2EsJpEtdCi+ibKB+DVcbaS1heMXSGoJ3dTDK6EsuMrVJA+2pbv'
+        'pN+uGiySQOCHwT6Hs0nsI5DTY0HUS7/xypKyHlkGhjxDXb7vK8+ssDLz/ticPPxsEAy3bE70KSz2'
+        '8NRwt3+A5HwfEiLaYt+2zg8DSJ5SAayPm1jiAvD/ivbW+PIf/q3yOHS5CsxEZjICuNNn2MsQ0emY'
+        '8w8VFGAh+K5dZfrl1ySUJ3Lnr8NwOVr0+MrxK972AYGjeYGc5YkcfCNhri3dltFo3jvAYnzta4u4'
+        'OMn8RPBlS+5mAhUWT1YNLWh17DItrUienjqJd8cQVfGW7QzL8FMPtq359HzDsw/3g43iCWU6pAQ6'
+        'jU6KX1bz/3exUHBHUmc+CVCX9h4fVpwGjhBRzYoicnJdDXBbPXjECHC8rEpr3tL5NQ7UwCCezoG5'
+        '0vaG1QWh3IxIbN+W8iQpf615JoEJUhkjJ1vvBlxAKbFHHqQdjUMiG7H9flQHA3adQRWifg32s05w'
+        'QQes+1e6Z4SuyU27DfmWPn+Gcqe9Q1QNyyb/cqrnzKa1uQVamu94vC2MS+mJvZgCB/A3QQUEBWvU'
+        'HJdIq8vJ5ueuCrnv1Q+8otd4o+4BYzAsnNSiCopx/SI4qkHPvtTgnAq7pl6HSK8RzY4VbHLYLu4M'
+        'XtyuAQBCj19C6o3ST2pZI7GOxHii1FdM2HjSq3a+CE4GnMd4ST9ubS1QWIezPsA+MndZ+4w+D/u3'
+        'Xe95eTSA4dZ0D0mVa/LUQFRXZZycB0mztgxK4JgwEZqa8AUxc22Zr4tQQwv5q5huRp+JYPh0+zQN'
+        'M1IhHN+8IYfx39YJCi6lQPYhGi++V6SL0CTlC2mbg/0WfK8B+WB36IT2xeuhZeR1VqL2TlzXMMxL'
+        'LbefPsIZ17hJS+R8niXw8Sr+5f1TCgAmvua+/NYMc0ng7RQSFhHycGNrQf+no7BTsSQVopRMOyYR'
+        'CnzpDM+So7zZ5E8WshQ72piYMQ9wjiebk2xp7/VmDCONh6K8/1wc4DHrqD5NUODkZR+VbOvkJOX2'
+        'nQeUzuzo63HIqg1MseBMLQLw3WQ93ZlCwpUTigAbhkJur/OemWm4poCA3iR1tOZ3B+U8fm8CtgD5'
+        'JNGzYEuzRYhAdVzftbrOPi+/nJ44H6tws3l3D27f3q5tPMLIT1cHefovq5fxQCWqxIBk6qa7BTXk'
+        'IyB6MgMz+ytmbto2YAbolhQTZ/ShXTaLFcoWsB26+as8zfEnJtUB9KqnBMt10Rw0eJtC6K2rSLCz'
+        'lhOhYvl9cCawCGB6V4Kx37k9qpOYOEObnCK8sAfLdON/EBEoNFxcEh0KB/PMMIL0IGioAD5uZD9R'
+        'gqmeX4KnLoMPjSPcAlC8O0J1k4r6rU/t+wen9KLZmX7mBnOIDpAU6Fwq9TC02FJN52N6eq3vOVvT'
+        'hdDIv8Pk2j0uaD99q4iKQxO911ITmKPOEEJKWXp8msfq2sb2lWQFiZmrUK6rjuoZFNSAZsFI47X5'
+        'eKwiaE0I56cU1D68N9nXF8UMhyz71tB0CaixWfmkY1bCxVIbGhMFPLr4ZBgm2kVPf6iTAkTMEJ4J'
+        'OcDYHpURNiNAxZ4++YUhlbvKgU0o+um9QW4OpqPjz0hXmcW5z+d038fONoQwE9mrwe80QBExnpUE'
+        'WEOo94DUQeRZsFoOv9FRHEg4Lr2Ep9lFkPQXPe+Knv2eDSLt22oDQDx1BxAPea+F9V+uYYqwK0n6'
+        'Gzzi56G12MOrZ8aL/a1cxOeH2a8vtIU14vC7pgtx27JMayRMydZRb31imOkYoqSK2oVmDWYStkdQ'
+        'SgynJwPH0fp2112gf8itzKz+OJ/MgIxVBe/ay+WrhaAFkDaWuoYLb5QiQL/Uh9Db2yxD3F5sHhLa'
+        'DAOcUw9nR3sYxuGJN7n5Hkau45qsM0Ye+8VUtRBBY0zlLMLBpo9dpumpKhhHKAJwpwpoE8TnIMI1'
+        'RdaRyeJiyiLOPWoAcqSi+L10wLyYi2PM3P7lViAb5eX1SBAY2HO27tPh9Ln3C6w0NY8yLV8nw2/u'
+        'JBfGS21dbgsbqwT9fT/EwxIesj9A2FY/m7zFXG3P+Ff0seFbbAv+0YB23sBFlnpd03GUU40EozHe'
+        'QUii2l0f0lhT6i7xylDD2TMDNC3RASdprOtrnrHiQZe6HRrE8acinAjg3YWm7py463RwGLywAm/z'
+        'ctvmPGBiUPjJZxt43wnzp7h2QMzM8t1wtqN+2WAH1Spr0uBoqT31iSfKSdmFTRIoWS04L/1T6YbN'
+        'GCcpcCUnffYerq7Q352hBdpLHV62T9nvJP+2IvJCD3Pt18+GfwfAv/laY9vUPfa8byZ8Cy1yflKp'
+        'uxCmqhSo1j0bOmnhinM9n9q2Y01x/bMqxAgevOUDidW2XCLQYGHUJvbcPMC9U2nbvrgwAboHZtRj'
+        'oUwlScb+GDxW5t0hKV0DYNYCDX5l0pswgNANPfRiGV8pHtvXcEsPPWnZh4hvgdGOhFjyg+xmwA3O'
+        'MBt9LkZ3wc8SG0Kw9UH3QW30/WBQC6Dl6poZ7fPbA8XVIiUFr+QoIEWmOx0BKt3+wuFu1IoAjyeA'
+        'z0j7PAKtpZObUI2sXSm3IAqBE8qilmT8TCnYI4ngMKAR8S+6yr0Xk/MIYW1dbrhE5b31oaSDR2Ra'
+        'STGegh+eSmBiShdXEDWWTisoOrW3nq4zi3u3RNUKW+m/YLbngMguy7XaJsWk9/WEzkXBfEXMs79d'
+        'mV9NpB3UUvidtAYCXj8GsPLlZiWcnSNRXEHK9VvN29dx9QT4eMjvqbDtRb0oWqiwMgUbNIz/Pa5e'
+        'd9r/Yoy3NmDOF/8hb7nPo3s2SkuCVCMCIGi5dSV/4gKMiY3+nTfZ7NCpJ9Cu+DmaM1WWX6QfGta3'
+        'fpL6L7N3BF96tS9hRU9b5kB6RXpGmHWmJucSfxyGCCGiL0dbuJXcx8ofESJpZNYwOdV1vLxf9fn4'
+        'pyZqFX/x18IdZsVZFUVE+hOYRBZigbywAhDanZ9bBpEe+mL6aEO2SnPYPINm6L9vn5VilTauKJu6'
+        '2Id0BAEeuvsU/GL3OPTZQmuICEAJMV+ciAiJYcEe9JsK0Bl2hjYQlVIJfltmjQQM3l8GV23F7YhP'
+        'JIO/2AoI7CTBq+NLZHru7iFyeQ017d6Pa0/h6fvoiFw8GMJ2JF21sS48m5J84nlk5+dzSdq7/NIf'
+        'jNe2az8sfU8DnpgUdSQu5J4Pdc5BKUX48x32RNn1Xau1l1/LLx0uGH9E8qD0OOBtUad70RWkSeYX'
+        'YMabd/Ytc4LKUqUkDiI0R1gX8A4yRRV2KLWgvCkQpXiQxyl+l0sWDeI/osEnd/So0ettfWV7xW70'
+        'lhKRoKa8JeejTrc5RVkq/yTFkq86kx7bIVAxAxNCrCof9hLojYvkfry47mYEuukEQDUDPx9zd0IG'
+        '3PVaNhuh/YBxiiXqMrM1O5m4RUJFFtqgAKfpe80/wA55E/Wow30Lvr6FRsfLDxSXDM/0g9+QFKsn'
+        '1TTNbBpmu+qHmATP0PACkcbiP39w5eNSPKGsjOwu31Nj6M2oStbRukhbpRhhsRUBsHaEhhcOfOz7'
+        'Bn/wW+oDJ83pLuPYQIalK+9YgcU8Z3DU9XeAsKvPtSvIovZTTQt/oq+A+oFgy+2mS6M0QzmEhLJP'
+        'Sj1EtBk/EMr98zw7vJgGHMH6/XzwTo4EIkTSAI7NP99Ah/n+CbW66nMtjeYIXc6MN3brimnfpb3v'
+        '87h0HgIYEy7jrn3L9EM93mjK7rUADcr9MRdHKmQOD26wFomUOoxMmDoCFrbmc+sILr29Hl0HOo/u'
+        'I3MkitmcWznoWTDBtlAK719odQim6IRkphqFx3eg2hNs4597gr+CaYDN2wa/ZYgkiouTqGsvNUDm'
+        'zUftN0kIQ/PDg4tX0U08cxncG1ui0WQMYpYhIig3h3tCMv8/sAbD2wJIWBTADSaddDDLiX54q/50'
+        'CDDQ6HuM5MZjKUQ3CzpPKnly/WDn0mZTc9aUTj2BcGaDssctoqMkuahbHFG0nedK5IxSQbloiOQr'
+        '8GDnaN1eSOyCbo6lU7cXdyEZYsQA2wcac1/zr+MZZQ7J9wpzrcSaZxvQfpfvqFullHVJOrpeLe79'
+        '17MlMFGuKxEGU0AhSfGmpTIP2vpz3s6Es30BL4wS3vrkTfnnmzGh0BDNyG9NVRVIoP8cvMAhuMX2'
+        '5qwqJdOyOZ+Ev0C3vQdZ6S93vPJDSgavdN+xorr8mRHyS3+DLZJ/+Tt814VPy+qZLR4058WhTiWF'
+        '/dNSZjAsAfsOHNr4yGJGDhy737KedL5xvKpw6zktCD/mo+Ori9Rb8wTYIj+c3WpsK9EA+g+sD2z0'
+        'CItDKfkjqzMsbsLUXYVJp7YE+lakPT3JTTNqlCVrjc0nI24o+88vD7Uhh9t1RhE/tobQ/sXRR8P0'
+        '7z5L3NrboDQlaotFxYpH9C5ZGITKov5Q7y2QAgPJgDEz8R8chY1PnqQWinMZmlPP4nM5vIaD+qea'
+        'E/cXO60sxtowVGiLlsQNvdDf5ycjpBhmIS2eLkpUCVRqbez6tSf/kz+zsXInEJFRVUNY1D9/CGOt'
+        'OypuUUoqK2J47ruFGFNahHA3NpHauabAW+QhncxdUwZERdaEWxdoxfWuu1inGQJwp+bKfdBYZfRk'
+        'rKYZ2Njsh2D6S9hKSRjD/6bNcFcqmbkf1l9WfG9vfH+Ur0SISgKT1Q7QjxkFIbq1WZa0ZlFyR6jO'
+        'wHrvp7Fzj90nhrpftb0JqyLgt5g6DTz/sIIVxoUHL3AtVdAXsPSt4tv+1cGtIpCvaoSjsMrcUfO5'
+        '05DRHyTVwMAVyjtm3scDorvrRMvM6kb2xrGBdYF+P2ALliThExLj0VbbYQhgO7Vz+VJ1pT4rrpG4'
+        'Wtnp36v+L8N4Mh7VSodJcoPb4EGY4GdhCChkNuk1yXOMZmeYAi5Fi4HTLSCdz1VURACv3G0KkDHW'
+        'TwzWLdWCmae8WTAyzDdtW4hlu4XFjkW7Me0LtrnjdQtf4EsVE2kjdlo+mtpkdWY06O6wbkkVVnv0'
+        '1Kyul8Ezn2E2EgSNMimhNMC+1oD7qFBWikWalLpSl80IFjwOLBt3dCEYS4rIkPHCdym9kGYhttnp'
+        'eaz05elPKFuW1TdmyvZElKxcN34/7sYYHDQg8qC/zrpVhNmRI+BDFGZ7WDLqQ/Q4INxlAHaqRNIa'
+        'IR47r2Cd2yKbjvqFDDNMiR9bATn1fkJY2kozRXWZV/AFaGwl+tZyvar2wGsZc6e97T0dokxXuBxt'
+        'psG+EnjFXW5Plw5ZHXyj5nCRw5fwN0HvpmI95IsMcxJ7Fc9KhoVQVMEa2oOSMicGaOA6iizHN9IQ'
+        'N71OF9hVHrUr7fL+3jX5e1Z41uNiCEyHOhdpZ2yN3iOEb6mrYLpGYrJoap4sNt7oHham0DroKVS6'
+        'FggbwSYto+SKfck+kDSl/j9BclDccxYxFEfewFmHL+p21dwDx8YYUXtuEs+JLWHtw9gHik42Wo20'
+        'HUjpGoCZ3dXQjKHCxqAZ7k08bNAsQcPGezgHjCU6htkA7BQCEIis+Ek4FLq8zyR417RyH+CweqnQ'
+        'bv590nYoiHBF2cjvCNwUCH8mYsdz7Tltlww9XOeGk7V4AzxcYhtYiwmLiRxYUEVGJtAy6UGv8EQR'
+        'I6qOGd3dOp3X9kGv1/k8RMoalG2ciBe3tLln4n3j9DvPoWQ6v45smW0TXCOki0vxngBfVYWf04ft'
+        'DP3G5T8CRjEsetYXoP0JWR5LbDOleL8fVf0cD2tUxP9OCCCPGSuxoeBUSfBxeHhHGdQL+Z0huTwK'
+        'mHzrR13zqXxHwmnHIRwvTQgbv4NlGJxcV9sFXOsn2RxAdISoVq9qQdAfwZWSPcREF9+SEDqAqunG'
+        'P3GQ/ZYKiDOjj59PaKFsbNyhFWiJouwJO72ARd9aUnvebmAVPUUFeZyv9DtzpUxwXzmWP2H8GSxm'
+        'jttd7gAHhqdODNdryRXKXoGu8IdcTt3eHd0fxadPKSFwWDvA/zgrBHpejDqS+zdwOu0eIW7OQ34F'
+        '5O+wjihAQdisEAlubXf2x2hlIN+2xK9t/IfaEa9cDawHwBgsbVpuFfPXNAxym2ODqD3st7xlnloQ'
+        'ocIbe5px54Knhb1251+1p7SP3ECcp2K0wOH42ndloHvP2ViUfvAYWs5qUKa4O1sor7NkQlEX/2ut'
+        'UtJNaKST7RNPZLHdjYWqXr7Ehy2pqBbTsrbnxlqEoBDWUeyvVI8d3Hz9A21RjI/ejmJWKZiF+dN2'
+        'dCZRuGYOw7wTsO5EMyW0DzWWVUQw0m00/E1gpGwkhne/sORuBVpWu5nl+MojWuKg/B00IkPk+YCH'
+        'BpVAPy6ozmIlmLvUoSoZWGf7DPThneD73azOEXzbqwI7S5d/b7zGZMM0nzRXCajz91gZCvDMH49w'
+        'i6J7x+2TRzn0KyBH4G3VZvS6EJoFIXrPDlNCEAJgcbFsUJ2iLrPmgLw2N0pkee2qf8YD0Mxf12WR'
+        '7qEXUCjuUODbw/aH73adwouTmJfvOKWBBP1sP6zezhdwOQg14F1lJccvG1wiKq4JyTHKxS5BB8FY'
+        'r97aTWH5c/4txcFx1eGQvKkfKd3j/WBa+o3kX1bzNV9JaXX80s2BiN4hViPcRWATNJFZgie22xHz'
+        '+uhUEpbLWSK5pUthPgPxofRQ4REZL8OCfWo8CMDZdHUfif9sP3fJEAbsLtvU2W3W5BalT5oizFud'
+        'pdyDGP7jcQ2fBSJxZgvc2HsQcHvlOCkK/XmO359o524DUvYNxtiaBVAVTlvZ0DG4/+2LbYsiCeVm'
+        'yjICbl8fBl1Pr9X9NV61zcRnQOquFpLE2C0R10KnZX8+ctF2nRRJGjFlo5Tb0Yqdc8085ZwU8BPu'
+        'X2qEi81N82fq9CGl7XVhl1p6NeqeELbyP98gCG4sxcIH7WH/tdYXJ19PLOSJ6k7Xf+h6XWl7wnrZ'
+        '+DdycjJWfwQMx+W1EoaEU33EQGqZ2+Fa67fjGIBqeOu86V+laJr41LLRmdr9MXzx0mTASzQl0kgv'
+        'T4Qef5njRRtp8GygiuBJzM1hsbKFDlKvPY6Fy2BiSE5+v/g1u91O+icMjDo1eD7I0UBsV8kWTk0J'
+        '7Xq856aj//F77YeRRYF1uBhCq8fJB0KcM4PwtA+5UBUA8Fh+E+DHzEkWWJTGNaFpwdWf7Am/ozyd'
+        'XLwswQqzzqwCGeeQ5/lZ5aF7RzNwNwFnrQ90w15Ztzy4sf5jk15IGcu4/+JCfbOLulW2S5z31xtD'
+        'doOofnbEaMnbn+TAKlfHoPBBnOHx/SgjXJawn378JqTlXwSiPUxuaqcoLwybztO7lFCEBTjizFVT'
+        '/kTxpO8L+LY9c9wA1wA8rBZjB+uBkvOpCwJw6PuqFZpbfUr4bKacjOHr4hxFhPAo8pdwsJSsDsHX'
+        'X3W7HRnjt2w5ykXVq+epZEP/aLY+DjiSQoo+FyquFSEikj2aRQH7jL1F22oPMFQXWv9jYbBCucNZ'
+        'FumZIYJipJd6+NmoNIbfW90NTNs//DpQ9fMQDnb2qGLrneucGf0rQPUy7VpSybO8SL69dY++7OTs'
+        '16H6hIs4zMFwn1lRviQnyoRaEqrMoRUaKgjgDjZshOCAn9xlePc/gRzBkJo8r0gJBFCflev6xoky'
+        '4kyxQQe/F2ehwdI3R8c0UPJ239z/p0wj3G1vRdk1e9EZkg5ETILw9eeCUK/ASvykvvbt4+ZT9mce'
+        'IxiMYmRt0g+hohx1De3gaZpKHBO7ZX1TjzYrkutA4MkYIbr0NIFEW1k/GFIWC3/WKjCavkSsVO49'
+        'edeCMZeNKdoZQbTn1YNmf7ai7LGwolJCliDwES/A3AAxeK+NO+4IHWvTqsR6booBqmBE9DKSNccy'
+        'R3DmCbyKyyhRK4Li20HLocihtZ7O+GewxvxPP7tAbdEuHxilHpZaID8cri1CxEdaR13ngWZNKUYk'
+        'RRx8x1E4Zoh1uEDOZaAv6YU7I0StMEI5MM2UcZ2VIpwf8AiaZqxaCxF/dXsFdHFlQ3Y/sGngVwzv'
+        '9BcCckrOzb7i2zFuN5/Tv1GSKnzUil60EIKgZkaGdacqNkrhp91O/c4Dtp1WqPYiRlMfDvF+0l+9'
+        '7g/O4jlD4+AuaL5bLY/mKhCyOIFVfTOYwiw0kUkg8i+V+ACoIZQNdpDfeCisjR9mifG0CJi2hN/t'
+        'ohIL3RcXHhNke+9731NkTVzrcNfzbNca+jK7LyDkF+kK+Ae7ci6BEIwT1nyCqq67HjWgrI8Nvs8x'
+        'SOFpZJzd56AeNU5/UBPWCfxRj9C9Ov2IIgcC4JjW8Dc9Iyf+Jrf7iAKP24ORYlXTPrq+Ff73QkIw'
+        '/rLAnVWocCqcUVVqqwdWOPfL32QpIDjfwIxeMh2BLYnx2y8AV+DOemuH94btf1GFJPhQUx56VWTH'
+        'oA0Typ3fExCIiWLnK64Imhl0e2bFF2kqWrMIIV0sws4OSbDq4J/2oqr61xH+Z/2zUAiIxRmeGCLH'
+        'fbHNxzZDSOTD8UGMAIBD6eFN2XR7soFpKQ0YCMCO7y3JlsBbFRTm7qmtosqRuct3Fr/SVvOttTJI'
+        'JsGO8O9QbDYbZqvXieTJhT9QKURoEEySq+crfjpHN3kmBMDwTzWSCmfbhYZ38K348h+jimH+/qNP'
+        'RwkF2KChp/6c7GpE1GstDM+PsfYgrTktjM3jC8zWHg/VXoPF1lhyXgS6pCH5FzY+5XBYtoe+CnwK'
+        'yYb9V+CIINAeaIq2NZJPE/sU89KCp7n0rUNRTiCQtyyAiDYmmEMx6jLQRj44KT/ObwxpVtgGHor2'
+        '3e6C4afy4eAqnW0PqkDme3CcIzI8NunSJtvTqg2lSq43q3HJ1HFm0LBfPcssPs9maVD9qQytZYA4'
+        'bBp7zdkV+rsbjVwmpxNLtdH+/ZwNXmGdFWt0j5DavsxLcSQKcRvIAUSaEs0rYLxgTrYjDaXSZhCk'
+        'J0r9ydoD/63zr4A+qq7ooD1LRBUrSjmnZIxS+fGA4FXRDC4ynPZw8QLtJFYzcSXcU5djtmH5nDvQ'
+        'yh33t3j8NZiBz1v4rQrzBWDFHZURQbn7fZledmi6pw06SkW2OQhw2MwjkqiquFS3NSH3J/JsH+FM'
+        'wmUH3daOcD9zA7qjRHgj9y2LMMufpX32cR5y1R47/o9KcCTEMvI7L7zjm4DC1YYeTHCm4uloAISG'
+        'XLXVdqPyR8h4dEUTNoBJYr3vc15zL/cLIEoENryrAgJgiS11hDgg7Fzdzq8WIBz6iBGNeyqCACzR'
+        'FFirz+YxQQThhwTi4I0/fgU4xITS6DvLbnQIJ/y1BLyRMzZMFVrmKKnv6/yMX8EFTScZrzHEIOmq'
+        'LyQv7izY6gt9HYQ6gaMgNQ0ua5+8ChoDhgckzWDGDSDEt8uwTmun6qV/m+v1deGELGsgShTwv5dc'
+        'aJ4gcPNZC2zc/4Ek4bLHjvAScvLFE7JAZbq/b8u4XkIGCMBgTYFc9f6dsqFlKf3MohZIovaGyjYP'
+        '7NOHgFljhFBex1wTxBJEpRNpzeEW3E49jFBtf0tIJPWO7xuOdkm8JjCB6VBbzvvRDiPXsg4s5rMd'
+        'nttrm5TA+pfjHPNLfnnI/XN/76Lh5oFTdxgZjhJMxJGWAcOdMqavFHkWGvkL4CbE/A1+ncbN6jSm'
+        'MLsGSTU2TNlfmhSMJCfLFcSnHuLjexq1r89YW7DmKkxmZwcgIHrDOEDDTQ0dwocZUAbQW33MetR4'
+        'Y3HWp6dARw3QzdYY+6c08Dc4TAA5TDWgItAZW1qu+OggB+WpywyudfJlJKt2TEwofSRZhTowJqQZ'
+        '1ldQvNYxKMYJCYjqqhp441yMJKcp6inGZ91iYqqt9pifw+E1QTibIZQ0NePdSggl16/brHUYZG5R'
+        'RbDLWxHbkrxfa9M6obhmKe5sNSQ0O+CQoPkP/mtME42yd8NV13/AbKNdXGel31+P/2YhdPP1gLVu'
+        's4OSbEr2ks47wWCbpK2mGlfFU6ZTjBUMXukEUf/tVIOiZcxCwWRz9rHRFBP23iBLdsZ7wVfUONR2'
+        'ZDFp3iuWn1Qdl26izolOtX9RSyVQLuo6LMnlm0nnPjCiTCgcVxeXV2Ut5xpXdQjG1AKbLYu8X5DY'
+        'LZORE2caxeymlGhaaPn+mA8Oio0dm1f0cphmQDJ9rNxlOorTXzhF/gFAkckBxgfYOD/TSnr7Dv57'
+        '6PCLZ607pHVEGD9pEHXMAnqbG1WbIo8bMDXHwSbUX6GDqm7XUdiYS8KIPmj4RRPsM4NtFQA/eIOg'
+        'msml9cLcYTIPuH9LaJZ/2N1gCsft9ThyKKBwDF6Xw3ZB2kPjVEnM/8NufnGspagVdDVlO/Mb8d7c'
+        'QB26eZF5L8ezqWanYM+WuHGZJ5rgjerGrF0tQ694tNXd1/wm3lcpTGS49AeATHSot8R3+bT6SZs8'
+        '7lbcniC3P4KHzoFD+55bmgZHlsIrXqaymD5Z5/57l9DcPx/Lb7LTtqV048imm46Bs6x/Aal04sPP'
+        'OJS2muREtgRMZx/EpJkcYzUYPIImqKK7pzXXO+nFhdMkiDI/ZBk8suFAqbsrJikNNEcdK5A0Sbxp'
+        '2nEFmoLqxhY+TM+wjf2ZPFnwj47jJTpGZWeNuHcIxBAd7WMOjiCC5lxWIH5/wR/8HDNuMZkEW4Km'
+        'A0Z2tWOiqNvFP4S4ZEW7wJzAQ8UCgjZt9ipmlNr3WQTUlmC5jKqVIhN6Wpj5qLcBZqvb4CfkIDFw'
+        '3tWr5TZaj80oQ4SU++hLFcsl0v30vPpwJpSAtYzxw4DcYImBbPrEE24OCz+SC9UV+eQI79xcQ+Wm'
+        'FZaEiLvF1mdsuzAM4YxfUwP7RkEq2qaYu8OBs/SiaMwBvWBAILZgq9ooFVrkVuK0wH4IhK14TRiJ'
+        'w0o/8kFg4Zgf0oV0wGPrnFkOIy68+W9AqRc831qSqJvISscjjDgYW7yiqUMkpimmHj/z6UfghSl8'
+        'tlEbSteInrygx2gjGdX79Vj28nckVxywKPm2FkCsgc7wwpG+a260h/+5D1K8AvQxqIbJkxNPKtd0'
+        'dZerKNLn47OUOI/Tq5OpMUnFlXKzjQStQGAxkLuhL8pRzi5EXtrOysgp3kTWifkntMeq7vkBCMV0'
+        '0iMxKzruUlzX4non8nLLvF2lLC6ZKPpWgnFROP5c/isqzDSyC8pMwmUPeriTw3t+KhPBIcLcXsFE'
+        'LTkbG7z642YBh/USFKCWlO+1NbWoV+V0d9vthHqw3hKDWBuyS+fjZjb0o8ZYXc4MLi8CDUkf4486'
+        'KoNrgCfHmuN4ZbNiKjCEUaeeW9iwZMhWcitUEj+NAP8V6wXI1mgtZ6c6j9fbqzd+g09CSQt38W3j'
+        'BxBurB0wZBkm5Oh9ONJ0JudJ4/0GnCgw2jqT0dik1mt9QIEbx5HQ5ruSIuloXmtjWyZMUpn1Ubyo'
+        'Zl6dU58bRIZguYoSqwv6xKMzHssFlSiKwD49ZamR5fQ7K/KiYA7umK0v7DhH2Sr/37K5jh3s2MUh'
+        'Vn8WcMTXnFDxAY58V8s1u32IZtQ2W2m11A7f/2Lf+t21xREFOV0U056Tfuvb5uHXMo/3ur+mZOk3'
+        '5HCUfB+ou5z4ftfe+4XtB4J/buXdSz+A47yQxP6ryxRQiS9rWE2vnz9k5eCFx2ATmkJCUg1yqUrO'
+        'zUKqFpFCT3uPWIns7+OrxfZZwyVtuHraxisxV3FgM2LaF95io+CJ8iqQx/NOvq7PLyJ5YFtodAOQ'
+        '/ElQDZsA9myUYXbXJDNV8xkLTpIY/shCk2W8tVkwhZldnixeqA4iRmxrOWA/WtS2HwgKYp3V8WVL'
+        'vARplX1nAq59cIEMirrlfrLYO+Z+cPYtc7CQL7CXFLO96QBtOGtrplR5xa3+/jgCfulrqYkOROwx'
+        'gQGFqbXook+cY4YKaHrmeLL4jZXTDFUCXQETNBfwpR751waNR+JlBaB3rukmA/cMexgY36BjNOIK'
+        'tLsVQrUwjy1DmNFnyfUahPj9bEIIOoa70rxGzv3HjYA3rjJqXbyx4ZAY8tbsiyYQiUkKJy/ctN5V'
+        'tORmFB111rmb08Kn9QFQwpmuXCfFBaTVs4XHAHiBPm5F/XXIbaStf4P/U2DBywm1VbPdGJmiI8r6'
+        'lTjiuVFk4z4+Wz2XiZJ7pqldWAuMf4H2c0LB6KJQNI4oHZgZyzsVbHfi7INOu6sCsTqrUQZGYN44'
+        'jHGKnJeqOdQMs8HYSzoJvSsRIBonP+9qU+xQjdJEeYFGc/RHL8ffcNJvwqqcCLpYzWfmf7xXmukc'
+        '/bZToToKdK0fLmoJPcHfxWHSByDmZ6TZ936xPVszD3bEETFhDfmUWPoDwg6KZomj+8GR3Lry2o77'
+        'iYJOi3aXBsuSPdHDiy8ARzvii2rau0vUyOjsppAbcxHyoFkbdPo4o1H98i7HSd3QwBXkA+eeq6BO'
+        'NZqEuSLymPITJiUO8HLHa/jF6SXtOXYa+hP8JpSY23YD11crMkwExiZkcN7hpDsypNNrUEkG65oa'
+        'WNnrqv3SMEE3qfDL4pFSGjrTkFpFoTgfKBqtUdFoFcjvGnPwaRwOi4dylN83NCt1IjEKqGbnIOGf'
+        'b8eQw2KY2b8+I1s2OuAEk3Fs3b2N+eosQ6lUc8I15kJVjmeYUn5MdsPT5FJEwmQngfMV1VXUVq36'
+        'BUBidFS8BSmbChem9YH6pr+ldqUv47q/KojrbmJHoO82JAfhMsVTyGDFOBtAeDkbhBLIF3XC3nQZ'
+        'VLwb2aBD5ApMkViyob0QGSGeM7s2/jbWW44qn3wwqyxWSrjy6gQohloroad0Xw3MfGwfv3K7G3lQ'
+        'YCMa6wqtgSABv9YGsuHnTFvar3O+HrnYKDupkzlFOG2/4RschZNVwqJNcva4KsC7+QptOC2mjzFg'
+        'U1pJx2gtJGdVOGbvW2KfDEmZLndBjBK71NllHlOYi/eFGLTENGEsIUkmWcJGvnhCqApjuyd4OkPv'
+        'BKTFLgdnENqrV9JuWSiDonDLzWfPmzJzL+lDGSnd8TFw8QFwgsNG29QPn1ph+VU/AvHVlkZkoEd7'
+        'Surnfx2VEESgSeBtH05liLPLrHPG2o6Dm1lBu0MABs6n+6DR8UG3/yNhIpgOYve2h/GHqsAcvmND'
+        'xdRl9lVM8F8CXHl/g7VuBZh0WSG0qKRSMJtQqMRAb1aFX5v2N/pS9sFgJBTpJ9KYtbHI0Jgp4BIk'
+        'YNSpwnXdhxptmlTVVHOYA7Giw1VsIQKPmgWFBIMOHNJg7MzkPamSwQfg0ULnE8eZN0p7MdAZkvVt'
+        '5hahlNWk6uE1d1mnwZzjXxsypc9DFJ5uVhVWMLw3Q8DcVpW2m+zKztzg+dzgA576QSVkZfz7huKC'
+        '7pna9thEpzQtv2m9ZhZRoKhk8nnVNIu2ZNbfJfWhP+HnYbFDzT3fSyWgeFHKRODA3M9WOhIMrCoi'
+        '+icqjmakNfYyiet3IMRWvpo3lQkR8h7hWXjc4vWJH0OjcVVO7ap78goySyKh9R6Qpcl997wadOGP'
+        'crZEF9yEp7d+mZAzO6BBzlE+ZtmfC6WCd+1vO84k1ihCXhmPbfVBu4TZe85/8GVr5eWor8lfkY1l'
+        '96xhnnWZp6m4qA3q8okJP6gG2dpos0I2oGnduWeBz/UwIWXAodmSuaYecBXx/gIy2AQzORg7LeIf'
+        'z/Vn/fia/BH0assOHw0B5DEwDz6FoDzdryza7GPJequqd8b2vmYR6tI6LlXfLl/zdxEalHtgb6VJ'
+        'WgJ+Ki08jNzeegRoXPAo5Gma0ignRBVnnLsP7dBotRoezdaggZu1934SKr2kZt7HEhjfVJ3JKn8u'
+        'kA6Y3zHtHeocs+d471WoDcZiIFs5jAipK9wuJ1R66JolgB3vJz5mv4VE6YVeGyoOi77I3VXhqJD3'
+        'z63KP28nyGWl9bXGYCM2kcvcAVy70zrNxiX6KamK85wIM98yzTgSL3IbFiHmcn8xd/G+pnePNYmr'
+        'R+0BoPCNyCviMkxYm+V9sF6ZBl+QSe4QxQIp9uqXp54wq2vY5qyZdOaJR1+V7s+jZZUZBY88cS6A'
+        '1tiAG0RxwbOPoN+VhviTvfW3of9lNkEhiOZjhf5sqB8cQfbaQvGrmc2u4SvQoim+ilLlFsyj/ABR'
+        'F+j3UnfWBNbzp0Y/U5CVsxlYY0sJqd3PVJqizh7gTAFsavzmLwCZoKbNZXUw5LuOFmAiqbulRgdW'
+        'm49NGCIba/+wB0CyPSZhmp5ryBPcXhcjp/osBTYbDSlGACGJ7dp8DPBhjEzjhsjU2O1wE/hcCC0t'
+        'DusBOgbo86zBcTklR9wwgO3ZG5o8pppnpv8f+lMU6BcZDPTikDFxYwaUywnYfGFp4zEY+J8apO38'
+        'y+52vE3qQcNfGSD+LOLx5nHxhI57i4mPU71oY1nW6wTLDGGwNpFECubFuhVkofItp2aNmfhqXjWp'
+        'mntRDzVzLswm9StviE2Psx7IqxwwKhfZ8W5G+68jfTAT3AeeDBCXoKmS9sDH2DHe9UlNS/goHpvo'
+        'RPgZc9JkhYcOrskH3JEFFOYe/ZvEfmw6G55eKXFrO3jc4b1XhKCybNK4VmJuvRkzBLPARAGD4s1x'
+        'Pq3gg6ZF/KnwjdT+gs1Rr8vq/lkvMA9NzPSpxExJ8lONeVetyJNiquwLgC1M69fPMzROfAjxHyig'
+        'h/7KN25b0kDrz4fvnGxVslRtZo0mvox6cEdqB/QtQf803nCdKcI8EFJlT6nBFRXAEtDqNovrzZQn'
+        'lmi4kCno0s1jHE6um12mE5AtfQ/ckikgxCmS1qpY9lVE5ZDndkOOz6QRh3aiL1pkQ/TrzWswg7Vq'
+        'MIZ50myGjtLjOlJnczI0xF+m9akIzMtv80Z4kwWwkTAI5yQz7bilk3OzhOd+lH4Pc6L8oO2q/EPv'
+        '/eyqHBf2buILeMpNJjQKxvnUsdiKlBpCJCts6eQt6QHwEyAQb94aaA6UMkkYOlcz3eNoVCsqVMAc'
+        'acG3FVyxefmN5Zn9wuf2FMx+w0Ii0R7wzL83uX6GVhCSk+Uhou1KBsdlU9njp1U/I0f22y8unbL8'
+        '0ycdQTsg+i99tlMIWSXew9Dm2MQLM0hkMioyAUsb2VgTfb96Roy61QzrZVvMdyVrw3rh1MHFsyo+'
+        'Qgn5eJHJTWAYB6ZUeYWjzP0Nim4A01Z9y7tfKoLa2muA0kaW4qagB+Cpm2aaDKzDG4TUyObW3twb'
+        '2/qmlnkUOSWL6ijWQC8gLekEDAF81pmn2Y7cQ28aBT8TjomiSzFnRLEkskneyvLRIMc5xU1tGldC'
+        'VKhFBxmQW1E/X5ZCLEVsJAwnXwGQ4TRHDVBIo6Drkh1RlVb9rL2GcdmWZhM3vWF7NzKu4ctOoqo4'
+        '7XBdqqI0pgC9qYW6iSMOR8fOZElb/G72A5BRdjBa8P6N/eHX2GHdPByskf0qZ3Ie8FFVMoOBnjlH'
+        'zoGwFYeiyGHJ2aX10mStpwZZL8XNf++qSQiOUMA5V+6DHHGeYT6vYPlFroabqjTIhtNT+kIJx+/7'
+        'HAwbgqCUn+KZsXIBWpO61ay+idxWjDYxWiRqxH1A7fO5AsTFrS4RH/gS860GnPi7wkc+4a2FUqlm'
+        'TYIKfSLvgm1H1wNWFUaaSDsaJZDzIBDGJtLZhbTYWsBra3FJiojeVHQL7oOggU1QNbhmz3oEiXmg'
+        'egWt1cw4SeZpRkSwlPZXLVM7TB16Mzi/ps0SSGNzcB0b1KWQIQmhPkOpDQw//S6YpNt5+cJ6cfpO'
+        '5kERlVlZozr6/zZqCk2Izntv+KP8GMtUSFVYF3NY/FzN9nzuIwgYQLaWfJlDrYfkyFjRHXbxqL6Z'
+        'aMvWKMA38devQUc3sdrAbDRBZ8/L9JMpVbU5YHuU8F2lZrcpn+7yB/o436i8IRyscEZGDj/qOP/j'
+        '0VR/PJUi5QHgAr3Y95LNrfpPVLHl/BvxMwaDxvHL9zSe0Ne0VmjbUoS6zyXPAsEBMQiG/y1OsfTV'
+        '1pLE9HGoY72xC9BVD6X2ZYIXupVXJVFbgKq2hFeAKMUOuRBpKlmvCMxGpDjzGNBdieqD4sMemFQk'
+        'Jrn7Y0OCEjDcAq1wmC1qurQnvNjNSgG8z/+1ynArCHv4+Hof7obN/+Q02aBxRn3FMo3lnCtOEqPM'
+        '1BJ+i+bIWwVoUHJ/KO6HkAfAeo42yPtzqfvPrBFaTHQ/XfjRSz8FRRv5Eqe0o/q/riXb0sbOO5QL'
+        'v4tMQAhKdk4DzJSeJrlClgsIFkpeLd2ZY/P7vVD6uLDsjYibU5sxvmsLG0NDnO12rn0YEyBfkdL5'
+        '2N8/oovs+/8A6z0zGuOVMSPjcX2jC4va9RmXC9xqRlJ7mf+UXKXdMcc7se1vXeryPm+ges4tBu2P'
+        'XtctcEpJnrAtqnMHHkT8TQeokj3txTskMh7QmW9miemATMc1mXqGJaiKjeinbgtqvmoWLKaBlJAv'
+        'fxF9nxIzUTubOoJ9MKwdSuHzf2+nQ2AR0CUnL930K8X39Izd3+YnMeOrf+Iz8MM6kaqo7CzzLEgl'
+        'Ex1C02hPHlrUDwEGlVeyaE9d/GYDhPAb1mw/udqqxXJjlfNDLvFRSmwiNJRVgAJAMTyHZEY7ALcq'
+        'eT0wfV162191jKVDz6Lf/iaFPqtiuz/nIsOlutSiTS/biHhggZYcMXzFh336CIBhoae2VlKzamTQ'
+        'aCYEE2s+qMH2AEmlQeYuRYC3llE2WHQA3GYGBG0nwRMs6G5kSbXWtqkQEdhpA1MWJPJHz4GvCpZ0'
+        'PnV9wPYKXdaoKbE+D9aIDW43ouQ9WqebYB2BBcFfPsNMT4gre79pV7pgVZEVI2jD27tUXvxcZDkh'
+        'z/qU+QQcoj8vFQOiBa12X3kO/dKTjqqPwU6ZIRlnVq6mVrBaFrKrWHh1JeEB4OSQvsTHZ2P0aBQu'
+        'SEkZnOPnYcejanocjjBqSDT0KAowMB1anMWw2WQX+RLrA92LSOXBK3/9XwKE+8Z3v9fOC+vS4pIZ'
+        'UubTl2Bvb7rtsykhnRJv6EB3ClfakxUmZL1h5qlhM/WnRMSn7WWbDIG2+4Ea8XcFP2M2sxw2X/45'
+        'dQwM8HLVKAfCL/h/VZtfsH4pphmj96arIgUlXCz/iAQLwga6gEpWl+0jX09c6hwImatsc6GAB8AX'
+        '9xJ6EEAus5bCg1901/MXONvc1KUml0uUmmMPIJyDFOt8jO7RT6NVCVLbmG+0gu9337IK27aYrcm1'
+        'bYL0b4jZArgo5AylNPkhUl+moGfj6P3icm46JfOxQFYHn4w2O4+tBUHqCDvaCHctflE3f1Ulobh1'
+        'nwOCNPh6BIJaRVdFsDaACummk6jd6nbHET0gOjWMchLCZYpawlmGfEuuLP42JPPTKLdg9lwXKqDK'
+        '1dA6TB3C8h2gxbg2UI3m0+yLmVsUnBLHjS3t4urUUBpgQ9jSRQbrQ+/1Yz04tVXqgeqQArSXLGiY'
+        'ML8uStNXMQ+lalWXhqGg/+3m1DrZkjBW7HO7j5xcg8nPA751WGRGGr+h5BGBlFuzxwO4ieLFNEuz'
+        'pKEhzpBwCKkZb3r5G0dpNm7l4Gqd+wY/yVFO8JjEs9edpGrBLKvYXTZr6/qI1nKpSmDu0GYHUUuv'
+        'MBIv76A+coaY4/SdvHnVMIx3wGlEcNDOb7nHxfP3fShAq1v0/86BFfTxGLFDilTAVzGR2Q5qNhFc'
+        'OJ9FReZKmeOK/Xi/vR+rk+9YGQocyq8Nm+ogDstIZtLk0GcmbXjiocHFd4Iia+tdaqCPV67QqXlr'
+        'sSjAmYGbvnzwGXtIjtHsJZIMXlLux/XqspMHbF2HGNeIooHDt0WfFO5LVnGVSRjEny1KL2yN28Ep'
+        'c6+rac4tDkJXGaeS9pLdrc725pTDOfACUUA23QFAMITm+P6nwCArRzQ73NS/vM47TxifRWayCOxF'
+        'iZHVI1CzpgDci0qkoi129xNvNw/GqbhsB6I6UIAKBJD0sz9qFxOxWvDimgbckfn1uKYmIC12alys'
+        'T1ruhSM+Rr9XsUOBOnuUbAPtpXTW/IIPbyRsQKwxu0cE8TGVa15QlL90/KMqQq6caCD7tJ7bZCvG'
+        'r307Xojk3Q6Z2pMqg+1NZf+q0gXEyTPt35OrZd3T8s2n1rPoXvJwB4AykM9y8TFK1bsT8cvbg8mE'
+        'VuUbNJXfYLZ/424XSH32KWBpuGIwrACb13wCEeJ28MCm1TnOb8Q0AObEx/Nn0ubbibuRk5kUiHMc'
+        'hEHJttKiBcd1ZltFeqBzy3290bB4iMrAuTk4AyQdrjce+YRiSuxvN/NvZhgf2eUUNwTb587wxEIL'
+        'NiY6OPzeUsF+VmMU/ifV/ENqDtn5Ak7WCh+O5cgt512ByVOI3/E6fl/K6CrU43GIPLQduNRMhjeV'
+        'ZFUxH8fMTsu4U0gXAmdh5p3wdUU3EAombdtvNapsUmUIWxkXPCm6FQfLANIr9nCJ8UGbKUbJ1PPA'
+        '8ah+kfFxRivWRMLg/SEN9/m5oMlrYiFByBrDxGyp3RNwz+6PcfB+acZw4r4RiX/uj9EZ2IX3Nl4K'
+        'gtVCG9asI3bhYsdQu0a83MOh8cA83cTyfnFl7zGh9iPCH2/fwiFXMwHv2K6jMnA3NtnuRiJ2z1My'
+        'zGv0knaQfE4lbnfzPWGBZBeSr5eRb1AgDTgyrcTNEZ13Dr44ramTiUDjO9Azrx28I98P/mDGauS6'
+        'c5NBOfuzzKc+01J5zYo+shWzUP2803fELiYbN6jVfooEHM3ONpD7SZvi4brQe3afLmlyxwrNYPns'
+        '33m4YT3ICXg3nAXD27mTZIPCPjc8VR6z+aY7F4Y/4mZYaIZH40AVoI8TlE+U5M2T1DKRah12rSB3'
+        '76rFhCZ+gKwfr0dcK7JU2QGQ+eNgSbd6lY5TFDxiSj5gCnNZZvA6Sa+88VfAOR5yf/ZAjUyo5E+O'
+        'DOtU03wPc3DyIpgRHfOj5rhuuGfOcqxtue3mnaPEaxIDLieNndCqbTddFZXqJAktS88uvbQLKFQq'
+        'n+m4Sfu1Q+SioU0H6KOZeYBwlzYL+74QNW0TOtL3OG4Lzz43cLH8Yk3DFgsYYmEAnvgktRMBs3Fa'
+        'py+f0Xtzd/b8KPsZp8snfF9yQcE5cvLL2KN5YQcgxyVy4w18ygLn4GOgk8HVuFzoxGHc61+dCg+u'
+        '2HQdGMmcErrjXpHjlTaFbKaIXt+dulh1omQrGKRP4s5OEcsNSvtWiMxtFVh4dORqnDxbHReO8mhh'
+        '2sPWPyzDsui3TPhzUQd1ne9e21nl92NYN4w2Qd/M+ew5lKen6SUFrzA8LhWJBvFiNdPhYJlRgdHx'
+        'bbG2AzZv7aTPrfXHyXQa7LjFVk7Kufa0OSsI6ZAyHqvpQUbrvVCPdh1QVK6sRFcXfsJF2KQBxU66'
+        'Hg12S3RMMCvO2vbMbtuzh4oWKfFSALyLAC9oW4brY0YKWebOoqEBeFGkhPB6PanQ2iNiSGv5hQHx'
+        'R4ZT7pV2qkunLg4vGEz9AkSGRzT782FtemTZhTOBuMKruzOPyUzEojQ8AoWK3TXuzhE1rgtqNBQN'
+        'WfWTTxCokuwKtjzDha9IkijUGF0u9shtCPI7576Ye8R1KSnMDegx6tfb7iY43P5uh1oVnXXgPPqK'
+        'HY5LS3ekEiEzYeMI97Zy+o87WwD+P3+s/Wy+5Zf5MF9vzExYI8oOxyQAryzYp7feFoGU0XJlubTM'
+        'qt6TT5RJ1RGagqBDk7UcPqQZLNxjMNe7EOMkoC+sk1uJF4mxkp7stc6vyE/5dem0tTd2unHzlwhk'
+        'ka3MpMhDQbIjsop2RrPeX7p9LgDF2BwEwqKhsO9rT6NzeSnQQqykcuhJlWzCrHUDp/zcieE8QHqw'
+        'KmXgPxCJgNUBoKyQEKvLxqiakqeWULT4MT4bTxWr9LMJlnljNAWAqQc34PX6FnWbgcp7tHVDAYIs'
+        'vtqPzMLBYkcNZigO3w0SA74fT7z+oMwpRbpR4PVdNSGJ2jeStNOz2y3xtiJNQUnVbzHNaCqvV/Zp'
+        'N1Vg9fAf3rwqpWBpLw0JCY33Dx6wsXXysyVkjqvUfQWnVOv/SAAc2jkrVRRzF5RDKlMSut/Z0u0h'
+        '16MNUIVbH5YfHTL3/2xC0438OzZSB0DU+NYumC7YtKnwadINB6WIeo7zqkqEXfPikIwD/pC30pZS'
+        'S9PVfnk/3HUlb3cg1JBViKmuNKhGFGWvPS3V7nJGcedbWRyp8p4wERe+8cckRB3PNvEeW4sNjj7S'
+        'gijzG6DDZR6uJPtF9whaemFg9g3r0t9Qzc1iQOy/uaW0ENIxGZ64gxJiSY8AKLWfl+sOwDXv1rUF'
+        'O1zkyXdQqs6SBO1fhQA7G3miBRKtKRWgou5vOvYlk2O2OR0QaMRNBfB3Tp5KU9QDUgF6oVhLbSqN'
+        'Hm8JzO8qjidu8eETlonNvOdBebf9I0rty04nqA1O+4dhZF/PkICRJTHXzPedpiKQEtXEt2cmgXRH'
+        'YbvR21wRbeG+ayInQyswm5DsTFj5U++2QoB6KSCFGWqtlX19F2MQH2SYDFeuAg12Wf3yf0M1npqv'
+        '0GN6+/MbbTYrQ6IN3/OIjVmD6kjipN5IKgyhDhj4VPGHh4uWMAkmiXEny5dwg6p04K6UZ/BSHUDx'
+        'FVVoxfp1ZMs0Rp1YyVLUV+Y2/ju/i48JhyKRbgq9HJj4tiEMgIoC7iTc8uLd5FPczSKl+3TuH3dr'
+        'DMM0cVWNyDGYPrYSnduNkmSVssihaIu6i/q1PTbF6pHd833ri6L+0WozhiKwJsRG03W0gsSdENI5'
+        '1ztf5nNE9FIfM0oSqYyRTDG0MPXOaMckOJXPXUwc2GUMDynIpKNfDeyTEU87Mb4vrmqsAUsVQyki'
+        'oIS50QFgFTZl+9JsnMp1NUWzLYF+v4zc9C54vmB5RHYNprKzjhyRAGWLGndSS6NWz5qxUMqesbAt'
+        'NAWraQKPQwlmm0Q+ropHZ5xQOrXev1pzskrZoHDLkE/XCepA6c3cUSNMFjBjzi1ldBZkpglsqrj0'
+        'gpJNJA5iV1rYnQaseEMBOThmIqQnkSZ9ycw14b/X9DYYaava8iKPT1MfADif3nibdiKGFs6JTVM0'
+        'FXifhDDJsgRBjqL6CtplJydDB8BkxRzbFxRjq+YLnoGU2zw+G0ASiWlorqAbsw95i9Q/xMKmWpY3'
+        '99IxKmUMtQM+GV3QP/pW4LAO0KUwUSmKBQntovqQnF+QIHw2aMkgcfZ8Tw5oo4SdaVaqTiPBqCWn'
+        'tDmNYlwPaUGZu78lKbWaGiG9+QjSkzcMDU2JXTX7YX/9z2kdezhpwPo34nNlAG1Win+BHTEKOTqJ'
+        'A9RYSjs+NFcgtDtP1vOoDrL2y6g12qCcNLjedm3Hrf0coK+uUulSYblnleXCK4QEqfPN+wDp/M2n'
+        'lsa1mfw0Ruq7uED4DleskKBvKjIkT5SdJTRddbFEfLSdMCi5nF15AgPitdr3O8kG0MuKq/pRX23O'
+        'LBdq2+l9bV/6Wl1JIX3qrmPISW/+2fJ72px+OGjYnlcaO6T8iHS1Xi7tUKTNx0YXNO2864WD1uBM'
+        '6cTI5cdJ6RyPcFLIT2rmfNFp1dT01fZkfRAGzOKuqHmeGdLcESok8QxVj+Auu3PAoWaoM7LB2FEa'
+        'khKIrVQngaI0D5El+rzf2fgV1+2D9r1zp8JWv1WKOfEqZhOg4G3JiuXjhh41CAJ8UZlirFfZ91KP'
+        'iTKJzW1m/E5IHHdfuL4Zqq3p6SmC5BLFDEfzH3TPvsbR0qtP+YlA71BSPzg7BDsFJyQhsxe+0peO'
+        'qIjkyQYkoW8aAqAgEulODorHjido7BCOW2MfJFSJC5dgYmYeVlvehjJnEdJU2FhpH4qhFOPM9QYb'
+        'B2b/zQFA8qOwt9WeRIgnboGB1R73ExhRLEcjfvZJp+u1M1Urhv7Lf0bXUaxlgy+h47Xxit0ZgkZO'
+        'aOaicOtp9YoxXBgi/JZ5M11A/6eObsAke7Dr247d9CcyYv8XNu1w8ag1cR+QyFRBOzsb3amCdyjg'
+        'AJ91/lFSMwsk+O2k2H7ERpZxZVIl0/D6S+vJL8MFNQBaH/zSiMJ8bS74sBz1KWNOzEbLgj3mr3Pb'
+        'VeaJMnkh8umG2cMrfeRrSWxLNAeAnjpMocTG+x/oRhCuZB/JnlgUXmMA0Clut1HaLDhdshTmxFVo'
+        'kwp/7LmPpBsZLwFrr5trRwhCzuT0SIDXDP6gEZf9tqDU9Pf01MJ2fPvtQAvalSpNO4Zx0Kxx/axj'
+        'ujvvlnb10cBuaP/8Ms4TaSA7OLuJroWdWGyTRV/SKCdtQP2UHgETuwlDPpWalNfaur3Y1fWTj/+e'
+        '2MtYKJmEdyJ2gtU+Zn4WKmrIYTk3Lu6TQKgG5e7HJZtxwhxwijObVcO2GlT/h3vE2qZHHfITMCVe'
+        'z/HfyTHXyInXjv+u4b3brwAkcqGXoEuXRx/pmoK6qm6/+DxfSSi2eKSADAqGCzh0NZ+jqlR1bTM+'
+        'hUnvmOb8eAU95kLcaErAKBFdEqkYs99tCoF7eDYGnrw95eP4gp6K99ULZM9HIsPkMl3vgoZbRRuz'
+        'L7d2DCLCQZ6zZiZWZfWV+Bfw2ujcUEzp3V0EgXQJmb2gY2SJWqASf1ffLvJEvD0Iz3IgQbSlHVD+'
+        '4lb+vAsAv7tB7qe3TvN9kQUZyi5hQWSNFypxOJoaKEsTqiaIZOBW060+leDFtLWvA0aAQ7fysZbQ'
+        '+SAZZpvxJJnVyXo/XZ2hBdpAu6HAo3G4grtSx4Es740O1tDbxaO3+sd5lEZkxoCS3MUeTMYKbv0h'
+        'T1DZiFoxmSkOHSDHD6qGXd8K2h100BMCm0ID4HmBtMYBajNPKeS/1a9REdDCwFQJnon06nRPY2Kk'
+        'bxqmWfHvUcoBIJ6aLUg0CJU5KJiyrk4aGlrTk0w5Vz3yHTkukMjlKIqxm0ydJbUsw5zfsqVT0hxl'
+        'X2EuEVZlFiOoRPCSx25RviPoTT9mLKc8YFuGA1XEpZ9QY/a78hpMBDgRv1Q49NWw7Mc0gUuX0woh'
+        'wK2n7O/VbKGIIJkEmWxkd/+xI5kFxQEjx0Pfcw8w3+wITt9mbPNGvuccAMsrFf4dLQJ33mt4A1hm'
+        'xDDekikkVsaW9/MCaooOmRSspA/RFqIlB0BQ9+vrZvi2F3AlD2pMA5h1FJp6hiArRaIIOcixSbgK'
+        'm3FWdx7lo08trgGhsnJ2nCFin0YKd/qtRJMStuG4L8KSDBL+oNvfbFMDeoiXtgnPFzv9xERZigC7'
+        'pkOe0cek6wHdKreNG1KniEbcarHLWiGHOjSZ5T15i/+iZ7DGpS01zsJUak/sr/NPczPjCcIGNgjm'
+        'Lo4g6FduyKBnxoyqtSy33Lb/AJsagcu22B6exhfSopstvM16PBX+hxwg8cSfoctpGTovxA9SAoOJ'
+        'Wz2w+SCUxn20cRQR3NDncQsn3TmgkKDqNnA14DpgOtgwJHR7Bs9jbaL6fsCxikDKBGfenL1qrvWH'
+        'HWkG49aqRG3NK4RRoX3X/nImjrRe9TysyxZTGzWjhyH9lyq+krGnaBr3up7Y2bCexWBKYHtGk08y'
+        'h+t1tdjO53AQD40CndPj++tL1+kdoP9KRKbcaeGLrpW/tzIF3iHb4VBGOu6fAUusXLjPDll5AOZx'
+        'wHDFY5Ggi5pzQv3N4QUkpk4O4hqk2AiU0zOpHyTPQ75IiqJw5vIJfu0CYiEgON4w6CKs+E4BKgQP'
+        'aUz19WtOZslL9LvOq6Ti+O+h1q+U6Y4SBXSOfUlZkU7ECRksgS5zdwItyrUzdO0t8pp0OsR2h49b'
+        'X7uVa8n4PLfjPbudKlycFWS268nV4nnINFi3o1AVWSSc9mWGraA1ex33eBFMJi6CuF4JnS20wbys'
+        '0N2UnlWwBLxC+bv9f+awxgFAAIUfyImELRsvGL4D2qxRoeAOpNB3lbGd7F9jBMKszXRhSYxgfzCT'
+        'DEG5jpZVIeDntde299dmzGMiUqV209k5aD2bg5Z+gPMxNHJuSIhCwBa7xww0/kHFD0fwlaY1fhnW'
+        '1SVEGejqmEq5Xce8EtYgFcxSBJ5qvfLpx6o+jLhXwueGdAuYM469P04zzB5rGyNxEVvON5qRPuJT'
+        '86840G2PBFTnTgRizCl8h60kQBz8Y+IF3cZ/dWrvOCoXB4DWsx3ba4H5PyLoTi5ZzNrM2mK1hJqi'
+        'q4H+2EKmZUWbQkHqejA3oKNXkY99f0aWG8NccLB1d5JhjJ+GbRxGS6/ThFkKvW8pKAdemfMPdv18'
+        'kyZipxkQkRuhwe0fTOD6zF49/V+QSSv0NrpR6woKfPo0Ax4FiKEbJAxxjRqZKlzfgGs6WH6lNHOo'
+        'pRN7qK3VG5VBUrqEsb+hV8xDB8vD1qc46mpfdZUTuZ4HzbLgI9RzbLyTqi40ECqDT04c4A4aqQNZ'
+        'ZqWXm7UekRgOoqGYxrOJipARTTOcchy0NG28GIAYF4YYoseZqfyfa8gsRu4D/yV18K3pOqZ88Tzz'
+        'qubvW217RVdBPqtrJ80FZVtDk69pZoxt0iITTtAnhumsL4epKy6WtyvHrE0AcwqCnD53tk/cJb8p'
+        '8wGXYlSEhy2mm+6kMYf0T7EYblTnkkk/sloGfC012FHM8+pU+Q6cdZ3+WyfN4nH8OgxnxKgYI1VV'
+        'vEnotNUO1d8IAHFACEQBFbOAhrWGfCVT6+w7p4WKKzKBLJVzXevO+Vtg4cr595cZSkNP+v/m5rqR'
+        'nOnZRQauuyNEqR+bcij1qTRGEJscFIAiZEBsAzCJko1mqPIIEwHPwOOjhn9snDGBdjPVvjPsjH2L'
+        'Hq7O8gh761zTWf5fKtwumFboOYXwVzzJuANrhVNDD+exst0mN1iHo41WPudEAf50KNN3vRExaQnG'
+        '9eaRhEd6Rm54LmEOoL+tYluV9Ql3LzdSPg8cwwFASWiyP/UXK5SAIVN+sSLjvax/BKZ0FpzlXo16'
+        'gBg2QVT1Xrcr1SaZERQNO/ZdGmSgedBB77JmeYgMjavOzhqDBupNUgEtxtwKPghSc9jRZR/XuLtm'
+        '2d3axlPJGcyIkt2xaDlSkaKPSU7UiowbMRJwUu3ZgDhOwmGNFzJBdzmSUsp0f9YU0MyRYiCXkRP+'
+        'IY7c+AOMwlT32zxPa5ObeRnYrG1ClKanP7raZDsjlcjJ9n7zGlTp8y5ENeriCAeAlpVlQoocHq1t'
+        'uzbqkfsTk9/lbv00FgMCLkoji5499kaPkF8xCQPBX0SjdeyNydsIMGig0a4E6mE0RYbnZ9nrp6+Z'
+        's0YR2O61lbzUeMwcKy/JaFMf7dJ1Q2VX15vUyjOoDdE4HQJmycUKDpYxDr4m6st6qbzmjeUXz+H7'
+        'mQJwXlt9llAA1RvoLaQmO5LrdQuT7rTUvPCXtGWtpCwVdqckklnuWM3seRJXzYoV8z73TKUkwLQs'
+        '32PHtUhiFRzAC/yqvD7tQU9PuUUYdgpD33suk9OJQgCCWNA/Awn+j89a8ZCdlOSH8U2vIEwAa6ye'
+        'ZPizpol00Pg0R8h84l2LwF7FIgQOu2XoA48HIJKm06D9ogq6BQXTb7Z5NTtqbY7swyejcAhxdjxX'
+        '7gFQtfJQUB8XBdVeXwxc8KC86G7zrZ3Vo/IFV5tdCsU7fhFmEqsGbGiBsXqNQ8RbRry71helccsq'
+        'Pk1opvRe6wMZS/kNTB+xdzuEKKbZNBYTHXCAxn+RUddrQha1z4wHa9E5adP6s1xJsaizvj58kLmJ'
+        '8Y5xrk68wcpn8f7i6S8BguDmxwdedhWquk2ofxTgO+WxBz5jHqzvGZBr4Ssdv6tKphyLZhpMho1r'
+        'vkVGoC2+pUaYfVyQpxecni9JgtSsrIeiQLvIinRZGufdDxT8fXRts604udkyJW0x+W3AxjZVK+Rf'
+        'zY/2GTSa+YSa0SGXsORjeXdKFOsnbY/2/mjvTfln+IMtN73oyg2PZRcxk78BgK1bBdpASLYenNnB'
+        'CtDvk+MlILvpsy47Tnbw1UogGwnN9IrgntC5LG51a7TiPOJqLVIC52JkvDiVJ0f8n1LZQ3AsBQkM'
+        'FzqskoArBpSV5CKXBJIsObnOVTC6YM0xbDVcDPB9hHluXDjqwXv7tz+JkU8StSaptK45fXfgvKQy'
+        'D24wQ6GOn8JALOoJvoklRJYaboNj9FxcCUSvIlD7T0H/XQf3rlV0w7HnvExYmmyg8EOvrfXRKNXe'
+        '5EOoR8v6BgDHx0AGY/GPV688FZVeubUVEa7X4rqU3eCWne6w0wYqEy17s8gNpPUVrrs1B9Z9C+bG'
+        'kZ/n/6ZXMiRZkB0T1/sn8fHx4fsjbe/zh8vgiYg/AyLjjtECbfCuDjkoykLMfaKzxZZNhwTsRWr9'
+        '/V/9V0giY2AnQeQHKKjEeEVlcYw7bqUWR2FDMkjrKnbblKWd15S34IO4aUYLyoEGI8EQGwb0Kb9i'
+        'rzx+Mhx5RbQeiXzVKQ+ilYHugQT6Ud8y3RtyjJ32UqmlkP9DyCqXB3qrNOgImRXCl7RVIJlYHEHH'
+        'gfK9hTwH76Sq+0CDyHBc4GEK+AevnrHs+YDeQwZQnmSfveDjA5CntdXVv4hsbxaj98jBbphAMdNj'
+        'nsiTDKNyNbIiQ+m/JxQ6JEOu+TeFRc/cwssyGzyBz08XIVhLsqy6EW5ozFn+qDhKV78hRAhbxzTk'
+        'HHueDhoDmST60wnjDGAwfCk3LET2k5F+Wa2TaCtHAon4XFMptv4dRIkXET1vHOuYqunTKChQghjE'
+        'hnIPMweSGulFreEOn+adoga+RIWgANo9Dk4AZdm9yzLsyzAu96abLmvLF90d9QYNhPe7RC+UBJlD'
+        'pnxiMfIVTk0kWqcTrTBuWZjff/EGK1NXucjCzLM3yFawbCqtwfJrUb9lzG4+bOYafvU54TFHtQP3'
+        'vWLQ5pcZ7NX4KFGlxL7k/rjDZUeO3bdTN0370J7/sHdzxfuL356tPK3Eh6TpO2daaw/b6S4oHSwI'
+        'nAv8SxQWvAEc6T1jVE8pX7LX4gKbsrIDNO+fmFdN/dysHVnQHTnjzIzwdKoBISMy7PPQPz15Qm/l'
+        'mZ7mKJECaLAfltURdVkmktQ+Vlg3j/cMh/hclhIYoI/LjT2SVXGTk9IYMALCfbrF1yrWxo64Ifla'
+        '9C2USfNB1hXCTA4KW3IR36NqI9jDsJdlaAzzcdFDYfosl3oj/R1Ps60uI26IzBcR69dqfQVyccj6'
+        '4xC1iYXbCbakV0ImWrCD5Ootlq9FyxCbc+LsBjgKFqiNYi02q81WOgfKZWwKpFhYuT/wvg7gSLzA'
+        'KIKkqGtA6MSDRqr2oc/zhWEI4Kchg8Qnnqsu0i58h/I+SGpTnjF2kzy/bIu2VkVbI1dJVn/K5zLB'
+        'd3QA84g6igIBawq8+F6HsfoqTkwIJbso5GxHPZ4DTAHdc3iLOCzFeG8B8TgujIskRodKLxTOg63a'
+        'VcDiRc4yNpMnOkfTiKz5BvO3nng6dzaxgEw1XsN+ZPFbbVt86xvI71lT+33VvaUbjFjTh/QnOyO0'
+        'fOTqEAIbLL6qib/INPA5tpOn8x+QE9N0b5DZwYZWPDoNI7ZhPAzA8xTdzlXCNQ8OIaoHrzFMacC1'
+        'TkEiuEkWEp2GzBpWQwosIOB62hedFI81x1eHf6oOUPlmikcc8uVXJ1ywPmjmT31RBp8R2ggyowvn'
+        'amG0ucYJ2vqsP07i+tM2V/50JU/rcSJ9N8DPdoNllPaWWPOHDhrhYPOis5ejxhW79g0tp7zXCgGB'
+        'Z/ozSedAfDL1X26IKdj1K20q18sskF/DUoWfHpT1aFgN5FlTh+Z+vAglzpIr7PorMH9fx9Jp33O0'
+        'E/hIvsTfwOCuQopeWauVCOGJkaYsjKjw98BaRmFFDCqlwR8X5udleELxyqawNpNRq456/URRfXwF'
+        'LJ2vkNoGg/3W0MYqGdOn8kJ/9XV1ZHNAkG4Ex5PFY8aZguFWZaBUnr5nAOQ+E6HeOgEs/Ct7mgFu'
+        'w3KzjFXkzob957RtNRkxt3/XziLcl8KhPInYaIKkuAGYQDt0tUS3ftK0L6c1ZIMnB/YNnwtTHUeK'
+        'd4YGMPsCM7tK9s0SX65F8g3cg9iY1yM5sHJvyr5u7qxZnGbk0ko6K4GStDeHBTB6y0rtOHoGjJw2'
+        'ReGQ7MF3h0Y8Z3NhdMgoWR3voh76keZV5r1q4Q35I+QbE6JMge2MmABM8ikTKFi+/knTTPRfC6T1'
+        'YnqBwxYpvE7dSGUrWM2f/H2KgHkQHtAXgVmrXwKFcLbXj26OQE3fK/DhDnAy4KTJhpUn3wZwVt/g'
+        'DuQKViWRRB2WVpH6N2elMo0lSM5BtreHjCtcWTTMd4yEpMlBeSmVjpY3b2nolegscRQIOlYdneYa'
+        'pXsCfaoXTTGqi2Tw6XU3xNaJY7HZ2QHbOAPopTXWBqtlMrr1PUjegxryWM1l8sAdSo7pt3JkZWDd'
+        'uuWB4spPx83iz0nytSopk41KqDwDbbL3R1M7M2194eyrzMS43LmESIQUuwOu4ZUqQCIFaD8x/OWs'
+        '4iSg6P7PD7x7vRBELc7/bhtsWHadBhnwLUn0HJv5XJfv82ete6hOpYyWenh/pOK3RzXS6KQjEEAs'
+        'HDIQyRMvSwFxOR8DcmEU4ZomnN692ZfIDqDQ71mxQl/A2EzIJVIDcUsRRFML3QxyjLJlkR+fgLiw'
+        '1zYqKgz2z9KPNkom7wPrO7JPguDr0lM/6w4ubl7y3FTihUkqTAwC0nI68cwDHLAb1X+r2AKxWDGN'
+        'DWJB2sidY1+3fUqvDkqoGiBTXgJKyIBvegse4KZNBPG78gayhW1o6QeoWpMQKc71/isA2IESEZru'
+        'M8VPdd9mlAPzJ2zEooUsvHIsAUB+GcSMLz5Nys/fYJQCKiQPr6AZ3haanzyoBH24oopDtK/FOw1T'
+        'bcrfhw+ZcUrRVDUmCgvoHnZqXfPxaQjT08QCp/GnPdZFjhwLqBSbkxM35ziFjZEnSgpNX8x0GvTy'
+        'j16iiL5xoWH9DcEG6c32uUGROF35QENGFw4Vwix+bXuCRJ4JNieIJs5f3hgXJb2JOu6RmvVhWD1G'
+        'PrUByMCSZV94q4UslJACG3CBzcUxVTWz35GlnvfzjoBf5wK85Yk+weVi3Hh7Pp52+loAP3Z8FaVI'
+        'fKZ1Qf6LMPzB/XOlV+yG46Ri1d6xQd09WdlJ64xBjddA+wR9STbzYQYQCTs9RVIcbRr2X378VTd7'
+        'CfkRCXq1Am1ptrDj8HxW+NU1ct20KOeos5CzZMK55+bbb5i/BB+C4t1XJTAkG2h5mssQRHc2DDWp'
+        'eIUE4/uFrjJQVM0+8aPYGei2icXl2ZnRBhCHBSzyIsqu5Df67QdwSfkYN9l8mm9wvHZYbx/ba94m'
+        '36mo+skpXGOldT4nDd/IiijSry3oKfGEELuCjzCmbGj9dCAqsbpEarvOrLuzIZ08CkwBNvJXbbse'
+        'Z4FFthKTijkjUNZb6CneA7QaAplnVWFjG7c3XYf5QTQbhkKk+tCh6ydAxafudgQr55q03n+ag6uf'
+        'EJcYrlU7V+CRzwYPy7/tYoVN4z75bCS7nKQZrOwsnTiGTrauzA2Axvi2M4D1OBu4uqt03jSZR/1o'
+        'yYgnhg8uhTjhFRQccifSN1AJnO269zUkLwp7/awMYyhGtucfFml+aN9XxImTXWdFM2yezm6+79rv'
+        'N4gcpE9mNR4243Br1qopxoxiTYPcrxtlm5xQwQdSoFNpvZlUHuRAwTFNcHYMuhRX5MRFn7jKYNg4'
+        's+QcgLpI9jRDWnjo4FtuN7IxECOTdTySyAdYzzhaSNbx/tW0UvN4doscoM44ZUaLGy2dYro0wWgy'
+        'zQc7/3ZPpcKDOq5sUN2dKuugs4jxTHrQKB3nQFVqwtzF5Smwzwhho+N88X78Y2LWKCRt7oFCSRfD'
+        'GVJ1tuOkfBJxWzQu1LBxK+2Z5GikQzHPd3676vgTw7KGdgNJIKHS/M82oGMo7P1+kDc3umvKa3BS'
+        '4ee+ZJUYTSUC1DHCBihH19+dP++VWnIqCKMfay+7pAiFJGCIzw0JoRo2MH9MP7SD0a/ps+4B4kSp'
+        'Co6Iz2xVvnMFJByLl1y33Ak7ChXl8ULdLtr7h0tf0ivjsQGwELdTkcS82RJwTFOgn4u0U46XmpUZ'
+        '1UZbGTgzdx4MJP109xwxvmmajT6xWXD9BFYCgCvBlQO5YZgzWVE0sgG0AbcyKCrCANM5kX1TOG4V'
+        'W71k/DEMBofg81VJM5QsFJVxY3Vex0lJ21Owapx0d2ngSQc9rER4UBnl25BJ1hS9JAfP2F+h0pAe'
+        'cKGAfuwB+49yskW57b3GM87n8wwm1FekvKb/ES/5QdYy5umGZpEkfcDkIhifLmoXnMGBZpEPcjjE'
+        'BuBoiz2ofMXlkIW43b1lyATwrD1mG5v03ofvRz0wkI3V59rfZ+al84LF9+Siu8QbNKl5t+hT2gpY'
+        'lK+tfOSw1/fKno+cmCT9K3DvoXBd2qxp3dUYrGQLT1ER9U6wgWNYSgEnu7+/gvUe15K8YkDL5edb'
+        'qb+p+II0xCWUaAE+HU0/9yPeptayJw1DXj1VdEauEj+eA9KOgBaI9ByI1s7w6ADElJnuVC94hkeK'
+        '5qWIqDxtNmAhbDroQc+0EQTYy7a1mwMb7Ifu+uDnbYCRBSAIRVIDVylvjMbK4IBXk66n9A4MO5UM'
+        'td3WiEwxqI6rx3SMC5ZlKVA1mxGD0s/Uk621J5X2hcADb+7BkkWQvLRcIHHIkNV5NnB9lnjw1KPG'
+        'MCE0ALsMekc2Ke+cngpxoCtbovK7wZYOg/5UlcQ5IV/45DbOBh7qP7TxaQWFFEk6Gv6FDYpMJKYk'
+        'RfYueRfYpxNsGi94C1WeXmJ0JZDmfMMG1bPXIaP41ljQDYPkxbX1ffplfOSB2WuoeJID5ZbOSDOu'
+        'Dptel0nJzkKs6xhGWYoRWkcizrcKSE6AVeiObcco0jg4eD1VHIxcTzjKPsHQg3RCbGeVEq0OC/2I'
+        'XwCRHnbEImLi9EqQSEYQ+Sh2WIVPZWP/BC8OEVXzPt4NsFwZdLyG6RTYOQOhCumCxyCi+yHJMJe5'
+        '7iijcyml7Lc5NrLysdnaxktGmpnqEUMZRafMSuppnKl/PoENaePNGwdhcW3PR+HWh1vWF1RWn0cx'
+        'DOfvnfNr1xyQYQCTrgFobqz8n/yvzJ9bxXaud4nRruFTGvToeSLsA8G3luelc+aOzGrqSe3yH9d6'
+        'dPM4F2ZKVHV3riZNDIHW6kayNH5pS8UoCBU7HBbGNkvITCk8YPdrXyxFMsawtRG9x2Nt4J2axOLL'
+        'bAzukpKoQIiPIYJlAQh6Hvg+/KTcvlVULtiieft5PQt3Wc2jPbXqw/nfaYhWem3Mlk97WyjvBlWM'
+        'TSGCdHTM9y22bPXt6UL0Lc0sNOb4ApvKqzrVFGPIESEeFpQCtwbQSy6qxM1KpunvOzbFc9W/pl2M'
+        'Bl2iOtB1npVlWYvEDvbk1rLXdIY1+dyHXifRttUwoaNhlqEoSkMnhPD18FKsZREQoWEoGykXlJkh'
+        'edDW+sy4NfJSykVOvVJziDY1GXGmNkveMUK7UkM4eMgec+KxG+QbaKJCYBjiC8DiQvkJ4kDPDv0O'
+        'T6f4xDcbpWW5A+hHZ5q/7K8SZqPBGH0Z3gFFe0GcjRSDq+dOpM4GNcWAJhpzozA31XPuXLy/vHRx'
+        'o0vvzhro2JE727SOi+KhiD6XZbLEsXC7tkAtDYoCNw022Qtptki+VPB+q+oZQ3Dq2GlalNShDEnN'
+        'oWTbySDbktkw7lLJZ8d0skh4d5YkuRthHxTIjyqt2yVYxLd85Rrlzm9u+VgeA90oHhvySuzhr8Yy'
+        '2zb4a8z3X699rNNZGT3k9jYy6cfHLip8NCxc06Qge1XRkGCgtx1dd62Ubjxyy9iIsDGsF1+OR5bn'
+        'jES+8q2Ui+QW5fvGUPBegT8u010o9GIBR697B2vwhxgt3I/SOSOxPuQ0yCEXb0Hvgdgb2Q3EsVsM'
+        'jbi7xhAzoHEH6cw2ADVWn4CeaFt8MDT489O3B+weUScsQY50CLGcnu98paRYk3L69RTLRi9wp82I'
+        '046R9Hq+jEqGE43YtNP3Y9WY+HS9zt97ORxsD8Vem9A95MFhOjLZ0/HbOhp5xb+A9+cpG9mTNDN8'
+        '7XJ6hp94KJ4rV1wrCpirV+znBgD+f7LhSvvFQ1DJhx/TQWqIHIIgEupAj3e6YsiOz0ySTasBUP5f'
+        'qKoEU1auD2tDfgFIMIGq2bGy/+b+kLPv7ZZcH141wFYKwZ8TIvcjH043U+gzHaPp03fz85nqdgDW'
+        'nHUO/mq4pnZDqKGSBLKRITAf/Dw3+tAObC2NTfet5b1Ik4nLqYxkpPzd7Oh4cVoPupdcoRgSEEYD'
+        '77DC9ZuLPbK9QLOANDJeJFBoL6ShwSiQyyhubGOO+SqvSd46Y6Tr4L9AQTI3K7PGprW49K9mo9Ho'
+        'Mm2VUNgc3zZfze5Tm53/0hOkevepBiAUm/ckOc0mI5xXxJNV1k66WkPVbYUWUHeCUrSCdl6F/fWp'
+        'i0pXkWt+fKP9AnVfW3zmtulS2OddY5nHJ8t/TPbHotAYm1fVteHtzbmAAofb3L38r3ndbnN+zv7k'
+        '5euqNemKHj5M2V2IvHX4ilQ02qalJGKd5NA5ACnNpH0ZKi4eqhL2kXm/i4fyvn7LbmLJi7HBGDpp'
+        'gTG4b5nq37HdvvHqcPJG7ZZDQKj7E6F8XytUOwTjAfgKG4eI8lDAkJJ4KDHtmhp4DE7kiTc3EXUM'
+        'dZ24E0zpxNiOj7SUBJdUWgvManBvteK8oMwjqBe5+PJEAAqXrfBBVhYlxxtOSpp9yb8Vgg4ASR3c'
+        'yfj27Haa+TuYLARbD2iJIY6OSaVz5ahtDK+xoAoEXayi6JcZyw3W42jV8w39IFhXdHnyYrFjaSPF'
+        '5W200bKE8980RMMJUFuPKIBYuXkQDbzOLdR/m8u9ZPCsQrJze+1H+t3Q7nTIapuSMZ5+Yfytn2RW'
+        'mjdh1/ZpbNHzLs6yGzhqkOaUMJcfVxPn5IP9KmCCv8xBeZkMejXN6PmJMV7t+aLfX08mNjvqxfx5'
+        'c0eij12JHaimlpo6NtpX2nMPWoLBvHZFk+gAxtnEUf/yjYNIRbkwbkxGaJ4h/oEr6K3pdzLLdiiR'
+        'PtrDFoBxt2F7MXACQ7q/Miuf1aVk1NWTkkYN7rRV4tbs7Og0AR0evtDHhouCNczZr7KtCFxw4AxG'
+        'zM40K3NYYdh3lhGjpapSzrQhgIeqvziX/DpwwtqGwccQxCwOFrESqAHQ+yWLLBrK2RFbC7wolzfg'
+        'GudCEM2SSe7hnNUcFNnux5KE7zYmm2jxi2GbdZ4udhmYf5WuUEJC7ycMGGMAC+Py5ubXjdSq8pCv'
+        '3YOVgtwgL2qzoN7K7clJ9LnpkOFQp1DP3mpnUYy9Q9Unj7JoAHjIil00tK9GGnZ8g0+ykZAASQQG'
+        'fse1bZweOb1/73D8Lh2gm6g2dpjLbnZgtJYkPuSgqYISbrj2fgcnS1aIlqNfzOR8PUNsRjBGRdkv'
+        'J0hsCj/cZBadBqCsCDrD0raY6Lew8GBCKipv2vUGRtMG3aZpfaG4tmD92FZIhwvomTuu8LDtjJGm'
+        'no3AAitdaWHTsNZkWZU1PBDvlxOSw3hh9mbdrT8Mz3HQx75gMOreEhlH6gD9W/1GOtfGp2rHyixP'
+        'kDq2P/D4cHOROXddFnNZ3JwW1leIxYE+DVDynKBrHgsdqM44K65jzcRgt68Yxy5NdnfjGgNQxpKb'
+        'YDza7TCdmPefVTwZqoI8JnJouPdzc7yBmiDCYXVKXDVnkmca8NzAyorZZDMa2eZvXHbd0LIpDvlV'
+        'IszxV+Cm4idj1pparrbUzsHw0iiD2+VrfN41zUied2+PjrHSGJe27MzbCE/mBHq6drMWNtoiSmYc'
+        '6ayWTuX+r292Y9YZpTWVVoJIUs1VyXha24LIs3eyVRWUFWhf9hVoxOWPjkmsTE9CFCIABwA65hVo'
+        'xzje0H0u8+mIu7d5SPOP2ylKwcTWJCPENAbC3eCJmZfi7dte2hiMKPSrUuoW5JEyIzjorfWqAUy+'
+        'QQRWa2mgod9l073NWzFy92nRKY9/73+s2VhEFlpzNpsvu48Jo/nVhc6ZYs7yQjn+Iw/OEQxm/Tig'
+        'ZkyxekGL6Q8krnsXw4dAYNEuzDuk8RRsAfcWGig4KJ39SKFkm9/7gt21IrhUsc4JmHCgmx6zOzp3'
+        '7PXNN1qhPpaa5jzfbzYMicd/EsYXscklVkS3VDa1Xk232j/N1vEIr9UWAOQqWVz+7EeWkNPbOPgn'
+        'IuYSXE+QfU7dawnYey+1UW901wdU2voGk8dWVy3ipAFg6cd7DAs/j+t6mkyLMZJCBxL0mn8aOiZw'
+        'C/wMWRd1MCRafFMsFk9l1StyybOcOa8Q6ozpYQ7yAN2uHcoUoj7RWS8N03l5Dk2AsVGB8N/WVk33'
+        '/MsHeo+w/o9uy+kNmG3NSIS3GeaqMcftxccux4pJUkubuHSVgYPbUnOFs7QJEkOJ6a0bukZmZ0xY'
+        'dPMLVFscmV35tt8V1OYzRZXc7XFMwP3kZdVlVIn8GAP3ymGrx4cR+Bn0zExfcbWWtmQOMHkNOpZe'
+        'kAbA5ZcNHOonoSzYC5jOB8O3hr46Gt2ADK9m2fCDdPxjBb3vgQY8T5lXlT1STF4+XKjmpNbcPanx'
+        'auQz4VERZwp+1E7qlch+7nYTaKuHPP5vxE31TM7clLbeayHyAHYxfSKYC+F0+CMBnAIYKgdJQwRm'
+        'nrvNgwcbmGp08GRQOiE2ZDZANGd5JsUyaps9fNi4dMMItOCJh5VhaM/pJapHhbZmCCAyCRn9iQ2z'
+        'VE/XPs1sgkVHNEqsMFZGYkDQUCGtac09/f/bNBrMsHgp7ODagOpyC7+60ZYPrRjNJtlRSAFBRfmB'
+        'SW8plvTZlHNsugTPJneNNPfhiQ81Fp7TahLvEwXDQyZ15BiyaKKTrSSDUN8pgDigeuT0Zxiy0FOn'
+        '6mEcPPLQusC2DpkCnUfDnN98fzgP2PZ58EIgByYbuazhGNWncNAEbFoiR15AcdJJcWsJ77mr4KKS'
+        'hOi0IFH6UF37Wu1yZYUUHR/xh5DVeV8976AApr5Amk+k6qvhTL8qRpSuQDQ1VU0xl1igZf0eoWho'
+        'b9RZdXfQ4rDk+oDr2gNyBLQH3nzwvrBFSG0SjEJMi7j85PH37+J3d+HVooWsOWhSSXSFHlMEF0f7'
+        '7H2qmtJAVorWW/Ex6nOJvYAPDatHJa4s5by6TtvBDIOYwUAReStslGsosX7FMDDtKD9UjGFzHDRC'
+        'Us9DH0sNR+EDWL6SVDS2iFcBtD7oIY6AL16o8TTrNLH3kHRLJAWB/q36dhlzDrUN78j6kMcqdqxy'
+        'zoM+zbsWpKEIj+XSUcApbDxHe0/aHrvYu6EB6G5v6xZhc/UaTIkqH0oomzo0q2JuUKDv70Q1Slsv'
+        'gpyK1aIqDZnfJLv3Y0+T+Rkor9poeOSsrcIGHcJna9zAR8v3g+oAhbKU5WEI9/sSJ2g06wyxou8Q'
+        'IuO/L3AbixvlRZtYXrpOgkdhoiWEEPHF7xaiarn/0wv8GIMQihheVSRMpgdCrV0Bjr9W4ZKRgdPQ'
+        'Px/bdIZsmmrxd9nQwzPwuiku4WRxIby7JEg+1yrbLzlVt2NXUsRw7QQ4hILU9Gms7Q9zVs+DBtCr'
+        'pFuDo9smjDZsIIOt0ATMcjhJlkWnV0B5a0Jxev9X8JyGz1O8+BS6znjhO2Wa+8k8TBaSGTFbBIdw'
+        'WAB48K2BlzKGHHBaCG44ozF0Eeso8Gud3omV7P5/N+UtJZfyqglF8IhEqZHLDcFm7/j4dN43lBPw'
+        'KVuhloRZG0fm50t9Qk8c0fNZi5AtHGRo2qhdUSYr9qQy34ViuL3r4NjKZKAMHe+6Ob8xPuz9FfvQ'
+        'WfMm8Cwf444VHd0Aed6uUh67JG7rfR7HAhpI54f1VteDKHigY61dko3h/GaLSlLLXBUSOuoOh5rE'
+        'QPFqbxRaZhrhkl8hG5ngXgVveK71IqUhK9Zf1OZgWbqwMQFfy/MivUP4ko1TnNwNal17Si4skrBm'
+        'DGn4vLjV1/gzMkGC6TZiH3bJDgxJx4Jbg+poK61H2M8HWL9JBPAGOTmBkYnLg/6tZV3BdnPGjqAg'
+        '2msBuUNbie2AUbv6PJamAh4xmHl7ibNkvoOpZlXmvdV/JoPk2XmkFLmthAGlCbV49rE6a9lnMNex'
+        'ja2U7gVy5uQV6qTZ1x0Z+J5w7d6+8JJLF8Qn49L0c5QMIQu2WXwzLCqWIl+aMPX1A6ygVrDbgP4G'
+        'zBk50AKRRUhgehyLaVlq6cfmykz4GnRmT2mANRULBKLLUQxTxaxBgHY3Mzr7d7x9Qq5mzc3+I/Z9'
+        'xCIA1/bfoKwrUEVQ4AdoKqDnZbZxOd+zqKmPrJun1dA8yVMPvs+8Qhqzk2u37oJFHukPhFEAd1bz'
+        'e2xN8jMiHx0K6lVX66UOT5n54GzW9IWfngGQPoXbcnZOH3L1bn95rGplhnPgrH0BYLAOPOBzQI73'
+        'UPbOfWnmWOCoIlaYYE144c/hiXN1ZLncV+9kw3YPqWO+Ua5ulbnRYdTfCOoPu0gmyepLYnfVnMXf'
+        'fwW7Zx4TcJj9dw6iH8IyFDtvBe/QjUqHibFnJwaGxhakyZNNh4kO+l6RdJbZ3AYGT01mhfxHDGrk'
+        '2PTjOHGPnrQGHViu+Z1IK5U8lcMV33vHjypaDK2Uf5I2OOCf36tJWCBXacmCrJfm3XdZ8Wd3BqAQ'
+        '63bgikc8qCjzIG4qB7ra1Jk0KLOyU2iod/ng1jXO4y7RDjOFDWvY4hc+VkL5AvPOm8dvGv6VRRf5'
+        'oslr0iWt0aeiEq1c5XistJ4qxEsfm0zaiXanzMTSya1YekmvhswLg/MOfWt8uHQaDTEP010z0RcY'
+        'mL7uWijoUGXdFf6eht/bBprDsUbxuKbYlLkPc/w5nYRlbmkjDClHG1W0FJViCGXmbsJRuLQJWU1F'
+        'SfUsHOlg3tV8gfelFDBxWd+aq4R+zAr2UNEZaLvMbci3tTw1fkRcsRAHoYKeqrjcBrK9ry1iI9cB'
+        'NjlAR4EUQSvfFQY9aC47G8sz/ngmWbDz53WWqf8qyXJ7Z7GabJyZJ7wAQ5cZZN9ITFZrbQqNraEz'
+        'j2gAwBQwj5Tp40z2N+tNSvOy8QlghoXtKaX7DVYKES/i2Cwgb2q7ip/jE5DxACyKAfYdl9W6AjTi'
+        '4/k7ibcZlQm/WaQrJgAZ7w9DL3htUvW+IDki1V6hoCq9W0fWdhFdcq0aCnv3MI04AYKPgpkvFGew'
+        'LiljoBiflhgm+FhJxmJnXQWzC3VrxwbW0weYEGSXUdBaMlj6aLgXNVMzXcWdF+IvAFrfi4kSWu8k'
+        'IdWTO+ZQmMFEobarlaWYVbTZ+RWqdf9BwBrdydRltdqCyQEjONftFPxRoSC86R8z5nY4SyXFuFbj'
+        'BjT8XGhMj8kjbdDmB67sV/LagMBFE6EXbh9eqe3plq7jdjIjuA1l3aj9wF5CkZi++oo6xQwZHFS8'
+        '4g7935zFj4JvUVkYvNbmEIV+4MCW1xm1uQiNmwHwQl46Xhi0ro9G1Y6FmqrVCEFmNAw/0jHK3xMC'
+        'WYCkteRksENsQk74Cj2QWcTB1XEDRVaDdo2b1e4K5ZxZ9xsKK5NaxHKLMThBusJIoZCwoDgxB/nc'
+        '8Mok1l1ncDhx2tB6sEX/F+HOPnCPDvlpmGNXn2V+UmlmJ+GPxkj1r/9+oLqQVd4BVIU6I6dYu2ba'
+        'KotSla/ce8kHYpm1HG2fbgqIuWhMwQhS8XykHoH3IAovt315Ix6I4nG4qhwRS6Vd/16a3zWHv7Yn'
+        'awbgppa1RZFgmOs5KdEilRJz9hsGFstTwFiLmuVQcAZReuq6ZL6PGphkhs0Lk5lZP6eA9mAGRzjn'
+        'U4hLy19VGyz2Artz6TRywKOyXQW6k4yYwogjmE0AnsoX3umYBWT5mkBjZR84/0ft93u3L0UbYgmo'
+        'hSLkyIf+GZKhgLiKI1F/2QvZPyxCOgTvY+GYvacUzxAF5gY9uAcy8L+2mg15n+5AIwHT8EYuw754'
+        'QoUvLDMIKUs67sYlavU1CuVR5RcHrNNNzCmN28l2oBmQZrIUCbg+tKV3FewAPuzlh9Qtgva16waV'
+        'fEFhgfSvYmr57OpacMW9VQrC+ZZ/hCutD9CHFnFWPScMKxXRLGO8gcr1zoMEkleq/RyxeNYNhxMz'
+        'jFF/pS7KUgQ3B7JSj6scOG6I8db2Z74ZuugaUtwZvEUwIORsIlzAFfYKOv/krBEaMJbeBveFLhbc'
+        'gr4q14caPrLbfYeuxPYZ3Um1X5DDRmbuReZHC0T2kFw+OcIUCO0ZlTH5ARFY6mEuyZh0WOYQ9dlA'
+        'VTZhUWZgeSv0sUaFfKgAlXttpDAba9t0pq71FUcssSOHWkU6QrGQM9mxnLmwx3UtsrH4RAtCREaV'
+        'pAVsY5DriKkA5TcASsZ4Fd42Q6h8giKQPCZswpWemGc/N0OejVCdqEDAiMXkWeZyjw9IE2EYGfj7'
+        'Vai1awXvAfIE1fgilvfSXSgMHQqcx8wy/YkcPG9ADnpYIyIiKNAd/YICSXJ8RJjXYFI3ZFN8EtCJ'
+        'JH9bsF7hzTQrZhjmBMXlXIBQrc/y4x+UwNoag6X2wbk1hJgBoKyVFoX0bwg3moSuIJGrkchUcgqi'
+        'gCgW9JJK3VyYkDKrY0VG5NbSvRUy52V+wZ2iYTRs+Y2Qxqv6LyXNQmGesYdMPzHYkGfC5YT9aHih'
+        'MrCRy/WXkcbCFYlvlcd3xEyxcKYYdyUGxxjU6ehj7aXO1ytVHlo5X7MVXRAymp3npASNxHPxeqya'
+        'nrOhJ4j09kyI/rQpZOXUOTPge1Pql1GxcBBLuin1XN2ppOl2c3z/NOz/FiwaGkMVqwwpEXPh6BZ0'
+        '8myQfelb+g1fBkDyE52Xn47X2R5COYy5CLFIGnICp4jg5Jep9OlE/3yUhISVxnNHLAf84lyvmwMy'
+        'Pi2PhpeiSakdKx0d5vHLkY1H7/OuOwLc7O2lSSRdOLPnTLeee2ju/4UwQmtwcxWLBWQCdD5f389k'
+        '7nl4/UPxH/nQnntMtOtSkqAAxh5cmD38isI33MQQ2eEdnlasyu2KuIOIkAJxjPeDiYLH2vzEkC9v'
+        'D0s5lioMkz0hLHObx5RwwnIxIdHsf0dN/33lzqGfkQAw0P1mnuw1cBk4Z3PeBJB3D/H+56/i8yAO'
+        'tezhRxOaHv3FyqGtugJkWJHphV4MYWdgzJFHeu9VrbLjt7HRDhUx2sAflknepC1G1NPvwybFSKjK'
+        'wVpp+3HN0RZYvxrSyE5iJ4r3fsMTT8O4tpZVq242h0xfmyqkPRRMc3RPojOLg5P5uoOgQrE5zcw3'
+        '9aO35n6pEXt/2S45smKGmYg1Q9j0/dXOGIBi9FJHNnTPM4Gi325suddrUPdCRbkxaUYOWbW5gYjP'
+        'W2UAA9yYsBfqjxZr9ZBlkHD2cEJqSqiq06/NfeFUSSAECRTOsKuoxVDULgsTfjhQSrlP/nA+/lmb'
+        'RBERu9hZQHovj/swLsqHCncb9md/Exg+1+tEyJHeZsz1Aq+jSHCP+Yitt4s1jVSUqQl9JpMUt16e'
+        'LYuf6V40yrPKUHDzMcTT6rOwCMwLAPhBPIlJFh5vcaM1UFjGJjJ7KYLY8DSSe/QI5mZgKIXhq6c1'
+        'QV+2HeIaJWdZHSv8CEcK5uCV/QJnriu1E5U5LSxYlBWz0LVK5WBXMzUUmeKElQEQdTGNGZEIPUrF'
+        'agTmFHlNOLhlY8e04s0Qckk7D7LTmmkJhMoPNQocMpFznjIPUU4A9B1ehk4RXfwBbymbWb9eBedi'
+        'WjQMk52motELJ4kpBWvpg8Twbjf6sYs8ktloqbDAChGEs1h96E5qq2vZ2M3B1Sne2v6YZ1O2nUso'
+        'EWEQoqzSNlAWVCvigJWM+nav/JAYCTmkE/mpb+D7BaFms0/xjlgbCO5z1UpBeKe8nuIHn3x429UJ'
+        '28KNet7biNJmxBiKSnrFye2uExpTBiCMD1zZd1qef57DHl4nUReRdc2cbhMhvIQ+JdelNOTmv9eq'
+        'kIJCPyCpU0ec4GZleQwcu7ScocRSbPFVHzVu5iVlqffBejTCTZh3p6BFzh46jiJTUe5vn1Z/BGap'
+        '7FJ4oYSLSwDYZubwaQNn4hswImqSRFXb1ggQLj5AoYaeghKWyntZio5/tHxeivE5ySLe94EwVeCS'
+        'WefLooQdvCFHLgTrtuwIJTSglmCvI2udQG4KcvmdaGG4pGhg74rkB4ShSLBk5g1M5A3Ai0AZkFU1'
+        'YcPkrUUQDgPCGm0lq0zDfL/L9ufedRmA4qMV1UYzPi3+SJzZnMDqlfrHAYSd9BLmoCMHTfRfeIhP'
+        '/drQHgF9v9Uaifsks5XYYotaDugPq9mul37W7fQRG6PNcUJGrigNgwQGL9+el28ZX5kkHS0ClvzS'
+        'Ako3Ktlqkfk4BQYEaOMlm72KaN4JsQm4ObwNgPUHIvuHz23NpkenLmgvmKuBK34USPEu3LItjVaa'
+        'HkWDKsTgsckeYjD/EsMgrVa/IxVQ9f4lfM3h0mRgjjHyhvlL0Wnd+DEAXETmIWd6q6joEOhUh8RW'
+        'yP5io4WoHtHotN/Jrd0J3GVoABOM+2A/H673uBWb9KGFHxMVYVkEvHpcmT1mxFu/jo/jFlT40EX9'
+        'Vuqdl+ieS/yWZf1PK6R0EJVdIA4LNFxQJqXVxuDjdr3ilWHbb/q3voildLOUHYt97r91cWob3YtK'
+        'zC1Jdx+J3sjPKfZRB2A220VzUaYdqu417KCJLqfrECKTHimVUsugIMomXF7t1FtHGBK6T5PzrGxK'
+        '6eWOkgEgdoQxFSDdB+YuaFdcixY4iXTsqKykQbFlVMBH0w3Hok2Mv37bWFA+TTnGB1lSW+E0YFbO'
+        'JjiDm586SO+BLaQwJjY+vENGcxkoySGXom8AqPstmkPI1JaDMFKno04bK1EHSBJpKQy3Fkv/kxTa'
+        '4SiaSJIDDyVvyFiC3K9OUeQxS3oqrgvqEUli6pv5jJ5UJs/+UZDpcsYQXkGOmG5UeCu/y5sPjdqI'
+        'fq2G6NyQioD1CV9kh6Fc1qmPSv9oB5RaMBAsa7qQh0WZ6F1LRwZAl5LV/WDunqbDU0r9A0xra4AV'
+        'Ko+se2XNq4W3O/rRXAt415a4wN9Ue0+8e6Se872uc1U6J9xpvj5lfdohc4IIL8HS5z/E18jXxVBY'
+        'PMl+EpULwwZyzHLnN3Gb3susg4jz+SMrAD2+QnnYQTAf5wSPWfBFYTpmVjEHdotj2KwriqNQ/iSd'
+        'T3TgCHqJvscfRD2egJkT1Tb14QEz4tWM8Z5vp0l7thx/KCyfV8EqmpUZFYpgtMQ/JHdpq0D7ujKj'
+        'UtVmC4G2N/H9ibR1ERnwf+ZNapNadGTTjWLSzD2zeEQ5HOeob9ZJ4I7oxzRkLPms8pCCPJbER54F'
+        'nHtYH/9wL9Xgxla0LZ8TL50lU2IcRY0ofxqf8gUlnIXGd/r4nvZIMc8W07ocBQn+Q6oezY3ATbSz'
+        'u1WfCE93UZMJc74sq9HKvqRxcgwP42LuEqUB2qCmeHsA09y2HxLee7lFTKs5odFYGNQRWg5dzXMw'
+        'Gr2cTZXeVJJI5zXytwKiGOb7AF6Q5k6H88Ub3iZw1S+oO3/pVR0lJyeObC0cF2QgI/kBUFACDoRF'
+        'Nt5k5qNtOdBAGOeNptgzxyizCS0+sV5lfzjHxo6BYnKqw2NtlI9EK/Xph8W427og/fQfLyIjYpt9'
+        'T3A1p9VCtR8tc076adyHC485liTm8glY27SsRHgFchm46dSb3HqX/Wngcur/2erJwximU/Mig7d1'
+        '/LwRKNROAktbqi4P8mjz2/vlpGwMPE+qMt5zXInEyndwGQ2XwDCoOjtsczJnIuzWQOCo0VWtv1ko'
+        'LZK2hed6NVC9HO0vmPU4uDiNNiMXoo8BoIty4WW7zWXCZrCLIrgOKX3YoC7ow0wxEz4zY9fAnY98'
+        'ht9UgsNPqLnVOpZRzIcAIDWeiUzpGP1dbMXkiHCsTROUk2LFwpmqezxBQBbwEJLXs3RRi2gfi+x4'
+        'Gc0GxoEVrXZI097m+k+eC/LEcUD+10EMZp9UwS0kU4a3F3xmAfg+K3iIWpTIKBqZsAadxpFTNW5w'
+        'r0CM2P0Pq6iFTEq90k1H+0DMYGB24Tt9AV5yJH4ACQFivCU4fZ+vOjZFagTbGb9Je2ALeIrPN6E7'
+        'BkA5dBxa89cGlcpNvp0w2klDP9QzRubNMffXG7fulZOwnl7d0FBaEECGpb7JpPDknKQFvUR7uU6j'
+        'zcRo6NjL03a0XqJd5XvCpdnsD2IMVdIttgZ23qoXVhOka3ZouDjrUJq+mVhBcXBphbcD2vZ6Ut2n'
+        'QWqFY7gI/pBAOrc+rsdHMZ3mr0yw0KvNnfuHN67vbBz4ZPqqhmqt/MBtIUhqT0+kuSZE9l3DuNjG'
+        'cMuCZnDtVH4mBzPVMpo1Yqh73h69SHyi3p4P5GZ0tEjx4hjg4GuaEFMQhZmSUEvWOEBVN05Rfe/Q'
+        'uTv+bgUpH6puVfB33wKY9esKCxNuc9gzt/uHlud/TlugBNxQor3/X8S8p6bQnDwBXEII+mCWLzLp'
+        'XfGYn5llOautlGNeKtWdJQ+2ltwGHRLZpq4dmP6HcGGEp79ufpiODFPXWjigtzfRW7A/eTyLEV32'
+        'hOMPNyTXPq9Io9mZa5BZ6NZ+vw7srSiDcKINRORtulTUgf8vsbp0uxcWO7rYvg2WW7i0B3wrvwQz'
+        'AysJ6XDswXOTml1jQNXfkiUTZFl5BC3CUeKqN2zF6k1SBsMpNRsdfjz3V4AlPPaouuMAREe6S9QZ'
+        'adwlltz6eFrcD/azbied3RsD3eslkKsoAuVMJbYPM4kzgPZGt8KjTrU51QdvVKvrqxqqJZyHFb37'
+        '7egrwnd75qRTOZg3FoST4lavDB9qVQkStLSCT8TcQRWk5Km3Ya+oJOfaaUu9o7FQVAn6eRsj2T9y'
+        'XqbwK2Jyx+8CDgKikd/nIyd3Cc2QH/BwGEuBaVF0KRb41Bw+1QrqHpe8oE6+jAHAbAUeHeHN1Uff'
+        'CNnuoDKhMdflIFtJA3YkIC9CPyD1VI6YrDbJI3g51iTz7PFA5eSYMDFAL2e+iEquPxNR5hYcBHPV'
+        'IjqFrUNfgwOlAC6dWyNPrCATtf/8R6tzhrL5Mswh59UAwY6lYCZwTnWJ57FSG9TKdQ0pIg580M+V'
+        'KaVjAB3KQXiVOzMJJlOpwyZXEXoczrHM3z1mI7P/hl5FrJhm7VzulBTugC8cgXIYUg9RrLtsTkAY'
+        'y6f9yqqPFUDWiRhulOh6Sfd4vaWoAxswBoDfBvyPJNNTw80eK5sgOHBtxtHGqWQuCMn0UDiTaspw'
+        '7T6L4/jWGnyGRD822wgFnRcvTT2doDyx96pOhF4UtfstXvHV96We2AhoCSPX/knJSDit+YHAPGsT'
+        'SLzEpIcIP8DAEOKdh/ArpgrBDFOe84keieTzYzAdMP2OWGxk3VC7vdRBcev5ZU0A0o6bzctWPfEq'
+        'hms2PqTGuDzPNx5X0uxR3eakledikMWebkvsrZjNMNbCAPFC154QU36mxV+4TMe8MV9Whp9IRhAJ'
+        '/LQYPDZK5l7RsebzTD8/fy6bRdG96xx3nyBLmwJSWzkNMjQaXetzpRYQvYdOwKbSLbf5act0cExh'
+        '5qxA8+PYe+/vmadYxCtemq/vO/Hkw5n8jO3OAyMefWpUOqGJXrvTDprAdQvJZC6xhBrAYzs3FFVt'
+        '70GS46Csi/SxsUnVgZbMX7YLspjDBwQJNZHxpfIMynOaOipSXQTxNRSum+kJ2OvipUx8zeE0SjL8'
+        'eocbUiGKDitf3c5ZDZKG5vcnd1QDFwX+rL60BP9oH8gORD9TpmKIpZJbSv2Gw5PoNclpgUFBkglt'
+        'XB3ukXfVZywjPsVGPC4EVvQ9cFk04O6z7Y1JdpknypnZGQsAGbXVG8eE+1edAom6wkP3k6pJ+YsR'
+        'BkIjG5pFyfyX14Jr1qNr+LTWUkR+CeQG6/z/h552GMbh/rrOBOV98zqtOwVV3kB+0CXp+jsx+U8b'
+        'BNXW1MirGaU7WQoBIpIWq6omV8+960qd4da/oxdoGftqBMcRdqrXa767BOJ7zfHi56uZkS1Fw8hw'
+        'MiLdfO/Z+rETyEHilmXjiQGIPOSBih+CvRYEN45et+DdMY8C/RrhT+pB6DXsYjjNei7FMFTJ2y3P'
+        'A1pyJZrJjBUqJ3wXuoRwom+Zrx7BoBV2oTNB9WaIXVR1+YodSHSz3AMJn1Y2+4MHZVGQKcB25UmC'
+        'qoxshxhEeS1TFMTqvABts2CRGUDEogA2T0XTjcr1lgVuRhEntucGfoMPvZh0P4fo7qr2rEmEG7nU'
+        'A6E+uiL8aPUyC07MDwovfR46p4tu9dGDHJvKQSS8BjU3y5P52afqHOwu1/JtdbeDHye4JAYQ9S+C'
+        'pQ69jN8NRhQ6dHMMrSUeT5NXEF2WoEHQo5arH6RMOqdfuOEFQxFYMCKKLfHW23OLLel46UyDFCBP'
+        'm/uj+7xq0VH26dUFKQ1Hg33BxuzMcTj8Ze+cQP3ulvvycCbbxiRodKhmKiUDo+94hWOxaVh7440E'
+        'U9PJ7QqHh9OelUzhSu1XNr+qy+GOorQQ5lIBzK4U2+igcC+Y/EBb9jYTF24rxCIFunmw8Srf7ZQD'
+        'RqpHEV9OB3MDeZlY0MsWqnIwfjf27nHnYawnpI+ThxgouF5UQOo5Z6RDFfWb4DMsZR4dUHC+CkWO'
+        'pobwGsf0ZU6FvsTO65udWgsbsULynU6ZM2K18xQjtGSw7lBs3amxaXRyebLg0rODbkx+iCUN6zZF'
+        'XhJvGO7QZbiWV1h5PQ12idLQ26xn8+C5KiZ6w1s0/tXVa86wLrgBUX7u14kMsLYnx8IAlcXHtZbI'
+        '03ejcC8K2vrv85cbLk/2DYz1yCaTwPE9NVllX09EAosIkRMNMIZ/rAkhVmE/5v0xgNoN6OrOMC3H'
+        'Y1SwhQDjQqY88WFwvKBTjDVt/XPdgTd0WPlG01IEdiT7KbUlEis9yJfDmtlmYKQXOLVlFdeD4A7K'
+        'rPlwIqkz7WYv259Y7bTlSStC8ftkItmEs0CaZxgymduq6xaoznsJn38Hkbu+GjCaNu4ehii4js9c'
+        'FLsXpe5qW5sCW1fKPFmnoW2cQeM22KY23d8rBZeNbSW/4SvQbG/SDqD8S6rw5A71zzQdrmFPyqYH'
+        'yMp3W2IdWZyBMMUaTrBxa0i5j+RtzB40YV58fvjWbkuo22EwZLt1Z/PRDRA2EYcBUIdGxq4crOfY'
+        'SHMhGPgvtyVj1dfi2nyBky0F0sCQWhzipkWY2BAQUXv73+VL9QEtQjiSb9Bla/NrVBpoi24bwMVo'
+        'DZDy9qk184uIliZ/d/R+ekCQmsgqCQno1KR7Xom2qKSNk0AWTHJ/95Eik19kV0evUjU91rCcGNW5'
+        'oZKZ73Z+GfYKqnReOwNLfHtMH06LmpOzAaJP1G+k+8uPXsJW8YXe0KT+bW+E+lceS2bNQwld1sHm'
+        'm8nUy1D3EHUxD9aTwdaXXa3CrSxixZovC3gZBiB48/fGXZRAzI8cO9x2tc1PRj9VO94AYyQHfZqu'
+        'iSn3IzusvT0YK22n7Tard+HbISYjv2fAqfaRk9/QhGc3Jat5G2kRkL4jbyw5BCfaKCzlfKAjkUAl'
+        'BXOT5bx5EFDMlLunBUvDR0C7xH+2lAnwWMh3Icz9iByaP66DjUpEk/cIXTQKuUtHV/h7yuo9CyIy'
+        'VAFcQIcBC6qRfk2nVYMVC3fSbWiZZl5soVDA+wpROUpmmD5S6VfyNLMAX0vj78lDI0egYfekNDPu'
+        'GNfen4O1Whgo2vlzWhdJ3fYKMqr2C9q6HcqFXb3dKULc2IFsFuLaJf+iBS56GWE5SibdEzvPZDrj'
+        '+4cwVtUu+O8ki3qm+EWMiO8AC4w8iRN1oigNZzUcfb9WLcfMvgfj1VKRq20irMEEcI3rFM4J3U3H'
+        'N23kDnkaYGjrpKZfnAGVGp8/9SF25075EEsEWRNl1SRt6iE7ssrKSsg+D4CWUE8hsA7Qtjz8lhW1'
+        'oqTmIx4AlF6mbYlmI+955/X0zvmmeYQRhvZpsXj3v1t16v/74p8yFSFyTT5hMCOoJyPZPzso3gLb'
+        '1bdlWlDaBCkaJBSnz3cpj+UweQfqnramZLatBTprnCXbsZ6F2SQ5/LSeAencPmCpF/quxxB6DdrM'
+        '9OTChjkWwjnAJbxZ1SO3qx6UUSwAXN4GZIt25zYXlYAQL2xGKAT0txz7z3Ba6ha8MkiUhCM6ei87'
+        'V/llmlPmfKz70eJOdocE2C6U6HSdcnlxN2Dv/GaYzHXLyIWjeP8PtwLCntCMjrjeC5SMmZEUfnub'
+        'MmZEr4qTs+5ftvE2DST3gxQApXBy5ppHhAFwHtlamuqTv4q6esQA+j1w9T6+oJMZC5XXeGGDFTCf'
+        'SZqtHI4t4DI+5fNvQLgd2VrtCjWsPTkhCbsxDziHS8wUSdAIdMGrPSyZGnTRT1hqoff/Wx/SHFag'
+        'TAG/YJ+vj/l7sgLFo+Mxo+DhJf3VJA+LjT6RQgEnceSSqJYgnHpaHaIJ9fhvyLa1MjxFdh+aP/MB'
+        'iEknBd6nWCG1ZbE9c8fYC5b3MAxMSxgQKJQLCc+ZgcdM15apkGin0/ua4lm4Mj9U1PyuP89RcDbs'
+        '2xwOHFoOBuAZs39mCGkrzNRcHO6C4o/YUr2CD0jvVC6edqdiIkOya6i4Z89EB4tyvROdjm18G7rY'
+        'bLEaO7x9VIGacT/p26YGwdVEizWQiG4q3sOFsyJ+39YsQL9XmpD4yTYx0PSrw00eWTRsxSdd7WYv'
+        'LAf6VSo1HmsD0hUd2OBlt8PwGEIOvdE+ZSKdnkUUwHeYxW2xaq8Y48+C+79F6hPebMxUWk/dtRjS'
+        'yBn/srb+QDh/6nyzyW0We8BU9WOm1+/EU05mbLZ53YUa+C4LbFDxawSZXy4YkGuc9lg0pTfl97Ks'
+        'ZjCEPjaDp56zwdmmqyJRjzKA/aMdWuRPy19PTjLw67V2pE3XzlLhtVHA/t7IOSmveXntxZvAI+Q+'
+        'EQ4xdIeNAg0HWoE+YRvPCoqAXp5aR9S5Uic35crxgBBJ3Q+qkLOSFuJDdAixl1Hni4eEjoEC4zux'
+        'F6OTvTu29Egs3gCWKnG/JyklWuHdhuYUwJqltuJ6xdD0j8VW6dqhErkUIZO/bDd619sI81iE2MN2'
+        '9wRrOdBsv8EFbVfjpkC6XoCTRis+fn98jWBgg2CPzV4brehrR3/kUyXTf+uikrXu77qIa8QzeqPE'
+        'BlUC5I+skM+hplXxS3N4wL40hHHN2X6IuwBflqUg7lnTFbGc8srhdntjSVF9Qlpbr7K4YikhIWZ1'
+        'tl2TVkZ5hH+4mOi/MpCRDmFlhjsxL1phVxEe4ncz/DrkX3dlZ8b/Dhbjq9Atus92iLFnTb6N7vWS'
+        'YUb4WnKC5UhysveoUbIAgc5ccTGmy/vApcpIN1B0usIMTYb52PFlObaDKuRn+rlsONC9uUfGmqNQ'
+        'mmWovm+GgQGg5I+KXvJcgKYJge8AO5OyZ7WINQST/VrFlb4weQ/XHCY8kG8Pb7YT10OCrDXoLQin'
+        '9FuWXF6nlfJNqEFIMhdK8+HRR9x48IpsUrPTGbrFXdSs8TtBmCOMk6PxpelJZhg/Z0svCgJbOKSC'
+        're2P4n0kM+Pv1DUf5OemY9VwPr94IjBLB/6OtP82uygJjo7Xl6iujuIeuzMZcB+Z0fIf2fp2/z3Y'
+        'OFEaEJjuFNtRCDmhyVWleL1CKHLEy5BChztCRge9KyQR/zU6ylbI9VeDFMldAwZAmoirTVQ9r6B2'
+        'w7Qa+o70uJwa3E1Ia6G2b5OSSz8bKTdHweTZC4g2NvgZ5THw8bLKCLuIui4iYEkwSpBqOv/e3fov'
+        '0NSyY1VXq3RvnuvTW/ExJJ1aHldiiARIKH8wDCEx10K/rBmIQOVhiCFR4zHucPB4p680GgfcKfgy'
+        'YmJHFQ8k3CSKcCnj1wHmTJb8atwSd9Gw718M/J/ssmO41ra3EoFosSbD6mSRKTPVWFL50bFh2x6j'
+        'WszoHS9nLAb2r+whrVPxEhd3/aO0oW7iTpCPAhiIqyXx15SkL7/FvEu0Tz1mEP9/NUr+DxmEZlwY'
+        'BKpXRZ+mFJ5Dhg+tmfCODsyR2gBQRDPpF+ztKwPC/Gd6bc651+HvyFd36m5vefXw616MPNXJmstG'
+        '5WE7qqxx4ROnbc/KUlC/7uhK5aT/pR6f5VY+1huEnsSx8RlG3FgQAmSWeENdyDOI3KTL2dV7WJn2'
+        'hjLZmuhPJIvm3Kf1/h5rwok6eXK8XcUCbd53FKsPfFUl/B+s+zZ5hOcaRNE9yA2GshRrZbs4qRAz'
+        'iaTKl+HAltzA3l/wJwE9ccw1Q7ow0bi+7YHh3jgHTWGY0M62u/fCdC9ASoJxnshuRGEhoxYbv/+c'
+        '7gcBGKN4chnI0cjMSv0V0kVUZ1CmYUNtDgUuqV3cph/o+Qsu5AfC3B60GdFn16lm1tdrtLJJBfgi'
+        'QukEb0rRi1U3dueZq9KfHlnkAyi0T9vZdfAGbAHJ6Un8MuE/pDF+oylRC/3zYWaj5y+GvBNTg7k1'
+        's98uijUAaojfRi5CPGl1Ib4JQfEm/Aio/5Q7zQnqEzJ2+AHLfBMWuftsZJuobwKRzX4BcGTLW8U7'
+        'db21TXtm1aMRWXkUjsnJHncXmv8T09LfL0R1/mgUDhPPPjhiPvOOHqwfOcCrdJDASR2WFmJafoI1'
+        'Og0PkpViaG23R8tFzVbZaQw3Eh+8zpOgBpiH0EXB00cFsbEfzZGBn/k5fu6u3ChQoXEKtjFJammN'
+        'iNp/wVh4xz4N2jC8qtJxATiGDS3vaia9U+qrC6cKWHC0mPh4pR8TyzZI2dgZeERNb78Wd2VwdPpc'
+        'A7zIGM1Du7J6s56ilfpmfxQ+aXco9GYD8+tFqsKrhIL4BeAKweS4TffE9uKNq9yH+5SHAFYy9qgr'
+        'wjq823v2193GBoYMQPr/LBkKd4CRn+l3yODpkIrgQa1bSDRO2rokGCYcZB112K91NXndWMfm7Qy+'
+        'DeODupMlvxRx3Gm6A0mGIzK/V1V/WkcaEMA7yU9I+prAYB8aoZBIHF05cAaRWFv0ccvOm+ibhDy+'
+        'QZOILhgFmeybVoSfAQjSS3VXCwq/2STLDC75yOnz0Cc5oeCghIGNuuhVJoNxOZ1tfGvPN2FZQ+tH'
+        '92iWfxMEGQQ6I93bJTZD1xdwNP8L0uhyAAFoXA5EDq9Ugv7RXJ2HLK0OGbC/N5blrafSPLsiEKc1'
+        'YP8blpT5SrTkt3geV8SYxD0DlqhSuq+JyjMSayjH+yJHUBXbA+xwaA2il4VsiThGIbq423z/GTC/'
+        'QZbfk3mF47oSKkLvnom2nz/i2XSmYhGo6EF5P+VPUw3vwPoVTpNEn85WIQkTaeglToxhlMWhPWp4'
+        'fzRn9ang//x/OQBqAOpx9AEuBCmF8IM61f/aSC/wV7X6olfnbdE5w06YYdCynji2i8RiIPzHETJf'
+        'oEFNLOhBEsz8p0BS0cSA9ISzShXalX3UgOQkZtR+NjM9S0AZtxz1FLTy+138Flg4r+nEcjVZ719W'
+        'AGYIF//z5/NUykJaU8Zpx5IFtz8rhH7GlY9lawzf6QUHEa880XzyYqQPWUDbCRVVuwEuBXrCxwGV'
+        'Upn86Zsrbgmu67btVP4PFhdOwt0eFczXmlkT97SfLp38U8qyAyokKb8PSMcLNv+6xaq0IcrwoYhP'
+        'wbgW7BWdjKxo72SfetEGepkPzESDX3kB1/yIKEjjsHGAy0yb29scfAHg12YpHkN7CNdEhNwHWxXe'
+        'KgtZrv8dq1F9J1wWZSQil9oKaXoBt+FUdgT0FAE/2I4wLYeAaV9uq3Vx0baio/ex4fy+xZd1V7jE'
+        '3gHT7nd0lBsLrtWp1HWOX3XsSgeDWUStItwuydDbEKe5+VuyiQsRPQnZN/RkQwMxdwLyHBWAKrou'
+        'XHrqRGAeEmD1jdlvlRkRPSdU93t5GBmI0oM/f9qYQAag/OAPYDaWDOAPLxLP+MiZnGCdqHqpLVdy'
+        'TSxewgNRguhf/CUr6p8ttdXi9x84xMftBcA8CGq2BXL5plK2Df8x49YggEmur0PghYAsbqe/hFpl'
+        '37Oy4HiWGJgMaOgKX/2GUxadmDu3AyARNQrLcXqVuyY201mT3f7Rx4GuZvwx3GgNxx+SoRQUefWu'
+        'ANUKqxhxOPfv8wtJcci67UCvLTL/hrsp/zsAIIphWeHBNjonO8wSrFjpcuQMNKZ6KHjzEqCtjR5k'
+        'lvsMnzgxOPUQp7bBmtuP56JSM0FWA4J/8lROFh7Toz0r6NmtgORhzLThuXoWgW8QtWYwXh56A3HT'
+        'JCXJbAljeKwXUEbmwt0EHgl4fT+YBE3nRlPcLed5THtx8GPicEeNBe8WO/IXWfSpsPFGRkXGnljG'
+        'kI3rfI7oJ0wTgzI/gMn3d0ojkY1zAaglW8jhYMy7meNCh3XiMM03BTcnB7NB8BQ+fVso5ptwiMYN'
+        'BfGOiU0HIgiFPl6DbZQK/H6KinoSdgr+OcsZLpOjWqRe5uJGXhr7/8cBJtERKH85/qkk1Rk3QTTj'
+        'htYqfYCU+u+56A4cgSZOPXMeoGlCgEG9zZG3klVnB8HdZ1RtQxnJWzTgoFBHV69mh15goF/SyzIT'
+        't61tQHFwA6zIPufpaAmWguGqjKUIak6w7vCmewrDAh/YhIYWppbWrGJZOuM8Dtmgm+PyXyQL031F'
+        '3yKJJ6r1VZxGtgLp49MPDOa+34IFqeuji46pssnjEaDsPKM1s8zEKVi/Kd4l5vwnmRI47IeT8kCc'
+        'MkS7nUJMrw2kTNoyeM/gu0SXMT8EekLgaTUBpi7SiqnVsU18R/zCK1IupAoXnLvB5x6upCgVY9OP'
+        'bOUvWuJS81sUeIWricUybzYwW4X58KGsiceBNFgkLy50eQHgt9xA5nTf9TIa+oE81oynlCrxVeNY'
+        'PWTDbLwgIewVubMZ0cM1xfOrMjK+VuwC704dG/yehzkc8HozuqYzEzX+btaHbaebXIDZitF8PVUC'
+        'unsaAAfJAc+lRpbTVr/Yshw3a9ODIe8h+UY+1fAQY0I0EW7sU7OUhL21MwC/OrtQDqJwnd8Q8JW1'
+        'R+ncT0mwa1a8YlTNDrzLPyt3y4aqPd/UCy/ZpjGnlk9/+u2GKwE/03hn5beya62iMUQNUqsdb+TR'
+        '38MksPCaehC8JdVvsQajBQAt4wXAjQRagSnX2oQrix4dt0jv7sb/2SJT+jKyhFRTX8zkVL9UJtmf'
+        'gqp4tTZn+v7p8Kr2XUgJhz5bOFBcSNDDL60CmxHYL/8XBxMqQ0uZvGeS8HX+t8bbPm1/kpHFQCTu'
+        'fzXVe11rLBLXcVCn/UJuGVK6A2rlUKWQYZV8Cc8SVGESsIc8eMwSOb00bn82aRmz+bPW9V6uPlQN'
+        'ddB2sE7mgqfvxsdKRVujIP3J4Ejsm4YSYJQxppqfv4rKxiLR4GFHCDcm4vbUZq09C//XE8/xr02F'
+        'BfssghegGmk4j4h2mdEnjEgmReBTGW2j0dAr5eyXgDWqEmITx31GsJXwdXSqzsYWmCVaq7d2CBg7'
+        'sd113a3ncd0QYEgLrS+pPCW2t9Nx6/mnjY1O5ydTJ5FUg1tRHFqnZgslIxQp/LSTFrmVKq6DBRUe'
+        'aZYaphZD1+nidwl1wmaLZHBDi6Xe5HdKsX3FQvn3A2wOZYhwog06tXSXBu1NAyAkHRjdP1lkbYi5'
+        'aGpq5MqI9/YXdrdmGR8ueqO31FsG2FEr+aSrMw6ukdHKuFBzTenjXzpoNC633l3Ah/dvu6HWdHpp'
+        'jBpdO+2QYUpdU/NsFD1qr6NEnwtIpAs+amAu3aCHkeoxostYkk/HfLaj9ah7SSGlEmUyzejjuyZM'
+        'yA+PmyriQuNKclTZPkWtuKUo5TdrNNjpHRgGE/BJ445o5JEF5PXaBo10MqZVbfcCgSP9LhIoTdRk'
+        'eSYG+wh5W7CJU/JbX1YvkTnRiKXXhk5XnLwzuJ9cPba1WJGF8oiiY3b4SBk8n3Bi1B47+zOJZFmN'
+        'LIFfzdDTAcFszuSgJphfBgFz5Wa8vXC8sTaoYphm03YBQDK1WvXYCBjdnOdMeuklZdM6Gl7jXwEk'
+        'iGRTXLcjBgLA94bp0/j0lAKYDoeOT/8Ppd6KFPlIqKs6ZhQoWiC7Iw1hw3HGfV/hmyQh5gr+s+yb'
+        'ML2ouuxb0Np4rZtVGLXxCCMVy+OHg7RG+Mxmlar2RSG6yHWYLZmEbSYmmXsK6TzXrfR15GiNbtmX'
+        'hFhUYi8L60zJJAeFwVJuTO1diAih0e3KOwWVd8vrV0lNSyXtDfdsiTmspKP/swg6+/6oT71fT/bT'
+        'D6IdEMm2ZILw07kIBx81s7HYBYCG0wbkSmTr+F9KpSbuDub0YFPkTUiThpFqXE3Q+GKvNF+26CfS'
+        '1/5aAC+gztCnfylKCVo1iy/VjCE5ftJIEH6K7IEa2pKIcVPvhD79TzDk/eV735bk3vq9T3SXAVXJ'
+        'K245vEzTFF+e1KV5byIdRmZVJOGbTEDNDhv1EZXX27IyPV+FNuyJ74Sqdjxjj0i/1eiNDQB3A7dw'
+        'rhftZ/6++6PF3U43BkXtOwq9pOkQ5c6kprF3JdhOxeYDXBflrLrHA1o/oO2gW4aG75PbySGn/sun'
+        'Zu1eWBfY2nppJ7LuKwBRrt6dgRRztbZ+sWEb7Gz6BSHDv0/iX2KqdD+4OppZa5H09HH8Zpg+3/az'
+        'T9jtPduu5xCsW7asEwT1kPGt5vhOJojiLbHysF5mKY7hd/Ynav7DzFJ8187gCEy7Cxy4jWQUy0er'
+        'adTkTY82IMCwGguce+kNu4b/XYQ6X8SCKCfIgcSWcfU/SEc1yuC6DqwT4h3yUBSmyiAU/rG8tYH8'
+        'ZhZnlvOkOpYWMnucuNzwMQnN3ZvimaCHbcRMUkzR4A2cxWHJXOuWSeWTIdgM+zddUKDXr88yXOcj'
+        'x0g+ME2oNi6IedF1IkWwNvBDEi2FbnosZd28qqECpnJjskFJUux/XJZcZOto6te0L0hiQEIpWadM'
+        'CgdqW2px4/17hlAZPRw49Jpnnh6+zZCTcEBtdJajvmWIn+5Aj/bPJrrR7k4/FFFLA7Uvf881qGuG'
+        'rng4/aa41kJ71aML+WGEcJS9EXO8OxFukRIwaSI8ZNDcXNMk1kAHccomO5tVH3mu4SOyhamRmuXb'
+        'u3XCcZQldBetoM3nk/QEs8vv+cPSbbITmf3+UpFqZGQ6dAFQxUSbbAXKQBA+IGM9W0cON1OExiwS'
+        'f2w1NzwnBtuvKy2VDN4OmbOILL6QEdflg9x3fNFjqNGM2HjoUe8zLRwAkRESzs17IlXhQAC7oLnO'
+        'y/7A1ZQ+AtnC9DfWLuGp2duLQOqsL6ukV7wkouh9JkOuY+ba6crKA+j7wSWabmxzYevXr+WhY4UG'
+        'KLbaOkS+ufvqB+VFkpYfI7kRh6dUJwUmhjqvLbCHFdnSKItQf116cSrKU1zsunEy76v/53N91vlq'
+        'Bn2RLkCgTLzeT9E8YEx7Ac2pW1XOBaD+orTIcazMvQ+GQHBM8+uk5N0mS3lnoF70vSeQz+/ggYOk'
+        '221Z0+v2bnxiTlvLhZmHeuwnbG8Nka224V45Yy/NSAFsIfADoYy582T5DbGyqZ0eqdyFBVB8kYQM'
+        'J/3SfQcuYwjgsAQvDmkT9b4sYX2K0Raz6CCT2xQaN6AeqHGKURdxgxmjM8uIxumG2XqhZdAGpnfY'
+        'a4vX/QYWVvoRR7NNWWFCg5Sm93+2gELe3b+Rz0kiq9dqtHm4vLAnbycVARmSsoytznii2laoTLHK'
+        'xQ8c4XA0DC8XEEMKyXXu7dyCAft5A48xoTDXGCH7+BF37QHC4DCE5KoDfJ56cIuo6ACGHBIpehH+'
+        'LIu2olhar20T42JRMo2y/lGtNoQwIOGpByRdhFSNIo9613p2LvBWeQ6b62+VjnWX08EnEgW6+9C5'
+        'obooJvSThLlyU1aBZmilVRceGbSr8iyBAPEqD+lSJO09You51I72p1Kw1nOWkYbA37lkF7aUIjKT'
+        'pNs+oRUjdnQfLq1W26pSp2nWH8hSI1oKXshiFt+1SOS6fDu8iAou9PPRTNBaBmaTHT8qk1xgeTnO'
+        'I7v/+aZhRz5cqKGVKajy29DLNdMrnNSkCxvs9KvKoQ+1iJpQQA6wdVQyH9vk99XwjFNT1Og/VdVr'
+        'iuAGVy40/KiEwOx5mooQutgYavhk5lsqjlXeZk1VovzEHpf2udZmczUGs6MF9Wr9bdoIoXw+7+SU'
+        'VFYHSoFTPZfqwZlJnwpkWBuTQxO6Hkv8g/SKVYYatnzm34gXm60CCI0ZsrFIsohqTqG8peIpZehM'
+        'FIfYH2DOpz/kdOE3KfzLKYgH2AEbBZngIyWCJp4pFINu9/WNjQepcQEgUl/WYmqoLj0asxZUiTJQ'
+        '4OffBw3SZWkzehhPGc09X+VRT072Ritl7eXOOIZ5qkfDfJkNbRp3JdPUZ3URiMx6H23X8ArErUVr'
+        'VRu6yhpz5fayIdcUnjf8eip2pKYZeSaC36i4iTYs7sdQHudG3OrxzjsSEMCFcXHYtMSOswqug4eK'
+        'JWG9D9Cx4fJQwWlCfk969DmNrl0nUJWG2orAIYaeFsl4lnawB9D7Gz2JgBSGvifzLW61kUbUaLCP'
+        'aLa0AiW0g1H3ALbjZNfgibOLG3c/S+Ry93kXxAVA07F6ncXDJizTyDZ+GWnvNeYvP/5Er//Me4Fy'
+        'NUBKQ5EsvaphpkCycheomXv381h3uQI2yT94AVZ4FP0MZ07UxDTHr4LQALzTeeSq8fgpjWcKftGW'
+        'Ipj65sc7nny6+KWuwDtNFCJfjzqDiY6lyI6hU2c/gGqD8Gax/70yTzrp08rtyZM5dUHOOLNOOq5I'
+        'pf3jYhnt1Ivxl+agO8ZksZWDQtGsV5ryErjGPVjo/kE236lkOTedgGZWwi09QDqgDrcA2Ud/uba7'
+        '+QVWcIO2Wamk4FbuGNUyBhfQGhd14Ux9n6FU4Tn2i+mIPSFqJekSzntJ8ds16Gh1jpHoWw9DuQzX'
+        'Pu+0OnyQoZjtyxfy+iiFg8oKjSGDUZKY2actaPl4iy2SjzMzfPxV8chne70n9sARZsQQAODV6PwU'
+        'kMLRd7ZV1qlJwTmq5yDgNe6jnmulmS8yWQ+bWRGlFFBtj2jYuodfXOtSG8GAIRV4iyYhzn6zDSjb'
+        'FAAug/J1NDoiSrJBp4vFBPnWzbEEWxIWl/T07+Be5Xd13neYsbBc1zyh8ZRjpqo9tNxVT3zA1gIY'
+        'XeM88FtgjTWqtM4c2iLqQEWcnqsbEGUY6JRvQdnnENY392cocRBGih5L5/7qm9aGoOTwGBvIyzQM'
+        'i9edjYggminN3Fl2uLBxCs2xo4vM91CEzuvA57DP818HGFY8WFG1ao3OUD/UmuZ95d3GdaueDJOh'
+        'kdJiqYA3p0C7XCKXJvWfLBoBvDivNQo1irMG1gqcJ1OawZogDlfypb3ihVJiCZypepTSENWO/3Zk'
+        'Kkdpm1XXf/VoZBV9lI8JAQDDYZg3li9eMdpWuMi+r6MYjKhDkRdr9ri2kpSc/7YwH28B4Jk6Zxy5'
+        'PSH4EENJO/olbER246K8hOshTjs03UKSh9kgpjzRzh5KIcQW3kyrmlKIuAQV0J/C5gt172PlzceB'
+        'iSTPxP0H5SjtU6IE1GIqI0ZUsUyicCKDKyUvg0YMiQ6p9xLRHGZPSxBaQf5r9+jRuzJ8gN5YHEgj'
+        'QUmzFL8U4BEPKN+PYdmm7dZ2T/sUuU0J09SMByzZLEp0dpn+dud5/rU9DQ5cqgTQL0voetUAsBel'
+        'kXAHA/mmfqJJmFlu7rzomFcPbC+wC2CjVazj+zq3YivqXRJRkfe5BcCF1TCGzYoC5895G2SN1tMY'
+        'v5kdFtHBmnZF3PJL6xZm9KN55vh4yTu2XnUqvlwKXI6Yv1Da9bRPUK+d5Ujhoci97G5zVRXXNyj0'
+        'N+hAqZYDu4+zd4qcU8Z+TFDwP6lgtrqmrfR7DNn647gob1AqY2DyoKtJE6kTlZ5TlKTGw7ru+iwp'
+        '+TpgVkQS8QigcbCThs+Z+eXXx5P170keMQ0f6QVRx+3UsFj6WGNRFOuYxZhG8FrH4ycFy+8LRfP/'
+        'EPQUceJhBRUf9y59r3QebodxobvsaSB9v97Q3RYgq2mVEvmWagVqZswrWxSp7S1k2OnCqs/C2fuy'
+        'iJZ+Q/+owngIVUkHh6K/EmSOhGgcvlQKdEmxEH4c3YaD2WYfiROBbD7xBPRWEylg5bgRCfC9wGYe'
+        '/4xMHYL6/Naj0ve09s3Zr12zd8bXmS9BvA3VwCXL4YbnmfRlSlDQzSKgaLVkFjBRnL7Ke3WlM7uU'
+        '+cbtYMP2kL0QNUU1fvpOnZaQ0XGgD6ZeTeNnF7y4EyqhjfCIkRS20/APexyxRw+99pXF1UR8ubeW'
+        '4PvmDODGJfpnYnkWVFtBK09bwBbp4bosEvssLKN6Sro9BSE43BhdDHwtHa9ZdjcU0raHL6UlD14j'
+        'hEXZXRgZQ2ajZs3lQEO3gy7t+KOfDIJOFN453/V+lYzijn7pWpqlGCz5RGKQ30SWJs0m5/88ji4U'
+        '9fjwnikh4pXY03BIJVS5w9Qnjir/4VN6Se/+pdv3l07QYPJknkCFn2EJYemRGZ0QG/g+4bymHkr2'
+        'AY5UOZKjLIs0BZ8NyQRMz23Qvxg5Uh1hNplak1wfGdb23pF/mhF9Ed0L4XtPaVkIQYXIloqu8rfy'
+        'VZmXKMGcbAFAfeq1awXtn5dku6oLDEQJWzKKKYhADpK+6PdVelL5j4QTByRdOo08UsB9FeWCp3gq'
+        'neIn1XI70h2LQ/pcX7P2ftjg/NAUuK/AWvgZlABjDRgDQ7Le5xDSw7VnfBnMAkJqcGi7QJFku+9N'
+        'k3DUcSIj7C3gUTJ6E7HBzj7VijfH76mpGn5/bhZXWIrUu0N8iehqlklm5ZYn+OggZUXLgmyesy9F'
+        'LNYpa9OTpfx/Uvt25FaGuQMHJ3LcKNZv4FtakDqLEsvC1uFS7CGodhtMgGEKzcKr4Rp4J/WvBYCs'
+        'z8x/JOVn2sdJmNSSy7BOgmGiBHUZSIGnTknVUz8FRG6lz21ADzwEN3L+pXkVcRIrLd7KIu8avOvU'
+        '8f9KZMnZH8VSIfnKw8dgIJy8if/Cdmwo6G0ywnep64OfdPs1t5CgEla+AHPWnXlDJG3AUCu7bypa'
+        'V94OMlpCbexkQR1fObUc0RN86+vwJH4NLbL24gubIMvheufsQz/IR519hgoGTFnWDQF0X8MGgdmE'
+        'u4qVEcFvjvw5ZCMLsnE5LselImIQaIl1zQ0HWrQmeFyKpvem9m4UdO5q5LUWMMWA1rr4QExJo58c'
+        'y7T5AU52orQl5IoLcYTysHPlVYJ52dIhQihbJdZjEVFBiQnOqgly1Uuf6l803j0NN5RNWvwrTP4A'
+        'XYIraBfOY3aXdheSgv4TqhkzxS+Vezmn+lY9tm/1NTnBwBccUD7JwXRirKLI67g/Hl3SLJXErXDu'
+        '6rFewyE5LH8NNYPTreL6yo9IlTyUXC5OKhNuyQBzuoQjQOcRaII1hP9bfz7cZtWelQ1l++YHBrL6'
+        'sZiyHA6jErNF7n2ULnSNL1WmWmdyZJJn4KKIk1hVQMntr1qgU9actErp4kkb6GvA+ReD/M9qccIx'
+        'AH77KFubc370P4HHejn3iqWxkgB4cOW6mba38XH9p/JWX9bSPiApr8DPdi2o2A0k3j1B2dqplxOS'
+        'iZXhXs08vmxe45ged074ErCRBeKJabXfeZv7X/yXtEOIKKCIgs756mPLYob1Fz5TnCc3jbgeuABd'
+        'g3HasQNHwwituO07LuKUz3H/8WQtPoQxScxXJOmFbpUw42Wo2D/RviCm56shK+brUsGVG63ZPd41'
+        'xz3I17zwVxjGBqFS5Px55FwwZau3ypohagGgjPsV7awpF+pEFbuEIN0j5CdcmbaQxUNRTv64iUwG'
+        'Fgs1k6iAGb2uw6Afi7NnLKPWR/QIP5GpuZZZ/uri+1tudZRpX/NgZ3ums5PMn8tK/Qu5Z78vvknj'
+        'LQ37Aa4o+D+uuy0VIUJVkT+z9THx+vVCTrDWXHDEfsG1YH/GSrJDBIs4vwrJOYchMaTsmPvHC0sI'
+        '0EX2cuo0NGMb9xOpq8jtBJMvHodAmJ+plc6JeWDSS67zqk7YLu4gsAwZRuKq0GCf/7fUOjsFFkdL'
+        'T9+N6H6aKXjgh2EarMQPpgVAHfr41ozq5dbJGVrG6Il0fHGiuWxU7Kxto+1JqTOwWZRNO/Us/Uyt'
+        '0bxXHRNraU6PWAyub5POnz7+g4xEKdvhUdWhngsQLuFFMtX5aq4NJ/SLVGkZmmr+Ocrq6idxHulb'
+        '59OD0bvnr98+Dh/pht9nWAe989IE9ywE42Uls5h5Q9whcLFCuwCOjuvLRBWuZFP+R01Z6E7ngZtg'
+        'cgEscYJIM2flpKt35M3icLSHJISXU1jWN6J0h6Igd31cSutPiq9mKVRUadtDluFJOBQE7NNXDeWb'
+        'DK4xGJ1rjhagR1gWFjCpX6HAQMqDlpNW4Xmvw+nLdSPuJKQ81WtxPM/hHOjPUJX9+UUYupRBe7SI'
+        '5FKukzWlww2TyaO1XnC56ZmBfQpzkyrASE/NmctCE/ir4LhCi9Rvh5wXVoWVsLPsKrjvmjB7wgQC'
+        'YoJl9w2o5XwurzaaSap6nMSqoSJbvByV/G+oWA3CiVBal5uOgx0VTFNF7Bg8zD+Fw2SMPe7ITAAQ'
+        'v1uC3tT/Xa4NSmhj5KOisMHyihCaaUh4MBpy8gVjP/I/yvDMEOJRlMSeLzSDZqrOCe55lhJ9ElrA'
+        'H2OgBpKJHnktbrlthGbL0nxBxibTv5myDleBvBawUZIdM5bznDf3ZJQhi0AkLqaZNBUHOA8Bszi0'
+        'qQZUeThCFdMd/KXJETqX+iz9EesCMpkldKzAVepmbvg4QYXi/Vomf+Wri7hPWYBa4yc0i7wxwv+c'
+        'wQU/wYg6jzVZc9G0nXP3L79xbMshQDAJHaMkrE+CRaQc+lmlQrN/4K/7+mobQ8xaYXvU+Vh1XL6/'
+        'quAdGRSZhKKMqUT33kO5rOTzOIQHU+hDRCz/L+bXOMc58hTqRiawuq54TiKgrWcBQPUKDvbSz4cL'
+        'EpsKLIrORp9bq1ZuiPrn1XpASSH5eh+gGfFyNgNy/mioxW/Az8PmqtZvkB31XgoBbtDGPtuZyhip'
+        'KYaJmi2C7cz3/dV34TByfud6CYD3J+AdW2+9WWVvPlz0qo1Yy9g25ppi5+EV/nalfwtpS+55eJHt'
+        'CMwPID3ZAlBIv4kmjLUD6InPDKm4m4wD34rjo/fxMTQ0COXcaFkTJJqLFSgjBbpR94GhOt6TpGsk'
+        'sISWH0y0GjpLrzpYiMkLxNJ1J9JCNmrQe8Hd8V/uFMWJc+ia80acBYC4UnvdL03GdnCqyWCCWB1o'
+        'I61ps8/UFRRq7OnnaRx7vzqbFlQw90OjEY3wP8U3qKK7drDfoAqv8WuEK+SgfrqrhuFBrmlGCfF9'
+        'LzI26digFbNV2vpSakZzlPvp6GTmisg3JbBP/Ldwk6RlLfd5Cz3Uq3i62TuICepifOiSDMlH3a37'
+        'fZJnadAph+kRwAo+xIMmmuOTlbha0pcLbmNxQEc2ndVNj1/p3GEQjeTEHpSy1sLsM7x3125rJx7j'
+        'FSmRozIzAxC7Jp5GxdP7swqu6BRs+yUUEa+wWKJkZxZg1rOXpqjk6k/ZU3ivrgzW2NCjrvcM/REx'
+        'yjHfxQeB32flPgc77ChkfKxqDoFh+grziLemWlxx/rjKUCri3xFgozoNNK9B0kzqNg0RYe92NKS0'
+        'rKJwxG1EJsie5FzwHq7BnpRE5GZNR3aPcef7gAkyq9cO2YIY2Q39iv6VpCL0b+6+bq7356TdmjzT'
+        '2N8ENh/oZbXanzkArKMoD23XajoLKr7WyfjHBJPuKpSXyYEinBew3PhfCVJpyqejuftqmD1dE56b'
+        '4LLp4J86o1XNcTLC4V8G4J833VDb0XZZQPHZ06zONTQ2dg3MEkQCHP+xQDsqQFNisnFf0UZ05nf1'
+        'cjJjZm+BHiMDwXU18mOptqCn1582CYiAS71TRB0B1J5uyzVhWrkI77+NkVl1VIRkoORlfnMhpqjB'
+        'U+d/zJsUbX8vYOkfuuXrL8UsWEutNtJOiVc+/sdihyPQVR6lU+EWl2dchDnJKoFDGJUzzQdUZdHE'
+        '1JgkoDe6f8ohzYeuhtQx1MdRcD/g0NswBwP3+vfap6Ms0p9LAbwcNWtkQh1SF2aedKGGgyCg0WcN'
+        'U6WIxV1PYpvxtJ34TLRAZQFAxpfULWbmTa11Cc3OC57N3PyMoz2C1rsu3iqR4yRxqgHDodgWdl12'
+        '7XJrnr9Ycqj9d+r3TXRyFWc09g2FQDyv0TA+QXlSkfoovwnoSKSJi2h0r2PE99RsXN/LYt2/3XxP'
+        'gqVSyYmoLEizUtm5bAcs9UOeEYuhX6ggXl9Ua3G4+aBGud2UgXNu4tLW2LmgUJajNI5vt5KLnHx/'
+        'fwU2fd8hALRZLEuJ3I2GxycJmfrNG38SYNkGDriWa0ItoQTPmrBGMTFyBOt1tOjURE5YrDjTbQeM'
+        'Sk5tw0dRQZqSBYDgINl/7Bs9PI9l8IOjbT9Po77m5JgmE4xiz9hT/a+0dkSKtX3k1PYA12k7n9c9'
+        'ihbTUzODkaYjKL/ZYjhPbzTJcvEauSfC1BIWXhAwEqZ7b9NEy9quMVGC+xUjA3wLvsRQKJR9PS/+'
+        'eMiqE9r4ve7ZMbUFWefOo96pRSlFaxnTUBj1WKSN6uuiQKL/5imYSWGlkAFp3G6OaLYxJ1j+w/rq'
+        'GJ+nmfz3WAZmtPFEgeVW6rkOzuzBUCsONtcqWczWFPZMxWu8cIiMCRsL3nElq1Yo3ENeCOOxgTix'
+        'zUAWwHrOi6Ei/Aof3Fn1IlRoOCcvRrcDyy4rRfDNRpQt2VdB0kDblxXG8fj0y8YpeetN3LrtRBps'
+        '1dccqMPQ0uaYoMdF+2Kyrhnh4z4PXgEdi1xlPcy/M1F0NmCTadBMIsveAy9sgJzDdxl2TnK6bZ3X'
+        'RMcld22VYz9opqxjhkH1qqUqEN1QN/y2fFMyhtvXujXPivKsBaG5AAx3xV9dDQ5IdISGaalWP7eF'
+        'YI94Q+igduJe/UPVn9nzKJo+eWSsgsRuQaP+fAC5ZQAptz61JyLItMxgZxPV3VkJ2Qbl3FiAoKof'
+        'Nx6VrCWZyjMVmUaTOqji4ZtmMg7mlXZHraewZ7xt2nNsu++lWcdj5TsvsawHZiHvcmnYfM8GOOqz'
+        'jYVAtlOqLuwVr8V4CcGj5QibgccqMgCNbxZCkNtJIaf/TAk9z/RRM3fzBaogO46nHqid97aabi1R'
+        'CisyE5xgsVx1oo2UZSlYI9qUXBRSPVbWqaYRPL1X5yIgauNTXDJXJkY7wXOMWrAKW7WmMXA60FE4'
+        'vJ7ujz/7VE2z2VC8AGGHLOLgfbv53tf+UH3IYDa1ESZDJIlIEbh8IZE+/braYgGAAw3KxevcprPi'
+        'ZpTtusXye9hTTV2uA8nGqo9xz4PlEvKAWtA4jKPZ5tN5YIYSLvGicWaTnA8kPu/lahoyTEwidNla'
+        '/akNSBxXTYwoFJoMZJiBlmkS0j9hjYYvdznQSed+nZoaWDUDx9h5Dp8Hj7wAt7sC0OOIP1SFEBvP'
+        '37bsmbt4Ci0WdcyAl097xsmhIyhzclBGaJe1g3fkSh311tZr5nQ5R5U9Hm1Yp1qme6OrB3/N0Lpo'
+        'awaV0bDlcKfxqqJTnUIoy/H38Bt/CGaqcRWxHXaKr0KVBtn5Kz0JiQUAowvXHU3Ks9mB5U4+qdAF'
+        'Ja/U1909dL1ckUL9WgxtLYszMFmLRi801A1c3X+fdwlOmN4ywKzqKQX4feiwJ9upe1VTkUUwujUX'
+        'EwP0Z1a/VSdEOS2Qq9lIs3mp38i8kwTfQteG1KuOjAFtZEshoDuI+LhexTiqUvJpTTZapq2ePD3L'
+        'FXyZ9fAk4eaeLqqcL8V/a1oVBUjMgb36W06LZQYNSHPt4okgQgOID5olvzyY/oVpXCTfhLFl7bC4'
+        '32xF6bFNordwRkwBXzYug1Ct/RaPboC0wCOsci+KcQmlGhbE5b2WziI+7PV9fD4g9srXZyu8UA3n'
+        '+Z8wijOiDZv4fR2gleOPpGNAgpmrdclnF6BXUWxdRkU+emua+wRbuduugKIvF+iBQ/jy/WlCMDYh'
+        'OJb3cis/gleC/DGUuJZj2UrALAivdCglVEvj68+79QTAEmbfIXathsqQ2NCUJssSruGZyw0Kp80R'
+        'i2aZTeXXR15r7vvemC93C/+6Mm8RQgOUWsgwVhSjcEi8o96X3aT1poe+Dly9B6q2YRkaezxhBmfX'
+        'KdS3BHir1a5Fp4ZLz681J4M+M/rrnT6vI52vRFh4SJejZKYkjZH5gI63VDeosOyqUi5KK1O7BJd8'
+        'j5KIvo1sGovrXHNeNi5s/GhFC+CB4YRgvTeKD6J04h8gl1rp3Tuy/H9tFPnFmPjgrdbELz5uIno2'
+        'McSVm0qONyjqCySZEqHglgDqLGbyxREpyqILMgsvzxjEwKUtmhpldO4zdadZGa7L9SoFUbL44VwV'
+        '9NpS4AAGa4ZVQrrwCUUA79EmWyQUuIn0MWmNlaukUjPl/hUh2howIx35UQaZ37MWdXFmjbI5Oobj'
+        'mDq3f9nMNTpmu447NCLfnnlk7naYe2ABeD5lVUjomv5vML9GYW8Foq5PmPTEdWRSsS1op1JuCepp'
+        'U4AjO+bqahAOV5kDntysMxSMTRl5PK2fi577xtu7mjD4Il9CuU5+uH/GkRXyu0hNGvi4if1giYPl'
+        'hu9JAi9l5DJKRkCw+R1sAOboTaHP0xBM+KWgWAKn0eo2f5kQnI/gZNwd2kni5WI8L1wpF6Gt35wQ'
+        'r+Jmzu9mVMumf1HM/qwzuILtGDZodyIGC8BlGlW59lEC6B2fLtCXe7bRErMrNL+BOCtSvwJkIsb8'
+        'BIdGAkN5zisDCel5YkHJeJN/BfCUFWojTkFZ8dHAKF0Ng8QWiQQAqpFE1EDLjQ/Lxq2KS5Iw5eV+'
+        'ScjURZ7lxmR60JqP+Voy2DFlnPTVNuTNs6Uchy6roz4KYE5WfFuTx/iGUL8L6rZ9zrvXXyJXYcGx'
+        'q9iS1sG7BiJMi4FhEfGUt28mj6xeWWFb7m3SaldJbdtMsL7bv99dWoJerVitNlqawYcE+DTjuyEm'
+        'K6zXBtd7hByzPcQm5XqmCh7PEJ+kCwKjwUEBV/UC8f95lzXvX4hJxfikFOGseUWxsJ7z+QGjb0tj'
+        'N5Jwzy5wsNp5tfPo9BVYzymw0ecJG/x8s0vVLK+cvz40ImsBqE8jwKGpvbEO7nFS0Q8zVcnlZzwr'
+        'AnMvid1a1YsSLOaHNBvPWQf0q1uj/FhfWyBdAzEJIqel/1ZcR0NdCarH6w0cFHECUJ5NvZVTnDGo'
+        'aAZHV1pcaMWq6sbLNP5lT4WXtBUCLcQk6eV59a6sSaCC5z+KG+R0IQqYuB4eTFla4moIDgXhMHmn'
+        'c3fukownDVnn47nt3hsw3loeBHueHiPXxZcGC5zvH7nCKmlEp6Ls9HbPeDyCWjZAJjA5jgkH85sC'
+        '+iYqKczJKq5XkDwPvploKMtlJYeFmIFAJxpp+BAzDIUL7dauWBZ1YhhiFAlwBvnzJfKIdcZWPY0J'
+        'ZCeOcXlEBPOBGyxxvSFk6puC9V5+oGqudXPint8iRDR5udB9mSS7pV+YJWZtrlfeJDmyftagzt0i'
+        'ZyvIekzV68JszGyHC01NWcWyqP1e40sXPboMjK1Bu+ZD44XPNKPo7YLzsizsg+KWGjm0ww9UL8mx'
+        'SPpus+7FSqJM0pS3H5dgHTDjUGXyRDQvGc3pA+OYFJ/fpxsBXtV/vP9I/zh9AhMCrdx16Z+fpnSQ'
+        'izEjXgGwCWDQeRnJ34i4a2LyxZEM+DwQLREnanCgZTFFlCfM92MSQFU8LEcs1aj9phwHiIFhkXHz'
+        'UY4Z1Ctosuej/6Vy3jH0Nfn20DSZU5nTQDeombbcTF4QNX1HjQDUo0HkGBm80zXnTn5Zh3StzQVA'
+        'STKttOOIE15SZ5+4tND2h92b8P+CW+MnOPkOSzqmrQEXglUhiyV7Cnzq5w295VtPdLKUyDUEFoh4'
+        'KKdMU0XBTT9R9V1tagbBpvez1ODLlUTFqU5fgBzG0Z7qZx/40HWj9C3mzU+deLPmObIVVs/6hzh2'
+        'BeBp1QjSo/1khJNntPayxQyMIHjNBK0g3KFBahmrYfvJxHoejyDh2T4gv+pbDG7wLuc86X0pvEWG'
+        'XBVk5gNXlMWGqHwKPyQRLdleRzqx1pMy6vYKmMgHgvW9mPNnPcR9L47KxhXgg/iWenHfvSzimoB2'
+        '54Ggx/9E6o30tXIWBmv2rmg6m78yZu4kTY8mBKUGaSg/EeqPwHjxS9oVz5Iwga4RHyBiFJNd5oIU'
+        'rdyaucULDGli3KEYcJFyoE1sqA6r0PJqyXkZU6xFNJ4fcn3k4j2ijn0bPLAGfKHE53XBl88VmO0m'
+        'kVqc8qkUnp3aTUM+6GfBSl1uagpAI7Ee79/mVgJgDbTnHvexq3uf8zqfhcMXZ71diNfdqhO/A/lO'
+        'zfedgEfw8mE0XS5cqAZ7BCQgqhwVY6inzL4go/9MkfyunFvuOJLovJswifGsq2FVuJyeG/aDUZk+'
+        'UbxPRAVJQzSkvgiknt+8G2hnzG8qZvtCYvvSfhx6sc8ys+V4pbx01BHBxNTGtwbbsdPj2Ih6pvAA'
+        'NygKBkU6ljmeh6dIhf2BrUnBfd1onoLRdVyrchnPBEDlwYZw4DItMvQj9j2ONttPGVdQZej+yICU'
+        'kul+NYAXwuwKalLbjpCrTOTjuhSaaRhx/4o2dP2zWq5iHax9x9l8x7FFJyXYI3q4ypPRDpNRBLno'
+        '28imRh3SWRFIjgln82DDf0+TrmL6WPMssnOEP6nY0NdqFil6fePYUHz8Ub9ZTZ+GDrH7m8mhT3MW'
+        '81XprVseyHC5QqnOtaVCfKdjTHNmU0Kcro0dy/LFHG3Hb9RR9OqnYErSt8eQAfnwgoEMkvll0KvE'
+        'FIk2BgM5ayKu2IPnRT83AqeOADBK+aJX86WReTAffyVwMOHOOV3W6yX2lmvRWwEQdgf/Nq884Jja'
+        'p52y3I3Y+Ht+7FP0ODm/Kn0jv3AujDPd1s7kuQ7YCDxHfan3V3tHQSvqvDXYJxHrK0Zkt8e6yXEo'
+        'pYwolmrO5hZKGAlQjkJzt8Ol7HESIxAFdhVGA0EcyzCuGMZN50bJcRWP0hmGWA/Xzf9ZK/VX7jGA'
+        'jxIhlDDQ0BPLKtYyZapBeOIUin8D+BiiSS/xiB40tO+euQBqm5oWaVDBcjW9skoft+m/6WacyZvP'
+        'GJe3VSCo2UkYdtxg2W6OZJo8IjtG6rZKAtt6yl23NOJRFgam4GIXuAD4bAUgfyqn5M5udhPe5H5D'
+        'yHF8DdlH9d17jkld6RDDd5g5R5+5xJEGjH5gwShBpUt0ut6S0zC5+9mMnpgocEw+iJ7csSIdWafP'
+        'Jl1KL9oRW6EP+5D6U0S3+FtWrwmA0m6BdRxxg5h+UGzD5lG9tSzBOLDDzPu15DCEdcmnWrO15FAq'
+        'YlzYidwnuF+tFXWWlMlWUP2XlfkLAyOV3OhtvPwciCBZJiFOY83A0DbAqHWORIZbZwPkWbh7WSRp'
+        'zY+0I/3sPOUpdLS/MPouHZ30EQXSLwsNyO6B6oWEf5RErkcJrsyvqhXwBkdbk55RvSFWYIBl48rH'
+        'MFnplBt34BAC/RbtVj2UprrX9AZfS0hQ83Mcxq+mA2QzlqCHgQXfOMkasOVaYFhDXCME7lbL/qhf'
+        'YKG4/dQ0HBgvB2/7MrVkwhWl8D20XbEOgekozDKG5LMhbwUsu6mTsKwl3/SqI3VJVkQZzRQ3Dqfl'
+        'OzNzcU9XR15mRDAiP7ewHq9ETzwBpx+nbTC+BmSLJYsvPnuuiKvuM/xc0DNDVgt0Lfaqt1wfCxlj'
+        'vR3cvpETt6kq83IxmfATYUrvy3g327fHPJ+dNaIYgGsfuEEYhlagg9VftIEy6HqWazji3kGpuCrT'
+        's8e0c4SJFzRv97hhKzxvQHt74wm2bsdwsybj21um9r7Ff8G1ubV8JWocdDIsvo8r9ED0lCwQX38s'
+        '2lvW7LOtievsIHQ5NFVcMcfPEI+H0YyXmj6eSUEx5WCRnu3Z6InBnRTf0h9Sah4Hb5JFgjFTl2qe'
+        'sRR7L6shHJ6z3QbmMUQd+GdkKxhhO2Cxg5SJzjUIjbOC8msZKIL6gUMdGQjMK9Fo/iEsAmRykSuf'
+        'oH5nqNwvEVNZdtjxZvvkRmBxwqRIrtnPm1epFG3P4XsshlkBYPD4yHG5R/lpHk/hXl0Xfd3ZgRnS'
+        'GF7+b3jzqLgU4wOvXdlmkcOMXs5euR6/xkJTYmw8+7xMbvGqWgfx93NUBEDdKluFrMFDDDxpH0K2'
+        'YkK6sVrFI/62XMFYbbpuSJ4D4HtpvauqLTXT1+1MMOAkSlkRC2mf0u3/+xea4+M3T1XC1wJBmXvT'
+        '8idb+qJMAybIpeUirYxa01zhzLhbJxASqS7MTeOw/psxMZPvxGtqUdC4OwfVtgf/yMo9tmdluC4Z'
+        'c7YF/e2iO7pDZ3ULmNdoNpr6REHeoyUCvfq2SAgRe9FjBcCn/VV0N4A32T+ZN3D9zePLBHP+g9yc'
+        '8YMu9AE2yMABtZ+vnAKlaNBSvhxIIrrCXmafu78QFliE1Ktxtu4MZpO/Xn1bqCg3Ag1YnvKFHQ8/'
+        'xaHG7DTs2Wf2sW78xZth8CRCtYzPXvoEXHR1xq08rgR9Ui2+puzLWOVpKCDO7SoVU0TdBeP0GUPa'
+        'D73/Gs2X0Lz+D/tpjpJGPgOcp7Pwl9a1aHFgqcWKX43atE/LPHouFYd24RtzgviwtjgSwR7NvHhG'
+        'jISuO0eSkOb7StgnBuBcb3t9e28G1FYrez71rXcvhhXY2EoNPknZEYCRm7W30KqIDCncXggZtPWz'
+        'VANceTrlXCUhqcxtoCi2CngUKkJChgSNXBcmfJswMiNpk5iXDmoYohP9KfHZ8/Iz93TAh5IwX1Wk'
+        'wcV744LK4xof9VSHDArG5Djwxmk/1zLj5XsoA8z8ucfg3xl2+MVpmTWsSbJEu+YVoYslBosjuodF'
+        'PbRPKHDaMH7AWTUkOMvdH+na3eiT/pJmmlhVOT8WRxeKaO8T5xKY8juFXDFMWkWOVCH5A9dD6jYH'
+        'YzPjzg7XY0ayNtWSdCOhxwnOY7BVBltq2MWOffRVUEcepPh796KpUQ9X1tzl7RINQpiYlfdoH7sF'
+        'sw4Y0a/OobU5yxfIPZIvHLs44MSSK7USXucpIbpdRbwkzMvV/PJ8oGbmEwMC556CMBrMfw7OiQfR'
+        'UalIoY94oyqzne1f3TfTSaogsFWkRFUkY4l7mYuJUg2jTyYA4e7b47aZz7jM8pQ9bx7FhwLECLVL'
+        '61iRU02o3d1tqAsgQp1T+keXwzVmpQM65ZyTKudubJy1JFvSf6pZjG0ttdO5mT4je29tCv02POqJ'
+        'Sp6SOiCfXwq8+vV5BAkZtvcapmh/lgLHoFpBVwHQfjhf4P9ysWZbAqA9tjYCfjtNPShFVpsmBlDF'
+        'GklKdZIVMILuRtuo9ZMvl2CIl8fVnjKBB8WsIn6grD7SywZEK1u4LbAL/ObxtZpHlA5UDwq0nBfR'
+        'Q1ZFadytOfy47ynu2E7OSHxjU2JoBBz0+GIxkcElBh9ywgZGTZg7RB9HeVG0bceS6TVkHy5Th6S5'
+        'yjmYKd2SC/YASvfFmw7U/Zur7ZWC7Yxvf/7ArjYZVEq+hcUKNhhg+sPjaGv2Hro6tLaQPfQQcb0X'
+        'j+OxZKkHtrlTo1dl9B3bUkyuyVky0SQhkcRaBaCLNbuGGbdbGx6D33mAluWFzq9YKocUeCCtH3FY'
+        '6EuBuHe4HeRb+ol5Rip+ScSdU3zxOJ+nhjHvRCYGStbvuIzSGXNeGd7XGl1ayk0g5/ozz3FZfc30'
+        'Oy2GnSeerlCObXF2R575eQTaXXTOB6SWAafmgrd1P2xC+qL1aypBhQQvW6+TqJCgYsMSS+jVXaF3'
+        '6I78g5Mx6N4/4uWybCxWd0791wx4YyaTGzq9aifBHomwNNEGeRMGRgdzgHJIAehbWNwksYch7Prk'
+        '/r10RiAKCFDFzOeWoQQB8aimW8KKZucsFWIV0IlcsJb1RSe4SPqqdK8h6G1zILd6D7s2XPooq4vH'
+        'q6jHcr1alx/5DsbQgvlieGI/SG7oBWGDvtzfaaW/xJfZMBh1h+mj17r5RWPHXSqTu+hzm/LDzahL'
+        '19C5hoCxpSP5179Zkt3kXTnQqzW36qOShLkr7oOMN15iP5qzIs9c15FFKemnvHynumD4ii6vsR/X'
+        'rSWsmVCpXR5GvkgcpZqHxN3c7A67X1c3OnSBv8QpAzOvMinKv1V40IOBBJXQdu6jY0S9PVBm7S4n'
+        'BKGgDI2yYUfTEDTjQLVclsRrfEDxKHR5ZFXgj9i0K2EX2y2+h9q73kZE0gnQxVengO+JkZQQM5UC'
+        'wCPU6MCdapSswAMV2sCRXAuKY2EOM2N4hk4L6C1lvnMCel87D4BgI5Cer5VaccpmD4SvW/DcOEle'
+        'PgL2Po9wtYpJTHHC39j7+1YxE0m3m9s7MN/+CIuCfztsZ14HSPV3JY7UR0hL8RK0RYbcanmxVLjL'
+        '1waUVJDrxPF5KfSw/AmIQgZFJaJdXLXSjlk5pkWua4KnT8ya52mmTPVudRN+1PTO1DaR3/N00Yf6'
+        'qFqpHBvLQCNwm86WgsE5EOyAjmKi7NwCVQGgpIV5SMBqkdNRWrx6eeVM49Gau5WVJnFrfNWLFeyl'
+        '21DJSpcRTJUVp7khTNMJep3TNHma15IFHsFxZ8v7nYnIHKd54iXzjofJhxnEhjxZFcTr322QCcUL'
+        '9LHFp9dtWkG3lucaBVMtJyQ1h9jCAhtVzKYjW6ACy8jqg1Kt0nVIksyd4lzmZWFnd1l3DRIaNEvs'
+        'LqHMWzuG3iRmaYCabrTkkgHFLtsP+ja2lP+IUUMIXJDmC1Pk7v2vyK6j1hlBUhYtp4o7lCZDEs6P'
+        'uGtraI9Mj/7sR8IzZ6XmsKl+okH6At/QUQVAGMkwCcKYVMGPO8fL5lm5oTRAAS2JiBNOjKJ5AqxL'
+        'O2gBayYj6jgSIhFy/oxHuLKeqHKmLb3A0AFA5SpElVFApP90qEAPHQWtOgJyirXySovvjvF8BHGj'
+        'GmdFxV3HASDQpH2366vduB6KPB+EfSFPUDPHKuf/Z8/eOFUtEg9l0DsERYc+LDSlhbp5aBqgqaQp'
+        '9jU7xZ5r2jISyyIQx/meYBPZN9j47u1uUpqa4X/mVaU4sAyXOfD8WcL+5BMnI6fqGmjgWP72aGcH'
+        'tfJlamONaJU3aMs/nSfv0ED0gWvxu15fPhXwF/JItKL7pphl5HEqclzDGCAg0CWnx8s3/vhnNhl3'
+        'rtqMLU3km1wd5pdvrJaIgxa4pL1sPGfX71La2+tg+akSIP+L97XJHWXy0hue0npLJuurqglg1qVu'
+        'SBIjV6t+KAM0Ic0wnQyHvZixCaeeTAbGY5vXL6qdCXU7aYHD7OWMviii3V12rs57k359fDiqAIco'
+        'GLHzRwEwwAwgyrBRLfZxFuOivf/tE/qwJt1yZ5mUzUpPimcJhGghoKDKQaGmJ6x9a6aYpMWFq7Lo'
+        'g+TPNoApD/siQhNzhxxZc+HYgNEeOcMF1lQgj1lkXzvm71Ak0bfz+TVIu9KvfYCb5MinmmjL/j+m'
+        'RTyd+MbpmQ5EbUuhv5C8zr5tUtxUGZOMN1pHOqcbMx3Fn7DgrdHiCPJygce2+tiyNYeGXr7OkF2y'
+        'xNEeM2ZC5b8LN2XP4T6twytrZJR+SNxmTfX4PEAsyDBst4KfW4ZMAWVqadOgNjrCAin1ySbsnP+M'
+        '02D+DKFHsM9smVDIg034XH6UlLAt2eWeP/VLq7T6L/H5/J+Orm2ZOBmdSFocNveGQpU+KFK2HF0o'
+        'WDIgQ3LtgFRberjPfMnremUaVV9H6MOaylIBoLnAgXPNO/eQuZgkF7hbQ72gbXjrGxDzfnzgE/V2'
+        'rFJMCRp/dw953wT0GJKX7FAH3Ce502agAVMEeE83Yj3Gqtk5JshnF7Gfe0FUPcb2Jnl75NKymXJQ'
+        'qqTbcxA4jI77oo5g7R0AZWcAifBJ1Di7+VsczS00TPGRFJywUZ+CA5WaMqfcD7bH0dE//eSuKAnD'
+        'B3dnDMfoYgWtcq0DmSAOvE/X0R453FmB8hWjfecv86SV6gdskmgoaXLaHewHM94sY6I7NDwDm/Rv'
+        'bBONvANmR1duFN54xPBtVtZjoGofPPHDAvZIBUDdKVJCmux2AQhZ6oQaB9PN7c18UnURoQHyCFby'
+        '2WXQbc9CYG/z5QTIV3d/IlZoDTO22XH2MGGRlYl+bm4yBiQd0QnJVZGRecVWqr8sq5RdE8xSuv9V'
+        'FPvZCSvrF9uzWnHSXT4FlB5+vhdtfKDa4GlwrU+IIGYN+H0+ctvBBcJPutrK3MVNvXXeH/ZNFMdW'
+        'R9Og6KlIlHcNUbkfExLunQ6b1SAR3B+S/1uCiAqvWAybwsunp1lLZjEsxHwcMem+9aayYIImvnm7'
+        'iCWsm1KZozt1oln1mzY4ahzO25+Tn5efTIcMGxXge7Tn9IW3qkujwFTGGwBnDCWQttbcDsSigPjB'
+        'zMERgcUhDoyWJ9KvQdGHP1HWX3ZrItiA20ZNrcQougU0lNmUpPEK2HKwOclTJVAlib9CJBiCAYaU'
+        'oDEo7UYRSTkCrbuwWnPjKMAFbPAxZ65ViqFxeXBfm/nln1QOPEgKuP/F2i3h/o0AF0yuipbOg6wh'
+        'ejyOj8pCBAwbuTStg5UtjS2F+O3NKfLsttlAiotxG3Z1goL9RYEyv74RUDeBVfSVNBuUl137zs12'
+        'wQ/Vo/wmmyR44eADBKSD1q4hrZquFkO8YhxsHElUQO/Py/Ofkc77wHdf6o3Q+lydVhdyPlk8W3/U'
+        'sPju10r2TqaXeXNO+wdp+qXHYxbSu9TAbvHHquhEcWug05K+Z2k468zJQL77BLF3glV4uQEZ9lIW'
+        'me6hj2+ryveB9Uuo5Ih4g5PNJC7Q5/Fnf2QbfrZp52ODAV+UJZsKmMu6EVk9HoioIATplIlkWZxV'
+        '2iHwXb/wlXbNlVMt59LYRDu5YlHap9e8tGp81ISp89Bxr7VeN0hXkiJGBXGxx+FCIpAoZtLdSwHs'
+        'DcZm7rtB9KJyas+oWZxhSKKF3vingSOFu2+JBXyYUAHANkzJYbnz7+vQ2aJLN4Mx6oPYpzVLNN6L'
+        'k2+Ld7Y9Pu6+eUzyPdCPvh5HI+KsIssPXMb4SRdsaswHWUlzNvDTATJwfNh2xWQ4KV02d5aaE2ae'
+        '21DgJlLsl/oFlGWAyD5OclqyctHK1zk6FkaZiSAXJXxWKlATwavq9mQyPsgcU9552gwW2AjZFACp'
+        '8O3aKjmsKid/dYe8oGK8nbLRF65fy7oapYlhjTETwOt3+cWJCXP1ZK6zMozGmGsSRs4AGhbdrFTk'
+        'QOCIDYxpAp4fs5lA7VuyL5SzqAAuFPD8NqZIInZYnDNABYDzkiABOFC0zdUTDi5ndGar0PATv1qx'
+        'ej32fIXJVQo1iGT9zYwwUJUJay0+FwZmKvaP0jbzSdPG5bruk5GoD4VTCIsZ5f9aSgx3nfNGwUCN'
+        '4LVu6fzknzeWr8bhp4PsEWFoKS4IbdqIGdwPNOEBIWe5v28WLZrB40kmgBAvV4Qdha3WasV8P2Ai'
+        'r3PX9jHbaJk1v3TKADQWEAC+myc98QruRfRkdMn5tgjKsHXeQFaKCdXOJU0Fbr8udsxW8aOKmlIm'
+        'b/II9iB+nctf5IRWtaIJCkfE/XZawFtb507wJx2D50ooG/gUOCpugISzbo4b3kDjXP9cC10M4MxC'
+        'Ti98io4oO8TtivsqPudOMuWh0oYRcpQvTAuxDYu6SFsimuWNwaIyztexZqGK3onJcdaH8JBMsRmR'
+        'B56k2fEL/WfChI4LpfWzN50iHol8ZJhK6Gt1eatSyG865e5FHg9UvrBJSVKwb0b9+iaUW8RbCVU7'
+        'dHC25dZ/rA5WkavR7awoSp/5hxkKQs/nzf3+KdNgiEULUEGf/PMBqXovtzEpGl+n00a7UkcOHRnz'
+        'P0tgCqc3375iqh8xjXRM/6sTFW1VpyLlOJaNigNVQ408DH23vVOQrdJAElhOjD10TS3hszDdSKQ/'
+        'MKYxXAc5bJmJHnPAjYendyldHa3SZFKPJWEZngR7MjQC4HoAri4982CikSWdVFwO8wp/+BCzdNVN'
+        'HWjPof+AnANms1QGsVmYpQm/uITYcW40grSaP+seWooopmUUVGu0SqSyHoCpO3BGZ4xFzaR31UER'
+        'vwX/t5aHyTEwWcXRi/kbGb+Es6dTMcsNTZZkIUkUUU7vCvJ1mkQzDV7VN6nc3L1wJBB5uA+dB5Ij'
+        'MlBipG4OFH6/cNFrYKvAe0Bs9RzKuj0ow+i8/+fmjMoLKwsNCGlsTgGQPJ9n7P+83aRX6Uc3cO2f'
+        'Sp05hfIOWSJw3nYqhyt0DmEuAnmOngIlyUD/ldENLZ0PcmPIRPb8hveuYSPRv9nChj38gbGM8sLM'
+        'oxoZJAsOKEz0CILUxWLpx5KYUYYB767N/gnTz/sOZo8EEseKUEjSSvUxzB+gmwTizlmBS/DblvOo'
+        'ZmNa2EboG/rmrfvQiy4UmCs+Q8vtpu6CQviMIYh/435Af8NExWs9YlIfCP/wvRWA9BMdUXUJBQAf'
+        'YufCssct+tAluHHTzT2KAyCRWe/9KYRs/3hMXEgBZzv9W9FMpSd2kE2JNwUgVfz/gk0RuOXrZy8m'
+        'aFtigwSmzWUM1uVlSpyWRRCHAHKd2711P4zCBEhrcUTztoEvtrwiKBOp/cjssoZqnLWGGH6pr826'
+        'AESgQ1tPjPD5BagtYsNG2cVLnPnIMbAMFpHZ2PIw6yeE/yE1L6znB5erfpChhuKyb7JCvCJgiYe9'
+        'T9X+6YYn61E5dY1GOPH+6mRvYGxBWdpU7yL9K5IutNhVMpcPDv39g5G+0azmkKs4xMkKJ+E/jF5C'
+        'Ukrk8KV7M1EJkRbt/d/dojkk4h/h1Zdewt2rGwOewBBM+DH9bZodWqHzysqJ1RRQIF4VdFtp8zyf'
+        'Gh/XE0xc0cHnQezRfVSbLlqVKIC4S4phz8oOPF5F3sNnkhl5hTInkIFFK+ofkiH6BhsKABUQ/ww9'
+        '1nxTo9jySYbfu/NjruOEkg8PYmFCVZHDS+gTG3J2L5aSGLLRJxdTEwisR23FnytYehdHZ216ccrG'
+        'x5cjxlJf/urmgZOCbtZ+MYqa49luIHfgoJuuE4HShLRSoDEjjRA8HQloRMyik1Loo713Ex7jihLH'
+        '6bTY0R0l1E+2QyjRPsW39y8T2vjhc+rJVxuqEmqparM7qBOBUw1yuejWYfkPoCHRM1Pg7D8L7vCH'
+        '+DG3BpkljAJqDzlLNUGDG/+uf+3BT7wPBnS03EpfdG6jGvyWDIcu0z0gAQwYvsmndTAUx0L6hys3'
+        '1zh0YdcqyYycKql8tedFJBADUxisdFjnTY9nE1gmUHr3qFPxfpduH9cvMZ6Z8rHkYrsg2KfE4Ppq'
+        'RlPbUGs0vzvJCr/Y5VtwywsiyAeP4rEzPR8EZHfi5md4RUhYyqJPhLRbys7HgkMHHeuV+RJha9hv'
+        'BoJeq0qVoN+VqmSjJDRyiJvaeIPBmhrX1xAxwiTE2RqUap48WCVUFtTF1XDEMhFtv5ZKRkwBoFjB'
+        'nGa52Ol7w1gQzqJCAfNya292an+tTAIh1f1mHWHV9GDraTNwAfoS8LYf1DlKWYvylxgfzDVdCRup'
+        'lNV0LXpDjXIszgswgtttjJOUMmc0q7M/8wqSoyBRRUXdrCSVfkTvQiZC1zwHA3C4S21jxUQCK+iq'
+        '4Y8Tnvv7IjpCUw84Kj2S71F4Rvfu3L+BwXH0j23f0CclnIlytEsoj4g5QOFvTl0SgMhCK0nLeZ1P'
+        'lnxR+aozcadzzp0zFGNu1efoN5YRTQxXOMdCrcZODDvFWFy84G26TnbotHvXf5er+/rbWy4MuvYu'
+        'BUCc2KNEHJ/Wo42im4YSuRJQgIaSKsD7z1VHVcghKUpsPcCD0b5+KeXUV2zKFXEJ8++EUQ7cyxNB'
+        'd05kDmqFZJEA2hbzUYcFiEgsEriujrZ3vFKDYUl0xUW15Cb1p9KQjF5DjaYs8QK3A7LuJqpXpEDd'
+        'eXq8aiuhuFlUrN5rPtz8zDcWcW5Pf0I9XWeh8bi/cShS5P9WQ/AScnKo/xDW4B5CYotfgPHma5rP'
+        'gXc2JO+ZW2TOoiM9K4uzMDGDNkdp0w035NuPYBNPk55g05dtTf66QFkqvLx5p3UViEBRXdyi1N4u'
+        'F/9WsxSQdrFM8QJrBUv3AFB/vqQ9osja3DMOWGQq4ECorLTF3PvZYW+hnEHOgUSgGdJLVXCdz99M'
+        '+ncfdaS8hovnuFRYvfMuMsyDD6khtFUQJg+ZEgF6tUjWCSAiHPcczvDzsQYzw4wpfJhV/QTr46vd'
+        'rE64wKEdAVCyVSGH+37qOyffw//UPBxLODSLkHzwgmJaUZhcYlYO9HVtg3VZoj6CL4VD0Ng0v3ut'
+        'gZ7tBp8bSfsot8kQ2fQPEJSjpXjtiyNChT1gEPpO9pZVmbhysanzeM8oEklulfxLs89DXHuQv68x'
+        'QgxwlRyiY6tS4LG49thBpLH3sD99gZc+gWitFjsO9qOPcSyasHU9lgz/mvEEaMtPJ01vwoWBV3qn'
+        'c1gR8NkHR85tSsH4AyqFp2zc6EbyLIQFCasFMPt/H/aBgH9qLYSMHlMVJkBqrckDHuYLTOmp9Raj'
+        'zqkgJ9moBG1QnFu579/3/pwSKENIf9aAo+OA99ACw2ErbsRPyDpuD0UtpcUCOAUEDahSOaCyj+UM'
+        'OsJeHO7kxYl3YXXBPY8fCfKvkZTrMOpMkKEIBB60sBh5MJ1djgjiM8VujdSg3KHva1/77vYfWflu'
+        'zeKUtga/WL/07gkmSgFg2D38u7y8dVeUNo9jtAjffQfpDnfUvs1XYp8klrtgzs3fQWeTjqIhwzZ8'
+        'wLdCIC9+w3pWy4nkxyQip5ww1sA0wYErhpc3i2lAy/S1CZ8E5FhE5uWXEq2x6XWi+T6HPjRSX+Co'
+        '8D+/qfQ7p6hN1X7z3fvv39nsW9Ek2qP0OJ+sKYGBShVz0CkPiDkaEg+ky2ugoND6OmzukmkV4BGx'
+        'g6FqGfkwbfecBk6NBt/36D1XV6tu4n8GKpkH2nbFi46GkTEP5fLFkWBCoK97NlmUU7I27+VT31wH'
+        'qQh3D4rcGaDqsOwsDkoxh3smBcBqOGmN6RQaVUOev+/xIdc09AyukoogJuyQ9dbYOmywoiRKfU01'
+        'U4ZW04nmIIX7KHAt7xe3iy5Zg8/POr2CphpbMsLLBMwsOxMhIL6SqsAL03j2aafl3InVimqx1jOZ'
+        'Thu+8fCCPePSu7NvuNC23umpEl0Aj1nVLvXcCVz6UlxscT6AIe0wcIlCYUZ+3CR621I6sYYYKsGk'
+        'ZpA4GzjSxHi/hG6yka4dmCVQfG8S3V4kFIjKOC/KKCiov2T3mJHpQ8WbZJl1uAov61DNqezBR5P9'
+        'pNfw9Aijkq0nZzzl1nOsDaPwC4VcgZEUoNI2YXOhwoHPCzUbOXeMRx+1xdefUIYhEa7gdwaiU2gk'
+        'R6qcDFdxGJeur9XL9lOTtQenr0jQLNjAKk18Uj0iPNIOIBo398WuIKkKJXxj4tKTvml/GzMjWE9N'
+        'rd4PdC7ug2JjGRMNz6A3XzsNYJQTJ0xyZCsF6mqta/JeeWn2vHkgJ0N5rH0I9uF9sCEiSc9XE/1w'
+        '4wtYfKQcUjaLkPKKuo9s0mMPgY5y+wEu4RUg+Na2IhTg8MvqppowBA3xsmCdF6soln/SJLkS/xWB'
+        'cs/2pM+XSUHr+t5SEm8PJv11/eob+N4ryGJpJFLAo+Yv4RBgDmatzsE5JH0UhYj/oVb85DhtJiYY'
+        'ZwDfaPrAp0/bKToiFx3yu6hY148IvED4esOXhLZsYtd5Vb5vZMVU1zKQJeRbnEDJFAw02GPL4Mie'
+        'jtyStNccUg3Qi5yfqhEwJioT3eZ6fMTw2deofbw185nqnZ8FZCd7qzLL7bUKRcKaRdkaI1KSn8Dr'
+        'pY/PUwtncoLpG1BiAK5M3Be8FW4FQ2nhJp3SvyCdZqhse4pnnVlwgao45vC8cfdlvGFloLpnVX9O'
+        '4kILUcMJe0n1aiUNzu/YEkB1ECQ6a4Cq6unGrxFfvZALSAFACPY3HsmmW6EmF2vE9b2C1deDBByj'
+        'msLHP51Jr4WMVBfDHokQQryVccK+QczIz/G0YpAGsu0Kzd03Rld5mzyS9Ksu6KNowPpuJUihvgpP'
+        'gwJ0B8J7HzaFGovbDsOt1AhT2gtEds/lvXeChSctUY1asbccl9oFKk4OZWwrNMIuvAp5W8M6zhOu'
+        '0JxLqSsmnU8cxH5vRq/LYA0qA/0PvizvffqPpj37IHr8Lq0R6OmFDXRFoq11Vh5jILDOb7PbU9Gm'
+        'mhhLS3Dh7IuL/ZRmYuxaC7bfVVXrLXoVqtyrLvLUIZnFxwNOIFwXHgWAWvC4vlzT07J5zvJP/38x'
+        'NRU12FLDtFvZHILwgd7tUXgiZSrrk531GBlc98C6PMmIBkwIkhG8dh8rFfuj4Sif+09BsicHZ2Gq'
+        'Nb+VHyStgQYLRFGjQ+bG6XViCcbGqPV1oWVwgbfK2CsULUDZUnlk6P3hQARSPADfBc/Ok6X14RTZ'
+        'qS5WmQmMM1jwx1QSNC5/HJDgX3vCWKkfaIOwG5I+KrP1j4KkzthSi1Bvxi9hlnuuiYr2FXXfNarg'
+        'IW5UBew6lxrGB1l+hW2HEIMf8xCdB8GXBkurA05sRwlCr1v/2r9onXf9SoEHcBQwszD3VutcRvj+'
+        'MHDUt3+WqZqou48S9HAPvmJFS+FUryJWpk2zlKURb4ClMnA+9QCSBmixoCVjlukhvIpqYh6VIkIK'
+        'XTw4xZuKn1tt27dWpbW01cG/L5/Xru2LmXkIAgF2025OQ9XsaRlRkbBXl5iVeTWP1Vs46AYtZ1ws'
+        'UykdKX3joMoMTYysPmBzhN7EgMsgaeTU6kjQRqonN1KMFELYsK1HEHg9LBmh1eMAzJ49AYChPE9b'
+        'phry+lCiyx19MUPk58wlTeA1tsz1uhXUb+Bn/nDJGTi0dWl1pqwAne0WBG9QnfzjQ+PcnlGg/+L6'
+        'EgZv9MdO7KqH6ZpjeVAfzK86oUtMLvOkyB+cFZW9zm+WAETsXje/gqjM64l9HWQKIU0IW3cJKcpv'
+        '4huft5T2v897ypr5pCmDkti7b++6jBVcaU1PismSL9b6y1tQTfTAVpbVjVzvtsvdrNn8pk5UfkTt'
+        '8/+LlWEyzu8StsSplwDh5HvjbGocdDj4Ytdt/EII0Naa57myt1MfSS2nG9/ruq4bjKXurBnAsKcA'
+        'yDD5TQDpOjcpdRP+KTWJGAmFbNJaREWR9tgvcwGDRbAUI9WthovQxUshPGDuIKe6aZgyfRkodxvJ'
+        '9kUBoDQ3dxnbf7P/ofbCjN4KVkGvFYPXRRmymY2b38xVqG6INfJNF6OTOTuWsnPvtQnbkmx9zaIU'
+        'Ex3po6AQZPLSX5xua9SHZWCu1UMVx7p4yjuBwkhF88fNXoQZQhCv2xAFzA0dHXBf6oTFFdRRDTgV'
+        'kyDygZwfbPK/Ub/HOW9rfSq9ry/fUfFmL1uttWaL76cTjqAgSiQiLIz7xZBrMutmLz1qPV2tpOhJ'
+        '4xF0f/4xoduO4bOrvjm3fpO7KwNNG2rqT97YKssWNtKHnbm8OenSW4KfA5IXutBlFGx05a99m4OZ'
+        'MyvNEU6q4ckVBUDdm6O+A2sdswvGaXtJbBzcy3OCKOhxlKgP3KLXQVDWniZ8z44+/DLonCEsjJNc'
+        'eXX1AkBZoToVl81Pinqf+Ulqq65HURg2ND9PcfvtvTfxz4A/wtFkUX27rOJukALs2vN6QbPt8YUV'
+        'Xpjib7MPwMc+x6qQ6ZkQnks+umTZUylgykhLTF/FrRixdpgkeLOHX5exQakf1WSlV+ruM9uA/m+E'
+        '/tYqqyCoN9hMzKNLinPsksccY9rVGCnufB1p6Cgo3VUhc1KOFafbpSXW4gFsZiGvKFCjOZFsCGMd'
+        'WDAHXp1nVaZXGFGVVxLoThSglccL4aghGZkEzqS6yuqR6KovGYudf8UafEE+cl50RJQlqi9u2aRt'
+        'J+yc3USeab807uTTs75JfbTYuQQ8N/0TCBGR5YsjYNXtz4uZpKCvzhpIw4fXIqszr+VbtGcn3yfE'
+        'xSpCQiyaedJJlOrk/YtenpNFu+B2X9C/BZpMbLu75z4+u6NA5X5NtkGOsobr+7L5nyuF5P6qj6j1'
+        'ejUKxaU9S9tdIUfDCNs7vpJ/n5FIDhIQHdNc7o5mXDUJp6aZgenWvYedahC6lSaGnsK5LZTEl3uc'
+        '2ysDdOKJ4w7wzj5CghdZ9ozaHum9uBpRwENWsV8tQo/jC+z7Fjo2Nc+jIbcI3Y/KZU8hqsMCNCpN'
+        'L8VWdNawU1e8XqLTM3HCVedxfdIGfJblWVWvdCIoMiY4suHsZ7nuOIARByOXvA0ZoDTCXG+dCFPk'
+        '5HhQu9fC5Barj09+axLA2qqOGJghQLbzaO9J/WshF6jKPU2DAmR4RQp4L+c5Xop4ShpunCGtHs2a'
+        '1tBhA+U28sO8yIFio3kt7FDUpPjatdiVV5YSGwrCLOZ3HcHd2n8U6BZIno68Uq3yfNUHunvqQvae'
+        'yhFvtszi8W4qvm57ef1dIDanSmw15LkePXH3jJ3nQwFAqaaZtDHycP250blotiZFI5ulD+jVgM8r'
+        'mKEfF0OEMlAqp9/onGaxFjv81Am72rn/IMpuwv/ceRJM3tkpn8CymhxXcMyNVM1s1P9yTnPSDF0X'
+        '0fxyc9hfm9FBele/KB8qNV6E7hMSJwC7XMza6MBpR1d8nvsiFSZg8xwX3M2zKyRyq7LvxjMBllnj'
+        'RHPiBD9U1LC7nmr+6ikR+mj0yYf7azaoqt3Kn5yjxMKUYUUUR9spPOvLa5wJgWhaInbrukb8cqMJ'
+        'i5FCLnsVap5KpK6baQFlGROf6GijbmopK0BO7Et5QYIVwupGwpINBYDgNznNJWcmXeQ7iQFQO3B1'
+        'X7+EbWZf2beJ2PVywt+BbS3D4ygpVbRibI5j9Gjb/NyLMok2fHsm2/QJ9Wi3cEWa7nTWgrdqCGkA'
+        'SIzTRJ2eSdsuqI4WezSL3sdKFt8GO2mIwt3Y6alJXrpGJ47i8+bngOhfS19lo5o6nyiYZoUCIWaM'
+        '3mZmu9LRVAhKW/HB7tisdCBkfdBMcfmEgFAjTf5TQmeE+n7M5QAwGXxYW+ZJ0oLJDss36IjY6i7d'
+        '9Cty12ffwi2hgvq7agOiIPfTSj1Yu43e4E4VxHJOLmNYCJv3lLUdP1DHwSm7IS4UYK8mkQ/KGTmF'
+        'LD1YF6Sw+Hf5PsVzFzBshDtupdL2JT+CLwDMBgqMqgIzKfkygGHrxQZFRVLeISejnOVkZqKzGi+S'
+        'MEacgyD3Ru6kIG2FiLrT+rh1ma9QOIUKcZm9ovqgcP+7aN/IvljncC9Mlbe7XyF5X2DHlLQOGzk5'
+        '6Rvf+da8BycM5RASgoaICDSn1Rjevv+1dC2lQCTjJgYMe5r0kaZTjQ3UaF4QNSNe+vB8bfLlXvTO'
+        'IZz3epWzqqI4AOw/HwlHRShJ+xzo9AW+CeRAbcv7X+SNO+U2c7ugE5s6LJrjSaMgJt6aK6f3l1BA'
+        'H6eHr7bSRTtIZ8VLwRimgZvuNnISeFS21Em6EpqeyFxBx622MWRhgYDW1JweDreYSs28+7LVHhWL'
+        'cR8zMB3+BVJMutb+MNfVH1hsmJ0Nv0jRxtDTz3VRzPDqdPzr2buuMtvDjgYGvmYZgm3jB2a12jDd'
+        'NJYlsBmNCzQXF4NT4MnqM8MU4H2U4Tha/6kL9Q0m+hWYz93OL9sdv9zf8JAP1JmNzOgO+92n7k/q'
+        'UuLl4A2DS5zF1yDLlu9OQCtxNuzx6qctbKJ1ek/DeLOTuyTS9MNobYKSOpoMDCZSPFXi62CFVImq'
+        'QJJo/fjdQQFAJAwM4sdxNfsRu+1B8o+aaec0P3nKqMP2mV1FFyLNnl25tEOpuWywIdRTxDYTxksB'
+        '+KKUTxu+OmGfHzWSTGlP1G+2Fi6+rmazeDSiUOmrBDFfUhYHwv7vJ461Lkdx+mZUnYtGjPPFYuQM'
+        'Mz7GKiUDwopupHHrxaPH9YACm/ZT5S+bOTL/qzAKW8HN+/AH0cM1xVf4LCo6TiHG7CUv4mcklKvu'
+        '0W+KmGF58fGi+jjLJOo+eRxHFVY7+/EKYxW3xzFKaN2KocIPSAjvCHkNYX/OG6FGaTw8XOqvyt6G'
+        'NDQXdD9Qa144PL+UCqpxBQWAXHEiTVZSfmWezVZo51wGZx0mYKeuN88GG+006ifvuK4HX7yYIi8M'
+        '5zBcU44dfK4M3PIeN+KNIfwi+nD6LLm40lk1oZc3YpOSeg8ge/SSj1xhMZWe0vdDzHeflvBrUwCP'
+        'hvyi2fB4igldtZjLCgmOK6xfBgDNTxfBBPTNRT8A4H1CchSOnskTMI0g5ncjqKvZKZjcfyenJQWz'
+        'nOe9sju/l/GxFocyhhYw+baCkDFOmPhPzwPsI8FcFHtyHpA95NbAtoL1hc39OFfQML/QbN7AdVca'
+        'MC906LW1idrEafQsHpEceV02X6gfqi2zDRTAUKAKYVRQ/XEFftCLdIjm1qhxrIFmEyVPtdz4ij/5'
+        'UdhVHoTxM1Jv4a0Gx5AUX1d5PEd+4eBujHB4/bDv7H8paVpZou0nYYVawR7jsYnUJSageGw+juLo'
+        '3lX8MkZ9u3girMUmzu3wxUb+VmFeGGD1gIhIgOBpyUGMOcJfRecs6Saa24EarDPZeaZt/kIAGJBw'
+        'bxDyRrzDo2h3zr9zyyiCP8NPbEf+cnDNRmrE6Ez8TKQdZJnjFbSyi+vEErgC09sMRjOM2/FjbxIE'
+        'U1I8gLcuoK27hcy9vOHQXxfNM6Q81mWccYaqr43L/2yUFlCAxOO6ei720X8GIRZQZKmQfR/FyCbP'
+        '9vEPyFv4W3lxW2rOiq5uihZdkGD7QhVCpgAkeRRrF7ueZqXuwOOFBicq3ONwnGmPsln09OMVl733'
+        'MeZhbbi+ywZRkh9kAajiTYyi5+YsCxphaI1EaNdcrqCoTc/L1cwYRrPgtA9HmhFfTbwFqtUg7UEn'
+        'Tqei3S4th9HYeMyZbxIABMa4aDn/wOxotTiV9QFToq54PCe4hKe6CaXKASYGWbqUAk6l5pLvz8sA'
+        'pWMFL5yh8nCJycqLAo916lWtUFPcSvgy6hFwAdhELCujJyBHoi77vr3G2T8BgK8hz8U/FhH4X6qi'
+        'W/FVvxg9KkaRN1YEwSq2j4rDOrt5CzUYN7I9FiKJDK+mh1rv15Z930PN3CXrpmGKgPJmYyNKdJLg'
+        '+IBqNS5FTc5EGWv9KS6N2PF8rgfil9cBChAsqK1MRuEI1XGkD1VVmo0SygkXy1yEBduT2XT8VIIq'
+        'RZabZ50jJq2/q372OTjT6DPmWRwCW/bprH/be/v3HKOjAaYTEDahZP7BWsjE84TqyQbnxS+WR2d+'
+        'iPZcKgaOqWjfz0LBpDUpBfA8xc2F3Nbo+i0xdXzzvZs8kBetDr1fIXC0hAZEAPv72BOdRmb9BACb'
+        'DREX/VbjBAmq3IcM5k6p6kF73mptuPxPyB81TPTylwoOS5Ur2/akRj0Awp+tFj6mgAGU9fHV2W6o'
+        'ptok2kvrRPW/ANPLFq75Jkka/GWyPC7FMm6fSxr2O1E2PKqIyOwlYGn5zI2KyKnkMkaEHf1/c8Zh'
+        'qvTQAJmOmko0SkwvN32pJvjpxFy+fm2naEBUb+e6KEcVBFswjUusOfI46ysI6SMynYmOQmfFVoOV'
+        'z2+ShaZ1SpaKanx05E1m706PcXFXausjfiKUfLVjYXPp7KCzG5pAqmUxN+QPXQtxETMsINVZ1+0F'
+        '+ZtYBSKb7RMIIxvsYJxWUjhHesxxKE3GLUEPiWj89OZy/4eQWhDmC4KtWT3cgq4GVoXB/aHPK8RU'
+        '/syyYIZxLumtMKMvA7yD2CTVMX6f13fCDlrH1ebgzqiw9k1TnjesqzohrBObrg0QMQuwneq/T9/S'
+        '2vQRFeFaepCwqbvqqEHmDyY9JxV//q3lNKfQbLJ1+34Qw24U0hfZEDGUThiF37tNu/ygnmZvRQTZ'
+        'mZh1nP4t8YiEo76hDT9ELAYVs3xqZEj65ti8uhBtgP1ALI42iWk2JgBYxEtk1REB8p9HbTxERJV4'
+        '28C4415eqK16vB3iWUX2iZZP8O3ayZ5hjliWChCV6DFJZoP/9PvFQC2jvjFtfew2Gz0JYcuLk7jZ'
+        'u7fOhaVtA0aC7EPOVy/sBjCy8UTR33yjVz58rBLpe9gGJ/XRpJh8MVYKXNN/y+nqeHpOxy7/82Xh'
+        'H9ciBYKAnVB/EmCAExoYIGZLu8aQiidOp2qSW6+QILuPC+ACIOiU2johk4mMhdmv3w8fA4Yz4cAN'
+        '80dy4KcIBC1gZcdmhDrS+qKstZMtfcna9BBMVdVkvybAeNcujM3MIOgkTpHac62suueXGANeB5rb'
+        'ESlUlOv6VDiCJQ1pkWqKi+uO33Ao4vsIgvLaPQHwE26FTpWSkb3OO71DYyXl1On6EgTG/1ZD6Sxc'
+        'bHmzOAm1r5fvaVsRmHObjV1KVBE9H7FWf2DdRLkO/plgFuIZf4H9xOOkxI3QUoXxh7YhyrXUNgrX'
+        'TLQIlW2GKZC/JDmvnUhCrIz5Oc9IoiA5YcWixRYGODq7N86uKeSZXYQFxTn1qpJi/8LpS0wdYlw2'
+        'fSSCSQz18RrR8S7Cug+cVnFw+L8OpEpbcHbl7TQB5PUlTVFlXxgiNWEd60lvEGAX3ZNrlDtTnxF6'
+        'TTBPq6AeQhk5JndBNOa7w7I//quTsb6fobobDrsw4o6lhU8wR3D1BOD/P6HuiGQCUK2oUlIy/AlX'
+        'z8NXubh2GFtx2sfrqbEUFL+5dcIONqi0vcvln6CTTy13KS81O5MkXYec5iLklqF1K0yeWotTChlZ'
+        '+QXAJCbNHdHPotWBxh5v+fj7tC1OyEEVy7GFD988dAxhM5XlEYoMeqX/TPkfy+ac1B4WgT/WQDoX'
+        'nxuJF0VSbW8LVdDFAzZaVzpk8rkQgsxAdLVWZxZHwSubR1LCa5RdGmoJVLC7+SgGhpZYHfztwR0o'
+        '4HYaWEwj8SLzT+ha8mAp5kDMPeMNnFOHKMT9eqPuJBVrr91M/d8OKtQuzlNehYdW2M0TsALtpPa9'
+        '6kIyTkbVa50PvO7sFMb+5dXB2aQwSRbIDdHru+zACrTlB+OKIvpizHv8zuGyuTdX/HZiw3sHQYDY'
+        'HhdQdlrPffUsK5SSrJSgcqQBSUOTDphIAchUpq9QXQfD3Fz0EKkNS/YPhDUaLbOxxRumuys2bVDo'
+        '4HbwiMqHc6mGZrSrOFk5f+lKysCql31J0GiqSZAuEvIgSC0bIJPNmnTAHYwFpW+NIhbMbO9UZIws'
+        'NWfVhkN2RTOB6ImVtSXcWvF8CimBZ/nIYpadPbjbIYdrxTJBFWY7TvAJVmrk9RjiYaEZGJpCWAOs'
+        'NULTF08g2fxj1uP5jLiNa5cib71VkKq0LhIZdiEOXVdduo0UMLCA0JJ/xaQLMUlXb5bnXqJlv4q4'
+        'vvJeob86kppYwZo4Gbmwm4XQcvvPaqCiBVWJ8GMGOQj2HOSLZGBh71YpZ4QpOyNyQ5Uxx9OCmQNX'
+        'FbsYmfGwKAkn5Y9PmvjvXdW6tQYuiglBJmkBpLlYK/NYyi4aKR82VbMRj21nVkYQ8ERzwM4ss2AJ'
+        'R/9vnqAPGfbrES7r3Ask0KxjSA0r6OvYmpgTDFwCtw4nrbZZ/RdAprnmsiKeNPQHPh1EZboPIECH'
+        'KP/4oSV0rYazPtYsX2jhOwFgv321KyjO1iPgmBMWVpgbtjbmXw+P5zq5htpJqpAlLE3KtFBbFg52'
+        'Jv59uUWjWRwVTy1oyNd0CC2TzTymmXNk2sEHCPEoSOS1Fh6mX7Hhuy+PQb4fanJWNRsE328vn0sY'
+        'Su8YWBEfft5OItUIFJqdZrM+7ewXQmOYdoHsPUQ778S/+bkm3ZAwMSgh6/KSQT19LseTaqxpt9t+'
+        '9hAWCyAyAswrLqVmrONfV9cZotuBcg/Lg9lhbYqEH6m4sHkMh/gcY3QkFElsheHImuAP6XrXkut9'
+        'mp/W50FsVjb/h9us/wIH0CMkFJmrcdhWd1yP7QTA2wGQnKxKECt2QevVLyLd95F6tIF4dzJg5WZO'
+        'wh2cx4pEl1QMMdRxHQ+JS0mv2bYB7tzfyl1L2rNO1yjJNtfts8vT03loeYJDex/VuQ26YNnzKx3+'
+        '7Sb5P1OIczaMfBv7Oq/M5aXbPZ/RtldsPEq2uw/9DF4Lxq3fnm1dy5KrgJ2+BThqowlTX6K5T7Z0'
+        'Su56U4Q9z/dBLVr+O9w83wT7NBegdGKUPAoiYCMnMk4gPw2P+6yWz9J8Tv/leyQGyUJnxzIsESNe'
+        'NCtxYZmlXFb+kuJ4KZgLDF4BQOaIaYG5u8insA8/vR2BvdGLeI9prhOw9zUu3d61w15EQvgzVGml'
+        'BkiuDhnnIdRLqsxXqYXU8f96YoAaWvuxyXFkHzXa7Uohwbku6ZcliYmQw9ziwJ+VIPihGRVeElvt'
+        'N2sFESl7Re/X4tYj+b94GmrNZiEOPTY6E/dVclRBFoeU/fw1pvSoCKdN4OAjSFY0x1Dvy8pJyYI9'
+        '04VbR1Cq6fR4dt6oZbLKZios4KCTsRZhIgxFv1hnohLD4ydIQVRqtnloE2uRDdMWq0HHN5hh0/Wm'
+        'a4zGsyWz/buGgxR6KdMlV6A+9iLsI/sTQE4unyXbgxYyYAWDIEUhMb9wiHuJQX5U1mdrmk6gsYbm'
+        'ePrTTQxSl1Xnjto75oVa2FEfJey7J2D8Mq1FK1aLMNHBx4gQQkUaRTMFbcOvHOHIWG/h6SIj7te0'
+        '8VvB6mRPwkro49l+5nd9TVr5TLEUfrx5BxwcKxFBpz9Mgw4BdqbfmcLqv+xC/kdmmQQJiILNbEsk'
+        'XUb2HSIW2N1AVOAeL/XpJDOo4IJfl5ZRymdM870KmyL/MB/Hlg3KMWcBCYkFup3G6U7jx4duKzOX'
+        '4A0mu1RisrigtXIWCRkgalIc13+a1nCfaBn+TLLRhSyQmkBKbVf4Ing8NhDbOIWbsL19kRIEwa6k'
+        'ZRJPtsgU7TkBINPefx73Xqn4mGpEmXrv/y4Cj76ZC9xU4XK32Kl5SXNnRzvgCz8YaThGLQ5XpCkZ'
+        'frO+DjwJYrVEZThuIZJ/S8pxJzBJl+q1PmPf3RYl1jH1rd0qApxpyKQDXDEHYOb/EjJUf8RyndHv'
+        'f+6rDfG0AZWJ5HZ93eyus+DfkGkoWkSsZSiZXn9VVevo5Ij8PiwmMegOzwS27HIIFyk01lSDwZEV'
+        'Re1P2GbEZPC49wIutzkXhy+ac3Pn8ytZXarPxOistLvbzS2dn7AKwrN0FfOEAfJ7yHczPBvJHPXS'
+        'vih+3JvGMMxMU2oFtOam9qWdOMPlBEBM07jYhjyNeqID6/V7DwE/z7tmhSNThoocXtIBdNO7fHDT'
+        '4HaBIF4J5TNXomUqJPixkKjYSnSWqwya5uMSqHOXgBoTVfQT3H8plPwV7+GrrwJN4hFvBL1VJ54g'
+        'LjoirjTMODrM0su2BMss3+RzTAuHla9Qj/HNAQ/blVUstRMJM4q4WoTXIlsf8t6K+fnqdTuFiAKN'
+        '4hblyNCxDL58GjWQccLJdaRjnLKzoG7TvdnZjmQR/opOP/y8qZN2hyCOOSuN0vCBZXKgzeam5nEV'
+        '2684l1jFtBKBe25tatSfXbTmVuWvBsxsxEMeiCBx+ZZNjxPgVGgOCSShF/ZEYpzBaPAbhRqMRu2Y'
+        'L//8cfnXOSbZheVNmHvyPQDS1IpoweiVJCh1wNyt8sglVJoyK7rT3D6jfyehIUe7PAgQrMS/TAhP'
+        'K/DJwcsJ2Pb9CBJFgtFTRhYbxAiQBi/ihyrPCWLJ9B+t8Kjsu6+5RBIhF6dSrMv3irL78yd0Q9Lo'
+        'doHysO9n7gdRU0rce4Ki2xju6HF1bfa9z0CCjOyIDyv35qo2jfQ6uCr1nc1z3JpBfKckjGI818fg'
+        'Df3irF8hVq3SxumVSqImNtd/ae5Yz9Br93+Enw1o6NebhXns4XDP7YchSm+VTR5OQCEi+sr2AyVG'
+        '2V1Tk+d+HZaur2Nya5f5iUr5nYRyy8W+EVczQdsX+T17c9Io2L6ePLy+uEHCZgt26jt412/ffwKy'
+        'JaHM6CZOBPfFN///b8AuUiufrgHxmQ7BAhIPkfkXFY+1f5170N9ozUL/tH0YFlBZfd5tKCXKD0xA'
+        'cLQUw/io5tK4WAzBcoYsgIKAEGsGpkUEYLFagGnZD9plVHw9TZBhxb90p6QEVokE2cdAznsqoccx'
+        'lte3qi9Xh5ogtLJWEBxWruO1g2KnozRgCTw0YcHdcraQAToLNfGN/yrInoCFXNSPYvGwT4T5bUOz'
+        'juT9NwHA/gagmiorrw7GGdVpk6POe2EUjT2lg2OUCHH8LOTh/4qmT59Q36jzZvphg8t9j+FTD+HD'
+        'IEES+yk9nDo3tcDW087E95ue5+vD/XmR9hOmkQm1fXcM0Ob3KHYU0Oy/flrRD4K1yiJf7uHs+A+P'
+        'XCV/iuaTq5/Nz0/J07nxW2DnJoCKtfc7RIOlRXNxGCd6OOhLVoepoMQNGjeu8WYa3VcncLT94L8/'
+        'BTv/D79YsZvO/yA7oYWOU+oH/9w3vDB5DAStuRZ3w01bKy+PSfxEYBN3v6q+nDA4/QbDb3+d3B3q'
+        'nzKeykXeWfnbiYgPJ6c+jwveBIDbbfj06bEbnSMNfFlZMEw5WSF7pQC/k+H608jFvS48pV9tS0hv'
+        'YzDadYqL43381SbOUtqcPUB9DEOFJ1HvO93mdU/T2vlhIGWvonYrjcaA7RmzmOQZIoGRh3ewa55g'
+        'rDpVaLWuAh+LErKzOKvkaWEZQvdyGsogmtdNHb+ZA7rR/yWoLcRzWdqc8PXLS7Kl7Jdcphm/NBx+'
+        '2iakYfqqbqP44SYR6XfBTyQWx8xwEjIOs+LGwxWpAaBPoFeUxtkiH6uesL0tQ1+sg16AAvTIsyzd'
+        'bv3ZLi8vpPVXsWM4Laol88jrCjB8vLtD8VBumOI8g3ATcB3pxPrS1uicS5s9QlgGoBXUst++EDXG'
+        'gaoP1x66+3LU74HdWJosagdeptTtuQE03dfiOyOiTCBX4qyP7XMmVcBeiJhXumXN3C4T6qmwklL6'
+        'pRLRginSuhyhot2TIMdMtMXX8BIdjNSvsbjymA0fUeRlrmu6XbaKsdJliFCiayF8/B1cLNXGTC9Q'
+        '4hShs2ks0hxHGCPytvhvy7MVqmYN6ZPd3Ja90Dw4VbanLaaJvlnl0++Dg7KyF9WBKYoCa0VFPcV+'
+        'Ex/TLkvBFEkQL3oXiTckPgkEvsIF36BrPldEP93wn0H5wZVMw/Pg+sDKBBB1o00ghzuWiPGqDt1W'
+        'j0JZXYHDQ2/U7arh+Le9cqPB/3KoNmDJdbHro7fnkExZ+1AiPXnQgjNXXl27da12zU3bmgywUjxO'
+        'hM7/XioRiM3AnmBw+wePXAnbNJsP7P+TAKr1KTO3B5odovyvEKo96VEbiWbwx6OEsgw/OKFp60+f'
+        '72Xfch+0L2ubmWtkZU6nY8Cjf0zNfH2dIzsNIv9Xd5MEUyYoEaMbQXnrAyBllaPSSG2FmUT8LbJd'
+        'm6wzGmrUmrcU5kpIyGY+LZdlcJu5Rmwt7OPOhsTeX2cHMGfQLGNSX96TNrwbunA3n4Njz+wZfcye'
+        '28QTNgEg7qPrQI/TgvvsGSbMoEbfbGSdbVci8J+Pr0ef1APe21WrHjGf8Uyl3Ljgvwe1IXNpV4Kv'
+        'KKeEpZt4EOU/AY+naYHrf1NPNr/vmQ3W5HY+tVOsZg+dNwRvN07Oh7P38ovCgRVzqDdMtTdkoOID'
+        'IkPOLxW1rHR5CXxapBHnjYpAhwF5FqzEa+mjutcZ3pCaMYMq4Q/8W8PDKZtBkQypm8apR3XfIeGq'
+        '+bmmavN5tvxkonlHYX9x5f93p2IZTscQhIGsthnVwnxYnrbu1uVQTIOuKy0rkLcV5xzM/Ean1IeQ'
+        'urjGgrLuLojzjVPoD6htXRVo1gRA2MTjOGA6BCBV/ElhXoF2d/paEvq9EqJDU6cbVVQkUhbEJW5R'
+        'WiNaJPUqShvEZ3gYDYsfUGeiGaBX0QMSS/qX0PL+KA0xrGcyMVvNRAyPd8OZoFxNG1sKNlwqrfLg'
+        'rXgIm0k7iY6Dwc0IY7HrtipG9AZdhmy/I1DwXZ8SsOYmtfGLJxiAHA1f6DyEh754S12JtpUq8//d'
+        'QQwjjgFQ4kTYcPc9Gt3P/xMQ6wSzaiHkLsFzVRstDejth/aOV6zrQUluU29PQXra6NQpFvSrjgob'
+        'rO0d22rjsN/u7DWILng1NQK7dHkuYB8+OIHKUNrmolYJUhMgaiPeZmuSCRsRXzCTqni6vPEbFvpB'
+        'VHzc0xFaGEDDKeUUbnJKDUTL8BWJUgCKz2raqQ86xSv+6GeiFjoUSQLUOhqaw4oYChK4j65urWMx'
+        '+ar+SG4Fvq52iY0aBZbA1PVeNZTzIHAZLYWrsY/4htdUyYREbes/Dld7FdBrOCLQWujF32n7I68I'
+        'K/Fc2rAPAltkBBLkuOa2RLhugyQfpdmnKqCd+3x/1pQO3ztF50kHZK4/Gr3kOoab0lE3O3QDJGCT'
+        'eK31ewTQQBYzrpAe+wJVdJeEiyUsx1ceujzILAfVIZD6qfLvzOXbqxFeJCfM1DLdKU3A/mqIjRp6'
+        'f1RoyJOYEPdwSakRrL/Xk69+x2xsR9fuuyEivYwoljSaGDnn2PCerS+4H0AOKJ8gUTWuljEH+DQw'
+        'IKHEc/psWsxBu5bqDYdmpVil8KvfZn56fZm+Oh3oGpv0gofjSH2q9utoqQjuoP+LWDZ4epmV9XMq'
+        'FxAZmjnT5G2xI36/hIyW5tlwIoJqJBZE56XQx5RxJCBZ52lfYWiB0YKksHbUkcyylL7Al5zh6xtk'
+        'z1m2JjF037lmQ2C8b091JvgWilCwHI7GNYxtAj6OHOV4mIHerZDVItd1qS6dsL2nHrBtbEv+LbQA'
+        'wf9/WjKjLjQBQFbcv66Fv23WvPfNa3ZBxUioVY0KBeJG9Tk/PH5gArwAma9MYQbSfgazV9EUUVGX'
+        'iVZnaWGNfIzXS0GaGbpRu/5FEIpohkHpFYOvBHPHJhw/keQgF9HTNN5I7l/N+vGzXVBQLQBZLTt5'
+        'rTiH1+YHjqjb2UM7yd8FtQvBHs0cJ+HavXr8q39Q4Lt9jA80seBKelrBfIqvNA/OhMHe5cHar9U3'
+        'if+PB5KTEj6+Va0u3fG2sbOXWd1LsdfZzA9SIASl46z5PL/JwqcIMipl7+o6eMVn5MAVj6Gqfuku'
+        'OX76/jGK6XlTTnrFHzwDmhXciKhcgdjOBIDiG16fDixCL623LKu4/1zEtqPtdW1z5UTJknKI3GP7'
+        'sg6kQR48UbdrWGCDxv11THdoiI2RgzFAAiVlx8qWj/B3/HgDGA23rBA+OmS/Oc95aqPoLGrnkGQk'
+        'LJhY35CwfZXZWztlPG2KEnYp4OFGEnHAeNmUsb+oIhVvOXhY0jSV5JuDH49+YGCw9msa5yvTMe+v'
+        'kgakYJ/iIYIBSuYxdvlPDGlJ2QjSfQCptVYstJq8++MEjTlZEr21qLuZUJM+i6J9+blRJ02rzT2C'
+        'ZxTjMaiE949qtXkznNPQSbaDvhYjTL/DwDBeqAjChfSredTFH7/eMxNgwl+rTZ6NNaIln9njwzs7'
+        'qUWlT1JfFtkXqiGkZUAm7+ZybnMI+147lZ9vn7kGuBNs2a5MnjfrWlJHj9TbKYITrZKs1Wr3V4z0'
+        'LKpZ7vqd6UYcurws55PchM8tRIKmphP8vRKtHRX8K02qWvS0Klq9agxxROy4G4/+HfinnDuA/J6u'
+        'G8QlPhfSsFeZXmS9rUsUltypUGSSbqMr8DCWG2bZfazmEGpYE7i7XASG7/Eex7bfdfkorHlV4pZJ'
+        'Oj1JwyJ74eIpgIL9GjrnWs9M1G/kBkKsHlYsdj/pfuuUaGxDD4kvfpHY1RCv2YxCe8B639dugbFM'
+        'QLEbt+eCZ6ijpf8ErxadhM4EAlbBY5WfNJDRbxILfy0gBSbxbmkAvCvHGKZpkmS7djJH3cMpADoC'
+        '81uQabrCpVRKmIgCYgskCseJi/V6pdUkXPwRj1PBKZ03LRqH7iURlP6wxfmFcY+SaiPpEgD8doCy'
+        'PlCnMwXY/InanopcsLT9Nz4CCw5POWDll/AIWpoWbIxe4Ouk/0ZMlCSu1tSRzph6T1/pDG++asLl'
+        'O7+XEhYrvWx3DtZsSTs27Do77z/XpMjp0bzviZn8u6pWVQw5S3FCtyqfB+A8K87nl5hENM1bE/SW'
+        'n1CAr9V79Ny0cl81bG1OMgFA2oLgw/slh/YZk9MGt+d2+XhWe10G2Hwr9TYFVMPcuXgUnknbaMUv'
+        'eTZ3OzRiYUkSAKeLnIZ2MxFfZdAWwp4RAR94BMRMvSv3Dd1JKIFGzorcuHrRDOe3nJo7D6/8Hfds'
+        'W35/NDWl8mY3bJ3U2KfZMNAShpbIgKip10BaSjPJkQqadOBs1TC3mP/7p5s/BPVKB8hOBTCjAi1o'
+        '0G5MxFzx7K0bsQXUclOqazE/qpZ7U1Tu0L1TVFjkaCTDR151sZFvWcSh/xuzSRfpS3mOsjCEWTHj'
+        'bqrTL+fayXTRycmbT+zW9yZBVp4tn9S/rzna0cv2ilzHBIDYHnhs+P8oxRZ+n1Xr0znaGPH8HmTQ'
+        'uQhuQfCegZyGFTg10WtTETWrzvxNDQdJCELBhhIFoRCJymI7fKpuwr9WFM2h12k8lHAuNgOPccmr'
+        'yhz/meJoIZ2u+DBp3e746BkELL5yZKrRfM4TjLz5FoJmX2ZhJ1K8W3VuHUPlNdRq/1J0eVzy8HtV'
+        'gEn18RYpE31eXKg2ja9oeUNg3puIuGlv0+vZJ4LVOUYWHo0LDwjGJkOJylD+SkWzHJwXXk2xhQ4c'
+        'N7OGwXUifHrdo7gCaSPzbeby7UcgqtwqVUxrlMvYCkOP7Gqp9ZP6X/YKusUE/ZVWAhYTwPBzZX0T'
+        'MDAMJflt/xE37sZjXoTm5bS9H0o97/5/0km0V8A6B5DPweMNQ+p13QznGpnsAI06hAkQboJr8NQe'
+        'kyTrPOops6fvdJwlJIELz2yaknEA+iT9m4bNEM0Q2Cyo+gTvAlHqFssWUhwJ/xFIOKIcdbyNVOdu'
+        'BW6AQ3oWtCvh5ANVOF18fB502zzfjGmQSVp9aZY2v1BUXu/xXf5DfEvkSh3z/KLAPH3IDTrOMQJY'
+        'kEre8qh2xYw3WUOTU/Tcp+THPdpJuagIgWSM5OAwI6JTCp2vY+OWXL7WIS9ObBwXlYA2TDesnJzc'
+        'DN7Tw1FsRUpdOkyAlPsDlCFHjx4csQZtZhxIrfLWMpIOtyL3t5O9z7EU1tBtFWW+MDRT40oL5wg7'
+        'wbbD/SacXeouFRXyQxAMEzC8C3XwAxF7z5zcwOfhT6YVW5eqheQAPnWDi/jfGIwuglFkkIVA6qlf'
+        'MjujVLxzxjMgVBKNLlZOHGif8ABUDau2L3gCfL+8atJik3kUz4FTras3FC0WwsOIzrj7GQMLf8Ry'
+        'LC1gPuGdTdPEE/B8doJUjjwUZQzanfX4MYH0wugzbUzcH5tnWRxUDrRsV6lgRYoeifY2tVE0qgO6'
+        'clqqsj3wO+X5I/0r0G01J1Wn9JcUvAsAtxFzMAGAtzVGJXg2Hbh8P/3hZVL8Vsxj8wxyXc3i07JQ'
+        'fXXyn3BIH/r5JW31fb6LSAwwXNj0Tek6F0BsmrqkJs4V8oHsmSKbwD0BZXVsylfj0OXbT/ytLq6s'
+        '6dh/vfFd3N7HmYP1hPnr/EeES8rDOohe8w9/uSvCeJzHWfsrtj7ewMsrK3scCJv5JyOJo8n3Cs03'
+        'wgqo81YGP3ShmnjDwVMnMKQOOlSGX14Wk6rm47C8QjzBmybTDwYCS7FW/F28OmhZ5whX3KFcIhQY'
+        'FwoJO87j4bNisnAkwSVeyNaJTNSmrWe86toMBE3ve7Pes8D06QQANVduNuvzvwQAi7fE7ox8+nbG'
+        'rhHj22C1PeZCutaL3NOBwvnakpnuDU2NWdtwztZ6C101bqEzWTgxl265BU8r4tw6zbGvawyv9+fZ'
+        'zb3um9RYz++RWtN/nYfSWZZZp3vbG2SMq1WcJSZT1nAxdy2fucNc2OmbJNGJww+NGKzNCIQfLl5v'
+        'YymAWW1vZ4GS6gD+zbfAd6jQvYib8lCVFvEqqmw6Xpchwo8OWsPaaN1CBx7DA8tbUq9tKzwSHDSA'
+        'X9Q9KwyaOH87Rodoi7eYq605sQ0TDGoEee5SX6sRu5xjYt8CsBKy4I8CLWXnwfJ7elzb3Lq4/T0k'
+        'Xj9dewJz+BIQGL7zQ/8CW6CXG8YW6rRt9YM1MbxV8Jao8nJG8le16UiiVHQ5L0KPdL7o35gK/c77'
+        'f6P1SQEuQ5RK12ykHxLJXutJKvmXaNl0Vh8vyLAT5oWuRCEAIAYqzK4ffOBPGSCNiW706M9tt00s'
+        'MZ3LFAwqo2SzNptaqSlHmhZ2h4xlk99n9uhBNdXR6RfesPsklwAHCyuuefVZvolPp+/+a+YRhBVV'
+        'RLPvejlZaY2MjHZSabMEzYW/hwpqw7W1RrFPogfj35YG0ytQI5V7GJmgrP8zfP0Dp7dpJ7sTgiaF'
+        'tOAOzbr9l/qMlGjVSUlBAmXFYJYpG2BsxEvgwyGY7ClM8dpVauM/NXSWMpBD9StvwZE9gZZBgUY3'
+        '8Y3fpyzLiOUJPUXqqwJibgjwnJiLbqv/QwFgAWoTKoNKDg8ywyjImgr3qK6iM5UKvKmsqtAamk4a'
+        'LVB/pWGd4X1PRC61vP+7npiMC3OPvidt3tlk6JRPFXvaK4ChxZy3l4GjQ3NYPMXIFiB6F0PPy+/5'
+        'rXLC5vRTsCdeNVOC3h7Yp+m5bfMrQ7o2QG2v4Woq5xlPfHw47me8yrft+RysUwAP5ehOzq/9vBxB'
+        'DtJ1d8U1/bRzjyFpAMvafQteepLlkhuJuU99upoSkBdS0U2FzdLWLZN+nC4B4KnmvmUup2tYu5hj'
+        'sUw8hvwOBEn73FJMA5hp87U//nDAVkSNg7Cjb4ETLWw1f9+O3IWlucCu7bSBTiH0n6qef1gyFT4p'
+        '9FBtBalEVycpr1obSwNFxvnUPi9yPxWrZn7tsmEiKXm7LsVoYPKWhqEj3BFjDZxf2DrOxDtgCOkU'
+        'bqGgGLccfkXymzwLrVoZRmpdt0vkAMg95jzIXalofE/RQSMa+nkpGvXXJ0tdGcD73q/EeiOrwWy7'
+        '1j6xRpOQtBuDg7pOc/LYG4UDaWvwryO+b9XRB1FcGryxlyeuNRuya4V7H5MQ94Zasib59TBVq+oE'
+        'n9puXJ64BMArjUStSgj3fWdeojMLAZjf9bfOZD/00wl/wC/Nl+FKnUTwD5cl/HEw5VbmWjIvTnam'
+        'R2PASAT7xZCyjWtPSADEMNpvDSxhHzd8R0pcZjl0CtagoIFMfInRKeyLZF9J6ViCqkeq1+S+tUgO'
+        'NR8Sfdnm4or0vhKmoAOhOvZJvkd0AuzxcrFG8K/b0/d9ZG0RdFufrDNHPtvuCwzdXvD1VG8VpHy0'
+        'yoTwQEKZwwI1/rQgof2OHyR+MNcH/QS44WWjNy9KYeppuB9RQ+0CCOXhECCYWLnlJx4EageAo4bI'
+        'zcVXjPLkhvUXurJqsGTh7oSpQDk2Ya0v2xJg2Fg4BEaCw2p7rTMEAP6Rfh5/ojdHa1z0xuyzA4vh'
+        'WgsSmQYZJ3IXfOAvMie4VhbJXxMzsJQ0OQTNqGIC7ZJaa5FZnqFt6xLZQRQTFCJz2VGwRK5xvw3s'
+        'M9JEPgVHZHJvAilACXY14LCaX/dj7ThVgbhPMDIyb7EDpbKFmY1D76BT7mkCDgUmmidqlKtQzQ54'
+        'fKAy8e2+VUi2tnRPRRqWC/KI6eu46IRgElHejyUBfm9OMDr8IsBTxPinnC1FAMTnBwMAXTU2OePh'
+        'W/asBFnTQ/F8y/jUsFXK2IZ/20afF/zRfEcjuYpRsMNxQ+UjqEdEu6dfqk9LQDwv5lTvRbRDAzWO'
+        'SrPiIp+11bEpjejHj7m8tn0iMplvcsUgYSlfUzD2q3vJzYdI07dQeTq1s4Qpnnl0scixQb8v8m55'
+        'w0LOzdkoLokmzrL8rRUspYtYgWJUESOOwlcmMC5wlUYdoNCXrBiddh/aguYigCH19pm458XAysjM'
+        'mzZR8eniOBxKGrE28/hxvR+axvZjqy5IwFeQG2zJ5X/wVFYgmyRMeYR4pv1wZZUmQEy99ZsMoMDK'
+        'DaVfby+atzWPmQ0wZNBNx00RZWLCD7keX2OCUeRkqTm0R7SalfdukHkGLgvcNR1S7EyRLG6KeSFL'
+        'VlAC0qLKLAHACGkjVZINvsx5U6iH3XItupORb0CU5jAU4+Kzl2/3Zyd+hjlovoLrWp+TGiCNmpTK'
+        'a1fJBo3ZgQ/BSCOFbtShGeKPkecTL24MCbI7bNUO7pSWVkTlbkWBx1ojj6g0oV1MAA2//yj8cRNs'
+        '5zZ2xOCK9tzb1gX1orNqs70nx/ESijfnp5i3q33yn2uRdgwsLAmcAJkRhtqYit9RsXsURLVRlKXk'
+        'Sq0AIcWA3nehyD7GryBlvaPx3WdX+nx0ve66oqSZt3ydc+4EWRMaZpNr7qojvge7Jq6VLMqQ+Ltx'
+        'ahKEDHAyfSUndNHBlk6qHzIXWuhOUtE0mluxBICL4pVLTBu7wItdKOTKJxeqIEP3iooi5axWC4q1'
+        'LtmtOBv4AtNDDWyLdT1PbyBjstA/x5liYcAqPf/rEQJhyDGSF/4/O4zbH5c2XNcOHRfXueCOkGWb'
+        'sAm1CaWLCp6OjplZ8ylYxrfFmQnPddCbulUmY0WIuaPobm3aOlenz9a7c0g1nygX6K/pSSWLt5K2'
+        'oiRnW87nG2eoD+NkjIQe5DMBp7dNkt6kCzWEbhWnKaykZ9EDzcJkjG+tlxyq0/05MthPsnLfenvH'
+        'BbWoIZj53tyOgKNvBJH583H87eHRDPPy+VlnNoLyunsCaNkIUf1PrN/nkNdGN74S4KDAcMXyfvOe'
+        '1v7sALFUq4rwRCQF8XOf4Le/zcnZir5c3dvLYI5ND8vNw93z0jLnu7itJdgqTYISVw/ctg4AzgMu'
+        'xZxAd5v5639j5pVKm9zV4hn24kt+CGesE7yZB3ZS+6pVHrXDPhgjiJUD6DGk4Hm1LYdlogp+8VRh'
+        'xhgHnb5jt5Du1GrHXDvo05lziGegtCbGO8S87UNI8ZLUo0Sry5medw7ndtH7WB3t+EtOImQbpIqm'
+        '+dP0DwTnusnzvOyAdYErDZYj1osVgVRX6RAQ7kgP+ZahlcdH+PiJeHmpnMC5tpnmADCW/7dBDCxv'
+        'Jlx2l91cGAwT3Eo='
+    ),
+    'rooted': (
+        '6AMAAAAAAAAAAAAAAQAAAAIAAAADAAAABAAAAAUAAAAGAAAABwAAAAgAAAAKAAAADAAAAA4AAAAQ'
+        'AAAAEgAAABQAAAAXAAAAGgAAAB0AAAAgAAAAIwAAACYAAAAqAAAALgAAADIAAAA2AAAAOgAAAD8A'
+        'AABEAAAASQAAAE4AAABTAAAAWAAAAF4AAABkAAAAagAAAHAAAAB2AAAAfQAAAIQAAACLAAAAkgAA'
+        'AJkAAAChAAAAqQAAALEAAAC5AAAAwQAAAMkAAADSAAAA2wAAAOQAAADtAAAA9gAAAAABAAAKAQAA'
+        'FAEAAB4BAAAoAQAAMwEAAD4BAABJAQAAVAEAAF8BAABrAQAAdwEAAIMBAACPAQAAmwEAAKgBAAC1'
+        'AQAAwgEAAM8BAADcAQAA6QEAAPcBAAAFAgAAEwIAACECAAAvAgAAPgIAAE0CAABcAgAAawIAAHoC'
+        'AACKAgAAmgIAAKoCAAC6AgAAygIAANsCAADsAgAA/QIAAA4DAAAfAwAAMAMAAEIDAABUAwAAZgMA'
+        'AHgDAACKAwAAnQMAALADAADDAwAA1gMAAOkDAAD9AwAAEQQAACUEAAA5BAAATQQAAGIEAAB3BAAA'
+        'jAQAAKEEAAC2BAAAzAQAAOIEAAD4BAAADgUAACQFAAA7BQAAUgUAAGkFAACABQAAlwUAAK4FAADG'
+        'BQAA3gUAAPYFAAAOBgAAJgYAAD8GAABYBgAAcQYAAIoGAACjBgAAvQYAANcGAADxBgAACwcAACUH'
+        'AABABwAAWwcAAHYHAACRBwAArAcAAMgHAADkBwAAAAgAABwIAAA4CAAAVQgAAHIIAACPCAAArAgA'
+        'AMkIAADmCAAABAkAACIJAABACQAAXgkAAHwJAACbCQAAugkAANkJAAD4CQAAFwoAADcKAABXCgAA'
+        'dwoAAJcKAAC3CgAA2AoAAPkKAAAaCwAAOwsAAFwLAAB+CwAAoAsAAMILAADkCwAABgwAACkMAABM'
+        'DAAAbwwAAJIMAAC1DAAA2AwAAPwMAAAgDQAARA0AAGgNAACMDQAAsQ0AANYNAAD7DQAAIA4AAEUO'
+        'AABrDgAAkQ4AALcOAADdDgAAAw8AACoPAABRDwAAeA8AAJ8PAADGDwAA7g8AABYQAAA+EAAAZhAA'
+        'AI4QAAC3EAAA4BAAAAkRAAAyEQAAWxEAAIURAACvEQAA2REAAAMSAAAtEgAAVxIAAIISAACtEgAA'
+        '2BIAAAMTAAAuEwAAWhMAAIYTAACyEwAA3hMAAAoUAAA3FAAAZBQAAJEUAAC+FAAA6xQAABkVAABH'
+        'FQAAdRUAAKMVAADRFQAAABYAAC8WAABeFgAAjRYAALwWAADsFgAAHBcAAEwXAAB8FwAArBcAANwX'
+        'AAANGAAAPhgAAG8YAACgGAAA0RgAAAMZAAA1GQAAZxkAAJkZAADLGQAA/hkAADEaAABkGgAAlxoA'
+        'AMoaAAD+GgAAMhsAAGYbAACaGwAAzhsAAAMcAAA4HAAAbRwAAKIcAADXHAAADR0AAEMdAAB5HQAA'
+        'rx0AAOUdAAAcHgAAUx4AAIoeAADBHgAA+B4AAC8fAABnHwAAnx8AANcfAAAPIAAARyAAAIAgAAC5'
+        'IAAA8iAAACshAABkIQAAniEAANghAAASIgAATCIAAIYiAADBIgAA/CIAADcjAAByIwAArSMAAOkj'
+        'AAAlJAAAYSQAAJ0kAADZJAAAFiUAAFMlAACQJQAAzSUAAAomAABIJgAAhiYAAMQmAAACJwAAQCcA'
+        'AH8nAAC+JwAA/ScAADwoAAB7KAAAuigAAPooAAA6KQAAeikAALopAAD6KQAAOyoAAHwqAAC9KgAA'
+        '/ioAAD8rAACBKwAAwysAAAUsAABHLAAAiSwAAMwsAAAPLQAAUi0AAJUtAADYLQAAHC4AAGAuAACk'
+        'LgAA6C4AACwvAABxLwAAti8AAPsvAABAMAAAhTAAAMswAAARMQAAVzEAAJ0xAADjMQAAKTIAAHAy'
+        'AAC3MgAA/jIAAEUzAACMMwAA1DMAABw0AABkNAAArDQAAPQ0AAA9NQAAhjUAAM81AAAYNgAAYTYA'
+        'AKs2AAD1NgAAPzcAAIk3AADTNwAAHjgAAGk4AAC0OAAA/zgAAEo5AACWOQAA4jkAAC46AAB6OgAA'
+        'xjoAABM7AABgOwAArTsAAPo7AABHPAAAlDwAAOI8AAAwPQAAfj0AAMw9AAAaPgAAaT4AALg+AAAH'
+        'PwAAVj8AAKU/AAD1PwAARUAAAJVAAADlQAAANUEAAIZBAADXQQAAKEIAAHlCAADKQgAAHEMAAG5D'
+        'AADAQwAAEkQAAGREAAC3RAAACkUAAF1FAACwRQAAA0YAAFdGAACrRgAA/0YAAFNHAACnRwAA/EcA'
+        'AFFIAACmSAAA+0gAAFBJAAClSQAA+0kAAFFKAACnSgAA/UoAAFNLAACqSwAAAUwAAFhMAACvTAAA'
+        'Bk0AAF5NAAC2TQAADk4AAGZOAAC+TgAAF08AAHBPAADJTwAAIlAAAHtQAADVUAAAL1EAAIlRAADj'
+        'UQAAPVIAAJhSAADzUgAATlMAAKlTAAAEVAAAYFQAALxUAAAYVQAAdFUAANBVAAAsVgAAiVYAAOZW'
+        'AABDVwAAoFcAAP1XAABbWAAAuVgAABdZAAB1WQAA01kAADJaAACRWgAA8FoAAE9bAACuWwAADlwA'
+        'AG5cAADOXAAALl0AAI5dAADvXQAAUF4AALFeAAASXwAAc18AANVfAAA3YAAAmWAAAPtgAABdYQAA'
+        'wGEAACNiAACGYgAA6WIAAExjAACwYwAAFGQAAHhkAADcZAAAQGUAAKRlAAAJZgAAbmYAANNmAAA4'
+        'ZwAAnWcAAANoAABpaAAAz2gAADVpAACbaQAAAmoAAGlqAADQagAAN2sAAJ5rAAAGbAAAbmwAANZs'
+        'AAA+bQAApm0AAA9uAAB4bgAA4W4AAEpvAACzbwAAHXAAAIdwAADxcAAAW3EAAMVxAAAwcgAAm3IA'
+        'AAZzAABxcwAA3HMAAEh0AAC0dAAAIHUAAIx1AAD4dQAAZHYAANF2AAA+dwAAq3cAABh4AACFeAAA'
+        '83gAAGF5AADPeQAAPXoAAKt6AAAaewAAiXsAAPh7AABnfAAA1nwAAEZ9AAC2fQAAJn4AAJZ+AAAG'
+        'fwAAd38AAOh/AABZgAAAyoAAADuBAACtgQAAH4IAAJGCAAADgwAAdYMAAOiDAABbhAAAzoQAAEGF'
+        'AAC0hQAAJ4YAAJuGAAAPhwAAg4cAAPeHAABriAAA4IgAAFWJAADKiQAAP4oAALSKAAAqiwAAoIsA'
+        'ABaMAACMjAAAAo0AAHmNAADwjQAAZ44AAN6OAABVjwAAzY8AAEWQAAC9kAAANZEAAK2RAAAmkgAA'
+        'n5IAABiTAACRkwAACpQAAISUAAD+lAAAeJUAAPKVAABslgAA55YAAGKXAADdlwAAWJgAANOYAABO'
+        'mQAAypkAAEaaAADCmgAAPpsAALqbAAA3nAAAtJwAADGdAACunQAAK54AAKmeAAAnnwAApZ8AACOg'
+        'AAChoAAAIKEAAJ+hAAAeogAAnaIAAByjAACcowAAHKQAAJykAAAcpQAAnKUAAB2mAACepgAAH6cA'
+        'AKCnAAAhqAAAo6gAACWpAACnqQAAKaoAAKuqAAAuqwAAsasAADSsAAC3rAAAOq0AAL2tAABBrgAA'
+        'xa4AAEmvAADNrwAAUbAAANawAABbsQAA4LEAAGWyAADqsgAAcLMAAPazAAB8tAAAArUAAIi1AAAP'
+        'tgAAlrYAAB23AACktwAAK7gAALO4AAA7uQAAw7kAAEu6AADTugAAXLsAAOW7AABuvAAA97wAAIC9'
+        'AAAKvgAAlL4AAB6/AACovwAAMsAAAL3AAABIwQAA08EAAF7CAADpwgAAdMMAAADEAACMxAAAGMUA'
+        'AKTFAAAwxgAAvcYAAErHAADXxwAAZMgAAPHIAAB/yQAADcoAAJvKAAApywAAt8sAAEbMAADVzAAA'
+        'ZM0AAPPNAACCzgAAEs8AAKLPAAAy0AAAwtAAAFLRAADj0QAAdNIAAAXTAACW0wAAJ9QAALnUAABL'
+        '1QAA3dUAAG/WAAAB1wAAlNcAACfYAAC62AAATdkAAODZAABz2gAAB9sAAJvbAAAv3AAAw9wAAFfd'
+        'AADs3QAAgd4AABbfAACr3wAAQOAAANbgAABs4QAAAuIAAJjiAAAu4wAAxeMAAFzkAADz5AAAiuUA'
+        'ACHmAAC55gAAUecAAOnnAACB6AAAGekAALLpAABL6gAA5OoAAH3rAAAW7AAAsOwAAErtAADk7QAA'
+        'fu4AABjvAACz7wAATvAAAOnwAACE8QAAH/IAALryAABW8wAA8vMAAI70AAAq9QAAxvUAAGP2AAAA'
+        '9wAAnfcAADr4AADX+AAAdfkAABP6AACx+gAAT/sAAO37AACM/AAAK/0AAMr9AABp/gAACP8AAKj/'
+        'AABIAAEA6AABAIgBAQAoAgEAyQIBAGoDAQALBAEArAQBAE0FAQDvBQEAkQYBADMHAQDVBwEAdwgB'
+        'ABoJAQC9CQEAYAoBAAMLAQCmCwEASQwBAO0MAQCRDQEANQ4BANkOAQB9DwEAIhABAMcQAQBsEQEA'
+        'ERIBALYSAQBcEwEAAhQBAKgUAQBOFQEA9BUBAJsWAQBCFwEA6RcBAJAYAQA3GQEA3xkBAIcaAQAv'
+        'GwEA1xsBAH8cAQAoHQEA0R0BAHoeAQAjHwEAzB8BAHYgAQAgIQEAyiEBAHQiAQAeIwEAySMBAHQk'
+        'AQAfJQEAyiUBAHUmAQAgJwEAzCcBAHgoAQAkKQEA0CkBAHwqAQApKwEA1isBAIMsAQAwLQEA3S0B'
+        'AIsuAQA5LwEA5y8BAJUwAQBDMQEA8jEBAKEyAQBQMwEA/zMBAK40AQBeNQEADjYBAL42AQBuNwEA'
+        'HjgBAM84AQCAOQEAMToBAOI6AQCTOwEARTwBAPc8AQCpPQEAWz4BAA0/AQDAPwEAc0ABACZBAQDZ'
+        'QQEAjEIBAD9DAQDzQwEAp0QBAFtFAQAPRgEAw0YBAHhHAQAtSAEA4kgBAJdJAQBMSgEAAksBALhL'
+        'AQBuTAEAJE0BANpNAQCRTgEASE8BAP9PAQC2UAEAbVEBACVSAQDdUgEAlVMBAE1UAQAFVQEAvlUB'
+        'AHdWAQAwVwEA6VcBAKJYAQBcWQEAFloBANBaAQCKWwEARFwBAP9cAQC6XQEAdV4BADBfAQDrXwEA'
+        'pmABAGJhAQAeYgEA2mIBAJZjAQBSZAEAD2UBAMxlAQCJZgEARmcBAANoAQDBaAEAf2kBAD1qAQD7'
+        'agEAuWsBAHhsAQA3bQEA9m0BALVuAQB0bwEANHABAPRwAQC0cQEAdHIBADRzAQD1cwEAtnQBAHd1'
+        'AQA4dgEA+XYBALt3AQB9eAEAAQECBAkUMHMeAc8CMgeeEsYwzYADVwF1lwPfrwlHQxoki0d0tsNI'
+        'cRkCzfHIBeer/Q+4V1Qs9ZQ2ex4UTVcBOU+qvgOdVKF6CsQDTmEdbYF8hVKmxg0s6DyRIz2OAqNk'
+        'F042B2BQS6BhFIUYqDGsORBr6mdlo7zUsLZ3zwGl09FiDyQFzl2wmvucDiWyLKaGlClwfTonTWx2'
+        'ZX08wkOUUQGQFmmj9CHDA8pjhL30HL4K5q6GXvm9sh4I8nyh+OjJV44T5TirKzv7sqeOHbzLdM8C'
+        'DbE1tUKQqw0IEcHDDVVHnhcXPlgA9r37JEFCYB9rcyYKvjO+jLr2y1vWNFUiAmr+cm4eSu4dIgaG'
+        'AN/BQHBpuKIRYyzjNXL86xq8MppGUiHAtdaRBpJo0OOpqI378nykAbAkl1yhVNybW7sEireAsz+8'
+        't907ow0Z7GAMAmw1UjtSJ07/f1ICrkRKlGtxxilOiv8Qi+SQSEcBA6unNPmN/mLxwrAD34k8aE37'
+        'D2b5OKgKQgKBlYm01AeiMcke940k7ZNMlNV9x/ZYWYHJkkyzblcOwisBAQpEnPM5lr5bYl2n5wIC'
+        '4eLFUZTfiwbdFGcIme2ah1yNFRv9WhhQGIBJzrf9MqbUdeeeXkb1T82MfLVYJ88hfLvLK/DSrRJW'
+        '66ixXeEBTgJFMZerwT/1QisbOiCtBlXvDyGTis2CA8dCTFgTYfjiaYMFVpdC/hZTEThrgOmc9ROt'
+        'Z0JAOAWLopx7mF6mLENzUoMESFbXAYhM+9VqKWqy01xG1hhXBSAyslilZzyUYHzJVSZ+Dy/5EXcc'
+        '/ThUxZa/UAX1LMDXdJRCP1xy9rdJ93p8gqVMn3PtVeG5v1N6tljQegHQHAzvq4FKAmJbJJNs90sE'
+        'BiMuSgvwjrZAsG6JoKZ6DNF6Pf7/8NXv4tVUnLUpQCSYNwhMuxG9ZXU4sQptXFNpeqtqRALIDWED'
+        'Lr5Qrc4UMgHyCk6kIUFe/Vzlut6czqd5A7TqNwDOUAhAwePIg6P3WRoKWImy6s3ReaC5PBAEwdU+'
+        'YB3BwpUdJhXrv7oMjUnaDj5uVRyyJIW4ROLUeHDREE80sn34bh5uTV78tjZn5HsInTrR59ICfi3s'
+        'kyW6M3X6vaQrQCP2aTcI2rN72zR/Ea9isnoba3UGO+kXqb72MFuAP6Vr8KlVG1HIfJhFj+zMCpyJ'
+        'ntsuG2vS+aA14ZjKkj8/KFdQKPNQiDnZ+ncg+NxNAjKMgEHtW/GagKSyl974BRymtQZI9j/dVX6E'
+        'ZL1B1E6ukKdhb4oTKppT2cg7LEzZ8iPUZeSkPRDrOOdfbbZOkGZ3I+a98CJpkLWE0KW2YAAGtbYu'
+        'vpaDIGF7q9JYex7jAegFwvkDKRT0oT5Iwd85Vcsf0H8F3K1SH809mcdr/56ZAxRuQWHtBhA/cIsE'
+        'AnGJEZdhzlPPSQ+cvyG3LsisFDlrZPBcWt4a74pmEPR3uy6I8uIiUWb9etfAZ+k1Hy20R2YlC40B'
+        '4GDXe8VtSwnOXYFVDeGa3NTcu4UEXsixLQa1mIGIG0sAzxFgzFldOzANi2DryparIUWPqYAdph83'
+        'NouAFncmufqudGfyu4w9Pzfp8FuQKvLATjNwP1eYFcSUxOBYNxbqsYnZ3NXfrlFHAR6x6WNXjJn5'
+        '8e0O+DszVSV4m638ugNFM5O5+OqP1TIzKWASnBtg3oJyleIKVSfH4Jon+wGvqmlt+sLZHwdnuPHD'
+        'Hw/6C8AVo5Fr6CdRYyKa+djLtEmYtVy3aDbYan8XL1NkgyB2OIjRQLBOWZsOAXm8iuTyuIja9t4n'
+        'LJA+GWdC0SMJ8xUDZ07IpB0wuFXYKQjsr6VcKNHVtyk9AgnBE/UPY9Wkul5G9eMtGFqK5HIP1LBN'
+        'GiUg656MO1ZZuMAiZv2F7XlnwbhWys5MGDzvzxJDL6t6BG5sV86lV+OgeukpTuDW7zI4zl99m7Tc'
+        'hZqeBIn8LVF2470cjwL/GMJy5VnHI91K8G3JjsFvjbTmVBOFeQfHTIMCVNXrIMwmq/ir/lUPP8w1'
+        'ED261RXkk9BuetwvGkNPVVFZ4btK8nzGcJMSyj8Wx1RRJmd7rFLiR2XnTo0SrdwHJ0OwX7rK0gvd'
+        '86wUdEtaSN5ETA5mlD8Z0kD3kyACNPf92W6ulq+6gHJ4wQ3bCO6Dx2D/xWA3BsLFt33fjEHawGM/'
+        'VMYZwObZDf7UNunCKhKgj1UeqE7QPZ3tlaf1/Qx47woYvWNw4hg1m9X80wcqlkTeqzG+C2Dn1sgZ'
+        'uf1kFI0zm0x1AaQm7lDB9vudZ/yRLslfxaPj6LWTr8UBMQksVSLGMoOPTFFqhL04d2zLz558Bl5T'
+        'LgV/ojlI41sOqhzTCpl1pkyGl0DM2cEfHMAlDx2x4xIN7HBYKFrm4hy5v2b1uxy61GIAMUosTu1v'
+        'wV5mi3aM1nDV3WbqLhvlc37JXixsgoGAxhahF8Adqs85OxRhTBythg7jAqYkjX67egECs1qFH9sy'
+        'SL7VtJKFz3/PS9SFmb9j4kOiUwSV0hm5tpBHxMLl+iK4B+M1joX4oY0jGGCbpwx5QjUq0Z8R8KK9'
+        'ulUYu3a5F7yLx5jbwoXlAyUte5sPhOql0ZkyutIqPvXVqd0yngeepNojR2wpMbgIjLp1AgOxA4UB'
+        'bTGhyPU7VTEIcxiLwjwBYQQe4Rt09mvVNu2aq/y+/FdDNJBhqaza07meA26UWJ0zpq5m1KnplXUb'
+        'G1grtghWNGniHq10lwrctfohQdQma6470F0rO9LriL+vBSMwmMNw1/0eN/1K3eRsXMRNyyEgYXY+'
+        'mM4ozZq777d/9liwWlAlPErbhMY/hRCb2g0XkRHB2s/mM9cfyq40ZQkBRtfWftXRZm1IC9wKo2fN'
+        'EBvQ+qDsuICsEtW2CANTJiVg1lhRDhbTsul0sMyPd4zWidihT9LRsE3hCP1BEOeQxNoU94hV2qTo'
+        'fhQy+FMvwPKGZpG4+v0ZNR0dF6COCyyWE+w2FQ31C7RAdFb5cCjz+lJ9FUwx/jSCb0l4vMdOLUt4'
+        '9TImZCYZmu7FQzGf8vS53rVhqS7xEIOq1WBwRRQNUI8/7zso1x13gQf5WwuMAu5kQPhlQ2lFIJGS'
+        'LRvL7ZZ1Y8dLGLlQCI8SiQN1B++CJOhiDgg2Lwm3+jU/3imaXwBGtWaPY/4LuWzVFYEspw878+Ah'
+        'pRGa2IxWm89voP73CXA0PQ8x/FDuPzzUpWvu1DVEGc0EL0ErFYoUcwjSm6zI5Nyq9so0u+skn5hv'
+        'gVcNoEJkTN47hTH6XSqtwfjeiISedEY4JAKW2aQCb/NLl7pWMqwMnceM4tRLl2EgfuYcLrmHg0UG'
+        'Sp6o5HeGP1UKVYkK+bMl8vvaAxECkb9K9VXSSypeEu+GzH5Ta4mYmuqZkzTc+4rTPwHR5L37PIbN'
+        'xblIzDVVaPXIbMHE09Z+U8TpnRTs0VlkCrRoTVAg1KNQMpSdC0P8ENaZl7WPLWdj4FoWGSIPTE/o'
+        '1Dz3aqTaz1GWzQEPXjmnfMYc6WAJABoKUKkrbU282MmWTBC3dqiKvCxIBcJaVY0NVMxhLFQEDCTf'
+        's8G/gMGTE6mRphUbJiNsRnkPCJMo2PfAtYmZlfOHq3vMnrhwPM2xS6Me33+X7bNlVS09wZQUD7AJ'
+        'C/eXMY7YcUVTxxA9ugi7O4l9roCHgz7ShOIpieG5HIGwsAnsHaeLQrIYj5RyIoBLrfrzGYVRFyuF'
+        'ATjhNO3UDUWOzyWz641GSsGEA04J9g/FsfOEnW+Ts1N0BOMB+8Ve8Rm3LGkNcpu4ybl4Y0G/eghm'
+        'q8qh8fgIMIMNDWjKIXBhbYrZCM+wFam95LHs9TOdPFzwIUIHzgj03CdAJh9mNJjOXtNbptRkQ2W+'
+        'VwfrNvWJRHlLY672TyTZwOMYcMzAolBOcUgsocraWv+WehFl46v/BOAqol2+stQR4yyHSAHoYxPQ'
+        'K2bH0jHg6g0/F6L09OBUXC7juqgOZ/Fcm8CB4MIDpnj0jtNGaObOST+qRQRU7Aonf1ICoobYSgpf'
+        '00NGejYGC0GcShOOZ/Ak69g3fnv5BXMvBNO45tZjWYP+LLE9GmBaUCB9ILW86ZpxqwrZ2KHEwBv/'
+        '6scoJOBBTUiH3xjJhriMs7hedLqCXye8ccboiE8m7U0mZuKkrkqn6Eb1ZJoZ8urDalarFQGACRHO'
+        'qTJZa8yuZU0CL+vxNVwqfL2BfP6tFaMHBKjiLAEuA2BnDX+MKzlxVm+aRW/UVHSoBVQ+hDbRVU++'
+        'hy9cjl5XaVIJrUPY1KXb5W2Xf+uKQSEJ1eDO5kusbIfUupHjOTeT6i6JVBvu5HKyfkoSmcy1Npkd'
+        'Vl7hs++Q7063mh6DurJE94y4/4AhUB/XlVCm7QdCv9sgb039enH0ZEYNoElZ44RBS3UZDP1jNfPq'
+        'vXfgCOL+x42NilHGZPKqVxH9YXksWuJIgbLXSiJt+w7s67ACebr1tXB9hH3usvNumABKjZSrxTiG'
+        'w7fJ4ti4QQ+BOe4RJeQH6nOXsVj1g8hh+QLALBjargI1gohekIMYTB5afvAcGr17+iMXDYYtVuKl'
+        'o81hwLlX3u/aAUrQcZlagqh2ErdH28+bSzzTgdxDRso2nwNZk6Qkn6k36xwH5TyRYUFozE3VXcTy'
+        'eg9RxzbOQwTHK02uOEybaiO6AzBpDvHBIzAN1+e7EOXEozd3lXd1OsNtzq1HAuGFa+KyO27a3BRU'
+        'llAU7nDVNYUJDzaX4VfAQhmuV/t+PhfkrwaSclcgpNEv1ogieBwZ7r5as3c1+P6AltnlLrFG//ap'
+        'g8+oD50T1YLpIJHgvC+BTgtmF080nwHB20MRnwyfRmX6blE+kMOvV5qHOc3TwzPckww74b6iS6Pe'
+        'bXvNpLfiTDAxrbbI/PQCRNw3T+0uwKh2JseEtylGFmNNKyVQ7F32ZC4KvGTJAgKHtFCntZYJYm3R'
+        'IgPvAZ4WzFWWv+P81Hu9cs/IrWJfLuXLWldiBRebEZiaioR6MPMNH6wFyHSzW8e903Ybj6XunGhz'
+        'aKoDzhZZI0xTGXhnNeD//4gUc773oxAw+J//s7WInUtEK9HMuJ5Q9n7/prs8eXo1ZggzQI+vu+9s'
+        'MpXRMHrk4LmIEnVKAb1vpUS20QPx/PYKpD/bb6h4bLCdaV4AoQ4L3DmP1xsTZp56OQXE2HHBQtYq'
+        'rNNScZgVUD5i0A43ckp5uyFQnmOUN6QB/D3sQ/V41j1BCQbmfQuZeezfL6oDwphL+pHjtqC3VTux'
+        'zvw58NAEiErVOD4S3GA4+KMsXRBTM0AHwjmtvHUn7Qpajr0f6+AZ90xsoiEONvLV9O/QL6DcJytF'
+        'LCs0MNKPnH+tS/1QtyStn8KcSt0Uxe7uFXcp3UkahT72q1Jt2tKhUP/Ykvdn7TZml2sj2XPfg2Et'
+        'rkMbCf8Xiqx5ukn8SlFpqT4CpLXR9kMAD4LwJSnvg/OmgSp6vESwUbIFRSByZQxlAVHUqaQrS3d1'
+        'HPSd3eeoLBa8HoD2KUxS/XA/RGVWHGs0awsuF5jIFwQ3wJH3FDYm1CCEcZg0x6UHzgFwJpvMnq0T'
+        'Mayz9FestC9OLNVb5gIMr6g2RjQ4iSFaRC5humZ28NyPdACGcSfiyayiweANEPg9kOxCOiBAIxKa'
+        '+7qhLvdBOQUd1D18uwBVgcm+GE6D0Ise8U9hzP9V7/WaiguidGd7i1qdcFs0/23BRG98tVc34bBC'
+        'hQ6k3xR+rBO82DwXngeGk+R9iqMvAd1x6u5ieYIv+VpJw9LzOuXpyMjwEyVFqKFwkw+Hmb7C+PAZ'
+        'nSgbM3sDKZoH/VmbWorVyG06S+LVMkMbilzu7yFXQy1SP0GGgcrYmXwuSHrQNwpEfVYA6euILEYT'
+        'zCab0WAzwmhsYN3A6HuZ25aWmMdTwE5fKWvy4xX+HTcUJ+njacIWMJ9/r3KXSpw0+0qtGpoWmqyx'
+        'ylub+2OqgFtxXY6p3wlYpZsTdjC2cGyDZEliyfd07sY83TziqjUmDErrvxfDZQy0SN0VfRGsbgIB'
+        'Ql0mLlb6yzkqJWebtDXYaR/biq5coqfrcJNbyrKr0hju2L2JKJk6o/YCQNEboD7yQEZkxizBZ/GD'
+        'DViMJBYdnSPEnfaE7VjdVzJ/bQa4In8WFLMIBDuflzzgAZc8ltWje28XOk5jNXkGa1iNq6QW+0WD'
+        'cv1fm1Aj8YAdFIoZiXQnCH8P1dLTPS+5dL2cwc1SeDBCI/cWZW2/vnWfAJo2rOMUXhuojvpKkGRh'
+        'j1hci/+u8928X4pVoBBbvTD6vJ8+TDpquhPJaD/Y46IHu0qtSiHcV6wjK5nKnalmnqzEHVWBOXBo'
+        'J3YcaLOEBK5Kg58stabQbX89xrrBmEyGAkryr82amH55AQPpDTFSRrhZyqaxGe04IipgLEbrzXzn'
+        'LQO0kBKCHGWVaQeeS13uO0r2L3uecLmt7fGh3Z057NqhIDpyjHkTUpp2YDl6eDNrz59fncMV1nFt'
+        'vpIfN491zEc/bSoq8VUzhvILHp9IABaGQuj+an5TevBJCc8oZabnP85N0MccoRFJKDjBFH0vLH3s'
+        'zc8T++K6yxuldqAHTTw5RK6buxppjwtppbv/dmr6BWLxM94rsXsJdci5JfcC3EtR5OwL474u+6Eu'
+        '++14ZvYWwkWl/gEnAkAfBnxxucN0l2KIgUE7N9o34w6LSXQt+pr4AfwiQMXcczVkKrOoXPZRCVIG'
+        'eYb4cvLOF7sttdhxQY01jO1gM5xSqaNBY67nJqvcdLLk09axr3z8NzKBjxLosle7HARyE+oev+UA'
+        'WvweSFyTD16s+rapdKbqmxVbZX8tSgZhJmbkbJmBNj19+ukX2KuC8hNPMT4VI/4heqqnMelUiLpH'
+        'r/466wRvYm2Q6sReSGnsQBKgnSF9CocEsMcVSg84HobCHGgjBBtgnRq4mPzrnKVY1NYn9/2yP6C0'
+        'kUpGGtYB+BIGj0Cb8kyCwQnqBsydW+unED+yH5FAdEjqbnV6Gjnf6UQpKsr5PpyPpmQFcU3RrjJB'
+        'K0vTY93zrNcvm5xd7DQ0SiubOrteTEbhF01otb2XBVMgODgU9tYP2lTb4JkH/zcDM74kLJQyxbAs'
+        'zovLUz3k2cjSjUHTXJCcz3bERXHpbTi6toUuL7FQqN2mpKt98WlwXnTMKZK5q7r5aQVnhtlB1j5e'
+        'EvgxSzww2rximACcn6SIBCQhIi3/CFcic+hkKA5JOh2hoKD4UOAUaSEjxkknDCQyA+f7vE3ZvbZJ'
+        'FVqRAdcXuw2YrBx8i6KezUuv0EDWyeI2+298DP0KomZJXrdaqbTX67nQKWnXhabkmgSsRhy5htnT'
+        'SijlVhJySNTuhRYphllJ6G+EbRMIvjDL6STmrGt2TaEnoA0b3IYN1OxqbU/qr6rrqWlsODD3HabT'
+        'G1N1EFO9B+scPy819cHCLR615b8YkXGnaQG8J4qqCeCNRKk+0WxwfDuPTWa2+zL4gyqRzMarr1c+'
+        'mdp+O2W+UPYPzrQbxxGbuHRU8T7AdlgU2u26xQYODDv5E8UEf9RX3DFT2NN3PmNjmsLljmz2Vhtc'
+        'YVYAguFWAcBRUvs0vAUHcNocwpZK+KP0HS7Pn9kRJQRBluMMgNxl4krwW0UC2EoJbelpRu8D4KXB'
+        'yrROwi0duJ1GQcSTQCMpoKIEcSDQ+eGU59zPKAvONPqGHHCuYkDPN70gjwu/R+R0tjHp7FokaHQy'
+        'yF4L1N3kCWpO/mZVWicoa7ixDeU0+2FhceDtMqkB9mj1IWcjcnlPfzh3UbhCkwljhm8gsmVBjt8V'
+        'jELBsbvk8pfkwjgCDQkUINZCpUYSYMRjvmIkjhaivw3VDe8P1Bor0ra7x03PrysKSJUxTviu0Wbw'
+        'B46O+Vz3bDnWe9bqHCUBVFzFT5iPaF+zzOiu0kAtqepe5dwlvXrqrmmceESW4DsAyvsRNjbG9oh9'
+        'IVW6LV0DG4POcfOopoAeGhbHW1LEYSWcZ/jaHD9jEC6LU8bI93YaKcYJCPPDRMQ6tfSzPeIJQIWQ'
+        '0NNI1w68qs8BZDkXtrflMUZMx5v/O4mlquAFCyryapBKPg1lizWgr19YUAodS7oZsgyw57sJZ3Wg'
+        'DnB2QU2upYvZDrTi/6hQkWHRRLjB1W30yifMWExQyi4Q5lNVOvscO8RaR1pyZz3J1Jxg9hAzehh6'
+        '72DA94wqKDVkDSsAP+5BN0AUa7lTBnmtarj6qvo+Z2F/uApkkF2M76yvA0BDmABMUvLlJZNb3mlb'
+        '/zi4EXsL2BGU2d9UeDd85bbgAuexr6zOVs57OA6Kc2dVUT95isdby0qmTN2F6itcD5/jnSfBVJ+h'
+        'brpVlMtESQvOdAjwjXESMTPzLuTxoWDgaNjrWRWEq93a+MiaSvrm3HGAj+iC0P3V9yhVGJ0KM7jH'
+        'VdkYWc0/jeK2G+iNs8qQIa+lzcRm0WEKIhX9OPqyNLQX8DFdyUU4gJxCx9EpTHDMWF8FSeed/Ne5'
+        'Rzt1ucJKPWH1QjUSycj1S/5I2Q9dr7lSihwQxElHAj5xGRoF18Sl8f5xldZXTlR5ydITFIrV7ZLp'
+        'cV4fbPFn97396YYg9Qt5fvdSfxxdd/bTuIkaQF6qtMUIRZp2As5DTDDpv5YZ9gc+wt7PtCmVtXjB'
+        'aEhwMwcSF15RCf7K5X7NHwFMBQ1i0/+wymdmNT0HdwiiVuvbwCFpT7b6/ij2of+sfOhandLPrlXW'
+        'f8RkCKV7AApgC8rZ2rrJZ554ZohPRhXp89zLmKCGkr39uLb2pEPS3W21KuwALAp2AJuYqKyxyPXY'
+        'inEKGNlss4OexYY27kOGPpjHCMnPkp68y9e7mI6tLWvbMdHNewELHPCs43RNdW53RVesE//I+tdk'
+        'KHF0u9zqIsK3ipQultlqREeYuNao/EEl/IA0Fyy/JvkuH0BAE1ICcavscX2ppaJakXBhUfKFKCUA'
+        'ExwCiOaBbYNW3M0qFIJYqJOGO+5d0ed8xEPQ5TWi7HZ7PSZ7yc/SN/VSN0GA0BcKvIk9VjMGDFPh'
+        'hJQIqe/rkCFh/uR0PD+WYv9k30hEm8/pSsv2l4VDZHq9TqRHxIXxeuzTljVmdDkST7AYRpHZHpIz'
+        'yaGZ1YdY3XgTNtihCRpbuB+Tr7Sot2ULQ81uNZsH8j/HL97BMku525A1VRDWA9M5vioDCEgKUeCZ'
+        'KlcVjeJJu8/akD0vCcmoQx+2P/wo3J3e3hd1rzcoYf6rIHKdowGHMsr3thMoTbP1niWxY8w5EQ5z'
+        'mEObnp9s5Y16nq3jrmE7sP7aFVSZXnczD+pPCMrOAUvsHYz3PcF3IT+1IdAfHP/8G9kQ2X29Orvc'
+        'YKId3nCpmb8sNaznaKe5QRzJUdGmwnNUUAWM42cBu2x4iUZXBfO42+j/GyjwocuMENFjN+Fpuw5c'
+        '54HdW/09aj+AVrDhDz+L2tgwqJ4PYWOdC/BRC8r22N+6E/mhI4X2u5HvaZU1s1Iu+KM2GY2FEmqM'
+        '7ojctCCfs0O3C/NDyjHqLTQJFkBiPxK531dFhkK1QMWq6nOc+2YQ0sp7EBav2ExZdQ7HDEE6hyC5'
+        'M1RSSjt3EJOR+IYF/1EY10L5i0mxDP/xQzPk55CnruETTVV2hs+AQA46gCO5P9y7DV0SAgwBdyKU'
+        'H4OclMSMARBdLJfKc/qE3wtRgYas0nVyMt6/n/+aXYL+LLmCD4NhYhgqHv/AjVZqLIVlTaN8S+ge'
+        'Yo4ELgKictUmdWpsu1uEhxdPKD2HOaaDEdxb25+DzwyCpTWYKw+8WmH/acd82+kgC32govnlZA2A'
+        '8i8GJjGAihUi5JcHu+To9F/ZPj8gSDarfyqPfylHl8MNXql5yMdz9vvfDOCJN+AUcV5gJyHE3ZVy'
+        'SbzB5pHBD3IRf1XD3vR9VET56PyOH4vlvPHJPHKK+CfLC9NbaJUW6D9TCtN8HsNzgvmcWYGztclo'
+        't29qqonsuhekk3+GDteUJgJlBKanLHtdYXF5ufgJr9fF+HNgpbPT+9+AVVQBCfYoHAcSEoMEsZVa'
+        'HykMLlQ3CHyWIMe74BhGkX81YQIaOIsZK58vXaCaVq0ZQ7mZ14G/lOgDrr0cRbWVRKXFZ9QGUkny'
+        'IecPEQvEMNycrUq8L3XCE3Zks/sh4j1LYgqS2n13mcC8s2Pzwn0LD1fo0mvNrjWDCOR6sPEHOKgJ'
+        'ZJbw9BFhfy3DEymyOxOc3XeOBEMwT/iRzo4pYQExLdVBGckhLWz3yiOnnQLbzxnXud+5u1Cslbq9'
+        'oecQkjEjd3WQ0moORJq9T7uRJ5yRonm2L6OY221JxFVjwltEPQ6ynuG21YuYoW3278YJZedCLEx2'
+        'eZHLpemhYc5J03y08SGWRUQQoi8+BiGud2UaEhEkAfOqJdXaQb5/oMCSLwY2GT7aUdFBiN8NfRTR'
+        'YVJ4vAuIMs+OR0gotBlPy6BfomgbaTK8j3fBWgNRzTdIiA11xOuomAJ8KyFbP7m41K52ZeMfukOy'
+        'N5kiC05e21efpix0sliaQeByOmY9xHzABd0Jbuf67ILItK5KAdDWTotFMEtXiZJIJ1TSq1MjeHjw'
+        'QO5nuPbkCYzdG8IHAYNGOCYIV7MUxYYAHcgbuprrLtNLESuRzLLPJGvebYg09BA4ObH16SPDnjw4'
+        'UKRwq+AhZNrxbVxTxmlsjbNSiZ9TR1XWvOw8wVFc91/P3zI7ziRDDr6FuXGtpqLwTzvGM3dW7Cc1'
+        '90GA2vQ+hQTpBFUBHAxYYKUDuML6kHQpR5KnLgLifga+mw3Dm58jOKzlC2YjDrRXgX1AQ3Xuq3xK'
+        'qXhuAWm2s8JDdzuvvvEhrRBf4QJFGj+exXLMgICzVHDWp3CYr7hFDCNctvfLvhmpPesgTQMYUUW3'
+        'eZNWZfNXy8ZYfd2BWpU8uk54CGv/apwo/O+i21TE8M7Q3+aC+go7dEUDwW9+7pQVsyrGuVaLNX7p'
+        'MwkJ1SCs3uwh1OOK79a/N+gYBp9R62q+i8TQBQ1U5Ag9Po1JRrw2oxyhYCqYtgYNjWjF6aOkR/VW'
+        'aME6jVrseXqrr+BppJaBPkncNt2Pzuyc5MwRPxW/T3sf/mLp2+dIIrxTpGlW5xyRDaZ2g7ODfh+I'
+        'SjC4zwie1hMk3xtRA3Zk17TGgeT0tEqSUnAlqKLkVWwog+g+KBrj9FQz6RNr9oOq4prScqB9+U1q'
+        '6ht0kvX+FL1Rch2I12x5AqoZLbwXXvv/GIStvGSLD9PD9AEj2dlsuaYsqVl4OSeTUXNbEp8T5har'
+        'HtyPaRo/h/ZK0LRMWM5GBwoBXtJV7XoJiE6HyXU03o3CPgmImD8w7hsT29+9GRem7VD5j0+LElL3'
+        '68cjNepyLQ6+7TTzw1FmFYvGfVLJSbsBhStoa0y/lFHN/N4HJ2yohBqQoZO/De82ZQunNtDguf+K'
+        'HxCsUmBzj/x8bKPXCnHvPkSHCBPEdwXj/28YhXX9JIAkT7lAA9FR1OI6fguvhPG/tFdzTAaSQ+IN'
+        'OQtO8Y3VQvyhEusP2qwXuduq6Mk4uLB6bIKvhlCV7/oNIWoWyvBPe3kJ35+abnUyI3qqMALmn11S'
+        'IpW/7aG++3iflId0VX5dIAKt24y29Q4s4f3J/sHhweqs/OMkglJUTK2hirOsa5lJCdcduhULmcVO'
+        'zvTr1T0Px6dKFVwsfAleB0EGhPf3q+eQXUT4Ku/t3jXJ9ifW9wodHl3vZmMoJlV/HXRVk2M+J8ok'
+        '53KPbCJ74TG5tG+FV1e2K9pkElgGhyEvnAx/obOSNQ9CN9ofQIuPbN06HLSzYDGAdQMpbZdLYb2S'
+        'fXbt1wFZfynZa+hOVwsuA5KgGTZnn0+l7VS3EoBwF/3lM75EWD/XNEG1LtGiyhuYYGSxjGvDlugt'
+        'ctwfh8LUU4whuCJwdRKjAO2FCh+fWb3UDnW/yrOifyTMjcDD1j6J+o+zW2c0OZ2gjNI0X+U9VStU'
+        'vL71R5P38VljK+/lmyNtIRBpm1sF1AHNYT1O5s2WClIMy+OKamgEvi7G9EWn0polidEp2RcmvHbK'
+        'CD0973ufkTa93XDNuwIFA1pBloup25pgBb2Tb8Qd+/ZK/048fQSf5vw4c9UwPK/Hi0bp4MGOuwoV'
+        'txPgiVucM81QiTN/7JzaYyEEI/dF9q7SHdEPDGBXgWLlUyla4sMFMTMe3f2oXlSc2VtkR4+1PqG1'
+        '1i7Mr1MeSRS5lPEn6++NcPY9tF+hgU1KTX0shi6D5hVTWn5uF5eg6/LRvxT0GZeY4aPYz58WEigM'
+        'GOAopoMs8o67iMG3HUL1Pp+O5CeoiaSw03h592/ZiPXhULJ2oyVnWvgy0byA4YJr+tZx6d9Vubhm'
+        'gqNI3OWNluDT2oT9z+P113RM9cmYLgNyq4+278v2d4uSAXANZwzLwbgXNdOKCv6eEqaThkL/fBTI'
+        'ZfLw13DxKKi/mbiFws75eNv+Q3JdTq/C3l5lL1elVJlsZhygBMtb/4tFebaK0lETqokiHCLfvBOA'
+        'jqWZdJza9MAnHUfQjmqodZ3/ynywmsDuvxpllvj3WSTU/ek51jCbDRvLposQF1iWJzZne061xFLz'
+        'VlYn5DVVtc07leONfVxkHa0iB4BN8cdUpHMYgDb9cW/r6ypnjnCeJlcGKKIqPK4fEzhD1RaAVYWH'
+        'sIZHz71cVewSht8qt5qGquwKf7KVv73vwbTkem3OA/KmEF3phd7siJ08bqS9dXmcOgpGRNK+2YIg'
+        'lEhnfOo96rQqlzBwRGmxacpTzTXl60IkLkMpqgrROys7w8tEcQU5UsHRaFUNjPVcWgHWFU5aTP2n'
+        'Y0oMkDHBORLDhmL8NWbCjqcbQe3W/Ci3wWmu8JVSpyJRdv2KR5z9MG37NQlHGvRfLysx7foDUMJo'
+        'pVeLUQGB0APPvYKRv2zq57MhDfhSENksK5Ke1AhLuIuB+hBUabsrIQDhb9DmbUgLip8GwxHddIK1'
+        'CzN7aKdnuHXZjAhl2cD2fddTbUP+cYJV+zqoK7n9KjOCelRpHzGyzCqqSssqhYOu2Av+LVlhJoyD'
+        '+R1MciKrWpAgeHksFrVpz+e7sHQETx+quRwihlxQxsamt7QiXVbBh4GzGAaqTb1pEx9h4Tsa50sn'
+        'IYxRK20dtVZlqrFx5zVzGuw04KYreBYupmkuFhxjbT0fT3ze7/yzhI0yezyp3S9wvVq9tPAxa+ER'
+        'HHExZzKHsg3Ko28iKgGKKly3ja+FDzijTwcz3rkXxOsxAtBgYjRwdbBNE2pv8sL4TERXdbx760+h'
+        'w9euSphhO6pSkqvcvqdi6BxtA2zdDWGRH+Sl4C0rShZuT/BUNDT0AyGFFYjr77yIgHZX7rYOaeWR'
+        'TfSZqPum2nU1dcQsTsrspp1QmPPLgRQKMRtELauTk31cP6ko7FxLB8hI+TVtvsro2PXWPAQ8VpLO'
+        '7GzX/pDQ8xjZVjSmtW6rtLWPQr7rY8EO7LUUqB0dT/n9lCiZ4KLP9DDUblzw8+kylMWEenFsoPTs'
+        '4Ju4ewRK2U3bhXl++p3CrGCVvv1IDPlQJo9nmC5KU+VAVyZfqhBjrU/za1z5nsiRJwbpq59LstKv'
+        'ioRLJ+4Tj5s/zawvqAjS/Z7Fszr57RsvvZepGZEgXVFdEuFHAbcAAbY40YGKP+L8eMuFt3TghnMm'
+        'KViD7kOaKvAGhEuH3oYdtkX/HJhqSX4Hn3NkjgfuG96UuezhCesZKHOAZE/zAlX96C5TOfan21ul'
+        '+7yXhcJA9siEjZeP0fwoabLzshaBMna87kqp/toNMmUD2wYTISjvhT+irVR4lUI6vlCuCNFz5y6U'
+        'g1+2JGeBE8lAEAKmvjVm6WxQiiYXpn3AtVRqJ2WJ0+J0I4ZB1RzHEbuVEvoqwUXis2qgKfwLBLaK'
+        'GabxMRjxM93lyNdGGFVWQu9LXSdk6t8dFyDK/3g65nQDhvntC4jMMelhm0JqPNfvtuDcpCIHbUfx'
+        'a2Fg/RcnS64Hz2Trl5wfScmSb+mgItTJVSudW7GK/mCSsfzR7fTQbwBkVGN4BVxUUaEnqvO2g7JY'
+        'QSOYt+JvktJTNa8g3bE6Y2jEu/j7r804DauZg7ChzjmFWE3eybRWSCRtRJmRf5MmEwBjspgSRyF9'
+        'TWEQnRhx/UtdaxUbsQTxk2ymigI2Zmw9qlzpr8Fdye7dHv+ESzRgY4ArlmAQmdwtwv29UnUK+wGo'
+        'bwj22HDTlpBN0GzCD2FiO22BKXO5xcPAgnoH2nGOj/nGruBRopdLRGXoQDWffOas3YiUpgZuIr5J'
+        'IV+L5n4kXHPoXvfsoBPQN2+xjKoKMpNqtetJu/4SunEBFru74Cyjpvnx/3HZpprPupLBL/a9gkjs'
+        '5eKKRorcU1dfAyxclczA0TWvz4TDwpLddOkFVW/iyU4DTdaKtzefwEBGXdeGjRavT5qPF+s5L2uP'
+        '8GWS96t3Obpx3nwZcJHbjcYhNRyzESORFj8RU3rPPiYhBMoLneNLT+OwxTyj/Im+r0oaJIG5i/9S'
+        'wBdtG8P5PoP0a8lPa94g12PFeoyGvKVfGx2U7ey8sULnOHxhxBguserh5U6U/OgxoDohLOSuMALO'
+        'pAI8Gf2K3u8soSVUshLJmKqN3TsHzq49uT0CMKCiT69OECIVCP6cNYez7G1ssv3aECVia6tFvWVh'
+        'DPgYq+VxBpjM9yFmdKoDYEbAI0JRwCNFW0HDEEHBNOZLk9r664f6yNYZmxmm4gixKdiKwPH7VMCG'
+        'Oob+ISgVtum4YTtSJPcSZdXEJ4XwIVwWyyuq07iDpkyAEXx6TMKvgMItEq3WZkm29q+OTQaq3+1w'
+        'teWOQGduHP8e1msCLWE5qUNc58Bhzzf660BVPHXBWALL4TfpmvzT26Lb5YuuFWTVwkdvKT5jzXj+'
+        'Bb/L4d8P9gMhLgyPxKDjYJboE/3s6uan1iB+ons8pIW8MXt7UYvpamL3wghPDd6ZSXII18lWxDGD'
+        'TeMQ6j6Aaj2XQpP2Qj1s+LmF1pIMnsppSmtNvrlYNwyijfMz2lDjAX82lCfanV9HZz1fcjkfsDv5'
+        'g40vyrHiTmtjbRuAFWS0qSmD0SJlygaE9gkMVxF8HDkvcXxqkffOkgzZNtJL9lKOBSOborbIw9k8'
+        'gcrgC9MaE3uyQUwCpHC08fkHfrmBLpjtUU91OaB6feIqY0sJhhLuQhAgD9714L9PwuLZm6pK8LtZ'
+        'ECH68etnJHC8g6WpYtuNT+jtv7RFMhx3pHB+OEKra896rfvd4TezrEu3kw6+gIK88szTgqiDkAqD'
+        'x31Mb/s0z0geMHYzXf6GoJ+enLU7tYBMWq1/Yum6l5cutaY2ibLJlBsYuNz9X6OCNDdB19hVJXn+'
+        'XWaiJub3D0Xv0yPgWIAVizGcjZw1AJ4yLHYsyvjJZXFkoqS1YYQboH/+rGQGSUvjW1mDxkqwZX7D'
+        'ui21g3efOexuh9s0/rqJl/3gJkCimCsUGQXCoAEe/Pgyp5FW4F5gM4aj9CPQLWLBUhZXhMmkFJjt'
+        'oFvjwXY6c2CHxfku1xlpmYYqhUDicG12qaZyQ6ELR0ioaWwYiMoEIaMnttfu9I/od4QgMDYQgT5n'
+        'kZx8+JIpojn3Asp3JDQUsEZbu6q1UypftCmR1ElbdLK0Lf/tNcnPcUgcmw2MGMQZDoCsAqPc9Q9o'
+        'bdXukl8CKZAMWNvqj17bW+B2XFEtWHwvw7jRP90ztCGTX/DFQNKFAxFpS/fLJkjjWZkV+8t8YfPq'
+        'fylCbMwEpX5peUkuaNkGZcJuKuTsQS2QNzEXo9beByTNVQcg+E7KUknjFMp5eH4bypMx1J0I6wLT'
+        'krdnB/9s2O1RriN6lBS5uc1eksCe4U/mrZZk1Fk7GvyumTBpnYlvcjLQkpeeA1PN5+UDD+SxtwSe'
+        'Z/hldPJP9s1XYyOITmSU2u2OO0t6ZwHg7mRUpTSRWlMa8jIlbUm7+tApxWljfyzBgHOQNgzSn/4J'
+        'O42UZHTdTFmAA0rzXt1FtEluBxE6KePlTgbB/01z4AQiBJL8CegKcuFzdV/nYknvbFs2dIde1aos'
+        'J0oWb7IUrHA4AHf7V/UQnYD5QGpzF6N8o1dnyKXU2kX73NDtKRIpFq/9AioMCDFOkyN1nnZLigVQ'
+        'VqvHbR6UP0ufBI94fZuCMJHoicsUmBuL/XvkZq82UNCcgvAJjRoszjBQ4lYcZQCzMBowlIhqzSNW'
+        'omi/InE1+BguGmrtujmtbtK29IsZnMSrDgd14/XVOQI/bEpsuglyPukjTz9FprPLMN7t2QE67Ehc'
+        'VxfpNuBa9rpgaWQTpOIelqmWRJdndVBVVPpB75qemesUbLGfudQvcomD0onAAuMJCY7ZpItqBi1r'
+        '99yXwzYCWtqcs21Cra3DdbU4Bio2ARcmq4CRUwqk+nJrHtJlTmnI6WBS2Fe1PzMd3ogq8fmSHKUg'
+        'zP2VwMlV4W/bgRwBlfV2DKEe889QwmAimreAZvk+5O6QAyhHX7J9PbKUBjgE+I26eGBn6kOtMts9'
+        '6+872zOCAmmF0FXqA1DjAMXcG7R/CQ/fzGVET9ZKWy4q+yyQiBYDrz+hqyV/CoGF/SxkiyOhRVu1'
+        'sJKHWDr1/j2k+sgJYtKVqQijN8/2iTM6MaQkBNreNt4cDvnSBhJaO9Ci6MuJ5y2daRom6BkHtn/l'
+        'Hl+ToWRE2/VjhPQULxY8zlmrifQGfkcadiJlGDTUF/w8s++6KZsU/nmMNloVgAiwfsT9bapYD0/Y'
+        'ZOI27bgvmp5vqIfxWgyD5DhT/Z900GeaBihU3iBdD5bTSSotdJJTKUgvI6VoSKzeVmUiAokrI3Dw'
+        'jbReb2a9sRlrJtFLFCn0Z42xJ/00o7yxCwHXOoZc34VLXqMCpqGuPkYls5FYAOp8b7Ws5LJp4zvw'
+        'U3MZabTLxIp9HFo+IX9yWfMzl+vvSn6DYqNoShr3hsfV6UM4+RMDy5975TYT6RiHpVUtBGrz24ye'
+        'H8XokOazfxWBzeky+TnyQDzu0tR/rzuesuMjXT/CKdDGDqgebIsnQQkKyJrLbcqdxHgPCWORbMzh'
+        'IXAxPwL3JHKcRDL1T3XvxSJ5i9jSmwZBXwtOjyOcXWwmX11+hPM9LybHdG2cr37wpJ/VZi3EbbXU'
+        'ucN7Ikynqxr171v9y5o32SzjqVIu3wvpTwMay0JLScnNsI+gf07sLBorFVjaJRVElKdhEzMd67Zi'
+        'WL7ja8hbI7hL+BLjyMPRRu//RYJO/o3w9VvOy5xOAwYHXHTUKWZjjIhfxM9TdQmBWjFvXBbMjFXV'
+        'V6dCOhEsHUt2EZHFxAGN8Efmihxu/T8CHinKU9pdlhgb5xOzYaHBnwNTVPiu6xGna4NIkoHKht2W'
+        '/Xi4fHq7e6HaleqtbTVLkX6F6fyynVdJNF7xq6LCn7USkk8Z7vQE7hCyTVLIT6gCL3t66YZ4qSkQ'
+        'skgcCiG0U62alYZ5mdJuhvyv8/zatdK3NL6w3dc9JCK3SraZ94hKouelNDDxB5PUWM3Hgk6W69E/'
+        'l+Kr0ge0uPalA+vffTEnQh6paWUMo1fslUF+DI/hc8P1zdQPdf9bV1dzucWJmk3NOeqQCsAdpSx/'
+        'oWnG230lpagdHFxUTId41nAHF1LiRY1X08FT/liOgmtUmBK5rUAvwzMNcMDT7AfftIO6TjnpPhMV'
+        '7OpGisneYKVZW5vUoRdcWugq1pKDjLYcj5wFEpe2HstDbpA3FIit5tgl/Sv99TOEMIFM/pfcwrVN'
+        'rOsvTQ8iUOsjZO2dz/w0Lf18kD1ICdMdf/HgzcPogkQOYeQKWiXRJmKsV6jqksfts3C2GkW9VMiJ'
+        'NiBaECj/2A4eYB9feU1DOyZpJGbtNaU97A0t8CCefgfEz7XlZHMcWX1iOYWkGkuXTwcPKJq9tSdK'
+        'aMOFSwLb1DAGfngINlmhucorFRprlV9bSMR9hEm2lTCvWEUnSxst9nc/CC37oqHrVD18z2+Ha1E/'
+        'ab+2B/pZ7u3DZrZxzokc4fydwQYGEDZz808ZWshnBxvEiVj2SO5WSE4ZMDT5uIEf5RRSO6OarkT6'
+        '5BxPVR1byxdL+eYuMpklbBb/yJPQpK8aLsrRWALOlx/n4xPNMFZ9OS0OLemNsjz68msjXzfWTi7R'
+        'goMjHtnV7zrY/okPCQa7IMKiyqJwpuCHY6MiepBeOXcJBtzTVARUeQO3djUNO/J0jjqIrJeN7sr+'
+        'aGdPww6e6Oi8cYsa/CJ7DUK8JTkBEI21JLyY4RRJJmBqNwOOfPsaTgEZFx3l4MrfKOoJYGh29LTv'
+        'fRmGBlsQZKw1Qtzl6sNYGAQ2Fq0zjuqWkKSvWESlPjcC7KOt34hHf2T33prbUg5jswyv4jE2HM4x'
+        '7BcYGOGM2lpgGPSRE6yoGk1Ia8yihvsBZe98aq0k6HpEK+FuQrk2RWhZm98KShRAehE15dROl7sd'
+        'vQczAB4mIMmcXaWoNgBKVaRLpB7VDHWiOZIQt2gkE6Mwy1oqczHWBYbqDpBCsWBVr0xQoBNlqIHE'
+        'wsNgqoGpo0I54KaPrnuQZqlXWvL6W2eQxHWVI4V4d4PMjYxi5nizzUrl/MhMsdqExqDmYCIPLxE5'
+        'qJsNwF2CCVkCGqHOWIqzIBePmdRwKZBVYUIAWXpEzOJ/ko9h029fCJe10X5oC0fCbf+QUOBScQK4'
+        'w8s30NEId9f+cFdZa5cySUD9zg9rPLrqGPhLPNUh4fpozKRlgC9s94X2ZPXQZI2eK0koZiKjK9vG'
+        'GCASLuT6DxsfZ/C2TZAafHY2cyS1dGjnIZkHjRvzlLlgM0n2McQigsYecCHnWhAq+3xEQfnnyAb1'
+        'qW5SwlhZghbUfJI88NJgNsQPKTeKR9wckjvkxQLrC4z1qk+ckjzEGdM1a1lnibYBKM0Eg2ZzWSwH'
+        'U04siCMA7IG9Pp5x5+mfWlf+mqGz4Qi/uq+J1A7iuvQdt1l+NC57VR5P94ip29eFNHZ2/2F7rhdH'
+        'BoTshZUmCwWidjovicS6+GZB0Hn6eFTsp1nZNGcMMdECmxoc97il/DMI2Ey9Hvhbex7oi0JvzRsw'
+        'fAj5ZndRfhlP8lc3Qa44Kxlq1HmWBHrZDql7cY6cm5IylSqsecCDvBkYnfUkY7/8tMuj8IX+Vlod'
+        '+AP4dQ1olfQqxDvFSyiNUpgFhr1ZU9b3VmTujg/r+x+5Q3HC5TgBobgrR2pi5q9UP56jr7B/3T5O'
+        '+R18uk0853eiEdlaIaHsHV/yfPZmd7f8F12xQQ10z5a2CsEcHCW6RPR/FVFk8vTBNzmbylPlt8ed'
+        'uoDaHKHsEuDaQa0xXN1lBkydDy3xl0w7U9OvoB2kNcpFPXhtFamojmMnBzY5xmdwTfVLQ3JWokZn'
+        '4+PX9Imfs+vcH4YM3C7ik7cFewH40MV04cLwz+iWt6P65+8tnYGRhauYZyJ5W0Hwm2DBG/YnBdCR'
+        'Uy/nncBsU+i8heGIA9VBYSoScVAiZ2CDUgS/e4iUH8ZWKq/7WwShiH8PZdWP8yyOf+CijKpd7xiZ'
+        '18CyI1XLYc3QacHmpYUxpBwrbSkITWWPprx51kTG7dTUrAXKS7fLNULlSqf3iO7Bnsqb0zzn1Qwi'
+        'c/KOQLWhytqn4KXY8lx8kChoZdwHVVI/uXx3d84Y125yOluauAdY2xiH0WvHAuYxkR5ay2GebGK2'
+        'emZ+DZx76ujIA1uYjs4dyyWjMtsevAATn5LAV4q+bIyLgfO4XYI5dTC+pMJ6aTV4Ahh7CXEd8NjO'
+        'g8RBR7I+g2GXNMJ3t0Ix2gVPFRapfX8qGcw+h28l/8f+R29VihqAyP49mJ+dxpTE7q7I9NvufL+L'
+        '37k8UlVwXpEysf9n/bhZ6Y+w3QdFvllhcRKsFbGYXhZ5pD+REkc+/Hl5dDhPLbQeGFKWqkcBt3Ez'
+        'D5UkDgwIgjt4B7vXS402Ng2qwpF3OhGxQRokzJ/ZOhcISziZk+WSx57Pp2/hXRiFONOtBlKATi5K'
+        '2KRwSXVVPbxoddwuwNHEA8CU6v8XOeBQOEkeyRDIt3be2ssWNK/9U1slyRjZF97b5rf1HviVs7qr'
+        'KV+eDgLDIHVKgUmO9Ig94mRRHsBYqMCHbrxlvppsKXf0GAsIpJPtXczifpm9EuMuSMpx/wozc3Jc'
+        '2qPhlrzUdU/R2hZIR1iinUujSJMVyyK/DFgJChWa41nYurExIussBfaG3M+K630qZmYsZ60g4ZgQ'
+        'a3+NpGrQyNZgGXvDN9UO5B2zPYZFr8CQajrPrnsH5ea/3Kp2BNvCWffSKojSMcSHSonY564NIsbn'
+        'WpApCYdyFZIqaXWJack4YM319LFszoF5XRfKtyLOiF+UrVrZI2FnCRyxv+a6f1wOmu2vPeX+SvOa'
+        'lOxaDZ28vtBAd6I8s8u9dMCRIjt8+6t+K454uuqDBdd0VhsBJcrCB6OHmD4lZ7NVOMejTRFgPbta'
+        'btCKdyqRlpS9EHhxdp10DTKVB85909vjoMPQCJKDg13oY7cds393TaOs1y0ASvbuyZxxDTNVQgOh'
+        'WxW6RkiV7HtjO8tQGPlMcBDa3JX1dL57sVXBhZSWkVPDS2alT9HLqEEMK6TZKM3ot6y2yk12wykH'
+        'fuM8pSY0eWRCaRqRKo3ZKtmYCRiJC5u6xQmoOlJNN5YXBakbse1B0kSrisJR6DOCQHZp8x16nUA8'
+        'GFKMpi8PXZnEskJfVs1tDjmfgkhXPkOHQT0R5kEW6q7FYXQUt0IciAjRzTb4vMqzioP7MPwBhSyW'
+        'YtkmOIL1DQ++Cx5Rr/Ln2ZxuUY9RgbVRzN6d5ioKYv0rOaWw9v0m+Gff6SvLGe+PMiXtPkw8CU1d'
+        'OFMvCBXd4v4roSbQ1qAoXN/bEQTlHAUnZp4JwTHdm1OHbaJkJodJatG6i6RKiSRC3XLgm8TCXlf4'
+        'Hso9GzKqLuepTPntIpMfy42/mmwQ9RCkQqw8JIdN2zrr01owiPDUTrMujWBu/bYnnZDqtc8Sqnct'
+        'sYg8lyr5+6QgHdEzuhuGBnRxMxX9eeEGfZOAfyCqQnfg8vmAcbQT9qnRAjbXzbUS6pCq35HfLKbv'
+        'pxhq4JGpDVtLWXjP19AWUF/6oJHihvKr0mWYH21e3F2erG/Rv84eZPqd/S/wqJx0ql4DX5V1MLO1'
+        'KhjfIyxNCGTdLzM6tdyrCviZhBwV4zS1KiuZhcu0pi67sDZsTxRsyBfDfHLCuIODz0DmioFZwD4V'
+        '0G8WwS1KoOpiupw44OiswHn4A5kYJpeZTlByGEBS1v3lMoxK8G5THvInlsdaan4yCi0hK+GKGir8'
+        'GImtdNMrXckpgmSGrI5JzPihmjgdvpSJXPjk4SJNDKD5rEz8qMDU7VSKRYnZQvb9R3ubfiOEIePp'
+        'S5bakVeMN2VFpSXgiZUd2vOwY8jnHOAzInAzUB+nS491kyyhtp1NgpubrmkAw49A3yPFp1bedul/'
+        'xeB9fUPf1JWW3HQC1K9vlURQiy1ek+oVkQpirmDRJ6VJTF/4IWvJHjRfw5oFHhepZMgBPLdtmkqP'
+        'd6XzmsnqxknrokJceRphs52EGvQqAd/hAFBgUTZRBnhacAK+wVaNZljSyA67mRz9ugfXAWJWHIn6'
+        'aAQrHwHViJ+np6QBYfDMF3ff5etnUnrgz26ZNZ/AfyoaZoPgY7KadvOa0y1+1+peARfg2aaGsS4H'
+        '+cB3wYvb3bLtdrxl7KjXbP7BU5xhy+K8bsPreb0J7su9wELDiu2SYfhG384AHCKprdItKA8VddP3'
+        '2btrYVqSqZdIted212EhiHf0k+smFYZoAt1D9jbfgkhz0kTLJ/87uxbG3LI2xvwQtQlxCrVv2GmO'
+        'exh6zXqxyscdVcwyu279GmLsyifn6rDT/s/MR+egjyp6Ibw1UXM+ksj8Sj6Bw7/1a6ipKie4A4sZ'
+        'jEz4Oyw4pRZemAsdmdEuZ4AfEF5MtYcc/9w9axKEnKefrij6YbfiBBnA0CFSJJjanh+OKAB/qs8A'
+        'w+ZxCoDCbnS3cpRlow95gTuJRTAJvsRoCWWYR2THSC7oXP9oixggVROzfv/t/6viT/9MTxvN5ghT'
+        't1IewVKAN3a0XYWIu79PqsQgW/61AEM5hPsauhpJHAJZGEkexPJhZI8Nzcxjn8SXD5jGLEDpyVX5'
+        'dEjGL8yY9aoW++ymHWoV6ahJVttnshtog6wUUICb6hPZ8ZKV1vzHJyVz5Jot2/pdXLN9DTA3Bsp+'
+        'OcU/cAuvmOejpPZNTGpH1CWVSGA2FX6RkVhpX0j/vi6+WaEZhpObVHfIx/G+wHaCx8gFXMMDdoEi'
+        'T4IlVdumCEgi62HJrLoZ6UTpOU4SMKpJ4/3mvG+rh6xt1tS2aXOBfMBO33A71BzQlQlQcevzrQ8P'
+        'TGqZyvGZMmRh7R/t7R6rRi6d6X2AlAXi3GsHNIANURkce9uz0OVzD9OU6TWdYykUxScwV+DUlHe6'
+        'DxbO+WC71GNr61dcu6uXE21vAqKkloWhL+G38OqA1aq4TFBa34mSvyn1Ceca0ea1EdxqEAcHOj3j'
+        'avEwCD1iaOjHntTQhy92pzhrIsCrawz43tXYyRhKQRXnQs19PoI9eH1M1yr1jILhQTGToeaIfrvc'
+        '0YDm2W+HwGEvTeopur8QGGWURZt0FOrtrxxCYB3gvqPTAdwLMxS09cR1XgNgBEn41f4fL9MiLi6b'
+        'gIodQMmlPLA4Wl1IUhwoL2btPBrtnjfG5/r7/V7zsUQK2FhVegd8tRmLNfVkxeYrgzPsUEiIb0xh'
+        'BYQTMu2o6wuiAchpbL/N3ZdZ9YQWZp9ezXPcu6NUWkXrpidb488QeOXXja5APb/d97SqlvqaFmCe'
+        'yaAVtI3MH02k/wNhA/Sve+xzFYMCEnnYD9mal+7A85hA/M8wZ+hJpJ282/Kpl4gZVReY+yleMNew'
+        'RWKNRkbqcyAnS65f0uJH5J12sWS72oPV5aigexJbNa+tW7JhgFe0lZN6S9R4vWGrLqr+RgKEEp/F'
+        'bC8V87qVz75cePUtIoyg+/5EMP9mSa08/N41bwdDJZmwhZRNk2D8QbbcACSgZP4FdXsQc4vLwY7b'
+        'cdKhP0ngjDef/0eYAnx0ib6oOhjyxVq/2DHRI70Ua1aS7J3Hl3EOvSjDMyHyUXzTUYCY/x6YFWm7'
+        '/TdkGagdA5fe5JM5ovSXfKSvHj19Xru+ys82M0qiMzWg7uUTMRrZlAGcy8uE32e4KwBNzaJjWNaW'
+        'KRjP4kSHzgtc998HbPgjZ+s7DKd+/vOLMf1GdE9pzRzRCHDq/FxDDMoJKMyci7h3i0tc5CEYjcGP'
+        'aIwoUvEJaqgEwXBhOQFKEESpyGpPTCgwg2XUcnL6wtPuEdC7TpK6SAPqw9Zn6Q1C7EeNTyxhiUx7'
+        'orw7XQkuPGXcFNqqXcV0Hjdk7OIfM+xXeAiyBxVKdRe4Dd+aW+MEypDebDqv0tjD+dH4Lgtm+6zN'
+        'c1IB098nTuMlEmhIiyuzqTBq+AkM/I4CzIIvpn6uqaJhPFAQZaDy7gk5906fWIVbcee4PjacBJV3'
+        'aChaOymr824yW8y/auhlprL8LFPjfZTVuINyQSsFrvKPKMhGnTCwgdBNKBuGm6F7+y8JXsUIdy/j'
+        '2yYt7n9u3Zu0lZxLqToB8T+hETJ83Lg8tAR3bNJdh2v7jKuc5hehWfnxZ/iXUfN/HicWZnLRe1o9'
+        'qoI9ebULeS2ayQTL9SrrdQlTXdF/uxL5Fk9t5HRgp3vAfeDQYBT2gh3TihXvoLAA8JSPXgEv7uaU'
+        'c85yet2NYeEZOjF3kMCxjs9VMyA4jG5ckLLtqdkeTvc8RsuWnpe5G85NajCwS2tSYYkIh1L1pA6+'
+        'NcfXY1L1eIHXJxMp0BpA726RBpAIBB01STpWzVPAgld7AOgFprIOPN7iMzkJRmdzmnerZaKsgPAV'
+        'wjxltxgi7+oaZ4xw7YsISw3EnfERRiX8B0aqvR+Fq0YaFBkl05f+LyCQdTEzZeELfLbVPFZ1xEXW'
+        'n+5c2REkl4013vgMSpwRjjOqIccFsFVWJH74B9Rf2I1RedZ/NjNC5BP/iYE9yUp8U93J8EWmsQ30'
+        'n9gn53Nby8PBzQmmliJz/iK7NtvyGu64yaJnEgDNyG6AtY19jUZ7ehc4qBWKOvfx+LTzeLA+XV+F'
+        'iQOMR3Hrcb152UjV3i9W0QjYR+FGhNW+lgWtta4eQL7tqzN/Z/vLZWITZ02wBgoM74Z+rfOBPgsg'
+        '3y0e7IGBArxSCOTWX5zbr1jN6krALcDJVNvkH67E3A/XbToMDlZ1JXF2NaBCa7DKFU6WYTqWVhCh'
+        'fgg5pwu7z0e5dZ0vAZcPr2TiGiF2rWBBskZyR+DHjy64uScTMyhi2fP5Inzsn2Rk37eDNyAjiNh4'
+        'Ozv51hMSeEMj+IivmAi/EW/VVp96YNaEnjEazSHl7OsDxUugWFJ+A7Cv9WO25/94jEb+YtP+Lfow'
+        'Rr49UuDDy2LV8yl+7XMtt4sNMTzUHuPYkk4U6W22NRXdA8bCtXWqOhm9rVFtwAf7b6kCwD96c8ct'
+        '82p7AwcAf1BKCr2f2D08LDSeWSuC3bumACPSMq1NaInYMMH8mZyspICvUrq0524EL/EVGozLuOPA'
+        'coohU7f30OSNLiRrOhAUSfel7MumqmGqrUKJGVurYxhnD7NPHhA3JSF9qFBGd9BfTTlf+xWt5qnK'
+        'O/3oe2KFjquThj0MDP+DAwQ+vy8Q5LgA3nXvhWYqIuEVmOn+5z72+PNdlb78ab3Y9C5DoWJYlnNf'
+        'RmFc3lVJWYxQVCExr5Fn8YR9jaV6Tk0HGwuKhnvelVhQ9DHPN3qo5U6uI3m8RBo3A1tHuJHMqAtr'
+        'ad2bv4EIKZTNahoRSJqmWSWxGjDSyYOHAWDWgYsGDCsCBwF0UsKmMwQcpP63BPdhkjMwnNsj6axS'
+        'rwbaxcPdASlLnze84Vk+AnI3JyOyY32WPuVkKB+5CAFvgTUo0U8X0ifymyprey9N53pHvihQkdLe'
+        'MdcAvgYDQEvMyNVLVqhQZ7QCI1ALmHbAjkDlSTS5Cck6mkk8WpdpEF9TPz48WtRDMUOxSCqisUvf'
+        'k7fz/ZbnaueCBO8zf0pS4bLWJ581Bszn1j6QoqKqmyvqCB+oNX9ICgBhtHSYJLSQ0FZyXetMkdk7'
+        'RMK3c0maYhImgOu3PMjWy7QBe55CMBtjkSeXT0vGyW5n2Ngu/EjcPPlPKpP/fkMiG8+CzmH6znpo'
+        'oletQhpZ27VbV4mpIJELDrLWDqcnzV+9Ev0q/oog13o8Nx0fX+39Emwvba6wVrkDdD1pZfkOsyCL'
+        'zgAFpV1z3xQbb1ATO4YmjXxQvJuDThWGzOgATOuvZltNIOqDrJzg8IWsiDLg6uSH0FJYgnf54gtc'
+        'EbtIxqk+DCO/3ty/evqw8C0y6HK14+iZ4rUcu+eufmVWcL0uaxlSc0cXY36e/FIqQSsrkS3S9ZQC'
+        'K4ng4x5iVPQzMz/o3SlGNGNLxeWEDQ/uxRtrn6ir/DJpvZ458xNB1tfH5ReTbsvRg1p+ATK+IfuW'
+        'PQowmAtVOAoAkBlijkCTr8bW2TDr8+xJZ8un24EfSJ8CteWd2IPnlsuPlZyVH566eT1xgMqwYwnc'
+        'sVLvpLRnHqEdJbGP//HMSS82QQy9t0JBL33iuRdQeSHEnu9yAh9XrhB3XzR1ocWSgpHiYj8lXZia'
+        'yhV7uQcliFdSRvJ8aqKJQprKOWug2GKMgOCYr5UBzfiaf3c9xiMz3onjffWy8HePjuDgiL3sZdxp'
+        'lkEaZvhHVEo/bDc7KPHfVNpRe+hSpIo1k7/4FZdn81zBFhdypOSzdBDl2MX9XFXTr6bzy5a3lO9W'
+        'AoPivtik1nWaPNnRJsV2Go15ZeGa4U6+HJIGOi//QC0LEIUlJQBY3fDyeunL2T8IrAthvwt9cIqd'
+        'yahJxwhDTl7JrFirD4D3ocNY/Rhi5hW8Zdmr/KSc3xN1+BVlTQ9dLatK8g1w9GvXTvmRS84iciDm'
+        '9sNEKw21IjKwdq28hDfVQHN7XdQuVfOpqaeBafGhewzZecXFH0MQGtrObMiPob2GRFXHIF0mZyEw'
+        'fyI5djwmIVcR/MhuicnCN6s/eWKMaWmqAPsTUoLMlAtbysj8xluoXRy7YEVvX22IVJRJ2AmD1k9R'
+        'dgdL4Wy/RQKDcHs3foXbDEcOXwmSuWqnBjP72B6dwjp44QfO94Tp2XH06b839c1o5+qIIf9xfHQD'
+        'R4iNqvHly8vS7v71qyW3A9QiYAeMOUi4Ym/Q4WAelKc+zgrLsQYtn+FmZbLbjXjVoCgewQkzou3E'
+        '/O1IeWdwh4/zuQ48/ogElJeYpajfn4bQqkI0XuH9HL6iSsvI78iD5t+8Cw5QkYrXqZ8HoJzkC3b0'
+        'yhBtu45/qTjEuBM2+5Yj+u0qik3G26gMTounZq2Gb5o+fDWv6/xw53q6CcvV8CDZbrQHCgRpcMAy'
+        'iFIafaJ6ZHx33zJZtYpbpApBJ2qtiQC6fxMKUqyT8ru3jiMrkyKTGToSyCXuwhQSLIwwQeUCHNFS'
+        'HeH1hDqk5HwTywDTRnelIfysT6hgOFSQeeg5na05lMUkydG06xoNl2OFKfAtDwMPpsCCaXgtpIaP'
+        'xF5daZ+dqFOtQD+aKaukvvw9PuWKb0WNcTP/Vr14SjAJe4TEA4YjfWSMKldWARSxNsAe0PAHVsLA'
+        'IpPmvexhDyzDlezPgkBJ0YlfshyZPHcvElOBcFgXK/dkpZRwwEO1q3q/P/gBpF7KofXN9abuLVSD'
+        'QivH7puUH0E+yUdOFM/6uCxjd1DmkuDmBfI/SH1HbEM9V5xhcm0fTAHlRX7mbuwrzpZ8ZuljkM9W'
+        'rNcLxMGxJjngx6JW6XDFeYrNBRz2ZR/vdOswUOyGpzY4mut8MookyQelp07efPXGm0TWaWCd3bQ1'
+        '2cTbE+Y0/z1OLS4Hf7xQjJ4jhBPgX/e1/9E4kyd7oSUWvNvP1KiCLMTixjeOefuAGBFerCv34tZ6'
+        'dsab5Q8czmhET4zDsOcEYbc4Zy9Bz8qqFuDkZatcFbuiNM/WE7O+7XT0OAJje4pWOnrN9LS57mTX'
+        'npYB32p+JXxP86gzN3ZPKPJfdZeBkV0y1QrTP6pvnnSTjAQPfgYyNNTlba4j4rSiyWjZukKyTU7c'
+        'IJE6wvaND46Af6k0kKxLY6ygim5s5ljy67GHNihFbW3tro2y1OG+NHMkclopL1TWEsS+E95hlKBd'
+        'SrZ58nBUOVNEvPrwrLIVjrWGiDtaOljXzoiXy6La9XcYuZ5+KPYlqzw23SaIvDruEnaVmBqVtL2C'
+        'ZmfK7DUZC1MjVrGTRzIcK1LBbxEsNiFs0NtUJ7UBBBbZfsrciEt8RiuwKMmYjdRWzKzMSQRPiWqX'
+        'IaLbsdqqsOUFLoCqBgTYfFh3ZwDmxUnPnD1N2iF/ra3l/dEUjqsw7SEO8QYM1RUyMz2gp214uwwA'
+        'JMDrBwUaD1K6xcTwguu8KB/yu0NDH5AEwO5WSnsML6CWHzIlzxnRCXP17DpJ2bKEMv32/ur/Kzdr'
+        'Fy59f/dPuGYvL05fqzJnwHYOk4ahhA8aGlWEGtTfB0Ow4W/SDvrfDmrnB/FViL9bVP4+S22ZKBcW'
+        'o+f1rg4xS2n4Dmw4GmpqF5KrkEhJB3KXt2nYpaG/RJsfPcgfzLDNt5Frsj2VfaaOcnw0rH4r/LaK'
+        'k0TqlKMo01vzJKsr77fX6zANIyZCc4/hlE1JC9KolakbqvX7f0WGOweKbTBoaJy8fieiBko6JvQT'
+        'tgS7n2BDdGUng62LkIsEfewDWuX2L2MTDQc+6BxT2pH23+Ydqwk1uhcmqICuYwKMXBY0SUwjwsE7'
+        'bjYM6mey6RKlS1pNPAI586P1Hw/EvkpLhhYt/nUisHk/jR9l5myAwgmmu4SH+1tVo2qZOuWOir09'
+        'ItUOCLLRymEH70rEKzelYJwNewEi0v6q9Nv05GECH2NqLP0p8ugih7SXTF0PRJA5qk2elJbhPsR2'
+        '029/PwfC0mqA8PHycq0qhzF4TqLRLp33vDvRoFdzCx2ByBQKQ27QjmOjlv1fRMmqIoXJXARr747j'
+        'Z95UNgCOAzhd4GqWNZRUovsu33IQaXi4PhkrwBfOL2X06Xlp+Cw2uLh15AwkKuiqp5AAD/cVU0fI'
+        '1ejuUI7TsSk824lCad+F/KmuOkqyKMI6v71c2gygTRY0LjxpWJEU64CFBePsSasuRet1ay+dXzwu'
+        'FMqzFwh7dgErjgB2Ey6DeKOoXpdrY6lTZgAAUpTSD0S+h1nKqOcK2uBun00y39D/n1/uU127tOe6'
+        'xAth3iXeOzVxqKHHYSzPgaFnyhA3Yf7hy38rA0hDpvJ2vwel6znCdZvIY1Po/alGb80vcf7mbx9x'
+        'G5MWguxUJKu7lCvA8Ugu7/9rAbHP/E25plicL5xmL1JdqSSzkm9o6tDWVprBopI9ZkRaU/DCyJAI'
+        'ZLmqd2P+fB1yGDj65NttF8xLJqx0pGMXk8WRiYy9kXo6PawJzkIuF1hixuHwkpR0yGOHCDGe/kWe'
+        't2QxHwPvicqTKeRMu0gBfMp+4hkDM+wmV2vTQj2HRilB16zYGn6P7B70bsTxcQzraNJkeozchTF4'
+        '0UAeppopeQo6KFnFIMeMqrDxvDUWCtbIu36U2gUCShnHc/S35iCv0/MWVRnrcY/IA6EC4MwG1xAe'
+        '9xiMqjOSbDKiqkx5TfyB1ZV70NJbzaEnuBM9jspgorYJ1UjSquwF+9repH7nw/2q1ge27BWZ6Xsq'
+        'aX1yltoIHQYu1OQG5chacvIG6FtgPhW+JQubpK0UC4KJtALhYsdrTlkRs1wG5l+DRtA3nb939mLx'
+        'eYJcZXc6ShamecTyOvmMHBOFn9qEPJrBgn2EFG7p41E3yRjYQe13bCAGHpe949mryuh/2GbLvWj+'
+        'QNgg15SvlC904uBTys1Omxv01I4b393e4XBSeEG46N2/eIbjs3UPemJR69K+K2FJKeQr4NK1r7zQ'
+        'A35N0fxTT/Vz8zjOiYmOM2YugU7doJw1//qMG6FdOTHg+DTGYNrTmKCQoO8DXyDvvb+ukoffbJug'
+        'Sms8VxazHLdkl0TjdA30/5LKuPRvWihxvsyVQk+JacvBDMQhXu5ccYGZg3KKQImz3t38Mo2ARzT8'
+        'OWxJADYbucYNnUOWIx0BgcLWeMBEcQZMoAqzqNfWnzG7vF/amIr3+YLCEr91ygPJqkGU7VxlroOK'
+        'JUGe3HqrU11x6+ndmLirGE5tpTlIpXzk0Q+H9fsPiPVm/+NcejYBBzaaPyuxLCwmSAOscnf9B6sE'
+        '5HQqYejr4jlFz1jn6F7O4KSZNDj9LXIORzm+q/czjFIDjvxiBVKL+ExC7CZeKCzUmpDSvfFRspbs'
+        'Vc/xH58tNjOQybGKr2uE5hectPfY/mSbPHqrCbuPK8+nEJg/rK1po4mgKw9IV+NgTqVm141Fojlr'
+        'omE4ywLVLF8Jh1SRT0x4XQQawhsRYzzZL1NPB5Xx1dXsvISLdjKRFXzpm/O2Lw/FyxPXva4aoWak'
+        'RENj+n0caHAusI2wBuocQfuwwuw/TGZ01qXnVLR4/+qlFtuddO/xuhuOe+Oy6i8KtXMMkYEKXPJ1'
+        'tvuRQTLEt7QOqOzTIuZEDOR1y4PovmDZp43N+AMHSnXo4fxfL6XM81Mrgfvau26kmc6d8R/XPI98'
+        'Gow8Q8D1C/BcM3KmyI4huR9InSwcQ7sI0KPYo07in8Qra9aui60UnNalmrBfP5sq63Jhf6xTKJwr'
+        '7akH376e12g0Tg0pZEkdaUZe9y+kBfn4U6drz9dUUbpfu/KSfyJbGqJ3SspL7STW4xzNDe/nzjh1'
+        'SvCJGw1msxaQLH5QfmlqBRRQZgrB4s1U9AMGYoX+KItYQFB13D3YRhnAmYtdB3cbyBW1HOLYAoFp'
+        'LrmLo7tlApcSBOQzohmRuC9fbslFiownpuiygrEsAqLa/bXH7it98eH90z6kQNPqz8ffCHfKKq7k'
+        'xoqpIKMNH0bn5Cp+K5rb1RNpp1ZKYnhujwNYS2EErLRjCGkHXr+mGrKGM4MLwSyfatiCx5eWWCHI'
+        'QJ0/kwE2bYqL1lEROxuigpo3jKolN+hqeq2lKpSldCby4WzQPUA9s6QtxWBpCY1RqJFf+WURwsbr'
+        'T2HJGZQnfGBSKWi4GJlzJMoLfb6H24/Qup8bUWkwWjgVWCgcr8j9Nupcgg0DwvBfHoy9sTNUGSh2'
+        'yCB9UeDaM5DDc39bc53XPAtfwIjvHpmuAMi26M26f6SC0UbB1eO4PKaI3czAElbXSGYW7d6Ie5EX'
+        'EumfeZaV+k4gMN/H+blZkTvWbmQ1jQWzhBXMdjJjtg4U0p4/AcBYb6SCTFu/TXp41cumB7gnOyd0'
+        '7LsuM7xFJonYhCWSTKmh4kL9Zq++/JZcYb+i1lbGgHcDdVNfjVZUi4Q+qKbRH7QphbnQuGBXuW5M'
+        'sEhUr8/dek9fC3Ywvex0qylW3WqWT8yPeIuYBAe+QhUk+t2OlDWtDTLgvXDNHTLfZk2Oy900rJU9'
+        'ufRctJx0eAK0f3+/M0vHz+40yG9qALyOw671kzsPY4lPqF+vbhAzlC3SAzQtyLZNZ7YLIQuzCUBz'
+        'VVjp7H4GEGdTbFbiU+qIjpTeblcH1VFSva8BrPiObnms/xscyrL0TLpjokcHS0Emfji7Uq1awYVc'
+        'E3oPziIkq+GMUksrpHXRIhxaOZS3erRw54xzyy1FG7AMlhjon3FXPwhqpFqxCItT66d/yJqS6Mlr'
+        '1IEXNnduBOyP0Avw+x0mXVTOFAXeS4pzFVO2i17NIPk0fmKkTeauW3unu8d1Wskragz7xWjQ9ka9'
+        'ttkyjHMLznuHqOkAaymgab+B5JC3TcmugR9H5nS4UF2raC87Sc/FDFARKzT0EKWRnTuisKsQU/ui'
+        '65TuNT+yo069xAV7WAlTqrGSIZ4oNLAuPwW0Oo8nVHFnG/jXrvO4xuUF/dsp/oexZU7nDcVXd2wE'
+        'wrJnheSjpbqdRvLBEAgPMCMW5fcyPg1Ix6V8AOOiIOLPZTvSmLT0oEO6TW3PKdxN4uxL1OE+kz+3'
+        'fpiFduDUb0REORNLADsSjymoZ6c3NCi1UWY1H0wP2un1a8YRdWzrQyXkCr14e1gvwF4kxDdBLfu0'
+        'paSl6s7iMn9MfttfH7vjbZL+4jLfJAK7xkUpHhItfIv1hXmTQtT4mJvCqlqUJL7ePwi7U1GyfcwM'
+        'A9eHTezPdLQKMR4C9uMc+48eiBZAOREKGqfjfWpOFXdMvcQ3GSyDiS4rC7e4E3FCBNNdzBoPG8W3'
+        'YGRRBuHMEozWgpoyBphkU5/O5bc0mdXK/GIK8dEDjGV6adxkWe3z3F7YP5QDyd0d1N26YBW/laeg'
+        'GSmp/mRiQC1+K8q9K1z3bS8+wbgiB72M6WXNTr8B4o3j1+bBJrdcF54SpmXToMxgDHNWB8WaER61'
+        'RAcxLxZ/E1m0z7djSv/SUE/dPYJ0q/lrwC2pVrIR6bG324NKmOtE83NdnKWzmBnFX+jXa6N1tGi8'
+        'zkBF6Za8gg68OqinWHRsw4Yoiuuv3DbwXE8Me97Ak0FJfz2A23NvUucSNRzIpqcJu5THew23M4r8'
+        'g+oSgW3qBbjks74Gh4ddFGwVYmg2i3n/CR98y9oGGQ3ifW7DfsVSVCma/izrnhSZt1lo6e+7yPMq'
+        'dwyroUfU4OlzML7ZlhL1g0G9K0XTOyR+SVlFcgc/qWkdNdHcYGYSYVoNFYAlE4DqCEaMenlQhngG'
+        '3G0qbh9/lzlkEtYaOx/g1/ZE4MOmRkD/pdlaRrP2AZ5WbyGdz6stlmjcATUe+M1C+QZQe1nBkiWg'
+        'lWSSSQ49BmjGo3TN2avgEICuDQDBXOLdRBvcZhq+Kz1Yz5fHI6K8vJ9LLAaMPqldTVPIAIEFX+aa'
+        'axLEFNbGZd5+FwcY9Ro/ZAM0Zv0bR+d7BWLPNty9qAiDvBJ3DxdhXPdVhZg0CjqOSmwQVOp6ylBs'
+        'ahyK78BIF+uNh3TOaTg+bZLAlWuIdaQFCbeavmstKAKiUAHbwOL/0/pLPzh0mRSqCnd4+wuV/gls'
+        '4k3/YB0pEBjz6NLyftbfy65ddNaLYunKpMc0UXevKJ1Xw1zE1JTVR0AK9GLnELBGhs+Q5HXsKUDR'
+        '2l88JYMrf8TjJHvIeMvVTVUbsm1BPPXGXfSTq9ythNiykIpjus0GGrlvVZifL9jeHyFj9EKuyPGG'
+        '8vkRyKC1auLBUASbCKO0UMEif4+Xi/bVumqbYISPAPFXQTY47BMr6+zZDGZEMOdnm5yAIBXNjbkv'
+        '4uy5uv4kYJTqk3fBFZOSpn9WLN0T/aOUIG1XjE09+kkV7BF1VAXiLPrZZZ7wtfir9w667EEFY7fY'
+        '9uZBYM1G+zlN1/8Yf36uqmExYTKJGi1tm9/wuGG1TVsYTsuEsE+jQ9M3HdgWAxUX8RpH+A0tC9In'
+        'CYfjtSdTKjaTnQGH+QhyjFVsQ9VM/QzQmizXeIvpCU5iTDGxrfhnN9Nd0tOHT2aCBqPKAZKA9v/M'
+        'bk0SM1BeJZZjoD4axyiFNlUAIlSU1DhqRwmGFLhNDoRm6tl8Br3vX67aAN7Wxv2Gx8IEFk4mrT3Q'
+        '6tki0sFc9redWR6NRq0r141vjcEitUfSyXlwNaV8F8deXECRbKhBjwvhKjaHwLSRwSoZXauQnqY6'
+        'HaCuKYXxCnECmBjWPzKrcWZ4hEbIUdAyORFYDqq02a8HDptpiWXhNpR6z5d0HS3nx/9mnOjRxlPG'
+        'XBkp7tMARjTOpvSX4wtw0bmyQQ9G4PQff3ngixGuPxvvuGlDPk8zJLhFGu+hUXj3H7hobIfgcbXO'
+        '6CwOrOj0o6jW0Xzg7V+ZWCkyjWjbfQ09cXEd6Ps4AYxFcqYV3TA58Yt6T45efbh9LJchE4Ypoli5'
+        'VStWzUgIzPEQ2K2JAtgh0iW3MTBr+Qewh+23faMJTNlrLIsfsB+FIRSa8w8N9WZRgr3GZz9Vsth5'
+        'mKAuaXDbrQvYgCM85Yxf3PTf8HIYPg/AqRUdYsZzPzSSeqWYEZJX0G0EdBeC8+BKoTCRp98qBWo/'
+        'NpU3si/qF1aUippP9qjoZDb23ZM4gtvmPm1pRGt5yxIXMg04rhIVZwGEpaAPcTClYcMdSoG//XDl'
+        'mZULXIyphnxl4jq9xA1YvCWK+Kfp+Try2jJAfw4mb0USgJb9AhiiWIcMnW8bE2LpRHTo+Zfg6c3W'
+        'vLN35X8pcBrUiS4laYnDYKmRInz4WjkiBFowOLJmqn7hRxIyctnB8orKa+g9TGpkZqxAyKx1Adan'
+        'c4DoPbaJKx9620MpzfZeWQlJwomgggIzE1GLX0qxR+oQmQSOUAnS7dKLR/7vcGP8FFctGjIVc4Lg'
+        'qmxHsKEfoS4MSm8UCEY4s5yO+LcNFfurth79Q/ie+maNtxg4VZrlOpPkCXqC71hVru+BJU6KOviV'
+        'jndNawPjA3HKb9f8I8EeXDjbJOdr4bst3EnAUOQSd14f5B7yQqDJ9TEhmtrcpwbI5iNr0Zh7B6Zt'
+        'hmPVMDrVCOrZFyex7VH1VFJl20Tvb7nPxTGvtyud0Wp6j3I/kspOVFPc+7xKbPVJc9IFNFXeBK+9'
+        '0x67l1ad1NW26rbnyNWoyyVf+npbvLJ1BtbB4ZY/7OvNaTvSbFv7SC6gDR8TPLgs0kPYFBkRIBbK'
+        'tLuDQXX6R+tGzZa085wSOAUzJTp3yWVJnI9lp731tUT39hcfybObfYNwSlVsZE4RTaQyZIw68CZH'
+        'vpNMzaBXqpTQMKmUmGahs9A3AWR1qRMx8oduMaVpyCO65txJmK4aKQ8OHbB259jlyFY5EK7d8o5T'
+        'hw15lGjrWuFMnUeyNhv1onLMkL8qtPJYALUzJWsXe0wQoOTJ+ZLp4FOarHHkMNvnQp4H3JF8Ii+X'
+        'FvSWA4v9b3CbeAansV76hgjbqwxdSD6qTQtJWpPYDFKgOt7Dhcgx94CMHF6BYQRoLfky8gKrjGfU'
+        'QYuUE+IhAxZw/w32rpTdcQHvfxENHRgW5AXubvji7qu+9oy0AKVQIQxffUWUCqO66Czf/YHhS1PW'
+        '79yKNm8CoD2ys+dzntydY9MWHg8ZEFkfGJ/GZYqJZqHMznkyv+m7MZFNN7N7PRLkysCG/wIQkkbk'
+        'qFrWd2V8JFbipSzeYRVI4mNv8dSTxshJ4nQCfKktH7Hc0cSnCw/WBwy1eKwOoEvM6xzOhAgRccP4'
+        'Y+jnA7hNvakMd3LU6EePkY07vVHsHxgp1+0aickwIRJjpsD2Uz7s2+j8uPfLFK/tFxLaaTkL0I7E'
+        'wiCctOwlfkOtpdOOwzrjW9MG1hH/ekFDC6HwjDTx55Ve48sKWy9XY0MIGGHPhw9iYpus3j2aIwEf'
+        'AbIeCfYi198nK6ulEenBVyYAYe9Qlyb4l6nrG0NUwby3ckqdr9IHdeSDfd3nj1+AO3NHZlFj0RjP'
+        'DgHHD+cs8R75Hj6alUiDA9QhBD6v8My6nVeHSyWRx71zqTRKY2MDeaqIbUhHKcuxmicnt2tDf10H'
+        'oNN69ciPlQpw8Yk2uKorCT8OvKqmuivOyg70KIzJk9YxQeOAF7PryUpOIB4D8PMgMKXuPSK5cfKC'
+        'LjsbTI9dipGq4RlDHSrLE916NFxxanRLqde2jFUkZZagIaC5gH7vF+X3VKrDdibtgdKx3c1c48v7'
+        'OUpNTIviZOoiB7c3zLIyANgvn7+Xt2K+CBB9qz4wCSyVv9uffe2jFOlm7VIwLp5UfwVcEFn5OM8F'
+        'm9uvYktF8Vqb5lMUx/MeuDTDJJJ84Ftn5gmw2my/R72ejjPKgCdbP5TGoRhn750JOYSSUPDkyPIp'
+        '21xSWRAeKgl67GfzLJuYFBvuXxbkGaBUbkinGaETpPgz8Vkft1tjLyff+aTczPJwGAWVbVpLBhyj'
+        'VRhiJCmc2uLK+mG1JH5Z3axPpNfC1bQBeiLWC0OBVjbQ7uwIXeRbYo6eZy/oAyA8Y1FCcUTrXuHh'
+        'CdBPbKb1c5RPcLx0Zt/unMupNSvphSy4BfP9Hg2dHoegW6QeBmk3c68+XGVdUw53XZdebFRjoKPg'
+        'kFWDZU+wJT/Rgv1pWjuwYtmQLsdh9hmmzwHgyvt3BRs9MwxqskbALOTRNX866xFGeyV+pJDrQbIl'
+        'fpi8aYpreJZsIfS9jisF2RklcsBMgExRmNlFWNevE3uc10seNbTV7oisSbJ++2yrImXwOer25awm'
+        'XKyoZZQPDdGhrURrC3OeooyrosrysrNDJ1UmYVFzSLUCETAMbDN/mmFqzLQviQx9GCbSjvpKPVFB'
+        '8EkwmuvBgA0A/r9fD0qMBBK6/3IrNtkI5uj/yqq698p100iKyk9f0yLXngGjvpCJxUxDh5zVhrJf'
+        'Ekyfyl+ArEMW71Dsj0gNEYRO+wcJ/Zv6gIYSp7dvyC8AczdxCrlR1782C4lA23iO9ApBUa4b4Lie'
+        'YPKuciIpoI+daWFKYkdvuFTax+sTsUsq5ATVnbyNpivKpDkBejXEQKjyaoFb+5XZNRGu9ZcZCaYi'
+        'okI2lUCGF3ruonfXVNBcQKfhGaHg8FE13KHSXbzBUm0CUeQ4UwZ27NDnoHxvauAghGyUMB+HLB5L'
+        '+BIe8LZTNORprhbkvr4whDcF6IaXjwpsin42Wu9k8DUGmGj0TSb+jcj5fEqRcKwOhlVFAsdKMe8B'
+        'mDmJw56APjY8XQOWIhjqIelN+tbbp5sKcKHMY0UZToTwNCFrOXW7ioXj26W0k1T/QMMNdTOpn4f5'
+        'VKqFkW4iQnJPysr1uJaoEiHhKalYL7/6f+tTKGPs6x3YsPndWcwkB+g2sKdxzvDoW4Oqm6PQYZ4y'
+        'lICsk6DBCQSxWvVd+avvXJLoZSCNVRmaFSuABlLDoSGHi9AVbFKRwo7rxhy1CEVxvXDDWXM1cjmp'
+        'YFQOgtO9Vq0R9gDlHNBLVuVX2g6zSIxLWgIB2UM2G1Umjvb34OyarKKc7UHVCyJCLQSKzAWhAmyp'
+        'havOAdaMnhbeyafG835j46TXRuwUGFyOIPrNm4+pN41TJNvvTEramGhHzjwIp2b8J3XOptSvJGyX'
+        'NM02vuAO8IJB/+wv7wbGSqdH7sngtxaQsOcZicoIaMuB3ltCtnHHjuVkfd+QbO7QCgHezYZAcbNy'
+        'oFC+i8q+81n+mjiCiT1luNRVWTFxjPKOQ+HW6u0v9gaT8y6D2b9DPdtSMMqLv+SfyvFv43kvZ+Yp'
+        'cBRSM9MAezGx7oEZK5HELhBW11QrGZrV5++6hRdB3O40M6/sfl0++686VpI1cextPdYhzSeCwv2K'
+        'bJDYpt72dvP/xpQYygh9mjkcqO6whPRYdVNfGLmHnNq/gzcGrO2Hy6JEpzRLPTzcyJhnw/d4kSRV'
+        '8UjFsyLHYaGpivodrzMXhD90m9MP+vOazXa0fZhPuTNqmr7a2OHmJsqsc/O8G9Ck06AIg+3sA923'
+        'YxeKIL0nykg3QrUXnWHu6KLQh/uDIcoa5lbLAIweJ8kBjbFODe8NXLvKGoeyv/yi60h8sS6Z4gPI'
+        '9nBJLjld67LyAySZZ9UVvfxOvh5is9QrIa/fuEzqoGkXkwAqBViCEuWpXu7b5MZoNdmBvwK6ZWGJ'
+        '+oVF6BacjuoJUO9NyvLGg0PPIW2/UQsCHRLc81enKke7XjqWwyxw7tBvjNJlc4BuAkTJOL7K1SDc'
+        'bi0l63JW3J5cXoL9YAGfFyKmDP6ykfHsledTFepSjl8CWO/l0H0yMSuUHBuTE1ws1aN9Zfc4qjhf'
+        'WLTpIqIGX7txHHUGBukkj37zQLM9KKLus0q7kkJ4rJHZDl6P89+hl6TKo3QSHwzfHoDdJZbxaCWW'
+        'GEXC7/cJIPX6nnz0vvXBJgu0V0XZFisyJ/SC5z47mNuMyquDcyYlMDMvs073B50gZ98m49AjMwtX'
+        'whEI3KO/9/vyvtMNNDm4elA7ExPdR0C0oCVqm1eeWl96SsZ3uFy0TozvuFMw0bIIahV7+jroyZMv'
+        'rBn7DPBuPHblDq7wXmgqsmAP/VHxvSIYnlWbdGNPoW+Sp83ydnnGuCjxB/AaQFg00BP2fuQIggXI'
+        'CYX5k9sQFZgPTchnT9dV5QZutn0S+qMEaAgbyllq9TXq2ePCkj7S8Yo/WoAixR8M1cEOU5IruJKt'
+        'EUf4t+j4fIZBMxekiEQSQyGCQorDCRpqZiM+weSzy+apeDBJmp647KUEsgDFcPduRbDGkfbIZYxN'
+        'ITPC4lyl3ydDK5H7K+NxrmFpRYCC3i0tu9PRBLuJ0ZPA5udq6zqo1+4Cx59NBig5uioDlj6md6WH'
+        'qoGexxxTVUjZfRMiTzeTCB5f/EWnhA1uwsYBgY5jSCKwnOTiXJFxnNnrnZS6rzhfHdZD9nW2PTvB'
+        'K+m0SOUQ9+Uyn4yvA2JSTyLpkzjtRcNsG/OUeBkwKkb1F9Lf8U3y3aaLn0whPt/VNwjvFqd2XPoC'
+        '2FFI6/Kanq+zIBFH33lqPAUlEkHa3/W1sxo+PmvXe/11IDc/XDURXC42wA3yPzHFe6cw3aKRlZlI'
+        'KoB/kDXZ2OIh0iFigcbkXHsqqekKQYAaFEMQcEKpxWL9dkh+RA7l7QNjbrGaFT80TvefjtCQpCen'
+        'g3sLx+5uD/LQItfs29UftX45E+em0qi2J1f6mOhJEum0oN5PSpCWL6zCX6CffQlcSoMGc1MCpGHg'
+        'Kr4z3xy48pohB3B4JfxQKZoKgFkrM715NsguDM7RXFV7F0CQa65mRMwZG0vpZlIvh3QMmn0ttfpi'
+        'vuVULgXIM6xNdCRKuunLJ6yDawKNyxFZqbZ9aj7xEtak/WAOKgLSb7UN9wrFeBy5K+77547l2pU4'
+        'uUdF9Gwoya9FUL/8csTpUoFxubw1i49rZAF6Ww7VhuZNchjvkKCljyxCFoYEaBQ2LXZaJp4XJrVZ'
+        'EPkqN8yzRx4x8uvgCEEieMckYDGpX+nW7I5AAnVua/y2jdAHzAJ3pdyhyjI2rAwh1il97pD8PoqS'
+        'LBVoilCiaFLhKUTXP5jJYxAits8pCfa14ZsOE0zXw6k7iwHm0pAAOyNs8/I4+W9UV2QnzSQKx6Z6'
+        '7Q9ZJDLl6bXS8GBw+UV2++YHR5/bTqKr4yS2KJUu5QEOsrDJZE54KT46+9MJsWylo2hA/5H4mRni'
+        'fYHMJEjOpdNqQjXilZI95nxLapCrkXj9jATf6kILiiJO53Wz5FgugvveWiZwwkXPyfhewNvSD9Qa'
+        'aKtKr4GxRJyPu8lGFnFHQo/ezrjQVHtgo6JRriHsCbQDHIFiWZJPVOXP6ChCPqhWdcEGov+yjIgv'
+        'EZuM2UJnI0R//cCFbh3yaQ2hWoTueNRrNxc3FGT9yvZ6usCFmYsA1Kqx49EXOVUvyp7ysAapQm/w'
+        'QR0avywqUfInwzm/8sWlH+jO/aitPrAwxBa9tD47DpS9IJLgl9i+MuhOyYyyBlm3cJKYyQnzvhI3'
+        'dXuFt+oCiickG+hBTvggnPTPtzT+KfIhnPpC0ac3KMbRsbUwGoitinVNr5vUUwYdvlPO+Yzdg8D/'
+        'v3DcN20l/+eeEB517pZDj9rX1WJMIPEv3gNLEiHS+I+8DSt9aP/zeO4WyQZWOtAHK1CA0cofjHQK'
+        'jNqeNz+EXiACIPqi8Ic9wEnOkRpHR2W4bI5jlQxL5u1uI6QiMDQVQBQHzxyGK6SIPYoWtx3rOddS'
+        '1b/iIm2+3aoHxqKAx0fW+DahzoiDr7gm/8PsaOhqtgzI34l3cc3NSW08csLTilcBaMY2/wZvcecn'
+        '9MVM1lfB/nzxDDybtL0ZEZExPN09eLuHyl/gHYLUBoF+XEvdWCeO/6LGiHwhXVccpumD9JXZwTM0'
+        'NUYYy/otgyKrK5un9R6wKoZlBIQy5Sur0LMz5PSL1NxoYsli36b0A4ZpNIxgzSS0eGyzVdlCnc5R'
+        'p2/yrbWK+ZE4eNHGBET0P9iPtCvBDO9CaZnRh/w7SDq0xOMH9xWkH3fqeaCTHaSrmVixMFAYinn1'
+        '+aGcpsVs8P+plKMXzMKlKW5P6nOqQJj93GaUh2D8qAsBYSIdjJRm2VSJfEqft2JZnFBQV3oi0WcA'
+        'Zli0Hg3jeIME5d0GlEAMV8PNQRRSAkylC2URZwJk7OgqvqSp0ASGNXxfLrunx8NkUKvTwL0HboPG'
+        'mGAXMLjJyqJgCcCKuIjsoleQlQDu3F4if4xaoL8G0mZL0yiN11UL6QP4do1gM+tzcaqfrbS//oJU'
+        'XdnA9Tw0jmRnUFpUBMMqVvmigB8jIuomDdklkwLx87AUvCiD/pFK1R9zGg/kg9xCKxEvak5QsUrh'
+        'tGBJFX0+5/iT8LXaw5hQZbreTbcZXfSvLoLpY1ZMu0sVbK1yYvo+geFJXB9fH2JLnt9gD2m9RO13'
+        '9BoinUn+dLPAKvO299WVS0Grb2D9agIoYlfui/quyLlPf+k4BnHNPQgQlvdumhtXoWtbEnBF7Ke3'
+        'VCjiSiw9pioBDHzPRe+oUSqAYyX2P8JyAZD7tc8xdtDYMeumumZfqbGgAtuaLzQFeyJ9QaCKLMHR'
+        '7zaEvLXepXxQtSa1Y9P0heKbonPyjh6LetyI04x+3n8OvY/fh8oX276jJHT5k7Z+1Lh1G5019wRY'
+        'cAMeKOjcXEdUDbiKcjNUgmZcqTy4i4N3P5zSiJmG4kf2k70R6/dXSaw1UDFMBoHByVrxNJH4DmNx'
+        '8kU+9p2wnheg7j5wGAImgmy41RN2E4IA6rdPVHgfDHBkzlhJfBLzSnqAqmiriYU48gsjChiuzoTY'
+        'UPJ5gbXa8x/HPj9iraGH2ZglKsgThKvpO5K+LageIht1CntqaA0STjGU39PJPKYO4wPI//5dxi8w'
+        'G01kJeazwPrF4xZzm2tFmW03ukbPkx3NOb5cL0FeuB2mzhz+r5ANoCH+n+EdwxZmmD9ZJJtDrdwA'
+        'NlZicVen/FsxiTtMeDL4XCYriMWnk/xdtqzXyzPmUdobxpfiH13FRv14ctFH0gZPI3VbtqanQscl'
+        '+EBJ83SHjxgZiuqiD6gjhZ7zkgsIzSo5TJUoLtXqdEonkDCEFVijSnRAwaa8LZye1peRopi8/+3i'
+        'HsmkB8bPAk/1WywPwG43AIrjho0Piptn0CXdBLve+yn+Puplm8ST32ltwOnxeuH5N+ip4QW0Ig9o'
+        'Rw6tuP7/SbJ7LZil1YKvWieQoOPqGpgNWFQQJaWnAwFvOQGcDwYSiKYc5sjsdzsi0O9JWkohH8EM'
+        'W12xqJYJGUeUmDSCtMgvwFWR0CsxxOAgoqAY8g4oLQSfJuiiJYUugH3aRTSeYZ/THIS0sR0GFhuw'
+        'DtujZLXWFZNSyve4PHcLxbqkzZoiiZhq/QKSoA6LO4J2Gl/DJjzpgOSGk/jr45ROX+nkLwQFtsQp'
+        'lZ3rxFM6HScdHLZcRnK2NuNobukYPCc47VXag+38bSv1h664hbqd5Lsve6tpAzJliredRnhMr0TI'
+        'i7n09d0+z8W6zsIEVc7NyoVS0Aj58dRb3T0y6bZl/+uHObTekxJzS2nmA+WAzA+/bzJyc89iDIJL'
+        'd94Hly9KuHC2FO7Kfe6GkLVfGXhznOyWzNYqCHvVYUsTLUrFd1f2ZgNg58R0aEX6JD57P2MCPp9V'
+        'AXm63MRDF6KgQCBN+xlX/IPyxFbcaJLW5ARjK9lGyOAg4cJCiWKHH4T/52Yb/un5UpXBpbclQmV6'
+        '4lJHY0bdw7vz1IM5MKNuL35Xmw190vifn7tVJDF2ESg835NNnO+be6GRguL8HhEwIv1LK6Vz9PT0'
+        'TgX06e4il0zsRzaLZt5Vg3KM/jB2PKpfuabzFONCdbb51MqhyGSg+Zfyw/ioH+p7AOppNUmgmEg+'
+        'HHmTiwTdW59GgUb+XEbZNk/RQldxICbPbXEQB9BntaWebPqZiBxl2iY3KpflLHIH5SAL9gdiQS52'
+        'x+Fu5IyoQIAWDTkAiumPThF+ryb6DWYvjjk3oELK7u1Ht0o7/U5BxPQoB9XSyaE+qzwKutPheqMU'
+        'Bq4TtZrt+PPwCYAMK9Ign3Frn88O9w3UgQhHz4Y0aPV9OXOWXapX2Ho4rbmKRJMj9cSdkpkCwiER'
+        'NygfK2QPNIT74duqJynY5Ck4+lDJVC/ZrjIPWuXQoVRXL29+FYLC4dQi528QSNt6g/NBD4Gj0vGC'
+        'WBvvB0My5kIeUhYbMjswTrK6YNCufMf9lYOpEZJqJaiQA26qPiZ5T3icqmD32guqBzfalL5mC7NC'
+        'VNCNfZ9O6Itpeq7T2qsjhicg4UZ3FQO9C6kC4yt6o0pwHU+S6llb4wZCwhk3pJLvMgbqVEWiGTk1'
+        'Q2MMRRxE/qGSLBK6k+Nn0QfbXqDgBgSJxpz/2R4EaMpW7LLYFhOQ5vL0lxZKeT4xma/aWKAx+Yov'
+        'Ff6MCebGM8bSC5jNVWUufAo0ot2GynO+LNz9qw9VCLbjUbH+pZcgD4YZ8ruM7KT590UpVUeSAp71'
+        'Ri8m6S/agzIuRv1E0PNFyhdj38MlHL8W2Jj7MuLzuLXk4JLVuZpCfZi0zq4H+FHTEe+RCPU1wlBQ'
+        'SN3tYjgU157cw4zUlT7auLqQBBLjm1vTHtilRbLwAiobX6Yi7nlLt+DW0m13hH28PhKHN+P5rsH+'
+        'aGT9l1If9iqgS3ag6f/PPuX/mio9X1YEsqZq4mcAnqhYxCnuKiHQpFmGA+XLJy+kCfhwM0cenyjr'
+        'VyE8YkNyEUGjbbNmuHyQtGNfWvokWvYqNxdPyk/vsRwrqoGzYYtj4FWDm72ScWzoWQa7jV4Z2evM'
+        '+QEhgbNVX4kI1COLSNEPzPRIvS/yZOqjPqBO0kICsmAf5wsGY0DAKYw42PudSDiKD64QwL20k7S1'
+        'CD7HPSuswnwnJD+sgiQBrCnMKRCbqm5aD46JZIbty0DBreyVhInZzyXQ3s/vzBmsba3Ow7ozlQVl'
+        'xkV+YwOAwWgRNlJUTKoYdenGK3Tpbw9aqgYP/SC9qBqfSoIPEe+EgVo3Hkrmy4dCjOxm3giswLJc'
+        'ARwn3UD/ndIX64/+1817vXhOdH82xGeFaM3IpHyTgH/ZJEiepIU9cYGoOl6/DcJlrRYWoH3GLwBJ'
+        'DXeWVMjuykvFQLyLhrlXRzHgnE6mE6zGR12Lb5BgkZmxxPrWDkPtZCux3dsYh+J3yZwaKiOEhWrQ'
+        'XcDciSp3sQf9wV6f41ibCH/cu+Oub0ebbUTgCHHFAd4+Zh1l4UgP+Uh42NDtjouNl8H6++Y+h4jU'
+        'IYI5mlmGbcYqoC9Zb5VSXO05icBnWeWrK4YIR2VV1rGC7hcWAlcWa2SIolcBSUbLR3YP6iL1B/sh'
+        'EO+6H3PoGTfoIoAaSVMLUxt7ED4D8TvoBaNOCKxotBy8ZsSeA3l1uLx6Ak9BAXP5TRr8pOw4wFyA'
+        '+tfPrvyHUnI1m5wzxarsV8MLlh0f5vv3LFm/2rkZm6tiiSgFKL7habgs+LnYR0+WiITDRQmale3Z'
+        'wcgrUh9s6tqAI5rAFUPRAAqutZ3yAyypwtov/p6kaDLCrpICqw6USs4kImwTkESUWCzPhW3JowTL'
+        'DzgwEWDqvaBv9wFOZMTF/K0Ye+lpdAHwRAEg8qSHdbUTREsw1Fi55iwChZYtIZu/NILS+f3arv5Q'
+        'AdlZEeaz/Qy1+scCgT6XuBdF4twOF2jEu3toN09Qh46zHhThmfws66V20LfXRgnwc9+DUG13OdNU'
+        'WwzYccMmzAVtVv5Bu1AbXQPKCzG/eRjYUJBsz1pslb7gaLmzIlnjmnsJ+8Qtfzj3jvsU8M8Or8RQ'
+        's+K+k108wS/cfpFFsxQznUIujdf3ZGxr64GviBr//2jjnPIzDQJoXEv/nDUx+Mq7NxgKEbdjqTrQ'
+        'wO9cFxEYHzJn037pdvaSwQvmQkhUMqviwK30jsibVy4NFtQ220oNQQICu31Nsbk+9mNisXNQcYgD'
+        'Tyz//V3kNfE1UzIX4bPILlCHPF6jyk1IF4alQRZsivei63PSGJ2chcpshrEZY+Xm3aVewj+jgNjg'
+        'YjLnbie2yH829xJgJHt7NoQ6KQ++BbY31HGn3ANKGhxel0sLvU3fBAceJjKIeExX9sO3S8eNEZ7x'
+        'tERCn5prPB+qJzzXwhNCUIRt4b1msoR1/qPpfORAW86f5okxcVbJFyT0kFJ1e4DS45qE/zP5ipRr'
+        '4Dl987xwUdaHL/BpRhF92xKZ+/OM1+k6m5+5lbusmtRbahsjnedLmSFnZRi0hJtCxHKjk/RF6NGd'
+        '6zwhm0kKPnyMmr64j7qMUv0fLeYQr38+toDrj8nFQausZq+6RUU4DYzwezKxonSofB4167UB1be4'
+        'oededvwvHU6mfE1VxOsqJCy6rFN14ngGBSDNYSzbkrAIJwckIKtJT4KBDZg5Er/TwReNSN8zJDoL'
+        'dEk5n4kBOZ68g8D/oE9zp8m5QsFQ9Duuq2LlZQxmfYA/isjnvppPxkSU61Xb1anmaAgLBY32nWX3'
+        'Hcz/0EKVaHR1j/cE2EHuKsH+SOz2XeC2s0HwHa7lJjtERNvNnH0pp3cgCykNts+NRkN8RCnwU97C'
+        'tZLHAWnC6tGuJ3IGpvZW/EhF/t0H+Mws6p8aFQOkj6fUZ5Qr7/bOw0MYAHAYNM4f3g5HyCiD2UMH'
+        'Wd4OlR5/aDzTEAjYvdOzbiq74iaEcerDeuWesV6spZBiXmckonh9jFi8x23ArhCQL3kLF2LPVgRc'
+        'nYplNs6YPUmA1prhuYlT7m5v4PgvJ6BxSN3lgXxDI4dUQDAiEzksFtMpSeNm+dQrSHGEOm+6JMOo'
+        'MCnTE8G9sZynYChPcUl1Yo39nFVvO0P97AT/u71yUKM91DSjaxJZk9dgZYfnS/n++LiEHqahPq1S'
+        '7ossDrTFCg70YvJaHn98XtIw2URLSBzgEmgSyz+QMjI4DRqREfXFUlkTqxw5gV4VIbQmU8t3XPAP'
+        'g8uGKx/QQr++EgkmU8PchMPkRuKPmUVGF7ZYMAiLgDj2zW7+7hKBlfVUVn/C5radAJXleBJkd9ag'
+        'kmFzNmUL3tjFBJiI6+UBlCtvFj4d9WCLYFgSafgxq9tO6EBnIt3lcr+A+HwBl1ATB8mWWVhtiS6C'
+        'I8/FdwK5jnOht40y15eekrCtcyF+MkJibI6V7cdx6R9xF61GUhX7gPosTKjnleQ9RjGuE4TRDqbW'
+        '0eEfmfNDRplTLQdQiU6c2pXpMBMcdvTbqIJFJXlXVTq1wtf3TRCryysrYwSZ2UxZlC+5ZSzDzI2R'
+        'BHkUdJQhWLR2RQbo0C7RG/0yjjC7t7lxtaGYk3xsrPYpf2C8vVk3BdLiBkHO5jMM3uTLrIp131/2'
+        'LrplmbvW/KLUYbnfZCRjBVyaFkcuVutvuDg2G9NFOngPiBYx1YWWKlDvDH2oowOf8T/qt6ML99jY'
+        'I6ERe+ayVTQ+NX8Ic4u+kPe6ajJxI7F4/aRtiV2en43nJ4UqarkW6/IE/PWmgYxmiYziYqs/s/kx'
+        '7AyW9+C43S+ejuYzuLPsLPP8Le+F451pTra8YYFwdfPs2AfIJOJDayImR14hg/7iLgOFZaJINqFJ'
+        'WVMSuKAJHj8wM+QXaWa3uHn31v/UGXJqJoJU4YFhCLmboXa8P9p6da02ERwCJzTDt2C8v7vBT43U'
+        '3eWenRBpm/vCPfNqU7cIMv7ZOIGRuXBjAu4lCaGhzwimIe4F6rW0bXDX0RBoohy/e2vOgMvJoCjy'
+        '2CJRt5XOwe1/vO2qDD3NCdQQTMOxS79XaopRK5tAqBJzGa0uvh+r5btxgW7XQIDzhT3JIN9YxDZp'
+        'MWj1EvZD4/TwhSvWFhG8r41fBY5pMBdD+qr9dF80J9voszV9lwN3SwEb+YR/Qv4pwbf8yu8PWEEe'
+        'Vw6G/VDL8MX4CPRrGBqBXx1i7rN14TT+JKafJWvUhrWAOVuLO6rjUD09ZS7k0RMmv2j3OELO1HTw'
+        'KpgjgrxxQwsxOdYBx14u4zk2pli6vk259Ep/RV6xPI1LFmZrlvY80QOox1SDaj1s7yLMFQYvbwte'
+        'eMnrIsJLGe74r0wZl5VjKjpvUuwS8jMPTbYrsFH+ixvv8iXtcxKQa7I/7Cc2FmgPUKwDBrob+H10'
+        'bDQIZdnLSnQB0SL4oEWiQFtP8aNSaC/OoPwVtBYtWjSyc1QBFC0lQQsjDYq9B04Ho4NK4yRfjx1l'
+        'mnrUAuC0BVM/M4Y/t920ABfElnPB/SSkV1/LxEHW6NfyMjI1KX2gskJMef0BBRE7UzZSFfNW8fPu'
+        'PCTKL9YAWYELqAN3Nv4/ozuisz9f3jS3u4GeWolKPhXOw1ednKlhLiE2xWjZ2FqUtwryL2vU4IsW'
+        '9RmhvzwltYuT6DJXkd8n10tZh4Mp6zVvqCx1Esfg1rFQQSzZQLQNQtfvVa4iK+6/UmLk5BvF52y1'
+        '4KfMV+0M1rSjcI1QUqJGjtoULRBcxjlMSKPRHi2NIR2MODpwlQDN02FVxuh/lDix14zfpOFiDuCU'
+        'GUUmY4wKUJA+vdvKMxHFeVxqP0IhILsArVNbhhRfiHFb6OO1HUizC53g8tSZes4r+u8hLIPQY8OR'
+        'D4+mxjABeff/FcNitqqpO7zd9N4bwW6WpFXHaoLX7+ad4USPJDZpbCABp1TIKZ93NadYAXfAEna5'
+        'HifJfM4anmaGNNZLuIWBP564yaY7o3N6FcEicuODooAHkAl4fv+XbGzsQZKw/f4ZGuXi+3KDnBmG'
+        'ep2v5sKco9GmlENxQC8EQwuXScAXbY/1u/6TyxTvkHUYC+GjdgN/JlxSAz8lCPrNTq/SXxmqgryW'
+        'WX+X0OtjMm95ZIwoeZrschQkLyO//96RvDfsQsqDxAsMGt5uMeQXiXoytW6xwi4fommxXAOhpoAo'
+        'NWll5aA2YHSNjfTayBmTvOxUX4s57VdGlgulsDhbPL/4peyEXBEOKUMhywnocusSaL3dQQd31uOB'
+        '/CWSK9P2ThAaTWtNKGg5MaBzMWPrLrZMgvQAwFpa6cN1uODJ5P9k3GVdxDXpMlG9MnScWcBkCp+v'
+        'fD2Kqd2Qvm1tmaOck3GX/t2yDfO7wD+JYSVBsoOkM9l8qfHkD++bsfy+198cNn0iOY8DyFYQQ6XN'
+        'jTXxaPQxoahHhxxqGto/n01EOKsw6NPlqU0FvkOdZTX5xfjflVoiZK7Xzt1pHo9SH0B3yLx8V3ye'
+        'mZMt9A2UVFN45GWqdoF++zDk3sUnts1B6PsSefpwp8jpNj+lPWtd0a5zUKwhVfj0g/LuI2y3jGru'
+        'YUijv8y/X++x+SQVDBLrkymB5xSukmx8aXYTXzKrp0u+QYGDPpYp9Q4mbDFd7fBOz8s3/bx5D2SE'
+        'QbEzZWmoOvyNt7tKfA5hqxotnzVnknira/sDD6ueA6uHxZAPoJmkz7zdg1Zz//rS6fD00KxT1Rj7'
+        'Y58KXmvHgIQgI955PlwftxulVj9MEOt9s6wuF3qqkCp7rz8J8uFYxmMcsqb7F1xRIK5y9KLAnN+/'
+        'eH+Sj3qjqaXhvnjMGd4hRRyjIuYTbjUDaJ+7UDXOWmNlzcQ34bMg6xzdiBtqkgjkAp6h53MDn+yu'
+        'qVOKmgSztmJU8v80wC99wrbKT947P/+APuo8Jt8Glcm+uCF2NefY01fxfRjvaE37ozPv/xSRenfT'
+        'HJy/+3LlzMMOPGXmttKeB4wEBjHHhmRlhuKBrMk3SpMd4DE+hzPOXed8o0fFmfoF5oUIrg0FHqFT'
+        'Rf04b7qXHJl5828ZzLUSQg/LTTL1snTNjZjj4P+tejYHHlXCT2M1lvuCCPVuLRotG6lZe/mFi3yP'
+        'h7RLjXOX6OuKmZKU2s9ujwgRHb/N8opGpsfSaRGSWi/QKLFbrfUxyXayk3r+MfKs0rMWIRnnMz2p'
+        'hFH+/lLN79O5r6mg5ijRSKb0gF3EXBGm54oSnNFqLlA/puXFzt6AQmyQuMDdwGLXqNLEi1AFOn6W'
+        'StOw806Q4FL0mVJmMdqVaEAUBBbZjaK8++sQx9DQrxESJElKB0eST0wAfBF2PYx3ul1A8VUXSgHI'
+        'fBJcOHI/+/RIjw6REW/rFg6lhXEZgToPOPp7ndHzb4BYkrcn80QKuRZdVMwmiEHpT076DCn4dV90'
+        'SkplN/aa8/hQiwE8uomvxP2SbCXPDgsY1Xqf8jkzzrsVtVOuvgL5hXvYKneAzpIGOiEwXzULk3Pa'
+        'qi9CiLZOZ2ZKEQrccPTh0nCibZ+9VDMQGd847TGUuFD9ZSeWYzfDw4Bnaig+SkBbUVY0CDjRLsoX'
+        '2JKlJqHnPKHvm+OjJewkXemjeCiH8qXLHSHTNNyVbHk3+g2L0ZPxQggKV3BUw9l/4xKASVOxLfCT'
+        'FoQCWkMk//QF+eOmCIGNCkdCU64GVSS95eXRBvNyGWJONOZlR/cRYDUAPuyS5v4xhu3BrdkWVWna'
+        'CIxNqEdtYZFXS3YHm+fJdB8mfHyg7ISYikm5tyQ6pOdiO9KNVUP3JkWPLI5Wozvfcr3VIEpevkP1'
+        'N4cKDmsHW0lW/MY8Qs12rHH8i0OtgffvLj1JqKMmf8Cbf7Hx65oKLn+B6w9CzjP61WuUBzCPUlpR'
+        'yMm9UtmcH7Snz7KqOdCYGGZq0IXzlcOo9ir7pVDxJfkuQ7AvkRzeNbQExU8TEaU0ud5SglWJ+eWi'
+        'knSnn6BGRd8V5O3u1ad+0h4Gb8CdlRlRZ3NyhVGlWAnE0qowngSq2O3Wn0XdZvDDyJ7G7OuHz4YW'
+        '6c6NQObKrqO7naxsVlSzxCbxJoZhz9jhcGAXqe6pEVfHU49P5kPFKnkFxN7Kp2nOl3DaNvrNwcZS'
+        'gAwKzltzmmJoPn1AHAP4nb75mE+GitGlEXSXE2+V9dYacArxGTiLJ/x7uRgN1XXLRVglvBY6iBpy'
+        'vvhc+C8ufebtPZfg6seD1TnDUnAUATkztAj+T92ONsu7vVsvQoB5cgssIuhzOTEczx2RnkiIdELg'
+        '2Ig3D5laWidsZ3/mGCW+bYrpSPeL3zsQCBQq+THGtf0A7laVwdxz7cNXJyfdb1X+d+3RpYcPiglO'
+        'DYLuHJlxQYN7VM76Y22xYo7hlVoq4Lru50bT+OEzCyGQc6wj9Z+KnAtT3Fq6IpR65xHTJHGasRNS'
+        'ynM/HT7x2jwAwt3lL1X/zKMwAomXAh0IuQCSx8Knaz7Gw8wY1+02E2kSK4mm4Sduz1gNJEUNkjN/'
+        'vx+RYfU8Gi9EqHL4tABRHfqs6YopkAwyU357Rt7GVOG5SR9ABkwQXH7ASf0eJcMAXT4QpwzO9T68'
+        'q0wE2qO64D5yXK2QCrObuCmjEs8LdQZ2PZQb83z78KK4IM+nAAGQB7Xb0iXVFupHWMa0LrcKWCac'
+        'NmLBupakXK/7Fb4cTDurMUOdMJFMxbKD1DVM/u4eRMJbjmM47aiFmJS+e7YNkxheDIdEOBJpOOoY'
+        'eCunn8KmnYGbZzfVUON88UVYoSvYB7lZBgoTXe0toSAOSDOYBkkeepnIi41n2SzTPMhrJtPNy2Qk'
+        'SKQVEimpamLr0FAo9XabmfpEf+tUaYqvg1v/d93v0drTPDihxOrPcs6jtXPeNYEd4z87YGGGbk0d'
+        'rKPKTPzC1Z2afJ2Tj/6BOy4J9CTyvjJDw3M6gSwjOM+K/IOR3LLtOchUBNLa+NewmagTutEnW+CI'
+        'H5bT+HGPWcguN3ffRLw+NHtxWZdjqZth7549yJMu++EpjmQLU+74MIL+ycFvDolOYTQgorycPX2K'
+        '67wjImmBnSBn3BSlpM6nGbnaNLCQBR9nke6UAm1snrrnhaUjeQgFXN3rUQMvQMYmh5xqDTtzaik/'
+        'z+fTGjz2pXZtuRWwP5qLwLKgtc++bgLnNSRuY+62mfyo7Viq2pqPnVqe7GDn7vXCX3lm8CQj9sPU'
+        'sb72XXia6bEqHBNBtSqKLX+6+d4NJQRyddVtEK9IOOsd1EYQbg3oAYJLYJmmOjTyPMFGluQY4lqO'
+        'VUzL5IYhxeI9emB19WluS3544RafjAjFokrci71cVwF+FtynRKCiZI+y+4grxVDujGKFvV4Dxn5H'
+        'PLKdTQByN965Oa/3xqDRLVj069hzG/K5gROXPTDqu0YoZZQdDQgwehMVDZ8FmIeo5/jo57jnXWfW'
+        'ysOl2TeigmOCiRivVK4dNHStAFxcOf7YUPILl/WfAwvOcXotVsvUn74I8T5DMsKeUTY0+V9sguca'
+        'pZjWoFRxRJNhhFBCL/sL3ePB2hCx07K7U0l40o0Jgr68/mOjbYP7UnxX5nJKcY8kkxCdtMXaP+hu'
+        'J7UMy+xfVqnKncA74aI8AfB8AmlXYrEsbI2/O+GodC8LiVowRHZGuai0B89ceX9ot2U+9VBczmDa'
+        'jSNRjKtW7NvGNw+psz3tLwjsfB5/b0HNdYD+/UK2SafE2iPAZatbD9hgaFq5qOQZkdjXtkDfMLaZ'
+        'jFUH/AFjrCdgV4rwXDxUAN5rfyRmAfuBvm1XNg5gZXGuPi5WcRkD5zzW97Hzl95eK0MID0FMks48'
+        'vPAqaRllw+kn/A6ymYnNYJ7kaiShlH4BB0xFCMqq4LdODOf7l4pEtaLs4TvWl8IV3VwG0QYJijVV'
+        'mBqQyC/0jTe0beEalH0VbjNX/17ApsUc/oysq3FJC+iaCTwnHv+reKi91ZFhHSA9CQLGUG37melg'
+        'ZGQHvnOzIuLMAXkmWG/VRKDRKphCjROpwSiXIy/mIEcU5Wh7J3WkdcerIYp66tu2I71LciLosOx8'
+        'lhYfABTJ56gBy8u6YIhdTZ9+IZuC+eZyopbODli5GcgndmNmwAhpRePSpM0/eD42iFrY+6Dai5Sr'
+        'Wc+p4jL16Tnp3w3aUUa4Q0ioDyfPcJs3AF5ulmzKAnLMXYkWwuFaUHjgzVTFkHHIyuLaQsOM74xM'
+        'YYdnap+CyD8Kt/oO4uQEY1rYHr9/52pSiW6KzLhqQHEqb8sqzP+Qnrsjeq+9DfWg9AO7r6OBEVnS'
+        'CQ8lo2LRWBdvuhlgq4QONV5BvLAf6x1aM/7CZMFSPppRgQs1/itINhkA01PlvOzyHbkf5RW1L2Yp'
+        'dd8nBYMPJmN5elzSlg2SSPgrSW4OFCmFImJJC9CgkTpYqZazQLXFUAMk+hSM7OKbsIBvS3IVT8C9'
+        '3Axvh8zRz17l9L0r3EAVr5hRBbtJXaXdcLBa3Wg0FN9oEFOj42A4Dm1BMBfdxDUnbCnIHQpQNgcA'
+        'G8PraIOtJK7mSVVghwVbAORPRvDa6+vPHY0qyiYpb6/hiezUJ3KLEJipmVMf9XKZ7WedUVUiyGB1'
+        'l4hX0o8M8Y2+u4J+++6e+wAYEdWxxLWrCV+pR8Y5eBQ9crxpvAlZYn8fm6H9vl7psPPNfgzcrJI4'
+        'flR++ys9mhj0Ed1U8N8cp0eMeJh+p9rlto3YNUf+/nd9lNeF3sU15g38iD77ywAed1Onc5w8e9aw'
+        'saveF45ySrEmEX6kXcjWoyacROzwjM8EnJJQXyOdeDP8qU4SKgUpsDy5zDf7scZoAR7AwJ/Te1Qp'
+        'W0RZMKjJTWugLR3qPAeTCxBypWthYSesDFspo41bo1peNuJMBPdxAcBB7QFTgonQEFQ959hKKtkr'
+        'mcZ9yWryVTOmNOetF8j0ZTs0uVTVH9mHu1JbnVhVqQhhYXfABvaZyJfkNZ9HWNRstHXuMg6Y4wbF'
+        'XQKzfGvCWmpv8Al21cf1AfempqVtkT6zfMP8DR9BmSsuLYWHThj3+xA37d3nQgQp3o8jj+epOowD'
+        'Y4kACSkZOQjZ6o6bSgq7WiE9c+G4KjO6hqnP7CA6YiQkNMHpVp7z7tXshyzu8RMSUpm+2DutxzPb'
+        'AuHHtfhJ7eYGqYXUM6Z0eFJEkCeCbMe+mGVpsTOC9BWngB0VTDs0vTP4iJbXnrmbFna4vJAMR+bL'
+        'BNhDvLrsK2BJUPEoweFGLzun2c/fb9Gk+yzy/26/3NnFg9tSfTEjcdabu35kGIPeLk6WUtzzho5u'
+        'wYLk8sjndrRMIwkz/QMIATLBIv1CV4Kkcx63rv2hcnnrHLgPaVAuN/t6mXcBam6Di/8eEVqnS/aL'
+        'NS4NJcJzZEqWZBcVOPzG7UwaXRq4nPCfxUm4ZSXHUS3mmNEwq5lRQxeTI8frbJVDnv/aHnq+UPHK'
+        'mPv1MrRqDdpm5vMCb0EW7l1dqZHFmyCAV/QaV8i/ZjHvZZcOSZwcO8e4mUwgslXBL1/k3yeAC/0b'
+        'RDwJXq4iN5QFQW04VAdrslC2WlAsIpCy7nzsJB32aZFBUTtAAGJ8/NPTOOoOEDtd64BI4YggyUTs'
+        'Z06GDvaePwPW35nZ5Y07zbI60tKAWTkw8Df6plRFWnylAlOms6z3vApUVgjxnbg2xnOAsWkRmpy8'
+        'bT6qyfq1g6WCAsFE7EhbxihCAXb+rznwPuOTwacmRZ3kyumxhJDc0Bmi64jqoIG2FYgOr1T+ZoEc'
+        '38uXh3zwONpn7FOfg4GmziS40HqLY9wunj744Hi4tIcGbzjr014dhKv+dvoLu02URB496TQFjf2w'
+        'HlEAp4WMkf7Y/0vdGA3UHttM39qadW/t9bUDTj1g5tWsK+3XI96KrPoL6iETESZ8aFDGhhjSrMME'
+        'qj9Q8BMU8Cxc1mZbYmmn23XLcVbYwK4kMyVCjebwPb6zBAgm5juPyzcdOlOZ/8H7dbnQGZLkHN25'
+        'KS4RldWj8oGL+lXiHJ4wlTdz1t39np0nJc0TFSGGzRcw8Qqugt+Bn2D5LUbLVzI5iAr6I7wXmTeD'
+        'WaI1G06w7zo0gKT1IfOdk/u/KsbKyJy8fU6t7HlFJwdEpVBQC1yyr1euJJ8jVbF4SqacUjy+XExQ'
+        'IhyEGWX4vbiJWOYWgjcbuq2kY2c0jp/by6iao3IEBbVZdqh20zt8KAJEIGdQ7AkAZOZp5G7adanx'
+        '2KJ9md88eIRxz+hVQS99Gzag5K+uxi8BP/sBKG4W6OFVQqh7ougFSzUlOaYAMWk4ixhfCUgHIMdd'
+        'snBa+YH0w7AuW/nMELXDWPY7icHr1Aib6e8AuQHf3W64dUeuCzzNQqFcbdhxGOzmziRfRlafezEk'
+        't8LLahu0XgdAXNHX3o/SHnaEWgjRNTXLqymEUiGDumSVpxhHmQSCOAdGNV+bdhaHaHw7Nw2Cl//F'
+        '3FHpRdDnHHzM/wFeMAEMZZegPOaGmY27YfOli3uuQXv4g9sL3BCFqaJOgIOPcCD9P4za83QHnAW6'
+        'jhgBgG0+O5ZDKvS3L+MDw9VCm5nDPJPBs3iWDSiLWCzwTmCIPllWS+6Jx9jZVdPsB6TLM5prdjdq'
+        'aFc/i6CJbOKwGIsy9n9PMywBE1J1M4rZFEOd9V675IFKwbqGJG74mb6nwHppxIGTbZtLZPioilva'
+        '6RLg8AhXanfKTTsDZDl3xlxqTcRHyXB1ljFLlFd0i6sm+WuuA1JdFBV36OG/idrtOBFfalAF0sO6'
+        'hHlorGmAgofRvHeCXzIiyaG5E/vIVdLfalMCtFW2Cns1NMmcNHk8Za/hAUzAKJsqymPtN9ZjPS43'
+        'hWQ1o2PAIFDEd1PibzOzH9TqjIcJKyIuZcrO6BGG0zEWwInADFElSEczMqXdjboVInPJue1xIzyH'
+        '67TLwVf+RKOCMAT2TYRcxCVt6gtPlmNvwyW/YlaNEvLRXW9qvZAuj/CtBkLU6VnFtAPGNALqnzrf'
+        'NDWJG5ibtDU/lEjY7udu4Tgi5OFpzEc1MZt+wxkcXIfv6HGN+bvZkauMV8NgzwSBBn2EwwLeNOQ5'
+        'SvIu3sWiK1V8f5rsm0ImoxZ+4nqoQPCpGEhzmFV6RZ31nMD7wAf1OfDRfSP3rbxQtSiDsMsuAd1S'
+        'vF4B+dxRvaK8mPaVtHyPwL4sx9hQAlzN7dlsQnDt4YizoUB+Gd1ScHcM8REc85iJq2Ek69lU+7bk'
+        'kz+X3b5BCfzCLpwohsPu7XxQ39L4+crycXgcVyoafG32HerD5De9L8fOaOZ0YYmeT9O7iuwb7PdD'
+        'jZA2KWN6BGXFvWVEJbVdUVjILwlN9uC1aTlQC/lfrB2e3dZBAtfBeSYY8OXLzFn0szFqSpztcWWC'
+        '1RJqMW/yeqPPl6WrWaJGm70J4yztnWNlcA0WYed/gOFsrcXvJRSDs5fa/NIEmAPI6qZ4aP+s8ZBm'
+        'IMSp2OTlWXO3Wv0KZe6gOCR03mmG3dWZdLDpnNdvRauf/L1lTcm8cD4I2FnGmx7WW5biVDuvII3Q'
+        'AhFwJHy8lmcdQX+cqrMmaxH72H5yY8zZhttvQR6vgTAoY4JjlKDheC1uTHtxPlZLkJUxP0o6QNd1'
+        'uu62Sc/P5HWp3wbpRc5C/GuiedsmTusr8Pcfqjv4STeneSxll0U8N7vDMRsMReNgyL5KNp1bE2sQ'
+        '49FIjL/3GEnMTAjTrwIg2wPmQaJ4qfUJJ9/Dbb8P4OyKPPu2IscY+fb/JRBdkXi8RLSROmB09DHF'
+        'Tk5fVn0TxWJInTQIUpBMl4tjHBXSjpkGAdKjvtiYq40X4lX4ucmGytJiDKVnb21vV1qdVR72JWul'
+        'wMdLtqhK3VOyY/lYSGNVz5oFvHkYsbbmiLdT2gPmadpqpV6l6sxnFIbjj7UCzaDPPcxMwcc3t+9e'
+        'tAjsjixssfJoWrP3VCiVtZzkoFCVDJsfZ9mgpQm7aC/68JhOWBPikACbSaW+P5h6FLkiiE004wnn'
+        '3+UN3OAV9YNQo8EKts8tawHPAhcqkKlrGYAvTNksSEG5yda0sCR3s0oLX15fy6cnVUjW8xLVbFlM'
+        '0Id7vECAAqpo5E6KHOEuXwq0ytReH1oO1+Y+Ku9dy6UPlCz1sH80BSkk2julECzp+GeY2zTDLrJt'
+        'vRbfbw1oO3etnR2wUPC4/uqiUDtHEKFfoS6+BR5aMr/e5p9GkEAP1tQLJq9tFOG4xqpnlu3gmw5f'
+        'OmVMtZQ9CZrWHVbJcmZwA9OnBzmNgmGRYcI0givdTXV/PW3UxCHiGNmM2sqB+8bAMBUfLU/pZjl0'
+        'ZVaSHuig8lCmpU8bVwBzPT2X9vJQDjQv/CmEYTJ/eC9I0KeDKlrGdCF85EtGit83lKFzAtA+WWzN'
+        'b5jJ961iY17Nlt5o9g2q56I7DjtqUrPT2mE8B6DAD0RY3aak4p5ayIcmsaaLEmEGxchyMZnfm4Y1'
+        'WTVbQtckeXx2MSvWke/7uYstF4Z6IoERXmwvhaOK3mjubF6BBSC5GHfP+BfWj7ZowA36QlfdLtz+'
+        'Vjr10joHWNLoaBG9aTq8dXX5C8dxYiK7RQ7+XxBGGHBUL/Vkxf7UopJJLnJkKDp1iylTMOOkfZTB'
+        '9/x1pdFyY7cynE73IaIf57V4DU5HNcIc6JXuQ5qzqWvS5UdnO/WuM77zKukaB+rfZFkJ0T0MLp2n'
+        '/nteaU/fH8ZMIuvPBAzsURU+7UvBveLvBB5E+Zcg9H7vHfbHFwk5kVW4dn3/GOQDbdFcB03TggEf'
+        'phWrknhIcyXAQ70eALLbom1joKZqJDkTGE0RZHohtwqXSc8svIZd2dpeOfiyWhttuO3yIiCnC1A3'
+        'JdS5F3Hf0wmWH7Y2c138qR1kK5n/nlL78ADfPoczlvqIoOZbvMuX10f8bXHrKlf+5Th7d7P123Tg'
+        'kw7jFdKBuqUR5VWn05dLAK8oa8P9FqAIOuGybAnGsfvWqbucNrXJAovQZoY9tWvFSUG6riKcYSNw'
+        '1MNrB6dRd4JQPp146YeWteRktUP2ysiKS4ac3WSbg7hq++CAIWe5+R9qOWVtKXCVUKkMfVGoJBEz'
+        'j9Tj8xWujUyct6ztBbC5IscOa2S7ICtjv9uNPZheLtvDeaxmayJwAb5GqVDCitXlBmnaGu/m2Jcs'
+        'hqQxOb51h4AAK8YfxQ1PVSh1FZAXvcsfljTBada2VUlFnUkgrAFj8zH6NS4HOC04viICGinzGrNM'
+        'Bn9kZPrUPoHeWTydGaWIbbyV1Am+eZit5nYa8w8elUsUtExyR2IipqEoCgBbtwl2FRop04LTzcKO'
+        'iNTEVetTNUP/t9DDIHAyALyrSoipjQsAaJZBfPPz4TbG3BVx4+iFTeLqIc4i/QQ7g3K6QfCFnvat'
+        'pxJRUkwGPKMJ6hqhftTENiF+sNd23ijPxg2jlmt3KfDgPxNHzIMR432kf5AEFsu+MHSSbvHlp8c9'
+        '3xoS4k7GgBGrhV6vd7izjJd6wGP3pc+qcxjWDjbilENee0DO4W9UIqFuvp3ErVgIErDquYn8ZZD1'
+        'uOpfJQOIy6UbQaoS9rvnrpISA8p5l4FkjnypHAjaLHzPwH132GwPxBUV3VLByM7moBgNgDy9NUhc'
+        'A0+Syb5imHsLcSUiIKL1ozkk8f7haGyzVteQnwDxAXZU2P9RQGgeYg55BjN1WDE7Bwl3Uks93MK9'
+        '2xWXoQ1iI1M8WtyWSK62NZe3NFqZalxGzFw1dMU2V4nv2KNoRF6WZRWC5ey4RnLCk4AxWzKjtK0b'
+        'dT0cz2Ne8f0RGvwCaybVbbMyaBDabgsAzq51a4psQKMX7YhmRGLdthBgIoVZf9CMkN1h8oxl0LIm'
+        'r77XKfjOD/lQ7OKcjKFo0MHd0IvQY5WQKURpG3QKenyzoGPdMQETGYWhNoEoRxkAUt6sH8zRLowX'
+        'GqtiZ/BaF16gHbjLCEioJmHsLuhHg89ccmqXbHR3/+TlslVXmXUBFp48FWClIdxiv85kKZtoAgze'
+        'bABjBtLZwD/00pVWfVfuE0K7FkjJBT7x47f49/zRNOPVeSRfqMVth/7CWlGn7FtXluPEalLcAS7o'
+        'qo2XLfRHYriFbtiqD1KpQma3+AMaDBREsb13GW5BkymKF9wejWEUlgetDMrAI5Be8aFcc2js4cyb'
+        'Qf1BasZIdY1brxg5Z/B7nQ6CMU+RA75G4q+FSN81K7EwVbsz7ukoQshxTLgLhwFxiCYz/GjmO8rr'
+        'lhMhzExMUW+tfAW6fRXmYzxkgM0L34o/lDAZfB2Zsk0GGXDtPbFLwFcelPCt5MC61rfhV1xdvBbo'
+        'tTXV6/n+3C0Q9Z0KtHINwItnRoujFuxjdlGU0gQJkCMBRk5kx+XVKXHRsHd7s+cf+7QykK50AIhG'
+        'sUYQDVdE4WP3q/v0TAJD6NMvH6ebay4QOnZZrFV2lR4WKsyIx3+VCRlriQRtq0/mLtppH9J3eRbi'
+        'OOAahzNmqhhy66gXbOqJsIK84KCtDTWlz+I21IBEOjsFQpOkqOXcngVUz/WIEXn7HWZ3GDgI7SC6'
+        'EKzfMvJ4V6zJhS1nNTx6YEcWwPNlXY8XM8MxSVAu/mcJOh64L6vdu82A3qZNnCATZamc44iljjjP'
+        '8WyvRuDqzbWye0kEkZa2PnTJyzQakazB0SvgQjmPfXG/37jlrWo846erI89loV1KuLvjctbJRhag'
+        'ewsYu4wwMyazIMuCLVEEXCszjBeXdCLf8UeQ3cSa4pgSJVdB3dwPlh6KYW8x7PTPuYw8au4bGW7X'
+        'gXv0bBsZ7KnFwEB7sWueMVgZ2ZEFtmhsCwGhvckNonrLTg9gc6xs/Wnve5cQ8q3HL9D6d496Zgo+'
+        '8lFkgrnJxoF9G/wvKpB4LLXnY7CYSBXz6cr7BYe113Vh1FgQ1AvcHawc8bw+gfRwFY+m1HnHknZm'
+        '5sZN5wGfAVCpgFmaLpkQdiroAno/6kk9ex2v0i18PokjQ8YnTEljh4ChYapfrfyThzIrLvZJau9C'
+        'SBQ2bK0a8gAue8ZL1IFv+9KVtMiV9M08I58jetOzH0hcZ9A/0OAu7v8oimW4wAS1wlf1MjfNQvwV'
+        '7uQryVpKdUAhfB892w0cHvC14ccEwtkT6wDkMkNB11JkO9yUQgq40PbF38sdnhuPnXmvbez6BCe8'
+        'By9Xn9LZqTnRG74NrZqPKxjIfGsBiNIFmQgv9sx4Y4FqbUNH77u6dDzYh/CMAMtMijnyCnjIvQqZ'
+        'hIJtWrWPAr0AAmOnJMFMBa9ez+NN7hJpIn/1XE4Zj/5PGQ5aEuiWimKhqdKbaGFc9MV1eLWa9rJ5'
+        'xbW229YnYcqdf6HJMQ1nMZiJ9VLubso9PHtqJGJpoop4r56U6Z5ctvtU19islrqaXAMBKVJTlAfb'
+        'yUwB2FcdYOyVNtTEKC+BihgrmSQ5yYo5wtUV2NVB3wIzjnsXQ1kuGq6ONf1imSaUKVGYVRY6Z2IO'
+        'N7GjAzdg/sDprUMQsQkaLbcovWpmViXJpqEDWyk+vrE+UhYuS2v9N82me0fha3BPwIpqN48CEElY'
+        'Xqv5ZGtx+6pdBFzahtE3VsVae1A3GAOqgU3Kp91ismOeoc637/PRskzBQBK/s/m1QgxTtuvrHJoj'
+        'o5HVjp56sQEj2JoAq0ADbwir3fqcAjyOCpjON1FmuPyXSXz923ggYvcNRVYO77yG7yVNvGY8OSTz'
+        'ty6ndXuGEkgXl5PX17PUaWwQVlCuJ3IomVyLYnQiMbG/mwrHJ6e8G5rwzQ6qPJOXHOHCZMZfn5Gk'
+        'ufxhOjoXFJpOOwIOFHlr+cDknWkBBqhIzHRyBHb8U801jKAl5r7ik5pDhZhoDCeP0CdpwPqfIQJ8'
+        '4xcniXQUnQlfkQvBhmBSolg4MdMKmnXv8/0ebt6aKje57RQkMwnOu3+7RSeMGX5S9uxzd5wCKxtw'
+        '7uxT3Pl2mM64fGM04quyNtC5OA0lUhy5li3t5BYqB9uXcioEGO9PP+pxcrAMKwEiMTrtlrvh2GTa'
+        'XRbviAfh/hTOacUlLRtg/ylH4rEU9SUHzvQydDfpB9yPszsNJb82yQH2ai/7JIZwt04YdU5Y3iMb'
+        'd0apgMrHaGRMvINaeg3XKWlnxx80Yo35R2Eh6KjHXo9IOzkHluQrM+H54B5HTtn8FEkMcWJQyAlb'
+        'fFT4AQIE4YTiFwwnx+lBIstigo76NFgiGipwEVdGOzgO/dFzY9v/7XgaTDuLKE5cnQx0Phm5WW27'
+        'Y5WU6xk5dg/Bxvgclxe96UkylBp+1BGHvc4dbRSboVNVRRU6NWoXcOlTKt2XN71IaQwlDro5Xx3I'
+        'aalN+utbQTskT5k/8nj2HG9+Y480DSdcZ9f6iSQN8hHR04Qtlbo9+TJg3C4Q6ruryum/+kZaHtNz'
+        'LQxAL3PzH45/zr7OVJWHnBugdLmI6qlAw9Go/bl7o82yS4tCCOydUl7C++LjmoOMXtKDhn8tFLC2'
+        'TflJAP1k86fbB9ctHPtq9E0lIb5TBtpq6JX11awTjbdhNqhlDH5y9yhMhm13xVy2v3UoheNJ90Ou'
+        'FjPNzr/OaUz7lVOQYC5plMLhMyhJIU0U6K79zKWG5xaJ6bAfIRdK19u3V6aEZ2MUxGOet3RAZ65f'
+        'qT5zvIg46u2lrlXZ81UVA/6+rTfBpS6/2D7vAjhIb1bVH9QgHR87AQJF8V60zbOdijOSVfix6s0k'
+        'adRrw4ZoTpJkFCNMge8i7CvJ6m6Wcl3kAIo6D9GF5Z4WkSA77IM3lFOPcu+U/Z3dbtE9Y8QQpF5u'
+        '13/GtJ6KX7SEgi3Jrt88Kg9ma9dKay5C7285M15KeofLQYXTYsEC7B5QthNmvc7UIPF5dPxXoQOM'
+        'KMiDf5w3CrVtL4aMVAYG6VqJoZ515tlIjAQbYvVUpfj+EdikyXnWzjMgJ3AF6nDcNlsGf7JgHYQr'
+        '9CJ0WoVZAaqp4AJ98M4HEP6i6dC4BA/kfcWk2Qtrp1nw3pOiuCrZAmtmGaMW54MfDGbevb15E++M'
+        'm8HCDcXM8v/QL+G+yrQKNU4Q8zfxmtvX4zObzxafLSZlkwT3o0jpSQ1xvdOUklBwx8iKStMoTbzw'
+        '+6wkwPKvWk7qvhZFMRuZns+mfc5Q/cj4MHBDKwO5/mP4kOO4qNcWm9OuWjRtDcblDrJru1D4CfGW'
+        'ud6u2pkgQs9tPaS19x1msKbgWInf28tJlKm4LRaTH5cuJnmT6npCI5oOoVTAtJXf8jAXUE3Lzl68'
+        'p10BPrxqybgwkDBhK0urYEWLXnSQHxzhxbcAiqiBx5otGczMX2eEz1jYwJiXPBNvF/D41PNoCAOG'
+        'T0XGjyocDBwWUM88AT6dBj41ySSRMlu1ibMIK8eUI+Bag2r6MoaV1MvnWL+MHl00eanDkY+xPjUj'
+        'ZtBWbSySIfKMsrILWbmApzpy+V4qaHslLzS2kgrgOOENkN1DOV7ZSfMGkxj3XN/WzSrchG5VXswQ'
+        'dt0TSZ8VUKvLCedlHsDicHQg/rdmlOLYX8WnucG64H7CTn5RLXiRDrD4yvKsbXEhFdFUfDiOZXtN'
+        'lbaunqASAbySfCP4WmYmZ9nU73X3/HuCQO8Gu+EX6VsbCulfvEmIA3fZBGLhgef3+HBczegHu5/h'
+        'YO2pOF0rV1hLeWZRCqRJ/FdSfxeHd7axuTvsWXb1T9lfAmji5NhvcJCTrM8jIYqTtM7irqkQPNuS'
+        'QnfzmcuSBN11zVKkUsDL+YsQCsH57ikDBYRrKtPo1KY1gKNpl31afBCkIGA45yWEZADcMb7rohuF'
+        'v37i9pq2tltiq62FlrR6H8GcFfA+Hg2Y3iTrJV3Fln5HNDhTPj9PRHu8Dk3EYsFjkv8qODdsw0LQ'
+        '3gmRB0EuWr836ld6yGAKpxyAwE+oiJGYc0bmTh5snZG5+iykSKerVAljrCD/KpHWj3pmkarCGxw9'
+        'RM/50hhHTpANgDnTfpg+IUMWgsdCR8baEW8GN7V63l1cXZbhbZjOSfagr/yH+zRMUt57LVZrUN6A'
+        '0hLr8Hb/XI8Gxx7s7qOHAjCxlNiP2avcc7mOgAMeFAhYCmMyD4Tzf/0xf3WBCTJvPlnhN6eLvbuE'
+        'G63RlKaIdtjLzBtXhg113QqdmYDRbwwEaZB20WA8i0O/dxzfj8AFFQG0VZhSRGLszjSE3Z7XqbrZ'
+        'QSev+AO4wp/yfOG82Jyxn3JfgTUch5TyIZO3sHgAUPMTQsaUKaBNWnT1SZqg3z9ypFQtaaGxCRGy'
+        'ppRSfAvqPWImA7jBdyBClyhRHSke0+d8GSg0XG+Bx8aI20LjX9tQYkzv7RLQgIZ6Ywo0mWo7jfla'
+        'cO0yb2evmRcDqdyltlp3XL0OuLuFjBUWfHTJM+nWYcSQUI72c9k6xKQm91PDX1n4CSPAf31YV3+x'
+        'akinQv+xjag/EzmxXij+i8U5/WrSvYCIDnvWkts69yVMW+/jGafqj6RP3CiDI/MK9cV5EhcXxIzi'
+        'EKBytA1JnG8zOhM0w+PF0t1LvnZmG4r3UbADS0wll/wkP5Frud+eH03qIbuYz+YBgBe93g2yo4Kn'
+        'HQAZ0bygiZ1hEsbEodbxVz/JKIvrwQQbtipoJjbXLTM/BLdGLK0YgX8RrsvcfVdaO5LswQIzW0zr'
+        'SZw/lgSujuXfF3Q9fv+NtPkokRfCc5y0v9byyV7u2NnzqWS4EfO/B0LbASPMdYDD/9bmp+yA6Kh9'
+        'p758HN7Sp758LcN10j+jkt7P0G2GQtVO5w89fbjJYi3buogRCrcJcS617l0O+wCjQLIBsE8iyzFk'
+        'yjRsU5n2p2XFj0D1IQixleitCrLLLSdxPvnJ1s1qR6w1dChJnCcc5I+SLXvS87uwdIvFIY9dylfx'
+        'q7ingP5EMCf7undhZckdjoajWDRgJEK6rzOz8LqIxRl7tWO7iZXXLrMuIoG+fz+oyql4V/1twoPP'
+        '/Q0uJzSxsYBBRpx0sSazUr6zZA9v9yJtDp1rN5hE/BcUZUz0SMMaqQqGZM99d06AxCGR0/qM7BHZ'
+        'lhm84UHtlee/Te+aL+nDYQLPyholy0MaxpaEdNmQtr3lDj5wszr4ZJZ0wlitlCrCLfL7SV4rF3U7'
+        'p0RqOivPqnQ33s+MqoCt9okz1lwhkEXBeiewgm0ISa7RmOQFoMGGcGSR8OiA+oxmvUYgDvALDbUk'
+        'XONYi2whHtEymdAvUhxEOngG7pXazeWY30M4BoHHdhByg3hvDBA5uyoosTFd5imhaZ38Qgl9As8c'
+        'si0vM+nOj+NrYuAFNUgtcC1D2Ramp470J5DE4t3RrDsMgKZKhicnJW37tWnVOhEiPst68x2t1VN9'
+        'uQ4NIRrV/cD0odDGsyFyu2C1B9WBGVcSMhOPdJ/MsTcegjOCsHgTvH1LFTbPZ56ndfvaXxsh726m'
+        'wdGzbVGuJoPemXib0YdsQF9pCtKKbhhi4jdk+cnb1bD6sLfNH5+JR0x1mQ3DzvJANrDq8i2JWiNE'
+        'ygtNxatsJy5Tx+mxvpCmzvSZI9UkEsv8iuIxUmcCOMMJiLctia8xnIV+xACeT30Y0oG2bGNZ79tK'
+        'uTruXXYRw+0YaBfo/AhJXTT701p9oB9hfwaQBaoSh21D9FWCGaleLgYDgsmYGY6SV79JBwQjTZ5M'
+        '/nf/WDvxFriRXcNq3YqW8EibKDXeRKhoMKyxUKc9VL1L2UJA0lzYvrJq+A1iUMYWB5N1h0Q4KvbX'
+        '2tTDGP/HskoREg1Ew+zIxwg3DUQudFFlUmJeYGTYNo539zUCRtRATN7xjbrav3Et8pzQcdVuNtOC'
+        'tr3BpG6RrKaAKzEla3AS2T4FuW/oyJ6/Vj9n6KPOdxtOdGae/EJ4DHpIqVaFzIfDPriHnMRbwfPQ'
+        'p3Rx0T9AgS5b6BQnB0RWbpe8cH58p7Jyrk0isr9dSO6bk5bFqQ2+EYFKJxzGB4tRx6f2c5mR53Jb'
+        'o7Qan1vNPZsrMp8qg6/OlXI9z1+k1Wdn0+h2Q0UEWAzeifxlDYCHOQyGD01xGvycqEbt3tiqA+G2'
+        'lFehpCoj9s93rnc5K5YzmscdZX9CVKHGzcY04Kk9tLfPZiXRY+ePEuJ0xDT9Ud0ki+EnN8TBqBgm'
+        'PYxaJT3UG5YThdHcWXG43E4VkW3rJlKnHi4q8Wu9aQZc64AB6cIiZlE5iyuwtHlH5b5r4upcWJ57'
+        'Cagwqc13FPZISh0vk11f7S4lIrj1mwDmTP/KEYDmjnAz2fLxK6wT2/ELHTA+6O/dte1poDSyWnkK'
+        'ujyXkqyqJaRt9+nHzDaEApGCYwWrgJ7+YRu3F/kGKPwmQTQFQGvqHxbRyE/IXoKllyX99Xg/t3Ll'
+        'MUZizwFsODqsQsLGLPLVBwQBJJ+zl+yys36ot73vj/9Diym1b0FAft3Y9H2aa0Rriok3a/O2RC8t'
+        '9/LmavLlvDmvYxgC0cWMK7feY7nRx7p7ESI7Fg865Xqqx1UsYF6Bcw+qdUwh2UuP2OXOe7difqUA'
+        'S9MBZd+OvaH3glwF49UJtI3nXx4hbo2nXQIdvsytUXkCYJD07dLMooV8XbhEl/jD1ewNF1gatr/M'
+        'q43sqs9/Zb7p2CYnhc1pEQiZu3yAqfbhi+CQ82EBLgYX9L3V/yN7tDUwwLBRSItQio7Xaw86WpoO'
+        'dRvuNRJ1eKfg4Uy+l/sK5C1FnX0qTlUavGHzbqo4wdwdJdE4ti6tzZdnyu5yG4Nk2MSps1dkV7u4'
+        'BzRJeVHBVPJdo1cztQyViJceCaFn4W7TZixB39JGrl9rQY+/a2UO28H52c0NSowMA+s5EjW4jl6o'
+        'xk9m9gVXNJpComunQ4UNizfJyWIQW6yVrXXheg0kvTAJJvSu1uYJpJWhNo0nY/VlmNjBY82COjkr'
+        'la5xVnTKwPsN2FsY+JBJl0YX4w0cRZvsSNFrVcegNyNhxhURxm72Yvrli+laNCaeCE0b8GVZOAC2'
+        'Y0aDep7P3d4lJSnTjsE1JNp27RYKk+jRLqLOEai2uU4ZQqgroRDaPxOOqByDRojnsmEZC3WgE06O'
+        'tzkOv34fQ7gKS15yhFzkjOPIAjwyHlvC/ooAnbYPjiaOIhZlN8zxbvmHCANjMQj91mIUyhvziYLn'
+        'Jrjvrg2jAMh+2336T/HnELmN19UpM1eUJYeUkP3qgRorjJ6UEOX0mXRE6DSj8J54+SBNflPJlzTE'
+        'ZYHX1b9nhDr5ub5RyvnTaQHnkUGA5mLKgcKoRfxnv0jhEiLpytmBlApLz2z3MBaIY51XB5FW+BOe'
+        'vj1dyJ5k6M+5lEu+ctag7pdeS/SFCyLciwQACLSfGY0PRG2+Rxz9kSVB7WAN9I6y+k6m2Jye0wFD'
+        'EjfnP/usp15LSHpk1wnHLy8tOBQ7P7ari4rUXgSbY7H/4HDVXi9SsdDQcksBBGSK5HYsxPp4CWHk'
+        'OBSLuJ6WuN7yCEszivsY/aJ2T85tBdLDIMoULaLh6Tq9Y0LDz8ZygA5DpTVgQ2iFY2yiPRSRxQqZ'
+        'Vo2SFLmjV1zhZe73NdjmFTAzYwVp098gbBy9mGhqj11YFDUbQgA9Tbxjy97v/d3px8rHXxZ0KB7F'
+        'QFWxXQ9MWTtPCm5O8kMbe8o9SPkRQXk4nkuia0HNj04FN1pyBBEBesL3xRaWvly5jf6B9y09xBnx'
+        '2esIfLGheygxCUBnhzI5o67SOxrQ85/3gQNZbvUJ9/Z92KFHdULV4w/kKnWvSy4zej/tLs4BPVXz'
+        'FUP+GY2m3sjVtVsnljEo4txROm4Apbw4YA2KkddhPGv84sN0c3B7+lDAGHWL3NPPZ5DBuceKWwRs'
+        'c55MVvsEXD8U4XLEThKiz4t48TpFOlDoI82N6Rk69ZQFKL14WEeBXpAG27PcwKI1Ql1HQgFna6xS'
+        '2snD3S4K2ThZrPQvDSCGpe+tlhoTnAxN2Is60TRyJQ2TCa4xPiue+mIyl7GGG3Il1pXExpi7AM9x'
+        'R1YWJvKC99MD0mSTflD3L8bVSRKJhe2O9mobSL66Tb1cK9cJ1nuKJGHairtiKnbpz5Hf1tV6Hjks'
+        '3QGqoRzG9IzPb7153S+QOZ2CTF23MPGaOopyLmMDmpP/07Qw3kOEgwJRjpS7BowSw3Fng1dyvIqP'
+        '0G5zkZVJE4jaWJ25OMLo7C2TMsmC+TmSHBxF3oF1Wp9q80/DsH6LzLYIsixT0POr8OGEsDAJyxy3'
+        'HPITPbMDR2cL93wYKbrcl3RAzFXK5NE0J41UQysaK8z50B+eBnHEFPXjWAa/spcBn7yjvMS+v49U'
+        'jnoABAE2pLTJ1UY0QWr8bg6dXfSMWEs766TPpcE0R++pqASpMawZdm1sC4b7k/RM4VwQ0/08L/6b'
+        'crJbH8yiG6uk/Wp4ZcbnXi51fdSjtAzDCuku22tHxDxgm8NrWPiOEkEWZqfJxK6TsgWLrS4iQchW'
+        '7eT7IcEolODXa3yyBEULUO/tdgiPoxRhAoxRo3Ko6cGPqYYgZaR0ZiluxCcdKhq62j9dQudbZrdj'
+        'CHgrNNfI3CfjXUyRa+UD3YzwRDBWVgR4mkX+zB0T8ndVACZ+ktfNULsoExm9ge6+C1YndC2bQWq0'
+        'nLdwJ4Id0TZPmS8szK7XBfGm1hAWSpZQ29LxuIPlJ0Ov2g0xouUbcAD7ePBVi6PSR/6oZAK3ITZX'
+        'Sec8em8nuITPpR3KFhE8ULjvFmb0DlO3x1BJy3BHbJfrmwRI9eeQ26BfKUIF4tDAKyuPuue6xn8q'
+        'GUdp4oYYJ7h72zMQPq+tquGIXOhTnF2uPpBtIWJG3nj+J1Cv7WFM1KPwnViQNq5LyQWu0QY21two'
+        '14KxTlsLjJi6ayhspyLGdVxEry9bdv4YTNdNtKGK3sDZ4gQdAFqLzIAV4DjcuxfYOELD3kBfZk8r'
+        'G3MsnQLmKo7++58a+XrAReyWi/laQ8Xti5tw+0VfTTHPqMREva9TkMeiw7fTXD6KSgEao4TMg1fu'
+        '21AhdZvN/ZAZAnc5oZtVox+XJgKGeGKs6Mj2C37b4IZ/zkffMw7SzwDGvh4AOq6jWJ2PzKwjrR8w'
+        '9exxpIjSn4q6tOXXrPSJojzVc2aYME6J6OrrSA2mdwwGWKrDOHsTQEw3Q7tJhw4qE+JkDT7i9nAF'
+        'kNvYTBs4fXxEnq4tRUBJYM/C3sMsVUC0gZdcycpc7VpyKPy5DQ4PHsV+e2MBiMUTnZQSjm39aolj'
+        'q8GMHrMrbwqThMftl+hqn0M0AJ274icawGAD4W+1ixxcHwukEh4rxJHtskEb3rbw+Ykli6DoF3ry'
+        'u0RliDdVL67ICUVsUmasWKlq6sK9h0FU4oCUnW4W+6HVESbpODI38cDxnE5jFAlXh1qS3kCdS1Ed'
+        'YJEUDJBm+W1+GATxBJ9OTBMT/9Hg7q7Jr4oMjHp+1ObBkaDO65Q6WVbFuFVa4cRMnFUNW7Xjhbwd'
+        'sor8P3fLDBZz9+bvhZgirGHKl0JuWDkbsWDTDKqDBWnwoyIuHHFBBAqlNj22FauBffBoE7TvOH25'
+        'IUsfdQofxZqcNRiK1otXB5vNBTYsVQzIXoBEqdTznYkUDN5S+roHuGm87VjIj8kUBbo8soPexzzw'
+        'f/KLlJiP5xOz6G7y3i/ZBj0Fzn8XfUP0DmzUYFMkHC+qj4vsaQPUMOnsfgoUtva9rG2QIqOmgd3z'
+        'cKO8/c2wwb2YkQ5pZ1hlGtYo1A73IUK9wyq9wPglD6R1D1CXNOlM5qu58LFGbe4zXRWq5r44e6Ej'
+        'yVbTt2HDIF+9x/ujVIVE1e2GwaUVoLrezdC9kpjl7nn9HcVN7PoaRjtU9ubAuu7uOym2uSGKzlHc'
+        'Ak0PwztmE9hFro6l0JmLvBwdb5hym3I3kVk2a25/9yzgy7tNhy2SIIMRe+0s+KHR+9WLrS7xK8Qf'
+        'qBmSVehwjQVD8/05pnibmCm6XkIDGGm9uJV0c6uc5neYUqFdm2/shJpUEGpMpIoNlIgS+nIoeX/w'
+        'k4PdDlCIhLX3vT5stRMxRwnF8kJ+Es5dv+TgzgBR4eJRj5OgEOTp6hMVUoguvOUouOXb3/+lpUNK'
+        'EhEEMzPAKgo4A2gMBbnslM6mFfq8dJMnRNY6kf6/cPEjTDbYlB4AM3CN2Dj6NQEUUetOS+esymb3'
+        'S5k6tAuAeEHdi/ArevPV/GN9YfyEqrZ6hGKQVP0WPwoJFu+7sqOgMRk8XDU8ED5/LBrpyoCeKGuJ'
+        'p4d+CG0AvTqSxTk0V/r5NtjalGD6Ppq/1LPItlL6jEN7o8dtNZk7J8dbTtjBxxDIxdfjc9NGAvdQ'
+        '41koDM55P0X8m3BKkgPk2TN9GKz1rgpn6AjxF3//C0zlP4VTwbZpWQqEFtQ5WBtsUoAOk2Ja5HmA'
+        'IX7uW+Jn98uwNogphgh1d/i2vskaH+dgGSzZqHRzDlPSHi8HrknnbugorwZE1J5qnjzXFYpRnk6/'
+        'JhYk/iT6elmtpNCheaK0ED9wbjkXHOumHZktAqJvdonI37y+iArIya3MAO2f9AxLN8POtbBP3uMC'
+        'vUGyQi7vi3vpWnpIpPdNAMsWQpfpOo/mVuTo8xoKPIVFi4PULbICNvSyFHS/O2jKyEUdeP7UDe4A'
+        'f+CLCUs7dwRSgguRPXM/jxQ4FSAwXrB3ZROXyCmVpma5yU4AeCk4XepwT/JfC8XT8ygZCfXe+ou/'
+        'rDw0Eh98PRPfVw6SISvTfo4bM71Tb1ocawveSOhGYcLHZ7ByavCXRZaQOaUDisRZACfuCnfp3e8v'
+        'UfMQDyxb07MxQuaLK9WOPsSojQ3TPa+lvvX7IqL2kA5+Bef6k+H1mL+H94wMYSiEOR5FBvIQMukn'
+        'hSkmJkqQKxJLGvFbIdOlMA5YRQdfBSlN1xJzpVu12vBMJN1KLqCg5HGpu3uwIU+YKstOt0nYAvjr'
+        'vOh6ElrHgc5nW0CkyTwEtRnBCf/foUbN6VjAjMfEiJtXEskXqfNczxC5cbYT19FeN/cVsZoBXHy9'
+        'RZDiiO0V1BdwhbpLk2yjxbFul1YVj8JASxmG24BX1EGJwtFDIM3XnV8XD5JjSR/PO8FLUQ4BJqCK'
+        'IRSlv6C+VLgCAXzxOLzATQMbTfkm/doqgHgcPDFE0EcaBfv/2FCBgOFIro3QZLhtJuKFdemaau9f'
+        '3J2tTiAgL9yaObI4jaMgnFeUbqGHg/LWzGNBfd+xO95zD+R18hvypiVFrvUoUnxZztXNNHU+daMg'
+        'reL/dUNjKXOkefG2aQdG7hSx+1IdA3tmozEuSIE/bn1IB34yj9Gy/FM1GivmftOpZeB7YZUr5dKt'
+        'uQwIOnz3mKpb3EukmLyPvJXH6Klgr5xsZa0Bc9Bw6XbY3tgXXRvO19igIDAoB5TZeju6xWM2yQLi'
+        'tPCqiPL+Jv5+2ualmAlswWNLlrhvJDy+XKGKo58QK3HlkUqA57F4w6e1WuTHLwmJUFW8VJGDdTGW'
+        '+OEArN7yY4q2ta/LhCGkwm4VkE5OZsAhnJcW7pRn37TDA2dg5zahf8zV0YqdCqc8Y07GBG1t7upH'
+        '3zXA9UOYZGxsGyvj7z/VOnJWP3Xp0U6kH74eRFpDhbJ4mzgiGxK8OdTQZcpc1NaCnhcIDiW9JtKP'
+        'ZnpQZnpuDQxBIudS0Bgb3Tu716Ezu3WaIqLbWZS5nc4tzerisxnjcv9nlQSSqnFYOjRDjvJCBO07'
+        'aUZp7DMdHKZfY3uKcDYjhjQEL7alX6NaKc5A+O0xBpYy0rLtHKFzeqJqEFVJssdiap7b0jBPhjMR'
+        'Y3xU4Cgx5Wpx5DkVrJovJ4bFP7py4BqvAiLMyEXYctPyeHFoaOPsT/eEBl+I+VOxDrLz36j+1Ryl'
+        'Qmtsf0vTh896O8+sduIXLIu6BZstqPwmqbP3vAAcfws87hEslAmpwj+ebVIJZw3mV4M+9a3F6hG/'
+        '5SCHdjRjkgpr43ZgekmkjjM/He0DkTVPsDnES/iwmJHFpBZuATA05z0Op9wlOGAGO7RzxEuSrmfC'
+        'qIN9V4PLv+v9DfOwZjVerCqHiqWVW8TOIFWZprfHqqNcJmfgcLClAsdOkDz6LXXk53FqII2Ltk2U'
+        '1uncKKQiL8qAE6wDmG75fiH5H+pjMuKl/hM3S/Xv8ItT6RDTe4sI/FDmUD1kU+mQjn3R0ArsKxuZ'
+        '3vQFQAtUvF4MA5y5l2Ip/NVSfvkqMQw7CPQU87n/OV+3Ali8G6hzJ25qqJMsez+DDiXP3TY4jrgu'
+        'LtyB5liAidkEMh8uXnfkc8Bez9l5Uv+z8jTn1PzGDEwU+LLaD/W6gZL4hwqy7GEGGdbwWJyM16FD'
+        'ovKOi6ezphbHIwjdihSUoZevhb0KMaI7sXt91C5CbqAlfKhjhZzvS/QgEpvtPLCdrGXS/c6zo0/c'
+        'FwMIc3uG468uyyKAc/tI6gYjvtJl9m5TcrluXIj53F5OuBVgASk1SZhO+Y9qIphiszAjuAEEJSjV'
+        '+9dii39m8iQf0qNJoS5xZix7kCFJlD89RSn45C8ncTRPTycd1GV3z/NV648tCIggPP8VzvE0lhJh'
+        '1lr1Z9YzAuYKJU83sU4MjwpOU4nxsjdjKCP+oRd2iqlknMrik2cukIGmdNxVmUaixH8KTq8NejZA'
+        'PcjlPR/LQSO+AIkBJLoH/5uu4SRCP0cUaHhOdnjp8K0XCxXD2J4tJM+F1ntuxH57C19XMIJBE8KP'
+        '9CkKWVjRoeVAxarV6oLT5+HhVDEgVlkCI/r14TIOVe1Jr3/tuMxycF/AjnqltXu25Sx/ql61RYdp'
+        'yI9fyakzUeJEJx1OMeFxS4H8pIel4f6X+rTWS0U/FqvaPja2I/6Tlas9+uBdJEAup/lmwYzji/Ql'
+        '49ri5qaaLcF38NoFcKsHQKNg0W69H9hyLT2wrBqfLeFvwUDkXl83pbo3tvHqU8BlXB1sPT6M6JWb'
+        'HPoIy4ogxlLKdUPEpjdky5bRoL9jxZ3Ny72pma5pOJkEU0yqt3isHWRPfzAjx7h6b4D06vpIkoIF'
+        'L4gnXSugkBVQj4h07UUzcgpcb6Cacrww1p4kXCBt5QVPFT7bOMz8uGON3wE2Aw8Ng1f+QyqwTMkQ'
+        'kQPc3YChtXDUJnpe+2EdOQbm3P+/GA4DAyIvOx/8y+zEQ4W5dho1meqoorjkWW/2f14CwAkq3XHq'
+        '0qvEcfVYvwyWaN+eJCBQOxkm2uSGGfP6Nsl8JvWnCvJ6UPeQUuI0r/OKUKk/hmIhtIuDmktqxqcQ'
+        'sQBOOCm5h6krL0lJCbWblf/UVSpGgNSFvmpCOqvd67+B28rdIZL3MIORRjy99Ugym7wNwWmQj4DT'
+        '0jB/1gqr+43gdIQ9WnPCFJd7+vwGl84nlW8NL5kpVhJ4kquSHIkkLMh2EJgQL8C4l7hnrEMpM7zs'
+        'Ht3twxrQwtXzY7Wo2diSaaIKZc1XeKyuGxoMxV1Wqw7vhBhV2AeBOkn23ZKBnqchdX9vlwPgrBlR'
+        '/yjpBMCGE1asFB0uHASp4acNMn323hoYshQY/HGPAmuSxRYK6M46I4BIh/1A7JwUHV9Xjw+xyMWt'
+        '4BF0gxbPiMwnGnf3QLUisezIR9RZ2gCBWSNMhFLNqJdAp0KRlCUa3Nkc1blKUEJJkE12lrdSwdnR'
+        'Uv9p1c7gOPN7YoWvk1OKTXpDMB0kz4yOvahU+ST4XUzUS6xM7ke8vpX/mIYUOZVat0QHs0rzxbF2'
+        '6iwzO169ksszm2XzrZDYTc08qh/h4HEqUP8ubvT58NKgD0NWpa4f2xHtS2nkmz1MQoGw+JCHEvf0'
+        'B5/pDaK86ixw0gK8y0CdUfgJujqRCh220sStON7xDTlzXePYX4OXXBA81sbRGF8hRSGUmzdZVrAe'
+        'OpKWsjDFN1n4nTGjCjzZiONRUZMv4vVuOI9BcEdwHea0t8LTnMkw6VmrAFmzXvjd7GLt4d5XjHJr'
+        'Bn+7foPhXCiIULxxlmbhI2eowcGTrI/D2BbpoJYlV7GZzr22wjezbrPeC7iKNvGEiUVWcF4aJqfl'
+        'FlQdZd/Za4eSG7Y+eHe0kUjqRx4HHhVSgMHtUtyLL1z3uITSD81KBjDWRZ4t2SGtIpmxbM98wyBY'
+        'dQqszLnC1oEyeSjKCQYRAlDEDO1pQe4nGUGlGlbwjfIJG04s9I59bNOKrS0kRepjpYWy0YHWqi1e'
+        '9zWETTI2U3vXBY5HED+IXFeS6KCrjluXM0HNCrLehq/pxwB31YXKMQJZJsDdBbTcd3ym0oCurRge'
+        'bCV59Uuj9okPJy7K8o4o/gts/bXJFCVHZu0rzkOCl0ksEzsUvBh6WHF4GAbu4xN9E8+P2LUz9lzv'
+        'naEduWMp53MmZRFIbmNgoNftd1tADiqAkbdeeV19EAFFjWogCa0asV5v1zfFSF3DkyB/FXLVl7gH'
+        'TOQUvmR635hfcNk5x2Y6UzMgKJeKhMv6y2aD/BZCuV9ZpkOO1TMUXwY2A5MAzXQ1sJEhOok7c5Ko'
+        '7gr376CAvJwXMW0B9voRu7bJNAR8b8KKXUpP3RDl03oqQz1VgH8R8P39vHdPc/HJD/OwzkJu5ZUw'
+        '3II+aJOH971Wk0C4bpMg5P9iH3Rf9OWnPw5iTJ9I5vLdZ0cjbFblUOXo3SWQpVctzqe3kWsdlHTJ'
+        'bE/8YtbFwStGfSbILZ2lN9byFAgzXEHbZgLebOk4Vd/ZxyzkPWePY4MJNbhvlwl0puawVjHgU2ji'
+        'dfrOkdL7UPpR1DeXnmOWSPlICU84lBa96lJB8t5VDG0T6pBKKnHKO+Xeuyx6yMgOiJFYldAWp8wQ'
+        'h/nO4md0YLyloGe7SXFoDsjk0ycOIPkDrQPgLSma/SF7vF7NKqZe2MojyyDIv5epzsgL1e6euH4P'
+        '0XmIdUFeYniC8QEscpz2VezQzopHQcl7z19aWFJO0SZeshUmRk66iE+WoAZJ5pfD4vJ2L6lrhSEI'
+        'RMwwxAx2jqyVIemazSWDPGrPvaKaK8+07QnogioMz8XQI44n9qYDxGQfnDJi53H5FG3U1Egv9L4k'
+        'mwpUGB2f30Z4TuukSoWu2uOD/77i4rbzM+5V0u/pMP7Ki6eHCGWLCHrNAcWBZv0xc22FwPIog0YB'
+        'QqM7zGhVKHPskYnsJ1hn8qPJ8Pi5Kwj+7ffMsHU2qb21Wnh9qmMgucqQjUQcKL8rjgd7Iq0Y6G1P'
+        '7m9L2yyd6f3YS9Kg3PuByPIY6ZlPkkrVufeiGffxkAQ69UU3h7Y8E5ht7KfWdmOOg5QsMHhQwsCU'
+        'ZEBQ7nhdqCfU5K29PlEFrAOqhJ28Ab7T7aDTfCzc5R+cVMoL+fofdMAbQj7XkJ6x6Fv66574TaGJ'
+        'oy/NjWjT16vvqm/1Cxjx9Q/uEFRGdQeVhqP0XHqSOQvBSrjZ8JaqvRCCPlWZTQayq+pkuDzVGdyc'
+        'St9dy3xzU9iffETQfjJD1F2GXERd6Lfe3rrE+6L/aQUQXX7pwKmGqCxbrw+FFAlu5upO4WLXa1me'
+        '9Ur+oonaRSHivv6+n/hDiOKX9EvXzULWNLqvTvs/lph4VKJTcbjtnsKZ4zV44PBVqGbmFe6dUc3M'
+        '8/EhQm6gB62rCVFjr8cFxdWyU3OR9CeOPGpbgOPTy0NLUpprwQ0ObxQ4lYoMqr4Y6Q7KPMf/PGad'
+        'FShYuBUYyoIpHT3yCGZELsf+9G4YZxTAuedXl85/Y+QbKCXPOFrR0rzV59DLxE7iR5lSic3OOrFS'
+        'AavcWSTWBgxPZj2d1bHox6e+BtLVrfLSble8bajWixoFgKcDvk7ZYZKiW4TLv53zA5H7l04nuVyu'
+        '0SHgw3ykvXX2FLgj6eqL/WZWm5k7hQEH/Aox0Tq9mmnUqhvDOYCZjAIeaXqIipovm/NwjFoBeE8o'
+        'hFpuLK4R2Y6uIJeM3DFpelEb/Hs0o8Vl/RI+Sflv30L4gGv6uZe2i5nUarsdIXfXZfZAd3t3baNV'
+        'RuWkC+hyV7L8QcHv7FWhI+Q4CPqRHrffpSonRpSHQAer9Q2huYJbM6zfJjquKXRT9kiqauQiZh0K'
+        'XW6vADqqvFzADQ1hKbQGlZIB6IRSjOzgBfiIsWstEQy1TtHQUZsUAMjAM0Nk7CfBG1QmyiqSnsrE'
+        'DHrnT1KkwzDFGY7CnecsVpDc75zNmD92vZEcsICKLnPIYox+1i2UkN7F8JmLGEdZ+LZBF1btCHrx'
+        'AVEL85ZiXWcYvf5Cj/lA6uyrCeQ2NNUXLuidRoLIXZjTNdOQpxIx3MlgtLZdiaMEu04uJdWc6rbC'
+        'ErMTMCoDXpdbXmUZOdGpuDc+gtFiZrSdjsmquxnA/h3kaQVjyWXjDUJIMj8h7247fS0i8r6mWe0R'
+        'iudSz1DK+0lY9Mdf3WZVrT7RMzZw/Alx73I0783uo24FbCbRl467PcSY/uw1cQbCSJmL10YilTmk'
+        'EcFvI/16jkTYuE3UnfuQ3eMeAa8N4NU+hFZ+IJmIsV1qgJEUeLwqDpM7WsFjUDYJNcTuN8nn1y5o'
+        '0o0q0IIRXZ7S/MCyNzMZ3eBLmFFZbEYjH0KDP43KXVlaeRrajF8+qQY4WzxcO1BkrFZ7EF0uG7GZ'
+        '2DRDEymfdYnLzvG6Uu6odcgDZdjGNMYpM3ukgRaRCbIrGlD0ydJF625oa6DaWxJ8N10oGQHPNvD9'
+        '2co63KlaDLr/Ryf8KCxvkW4/F5/xHwo30cUKI+QW/WLDauUyFp88fukDTblJHY4UnmmyGQCKO9bu'
+        '3YpFzn4hnSivK//OH6D9sHJs1cZxDhP2EhBxzNUPBdIqB4Rv8zmfZ7zzGtkbuYt3YAVfDQym1kQ4'
+        'HnplRmQUfcvbN/W2/Lqt6o/VIfRoKhF3ioXA/Moo00eJpAIRLCqTcuxC3SCAYBBVZO1zMwX2fycB'
+        'JqlsnlhX27Z4/ZtHQANxQloN0hBi4ZNyuYJuzbQJj28YGn0FmIQftcUf2YhgtQJdbAW+eiTPItVr'
+        'RraWf1cKSpfd6E5/5mHNtD+xPOaNqJHKKZDhNJhxPEImeehs38r3o9n/H/9jil369sotTTpfAaHC'
+        '8H4LuhOEHX6P4ylJupnOOmqvpz7X/RTTWdcnjE1QvmzHF6AcV9XQbH8GXeeUY9Dc5faMubiqsQoi'
+        'Z8yD8k4rgaSPdsir8E5wvjzEW1n3P5KvrUifq8Fs+NHMiuWPQBlrd417ArtvJiOtldX72I3nYHba'
+        'b9+SnuG2zz+jDwZp5y+rifsl1yE3H9rNnr8QDASoPVzPLqpX2UXOuHy1DerFwLBRIsclBDs00JiT'
+        'Kl0a6YFl0taM0n9QHtz38wtDgegRM+ryhpayW1kupiaZt25x6v9dnGfHJFwufF1gAQR3bWrO7O8E'
+        '4XdX0Vip8rFokPgWn+VonuCgmR6Z+GIK6TPPTcYOEusmsDM/tsOl50JrnuP/lQ3a1jBTaLHXOp4b'
+        'PPALkapAYlptpqaISBJNQJXv+5ylb0RQuVKww4aBL5Coc/9iK3uiq63djEeNeMakD8+Fek9CBeMC'
+        'KSpb25LwpH3YOOAgd7RnPz6KZwlrZyG497aj4IQ4kD9KA80W8fMF2KNqIIGScxwZ9WAVj2uK6RyP'
+        'Lshz9pTkOYDeuC7+swLN12QkHnn8I5kTgJB1mgqJOHM3I19/1NseisTRf06MhDbV8PQqkhbgZ6vE'
+        'rfsboDEs/33KhDBcnfi1zVfOkHXgY+/a+Y6fbL+YoVqJLHepvKghVxX7Be2+Uvj5IqyEDHfN+PJb'
+        'hDQyCFOiS7Jdh7TPCy6IOb3/DwR5bLNI0N3EeBcAdPZSllWtIGejfODUupCgtnigXB2V9B4l/Q1Q'
+        'acCFUNlX4mdu2SVX3rUiij1Ybe4g94XuUjJuWLVeeWcxf/eBJ883tlaov1ljWL5teEAbkpR38sJ4'
+        '4vMI6vAHrejRfTsDC3DMY+9Jt7+PH0LrS4g1zx287IW2sDj2A73mjgPzdPD06W6EDMNa+C1kfdqG'
+        'mOzm9LNndlswHy/czscAc3a0LeHR0sdmDEN210hwOYYBPYoQ4XEyAQIcghRfqupnWqZCEzD+7fS2'
+        '40OUA+EmvzHVYJnqyRvowDZhyG8AteUCf5kkBBtwBvT/wM20Z/Ygsg12IHvwH1S3CqEEMUM/AWOu'
+        'Z00vD5xQDf6DbcAYOQeBz2FPnKxG4c/yG/VT23oVAfERWyXV6ZccC3Vu2EPHD2BxtHo1BnbOBSMD'
+        'ow6YxBBTF6vl0kyh+YcDh1T3FdDOzWuIHc2ttZISnsKEVXJAdv39Rd+ZTQNfskkErEaMNrZBjHL6'
+        'JbV9KUD+BcXPF5fG4zT3+IEHvjVW0btp1AIbwNYOQpgwENad+QqYxG832T33NMRDwMWcLn4khZYL'
+        'AJnu1mcA0EZPwH4GXA9LM02JPMv9AkN5WClMpm6EuMhD0xyD1QMglJyXYsCfagrz9uJU/wWIVfJ/'
+        'N3yFOSD6xMw3z0Alm/DpMBZSwMa17bMYR4JkhHCv1PbxlIbAxYSgwis0mi21GSDETEGzQxRwzJnk'
+        'qgkwzXt1hEcfqyWbaBfy9wcY0eg2UZhLGJesWMDg9GvhEdDWu0t/sY6iG/Cg24x4lucYWM1E2ALk'
+        '+EZqkX0fo2K+cfuBg3lVp4hEU0K6HnCfmiuJNKi9DnyIlf+X856/R1vW1cwY+tt7MF3q+nWVsJaq'
+        '5k9IzM9rbwP4xLwiVVhjtJakGZtlfmX/0iQuD4bdA80MxGFkQDELOYsgrMWQ3j6l/W44WNEzZ72f'
+        'djvEWpEz4Uq6od+RRwC6IUDUs/d0H7AYFinQzCxdWV9xqLuxCLJfMs16Y+hXE1Pc0xmvsaRaK5Ve'
+        '6snCCS2OzojsoYQ3nIc3mKvhYDoqMaCrKIzudFcja543FKT3Mv//GXIF1DEUiMok5Sch87+MAVUo'
+        '3JtdmznhR+pCLCd7CRhZySa/pBYw0V7yXl2J8w9MCEaiOSWusCUNPna23CeVBxhrVyO5eiUdbgab'
+        'zWlPeDzkxkYk8MQ1BK6B5gU+ki/0K6ZBhVHBYwsBACJcieYEAGO/kCvmUTLUCXwd9J+2WXK8Pl2M'
+        'DmOT4HR2ho/XFLQZ092uXnLA0VAd15q35QfGWhN2pfbssRgJvBBVZkx2yiBpjASRMbm3oujcXYbg'
+        'LddK8fMLlLYnOEILKx8xaw5gjB1micV9dF9jSnzr6Oqi3Tu63uTcGmM7CXN3FbNVwXRPXA3qFNjt'
+        'MbUIxxQD9qNUheIBhJ9+NlCiecuEvz3aaQEKU+bj8q+k/4wL6urTOuRro1La895WPl2PkvXO/I2N'
+        'fjUm49xuXrANrommraTlBcKRno2yIaNdswq/SP3l54g2yNVRKItnJ8RwkV482eywLE5invLCOk5o'
+        '5zilwYkojYp/T8qcqARjmC7yq5tprk7aKj6E53jU0MHITEeo1RYJm2j9U/yvlmj4jXotpKjAnIVt'
+        'AC4eON43vqkfKaO6XFlqiNjxFJy49tHRkPjj9h2Epj3oMOkgl10phQP+8qDN0yLFtRk1dnGhNWwZ'
+        'LE1UZAi8s6aGNApYZ5cooBPZ2d+bm8FVdqFFn87dqLXR0NmHGUb1+wkcmNcDc38jDH6PNhDnhQqn'
+        'DYusd+pB6C1HZMaKAdAav8afG8edeAZ+4ZOWNNQYEnCW4hRoEag3YwpcO1Nihe6W6NGLMkamK1tf'
+        'LQzgw7/yc9RkAalmPBLgEjr4rO1mqQX2HIKeszgN89erabFvVGDPv08lqOPJsFWlmytbEV34e/PC'
+        '/3o4TB4qd+gCWO4TEyt9FIrDKKtmi72aO3Hl2QBBe6BuLZat5l2lO9QA8dP4aBhPcoqovftEaWuG'
+        'UzX6KTIwkm03H48T/vnOvkluxDdiB69ql5uvDep7FE64s4eCC+3REk4NXApebtoq3VHidwMNhwFr'
+        'K229FabqZfMcToGgv07cztlbxe3GyV9AGGjEb3F7/baPQZuDC4/DFPjalzBdUh/QmnvvDijP5bct'
+        'TuD/gWlt/+fYOUzgXPmhhMoyqXr5wlPp46Iy1k1COhMmizlNif/aL0vRM6D06HPCTkRQ1SHKo+K7'
+        'hrD6FV6hsdVDlhXSjYN3LowtthQZah5jc3dh/zscyU59Eqmmqhlyv2Ks+f0UPrnKQTGWFoxpucF7'
+        'qekFrpsXG7kVdiwimpCK7Dug5KZLGM0r56yftfOdH4OjLMD+hBv4iPWAQo9emXNDYY+m5hZ6D06w'
+        'Aq6Du+swUbAHC+lPHl7QEhCITf5ex0Y+qWTeNeKEXlefrP/v7UrgpizGyQyD0eTSGHb5mRZz+2hf'
+        'hRa8i61y14tgYVn8xyWJGaPY0s6qTOm4B69AhQjMC9V6hteFO0R0WTbjNcgWw8cXzWRm6O359Vos'
+        'ddQn+Xhaf5F37iGJ8RGqFR3SnOS8eWfRqTabiWJ03HB57gcvdpI7QEkHC39hADz3pdCr+fYJZhK4'
+        'eh5mEoSpLMdWZobXB9WkSpf9FPhWPoUeoT/U/hmdvLo3bobqc0cfdO3ekvhykdiRs9DL2pmOJkRl'
+        'Ry+f3x7m4hPaHxmxis+5ZNXoGCOUnaJZYrtq9s+PcrEdnY56O0cyUJQQBGoZDWj2cXDLndPxaDCG'
+        '0Bq2CLQbopQz12UXqQ0nnlu3AerWSNmJHAuCB/oIafW9FLGE/QXmOqL2ahrQiFW1fT5aYKZ2wB6i'
+        'mSdKCP3foNrhGpmFnkLWMh5bjIK5kUCcFkEW+WDgAOSh+BT/PYDhSRD1hWQFQiCnwI9eJZzCATnA'
+        'xSgqn6rZT9CVkoj4mAQL8WB/gfsu/DOtpaLEDxotilDXn8K/UXl0cJet2OYFRdUpdba2IXtCEB4K'
+        'JBvQPB/FIgCdn0yg9W2c3RCt7sLPaoHQ7baQgO2WzOM7w2CJsNxa2k6mo6G6mf31UFH5tczuf39F'
+        'Gh/L9Oy9yZP6tS2OdwlTnjCNwtVXIIl7oXaEQY+Qr6/cJ7KJlNIAYJGiqE7iGeW+CH7opX7J7SB1'
+        '3DN4aIF5XzLhyX6M9hI+lAl7xyn3ncv5bp717qipPodBZfAyLfCELGWoJE6LoOE9wvUvm+BKmq1V'
+        'aSxx9j0EL4G709jz8ZMYZsrYSXNqBCZBfA13QHNN+JBr1tc3Ua7nY4tBuOJqudmbmwdSewMTcu84'
+        '5GBbz78bpEqdll8h79Ad0IMujhGdd0tapox2/Pb+DfPHirP/1S/bq4F/S7xTqM2eeE1NiuXARKtY'
+        'AjL+ZA8O3tlRu96uRku0q7EApjHjKs0evWPID4FWb6P82j16clhGLj+wEsMEFkmk7V1sbwb/P6Iu'
+        'p6O7N5Aw54x1suxNlK0o0P2nh7AunLh68gDLcpXP2M3KIKb0eWXv7lZkLiv34Nuc9BEqT/So1lVS'
+        'DekE+UYErlr8jHEHf7nRyWKcyCYFshOUza74GwvKZ31s+esG+tbmlK4ONyI0jPrRUpkY4ufVqUj9'
+        'PsYgKuFFF1Uc6IoAmpZzO8eieEP8fFnMC1AoPi4hg9hbLbiakErZQXJVza6oo/3vJIcS1ctM/4df'
+        'pyd9JUaPEqdYJfQXMu98LH/ogHuIjSyQZgC+yVlU02P0W/GXz2XbI7z/gPU1HXlvm/CrDpzzhmqE'
+        'jTq+a4/kQzhTPO5WaxRM4Go9eMK+T7ftZzn/SFjQtRNtciDSkX0MTtBDF2Sra/qjq9O3S+xWyB1H'
+        'KXno41NZg1SJAQ2a8bzFhwmenzPo00kXW/FSQ6hl4ewAXxfwbXMEypBdqe+tYG47HNKHihsMMZF5'
+        '8GpC0uiinV2KbMQnWzhnQvVDvUxOev9PiDvTmi9xVJfkygpx4diSauEzYCbobbw8PLOGnchl30Gk'
+        'DnPXRBdxXayLWTbpXdTPNjJNErab0ovG04El06e6/G/XJuH1jhTrvDIIXvPTsdL2DhwWpjiUiTNI'
+        'H+MP7vMuOogLchniLCiK1ldEtdUKV2EzODh3O1i+UHIpbWXVBkH23Hq+KHoM3U6sKBXk2M+SMAr6'
+        'y5ApmOgpWh1WzvuPLqmo8HsZeJIuTYnuiLOx/KdZyX0dxggcjG0sOhmmmecO2DB/jHQYWWg8KK7U'
+        'xOC0JR4AxIislnqXxEv98V8v6NBeDhWPCywD4vMssFOJXZ9VhRz2Qo5Q+WhT/7otAqw0djdgbTZK'
+        '2nsuFUln4iYjJctsP7iAZEiuMUPNu+I3SF+eubHEUykC9O/WJQ6AEhYvI1d2x0CHWlqYV0FceQvb'
+        'Ky1wOQwCVhWO6TIe221R3FuGBCiAufY8FZ+/ybzI13KgXE2arvGzMIO01LcbD9hnvIHa/tlzZQVM'
+        '2DF1+Xj5mV14juyHUGtbe6TytfJnym06f3F5VrC/ZCLhoM8V/I6zEQdsF2EAzLIDpMnPYemcSa4b'
+        'RpI55ghdAaafbmEYbJEObQNor4q+gbz4UBGqjtDuGh9bWU0us6FlewoGQ1i5P1/QHoMH1TDl6Epb'
+        '/0t/I3gHH1qByxzcBhZ103lXrRHvGSvBUyESsJ2WHerMH9YVIC8zcYyaza68OYTEqd0qDfpChnvw'
+        'Ic4v6fOUD739pGhQt5vEu5T811eH7bOdKdzcYxD23pnZP/xbl56+IE6qvht+ZaVYyu/HK1CqC9FE'
+        'CFyUKpaONHhmEmF80y4M3flZMdIRd5PdkF/pvm5AIrQVsAJaTuEMG6/9PQ45App7k2Flgt+MYR8P'
+        'Db81ijQ763+7qmmYD7AMbXx+o2UiCoYO+znUhEZCPj2ntwumOchEHKmHZEpimhda1nDYBzlPHand'
+        'SKZNNkw1zIqRN+Jz5z2tD7gS3X26634PcxwfnrOENaFBO5lrqjxGs52zvMEKtkqRj4tLiQcUtpI0'
+        'nxc03+z9gJt68/HFF4Jld9WSyo+nql+hXGsfCprYrWj0kC3+NBKtOdNzJKXHPax0bcNvRAJ1pU17'
+        '/vM6MPIS1Ch8jK++vXU173lvWU349nCRDQmGHs6eLWR7QbdndoKoxVRO4wAPG/3VM9g8A9NT/YCp'
+        'WBAIbclk0EhRkEZ5UchvB2epCd0J0MgTlHBJIhIJLhk6AxibUIRmAbPm/1Fu9vHuUiYZfinOfe0N'
+        'niYJflR8BOsWOjqlpBMDYC38+n1QZchxX9nIUJxIWxxflF7YtxUNc6lsO5cvxJj06elzDgVLZSl/'
+        'hPJvVNkheuPlbfFyKr0FWh4GMqHKWyOx4/P50eRWJ7cBnihbzhh/bKh0DlGDT+BWOtaVRQYWR/62'
+        'tcjojFPqYeYTp53oh4nJAZXCZzN9arTdhMCHpOYoC0Mjo6o8S2okvcQJfcFh/If3T1AZZwgbhtOc'
+        'PKBuO+GOp9bE4knFN3qUYftWD0FCHGd/GVB76ssN8gWvJS85C3zc2z3oXqKe+mJG2dQLGHl1TjAj'
+        'jPwsIJAHuOzjFq82hu9L/PoceiOgnPYpLV6dYe3bp47H8StWYF1HRDlYRiNXVSzAUevERQV+2ara'
+        'P2iunhLDcNZSh2M75skNyjdqgwsccd10tK1F1gtNPK9GJ7W65a+yicIVVM0fML/MKcPFE2LT4us9'
+        'HMK3m3MgyQUkqDnAS0fgA2TliVrSam8xitHazYmkhqzqF1bOJswSfr0fUrEK1LG258aCb8PQX3br'
+        'kpm3vfLyOQ7BjvXS2BQEbcX5P0GOYt9QenRuJJsz7o0PZGgAmzTaqun3vUB2plUdfuVcWUToBjP5'
+        'CAULVpDP6bTwVqIXNdtC4cKTLJWcgrEhrz3yle/PRenDXBvvR1YHgRHjnZsonyp/7WEMCpRIthuJ'
+        '+nwBxW+iShlQlB5Pgt5bnCdPWDQwCd5P/zZQ3ncgLchvTA55VfCphLJmKkN961swYeriYOSLElNv'
+        'zia07Rc9SxKbWw3jLfMyQebgMrjVp5Pj7j3O9oKhKxHmXGQPO6bxs1gUP578Lf9XVQ5/RcMB59Vd'
+        '6KLCYfZwiZHTsctkGlkZQPUK1ZJ9INGgAeZ07kXWWPQfFg1yVyj4uuECF0Et22JyrQzkbsxMKSZM'
+        'Eq2PntOP5BGyOxNmLd50uCvcaEWKqOYX401zr2WaxBGnwfm59l/GB4q9svoYbnPxXodu3gD0I2S+'
+        'cqxlCcprxxzTh3yJvPvKqpO+DMwQhiC+Sh8bDEV1m4fS/7LTeYM2ooIqkCGt3UrJ/92btPDKM2nD'
+        'i5skF867ddEl/SASqaUwr5YIX3+C6oF2xbgIKo1IibBQ5irvQbSwpif4gc/J7+S2thX2fFTUUhZA'
+        'g7RMgFAWVs/43x2S3iZSNri1+OaWjWOhC8irsVuPAeaE3AlcHtyExVJO+DXUZwX+TWLN0+KjOPmK'
+        'q9BdbLrfc8hx6a/4WB2phHr3NFgDPuQxQ8/yJZiiPoTiQMzHX9f/gHrB9nyyczhRBJtDuj3yQtbl'
+        'C3D3pN6LKL4w1SZ5VcfHXYK/wKgGqh2/MnY3tT5rswKacKqJXtjl75yfZWIMOn/vtcGRaUAn5kr8'
+        'jYZd6YhNhLWwJpoE422MG7m/l5272ZcN1kaI3q8TDXPoSxPojR8gXWnaqD5KMpuuNB9oNczA9RN8'
+        'vT/U3IxF04Dm6B9II3VAJiiflZ3tcyYSGy5pvC9sDmgRQ6KfisE4qwKOG9kac1KRw/s/YcELBFB8'
+        'rM0pPiOf1NKIVPIhgm/9QCgs2oEN5nMU/B9xn73tv0f5Fiu52fN8spzPxE1xs4Svkw2hKZpr+BW7'
+        'aYjG2Np1asygOH2NsCwwvuLfuQQCcGXRtGCbRW4TnWpavPfMnDJMynsRdVWxl+PChTrEiYCFxN3A'
+        'V3KJmJKMz/ohAGfc+rfa49Rf7wLFoa2DdoCQDpy2TORKKeivpZpFgxucdWBD2RYQ00n6ClNm27y0'
+        'Jb1ROWGyLKY9osAI4gG9a+pbSJ/VkRUZx7cwu7UNKGwgzcG9w7JK0oZZoEchUYT26bmLenhsii93'
+        '28NIt5oSqinpM+8Na2ZNLQPj34hWopdK6HEIuYh2CxIPMLzcGh3d7eycw2P9VY/QYROLp8QrHVDy'
+        'KH/0WCkwNyw0E6AR3Cs8Za8mClijn0M7zBpsT9dQCv/fhtwW3I4iZ2sEfFvG9tKEhvcEwjgA5ID9'
+        'C7FMG2l5GP/Izil2VYwIPERrilp9a0AvCtMKgk8U/3WG/a1m6h+uPy/Ec441MNse3J4fOEVidC8T'
+        'wiBLKZLcSwoIV8nBHbRIAh+xNUwrnM+DG/7+HKsnve9qNLfK4rrVOIystTukdRAkPFZwKE9gPsqx'
+        '4iv7nQ8DEVridNzokB32uCJ5p9r0wrsAX4IW4O6Vgy/5LdhB3dqgOIF7yQtxEPsrmVwBGwSQXqn7'
+        'i+1E+cUZquKA1Sl6SBtbnb/c/iXoDvI0T6WQEoEsyD2zm++Xqp1/wICXfPA2s2bB4CnlHVtMSCvg'
+        '6vMDgy8aPT1JprfD6Rnj4iQ36RGiCrMgl25Bt3p7tdHayxHetKir8KoFTjhVfeKyWW8iij6RukFO'
+        'qIz8+XfCPCKW5Sd3dbcZZJiYWpEMbYNZydLg1SuZagQEyOcAyiP2FINqHDmMJmNmX9PeDzz75MyO'
+        '4QJ2AeEXVhs74h8XfyoxLXUZPt0XaDGONQmbrJ85bTUWZy7nHuegFTvpYN2XhXOjM0b/+axnEvis'
+        'h+vsrws5fzv0y9OBfyPwQJJpu3OMglp6XRSbwiFscvdMeEll8NK9b27XYROHdODtJ2K+ZjsuAET2'
+        '3zSTSTViJ1H4tM+0/NkLjUEMT+6peToedQZc8o0JBb1AGF3vpX4RjoPImxhYQsj1aIrGWyRUHLqT'
+        '92GXJ83QtEKEQVGG3y0SAarfbWEvueDi+2HcKV5Ys7yED+0JOc+WzV15VqWgl7xZwBhUejlxLCqO'
+        'de/3AUpjVvdG063h53OM1GRI9NO+ugKk0Mxl/cGnl6bOX9TqwkXmOUhRb+QeOJrJdF19wPYiMktM'
+        'qxH+N7vTOwGcVcOmneWsvUv4jcNugnNxPQGPC6/JyyMLPLtD1xZeeIC5lFWIt+MddlRNTzFFe37E'
+        'wELL1okGscX8EOfqi+VbaBhh3i9toX134qb3vYi1+RbfjN9d9BZvUyRNybcLfqQstYDdgi7pHplX'
+        'F+VrgBTxpO9gDxbJx70DF6f+IF/HCDdlzwxrIbnyAqkFOiZnCZ0ULNrJtsWjtfBimaLBk78HNXjI'
+        'PcCekteHHaDogdVkfU+G0U0T9tPM8oNQUMfCiPeyeiOMHGbbs+6UbHIfoLuZmxrlxaAu8HNn9l5V'
+        'foN9RHKTRtIYyVxy5/YFGFhS3tG16LwQWj/k4/gy5qV26CD3v66UyprCUve30S12RJo93DmkRbSU'
+        'wKI/eIsWAzAKhGFX11daAU8wAYc8n0SASz6ozkOTd+bsxX6F7iNqW3QAKbwajtoQMCTqhvitQY3j'
+        'Xv1d5/x/Powo67jIlyV0TyUSZ7apIw7XzWfPB4Ko8LWft6othE6v28NLfGVU6r1J5EpncVuW/qcz'
+        'BA+mB8v/wwCWQTN9tMfjcCUCHLP5GPjprVBJ8iJ5bcUicj+F4jpO6G5EtH2n2nFAPkGZ0oCBxxfE'
+        'gQPAFB3fI/02asyfa2Ez9L19jp5W97cvxl3nqcQt7SUDhVkdeByYGbYxZe4eiKwyLKmVOob6ZD+t'
+        '1BtNrXjZBWr/lScqUN6jbKMX+OwUm6bqVCgI7REkhUrKcHBRWad9XFjazqpegQiAkkmWhna+hoII'
+        'txbKBLKUBIPJtVjspySTcPwCU5sVkEADjMZO7KdmU1Hds5wNEe91lFgKA0al/tciANUXW51mxIUH'
+        '73qv9MW1XYqz4rOXqT+MGvlCGIEhTxr6Hb1wGhrKkH2lXpAomCHmJnfc+QoWPkiZnaXPeWycm1pZ'
+        'dHB0q74R9oJqfOMlT6r4wFTxQ7vWXYXG4bkVrjI0jhuevfsAEZSonJCHF+ITZx+kbxECq0iQQNx4'
+        '0c0Fn2+LDWc/nY2wVXGRwsT/pV5s5dSFHl+3t2PNBrD5e9dPvnu9Vhq0W+4g21Pbi8cQJgIwiYPM'
+        'iWfwYWQM2cw3kRf8GlrI26IXf5riSpFX3E+UF0bXih+QERA+6SOgzSo4/eb3s5ZImCtGzx+kZhJe'
+        'aOH63Wgz4UTgoT4p/TcB9FiDWA1smt7/gdv+j7ebpZ6HtxseD9k9YmuiO6yaRhcUues+CUvHxah9'
+        'tN/I4vxkDFoqem7nCsGDPUUSzwuIk96X8EozNvkOueCdvsiNxdNRstgNj2d8kiAQRLiaRYVfexM2'
+        'imEIXSvhlWQjh4F1IKGkaVtTSqciBI2iSf+JRgw10rAxae9738W0p5w0iddrJEfby/Sb+mipLWfj'
+        'MOwgwI9DVq/uwxXpU02D6lV0njvNkaQlRQjotknMQlNj4zGOP5J3ig+rOb0ua6kJAZZ5cFScGYqg'
+        '+FyjlBDUckWq37M7t72CA/xaNvcDgAN7KSOJNuRmywaOfbHQE270dGVqk2iAL98lxpEwBYQEOOfw'
+        'TkN84WQS8xxT75TwhXBXahzUhqwpvPuEr/6kr7buj0fU81ilCzl6HK0KnUhQpYIsXW3C52lUbcRx'
+        'fRfk3WFlOvJYRXP/OYEogLG+SnkGF7I2PXepAbmUwg8Drx0Mh2Nrx0mdN63nVSxQHHtxRzE8hkeW'
+        '8Y7+/qxvHyUkRL+wx3FFNycJpfXx3UUiqXgg8SVcVU/XsWlmhTKx3nGKGv9krA0T/2PBpLYu6sNq'
+        'lhk+afvZR0rvFnI+JDCxl0VdwCvH4xqM4BSheijD2HqGtaiH3Kd8PceSzAcqessmPHYvRwX9yKsI'
+        'wpy+pjzilSZw0L7Y4qdECAmIQEP5y/IuOTnpRBB78/U/8eH18vUyX8kUN8rWL20TUwJFzEE0Ok6I'
+        'Co+CUN6yFB4CBW8LYdcQFMZNTrCtJSxD1xNO2l+MMuSoy85kDMXDN7CmQ5qpKuyxvfBXAgNLvuhL'
+        'yFSz9/ygJvBZ+XLYERxugI/XmUVQLBhrKdqZN9CMDF/eyDpZ+JxZAjqgjgX+7H07LPGDyaeS6bml'
+        'GljcFqs48QJcwYhrMWD3rLT6m7jOHoTJFsJWrArxDJErEoHe4T4tyHtusflwlkGYDJfmJUtuKfuo'
+        'WDoyqf/+yiAUuVi5kytSndDwDXs8I2DFYfNDst/aGcUBTrJf/jBhGD0M93sg2baCVMOZ6ARH4nyr'
+        'm1dfRio+GDwiI8YIwBmL6SxIhAt+Q57usVM2yB+fu1LLTw7l9xXOt51OAsFpZFWEtWtGAMS+H5x1'
+        'XR/pLbWksGU5UhLcsOsq1fpSV6pfwBXtyeW4jooPdN3pv2moyDyVcvSItVp2oCucL5hyplkmeYmg'
+        'U00l/RFJBlYW6tWNXN9g7y3hmZcOYUtcbTj+rYXKdlvXW3pk8hBQqx3QwE1fBtjZqDWIwV29wsLb'
+        '6Y5VJA6T2OI5adBzaHUAU/B7MWvG0XXN7+eanLWIn8obp/mWmQIaWpEpmF2SeoHlNeD/VJqV0q74'
+        'rI3BXKWQxYcXsgFcdeie2W2NeXS+oJUUNsIioKRxG2OjVOee4WGjT06HVrUNxI3vfz2UK4dldIrE'
+        '5le/1PU0j6PiAdlH2s++pAc0+PQPlQl/JGLNusALBYlM0WNLK6SoGOWBkSF0v0cqFUzinSQHx4fO'
+        'WQwO+ofCTJVFrAI4gjNc6pYSNlBc0cFNu0n6ue5PQhM/5AIqHQ1vBUyIhvLjq9urWcniZ3TTSTCt'
+        'o1dF62bwUGX/y1Z2gDBX2YsJRc31LtbtWZu44UDjcmlrU1i/wgtl1Z0CFE+p4g6JqCBZU0whHCt5'
+        'w8pxwnYnI4V5PzOKmYjTtQonFKkPJXezY1Uttq4PRdBERpBXhgHls6nCjMW5AGNiE2zH4gfh7/s1'
+        'X5W4AiaDPOKFTUYKEEQ6YE5OTcD+TjyChkF2l0twkOcsPtBU3ajNfAo+8e6aIa+lroVRzxK52HbR'
+        'yp8zRCeLf6WsAi2d7g1Ks2EVt+I7nkglg2j+utBOC3DhSHWmDJu1W6SFOW4ZGTSyKfaYPtSzYz82'
+        '2zLr/+tHoEO8UH0me5sxh+Rsozp5jggmz4bsP0DtAup9gTnvQxd2BSHxrYdr1pEPsbgXTcHZ+VVF'
+        'WNKj7O+eZjvsGX5+u9b7D3jf7YlE1NiClbiQ91MF/+JhOTDhM7OHVeUjU0pUKM1yCzE8TOFu6tzw'
+        'zQ6FAu0bN3Rjs+R7+NWrZH96Yeaf6B8G0y0mtxyj2YfUvUV/v1JFIE1b4wXKIKgFmJWj8Pt1+Gmi'
+        '1F1ZF6qcu+2quBG0fzONl/EHPEKho0QD5QTA1J9MvVZBgBoj+du/mJ07aae/HJLIggv1ZIn77NzN'
+        'VANIPM7JjKa8PHOcQFwKL2J5Zy8YiyOnM2yUkXKGOEYuVFPNApiIZDqAxaRPfPkqcLLaYeJqN7s/'
+        'Io3Ga8PhYOS5sRx5SdDU1KfVM1qzBbwD5UIFnsNZohWfGs1FDa9CYqotJ+EB1b2ycuRCPT1El7rd'
+        'xwm3wnU3gcrjthUOTKb0a7RkKRI5GhoYpAKgsOsf6qdFDToCcPess68zXaLOvnDKq6U6vivPMgSa'
+        'Z2Klp6K7hQRqGxlIV9skq79rTZwMZaK4gmZv3BVtzKP3qW+tu9/OPpVOsOcJqnbZPJvjPigqEkeR'
+        'JNKcGpUps1FSp3OV+2ox8jaZIAQuf6HP8H+ICI1tAkGWDoPGS4yiti0GgVP5G/JrclUCsCZDDDvg'
+        'YoiZBbwbIsPvp4uXaO5nMSoZ6CKmSvdhjmmtJjePk93ozeI7uEC4o1AZ7NnaOp7BdeUUsgwNY5/U'
+        'PFVRzAMdbtKzMXgjlAFjGTrKXQeHfIHT7U42CuuXmwSEBlD+v89149PV6G8vXl0QMzsQf5IonK+u'
+        'p5CwM7oRYB3PlKE51yfgxytqiGNIf5UoxQt1x8QhOO4UvaTiBieBtMYM0XI8x7ZNJPoCEzA86dIT'
+        'ztAkdPsPNJMINSMzMD+sFRJA68+D3/ApUXiSmztjz2yJ331E7QKvd/3J7OBV5pfr4oA8IRRrWgz1'
+        'OTXiwbm0Xrwx41DUrdoM3cG6hzXBadPF/9kj76CEfm3bEKav7U7CPR2RHZgxKBLm9C+a2+PKl0vt'
+        'hCpYE4aSXPpq8Hop90eGGChrmpRTUBRIn92+Mq/7fTNEMcl3nQFSQ5hXJcJhXo8tXzhZgpMjYaNE'
+        'XDAPyeCalq7i1dNDc/cp0qZ0xHJ/iyGSobyCldlQigy7JroWfjCfMtK+tMpcVl2Y+SUKXsy4e5z7'
+        'FUWe8UamAtIfMK5xWqL1DeVlrBuS0Dx4jUVApBY0QQ54nh/KCfkHUt5w7MkVNHSAnOwBJAN5A6F3'
+        '39G5vBxoju47+LWxmOHrgCytyLTLMPZAf/Hlte9teytyN1kIKeQwbMuj2xBlitP2HM9SEZsa8XTB'
+        '2va4g4cCzBsvTqgcX90q67oXm1c27kWiwYqRYVP7PyHEKtIa8MdqyB1UsReC6nqcyBlwEiCcm0rg'
+        '/ITXyvaBeayf+niE3z0IZ2oaThkmQyjN6cShab3jWfXhNA3RXdIDOteY97OWIJDQIVjRsDRWkyuD'
+        'jRwsw7VoyfdVhBlm4RiuZwkF1yXt5o6Ne2yUk7KFZafvSftI2er/XSk1BJr7jV6ohchqkMWWIPgs'
+        'e3s8ia0Akzm34kJDXOfWwZdxEZafd+BFUa/QkU7YaTvhmV1vQlFCGKkYuDfj0bi7nLSmuQnOLcMM'
+        'J5WVcS+qvlLK0Ade2zxdDT+LuOeaj6AKcuV3R8Qfw2P8rGM9qwkCK8/IDSLOcZoCJzWGwqFWV33j'
+        'z1g/fXUZ9YwIJ/zk//EQL7DxDYjHtW1FIGlK4Uu5dHquAWO3IzLc1r8RseeTBDlteKURR2jq7YyO'
+        'fTHgnI+AM8lF7RYPHLvTdMqwfswoOqG4mfemv50UKvZIVFTilM8lEhrQs1esoZKmpng7AfQsD+Tx'
+        'OKVfII6zH6N+ZLEGP+ccnrs3QYla/vMXAwaePNVQxEd6FtIKesUdlATWSZLYLJcR5fb7OeUkDE5s'
+        'Ok0IquwC4lagEMzpglwYsLj/xfnjS82m3tbtGoPJ+nsJOVGSj9g/k++EVCckyt0Z4ggbzpkHlGXb'
+        'K+QLcOdXsBTOQV9cdaPxEi7rMm72ezmNdnxyj0VS24TA8rjkMCJWK0ijioc+G/NF98vABNHwIWMR'
+        'oC8CgQujJo5utda8ERi3P7l90DyVVl9/yKVOaJL3u3xF0kuaFZ3rJxTggi6+Is2MxDJ5NPtoBvES'
+        'NOe6D2pi8Z64wpkmrmGhKMLCxfKlKzfToV62Kk8xfMN+OQ7JLs8nfNeIqvby84s+xb/ZJX+loNrB'
+        'fp+Bonu0VpOq5yUiJlhIhSi/XMJeGJtJfSrLOkHSYNXhVoQSsYm5yHsRuofLmOWGl/c9ITZXBFU0'
+        'Iym0gW/zB7+o9m6idPlv/iDmYXFqkFI0o55L3LmXju7BKj/ORRteYY05XnW0KZ4EVrDm1st3W60d'
+        'RyLoSCVz59cPy29BPsr9QSGZjBMjfBVVXLiaMdrHoCu0jJ/DUT4wJJEhAnU1v4vO3BxGMrRBW0jc'
+        'udfpx/HBXvzHXIEmjPUlAh6c2C/FBq7l/LyzU4MV4cSOAMSLFmLBIy/XZZo6mkgfGIMsCzLNFNOW'
+        'D2X4q+lgacDBqRz2WpuRF3eLfLn63I/Bd8B11BIaux58Ea4isoKcDlaViz0MwY4KIT5aixLbwfti'
+        'Np/dPak/eB5QRYxPbeCZW9BajvwyXXZqLVbPfZF53pW6f/KFw2LGCfjxAfZS++zpurzJPANHnuLg'
+        'dk9mmHTYY2waOiJs4kVvkANlac1NsmPN29aTrS6HxwFpB3w5rej2Vrw5HVvRY53JTRLu95G24NeE'
+        'Oxxc/UXal7rS83ID4ltH3YvUr/BsMTCO6o4W3jtWuLXPi2OgfIz6sr8dM4qWpD2UcPEqICoRVhLM'
+        'PC7EdWN3+Xdq0/pdUA9R/IxPNbHVEIz5U8bIzdFLDHDJmfCFhzCy1ECvbgDMqy+INcA6UnsZ/ElS'
+        'uwjFELHnzPJdBXCTNtxiBbn4PwWxBskRW/jQARjOKgdK9O+aCfU21l/hZphivnXbCNvaeJZZveKF'
+        '+ygLfG7tQYKsTo495D4HVmixJ9zQ2avNXNOq1oYcUScSfahIUkk6djih+ky3ZMZ/sqIQcPJL1Qzy'
+        'rmzbvhZh/Q6p9ihAHlkQkUwn017IGhuJD+1PLbCoRrOe+O856KiSJNgXq04XPhZqLMP1u+Fg8Bt8'
+        'bdSU31E1fQ9rl0CWK+OVQYyvHyR4KZIaXYbmwT90CudjFSW780iobgwYAwDKcciVlSL5o9QCdUit'
+        'PoY93qz9kI+3Mv1CkFY9EJq6Sq4rqvglsJk9q3c2Vs75HKIvC6S+j1nCBb94epwSfm95SPM3PuvV'
+        'wgbislFQn1XKHpD/MPdlHKzeid486V43XgWHZJfBtp/ZDuGSz7If8hNgU6L2CEwTWqvXsi3le7Rn'
+        'vH+u8F2NIO4C9S82YsJhHnPo+XqQ5QcJ7YkeGpHWnNdXehhSqrLhNVvyVB2LfQsI6HEL0qFG3WjS'
+        'bK2hE4t9sHHVy1WcAnq6jDLJfW+vBBuP8sHgD79MBjHCgXQHk25abZrtf8JvF2+9RzFo7RoeSFNo'
+        'yfbaeX6LwMOy9ATKsh/PutSGzf+bxHXgTpr4ccGsue/ui+pcKcsF1IZSQPEbFE8Deq13CcuuR+PG'
+        'axQCbePwXTWhDtm3kqhj1FIaeQdseMzHVrKhgi0SLBL61OD+axiPKalWSCRpd4QYhIceMPRwKjGf'
+        'Q0uni8aPL5gYIYYfyylOlt+1RoOMXuvUceFxVpriB6lBp5ZP9yc/sLz+nEa5YJeYRYvlloKCHiAQ'
+        'NozGnB6dJ2VaZOemjKNKrX9RiqoOXarU+ZKVy40BlJfW3cKF5FqhvrCvvBOVnpZOz3xaY4rVynb6'
+        'tnH5BR48RT24TIJeuh4ExxmGNP4ubmVzJmd5gvOwRwJFArTpPTFdTMOfEQIBvSmnyyRxfZXC0yTz'
+        'mVYbufcPihfCPZifh/1XsdLo49I6mvMnId1fMsST6envu6794qTzYjHMMWkwmxX8J9pcnG7a3LJ+'
+        'y5ShUbeTtrH1CrjrrITl7aaVBPZI3fNhojC+Z1bZ+5z/wNBmCr/3a8CxyXVfYP1/xDGrTbqAQRtL'
+        'ZTGDc9JNqoFU/Fxd2M7C/iNBGXv3uyEN1W22+wIujsniQfl09pnmZeFFzPHcKnBSSh0BKSY5vIt8'
+        'bkvC2481J9MyrLjjrjOOKr/R5OnC3OOPB+JIZ9IZBa7EPW+EDpsNvKU1FsbVhCZPHF9NleOzBpcw'
+        'c5TdWOG9hg1AqQKANSEogv64dq9Klr+/vF9xdFEhdSGqPq2ryF0BrOjYJ4t+CSfLfm/Jc483QKl6'
+        'Q5YPpP95lPxm9+tnjcu9E9TiJxp/bJn6ShPdi8H9s43KS2xvtDasnSZQM0jN6TNU7qXVeielg1dz'
+        'Gs+ETYv4pVXbqk0N2+bJS5VDCZDFramkZ/6eg4LGwBZ1m2MPNblhQVeKm6JaWlaaEcrefegnhSSv'
+        'LsWAB4jsItzDGVDuBz45DPi6pVnFXbyjWhppVNtDizaJUhWX0wwilOZ87WbOZYUxwW/FyhR6PwCk'
+        'N+t5OSMgmkF8FKjigLHo+DkKIo1RzZAamXkLOr/bVxqNt3bI15LD89PKY/vJK8vxNrMdF76wjXgH'
+        'VwjAaBJLdKTZY4gSga+tXlEKjo6LIVpaglJFCyz4PtidYtin5LsXmNu+dTZQZZ3DSOiSeabacK+G'
+        'WX26j/oa7QiuOw6mKEjIomlgkA4608j9/KvFXbvFvBt2iFTU5v1aHjZLaGhvRKeWSh507YoDocAg'
+        'P8chZDfRaGKN2dRWtrC6dpTHZ2XhaIbhGufUGwT+e7372RdByd9QZaOGLzFi1L1qBraB+0DxjKDQ'
+        'uFzGHRHHhy8YIB6w4dWmUc+sXvpxAJPDt/po79cJZlsBbW5mcKNc4tU3scvHb2OlHH4407V9CPhg'
+        '9Cl8shCAhf1Ks/xohvZz32ZqfzjadruX7stuy1maW3oABs4nJsqtTMeQRpeuPZZVtFIZ3D/7zlBt'
+        '29TMdyoC2kCmUZnlrmq3LTttKvwV0Xxl+F1Y7xtjLqOA5gfHwWyuWdvoULNOiXLByS5BR3ka2ysO'
+        'kZ5rLI0sVle4fKYRLCTiVgrhXS/5AAT0bPCoWqI51zKFagj/3oKwV7Pw0skmB7L88A2raw2/hTFi'
+        'ePol2/GsJv/p7Y3aOhRf342SCxqpRnlK1nb9gryO5O6pbziaCUELq/LFrvsOStvv9Wx2jzpKOB2G'
+        'TaLW4HFpI6up7+4fOtT1DAUwnEeBForyzztV3zUJc+AfBC415XGExjSYg0Os4zl7jE2Rhc4DGkJO'
+        'bee+eIH1cnAmBh3QC0bXiH/Gsd2nlj9q4kxyn/wwUIUXOsMcBw9B1JO0XkshqS0PtW69xlKSbPsQ'
+        'nU809UtSwDxZWbkX31x/Z48Rnww13peKFKa7vCeGMeK+JF904icCwRWhN7NBcwvJkk0mJgtKLkQk'
+        'UADNsZGH0J/jFC0tamJT1Y/rdK12gO0y5+39mlufqpiqFf0uGbdxJ/3itrU2lHaSQFsW49c8QP8o'
+        'ddoiMoJ2/hhNAhlkKA0SjpgtRxar1EjZpHfDMIz2feo+focZXGts6AeaJgalnbVP/WjnW3ityWHV'
+        'qKN9S/CYuW53dR3EWAgGcJIsEy1eNgfsFxS+AMqR3pGPgdm7X1MCWJOw4nDvQUZJ7CcB0ZR5CD8B'
+        'WLH+PGUEDXM6cPlVYE1wl5pF0gG2C+UGQ9FkHKOmvnxe44EjMws+rYgC/djNrw421Wbz5ArorgV2'
+        'Okc8NSZbpfw6iNFiegRch6/xZ1U561xMCJjmf1WPysR9cpe6VcwRIUgUEXkcPaqKmKsYAp9Rb/V4'
+        'Subfp1d/2fY5qTbaXQhQXAMVruJ+vDDHzDd0m45+50vs75BrQIg9UzUQGirYZdgwVBvRULFxOUXQ'
+        'f+S3/KdzybmL6nlTA3vVPhik6qt9Fox70Iazi24BnIU+MUYfUDpnLwGu21Bp1B32DhpWXpvFT0s9'
+        '5C7QLOj03uK9XgKvoTfOvC5fVoSyCkfT47KBIWG3efBN+mF3z+wSvgoMqTU347ucFrSW4XsAbU8O'
+        'w8jmdFgO3Vn40JgIg3dgXSV0n60mAMeB0vG+/BFJy9MZ8AH3wcwHOjCfwz2S4TZ7i/2WOLTNI2MB'
+        'W7z2x/R/Y6OzuG57/a9G9AvE9e2yOprAzCuf6pctfwPcC8WJPQ8ErAmQ5+S5SveL2RZhKVCWu9DC'
+        'KKy17j34ngh8SwbRlKAeew2yw8QGTAd8JlZ5nGY+L/gZhNbh3NZ7RNrN+s+LwjaJH9J9b8o9tuCA'
+        'SCHNjBAi4FT8v9TcDmwcodh9mJzSanoU9cuKAw07YCW7DEek+SROqdzzyZG+pwHOXGOUmpxtJI+o'
+        'WnglxTWlWsUTOxXHt1u/pPPRy5wwUQp4LyXK9bZJbf1/nKktfzByKgUs0enWX8Ds8NogVqpelKsy'
+        'y1Bwt4IbzB/XU4UFkKyPrDczOPQ7eckY/0UR4HzY1noyaFB2muxj6sQ4VfCVRBIj0vCYjI2LjeVH'
+        'Mey+CEpko+XAkN5GSKRTnx0P5JkA/8epnhrvrng55STegZCkC9k7IUU/BomZ8ZuXnkgPSM08qgK4'
+        'bkcxRF3upT0L5ve/cB6ogdFQ3N+JITmdfoifV4jpbvY5HsTkTMglwZ2qDVpzjf2cG5+bhaiHYXoo'
+        'hhJlylc7burRG2wrK1L02TO+XtX0+Qph+FU2D7W/9ugzt2X7wyX2CsSAQT7sP6eKp3JRZriPEuZv'
+        '1noLK37+kXQ/TlFHRCSqHezjE70umOC2u3dVNg6HtLH+m40YZZrN3kHAw+uVcjUOLZ82ecAd+5ix'
+        'RK1R0FligVREJ9wUb2zKo9x7vUJPlk9a3ndkEhwY7zbmSkOtga3kznPmGEDg995HKlxpR0QiI68I'
+        'mjhCfFPCJAExc0INklYSBX8nRxBMxIx8dio7G7De04YwJNq03SebEMveUC+qBkTBtnhasFcC1AYG'
+        'BYkPE9K7ysxza2YFu5JgirA9YkfKZKkjVOsn3ex/XJfbnwN5Qp+F6ur2ixQSslarhlxs/ggBrYBL'
+        'ezHvNsZjMusVsBd5W0VPX6PIGy4GMK+MpKFBszeNWULLwVqCno/hdBAoOa2KX1HJIzE1JUQZ+muH'
+        'bMNnjl4e4mQC3x0VJZeFvOk+/28AxeFmbPyK7x1fh53Bew0VFkTkOZzVnQQnA7F4/bLybXeosBld'
+        'd+YpjCtX35uOkh7uekAG6YqpjLD7VKzciiGxE2tvEArYm+I8BjEHLZAIedwNA7j03m0ngLeKSddV'
+        'ME4xV4Z66Ezn3EAmWFxvLS/sNtEDmff/ridqNwmr3MQhtEqkNM8y/845EsyN5pTLU0CqRPT9piN4'
+        'Ef3acY2BHWfqsdCHDY2Pz5IkIgI3x6F7Hyxk8m7LLwqMwonizrowTnfyP/35tWibRV0pJmrSlMih'
+        'F2mgrgoatGLNutBjQ2gWpnNu7aoahlCaO86ThIOO8C3mJZXgAgnKSvuAtIj4+X6+TvV2U710XxNx'
+        'mxKHKXAmAwJl1I8T2DUppXwI2NE2NlWN3yheORYvxsmy69TQ7NWNTjfI+kIrzOeeIW7vjg3HqMEC'
+        '7kVJ+2jtvWEO8XSIcrnPESFUYKXEXx1bILo/3jlp8mQ30J4jF513PCwjRq30MLOwGSoqQyXPBNeH'
+        'QuarBXBmLSquX7N6IVs2ZTeKb1Nwqw2p4Fd6cZYa4Ckimz6wiefj8v8IkqYqla8C/eO9AAoIlWxZ'
+        '/go3NmlyaY6cgwqgDz9GZVD2b0I4fXvu0SUiTRmgXgBGSXNeW20rCAyUh+4QTZzRKTgox8L6vdrt'
+        '69uvsP8BNUqKSB6Swus8LaqtbZiRrCtRnmplPmTcror41azpZCfxewBMOxjG2gIJFZHgpP4JgT/l'
+        '1qipylcmn3AqF3mZk7YhDiIKenVyTmhrfXZLuNITisFQb82ooNQFe/P0mR12O3hDGrPXZNJuiRCp'
+        '1OLXPL+zoxaXk9APVeOY4E6rjH9sMayypAVniNHFduDlplp88Q/BhQfbqufwQPDdoJW3DDFTAeJx'
+        'TcOiAs0cwVd5MR09CwcxnBcFoKqj/+3eU/fZMvQdB5UBr7f9qK/+Q4O+jDCpKDke3riHFZp8xJV6'
+        'FqnCIgacqIrqU82PdedNR+pEaoowD1Fp7d80nNZf+srwT6K7mn2rCOubPY6aY4QWYV0bvboDqNEK'
+        'B22NuideabetLmKL/bxRoy9bqculIldVxiKRRpiGOiVfWdbhb3Vsqg0974dcgB7puhCuAzlfGC8R'
+        'lwabpR6eSeVlDRw3AfUYpWEfJXN+rfK0f6OnmQUS1D/kj+LXaMvWIWGPR/qRJ9r+GcKnB6xN6tTO'
+        'XaEGyuyqAiVboZKxTxPnsu4wcT5Hwuh7PytGxp9TKFlb8IXpDigT6StXuPDnujvRnbMk6OW9J3WW'
+        'sJV/iKPKbB7NMFrbakG2YPFn5y5CWLdigp+jrwLlUQ//jwPS9FrnlAmYEHyVut/Pf8V4CUy4Qnvm'
+        'kQsvyx/XalDOziMtLCywaxS5Syb5lp13aCc+ysg7rMLajjVswL1yDxP+OwpHKQ65d1k2t7/V/N4H'
+        'tKU6GGoZBWIoQK15EiFduQPDhe0hk55sdd+xy8pChaCxwcNhGtZmjRf4C8IzJ5aRZ7DncveF5ALZ'
+        '9AL3E2xKrSEj8Ce3jjUgiU9Bn/mZ7U0MuSDf2KDBJTxIxKzzfpmjUnS+pvi8bIJyPUpJik9OTDMu'
+        'VmwHveN6L1/B8dED+CFjTmyS9pMvWibJ346gK/5kOc3StqaVUZ0qO9F1/e/O9AZJORfp6+8i2GfN'
+        'LBl1uW3UctN2A+mOhRX8KZNpANRsyn9u9q2uDSpAHLaiPmZzKrrXrX8x/xbWvIWHG+FVgznhwD9q'
+        'aGzAIujWqY+JKAJUWReKD5lClaKeUcn8usdk9Wjode9EF2OwCZARpthIk5M3q9RgMpyEfpmCqpDA'
+        'mHmAxPldqYRLORkOgWuQ7ifWFJo56Qc54LdJ6r/L6Zl2nZ8zSvxIV8qFRLQIWNMOsWPrG994ohzZ'
+        'enF5fj9wRpRmlEHGznw/Kzdhbirv95dg+882Ej5WG/QQ8nCHrJ3SkuLpvFRJG/ZxM6WIMx2zaOZY'
+        '4yMUgxg6AXD2VpYnmf/9rqlzQfc9Q4a/yGUJj1QZb/5D50V9+JaXKUoSw+XhhpJd58AjEWgq2+xn'
+        'l7W2xPsC7xrC16Go4M28a7yF0rMpm90/sAnlWse1U+750y3K0SSckLH2kaDpD8wHvzw8fKI4JZQp'
+        'm9eJDBtZ+gXTXjAM0vJ8DWfZhzdAxB9Jcdk9ehkOKCX6jZdUqIsQqAZ1/5Fm1nGn6/nw9szILnHX'
+        'JWx7LyH4Z8BzYNIpLLBgV/SEzz9/8Rn/vuAa2PxhmSOvi/cwsNyTEIQqRUf28t0/AlCZ4tFWsac+'
+        '9wuEEVbuS2qs6UpwU140UeagaxXIQirVEtkTilQCRceGbqwj38kXpcJSTm+tRA5w3mqBkaCsfAVT'
+        '80iEjvPzovrSCo9ZAV+kwxR2Fr16fVD6CXUzAqUuHeWacTCl/aFR1FNIVI930kLZQ2oyf+vgQbnu'
+        'YkhXnVg3yoUbmmRt48QkPqlj4BtBqpAY16HabgNje0fhF2Tl79F9vX6/tdWGMHg9XSkQwHqprf+C'
+        'E/TBLK4FwqBe2owmuj9XwqZDdqKCH+AGzK/n6OkwJ6aMXP079ljc/vesytfmo6s50q9+lCOaSSZN'
+        'mrImTVi0+e2HU+pOJ2rSIM/Xd5kUrj2VG1epohvNR2ct/4kwrQ5ZAVZX8GDXk1Hlt3wEGOmGK8MR'
+        'XM4qe/W8bdHhU8UBjpveQHYEthCwZxwaAqwM3ikPQm9gXo8mmmtfA9HSc6Mga7wpIFT5boCimFXF'
+        'KQTP7IFBAU3fhmuvO9RzWkkUu8H3e90odlpZC1cGRnbsiTWfA0UzFvfv3WlF3EUgxDf6fbXKEXcF'
+        '6Nzi+O4ZaLp7m5R85kafwC8D6dUND5osl65FtQXATTk4mt1Usvy5yU1HBCyspAO7q/OUf43o6oRG'
+        'YAl7R3VLX6FchGkKfHulx4tq+NAySHOR7N+plxwBOHxf4dKMa8lRIjqefnkHPAj3deib4D/FvBSc'
+        'QUT4bs/eeUaAWNs7L8SOoHAGET1LZT/Dq3gQ5oBQMMwSXoyFkyJGMyGu9JbZ0nl+vzM9itqAv94v'
+        'tqbaOzeQpTPiWvU0D+dutdnIIIP8YzLV/tc2BLMnD/GciXfMS+3o2xPPv7UuyDHRXClf2Kc/brJ+'
+        'pHjUisWbGfCDt66aPguFsCuB1+6Ngj7YcVUKfr8bEwc1f4BqVNF2SmAXtMzvK9D6XG9vOQTDFC75'
+        '1W1erZywlczljZyawBp9lGD+P7QMETHjEFUa6I4WW5a0aT9a3COeb14LR+FdoufLGbI7+NFY0oDy'
+        '9iGbHTSD6cdfqHBT5nd9U+Ru/BFK6OUo+oN7drn/Ki97cygpZEzvjci0VKvJ7MejRYNlgbOx/rm7'
+        '1/oYz2RWdewGraSsDq6GUmpT4zI3kLPaENi/LmemEbW5Si6ZsqZ+97/XNQOhS70PwVK6afu4qBsJ'
+        'Aghf7UYAPN7j1F1PB7Ti3EETmgMgDsm50JOZg21ZNeyI5ipkrecvp/9Rg2sE3db0ZSiI/mGvadpc'
+        '2aTldpE9cdYXL8cSx0GFHBCPQq4JXghl2MnLK/6mEV2YytBfKxVPbk5G828RPN3GCoP7AERYCoT+'
+        '7OM8TFAsthAUcu/YgRxHqrE6P+mRGGyl/x6/8ba2nPSmrWL0icG3VXAd2cSsPrHoihaTAQZoxT2u'
+        '/zZ3R7Y83N0NqAdeEQHlxyhgCvv0UkD8a89f9pXNWHjNDCihM4rHuVWom5kZpUCEb5tipS2OWQaY'
+        'pAMVfVW6Vef/M57UjFAtpHb4w+EhHmZhYC0XDoJnR9nQeB6iu+myzAYkb/yvSpjBP6k1f8tevXKg'
+        '/u7K1Bb46N18kN0cPHz9w34Y0qeixiKovjVxP++nqCiA3EkqpQg+HU8x/kizwbgRThD2qxZdcl/b'
+        'P9dbLyAxdYYqph3T1e10TrzLdzQciyw/ZIV1jw3JNp+Vt8b4psAP1OGX4Ln8NOhhbxfvX2HNbqIS'
+        'qIbYcfxWYajAotT6Fw5Y19LAuYY/SQwuiWcl+L1SW2uxS9/WMBiEIHt9LF58gbA/eWym76t0EDw7'
+        'dj7AatRgSa1xsprtZqp8+STkrQbozroqqUU6QC9uF+S8x/BaD9ynQSZKNOdZn/kb0fjdtJXyAPRI'
+        'dCbUxPvoam5BDv3zjkUE5zJIzSOOuyY7so61qmpZXoudS6MvsfZIVm0cy22R22OZGOHmqTpa4WV2'
+        '7YwWTDMx9FNgF32WhaPxLJyFp+BhxCIHzUJJDIZvcHMwy4uk7FSkHJWm0lds2nAtuNRhysxqMQ1g'
+        'abK7uvMDSEY5d6FHywJcRTTmOAL5bJ7JVdKStQL2dU+I9jc9SZprKG9ncw7TMgIWEOGUbz9m6chY'
+        'uO6Pm3JAOiLzzMNzd0OS/NjrUuePz5+hYU7SAbG+gpqz6DDqZbhM5gvape1Zby1erx8gd+iknt/c'
+        'ycxBm1AGBR2CEqNfkqQzawRDQOc1E+08w/yO7NllePpni2Z16mHqv2oDRdDBMNWyv+PsmB/QF1P7'
+        'G1vmFDRpblUzAHTzoUzGDVEZJjgqOMOQDjhggFS8/DzHAQlVNOHxkDIAfzg7TwiRX8avA1gsx66p'
+        'J/vzWXs3bMTKRf6xn11yWx7A9AeFo0H35RBYFKBvmlyoLX2OGZU8OJbz4G68mfQJ/BMfw67nYi+f'
+        'HCMR7/EIsBdluyU5LpLjHLuaonQ/sd5ef50Be063FPm9GAINhl8UIMFhJGVJREZfpvkTFMNt+CF2'
+        'sqBmmUH0CPhWlT9FWSnVdMu5Pgbz1R/Tgj7QOz8FRtzo3r37rOsq7DFNQBHyY9zSgxrpUXYJtaev'
+        'mJU81IJuv74TFq5eju2kP/rKjaqFH3ksIOf6Bq7CIDryOTjgl9WsB9oiFR6EhoU6fFrLjWPPSA0A'
+        'wAfEAYYodK/2uNoJ39nTpz7D1MIal6dsA4Z+vkQqK+QZBwEWs+Yb6P6/l7OD8NRaDv/j1H+bAXDk'
+        'DlOmmmKkm8oSWgpFu1KRKbE0AorOakFgew/f0mE1NUd9JWYUrzU0MHBuykF25ccLW8a/4kOAInkS'
+        'P2ft8FIgCqBEUZqIMQN6lgjrGaHoTFLgEI7ZWR7bbcYeyqytZPyTQBPtD+ZzANSOIsrBN36Yb+IT'
+        'dQO6rFAkVSfgtayGt/+8Fe1RglDC1qPn/ZYUHTUN6a00jdx0Z4HnCWDFF4tvaXa9w/M4YY7PZTZA'
+        'lzcjFvbfUt54y66PSETZ+cWao3OuLYrVhSFB/E7JUqKd3h/tH7KsLvDGjh5sB5ac6Txap1cy8M3p'
+        '35JYrm/ukjU4iHvMJXU+TX5DUyKnTJjKJZyaHxVRiAaFh2+Bh7QykXC+Mp04fffiXJc2RlK86DGZ'
+        '6+4+0sR5NoYvUjKGrQL4OgM/+EWHZJt92DmsVPq75fHywJQ9AgmPPIr6ImPUhooZe6kTB2MbHj8q'
+        '1PdbZasdF5EsQdGdcmd7DsqGL4TcNxSPYkIyobOvXIvFSeDK7CX9SL0zXbmVgBuMHOPjyqZcyTuU'
+        'lKeuhGTTD53UvoU2Moh0Fqyhy2ZPrRCJw0R2EW6xEQoD19UA2hRFNMOndeiub4bUHd/HMLibMX1T'
+        '2fbnrfXgrDs7kMbirn4OleVi6A/vQBzgbU72E2C2HqGpgUy2SO02Wgh98KEnMtekJtAUeH/frp9z'
+        '4CrQYsuESslHqx/6to0BMujXJcHliFZAjiAoL6S/WoyoyKFVd+lx2UIImXOLWcYCBJ7cioqPqtQd'
+        'xr2UiMfy9bAkmGvRlRZ7WDFKmZlYwrB6aiaaViXPuyHp/gSYHd1AcYu78fYGCxrd7dgYSiHMGQHM'
+        'AJgmGnL5843C3ELwZmOyUPKjLHgUh6tcOvgNx7hAs3ck1zXtbPwKGM4YSEZon7VOYy/FeWLMLHD1'
+        'hPLOnH0YQxcGhJUEDssv8NQ8PaeWVH8NmmiZLWTvmeV+9EZcymkhiUNVZF9V9U1T4MgOUS8galHv'
+        '4M9Zd8wxHQhgfENWDcdjbGV5WtwRpiyjX0+pjSE/YJo5+wtQj3Em9Y2nmC6LO3WfBMFmBj5ss4LE'
+        '5L4XqomWIhGWE/nzJRHMN+QEst+CHD8uL0CMOZmapfWrkODciUwg4tCrqZAG0rsNtaHAiRCip8QS'
+        'lq1AxVMeo4YN92k+xzLds7rCs+JhU9sugafMAT2rrClraBbKDgfriziC9jBUaX3Xg0IE0R7MHUJ1'
+        '+u9vFlhpjWWBKX5mthaG98/0lCbDjMSa7SDeXQjlQyu+OLTItbYw8ldy9Q4HuVA5wubcpumQIdt+'
+        '36/Sk4WSKAwHPUIEQXcoprOFOE+RilzZ508khyYd4Ngp+G6MZTsTlzItWvMNNx/oOXN7PSuNZF97'
+        'aD9KD+knSIvZmoU0rq+4k7zSeDd+sBn9rLebi9R6HMCt4f+cAGMN0StGQF5c4zwaB3H/CEIUUPKn'
+        'dFWhY7q/dmfVuRXAYAGJMq40hSO/R9Ox/7x9Ome/osrMZ4k3QDK1cQ2LhVQHYAQj16RUYNbAPA74'
+        'C0V4e/Fu7/yQRbo200krONu/F9NyiwdcHd4BYdLWmvkUZUkc1aziBlST8z7Gmf56xCfPB6R58Qcl'
+        'HcN1oVSzJHz3TIsD18NCazyEpCu5Ujr8tFsDgsX7mxSamZow5rjCIn66B5Rrvwd/Mfjvw0LFDsKc'
+        'NrgMKiJfwfzsvFwuFh1ASxBD4fVp2xPyI/3kXymJked/aB8slWtJkR21w0py6A0+MmvYfmooQ4Ve'
+        'fA52u27cgYCtfD8N3CYucnFqg8i8/GQu3nDtzr43GHXIEcK4DKYRp1x2gOCsBlkE+3uhfoTOMHpb'
+        'AZ3XV5SvRnkztXzS82qVF8IWD4kA4khzQmdT1n8oHMSbglu06b1Q/N30JnFCfun7LQFuL9nXzffI'
+        'SOKXK0PbxcOnfy0w6pQoKc/jKIIZwLFyzTuGivkqeDLPLsUKrg5/1mAa5u1xzchd3dvnxvg4I1LA'
+        '+DzRWo99uqvGXhkHZZ+hFYDJ8mszKNPjtXq3nUNikytjxELpUAE8X+GBSqagllaD42kGGQBLAQSS'
+        'alcwTyIUP6KdgKeqydW3gCyMP4h8OV1qL4KCUsImiQb/ycGephJ+U6EhEapi+F7GIkexqxANTczB'
+        'PQlc43c6QQQFai9Sy4uE5WOmL9rSrL+Ajq/OtNjwlt4WiK6kzV7cXblPnQYO4p5JtSZZpxcaag2P'
+        'wxbkZ2ZbMk1fvPGqSBjiyblDDKLBbDTMBt//dbAZD7jncSz51uUrP8dFPOPigYyNgvY6UNELO5vc'
+        'odkHtP7UNNjA5RRwzholAsBaPyrmrIZ5DJJwoNKBGnl6w/bAUa/xv10Xoz/UPp44YQAlCnc552pT'
+        '+JI5H79rqvl5PrwT94aPEDxkn0HnVorAMkq7mZFcOIGNpHh/20MqDj+RduPohv9mIEviiY3nohL1'
+        'Hh4qbFBjKhLD3yJu8LFVQyly3BJRQCpGREvVUsKBWvdTqpRp9C66jNZ2RmJF2N2FTMHeIsHLJYNL'
+        '25eiSH0O0iUHFQWVOlhbWwLin0fcl4N2HxUEHHObVcyiB3E7GM2MkwqGnHX0zyOUYdl65Z/CbVrS'
+        'lcSjkWCVAyR1jsApQo7qauMNgwHdklNCitPNh91f8cafvoRhxOjYY8zpzAJjD0bxmyYNsq1VIiB1'
+        'WFbRRezGRemrGbkQDyyXapjIu6RlfH15i2mLMLz4NPL4QimsBlezR34gPxIOkUwe5Gbvrj2N1Gs5'
+        'sU2DndagH/5pD0TGRBTGjMyXlO//bNfcGTsjCKwtrqBdwT0YAOEy+oufWWv7UA25JhYKOcBUO3Tz'
+        '9JaQbU59C1wt5PP3ygb2fCECLDW2s7SkXqofYEgnRI4b83mx0RBhrA0zxm33u/VKqHzasNX16oOJ'
+        'vaeKqFGVcJArAH7KCukZxBfu6MRFHNAIVxvAoxi3pS55lGZb6EWm3DPdJazqxJkvAX/iMxSt4Fuh'
+        'bDwENnDPKt/LSL8XlHB9nPFRX+aX+dRy5Lbzh9OvSOPh6A9qKK8QZpdma+T7WQ8Cena9QYYFD1HS'
+        'sTThcNTmNdO7KZ6x9APEVycU6RgVV8p9k2bYcCcy4Vi6C7WUzGWwoFHlgEXbXL0FEwi7lVVJwvSS'
+        'fxlDk6FyZIODOBc99+bRdScN717S2p+ZSUYlTDydUFpBvsH8WgrJxCnL1EQF1n8DcLweJDB9BHyX'
+        '56Wv0kyn/KAGTKg6raBPLvbboEKqntWiHBNqmBxEbOo+3P2rOBaqdj9m+NbcLNCmvuGKppzm8DgV'
+        'sKMJCOv0rOaEIXairxNBb9uqLgIdZddgUl2lzurBojMwRgMDNq3w2fGUo0eZbDcgt4H/K/RlqGsU'
+        'XHUeSZBXdnZKkFn7TXuI89uCOz47r5YvA6IjxbmuyfLxhcMHPCq5mGCY8mJaUwplONRkmLcr9OeK'
+        'qnJS0LOFxalA61iIPDCiSEqe1upoaj9JLrTsROPeyKc4JkOXh5CbzujvI7mCNQoyjIBz0b500zJ/'
+        'kctq+1PCRJTI6Fd8vmtWZjoTc2Il9VHgWCmRVC5xnAEcQAL7YmV1FyBL+5/dk2ZUyQI0acmy2kKv'
+        '6vNXXkTQkjAZpThCclnMbXCv93DrfvHu9emhaCW4cDzOCVYMWVEE1NZOLcl3HphfWtVU/Ia43GPm'
+        '0g8vUyhMwgdkZUdTgfCbvQLGnvEZ8CxTF+1qz8nG0FacR+xtu917ZPQpb+pg1fwufXuAtaXX4yu0'
+        'CvXUqPfN99HpQF94Dyc7sZEikljcb62lh2XuTrFmp3gJaWVU0gP5LevPdIPBfMlO+NvTb7rdm5QN'
+        'iwAwpenSxoDsN2fb7ZHrehzrnZmZd464loS3X4Gbj6aQqFBew09JAzmmAOdZYyMAnspPHOpSoapU'
+        'JXp35gYHJFXIcYF6pcRxjND08kF+vWwwd/oc595+tx+hGdk7W826f5zrPfC8efdtci2IS3AmAGoL'
+        'xKCvwkOZgVwOEWie4pLNmMYnbfBPxntsAJRpczHtTy7OZ7myfiFU8WXViUunSzvQTRSrUQDOflVC'
+        'zlpWPmXsAtC1tRIrPsBobJKVaZQRua2Po30/gK15cpE39hVb6L/PFboDRwkBGqPoG1umvvfjojxM'
+        'GOCijUYfHWFyd1XtNdXbld6t5BYcdbBmD6OFdyyOx5vfHbXRo94qeqqo6tRhJ7Yu4YJRD2u/AjJ7'
+        'vJVRIt17y1OGLKT/ldDNP+zUWBUfXoImyWM2Lly7oh8lWgK8h1Z7XStldvQBNSEJdSI5AOSb/6+O'
+        'qsJpCwXeFFsbSD/r+yutNmr19rttWrETBDgfMOfTwHD69DRo3qogdqRTww4Dd/ck6ka3PcN6sNA3'
+        '7CE5u/VFNrl19FRzsrJHDxUfskVxT85zfpW7/zwjgSQEHRiUEZvQ6pITa8uca0LjvQE2G6gIcTIF'
+        'FcF0doKZu+J03IiJQtkXjdgXpygB0h1d79kAUPgq1hPgOe7JQ8SvOmRehx3ZlDKRABQi490jcAVf'
+        'mHo95C/UWpJUODJx/dBDUfgpQJ41k10mUf/ABafveXYk5bHaGc9pfI/NugUJqTMtCAz3zHxf9BJG'
+        'xygaLyFtNOn+jvdCfyvg4bvGHiPc844G1j9A5TXohd/14AvHdaEHgZIcKJmQH4gRoUFZD4H5MaCY'
+        '++GT+s6F2EAead+a91/Sq9LWdBmy0DwMFup8NCp0Hi4vL7vB+gSKeetxFrQ71i1dAzVFz1IZ53XT'
+        'vs9wImMvcqa0WquGFiu79ixx6/yRFSpi25gU6R8+yM2egku1mK4f3UKAbJ8adVSZWh7LNYYPhCVG'
+        'Vb9oz9jKWurvwOULw653kYDzTyZUaZIggZQaCEszxrt1eW3H2enZAxIH8NGBGpjiFjlxrtKGWbf5'
+        '2aSAwZA8MCFxODdnahNv+IMS43bgGwojd193HInMrjmruAJoCdHTInuX+Cg7IAj6TBOTwxQ7PWZF'
+        'V0Bq/iyKSv3wYWtsY8Gr4TJDu/nbZnHRjHX6GHQFfQuEVO7aTM33Dngtno5O2gBasBACrPdXhCVp'
+        '0b+vR7s7qq7FJF0JSV4xbNvP7ju6MsMMP0xG//m0GjgKQ5Ybdic67UHBUmAiOc+W25CoN2w0dE+C'
+        'hV1wy4QzQU9Qt5U9asdWdL8kEB48XPr+xwAum3L+g6fwH2c16m2IKc2403/CQ4rOg8dnPT7lMsOE'
+        'YooAPw7jCqM8ylwy76+2bOfQPZz4rwnTRDtekSGwwgA/uXTxI/t5d9yQic3nXq9p4Szw/J0TMsR8'
+        'DJm9lCT5z4pHCw1hh1RFb+P02hbitEdfLpCxAlRfTMO//ICw5OkC25N1wqXcFbA3f+1OItuZTPXB'
+        'TqNWzCoiz1r/ER2xrWT8valQPLBoCmZBlWacJ5NwIO+7BTSmqm4s9SpbsilU1XcrguFjh4PMkrgA'
+        '+D2rrfXAGd2US9PJlmNt4xlM1yUf2WJBCPJzA8vW+ryqCUVvqfVt8UPow/6rAhgMirUmqAsi0fI5'
+        '8/iD/cQWjfd3NqDCOuxVHFh4EvgXUFza4AIZ3rZMQ9pdNJ4Im15BMNGk4GYZ7pmLJEwYfcn+9kuI'
+        '4BQHndoKe/q+6IAXlJBq2268TlI3Hwac7mS8ZtZQsb/Fz1zf7iHxM0fbl2WIsz1G9fvDb77bB2lP'
+        'fgI2WEgLi5Rleo+LNGfEvD9HIwnaIMAkzy2GZ0Cnja/6IHwlUAlcHfgdqZtP4gfxPEXzEQSxyp9I'
+        '4MAkftL43MuHTil9kroCHA6H5g+dJTP6r/KG6pfXreTP0swHMns46/3q1KmLdVwuzPAon+XtwsZC'
+        'EMftPrR3OJXpEGwrAJbdbkmhkSoUS5ouJB9anVNrx+KIf6RrPieXz8KMz36KHOPaypYyBmfIbvDr'
+        'b8SQ1nnJ/AHCV94IysYxnNNbgXEZFOL8HjFMuaGF7YtLZpKYNf/3w8hPKk4VlEMXt+oYeQRAVjwn'
+        '3vFMpQmVd6T5JPqzuTThTaye9TfZXhpikLO7DwsE77TOSYdTU8C7xnLveAAjG123UzDdgqlZHzMD'
+        'UN8kk4EDtIyfvsEaQfBAK7Nqro9qHGBdHbYlff5Vls4o4W96WVh4NNjYfATcnDS9cVqpYxsKcY4T'
+        '4dKz+hmjWaQm4f19K+sdwq2FDS4LzQS/vT9dDLIpAq0MKwTohpFVldbVaq93ppilRBxpPI7h2ZVW'
+        'iYRnLR6avYDNIWyOkkEYPKVQy07jZpDRoio554yEqp3jSR4mLFNo1xaHIrAur6QJtrA6Y1u4JmFC'
+        'udQX3dsfuJHexkGSgMOXjHhbajnQ5+v83JXsB/MJmF8tRWbgpkaVa8FBW2x6zBAbr9F/lrcDxfm8'
+        'IJ73gh0CB7LaesWUBFqvCeLEqNnVdHZyhxWxNfk6ODbqKH40iTyt9oIJaKSzNBHmj8olnor0aMcs'
+        'ZutO36zfitArC+9VnJvBF8+Ba7fAaquF1EV1dqRzbZKMp3K2tOCdNPDuieOKz+VUJfmZcIe/T7iI'
+        'ZFmsmzHHzBeSEwRbO2b6h8CNS8yBoWrR5zLdb3/nA/1/95kHKbO4VlV/xSH4nrmcPqo2bRUMbYQc'
+        'mZChGRX6lIs+SFXr61ZZMTkjRrx16GLDreZaJu9epVR8MiljcSfSzq53/VkVvmCZ4bdVAjOv9JI1'
+        'G0pbjeeCBUuDWw9gXANqBZDH5Lt22uJ0sL11JsbThf/72r0rCUr6Uq+CSxyIF6YQCzA0SZyGTNGg'
+        'PuBSd9+PQh/MV6bYkIZmNp/lBrokZfXqdeY1goqFvPCqKD5vfIzxSj55aQiS6TooxATuRtdmT9U5'
+        'DB/622asJ/uH8K6RHm/oTizhmu1Fsgx7EBVqz5vg9xwwTF/2uAqYkzqf1IOKo2or+WWgvuMGXHCL'
+        'ybaLAlnUlF7u90Ltz1NUEgjqzsQXARxm29v7iHkWg4FFxBZdF3WcKUXKa4T3yj1QTfQqZ0hWXndM'
+        '3NMm08Iw+eTvO85BMwjwXmgvOVOUcHyDUkWKpfYjVjz9UJHHqZ86dkjjcTYvCAoIPNDWGS4fgxep'
+        'caXYu3nc5JYXRMQb9/vobfw5Y4Z7fkvk3Qv3T9gp6T9CsJgbwERs0VskbPU1h/lAhqNXl8x1VBSp'
+        'Q5y9D31Q5Iivixi/25TT2sKqk02o5pvRcWefn28nqZIiGlUljgEYjrLq7B7C3Ws3DWZcB+SfwozY'
+        'Gr87VLmuSYImnc74wDGET/rBNEK/l62U8/HD+HxEyMmFcI9RLz4cysa5EbUzpp2GwhjiLYzvajQi'
+        'imHOkKH309z0tyq81stGPeexuM+GYLxNX9muCFTSz9M1LQ0IM31xjfy7vCFOkn7ThFF/twItdFv9'
+        'Ox74XHabzeWyCkzHAsIN2JCa8RO6nJ4SV2t2zxQPyz1AIjHXfH4tNWVZvQ3EkXMPmRLYvl61O3cN'
+        '1ChJElEJyuiZcEcyLAhjP2edWVYSlZ843tmjUMhQ2VvLIPuWkmQb3ff8wafnOsd3/iYmbIsSBp5J'
+        'vqVsr3fY1RSbs2Ah1sBcSR/2Mkvl5FXWhfLcwV+bQQGJx4tchiS+SATfn/Ig7Klg3LU5xP8SLYiD'
+        'rgSxWlV+RZKBcnupmX7Uiz6a8DXw2Cg00vcsNmjNjPhHgQaPAIlG0w3l+/4uwbjG13aZofRg8Wfg'
+        'UH6AyoPArXX7GBh39Iat/x0ii5FQhfurZDgJyBXvZdDC+wagwGxUvfIhIkghFVv9lzwVSes1GBPr'
+        'ltM/MfoA1odd7XGRK4pocwSgRunSeFi8soVKpfVPsU2lSi0fJ39pf9VF0686amoweDUnX8rKMHo+'
+        '2vtHWQoCvg+TmKCmfhPcJRqHFqNUrjlp3GfqR3qGmlzEbPBxYFmEZV802empcpw7UNr9AOQHetCJ'
+        'sYNjOKbc1s96NztkogMCjXuWj8gjb+UChisX+/vTzLip85fjK7hGmpwLmy1W78leD1kEitcAXcER'
+        'IBLqPxOUzO1iG6DwbfQwkfE3Kac1yQZJELdEOleeu0SFWo0vRGvk9UNV6E5ZWnqUwwRZ3hEJgA9r'
+        'T/sr0nznWwUGhBtoG1KrLpzfmBjwCa74kbMeW3xz9Pw5PkPUEz9Vf0J7OTxR2KLkBQ++P7PkQDM7'
+        'zBnCha7OyReicTAmjBcQnG22V3K2Z+jF9e4IBkAVVaZWeoDCxYi3xwpDIi9AHUJpaj4LuA3lOA1C'
+        '8ckvQnucVy7qvC6cROxk/9GKQAgf6fd5roCM62Vr0KRciUFn2m61EPYpGBsXOsyeVsvSOnEuJueK'
+        'bxjQheIKtn1yScQRXAF5Z7dOy7JyIiflTksrSdSLK70t6b5aM5oRloMmSVvqsSzHmuwX5RliaCJ6'
+        'V4wLtNAJBe6MKfVauUzQkvvPK22XzXaDZJg5xDeUcwhMhI1/Gk8pjJyX3mUE6S5/wtW/z4opMSq5'
+        'ozrEMZRRFs2gN910IFap3zYRHilxaKrAgY0TiDg/vn2NZ/kexc95fyuCC22I8wY2vEHsljvNlvwL'
+        'vVLd7k33lvU31hP3PW00i/ds6JVlCrGZ/vROvmrVkPyRBITh9uPy98dQK5aPTCuhsK0f15dhnrIG'
+        'tcMS+43wUIOi+Bq22JelZzxLz/3UqKWpOtALcjZ7W848WgC2zS+D9MSUm8m7XeBdH2H3lZdzS+0u'
+        'YuSbJMRzMBG2UikbnyRkOggvDDKxpd9iaG+jNPuMzgEbVrP/6cB3MlrsegENrfTInUGu7ZQXmGVR'
+        'ZOnluE25vXsFFE/JAW4h8LOa8yaAaRnsUSrl/t10jo4beRXsGi2v3qwlOgoUV0/qo0PghqCu6qNM'
+        'R0Mj7tggg3bYQCmWHcWN1chhlz6eBC/emtlaFJGksKdDzgbPEGIr32F+Nt9ElDoEvwF2edPhre55'
+        '7VdkK8nw3aWkHaPNomX1iyGhRsAL3pvoRmlTPVzLa3cwCfROLVUDPpv9aVAAtabqOILfZCu0RdYt'
+        'MxJ3LiNC/Yj4hm3IoNxvGQrqGYHIAa7/7MywzyJFAjkNIqTIntu8BhPP9iuruJV8nCqrcwRxk2lD'
+        'JtgI/MhKg9Gx+wGBLghR8mOSHV1p7SF+yhmfEihO4aWs9TaoEvutZv0r+EkMs0Dc9nZQSMD6gfLz'
+        'XeVcUgXFCNizV1pp7OulkhcqJLhsHlqSifKVTSDkzSMmoaH+hISMwQGaokbx5c1PEAzKaocqIE0z'
+        'XFKSyKHWF3esiUgclDHzI95ZLYsnCH4TQwXmmkKDq+7PxCxkSGaSyU1kxkRP7ZwV9/7lpNhwFmEn'
+        'aGdvBB1lyJg0dLTHbnKqlx5k7SXxtW4f+vPjtuPkEHYf9lmH1lgi0BqcQ49ylHiSu1mz5z/QaF4E'
+        'h8VXuuZDyxK4FmjbykXmTNWJfBabxNQdqIleQnII1sJ4YfBn4QSTcWk3oQXWOoJL+GxuGcquZDEJ'
+        'L8z3EQhQssr4Vy5KvY5TiFiNozxXnjBveeM4B4cPvA9eVqmOGc4ATGqcaaynfzeld2qZGqneNKOe'
+        'ncJJwkzX9tu+0KtMJOZLH8/yWz1jzx6bdinqyn9nEKSEAm72jvyRz1GXa6h/fr+nEeNhqJSbCmP1'
+        'm6oN0KjuJwjdyjSw93qihfnJam6r+05M3tdSBeTM7nl4ZIQkUIv5e8uctAHJ2iq3IHnDfgZd+Y5k'
+        'JX9JPogLgfoAuLkDHLlxc3zAgmMQtAA0KRqFDpzhRsLRLc0PatamHIwyTpA1emtmThhpECC5Jeed'
+        'ymQqQjPFYNvRQIiEwl/93RvA+Szk5iXdoq2YVS6RLsHb5FC59uxbWc6Cqe7eB6+NX4yTR/JcGQMY'
+        'QySGR4QZYlXju8V69So6KYHor16OF7PaLsWn6ZTehx5EMkGB3LGTUJ4ACSWMzbGAbgQUv8SurLmW'
+        'v06YAxwZxt+bxKbLzf70ml5Z/ede9BZyxKBjo/XHJgVlMAH2NIesRNlbRMPiQjTAo0kZM6cwglYV'
+        'r+EOZ/TxMpBeDmUwkffPoYO110LYe9yUIivA3C6iVz0T1VoebiAdcZnKZmsE83rJnLhkjStbjb2y'
+        'KkRQCSGL4dANtlHM8y8q0UEcPv/FrJ0QLO1BmvitDU8pZfxozUTBD3ENJ5WG6+SH/Wv4v1W1ZYPa'
+        'BdN9JDa15NQzoTbgjqjlOY3DwhYKQhqwCyZelyUOqHPP+TdMpXJTcPqOAbGWW/4mxG1uvA4fjT6/'
+        '4BMnQVk9fUetSMmaGwOuf67pE/OASB04fwM5Z/j3bnjNCUCgwZx342x1uGFskKSgdDS5hxd1csFJ'
+        'fbcrr0/JYr4jXj6/FakRBNMD+RXL833GvAsE7P3E55PFw7LaArCkXpW8RHidC0xdorHx9X7GM1xI'
+        '631p8LreJlj4ZxEGcnVIaJrTljRxzWcIuyRD/TmbX/igeY9sKM2wUbTXRcESVpkEIcxFwmDv4h2u'
+        'rD7rW5iUXXW57DqN6/10xjsuxN524rP/1h+ebZoAHTGYBDtc/Y6aer2OXA1r+l6mFxrKh3pGssoG'
+        'tns58o7AdC5fc694BKys3B8boznoO6x5l6W54qbTbWHnXt2bU9xsksvfmXGyaQo9v1YPZ6Hqbiqj'
+        'XLc1Qt4MvCffzeV1ATwtYqGHnrwd3T38ZTUFALGyRhbL3VhVVEUcwB5wEJ1rQ7t7ypEukg36DLu0'
+        'eSjL+UAGhky6pudB75qq8iRCqg1sUTOTV/cqMXNsUQ9sJCZq6T+VdlyKzjbAvV0XkTsB5d2+hHTC'
+        'TwfOH1puvR+RLvXr3w0TDw67c2ociRvLo56dEpQ441zRA1XGUPHL2RGhsfgJpARuuOvHhKvdiSxD'
+        '+fFFwN1ULnP1aF1dE4NMKOYRfT16Q2j+QkoBJKGgToovcANVFjYJvlROkFFosP7O7SxtB0dno+wL'
+        'KIMnNN5BHA/q9Yna97KtJIU5kpL3lhFzBe0Q8YEXK1Tl/n7BmERBhc9Sy672NSk/HCzcGq2RqNtq'
+        'k2vLQvqUiuddXjyNbR7s4LMcrRC3yieGbyB30zPn8/rFEzXcSB6rS1a9eAo4Sd7sHsd0XEixwrJo'
+        'FOD3ZwxG8KnM1R/j4sJcUCikh/f1VLMtF8KgjZuMroZaBukSHtqz6KW8ucf+t+qqJpgONbhpRL/U'
+        'PhfmVyx2x8Ej4OAlvGT6sRyYt9BFddSslhRCKgOLbCMvfbYsAKMCj8suhJNjItNVa0ugqvsN+ySR'
+        'kUueUiI7K+tlLGQl+nhx96DOYX/nokN1MThg3C2vADqeLISM6e6MBibds/0lH+Iq0j3vOjiddxcm'
+        'xCRVpTA3FgZ4tOSF92WOqDTneaig/ZIBkmxwXuUDQqUQJzg6hMZW2pPQaR41vd0cgTbJuCy1ODeR'
+        't7kQNhxgArift1wB4B4H7PUGfOkR887t0Cjocgmz+OB6bD74OIwsoh5uLNJ5nU7hj6/j5doSpzo4'
+        'BrRjH+J8AO3r6TaFI3eL+ZBxwo2ylCkPrimoOsxvHSE5/VhL3WoNo/wW2KvAuCQytwSBiZSDA+je'
+        '0ayJgM4A+EedAz3iZz0q3kdjRI1yGQpHR03sNQcG/8UZlxefmmVVHYGkmux1cUR5hrlyhtoMHkHb'
+        'VZGleUfUpXNW4JX1SEsQCAUE7HRvEBKhyAu+E+4bMANgGtGHhg4Id/JdZ8SKkAMooe27DdjXrrI2'
+        'I6PTOZq6rkODFKhpkXeaFeOWeMn2NGmMwJLSLg9yZD/QphKa6QqklZ82xHxLOm4lJW/BDSY5S+dp'
+        'uw9xY8lHOOq1fv8hJEUDZthOO8c6lDn1Ex06zarzXmFgyX8GEeiyJR5vi/+Syt9iYIIMYG7QfDpL'
+        'dtUcZLrdgQUTj2o0AMJl82Owyv9XlNwLgrv/DTKIevZyfsQSa5JhgOWr9Zgeu3xM/zQKfkeL8FuG'
+        'Py3+Pe4fNVfP+Kg78F7wAvbzc9x8QRFEloAwKkRyIi2Iyq0Vym4yAJrLfd+iSqXnVODH1Tb5FgqG'
+        'lSgFlujZYha3OzNBJT8vvQiqiMy0d5qhMwTcnkyjyNk3Ez5iITvhhTQDiv3g7oDvMzKkUla+ISEt'
+        'dJbHNDG3WdNyON5s8r0B5BbP77jfW8goo+FwsAAjGefsHxYmjBDwFlexpstuW3OGEgl8P5rjr2DA'
+        'FL90h0O0cQ0+Zx06IfPtqL4wlsb/WitBwZetKwyO7yuaxgxUPcwVXXt6lMpOm1Jy3VDutN7YWB9j'
+        'sSiOoFAsrMzMekxDRuB7fn3AYUCeLolkRLORM0ULvNc8o4gdCn3eyueonG86WhUWe5utC4zW3sIb'
+        'iCS2U7dfSrTZNTuIFWqA58mfRChTl0e/9uFS1FuGDp6bSEpnizyCxd2KAtQNBfJvCddMKlcNVLe2'
+        'sCn1abt4IEjMclQzizdlrmQQ4GO+qHbiVA1BUGXU1aqpQwnaFHYwdzQ1W7K1R8QZ7lB1xrFn6AlS'
+        'Xxa0iaKp0vLzthgXOK58PdV59XB5PyEiGcQi7WIUo2RsokAqg9A6TD0hw+3tPJXy8HYdQA0nIwNp'
+        'Hkrti/gTCaestXzvkWikWDM7a7SIh15gga28mLXovKIm2eXBtUQMOc0wAWsQDoLYOV7NpJpKPUvV'
+        'bTlIq0L6xFNxf9mIXOega4WBh3UEFNnGdxanXVhgd0ns1rfxj/YuKyIoDq+d6zU0G0HGj7A5Ngew'
+        '4yj2heWy/tWrLBOlt7I5cja2r3jJtcHKTMal5YMT8CZYQvK+7Szdgh2ST2HxatB/D3dFiOJaSNeJ'
+        'SzyqzaPaoITuXljf2gc23QfwqTyxbvPy1cxn/bU32QwLUNyvPlx4YamJK9GOO+BygwMFIY1CGiUZ'
+        'DVN0m2JEfK1cRj2bJbfzvlFLSoLpO6Uw4keHMVNODLFssz6Bx53PQ++oMAzWG3cDkY3bAhme7DZ4'
+        'oeTdd0U3ZjKtYt3kTgBQILxQz37TFknkKRrsNplfr1wNG5f1jPmqUTsgSLJSL53Ad2Sk1pVDAWR4'
+        'fQTlVpaGu5+dPvGDR8AaqWotr/1OfleaJut8581Vk55dIT0piRdzACi1wpzv/IoNLfhAzANWN14K'
+        'lqSXunZJ+UVby7U8meolonsmac0hfhDkQOVExlxBAq6CjVDjA8lMdMcGRf2y+lxu79v9oZ0CZbZm'
+        'C4mZrXiFPf5eEY2X31eDLGUxdbgd0jM1BmrnzsKakq2EW57F+6vGY8WBy8QrvKdLp2+GAqP6qKsg'
+        'XaFyjBmyq3zJaWPcR3WiOnAcWu9BwIkZjih6V6zbdnXuWYi9zRMsKoU7X5oNL0zlvMav/TTijFfh'
+        'U516/G+YHj5s8qToxTrGt4l5tbw1HQN0yCsUmW6O17jWdhuc2zRDADzzTfJwtGQqqMUZj2o+5QI0'
+        '6aMkmAyD8JYWIY59hFwkJYwNK4Bbz871KkrBg2wM42CVIQ7qWndo1IBq1P3NTPDmoPBoe/xM3uZ5'
+        '7SHRjYd5X/rheUz07Ul2KbiKKHzuGy9spkIgFAcCUELdw/U96dMrkTdYr8nymjiF47SCs/KTKEGn'
+        'TRvnoauDKsBU5rUbSVqdK/NpsNf8/ypxYTb37DJnH1U4PdNkwmzYp3a/DuYzjCT7nviZAqS/LLge'
+        '6P+K9ZxIA/ISkll+AJ6IwhVfBKovK0LGPtmGwOQ3I3HH9fvUld8k0kGMidp7E+/bcQfVU1BTDbjU'
+        'VFB4fchakm02j6XztZNvMj6I6wxqP9XvKKv4eYyggDKjEdtgXLLs8w4S4ZBpLa6og0B/bCpO1B6J'
+        '1c1eoCDDdUpu6mJYJ1ksVbb/rW0KAQpi0wEAfNpJWUf2PoRg+m2mnt30zHxgLGFaJfkLFg0mGYFy'
+        'Qi8CuAmdAmvHdyQ+gOu7uJqw1ZaW14rS/gUhP3pQY2b1+HyYl25/9wHN/Ev+3z/BIAjf96Epf0ZK'
+        'gA0+3X5qDYf77buD4ofaTP0Pk97pg5+KCJahzjvmMSPyB0weBrJkQF7sS2DJtZMha+TrmraheT70'
+        'D0zzAhfsv6eF2X46ro86JC9k1Dj7jkRSjAQQOBIDgfxgA1XbWdEk9mQKjkzhT47z7zK9MLX2wyNt'
+        'itmUZqxNLLsXLL9NEsePGXRjgw5O+6WphIXCtEAIfzER3bptLPvO947LCLRvmLC39yvB/G8OlUiB'
+        'LpBDR6iR1za10ycxHFXE4F28e6W60De5VATjk0tvjouNRWvm6XvLaGJgMKditZ0olOKVCGSLLELP'
+        'EcTnfTg5T//nBNWDsd8T1wQMMDazVcKQK5NXkwfK4vOTOVoaEAn+e3sETGrigBvud3K390sbpXP8'
+        'z2xwee3YlCNIVy9XRJtHRX/z40XktHeDEUjM6UjrHcShbN1m/7WH6fD7LIWPUNygoNuxo2/1MFqm'
+        'kfa26nEKZQgRc3tQuSIwsUN69Y2IQHuAdCVOLPMv1tf0RNgw7qJHOyIkyLUKReNFdUWhxic5/NgL'
+        'zWv9v/WtCMm6MelEEkKvlRgmPSCgRpjXxwDBYtr5OaZWv38LYnNsphC/oIy+GnLQrLwUBTn7bfiH'
+        'r/m0NnZgygRGxZ2l47AkuC9JRjPavi+odnmn71agu/NavvAQhy6xOvZWguse4Ob7HtI283wOcvDn'
+        '70RqC21KL+8lZRS8QA3PkGRF7/MEN655neskJfPQYmdC7x8bvcPie9YmU5UQsnSJDCzqUDj2wTZN'
+        'CNFwprxJRLE91SR6zAZ9+guaisytUEQJQf37yUztKbC7D97MQ0GW0ccHAjGZNHNuaBCe++tOnxZy'
+        'd64xPB/eHK5XzygGzJAAkJ9j2D6by0Yrawz2aleKw1/MszjbRiavlPKc/ioXAP1a20falPaVxp/n'
+        'LrtZ8AdYm6qNr3qfRrl0f6Dou0JyeolgzexkOkT8xOKqPIwAh9h0Vw4p4EB7tvyLquwMRUijW5MD'
+        '+mylp2BakKixuRDQEsEHY7bGDRML3uYlF0UrEwMRBmpsevL2YlfTNXDl5eiuwzJiEvGbqDzYSEPH'
+        'urWD5eh0HKV271ejzDYMTEG4el4DETFmwFBWM/lAO6258O6RQ+3wAVd8bo1uZYjZdrKKCF0UdmUt'
+        'typAW367zfo3e+KEtMbKfATFZOdlo3njMTCol1kWsvhncDjOWvLf3jmp3Sd1hYHpz/oKoClp9iC+'
+        'VxKklrIItWstm5dG6nDmtxGr7S9Sl/Lk10V80hBNS8L+JUDKJ+2dQNarkExjzjIEv+FkivwLZNqX'
+        'y7tpsBHSNE47BRpGrwLsaPpjWDFz+Jn68cbN3wlX/LLuMyjFnKeMG6t/ICkoIa8LonL6m23PWbeq'
+        'QPhSAQVMVvieb+klOltbGKx9Uu3+5LCTivGevkQ3i6w/hGkn42a8JZHwNu3UvkWso9uK8VzGZ5Ml'
+        'YU83mBZ9PIcd/qsmxkZfwN2dtG1ILc6FVC8j35TRB9pGucj5cWkTQFtP6tmj4XCd+CkLI8xQf+5b'
+        '/TErg5hyBlgf9C4bFq5vyZw+SCIj7AdwLsYlN4WIVDFzFRLyuOAPHnnFhDrTJoDvONWYQcsjE2iC'
+        'ZsEBlWov+qAOEEdwO6Ojw7Gd90AuM+NuFlQ0kzvQ/F/44hY4MRx/sRXF8btvK5i0MFGR4Xuvd4Pb'
+        'F2BsJtUw6cRHlVKXewH2OV2PC5J884GcYoU4xDnIPFHKHxoemmSVymVXhxPDRZTZ+EfMCl7AhrA+'
+        'AtRdv2oYYD/2BvbnR9k4cJuuqUnDxb6U5AvQDDEFYReCrArS7jBmiGa4zQCw06r/mrhKFm+oCj73'
+        'NSgdNyLu/UJcja3+GjEYTu23i86FLVt223vavVxlBSFkFSPHL3wS1xtkkSk9MPAuxCYdLPza5UO/'
+        'X95UzOhssqSC6SqKWAL0Q756D3YxTv2bwwlVYGK9y7d05ZsnX2eG+XCuovTNW/x5XMBfs0XaqHND'
+        '4/bbrrVhluk6W8BEp4LEbUIDnG9L4Ox5PoAEI1VMjhXbNdWO1brJ/UQhSZ/RJwAo7mh4XEL/DAcs'
+        'GieBULjIaQ8XLCXGfNdme9zIpLfb5KLlGl1r+tDZVUs0/xzFbOSNwB+384hcEIq1bmSIXTuehwgb'
+        'H37IEp62lulmRirT+xA4MEVE4EDT3h/96QKHXntkjRuBYUDkAWYoemFHC4G6fO5MMju/1+4Xq6TH'
+        'BLfysXTY6YQcwa9cgDtG8RZrH7aJwdeRrz6zUQBeLvSKZ42yO5BGQ/pbpyJ8y7IBmMt0R4QyY1Cf'
+        'WYX8THnUc5NtI5C2gL6GaROqFx+8BGRiwppCm48XuIQJ5rk0jfTTohWUtMvOE4KN3TCIEIQhnBTT'
+        'KqwmAGtDxE/QABSXyErWi4BWKEcen+ebIumnmBHjj2N41kBEAfVy9cirq67ouLiuDr9J149x3NaP'
+        '6cmDGXBcsjtxivVmf209jOh6Z7WBvyoeJLGlymclJ51Li03Jbu6ZUhPhesgb3heKaOHgb2R0Xe+c'
+        'zlgCkbD5dA1OTASBDEVny1SG7BAf+DdD3vp/H1y5IP9xfZjklUYnVK70xlNFdLCbTEv+6iesEngn'
+        '5uS61F09bmv8jmNXgSO+son5LAtGRL8eGVYhXoV9IXjMUfjY+fKLD9T7lc17WfGqzV6pWlf7FyIh'
+        'ZRsBAg0HCKRMb9ozbGzTqyK1l7KmVMWGsUrlcH5Sc5D+jIS627iCZAJwsfj505/eO62HUrByKyyb'
+        '1C+uJw6rpS4Bf/3sBvjaeRJZ26vusVrz3bI/wnE6k9hFZEApPgnpcRkPdpK48q6NaoKCVoB+fW/x'
+        'g5IdR9lZ6BmE/rJtY2zNlezxSBE6ojMLUnI9vOwJj0Nu4xJFZQqdJWROmUetZU7iL61DbRq9akuX'
+        '4RRomn3JID4FbA1W+mvZKlPtBsvUiaAJXymX2lmh7qDPtcSKOl0tG8LTHeEQhx5zuaZ6OuA03C77'
+        'vtpz7oK2j4k4+wu0xKvLGZz0AdggcBTP4Zv255VrX06Qx31VL1vN8wBmRno9LV+XDZFUgvwArorE'
+        'lUk17bSEJDMo2Cnr81WReSP+eyES3nd+NqwPVvk01F8JeHisXRHkiv/OxcFt9rx89mURBw4sgQeV'
+        'MWZJ65O4qy7g9gLfJWM9hAB9O2KueRvwMkB1vTqwTuI9UlRk1o5FFdowKNZUDaccZ44+kMPKsqE4'
+        'd7Wfs+3v4pF1tvK4pX27S1EdUwH1CM2HxadP0kVRI1A8UgEtVt+o00e4PS+hsVrXZn4FTorBT6Kb'
+        '9W6FZ5hJbhCYhjkxfWzd1YDNHYhF8AbTyHax94XI4g233s6aS5bGBOEKlwCVTvx1+c690f4Vr0tH'
+        'WjycnLAL7sWuGo/ZWhlW3Pe2zrHcC2BB+0KpeM7kX3mbR/U3Cfz/mYFYmDeAQ6cHlzvSTHgX01LD'
+        'm67ZcjExc2gijWbUjwT/PbWRDPQ8PIjfxBetm2x7EP6MhQ4WqEWlF038sTQrEZbX/41yfwkw1Odo'
+        'kO8Sjj3h9x9dfc5o0TIbGgd25uNhWLYQJBFYuVcAYwlNzqlW5EzkSCSD4ZNlPlhpILqEdMFxDYus'
+        '9rcJ7GQuBrdbQDt2TdGeaS123dKTaRBwLvg+IfDlCZM2XlaSbf/MqS6wHEbRwmtRV+gyuxlbdNXm'
+        'mY4VUhiXvHh4Tador91pWWW7dctpxoRXWho7fFfJ4G+eIWnU9Faa+zXGNMQJ2woFoqDSPQ0CiigW'
+        'dqM2SkfFyCrJ7GM0yQG+F8sSdfQN1Rdc95B48/EaR4XQmtj1tIraXo2lGvpVCs0wFvzoweramJQO'
+        'nz1tx9NKCWoJLA+YfFe0v/IywS5wuaazlG17EOXq6CK7vwfELgHZL55rvOxCfQBttFq1/y7WCrmx'
+        'lm2UO7pwgCU+grV6jmj8qp1TxxW3P9OyGUcaqCNDv0MXtxyFYNRSvyln+ri/2moeYdlzxMT3JwNj'
+        '9RTygCYCDgbusl0OGNL+FKua/O49iI06U4bnV4ZeKmHG2CseurHB2N+XLCSENeVmcZ8SxmUQ0Qoy'
+        'X3l4W7+w0O1SkaroQi4ol8aojll/5QxY7sg0ptp79gjoz0QHS3KNRmMwvGATQo4qIeyaW5RZJQoQ'
+        'itB+5d3OSeJqk1hxjk5eqH81CeozmvwtyTHUakqScAMdUwLpupMiKsl1r7yRAllr085tdpQ9Mi/A'
+        '+jKgz2sUn4Y5bkuCl2EU0STeEaqjdE099NTMGmIyt28XfygBtS0pkIeyziFIvzV4v7Ukwft++Wni'
+        'E3gOqY/BBcSqW2c/mf6F/a2uk9WBOOb0lvv4CTecRr8Aj2AWArX7Gg+m4/InAuqRQOWuray77EzO'
+        'ZESy0mbN2CxgAf++ArgHcP9iwKQjK1uwNvwkauQmSk26vpuBpO/4Wo5YB/+325MqQlv9CtLmiXDi'
+        'tIRsmUeNua4/9S5M54aLGrLOepwAjXNu7NJqhro0zn6MGk5KSTOn7KB1zDXbXyd0ZhW+O32EvcC9'
+        'kLWR3SK4cF7fRs9hVzTAPYL3huB3T71Zf3lUZVphEkb2cvhBHt2y7eLAkgbVh+phIELV/J4anmnh'
+        'Dlt7VgixcCBFMgtmUdj4Y7yAKw91ZhOKlJvh0NuxvKH9DhMyl3YcP0s+5F28pp0i1L2gznrRRahl'
+        'yq+ErNvfe1sZF6MTQ3qky3jdV6ZJWKtov6fsQVaJTJ2QrjvV/U7imps/PuI+HEGr5LDJ6pPfED4t'
+        'Ne6bfVl1YzERWkogn5ozvxsE7aTzCBcjJebhvp6z9XMPyOtdeij5HEAzSfjJXwkeBHB6Z+0fufXQ'
+        'ktxqfOVO4cH+QIeJUr3skDDqIwQHhn2p8xoewPph8968gFTjIOCDbALxVaCBkygYlptIQvV8ALo1'
+        'RCoM8CPUyRbkXQJ5nfaz6OXyWYv5Q7E1gr8ypb/xm/eHhgA/stv1Xv0/KlfehCxSkB0zywEjmc1c'
+        'EpeTDY7n2gT3kp7UX7OJ24OQfz0guY/u3kGib59pzU1PwBYRbMjBvYGqFDZf/HnsS7WC1oHM63YB'
+        'bbYogdASe0VtH7oezpeBGp6N+7mzoAKcUWQT5bSLl1QVhS5CsvbAkXxIYHq/jPmeXpiKhWeRBqrO'
+        '063NPNxptYQltdz3LwdT7M93OiEW4mwVlcf3I/2vMW37p9oqJGP7bzjYhgIfTtQTFqRvAVqSegf7'
+        'mbiXArwgSwXNHED0/FupKosEISKBi6Viiq+NMVFwyHwwL7nWlvWLiGeVSTnzxlL0lEtX/7T8h+dv'
+        'Mc8kpJ+p73yTE6WqiV+OaSpCNDP79C5sf/q8Iv0roOKEwj8ZdwkiScy1GdsbjhfnEPqZ3VKVhi0A'
+        'ZUHXfJ8zuPGoEjo903Ky6/z1A1C3gXKmGtgSuL/90VSuB8U4Q0kglrCkZb6wTc/K0tX4AljF2/Tr'
+        'm7Jo8lXupgY4mkR3JRYk1pkTnw9DdARa1K3yQ+GaHPjhNa+Sk7+uf9dHKemPhnTokZ2sQh1U/4sE'
+        '1C6wZxdQvKeDPe06w0snfkEuHyPRXfkuAVzltxOyPdSggqF5977XMWs7h+yOWqmbtvUYUrZ7uk9O'
+        'T+jbSgBtvqmh4PYBMdv6awUm7zZiTZVSTk+e+viy4TEayDIweMAIoCQla2ilKulesoX0yGU6H9T8'
+        '3O1k2LP8ZtfcJ5Qq/UdJrOuqtzH1gGcDQan5PaiSGS4qNwkKJOWm5CLfhBIyUWCQelYJQMB1PzFf'
+        'RMWVnKkIMOgxKwG3m79wujwC8mrMCykm/GnEqVCx97H3JzlUpsSbbX/t5MkKNOxWRozmbeOdq/b0'
+        '5rmttBVCs8pUgAkatoACM45eMPk38TNi5bYAiFdnIDgvHgwBZ1fhd6CkYN1nGp7YhXeFAyZNHuk2'
+        '8fw0FQSPu5O3S78tHvHqVrUe09igA6nyCWgLBzKQRDby3gGU390brRlhC4jTeTatawszsQqOAY8A'
+        'o09OxTOuLf81IOV6WprZivy0CcqmJmPl08BTEahjHr/IgDKdErOup5hddwNUGb0X1pZa/6rTkZ9u'
+        'SnUUMGv1vY2mTBdbUKgff26JJlRqbX0Bs5NaeC3wuWx5VOtAvH9NvRlp13V7QFevEFJN/372er+S'
+        'BlGltXwioJvuX0LLfISaR6mQL/ybMEmdtE8OA5ksYFIJLR04uQOUxIydiiUXFqCAlWRrDjKJepEB'
+        'PRTE0wiXT4pRL3Xbzuhx5mkC9YzQlNpGEerMpNMz6VNLjgZbWwxgCF7H9hqDf3ouhfSiqSW88CV8'
+        'vZSLnrqlOo6FVb6oHqk/kF5pNtJ0EjCAOVhNpihnV1nNTbcnU2mobl9xV/gcY/1z2Amr8VFWu8Uh'
+        'Ef5CfmI/Hf6dPPnYHtTKeaa84wZY90EU1AubF30pT2btRgIhu5SLCc7aKT/UKSyDA8vZArNI2N69'
+        'gUBQh8gg+F5VpMygBPBPOwk5PL3BQQPexikcJLePFxzGvASH1w5F61UXQFBP2qRMBg3Pd+DuXUWF'
+        'Qa/TQNjXNRjuti+xYGtr7XEabWpIR2M/tHwXGbg4/lKPG6ZCMLRtxNWAkgVSZwhOKHuxiNaCTlTj'
+        'nLvYQKs7HC6X7E+4kI7nU2RD/ByLsCPQsYzoYrL/LZoXjbf2O6hVg6/vwf2tCL0WAP1RSm40ur92'
+        'S/nUotDEIsHqWvXzUZWgBoGd3hWoCWV0qA1acmX1BhINyT4N8QoAitQ+Vwb1Jd1AIjHMxE5/9qhI'
+        'DI8uJAsxDv+kTzdeR3D/Vr9/vyeQiiorYmTQA1Vqefi1de60aXQb7J3BNiubCualtG8Ea97mzJgA'
+        'YeMBVLUX+G2imuhZT9SnzEtG7D37VEORv3CQ8YPDjQKokWtPF1QjXS0td9korR2BD9O5+OdX+NrU'
+        'MrAl7XJ2BRkjW/kgmT9pEj34WbC7gMNjivN4tyr+TmYTuoRvYk4ostJ+8nErrAx+UJBqklKpK2J5'
+        'QwrtFOKInzzN12f0a7x49HsvcfWPiyRENFgsrnfI+ayjWKjIPIJMGa8o2shfor3PHOPJkXEaXx6n'
+        'SE0SJvfEdEuJa3RUB38aHjJG+uwFHplp38a9xXZYQBfD4T6PRH3BXLnCLJeWT3SsECI9HOu2NaqC'
+        'Kn4UQ+jG4z8Sukgk4r4FsWnxFfGvWX6yO5xst6wrvgRBtHSWyFs4GA3JDYxTsYrucaDydp7GrQTZ'
+        'd27HJnlU7y6b6gKUXMW2Wnu1E+8U74A0fiXIi5hzhUNnzptuhT80OTlGJ71ryR7WHc3IdR5L4Igt'
+        '1st4NOMLUVcAjV5QZTs84YCOcCUqDubh6PcugWZw4kCKCAV2jHvrQ9qBz5ZOhJPvIY8qgRTHwsMO'
+        'w0mnqRsowr/RVy8dB83lGI9R3u/kYQE1PvGVYjjGTB6jEHnJnW+51XpW1xQM4R79TVPxkmmgCb4I'
+        '9V1cE0AeB18BQ6jIwvNwHtigcgUcRLFecbjt1sKpsKjDImEiDIXRBWCvReUIgIxl26xtyhIC0bth'
+        'dn8FO0cYRlgo2PaZ3O/Mi39KPzzn1KDoalf7G8+gek0Zgska6dN4f+ekGT6N93yCC5c4iyRK3/Rj'
+        '+brQ6T3EP83yBrZzZ78mmiJydVXGga6Oi8ZrscWYWS7N4gK6J2QxJ2GiDhZl4tF65ZW4HreFcfqv'
+        'Wew7W6gKBlwKTgIk4o+xHmDHXkvsCwT15rnsnJYy7EpsEaTk8EfJ2RYvpHevZCOP07PBOYasUFuB'
+        'zf9XSdTd3XBPlAAjmhImEVWaQ70uv0lDDLd86gMw5oPjdjqOsorMIf2njVXByYT88feJyRXlJ4AH'
+        'eV2ULDnDdUZayvJ3PoZEoW5ysPAQxLbO/1MGHXQh4yh7yZMCC8W6VUsax/HwpmFwt+xC0Aizmp55'
+        'WgbpK4wVMNTgQpJLNm3uGcfwl/4Qb2YEY99rUk5dah5nwSHxC+LWLBKdfXZazcLcWVJhnCbRuLki'
+        'ouGQYhT3mmZlZVpIhlydx0w5t5C1KHgFjBSQqMX2BilMV8RnY27VL7jLHELcy7yofsSAQ+O6dlOX'
+        'BUcj7Q/DygRG/JyRVp8Zi2hn/Q/C9VDd8Z6vGvQdXhzudCDMLSz+G+puhs7hBekLg6s+/jtbBqpx'
+        '2uXdZFfbAh8lVfU45iZB8CaKVkxuF0VpIBNISngnYlXdBY9mm8qr9Lc/Pew+mR9Y+T0jM+7xUAPL'
+        'Ba6TJeipH0VGShhu8z8RmVvIQGJsMf32z4fTVYdRbonrG9HrHrgvSNW5+yHqLD2a4C7GFLbBHueO'
+        'FiCA4XDO+KaubdBmOWOhg79FuKyiqMBdrHe4yAKc6kA8H1wYtrwPMXgqj+3f/IMA0LNPrAbkR5U1'
+        'x5wbY+t5HeTjYieE1tiw2lfEsn95OIQdu0RKS/gX7duvNmTpd9QYUnLrZVPc5jKHk/KZmGOqP2hi'
+        'FE1GAhgBAWg3hmL2uRK03a0dINuxKpp25Za5qugW59UfYedWo8vtbc0TfNLlcwKiLoavAIMb+ZHU'
+        'uyJ0i1GxlwGHIqf2w5kuBpnT5nTNdUsIfmR99+gc4xk1mUiBwtihMp/fjNfANV4HwP+em0EnXxYc'
+        'HYZSaq+d9+dmG1B2NerlDjcld+UujCFwzbR8aSB5DiDvqGHaO0drKRgoOIumQW2eP738xfMEX9Wf'
+        'vMozm5Zt9LwyhGfbJT5QjETL2u/tMgHyxwWEkN8qfi2S/+dTARFCbFIex81vw3on+l91vgcvMSzv'
+        'zpvV9o6kmJPSNLLO3aOUBWhoyvwUlUXTbqDQ2Dycrfdy1afP0d9cPXUz0FmwrZjRn4VRgrV6SRuz'
+        'QBLL5cc7l9MEajE/nWWkPhi8z93K6zMNI7u5a7m6xBld2zwR06+4ahXLD0Qn0O+ZFWNjQAneUFqy'
+        '231+LaYekprFQIH0lj4ea86BYuzOZjjRUK4804XugDoD0YrKiQMmcnjUMv3MxXlAGf71QlQ4l2Bq'
+        'zp9z/eNdC6c7h0Z/VpqdVkUqvsG7ZQlvnzWEdB4Gm6OQwLl4joByShgWEouVt5SNnNdPwUvXzrmE'
+        'EUCdD7RST6/pirjwjAyV0gNcfn44YtvqB83KxW0TVvNGeWWoWkdf6P6Ao8+quOPtklYevAsrZVWj'
+        'OD/utzqgC/YhYYZktx3BlzgYO1VUzFf994cCGqT/1hXRIQzF8GPnv0hRtHA4N3hJlYgecQp26Trs'
+        '/Pry1mbiiYB2dk+9+PabBmtugjStgEa8iMmXfveCMozD9YQLMyo6IGSlgSvMtit8oCI465KiK5NF'
+        'O50DdFrvcseSqpHg0iDN9+CkbpW2T5mbKC5eqtk1H5aYp/aBgkVfgs45OoL85oWvS3RyCAdhgefV'
+        'owIZUop4g5m8Ahd9F7INthrtVNsq/YEs38vR5E/howmlGn4lgMXuccBWw/XRxBdBgKzLeQWgM63N'
+        'lHNwQ2fIAB/F0B56paZqAlXsgaxRNN//a5wPjw6bxYcO6NMLOuEkZhLk1Re+mGUDoDBo0VS/fsPs'
+        'd4W7TD0ZUMot7I1CeLcBAlaICwmYeKyxuWLcm2H4Z192ya7fzqLAQNj5jYOAm0qjRXVqjO6LcbNr'
+        'AnibcrWxBNiQNP7X+3lftfyP6JerScoP5uU7WU7vsfpBm0jP/WyQ34JNZK+m1QDEl5u42w+bVzwP'
+        'VIRsW9OVbRdhXql6MEmDyvN1ukNWoMf28Frdwu9wqhAT0a4hVkevXby4cRnkDBq9aMOP8JLWSUwY'
+        'dYNC9zMPRDkk54L3oejLuRxFE0XozNmlXYKECip76DRLzIKJ6gApfwgOESJTLjQKj/jM6jfZirWh'
+        'ADUYqsfb6RjRzOW2b+OVE4nMcB7TrB/ykVNHwgvOYndWVVjOj1SY3cvyx0XFd/s0KRadJE+RWeAS'
+        'T6sjXdoYEHfbAfWsZgRsM5Y+WQyc4p1q+BSYp9eA/Na9BT6UmuPJYQwBI9dERRpChNQpPFqQoxLV'
+        'DASJU8vnSzSsQKaQ8Xx0svX8lhOS6g6q4eH/uxSPSE9yYUJ2oGuYVSUVMEUXrFGBDm6i97d3eDS2'
+        'YJ9QsosQ3Hn4eOCDt67vkFO+jH8L9ExIwrVoRuwLuBCWcVmoxf4QW11FZ+Ryj1Yyan+aziZJ7XmJ'
+        'aCHRn2W8q3Of6zQdROSkl7cSiaYgnkwnEd9dpHdST+UbEAzLHvLVC1E6T8ARfOpZscTWNBV57AkY'
+        'A9uOz70M0w4ent4xaGivmVJ4O63wH8xseYGuaIKZqlzJYEuvivoqRZ/alHrn8hwUcYsgoFh0/L9R'
+        '8A1/6OR4+VKoKcwqLSRbGLpPLLcgJQDBHlSdQGGN/T/6lLPXwmke9mXbyduQXHOLw0KJA0Eu75PO'
+        'jxq+Jr0Xasz5K5CdOZNgG4Vi6/Nz4pTW6OBkk/1hG58yyaDjjiakcFiSCtWoz7BPSY4CoCh7sYYm'
+        'g756UDb2N5F9b7RnBElwIQmWP1zMYTnWTByT1tomJWAn64LFmVR3MfFW0VwldWRGoZy7vzxu7DUj'
+        'bpHcsRQJRzMT4ns8sQXsxIAwxj9rLQ/tZaAgXLJ8b8uU8SFp7yBYcuJiZEptTTRKoux9kMoF9lIQ'
+        'Z1yoP58BWSvAYPJdV6tohN1mu3YMFvFYY0c3ryKWBPAGL+VZNibTLB3yJ1anMllVsw29MAazUd6h'
+        'r1zhr+RbxPLPjluGJ2iAMtwGnLD94UcjSVvMLcHELvIaOIb74m5WMmlX7n7RlH2ce3ayJ9Hgpn5E'
+        '8s+O1ghO4dj2mlGDtZuKSW0Z9pXwJe+nQov2Z3ZDBlLS5rTOmtpXtxfSkJaLPGuMJyQ76wC6CaSa'
+        'pDKaGeq9uvFR6xMX7a2X3wUN+751c40Vxzw+fpaRMr//2J2Or0v4C7lyAUGf3jcBEcSMcCos2lWH'
+        'SxfuNjrT8qbTJgRt2n6HFWNdNipkrI9GEopXmM6HyLkyaS7CPqi+oCQ8zVYeHMGFT1OjTqAd6FJL'
+        '5I5xHC49dLEBFSYaq0qSrvhjcAx38q3cO6Cow4deK+3zBO48FvX4P2htXZwYvGswt82bPLMUv8nV'
+        '8LF+jAcGiqENNwEP1n5k2gkxCg+ieb6YjA37H+IluV/oA9xywMzmGFOkCCn0I9rMeygnXB1cC41V'
+        'U3/PBUbqAXz/6XHqHduCnMn9d3Gq6pbDgKxOlm82MICOGQ0qcp6HsfHqF8kuivPlkIDqa8DeF2gz'
+        '2mPLx/5rr+onqKcuaWpArgkOIehBoJQPEDMQ+AJZMoTHINnIfQwwh1Q6rqnbwN1r3kYSfKdAevy9'
+        '4dyHFsNWjBQ87e2ybw8F+jTtQYuC4/bQZING4Z3lnzBPYw/CcpWQ/kT3RL//Kkcpufx0SOCO21jG'
+        'uxwRlrqijI5xH7gFFi8elhjw7bbgNu+Zig92uVAc0AnCI5OAAUgo7wfQIwskCm4jDmhrhJeHAy1V'
+        'G8tyY51v/GNDgIOxGmRp11V3MVxyi5m0ArBWI/WUrBGjBPwwqQtaFoDBYdWPbS+rLtvOnvQJVm+N'
+        'MaHTeHdmvfIbxpXeYItt0k4bN3bsK6x7zTNXtFPJYbzLUlJbfdd65OwRiAJWEGu5ukqn+CDhu0O/'
+        'xFYB7w6zen36AArfQYtajWV6NTXfJOMC6qQHLi1rxK/URSChRZvxo+Nx5VURTJsSYlIm+ES3n3b5'
+        'rzgB0rJTj3xfi/JGXfgJxhqG8mrr+nM9Xm4zng0iBeVs8zO7VqV3/vsHIMQfuDWIxM9Pz7v/VpSl'
+        'tSHhcPsjikUAZYgrP2Jd9IP/VIhB5AFftvUwMImAljnGx2qvqAmAoFF12083l49zpHWm/3lOPPT3'
+        'eMLsYY4HP4XnbFro3OjLaVLnQA0jK57izIs4TtvjNO5UsmB6Pw/NL5BvdxpofAoJ4eK/gvXPKIDy'
+        'Tr+C5ogjFVMRSOjjrcetShK+dUN+ornuG4XR2a5iqNSfW/kEx6ymKgDezj9lXLanG9hvNgvm88U5'
+        'kBeSZkmGL2L3NNv8AAB850tX3sTNcxgr92B9RpydY5kjDJ7gJotVVpMbJoDjlgHHT19jK9CiTaGc'
+        'GVBlIru2DtZ3XxNUnVrZM/zSioxy8sPpX8s5adF5TMDaqqh61Ic0QJhK6pQafBp6ccnkZ+ZiLzjV'
+        'LMSGP7fMfvTEk7z5EbxD4VWwczo08saGC1x2KTqASA4+B4MdNavN/56rwmjXIe3o/Mfd59t0juj0'
+        'Mk2JzvUsobXHtGsUICDbDU6KRYVzj4dup57EGX8yGAcdtzNeknUdkkLWfrJXro9ro7gbUdIOde6f'
+        '0+9XJyFhz/18I0xfAAOl+EpCcRCWz1zLwc7zFjcOlF/p8yo92WEBCpf4r2CyBXNGCYVwc/W221BN'
+        'LhTmXzz5XNAaeZ3k+4catplNtg/bwCIoZXM7ZeOut9eb7W4ko4ckSKtEXrX+zXXGBbK+E2LQK582'
+        '+fN5YAyDe6HKTaVuCcHU/UwzCBA2OOTgjvY69RUn0thKPzrN1RyZok7SI9FbNCdn5wHqFxZRDta4'
+        '1GKLOYdZacBBLHxmB/nUTydl5Rck3o0rIQYyYSWMMgnOIiyct0/9upk5msHLSULz65mwB4c1Qvoe'
+        '2r0HAsrxmdZEFIFZFxmRENYFpHkC5ctFnOGCIPInmCBRAILdREh6JE3h6jsZ9si4I8rOSm6WtZxd'
+        'n3oXDNnGb8dA+p9JRCInkfto++Z6wMLirEMlWwG9BF75lySZsD0rjg+zZGFy/H6CeFJfq10CM3wE'
+        'Ojl4yUuTWsQ+IROeQCD4hdyO8ZvYzFICTZDJEEZ8bFSgTZAWWZSu9EWCSnmQFwo8ZvgModfIqp3z'
+        'SKH0sxCmnQgJRAQ+JJCfnWYeaRtjkRmUU7ekqzWxtyB0Cn+gZ2/0ru/EBIfIul+OFLrzMXP8IF6o'
+        'CSEeYElIIjLdm1q06kYwr+Tq30KlSwLgw67ulJWjozZCu/EkqtBwtVfamL5ijEGXxeMQWGzT5eti'
+        'JVCJG8LPH72IdmHNdfsGGsho05Wt8noDWivIXz7RM7MzkVOg5sUC90+X7XBpj5WQnT2HwI+Y6c7Z'
+        '555GM9NE6DxNUPpQGhxItmlH4vozDlPeC0a3QHV2RNy87RAcngrphU662lHaWYB5odWDh1TUrw7W'
+        'ru+8SYh5AZ4yhVVWolcka1/v5vIuA1WHyIqmlqfOrjdVoYdmHL2GJDbPOlZAgKMBJF3hDwtdU1zR'
+        'dyDs2juT9Wlmirgbizv5YzctI1kywMGhI3hTZy6hL5sUKDDiRoAUdI7HCrwoDvQx35DZWRjv5yE7'
+        '5in6wC7RVi1SOqCM5iZVjgsk2d6O3963qxGBiLk3V32bszN4YfifLF2dODl4AYbEEpjhKB21sT8W'
+        'ZP+7DeG4Zpe0ljMvWWxk7Q0z4OuAlSndfCvSyURNRGIOm0nr0on4AgUE78WEjjvdSxBtsEO2t6Qe'
+        'yTQW71JQHlHnpPiaPUsdoGcBTsWMxNFqblbNdQh5CcmG/zfCt6+4oS+fbX7cQdW6QNA8KVQTLQTh'
+        '4XGcXod2mTfhAjBxeHGMbWjsKugrcz0cNsgr9IC0Tkj1ZWzentdlbZr9b+8myJPPm9GDErI4TrE+'
+        'y+AE8+G5YPyDb0/FLfFhwm5XX9Kfc481S0avtlppz5NCLpTlIMreTnVKPSMcuckU0rCTQt7niW2F'
+        'Gcz9Qmj5WljWshsfwmzjUJkYkbWPq7y9RDNigLx6+hxk6m6rB2mu3LxiFgpn+GPOkZZXw6sIi3tf'
+        'VWrDh6ragJUnd3mzOr7nS1Mr+ZJ6tyk8bwaCc9qOyDeC9eTO3ozgls7MZE1KubK6ooPFmI3e+u9/'
+        'r+pTHns6WTsbTEWDPW4S3h8EmA1b+KIc/Cvp9VVpWJHA3oEZhmExcJHlfpWO5TcrGsWR9qgTGZag'
+        '6ONhwpm0Cq4qTrR9h6t4qZwEOZI36pLUPAhywNX0939B5QTArMymi9u0iqvqWCvwNxf7OfLuKNo3'
+        'AH7vcsRCEIVFLQuj6gsxHaV9QOg08M/19B8mw6sRAgZJSe6nKzBziZ92JO7ckUvE5NMlM/tCXEQW'
+        '6JEPGtFkmH+9KvAhMW9386xSW9nS/XNj6rxzRhWXAWp1qlUtmeGoQL6ciLYbQIQNg1wWE22aYQL6'
+        '8fdpGoh2vpz489ZyLOu2GjPmWA2p53Wu6O4BRvswr36o5WA2RhP8CRUHIVxny4w6KL+9C6VxPTYG'
+        'xsL8iPQQE1Pgz+988sQWYKVlDzza92u+qfL76tcB4v0lQdRU0179qAiR6R7WMEgvGwbgtvP8ESU+'
+        'bv+XrhjrdDABIDyGHRgDK52GuXDjygbfvwgSEkvOYFpca4SqRmiPzSZl95QO8ePVPeb0SK3eSdNU'
+        'cKgp/HN+mOHiI2PLLcJXbX3IlfN+fjGqz/PkGplslMv1GyoXhaY46IS6xj7ggAe8NQIbr8PxwXxy'
+        'qzxBzWnYtapisUU8SIerj4M2L3bANM9cZL9i4shHUrTYu9vddTw+bjzwd5nPVVN1qrY6uQ5xtlu4'
+        'B6bcLzeb6DoZVgUS9BM9AfQgEHW39HoJAV8X3LSI/fn06ZLah90oI48WXJSs3NIYL3rDfMJ5Ow4K'
+        'J3hv14EgSuocWJon0Xl9yJmHU8NXyHext1zyXhKdD/BvaWWkgHO3vkUNcSRyjo4mHpXKQ25D+S0m'
+        'cfWzLzeW09Y/+YsGYfmFZG/g+4Ix2ZXbEG8Uw6CzeMY82NsZBoa5ewnPu+TwWSu8TQCpI7OXbxRE'
+        'vlt6jrRgzxCBokLlUTaiSY+h04O3lBghPNwK2hcvNaLca9S/UPw6oXMq/Cmxm7G8QnUNTtXi48ha'
+        't4qcvJv0i3t7l2qamb1m+Jiz3KzYv7uv/kvUPUcUzbDPM0l7UW7INugpU8BOiBPQI0x+Z75/k5Lg'
+        '3Aq2gDSyMgTPtO+jn3EMLPy2P7qRqEwzMOL7hu3xrUmAXbkeaB5Vpbi2Ylo5wFGFWDVZf3o0HkAc'
+        'YY4qA09I5NMlBc7yASABssZd+ABXykm7AyZS/uS2RQJFc7TlEWcJi6ZOqOUpPGeP9ZyAynlWQo+N'
+        '7IqZ4Lbrr5sR+UU9CaYRxqVVBXPPrkt0SoXQxxozCa+6tnkAeJFfP9rTtIe+VtN/CjIag2FmEJJh'
+        'LxTLdv7IwyMriN1Sn3iH5JC6hsLo6uugEJVfiuQVSK9B6o2kuucromZMoTbKYoMY0+k8EDPvXaG6'
+        'TFg0T8uqMMV87aJQXVuU+8+ZN6FHQBfqxYphHMmXV3aNCqPyXB4Bon+q7WiFPJ2pD2ZU2sMiaVJF'
+        '6w00eeEFOJH+DzrPAWvyRhOy356WK6p6GaDz+Jt16J9IOG9oAxTuo6f0Zl464kqRUFclDM578p8g'
+        'oyL/G3ZM3tiXdvrsE/CNccCdKUxulFtkurREqYxQVeoIbExLZxD3ai+eXpg97abG9oKdKO9zxbKU'
+        'TouDjM682yB7JfSOpp4G3Ad5ssi3i70i1rRt0/aibEDIfV0sNsSfyDGOnlljbI4l5dnbc08x5NMX'
+        '4Isgbrs5fEb/uGznoFFru1DsLimGTAq39+rO5BRZGlcF36dJH64Va/2OigmMt2EixPhBkgLzw37n'
+        'JHE+lC/xTBiB/sVYnGgLAMXAOw7OPGamsH0dPnCzDFdyGyNXQVbeTpWJ750UArIHmy+PbcwPif9x'
+        'HJl4lh04/pDDxnPJWxKPBklE1KamT5nlyHA95JZq/h72x1arH1QSM0h0RFk1MIdHIfp+fNCxinT7'
+        'QxR0j5Q33fbEXYDvIUcop9r/Dn01weCbVc7+cp6qwtFDdlnuaJ8yoegseri4AxvTQtWuwg9SswE8'
+        '3ra97KS5d/i1H8iOhoJk8T0yrjPSkYhsnO4wplqUX84kbPn2Iup88anqQyBfInl+hO/HqhgfOLML'
+        '6F8CBaQ6Lh7ik5edbeCMtmKu/o5w34kJU5wWBvU3npivqdZstaphzSxsfFWOREC5upDNJPZfst9w'
+        'q/rg7QMQUDpgrGTcyvpM3bIZakA+6qwsLaJyQVo04AgALrxSqz57NEXIMkwnvtdfFLhJVz2HvIz7'
+        'ma+YbTsUEqLdD4uv0G+DLvY6m5aN2icJ9Qp48OfBqksNgC3yxADX1740Ua+1+KxMH8RdCZ/zr9KI'
+        'LOEfMGHV/gdrBGcx6TLSrCSO1nFcIh0/ScolthA6VLHkAyjj7WpR6akIcegv+3cfKsxf1Y1aRm7E'
+        '/kaADD6pbLyZun+uUGevvrdwDpLJd7WyjLXJKFD8F98Ttz7Myngsblwy37VxDtsgT5HNK/o7mTZB'
+        'qogSdyNBketjfmGn86Of75XWsKJ2ZNaU5IMsrYaDzxIDHEaJ5OaltsUD7lJkO4QtgiDU2wt0kAUf'
+        'k7t2cak+SB685nMUf+FWIzDrTDr+AfZBI61XXcQ7pW/JpObsVKek3eIrQ6b/DCle/Ji7+PpD5v+V'
+        'DgHURNzPnykQ7+Be7oGDnuh38U75ZH7Zd5OWW+NovMPVezNpCa8Fp0cTfaqwYbCfTjMLkUJOMYhY'
+        'xRkLd/f8+GLBF1ORipLN5c+Ieq/NNLM1ddr9rtCxGxG6ncd2n7Jb2fmG9ItOHVXiW/BRj/QnIpUB'
+        'xbv4oTZH7Z6liUBiPg6DuEGNRnc59muGNEGT21AC9nCJ6QydpU2cgKJls4ejLTwgfsSpU+S5qhV5'
+        '+u763qCA733CW0DQo7n70X0iF+6mwLabr5m6EAcwInRo5J7kiWv3siTfx4Lvczxo4YTpSLeKK1sZ'
+        'kHMAHmi0+nqzwuwzTJM+FZscr5zIVJcWl17lxtliIGhqhdSmi+v+LRA1+FBPIOq5RzmljmNmalOx'
+        'CYXRf54eoU6QGh6Q+l5A0GrXqasEagwH8YAuLhEyuMRFCWLNi7bhRxoMR7rZQIypKh0m2T/PokOd'
+        'VS030ChWHlNdLFy2H95Rk4AADutEBHY4T+QZklPZCyQGtuInkAwc9PRpWbajJ23lgknXBu6rCe9c'
+        'Fa9uXheJ2HQSSx0tI/RXpvuCwZyOxq+MIWkVpXJ/Vsxo6/KzG08CVjj+kcoOTD0q1lH1IMeBDMLj'
+        'Yi5Bnrxe+w/xGRI3Hb3AtATnpJ7se7xGvrxLn1GmnYcl1XyqAoEtv8gN7isBO4lG5wGSN3U7LlBB'
+        'cqEwCZ4cOmYgwsSmfjyPkJtY8qrfcHh4y/YTsqk7nNzLJcnowCqCTPeres6gOtbUok++IA/5KvOl'
+        'xapYXlFEa1JRU0nHN/Cdi9SqDRo7UsXN/Zb7UXF4W0ngqU84idx7fJVgzh4+fvFE01l/N50k5jJg'
+        'QPC6tuW7R84cKlYZ2j+mBlLf2A33EYoQ6WybcLDJq8NmZFyHziCbWfHv7Z/zvmGYp1MIkHLu2A06'
+        'ykbkXK4oZChTeatSVVVuEz08jGrSQzdZda1Ttw9eSaG/F3xIlbPVghjZN5s1lCbLiGbTzquo16pk'
+        '7w7WS9c6rWPN+72BOmMUCkMmc3NxOi166ZEhzweA20/NSypA1dLkY35wor9Z32bUqJI8Um9kXalN'
+        '7HZTqg1XhdKXZQdkHj/E6zNUowR/IidUc4phD7TZpUAxKWDr6AJjdRe+KuQoeUt7yVW+23e6s0+8'
+        'K9yes725lwR6BM/Vn1LNg9v31QEnpNXx3w94+qCida2zqQjUEHUKPkxkb9xQg9G2c/cTwV1aiOyB'
+        'IsuoUlABLdjS9cNLTXFddHtAvyCaD7xFZcDszJ2Q++6H8lvSsZHunDL0dmIypPJgUrHNiICUXjOk'
+        'zXGRzn+BAtLNvhF0TArZUHVzVSqXqZaawF1JDJlemyC+EORwEYqXi4zsK+OAKqUtoQNu/OCuR4f+'
+        'saiWlYMjM8g/Yb62Cm3ftdSNROypxnn2lBVetRy6xq5W/CyT9qzffZWNxxkC01ZiAcCslgl+CwOI'
+        'ESt+DWm8RI0ODdrBR3YfpvmvBOBIoE3pRDFm+NvWBqrPHeSUamxa0ancXcU+vIP/sdlBrnr+B6K3'
+        'XgIEF5p2ibwxq4sxdnV1qYyhsPTfTk5I2EyYtJimoYxjjDCMlj+C8eyn4Kd63dOxJQmwH8p04Qm4'
+        'SfgKS03hePwXL7CQ3iVglo1BCg/WmeaLsGJwf8KxViC3VCqANUIDwpW274Fqh0Q9rUPfV/yb3Td7'
+        'GaFNsQhYFnF7Q1/DFQRoXTc5qdZhOXGd7rdfOdcGwo3y+IGM5ujHckYEGJlDyuOqmGu8RZ3nqiyQ'
+        'jEP0jupYE2VY5eYoyJ6l7vmB2MC0tpkcksX3K5OQUzJpx90goQ6WUDsNVoG29Bt5M5l/1GJuC1F8'
+        'iu8M9MDxYuzHDdJLBXiCMKFWR4tg+Hwgb12+kxgkA81snFpIJgfJy2ttKAwzTyb7mM9DmXqcG61k'
+        'wQ3jsgqI/S0q7c8aARWMT02T3G9IVOl8qZn26KOffxAaXw4Me3GOL04CcCR+pnyZCx7GT2qyc1ZP'
+        'Km9LERJ0AlCyIJxgPX0Z8xMTDHHL8dXgfRUr9psPJBRl2BK63EwIdLb1vWu81CF742aPlrQKS1kF'
+        'Wzie5uBNNEOroynFAlfFikYHAhxkKC4HaKrHCErRINzfJCuut/KnVswnNmpUPhuu2DiK+NwB+kiV'
+        'H4XqZS95DjghVJcs/Fqvii2yVWD/+8HoNJsw6jhsw1gnnnDR/A266YJsn0gIENCvjmFdZX3Gd9qU'
+        'I1tA2jdNA5lx3Kq4a9ZRh09EPmfByISRRFKuWoOTaI+qx9Hkc1/f7yjJqzu2Hgs9d+lSNOJl9vqr'
+        '5LFTvnl6hTelH59Wh059GhiPtwNxIZ4pAUL3MruMKWSXQc3Dm8RzcGEcBpQC0fX4cBMsKUwL8AAo'
+        'G4OJkDsohSPgMhHUTvtPbKex8lb6GYKqriMNUEQ3AWrjl0U0GS0jVbnj06o2dyNM3j7BHMFe3XdC'
+        'R5spQcmNwla9sxv976ZxBoK/8BEiA2llQRwwP8TH1HcfrruhJ0VD0BQiOuIJLX3r5FEQsWe1dTDd'
+        'UkPN6iTZ3jTa626vA7UK5QFV+3G7Ticky2e9RWx5kiFhCjhuksEklIvWfVyW0S13Nse5+4VXAjSX'
+        'Xas5MaZgzGK0deUMseWWjhYdZ5nyD8wNT66DeDrdp9vNUZR/yK4H638vulvwJAsU1J9pe0LInvy1'
+        'Ephkr9u4WD+x6eyAlZNhe7yrllUWs45VV6p4NJxxY/Sj7peJPn9ftTL90uw1AZRuN7Z99wJuqN61'
+        'IM9jl2jSPBNSzeJbl9CD486axHdcnRxRrFaAcfmFime2dnAUfEYEQpt8AYQA5rd/vy7ABnf/nyIR'
+        'oh71y4U6JcB3+KP7Jv+2y0CXVObC85iPaih9KC7cIFUMwsTFV3VU/eL1uUxF0/T4U7cFEfAMDsA5'
+        'mFj+KQ+GHCRs/86eBLsvPtOCJqpjqLESQAy/U/FPf1+ru9CNuCknmsqx41PEv8j9sekttfuKP73n'
+        'oihwnJNur/fLsJID'
+    ),
+    'unrooted': (
+        '6AMAAAAAAAABAAAAAgAAAAMAAAAEAAAABQAAAAYAAAAHAAAACAAAAAkAAAAKAAAACwAAAAwAAAAO'
+        'AAAAEAAAABIAAAAUAAAAFgAAABgAAAAbAAAAHgAAACEAAAAkAAAAJwAAACoAAAAuAAAAMgAAADYA'
+        'AAA6AAAAPgAAAEMAAABIAAAATQAAAFIAAABXAAAAXAAAAGIAAABoAAAAbgAAAHQAAAB6AAAAgQAA'
+        'AIgAAACPAAAAlgAAAJ0AAACkAAAArAAAALQAAAC8AAAAxAAAAMwAAADVAAAA3gAAAOcAAADwAAAA'
+        '+QAAAAMBAAANAQAAFwEAACEBAAArAQAANQEAAEABAABLAQAAVgEAAGEBAABsAQAAeAEAAIQBAACQ'
+        'AQAAnAEAAKgBAAC1AQAAwgEAAM8BAADcAQAA6QEAAPYBAAAEAgAAEgIAACACAAAuAgAAPAIAAEsC'
+        'AABaAgAAaQIAAHgCAACHAgAAlwIAAKcCAAC3AgAAxwIAANcCAADoAgAA+QIAAAoDAAAbAwAALAMA'
+        'AD0DAABPAwAAYQMAAHMDAACFAwAAlwMAAKoDAAC9AwAA0AMAAOMDAAD2AwAACgQAAB4EAAAyBAAA'
+        'RgQAAFoEAABvBAAAhAQAAJkEAACuBAAAwwQAANgEAADuBAAABAUAABoFAAAwBQAARgUAAF0FAAB0'
+        'BQAAiwUAAKIFAAC5BQAA0QUAAOkFAAABBgAAGQYAADEGAABKBgAAYwYAAHwGAACVBgAArgYAAMgG'
+        'AADiBgAA/AYAABYHAAAwBwAASgcAAGUHAACABwAAmwcAALYHAADRBwAA7QcAAAkIAAAlCAAAQQgA'
+        'AF0IAAB6CAAAlwgAALQIAADRCAAA7ggAAAwJAAAqCQAASAkAAGYJAACECQAAowkAAMIJAADhCQAA'
+        'AAoAAB8KAAA+CgAAXgoAAH4KAACeCgAAvgoAAN4KAAD/CgAAIAsAAEELAABiCwAAgwsAAKULAADH'
+        'CwAA6QsAAAsMAAAtDAAAUAwAAHMMAACWDAAAuQwAANwMAAAADQAAJA0AAEgNAABsDQAAkA0AALUN'
+        'AADaDQAA/w0AACQOAABJDgAAbg4AAJQOAAC6DgAA4A4AAAYPAAAsDwAAUw8AAHoPAAChDwAAyA8A'
+        'AO8PAAAXEAAAPxAAAGcQAACPEAAAtxAAAOAQAAAJEQAAMhEAAFsRAACEEQAArhEAANgRAAACEgAA'
+        'LBIAAFYSAACBEgAArBIAANcSAAACEwAALRMAAFgTAACEEwAAsBMAANwTAAAIFAAANBQAAGEUAACO'
+        'FAAAuxQAAOgUAAAVFQAAQxUAAHEVAACfFQAAzRUAAPsVAAAqFgAAWRYAAIgWAAC3FgAA5hYAABYX'
+        'AABGFwAAdhcAAKYXAADWFwAABxgAADgYAABpGAAAmhgAAMsYAAD8GAAALhkAAGAZAACSGQAAxBkA'
+        'APYZAAApGgAAXBoAAI8aAADCGgAA9RoAACkbAABdGwAAkRsAAMUbAAD5GwAALhwAAGMcAACYHAAA'
+        'zRwAAAIdAAA4HQAAbh0AAKQdAADaHQAAEB4AAEceAAB+HgAAtR4AAOweAAAjHwAAWh8AAJIfAADK'
+        'HwAAAiAAADogAAByIAAAqyAAAOQgAAAdIQAAViEAAI8hAADJIQAAAyIAAD0iAAB3IgAAsSIAAOwi'
+        'AAAnIwAAYiMAAJ0jAADYIwAAFCQAAFAkAACMJAAAyCQAAAQlAABBJQAAfiUAALslAAD4JQAANSYA'
+        'AHImAACwJgAA7iYAACwnAABqJwAAqCcAAOcnAAAmKAAAZSgAAKQoAADjKAAAIykAAGMpAACjKQAA'
+        '4ykAACMqAABkKgAApSoAAOYqAAAnKwAAaCsAAKorAADsKwAALiwAAHAsAACyLAAA9SwAADgtAAB7'
+        'LQAAvi0AAAEuAABFLgAAiS4AAM0uAAARLwAAVS8AAJkvAADeLwAAIzAAAGgwAACtMAAA8jAAADgx'
+        'AAB+MQAAxDEAAAoyAABQMgAAlzIAAN4yAAAlMwAAbDMAALMzAAD7MwAAQzQAAIs0AADTNAAAGzUA'
+        'AGQ1AACtNQAA9jUAAD82AACINgAA0jYAABw3AABmNwAAsDcAAPo3AABFOAAAkDgAANs4AAAmOQAA'
+        'cTkAALw5AAAIOgAAVDoAAKA6AADsOgAAODsAAIU7AADSOwAAHzwAAGw8AAC5PAAABz0AAFU9AACj'
+        'PQAA8T0AAD8+AACOPgAA3T4AACw/AAB7PwAAyj8AABpAAABqQAAAukAAAApBAABaQQAAq0EAAPxB'
+        'AABNQgAAnkIAAO9CAABAQwAAkkMAAORDAAA2RAAAiEQAANpEAAAtRQAAgEUAANNFAAAmRgAAeUYA'
+        'AM1GAAAhRwAAdUcAAMlHAAAdSAAAckgAAMdIAAAcSQAAcUkAAMZJAAAcSgAAckoAAMhKAAAeSwAA'
+        'dEsAAMtLAAAiTAAAeUwAANBMAAAnTQAAf00AANdNAAAvTgAAh04AAN9OAAA3TwAAkE8AAOlPAABC'
+        'UAAAm1AAAPRQAABOUQAAqFEAAAJSAABcUgAAtlIAABFTAABsUwAAx1MAACJUAAB9VAAA2VQAADVV'
+        'AACRVQAA7VUAAElWAACmVgAAA1cAAGBXAAC9VwAAGlgAAHhYAADWWAAANFkAAJJZAADwWQAAT1oA'
+        'AK5aAAANWwAAbFsAAMtbAAArXAAAi1wAAOtcAABLXQAAq10AAAteAABsXgAAzV4AAC5fAACPXwAA'
+        '8F8AAFJgAAC0YAAAFmEAAHhhAADaYQAAPWIAAKBiAAADYwAAZmMAAMljAAAtZAAAkWQAAPVkAABZ'
+        'ZQAAvWUAACJmAACHZgAA7GYAAFFnAAC2ZwAAHGgAAIJoAADoaAAATmkAALRpAAAbagAAgmoAAOlq'
+        'AABQawAAt2sAAB5sAACGbAAA7mwAAFZtAAC+bQAAJm4AAI9uAAD4bgAAYW8AAMpvAAAzcAAAnXAA'
+        'AAdxAABxcQAA23EAAEVyAACwcgAAG3MAAIZzAADxcwAAXHQAAMh0AAA0dQAAoHUAAAx2AAB4dgAA'
+        '5XYAAFJ3AAC/dwAALHgAAJl4AAAHeQAAdXkAAON5AABRegAAv3oAAC17AACcewAAC3wAAHp8AADp'
+        'fAAAWH0AAMh9AAA4fgAAqH4AABh/AACIfwAA+X8AAGqAAADbgAAATIEAAL2BAAAvggAAoYIAABOD'
+        'AACFgwAA94MAAGqEAADdhAAAUIUAAMOFAAA2hgAAqoYAAB6HAACShwAABogAAHqIAADviAAAZIkA'
+        'ANmJAABOigAAw4oAADiLAACuiwAAJIwAAJqMAAAQjQAAho0AAP2NAAB0jgAA644AAGKPAADZjwAA'
+        'UZAAAMmQAABBkQAAuZEAADGSAACqkgAAI5MAAJyTAAAVlAAAjpQAAAiVAACClQAA/JUAAHaWAADw'
+        'lgAAa5cAAOaXAABhmAAA3JgAAFeZAADTmQAAT5oAAMuaAABHmwAAw5sAAECcAAC9nAAAOp0AALed'
+        'AAA0ngAAsZ4AAC+fAACtnwAAK6AAAKmgAAAnoQAApqEAACWiAACkogAAI6MAAKKjAAAipAAAoqQA'
+        'ACKlAACipQAAIqYAAKOmAAAkpwAApacAACaoAACnqAAAKakAAKupAAAtqgAAr6oAADGrAAC0qwAA'
+        'N6wAALqsAAA9rQAAwK0AAESuAADIrgAATK8AANCvAABUsAAA2LAAAF2xAADisQAAZ7IAAOyyAABx'
+        'swAA97MAAH20AAADtQAAibUAAA+2AACWtgAAHbcAAKS3AAAruAAAsrgAADq5AADCuQAASroAANK6'
+        'AABauwAA47sAAGy8AAD1vAAAfr0AAAe+AACRvgAAG78AAKW/AAAvwAAAucAAAETBAADPwQAAWsIA'
+        'AOXCAABwwwAA/MMAAIjEAAAUxQAAoMUAACzGAAC4xgAARccAANLHAABfyAAA7MgAAHnJAAAHygAA'
+        'lcoAACPLAACxywAAP8wAAM7MAABdzQAA7M0AAHvOAAAKzwAAms8AACrQAAC60AAAStEAANrRAABr'
+        '0gAA/NIAAI3TAAAe1AAAr9QAAEHVAADT1QAAZdYAAPfWAACJ1wAAHNgAAK/YAABC2QAA1dkAAGja'
+        'AAD72gAAj9sAACPcAAC33AAAS90AAN/dAAB03gAACd8AAJ7fAAAz4AAAyOAAAF7hAAD04QAAiuIA'
+        'ACDjAAC24wAATeQAAOTkAAB75QAAEuYAAKnmAABB5wAA2ecAAHHoAAAJ6QAAoekAADrqAADT6gAA'
+        'bOsAAAXsAACe7AAAOO0AANLtAABs7gAABu8AAKDvAAA78AAA1vAAAHHxAAAM8gAAp/IAAELzAADe'
+        '8wAAevQAABb1AACy9QAATvYAAOv2AACI9wAAJfgAAML4AABf+QAA/fkAAJv6AAA5+wAA1/sAAHX8'
+        'AAAU/QAAs/0AAFL+AADx/gAAkP8AADAAAQDQAAEAcAEBABACAQCwAgEAUQMBAPIDAQCTBAEANAUB'
+        'ANUFAQB3BgEAGQcBALsHAQBdCAEA/wgBAKEJAQBECgEA5woBAIoLAQAtDAEA0AwBAHQNAQAYDgEA'
+        'vA4BAGAPAQAEEAEAqRABAE4RAQDzEQEAmBIBAD0TAQDjEwEAiRQBAC8VAQDVFQEAexYBACIXAQDJ'
+        'FwEAcBgBABcZAQC+GQEAZhoBAA4bAQC2GwEAXhwBAAYdAQCvHQEAWB4BAAEfAQCqHwEAUyABAP0g'
+        'AQCnIQEAUSIBAPsiAQClIwEATyQBAPokAQClJQEAUCYBAPsmAQCmJwEAUigBAP4oAQCqKQEAVioB'
+        'AAIrAQCvKwEAXCwBAAktAQC2LQEAYy4BABEvAQC/LwEAbTABABsxAQDJMQEAeDIBACczAQDWMwEA'
+        'hTQBADQ1AQDkNQEAlDYBAEQ3AQD0NwEApDgBAFU5AQAGOgEAtzoBAGg7AQAZPAEAyzwBAH09AQAv'
+        'PgEA4T4BAJM/AQBFQAEA+EABAKtBAQBeQgEAEUMBAMRDAQB4RAEALEUBAOBFAQCURgEASEcBAP1H'
+        'AQCySAEAZ0kBABxKAQDRSgEAh0sBAD1MAQDzTAEAqU0BAF9OAQAWTwEAzU8BAIRQAQA7UQEA8lEB'
+        'AKpSAQBiUwEAGlQBANJUAQCKVQEAQ1YBAPxWAQC1VwEAblgBACdZAQDhWQEAm1oBAFVbAQAPXAEA'
+        'yVwBAINdAQA+XgEA+V4BALRfAQBvYAEAKmEBAOZhAQCiYgEAXmMBABpkAQDWZAEAk2UBAFBmAQAN'
+        'ZwEAymcBAIdoAQBFaQEAA2oBAMFqAQB/awEAPWwBAPxsAQC7bQEAem4BADlvAQD4bwEAuHABAHhx'
+        'AQA4cgEA+HIBALhzAQB5dAEAAQEBAQIDBgsXL2rrJwIVBVcMPR54S/W92+MBA9oEGY8M+bggzM9V'
+        'KkLiOatXAtqhPAYqT60QdFnELFhKm3h59gJGAfok/XMD5pznYwltz92aGRBm4P5FaaIXzb9C0oq/'
+        'DgK6dcKsqQUaGoegnQ8m+J2gJCs2bTl2aHcvUgQWDEsBX/QRIEWXA2Mq0cqT/AlVU6/ma9AbDrRp'
+        'mteSTbrJsAWGo9iWfU4swsRdAjy1HAjt558GbQfapeNWkRJ4f3apuJMZNB6EhIcuMliSW/DVYnpR'
+        'fZsB9Rq+KOiXJ4YE4Oo2nsYwv74MMY0wHSo3IPAj1LBI1H5esGxlRUtrxGTRcnseAW4TEeF/03TZ'
+        'KQMrNGAXt/F5IvMIrHQOJFOmgbdWGUlddegZipTBykeI5m01ds6gGY3LHFEkWlf5nTWFQQIU+Wv3'
+        'DaYAAKNnBg3zpXok5QSaEDISPn3mUjqVc9VZuTP6fn938CpGNmkfk2L8BDVsSoFuVreiAfwG1/ue'
+        'wslSaFqoBGuPgmu6M+oeAUFFDVP5zYaVb1IiKZzUJffG9XKSjKheklrma3PI/JR7zp9h1MrnMwFs'
+        'HKO1ZJl05FlBE28DW/fEI0dfkTiQcvfOCRWPK41AKPKSWDySBxylbfL6ZNpIk+IzzSJQyDh2Dfj3'
+        '5hDyUQ415Skjqk1OuOg8Rt963Y8CN/dJZmiLLHduY2yBVQcqIngmfjxNJ39micwAFdGRp3DS174a'
+        'yPCHJyw81SOCvIQznlyzwz3UdKwWrIYy5B3780kBAJhz7gFN3V7oo9NhD9LDAtkqigWJriiyqmzJ'
+        'zkaciqP95A8QtzvNL7lAhcpckFvJni2M49kJN+qf/Vq10I/P+4KHd3Mu7R+LvXBaTVG7M3gBJ55U'
+        'GFjlpq7yzFzTito4BMymEc2Ri9brY1cJLL5aIgxciY74lrZbJN25bZXdY+IiiIycTjgi3UiCA6Tw'
+        'SptRZFSghtEmiHqYX6FNN7IBlCAB298/7eSJ+8Ws9aiwd5JePgOEySQCZI2qAssWKd7WgwdWCbcH'
+        '21vy0V8DYGbPX9MIFOEaZM7+VV66OLGN9aGql1OTaE3liJlDabDicRYs6yhDWFv83hlRx+f1iT9H'
+        'hB6O4/VdeoKCAkZ0mMbcDxC0u1hE1jHAoMw7B38R3S4+ZJ7EML68s2E4/XraFBaIKI6uENRpGn6L'
+        '4qLtzOYhPOrznK0KBHUvVCleXT69VTRwrUns2CBiDsOVtDSNFfjaKrVc9AHtrhg2+F64zqgWgjV6'
+        'R6Yk3KMFTuilKhTaR4O/gPdc/zvg0WVHEMo2vcWUpeoPjYluqiDSuooD/y7+ZzrBOLenkMSbZBwz'
+        'kzWka7SHoT55Y3wLYj02AZ2T/uXQqyPxhwEJP2VviueGdcR6U2uxubPpwj5sBJPHeDCjAm7AuH8Y'
+        'g4tj0mYqhccMgJ4l52AMmMwPVQaAfoFgM9mx7iTVHHZyjtAWdx4FW0CPPKhv5I7Bau4pPlZa1VMH'
+        'o+GccDmuH2X936U0AQ5yYjhV7hc7ursyqvU8+oYTTIV8A1JlPHEnOggZznQQwmCsPEvKRGcVCn9J'
+        '4LXrUaZutfym/IMMUcx/v30rHY+dIpuYUJrkRp5ZnZ0/O1sDD/RlVEll6ecqOiexQFjOURJOaoZJ'
+        'MZA89A8iantwixtbjRazIajz/BiyRWHpwgIWqQF25umbXOHYX3lTDSAYXSlfbP4HJjV36reEKWKz'
+        'LfXVkYhUYYcPWiolFz6gy3VzHf6EDgNE46N/0wwvd/R7BkNPN0dBm//01fOGsyG495cOAn4v7yDC'
+        'IcmOggOXeHrl2I8FfznD5+X+rCdbMgIzPhnhcZ5brSbLdDMjmSvmC6bXv05dBjXlfUPDuVSI+IdC'
+        'G5DL0Lt7dgNqUnESjkQZfSlvtnZS++aKNnDMRNYMqC9VczWoq3VoY+GlusLg9r9QMEVG3tcIMR7v'
+        'mntcwC4MD++9pY5ivH+9IolOLbakqSrBAXfWv0gOEhRKwB+Wf5GePphZuom4el0WBUv/2USeivlV'
+        'Dow7VH0oq4+4DHSmr8fADky+9cbirKEQT6IBdlahlXeM92t7sAPKKnGxTwK6Hl8hd9gTPK0nbILq'
+        'hwr09BQffB1oNXxL9Uw9vIIQp6/fOwx+EW9XqSEZaAFE5WFxbNcUezHaXyfUadAGAcjNMd5G2hQE'
+        'nxaUKnNFie0WXO3kJ4HgiChjylQ5AyLYC1aDMdwWMoHO37QS9ByxK2pZ0w25t8pXYCK1XD0vrxBe'
+        'aokQJRi1+S+5yUfblg0wJMljHpDnhyvdddhgM2IYUxZ5gn7iZ9QUIaewIQF4eUQKnf/NnnETpE6o'
+        'KpcWhm8ffyqCBB1JA6UJFkkdCIHn1m1/U45hzf3HSVjMwsr8eYoJ+5zYCkxuva2ZWVPq9rPR/s8Q'
+        '0SlvTlh/tRswkUljxZg7nnqiiBQ6zVKnAKAUECS6VqJ7UI36ydlS8no34WaCYIIIYkXwz8UEotJH'
+        'K8zpNn5lt8b73D+QqKyOe0bJhMjfLwwtbeBOP6cCYT9oW4QxVOec2+4mVRATXE1DLda31ILkorUH'
+        'iEuWd0riD0uQ7FDGikVeeGfig0EtO0wxT2cWnyN22Ff8xaxxHwtHTkHXBQSASGWMLWTkfhxBNMgJ'
+        'hwzfEpYO16zCEMAJXyCg6okVBpICCUG9Cj1qJjmI5qLD5WefUDIaeNscIBRAXtpj0SYmAgLzgcmX'
+        'UrN+6I8jN2zGza7Y8v2aR6WZ5jlwPwZzD99QLI1XMW8T5CBHcfeEH+1hfap96suVgCoSsV54NEdn'
+        '9mewP8gjN+mOTdV46O292DpyHS7TNLMwqLoVLcXTXFuMbZr0WgQylS0A0QAlInMtoJkbCt5fNA7x'
+        'Zj8sPBvjxMnvRwoWvwBXLGbHW9K+ATsbG4JDZxHT1VDltjfvGJvG1mz5xZgIDmUbuBMFUk16CGcK'
+        'o/6LQTDIsA3inJ1enAYjHPPHiUkFxQ6AMxr1eoDV92p/uyoRizSjjRRyJvnxNZ8qGX/4Kq0zB8xz'
+        'B1sjqd3c5VcPWA4J7n4GdGBwYcrAAgh9XJfLb3fDys+/z04iO/NqSP3+IgmC3w4bQcd11msBmbuC'
+        'YTBgkAkS4mTY4rk302oRArkd8RVl/2Fa3CIEAHaaqEzQEwfGxUrYCsJzK8rqF6hQFeb0Vris2QkM'
+        '5JNWyKf1UWCGMcwwyFwbuRj2YvUN3GgWGParrQoj2JERu4q53e1XEE78V40QJsgokAbxYoAww25y'
+        'XwJmOd9FkTyWdM/Qk1Vb1XIdF0sbVf2lGFYJWVHAEvwoAaUZetIo3LZy0zCJk7+mgekNjri+2N/+'
+        '2VVEv320YAPbUp+acRqt5xkdAhzUyVQmRP0xeooLO4bOTTRD6tUJnZnlwFRzoLuf3hQvjRtTzn2Z'
+        'I59M+7mE6/ypOYOkHI/C06VGoUvP62KL41OYNrnqhiJcTnp2vGAGHO4na1N4XUeNrKpCddyQS2ac'
+        'YaKnlKwwptK9TTjDoodVAfjyIiLxY743XhEJLk7LfQA0sxNLEttimIDwipkVDiW+wwIf72FFZOot'
+        'D8ePP127F3EPKNOOs63rlK3uih+Vi8ENCFMZhbXsT5YK2Ovjg2ZpwggegNokKLpqklyktLHZsXYX'
+        'QVB9047O03EUIWaQP9pSOGKtaJrK62MaNFb3JUZIXUQ9nxUiMqHzgchJGkr/e2QcXRlTIl6n6FdO'
+        'g4cDoW40xxBXejNEv6Q6D7TkwqwoA3xxL+0rq0xK9PEOVjdp74BEAu6ZSCC0IDz+M7f29v8LK9Fw'
+        'MzNrivOnVzIoTxYIsMibBg8r4STkdatsf0tdyiIZgJ7Vw4QwB8VbMMClY80RO9JCEwOW0Yf9oY+z'
+        '1jGNkDcYgYuU7zHe+6uhE0DcMa34c1gkOGGcTc2kzHFonf/yInPfyzhLA7ipu8PE8HMDeOWMVrmn'
+        'o7x16bolabMY6BTiWSNWah4E9wUemMtb8APQY4gCo2AY3QGjMbS755VBfX2+y8JXL3tqVmfUnQTk'
+        'sFT9X4z3LiGu9G4FTiJyPdRVecHKtJBxe+7BnGDpho29i6wIC7HP4o1YRJfXD0y3KjlOCY9upFP9'
+        'ELzF0Ty6fNq5W44/ZKy6GoxIA021MS5WeORFU7lrgVE2cNnUUyzndC3cDNHsT77LiWGfiQ26JLWG'
+        'nfzyqG8mw+JVSftkrCwo1tTHO6jy4jg0VcksKM4h3P7ZiAFKcyBV0/4Ykpr/xCUom6Rb/wFAsRJU'
+        'zh/s/qP0SWclK8R5BIxRwetekrnEaX6BRHZTI7bRQw+YLZlDd2svR8XH4GBi6A0N1wfc8EfS2CMi'
+        'I8y4rQEvUGaNMnovLz5E0iqXzzUc0EMtFCa3SkP/MoM3oVOT2UPzzTEyWHhLMTr8v5A5yILukiYP'
+        'N+sUb0C6hklOEpP7smTfV4RvRX1QPPtWHDmn1Rc1aSZ0lqbRiRBEAXBiEfaROIACGSxpmVzlrjDu'
+        'bHmRK0tqNvrKyonDFS/xrXmxAzzmk0becyI9/4P9HPIJ8L+luGJ51Q7e8K9kkwpXhYJ+wqjGCqrm'
+        'i4jiRPIRwx7LHo708SAzYhqSQzV97OHMyomidV+/W5xxH2lWPi3XCC0ztxNaPMKaXmk3+eD/okVU'
+        'X3M+2xtOkjr0bdvBW487Mfi2hhPvCpirrEGGubVPIe0v/DPGx2d2owrKTtFINRLHCwHnXmbMRf/b'
+        'dgMa6HiIvNflhQ/QKwFDFEcaSN+HeOa+0n5Xgw0D66AJG6HxI3ehqWn2XVA2peOQSxk3e+Pqua1V'
+        '5vXQAXv29ADpCHzBWbJCqsD3ZEyUr47lLvfBGQVy0RKISpSlgsJqjJItdgD+ARr7l/jyqhs0eE0j'
+        'P0+xK67EsTMOwtnoDaD70QqA7eR/xil4JetLp6VN2BsAf5EJBzA16R1oDxHUKUBnN9jfdLCYE707'
+        'pvBshxSg3d7KFhzPOotb1Ggq3aiOSsxwdb0+o2yziK9Sy6plqLoyGAwTBYcCmpoaAgSZiKwyi0kC'
+        'uMQRyaQbSadMURAG4YDyZoS3qFzo5ncLYQdl1TUzy2MGA+EMeb0B4v55NS1Z/7Edli8AaMjFxRXX'
+        'P2XdwJqLFT+tLVBqUV0cnPji1v5XzSblRSH8Nb7AfKfFgSOvbAtzvU8sV+k+Aohd5rxHHJLsw980'
+        'n8X0AuWCm82dBi4fSmrKv1/d9gwzeSq4tbfMNIrCTzDv2seHOatWRdlfx7hypTdNMBjuzZ/aaSB0'
+        'qNuscwd9GAKwN7ObgdK/1kd+SkQzoWNanlrXq/4/VdpR6Usxt2gD0TASpa3MHgaY4IZ4I5evtSKo'
+        'c2yScoFSi5eJviGC6+shmzNfb/LzQ3qXUrwO4BFHFRnxscBxiLgtq0zaf11CMFi91YJRYhhJxsT0'
+        'hBDlqcKcmx7HNTQ+nNZt6xYeQZ6Hx8/RgpJ4CWfc9AU717o1HDJ/jKovVmFF82kMgZh0yUW0+ySU'
+        '4eRqKdA4Fime/J9JKlO0FKFnGMNfH4LWSfOTKHUifL0BP2oMuNMF9dBLC8LT35Sl7n0+cPoE22WN'
+        'BGBeNrlI14ORGp79n2QVBRgJ0LBkQRUMJ5G3fHDzjM5qpNNCJefVo7Ktg0LVUG745Izirkv22Q6J'
+        'YsnQRyx28CiN+3f7JSysabYyCHA5Ve1fldbK/UvmPZSiE9jO3WMrKEeh4nIxhhiy7sTU9tMf1JG9'
+        'HccmgANIYcwS8bwJ80HTAULuQqXGflPG2x7FWdwP7nRzDTK7ltZM1aUWB8jHCUDMCFmiHzvX5kYM'
+        'hN4abnIBTZ7LzD3Tt7DANEyfWTJ7nhIkWHAcKXHRrZ6UUKoA5mmEgg0QoEVtOgSSuWOLzC3I2z9X'
+        '+XMGrD3ohxXl709/2TaXA0V3iVm34KJ79PYWyhpbDIZfxmkKmTGDceLivYQf7rQcTkATCd1HjF89'
+        '/+v3eKaWOFcOpiy6zxskIW03poE2MljKgkHiseqRAQoRFT0HWyFQW40gToqLtq+pf6lO3XNeh2lP'
+        'VJw4DA4/t9wDoeF/BMCy9BKtAbyxazBWB6aoZmUMu1JoqIKOP2ZtNAGILh8AB4xboymAHrrFV5T4'
+        'CjsN2z7ZlBZXOpt9JW5nQA8v8J/nCDV7hQN6fjRaheXq+6cC6uT1RTdmFBn2C55dvzwX2MDhK8dy'
+        'Y+fgSOUnzY4CSwoGiy4nOi7jG/FecrD0nFMJttsiWkL5Cj+/iNc3vk2P+0uMQwPcSkJ1Fh7oXfcx'
+        'nQeV5hYPBO9ZEgQDxD+czrZTASotcQ/wmQx4ArKOy+L1jVpW9FeJuKUBxH/T6Gag290SAqpWR5V5'
+        '+2vvlo0Nudqieg4s/AkubGfdrE51IAEB1OYEgf60MEPn2DpthRXc0GkEHI/0LnzOnsGRZPIs6bDD'
+        'VWGFkJvMFbnvAnkdB4AYRcq4DiY8kKUx9pEi2JY9dhRktwp9akchDxsfSVOyfQ90tATOlQh2XmG+'
+        'Bs0aHr7GS+XLrBsLYMahymYtuiIfS36sl1FQ9Tk1woPRuE37ABoZ5QjJLUwVODW3S6Z65ALBSl2c'
+        'hwCsIitEjH0brPsQzQmO1RS/t/OyUmplSdjUQcPjCkgIDoyvCujycYNLwUms5WAtvZo4jqSk/6XT'
+        'ZCavp36u8PYqnta2WDzUQY7sHo5XMGDlwlL9665bb8iPkVi0sFom2UlZBQfEeG84Lpqo7ZdzApsr'
+        'm4sktXpcMXykAKDr9Jo3AEGgABvKn4e6QKCMIT62rVB9aUXjNjPzUCsH2X3mM3f35+POTzNGfL9T'
+        'OBNVEmPdqrUpmIigz/G/211Z0HsI063sRLRj9xQKXt/cMwD9d02LYcuveEbg759Ge+LcnOR5lcd+'
+        'hwuuKSvzj8xn6NXPkqhRPbSl0FkdY/dBeaYJIW3W411njUFz8OkkkYnTMj0zU05o8NrR5xuC18E+'
+        '+1ezCpFaDJi2i+Ht0ze/TydQNj+kIZoi0F0aNV9pML3NHRrzVqY2pRAaVjjCjwwCHtq8TDPqG7we'
+        'UxCbmsXIgIIRw6ZpWYzIJW16zQt+BjHMsG9kSbWSj2TwWv4FHBDHkF7g3l3A3Ibpm55SkcqntUnX'
+        '0vzpbXAbLofFqLVNQXX2KY5DzFq3OIgRwGEoNN9siMqZN970ZzTNtiZXR0ubDx5iVJGsCPBSXIXF'
+        'lfrCm/0Ont+HS0kzXdiuIr50mxniAz9Yl3wwAVef1AuLeDJD5JZpd0PZg7Yo2MDmhqeo+BILewiW'
+        'jzizcLFr4GUp8WT0LIwy+f5adyBbdtcE4oQTsqGtiWCzFgzOflIS7ferD+22Af9QKvgjTDbmx10H'
+        'Vyy4gFMWeDHIZEoakPV8a2VAa91QZutD7tKkf/M8wOgkBAV6mJX8KgF4IJvZ0Pq+/DTdGXcs8bq6'
+        'MJdALD0c65YKzIGhGeOaBLzPLzo5Ha0O5ED4S4XxudH2VWAEYZaOu5fqi7HFpOM575xz7QhxArnc'
+        'TMNLyXBs/7AwCOvwKjmwMnUS0xQcQZvdJC0MLLGr+S7d6xliX8Ri57VCQML7SRGyYP9XLbPC36pv'
+        'pX0noqBfCCaxASeFU1Rrf75ShZ1/ZFx2cipqiud5L3qsaWqvfjQnT1TQjxWkXahvASbFH70ylaLj'
+        '6jXd2Gg2IHHRucEpSbcIs/UUKbIalJ11oS8SD7uNndKyCB3p2zMEMpsVxDCeKVvc++c5cIPfq/1Y'
+        '2o5b7GxFtnOpcAnY8sCSTc5l2Zf9Uk33XWhcTAx8lVHHRkaaNB2aYUl1/JCK2JGgocUs4Z+ccE0v'
+        'wSoFqZhbDpe3dJSFQ+aOT6L9I6jyjWREs9EubXQ4lpkGg3Fy9BFJ+bO3IG7gnQeb9sRkmBgDE2ol'
+        '8USsRyKMolRpiSS3l5L32GYfrwPL1J29IUyGWvVivamRnLk9EsEuwJYeNYU1GN9enb3iHwLVRTQB'
+        'xcqN0MAdUysrJ9oJhlp/nx6QbHgyoKX98LD7LmE4TWLKn3UNoVrxlUnvg8URQ4YDfBPvgITVE2WE'
+        'KI9sfuZXYOQPcDv9RNh1ixx9FUUwpOd+0mQckcyyKuD7MHiD3lAKp7Qs4366Pt8pIrkwQs29Z2a5'
+        'i4nl2pw+PhXeg6eu6xRyi35XpOtlDMDFnfH89zEeDwYpAtuRodMI+9vRsJOERuREgOoSFLrblBCI'
+        'NvJljbn4VoNXHD3CTFQpGrmK5mJYVyI1Qr7d7YMI5R6DBnUkiuoAFMT9PgPZ3qm+f2MHh/ILsJyE'
+        'Tj/NCotbOK2eL7sCAYQlrHF29WR69W/cycenyyDxPIsgeBaF5VS4GG9c5Qnmh9Qd3JDKvXjpbz8a'
+        'Q+1n9QK/PSsyC+AGAKRg3jpL4Cke7ucuHhE7qi/RzPb3sowqP4ZozhfVfD1z/Q56s2kwTakIh+QI'
+        'HPVm5sBoqfO1DqldVHDvyImmxkfaO6TO6ODUJSPkYcG7EYFSV5HgUfzZSWBbGSJe+9xkYURVjisp'
+        'ckFvftPAkjCVm3zkJwMt3jXC+zR2qDQJfa0krToP9Cs4m/TbPEqPHFaBol4UFqwDKjFRHLqGZ4sE'
+        '1Prc1D6mXuY00vDfx9adLP40KWAYaffL1WwFtlrZPzSmDkcEGGxLSjYcdmpFKlpsUCMfHmq1gClg'
+        'qDNRrh3x4sZ2jTOmeTigfnDmGWxlfAK/JJfPfgBIojol23X5PXGVNSvoTP9YpfoJtlhrS47f3cfx'
+        'H4IFy3qKVFAKJMGUQWJHBzBxkN1TGmP1+m30Fkb0J1GXrbh1y0OQwODgUCAlVQudSgEA95+kJv8N'
+        'sxPo6Uc2OlAVhAPRZTtb6RKLWd7biXpQRYRt+W4fqwpyvYbcPO0N2PO6qvxJcH8TnKp8xDq97eMY'
+        'aT5zSgdMu9lcj1S/NdhPc1IlSTPwdiVjjSqGsGAQULgUM/juErHcEtOOH0nx3/fM/kXCtlRzIM3x'
+        'ty/508mIX1P6NE9JQgQBdJ12xw7CwZ1HES4Nz7x7OBufrSlVirRxtgZSkjIXAkSzF41WnU0gDR93'
+        'Fpc+Fvm6BDhPvRTRrp/t7dX5xhwTzFaeJBT1vPI/8kFezSJLYlgfBgymTW2UOqJtuomyXHpJZUwp'
+        'B89//L/mz6a+k+FYG6Ip46btQ+gACGDRnhPu/KdKAC/uEWWotUVD7BKLwBbvTTB0G6CvWcYsRvHh'
+        'kJUEAqVEvSgkbW12wCTeU8S28ir5epNjnm6DNEJFfNc9x3ZrZllmG4TpdFvKhbfwZeFopGaWf82S'
+        'LoYiqO2JK0LrTchwt062lq9apJPNmTWV0kAmn7YwBIbquRH4qn73U5fqvr2XdSHx8oIylMnRC1Ci'
+        's2pguZuuc1EIK/R0K4J6wgF96DgjLnMs7dwLB+UfopwBsTbNqRrXxqwxaphTYZth0xMigFjXqgNg'
+        'Pqul+/wBbErsdicF0t79snyvPMJhnXazU/V5LpQiZI5Z7VeH5XAIULPkvb2fI76Hh4ZsI3r6GkK1'
+        '3HMpZeAYDwFFF+Nl2IZioSUTfyF9RCYjzvRelFc/RrfoolR9YPxN6ok5HKEBsKqXZteY3gQn7oYT'
+        'OSwoLr2r/00bnAdpoyokoFNuhXVe5dNNLunQ9nqHqoAwYTrMZqIAKBJD2O5IR7yWH8OiAYuBDmKK'
+        '21vmNogW660o6rYQmMWw2Nnn1UgkpaUBGDn8db50/cJGtsKtIlNxLe07zvYbKAt8ewGLa3KyrrEv'
+        '6AZ8RsSz01Qw7wXri5+uEc7Ye23UySzVIItNQrrHmb0sU1AoPy/eq0WXjbNXBPz6dCBOpu0lNf95'
+        'uQZPH7Z6iG9o4YrzvZ6hzEVrOVU5Q588rRf9DZKe0DFYYJZWDc0x1rgMmkjYq5gwA4l9FFmA2V5g'
+        'ITrUwK7Ph1BvPYvqJTfVzfub/STROgJydyAfF9EXMiLheNGERSUs5he8dT45m1gCHomK/GTM+Yc7'
+        'fURGKMdk3yc24wYb/4wtS3JhD2436rKoJPvzbjS95Y4ybUN0/IEVRwBx5GHdtjNQnOftRYu/msVh'
+        'gXgXQliVxwaNVZXfji9rjtjmjDvkMQN7LK+gRe8/ATV1JPQKVWk53jI6YRJE8c00vQVhMPYIzt9g'
+        'SdR3Of6UAZZ/+PiFUDnRCdjVwb2hLS9OfmWpA86IL2PQmY9nQZNP+H9fxCFr75nZ9lCmNDFCfIm+'
+        'WGHb4e7KCgpndaCZEfBex05pxjm10Z66Cm++FkiyzriebZhZb4kT2mcUVNHGksV6rArmTMrnXDfb'
+        'Y/wCJGyxJSL1NHsZy0lkH3CIS/xvH1pbqhpsevQ/z1lpf2fnsIkTJYGTQneGG21Fe9ZAYZthM3ar'
+        'fkehABnVr5KIHgUcufn3UHIeXLZHjSQgiVtOCrFbxHpSEe0WnWPJq5dbsic5ZKuB3Tb0OBFZohJ2'
+        'k5P0YT8O1kvPtZ6wZA/wDQGMEXQunDu+aejxk7Uj9GUrDkyi8dbt7a6kYkSGDWVEd48jiJS8ZM8N'
+        'xDHXYZNMjXEnDIPiBhcDYgz1b0VmKY9zs8lZXzegX6Guk+cWyOWgyzkLNlRYbP5OHAxLMMZANC/0'
+        'scip+FkcXyArCRkOCYYpffKLY4jELTsXj22gFq2hGyhG50jVO2KH/QgcvzWWuBSIbVoN1D4IV+G2'
+        'MAbM5QnkPL9diRrtGUpAfDpbNGeyQljcCGEuPovuy0oAjqLcPaeNIUXKkeH3bzlue9q3qb5bZESm'
+        'lvzZJrT4EcVNF/RiBj50CO8raA79qWi4ZOjvu3WlBpTnDPSoeEU7t7rwraCo4AzRR+uj+lxoaXQv'
+        'FBUbE3rs4xi/9dTvqi0sI1PxFq/umPtz3gPjAldb0S0+7jDcdVFGSLB9N495JQqb39vXN4C6dzNu'
+        'FE+iAZwC7bk1y38Q3tzeAQPoOLzmb/UCtmuUtiTwEFTn/WNkOWBXF9Y8KUvhHn/boIsPVXRnnzWA'
+        'tP7epQezri1mwQCCiCvGtf9tnZEUJ+qvESatOtAgZfRCbYlEkP0kO7OHSGDZcpuj0ma8rswYrJog'
+        'JoVqFgoEH53As4snExB2m5j3EjMOncsJxa+/wSGXOkJdFWH2YuFeAT4I00B919laIk8j6ZLXNI/A'
+        'E7RBih7zTE2RCBaOCBX3SQVNWU828Qw2i2qZdkPS5Bc4O7CeoYAUhqu7FHe7PLddmj8FgfhlNnNr'
+        'lsAXzxil1ZwhyHTHTRzhSemm3OW+75h9Qj5+r7LX0Qb7t4BTFBU8oTJsACzt5Bg8qxO1hv836ouF'
+        'NAJXU7xkb7ADR9wJM0wTYQtUBD5m/Lo3t6i68XFYYpz6R2o/tQBDjmyc9FWaHFCaS8oad4OFZ0bM'
+        'dgat1UPzMAxpETSh3ccP45p7zDazvx+aHwRKALbTaaN1xxcGXFNzpDe0cFR9UCSZqkUGToHf2GLj'
+        '8hJw2mHogpTPDhOisSEH2oGCiYcDRbRfVurEA1HjzxR2jnwJyWWRRPR7MHRexZFWGj4wl6qPYVJS'
+        'jDefoPbnnhP912Z97DrZiV2t9lKxnDRSl1bInKw5Pa9k6jJVzRObzt6RGt0v9EuZi+97GU57H9jV'
+        '16JSYYuYfVNEk8+4HnaFMoaXCZGR9a+Mjynom1a6lV8FYCgetj8m6eZxERkkQ0Bhmf01iaj52AAB'
+        'Zt0BY19WG7D4DonqDDrL1/E+RVkaRFVXYIyGFI6FnBl+Me/nQhvK/GTVOhjUzeD8MnvJBYiyx65N'
+        '3pl3Bf4gCw+XC8kfp5PHz1u7uik82P74DD66JvX7yASPqy3Cs6cyzSeChKdDgOtXYBEwGQfNWYB+'
+        'fc1aBxBV7K+3kvTubYIsUquPwmUiwgUIQh/k0/RDr0SFCbBlmCDTZE41eZQX8vnweR27cAMuE5YY'
+        'LOe9i/4uGeu6WRNfRmKDfeT8DXc46dbc8TaI31FjM9ifSR4wszJhxTHGvfnBohotkbot2Za4AjNp'
+        'E8APowzJiefCdCWA+pnm2YcIy3mFlJEA2V/so7lWdDi9Ei526XRAhPTq+CVxWDJJi4W/++65RqGq'
+        'PVpQFHnH/ZMByLl2CRREbjrlla80kdkKlBfEysonolyvZXEwMMLl9pEIxZEYSyXpEHd6KbszzLwb'
+        'dDwbLMhUFQeMoASIT4vj0iAhqZuLSSGpH8+VHnDw52B0MWkeMf/d4RVzm1pHlXdL+BZNBvsQasXK'
+        'yfOoNZcFU6StuE+RDbhs3hdvS1o2Tc5BgrrsCGK5hJvmRJVzGtiZrwkgcwSJOBgxScrCpOd2Rbdk'
+        'f5/gqmgU3jOFnRVWp8gnRVWiVCJDxNGJrrJhdksKtx3TtusIbSZCmXTbvItTTfLnXKGTDSlnn7yC'
+        'o99kotKjgSDYyFi24uzQqHRJlw1yvpYP+0Gkz3xLEOf5ECwa18decvgNngod6ifBTK/j9sAUwhpj'
+        'jJivGgwknhmHDAALNETPR9sXVgGxc4zNK8vNShyVcxECVSQnAmRXtbZJg48VQZFyURZbvfq6Nqed'
+        'aLbxAwbVJEKFrO9xNCBJ4jH3i60u6wOh2pYGIAeauaRcyGxUXPmQuqaVyU+VfhMwdiWlFix4eV6z'
+        'hXmSSKimbnuW9yFkcqfsD+7GjEGxyFzjfQsGwZvmrt5muuK7KhMw0UUa//W51bGW1ObhORVdX4iz'
+        'z3DVi/ijE41LGmDsIm2rmVC7DHplXGWrD/x2syH933Lsj+KKCtUD8SFWiSLzPZjPs1h6ZRFxZSjm'
+        '9CY0iLcsc91fqr/c/AkGhADrmYdTp3OY4RNzPobF1WILXkg06xXhDszl5GJHPBx8ENj12kc/cdMP'
+        'eusqoqPqh1UpEBxnirj7cypyY0d7EcL/iBeX4+A/MH5W3CEBv/QPm887kkOhQrNdFPFYcfTky3J0'
+        'Cj1xvIzRrsTpcqJGm3DweXylx8Do2UO+GtjvwIwxh+eEiVRluh1SA9oLhjvHThgxJTOLFgEV0ddF'
+        '9W+s2MQhRy9K8MmX9dr9hY/7Dy8U/GRRFL3rZToQ55YaMm8qO9jWumlRvQkFfi357SHxcseXtHG4'
+        'xDBYneKKMUMLJhHKnoxTf8TZiKmx1QKFmNAiWahsWnN5sdgNGQqPF6GCAUBS3ZAcxyI+3fsRM5Pv'
+        'LFqyt/UKAJlCQ5yQrWrU5FCWbwZAi0bjntbCUvvM2Qp3DbGwTcTRx2tJNHRXIoUJ1wjJU7EYeVcP'
+        '1O9H3p094ylW4WSROynGfQacRzZBKTWQyigg3M38/avlPYbk7Q1y4frv66KuIl296EG1zj6xwPU2'
+        '8nCGhezikv7RyfBDH1Ath5pm/voArPjjtivFDvWl/4e98DZ4QBXwmIgzF1yC9/sNyUEysN6Zc04B'
+        'H9fQArW5fRVgdUcfpZ6fmt/jPtyrh0FVkoGxFgO5vbqyEtc/uincUtWfT2R+A3GQXWTBB9ha9HJe'
+        'JJdLU532aUIIohlM131QnJ3k+DdX2Lv2E/wMff09GFu6nGSdEtTZr6tZ3F5uWfO+MpAScSKYur/3'
+        'GINv3ImF2genwJFGOhj2qdKEgG/llRW+qgalv1z+gDxAPydLbDxezwv+80GipLDaS9rc57gAAXwQ'
+        'HmRgaqHO3PoB4H7FFsEXer8RR/mSrji5+if7EhBdSvgJBi+aONk1ZAIMHmS/RTBBA4p3f4zrbf5c'
+        'ASc6EA/2l19hzL0V1025ycxeByQSv3rQmV7zJlU3Qq5inFjL+UFliSeSX8+59NYUd7F+GdoC6a0p'
+        'VPNvvPNfB3SsYHUELnuCuT1PpB8PdxXWV77dlGMC7D3ooFHbOadPwP5vy9m5P7xn9DEQYNwvPv71'
+        'yWr3MCiczmtuI8BxQLxSpSHyL/z8oB9dRsR/+Y3dHOSzIgIHDcMRHSPxgORA8Cu/UXOoMY1UIexn'
+        '9cJFQ/Clt5TrdjVibUvYNS8AV3fBzbcTJiLsLDS7g8Xl9fNd/WUnZY8UbYXfjv0dCEAp1UMh9zhu'
+        'jpeZ5HL2Y8I4fF/RquqMUMWisoH4BIM4uzPwC6CVflRTpeqbVF8Nwymwm+FeZFE8HVNtucmbffjC'
+        'tBYXDws04x2lsNtnnfTPbv6oXHrejbr3xknrR9ylnHkUQQd5IUMLeQOdMAwY60okHVzj6/WwvJYU'
+        'ZAfkMCwj0GDmOChmgNV/xnYhkRQSp1eJeuk+ZNb9dZe0raHwEBMeqDzdxYHip8C6VComNBK+lOAU'
+        'oC0HApXtlVkK9Xa5PvH1P3kV5LqODvOl87qHbBrRDNzIHF0ZVZfraAzkOPLF4fWmW+uEpPTmCtNO'
+        'kYg0u3Fn1jc78wV+ObFetWYUO4M3slrkcxyaja02g/5CbkwCJhQq4xu06NZCdOfpG0SgZciCfYMF'
+        'r8nKUCSB4YEGUYj/n4n/JXUR7LWVOK1kFEgUfszHrx9i8zjR/5Jrcu4tXvYzRbWnXYuMLbbbNC13'
+        'BhR9d8ZrzN0hiPH1xYxvIDflBq8APbs4M/8Ibccio9BhdbsR9j/qXmz7E/6xX/Ri8GIT1MgconZx'
+        'k3hCU4cgenbsHPuFM4OTbPla0KCqq61RHBu6CDFSSpartu3+gvqBtumZYfR+ufZ01xr5kT7VIKpk'
+        'tM7oQAoTegapeThE4x9Iz13W6vIuqKM8CVKyznMR093203JJsPq4AVLfYIwzkWj+GpRS/9uJwMCq'
+        'glCmIQlQSRI/YJtsKLsO0wxkoAaH7tD3fbAB/xVyhE1HnTiQAokuCbt8PVsB8Q0F5aT6dFnmr35i'
+        'AkzTltLaTTBustEp1M8d6CiaITYIQySbUkqzJhdTb0W3E98nMQuaLqbW+iWo6cWDxvw/BKLS1A7K'
+        '/bdp9kppljcp+FtzRtjvs/WT0mU5NiTfnN++S/gSdx5YJDjo3c8EPK+lZq0PJwfnJIpooAcaufKa'
+        'gXRVnkiFK/lWudTK44bU6kWsVYDp7xNwscwNWfz5l7Qf/JAo26yMEcB8JzdMw2SUvboRHOQbpdHY'
+        'm7fvWFrop6JVOr/MVrV/1W+6eSsTEL8n9PlivxObP8Uvm1xC3WAd9QAaql1jFz5PqWXkoTNMfrYc'
+        '4+mmM8vAuH8senfMjdeyQULUoS1jwnYBFmzMJUv8KYpQZD063o5yun+sPv4Nb6s+rMGKP0s6Xc+9'
+        'C7IEzIX03rqdHJBq4sZrAVSbjSGknit9krk64QNswEsEAbDcvRlF+uO4jJpsSaEsfvxK3ngz5Zku'
+        'wjtuVVqTTMAYuw85EngaS4p7CF/keKOejj+XwsWSbj/tEd0ZkI4NWZsM3hsf9zTPNKNI8vR+LtuC'
+        'gS9VznhNoz8O77N7BPdmm+UBbGmVBXalQxFp2HSYuyaj2lRa4MOgKtP7/WwtJAkDOP8kMSZXm4WS'
+        '16A4FlBzJxhfak9zYdxEd5C/4jFGz6IFiFCPEs1eF6N3DzZcd1yb0jsMZ4ZwNu36iw+atYCK+r/C'
+        'hZNsUN/FR67/WvD9U53Np9ZwHrB7rFq2fxo7QkFEtdHb0WYWLinueueuHQKIPnzKyvenThC7ORwO'
+        'UCtakEr7CCm4KqY+AQDZPgojcQAUtrGxFwOFyAm7wcsY+/RyAXsWYjnsdx2c5a1uTGHnnMNm6rZS'
+        'RIyHO7NsSrJk8Wd1hXpINGRbFFEwpwOc7bBbJtAnjikKo0id0wkBqUBMVViWbnpAUv8GR8da/s9X'
+        'J/3knn0yQ31erevrLFyf27JESUb9uOSfL49VlF+4srgK2QuTUdNkcKnaUQwf32RLAxTEA4PiwjJt'
+        'RbqQqHP6EoiBRU1MO68JWMkHySB33tVP2VmGfIDB3Sb+5ZPbhbn145x3H1ZornG69WUDVnLh5x/J'
+        'diJatqzpDU5mOpnqlpD1yjCUMfOiNdidNu8N0GNTWmkrRRGh6KpoZGOxehavU+I5qmJ4W1y7pL7Z'
+        'oTD1BvLmCXrzfcbS/M16tXDFS0FkPvDKIRWEHTyEgP2PWmYaqgV5nEdQ4U7UOiv7x5fQRxJ4w+0z'
+        '/r45rhMPAeE67IeFO+HXUMRmX6rbcuG9s4SI6b5z3KNyHdpfP66LfDuazQKJKoOX0StmD7d5Uzk4'
+        'AdHlsu27S1ksgtZnDfd5phsDu2pJh7GbnnaV+2d7DDZHWRnDzznNlWUAOAuCKj0sJwyNyd3c78vg'
+        'TN/ewgnTKFkGpDTDwN3SuBuvOuqays20VUxlHwnpsEPIoO/3/v2DevGfq0XNFhcEvk5EhfCvt09O'
+        'RzwnXQmrO9iQYm7Jm8EmL8BF+ER4wp96up6iOzjSZn4P39+nzf7GGu3VhYwHJuxuqqAafK/cvySm'
+        'ZW4y0kMQAUlB7No2H2nzLjHrZOnjf2rtWspcWw+UzBagSmtYs9fGLR120xTHeL9ylplOzmBpkjiO'
+        'Uss9jKbE2flvYmdDp2J2m+T065oQw3SruLgIq1hykTZwfuKLF7XVQR9W/2yj0uUqqqjZA1yQGS3h'
+        '/ztiuOY+MzjrxqJG3bMQyjsrWqq6lpohwPgmo9wzfDEA5IyDROQvLnSE7RwfYDWdf57j+vnWdAAV'
+        'f4LRG0rnGVfVV7OPuV1DpQKWok5bWnLqtlyVXeAsf2ybx/jvG4a2NKkyfNoxKtF8/75N3Ugw5AZ2'
+        'bZM9l3FNEETNaDgWP7DGqs2XIoO4bmV826wYxAc67l1D7ttPo5yTVh3jPl4cemJ/qPyagGqoninK'
+        'clTihVvbCssDkXPhGoRXRMUikJwb1y/VBfggsnZm878bmWgThZ8jzBbYLhNhyj7nxpR8DTBoreR4'
+        'aoM4dj/BriKUIZh4V1IQPvQYEBz0rTY/fo4MI/SOZdJebQ9SL/wLPk9b7fSiVawvaMqM7EJlLkMb'
+        '+bZOvhacT+QdBMo6tlGuNVuYZ6eL0GomvV1Dj2YBP7T1VmFrBTKIqvQgJo8dp4sx1xJJ4Mkftyel'
+        'vGTYHvUxd8StsffJOUWA2zI8Ao76hL0/KeW5cNu3WJBXM27keXwsjqe93P8O4/hk2w/2UPBj+95y'
+        'uievrZ/N/Mb0b+pWesX3Vabow0ACU+XDxxdjNKHUh74aVm8Kc90vt8NmUVPuO4/+M32AobyQUwe3'
+        'fYt1fItTiIqQOA1a+diU6Ss4HRVBcApKY2mNiMrknj6dBpTdXUq2Nrl23i0W5LFbNIFt6wDj8uV8'
+        'UhIdWC1l/XOp/6N8XWcL7CJw2EYRSckyqccE/NYDn67FqxDEbJ/dBZZ4IEcNaxNdJ36de2UkPy6P'
+        'sviF5+eSY1Znljv6NXDFMbcN4yjiPAUYVAsjIv6iQE90QpFhtT8b7/SjAuVtDkJ8UwkZ58pIv9lB'
+        'WgI5927dvUlJh/TuWZWjwGsM+GFLan8qthD1XQWgVqhfMcnMj6MmnOqsOuVHaePbC14Au4yaw4tQ'
+        'ZR5kUvu3oldCSaWZtt9fp3+4uApBuiahjttBXWnT5kYUmYOgfPv6TdRBhWOCfvEmm1itcbctbsab'
+        '6sihDAEb+iTDccNgzD32WUm+r1DM4GY3q8dFaOsBXOW2asLcE6TRBKsAJDcS5x5yO9lwvVVKVqzA'
+        '5tj8cG6Azep0KU3IcB33A2di/kK30Abvm3lp67dXcVq4Qw6eBeetiRDJogWDyMIqNZd8MZjzFVII'
+        'fIgIFDnlgRuuRCkNhGr6oPdY56ZkDjcIGM4Nyi9CkBmHS26UNmwbx84ApbV/PtgjJtUiDdmyMCKM'
+        'EMdgz7JV/gkRdBt5cAtShpc3k9KDqJ2DCepWYf1EHBVnhPVCP+5wyKX7NbFCXEAfX5AqKAsuUais'
+        'p62heZ/9ZRQYcixd2ZUwPea+9SAOTgzKv+h2jeKIzjZMggw4ejI1qQXP+cjBdL7eGXXlMYMbT1LL'
+        'v0yDzXJXU34U4/8nmeMJdv4MjTTxp9rmhKvRp46V3edmZ/9GSYzmQoO2s7brW1fx1yB6CkYWYWki'
+        'E55582M/m4deodjdeA2KqSDhOB0VsLn9LwvIF7aMlsLRberKwM1ahtDeogFMUS/lPsSTtHHI7aHC'
+        '+6faTiBu8pYeQ7yRm4y4kuKyiyBdL9+uiMPbEuvl+KEyn/VBfySwlBuXjlzlWp9OS+WZU8zy5oTs'
+        'zQR4Nl9nClJKibSIDVKUx6eikS0doemWMlS78L/J//aHuULHx99JLXuY4B4JExdEhRhOSbcYTAjR'
+        'mHxgrdmHiv9dC1lRSC95Gw7TFcNLtVvCH6VyGEH6KZdAif+kLEQItEqzjoJaJkp/1AIP5J2THmeq'
+        'jALDDCPAOI8zO2PnSQhI5Yq0HpT8eG7lVP3dxJOxbCmI3izjDGNSETx3s6TgBp1mHkslEXtnDmFa'
+        'WX9Aq6G3nL3G3l/lzpeo+5Bj1twaGpMw3V+5Eu/T6QhH/8M4rF5vut33IkcNpHnbfn/m/XlCjLML'
+        'hAXV6mjvhsMciXXuN+wR2YbrU/8L+3neFN0DI9g53S24mYU+XUv+udLVd1e16t7U/FjgEnrUJ8iz'
+        'B5l6MmUBcxeiniGZTI4W9m/gCQdkFxDwm1WkwNbfhiSiaDRhhBmVl09FgoW4CPbM5gZBgwOWO5eK'
+        'sGkDnOP6vUS/hDjSP38xBFCql+wYBBoTaPIZ0faAOTJ/JaoceYouW7ZzzW+aqpJGzpbtG/autTFk'
+        'ssXvyT1i+7iibU2/0YV3fk0BWNFR16Uzk2I7EzybGHY63+FCCAwkApQt1M+NlWu3NE1LC6SMaNzo'
+        'p+upweB9Fhz/xMaRu9eAPVZny6nZZJkzSDYtQ+Uz1c2W1ynlCt8sHmxftewrYQkAxB7BnlUjPnac'
+        'tjSv1bhIjPduA5dOSdTPH1q3wnjcOVmcnclknfE48spnBvSDdJCWqeUCJmgp6PqpMap7JB4oDaOq'
+        '3KQ6Y5f1QB4WeC7EZzKwh3b1aV/xkAPaItSRUXhCK8xaUVzAh7Zt3WeieKaTzODr5Wd4YMGoyA7Y'
+        'iChssrPxq49KOza1C81ILG048qzupVyi1qgRvDABryR3NZQ/UZO88iI4GztWK61X8ESE0PE4e9Aa'
+        'Y7zOAA927TtUnXTUcLf/1Zb/9N+GYniACJnDFsIBpWol8WwGBso1e3rnkubwfgNFsIuAdoPTuDnM'
+        'ipaNSuFF6FN5zcxUIYwmSA260DmnNAR2qVTI7WD+MqVvP9dUIcLcH+VuTS1E0A4/IXVE6/ucz0eA'
+        '0l2Wo0tECqdZEz73vXAvz+/G0Qa0FdzwpdB16cZZ2///QgVgr8MpLfnNF6cChQvi5nMCfk+iPlsj'
+        'cQlvB0SuCfBT6gRonbO3h5bf+BJQACceFsvh4honPwl0zVZXOG0grwaq08vu+2QdILNlV6B2IsSe'
+        'yNmJhVNUrZ2Zv8mWfiFPRYtARR7HUOvGaeIhdHs+0dhPUZ1f234wjlgu2gsNyZqANOlS5Jm3cAbV'
+        'W7W6XHCjeRQNAtRgaErwWIef+ZSB6T8cSwpr1/48NXmMcFCzh2UtUXFeD8sDpAJFlF5Nw4TNr+kV'
+        'BAFgrSjPdtMmQtjldrHN+WDGGdMV+LBS6T8p4NityH0iVgRG2ggtjsHZZDNSUkOxr5gvqJgwUIei'
+        'wmY/KO7m0fOSZLDqb65X4fng+wIZhFK2OC3laAZX6o0fXO8BefoJjsnMshMvHIAlFyPSskemk1th'
+        'kTKYUK5NNmbNAN8owRFZUmh0svpLwGbLqdbmHsmqBThczO6RwwgDPGNgwvf4PDiSz5jZIAXtfxTl'
+        'VSzfNA4w/iyNNI9dzuqj+y6ZX1M2lFAHYxxFWMxiRAWKvn03Si7kyqKK6qfcL4KqRuFdlCykvRnl'
+        'cgw0CC4Zo3Q8ipVx/OTa5ZcsMBb7TxnmH5h4/EZi0FGoC7DjiDrRU+M5wayyjAeP5aNB/ibtUvmr'
+        'mXcvYvR6GM13/L36T4Hlmku6vkNqyOrnt408CPL0hGA540hkMoC60InGdfmSfPotPYpGdh3qIO5S'
+        'XJZ9/qP6VRNn6gSXEA9Cv67qr7XwLL+Xl6XYAujJoCqGEd5jTlvgT8YI4AyQcowUC9SuwhhlRpN4'
+        'WnSYId2mMUy4VFVeLgaIvTlWl2gbqEUPoC9eorgELrmTGR/DiF1HJvdS9ZEVXxv84CwCRowCkrPP'
+        'tNnvFdT2/xnr7HvCgxUkD2fKyKnLNSC/bGLxW380IO/4upkZAMg8XJodbuNCZ03O2Pt8CwstLiAt'
+        'JMJebcDf3+ZHJGhYzu17ByGKAFvZ29Dwxi13W5janyVK2OT8rjugny85Ph+ORyrciBhj8k+eh+pW'
+        '7T0cRqt3Zzu4U8KNk2FkrcP9spgAZCC9fWspVka/rpLD+xWVzpml/YDFsgdMdzQ0o0TxE+1k5pCp'
+        '8+5u5gUhzaNri8qXyuWj9A352c6LwfgQzhJDWn6DNouLBhs2L0wcZPl3ZTgbwXKt/7rp/5JAPn0N'
+        'jek8JoCMj5EZXVFvEeUH1vDCparN9hJJLQ/WA1n30ocPH9WUi5EUsTMuZeorI//wk0xHHHmM0luy'
+        'pyVKHdYRcEu5yguSlu2uvWRKeqg7rd/CXEtvi2xpLmUQFbW6wmBxFD0ybbrXeKUjuyAtx7ALObpo'
+        'BHiNtXSiRoyeankSDWGgG0KlyU31+Fa9qGUqtpx7e710MS0Cn6NIgFGe9q/zGREXqQacWTMERS+o'
+        '5VXD2b9E0aEx8H3/3EVslGNfln24/pbSnltBgEm1UqVENjd7xjqMKDgbNopdt0+omYAdzYvGZAZX'
+        'K6lU7I6IW2FiCXDJ/VlZ15j2vjzt9P3QHCs1hNPwEDvcqAnOK7AjAE2jz1m3rifKp5n95B84hXI2'
+        'WfsQl4bhIJxuUVuPRJmogCnIEhJ+TNdL8bnIUXyV//DHaNos9LZGYPmIFW3WCxHEGEtt6Ubb66Lo'
+        'oGxBJZFJPUxDx498CG4sNKbwTP/bNNvyx7F/ASt2lCkXpGCJlSw3XXzMRB1JeEKTZuREyA+mKQTJ'
+        'y1njsh3Spa/+YDS1hFue2+rzjzbU61kDmwqoZm5fIjjFc/JjJLcRb/ZwkFXG6HQS8ZaddZMKqghh'
+        'FaKOvEjNhi/SivL9mw2l45tlEMHsKzea4R4+7mDaCM1EOW6GnC6/YYqbrwKH+gOYnzKBJwjomR5K'
+        'HPCzXpDS1RFGjGBFW0IkiSjYWbkn3AFd/VyL2Qg+hmkFjUGkV3mMs6vMIhSeA4jT4BB9ijJgomeb'
+        'eskmg8cJDuQXJ3nnP/GicYn+268Jj4utHk87RBEWvHrgFfAdKuCqsUPUdgW1VL8hcgnVV3LGGuRu'
+        'UCel9tLu64viFinz7N8C6O45h/f65hG6/8+RS7uKonnwTBaX1XVCImed3nIb781ySd5LPUT1P2KT'
+        'b6JsEvZ7DRC622wth4bl6gkNkXAXjZlEye63v7XslT9d34TdQYS2qLgCcah+MhUVQpN3F6b7MdP7'
+        'zC/RZSe4ddFfiHyQBXJnWh294SxnJtGeKIUIKS8ebFSM9W+9O7gPb/b6gHYQo2tJiSVvz0NQpIwk'
+        '5X2UsOdRZx9O9i3rRS/owgmAPIhVRrkvXTTXB+QfE/SANU0Fb2PMWGcvkPGhA4I9jYpPN+wUqHDm'
+        'Hkh+MRMZtRvcbSVHyw2dlkKSdP2jHTzLooEEr/T95gleCuhKVzL08oezRKR5ghNTOP8fkbDH7gSO'
+        '30VsFVJBaanmlQM/DpcBVfnP4ZfY3P4ex3cjrJ6iSPFYshjcXTHBgNaYeWFDHE9GHtHhgJf5cxYF'
+        'S2Qh28cHJSLq6jjlsD9ggSQhF0KnuFoHRCitU8r2GxZtbeurBIKYf3hoXhWeunItVr0oXsSsgyB8'
+        'SwH86POMqDyJhnHj4nwpZCCsVtwpHRV0Etjf9E0Es6D7GZ8uM0Rp5bIWqLJ3A6kU9QnOyW+1xE+i'
+        'uQ37xF8HYZchoT+Fk8u8wXPcjNgl3eJjUcQ6y3eRcIxr5rrIjzghavO1F2ALm2o1z/8M43GYt8ku'
+        'XK9Y3rKdNDsT+XuQbZu7rqSgL5FtRVMoili9di1tSFcHd0mN130vGFIhWcbg7554UHVozU/UTzu9'
+        'XnpKwebfWki6QrtGjmV+UZGaxtCyEmgbYIJLeq7hHbYZlR9yYhF3xXQnb9Z6dpGI0ypBQQxoLdgb'
+        'MvksAE6VV/Zlp73LU/BP7WIvFitajpjufu4WAUZX570V04epkyx686q5wKqOo2Vg55TD1HmkIevs'
+        '37W8L8eogK9pHFwBmgGNhNlhyy+d/3AxPuJ2nqzbOX/WTf1X3Ny+6HQ5A8Et21XFaz1k8laN9jrq'
+        'hhP2tyjf+lNUz4okDJCG3ZSTRu2fqd0NMXHbAlydCbjQ/gODQx04+OaTDvWpmPrfHsZ3cqqmybcu'
+        'G083n7mezMviVS38qckkdAQ2N+C74tvGRLPM/s6BLNtvFiLZYFhHAXI5b+SOBdM7OtNdK8xNBES9'
+        'C/0EL5I9gup9qSTgfoJRtUjpcjzIt7AfTX1wjq/izUwalrcCzX2JCw9lrS+Ae2PjFLrEobTpLb7w'
+        'D/UaumBVezqiJArLPAJFC4O+1QGqSH4irAqNiFP9KIrjXnemyUX3xBHHrINkWkZaOnzlbM62vHze'
+        'tqpGF7LUY0JyPED2VXp6z8Rrr6mTNIZysGUPiOJR4fLN5mIzWLxBkZv7vNsgWmXIRPjGV4yLEvSZ'
+        '4dCzyBcVQ1uy41Wr6QTUO8C4HdHoqZRqVAWI51BzgFOxrTT75HgGJjUZCjrmzX5joQ+70J/ET8PH'
+        'cW67UZtUihuPsuLOKQGFgP+bEhpTloGKdc2C6Li70sTrD/2ataB02nZEUCMlf0sGT8L3oeuyBORs'
+        'Ny7pfUwwWaw3j/tj1SNr73Mg+2Q1ytjt4VEA2jVDo2w6EOITawOr276OHwYiRewwZYaJS+zMr0hi'
+        'LqITASrNhsIR7MbkYg3pZQzhSsxMGnLG8no0wo4Uxhy8COlWcvXRI9hMCYf6csgRezoypRsqUhGz'
+        'FM5bCwqikGLJEnz72oiW7D28wV+csYKVvVjtRktoM36EF4hOtVxKvC4qmMHN92cK2N9tQjs3hBHG'
+        'XdbZYimAW0LphMQQKslgvCv6WgT/oPpotazfgx3dFvix//eMH4Pf6w8NjZbdYz0oZE+w/MpgTB2m'
+        'K5ASf8/6qo/k27xsXtBakmhNDa8HV3FvHH0fWhFYvQBCRp9OFXGzLG3GLWh3V2TyLpwNu1Yabyww'
+        'bne6m/m3bhYpD7D44dm5gxrveglHNNefg/je+K7oiwSaptNM6PyiYGRqu+ahU7RrnRlGGWU21RRI'
+        'rlgW4fyZzWx+duINestKHTzp3P504048G7eeZ/4yGiSZwiteiF9//CBgcsHcfxhDY93pZSpA0DRZ'
+        'tDKnfBdnuNkAxPmnJ4CrEjg8jE+YYgWqYGcXsUginu/p44hzwOmFgAts8OwCYhtuEIGzUQR7nT3W'
+        '1fUAHk0jjZPnuMy0D/g6lTTbq8w55ueZ5htiY7SyE1wkkBub/7MUxfG4PsxcbbbS3MGU27VrF+Gb'
+        'Go8eZkCNsabU99uYCNPZisr0QcqFGSh0cz3qtL1vLaVn6rxWVqTmdyMAWFKxX7ONNh2ZQgLMF9sf'
+        'acSyIcDmxwh/yhFGT6G/DzYR6fVa+RjE3y5XVv3koLLGRU2cQxlBCND8qsmEpPTeWvvj5kCSb0xJ'
+        'NiKOP1KrUV7QxscKJs/PUbsB9V0SQNZ0go5POlQCJFWGALj6EvRYQarjd5L3S9LJiIdBNSvGn5Ai'
+        'jphCdj5KX9ynHTByGHUcCt/oERtAUoQxzvlPd4D5tVfdjiwAq138iG7cWOQ8pdJ2PfD+HEAp4BQ3'
+        'GIVhrttB0aBktFRcsHRfFv6yjbybFi7R+k0JgFAv2hVDWNjyevTVqlIiuq5wSuMEqlaaezRe96Hw'
+        '4mwmEg/X5hBJc0AptjOsuMCaerWVhDHxMMrhxymnd1fzcnqe48qMTSqm5LuajXfzcOyj+NU0M4EC'
+        'ZuLL1eYs7k4sXnE83e0cp5cZFlXr9bE4I2yHfhQoiwk7vPnAVsMVpzcGvalfT5sAXpzHOWz3pKe6'
+        'Lrdixo0/0EfkOvPBVQK6uFgGHO8DEwthXAeQf3kfwHPztKAsKI1x3UQWOjmMopI08q2AkkjWuO99'
+        'dXTMpRE8IjDi9ve6+jcGog4xxcnUyt3MS5xHU9Ew4AsTY2JUh7kvvL+TAaVZ4ZPpPfKhFae7Zz+B'
+        '/PBS/SwAn0Bv3/wLEJ85MMNrvqX9gsaPLYSroOM25xEY6kaMpM+tc0xJ6sRAfXTSnFgyfcvhHhbQ'
+        '6AVYDIsBxgROP7LhQuHnw3RWhZM/FP72d/12e2vF2Dii5LU0O9z1Ji4t+y87NzTES/aKZXYYJDqW'
+        'fb/E7nTTt4W/53WZs6JwRJ2K7m0nicFfYAybGKlCKK5bOXw6U8nesjSSnbzm2Lq1G2Q67OAomcZq'
+        '3fOzinuhyuEXH4+6WtwtCtrFElbHeq1FM3CdyRBmNaCdxY64dzYXRKqLaDHMHyKJ5bQ+788XuK/7'
+        '518UPqMjlcfKrC9BZDYkJQJnevYit6j9Y8e0DOlHyBZY3ZdeAADMj4FczFdnUKE++qJFS5KL4Vn+'
+        'D26N/N25A4n1i9CZO93aAleYoiQtbUW5KOlQn+gJy/xUE9KtFQblvJPwTQZh5YAacRICjHjRoZUJ'
+        'R53mjrk5dZokNZK1EuawAV3ErCWQluAvydQ59fTXVpEj6/EaxLCySUiqq4X0oU5y0/8Z+cAknyf6'
+        '0tsPzjkk6NPlD+F3hxKBiUEj74JD6rHQ8aJ7shE4Coj52sQDxwTZnTujOwXSoPlPwFnbJA24eeKM'
+        'urbKuRpzMzCj2USF0PrP/R2KldGT8y0WU1En21aidZmGZB+LASGGdTZ3Gvzr8jgLnLWaY1YgZJMS'
+        '5LPXXK5rebjARaN1EZgt75PSfktX4yZpo3/WbcURYE+i+x1rW9PXjFI9qbM9S0PPh063ccVDnyos'
+        'YXUZCtuvvooLEKA/lfPjNHZAm43WwncYZcZfnNYhgIyRgLFcG7N6sefLKWxT2t0RNaPXcVumZlOZ'
+        'N3hrpynlcovA+isIsmK/lD5RtIRfiZdCBTziBhqS/WCxiqK6c9YBJXtLdePJn5BHbyEKEiUwiY5X'
+        'SaqytunNd8Y3qFwyZlAtOn5+e8z3k3L0LM8Xq6wyJX3iYaJgK64eZqmrYTrqWecQJkfKVhgg8sUk'
+        'H1n3W2hBDMJmBQ17MF/4oCkVZcFxNP4tDIxjwuvECBk+o5ziqh1NUtU/eqnAIPAsHrvZgl+M4Ri2'
+        'smIDYo/pVVnct6bbVWNGlGG3UztyfIov+crGgUAQvWXDBt5E4A8o9F1H4z4DjADmolbCXnyFyeAf'
+        '4i0P5kD1iOem0I1CIRDe91q1JvCwu2zTaePICQFvPt066TvUKWAfO+oBpcKd3LCRg54ztH/tzdvh'
+        'Rw5cJIiVC6ou6GIOTSqHZ2dom3EMjDsENJUNbgqdlWP5z6VR+OpFsNCALonMzOI0FoQUAaUQFz7x'
+        'OxALFiLotCCGQ/5w0cnBlePoLGItYkgVrdLUKgqU2CULR0Upia8Kuyg90+LUinOlHv0ikZxoyuSx'
+        'XjtobScojPoiyjfCq/G9tQt2e7Ve1srQxMqy9smnBknoeEUtK1PG6Nqa4SpgAySuZFMIDLZeTvYf'
+        'xB65VWR7KpMB8iwMQPGwVZ1v+Tmq/XapTMYBu9fxlfAy65NQyVm9Z9J7OGm4EDclIeNXntdzzJbX'
+        'uew9FpL+WJfk2/qM6AZftLpc4A82PHLNL6NYcDgfYwh0llUQoQQQ2XpgCVRY/py6nsMztfMHK05b'
+        'aD4C2wgyL+y/KW6vAuVyFz5cYutILSBowoyta+qfcG1IQq9t25xKiYPoqGFa65EpDyBjQjRIfCiR'
+        'asyobB15vWmbDbWR+jd2lshw70uUanBhUKuJSwOgdEztVLlF1+s5vysAgk+YlIzsWs+x/4lbBgs6'
+        'iuMmHyhkFOa1iqcgM99P0Dd4JoMNB9uZUBr+aL5TNVqv6xmJYP8nYYRyDxTEgbLuDo6oJpHpoL+r'
+        'reSr/0HFIm/hnD5oy9R8svGv/gGL/XxTUmyvYGRSxjEr+bRhe7sM0KKDEC/ClPv5zRcvQmAq0CrB'
+        '09cRotEjKzOtknUcjRcFvaQT1/AllZtk3WgBZ67KNllyUyw9YOKvPXL0REgw7sTLF4bt92gPUK2e'
+        'BPvlHd5dpi3pG/6JwWC+BcreM4zhfAnV7Ibr0QiiHJvx+U6kPTecWQEMCanGtBOmjML0C2940IK3'
+        'CeAmdjqSQhLXp03FyQvG6B2JcIJC9QFZqeZf2BRPe3+Hw/VqGhyuM9GCm+/+N40MivVIrQTMHdxP'
+        'H042oMHxuVf3XmHy9wPO3SNnL5qJd/VkeJt3HyWPNLCvlhzPnqwZD2hkyQuqmkkU0FWnBVjfY6J8'
+        'pznq8jLTTwQEtyubMfSQtw2oUe0ymgi0LvnDgoL4AVPStDdLFFhb0Zl8qguftPoFPckmBOCbYjOG'
+        'p0DbPmD13lRczHSFFpTCmDN7BAVplUHVC1lcBzFe90VbKnXRWdKfya1GhQZxJlZ02G/m08zcbAqM'
+        'AtuGtwwws/Psn3HzKqg1SyLPb9I37CCQri9RFt0OwImoTpPYdXC7TaM5P+3nTCeJ/gluQT3LvdAY'
+        'rv3kvSGu2xILdS8R4kcYSllRmaOHRQEZ8KZAATy1zg2RfrXRTAg+eYOFl3MQ0GQmVRL41AYufzNV'
+        'y+WnZUxy1o4hlkEd1YEXn5ZNunyQ8cw2DFn75tE5bsN7y3CKvAAvvXMMOxc1Qoh/Bb0gtUiynhKM'
+        'NMHyB9kBK/9lD3/zqmT+3ixYXCgBgOXbGPXfj707FOyx1E0Hk7/iB4DHGrbDvH+gDXegE1qc6QqD'
+        'C9kmpB8WgmPykwNDHo/8FniQi5iV/7rMU0mz7alBV9FudUeYxRi93Q4ygLUSQd8m7DlnA214Ig0l'
+        'oZ/rDxy6fmgklp+zU36avYYtO/wqBElfqtisMHa4M5chiQ0bpW+wc3z2Qoa/D400sePKN5GJW9C0'
+        'AJIx4RSciMQvvav/ScbubxJYnOcLipI3AQrMLgKWz6tB9ApKCzEg99Xwrl+sadQ7R1GZXCVLhzFE'
+        '/AA/wXRLGshiJZiPe9rKSyyr+KMIKDaSX527kh9xdU47msIVweLNjLrSOVtfEW+0FHJbKQ51g2kd'
+        'y4QG3pRqHl5nF76rqXEKYPqR8qBC0ppwmHpU18b0ioFQDReidUIXyNql5MIthOvpEOKwAzUfubp/'
+        'UrXbD7o1mkklvsQjbCZWnEW4HMpmnOWPX9Laf6l3Vkn4jaVQbqPu+mj7PRGR8aQSCZBhnSN9OjTY'
+        'FslzIdNr/YaY/BTfKRrPYjbE6Kpgl2uXGOiKjxWDvECN3fR37+qMnfc/oqDbC11Ty+DC9hOvO5+P'
+        'hehYNP6WI23AZCfcwGARkftB/rFE7fieNpaBLski1Mb8i6xEXi6vKS9ke3BFz33UzvhsISCnwX28'
+        'oKyyRWlkUc/cfIehGtKfxbzj2/SVSvrHs71xbnOhF804VFfrAl3gSdK/ZShDCA4eiCb0ZZslaUIY'
+        'SL3HZasaL0lckHc+Qc+AuOG8U9C931KAWbV8SulxS/mw2HByjRu9QQIkDt1CGJMPztPbDt62Ycsw'
+        'l0Y3LVvNRaM5JpUITPpiM36Qm9ULsGdZfUuhhSBpxa4bqaIWH03C+nPFwJElyXQ1LsiBTQTS89pr'
+        'CkNAxRwMkBcD+QSSscyvwIYc32eJrrOlu7QuARQeAqzSXGHHBDFXnSiYOxmhaDsU2jcdn+NbOden'
+        'zolj5tT/H8iYe+gboxHGNfmzwKl4NBLJQjwbJOJE1bNmA/Kg9uROpEpdy42vZSNw+P0Mq+lRepur'
+        'XKyZrzH7TDcEvXAIgJgxKFovStjjfbpPYRZm0fx732b4QkZDFaUaTEEtyBuYvKu85fldifSDOcPk'
+        'f47io5HrNdq56DgP2e1QRlsglqA2ItkcWtvJB130LKrAuxV1x1Lbw1XaFGs/MvbyohvacxnBO0U3'
+        'aXskFiYO6hdv/VYU/5cMfhXUfaeb0Uitrk7yf9XUc43y9CN8UWYmZiAvRwaWIf6By4GDXXTxEd9L'
+        'XciZtETagTlG9gcaGzZvzv+0HlB3wX/AQYECeRcA52BRLeVLiMO3FHBIvVEW7OMOqDV2LW03nJK9'
+        'sClVohCBY7OF6I+/KOCCbSVhge79XBBVc+zdNUhUKK1esYt6WlCbFgP2/K5zRcKavlHzLqJSdFOk'
+        'X10HtgNV/dqU5MKtOyD4yIEfmb4oWS4ls44rdmfTz9+IIfQuznzhqSty0NRnThgQM/MxEIDAIeXz'
+        'acBoSn9S6sEPYdzDUmTSAe8B46yUUIW7bqoha1cwBHSbSqcV6otE403f8hB8THkSH1/91rLDu7AL'
+        'n0zOz+R7i8DC2iV5uo2Oga/eCgCeddebTjfVTM2TF9LMvsBawssRFXIWYvpOLuO/aydRbFwbSkr+'
+        '1ydyMrfUfOUhUqo/A2ewEg1pjZFWwd3tVE4G59+8Q2EkY247Vvy65/wqT8BB3J/NTiytnn5BwyxT'
+        'nspZKP+h5IV3AsEJZFIInnMSjHHujyhVlXIWP/IAehXNq5v/xAYu1ku5qjC70yn08oDMhLwsxssr'
+        'tI/StLottxf2oOjxH4l4HJERleX6+QyF2LbJGy1sE7DQyc1cnSzm7If/PywPReyC5/QUm3ZVwhHH'
+        'mVr1ia/FxXOIqhxsMIsOd75662ImAuUG0//sbdodU2sTcJnToxixZH5klxsnOOMwKLu7szvDS08x'
+        '3DbzTRQAVPrhLai33wNbcOKO1w2rOGzHJ5OhK1wsWU1O8rcrnsi+F55yvWsSkgzNkaRtWSdLUgYt'
+        'IsJIT8yTzVmNyGgLWyXaYuQXJw5vDNDt6zQlZRzcPZDJ0GKjFuYUwn2GTTwa+QqjjjCfiJZSImTZ'
+        'VTcCeUKJ3BBaF94EYeRVC4Utq6svzj1vw1YnMP10TJYSm6PtkmclO2kypLjjO0UaK3a4teDTWQvB'
+        'IrPgdNgwse+f0u3Nnzuzms7012QnRPJrHvsIIY5Onyf81m3jpH7CDzqdfmsN3PE2c1YHT8J866jj'
+        'h/2Wxm2ZOxGnNp9B/fxWTtHKlkg/eb/Gyc4orBgh1I3VzInI5BUX+o5zHNVvZxszksy6NizYOVdl'
+        'OWnepsgr5C5lp6WuLEL9/pgqNuCYwecY4dGAoX9V9VBtnSZjFs9Nc1UYs6CL8UuSOXfzT5sCGECJ'
+        'LdMs6fKlO+ZqQxRjAAxSIu8Y4eYbB77tzszt/wtL9zyoaRrXP/Lh7O1xN2fvMmpMfvgyoPZLHYZC'
+        'tiNcsXrI3zsml4Nt9aPHqh6RAYbYAXGEevA9jb6phozp0kZDsuXGRf/hmTq4VrRiPa5PoaNklFw0'
+        'Uhk2NELbwOc+piVSy20Mwi61W6Gy6DzyqZWuwZkGSsCn3KMAxzJpH5TT6EE9bDzOtc24tSsXbm0F'
+        'yXrK5WP+BGSSLq0YTpNRq6igPjpSOBhxYqGKmH757zADxtNOAEWSJvd/lw/Y3O0jo03QYzWR3qKF'
+        'CYsbxK8C2xdvBbdpcaN6Fw7XloHE8u40kDaFj4mGMceW9Q96XkTRUSMiwOXloSC/81kkUrGTpisP'
+        'BVGDKizNPdwJlBCZoD0Dh6qZLyK/qWneVU5/HR8b+2XdNvk7uf/G/oGGOVH5Tk7n7WQOisA1UfpY'
+        'VfYCEqejxwteBrftLiX7bGWjQKrt19HcqY3sH8ZLSAmho9zTxL1rsb9k3fd44XrRADn1ZOGX2/ci'
+        'aG7poz5KBzj5Hez6GLd+TMfd3nMQUZwZ3iBH/+J7hism8ZiZtlzi5OVDOiVc0/6JYdtbjtRBe5XE'
+        '7jvQsXJaoFKw+KFy4jX2PsU3foJgtXimzBeGYxreVPW/HR6sZdDBw7GGCJWT1LaHSsK7QNU3xRpy'
+        'jNBpIxmNqenixQvSlkLJV5GtlkAs8/QYyZUBK05JdxhCggNjnOdbJ4MTjru1D7iXFbWvbe7iPo+B'
+        'p3f2bpc/0j4OD2Im97fSzq0OwDfaLrzAfbvM5AO/wFRkubjkfZIYPN8CHTOJsKR3gW2Dle3OsPZ1'
+        'pi4nQakEEB3naKuNx4+IkmtDDB1fL1UwlKnPQkLFo6C8VonoKG/ZhuOETfNVbTWhSH+5MfQ4vZkk'
+        'RgYhPQR+o6mnUcUpMB/ZcnReIyjygmkkgQsB3JwNkQNqzuWWlcQB7bQN1IQaNJeY4AuWu6TOLcbQ'
+        '5oeJiYmIg5ijISEqJdrs2lOPbNI4FWo1tvycDSSTTIaOfQ0SjTzSVM9uOh4cLhLJzHGMmNr9rDb0'
+        'DTJ9Pdzv8t5jR01gEhKBKa/9k04orq109LEwKUCGFO5y57XBgboEHHSe7lbAOEPa45Yd064Ilkqc'
+        '7vkm5uTlYM4h5N+HyNZFKf+2I4QUSeIoDUvWCn5aV864jUy9C7TsdrRMg4MoYF7Q9SqHo1+tzod2'
+        'eSavNV7hcnIzQ36O3Pyp6A5WsrNkFZ1+na7OSO8i0mvImFe2qGpsmz1K5H9gjwdyise4tak19zAR'
+        'Zhv3XLRqU18kpflrHsf420w5CFIgLIs6eegThvcHQehv3JBcAW5LrQ+s/2yf6TMzSvuEkttRd/GY'
+        '+9pi67EJZksFdi3o0UX8m9ojr70c0bHh49FPZt5I6qw3WpoEwKPE5yxfUv04WnwyNlHgWpy4ju8q'
+        'vtt1Cg/PT9FI7I5YQjsMAQT9386s9Q00G0z5KykxN5Kfj/iFX7vcVsO0/0pjiDkgpGUj0IACEvNQ'
+        'lRCwugTgkrroMj6cBMrGdCvleS2haFA3KrV4LgOCm0D2xHmq65raYqZYsgOL/McNP93LcsYL65JR'
+        'uUEkMCytEU38fDXiYAe/2m3j9xas4x/B0bXE05luffhQ1B44fM6cQwKOH1chAJmnfrIelWSRS6e+'
+        'CiSDBHkuggLS5EuDRBmkMRZQ5e0RnRMueA/TciKdGfKgIvhepR7BHdvj4TnztRZXsFA4dvPvNjQf'
+        '4PQg3DU0VP3Rkn3AICMV3Mx7ezavl4STPYEtNrg0kLlK/+OtSu2preZrxRZSiL8WQnuc4nv9i8En'
+        'FnbdacCqG/8+ZL521mXqNgDLjANCERIgKrm0jcoj+68P1DkS2X0kPxs77+WHzKomQ37NYqbxPl1p'
+        'NxgENm2KcLKG9vxyiFZMoKBXS1AlBFswkUt1NZYfEHlPOMWYgMfJWdukwkdXHSeSEn4rAa/7Q7xd'
+        'rkEPfm+r1V12pFdk45/pNNC1MIhasI5NINSQJVM5l8WTbb3NRSPNcQ+SqShl6ZFQxG00X7hgEwHI'
+        'C7AQOaElAKBVJQXqfA3P2sq0SCceqB+ssDvNAB+ux3AD8bxcUxzxty9RF0kK+LwLy1zafGsx7NoT'
+        'wLiq25fEeZYWEV3UkYmVrtrtizBFxd5nT/Yg6t/VmNJUD2ZWMNRvKpYTCicvQDOtkcgJ+1sOnp4d'
+        'h0OAAcK0ory5fN1RHgreyg6paFX6uuGsspeFbbNOIyi3x0uKdX/XYHxTHGOZo21YXL82S+mTz3lG'
+        'gaxgYce1vv4iEKp7waIK8EUzXN+Yg/nB+1tS+y33seDu9Fo4+1WKUa2T0Rv3Y2B9SgzCHUk5FoD6'
+        'sWJts3tWFMF6loBFeCV8GWS+PzUHLQiVgaBnAgUMVSh4tQe0sXFqLA4OuALTeK3/7bOyzjckYYe8'
+        'fConbylstG5Wi+r1cmoUIVj+YpvKRA/TmyvOvVVzqYRXg8YCgTWGt7SJn988Ok3iIg0LfOsfoJ+H'
+        'Y5StN7wqNzMi6KtoUY2ND3pdUUjHEF2rxY7BDCtFsGBy6tkx0hoCwXE+TKh+BS1YCXBa+tfSTyqb'
+        'iduPwEysyZs5hEK4ZAEBY7L80CyHE7F+nSnhK77a9YFQ+jwhae2FsPDsucuzKCmuKiJxAvq3S5pc'
+        'tuMIDIAnDvhmbjpDC16T2IdloXq9lG210ayM4svkQ5IfAihBk+mixMwU1NL95pIiQZQ2AvUCvePS'
+        'MBDMPnNwSSC5Ej0OTze+yoTr+zqf7Y4uim/RKaP24E91Tp3sNDB6Zc+dlIZ4raXRr+kACCOXV3C+'
+        'TrxeftyX+tn0tWQ4QR1KjxF/BmU2ziw9I1wsBqF4frZlbbIIC2QvOmXbwXVNnH1WoFmB4P2NSbhp'
+        'mkFjK/MqM91tkZL3q+qFdfmEnNjXJMPGsLIN4IrnPTQ1MeE1IcLZqnzl3BB5CLkLbT9jTe8govcm'
+        'ZXBaSQZVP6VqZRbfbSKxLZQZHrLO0mkFJeaVhJ9O+0rfUMutJqUG5j4bo8+tRnKuMx4WMzwyK9Ce'
+        'Uslwlnw+9Axcsg+P+gmt6BUywFYBWBfTCBgRqhGhDwkLFXTeu23TqWwkTU4LDDDXIy+1dRaBIjtL'
+        '2RgLtqgDoM0y0HcwvPTzXWsvucZrUIrvUrnjABxg0aUZVrBOTTzOoN0KEFndscwgZK+Q4w/iMQkx'
+        'VJ2xIeYY57cbCj3eo8VMj7Mmv4t02grh84TfKOIZKirgcIIPcUTdhxr3bCiOuPj9CcRW8mBTPQ9G'
+        '8LopoNEJY/5Bv1iqCepmH4U4fpSgE9CgiDuWSi+TzGZHXuwG2Oat5ON4dd4u873IrOZjaujB0+dL'
+        'AV8YLiSxqolMjeWFNIuqwdYPt8qKArxlQNDxKv3oNc2uRVtyAYFBLB2T8CoShrSIiHp+VhQ4T+bY'
+        'DG+CXlOL4r/Ucoi+IU/oaSYtovHq6wP+P5ZZL30KNEKGKLz92vxKWRt2Bds1V1+pr/giCAQ2V86i'
+        'aOwgegeQPrhYP59UWV4cHqwl6pgX2cCeTDwKQmwJ66rrCA8lBdPBNd8LJuz2xVxIlEwsmyGZ1VeN'
+        '+VbdhjNHT7wu3UCh/PuhINXUSZDM9HPIsEORAT5IB/8tMUseMVnYbkmE8v0VCEpxNbGCYPWyO65p'
+        '8IjBNVzDCPiMHlwpk67w4u7FGuUFtk9IEnGGWvjSXNdzhkTK5dvgL9DULjkPQ/MFKlanIJdOgzCe'
+        'b3IqTze6EwnpFwHs+8pCdDuKoQwi1eeqlEqvQOoyhX8V9ts3E2NoSmwU8p/mnmFs+27XbeGNTH76'
+        'U+YwcvJt8pVCrLGiIxDg9/t2N8LXJSA6FGFRC3inCe8CDLM+vDVLUrcoD0jaz/IiOXqYoouBywxr'
+        'JZa8REON4TIZQr4k/39gxM661IHH7tZRy6lvZjwDgYpsElWxoE8SjdnkMCC2K5eP79L85oRZk+D9'
+        'g5BQbDbNyxG73YwLLoc0FzcDF1Sn/8i+Iz/0UU7nUEKgAnpeuhkMp66McoYUlvjXXp0vAgY7TL3o'
+        'ORY0OSFIiBvVF2N7+lAgCrPMwLHg5CCjOfKnnmjz7NtLT8dLagpWGDk6zrxXg+d+WltDTVyl+Po4'
+        '3HinBiIQWpubnQJzfQ0xW1ePIoN08Ey8Wm851wiIBD3wCG4G264lxxkrInx0yjRnvxWWgtz3GmhY'
+        '2+qCeaW1oCLE8WWg1Lz1NlRNJw3VxqTxnwBIKEpdMk5buZwbJC2DaT966OEAjf3EfJqf1hE1ALlI'
+        'oGxDJ2ZTh1PyU/cJju3vXoSl6RIuZgQZsdyFQUgFJFT0i38z5MI4/iC2ynDTet5RgSQGCEV8N3qt'
+        '4z+XwaB4bIpzJXjbc0paU8ZeWOTDfzXoKyos7RzHqtxi8RVia3P4+n4MNGMwZyO5yp3ad/5rlXyq'
+        'PVqhN57Elnw1AO3l6tbSrUS/+++fmJfh/deX4d3B3Gp3lpfGRJrxfldRDzTYPqeTBIkFGw989T7D'
+        'FapEgJRzUq9GY9/OyCiYvZSGxOSI4XuPjG6uqcGx3jTIQ57xSFsK7U1ITaKj225ZkTty07KYFzVw'
+        'DKYVvOMGhMl85eDOyQEAvncg3EwNj+7w1z7TaVJKvX4TitN7/Mb1lZ42O0+vCgdP5PG6hZhAo+MU'
+        't6DyIBf3aaC2l6KQKvfbC3TR/accwjhrIgCcU+EBxPx6oMXepdiw36VIj/jSdiFRZJiWxz/TgqLR'
+        'JNUDRYQPs3xPiFUTtnSvBuMSkKhRQmwaDn+aQu3HWx1tcVXHUdHaJCzojgLpDpgP8YshICy+GpAd'
+        'O4RFAyBSW97KHd/G04cF+r/99FiVXX9CBZdTql1och1Ec5CXX8fWWvV0nl1ML9xwffns4orVumpX'
+        '8aXOtIRPB7xyd/7OHYNsaa6+LnyLJ+z8CHcz7HBEP3sVM1E5Qn5D/DLjAn+VSnio21o2skOptUQQ'
+        'WTa5d1qZ7iCEgh5dwPfiNokeQSJ4AkFh8E9QsiF1JCJGO2773EkKjZ5YwloOj7eF/mqQ8YzfQo0H'
+        'a94neaTEYblQiLEITsYStso3OUPruP/xFl/9M9K2ZJZw5f0sfY7qw9ovVWPODzWPZHbw5ZBxe2kF'
+        'dcnwlolMqhc85snEibbpdU3ni5ddUSHDYRy33qfekVJta4FrGKJKhBZLVY81OyX8yirowU8OK0TN'
+        'FsMmwtcG20KL/Vjj6Nm+TKCdkobZIbuBwsSMM5AHEFF4QECdsDmGnwjekdlNSB79qalDf8NRh8En'
+        'gjul7J4YEXcXj8UNGsx8G0z1WWmP1v3oizzK0DEvrH3xYhnwgxCj5Hp+gB+RjkhEoxPb87ZG50lc'
+        '4JYOQCEOhmUCcRaeAYrs+Ccow3zermdEWA+kRfU8J1z1FBL+8zQS8FAfVfA4OfyPVhZ4Px24X/JR'
+        'WPSv2HdiA+DsUkn+fHqGuEugqY6KkFFbFJj7ydQW14uIwIbXf+MFHbo8AXuHEDqwUWP0lX8ZwgQU'
+        'pIukNIHZ1oizAxE1CPHDWfNI3NGIM1qljZed5v+idPg+7cobc4hR+C8n3B10M/+lITjXKiu1cGNT'
+        '6dZ+qygcFcTZUhNESRi1RbW6CllbfI7kLarjFsxMgkgEaVxz2mtgQP8NqEH7czvg+Eyh8HlgoIsn'
+        'M1G5qKBkHIaqq5cMWpmhrVC88DQbVmdH0K737UIhg0FYZT6De95Nzy2VVi99lXX20SfL/3xEJrtn'
+        '5L0IeEXuxtcljN5cPN8FQ1N6mV0U0X3GOdosKa0RzSYOTXmnWQGbYIpdGvrWkLjyjS7TFUI7GyEe'
+        '/eJqNHXZrH0lUZYcTlSJ5MYd5mk/gm5xoUrobLQWBuTuKotMHCuCqKIiJsfljHaocz+7HlkCrtGe'
+        'RzWkCNFYKXj4H91PIHnzK6r68TTkTajZfyZ17Mr/RU7j6Vwyw5VxCtYgMNTshg1b8hs/cSHZg+Hz'
+        'ygCKHGQOjp8q/V0/KzsoJD6OwyQz1t6S5X/y6JbuRTQxnxwKmTry+yreD0Y1ul4jJWDI7ySs0VJk'
+        'AfphPhgWuG9/cUwbEtmuKuI8SS4xbjayxtGYZfh5DgLgvxesi3ylVPWcvGL9Z31M7kNY6kHZ4/qF'
+        '0kPcTU70owBTzCkh0LV9Q52cjjKgmBojGiJOAsmvaPqvXXG4xWc0XJO5ORgEuf2AECI013h1g6uw'
+        'fTPvtaTrOW0fA2pYq1IKPVYOk4ToYvFjS205LcHNr8oIxyHysyuPOGmvd9kLUZedIBtCGtcLpDRx'
+        '6SP9h5FNMw2UjzfmCGDxDjjV+TcgKzGhgd9NqEGtCwwop941VOK6GmqGvTvJzeH4bIYWUefFIjaA'
+        'r0AhX3H7RBfxcmsuyDRPjIXpaGim54mf251U5rf6YvAWig7bdyRog2US7SxTQxZub/tTW7Ci38VH'
+        'dXWRFjkCwHbJcxdz0hZKiKlvI/C6xmoYz8mmcI/a3nhltAWD2hqyV+cUbQjj12CE+9XqMc7xEy54'
+        '5F2DO5E0zBMrqvI+aFdgXGG2gMKAS6oP05irOLENIRx8i0TSlrw99IcYqxPi1DAPFXAdSk1vsMGd'
+        'xUmzjT9of7FogHhu7omtuvAAISKZ3Sq0hkarwzEA9urNoMNISqxFKMIEljN93FJyYUpDxshuf0oC'
+        'XD+JndRl4iSN2pGtOHWpy3EjJCQt6gpXq4TupJIhKwQBlb3NzBGD4Y2Mf06g7zK5rzIBRcekDUGk'
+        'gjEl+NTPhJLWwXlGAUeXoUJvPZdd/BwfcAzoxmtYtmCyLDYabT8wSom7Ne6WzmnI7hOt/q/vtzb2'
+        'oGh4azztjjMsQfzvU0YvBvRUXaPP4xHsbXU3d1zauSy8176IPoYDO2Lhz8NlwqaUbYOvQnEXnAUY'
+        'g7VbjNg2XWmcAdTiOGMYKlLbzYxC5+ixLnoabv6vm5iTFMAXop4W48RAlemGa5g+ZrsFAicNMDvB'
+        'RAqnt9+F/SjmQKbppA9nNLHzhUu0pWaaWF4KAaIvv0qds2uPfyaxCZ2yYUA5RzZu2V0DT3gx/Mpv'
+        'pH9JEQO1fpFATa8EnEwGAUls8HVGJDUWJRwmwmcPg9OiLdWw89FRoNrLAThQPPioK5cOD7locm06'
+        'j6aXcXUqun1EfGMK/YAe3A6gNG/zc2JwSGdttYx4Tj2q98mLmgv4oCnPe6yDgw0I15VSVERQVEqt'
+        'wRUzyrpqfba2f0kti0cILk7EEoIPc8LhEh6U8MUWcVikXuDqYjkbR+95fmCCNPP/Y7UvZqS/Pc4K'
+        '9b1ZUcv6ftfEcUXNylqM8suUY77VUNfMDNmkjIE8eubzD3muqHWDg1uJCxVpg4BBJhXE/+FpEi0c'
+        '3p4qx612LOEi93e7gYA1bvv2ouCyI+logExC1gtXv8q7p4MQKFu3a23pkLw3twUIAbN+nTOUT0Oe'
+        'X5WNOty3OBIKaAtyBTCsnyEuJbpLeaeZQase4I2dnqy+ZlKBAi3jzFc1EZJsI465WZ4bzNNuP46f'
+        '4Cq5ynDzlJxH+8S66kmXvCb9indh/xlwQCw62R7rjBUtw6bDCAMLBC6RbRAjt+g1V0yMldTCWW7K'
+        '7Ck32GDzhcX0P8j84yczpiB+2f8pnMs8kloGo1gbafOOWp3A6SDSEAjdiwO0DNJcOQrMXlA4WmT7'
+        'waQ9mxGOFLupPkKygTsCz4cYZl03GMqVSu0IBl+sT4QUb9/ULmUl4PWbMU8i8Wq0CcuvOdXRYIxe'
+        'FzkFAx+Wh7OgeXDa6dJzDmSCHYYLGWqoM4bac+qusK7mnXWVjkrcfiaaEgiuLHHPElHyhcM4EdaU'
+        '/gatTqms8zWIu+sX6IhDGv9npe+E9fvOeONfm5f/QGRaiGpYiH9meAnRG9gOzcYLV++Emi3K9R1Y'
+        'v4zAZjHpqwwJT3S0dfLNvUt2OgeG1xsd/Ydi7qnXXCPlupKLNVehnnFi6DB2qsoIStRO4qU4T8Ps'
+        'WItrRU0+d08++C24xpkNYlPpzlaL/1Fnc8APJOEgaIyQbEjPWbgf+/YuSuSABKI7+okOt3uonHT4'
+        'bicpKeMRsFCfgGke8UWCXth2T8He3NacC4FRZU3Azw/tp6+gJeKmjTwfC3VhGZqVu1fjKjwmJDdI'
+        'QeKsGKmkJBQOs4qAfjvtmF+arbnaaXPCfCgNtwv1rO0DgTOA/1J95qFMIEj4w4Va5Xusb64qxFfZ'
+        'F8s2Ww81bDvg6BVL0X8sjB6jdJe5Rzjaj2Lmw79Z/R9I7E0SuEvhnALV6mXOa9KiAdQtMggBz4jv'
+        'kjYuYKIlfRaaXFYjrONWZGYkBvJhudBrWX/SdNR86U80qtgF2fF3wFp6yBviQFXWCJ8DAXLL9Nod'
+        'xnjCnyO1HiuytO1Q/ojLojaHXvBa1RJaEhatHvmvB0JtwAOCTL9SmqU4Gzjo+s1KyDAwbyOqq2nn'
+        '1VRcJGTcQCivskmvyKmbaY33dSaf5/IJOhEdFQOMnaWhIrOp5PagBtzeCp9pUvxw5UjC4SSRVzwt'
+        'WsxI18n5t7rpi7l9GDt56aPUM54W6Pk6VKEKjx/I/7QpW2E/D9K6jxRQNii8kF6OplhlxQF75uhU'
+        '03gb5nVZvcGb8cgqXkrjLU/nQupizgH387ajun7eSPemQ2F4sbq4eYut4Y5QsPm0S7qLCAIVPm6X'
+        'sUFEWfSUTNYrjEJYD5jORPBcNfaRGX4BNhn8ZazcGNtwQlBNqcQ1DFToax/sYM0+n5fv+/xdM6Oz'
+        'dwRZId1yD0sYR7SNw3PbHAhpHL3zMekEEI7m4Bc/+T2vQMyBA7Ej/t2zynf+i1Qg5AXcrnfsX/HM'
+        'w4oz/TmWeYhV9Wv3hicp8795qK+CRgJYRNGFizFePzP5ejBqx25FxQ88GdgoB+kGEaYLDBmMlMSF'
+        'GBf9clyy0+Nwp9CP8cjiPK4iq8R2witZbGV2Mzt2fnVfCMb0dITSuyThMqfAIhpAAivR6OCjwjJa'
+        'Vo/qhOTcarbok9+hVq/GuUrgFIOX/lF2flha6OTTvH4qEAiPy5/wwh1AEDl+dc3pcDCxZ0NjuaA+'
+        'UF6b4gK2R/0sl489y3Lv7ucdJQJLWI6YXC6X6zNq7V7/aqXi4RKfBkrBuN0YMdz/8yvP7v28/Q9W'
+        'ojJVasdIgqgoamWLqXipouQfAcjbAJPgbpiWFDYvzrMQmwxf2W+eQia7N2Un/QkFpqhZmVqF3pGo'
+        'voVJKU1uMevRBaOdEV0gNcFp6alCEl8yCWxSb3t7E0LaHbHQlYq2dFoCvp4UNMg3MgZq9WwaLAyn'
+        'zAJPHpK9NWBesFrRCEHiPscFba+ef22mCyDrirzswc7Hhye1yF5uIbIvQ3FvXtx+Dvm7hKGUaEha'
+        'vpxxgQoZ4NF+zSZTQWHDjqFxf/xSOaa9gp+mhPsrIB3cl3qNbs5jPW0dWhrq7ZX13rUsVjqzfWkl'
+        '2OAl5JifpGW97rSeYmOLR6+kVhY3pi1jN/x8uDd5j1gsgRM8Xjs0jdZ5ZbLQS03OTZfzTcQTC6Vd'
+        'u1E2rmz2+YKOqoCrqJcbqPVHT9oDhZ8LU4fUjYdJPuHeAFXpJXWGH7zk00uA8/6o1WPptBobBnfX'
+        'ceDXzXT7ftxlgq3BZYJJK3acBz0HxVIvlFxMA811n/K8tcdETNVcYch1vO6gSTe1RsgRa96H/MEF'
+        'HORL8AEjFIsLxz4Qzsj23CX2wKfEd4pb3yAg/ps+W2nybAqKE/GMEzLBz7NRXvwA2da+oezr+/xX'
+        '6/Dw4naxC7a8ajt59ExjIIvUxnU8o+7+C2YIR3/IKI4l4HMo6COdPxMtPH3BpGHM/AoVUrQFbDmd'
+        's0uKtt3fvH21DmZaiI5fyqVTBUaQlpFJFsaTmgDlUGgfdjksJ0wFoivtyqL7J4rTPILR3dQ1gJdA'
+        'ZolefusmcCW1Qsfo33pVej+vXm/Mrr9QHXSGTlZ6T0b/H9iC5rFFQvexce/IEFjqAMj+NddmZyAh'
+        '0hQmSPhEcfTs3xgwZcPSH8UgAedI+gAqSNLcJic4hmOP8riTWpxuDMiqu+5fss3JoE7EGK0p4qVf'
+        'b4A91AVLWS7iUgW/9OBuv8eouhe7D6O3i1j2SBdTZxyiPvWpYzHjyIm3STxPLq2E4c772aHRmPgU'
+        'Wdy6mPcmZuohUMTvkbcMBNPCI35zHpQbPmlTw/0uSnzYfTpMJFZrvc62Ado/rsaixHKv21lue4qn'
+        'KeVME1TQ4acoJbK3E1DBEzNrucdDDfD1z2PQFFSRIsosE+QJ2BRagSvdFkwhV2aNHLGyyVVlc96C'
+        'gGewCZA0uYV28HcMowosSuonafvNgET500J6CHJ4f0GKWz8w/Qhd1vkv/IFgRGKQkpSYtAWt5uIZ'
+        'Ha8GcMbquknWwRYZ+/fvANy6CTCiqwGhZFEgtoN+zcb5ZBQewhoq4DORaLGz95nPMDbeeo0hQvJ7'
+        'oDhfFtMPDWV9SbYgZa0LjNgpq+AscLTI0O5G+md8qVo2WmrLGI7IWyrwFszi5laNVnm5PNHdkiNq'
+        'MoBk7CJJMsz8fHbF2lXqBDIVfedPiJZ1F4urUEuT6OrkHeI3psCbvxYEKPrGjRTXKl9wHKJCg/I2'
+        'Y60bYED9HuYWVIAuEN1mi0TPf91/dk8hssPWXvvPNfQoNM+oGaiaNnsSSazIArOaoULs7Wk8rbPH'
+        'ZH1aW/9IwHYOZq8REFcK6mDkLC2j/wVtaAKcXcj6jYeseLwiFT0ogUviBKEux/hIU3ws4QeaHmzF'
+        '7G4IzaishaZTQ2ssTvRvrX3oY3FQ8gNkN+wXLMUpage0pKKKJ4TUIiSVijWnBy9gB1QJM7v6WGu5'
+        'jyopbSOrtgK+m4LQvOKSKzx8L6cVYmBbsMQfxs610MnOIfL0W/LKHrI22vbHr5gIdTgmcK1bKuYW'
+        'SsAGkUV4V1rsfVf4hkYIutMFQn403aqXPgEK63KStf2NkMDpUmKQqXEKaII6TqqUFwo+fYzpJ8+m'
+        'QJS3kwDeHCgxFD3aiuYALUwquC6Mmizy5E/e8woFom3AqXGSP5uFsTxyKENP1vScsiykhxUrgDYT'
+        '0EBIDLEkEaIURPCaKqt98GIxbMm1+s1GeOmEIzI/kxE9M4/yp/xgPXsKVYtwASz8jClAgcJtzBZo'
+        'EmF1Dt1rpONw3OvGtcaYUh6/vgnEuFMwfiAqLmY1Wx1S47oVLyByKM8/99izgM9LOeqPeFD9nB6t'
+        'grS1WD3gKmfDsx4WczIru+4MVl1HUl5VXe1FH8eIX+H9dVx3SYE8BKkbdDffAnQSk3JuM28W8zJW'
+        'yVOSqK4Tk2mQ3T9ODWVnHvqDgP7NiLYzkWNHw/GTJm5xpBBbn7T05ViX5AOOZ87ROXDDfza7eGPz'
+        'XRa5z7btnvPtW1+Mat6XSjFotWYpkln8wjjY0BDmOl53DCC5pPTqzTXcGUZH/Vvw7jgBTy/XJxio'
+        'xMs/IlEsyxF3wB5lks3Y6kV9z1t6FgA9criaFXADpmDl6NJxhPjpSWD7eqywDaaeprVFfmKGVBSn'
+        'os2X7bJwkKBvGDQfCUylybpx1RqJjNP6V0yvJKCdsqttW5D3wFmuKGvh1E7NpDfInST+L3edh8qY'
+        '98W0TO91KIbeEtppkt+ffYX8t/XMWFFLq7aKhEZGyLOejPVujqZR5XwJW5hbSEypDAVxCY5zDLUj'
+        'Jb2IatDzewuOM4EsiOvoyeIY8yn0a3mvFgOy2RIe1/182Qu84eYFAU7T8rmLRzCN3KXgXzzgroX4'
+        '/LOr+7yGmtXnht0d6MN6mjuJ30ubXd+RgY5zYki16nMoaYMy40a8mYnP/3ZYbC3La+z+boC9tSuz'
+        'cBBFlFw3pBfh2G4827iuPQFbX+1KkKPtBVcp4L50LU/pKSnXI4THVsnQ0a9LtRuz6zJE7NgSFTOL'
+        'Dqe9+MrvrDzvFIKJ1ULSqI+75q3S1wkep7QL04F4+wP8KunBXTub/e5O58TY+ZW6HQ1DxDHhhO3X'
+        'EpTd0VapeYM/36YDNfzeO+O7O0/wd24TK8kBnssW1N1j1vb2yfBOAMWMY90ITAZ/MaGWDXqFNF0v'
+        'X6XHYbvj+0vL8BVL5ejlgG63nBAPewKjRVyrrBhGBFV+tVG8xluX21VAM0GzqYKebwWakc4ZSNG7'
+        'WLgbpCa/CuX/8qXLtgQfnG4AH95sXd4t/wZHVO94OD0FRn/tXrRUkQifrl/tk9ZtJ01zec+J+RC4'
+        'XiOQD4Ev6VsDocnT3IgLwAqNgQm226FqJki4eEpLUg9Kl41C8IouHaO+6BX6znraGJI1+78Vslgt'
+        'oB8bp7uztd1f0fHtH2PKzn7CPv7ZuqjhU4plqXuh94sOzMjxqvU8LhIxvRQ5MVn4UcmQjeesRQuR'
+        'DxxaVJDMMJbaAuO/Ux+qmHSezh3J7Ldj/bDRmOxPcyeW9HqtdKCNkS0NFfGjiDUfeNHW4BFdnK9i'
+        'fY2Kg+zn3gM0NLLDuEhl4FvEDe2eopsviNsXO/e5UfC+KtPP9LEBw+zzH1spOaUmnyMixKzO0tGW'
+        'scigWBlhjFx4FU3YDauMeiNrZ72It5MXZwUh8B+sh7GbU1CEySmHVUFOfEwCaqbkEQFAvC3NhLvI'
+        '0uxExiqPkarKThjfOa0gpmn8oVN7ntd1xx9m2Te4HfG2uhX5Csu1h2MK7dQf9zcj2tOZ008xlHek'
+        '+t24gckN433bup/7JRMkdXTZTHMXQCt4bPg5y0JyAmRrDhgtoHxbaU63TwomA/ffP5kEkdPk0N0n'
+        'ov7H9/ysYeN/xFQaIikzbMLpWvg0UsskOAKWc4Zf/4DzCPJNMGm1qpMMa5vi9RCFkTvw8TqiG91U'
+        'iCqkDPLTywYDz7H62EO4ErGdVOwPtvYcaggx6EhO64VVSIW+dvQ8HUQJy86f8c1Xoxzpv/S10gaF'
+        '3/ewTGVFrMIdZ9nz/3tC1WTKBxrO3tmFyPYjUAhB/dcLtWXEkdBvFEwesGjlT23KsEInhOGhFa6G'
+        'H8r3mwpZG/Cvzp5XcQd4N4yo8OsmJX4WEM2tvmJ5JPjscmUARRvdPDXKE7SFPJmrV6KBA3uFiWwL'
+        'wp9Vr7rKpvaviwgL5UpNhCmzMF9PWI72XagKfXcafqLGbMT8NGyIq8KW0FUVAqdSgXkh04lIjAl6'
+        '8NFjKZhzHNVh34RCVHt6v+dIuOSQ945Vup7peJSuuNtAUJEuBZn+q289mY/bLXaXthXcTYwSwrxt'
+        'RutHr93S28bMG9BFjVpH9Zedx987+dX40v5Plc8a49SIaht+tz0iT8DdmcmsEdIvfvDRgJzv4doX'
+        'qK9BwvCXj0qy18aJjUf8UMe2Bj47UOEjMKw9TC/sQiQkpiucZeew9QTNNg/nFMVGESPjlSIASXFl'
+        'eUIGnYNFRgFlL2zL5RfG1ZLgdSp/n21kbkcsieuNBgBoZq7/CEaWF+NywA0CyegLfENXFrQ7aP01'
+        'WYaYAbacAlr4ouZYGAqhkvv5Q0KlNMMrGLcCb5bUESVsqR3gHf0VrdFIU8A47lMAvtKWVqh3j76L'
+        'UNUnP1KcSbYW4kESMz2Lz+N3E14312fNIyPHkG52Jg0aLYjqaVEC+g8QXuqTpWn7/bU39ggadC/O'
+        'kKYoN91l9OsX5tW5WwSAK2hql3Gfr/0Hk0Y/Mb69H9zrSFekBT6jcxyALoANUDDmux+KKlyp9sKX'
+        'f9RZX3qb8eC5OJDV/1cu1mntlBJYrSB5aSEX6gQS+Umo67SjUnHcjbduH3x+pYDvLLJI4+11SL0N'
+        'eS78DFy7SpB1XCVIXA6qetohkYQXHhL9xu6tr5jbx9uKdZ9x3vAxTL1RmZHrMFpf7mtThTq9RAJo'
+        'WO3um9PsfE5NEmSlCNy267HoZbAyTrcF1yrQJEoRYoaway5inxDFh3W5+oyeBk01YHxAiFlCLz+Z'
+        'Y9qsBvjFKDVDexeH1IgE/jZF506iJwKDQuDB0ubvpuR+wrzg4ngXvLO1+YPadV3EQ8jQyYhFMJCR'
+        'GaxhAV+g3UQ1a94KIuy5t5Zln4GyKcvKILqRdhv8TOjr3W0o1Sv7q/JuyCvJxgsLTcSj+1EhYl85'
+        'C5ALpGlR9akbcyOevrTL3/PyUCk0Yc6yq35mMpNNSm6oCApp7hpiI4YYKvDUGfY5AeHORGB+6yTp'
+        'U5R3xGco07rGDd49f9uh7XlKFLwNd/EOhnYDJh+9G/mXG5FMd4w2j6yYNcdnZFZn8nzYUuXi2l4Y'
+        'cDj9Rxhdt/SJCYhXAkwl/Z/OsyE3YbE7K0av88liw3khOJbEWffpMTJmTZKYzQGX041lRruo5fnL'
+        's1Nb+dRjfCPSQuX2H85PLUNZSbfqJQSIhRiFVPk4FvnonOY46fasqZFVyk49UAtoAR+eKBovnTk2'
+        'MfDcm093q42B5AYnav5e7xvjkB1d+TY1ASPV1NwdSVujklSV3JUgUpZx1WrVakE+UAZW7jUvuMFU'
+        '73EffuruYqPsgkvN87WxbtfUdSOQCoVu3ZScKKWHN4AGzw2vqqafQ0Dy1c5B3pdZpz3zftZfDYqW'
+        'kf7h9yXiOkkUrKE+w8PtAOVLur85J6Bjs2/rTWlL2zrENIfI/CRGlvUZ/Cg5Kfk6OKcMSJRRhSoN'
+        'g0Pv6uG4XA6JrOtfTTXKglhf80Wfo1ImXgnxzgP6KMFB+GtuQcvFBccfCYLH7urNuUJX5j1GNL2I'
+        'l3E0DKO0OwjWHLiW3Lx4oytZZDRrK56TpbUAdoku3TRPQ1d6Jivba16hyhruB/jMLRCLiARDOV8H'
+        'wC4/ModQ0mmWJ8e5JJss+r/gvo92gxT9tU4LLUyYZbf2bcaffc/V1mUUv9x/lrLeS9PdWqzBxOEG'
+        'jW/Xua80e+HGjhp3loRjyZsp2JQr+SEw2HTqtMYGkRsDAOX2imFp5NfujffoNicL9uenCZ6juziG'
+        'oQx9K0j15FhucrYg1K7/6nH+oEBrvDtkjSzQaNy+jMo5KnU+VMKHEVCid/hc9yLkXzHltoSSK5GT'
+        'kzMFAiKpOkK3ynxXDOw9vI89vK7zIcTpzZCgMuWBAzAirBHx7t1akW12sHG7jNtpcRyb1qJFUKi+'
+        'mqrVug+Vqb97peIFahJtGuBfWpW9Y6JW7TMf8uwM3vpG28N/HtVPY9KF8YqryvxkEf49v8YG0quw'
+        'QPIF4X50gQqqiZ4qJ85riM/ltsPq6wPk90sWn9nBKOpWis27U1vHewtAsfnCfI4L7FcAYNGexP3S'
+        '48lzFKHU3QDP8Jr9T+IjyW8X0jkcUuQXPMq9q4tDUSoZoUlUwvsl/voEEoPL83pJNIZTHN40OKFm'
+        'gBHlwmaJa+9T14xKBhrNLdfsxKefGXQVheW07LFr/vxHzuAeZ5YXudcJ1wKDM08boOdreoNBGz/s'
+        '7EfcStmhv7NYpTghxcAhqJV/Uy/ZLMuG3qKAvv5zeDUBP8y22jnr5yAF/Pj+ETzXXIGO7GnE6R+D'
+        'M9zU4eHsp4uS+a+34TLLa7Hj1Q3h8P0BMRtAQW5F8hKMPhI3K9gOmLQHcftmGuVHMDJBrx75Lp5d'
+        'DIPvduS5gH63Fkp22eYy0cqZcqRmjBp0Z2HL4n6Dm1ygKZAvSZHTc0Gg8rr6Bsi1cNrgY/tX052X'
+        'CfGIUQNY/n3CFm1Q5SBtz4HtB2mjhUL0nb03Nqpr95sToVPnUHChHwjvbB1mbhOHXeFROj+ix6ue'
+        'DNNjpNSSUPXjI3TV2/vbYGW+qYxMQmYHsmGfwsh/V2+nK08T460OLLI75NzvQJeqmTfJgH4FQr4B'
+        'TgiHqEE90MTbLd7gNjJEhwmu8+VeZyvhjY3RpA59sfdKUb+xj5WDN6lr35VXHHzFbF27gfSB1KTb'
+        'IDMIxQ+GgoA9llh6wzvxgmAQHCdWouCUqakVC8dvTBqVAeeBfonjhkk/FtP2q1frzOLU9mS4fiEF'
+        '6lCc99WhfO3P9p1pjbm4l6TVxQdCJabe4WHCn4FZEBZ6E3pk0cdXtZfA8ddHwGYgt2/N0Kn4lnFY'
+        'dR3Tqqo6etUUxeauwPqPHcNdOR9yY8MFTt0wI5zxhnSHUdYRdqbcCtdkXMzBcGRfy6Vi+puzGxoP'
+        'jAppjtA8uRhdfjNKOSvsgJDOP2a1ZaHC+T+J8lqibzi1+UfxaF7NGkieqywnnOgjmig+Tsu3rPN6'
+        'ZY+p53L8VFGZkYGRGZalL91O8/2D/3/Wg1m0yzr2AECcOwjFTvBXrYoXLxc9x8FT40plJVRsfHMs'
+        'qQjU6Qg1tz9yAojiGnuaqvII2JVY2mkRjH59PSjczPX8TQbZcwGFEja7dvm3YpxGicaRqkNUeQ9B'
+        '2hulYnXFmjoswOOYIPKAYJ76f0o7cwAQOdqB9he77LpXXq6nbf2iZ+ZY7+TuQB7Chyc2UcqSkNaC'
+        'qCvFe57Eu+KgyZhEtjVoJoLxHMNbN0tyjq+5sZc09Y/GsmIPK9KEMpIGNwGIcvY650f2Cb4veKOi'
+        'QLCX+r15WeFnhc4CM8QGvdCaB0qMhbGaylqevp6Dmu+X7ewgAmiorUOYwkE4QnUFl64DQRJdIx2B'
+        'AWj3lf8odhHBpvxu1XCq5+/Cbk9VcCCy1zFZVOlAhz5W4DP8icY4mzOhLdzbcwMtmAilV0N1E+z+'
+        'UMElDYEUxffeDxQIF21IQRxfHlNiMkz+dwVxrx9SyzppZM/aFR2BVcwDT5yFfhkU1PjRrJntve6Q'
+        'bQR3LkDo8eBMRmsKi1qhggw2l07YaFfSl/IYYeIiV/m5Or9S2s2kxtsCQFBWVyBsElKKqcOhZ/28'
+        'jKQDjp2wjA+LOD/s7I+r9wAuBV4+oDOcVnVOKXlu5cpaa8WYWJ8DjVavEc9Gq5hLQoLPgznHPqB8'
+        'oAgNM7T9VaFHhEvLxrTCDtqJTowQ+HkjAHIw4rQdgzTvyGW1/RUDQhdqZORjnAD8Klsky6sO+Lj3'
+        'm/RNcjnrEQs/wvhQmH/7CmBHqoZnOTTIEnmU1Gsx+ycTaEtq+91cy3J9MhQ7F5A39CT4/dprdgRM'
+        'C1tdJn9kZLqEE2dVPGn0w0XKca7EjUJg+CfijJtoSbe7usdvlF5PrnHBIRPqQxSQPVL4oyzeIdda'
+        'yufJ7j+186MpPRWt0H1VIGToqQCbA8nJyPRX1bhnKsigkgqTGSov5v+6qNDckTRwKGdKYALNLpRI'
+        'aehX7XD7BQJQDtyEjNxs0p9uLJ85XtyTf9kDOFz8oPxGAwYQX9Y3R8H4H0JJIo2nR0FUsMCCwG47'
+        'RvueYrFIJ5eIWcsKOiwq9DW6zjTBRisKp3FWGMUdFoCn8SXQpCDT8Hqy2HE+GZauyyD7aanFAC6w'
+        'wV3jxmdMAaNqTkPzsRDF7UEqXkenzkB1J7qZrhTTDDMxVOtFUJflGZwPRBGjwQPkYgoZNlLHxzds'
+        'sHtQzDuxePgaz0ptTAA/Wi15bnxR2AH+m1FOcKP9znTj5z8YmeauVtWHrKwxzfTBck9TJRtcP5SU'
+        'kNXMr8dydNIDmHcFjbQVyqw5ABRErW4sVZNMGSaPuPVkwaWtN0AbMBeh1LLtyk9TpyI9CvRPW6Fl'
+        'rIqcpRVaQ/KgJQ0CgZ/Jwm81IfrxEQg4QbM7CMEnoS5w8MbZL60QZ13EFwMEHxrzEFY+mOyKkwyC'
+        'eAPTfFRbtdEoQAu2PLGF8R954kooPNzet3fSLYib1eX/JIyj8mjVCcWNSCDtMHs03ol+i3OH84RY'
+        '+WG6lBvkZfDfaOPyL8vWy0fKOOkW/DX31nmdhWUOVxQdrIcMPTpVmw7mZqlHc7UNhkEijnnML4nA'
+        'IFXW7YKLVjt9CgkeIQEuv6P52qiN3l92e51OZB7BwunLPIWO8MFI7BX3lFx/tDBgclAJCKNAMiny'
+        'zF5xHwJfJJlnWVRbdQHaUK8WGdHTnhTo1MBll5KWwnZnxax7WOk6dl00ZvjrRBGYcsBocJHctZRc'
+        'NMqA2NzXDvjl0OC4G3xhCyaiXZZcA1VwqtekNG6xDbMXDCjzCQi2mluCDOtM+UpAcj6XHGCXtKfe'
+        'Yuw+/qPcsFaQ8bEI+phsgfJS53js4P0EYHazrrdQAffBQMmNDqgkEZtBcz+mRuhaK9x7vY4eF9aB'
+        '9fgMyaxzhKHHmXNgAnfH9R4BQzFSjfM8M3u9cpp+ISkkWQMp/il3i+N16I+5xiOV73eIzamJJ6Aj'
+        'i6vFY9ga8vjNek6+qaXlfdlqvU9br/4yY2uceMIfS44ygsEETFzRaa1sZ0fumsyxm9U3+ePSnXHa'
+        '7fxr/l2atPCDvSoZeFqp0gxvtkwDmxEMLzdxe9ID4/pyWkd7t2U5SVD+4l7tPQ3OSDo70MadfbW/'
+        '1LO3XNK3J/ztkqrAMMOoz+iTHyidziKofA2V7pBHTxwvI69d7C+swew6LnuglPUAn9CjKSPNrcYH'
+        '7BeSpQ3YPqqKneo3mKGNJiywgdkPkLYJqMEVdKCW9mbNPZJVUOzmkv3nVVxFzfC7p4cGy9WnR3cy'
+        'sFnoCjHd2QFXpWvbCS+KVYJQp/qui3aOPjwvepvAkyY7LK/s26AE5ZJKvZ7kfyTYMDac1Pcm4xwF'
+        'P4Ll63KNMc0+96T5hJEX31lIHgDNLrb6sJccQgQM82KlfVqvPva93YdD1PZYlqKRFYb0nRKD6RcZ'
+        'CvHRfzgiGW1vJLges6YM1rQZmCswcFdNYfn2092us8eKKVohzyxhGLKRPZEFoSpVwC7wXAAaNg93'
+        'zkOthyP5+FBlXTL+BnrjMTNpgQtwvDU4Q376GytUS8LcPFLB94Lb9392uha+D8BZBPrOTSErg7r/'
+        'gnCYBKZXZWfo9vI+twxLp7ZX7ttpbEfl2hBtWXCGrJsCqx3ajq3ZkY3Dkhthk0/eLaZFGAnHjFdz'
+        'KfKjX+7zqyGBOgXrUrfF/8lOrKdpnjytF4e/BlvaCsX3V5BAV7XBce2elVulVqytcZs+o0UdnVti'
+        'jG8kUqYlpthEVSjN807BBbl6JySLiHCqftqznPYQnECISTkc1bbusgvZvp9KaTTDszyS94DD2N95'
+        'WY6fTJpSnqzcaybm5nUOIb7J8fa9YgSBKDx5KJmpR8JWt1/ZAsiGGJ4wlYlcqfKJYrEl+4KqFQBc'
+        'yH/yadI23crytQuyapx0l+Ilk/j4e1DeHb7ESWiwFOnCqMCLSzMGqJcJEHaHZzIvT2U3k9DNPQhX'
+        'STivDtp3x5Q4ICtFW5ad/ke4hALFFor+5b4kqzrqNek8lUICezEdYwieGB5KRcuRHRSBdci7BhYV'
+        'w18z2Cr0ZC109C5ak7rWzeveOAe8VUKyW4j3C4yKy/UKdIlCNHLrjz8MfV9kCIgEKPwt6Dk5AgNu'
+        'cecPe6ym9lbd+0T4LkNSh3FjkYNBwiUdLx/D3GWzyOHu7+Wk3tpMxGadqrAYI/Mbtxlly7i1QceD'
+        'BAXnUKSmiOGCd2HgtK2cDJLW/LFeFl5KOwpLt6vvbTxYiyxZu29YVkRTkoZLzAU/DW57LkELSWmM'
+        'jwAqTJiGgb/VY4n9Qdh+xwIOuoMgqaggIe92UE5j99C24L37qiKeOdHXAo7OkOCuSGdBv2SKrj+p'
+        '33j7Y3zeE+yTmsFXf+02eZhiIorilw2Tl/Fwth0VSkOThg7cNECRs7KpQVy7FgGRXhc1KdFhW0zg'
+        'lJrxohrtfbQwiDZ4tdKqXFcVCf+hyS3Pr1gY00xqeRBAVLfL/sFuG/Cd81zSc1E3j4uT99Xdlx9i'
+        'CALzLS6M/unOl2vo6FzDHl39KgfQOoKknz9t+ItUudbT1EQXjYPa6FrJj1tYN0ylNu0C8xU7MsF3'
+        'ZR/Hzys7IhCUi25fJTeB+oVDFgVdsxO/M3/TRukjBBUdF3DC0SDEABAHHQf8ti7wKsADMyDmT+N1'
+        'AkXTLHgIuqlyp7nMlq/LRotEkYMoZdYHGLRagMhshMfsVpYJD3GRUk0SuZlrlvduBnErJMI/iRrK'
+        'ED8GSuwrUOPvq5vg6tUtqDygXrcpABMiHnp7BLkZFFtIWDNnv5D/gJ7zLXCUiCaqYLLp/lpEDUsQ'
+        'RrlyTz4HF+M9QfvR/gaV97uH5LTsSWV56ubfxx/blQlynembI7s0Zhr5wsm7/foMGt31BvKbTfrK'
+        '+3VPHJSve2LuDhsQu+SuC+/I8e3A1cOKuf9WwMHcspwNuXgVbU9Xo5G/NNOdLevmtdI6gJS6mQXH'
+        'QxnTNsbCW+zjUhVymDEI/xQESGNrvIVUCS0A6+SAca5YZB7YDnBLEf1wK4xEuGJMQRCPFVSTCp7q'
+        '3i233H4huI4b23zEF6gaiznyvGkpF/WuodUcSUkgeM1BvvDsrhC4G9J6XFYWuERhCIGk9u1w38M7'
+        'inNV7+nkO9GlGHFfg33GPgbeFPC6DlG37K3Wk9nCZmMGfmP/8QqMtMusfF8RIwmIjz5+b2Ro3LUb'
+        'DtWEDKRBxkUI4i5N09G5nn3roPz0txUzv5zp7G0CAcFwWQ7P3aNks85pHmdCW+3x6dPhWN2us91B'
+        'vA2fWLyoGgY8E/5pIG6BwJw2aM64Vly5Y6lepkRHXnRkTiaMcNIHNXvkT68Z10MXUh2mNVbekfl9'
+        'U5W1zd+QZ43Js1leaWI10XsKZcHoPbe0GSM5J+nNInQURrBIUWNOnqxomAjdjIB8uzO1rUkjjqNc'
+        'r2faaDDx/aQ6R5hpEqgRPUVz6NemvYhyDyACOXdRfVD4LTCE3xvfzO19o8QyhqEvKLG+VwfPSFh0'
+        'I0ge5YS1rmY8RUPRR8eHuPyfjbYWDSMyix2iQxG/Yq6gFc5cA7TRY9s02rsMUtpXmnS1l5zPQoUp'
+        'B+hJjOEh9TZjdHd92Y1fbAiG82eztPsivRF7HQVIskEGiWiEiALABjVKuiKCkV+aElqewPfvDCsL'
+        'hL44maRGZ4Fs/8xFbWihjHHDa5w6/FpO1d2+G+vGZ5wjlm5gEAUFKxCk1Qi1CKKw9ux/eEYpkMkE'
+        'KoLGDZvY5SYr4bjtxGZp8SxlnDQmvxn4RFwm5M8MFYQs5GalX2sSKdc/r8EzShAtdqyNvKg3nH5S'
+        'F80gCcMQC7dEYpEtND9YNCVRsxsp5Jp+hCauRvmuDNu7f9woKqA12iJxv785lHEG/0DbWASgN7EZ'
+        'JezSNiMuzS+p2Nwo1CotS+MuHyf4JHwK8hNlduHyurCRVq5j10hr9fptFjo27qHGlaKHnWzZuosA'
+        'tSjL1JuAq4ryAqDisHO2PFTRv7YqvyYnih5nNWw3df4TxNqMjZJJ8QnzV/VCVVxte3EDk13nPQ5Y'
+        '2QUfjFvTDesOty9GQ8h1TgTIBSwbADvrXscczp0FByX4h1BIrocO0SExLMGXU0vyNKWfprxgf0zY'
+        'hQfVlWJ1ZUEMDCH2eXh0vVZJ96/j0jtFhgI8p5zVqnluKVFFuwVYt6x/0C70AdgenIU5Tdm8eS90'
+        'MX7LHzwiFhMvdg8OTlq6lFtQkENVsa8KPN5oXBsW3Aa2xfOT2dAPWXUF0IHHuGbUo+JKynyqtQDW'
+        'Af2WJ32HVkxMZID3G6OtqI7uPGW1XmuRJn4JoWkqJcOe5XktR/digMfLnuJwfNR+rZxysiCId1l1'
+        'n/94OpwLzkdvtMS1yhlerVpQW2EOQfJ3AryTeEfSg7gkRKu2RagasvhTuRHnVC+boWfxoZ9DjAhC'
+        'gvNROJm3ZwXw3FF9CN5n/dZu8Vc1t5OVks5DgUo/s+G15pAZ3aNS3lgDo3rU4h/eQJhzd/CcxbbK'
+        'UOSGn8uOp0bxlg3ecevP0E/8d870RKSpCBQzRm3/xD6mr7nFYn0FklO1rODTQfiULkz4jALwzvS0'
+        'KPw4SGuCcvmwlhxBxukPeLLwbcNoPYuU+xzOm2pbCDruMXAeFyUzbwVHfWpxzFz0tEem1AobTGZN'
+        'cW2IBMYxEfdxnmeo4OCxKSeCjfraNeelZGl2uMH0EPWf/JXp85LjP/Zqnk3L6mJTQdWkReN6zRsr'
+        'hfN1np8Wy+L+v/mIkIfCXUJlEZjZLjfmMBSAwSTKEzSI5s76jJ9EEtpCbEkbODwZ9NDkYddo4/Jx'
+        '6I0+ogespgDPezREtzLKm18a4Tr0/UH5U/FywB3pdgbn0ucI3pGQxG8mQuMvDYpD80ry5qmGOty6'
+        'D3F5O67Gp/AzbEPbk6J9bLp9nJCdwvLxmI6L7olPnY0TwRAiFnyEE2khfmLxdYu5JAypfObO6yAl'
+        'bGMulWB7S8+2xepzTSy6VSVqrgHa8Yi14d7ReCJR7X6yqMIxGrM5DfaPuusXir6tyGhL+NE4Tj9t'
+        '8iBmvTw+g8Utpm2Rn794mWrHrMQ8MfyDKkD/VnFAEc3fBheWAS67ZGoQPzEtuQXnAsg/pIF4kn15'
+        'LEF22rmhk5slhWcHlurT0FmkKkus15eXR5oM08GwA06ia0pD9681Td5h+HzgDYf9tSG6+djJfTQx'
+        'yTolcRvfTa1KSlVIODVhwMU/TK4TX+zeWW0thLiyswginmt3Tad1N4Zal6sEiZ7FWDOTtEVFWByr'
+        'osfCfuVIvmFhdbUcbsAmPmno5KPjhq4zaIBnko1AYM66Z68G+7hgPAkS3fJIZ/l3t4BVJDj9KrM7'
+        'ab4EHUCwuV+9fqek3V02thFnsov/B/X8rAwSDrIRQKp3aQHE+vUFSDI5i7bdxJD3LK8GwA0CmFtl'
+        'N43M7WxgjeCGmQba/8hocg6d47A9BUwDI2NVbDLz638FESj89JjfcfUZf9bGslhxsqXW7jo8LUfX'
+        'ESn1YCfbC8AWaW0Fs+pFjUFU/y7Izo/KamVoKlAXjY32QwsgAFp1R9iBIHqA44ARMoSobiNQXhdi'
+        'PqB7KHKM3jDx3Ljqs2w2E01yW7w/CyjiXOySNctxtRyzNgYhoIwm6UuRD//9KWp36owuXfnT/Ptn'
+        'oIuuv9+6j4N2pX2iGA2o75So+FSHVYDXsX7gV1Lz4fkleC+5cpvxpZfCAweGj8pk2Zc/T+Cbwbxy'
+        'X+cQcvIJudcdrDB3S49NY21H6iYgF1hmb0wPOdMUhBa98RHecla6ppaWen+3mIFs4DKZ0bv4sqmB'
+        'bsZ34/7JMGWhubmCYPx2IbyFx8IpY9Y12dhUcKLxYoNJ2v9BDwItccfW7hb28l8cHkOz1GxOBbjS'
+        '1Z3M90o0EzpF5O2HwjeaNNE17F4BXzkTHzkmGdAZ+A44ZrHXzp5wsOUalhTGr0gYhb9JU2jllrmP'
+        'OWTUUaeY+IX0f5vtzImYG2g4dJjKZ8wX35wkOVx4IL/IiSy6lSXPknA3D9zOTqcAOdwrNXWS59p2'
+        'hQSLgJrU7srquaFujYadfRWeiZtcge8OnSe+MwkEb+7q4SLQ29IPkPBjCbZ00xvnhILjuuIvlYJa'
+        'koBexdkEOFY1cfWcLJLpKG/+/1agm3/ByVA1ixy9UGyPCVUs61YjUMjxywFU8DMP3pvPc8ABLKxK'
+        'Z8hl0SxNSMzq5XVjYcA8y8kGzAwG2BnSkir2BTcfh4ot4D6VBOILIgpOCrtqepbn57p/pv4jSV6G'
+        'mvJ5XDH7YcdtOu4mCmwFazBhyVw+auik3IYdMtOhe6iodH4gTqfhGOUwKhtj6EmA81KyNCWB2/aQ'
+        'sVIlOMvEq5+/tOSN7SGvSe/1Jjllo4JnWR6w6S7UjLDQ0ThvbO09WRueA611jfwi5GHntXIymvsN'
+        'QTByMpprJtnxnPZtiiw4BMTJ0BcaDTxRA5NGDbe7HfxNnunVfkRrNCatZJSyve+1i0CMSQrLYdnO'
+        'VOpqo3rvmYWooy0Dc7xmykYqv0sNtWVYJsXVu4O4HPTS2t337GLvTxCGEhLrr9iB4qHTZhUywgJn'
+        'EQUfe1Dn7HSvikV33deGoozSPGIEy0JYFmN9Vu1R/dpiu7HfaqTkzlGofZgmtxurx+Of8eL9QLEJ'
+        '+QnV4wUunXs0iU8gUtuDwbcpqaz2HUfKxZQjKLThuI4NxmOhR7Z4xw/8cgpQEfzpZBPvmq82kYH4'
+        'cu1RqrUq1ksvAZXFToXCiF9quL8AJ5UmJYBjOATTomgNv6if6mgW0lxqa99xDCcXVLZYPqgOfBFK'
+        '2W2l+XuUCIvsuziZei+RlVV8Y421Zpc8UHnpR8qiq3eG51jP0M0BMJql4gzefBSJGzuksR2Njsw6'
+        'rZT5evM/+I85Uj8ypMjQOFYBfQOei3D7aoHe8xivraqd3xeu/6bPPJgWhyQsKLJyUTBYUiHco/0H'
+        'iQ+xtw+osib4hJIucyrrKpLLCcjZumlmF8m4u8dZFI5rBm2NyTvk3SrjYMOkIiNJcibeSMm2rEtb'
+        '6IxxX0xdWyrkZKDWsP60Gj8iGghQuUl/4yEhUkUKm4qYe2I0TECX7kq6eLg2ApN4PbQx67nGxb9e'
+        'aqGch2kbu1tpOuSZ4mtliNetutcjFKSKZcefPi0VX33itu8S3zs4XeO9AuAB6mKrHcC2zSBPpqej'
+        '62ne6PytlMdlm1U8vTix9t4bwPYEf+DswytcA7YlAeSKV9AKjrA9Hvd3zy55XSptO9KBdStrOhiu'
+        'ZHd/RhzPopckK+ZlTE9sIA6j4oJoQhJjsi4AwVD80Ace0aWps2xS+vBLtHv82x1Rd5gYAWInuVfG'
+        'SiX6sCzdJD0Zsu4JoKUSRqrUZ2eZt3t8eMjzJvQGppowRyTERakJyjeh895+QxyGCllPjAZsHaDi'
+        'LZ9+aWKxUlsKVMenoKTCHS/6cdi1p1j/5IAIm0NtbooqTjGi5Xbr96+NnvRjCrgcYwDR99Y5W36w'
+        '/vziKb1pXxulQuvGPZX2DQ2eP6b9+LuTIf1NQxxsJk5RNaX8UP6FypiP+dsI+EYvoWek6a2odcR/'
+        'RywGAULOroLTe8ASaNW5wWvLCBH1bX1b4hnJG5+UimM4iuA0PuM4UCN/GyoVbuwm317K9Go8VRlO'
+        'wBYvoAml6lU3ke8lqTnm83gXvxC1LujbIOJIk0yM8p3GNNYdOGGoDNyRwfPo5yB3WoXXTBa/Hj7e'
+        'jDVrNzLPK9a/8KOW8gMD+MppmJMWhxRAHF1hRqKIhWBitmimNKJDXuy9KF7cDFHS8EJJmOMg4+9l'
+        'penS9pHyof3zquux+KdbrjwNREPe6OukZnj7jin6PJsCj4bptyuoT7xp2WZ+2uhuVqzpXMa606nD'
+        'YYM8exlBVMu9PcZwG2L93z294CzozMbz4Ag0oymb5iuT1nRAv6J3eCiWTrJj5iwjOlaOW5yMlgvr'
+        'PloxyVbIcNYA2U7syRdB4Autvw91qMXb1AHeOWII+DTNDNusKR9ORL7kesHAWDNdUOtv80k8y1mz'
+        'Hv6CN/GRVlExIvMzI/R5v5D9SxduBhp2BXxmGW3OpFH5g5skGmVkfWlIho72c6lXUItVLlmcEG2d'
+        'B6+tMsyWuFR0ztdc1m+sIERh4/P9wjtuOaDzs3kPU/yqekGaXxuF9BSJ+ODJSRqLG2aU5BqeyAY+'
+        'rTannL7mJZ5kqVWSa++E8epSabgDMnLi98heSG3/aqOO1zbeIiDmI+rfTXPkM/pMepfYEnKwxowg'
+        'OO2kAhx+AY/aJrMgS2JqytuMRClH6UfVRX7PkVKtYcVVIQLhh4ixgiIg9J4TAnYMW6dqA9hL3Mq5'
+        'cBfjRA7i6kelaMPGg4lhcv1NpgHuVsRVs9YwkopDV6XBWxLSUM3VNMcT3hiN+vZ0qmHBU9HjMiu5'
+        'qOISAAGjfrppa1WJq+HgdGApaRlVry6wAH8NcRZuRFLZ2/wrDBBUI60UU2rtxw9YeyGjVr0Mr4kZ'
+        'lihhZ9H4QKBCee+alLtSbxyIcn/Ysw9bRBk5tXzSjvscZcIbiDdQmTDt7HlEyT6Kw0fvy8rXBCbu'
+        'iTSAn97iyCyzwztmmwLhgLq1uXCHGfCtmXgra2OOLdjflknb3F/2t5Zpe/VHclXPCORxk9lFEckD'
+        'UlIwc6KhD0MszT/E931FBgn/Y4avtYmq6iQSLvbXi5AXf2L7rZ6PuW1v5QFQdDs1LxX28Vpo6PfE'
+        'jLnHWrNYShSViksOpH6cubXvEF3UxX8srQdceHmHyRPcE3+Zcqv/dUMcuORX64bpzCxuEZ1ToxQV'
+        '9ndEP8loG6WykgIq3RO1ju3Bm8L29Rf1HC94gpZTVj/mgup8XUHDM4IFmAkFcOf2yFHmYTlERN1k'
+        'XX7DiOJKtD7XR7wjsS/IYLGjovAsYZ1UISDXF7FPcEnLH0qJmhabeOtPI60IiX/P3FzFfTV6i/k6'
+        'Kwyog++jrl87HwWPfrU4ea+8EDEIU6XqvJ3M3fR49rUjftt4n63ISCHyDJsIfW/kRSYyeuiYIsJP'
+        'YAypiAQWgg30YffU37pIZJx0TkT0Uu9a5ng0GbE6d1LJHEGhYzvVCzCQcll8CcLLjkJCZlH+oeKq'
+        'RpVj/QypQWpQuM9MJ8kdjfC3UNo5KWK3PWPq1k14ox/RCPGpPMrIaddD7H3x+784LRzvQqW7PXAi'
+        'hXTepxtp746t83rjRycXjU350KahMLOqNfzSgem6Qba/vpKadHF1EwCAIYdIGGl3/xcNlHFrOgeo'
+        'EEAG/MMkKN8gWa7kJQ9bnp6+1heNcBQWpxNL0lb9xW5nqPKPf2fvf4u+fS43EPm6+UvPd81pQAkH'
+        'YhrmjtMvdHnP9/IyD4Un8cyL43duay0WfILKIrYUoJM67jgoaCBmbckRe3/hVrtVYSXMj8Citq6j'
+        'RToDEVwmSpIivHGzcjIsGEEC4Mgh004Z/Z0SbmB/2kPSw8z3edAsYss4ffQ3h4XkHpcqL3kATGDk'
+        'ZdXL5cPFKxjeA8tzeN7fyWGPwStMLII2mJ+pMH9i3+ab5xp7mqHMCRv46hR0IKFd9kHCiX1SREoN'
+        'MU9BlldMsQWHum1mRBBFAgKQKCcMXMHggn7IVVGjBk4ycY4SHsxzIo7iT+VpevUH0DQ08lsDBbje'
+        'gROsrs8n4lsyv9ekhx+LuBBhzAmkJCdjQqY+PS6yDnv2yisUBxTa/w4Vs3nMc9l1spVyhosmHPNP'
+        'JklrQF3V2DkN4rPNPbpLzi3bVQWTdWGxi5XNQkz/UA3EBYNkaAc0CgvbixO7wFqg/g3llzBSQSAF'
+        'qGH2R42Dtkh4uPM5sSRpNx3/BKggdOfhXV+lprjaCNYfoE6TjYS5ppu+2sSvWfaSdecEx4R+rUsb'
+        'BUJwhIpTXPg0s0L+wFVvBr36Npbd9AqQbM5bAdcrmj1/IWDPcwdLGwVZBKeq4gUU11mP32udkY45'
+        '3jbiaYpvN+Lc2raCJmaHLHBiMDfIEfmLZjFXzJq9eb1syRto/MmDZsNOJESq70Un+uu5o7ewNQ0r'
+        'Zt8f5/QsBCxS3yTi8xXYetNGRbCO8Firo2NQR6uTmnZcACCViJMK8X7zrIAva91BZpfRH72LIVz6'
+        'lnklN88bd1gtzEp8qeu7yuqCUDF3zkaGbwu/KNnJzWeJCRUkINyGbr++7dhH02K8IZ1uB9Nd3B6n'
+        'tTQE4cDAuQgAGUspBIAgrJX7Y+LCmKM4xP8q6y3bBQ8HmdMhwqyFqXGty46T4UiBf4h7SH4X+fAw'
+        'rk805O4ViDqMMtqQtVbpZvhS7KT8oWl7FPMBoJhY1o7HOQYcMrSfQRk5G9+t/TdPMfSZTK+s52Tk'
+        'dErZiPiA1VyjsYYXzOYLAGq3IeDE2w+vMjPl89Dji9Zx4Tu5IJDRrb5yArKCC+T+PV83RxLkxFjO'
+        'w6ntQkOFmw9kGXF3C1yTz63KYDSRtj6HGnusOhJ5Fy1XDVJBIS+jvQXM56N1mnV5tmzlfMYvtRhX'
+        'dQs1t8F5D3lrohVBspNnR+D52/t3W/0roB80WvG8RIlSL8nLLC5/Q2iTU0BJcqU3Ye8elZGsRLxA'
+        'rrBuawTyCfCzLSgcbumDjf2a9HFGC/dXaDy7rIrjklYb5zMqcgDwPO7vtfwFcOFwEz/Lz6fnEFkF'
+        'YsZgOKsb1pe6ayOWFTYHITYY4f8S4YRc/Ar4RVDm0LA4AJS9Unbxw+ebQl4PUUBaEspF3L+1ogqu'
+        'fu+yCylI0XLNdadIPNhM7TruYxXNDq9cDwxjLD2sX5W7hvcAqfo0H21jYVi3BZ2JrbcFXuj+AsgG'
+        'HnyciJIQNbSlwscxW1pPYgqrG6jmzMo5uBx4qgJHf6A+uIliTJFM25uJZtBTgbPRrSAE9L8pzAso'
+        'JhWbc0UBaD95lWuaUsa+quo6Cv5TF6rbAJnP+yMliYlrYs/EN+lak0LZTyk3GkIg4hdBJFU4Kqec'
+        'SIyXUM7JdzKIH23dY9EH1QO4uVAEAhgYl5I4FPBC5DHSom97ta2PZqOCgd8gbpgcdCY8QyxkeUeF'
+        'E/EuDMshODwTzGFTCZASEHISx+1Rnx1/xHNmCXc4rNQCz9v/rV2mZT6e725CK5qRhtE/Vu92B/aE'
+        'H4F9XNsBdEyGgKUVGIOUs7XoGH9IecQmtdSiAeMR61v7+P6a0D+srwGXMNLSl1jOyd+IG5j+ljWE'
+        'EQYpXmALo0aG+7r8oSnTyEwkGt2I5XKDyHnO3KgfXlxyJAXyRpEQpZ0Fg8HqMf07Cys8CHCONjuF'
+        'dVZVLZrFJ+kuvFBMFgqy0v1PXctDdRjatWGohWaDvvnEvkhdHwUbDORQKh834fsvc90nUfkt9wQ3'
+        'GzEmQJyICGc3mIlpZ/J2ym3Dnj8ncsf9/9baU1wr7ENdITbo84+NLOpd4jDxp+UQWczG9esmSjm3'
+        'DZHoFPi7bHm4r/9ThuCSAgh2UKTobCK9nSUJF5FchtKwPj4r+d2niJGDUcKM1WxEJ+6WSbYaEY09'
+        '+NReIDWxYZ2BJu9bnw7dmeMENRXzEZq5nw77ebY8uevO9aEsz4Q+QZDzLPEivz/wOSdfpMsXjaw8'
+        'JVP2skOUCDYl1es2ap3DufvG/qtkeK+j6wdB+1Hw5aVMxJhXD0153qoheBSVaWdwBnzt44cz0k0y'
+        'oSAI5Kf+wWwpWfpkArdMuMKap6crL32jC055DysaRtX2w/AYKr9DN6lXZXGIFr5Px3CZLrOOdYeN'
+        '55+/JWyRYgjYfvH2DJxTE8lj6u/Q7mmt0Lpp8bHS3vWQcb1PRRFRqzBVc3IPOA3Kqg1iMF11kr5C'
+        'luRtJaGhAcJNrZQbXs6KGLDpA9hVoVEnrxbM9KOsEtLfndwyr0cboFYxzn4ZKr3wlr5ppTA0fDZp'
+        'BpHJxie0QMjXWvtu0JRAmV5lhFQQRQU/JwQ/a4OYjAYwyFJsgOLAjHM9U/NaxAxA0iNGpmAjawtD'
+        'ntsID2E+bm4YXysrAD0hjz4qCedStuprnnbEaeKGzKDQWSTr2j1XopjJaafwpiuqOIXVLIqBPPL5'
+        'a3UB23B+AGwUfINVn85SFRYmCvmZQpEs82S8U88jalaJuufFIvtaey3f1ZMt5upM3m1O2Ux7t9av'
+        'Xzbbb5qJ4D3VNGG3iIOdb83jD6PMXrLYFnPBQ34K1rbEiEbd/qLbwB/qKsWBvc3hptU2OVQjymRl'
+        'yyZnUHR3Sphnx+VJJtcqb6xLBKo76L4J6KDE59oesZ4sqe2AhXKm4pnR+KsBzJ5qBd9QH5spc7xA'
+        'U6CriS1Glc01m9+/2FYmPqC9/koE3sxuxUqh2GNKl3sho3QpjkQRM0BGDolT00p6sMAYT1oM+KED'
+        '5dRQFH/eNaCnZumG/Nx6P9HPnt/8rg3rLsFPUhP/qQhmpgyGI99Rbtn+KqfYYxCJpd2m3Z4nhh1x'
+        'M7ZMNM/8EdKj/WXy83m2A6FthpLNDxMCO1+rtVorq65Pi3dwFDhnxQ08gMwxJocm/T5eNxmi8umQ'
+        '6rPAmUbcIn29d2YqFdD5LmOJenSDstP1VXT4/jBs0jPJRCSAzhZMe04Ba1Lw7bQfuUAlMOcBrQhV'
+        'OrYAdICUaY/SOoBveHTfKWYX3/1+i7bTLtD0h0rh7xLXeIWgu8W/Y4TMP4v+eKgroyC9QVPMuYb1'
+        'QzxlYKUFvuI6CwLRfjgR2UGERA/Ck4TDKcuv8eo6OaWf5i/+kz0ytkvs4nBJa1bgjkwhcYHyP6Kw'
+        'hFkExz37cr20bYFSKIflwYvk47ukBB0STKF6235j0fV6lxitVl1cMjvYsmt/m5IPDLzDW8mkkYv0'
+        'ijlLsXVlD6PdTx1P2zNqb0VgX93kbTU2RtzWf7U2kY0bSRwkPgBpm0Lc3VhkBrGx9zW2xqnfo9xn'
+        'Y6H+D1/WaontkxQhAB7+NOOTwbC/wA1UE0MBQOnwa9suLGX9jqkvUkH2EaUsb2yLMgX2VLGu5K+x'
+        'dCkG9NEzClp1PiZcz/khudqmBb4XGPvl8+MsCWbKoVcB8/bPEqmCDArijD/ySm5AcypI5sayfuKI'
+        'egSJr5Jov0vTt+wyI00h43Ln+/CNHI3N+MB0gczAAbm9N+B9KzP5d9NvtwOanZRkkO+6v+0139E7'
+        'Ng/GqOvs07ZcMQlwJLbdnCmriq0GLfIh+P4tRAc8F8aH6Buwn5RghBm/W9+2Ttau317ARujSCRgW'
+        'T/iH8i8BDHpfUoVZ1d1s1zCby1W7AmhHx3PsaPmN00tTMBLseL/6JCKLD1ABuLonkWaoYp2tNPUG'
+        'oe/xCv5Y6I42/unuGdJNAuAbgGuZFRcA1ofIvMTuQsl4x6V9qO7i/W/zv7EgFN2Zhh1ej/bNgdVM'
+        'K1sIhFpIQCtXECP8+S1vtbKQ6PmXRxOILo2aQBSTRUSKeBnarzdWoI2rD4Vkc7/lgYMbHVh+Dy58'
+        'eWK02Q45yzHJAoS86DN0GnW+nDsgqwbETXwNxwWpH+Y+3ZJC8fJFHFhduX8C+Xb3b0AAoTXaRf9C'
+        'oDgjENGitIcx624KBXDurwfOvXO0VAcPlj0yCDtsSCcS85bse5i5AcIwuGgrDV7Z8WouveGW2LIH'
+        'DRRDlyX8IlNKzLc+TjfnCM48bb9tm18XIGRLGmLXXwXbA2vd7F4frc9bvecSEDJTqsSUs4rT5AIB'
+        '1w24OJrFVnygppQUWvz8xPZvfH2v3KPMNpl6eVuF6shOyiSZSmzHW+57Zx+GzpxAf6N6aJ6/ic5u'
+        'n9Sx+W26lWdmTUHbsWGCJj37xKRp3MFxdDXY6ybFZzoLyFGjOmhK/NkI+ZVOH/bN3DDzVAmOFwFx'
+        'ISOuWF3//xnOWjnFQd0dMIqA1lMwYYUnnagU2+O3GzHYkWXbPv+94MPaLbKvTqAh1oxW6vEU1Xc+'
+        'TdLUZN6+EyL/csuCkrWYxYNQYGLzqzWpaEGmOdL6Dbhg4osCc2MLGaKvw2ShaWQlVsevh7JmBhsq'
+        'lRWXCG5FzCd9vffyDxFLNwOxS14o7zxQqFZeBeHAbEmpCjyJfNVTdRD+dFnppwDel4EWhG3Bl/2e'
+        'HXOAZNIlUxbbLZNqOf+SRGYrr6K0Hi2biRf/nPhRvnQUKFfAgg25oDHOAB+/ldkyYSJ8tuuqtRh9'
+        'c2mM0aTYe74VdmDyLdnQEgo+OEibxALxYqOs46BtDLufeAm3WCfrU45XFmRbYnA0CB9Gv+fSlSL+'
+        'tYp3og95Q46bLqu8ruXrbTNqplK64REjWIWQi0onHPczCsNAxAgYQngOHHoRd52RtjVT7xztXptt'
+        'EWdOFa5pVAXGuaCcmMO25VdmviF2tXccxZtp+wkPVus88Z9435wB2jX0rHGFk8kE8Uqh5BvXGtE/'
+        'nzS+haButosY6WZkLDWfs0J8pxz8wMxmQJcJwBwWvyZuzFWRNQE25inbUmCgcO1vlldCNSkrwkSe'
+        'Nf1m6OmQyWuXjLL+XB892/LJP1Mp3YP4jEm2SJ15J010gUnCvAk1AaSsI8xEWP2ocQDfQ1US+mI7'
+        'eGyyql7ImmXLDgaZJVKXjA/7sLePzKewkDyVZwWZNAaH+Oi+Nlo1BHWVUheS5Mr39e58Pfn5BNLb'
+        'w7M1jYHWLeD9N8bgnE/Cw4mkKXOrsHFyjSznouECtx51lu79HVd0qNBUXVAERVveeWR6kYEjT7R2'
+        'lOVb2vZdBTqEgOl6YKuAr6NwNQsId0cyaW0swhvL7fHQIUnZan0y8HiMqUfPaZweY5ujchrTE7sV'
+        'Kyzw3LKZx5KwjLYq1jn0RMJj2DV9Z1yaFVj+40RhmM1bEJI2Te+ukBlcuNJNsSpcRvkKKU08qxb6'
+        'bx3Qmzo9OrMWFw9a2x1MGI5W10HByN++Ai/z/VrANxET1tDQCGQbGRj6NZ0N2bDFgMgCsdvutEPQ'
+        'pfZMasHOY6G4U9uUNrCa5R9OsVhTmzvMi/zce2Pz4VSQesmSDuzCII5lq166DDnuMYRiWa0Zv1Q6'
+        '2Gdv4PDjwhlZnboxKT2qXgvBCEtVyy9LpdceLUlLFAlS7GdBiLjBcvCYV04usvUu1OOz5kXQh0zU'
+        'tMvqkIgkXnidBGYyCIF6YuxwOYSCUxYFjeeaUldyM5TK91N5lO7pFCPyKny9OjjErqwzJur3RStq'
+        '27Hsv5YvBUsEtOOSzcEz3Bi3MJ738ZLrzfiv8nEgGpNHF6SzveHmNkLjBL+QnpSw+Zvdf0U93Ckv'
+        'dVUuaXQvo+aZX2hQ8WCoh7cY8Wd4wH2VO35Tzf4KJBi89i8qh9Zhn3QARaFB9Kog4HEcSUuDPYDZ'
+        'mra/HRKbuyC1IcS2m6UEyGM0hv0AgsjisRoPoTzAROILDAL66Y92/ws0Z0tMC7A12y41yHr4+2fe'
+        '0VIl3mJ4YFPa1nt0NEXi9Vok2evSLc3YNawWZhAGMFkPkXiBYBNNsBkPM2cHQtm5FRlHm3b6naQa'
+        'U+za8yOX3Xa8wl3IRzGKB5PCYufM7OX8wH0RfIBp7/p1EqplIGUI1DcTWRO7188uXmqXlEGS48Tq'
+        'yLoc/XQblXCyN/p63WiDiWjwHkFrNQzyZsxi1G/jZHPn8ewpJKxRhL++sGLurZzpDZ/1P5dtVBhP'
+        'FMHwNgMdBBDcLgBl0UO0YzDn9kZLddMtCOkrFlzR/PHJraXOQkqKOQq+TN3hMl2a3kRjRJV2sXFF'
+        'c6iiHzcPNL5uWR7yGX8U7yfed3QaZTswvDT3z3ZkEKhlx93w9ICJJNEM26I8qOf2lnCV6dAqXJXZ'
+        'GBQjc2v0rKzqSnqF0aXp2U7v3CrIKSsR/7c8XWPOs2gCiz/s2peSPzUPcQ18LNtD6Tl5NEtooO/Q'
+        '4dRUIm86dlEsNUBWmhqdmE4Um3eQueWwpoyumP/mUsMnAO7I9EN3sLMXYm1w0KqjmaB2CpTOfRN1'
+        'x86gzx5huo0dlkN6/L7cNmTw8A8sgNacKd4ZGEgeqa45zbRHGeoQqMPh6Ss7RPAtUmJNGAeoTNP/'
+        'gG1YBP5+38wqWqquIZ/EA7g10asKcigneebkJwTs60/u2aohrQ3Bd9fcxGc26B7mGgf+kCK7ZJrH'
+        'QWEIt5Gadv43NeC1pD1j7lLUAdplDllHOIrWHJj1irSNYRQfPMje2Vf/D6cbZC3+GnnZIlob3i76'
+        'dHr949RsdmK1+vQ4dV/lFFI7ssoEN0BBL1PIxdNg0/L0ahRauu9wGxJJfH6e2H2tEg8XlRtj2NsL'
+        'TFnKnmofR8ski9vbJWcBdRfbxHE17ix8elbUwxRh7vEIGvtU8eL9sr74uVpcmHWJvqlYYgBeRuDz'
+        '5OcE5MRmvNqGJ/TmZQEtjHMOrYA+6x7GDkR4mKCnJMxMDYs9vbO6c5p6TkspRdWiKecRsdf8SAPY'
+        'i7h7p44wzOEKXeGPjx5AMnywPkUXyyE7mnVpUBLdEG317Jd1Nak95HuKQs0XaYc0c3NJ5+ldVM9c'
+        '6cVMG7vH8f7w6HOvItk4Ivp3Y+ROThnaZPy2BxmhrR510znmMGPPK7EMo27JzijAYuxQ4p0/QrXs'
+        'm0ks1ImOwt7PqPGXTrsMN3cuVDG8nfQxJIdnBKfmzjEP12J8GSOcU63rdY7m4ObrfZuxleWTPSvI'
+        'muWWtRWM6bCTKAfTNHnCy0e9eNaoCy3gqBrx3lUZybmuiKGzCA/EHgml6mhBpVDFY164rpbwyzji'
+        'TyjqyG5QxF+ZCigX74ZSJ/vZFQIgWnlzP/YOGs9b1yDuIOOdvhy21OGeto5rt8z6W/vWor0SyRyJ'
+        'RJKoHDi5g9bTTExGXtZzFH7MqFlHXH25Ggyi288NCIbW+Y4ZHamQGm/7ARzVafq0M6SONzRcX/JW'
+        '7dGf8QSKI+l9fyEK3Q+aZl6tSW85U/jJGdoCcyfLSXcgQEQ+Z9BUJAZu1p1K89GSWQolAAJ318fK'
+        'lc1OZk9B7gPDV3Gh2PLJquMTfNTY+Z8xX+22r56wlITB8XX1Ea6uChMhhzs2lWeph2usv08X0jBW'
+        'go1b0YyrT1mKYKMo+upMRTpXRDG9/RB7IQFW+ZaBvLAN6NyGDwaZ/SvuuV2RaNg+S3hvoKE606zh'
+        'uJPyFhI+s3oRqwKcLFqQZ1/fdiwHaZPiyAze5xNqJy7i6ogjz96R4P/2hZGjN1Gd5/tEO1s91ZsP'
+        'tbPxZfXoa1r/7lZXSgynUB6EA7axPD2uHo79zC4XPwoGLETN2qGLXPsfMeqOTjtzO99t8g4I6XmZ'
+        'g+73fquMTDcsuQRSQizq5s5Y0j+pyj97RzV9SVRXbCxwW88WQKb7TLiRq3O9Y8XO0dBRkuyOrjV3'
+        'ifoIeTS2vo2fkVbJ62byjcTUrr1lV2BAMds/EMOL2d/hI+K2HM1UIonOXVvKyAX3LGQLTE28M/Dy'
+        'y1k18vzOagZ2rk2lrtVw8y1TOX1nbiQUqg54k3a0Cxld7e9dBjMuJ+MEjaFs7JxBSEQoJ6o1FLzm'
+        'rg7dU8B+psCHmKPz8oTkUqKliFtE5vCU+6Dy/ACZrZtJErSo4HEVDtQztzF61okt9GHq+YEYCqnb'
+        'X7KrY3AiBmm2ajVjkDxvlgJlM9wnt1/gxsRCrYRdg2vmRblnbtXfMktS+vYB7n3h4aGWfmJ1mELL'
+        '93CE+22CynWcMM4Bw52ATAgjRzJ3eQlGO2B8K3Wn7r0luv6DUI488kj6N5Oj3H1KIrvjo6KMH0zs'
+        'Uyh+wl5kHeEq/uJnzHqNAAGDEJVkc064yLkdAHkUpUzE2gcQVeMmeCK7ZcF8cCbiTpYKLY5/cPUK'
+        'CuGGabzBeHZeBjTvQma/5q3+7fbiePit4LCHxSFGtU1RBYuqUxBlAukopJ5XcGiED+8j/oGB7bEY'
+        'QG5J8DPIrBKnBzF7nsu9eJKvLKW+Gb98VUE0+bQhzLaKIgDj6plrr0/aC2uylRYw/iUH9bG3twSJ'
+        '2/N5P5tJwtzVTmMoG55LFSCIjLBUbCp0KOjXpAf40WcFSjt6zjxcegxKNK474JOsRAW1s3WDqQ/K'
+        'ejsHU2nWuBgRCulEysjPP0kippTNRTRbUahgnUCBaA875xAAp4Xh6nsQ0AxDLPcxrprf+EkWNw+r'
+        'SXTWnE90rgzaESC6/JfCv/U6coF6rTr4cbub35ZkCoY0i1rsfyAjhwXJlfJOONWhw6yXilJ/Yvfg'
+        'wdOUOcZ9vvKTHsAwjlhl+xJPeSEuZwnnSOUnFPjZwuM7BOxMPg8nOSf6LaZYeCL+6tcvz4O4WLn9'
+        'DDoYBRtUGW/xr4S+ZSasDc6T2xj1nYEcY2TMoS4odF32Jys3sZc6A4KG/7Z3MfkTcse2Gv0yktqP'
+        '3Deh09HW5Cq48ycoLbAYLAww4IqX43ERi/ReaBh1Ee5tNgxxIA8AAl3fh1ee+PA+LScXSnkMX7Bk'
+        'DcTn1ecc1QaPmicqscPmB6jWROCBq58tqBMc4I+ATPsKZUBUEfuIPdGSJjWdHCyoU7kJxQFSiz3I'
+        'NZVtOfrcR4z1fJf1Pw1bCq5n3cvJIwuauAlEX3yzHV9E3eXCSXDIvJaSN3U2LBuweqCNRPCTD6vU'
+        '+XkKYR+oMpABGhavao8gRGd2RP93eThrYTizXuCI8ElGKq8JhOn0YJKr7lvp95bqQZzWDqu5YZt7'
+        'rxotQrXrKEcqKqncjiYCoKhatYKVUmJe0XNNFZIHmXNyMD0aR1WzsqV3n+mXmrDWlbjk/FW0bXnK'
+        '2t8iFLTPytoe/VLL5uKQaS6OUsKFSEz4ILD0MeK+mgRpSpu3Fza2caVkWDOTg9U6R0yOE3pUtApz'
+        'DwDnz79s4V663pbwqc9LrpoMVS8Mnc35QcnsyrhPra1BVtAFFqJb/ig+i5BHYov+u/9XoeF1fo42'
+        'vjreiwiLRgf9D5WkHcYAuIOCPCWn/qkguywWprpHV/7GpajRB4lbvOQ0ULBIy5pqkuILHOePDXp0'
+        'iGf5JyBLbfdhF0yyCCflStvxD36JrMuW86s6jWfxy38cv5rvGHxvn8TnTuxzW9nwD6Iw6PR41nlw'
+        'HcXCecNNiaVzfloacZlawCcbFpMMqtAbuYw5BBs4sGnJyZQrqAlzrXHR4rGyBp015llZ5HmbzwZ9'
+        '6Em55Hh+0qjsAzuo0aHjnmZwRPIn+5D/9ea2Mq1iOZ7oLvDHRqyaG0Lbwo8n7IrMsnEVZ/V5I675'
+        'gb3Z6u+dLgdtGH6Ax217qbw9AuaZYRmll77BgRbhj2SMNP5slQOE39oI+yLP4rUj3hQGQkpBtC80'
+        'tuYs9Od1nuDpeTKaGwJhR3mMv591PBVx6E1wRjKoDXes7R6hsrLVtpT2qHVFwBgWB6sv8LFOg2XB'
+        'hErV8VXbsCwUy7NMMgnhopwvhy0husPqh9y7MR5w07EOXB5Kj4Em/NN3fuXyOp68mP1HHRRuL4ke'
+        '17myMNXuJpjKYKOYgocniqnNY3cmNgyqn4fE10FNb1wy56PCYlZxqIUWrq/N8vhsHmllo/10raOB'
+        'ox84+J4IdTyQWgHYQAzrFmg15IbxF7XIfuzL7CL9Yx+dnid7+E3b/ziYZZYq0t5SHpQw7LO990Ur'
+        'mx3VkvMBKpp8GzWWGR57hCbhkK0XaBCN3HP6rDEkJJxvtEhTJIUbUqVQNAu7Z+3flqYazESEbUj2'
+        'uVWkK/hbN8rozwBUlMGpsl4mTZRWhwzsx2J+b55KSprL/AMNCqG4hP2N6bV4pOwJkaE2xbMTXHtM'
+        'd2VZ8n0DSDnqeOQGHYIoetAtKyPM9Dd88QO6CK9tNLY1HPch+guX9uJqeCaQxEtIbObr63JBIr1o'
+        'N6j1wUTIRTsUPal2E0TGfFari4ilwdDCKWrqsF2zhT9LFF5EnV+auhGDAgFJnzDcVz/zAfdbWvO+'
+        'vguCGDH7ldWA9zm8Z8mGpH8P8DiGeSSrG6kLOYp1VvgHGf+ZX0lOT8GvChSOFJlOuuDeHVUroIuO'
+        'Y35tAPPw39SULZiTRJK9dw2a++d3JxnbP4LblMo10QZK6qAd3sP49y730E+oAjOtGpSzf5i6nsyn'
+        'QaLSCDMMVnCQWxcbd4y4WkEqbh/TjaNkmCKcTJVvPEQ33aueucyftitx6mowxktqQdZJGI7zYleC'
+        'gtnF81CSRvuRX9S/hynlV9QBsKxsfMaiiWr3YuZ9JLiP14lqjMSldGMDThD21XkJfiT8b2rIq53W'
+        'sKz/lW212FuVValzFQZVvbLN0ipedjuhV5D3EFQmhZaYMqQ0kNOX6Ma/pFBsjyez5mWR48EODfOp'
+        'I+4VipR9IAIf+I6EWBkq4dP6mS5fqQvUSxeFAQ9Aqwv3QywuMdDbwC5T2wBVeA/wo1tLL1P7Gl8G'
+        '+hSNQkMm2BxE+7KQoXbmcpCVOy9ICqpP44qPJoaauldwQH0o4vXT/ipJZ+rktTtMkziNth1xe8rh'
+        'tqZtQbVIX00UAU7CnblQJywBjuu58VTpROP9xx3L6gakif0Lkqt5IcLddQHP14bfTOvbCSJQ9HIq'
+        'FSK9OTXOItDZSC6Xv7lbwsXnx9CgMGpG4UQqwlG5XLv8YrAkKqaUK8JL7yoNI8fyHsYlEha90Hn9'
+        'KlZ3bGW6vvjkE7QtukRBUBqvEZFHyc3qkAAm1n1kALVtpUfhX17IDx50A6Q/TxGkjsg97vvWIZV6'
+        'uJmcJLTyxTc0TFCJHENjYY5pWKASg00TvLAj8vtQQIXfLc4UV+xQrz+jGRXcC1GBZzPkUFPIfOSQ'
+        '7zJ+F0lRAllyeDDwja9N0+I+ukGUdkl7K9JGE/owAQ2bYH5JH50WhZfBrRtRXlrM+HooscTckzbt'
+        'FjnyuNEpBok5LArB9piyae3bu/+j+2MwREhMEc08405b+5c/x8R0Hp+F0f43ybUq07Qbm6kbiNcO'
+        'f37l4qh8pfL5EDIXbwGokOo8Px7xxxCAsJ5vyBvPvaPPmbhY7VYcDUKq+tx2AsMHKQb2ioJiHseq'
+        'eLxNbKjdpp/GfONsRK7n3Eai+OzlRGMALR17YV4kPBS38vYdVNSu+R6v2sT7mkfEICzL+tMTUzKJ'
+        'Szg1Pgov2RZKg76JG/04cEerhGAYPPMr/ovY9J5ccPpKa8UIXLuhmVqH+NRtALOVSf+HZSZbkCaR'
+        'T6C9uAC3dXUhxXu2RoU21NbBxS8ftbAvOrwrRdJx8P+mbTfc/2TYXjNmi9HRSufY8QcJq0MDk8aC'
+        'iHxDWF6xXXKp/kfdT91u3d/4DviIaXlQTLgbPOQ6tAuFSjxORJXvqaF1PLPG8wLbKKH6hlIHANnA'
+        'LcSkh2VitEHrECk3JAP/2PMLQQ9TVsnVU8RGzZATSj4PXseiJL9DyecbTYTCHWB9YzaUR5uMNCRk'
+        'V6/bDrwCQoiZ5huOYt2yZZg6YMT9BHVVRMRo/QMBDe09gkNckvsBXWN9N4sFUUhK0BNCaWj9ej7r'
+        '5RhC5IRx7vd77LtEQ0WUkSi9uVYenvj566INoSbv4s0Ows4HHOLAEwQIsSzg3r1v+9LjXwuHo+pJ'
+        'L6Hg1X6eqP2sMjJjW56g7SrDCMfV7v5E278McwLMILbPoQmlPqYIuTYGAKK3jnrfWKODrdvU/QId'
+        '6ObikQpxJ7tQA3uRJBu1zELfJm0ejqWgIPReqmFPYatrl0l5Fgw1PJgNcmdWK9h6Rs3kXmqPsF44'
+        'OOtVy7qM3ctzreg4xrmDBZL3oGS2zjXSNTE0tr31Vtd29vPXz/3GPsE4z0moRuE+QvQh0khxwqwN'
+        'QwB9dOd/ZdWHZQbfAOBWvwlTTnkzA9zPCCM0Ckyyx7TcU+E1fKTnNZW37LTa+plr09s4Fe2vDlFW'
+        'EhPejqjT8pQvtkHZqjhlCE5Yww2sJ5v/G+L9T+/NpQ3DsjhiPXDuxNfNU+nzgZrEORIs/tZEZaQ9'
+        'v0XHHT14sdqJEfF4xatQnAW0PoYXayc7psigcQ7Se3kY8FQu7uci8YCMAzsD5r3S9/QZH9tvvP8n'
+        'NBPK4tSiArpr0OX5C7i2cJXMi3Z09QXQUUt7ywtRfgh111bjPDeN8zhw0Juv4hyHikdWNs5S/C4a'
+        'TB19vxpYy/GWusS3gQ8ZEcKp7OVDeW7rxA5hvz3H0fd2YdY9Uri1UdqJ0/86nwZfXOrItkC9Scz8'
+        'nnoeX0Asqn2sI4jQr4NI513UdUzRMM93f6ELGwFrQaw0VPzUVp2CcFblFYfb5ZAzlxu0bm8RzjUh'
+        'FMZbi9tTWmEeL/9bBUE0BcI50i8pwrwaPdl0Z0AQ0bPAKXiCxdB5wpdsz4AIe2rzizu02lXN2kxB'
+        'AUDS6L4fH3iGcPjHY5nKeH2EdlxUMCMGxTxkxW/gbzzabfUhDIJ5PE9wqSc64dJ0gls4PK7jggk9'
+        'kLJqV4GNPh6is5QlJ1/FwAcKyKpaPV9JYuLh+oXFvx8123Qr7w+4mbOL6JoSxWwpcuzVIgBYFAWi'
+        'VpzG7ctAScOuQ1WFAh4dYorGfg/j5UKqGUSbDMdXS2XfteaBBdQiyBYT4uGS8btWxxS4g5b6hkyB'
+        'sluKVHJtxJ4+0RKIBXOXAv7OT2zR2bNuEfxphIbOMNljJoMRVfllMq7up5iLa39jHH12meYYKogS'
+        'YbnFvdUok319q6HYUsMVPtbGMIss2AtHNT7IQdxnYQmgLsnaZoD4ffp2pNRiGELa83zaYEL7m+md'
+        'VYMhjvNP49hy64ZJPxbi/Y1aRRiQVD11+P9q96SNfX0ldceCT2DDIlOiBxl3/d6Dd7gcRwaL2zx3'
+        'UN2lby5fUKN/MVt0V2e2sgr+VhXclhsKTT8dwDgz3/jH2r71riSHVsjAMHihezwbND+rm0DXEDuI'
+        'QQYiVjKswkMG1VE7bD7bP5TSNyFMD/7NokRQ7LzczlXh0EdDk/Wd3lKwN790yp7lQWE3sl0a1ZsF'
+        'c9CrYk5hmNXbL+N8Fg877YK8HT37xFBkZx3Gzc55LAfVXFsrKVGjKse6aV0bJM/GT1UT2wZP0sXn'
+        'VncyGxVCVg6IoGnfNELOqinYUs2bay8q8O9l53BlO9M+cMecmQ0+yjhLuGt+/FsGZPAToHoGydOK'
+        '7ppcAyWwJj5NLCJFILAey9HtIW/xUUlWkeGQbPSNvAVL7YgHPj0+Qlb/nLeuiEWRfv+doADp51At'
+        'AVzFGFSePpl5lwI+trO6crc+fBOlcStscP9K35NJ7ffTBd2CjIghJxL+8JK4m0nuXrZjFaASQ6z/'
+        'bxpfLhc6BALlE+EpKQVTxBdHa0aoAemgPgIzmnOjZ+zo22L5nardvkkAGIvOnK1EgYJBSRFbBcFJ'
+        '95K8B4qrVqIiw8jzPWh5qwvCMHd7ONUIh10pYqx4H/eRsaGR+YZ+8GhiqwC1z5bclBhaOol4iFYo'
+        'B4b0ZjQ5NYI2eVABSwP+T6Gjg/KJxM/dwPF+og4C7VgtDkaN6Gxw3I6T6N32X7CAtxrXXoAmHPSL'
+        'I06FEBcHkIaaWZKoTx0oDKna4dZZJLd4uav3I5CzZNR76D/SPgLcz1cx9k5ZT5WUCBhBufOR7CCa'
+        'XKXkTpv7OYEEhdOYcmBtq2b0BwxrbDaohDGK6/folO+OOGa28W7Bk98HPGF0p0CkWVOwUxJtJGc5'
+        'X+c/0YEGGZPOwnEs6lEx6DIpWU6R9co89s1IhbLlhlcnzEKDIhxNVuS/aJI+GjCC9caDqLxEwBNx'
+        'BYRabpXCSp0GnGtoFp4ggl9xRWaxjdbZESnTkR1SxdnkZMceYpFgNUX2tllnXuIfLFwjtVp7VAln'
+        'nXu8cN2UXc2sPX65Z8SQ5PpBPyzA0ZC1EK+EtKZQR9wDWaUdp9ade+qSgtXJmOU81/5wD0wP7q8F'
+        'o2XRFC9kfL8HK4Vr3TveWSlXACIn9Av/DypE3DU3ulXs6BJ8Exwj8zQo3sJczEPafhyjUtIFCR4H'
+        '3MK/652DYxItAaKtDpfLTiF9VyJBqpqtN7v+KJxelFzBTF0LZjJzfY/pdVSgLoXjrpGFGOpb5JnY'
+        '6TCXRAZPVT90T6+l64Qpdj1dyaUJEB/qjt6NHVNyq5AQZRjOP56Q01QuTGp32WtlWLt7bq5/uXSL'
+        '/pb05/DbZTmJnifZDx7W59BkH8RCRiLTwaPzu2fRjVpfv0l7n4U7WI1S+vtRZNUpJI5gnW0FK4WM'
+        'IAt3x42N3I6exB/QdMWcYoVAhpo86dktmrKvIdCkYEEKtwsuKdOFtzlNP4Gk7Mfxtk30jOx0PAAY'
+        '311VqpXlv//YKe8Fa8Fuv+oDpJgu7pUhDDDZ+WYqUZxqVxWp56x+lXcFO8KBEGHIdJabMCV1KOLM'
+        '2H2YGv+MFf1GY3TWOqj8DGF6s8eEsekWAQNriDg86SlnnFWyRjJsjLUGSUfbC/jfOUkwIQR0zz9y'
+        'UV52meoaK2CrRrVEjT3Zj90d32EyUmtzpbDDTZVe2wb5Z0TT0AbifWr4yX6TR6rhJ7H4/2tsqewl'
+        'Iael9QoX8gEez+nmGu4E+HWMwmUJzvINJ1hNRzPHUH77ug7AiaQ6JBCmH4XySAU4xoL45CXNbM3O'
+        '1ebU2NPH69Bfc0WN+W5nGbXRV/AU8ldGtpFlrwavetMsxDV5CpAmCc88pV7EQB24p3XI7kk1Cy8h'
+        'vnZk+Ug/t/+c99IPVrdUuZQgXNgwllpvK8Kvl4Jlzg747Eq7BWOUJf0o7BKItq9I01QEF3Klq5FX'
+        'Dy3X8wEeesQG1qly0718zMcXGBU0VvdOrShpw2ywkSLVEc2dlE0huzF0uHxZZGKLE/gFeR42UemZ'
+        'GmLa6YutB3vUDehlWbo6/6dLlAd5PP4EJw/X98kxPJjd3Kt5h06cUn3q2bhjuy7C04SB6ieFJlQM'
+        'GkvrjeU4beIQA8BX1G6+7WFWsmYlzz5ue/nmqHrSCSuHfVJcfCYnt9X+4lg21qcxOhX+PUEVikY4'
+        'HqPLfQ4YHI14H2FYp2BzE/mgZFS5bfQMVZDPeIcnZEPMf8eFqkMMdjSCUE3BILbdEnQ/p0wHre5F'
+        'bS5qXqjZ5DHsqhH1nwnCbVrhy7lZluRfJ96EPnpV+NwvTA1JvTHMxCLhZb9wCSYYq18/jaj9RBH6'
+        'gzIjXNowUvutxPzDdbtrXuQLCg1MnON6LIL9ct2NkFab0F2B2HdEeVKjOgwm+uP9i9mTsxQTR1u4'
+        'KvGeDUhqf4DP+Yh/KhjSqMh0Hv7FtraGN1+ZHuNwwBfuXU0B52kQxKhQXZmxNRMmE5haCecwdmh+'
+        'MIpmxPX3UbWGkpZm7A9ZkSH3i4v/1MVpH23SVyadLph9Po9oXSXlxlh0pgo/DQdGrcVzrcrRT4KM'
+        'AmQSvfN2zSSEo8uLg1GAYCfNxHQWoe8sWfALYuM4r35vpB6ihLQo1WeGoJMmYG2HeK6FpYOFLsig'
+        '+h6xb86rRmGdgHGOS1NXxauO+dLeTaP2SzahakgWFzV6lPeTeaavAdDpMOFC8cfAdVMsZyVKkxeH'
+        'DBDP5rF6JJxD9rL4de7q20DDooO6UwgyQfBCviCHJ0K/OKLEfSZSBPUBfDh3fvEATzVqsif3lxPD'
+        'CvLwOXSxSPkvRe2H78lM0XDI3qLDCpuEy7e+nl2C3oaJb3ixGqyJhwqxJW7cvshJ4ZcIFRo3fcZC'
+        'QrjTa9m62yaZwJn3BOj40IgV4DE9i+2KP36AKOS9qoGOLokYhtUETvoLm1XTU5x1qljuMVqxQ3s0'
+        'AhEsNrWv9psh0C+lCmvESIEG+b+BTznMR2AjMpg97GbZ2xiW9dnXFS5LVt5r3hix2xYXsZP6/Txs'
+        'tLLb1v9STILU33G437PGfXY7GfTgGEBrOtz7XBGEE50fWTavqqrH4QeiDrwh4uGOdiZQTb3XD4Z8'
+        'M99Y6Sy5n2+48zkgRqNlc8zxueQItQKWg9p++HCXXZiCYY5wghQWcECix2Zf9/95YGnea3Fb5TIU'
+        'WmwDrFGkxagxJ/DX8bmULjxoAFPtpBqkSihXnnRRD0vdT+DZaEypsZAjj7DYg+/WTPRCF4TqsAJ2'
+        '+8VqibSOinPiEhIcOowbK74Z4IApy42yrCSWXnSWx7Z2wJmQu18FJrMrUoIyUkGxAL5YT+yeHlzi'
+        'TNvKwd7GOyroGUL373ylqQDgriijY8bjVZ64Y2gR3vmBqY7bFcGwcwclyAEmPGRQEViugQeGMhYy'
+        'xvOJTikxwzCmi7+v5vMMyJBjg6s9zUOVFhskPT1vN4BQq6Mu9zAYZsOK6Rr+fjhw7Yvi74iIoKfw'
+        'h2AT1YKDR2NK7EXrMi8L+md7Jhw6iBAJajkIML55WaehI8mpomQeAe89qIc+s2N8LxeYw2PHBHYH'
+        'TDBIBmb7NpsXsf3csNYStvngVPQ41bMaUqaBiJF0dDuaaehKMHwSxpES94tURrOnPQ/5EI4Z1HHi'
+        'Olmhy6wvLhfKdMBoKRLbB18ddgFU7Mxp32Vegg2Bp0crVB+hM2Q9J4cCWoEdNIvrixMAwzPUdzbZ'
+        '/aLqxdJgml8fvKMxmUkwTG7l2N5LxZxxUhgbx8iY8jcrlb9zthO8sO/uGuGD1sYGdmdNInOeIt0S'
+        'cRTweN/dp91QRbPdfEDMweLU992Rh1sp00TuEn3pPa52pcPSp5zbszd6J4IOlBh6IU4ER0+B8MlQ'
+        'WbhirHM+QA94Kand8rkwFheo8lLsHlf42pijFfHd5ZcV3r9brG7yIKrHdulIg2W1dh2I3//4ujwh'
+        'YycCdH0NNhT6x8gbB3ew+7sXnOjvfukS4Gk2avF6zIPgroCia71NBg/6cOPCTRI67Wh1BRxxFq7U'
+        'JraXLOIqsnsIXzm35IGMAciGywPdw9uuDKtQmfrJx//GPvhKo9a2RJGFUWrc49FMERXvID25NAzO'
+        'HYaxqeXyp9lDOm0b4hIOqbmZMavA8u8HtNGACarmFIPCwDL6A+K85dDpuRmfY/eG4Mdxq1abhNvN'
+        'IN6bLn33H0n54mKD2q5ukiEVLXPKdAPhEF9Cp+U10H5GIgYJRYpL76SiZxcxrGRsmF6txk07XSW2'
+        'ToTcuAKcP+J1lXLfujnJp/iKA2+CO4H0PLbId5Hk1wfGscQ2ph/GV40OKrdq4wAcrUYli1ARxAVk'
+        '6qpeAB2qIy8uzE6l8uRx9d1rTfXEXBLcfoSYPFXDYkos8fAJXKnkRxrGXbIhVoOPBE0dOp4sU5H5'
+        'DSUyGJWVYhjwdIXVEL3SfLeTWEVdEzAVta+oQRNuNFfiy7yjDTcJgdHDQfe5bIoyppMfOliv10Hv'
+        'HyRbvUnjLkkExzfqSuaDQQ8bs4khf1WkTc/ClMvOXSmHB8E1VJaMfTj6XudXOL2977OtTNY4tQzT'
+        'CYg5Ko+IseEIdHipltu4/yWQN4CBRj/TGfHWj544hj/QPQm//77aSFyN8wGsZpKSWMj8ZjNkcIgW'
+        'HLNIRAH6P5IHYrFJKWVwRcyn2c9850Sh6N3Zpy4VUcCegB//FReyVFEg+717rBlv15KZjpb8A4R4'
+        '4eSCNUq7UpbDIcsJNRzZvN/fzZJ3aNfYbAj21/8I1DMrLA/zfB6Op7qm99Pud9qq/XEaNgu05wT1'
+        'HV9iBg/xoTOPNa0Ed0e1aACm2X0Pecc3a25Wf/bkXW1BD1q7A/10L/UmMqyF8wO1VX2gCFS1ev1P'
+        '2soskFqF+dJijyshpNnR83N/Tj7FM0NohXCd8f9DeX6EFOGs/3JRN9GrKJEqYlAfPWkpihdjUBWE'
+        'KoUAMet2Y6X6ZNBKGJY3rvfSlCIIvA9/8G7lweL/gt+elvSTXSeFxbcHXj8lecoKvnY+ril8IQkL'
+        'rB9aKyuyf031gv4KBlWgmQ0RHrq+IjBGGNHecLptJzsfZDJaFk60o1fpPXQqIT1spAjsFK5O6Pus'
+        'WkNKxhemFdqPpDvJRFpJxB3lfn7iSZiPjSPSK0z9KHzGUHSprSPFf/LuOANRMEUNaTRiz23/PPWD'
+        '+9Fc1cFkp3/gy7jTtobBNCBCdwO9lxQcraZY7rXGbH1zbkr04mio01O4YyBN4/1Kkg/fsfmet12f'
+        'NSeaA7tf28e2GU/W/WT19CHnLhbzfXrJsDrctHYQqEgcsE3A1eamUZSCyFRxMSvfZUVA0XuDMdhe'
+        'aZh18Ja1XDB4OtF07ZnX3dgm+Z1tCLTqZ6+Lqzl3+cyITFajEpKLhFVzZJjMM/A+wo1Y0MYfKJ33'
+        'NaCTo6NlqZnrjVkFM5QItwJsXyAQXCTKT+74MihNBMoXNey0yZ+TSTrAAgTpXwPUvRVbAAJu+k8i'
+        'XA2rxcpZxjrQJJpVraOL7CCiWoxrFhkL3aWRC1rgI8x3j5wE3VO/QdIAs/6chCD8iyMFYSx/Z7RO'
+        'djfdfElDUP6rmXl2ahv3Frnkh+WGZz51fGV3DYixC8ayw2JaPvltNpMYC7zm3sTOAR8ZAZ7NW0Az'
+        'Zgxz7umqWYk/TZBVqriL7KC/UzZYZLMuSDRmEC3M7uXHhdlcYWU+PCMW2CMcna0MJyGQAbKnPbzQ'
+        'AcSPoCG25BYl6PCR+EkZn8HgDBIz4CzpUR/v23Rb1nRHFWs1OK0//drn7Ovaeo2eSKtrpa3kc2wr'
+        'ABDjy5DMo4piCp716QkSLzxhxJWV+0N03TU8Az/UXcnVKRfwz8I+QlSRQBwtW2cQHhnM431Z4ySH'
+        'JNzpFMGJv0OA1DOrC2EgoxT7cLr4i5S2RH6T5y7tqFwGuMqTgI3Y1GjLGwel7Lp/D8FJ5kSAha0j'
+        'VQET1cq2YND0BtLihJaDFsppJnb7ba19PmG6d9bCgxmAvPgCDc8aPYP0E/CSH/LnLwiNUmUnA4AD'
+        '5v+HCaIZMs5boQbFvFSTNwJxBNahWkmGTnK1Lcr79Zx3B8xYSWYpXHYmMSGGyV+yipHfys0Sew5a'
+        'YfS0cu+V2KqDfuvfsnCmNDjq2vXeZ2E7DlBnoB3QpSb8ZV8oI5sCKA2Q7auaPWUAqpVuq6++DZpx'
+        'R+kbjBCnVuQOoe0R/PZLTMRiC2j69FPcl7dJ91N3sCJMMooUHElgr+4NceCXCKxj5RGqGdb/czLJ'
+        'B2so67DQml2e96g44xtyaTTRK1yNZoyfrn8XJz0VFr2QpXIQDbcRUilgETSh5RFnqTdjfE7pW+nn'
+        'SFoXtcHcc8W7Vr17D3YgHeQPHBpYTGW1i7yBtupRXLXTGwC5nxH7/SLX512qshCyVfZJB0Hodh0J'
+        'Oh3S7ztYLb0yWmq6Uj8Mc45JxG4yp0Q6dya+FzEN6qFBfTjb6l9hZ92SZWfGKt/wNyw07qPp1iQa'
+        'd5bIa+AcOecoinzkxluEsNG22ef9M+bfXKvZjwWiZB1dFkelG1oRfn2pdmcqB52KIRhDxNSek9p/'
+        'Z/YUa66UcfkbTRVw6+FaCUXylosZFdXVDb8mvbHegtU9d21BFUhtSCCVhsG686vkSAg64VQiNB76'
+        '+dJtsce5dCuo2DauikzqeXDMN1nCeIAUYeSewMWqAGLJYtQ14116bst4KIVpK4/4zST+mk7RlPpv'
+        'XuUJuwoi0mg5VchR1JoVELM6kkaBbRRk/OZp+f3At7juZlvCeyFCwpJF7GaE+aeKAfywX3249pqk'
+        'WtEU4aT+se/05FDDMzrBspOjbv4QzgLv7z0lJvVxqDML2NcvrEKukaykseI13iajoM2cAuaO4wHC'
+        'Af2eZc26mEnTpV/sNbjTJptJcqOwcIE8ozC6KrYe5RLtYlsExhlpvRQkfhWoW5viko554ALjfHz1'
+        'off/DvQyOKcKpEzpBxXYW5gJPlLAhfuGHfsI+n3KtGvyLd5XMbEyA2yYeObbTCjDkJhdC7xPjEMI'
+        '6s5xIWUfp73BB+q67EeGMsUjOCxtvf3BkZ2cgpK4v4PjaDMOdlWHXSEjXDRnRqMplM5mG55nzK9R'
+        'EUmHOe3snY2gujMVtDURjVAiuWIFCORdy76859arrzYCYG9i0fF4q6+b5kUOlPysqCM86xa8HdWf'
+        'e3elutGkeuEmxZQ68dSzkbA/CZ8AqOYHttk0L8wmQcxYGDvqvNvRvQpjjiLyEJFSY5h0JF6GyLQk'
+        'CDqLTfnEXoX9MtlEFgNyMa/dUUO1m+ieOQX0KA0HyT67JIBGfscX27Yrq2IGXuJXLKh+uivlQWTm'
+        '6hxbx2y3InPQVB874dSSVDMndFkrCqSVAmc+P13LIe9AUgew0ZGYsoqAqekOwuxPSaehTwTxgEws'
+        '5H/UFK4ZvOgOu0cHGUoFq+mwZe2X8J9FFMSKsx1BblJRdnqhz6aZRl1NHC2FhR4aYZLZNko7hF4+'
+        'M3iO9sXw9eP34LICU37nws9NxU7LBqJAJEQH5nKT/Hy0bNm6bsLSA7wLn8K8xtdf0Hd3MRdfbGGy'
+        'oHWbiCKLCoqHxafeoWgXPf+TPeXn00HyBl2/tzwVrnviQFuSUpD0nB75b1XT+QmRYf8ADCzIj77N'
+        '2IHua17IPU89B6Cy6ILEipdQpS9pbEbpp/Nl5XN0Mwdvgs4PbXUB3Z7iYrn1LISGfaMRGlDWUgxB'
+        'lxPNMM9WYpZbUPoMEsOqjMN8KQC7+upXWRTeeSieEkY5u14I7uIXpsXQCifZFyAghVrexUVcxfJM'
+        'LPjipcK+j2B6wT1wrsVLnM2uw+WibgKpwytIcoPknTiI2AhYvgyyNkd6/yH8eNYoy/IwSJY4anK0'
+        'Kpe6bUXJ7x6QRt5owZQt3+ZNJb/NE4fTZUNiOP/QdLVB0vDyvhZPU+CrCtldz0uspHN17e7nydfX'
+        'hBBExm4rRF6gOPzPFc6/Gb2iGF/60P1VxOsMNffcDLfHxO/6e5VPZIpNJ5OI5UNx+tPFIR2u3m4q'
+        'Bw74Xf8j8jbdgilJUZ9g15FqAF5Re12nkD/LbBAenF/ze0iGr4g1C1kC2IKCR+dp2r+CQ2QfVmF0'
+        'Iw+wWkRtRmHOFRuvJTV8hsEgEdJGQME6Bim1SjRUxLcrSdqcHqkdIv3ga8MlQRnfIrVMk+hMq0wy'
+        'k7lFUz3Hn+o8JRJU4i9Jl5g2Dmspdzwa6pcNcq1tWvmosRwVXZmi9Rv6gqN1jFjMWsXkS5+C05FJ'
+        'MObfE208bnGRyWy/22fpKoDw+6zAhdmLutNSLBt2wAkDYRY+62f1YI+b0UbPXTQhyDc+/sLP1U1w'
+        'x7UEGObusRUJTPh8vjWwg81bRFs4Qkurn0P0Y/6y8QNiLIzcGMXxwEWG1sBdxMkgRoD0yPcS35rF'
+        '7eOHC5s0HGyDJ/GhMz7zZsEWyhxN1eI9GBtfaFB9n/y9v7SjCXSRiGoONPWyptNdaOCv+mcufuaM'
+        '+KKra1n7s8bcuv9MVxVUPYrPGt1kI9bQu1SmdcoeuiEHJuIHAdWBIS3/9ef9nPnPvmxiN+J/0x/I'
+        'zp7K0yF/jFn3iqBHUQ1AA4IgBi+VX6hrQFvBDi93ALxGKi05OSTk4bMJiy4IWVpDt+zs6XpKOFX2'
+        '7o7MHy3DzzURtkb0gqsCCsqc0KTbWsKV5UvZhSW8MNSzHLlpwEAPNds8pNsC2wnpwFka1XTNgPDa'
+        'nFmb5x9GXUw75XC1dvZQJsmW3LMnQ4bn1SK+CM7Tr99XfX2BqwKjTAfJg8FaJuhWIhJXV+wi+Ncy'
+        '09VGWsIarKFPT/UqxGhWxqy/AdZyAtdg9vEbAj3ajJJj4MJesPxWQDXJNFis3rRmv9QzzCTlrEmL'
+        '18uFBDH6bIudjUH558J2EAEC9N29LGghbtPZ+JvXDUI7HV8w5zzPZrvv1ItUQ6r+t7X5NvqzRyCX'
+        'xNoe0fgU/QmT7o7IlT7IGHxhkdzSQ+P/3aMQ6x0zTy7Jf0f1lxNHdE8OHCjrrsoEE661215pvVIg'
+        'ClCGpdY2BpVExeOy/i8bGJqL1952d/R75npZKm3LFeJQD3X0dM7hKVtCGXHbzqOINuYjXErzkHGY'
+        '3lUFaP9Iwkxe+XwX3wmurBh8Wkqio5lgHiPpNkC0brMPT9mDosCdtsbUdCTLUvibJCyPcbfGyUlJ'
+        'poM0QHbZ/I9jQa3wsJ9xR0qup4oitmuMSSTMCTSONNfBZzbMKOLkzhlPEnlkd/qoKGP716LT409r'
+        'XlrzuhLXJFQsoAXR1pv6NTCmZHwBbSU+EeB5G8yhC0OtWX84nJwP+ZXqusfii7Kp72rmLBoM+3me'
+        'INQW8uHWgzuxK9pW6dZ85ybqy8vUJrpdLDKixq9YyUmP3rER5fAado3J20eEq8IG3FJnkFh7dWkJ'
+        'bYdiw064uNpqz4TQG4gzNupKj7PxNRup1dfDj0zhnwU/SbcsuvJBYzik6iRXenaMFncSdWdUFnT7'
+        'xdaVPeLLpEejEv7x11VYM+vZTW9YDcEHGJMwdfcvwBCOA56c1mkmp/qR2oVaZQW/Y+tvSo54JHWc'
+        'L4QJ9/r+xVVr8hhLZVQJOt/9bkhUqXe3pU9Eg60Vehpewcbpnj7JB9v2x8aLLWfKElL9jq67Mfnv'
+        'no+/cFHhdp8k+MVx5j+/ntmjxmPb9KfJJy9Huhf1QPdoozF25NvhdJn8DXYzxp2zai5EmONJ3C9P'
+        'yas353XNZCH5x7DcODx34ljP3IpoDBJ2Hytm+VjOe5R+jNV0wQMTKoiqnZ7WRrD5gZ2PpPxWhj7o'
+        'u4IwGjzZHyrAH++9WCXGel2DbFve7l5FZ08JcN/CwGxjrcpI1AEWVr0I0w6QXTY96L/9PhHwEaep'
+        'AVtGPKTfcs0RnsiR6GCoWitrObdUw2Ck8b8Pb8If9iYUNxgMg/Sc3TE23kSW6z/jGA2prwFqIQFd'
+        'BpcnO7+5IHtfzaoaFGZ/yB0BRUc1i36v3Lv9BSLwDLh1BeNIQmXdRemIrollRbtgGV61ucfptmJ+'
+        'fWIbdK5+HCdSDOsm+WaQu2MF74Fri0TSoawyzXUUV8FqvBgKhenrGKdhfucJz0KQaEurJM7lOa9D'
+        'H27kXDhL4criniZeI3wVQwNZqUL2MyOF/IfFpX29piaVxUQg2tuXAl2y/4JvRUSmgKUs7LhFS4lT'
+        'FqAksnf3qgbGKKA+i9jjP7z6U5NR9VpkMcHiBp/rJ4R3KWs3xTegSLkaMgTnXQlMO5icdDPhD/wE'
+        'ZfsVrkiHJg5oT4WzyLj1lP637m/B14Gp1995qYmV5PS//DldohmmK9shx5dEDCYQjEg8DGsU1g3q'
+        'j2mv72xJN1+IL3XutGgy9gtOC2pcHOwNNx4CigWn7l9nkjYNX7fgnAyQUs6b0NqyWdLdRZvKD1GC'
+        'V3bkDfVlv80z5AR514rR0m12d8TZSDHmFbUhOzY7YQehyS7AfJcf9atbZk5bnw1JyFvTmJvfQnKk'
+        'Y3syjogAmdCr8/o8iQHlmsWUC7m7NkJkfYQnF+htXH4sYUM15efPadyTKYgBkbK1gdzpk3f8urdw'
+        'ktqnu3gbRQftLqO2x2phN8NfJeIAEIWK6YcBSGQ6uVxJlYPwIcnRjt/kT/TDcKbfrdVUBJVqZA41'
+        'PMvRKUpWMNcTzNmcy9qJL8PaPiJFa/sru6QhGSKQP73c9sHpWzmcEdY7kkvrUUCl4cyaxEqZB3JF'
+        'xuRHYCda6LkYkEYu1vc8GFJp2OOUWonXAalm2swo4ZZN+qIIgMWAaexEs4Zg2f77Ga/TPJSA+VHf'
+        '59KcjziQIpszj5SJTgSsbIvk9OEd2QS9z/ZHFd/Qz4534fM7ruRfto53y+sTPvTRdfMslgEKLV5W'
+        'wQXcD2NunFRdLJ3418D0cmdH84f4gA/fhgIvd/lveShgINaG8bw0niu7zum/mIfpeufJ2qf2tAAl'
+        'iCyQg/53o7Q1C075qUgmLxz0rB82M3yFdSgOlicHcIcjbRSqzPYfia6ZZA0skpdCKOUvnKp3qNka'
+        'lZTYjqrEhX9MnPO1L5XDaGdog7lO4uWwAdpFcGjzJsOsBOyLHQW0kU9e3GOGIg+9OJX94wVRy44j'
+        '5eFYi7toOEfjQnHcqMpkU/s/41RGeThJVAB9DjCtmDZlgeItoekeTPhDVkvF9ghzuKKdRRqn1IKC'
+        'xDjIbB41ygy+q6txoDwc4GDCWkjVpeQ9sqzFKfKDE2zRUFiAQNDQ8rbiHPkp8nzLZ5xYGccr7q4G'
+        'OQilFU5w6mtT2MGGLMYNAWAkeBi9UMP5i9VcOx3hoEXh72dg19174HFFDudmWCEehMYxt4C9uCOK'
+        'SQzzh8RZWUDKWIApfZIXNVja1lB1JQxsLwnHQspnjNbaqzpqBp0RUjePX+S1GFlo3Kjtau+gCnpW'
+        'kIoeGsFuC8vBK9xcP/f6kTF8fpLDZ7BrcUW8Mhv7QNg1OSLe5SSNl47Kln3XEObyW7OolSivW6y8'
+        'g1vqY4A2ww8C2VcEXPUUzXA/IGrn2qabdMCZy/1r6+fAhFquuItXm43Wn4MZcUsD3G0jjHI5upTQ'
+        'C1nyAiOs8iJ36Nv8rP0ojnoFP6vfRkYcG6dSMZ0AhSS4QA7+5Sa6TwTP47NhyjBtYJw3PHaZVMBP'
+        'Y1sXHSH/sxJKGn+KGu2bNfxenxqAQ0Wbo1dwvEziTqCUd0CBbbRoDj/wOUmJL0ryGpWB+xqAznDi'
+        '5n0s35NigHYdQHBNqM+Hdi5m5rqocL1TYdf2LMMkOGoT2G2Q2sg79Dd9ZC3GVEbtuUWdQmeYiqyx'
+        'LJQXms5/efAPJvNQyYsocwj1f37qaSig/Syl8kRrpHufM8i1ShhgButXyEqUVc5wCmBfOxtPb3d5'
+        '7FZyJuWpKxGL5LQd+lZgAQSV/mEWmY5h8yDUNudaqPTAOKWjYo+8wFJiX/7KUGven9z8WBjGUrdD'
+        'A9FhERoeiZ60cQ0ZuL9F67xeZGbhTH27M5EtkdLVdkWXsAga9LO6Xdj2C3l24UP8VhofmL2M7nTL'
+        '/SJMQiy0wtpljnXFr4k1v4SGmp8L37umk3nXeqSR6NG0EFIzGmBVEGGT1mDcRb/QdeDNBSkOBGXN'
+        'cniRmTtCVvI9Ir88HRgjeTbcjCQYvv3uq6tqttRlxbitakwJXhQuH/m1JYYe5F81D27NjfPzWX5e'
+        'CBKg7t4zMsWNKMmKBOemBwYFGQ3u5J7jikXxfcvSbSqutIo/3ICEsEnUU/R5Rl3BERLrxAlNtBR1'
+        'NpVVBipjFwbo3KvG4rhz/AWSedKP/z3siwpfkEqClHyG2+zyC7w0yw0AC3vAet+6Y1Q3/puPoMos'
+        'gJaUkZPEtHc5NHIEY5Stih5Dv5egq6YzsZSkprN6H/kAmmhPr3bR3vLljwrkjP66BkNo9qh0wz86'
+        'xz4TYAV5oKT/ZpZwtuPAtARh67v6WDmgYPNPY4g4WP+ciZ6/iX60LVWG046dWfVHAuAxPwSMdD55'
+        'WrZ88pgzbH3yfL/cs0vzIR41Iz/m9wWOHQHx13Iz32pymDR5L4wtYaCcbqyu+ba2FHs33msFPj9E'
+        'M07A9TDFrThJ6I+kKE6Pqqh6GnMd8WB9oHfZVyJOOVcz1sOpmqg7o7juzD57us2etm3CAEk9+fik'
+        'turZ9dj1qgSgkWdPPnVgFpF/TQnvPUEnfrgPgtY70auloGle3MmsjiL37qd45jQuvKHVM0cPZT29'
+        'Z97MG4rrotib0h7dYjHWWqpVCaOvmdGw7PnmUF0fVCderWj5GEV/orIFE/QmHZLQU2O/3jIxWhNz'
+        'jmO/i+RMq9Ele8pTPPQfGj6fe1T9leMeY2WH12CS5q2O7UMXc7Q8RZzMVmUExgFPl1d9i1E8I1rR'
+        'kLXb6ulUMgTW19C42AmCcmaByaxcxohmXIOdl2JD2ArC9VYgtHmrMQFsrK4lRdBnUUaWxDJgdBJN'
+        'gtVYWH26P0LT1jzYztW6ctDTAiEGc4VAK8DHAWcVPeVjMKe9KxZTuMKYLK+/hGkC7I4PnQP/0gLP'
+        '9t7OqF1/okZAGr3lTROhVVkDW6JzDsh03jAR7kyOG0LCAVgjsn/Pp+KaMqlPaU8TtGFMP+Z00B73'
+        'RECLZu6kSlbEDlA7w7fwlem2vOmMqoQDSqBO4IecTjGRBfdUcW7wpZ743/JVrQS+MVnHyfuX1kxm'
+        'vMFeXbba1w5MYe0dnPXEHwTUp9yJo5FTbMWAxCggBR2g2SD3wEszHMmXowl9YhmzI4BUtff0EYtD'
+        'LrZynz+T52bpBxf9gbZJL269S2zrgjjJ8iJOnl48D+01CYm5uIS/ND5JNr6qx0t29rWXNCDupSGy'
+        'r187YdpdCvacxdRQ72BY0R3PQ8TwOTTbe0hx/AGjn7cGLcBCm+0B1N0o6LtLOiGt4HfSpDorpNN9'
+        'K7nkJ68vNybrJTQAPveBYTa01gTgGzFRh8w7GsNw+yaPjkue0PCb6dGkNy1sZpE6z+p48U6biU5E'
+        'teHJP83z0zidx2AYXQDeGYuNx/SH5bj7cX6qM8wqPJ1aHyAZ1QhiqrdZevy5ix7tHagU77IciSt/'
+        '1+PsJt2X/BkGSSd9Jyi7ICsU5+x7xW5VEWqAztI3dgRYhkBpMDffRlp8JlUTRKKHD9lLeC79e0Qg'
+        'VQXzejlkkWcj3rwcrX0f/bmmLgFtGzxRcG1eX45Nzj04K13CP7aXGCXozFK1q3NjRfNjYtjfWI4J'
+        'J5ZnYhwwi+91zxaTyLyG4nmIQ4sr3tKvkWP0WQFauSDtq7XpeJ19HO4CU82z5R0otNLzVrNaG6wU'
+        'LOHPYt3wlx+eos97F0mJaZa4gQS+fDQ5GbCHJEKBTDC0fJzvCjZ9vlMOoSBodjWxCSX4BbAcBE21'
+        'g6MCb7LLcUYSAhuGsszTNK0p5L807Pc0+Gx57jQo6RfHaAuubWwCsKA9WvsK9vkLwgthL4IG48SO'
+        '8DVrDpRAd6OrqSg1CQHybr/of+8bf+6ZqxhZAQZmKyQ+bt9Um72NMRCQjcEow9sMwMkHXwasPI3u'
+        'wyDA/DYaziDcaGzhcB67JrurxMma26neuaudpBxkErNxQ9l9XcQ6p5Rkz3mn0yFESqsL18UZsLTc'
+        'TGgWvS4mfiAWkDhb+Py+FrG1JTixt8vmoWU44TKYQZTHb2wwi7m9P0sTwJmS5dD+GLEgUnUNA46/'
+        'XeGCwodhmyMlVI8FVnSNdLyIsJ9Xkv2PgsVvwAPbjQtoc4adWm+aPUI1FyQ6ZXLaiWkjetT+GUZ+'
+        '1NTIikgnV5ra9JHH+sgaxbd5O2ZlumpOxyIhKqHM5IGx6VMJY2PYvdsAu4u9DaVq3YZ75qEaunaV'
+        'sW+lowDdOwH4XScGYg+Vn0i724IWx/DN0X1T7E3+PPfpg4xxpf4I8K82ektzO/SwZsX7dUoaCr7c'
+        'dE1DSVKrR9KDnln4ughgwLTWGVGJJNisslik13OOQSLP9PAE5WrmYyXwrm2u5eD2DdkV5erVM5oh'
+        'gkxfx4bqG4th2CT4xBdf2A25kaR5hu1UF2MIWCCw+RcTijvnpZU+DZgnUJxXMJX+AzdshFcQYSXN'
+        'CABmjzzIIlLxAFIfclya6sESueQBgRqFy4zoT8GmN+7Kn9E6lXmsOPY2VNmNAkaavUeYmDW1sflf'
+        'FNi4EcufQPc0ViodaVvAVN821a8/HELy64YiA+R/sKpMLRZPQwkhkUmLtIaFtZMJiKUa73EvYCnZ'
+        'WxpFw9w5IVB5UXNR44vTGAzrjyi1lo4NoOQDsqA3p/9uIshGMflg6aJYre1pR0N1RKSXJlM7mj6l'
+        'G/OOJd4YTu4oFUHrgq8PY4it6opL6jd0XHYMVC88ovPHce8VOelfG+JJCEIen/lT11W4wtC7RHvW'
+        'cPZKmBStQ+bkLpJ4Sx3mcUeOAtFGS+G5gfK0KRX7HdFogtdA9MGp9HUCzvtLLT6yeBNpiupLWZv/'
+        '2e1J/ciJQpBuTTBbLFKSO7PL5G1MP4QN74/2VF0e+inGOS3qK+y00f6oz0Avsh/mP9UeF31F0g3N'
+        'DIIRGipoheEJ116Hqo7O6FXa8r7E7hI9Qp5qDY7WhTkRTklPPv2dnCu6gfK7J4TdWTcAMP/i2DZX'
+        'z3wspK1OEnntLK/pVohyN51nMkIi9SQTVGMPr9eBe+DfJHGP0xTFmD9XXzLRfaVdfYhEJYZe2kvv'
+        'AlzHomQq/PW2hlgFGd70Pd2AX+7bKeIIkDnhLgT3F6YC8a56Qi+ZlSquw05HG6lcBcJIAaIqB0zv'
+        'c78BasbC4NE32NSbdEVc2isU2BGFJCjEtuiq91QGurWNUHycQw+7ViOtRq649LUb6vlR01N/Disz'
+        '13Xqu2yTRN2DqZ1H3xgkeJHL9e5SyfD/fV5Ka0VA70TPI+87awYe66yJWo9PiBGA9ZFIkqgWgPaD'
+        '3eBBq0EuxbmFXHQc6eMrHM4HLY1mswMkX8h8ZOcUwupqbzjZrcLKJY5jUDJzFqE/4JQlscBRm5+p'
+        'KSQqZ8eh51arEsEeFtzI8lnhxXkqJC0u8OGU9JuNUp0DMtAma5c75KzBFLtuqwAnVSnfUbvbT2il'
+        'Sy+lgJowgIbHhJpD1A/mswrOEODuJPRo7tqWcdhN3b84qdYLpZw9Yl8mq/WpKdbnmmTVmBILGo4C'
+        'xf8Wa7GUQyTKNeVtZuPXP59xW65OenqS1kN9hhza8llF1FZ2D/Lw/hX/O3yQ3mfQLeFRgqmXXEwK'
+        'ThyON6qJMFAhlUS7/erMHKxQmVvixcXFLTCdQjNcq0RAGpTHHw4TnBVwXtpzm4G3Bf/pVXDe+8h+'
+        'hzVzmkWOKwRcJ9OFQ8fBBoZ24JI1Yiyw6TOvkqDAVy0BwbkmxtP42P00YMVD85JVRUL5b84kQz3W'
+        'J0uDZ19NMSclq9lJIMSAGzORq89ViAAVnu7jZ2YHR3JNel3yK9onaIk49rxJJR4adw9r4/KoSCxL'
+        'VgZX7iqxD4hzX1lNFWm/T/QCO+6W2m4HurEw6qb2qOkxjCmwb8YKC3Cd/eEVIEICLGJjlfNRm2jq'
+        'DZrEk1o1OS6jfJaX1f9s085JS0YV9Yxrrx7RQrPHUBxR56tZ8mIrht13e9Azzy2+cppZw0xIUmKG'
+        'YYqwHSn9rkW4HqJTgt83C/cVlY3hdb1UnxySJAjmtWGz/nMYs2BeEiWvT58rl0dM70/QIn/lImJ6'
+        'uGWiM/rw0+Gt1zaonqexkgHgQpKy3MKbeyVOoB3StBAp4EwV0zkE9vGAtSgnUbk5pCCBBtc8fjLG'
+        'oTNQ+/0M7zEacQpFDnVMApbVKV2O4waVtrQ9rI5xBRMNzWg3cuazGGyyvHJmqwdJGe69thbA3DTA'
+        'sXXNQ1ieOUeanOMmvILZY7dAxXp6/GT6qdQGNm/AiweRSFAGmId9QTyBcypOZGtXZ86sZk7GVIg8'
+        'Q2qM0qbB9lidWSvc8n9hpgRlTWUC5fU/XbfhA4l88DKSognmPdF8xcSgA58lImjqdzm7zefwyOAD'
+        'xgZTEc/+10rARL/I2ntCyXMS4ah8wALcUvLHeM1G4ud4nmlTGnEUbQmXLxsVQDEjKPSyKFH2E4ms'
+        'Wm2SKIDiRb9mDWVVyHo+magUyVcBE8h+HoPaMssH6MDx88kokwBO9JtG+diuQAPYYt6T0XYigitR'
+        '+wAA0++cRSXgBYt5PZQ+wrIQvjUa4j5qvefR5nmLouwKuyDD4kmMWOlsqvUTc+9pzYz+1QkFscFo'
+        'mx20wSYuaoCMgwUiQgaqIWCGqyJDm2G+zDqwvdBA8BVnxXP3qHeX1vIAbIdPo4+XokBzGAMcUqKk'
+        'zcAh0bt9VowqWPFY5QFtkOkT0bBU4mt5rgVS9tBLsnbtV+UEAkZ+P65F0AAi74toJoPq3Xq5Nnnk'
+        'fJ6lXS+DnWSQJADNcXzjlfg/JPgW1Odq5HMkA9bQOu22mrKkclrqVC4Dwiaj99RCcNU0dvv322Sz'
+        'z3NjRT6HvfstmEjdGizQDsHdhWiSFjQIX7npuoa9x9UYNofnrU1LTkGp3kuj7tLX7EXLfQAHQVyT'
+        'PCPu3S1e+cJPKXoFx6GEPzjLyx+AFCkCATs/eaaCLqDO6ogDboYUFF7XikApgztbI/qXJWRx6nBN'
+        'Td+IGZcruTXssK2x68uvUK3FdA+rYBOL/ye+A3jIsL6DO7kuN0iArl3Obu0Bj/bnC799oYgOWVZZ'
+        'Co4IqcvSQvHNIeqv9cD6QOwENRkIQhe92h7yV2CXl4yoFfuWKyQte2XyMw9/YwiOn1T43adcVhQg'
+        '+QUuq1Kkv8sWC+2iesxpVky/L9DMJjiquEt9zf3WsStfI5LpiG+41szaqxaBWedS4m5Nys/HR/OQ'
+        'yLf+AXLd9MYOOMesBz9nnUBG+adClqf5B3htmL/7Ppu4oJd13MhCpWyWDYI3jiUTWU/oFZuKuZcX'
+        'xzM0osTY1+JwHxKlm1nWeHKGuX4Of7tTDsd2fp8vCz3Fviq/YBdpWZNhFEQfK77nccTcX2DOsZK/'
+        'Y2yI4Q8DP6CO8j9Cce/tqU8aU6ka50Bf48q1sYwpzz5l58wcJLNvlYmYHfi59+AFL2vZ6WhJ3x7M'
+        'rc4ogCOmkKfEVOr2YRkQSl3234T+gU2yidKZLJ1HGWyArlsxsENGWjCSGxr5ZxF4Yx8gzQMXa6p0'
+        '5Y3e0CdWNboyFY+ZvtIreCwx4bSL5gX1HXzPEIysSs+ApcorPy5LrjZTYp44yanAB9vaOK/SoMit'
+        'EGqrJmNhUBRzwP85fTMKxed1e+FQYRsK4dp2By7fbP3OUhGW5UXzDZqv0rJSAuzJ6GfNzawCRpxL'
+        'KRIn9KLLo3AvLpw/9yNQ+weweCVZG3voTq1EiyFzCXRxGh32UH+EBh+UUWvf+3W5Ux5uRJyTWV0g'
+        'gGaoxTtZKW5oECNg+smRIxe0cjasyluFOoswvvdZzlFNCugkzF5QlWsXq/LrGhdpPrdkvYU3rv4a'
+        'bM3zLI1SB85FftroHjqsnAmIBnQMM0vLOmu1Qm6BxYBoxveC6iOzWDUJqvyECF2axdOVZd4ElB6L'
+        'Ajyff2ukYr8b+r07Z1BzkFgCx9x5U4L/MVP/pQkmyNvANhGicZ+UdwyINpjjNrjqJEkaE1norD3H'
+        'ZGcqKeMEoYG38/qUGpiYM7OQH1F3c5ZyKYPoEx7t4VGlZ3Aqss0lAAWlw3JIDE7tl8Lqgf4KuAZh'
+        'Nwvyph/5I26WM3x4fnaSLIAI8bxx6dmWRQNpIIc+7qOJ4IqVDg5jzgAPgYBaPQhtye+CqVGJTz54'
+        '3DsrU9Ns3QaZ9RX5N8ikTGtW2iyzY/dyozzlQMPvYVXX/OOPn1LKdToT923OS4kJWb5NS3S2xI7l'
+        'LpvsOWGwoa1IZclry1ZRUKjozmT6kWGqObdmQ5QjgUDw5jCDQHYbjElk+XEgJay+trEqSrsBuoBi'
+        'EamGfHXpk+MGDNWtdwxsex8FMUscEp9fezbEtPc2v4nYV/+WBuX2qQPVM7Zom9VHTs9WJ3Os9mYo'
+        'rYF3mFAl3OHrLG56N2MotmAQZdWQfEXvxtWfrmGryohql44nQI5aJWjzHEWcoFmPxH6spKhlnQyZ'
+        'fEmh8hiGSM9yL5ynfClzyql9B2XJ0gnLdeN+LASN3bLLWsmvpSHoSxoFIqc48J3ehFQ5RAZAv4Oz'
+        'rHG82aJ0OJpDhs3PcuaqounrFaCjPCx8qHO4jaY+nL5eJIXY4ZKFGL5F4LArgWdC9q506GI64zqM'
+        'tJnOfPZdv0bdNSvZTr8KM3bk2+OnMpFQwdnBavb3NlIrjBZq+G8AUvrZUsUS9kKLPDcksltL88Nu'
+        'jg/6Vd2FnrXsCQaj1OBtCso8wYXmSP7moOpzcAkPgaeo+VgO/7aJrAkBveJoZsdlGYN0Csu+NlG1'
+        'wIPyD0IzVq0ZXH16wwHPpRPeHN/rJptXh7aTmn6dRTtaP310vjljTBzpIuvqgMJ8S31P5mClYImy'
+        'Ej2l/SNRgoJvCdmEWSaDNxIs8KJ+YSuB1gKoi/rLqiZ4/OfhrYD8nBI4CqJDYl3jmszu0uVR9Utf'
+        'U4/t8D/kB8sCkM2F79Bts08seK7OscZTlexS5CZBJFPl7y7635hw6BLH3YGAt0Ga4Z8LQckA9T/A'
+        'ZHl4JiE7in5CzoCJDGmc+CRasFts9nPcrtgY5GfpAEgBE5uFMnrjxTZYgFMsMN8Q9gYFE3MkCCs6'
+        '0j+hPwGlZMkL4jjCMdHL/vJgjZcYRGaIF+bNXnHmlZs3eS9+0p07NaH6TzFX+zJZGv0qpTr+GDTq'
+        'kNEXQJSCNnKC4zNEOwuIYzf8/yh7WIjfB+QFifV889vXZVyRtFrsFhlFKXdEx7+8eEJQ275sM3UU'
+        'ctXfvZJwXzeNvFylEgC/XqQVRzbPoU4GzkNaszSkKjIK/KCTUGxbHKEF3l79qbrsDfN34GyBDnzS'
+        'N7W4VjqBRreYm4+VRe0eB6KiYuMwKUs8+2LGkKQ4FGJNESfFo6bgDDfSXidgx8RGl8yAAUbwWYC5'
+        'gOX/0P8yMdskLXbgG8SrtkN+CF/dPZsT25C689erFYR7nu4cyo5U/6+Ax2EpKYv24X/WttmZSKwf'
+        'i0qcw9cl1fd2TUS9R/mUivPxpKdZlxM6WzEeNHOLho/sqH5iY4IqyoUUcRvXc9Mp0iORMhTJHQW3'
+        '9z4PKPwJdXjSdWV2N22GJ/HJxYKFbbVFye2njugtVGSalAnWZLj0bQRRjgIrqSwDnvtv8YHLaa45'
+        'ILlpkVWcIlN4KD1om4+UK8a8W85CeR8jZX1kKtwg6IGW6k6q4x0YMzU1MeMBXG7wab3yIUFcbbU3'
+        'PDR4eRiAuj4AmFRUIhz93A+nVrYk017hOWjlvybFrOvBdpxK1dmvYe6ONC9/gfDYKi4/CPWW4d7u'
+        'V4m2KwUay+pcDl4LzZTOe8lcTtWa79MFg/kYpA0NST0YX9wp5XT5+hClj5HTjut3BsRbqydlggZN'
+        'LRW3WU/8i+mcfbXiqPSQYtxI1ETKlBu/Aa60hTGQcOuGPFpeyKF/Jbkdeep0gYKyNxVGXN4majky'
+        'b0ATzWWL1NFaLhTGN0PbC/vm4arO+tQSA3FgVICXCIc6RN3ziYYeX9KCw9rMUyceZHeu1poGlPiM'
+        'CCwiLpzLn8ykSHkghH/5GXp3JmJRnmSjFQZRaBJGEEBNeb5kPbq84WvK53hFx3Sg/lOn6Ad1GNLE'
+        'sU5M+Y66o6KUJ4VcOMESx0yp7bkhymCpzSde0e6AY7YN/eDBM4pwN9zOx5LgcV9kid59raVv1Mjh'
+        'GUus9jr1s8T0YqnMyNZddkB+fTcgpLkM3BEjlzPs18KLE6x4geRkQ6wi/lNQQfLGk/t58bWgbzvd'
+        'GKo/zreeW3Gh/gfz+Aj9cM9lCXAy9jGZucx5dIGgKOp9XbTiqUSB4JZnNVDVvZN4DDQ6BJ/6dg1w'
+        'KGpn8QeXH0ydL4nlS9oyw12/bpNWTvea4PcEGL35JwoLJwcAj/ow8RsdU8PTOvsn/PptYT6fDGQq'
+        'YU/P3egnbXqbjzteunyet5B41GFsqXDtFUPWHe7p8UhzBY/A1S6Pv0BF1odNb3mfTR/PfQ5OAfFj'
+        'H6a4PkNCz4Ur/rAz8fwY+kk+XL7ayaTbj1Shb/eUN70pByT6gRL6LxD2Pv54jJa+N3VlUC4saEGH'
+        'mWBJ09hdmaDR37vQgai6xW8+A6/FLPTau291C4aAfAhuH8/mgg8oYmKa+2fXdWNcozGGUSAoepsO'
+        'GHuEU50WB1/jFOCXlpA0zc4NcdncXp3dHRjVjdaIv387COn+nv//90oJcdgDE/sr/+/+9jvIlA9G'
+        'GYpUX44mvJGhLFbdw/6ezrWsAmp9hWTUZpSbzzEUd4va5CKHsk6pnNlvYQFbn609hqbMDvEiJdWI'
+        'S83zaBi0/X06lpagyW7+PUcQu3yb5PYeuPs0OO89QXjqN5sJ/pTh1fT6VZcegD4DWzRATDvfzdEH'
+        'jWXncrDUW5JtlIxcHBXbyd6Z1jgkAWWjVTx5M7jCo04XVQtMv6JacVOkajHZxsp++4YZjcD2oQX4'
+        'LzTpIwCjl6MeJ2B0fOREW/zwTXE9nka1PJXp4emwlneviiQyhnXxxDTBdwqObG9/YobtcGr1NkFl'
+        'vmmTbcJaT/RC+RKfmKmYR0d2eSvPuzKiqJz8wgv6Zxki7o4Oo5hYJr+TApZNYL99mX1aAGPclKyi'
+        'c+IMWnHkhmsiTih8nzGYMkVTanBb1F9lIcEagRROCHubF14xxo+g0lFzLMo+KUO4Rm7c8YCxqmPb'
+        '5/kXlbZ85qcvGvicC7BvSEVuqVDxBLEl8ONEoMpv9pmn6qmCW4E1OoXNEOX9cNEbmogxgC3EuRUO'
+        'l9vlevhDNiu/yA8uRsaqh2Ubmuth02/qUqNo1oU2pter9u5nueBIv5ziA7nb/3dEu2A1DkCWirfJ'
+        '7uV1fxc0s9rzYh41rmpixuF5uzJ6Y9Q1Ga5sDKqLo13HmzUvwYaAnngV+H+v5zxPjh+FxJg+19/0'
+        'UT4JGTldks0oKIhsRQuQugF0fyoRfiGtDKDgUp9kAzdnPLLLIhb52ky8JpQrhz1JcOVIpi8NQDgK'
+        'PkfKmRw8pTWoDIIbCML1BbLV31vBdqqUkLyoVu7lBAqPf9JTt7TMbegVMdr8tn2CXGRpCODv7zCp'
+        '8xIHCCIBmDfWNQFziSogzE/thUj36N1quNfMzEWepA3zrpZxgyXkUQCQRK59PwApDXxclTGbaCRr'
+        'SX6f188g80vXy3UC7EQGhjwPEkGjJtasM4tWVb9Gtqd/SjD+WJjbb42pcnDP+w+HByPq/IwIPGu2'
+        'vnOUXeFjJZhn7PgooRIrt6tUvnG2E8Kr59GyvRUsQk8dS4xzUvlcGb46HPJlHJ38grKpt1YDPP0J'
+        'ZkZQ2BlsCdsYsX3n8lARsyC+B6Ab5j8sruLyhRZvCF+COzblgj+zJAIN4fDl55iv7hSy8vca4dWZ'
+        '2ZqeBRO8325h5HdaFUDG1HbqaSujwrzB0BrhnXuETHmLUpsXEjZF/yAf4acR80ceHYoAbJSmbAI9'
+        'mLkRjfQ8HbCTlzzQbQ4KzFF1cCqX34Cj3Z4SuoWlzqjUsOzylnXPwCi12NYJkrUZhb32rL/u/WUl'
+        'jULQCrNg1jIsU0I+JPT9BYB7kh6wwFTaydaS+WQfxNp1zXZ28+ZtLoqXTerNNSjW5w6rX2rpAWq/'
+        '3NAN4K74no39WvybjWz4hXnDDI/+LPQubSkg2r73TwhfLE1KWrCm4woOzXxOtqHhd4zqcHOYRTFR'
+        'ZNqa8x3+eZemucoGPQK2m+XmIe0TY9BtPKuAe9GnyB7GDP8cwQSc8SAQGZu7KvWqMxR8rUH94tVW'
+        '1D8PQ0V14rFqKj6/2hSBGHS/qhPhE7SGRyHUob76iXfBnCof7j60t5TTbP2GGSI4ohhu3b0rI5HI'
+        'tttGTVRGDXXSzgLbvIrReSfiWPTi0VeWIZNEgdadtyGg5/iK94pPTYKDwKDb9Xm55QY7yEoV2bID'
+        'GrWaavmI57J08ZQkZG1FzZteZ00t/iMO1XNV3EYX5q+VOx7gQQd3A7QpmSfcUz3fDvV/LzMXoDwW'
+        'j5zgX/NvZNsL8YsttLVsMntodpa9xDfYrLNG3vuqBhDmaUbvLaCu6QYkFEWlp4WgotIVmZBTqS0Y'
+        'E+3e94M56l6ABP6ItoIP9yFG6nwb2WLzr4WPq+WWklEeVZJIpvPRKIa3IkLupL/oXDl6qV9RV1aZ'
+        'dd/U/4PYQVkYNWbfft90nNT7T7XegfQMzMwfBAEgvGuD+X2z2tV8yNndZvezxJJfeiu2y2EFHBbq'
+        'kGiZ4swkgy68ezXpFKOWeJ+VvuJZMnnWK/AYnO4Pz95WzzQp91mNCQMkrIfhoWn8xxOKlsk7SOth'
+        'C0ArI4gyE3sLpKAc0OL1B4nn6xk0c4La6Dk3ZIgEyXyMPZxh+2m21hV6X+ZEvLVbkSvNqJNDtNCc'
+        '4bgARng1PCfmAlFcIlegbu64JMzydq9xPKZ9vYC65uTRFip9ZwTwdZp5YDJB4RmJCxul5UqXKqpq'
+        'i3VBrEI7a6RTbqNTBE4sX/+dbzGNGI8jqdbUu7lyPl8b3zvmPmgN0j7jRcBNk5BVXhEVNmhE1n/D'
+        'J2BCjLfdmVWUGqj45snxNsVc3KYXNL1gT0P/wJYxFaLQ10SshxXQKDw5AxKkkvnvQzkN+7OsLrko'
+        'iwjXWNIJNuCXbsxhsrCf6ypvIUR6C1JHXkgugOPFNXz3wbt0XyVho1WTMVwK5ZMhLS/tyMWf4iuK'
+        'iESrXSDFP4onjzf3XGtzFnegCrNHedn9qFtnp2H49eG47GUibXut4Udgr5A/GQVIsKlho2hbHsGx'
+        'DuS8txYjEHf/C/cHeX/LO3qHJcrPs5JVhmSCWajJdFQRJ8aNo9q/jhULhtD3//7BrS0ZnkoXIOuP'
+        'F7dafc0TFJC0xdjMYU1tjxZKGbpm6bD9z1SB58PhSItrfL+8Xgq9NOrZsN2qjiTP22QBxIhWBCYF'
+        'x1BcEULty2iQtmvAc4g2alkUl0T9WPUTI9vcYMlgaaKazCdEtEm1hbc0BtMEUQvKTRFfsG1LqMg5'
+        'ccBb0GM+/v2GTQEv69GYldFY9UUz7hn04g4zrVjGktqpy/FJESvSeNYzSsI94E2Q8Vcp7mzMJ3/V'
+        '7xRTNHKomjzVNQVGQK+rU2s8mmdmPCXBYuQRq1+UpiTQPrHmXtjXJsrsuX5F8RNZDQFAiUhCWdqM'
+        'in8WcTHwnn4LAVxl0gNAbAhrOmZz3H29Y4XJ0h8tANVSOwJCqrcchNBY8gDysik4mvOMei3wjJ4a'
+        'mbCSMaK4oETvCxk988JhpJ4PZHOOS+3UUoSl5oD7fmosrtq5q+8zpZW9cSBYE1XIOzONXTCzs+1o'
+        'vFuZXFMOV8QpzSZ11E5hRq4URs6WPwQMuXNkXAsfWczDfXIarpjTXU7M+DJrxl0o6yYUvd+wVvuC'
+        'CzAIMZh3+NMsebYIFr4a9//MeJ51pnKJHQVErY0hTYdDaSuM7U9+B3IfyfouoIIlgfEihhPxvMob'
+        'vc6CohDZ/B/XJE0ToJ1wQBlCzDho3513R3iEAiSQbj0aufePTzk7SQ+BK5DUKVNkSai2f8qRjCml'
+        'e/KdFeKg6QUPV/dskl8Yta+cDMw69IyHSbxPvZc8NpEoKqv2sS50p+xX3THFhrpnqMDi+j0i1E2I'
+        'AZmzSoFOdsdoverRfjS3jZDefez+bENzPaZYjVJBkjaHsH3oINYAvP+pangJzx7XVNJ0gaYbvWq0'
+        'epvSH33RtoyMT0Lof0v2DpuJUGsHKNWfUkwGHrsY89uIFcZLxr+NTvsK1aBy84cjCrs9i4GeKhfd'
+        'ELTmWZiOKAKeTF4f7bIoE2+U2alz5FTDchg76yK4NpzCDNaxi/x1hEdlTaNTGIr945TtBLHQWRV4'
+        'ReD19chS27dnWEDTCBrUFBCJZK8B9hPhqADnK2NjO37HDyHk7hpNX+Oq2uwhQiBbcY1ROPi/VtQk'
+        'xP6BLSBvZglblWl73RWSBk7rPwPFrAz3kOfDUB/ZEGkehoKEOKRx8Hx9e8lMhPSBGbDDdTCGT39T'
+        'v5xPLhSr2B6d3Ov6f/QRl6VtAi9eMx6vX/dSwdBuXvv+IAJcLq1Nngphpwin3azUrSUCaN/QBRVX'
+        'OQVL2henSGESA63b2tBBfMr/6GSve4LV33dHeho254T8Y2x6JWJU3R/Hvhc32YcTM2TBVjc7Bg0c'
+        'MNRUfW5wQIvD+gcKlcW97LDW/w0lGogPZdWn5ajHLmz4DWvx6kU6ndkvFKznUmxwaifL7gkY8+Lg'
+        'JdDlJCnILFbxWKfx3nCBhusRJyKWAsL/05Tx/5ZU+EFVuoML13k64AAi1C+AMQIdRkIh+HZQCzY6'
+        'vl5O/MjGxEFizLP4XB1l4hRZmZHw5IzGjMNtyUUE2aMc8KqocIqDcjcm7J/b+bamBem5uyptEum9'
+        'VQn/clk/Rq4EQHLIKPgKG3E+A7D3eQlI/DKw3+Pml6+69KlatUADUtDtgCtT49FmJmfI+vfFQ8HS'
+        'SrUH/ZwoaAeuZ2n5gfxKpSQBsY2Xa9j+jA7918gDMUddyD8swwNshEH95718q8ePCUbjxLSGLtgd'
+        'Vl/hAMWiXfVG7rTVFe1SKKTBUKma6Bd9oEatGBWgil3leiYTevXyFeOqpFxvw8EnsS8Cz69Mgcnf'
+        'MANBdFWkU/p4MKKap52Dhw5S4Rm6lpLABiM3Sa9ZiNtwMBU+25+rLNoNgYgwoEcqsx+3RUkY4Y6E'
+        'Lrw7lIyiXtmo7as9eCqvHPR8pm9gOUEjvjXAWQkM0ecjT34dELg2Tmi+bbU7SOBT0gQLkX93jNeP'
+        'GO3X2qKopMvY/rj2LrEpYEoQeADMHyq1JudPMXWUqgdFPSwvMqUx4IOWfnEGaPGQa72nvOP/vSYi'
+        't++kVuSaEs07KgU4WJZlR2ZtAYDeDyQZBHhc1To37ZJ1+7EWmG53r9rlwl3jsGe6pTQgTVeFMRt9'
+        'oMeON7KQyjVUqr8dBMig3gJzMoeureAxASqyr85gp/fKiGR2mu0g0eF1zQw1T6ShUsyRZcmXgqRh'
+        'la1UMFl/GjSIyrasbUhbFDCInTRtg3AZYuOXrh7p0/DZkwWfUf0SKb29ZpPNw4v7jh5OIerI/el/'
+        'yKR9n9uJQiqdRsB4+/XLAdjbnx2cyU1X9mUYUOC/JgfkKTmJSgv9JGSMNboy8gYN1w2vPVyixwCu'
+        'LEU2z9NEqEH7hRof+z2ab/EkvESOtXmsgdbo9ypGrtc4SReZ/r2K3TDvqzdciLw1IIcQL5KHRTW+'
+        'vSqys3t3ddCMzO0NISLLTroOU0Mcy8rBqEA5BqANHvc39fOwNwhymAn8N69rEnDvSySwZ+eyjKS1'
+        '7Js6ENw8WLI6BiHsMq0hI6RNtRrca3miu3o1CD7rB+iqkUuuzZZ0GYtkxBZVDJ+jRVRYpk2Hgcs5'
+        '4ywNFskdSOPEFRoDr/N3p5VPfWZD12hCE45WGiU1tKBJG5PEw98iktBHU1etb3XmRPGHfLEMWY0x'
+        'I9sW6iyLgDn4TZdTRZOOWZig/mLW7dA1jPCkxOctbfTIvPFqBFXlaMIfexpW9Wns0Xem3fjtFmh4'
+        'hPgLflEPxAZqo/lOF4zllkugDRaoBSyu2p+jJJa6h2zJ9T0+xTJkppFDpl7uhz3KQWyn1YKC4az3'
+        'VGUdIGjlpM3SBywNT2/vNM2K/D1wi8DLXDfRIVZV+ywB6uHobxGtSaZwfFLHANjJ93t0TlJA3vyW'
+        '8Zt7wIa/BpXReJP9fA2F4iuioBvmAWNR0z5XvrYAKtoU2vi+Vf6a6c+EdCzLDKjLQkmJgHikgB0z'
+        'D0mrf4w1x84u8XNlg04hBlhkxEcSXUJX2+9hqG107O7KFiEdgtukpOluwvnncKwePQEg7IHsBJUo'
+        'tjyXEKfrRCr84brzvjRV3IwLPwGtX8sdZ5i/SCmVnL7Uaf6xho72CwGAhsT0jXJ55Oo5efZfZJ51'
+        'Ztof0Xv+W/9UHTI/DdmnmAXtW/jqsRPVIYaeHcJNHRRvThjUBew13b/N/iXCef4Ih2RF6qGa0xIV'
+        'QesOTUZvzf7lETVcT/k3kQjWmbDxjKW+maH57dTteHNVLInVvG2hyDbEbr8nlHh1Jq8VmUIjAlJO'
+        'a5RUOZscqbqszP6MqGUKCJ0zyEJr1Cm+S92sUAtz+cJ73jU54xbKarkpxH017p01p1wBCD9ghlTw'
+        'cfipGE+xkFYNVX4Qj2MOF/QEytuuQ4Q6SkHPdUgvjelmh/HYDqOHay4rQR4Q7Uel6oWjNAvqWL3R'
+        'CNXT6/+Jj0EPNYVbBsp2SMu/qhzZYVGOBCUB3TFF7CIbKRTr0lc3uNxGshqO1FBZsjgCaiNDjZ9R'
+        '0UvwGsuR57/2A+pNk2zAp2Tju39n8E1ETY6vgRf1+zvBPnRiwe40CCJPsd84oHZfGd3cFvtGNjFN'
+        'uZyOmCCcMOwc+WfgIjSSCmEMD5T/1bKq9RMrJXYqS4XoWs3g0ZugaE02hq2CbFwUsVcIuEeo3qh5'
+        'jswnuGVF0iWgnORcHkWQyamLWykH3Bm/GS7linLj6oRbewiddAznl+9Vje+1IMTtHvypqVqGsdfa'
+        'SNK9F7WdnEUNKPC2d+bSqxgaGmELoRiLT0e4p6zrO595pHd2IIJ7BfcmvM+2Q5q/MoHzC1lYbx2p'
+        'Q48cCzhW0NJ3QZ+FHdfkKP8BFK/UguCw8mNB3hyvq8KwNe+xYiY6JwcNq/424aGi9oWVd9CDYLKS'
+        'jbMck3tz5Cx8+NqN9loEQcjzOC+pU5KjAvmT0DUolGE56s1i2EbBeSgTZLqoeBSinhvklVXUeI1O'
+        'CCaI9AjurzC11FBNC0cxCuO2i4bmjZ8xnxm3IlXa1z92B5e42QR/XUCDX+8BU1R8lP8x1jumAeh6'
+        '9cRVtj3wiurVI7hcBbE0PL4PLgrm75s/m+drBNxD8zcg1hn0A4Yza1bpJYV57OCSgV7RvxdkljMh'
+        'krGnX3mV2j/xiBq9vyCv7gfsgheyBmvbdaFKNGyeWL6By9/2OcCZS4aKqsAAy8hexuV21Zn6nNgf'
+        'Gug7tPAg2dksobpuhkmFbWsiJHs0PPnrgEQ4HJZGfJYeVBEJIRKOpUQCDtDVsD0+bdwESwlm/hPC'
+        'tNz9YwuhpZNPJZqRBImuRCDvbR4krciQE7U0JdCvluJJu5DpUdKk7YRI6Lhng75umq7hxo6w5Dt8'
+        '9A3K4xnDMS1MASfIkoSJXQMR94QxwBkdJ1bVuWVK/I+A6EHmx5aKCAXVhGKEs8igN9lmvEiZYU0/'
+        'gVTVNvw4pEst0B21Kx0LQVYGGK7xgjJTsnekWo7CE/y+i7c3fP4b/85k5d6kUw6hsjDW1Bk2FR/Z'
+        'qUGo1ggXSVmxykUzrd2Rp3b88u3HuQXXH19KZvyG2d5hFtoCWvhVr2tSShZ1KB6lnU8jlT6nqMYb'
+        'fhWPsaucBvCCicl9cfYOEX3trRQ2kfJzmYGuzcN7tQzpr3maf67p+AAiXQsusZChTq8LNwHCDvr8'
+        'boR3XXViZVA1BQEmc7/GDkPUwLpBO3ubd8IGV8eBi9vvwffuDVpEeoU5Kspkvx4XH4Dt/fuupGeK'
+        'Pj+dr8UUr+XdHx7ZA8gouOiXWPtcWwHOjZdrEInlg5Nmi0slH18aI1G3tOoR8QXwaCVgOouBTxtN'
+        'PzCaiis7tqlY5Ckc/YDyqvQn650nynxHlu93MJ2JZezbCAGTrPnBfVRGEFa32sFS7JnFyy27HlZL'
+        'QMavn6Lkqunw6pO8xI00+jr8dFBZRchfGrug6MEngWPgO/YXo3J8wXTB5T/TIdrCAe8HvQXja18o'
+        'hKom5sO1trCTutUDUsy8DWyXC0bpU2zdHaUKFzR89tdNP5QC1Fth0uDiRhl02VtinVe42tbCsb+7'
+        'AwsuEcdvHNmsFjZkMasAuPK2tzb3sgJRiXfuT1bpOXvv/isPxmr5uKktddxogJur+EHcaMSy63jM'
+        'FXYlfcLAh3a3pSSOsHWgw4FUz1ui0uQvtXmp6bZ9iE59yG4BO2lfKp9mYjRYcAI+O6zveNUeo3Dr'
+        'K/XIYWpt4yf+suRnsfW4pFEJmW4mjhzSqubmc7vZ/Od7U25kqA5hdRjb05v2Xe71yQ4SCZr+WA1f'
+        'DcEwVJI9Wkp9FLBPYTX5O+kveTXPzGbCvUrd2FocPqW5t1yWdpYVbSvCrMfjufMzpfXlFRxyA/0T'
+        's3AoEgoY6OFsyI/cPaZOus83Z0ITNYLf2DUt4m+lBDkEk+V7ZK24z/p7W6u9AdYkwOkHNUSY11FJ'
+        'jtfHgfADC/EZk1sX/C2s7eMD5BoY/CMwni9DpPSR5yXzivOQuwuu+GMAGdbtAcsVGHsTj+Ah7ZzL'
+        '2e6pimo3Fz7OlQDDx0/98Br2tGewZFz7IZ9d/tgKtQQtvfgrcSihS3TB8tpqTn+ofPmSXygACSb4'
+        'ZcktLgR2oU/n//DpAYlpqEgNs3EDmvgtz+/7FnIMehhPgNUrWTwueNYbiU/dSt0m5A8EKcbKpedP'
+        'Oq/cfPgbUaRcMOCwfUV5dwLaF5uYqzvHjYEGWA9tMXwr5feyiukHd/V2jXO9HEyqwJ09K1F2Uny8'
+        'McMv8ph8fqL6rjbI5XGE68DYOXBll9TZupNQSxg8ydZCzE9MO7LGgulzxT3EDwp83ylQtQIMvuM6'
+        'lF4jatLnZ9+L++raGVSdK4T/S28hxG5vaK4kx31kMBEvXxZv1axViCYc9EdNL/TTTqbV9p6tyDZ2'
+        'BG7o6S4yVXi0proHYFYd9fOfMwuxbaV78P7txsA5OiE5FbLKdsZRC0O9jANoUVbRJ/9jeuuxhgyq'
+        'cn3cxGGhtQvseIklyv7tmszyycsNFSs8LM7jwbRFd/HAWpeutMCmDMh33XLzKfLzSxC/KhhkOpVd'
+        'vSc2zjnXxx+haE0BFYL4OLs4sfj/khxstok9NZURHHe0INHcK5eUTRZAoELBG7pWP7nWQM6hfVF/'
+        'Mff55KpNL6K38uVqykO5Us+YSQGYm9JTZItkvX5W5hZGNaPn4mecMVdJqm5sp7LBpivFHnuyWSCe'
+        '5IjHBLvRgHTXMFceloA3cCEGMFMYNn2DiVTrab89eHfkSXy7ktaU0lBoGV1ft1D1W5qm8rvOVjId'
+        'imi6UZvosltoLBPmbpYkHii2GKQ+AcSvW6W5NE7yV36zS7zlitqVOMIM2DnSfK1rJ33Zk9ay4kjV'
+        'R/A5v0N53jQJJ5pE90dqOoXIq5HMutP1X6u9QxMftE/WqbEEASer/T5GkBFWLgHYuPtV5Bea+/8F'
+        'SxIINeOK5vMPqMw19WAhBFaYNoTCOzdEOJF/Qq2fybTmj0Li/DIJoTdem6d0NOxwEunMGt29etzw'
+        'mgACjX04FHRfb4go249ajPYkqwMiK0h2MQxUa5r5Sf+hziIPtZTkuW1l0N6qb8f+coHcrko6RU3S'
+        'llcrEF9pBCyptG46yrK0ocBDZcbw1adb/rwBWZ7JRDRrByvi+qg0MEOwX1suq3Q2gOTfRvavtEbS'
+        'ZhJ3cnIMJeJqejCu0Bb/czHzqmQ+NxTNvXjdVrBqildtKVWay+pUKOjDkBwoDJDRgwjdF1WxXo7M'
+        'M5ly6lnpFid7zUcqFKNk/c8Kv3NgD4759kXHJTh/eCkYhKS9vCbxc6irazLOxY17HN0MtLkq+FLs'
+        'TLeqC4Plx0Ae0ksPfP+R6lKE+iUDh8bOlzjK2BptGbCmFkrmKH4oUtQrJfQs/u60rlH/EaaQX9rH'
+        'i61bD0/ITW959dFNofVuESrH6/p9luLK3lzfvndLDTh5urwVawVFprn6mN1+I2B7rUEA63EUfEjL'
+        'D7dYG+qIKD8OmTsP2kTeH1ED+UdRJKE9zZx0GuyrWPtNLDvMuP4BxA0/6MYZiLPzvHD55xf5GPat'
+        'bxyb6fVndBp1nmwwDCzZvgfYZsDSqeW1NzWKtMsQLW5ZyoaZlzTUszyjbSQgMg7vQ33Ux/jIlGJR'
+        'A5H9OIaK1JltSW92FLdJs0WhgApC7yl17JffoQqTgX/os8jduMt8S05qqlUBDL8k/fzkWg/vPl2b'
+        'SFUBbeRjBSTGLNtz7V3bViiggcUNOJcA2K/VtoyMik4cxpKRyUznCWNcBmoXUYR1UtsXX79Tlphw'
+        'X8JSlaGFnjhBod6Q1Typ/icUu8Qc+QUfGNfNlNh6Rlp+sfDku/yTWAIvq02c4YtvdEInj8krHmLE'
+        'qaUnpK8jmOjAGioq/zUYrkvHXz47vlCuB51y7TtWzibdO2PiqLxxP1CF1odyaxVgpmqotgLvg1Na'
+        'k+ijvyDgh62xHtcUASodGYGOE5nzqwKRC9ZkkKdcQPwM88JrAp2vRwUBVkeNi43m6pWK5uNSw0a5'
+        'Q9rgAlxfF7UC90Mko5Ikf00Ncx9795RyoHSJ0U94l0MWpOZsC3wuzCMp7Qof106RevpGKYtnIHFY'
+        'koK+d3YzR7ox2syir9gUSbvbs0TNFcQEEPSuMZxTSKTLEp+dOiXw+c3/LI2VuKUV5hhKV5ZIMBIz'
+        'soitVRUJ5wzl9C8D088c4UNaW8SNxYaCejYzYE06rdG7e7/9I8qcGTgieGFWKwhhHk5fWhLXUoVK'
+        '8bxtbaC4MWnJCdnhbvzDUep4uvJBdR5KTEuUJJ8XNFxkYk4yOj3O+IQ0PqaoyE5dOrKJb4G0agdH'
+        '0agVSx356IsnBMH+QCAHxFMnv8Uilf609Hx6YL8HolIUEWQDo/8WUcbXX8bQaZOCGNHAZZzKceOz'
+        'dRrcQZyLrmvzZAk9U41c0XxLURO9TVzY379zvehX1ho4fuckq2Oy+8T9fnRqLKStHFYoSmWG73nT'
+        'SyNgx+KU0KUyHw/b70Uy0UpIur7WiAjmlwk5R1wRoH6tdMAppWlHtB2BcfcFYWnkbSanMmB0Rdny'
+        'Plr2OCRNDt9nw5y85fQ2E8r8QZGbeSMxoE+xaouP6W313+kaC7gJHFTMRPUAH5Toxxc+t399BsCP'
+        'vKsCeXdjOGCwG5Yff19Wx3AGVPgNTwmA7RuM1Z58Va3swNUsZm7rNq4EdLbOdqxIpncq02NHRyTI'
+        'QAReHW2AybXSQofZlATZQjUCe9T8pzva97icCupWM1tZKilYgeqRblgsfa9RL4m1H6FKqjgK7r/6'
+        'fFRTLBlnsrg4CXX7qL0FYXaFzbWTF64mv/oxTe/qJuNLcCLGM79+PU5TwyImOSa1d5Ra3bahgfLa'
+        'G5miokBtapxRinY2WdKpFmuzC4NHQU9rP8t4KbFoD1S8s9k0bDJXWg+MTJ4LBvyEttSkx/8Fg8fC'
+        'OiypifPSqYV8yDtioV2Akvu//XMI4vBMF0jRPv51foUwwyCvTnofmsvNR7ASnBRZdoKHGBQQlc2m'
+        'zxrAw40WnZavwUBQ+Ynsx2bLzn1gDpdSwj7Gdo+3xMpiQEUUB0myae1w+5nqxvHpyNNO1DTXnquV'
+        'mQfp/OLnivDEgcyVfO2VpWCHwIGLrcfdUJE0AkRSH1FNXuNBZClXfZEsaSdpXU2keEy6oCgtk6f3'
+        'XEj4osPkSKCElkMawxKiEe6Z5+ACy9tvUiDT0D6z8DDOaXO40YWn+K+XbkLZ3KOOVLgi/rV7kiPC'
+        'Nit49bTm5uL8Hqd4uk3rhmZ/5C3/Cmiso34zPa5rWb/xlOiG84Z2uaVxMVQl2UU3slEkHuk/i/D6'
+        '/oMTVQP8xAKBge/YjHAToFzm4ZxKHihmEelCZxdRB8X+ooHJ27lV7HOvilfo6X5lsNbk+KxnTA8u'
+        'BTjrFS/cmvBDURR2OOHdWljbhz2RQGD+DGlJ0SwEANVuffsAC+V3GKIGgHp4UHw1hE0MuaMh0hw8'
+        '0NbYXhVuMIct8UXOqVNj2mNrYT6Z2C7OK37Yn+zy4NOI3YbjUX8nA8zBHc9HYzKOOHjEVhZBNwHi'
+        '1Hn0I8GxKQi8133NEk818DyfszHT2+QFQSBgWEo7Qxu0ArOlshWEQjsRYfvezUwAsFOLI3rxFQ74'
+        'tkND0XjGWwXUkpFWguUOBJ4+HrvBHqC9Xmcdhn+3d858nfbKehCpKELx4oolqm0fTYblwGfjxHKq'
+        '0N2K2qWNOlkuS00EqayvWL3gAFGJjmkNzQlwDTcnspo7aQgTEtLbjEeLvoCqDEv9KasKyJ62vPl0'
+        'eH0EeKxIDxjHzw8KEfNNindVrQEEIp+8pjWr7xqAtRrwovz3W9W+VQpSPmc06rlXdhW2GbccNRXz'
+        'jgiiWdK8+BwUTkwwBK4bKqXRO6cNvKkh+kJmAKoR/r1dQNgTWV5OkIQrihhF+t/y3byK48N4/V/S'
+        'KtVCT1Ho/c4rZxEg8PqFxMROBZEk6ta8pMYafl+mIOL/7k+vb07Thme4UXm6sJKuq3mIuIxWWfZ9'
+        'rp+6U+FH6kZofTZDxAjSmAOc/zvK1kkcRrahI/CoWzGpWXFtWnMtAsz7l1FHb8yIIAE9IAkU3aut'
+        'PGZdHo6UncuGBcEMGZIQ8laS0vTGDwhKzsG1q+Ow4y/Tc/C2t5QqMVxLCR1A1K7m30mldTxKBLRE'
+        '4wBZlfpCWNJqLcCjSm8pDYIEI8+2VcJ5nBAFD4nDB/psQQ3z53vOLsbObFsgO8LWTMSpJMpdv8C/'
+        'FVxpchVMBdF+7aZEu2ipOSu1G+L+GOH9vrsElqJMofipmwCjFnK7eaUXclgHw8pHegMeWHMnjTaW'
+        'WRS9KW7WOZk7Zopjgx/RLaZRlDBlwUIcpKBrXNvlJOF+Nc7lkA0Gss8uCZ86JDWtWbSQr8fcCFoU'
+        'riWWc8oYyl/HwqbS449ck75co0T9qX8Gv7cst58GJyw4qhBl478Qck3itLdYxQfN9Q1nbDpFz/qr'
+        'KPTl83fWFWgCAbtyDYfSXX9zd6PEng8x21NvbigyK4Qd8+3psxEHzqR8wQEaex9H4SnPjeDfrXMh'
+        'ZngHy5tIONWL831exMVe7pZSnLuu1qJwlyycWoZHNONl4Bu5KsfQSLBJzlkXz5fAkbh3omYzg7/9'
+        '+Dz3OBoLDYGGkCQ0b7JoS2yqv2O7VzDTB8gKlQOTEAaYJ5+zxB0TYcrBCW7Ngi+NUnN6/pjHFfN4'
+        '6kqCanthYugXByTZKZLPpGnC+ZUFlxsxrRtbQCd7DKxVkVxDGFyw+60Ip5hrnaq3KKdhUjw8jEBL'
+        '8d6rbBeDNxx33gCwaNOVg0lq7CDesfQQQCqemO9xlveL79gAuCXOLLKxxCqZIwKYdTlFPRtJnv1Z'
+        'jT4jdmPU5LkqBMYMiVWcy1EPEpoOPNVBe2uVEdNDdhIx/2G8QN3um86dnydsMJtoIoQYHJkUrnno'
+        'ScL/j0+Ssd9k6BQJ15ICVaOS4PBMqDBTHWRgZ2OvdYfCZSEuYmhPpghPS/J+dyVF1ooeNrrLpwRl'
+        'TT3tor1j4omr1EW9xDidHLhD6HM620HymlmCGCG/HSThk7VIictwCoRtiNjId/SHisNih4F0gEP7'
+        '57gYouEQ/zrRtNALTt67wp41mGr7aGU3BzqEsUT8yCgAYLS7f0O1k3BCblE5vSn6rmM7kTAsAnqw'
+        'ax6FfRKizYeSP6A9aLb0evCRB/f/AKGMdhYLZD2Mv27jblh2fcZwicmcPyiKxLghFiiiA++DWtzz'
+        '44gZrR9IvsksyGrUBOCiu+GQ7WPV1umJ26Mw/OlqcFGbAn+ivS5SCMX+6etDVxacilOWs+44M2MU'
+        'RcLrAOvSQjg6nvRNGiPZ87ffRtldTyB8FqeTsgidAMvqokXoaTJ4wMMfLXxviIWeTSs/nPmVznHu'
+        'dCeZPsLPGMzVmtWktaPuUKuK9Ram/jUIe78G5gzFlnfgdDJ9t6qKEEZJwc3ErGXIOnY3fuB9TVE1'
+        '7n0F+A7NTrsbHC5e58xEX+wM73YXnkJla1ZR6QVvqqv/TwGwQFy0/gaQ3DUeP6N01njGNp/BBB7/'
+        'AR0nzQJKU2lF3f/thglMmOLLPowtakRXzlGAFYQUcLf7PCMNHiiSYYIRNH06fCh/jvCaKfO8SpMn'
+        'AIHm8XaikkEKwlmlZhcCHm7mN6uz0ATX+cNxBzqgeV+WNXymZXLhkhOPQoKDPqiXifQjxTu6DUi3'
+        '1eZnSZP07OmFUJheZv0GPfblcQUsgTXw69kkqn6+PS0S0rwT/FhoocfNV+AXmYqMccBtCS9ZaGdt'
+        '7mJBrBCEw5KY5LHfJA/UwMQTCtSxJmYpPnlSF5yWnirIIcZb8E5mJpPlmujNWfxaZRTh/rSmER7n'
+        'j69NZkyIApCLi84xqKMdKgY6Z1WN7qeELDHG/KHdo2qyy+htUOvotF1IlaVlvYcx1fMkEJUKvoV9'
+        '71HAGZOr4aqoyDbBBX0/JEYCly2S5MttGy57F8mTFP9FtYXkZEGBkYVc5L1NczHSLj9MVzdqlidz'
+        '9wpa/mhgyohcqFm2jb3XEouXlwCKmoQIa4gVxCropqYobR7u4IdK90EVBFC5qbnIQ91NdL3GOufh'
+        'nOmfE+pxFwUEQAFqDkuD65IrEgAfG4SC5LdQ4hrpKFNg2EY03O+7EWdu3CbLdmhxb9hrighskMh1'
+        'u3LHYS2baRXIC8VKCxaILE8lLz+xp6AkfwS5IpUKlOqYiwvOBGktUh6zf1qtij3Ci23kaAsFG/7m'
+        'T722SAe+eNXMqTvjHhpCk52nfRGqn7cyGK8md6xKZfeQodprDx882otzeQRNWFgGq92O6nzOrG5d'
+        '7WqQhJbW7B1bido0uauRDpMQyY415inCcMr9j+S2nTPPKL9sric/xe+qvWrHWc7UZzrqynzi20gB'
+        'y95sYZRxAY5H95habnUedaFdegLPuiWOZcXZLY1pvt10irCpmjn9rePfcYwS+UjG8AYAZ5w1DbAA'
+        'ACZWeurq/cuH4ftcdUcTcwzNasfMweyNaP3FqfRcYmNiLK2yGoS6YiIFEc9oFdeU8mCYkhpFWjSi'
+        '7MIUCy4iHgFmb9hJK/x2EBT/je123Z1wBcvuvOQ+o6E9xr87f8gNyhaLx73QuqQIls5v6kMoG5cI'
+        '5sU7ktEz2T3lh0SQcAV93nu7htZWwAgF+FZrLthplKVAhLyZRAne9yiGF2vNHUnhevT88zN1zsmd'
+        'OHTUBSx1/hN1V9k6Nb0Up1jNRYsP1eF9YnqUJZgir2FhoEHoVwnjHoshQqMM0x4Yi9cknkUDuZQD'
+        'qI3eOCx0tZfhSBEdQMSyVfooxIywd8dR0QHqN46Qg5jzkkWgNJkuqxLK/wvX8Bfx8w0DasH3HEnR'
+        'FKW+wPWhkYUtwB4hE03OVvaa+fPgr+67bxM+MdvaD2G88hbFgmLkhghdqGK4uhXtU7xgwMN6922I'
+        'BRgqyscIXPNvB0VIqTo45IxLMxHKfnujQXeZi5LZA0corBLtwG5FeIa106umgmjDIGcfiS5IM74d'
+        'SkzY/bRfQFcJSyO8mb5QMV7+YSC29PPIjqORWwU0PjVfqmagynUvyKftuOiuJfiisdeJhOhO37j4'
+        'WXngytu8H+IS9h0CtZ6gjSYh3AdFVAKRvhuH8A7+5VxjFj5bpDn7azpr+dWZtnY3sFO+7LQOIdL5'
+        '8R/MSESKW0x+Cfv5tCgH7u0vNlM3kO3TzMcrDKMVb9aNp5IM/FLjzPff+fr2JcUki96mrOAG84us'
+        'hwpUuMWs+6P0eZdj4li3eXoYVTaRlP0D9trwo0HUyg+VipxTWiuyAXBIbkWpz/DQcoZ6pHcTaD4G'
+        'jZTOc9iojfbihsjCBvgkr/y9muMamCTr2SA+YppnaB7vGpl8YBb0BBThkVBhcy2/VaPs5PSUGDUi'
+        'WxnAwTDZXPViWp2oRwHcEU1cb6pK3fCt/Z/07OsmKybvFwoh9saDp5TsHJS4LbNZjYwcP7nlW0KB'
+        'N23LEwcewcJIT5ICxSQiuZV38WzK9/PM1k2WDbuUAmyojC4DVEGnfBYiQEKJywBw6o733DMF4fLb'
+        'PxGbB9DmnHFRr8XGL32GxyrO1hQCgWnMiV9GIpcwMcbtrgOoXm+imESJ2/P6L/gn19XwcCAkQ20b'
+        '1XsU+NXiaX81kdtUzYKF5z52Bt7/wdapR64AgMelKEx1c0eoEJH59ILYmbcra9wDtXgBTQ3X36ip'
+        'vU8dKCvscupbtcxlOb7F7UOMIxGE9i7xJjj6xr13o7VdsQ+xNYklIKbYYIUrr5q6hCwz3oucPgJB'
+        'zMBvWNBTZ8TJZjWo+5cWnHolHhmoKKEiq2iECnfYu3OCl0H31TFGpXgZ37oBlwa8BxoajtvUIGrB'
+        'sOcIr25qX7Un3UD1zXTiVW4rMA58O9GWS/enIUTy5guMAqzce08q8JnX0KCjhh67QbJssi1o9+8z'
+        '6Paq6CKgEIU8BrhHIYRn6o7EjyPZ8Dh5TEPPxsWAyQeKHEdqs7U/cZQBKfHL1gFzjSG+r8ut7NcD'
+        '1xRB9eZeeLeT8a9uwfmBRmTXU55RJdUDd15uGUzfMAcQsi2t2+986QXwe29MsoJsOuSqk9ZmobLe'
+        'W5uu2mSl2wSzdUDi8BmLzqCySUhsF9NBa8il10WxNe5nSPm0cNtuU5rNd4VXYahAiRcWtzKxBTK1'
+        'l/bolnQOawk0PrR1i+/XT2nhJ7Z3ntLnE4q5hcpNx2IewFPQmRW+IZBMkCWoBCQJds59RlaEX7g0'
+        '+i+dcxOJGLXegDdCqJrtAw6mFGYmGi8Ztwf3lb5uZ5vWQl5bSLsRNEk4tRx441awBUMQNXG9Ruri'
+        'kiVZFA3sT9pbagX9jwwKqufbV5whJSUkLOC6tv5lwATgKeRjrpzLIJvwHlacvlrKIGuamBHQP/lf'
+        'JRwIUtCfkS5ps7cWNFWwy89xGgvD5714I5BuzaovXGRjgJRrOoaDnl6d7wywItQEug0Z/Xr+r1xm'
+        'y8XIAesPhtP+ydD8qtFgJb0xzhdcsK87uKONtAN8e5M25VK7Gu1D52b10X+7d+6Dhk8WXZWWYTNn'
+        'ff43+0Uk8PWYAQr3dw6WErODA18zjlCBthZAAXeGoCQW7Yd4vERCLsOdY9/LDJ59uY+baceoxNy0'
+        '6H7KibvT+tl7kQ+4W1b1HdR2CFWVttgI1ZmhG3PI83T/9d5P6E5+tB6BRw1ZHq9pVh2kF3YoU372'
+        'XAaiBu5+JBMvEFJBBr7UZyuEjJp56ClRqJc2evIgoH+7F+yjbaK3caNdlyL0CQ4D3qPmmQD8olqh'
+        'e4sitssX2tlmZU1BF6NnFZrsnBF6ETg6cVaqxBPJuEG4mkxa6Jf1ZHB2Vaumx707/zFvO1Fft4O1'
+        'G4Kaplbrwcly1Zp1PJSJlzfwrnMs+ZbQshyIetGRFkFqZvyZ7iT1LNkr6C1KPaCFqLyAcY3GfRtE'
+        'd9zupg/PJPPyJUnqtixQbpAccazkvU6mnS+zFcBV1rVeedWGGMfVDqqM//z8x6xa3fydARyx2U9r'
+        '+J0oqR32egwMhkulRPiyfvVxiQvcobQveO7ITa/7k9yEDC/jR7RS8eHOLMTnbGqyMW5mF/z5r1Fr'
+        'J+juL3cX4oer5rX9D2vTLnDXHrTtZEROMBRYTrfIABfUUfiebN/v2q732r8xnHZc2xNXxOS7FGpb'
+        'qI12jl8B/cPfqM7RHq/c6sHSphMT2XjK4gJK2NFcERVF61X8DMNdM100ePKpE5pakcoAQmSU0r9C'
+        'F1L+r2osxYudKSRwi6nrs3h25mX7g4zbAGQr7eBARR5437nsuhtly+QR7k215eZXZzLGU9/57L74'
+        'nUlw62OqC7Lq+zRVT/yt4EbAkgwlZF0imua9VUdL9IKNLJd71B4x/QOIXv1wnfBc4NpSWAe6bzCv'
+        'nO1z4jGoZztGDARsyh7sxki+LdB0UjdZtXjim+MODZ195XdGM/XVYAoEswaTkAFIHnT8qJjBXdIb'
+        'h7D0i5WPc2fM7x6RFAxzhf1j7GTW/TdDJuxroxjMcckl3W6fqDZR97t38IqoR+Zzd6z9II3SkSU8'
+        'NqmTp9yLZdymdvdjvsXsGQIxP5UWTd/eYjvVBAP/7SYeyCNRBvanrmGwP7IobEdT5NtJxdQGIKYw'
+        'VRnjpe3XBpWOfg1D+pvuC1KAoV/QBs8V/doIOAqx2mkGCKUFiY2I6pptouNXbQHnAOUg61f2erUd'
+        'J/8FM7LIcCNoXpZ2gESmGrQzauS4bdvpuuwCBF6e7fYeqF9D2w8Cfo4wWJ2knKA4qizsxSqUyka9'
+        'N49yRLhMix7vRuC9h8MO+UMGHCGJ505GERBId99eeb4ZHvfcJrgZsCdtH1IxpTwft0C/gXOld2+h'
+        'CoFW1Ff9mVCzPmnzVona6YjCDCwj3EwYd9DqniML3WzyiosgA8M2rfXugEFTf1Vs5Mu5FAc9ks/N'
+        'GvgzyhdJBJB5iGIqW8MqlOhmBBd9Nl4rHSjwgABfyraCHm0F9ofUjX6en5hEpTy5lk8zjvlbS5GP'
+        'QEzNhE5rbcvtH3iCgLmkvNisGcW6dRiqgHNJ009V7VntS7LUZpraCwqqaewPBf8N/vMoflvCdMyp'
+        '/ELkDgmO6+6OOsAS88Cph514FfTBpphArWfmiux4yF9My9gNgbDvGNxqnYpqRNE8U3A47PCQOJgX'
+        'kSEGA2ONriHQUPYvD6j7o+OVEFvZ5ZSceycVjq7zBgx/lYbON58BEECkbzvcP/xYyFXdTyrO9YuE'
+        '8HzknGGhpCk62CtZ5xovU4c812JcjBGxBpY1pj9Dps+IJZlomIoo56qLW8rmNZ279hNCNj4AoL9p'
+        'sV9sZcITfyg4QAMIuTpaGlmXw+UEswzgGkDOA+2bMQFTwVqHHlfu4RkRIfoRFDQjvmAAJGzGAuJ8'
+        'KN8aZ6RyUI/8Coh+pAVr8K8ekGgnXsbduTpIiadTw5zt6bSLAjSsOr0ELqgeh0gNV+mjZhNNMWFW'
+        'olWbCaPYvTVkxfI1Zh9ceDqZTVKeWWyoyj3Js5SNvoR4JDATmEMKzNOwkPmQbm9fZBKAMhwTRUIS'
+        'JN/f3rRjJi9OexOpGjH7bFlPHgvShjwLLdudXt6cXCemFIrZhAMuMYpyVpf8C/SSpmQfyjBQFGiT'
+        'vsky/4KUN/4EYrbywEhq7l0mL1/w8TTaNopahNgV5mh5RxxJIdX9joKn1Ksb5P9ngzErH3OpY19S'
+        'xDIF2HBEz+z6x1p+h07fMRtZ4wPZYAJkrerwqn51ie3njlWPilA3rdd7jqldCvsq/PNxKW6B11F2'
+        'bdCrmdStsZFDJvevSEYzombGz2Dx5Qyk7M6oDNfwdTzexwJ/rqc1U8N1Xwp7V5JKYC8vv99+yDHE'
+        'GdD6fOObFASpKlkaUfY/90d6vjCFMVw11SxRdYjN1z+XMYpiH1m6I3JeFNW8h/m4yq+vS4ESQ7S0'
+        'FImxenJQdeqpVD2duf4SZZs4KEo1hROMb7rtUJ0DzHWWT7SnbyNXOr4SdZvyFywaLopWTBUIIdIq'
+        'YG85bIwYjBtNkbtQx4TGbJRfu9gJkIrEc1Ba9lRvT+9xaL0kDOg+vfU/1VxmycqYkx68nS+FDfGr'
+        'a5yaeSJk/R3hVNAeaQG0/m0+xAutzrFHKY3pf0cAuFY8Oi4V3uBV3KSWjc3mh4jnyQ47b/OZNGPz'
+        'T3/4bAu+vCqeGfvGwckihloG6uSuYRviTWuqLrB9TGVt4E4qm7+Giwf+QN2wfYNamVbpGc2GuKwL'
+        'YH2YTlsrI/LR7AmMeYFuypeayGZEGWQ/mMFCBeiHWsizJVQuiVMeulfSHgQVp9YNeOiFQi/DIVow'
+        'yoHP9vD8C27sbThOFl7rSO1De5+Sm14Kf17L3CrDD8gHmeAFIf9OsmjqVkK9ZFbfWyTFS9Ma+Rr+'
+        '/hOevm+tfyCIJEtwUoHu98kT0LWr52aCBisINND5RwLFr9E1h9g6qkKrFqcjCtDkGipo88vRHiB0'
+        '0YhDtZXE+Yz0z5EXWOJYjc8KuvefPuprtRoTPOeJyL8pnCC2jjo5PZGvckpzOgqMkEDTuK5CN1iJ'
+        'IPvGrwkBfFzUkVqDoOuWLk95g8SsCgakVi06eCMeiWSQkk/NLSh/d2pB43vS2Pg5PdwXRk652vxC'
+        'xomGP8fXQ5aQtF+BBTjSeyyJBZihuR03l/nNi7qr3YOzUv0rsDJqy2/Psbnnhk6Z5riAzN+PNQ5p'
+        'If5JNSvLb5ja2Ffzu9WWFRn2+f6vd2OIdRHIuLWm5pEhvGMeRvpWtHUJupf68J6iYq2cWOSnrCZp'
+        'V23tldSDElzvXy4PA2lLHOn+iNbhzoklC0DFQiB0EHyddhPiSoLwDGXHrKYSw1UMDCrjWwqpVyei'
+        'eEQAfLgMIpaok5E/6MOepdQxq0inV3MHdx8a5iwahO5H4XzBKGfjFythJWfk0FroWTlmHA6AQ5j2'
+        'MVbg+M9ikeRVhIBJUBBwjQW6QbqDgY3sU6weG6ZvOxKcPYAopC8UAGzTTsd60MfNyPtQFUUfSRnE'
+        'GERzZEZ2exdGbcTY1m9K4ZWjBAmw2ceS/U3ammbZouq2z4h/zJkEtckJwBv2s/dqU7dX7fML8ZoJ'
+        'fpQF1likPsD0oHczveJyScqP5u8fNG6GAraWPVB/9MyfABxsx/wUxxf6c5bJsPoYpTKOR/OtyyFG'
+        'NhthTU34imVwQnbdr2elQN3IG8r3YmG4y1OGc3RW6PCW7Cv548PuMriMGaiX57/i7GWjnnjyL/Vv'
+        'GNJe1fHF9Bz9ezWxPt2I4PYMcg2n08QoXJUaf7VLXdMv726g0JACrItcGX2hBjrhNh0HlFEgo/X1'
+        '9u+RxmkpDRCPrUGGf8ez/1Dcw/9Q9pHBnppBgHVqm+J/LyeoEA7Tc26BjGlCqRVAL8n9MVrPVwt2'
+        'jnkAwHGTS/VjblJ8ZBvjlB5AJcSqIcirEqAP/eLgTeWJRRKBJxRhcBcNZ6z8Lz9JUqE6o50JGDj+'
+        'YFM3IZdy1cwid9GhEAIOl5hDw4L921rh8uv5/ALNWMNcThi5b1AorY1Jirqc1057hxau87osOuiB'
+        '3gEAfoO6JmHxVNxRnR4Ya+NGMr27/0kycyKdQYv9ZWG6tkpFkCh4b/kzE/JfgWS57svR7tGuAXpS'
+        'sd09Fq/IE9KYLW5dMhUrbeYK+OTMsiFxjIS7S4pWBNLgphs8opkl6rKUrkVbAK4saaIznTsfx3Lc'
+        'gtkFPgITi/wFpWZ69wDHQN5Uqe9CS6YgpIC6xKPZsH20wIWGoAUQ/+ZqOH4CAFljnjFHVkkqvOPU'
+        'qeA/X8clXNpWyTLDqcwSSMHL744ZD1YsWM6x/ykOSoeklmhwJn9ms8ZtguvXS8i6Sreohsy5xrMD'
+        'TJHbf97YsZ598vrOvQho0pB8ei6sB2OoJyr6950E/J+O8VeQQ0lKJk5WsIuWE6qWSFphHB58fVxI'
+        '0hHrmjrPqmUCl8fnSCCPZcx/v5gMLFVSfg65b8uvGuvKre+of4lJHqKN15/4ru6oAh5Bm6yahYt4'
+        'MwFP27r2QeaRO2XD6AcC4PN2IS6qsS1AArRk2uZaaD/5J/0mqdlptwMnqx3S2k7+FPrW5wKc7as/'
+        'UeEIXNcRs54vjbTNNumXVqO0tpRA7fFx5zvNdJnk1fP68XIvjnKWJpPu7QFaFBzztGj4TwaLZWSo'
+        'Lt2z08rPX9eltuUhpoVS/QzTDMf1QlilEsQcKTr7+zEub7sEUzj+7CI03qKZ5gv7Yaf8lMMgQ9cH'
+        'leoypALqeCxACzxnPW3dEBr4X84Je/dfXytXc+WTAdxr5WoLnhjOOW/fXiOhYHYEbPCIbvcunV5k'
+        'pYZ2vUAtBx4fEB0CNHxLSSZJy6qTak/co8AOCVMINvqezK/Kn3S5lSjzhYK7gMSH0wIvvG31dqmV'
+        '91xrzTUGHL9r6uceAc2xIejMuBrwKmTzv/rkFHA3YAOsewMjekcZfjU3S5VtBgOde7E9/8xLxcX6'
+        'slnRc7wNHRdYYhNvvRsxoHNzzAmh/Xsh43RZhxYFrLxO8U/T0wONagcx1uyyDGGIoZ+UlKZiOKbw'
+        'zewcQqgr1h9XG0ovaUThEG3RsGyq2217Q1sjyPFEwWXjO8933ISJLntUJ/6OtGzbv7TA9LyCPfdM'
+        'pU9BmRwkGC+KR9zHP3O9t6oIwm3C57d+wV2OCmBOUlp0an/N44WtTT50Z+PhVQv1JO/oyISNBcku'
+        'j0TJZ7MNDXhxySFvInoiRFby/sSJd+mQeNp4Mo4rt4+Qjfw4J5D8SB/mxBm368yEiN/24rViSOsa'
+        'hpHI5lg0xGlL7fXurh7pvTSLDFLywUP0qpHl77VS+nJJdK6tSRqlWjhjJ11DnAMm8APmzVG3vEEO'
+        'zfSZ6/7IIEkF+2N7AiAvJ2Dr8eAIaNVFuSM/gpCjIDbM5S5fdgSv1e5gOOXl32Cz/EYh+ONGK+Mx'
+        'BMWax+X0YgAPgl98fX4pv5RtLpixodnIl/2HeOCdT78YLwNvUZ/nooUinwyn0SYRUuZ89e1FEqmI'
+        'eJjhjJRXEGVG5GLi/iyqEot6APPzMqFRr2xFl53SJ39hIuqzCS3TUiERYJyZtTwsJZljvUNoQKI5'
+        '1l7VhHMDEUjpb//Zhp7CYTzOLa3MKJp0fIydTd96WDch6LHyJQFHgGMnTdRBB9XWUj1C/7Gdgpqd'
+        'aubyh51C5EyyNPpDB9AIKyFoNI4tIvB7YTvKeTxjE1ACOwk5cYqeano62zHFWC1vdw1SvFkH2a49'
+        'm1uDfuxLI0muYBidov9S1QtiTbJ6XLIgqlghxS1MZIuJYoklb4mnDyu4Nchba151ZJBxwHtshNtF'
+        'NQls3bQascRGYPV2H+UMuU8qfyqVoqXkNwAyQS65bxfOFnWiU9h+WumSrK9CEn62x+3HTJzHf4Uw'
+        'MArzCTKxeYoHZBbQlluFVVhUxXTttqqA4DkdpxfaYZg5K3J/ASvFWtEGTy/YGiGScG6Ze3/X+OG2'
+        'I22Ueq6Dkg2Pdjf+EVz+q0pyHGJAXeFYs6iNMzNUTYNI1dWPslfMUP75jAp0OzuRaEGyOug/lxT1'
+        '+u1piI/fabBA6eOG88OcIZPE9cGwRl4uHBs0kQLoNAgJjeIPL6WC3zdEy/weqI8UjBp43uxyLVcC'
+        'x7GB7F0t57AGI0KNj2eUo1H9KPG6QVV1FG1HcfFdWp3E7c0f3+VRNvcjnVcRN1MEEhkUTwQHYl8L'
+        'AnKTwF+j31Jl3JY43eVyClcf2Rh0rhPVkI/XshpucS60mW96FcuvlQhuAlDGTxaNPF4+rgLHX+mQ'
+        'smcCi90VGDhP/x+1NGaszmKgwEBKHytbaXapPM0EJvixoBmZdpSUArsfNNrlertVO5tu70k+MJZx'
+        'QBTyNeVMTllJQv0wSQRNr0bxrOmWsF4VVh+d/MIhU4LuKYCUGxcFTv2MFhWFvmEAPVlWmcZ2+Fu4'
+        'BD87ELG83+nLJXFuXEj7+bYASGjlV04S1sFbeRex/CSQXaSFgjgFfhx1jNR7nZuvycO7W9f5VUX8'
+        'FeaYW0vIBr82ks9wUIuBtIDtn8iIvZH3kgkmMzeTyc0scKVnmkz5CqDo+P7253I4N5/HtJ9+AYn/'
+        'RRE3SH8jNewbJTX3kdb8uI7guowpelfyvrjGZ+PfNy95awGKL5f3JwRNNyNsnsrG64M9hCZ1+RjJ'
+        '9pzFlWeTtMeylaaut/3/ieEfQKOasTaaNgLd9s6LILRTEKtjQBuC/fAc+tid1fSLL19ffebC5cWm'
+        'r7d+/sbQ7If3pYm2XnhpIo4hKCtG4j01f+SC5ocncc2sapxuR7pD3QCOF91+dDTI54Y0D80d1V9p'
+        'DC2xKt/onxMin4sF0TUxij0qAspBdgF6kEX0UD/fawNiqU95PfjQSFTd9LR0lNQy2m5A2Kmp4FC4'
+        'toiV+RqGIBm7+/7BqbuzJvlt6tkCAvaQhNlkrZ9LFTt2IcH8CPFEjuJAH47qMgZ8VW614GlmAz+k'
+        'M5KRAhqVeXQZgAKK3UHDV7zqD3xeW2oD4zIhPGUB53bUPu6Dl/hUN03LID3uFUvHDZdwTYMXza9l'
+        'VyIrRMdCGAJZr1zuIipcUIG/DNWMWcZSjWsT5R05VmA0/HbkmT03ZvtlQSwaSZZ4NtO+1dTYp6Gp'
+        'DkqH9EiQPTsxXOu+eC3PxFa2B00kVF1D3ALjJ7667QWpUxPRMYRCMdAdfxyn+2QTWhInwrM+wryh'
+        'bSe4UDt4nM2h+KFz5Y4jnw7i4418KkJ5iqNoo53LxQat+WvH4sApodjMPHKvwimjsYl4y5BJ3M/K'
+        '0EPOggbkrNIDsRw2O7grgS1a33rJrePmBSZnPEI+v78m4+ssuxr66RdKK5jXoT8zmn+yIU0xSscS'
+        '+ermLSXUQrTnZBHmEdRWYZv/f09zL2Didb1fPB0Dt9PW5U33eR0+IHoRbht4WY41xer8n32e6jbC'
+        'W8xEhgk2keJ+KWLT+i8bEyCdk4MCbrSZxkGhI0phQ689ho8nhyB56Ds0t/zC7fw7+ioT9U4iSLvm'
+        'Loo93Sgk2H0mpxhzbX32V4FTI6RdP+WaX6V6gTlq3SOb/uq0cwJ0DeWILtkAw3zFMVLah4vDnkes'
+        'XuEO7pSMPB0V1IdsOmFH19LW1OzNW+z9+zwONelaiRVJK+e6pByVtUY5VcVb3VE0r1iFM3gSyABf'
+        '4HMYHTn78ViIXVbY4uSEOot5rnPtao3FOMYNb5xjyxblrIjaHGsZgrTISJ9USLM6a7+nLOX92D7h'
+        'xn312lfKuSjUSkmkzmI2to+i/Xgd8tfv6HGacR+qNLQX2a9kKNaH0YXbWcwfLKdbacgWNA8Ss3T2'
+        'UX91l6dZuukAld+FWVQGhPVYIZfXD+/K3+a77GtoqgvzLWeWXba6peFgB/ysV+0KN6w35Lt6NfOC'
+        'oi8x4ZcR7DIsLf8YQTIHv2VuQm6DI+swHGGkaxRNZ1qoQ0gEMLsSzhw1hkcnrZsuSwRCrAn9JBNq'
+        '0mD/uKTcS1k9w/s48KLcYXLXJslds7BQahGljSN5Z7FlMZjKqE8txaKad01UFpDi9CNeO/9y7n7i'
+        'N52gZreim8n70sYSChY3sqZxoxvcIXLw5/DpR2kYnunJi7aBC0MZUWOX1ZUXbUaiImlvasFkxZf3'
+        'gpmtxHZEv9VfmDNYILu/AY1QGyQARk4V4+kd363eMaGdmXUWMrG1Ub64wn51dzAJDmOSRnP3DkRs'
+        'QtHkvbJrc+dZPdI1klyvIlpGZwyRmYeocJVFhWZGdeYAxd8KwyiB5WyDiKkM+OJIXOoV3jf4clr9'
+        '7PX4ayLrRpY0G+KoSKAdI3KAWG+RgIJKeBAE0XzV21wXbr78a4h+MUlgNe5T8mdOZBtYD7R+cxu7'
+        'bkxpVbnT6JoklvIyOHM2Domrd+lELkZj4icFl/hCj3+IDCLcE3P+p/ZMoNElkAIE5KayO+KpljI6'
+        'Ng7milxVtn+Size/lzp4cdyImbIkvM2hiIF+PaZpxcJ4TamW9eRXjqwKSlCmtA6xNXacSJYS+Vwh'
+        'wmyTZCsIXa95tttXp7PHTwC/Xv0C5LTMsPUYgF98zdcuhPc0ISdd+hqsVT9KMR0ZRVTxVbgZ5T5A'
+        'aR12kSUlJNlEqoaf28RVfEuRa9R5xfJGOhIm8dkPZEojpJ/zMg9jDnmxeZd2fphLV4x6oO6M7xRs'
+        'mbzKv6aKbhDBQ2MpC1v27aY56vWbDTW1MSqW4py0+HLNxDXJPJtAagkXntu6GBYV8hUAGTM4mV7Z'
+        'DFtVo/ZkMbhkR28s1n4eJjzp/3bNziwtDcCIqRQozmAIhWpr6Hy+cYjMuc3Q/8ORe8E3XQ50h/LP'
+        'GIrjuYNZV+Tk2pidOH4hrWMrkbhxhN/12v3oOZRKMNiGxwPvfEv9Q5JJdHp97VvOLEvPwJMYLVot'
+        'KrTYECWNDuM4nyxOD7yflCNONfUZNluenX3Ns7ZyV6c7tgwdAU7hrsiwU7J0rwHca6sDHnlQXGl0'
+        '4hjvx0SkSdrNPKOLsfjkYe7PrUAln//1FjDujgoOWEGuCZiaLO/K8VlWeTPOoiUEVjiTsceGyqM2'
+        'ZbMIN6lWrF+yyYfpSvaqUQtu0TrGILWxqozvWckGWCeYnBDeuG7u1Fnl0+ovw2xeN/UsCIenXST/'
+        'OBaEpa+Rvc91bPl06cXguDHssHB0AdB6/fwQnwRFZ4YNJXODzLoU8XZ9JdVpJJM1tOesfYC9ccVB'
+        'Gr6A3Tf37d/OdGEa9PZxgpIaxvJXPuTPp4bLVt1kIxV1GrCiVX7LjXL2Lf8Rb5imG47rx6delPkW'
+        'MoR9cUB7IBvCeSyLpJzC17upEVf3Q+s/iISpGWCa2nsL82yp9/B8eZ8u+HU4Les2YWd7UPgMOdYc'
+        '4RdNTID2zlUKc21wY4UBUXUF47pmEFhPwXeUc9IcBOZQJDI8wGkZbVgXk+/a9srKvudsc9WMobQF'
+        'QjnqK7FLTAWedjLaMYVCK4Qbo18UZNrK4a4mTAMNpKhluilxpWCz0xMcuKLsM+oTAvmJ6CuBBdOi'
+        '+S/0EjLXj6WHX9OjY6n4WFH9rot5yX9EBcbH8s0XHjU1UpePghKVOOKxWGKNdYSotsH5PbY6VSk4'
+        'ko712aAxr1szgKk9p/PNfU48barJyrn56HsEq/uT31VAhqNrQSvOMPrS2Npm2OOhZoo3Z+9Gzyhz'
+        'SakON2IvOvsrr3G9ohroSpvbKq6jX+wMaOAyyaRcxk1vjskzvUBWBmE5wJ1O+daBhxvLa+H+eG77'
+        'tjRBllK/WsYNiMCNzc4a01VX1CaLWCYYMjLopPzuANL7yNnLOxxNb0lViGSnh0l162NtmVNOo6Gr'
+        'DqaZi0H6YTGZc9ICrUAlpHg4QRMcQMuWQuLEXrK3OH3IvOYJBzgNmBeBpHrw1TCe2jz41kdcj7BG'
+        'Bb6sLtRYJJ9I0jSx8vWEbSMjtYewTT9SJa8/KwGKUauYpggcbkre6Ch2J4ZdPP5CYWnyJxr0udUS'
+        'dFLFGDODYapzkCuM0tVjS7IF+ScSo9+B8Qydb8BB8R6mZLX1MIRy3C67/nCUH4qDOsBcD2nn6msB'
+        '6UhsutlFvIMnf44zBQR6rDwbNSkekgM1n9id5U9tey6LWyojnD3VURetfwvKhjByG/gmtQ3IXMm+'
+        's2SSM33YPDR0KuZ5VIYjhfGh8oXwagSoE4APxfiWwf0uFCVmS4GM8s59X99DoPwdj2PNSVlO1FYO'
+        'PAUvY7UxlDpN52e7jj0pJi8VKu8Jjlo4GzzifPvZ7jskrZhxcUXakCHfx05GD0H4uIVaaGga+ezc'
+        'lB9z1ZlhkrobIY4PxAKq0FXHro54VxxPs8wisVIULz/YtBNRAcrQLzST2UsRHONsXprAKx0BldTx'
+        '1RLRoOFy8VrIuA62IytfqaepMG5J/dGXUhwVrdFaHAtubLniUK1wpKsKP+aeymLU/23GptiRkQs6'
+        'uEOpM5OadwYCc6jthLnsphztzXGbwoB3n666I/mNt+dcBYQWJBYXaEeut5fSYlGBwClsdRWutVdM'
+        'kGtuv7gX1dEYOFtvwzYqqEi8dN4Wk7dyuWnvvPwJ4mbkq+/fdP2eokBuSn1AWNnKIX61zF7IiWSH'
+        'hXK5OjuubuLDwQ2EdKYmA6xSAYZxjQ6i9moWGVCjr/+dqGCMHMkUEd8D5pqUhIGDIKISC0mxbb4M'
+        'FMG1eH7WHUUtszJTz5dIxTJkZb70FmJeYkPgG8Ope+6NVQPoWQ3fM71kVTpUvODVD70j5T24NcXg'
+        'I7MuQgelHiQ/Gls4HRxUE3Fz2Rp7QjnqM9GyNZ9QWqEKl3Q0HHk14cnITicCLjlH56UU5NL4bCeL'
+        'WHUH6tqENJhDtW8klCO1/2o3hryH2DJBJn4WdJpp5gPqTE6k11G7YKlOT+NsZ/5gWT9C+lJHF9mC'
+        'jajm4vmqsa8yohnapdoN0OaQZxa99hMJ3zS+8PZOIN8ZntoKNX4dP5u+qFOw7TmPpwMnRqCdTAJO'
+        'Uv03VZiODGmcfgEQhiLmgvrzq4oHj+rjaSE0rIjQuzaBA7L4t/K9yYME6bPS6wN3VmB8CW/uQ4mi'
+        'KJo7Ggn51RvXP4iPVVk9HiBahZ4QfS7DKH0er+i1fIKP7v/NWqunABvQWX8LZRIzjADmQUw4Zfg8'
+        'OBKZpQTHXEJhRUavp7l7Ix4njpgqSDINTC7S0b/1XRCXS55S7ah3ZNh5aMpr0yxJym2BmRCGYsng'
+        'e22oJ+uqYrTcb3f98OWfzHErSmDWGk8D1QMQFBw0L02aSuMnAUKa+dIg6Ug8cDF4yXWTB4529otk'
+        'Iresb1cQJc+ppyjsA6oGnxp7fcXjtqMAWujIJvHkp+EuezB0IKa49Td+kP4rZizGjiTm8U8Y2Rzl'
+        'IXeQwd/0ywFSIOVO5dBKZ6Cbxk1IjQx+ZWWx4J0I1U/dUfpCem8bt3AHLT1QthmXaLgov0dm7Juy'
+        'JLLke5IL3NlHvJ0+mI4iCd+RDtS2S3hvvDEJDHJXb7OjT6Fi0Jb+H4aZ2hkVLY1NDrj6p3oKieYd'
+        'hw75tbNHA0+9fHHgbr7nEr/Ota1iltlLly90WqOprujWf/EBZqBTiOmo5vkn9A/0tzxIaM2uE3UA'
+        'JLGyK1vAe4bMhxyJ7GO1JSsCQq7LnaT3aQLy3yT2UIxM1TMVXZNHDqYNHI38mZPPtTPnag2jyx0j'
+        'JA4ElSbovauukZ+25lFcYDafNHoTI6Vp4ddQ1Ir3G6b0K5xBRCAdBRg/q61DkkYS9yhuDVVdxDdr'
+        'RKINCy3gEiwpd9kFQ8g9nx4ia0BQa6Z7QpDVfkx5QuEA1e72VGGQNjc6ECB66DgnI64mtfZdor6U'
+        'JBOE2WzjLK6ui38iDUjvz+meTnFcZaZw05QmAZy10kSvYWEgcbWaTrAE/MgMrSg2JOvThvhPKLYJ'
+        'kJHutjABHdENz5uPHuwmlpR/UXJQ4GcLu4OZEPWfH/ENGvnCEYXIRwaZippvCmcfuh9nADR2m8pp'
+        'gx/4ZjHhdc+4iEcI1qkwCLPPwb3MOcMr73Do3Xl+FDdrF2v8skp9bSwVn9fXevfCRjEcuvKdhXvf'
+        's6lG+OibDeRlojjGTT54hzUvUqbq6RKmk674fBkrupR22gPy0M/DcWQDCWNwVRaX3UidEC+ADOeL'
+        'K33c2S4qXNCKXhJUbwalzgdmDZL2nL8DOkqdS2Z3qV1oNJAHXAPJJwSfSvpYNJ/9BjScnsmaGYwi'
+        'eD27ybjHKqY1bZYQBJSkghehor3J+Ja/Q0VVDPsWchm+mW+fOP0wu7MhWfElWdhYcVMX8VSiK7MJ'
+        'wEkLO9Ugylmryc3M+Ny5VkP580Q6Ev4T6lhikOSDPworONzvtv1zfftxyBlFd6yGlCu2b1w8AAqV'
+        'L85yAa/QjmfmnfT3/oF8KRR6445pnT2dVojLXk0EfzK8DXF06QeaIQmTxQsvHJaADEmzO3UxPqEV'
+        'KLu0P1CV3/mlWkEfEonGYFw+nKqLb3OfEVjDt96hDYCxT9O8DXZD5QGYuAaOqEqseRuJUZASHudZ'
+        'Py6hQr9mdhAUArAyiH3aV0Ww4Ew5zEeZJAzByJz0+6EoMZIOvMxWxkctVMc7X+9oewi9F4sTCKOw'
+        'mygb0FSJiBNOC8d7HTLxPHYovh5FYO5s1J/q8ukCKriFKLxuL22fSWiXbVYubrXoyOlYsQnS3TV/'
+        'w6alqSmmXWpib3cYnK0KYXRx4zij5cKyFjvr/8PG5Sb6xBSxBeQJytBsjQyKuRQQPZWY77FDOZaZ'
+        'T+CRze7bovgQTSMuTvDy1JAKb2qtE4xzh/Y25PdHrRUFMDRH+61NBaje1mm8M8BXJQt6Ge50c+1a'
+        'q6jYcmKUYfStDR+3F/X45AvoPbw/eZ9RgetWFYS95IMuicFOvKOxGcc1i3OJmzY+StZmNFD8Cl5L'
+        'CY5B0tr4s3atsFoj8edPzRjUD1TNToKTEG3hnQ+q+fBmWBhFfNRdDSQ3GIYNf1zsOWYR1x9KeIdN'
+        '+gaYZuKa/Yy//9nSugdqQnnpey5PqA0NMJeDBGJZ4v4FIok0dEAUtnxiXIps+dyJTcMpSjtrlIz0'
+        'xYshC18PvZ/59WyULReMExL20083PyB4po4jRQf1WA3x/Xb42DCNPwABuYHucyyJEty2Omzenfmp'
+        '3UeY4wm5YkO7xYtcBd9KDdqtcZ4TGo4e1YEwxdJxonyYMMHu+TdP8mhJ/IEv4L25yt5V+8EWjcZZ'
+        'JlmgQOohy5ymURBnrUyX1L006FwYCHJGkvRRHwVLaIXq95nlJfabjBHru1sEX/iqb2fvPexo9mHD'
+        'iIZ+ylBXsnMZKydVaXXqhNFV3zW3EQ3jjXtwkRDkTDm1K3I7wOm0zJgN8qN98KWeksC/4qA7cvMC'
+        'u7ylcdzWflhlTgKJzZzKVCGCdZo/CMtrPehnz+3c7ZhTBjkNKiL/X04liioHhBrGZGB+FITJpdCr'
+        'Be8offNGT3ih8rY/4TV2CJYz5BV+U2tJ7jgjHiDuYAsdl2Lqi8P5R+U/m7dRNaJsbjA6yYVx3kWk'
+        '9oThpuTV6FHU2lL3pFDySNxgfYG8wsAHNYI+KWLriKzB+Vmj/YG3QmUwiN4NB4Lm93uUrPKCp36J'
+        'UAOBnuvPRhkcGO2lI7MITqk8ExqbPxbHkb/LFeEYadqVtIXeozbc1/6LO1Ev5WnFct3x+AzTY6K6'
+        'wfDKdeiKn9FWAqa0gjfhdn8ICxoU0I83c7CugwAVm0ti6SlIhT6R6dmN0f34jsA8NznN5xj3x4QM'
+        'rTnpbyh2b1Ai5Nykx7ScdAGSRiwrFLzQt+oad/ZoBRFxKKwyPThb2H8O9BRQBLzvZJhvwNmf+Sn9'
+        '+5PHOz+S6njrULk/Ys60zRQ4EpgbRi/nRqYE36UZNp2gcCzJMWW1CN+EYZGdCO3l4YGIZvDs4ZxQ'
+        'TSVBGPCVTItVvVjGwGfW63lqSEXHhIpjAMjSA2d89PCat/I2qHsaaUpMo8deTDGZfqCydjG3+Rfj'
+        'Tjp/2TQUtT1tLdEWXymEP03Egd2rJGU4AJTkIs3gai4YlUT3muuQRwCZYJ5BTOCQK1C270Ctd6eG'
+        'dvkDLghSwSPBdMpw+j1BCHCX188oaHZjATx5euGXAEm6qwnt7v5K8OkzBZ1LxPX6cxRmYLjZU0R2'
+        'QC92nkTl04ujdi7hvvR6cIQh4+/Tz1kHmLTxTpWNt+E0G9pzHNyzvk3/90ljG0r+MCYkfNTRlZFZ'
+        'lvkJWnI1utW0dBwN9OO0h9b/zCIdu19kVoyw3IAPtMxmXCVExwAbqSZwZ05FHOKhg3w1si1mxY7Y'
+        'aysdlOD0wEQWlb39ZV5XkJXGLeko0rnwuAUFTjAc7VcDW5K8pIhGVPtUfYK86L7jV1Ab5V5ZzDMR'
+        'GuveIzQSU30KVGKjifnemIvKX6Pr4UDUmJzvzz8adLeqd7EVWBBj96rEtBqvINcnc/qZP+CZ7/c5'
+        'Ym56acFXkPEkuE0uoD96DM84Knckg95zf3NpBkqezmQrUMSAoNEdMqU/WWDJcyNY2DgYcPyW6QDC'
+        'pwXVZex25jDWBoXreJ7GbGAyyOn56gaztBE6c/b0S4kdZnfKj/IesYx6SOI5txRJ9jq/LNK7SnFF'
+        'e0UNz/Cr52CN35E5kFGu8jGRAr6YMOZWojSISzaGLluq5RH0DbO7/5TrAmqbur8feYQ0uipXZuup'
+        'hj2AoZGHOrjSq2FBu9MIeVgGfc6nA4zBhtOHXyvHdh3ScUIr68D6uekH7QLqTOkGzZcnGKpH6rH3'
+        '7XPwxee5nFL7ErTvDtXjrdF4RC7Lf7k5ck94aYnHunvKhNbYn6RMeCdmhiFEqGGnqw70fcmJm4Vy'
+        'jTCb/vtH3SLjzeGIOR9jst97bryc7XPeJri2OqUD1I6CkQc0J//kBRvT6QOmBsPNflWFhZVFJoGd'
+        'tEI2QQpL6UahHulVpOJ6IvAGty5nP8Z2SwuNRs5h1bT6Vviu3gZ92M8pUfOzvuXGPK/UI1KzkmQS'
+        'A8Sn+DcDSRoRa3uAi6R9R77LbKq3Zu+IIysw0ovCfpNGK9MG8t6QTGCXioB/SvZtudku9Di21TqE'
+        'rKqWT6GZSh96BM07d8zd6uvmDT4C/J5QCzPJUYM92X8Og+Wr9PnFcG0VrMReV98AFlAWnDTPQ8l0'
+        'zWz2lXll6kEE5Rt3LViHtUPlxdjaWlpxkMvkskEl5onmhyuZUuLjwiIq0ktoSPu/ijGm/mrithEb'
+        'kzgnaL452/cgoFK41gZf2u+OT35dfKpxNL2A+HNCYkV8lFJh6jqYSP7+YDXJP4tPFsUvzgIRHvkH'
+        'FODPvZZICRjHk2Q+3lEjCWiEMLRk/MAziopJJ8unmnu6a6cKOivB1b8mRgvXWK7/ZF6Tofzp1T+z'
+        '0QxVBvtrey3IQXem6Gvd6dgNNudaHjFPfYTTb/3r6p7O5AtBM6BRJnwzM9Cv6mMcsFJMyQNORZGW'
+        'dOEAESiG8zv96+HPgPgKcjfZcfzSQq8uquZYSNlCsEjjHDbIrAi/sP/FPiC+FSAknKY538b+7F9x'
+        'vFNdHBaRne0zDO2efr5+NI6cS+1yN48bcCG8CqF8JLKRxJziDDp/OpsIhDRHqUboqc0oB2HbN+uc'
+        '7tKcHzmm9RzOhukmvR7TDCK5wyeL81rF78FLeWXsnlSxhXd7G3cp03xyZIDbktPrLoLr4UbsNeCn'
+        'PLGcqJ6IUztFPdJhEkZLxatk16n3LwDdpo6cQTQhmNOp5ifhxSJqutzpomLF9IGx5W9VAdnjrwrn'
+        '05jiqytrbYlOlqP6n/6l70g6qvz63Yik2gFnSPKDaZ+B3iBI2afOSLNt7hSD4+K59nfY2a1e48xA'
+        'UM+eyZ3UTqj7Yg8et2G1catQnw/+pE2Y+h/ZZa16QA+/Qh+FgzEwpcI7Asqe4qRyUVC9VZKOgYu0'
+        'MOMrxIV6H3iNkwYfNsaP8k4pwO9vPyBVmPdRdbHcAzrIRAtOLATu5KOuipWXhrJogqc3JSfmDqaO'
+        'YCtVyATQ3Sj4P4dazuhc9yumWf3bJWvoqsI3wohEpNBslwUc2Bm4VoRZdyYHMTqQbDfs5NvHdcBL'
+        'ugLabZVD2+rjOWoAOPJX6TZbCdlkvhDUi4Y+o8Hch7Y2n4jRZkS4oKs9l5fyEBzzu2m0OkzO4AJi'
+        'qJUGiGyFM4/AoB6y4FqmkyMSmn5C+/BDkgk2edFsrLMU3rLlrl+tN5LC7Rd3+/TDPZ/hxeuVWBbD'
+        'CTIJA4O2AWq+fd1M8zIYzKzFC/yV5I4mLEWYx+ahjPqzuEWn4ejQrHloRbcrAmkFtzlSo8VrxBF3'
+        'utf/1cmNOFxc9g2yBqhBhE+okB44iPrdm/RVpovtCEahIjf+W75W4To4GTaFMSb9h39g6wp37I9G'
+        'Vt+Z332JOjtd9Y2/NaMJH7+maROXFpggskY7FWNh5REiec3/G9vuiv88PKWl0pz93abjqsLIVGqg'
+        'oqkrkAoZAr1+GTAZRJjMI4/rplZ2ve7eo0ctipSlataTVwdLtOrztq5juJqS81NaZ1PqfGefSCCN'
+        'rS0Xk5+Hgidpyb38v43rQ/k23aj7VqrgEVE49NOVIx5YGGnJJmaOEM5f3LnKWuS09b5Xh9lPvAdS'
+        'RiTVI1CPuxR5MbJMHoaNT/n/wYRrPzkohRjAXVuDmQ8i6Iw7OcxoEegl8lgP5AhsM4q+pvMMf8Tv'
+        'W+jiuOLWr4Vjw4axX0hijNwvfugyHsjkNSuBtmxvoBq4XE9m0nDgHQgrWj7+eGFzkX7XfZpG1kVk'
+        '8Rx7sUYtnCBxQd5WX2eSck6j0Xx07/wUmv+It359RX2kiyHlRE7M5Zr7xWYR8vWfgbxK0+DlqsRm'
+        '6hMqIr6TJF8dI1rjMuSU9WZW8spv/LCw6y4GnCQ6OnXgo0FQbx6siFhMP69Fac/tev/C4ruonKrX'
+        'Affz+bR5jQZOttImTQI7XlTb7AD8+d01ae5jXNhLAChfLulJ1j4n8j6r7rI2xbtKi39Y9pCCRJuS'
+        'W9/xT+YKoAWNPIe6fv1wXb5rZCkrLID/BUUDYejpxBZIJh0/QiIC8tzBw0rczzZBw7OT23Vrnfdt'
+        '2Yp3EoFxJvCq8IgzYvqaHXSTnvUkLIXBdaNTfbvQBehKSyOwYHEMaynWoyE+ou25wdUf8jzaMu1o'
+        'ELDXS0/Avwj+khL9dvEBlqXRd+t7gZ2qleiWgXoO+Oi8S6y73MGGpoDW3aWYd83ce4TB8lq3uk+/'
+        'VZ3gZCDwJrV1hYng/wpDwa+KGzGe5ZhQC2cRpE7Q+am1VZOZOLqe+kttL4LVFvoXIAYjXMap0rPx'
+        '3yo2Iy1hkwiuVQHA+x3DBp5AQl7GpKTbj1Z6vWgNOnUKqQrLbTjPD31nDZ7oYW1J4tLMZiGoTPr1'
+        '0DcXUgGCwt+XWDORsVqIQIUnTRPeHPCy62a1I9zAo7oFhDjmtpDjfYihQKx3yeR9MZBDZTYJhHxz'
+        'Ncqguq/fMkXAmM2jhK9h/Fy3TVLGvIVGE0fE8sjLQtubZOQy0COEABwLwqeygZtny33TExpUwCbd'
+        'W6w7LxU0QPlnK7HSZZQPOGf9w3YxAZ2NKSSCWW23T2scwXPpOIaeWfTYUvIzeo4FNN7XTTBs2u4n'
+        'wKFS/6zuRK6at5NRWdYA2DIeCVRT27Y+hv8OqeVCY2No0rJn+920vjIgxetyR6/Z/+MQGifN/Ocq'
+        'r6OW+wczVdgrW09/Brg/uiLuxLBN3+HhMGN1nZ5O053mmG1W95d/2jHra/8hpftlUeuyE/ZYvemk'
+        'Kp6QLctGdOUiWWAQmkoUJP31DYo+RY71JnFRMjCseeRZfXvWm7LjTcJk1A/AW0kj9oIuK4IUPYXs'
+        'kUiOvUaili6U8bF+BOYWQ5MM2e2CSwMaAt9mXG9Ats0G7eTntC2uZuzw4wA8MLsDmQNGUqbwbw/M'
+        'uoJnXBlxlMndM8wx9+q5aPzAyHikM8duz7dMcAxmyGalH9KhBuX330wzKfTmSTlrNfSWU0ljwjdx'
+        'gEnXoWAeHYQQ8rY7fJ4mNxEkamJMGTxZpojdpFua9Djn9BQ9AhbLMsu0AIxbGTzw8RhaiG7Y9KGn'
+        'qRKaZ8mfn47GHy6gMiDh2uSn6aidYjUur64EsqE23YKbMQUt9HHymUOT9i7MX0KbKeXnVkN/buQy'
+        'kO8imZJDkdYC+J4wETHXeaxSO9Jev3of2pC75tCSnQZqvLARVfwUwtbkArSaMfHXxiK1bOK4ZM/R'
+        'gCWGnKQviccpr3a7cy+d2ZM3m874KMqkG3gXfsh2YFkA+NhMew5evXhRkX5H3TB9U5tSrvCDYtQf'
+        'JjF/Ka3R+k/34rfdCtwhy1yFTAjqUlG3i0svnAkYGnr6p9XrZkT5B/BSZQl6Xo0JL6yTisAIp3hP'
+        'DtLnQ3WWQSr6vJ+CLPX/KaNwPFg/sk8FGNxmjafSem0b+X6VMNtge4tR2o2qAtqwAQfFpVoSCiB7'
+        'XO53AlmoOnt48vt+NLH0XWge9inyu47mdF0a4RiNCWo61hMmdnRxO+OrTu486wNMC66BwT4Oa3V2'
+        'HMhbRYIsTq3MTGDYnXVyHhgwakuzQcnKRKOIQZpsWx+yp7BXeBeu8AVOF9a4w5y+DlV4aeLVUKbO'
+        'H0v2x2LksuyqigO6hevhztzRQJf6MCQALv10SM8WBYULBHI8N5RMNTulsTy3eCW6TGBLUAWWRYfe'
+        'pHTYO2V/f2op/ASkQELcQUv/ItEE2jmBrwi/ygfQyrrew0cFt+6cp8oMo7YlyfhsqRb+VB/Br1Or'
+        'NRr1GK7dM8wplvQUT+WBFsOKs5z7xOdU6pOjUpWaFtxxxH+r1efr4TpqOO48qb9ru2HJ9M3CRQ1/'
+        'ds/Sine9sn1wBoEydPMPhUF/eFd9vdvKSRxhV/UG/nRq7yli7vFf+14VVdCiNNq93jvxTISSK5+j'
+        'noV0ZFaSOl716qe5a6W3xjbhejMsEudkgKN0ebIOIAQ7gK8EJl+uHeiBBsoaLlJ4tE5q9aVciq2m'
+        'ILJTZJWWePJG2fmZ7stQnRUShOO8D2tmRd9LW4LPIa6DO615nnOqIAxQf2Itn1haUrbodaM1oWCU'
+        'AjOgD1VcHRDo0uwcG6fgzQEAvbqXrVJ+j2eIBnNBEa3AwtT9icy0PuFme0Q0h685BsaJx5bkpu/w'
+        'NX1OJEoMy6bMLu6aEbyjUA2m5hxq2WJgWcOQdlPCHaF+EKj93X0c4PFHn8kZaNVUKwF7JXjxVDtc'
+        'n1l2dRQO4su5oe1/WWyAsmgi7qVtcLPMvAqm1wAGRN/pvfwYFegWpZ31aH5t16Qhu915bdjoRACn'
+        'LymYKikQIE2FSGuzNNIS9a3Sbdht+UX+v62zZCjjLdrTpJsQFleg8wRhwqABe7vvjk0RGjDDd+iI'
+        'myfVn+lUdm0SKPvEPtrutgoEqkn7sgjbayJ7y6i2brJGKSo9IYx4UGxHOKWao8cadyuSXFj9dh/Q'
+        'i6eSoGJgzzLhwH+MyrSGKV8Mh2jEUXklmf970xa6W54Yl9EI7dhS9o3Qtwu7oV0EsULI4y5SSV4f'
+        'vosTnS5mN48ugLEiHNcMpWiL/+gh6wvIHS75KPe499cjiVMjZdio7aJEECt4gkCA4AsAWZaJ1TUA'
+        '57bd2DN+hzVd1EOKidBUnE11Wd/Qy6OHskplTDmA8AjbyPdABfaP50CidppKFvd1+s7cEt9/YZ82'
+        'ew9dDSVkNsVoxjiBZBFzrPa1y2b225cyfTNmr6d4AbZuSdUl4z+n8Lf+yOABHFqt2ZrS+nwO3s4A'
+        'mpS+m8qhiffQulOdL6vDpnL2qBQduVsk+fGAaHQMN432UP5/XwG9+TPx+kp8UbXshFfhFrgxJOOL'
+        'cMfpYuLXzttoMvqyVGmjvMWpHZiW7L2K8lI6DNlnLZlZE9G2XfEADKAUG77ixZo3L2dVJrnImlzm'
+        'r035t5UwxMru4k3hpi4j8ivKNj2wBpx0wo7S/bl4Xho3klbMCahGBOTt0MzLv1lZflYEUsFvYVGZ'
+        'NpgwofffCF6pN+/BFF0TPF3/KyDy+kJmMZMTg5QI4V9yjVZW0MGbC1OtyXlymqzTpcOrc1MWlu4Q'
+        'QPz6izTW53yQG1iJ2ni+yJrvW1ukhXoFJt8XMXe9VSqzg5dJc7iy/HVmvWJGx7UoT6jsv/rHB14P'
+        'tCHw+NebNij1+jmFukABPGUN3bV4uLi+QbtxTtkddHKGl5hL/HFBEn80Q9Z9A3PF9b2OJlQXH5hd'
+        '0u+8BtRrNzNYjcEUygyqDetz67oLV/BwJLwXgQrqD0ulw9ek/HnmzLVvr0YYaCmL/wYsFGYnu58t'
+        'OWU0jslzvrA7mTXca0maLoSTLHcmAtKDOhJGUKbN97pwR4tMZR0EhB4Hf+ErmPlfmM/4zh8iSLBC'
+        '9Nx0BNORXGWo53yPyQEtd+hxkBuGr56ee482KFljgrRbohi4g50rCzxjj+p5VRrNoi3L/wT8FvQJ'
+        'RjVcB5HLDcMltktRMl9u602zu+JxTcUJ34D3iyTNNgm1JYRuYDxwFXDPiE0A1dKRqZN6p8b+J0yG'
+        'z0gnL71bQDP3DiyomWGw9YGueC8IADVFQ9mRH4mRbgw5H3wIX5MQQDiifLkLKD3chDIRQvUc7+1X'
+        'T1C1I1So9rAc17VV1fIK5P+uBXd2pU8LtYYgJeX7gH7bPsCpyQ/omKo9yA/lVi30bHkXINgZisVn'
+        '4AD3sO3xrS3jim6PxINxBBbgSaTvl5+ZLoLICkV/B4BQDr0Va+Fk519VfKvpXUYc4ySqTSxvhZOg'
+        'DRuwa9MijvvsXJFDHk0txwROzKV6xS2Xf13OzKC0Tbj3MyfLAU6Ai0axom06QjsR+pA2rIP+RkpX'
+        'fImkmAz2NfoXeaKBl+9Ax5Cgds2Nks2oH6MNvBLjFzKj/JmZiCbCu/5VVrhJxu1PAgbkJj1MB+u2'
+        '/XsmpvR7DYIwcoT10QyiB+f++QKVP+Y6/lEJWTnLBIkmUZEIpDax7JOc/fHT7DUXvfeYIdb7PyQy'
+        'LEde/Z8SmkDbdZ5DKvB7xkcBszIQTn3anQuT96nf+OvGN+sBN4ONFMja7KWETifiYJBkFz+jau2R'
+        'c4OV7uoeq8HMM30yTP2r2p9Av4TdNoj9FT0jL+x2ijzYqRQ1x1koepHYSNIzgZUof6vFD5qA11Az'
+        '0WLDBGxNrz8uiulgFjIWNBxlAsDwfu3YEgV+kZQr1Jn5YU01u3g421SRfTfg3UqmkojuICHeZ729'
+        'Sv/up7vOEsyArY7RQfVhCYLmd7qMT3E4YwaNSMSxuJLhEIzFZMYDIlYG1n7kYt1bIgnamNWRN5kN'
+        'pM213jdl05HQyQRca7ZmDIB4A41QfWp6JS0xo+/HSlX/gRRzZF5cpy7KLKq1UjCyzbk+TZroQfcG'
+        'aMEvPBoF0gpN5ybjYVZxZj1+WmnekqmP0PGjnTujGP9JeXfrjWsxuBYgs3Ez9r6wkbynwzot4m7d'
+        'V0egOi2WEatr38sec5NAUvWeEYn/BvL+AkkukTaGswl/PJk+jQ1unx3kANIORPtqmQ1P/Y1pGukJ'
+        'RCELRAxY8ZdR05XwgV62+Tjenx1bUVRGwEGuW2y0HATIZxQMBfLlNf67NeXpHyJ+rI6Rg+4inwA0'
+        'TMNg78poDvXQ0DAIIO7CqgJeF4ctjqmCqQzuMVX/K1uI7siCGMRs6SzgpeAS0g/SZK4QMJRumwZX'
+        'KwFXqU6Go3AXN6Jx12DiA0HovKVfkmaW/yrat/o9A++zvD5/1mTPpsaYpVZhphBVoqGpsFKZSYid'
+        '5gwm2fUd5/QjNgh5x5LgJqASlpC4ptAgTSmKn+WeKaGRvkODxzfejX1enjbBi1CnRA1x3dSmYdzq'
+        '6aGt9SN40iqaBR1USH4zlZV3G0lLChKFZM5k6MtuorwKu7a1sUL7orC207bINCTDBucbNSW+9ido'
+        'sIHCBH0KvAneidmU0siZsZGyo5yo4AuJXB66AuGIwkJiURxWDF4CJx+JekpLb99c3MRECZeAd7Jh'
+        'Hr+lO5BH5iJ2OkEwgSF/5MoATy1NckHjTPvw69UnUEIkAhuNFK9vY95QLcBgGBbrcjawngDLGPBs'
+        '6iEY9qCewTQN3LUbusj9yJsb5tSWtnD5umh3+0PMVV9Thvod+4x1E73UKHdKUnhNTKH38P+L+NS/'
+        '9GJsEeSlv+doV/DryjpePlpQxxZsDV/H5cK6TrYpDJwFBXNluTtjuIwYW+2DhK/HvI1w40dI0vOf'
+        'yhusXbIvVGA3nM5rPXcp0GfmcolV5Vid/y2SQG30T9KPwqTiWtfDm0B5ZgWSWzY93jVHhlzIAse+'
+        'LSRL3cljyEEdAQ=='
+    ),
+    'pairs': (
+        '6AMAAAAAAAABAAAAAgAAAAMAAAAEAAAABQAAAAYAAAAHAAAACQAAAAsAAAANAAAADwAAABIAAAAV'
+        'AAAAGAAAABsAAAAfAAAAIwAAACcAAAArAAAAMAAAADUAAAA6AAAAPwAAAEUAAABLAAAAUQAAAFcA'
+        'AABeAAAAZQAAAGwAAAB0AAAAfAAAAIQAAACMAAAAlQAAAJ4AAACnAAAAsAAAALoAAADEAAAAzgAA'
+        'ANgAAADjAAAA7gAAAPkAAAAEAQAAEAEAABwBAAAoAQAANAEAAEEBAABOAQAAWwEAAGkBAAB3AQAA'
+        'hQEAAJMBAACiAQAAsQEAAMABAADPAQAA3wEAAO8BAAD/AQAADwIAACACAAAxAgAAQgIAAFQCAABm'
+        'AgAAeAIAAIoCAACdAgAAsAIAAMMCAADWAgAA6gIAAP4CAAASAwAAJgMAADsDAABQAwAAZQMAAHoD'
+        'AACQAwAApgMAALwDAADTAwAA6gMAAAEEAAAYBAAAMAQAAEgEAABgBAAAeAQAAJEEAACqBAAAwwQA'
+        'ANwEAAD2BAAAEAUAACoFAABFBQAAYAUAAHsFAACWBQAAsgUAAM4FAADqBQAABgYAACMGAABABgAA'
+        'XQYAAHoGAACYBgAAtgYAANQGAADzBgAAEgcAADEHAABQBwAAcAcAAJAHAACwBwAA0AcAAPEHAAAS'
+        'CAAAMwgAAFQIAAB2CAAAmAgAALoIAADdCAAAAAkAACMJAABGCQAAagkAAI4JAACyCQAA1gkAAPsJ'
+        'AAAgCgAARQoAAGoKAACQCgAAtgoAANwKAAADCwAAKgsAAFELAAB4CwAAoAsAAMgLAADwCwAAGAwA'
+        'AEEMAABqDAAAkwwAALwMAADmDAAAEA0AADoNAABlDQAAkA0AALsNAADmDQAAEg4AAD4OAABqDgAA'
+        'lg4AAMMOAADwDgAAHQ8AAEoPAAB4DwAApg8AANQPAAADEAAAMhAAAGEQAACQEAAAwBAAAPAQAAAg'
+        'EQAAUBEAAIERAACyEQAA4xEAABUSAABHEgAAeRIAAKsSAADeEgAAERMAAEQTAAB3EwAAqxMAAN8T'
+        'AAATFAAARxQAAHwUAACxFAAA5hQAABwVAABSFQAAiBUAAL4VAAD1FQAALBYAAGMWAACaFgAA0hYA'
+        'AAoXAABCFwAAehcAALMXAADsFwAAJRgAAF8YAACZGAAA0xgAAA0ZAABIGQAAgxkAAL4ZAAD5GQAA'
+        'NRoAAHEaAACtGgAA6RoAACYbAABjGwAAoBsAAN4bAAAcHAAAWhwAAJgcAADXHAAAFh0AAFUdAACU'
+        'HQAA1B0AABQeAABUHgAAlB4AANUeAAAWHwAAVx8AAJkfAADbHwAAHSAAAF8gAACiIAAA5SAAACgh'
+        'AABrIQAAryEAAPMhAAA3IgAAeyIAAMAiAAAFIwAASiMAAJAjAADWIwAAHCQAAGIkAACpJAAA8CQA'
+        'ADclAAB+JQAAxiUAAA4mAABWJgAAnyYAAOgmAAAxJwAAeicAAMQnAAAOKAAAWCgAAKIoAADtKAAA'
+        'OCkAAIMpAADOKQAAGioAAGYqAACyKgAA/yoAAEwrAACZKwAA5isAADQsAACCLAAA0CwAAB4tAABt'
+        'LQAAvC0AAAsuAABaLgAAqi4AAPouAABKLwAAmy8AAOwvAAA9MAAAjjAAAOAwAAAyMQAAhDEAANYx'
+        'AAApMgAAfDIAAM8yAAAiMwAAdjMAAMozAAAeNAAAczQAAMg0AAAdNQAAcjUAAMg1AAAeNgAAdDYA'
+        'AMo2AAAhNwAAeDcAAM83AAAnOAAAfzgAANc4AAAvOQAAiDkAAOE5AAA6OgAAkzoAAO06AABHOwAA'
+        'oTsAAPs7AABWPAAAsTwAAAw9AABoPQAAxD0AACA+AAB8PgAA2T4AADY/AACTPwAA8D8AAE5AAACs'
+        'QAAACkEAAGhBAADHQQAAJkIAAIVCAADlQgAARUMAAKVDAAAFRAAAZkQAAMdEAAAoRQAAiUUAAOtF'
+        'AABNRgAAr0YAABJHAAB1RwAA2EcAADtIAACfSAAAA0kAAGdJAADLSQAAMEoAAJVKAAD6SgAAX0sA'
+        'AMVLAAArTAAAkUwAAPhMAABfTQAAxk0AAC1OAACVTgAA/U4AAGVPAADNTwAANlAAAJ9QAAAIUQAA'
+        'cVEAANtRAABFUgAAr1IAABpTAACFUwAA8FMAAFtUAADHVAAAM1UAAJ9VAAALVgAAeFYAAOVWAABS'
+        'VwAAv1cAAC1YAACbWAAACVkAAHhZAADnWQAAVloAAMVaAAA1WwAApVsAABVcAACFXAAA9lwAAGdd'
+        'AADYXQAASl4AALxeAAAuXwAAoF8AABNgAACGYAAA+WAAAGxhAADgYQAAVGIAAMhiAAA8YwAAsWMA'
+        'ACZkAACbZAAAEWUAAIdlAAD9ZQAAc2YAAOpmAABhZwAA2GcAAE9oAADHaAAAP2kAALdpAAAvagAA'
+        'qGoAACFrAACaawAAFGwAAI5sAAAIbQAAgm0AAP1tAAB4bgAA824AAG5vAADqbwAAZnAAAOJwAABf'
+        'cQAA3HEAAFlyAADWcgAAVHMAANJzAABQdAAAznQAAE11AADMdQAAS3YAAMp2AABKdwAAyncAAEp4'
+        'AADLeAAATHkAAM15AABOegAA0HoAAFJ7AADUewAAVnwAANl8AABcfQAA330AAGJ+AADmfgAAan8A'
+        'AO5/AABzgAAA+IAAAH2BAAACggAAiIIAAA6DAACUgwAAGoQAAKGEAAAohQAAr4UAADeGAAC/hgAA'
+        'R4cAAM+HAABYiAAA4YgAAGqJAADziQAAfYoAAAeLAACRiwAAG4wAAKaMAAAxjQAAvI0AAEiOAADU'
+        'jgAAYI8AAOyPAAB5kAAABpEAAJORAAAgkgAArpIAADyTAADKkwAAWJQAAOeUAAB2lQAABZYAAJWW'
+        'AAAllwAAtZcAAEWYAADWmAAAZ5kAAPiZAACJmgAAG5sAAK2bAAA/nAAA0pwAAGWdAAD4nQAAi54A'
+        'AB+fAACznwAAR6AAANugAABwoQAABaIAAJqiAAAvowAAxaMAAFukAADxpAAAiKUAAB+mAAC2pgAA'
+        'TacAAOWnAAB9qAAAFakAAK2pAABGqgAA36oAAHirAAARrAAAq6wAAEWtAADfrQAAeq4AABWvAACw'
+        'rwAAS7AAAOewAACDsQAAH7IAALuyAABYswAA9bMAAJK0AAAwtQAAzrUAAGy2AAAKtwAAqbcAAEi4'
+        'AADnuAAAhrkAACa6AADGugAAZrsAAAa8AACnvAAASL0AAOm9AACLvgAALb8AAM+/AABxwAAAFMEA'
+        'ALfBAABawgAA/cIAAKHDAABFxAAA6cQAAI3FAAAyxgAA18YAAHzHAAAiyAAAyMgAAG7JAAAUygAA'
+        'u8oAAGLLAAAJzAAAsMwAAFjNAAAAzgAAqM4AAFHPAAD6zwAAo9AAAEzRAAD20QAAoNIAAErTAAD0'
+        '0wAAn9QAAErVAAD11QAAoNYAAEzXAAD41wAApNgAAFHZAAD+2QAAq9oAAFjbAAAG3AAAtNwAAGLd'
+        'AAAQ3gAAv94AAG7fAAAd4AAAzOAAAHzhAAAs4gAA3OIAAI3jAAA+5AAA7+QAAKDlAABS5gAABOcA'
+        'ALbnAABo6AAAG+kAAM7pAACB6gAANesAAOnrAACd7AAAUe0AAAbuAAC77gAAcO8AACXwAADb8AAA'
+        'kfEAAEfyAAD98gAAtPMAAGv0AAAi9QAA2vUAAJL2AABK9wAAAvgAALv4AAB0+QAALfoAAOb6AACg'
+        '+wAAWvwAABT9AADO/QAAif4AAET/AAD//wAAuwABAHcBAQAzAgEA7wIBAKwDAQBpBAEAJgUBAOMF'
+        'AQChBgEAXwcBAB0IAQDcCAEAmwkBAFoKAQAZCwEA2QsBAJkMAQBZDQEAGQ4BANoOAQCbDwEAXBAB'
+        'AB0RAQDfEQEAoRIBAGMTAQAmFAEA6RQBAKwVAQBvFgEAMxcBAPcXAQC7GAEAfxkBAEQaAQAJGwEA'
+        'zhsBAJMcAQBZHQEAHx4BAOUeAQCsHwEAcyABADohAQABIgEAySIBAJEjAQBZJAEAISUBAOolAQCz'
+        'JgEAfCcBAEYoAQAQKQEA2ikBAKQqAQBvKwEAOiwBAAUtAQDQLQEAnC4BAGgvAQA0MAEAADEBAM0x'
+        'AQCaMgEAZzMBADU0AQADNQEA0TUBAJ82AQBuNwEAPTgBAAw5AQDbOQEAqzoBAHs7AQBLPAEAHD0B'
+        'AO09AQC+PgEAjz8BAGFAAQAzQQEABUIBANdCAQCqQwEAfUQBAFBFAQAjRgEA90YBAMtHAQCfSAEA'
+        'dEkBAElKAQAeSwEA80sBAMlMAQCfTQEAdU4BAEtPAQAiUAEA+VABANBRAQCnUgEAf1MBAFdUAQAv'
+        'VQEACFYBAOFWAQC6VwEAk1gBAG1ZAQBHWgEAIVsBAPtbAQDWXAEAsV0BAIxeAQBoXwEARGABACBh'
+        'AQD8YQEA2WIBALZjAQCTZAEAcGUBAE5mAQAsZwEACmgBAOhoAQDHaQEApmoBAIVrAQBlbAEARW0B'
+        'ACVuAQAFbwEA5m8BAMdwAQCocQEAiXIBAGtzAQBNdAEAL3UBABF2AQD0dgEA13cBALp4AQCeeQEA'
+        'gnoBAGZ7AQBKfAEAL30BABR+AQD5fgEA3n8BAMSAAQCqgQEAkIIBAHeDAQBehAEARYUBACyGAQAU'
+        'hwEA/IcBAOSIAQDMiQEAtYoBAJ6LAQCHjAEAcI0BAFqOAQBEjwEALpABABmRAQAEkgEA75IBANqT'
+        'AQDGlAEAspUBAJ6WAQCKlwEAd5gBAGSZAQBRmgEAPpsBACycAQAanQEACJ4BAPeeAQDmnwEA1aAB'
+        'AMShAQC0ogEApKMBAJSkAQCEpQEAdaYBAGanAQBXqAEASakBADuqAQAtqwEAH6wBABKtAQAFrgEA'
+        '+K4BAOuvAQDfsAEA07EBAMeyAQC7swEAsLQBAKW1AQCatgEAkLcBAIa4AQB8uQEAcroBAGm7AQBg'
+        'vAEAV70BAE6+AQBGvwEAPsABADbBAQAvwgEAKMMBACHEAQAaxQEAFMYBAA7HAQAIyAEAAskBAP3J'
+        'AQD4ygEA88sBAO7MAQDqzQEA5s4BAOLPAQDf0AEA3NEBANnSAQDW0wEA1NQBANLVAQDQ1gEAztcB'
+        'AM3YAQDM2QEAy9oBAMrbAQDK3AEAyt0BAMreAQDL3wEAzOABAM3hAQDO4gEA0OMBANLkAQDU5QEA'
+        '1uYBANnnAQDc6AEA3+kBAOPqAQDn6wEA6+wBAO/tAQD07gEA+e8BAP7wAQAD8gEACfMBAA/0AQAV'
+        '9QEAG/YBACL3AQAp+AEAMPkBADj6AQBA+wEASPwBAFD9AQBZ/gEAYv8BAGsAAgB0AQIAfgICAIgD'
+        'AgCSBAIAnAUCAKcGAgCyBwIAAQECBhNA4TAD1wvRLECsb54COk0KsOMoBZCjOrSSAuGIbApPqHMq'
+        'BmiyrdqRsckCCdqVfwtIuGaWL5fXW5DFk8jsjTYDbP8Gs2kN67AmeiA4koeDMGTrnR0Hs0LdAzSX'
+        '4M2BRRDCTcv3WaNEd6ZHBbEFIgFqhfecz2HLBMV4AXd3+lEUVaoUAOz5PVYYfMR51qWAbgH+MsWB'
+        's31xFwZtmRBRZcAN8xm6CKQbYZTcqW5ZXfnLhcRUbdgBzMI9lsa2mc/iB2VXW9f8QogRuyHp4gcE'
+        'a4pa9GeQBt3onGU86l3AagJBn8LahalJtmNdCjLmzCdcnYyyYXssfgtfcnffeJTgCr/x4xju8795'
+        'nmMUNQNJNBTgqkpvWmFRyw2GUdlFqykUrXeBXTu3QWmly2ilimaTpf/Sbd+DVEsuekWJkE0E+EXf'
+        'SC1xZiVV+FCNErsiqSrF8nhEmwa+B1AoRc8rdR61NmoQB2xZAR/DOn3MsML8jcIpqdMFgROvgeTS'
+        'j/iTKgnBLBni79ajzk+JFqwBkxPSbCfBtwiU9Xd12FfnDpvWAcJGlf3VVhSf9qxRuxf0B3+aoLDj'
+        'xhOrdLqtIQptIgKZp7+rVTEvbRKl7GESlQYD3NdaqEiOLz9HAkvGhQLz6XWpDvi84kv7Eo1Tku4K'
+        'Bimkwtkzvdz/fhDK2qxkLylI6d4ku0oNK+mnX3s8is0d2lY6dCl90n4HUPmne7l7A2hBLj+Lf9tE'
+        'IedC0C+ICR4PtBYQl+F8d9d9seKeNR5joUHb4o1zFtMsioyHQgArRlAFHQHOPAPEDhnCMXM5DAh8'
+        '/f8u1gQxgll9sakICOl7UecB5ayNBBUgaxm+Ta7kfRhb59bjJRlKXFs9dkRRQ0O5CQWxJund/0Qo'
+        'Po0BDWKXn3AxwMzLtf245RBsL7u/Bgb5lWK2i+KSxdID0gRX+cZ/XB2j7a8pUX0+EtWAGkNL+EyJ'
+        'S8V/qGmHY3rc+npGb1InPhLtQgEpLAK64CCnR7MrxCtZhTRMFu7YzHd1Ca2goJMlub7nWXfAbPVW'
+        'NXcNcjEpDpXA5Wh2C29sfE7W8sBN6OhGcLN3h+tptkZt3R2CpcJssSvnydPSDQOn5d35HFcsS910'
+        'VK9DzWVcZ2Q6Tw18Ci5gjILYzNVDSCn891fpR1EzBDosM3SaMjTw/JXCPEd7SGeb0CZI8/whqshW'
+        'wTxaJH7dZ0FbBg1P0vbXF08ENkQtc6OI6GS3iCWaDrm9EeXXQH3LEjPYbQH2hZfgdx+7SV7R1UYZ'
+        'CBMZ/1HBwb0C2XoUVbkGWTslMxWJTp/zHcxlATQETjb2QFNvnnsXHQcLAapPzZCkkxkG45XXKI1i'
+        'uVpOPHnIQuq0eJFP9mqqoBrkNxV5RsrRlahK0A3e+25jd0c0UPFBdPky5m/jBXZK8akp1m5eDFNt'
+        '4xM45a37ATJXz0GZmgZCfLRG3vaghXnFORClMlqpCIDAKxqaoJnWPassTUCYkE7PL7zr0T7WJdue'
+        'myDHYuDDeGy6HT/RymJIv9T/N29QpVUyoO4TKtOJDrWoZVmIJMB+Un7IriVm0gK2uAsrt8fLDedP'
+        'xRw1JD6j2Yed+3MsS1UMmToXiRUOV3MtVxuRKWlvXIOT5bZSrV7pNSDT/Lp1PKZzyOAXfntpMcTs'
+        'xcxZz1rmsuvOCr8v7rsNUeHiQITGcyOlrGLVKdWNHp8GBMnmW3YdV3DTZejW4Iqe2HOH1klCU+XO'
+        'MZsRSrn/zCBJ6vwV230O+7OC2cwSac455o0eAk0NEb+z/z4lrWqHRWjPDrEUGhIXPWaGsXzgUAH2'
+        'jw+Gh7qKEWH2fj9y3l4JZVlCrUeCXyflwQVrw/Tfq1VzT8LUGNZmZXuD7M3jgYXaNbJxMRmFrsEm'
+        'OL8pL+U/zPEAadrhLCyM9NV+H+g1QW4SCZJrCtzKppJeSwz+qKcCwCZjZv0BlM28lOIBdcnXnaka'
+        'PmcSUsCnQk84ZMrLfBdgyn4eYYRACA4rD86Xbh790VLdTJsuV9fGmYyo9fL2UD/RICT6ES0WxwYk'
+        'Keb0loTnPjihF0RpvzkVwDmiZTGezcc5oUmvFp7hizu9Eq8B64KlnpmXWwGhaDrCtAILWnbKL5pX'
+        'cXji9fy3IWZ1aAxiFJTL3izPdBnaCzjDQuQyNDnVGG9XRoa7FRYZwImoM9zyC2amJOoze4Jyudcn'
+        'tRIY38vFptxYuC52Me4IJ64ysvMgbeMSDYZQdsuQYb/99LmmIyr/d4uAlPC6JjW/1ipr5APkK2ao'
+        'gr+bcvUv2MgiobW8BCbolzlg1qi4rzcWDhFLNP1THxl8tCmQu4v/vUeUaf82T9f8f63/pdpdvUoI'
+        'Sacl6fVAc8R5Yr77HSBAlfclcW48GEi8PnLDkEcBYxX/0Bg0jV1n/kJ61afrmQwb7hHZTss75dAv'
+        '5sqbBW83/70fS/TrAxGPho+XRSItAfPz+nnJMiKrSCQRlhiMUD+00JCoGKvxK7TgAg9jcHUb+0Rj'
+        'zgRjAz82G8prq4KijDbCW3ynxAHaccJAbr/y8fTTEFo2X9ciY/+c2AHelIN0hxfrrpjpQ3VSBcAg'
+        'tjMa9iTM/0oEWADSYm0YCGdArGmWxO83KD3Q3MgSdlBRZ+7D36sk1zbaMXxak4AjavaDtHGNIkQT'
+        'GEmbvU0Aq0gjgQJfvx1tUpTEBfiatZsK3v1CgNjASKDKU97OHGsDfy0XAmat2GF6vm8/IOz9qgJH'
+        'tAAwr8ljRsUm5eMg1Ru2MiwXb1Lx3qX57jIUb3obtAvOoTmCxJCcBlcpLztn3A/EYlj9+yp4UbCM'
+        'gA57Jr5dWDPZub1DJGrc7vN1WmbddciBum0IZuVdDKIt8s/cklKRR+GhasvQEFuAvO9R8eh20Hkp'
+        'iZoLv4Qrm4afjWsZkgjAg9wDpGCXk7QZMcEpoPP9b1nXth+izjTb+O2rG4kzuNfrWe/xELCsw2su'
+        'X6qp6KjQhHLmEoO3U5i34D7VAWX3pVFhBTj8XUrHpr6c5WvJ+lVq4x4QQLK+maHGf/1RlFnJdIhF'
+        'gbQIm2dGAbLXc7xdO7xVgYvqPphvClTWjkjrhtjA/7KZNL7+BkWMvpgFbdshCz+U0ZWg5dTKsp10'
+        'ZxsVQwzWF4YAkX+nax4z+W2EkRiqtR9f0GEtmDHAFbgIl4vrxH0CjSH59sxK7wJlr36J/T7ca08D'
+        'bpq+yzNPlce5zQOdj7n2FWT2wzDrRGjW44b30c0tKZHZAclDmG0zQEWqNBoSkfs9l94O94lcAUFY'
+        'jFDWRb6TY2LRzGMfCOZEi3LYLPOLQIV/tLqrLDlUlrJHMWGoCZ3wXFHS0jKA2yGrI5dUHxwwslLM'
+        'N58/Q8ia5PepP+0l7qUOOv5Pzi/343xW1kCknEhlxEcIHt5paS88aMK8jtIb869EBf57eUwQCEjh'
+        '9gr0s6b1rwJCpwFezaK6Q3E7k4CZ0Fbja7QEUWaUKNOTkYPZud6HpSt8s80LERg78pB3GPKnKPN7'
+        'H/GfZ2R8NErhZOuK6KEE5J8eZVmINhrZMw649ZFe//1s39Ef5p3JoevUf1a4bjgBNKbTcwWydLGW'
+        'i9Kdw+PjKSx3KXPwmvLdaJzXWZnNGShkQl9j8cvCXMvk2Fq9pG9C/J7oA5OBoGHrr5Q5N/zytZm2'
+        'j19iLpj3biS+JIrbjQHXwZiJoFGxRiwRLPTAqCEvP4NKHfmNtAuaxOiAr5K3J2heNq4VOzg5FW/+'
+        '4xKcdEvQvEUEVTJp6M+CInYRbd7u3VdcN4nIrlOa0e7nzx8MBLQ2NVOQSwHhAY3kkbBImi3dK79O'
+        '+lh8NRL0XFGaZ+PKp9IZmPdlZLqhyogLsQWWfrYZ1Vqo2BvUd49FXVGoJSU8LvIi5shcJvMMnrp/'
+        'c6+5/IRdAxnv5hbUJ2QT/sUdQzPFs3/JufPIF1GWHvOgWPX7VyAcre8aciYk723XzXJOJ/jlpYbU'
+        'dt//3nQ2g7M8Ao1kLNKD4329M5iewjSW9a7LMuMBnqk/fWqKW1ui0nPYQvwr5xsNN/bzH7kwtzQI'
+        'aLDyCFsGnoiTJfZLCM/GSYGhdG3qmPeBYTS8k9hLgvje+52uyHXKvVuNwyb+lmlmFom/eCTgOZX1'
+        'Fj1qNjaoDCY6kY2NDus+duMzsnkLMh/KJFvaray2KFvOH1ag2WNns/GA1fvjYGuhxRsNCUGXL3h+'
+        '58Y4+HC6D3zS58i/rbBwo93pwAIa6G2y+m2SBZkAd8Jcvep5FwuP1hYiB8+jU/OA8HkiRHGGM240'
+        'vFEbDIQu2WEE60kCzwT8oF32eLH6aEaS1D62TLxFiRkFbKZLLTDIEbiwuDs1983lfS4Y0yE1wqfw'
+        '0T+jxP/N+i6SXsFCsFZiOIy4iAH3yAp1RLvCFOreiwrBPYy80tfNBVrl7cRW0YvWg2FLMV09hbnJ'
+        'uj8uODGLjy4NzPZgBQQLL/s9Mp2HGqrjcATRmepH4M0iZbSRjqc8tI8vRp46neXxn8YRhHn9rhFF'
+        'PfGXHOGcrMsNCQ2jP76qQor4oZQW5cwcL1HsnnxpcZMirk9e+yDmxU1WzMKtCFJ4SzxHsVUi42oN'
+        'a5bGFod3zjJdQWQAhPeAPf5nlb6ij0ecEVYBqJ8On/IWnGVgLQzBROou7BTnM1wkXG+TK20fVZBr'
+        'UbSZAZctKnaIwprgBf2iRQ3KFB9WS8uTBDFL6Cy6f+nLu1bCEpsoJMe0g8fnWHCeHiz+wTlw2hlA'
+        'cf14NWJ1smwB6w3wfuw5mDFNt99uBtzFXXdIzeivca+7l55+8LjsuLpxHc3R56g/RlY9EIyue5XI'
+        'vuXhSG7nk1tRC4Oa5m9Izi+S2KuHDZMKppNT9AFyl53VsM8D1+QyRR2WywkZ9GDfC3EBSm9svFWp'
+        'N2fzlh02hESDPFyrzzCZCEW4HeQekIqW6PSlC369LSQozDoMIuHE2ZB6y7togszFa08PqmXei9k/'
+        'rNQlySyBhdtX07oWMSIJ7ZaWT6FnXGGsv/PJlGw2MiToaygPYAl2humGBIFPdKYwFUNDHCEjUnwg'
+        'KjB7ln54BbCve9mgUWby3oeLW17s06aUYSCR8tc4dM9u3AIl+4F08EqWQz36sVLjVnQBhRG+E7gM'
+        'QjHnonq/SsCQ21163UXDKrtt58YElwx43Qzt8lKr7hoQxLfBB2K4MrSBFDDDb7ySHO5KQdFp0beO'
+        'm6U0kGbAQ2JiZzdkKiX6uQok7oxm/4qju4JzXQcipeLW21GaA8bJ3cBRI0uo1IaQdbsp1C5G0/NN'
+        '68RWOy3k49IDWjn4JsuRd9AtZ2tYDiW6jIw0FfxkqzJzcEKRu9Zo6/vtGDEE21siX5OdjN5/ce5+'
+        'lxZ47EqdybRWTZuwDCBpmdYV2aW+rtVhNXntBP2N/wdzEqLJoyzbI/JcoCLBa4PK3meLjtfW9xTY'
+        'R4aQMdhwD9wapH6UzYNWfw7WiPKENFHz5OSGtt7uxPwmH//nNzJHgAUeJ66dL35vMge58fe8lJt5'
+        'Jcpn6pbMJkl/e3FlAQijQ1pLw1kRocBUfwMKtEcxU1hpqzwTgdd0HkeVHQ7AkoJ26xTxNJLnfkaq'
+        'cSUG2vmjXJvEgvokIPvAt8Q9qxQstUVcsfpD5ce0y4q9Xd8WHA15z9tyCGJDRPeHDhvncLQWWLUf'
+        'fdlZt3jXWX5LNK62g1Yrf/EwHJlxyPvJZ+T8kTOKG4fe5AZNuwQdd67bCW2pXoPjl5oReFXmspFa'
+        '+ulaN7mOfJMnZET8np3iZCT5zRP9UWnFPfC2HGcMAj+F/muJJhYQYAQDCG0Qk0NwrgEdO+sLOVJH'
+        'pRJXQN/Fh2pbd2TsyDu8QspuvtAECXVQTwMyr8wrcHESSltlR5gzE5cv7sRWcZwcf9pGRJJqMwWM'
+        'FmaLeJ5eUVRS95i1JzR8z9gT7cGBt0i2tBGfZNLiB4uSF28FZ+OolAlXfNRhKwoYckH+xR0jP2jd'
+        '7pjYrgtEvYCq/8WZpoRBKNTRmnXThxFxjfVWXA7yoJmsQfzPCkEGqSNCbaAtvkInlQnoAQPQYvKk'
+        'xKIv1ZC5465d754tV0QDn2F8YEYreLU5iK2dwgmABDIFYKKA3ouSk5siTj4NL7Pke3GjvjNAJou4'
+        '8kT/JUs68pY2gTJctgVHHD39rQoAV15JVtRhuw/qJ0aH4/JROrw+DuEYfZkFxoFiAMvNyb7YMzl6'
+        'fPp9CZa68PPZi7tFYeXMOFX2yQqFYfLAsKgU1gABEBBh+NNaO1ZSZsh0G0u/E+nGHwC7fL0fSAMQ'
+        'QqwOsqi57EXaQVFsFo4bQn+hY00hawRD4ZxtxpgWNSElcCUW9mrXeU+4heZk9Aq7okrDAK1Pdk/X'
+        'l63wXtobtH8LNQidcs51E1G6bTMc2/rPblQZif5iYRNfpBJKnD8sUvz7+fierkVDCJilq5D27Hp5'
+        'NAN66W9ZJLZV0vBKHyELF/fhLjNTCfgki9Udabw9rK9IXR4aZwnsaU87QKX5NY3SvJtcTMsGZtIc'
+        'h3kBtQC/FKM6+PRCuZcCGLTol4uqCvR9lxmohaDG5ZetZKfXwrVtasbdxDml7sM5Ysxa8H4GLJ/1'
+        'spGz+HUMf2/kPyivuTzt8m5U3c6037hhA1kPQ6F9ZNKPISW4yaCS6ucKrKCtOZ0ctEzB4TS+w+Fr'
+        'NiWrKIiN3qaDkMPEkbiUC4g2UTprAR9psuOU6jbphaMiIHkNPB0wzQx+R++bj1giPmEu8NpO/8Zc'
+        'h+fMJKGBrgdi3DWGseG+ckITRhDkH42FAyaSLsREXdXR10orAgoris+hcTWfkufiIsknv8FSImw6'
+        'OJxK6gyaJZ5o7xgCImnt5+pN+6EOtsa4XyldQMVXjgnhjvrwz3UAe8NN5ZW+7FmKvM/K8oHy32Wp'
+        'ZK65te3EQM99TYvmZvCvhXIys8IlKmBnyRkqgKy1qcZvwqr9vq+PfM1FfGCq5TCvMOU7ZnMXYWIt'
+        'v4DbFPkuQeviWqJ9LFkyhDbicDR9uSl3kmI2BuXwgwewG6MENg7gJJeg+UhjlTsJ8Ks4rmfW3NGe'
+        'r4u0Tr4+nxyIZFcrAK0SRDEDnfBAqjqlUbF3WSBUczmOGjW/O7rr4lOC/wloMjKhw5BTIgVe2y0J'
+        'aRu1P/NqgZWd7wwDEQ6aKyQqJklfMTN3w0fG/IW5xqdwvw4ue6MuHBJYDZUjibwB7B4lgyHH9itB'
+        'i0wFII3jeED7Pf+LF+imJ+iaifAw+cXFhGnjDhLDHDN7ojHmODW58SHeD6Tm3Igi9w0vaadZArYS'
+        'wGPi6h4RAZgKZzDMxWahwSCNuL5WVH+dFcOuGuZdLVmQMIPMMQ3pFoHXd8oqqnfTeEjCTXbMNXCK'
+        'Q4yzBB7jrLp8cHJt5nGEkXskl1goMGRYsuM456a06caSOuDVTE6V1BQNuR15Vt6+hrWB8HZcFc63'
+        'FHUkv7SCu12NuW54Nj1ks38qOJGDR/O9gq1+Kfr3BqRqtyWRLzKybu77izxxj4YG7COY8q1NW4B0'
+        'xyohk01cyV+1MXCfpozLG/jortso6aFh4c9YvBRsoSjF8dsDDC0CxP2y7a9GwJGrz5RikgEd7ZfD'
+        'DrKD93LmFiZZ1SzX2hfMF0u37dKsqzzGQbbPd+X+dz0EDRBNh4JEYP2q/gyzQAWfa+0GF37n/Wkt'
+        'JMPiG5jgoZj9z2l99LJGkP+AcV+OZhYE+Cp51fXxWdQc+ycS5CNUZd0OAUID1zaIHiTQT1uDjxkr'
+        'keH5FCtq8hHbUAbztKh63/4af8eF9XhXv6uaB/eTPM5cHpoVAkcsBwOAjHSJkoaAgyjNPSkd96+1'
+        't+RXyDtRowuOb3OCWT8pmNvLuaJhSnnLj/zbPjN6VhT8epjhq4Hy7cobYyhRAo0kOQ+A+wHfaOaj'
+        '1RsWFE19WJH5EPygeER1Ici4iYGZ4H1CCO8dnBkdNddij8meg6Wgw5nTjzYKllHPPihqkbKlXhyj'
+        'WV1pD1sQpvamuEDr71s6FlVd47ZevSwvKM1O0I3vd/ejaE3aJKouwiQHBS1jCBvjKN44q9LiuTxy'
+        'hnGvZxJU0SKe5pcnMz2m6noqCocxFRbDM6qO3cXwds/pwisQ5SWfiyl0xnXmuPmFeS2H0/J1YjwD'
+        '4ipq5X+mntj5kFKeOhEwcBuElpIUGATv8Q0FcEcske4ShA1nltM0IdhqA3jWrvd5lG/LqH73vESJ'
+        'ybOzXK9mL2PSMJBdzZMBwocQkeJTebnZ3Rz6Hl+Ag9RV/A1DgnKt1bMQDwv0Qlk2t8A4MYPkL7Vi'
+        'Po1miNbZl2QlUu1x7D+PbmwP7/NkS+krHvYRmKODSJe64r+rTXNY/ZlqQmTWfpxPatmPu+hi9iQc'
+        'adisDiLEC7dz4gEXZ5DljoDxRw6esrO7gIzvEZ67H14pOqKtmfgzLsnPJAH1gp0fPFb27+PpVX8M'
+        'rO6HjOTSPppr2iq8EG+a20Nd9V8tyetbUZprck/09w9XIIJMlqhIWORj9woF1h86rG40R4KG9cFY'
+        'f3DO9Y4cf49OPo9CzEMlEStMpBwiWsLQhrfFYByqatqfzjCV4bj9dIcXq947FrjO51UxqJtCGAsD'
+        'NJc31LrwhzXFlUeG2jlZ6X9AKW9y9iZk71S+DF0xqzpLssNUksj8yw92e6s4CGKjTMVW3efajMFq'
+        '9l0MMEbXcgXbaoWxAp1trkcS5YEBOdE1JkVt840nbFF5U7YuWYfbZBGh9Imn/j+wAT/bcbRQM9bF'
+        'BFCn5EnSksAzhKq6kBkVKAFmrpuxYDoF7AoH6LFa+8A/35tOPxBsdUy6u5izJKjL9nEHCDxaHjnY'
+        'eNIe9yjYHLG03TTaJ/LtfyckLqELaJPsta2erhrzqThn/lcYljSEkhxjaVBdjqfnXOdp1CDpyh6P'
+        'oDUASvywuXj0/WA04brij1SaEIonp1+XUQLngAyvEtkjanJ9cH9l6/L69z+I02CcQOqXHabEkJSM'
+        '9Hm8b7qAq6N3UG4LUt5vKXyVhGNDDgkngojrZ5ZlsCXoKoJUubHppkdEJIo1kkEPdbfhuaSv2WV+'
+        'Av4aTnzDFLE7OxoNJ29PdTgzMbgy3NIXMSuH3N+xEPnGcrzLgThMN6mCvmy1acyC6IieIPWdK8Ap'
+        'E0n/Cg1iOKcz9TMrI+Tatf8Ipnum8ijLbiiCpxLjZ8OvGMWjk8Dt7Ekb4ilwmg2WxZ72v5xtxLkS'
+        'wK1mC41/MGZEjidMUCyr86ewC2bgpShUimvHY8+WL9O5ONsDcg6cOKVLeO6CfKzzsaAeDPmKhT2t'
+        'W1AKdFxMK8bi1fWO4as5H5loYzx0kj7cWw/eF/YnQYc5Ces8FbtvEM1TbNTFyMUR+e4ZKWB2V4x6'
+        'InMg/RcmfzEMwRVNrwP6ZAWoYnwesKo1woGo+lZyOeHIA6jopfpd9eakl6oWjuN9/1SY38LshIe1'
+        'Jb9YhAYEgL1pzoX/3CgZXEAQAz97BUNDDUrSRtmWov477LEs2NNHaMEf5VorSzLhIPW2Kpwycc3D'
+        'OhBt9hRcYlTNc+Y1NddVepGRf3itR/2sOx8Os9QL9lWB5xrg+6ld+aN6zImueOk+mqVwYq/Is7Ii'
+        'AppSalBACAhsB93d8kP0zqH3cwKm0XR6JTwBPkcr4g4O3soZaS1czSFFhUg/0t8DbxwtNKsKMIz5'
+        'zAK49WBlR1CzuPysm9wcPL9G0HHnoGYYP0sD7rt0cgWJyz91+5Y/eY/fKzdCGvuJ3MEMa/Qs1dhK'
+        'U32lOWjPT9+orPqzOGS321HdrEbzjju8O05RvFnp489RjdIGGDaHSbEZqFICuouakz/lMnbV2LIG'
+        'EP/CVcQzksvMmq5rCV/I3l5TXJ0wnCr5Ohr0BfjrhkNF/9t4JTiTd/tp1h6Dpqm5sXHsDsOlvHVc'
+        '0aT/IF8wXx8blm7MsBgXIic24aUl2q5dfUP17U5qrz0XEC/EGH88odOey0jvgNMB/U9IIAAPdc0a'
+        'uJHkH2rFfaAiPmYPB1J0/6LtJLISmxvAXhFMwM5Ke7vSAsbrUMvA3fPnSD6BAfXVnjZjSA4I+eoY'
+        'DjR1SlCfSVTpQu9wLm2Wnv2npGoFnX7f3j7ASzLDg3OJJ5Ce6KUIyMgPKihO9K+q2O1KNQvw944d'
+        'hIkjyp1EDDxgy5o0Oxc2Goth2P9bCwkYlmK7dM9SOPNw3Nj/x6kUU7o1QIwXlz+UPyoVSNOwAIqp'
+        'BSAVmS4NqcWco48lgDAZacQTqdBOA0NfMRw50p8MGhvSecsEVVN0cQeHlRsQd1OmJOPmlMqVSDPt'
+        'K467Nux00FZwOWowFJ6zAirKSVwPB/v8nZuAJs7hMA6Foroc+7vfgyofKGB4yFT99bNfhIbf8sDs'
+        '5zaGZklfB+vMvX5T5SUQgEBh26k56wuQMNcbvvZBQKyK8xuanEvPtmShnwJvFXu4fYbXPkioAlOo'
+        'I+rEEvq9dHvcbzxAv/W8JLW6By0j0qW9iA45gZU09zeu612PVoQ+8odcpUqiIx0wzsn1nm33P6Hp'
+        'OHL/FY3/yzfi8ewGor4qiQlFs6u9ZsTM+bM71fgqapKlQHL/53jAJD9pYjoiucJA1UyvBBbN8y7n'
+        'X23ZxkcIL2NNzw+u3v98yDeYfYCTW+1ETfdOSHLPqmZ9WKDQkG8+sll4lv8DS7PS2ZCkf25SnnpW'
+        'vBpelNwKP8TQ/GQAaP56vC4wlzzFAYm1cAFac7i+BSI++tuL/CX8v/E9XhnBHnK05nM9pBE/MrPk'
+        'HnqbSTh0hSypD1q7ZiVhMJrRgOksVq+FJVwvvOMJeLVv5cBH7IcHvUDfNKvbGUNBAoqJ5ZpXyoMB'
+        'H+XWTSRMaJq1hykJtXECAYRJhcw3Zv2p5YbLvDhbH0qjhMYsFWlXsOGoHkPVlNURxT/JRfRmgHWD'
+        'Qb50lnpGg9BqGHVXAYsAzd74b/pWACrXHRgCdPSKuV8wY1JRKnwwrmFcD7CyxqEi4PrILo8flimf'
+        'W4KfFE+8/cVcFSd1CfX5UegImoDrBcbaUsYM4U7J2+GBoC3PfyN5jhcLoUzgkng2/YjSlN+fLUFz'
+        '3efgNDVJfo0Q7P9YDD3x/gOgTtL565deMtN/r0wfGkMmgG0YS8QcVkpXi5TEUa5uGcwPBa69fpww'
+        'mdMCdRwsXBLdpL8jk/2B0Pih7xLaf3faTYe4Oa3L8FYn+yB13g1Fcw7MMPaioWMqvmfRH2zJGmTr'
+        'GNDEXxAntDYVs7ZkMzHnfFbbNgOFUkNy65gsFblzVPU6K3C2WNohRAKeFi7B67ap/AEa5wnlK/jG'
+        'iQnJeNX6CnDJB08quGS7F7LUzOCyNfGBm3IneDpr4LzSH6Yd4+RYyNAI21FdltZYDut6OG+58knq'
+        'rsQIx5uWuKpijHklIBFN3Xid5hj/zXsjhVqWjOefmEGwX+GgbSNUmF1RGzLkcKhv1QOYwnLpMCuH'
+        '8Z5ecLgfgsQhNdCxJsaj7z51jxp5YdhJDvQClloTB6BLdqefON5R4aGRgFt0hdavh/JeVgGgoDtB'
+        '6vVmSyKfztT/0Y4IcL/G4IEWBnx6w6oxOyneMYuIb9s0mXyINB2IQ/E5r+NtetRzDz4JPOggM7MH'
+        'ySO9O8gIPfPh5e/n9wY/zZI4/aMEEsVVeRQs8IuWyZ3xAonUesZkjJe2QFA7LxF6oWlEbboo+I8V'
+        'fRcg+5MAnLQTfpX2ycfd/4lOPEhuiiJtiuZO4uuVDMpnB8UCwom0hbVA8v0MzK0VpoqeAOIVGpY0'
+        'DzSR38co/gGaBEFSIwWF/elxPsqn4y9aueLSXUgCT1qC37p1sN6H5hVQxGa7i1kwCcPZ4YfHVjls'
+        'gBdt46hHlKXCxFa3G3nzbfg7QaIOIIx3C4NUpfvRmXUpLR9Xxqdrl+QRo0DT+NcKrCzG7kXAYugv'
+        'rhFQfvRBoPwQ/XNTe/pRn1Nj9L+ZXWUaxhUOFOLimru+/PkmMmo3n2A2l9S2VGT3IAxkgrXz2PI5'
+        '+ypgnq1rkDbQOUhY6tpWiJqnvu9cBOIlcCgRSg65q39cBobB/sVw67Vcg8ng0790pZzCWOlqB83K'
+        'gTMTOvhn0qdcVMgwh6oH7R2HBT0t937WYOK7wXzmBdVBE2VsYbyLyr9oKwZoYYAN3yO1uXPNU3Vu'
+        'KzksUW4po4WtH0ruCjkREAvdQWmqR7ia40py7UeZrg1R+XxktEdRAUWWVlH/VH7QXLi8Wt1t95yW'
+        'fmjafIXzjEhW1v7R2sgUScaAV2oczeFic16vu8X5DuN7Lrn93SKEIM5r3M+JciK4oqH8mutiWHgr'
+        'dwGLQ9Dz5k+yGMF4EshS7wdh5dVzA5M2uy0BZg/5z59BPLbcBO8PcImN6DCwvTo6N3F4g5AFIG+i'
+        'FclzjefKMVENkz17/3cGyavLyGKjIL9Rwf4VoUFrH3fZLv6MZTX1OERWYc2ke7+DXHLbyKnWYcBX'
+        '6kw67YhZZ6H+RDgwBeDxyRyjhxAPgst8eLmNHEaZMoMWVordBrEh6wqCHLrzBEhR8KAGDGpufTmo'
+        'Ngze76ksq3gIy2phjn2HpoDewUT5mvS51ZsVjIm7cpZUmCCMftZ3Cn77cKB0YWdNnEumWnl9wy2z'
+        '1BJ42IrchlSktZeaIQBZTg9JUylD9gSZ1iFTgaXQTx/hx7i85iQLpT2sKc2rSGK9BGiCH2EsAkxK'
+        'aHRYi6iXouqO+cpKhckMojLoUYoj4KtTNMSILTuPPwa0q9BnIknG6KnPjXtKRm6mC7IrLqK/jFd1'
+        'uKpcUEqqxOVgEJgJeqy908k0BgtjY3S3p+zF4RfCfrzZQBV9MrxzLQGmwDLLzDUQcxrlobcjKBOK'
+        'n6+lPVlld7VTFvGM5aQekDbJTsrtRqgyWipRdbZHV6dOpWpmpjKoYBS+hlhjHfpvygWKpHAVTTYP'
+        'Q9Ncd7B+GXiAdMEZkPhmyh8c/vzTq8K32UzVEtQoo8mMETRaIXH3uqgnBW/iOc/xY79W7hZk+CEv'
+        'oMrJOUzm+kcaO8Pkwvqj0ae9c57OMkiOGjqzqP7Sz2o2YS3bVut1LMdbTR2swezCl2Lm82M5A30u'
+        'Hxf0wmHMBlf/zo+8min5R/kRPp/NVd7C+9XxftexXrsmMWWcGkhAxUzybY1FmX/pkJvYBTqCPCMs'
+        'hBgHK6fxKHZ5ieA7DnuyyI3+sjJcoUdqUUuieMSnFX7HEhql41aBy/VVrkzhMBWFxWapBnIvE6aM'
+        'eqJvLvKy9UEHQDeWB3vthC7jx8mt302WCxDXPgCyrPGOsVMn1VsI6tYsEV2w3uuI43P8oOLxji+w'
+        'Xc1Ka77jNU2EeoaAFdO5lEkbLHWFUJhEUc21BGt18HRa051oXyjfUOluFQEYdmDJYbk6lRUtfYYR'
+        'lz1W8mpXcqtm7k40HxQZS4BSBGzKML+cik4YLFZ2T4iUw9zFRuSnMMYmjasbOfXtMn/F7HVoQ/ni'
+        '3cgE1VPM6zSg/DWBiQ2ms/PX+TJB3u3sr9fz/OsVWBl2+7xZXcE8v2GC5gVC08zsNsJWdzFK82/n'
+        '6OKjHjMgYn4wO3muKUXHfeMfFcKTc6HhtYNDKUXRTIDuSDYl+g7Sv2IhLp/8M/tohw5jKeXyxVud'
+        '9NwVapXUA5M4oxiOABWD+dvC2kVjroiYgKlKNmYAVeG+RF2/8Iuuk1IoWTMV3HCBmJD+OnDwm+zb'
+        'ixaf6Jx5Wx4pPtSajFQjlUiPAX/TksaAVPeSffiPCEHlC+iRAh6VqANBH1cNaCL57c2bAVuXj5ZF'
+        'y4oTmtY19NE861Pl0wrlpLWzd/PiSdDrt994Oen3DpqWkT0DETZ7/YVB7WSVRpkh4mpOYA1V0PUC'
+        'hDqgbHeoAdm3QRoH7tjI/l8UCtlz6ugZ085S0laMev+REDtSO/EifEVmq3XKr/Ls+PotVKZLW+D+'
+        '/hOGAh/LTowtsRcetpTcOvzNuHFeA5M59FJgXB/fs0JiTa644gSAyhPe5ngDXAOsy7kcXDbBl8ca'
+        '+dzneUcI0ngpOOxNqY7ECVrBN/mkkAuWMOeWiYQstevkTROs13cCG72fJF55igyLdgiRvlf1vJPB'
+        'CePBeuiu2iXbPrTJh3euO5VRlnriMEfHSIb3oHoLL2njSMKZN+EHqI+8xdcTF4KkeVCI5hOOBm2j'
+        'unsY9XFjAnVnVAMO5UJWYbzmXcUmNm9UGFzQjMt4BZPEzw4KLtxHwkaVV1Xe52EEbt4WYHcKSX1J'
+        'oy3VMaadnNUpAYwvSszsqQr6NahecPGLCqKkfKLJPlrIIkhCsRvytcvG5DbLKNFJ5yTmCeuSanwF'
+        'GGwnXnelZgTtuwppNUFy/9xZTurnG2KMYpUg6Xbb+s5KiCgYPVTBJkuSLuCAa6tB08qbBs4c2QFt'
+        'EunTMYCiatEMdzNW5ga6cAE+R8B7Lh0pmmJU0mdWkKy+xtj0PrClgx3MdeD2aoOwV4j7OQs5xiG5'
+        'hu2mzf8EV6MUib6+vPv4xgp8+A+UEmmDst93b+7pWTR6sbKE/oOEmE/QCd1mVD0k+I4/+jj7caYt'
+        '/fBmc1Xxoz4NzS64/HdkvifKe54kjAMmFwka2KmwhdsZZbJnRvI+E5en1F3Qh1tiAfbaDuPY2Coz'
+        'qoilRx4kJHCg2bjG/o/TVmEwevfpGm5k5BotfEMr+7UomoH43XwtXKoPRx1FsPLmhhoEv8KDwn9F'
+        'tuM7nDNioclGo39L9Ebz5tHSDyTcs855fBzcAxoXeIxNZfBxZt/1O63wwD7wSYGtDAld2mot8/UE'
+        'ghIuRQXB7OXtmBhlC9NmRIQpjNi7QStsYpagt+/BKvMotuczwIX5qLcZXspk6CHADgM1SRwRqJl7'
+        'ZVo5Hvc4g0UyeWwSdHDSoV+wlgWCgjEB8tSDBwzuRlbm1bT1OJD37FF657g92lRakqTmOlqi2nOM'
+        'rcfmnotH/Vhs4OPX2apc2qvzpabhMOuXsLsNVUCybWFii8jLjldHbEI0RQWYNiF9sCxRA5hG/sVH'
+        'Xp7NZwWiuR8ftLSCOp/F808d26BJbokVCGNSwXtEgVvPUiLqUddFua8Zq8P/lAHdfpcK5lqPeVwx'
+        'L78bUINGF/k3BiM6pfvJ/XJA5P3PxspQwODdWe785jW+J8JIFXymNvx8IoO3nAHeu+uZMQ+xdO+o'
+        'JbpigfAVh1OACRNvob+gG6tRoet9nmPtJMtmFF/WWlgcbij41Etmxtt6aWaQjiZOLZezdgFRAJFJ'
+        'zQhqhccz7bdDN7++vjfDDYLj9c5gLQ529I9TxflHuM8vXzP4IyPQ3PhP0awX/MUBRTNDc/CasEk+'
+        'g9r4e8omP0uLQCpbGfFAymPan0fYX/3qY+9h7MjkREygU8rOXnEUV06rW2Sk1hTNfztjWjL6ZrAd'
+        'd2tDEGiX8sisC9UHbq9BsRMzXlnTkY+DsxT8WjoOPJRF70eE/lZdr+I1/sdU0CRMQtr84+teH9KA'
+        'QElNHWf6HDEU07hgoP5n5BZPS4k4/KKp0EAystitiJcibc8bfsPwLUOUDbvOt/MqfZscrIST97J9'
+        'TmoTVir8gJNczGYPJKoy+Fbt+YUcAA/KXcGc5C6TANzvFoN1vndKC0tcWQujIQ57wE9aPciYoXiw'
+        'WCcWRLFmtZAKZtH8PvZU7gW8WgcxPbkKr/DyGYA9RWM02MVRjQwIyLWHZmbWZl7hdXbsTs4/H6SZ'
+        '21nxcvNoWVZDhSHXx1Fu+82iAtTQ5XTN2dn4RnbkTsf0KKsxdheXmTWGHs0wSk/q+LqKvKnFnbOX'
+        '3HsXt1dEFFC684UjPwOQZ6aGPi8a9V67hakorpCwtXlKqesYgcmCpAvBIsWUGlPmBH+QjHcYjjN/'
+        '0lMOb3NRlAMNWfjMnV4jFRTUuj8vkPAxkIl4NLuHJyMiA1fe8bgRpWTp70dFwtQ2V3RvUeDg49uS'
+        'F+fnsGwz4Ek5DLkLkl83PAEUm7icANucYufryGhJnGu01MM+wKbcKSesqiuESO2CERnbShTJIvTi'
+        '4P/2VQj9c87w3K58Ezwm6MAKJy8KDNjM9Gkk43h1Yq6R/jz/RB0wq0DorQBAcReFKNO06I6PfF1z'
+        'd4mwnkcGfVF/D70yh3tqZ+GEI12+JCvr2QmOjmmcj4UI8r18MJsqNxmKD6vvQMiuTesDTatZBnvX'
+        'A82lmubhnepXVnpTqLq8qKdHRkncnO0nMAqwrgvEN3SsIaMuZhp+qFa7M4k4nkN3Dl30hY7IdP8J'
+        'Bbe4QZcZgFf+BrnFRFW8TxEBSt7cU5LCbgIRBUGiXDhsPv3CyTLfVJwGwGF5UDYd6MFsT3Ja5/Ud'
+        'hkC9MzQnypm0HJV6L3fRnTELocRW9XwCqwrkppWI7UXMCrRGI+93TLRnwJzi5FvkSOINBQGFaCbP'
+        'G3MNjAPR3OtPAbAis+2AIQVDmXTicxUE33LD/XCUm72rBjvRWIm9CqdTz6BRb7TTlXbdsK1cWXaP'
+        '0OwjichRAbtnkoQex07kb/v4/7wjpgBvVwLYJ/Kwg5fo50Smh2acAkEJzt6jkQIJvDAkB6hS0XrZ'
+        'rj9XwVbjrGkV4Bo7NlvwG63oLJ1rUh0jZIFaPhzUBcgvBgLemurZn59PC8bCpv92kTgko1gZihSu'
+        'QrBnhUK1Sxs/lRdnijgGcoyPGVZROHzGJDHOCEViLj/o3p1cA6MozWFo+kNy9K1nnAF69Uq/GYb4'
+        '1iBr1rKDX+f3j7D/98vg12QMWEuhLb0sFB9vfQLKV/QrptRlLEUXA8+YmySf6x0TWWfH/hIHxWnj'
+        'iZVKXK7l4PxL+FYq2M7bJKmBrgm9cfumYpLmFsldZI9IqW9w29FFbJqIMqAKHpj7vivnXE8Zoi2o'
+        'UdkAhTIBo35vLFA/zyuOdIjVNfUvr1I8ejP/Oin3hwJ0jpV1nS2H/3rs045y9gHW2uokUyykkjkY'
+        'fJcU8wikkea7udn2bULdAtX8yQD7sTy7gaHu2S8yqJR4DxNET2VYEYa+ejSjcnP34fEcSdLj4p3f'
+        'BjNmWakqhT8pXnLHoasI92LDd9wVtGBBLopviUhfG4Y1XasozeqSvPoTFznCTAEft4nSxFqAo5Qt'
+        'cQcrwOUmfVU1g4CqZzigAj0hyYGFr/XQG17ZQgdVQRDw+wEF7a9NJm07ms+BkVWt17ZrlGncxWfZ'
+        'RRxn23Bp/6k6qp+QEP6suqHcXYxV3JjyV8Fijtvb2vRHQkggov0ZevAZZMYp6O6iAzpApMIDLZcn'
+        'LyfBtltXN6kcrVbE/rDoEy0QZwycv4a9RX4sPunlWRQZ+4DqPqpXwbd1X8sHUTxhMlfzm/MQkKV3'
+        'lksBFD0yZIUKljfFMfvzKTXvrKdm1wR4Eke6ZcT8JZLrAps1wqH4YpsgkBd1LS1FowMG05+xWvgN'
+        '2MEtZEEROIWRdWuoUK2yOtDJK+WdqUxKGcYOVFDWrT7f0Do05PoH1h6psqGWtMhXkVCpqX1paC4C'
+        'tOYMkKFKT5qamQPGQBt5jSdryGhpgQqWe/N4rvfe5xhQpVWq1RotNduhNM41YsvfMkppKxbvy0s6'
+        'WEcO605UgBB4++2zWy3GA8ZU3AfrtuKyLf9G/zhzc2YGaHegeNhqEBjwDqy8Hck4sHhvXqMmvdkt'
+        'AMbPDNR9Wnvs/DrgCjJcwwAfz46TSK/Pm/bVpdLJBhozlnbTK995L5UpKmEPpIdjnC7xRPPQ+zBX'
+        'qv1ssybzeFCNNEHWyOoJl5e+86Y4qxsL+O1OmaHq+s2Qx6vKKbloIjKhMHxH2+hB7tEZirWhwtFp'
+        'HLxCWwPuzyyQdZcd4D1yMoIVXWN+d41YBJjl+yLTLdWPLldDHWlbtuavedrExpFTzyo42O98c3nn'
+        'YbShLILblAyOT4yNKkw5qYy2K8FyhpxqVHhgEYv0XdsWgN9FqlVDmJlSAGD3lrdeBHUzEyPNcJs/'
+        'QL0KH+H4jfsd7u7X9wlzW1Eu5TMhnL8/LTvr+T7TAYU/HdMLqAU9iu7usUjFQpdngqzfvgYM/8UV'
+        'g2aHdA8Bj8VQYdvLbmmXpMCEr7HVVArzSccvlBDj/500RNjrTQPpzq6o3NNFRdncePON2RnwpejY'
+        'AEBBL7E0j2fYZYkPLJ5YwL49U8BHrc/LGNjW/JXAgrt0UqMXiUvcunbH7uHkmILTdgFf3OD4o2n0'
+        'ZahPCZEAJ9vIvFU33ezvXpv5Pp1dnTWK9Tjh3oOaUrwdJ8oj+ADaL+8/V1XflZL9IDqCygNMLL6d'
+        'PT0havO03vBuZv022c746G9tH3gGrYbOhFmYcGwad1RsQ7dBxI0WQGgNjbC7/L7evcZ7kpqSwWRf'
+        'f9gv2rWNfQlyjqLfJy1gJ8jrB+WaYwPDtGtdJRqHMbVXGhsBR4jf8UWQ874bX3qVHCbNdt0C7YfF'
+        '6VKeIP8eqELzILWGXMnLCr2rz+WMNm0wzjXtYZaYOLhi4fNDT2EEQc4o0dFl427zH/UYIZuVoA9d'
+        'k67msaUJPaaqF7MYa9gCbgxNTH52Fn8lhCBwr+QNGapAlKiosIM/5uC7warN//tbrhc+8hE6I4p0'
+        'csWi9YSfy0skU7ApLkC0hVNRemfJIGdjExrhPqHe2dHRTqpM4mlXkSnG+E9Sbw4uAmPIeSdOO3sg'
+        'SuBFf0o/boGtE/EnYTtqDluX9Wl3v/yYR1b53St1nMwivxA4PWX2Th8wNItOP45CW3cV9HtTMOFI'
+        '/Y8ulqsZoRNOqB0+lsTQnWhA2KEJpIlZkkVkz/WIkzs/MVWfntzSJoD/V0kU4erqqYsh/5PVzL9F'
+        'rdmozS1j/Tj11zoh9UtCWMBhu5s6owHmg+MPLw/LhWxrDCHk+2a7w6hleomkRn/PjyoV0rKX2U5N'
+        'PPDcHdEauD5awkAPIiIJWlpBJ/M80Ak0sr/ZpoV7RPpTgsC109DNgi63iaLIxQ+b9xzk+QDjdq9l'
+        'qsLGuDCgL8banmUB8jQP7Hjxl+sRvB5bGCTBZ3oowrLdqzFoFYEcaPFeSbK28K4Idoo0wZdtiVvj'
+        'UrlwTDwx4uwqlJtyDroTSwHFakcFqvbqk+MKu4s2A2J0jvDdxB/p2kMwqKSg8rCNBgw/A2UnWjzQ'
+        'UlICYsEaDoRT7AdlO0DdyJ9hBWZDAPhfdMkxT5Yp3W8vK/+XWI0tItIbeICvM1H+1OilK/OJtIkR'
+        'z83eHXcPHogLIMmljVB12FGUZQG9xUtYDr3I/SE+bxGpNJxIOI4lbr9lm2rhfOunmRUxuC5qj8ox'
+        'K+irxCQwBwmQNG2ui2ku4kJLLJpxw2v5MBSC3ZsFOt5flJQEQkAaKrzJBqHloCxxWif2DahjP4Bx'
+        '9WRIE+yVrXD6T7iF+sWHjSTwJ87J6WumPeuhDEU0AkUPUbUHaK2kEhZGrmU9vl6GqcACWmxmWiiq'
+        'H+xHcpsYE6gzPbap0+zhx5+2Rc1hDRpERggeGAGPBUDlMXYq11VWR5I2Mkb5k6K3nR4qJ6crhAeW'
+        'cCK8q2lg0TAxYi33ePGK1c9jQzwjDq1EqObIAk6wrRUdhBMjpKNMUaTPbh7UqJY03on40vc4ITQO'
+        '29UEFujjMf7FVb+JcDglas0FcktxMdRhbG18YwJhk0O8I7t6Pc6f/CtzT7lP+qtiv06/Zf70avm+'
+        '3xYbQ0SSoMDTTssl6/c7lwf6gzC28FPN13hxyFv5LzxeFSCnip/tcyh4lAux5d6fvsvWs+mY0pdG'
+        'v/GwK+oS4y0ge5FvAbjbvSx4kPQQmg304FSFqVPF95jrmJTf0AjyC9nDZ91IFgVtuUSf854z42MH'
+        'lZy5GHP2bV65ttc0+4xH5rbM3fOYxwx45mH/iQRR3ngAUU0/kyK7+4Hcx95+lRb3AMUc3GeOIphV'
+        'scVgW2yi4BFegwbAboskhD9Nt019pNnToOY60pYJAFZdxFPxkU6hAch8bSG29DV5u6fk5WXYOUJP'
+        'odCkrWKxTmHw4mipakVz9L6yAi35rrDYUJGhZvhBFghXeotdn8nOvmyXdWbMonzhyHl5AUrw5SJb'
+        'O1CNHCz6SwovuutcNDQHawxbm3AlCluR5IezWC/F+Caf49T/ItApfISVk6cZx6FNm/P1+EMSPKZP'
+        'MibzYuxgihOSp06vT9b4QDPV73AhM6xeS7tsX4ebi8JG3NHugBOC2NdWw7Az1h9DsU4HOZO0XUrP'
+        'fmBdLq25X9Y27/iK9zUeBnzPYYE+8yirvpsVr6qbpIQEq11bUFphrL0EkBBndULorRMAp00XqKd9'
+        'DXveX1YggPl8H1rrjhTHjthA4ySzjPL+RB/XfAvT9paH6q9PeXxBFD3Pbllo1pvloJYCDahcWQF8'
+        '7wc+ufJE4Ch0jdH0D+15tRt77OuVFfTMzy+8UdHPx7JIEJ2RHFZsnPBse8E2Ih84XpYjudFtAnbJ'
+        'NIzTOoL8zFgQG3JQvdUrMYOIhF9BYnLefu0Pv4o+kpfQAiQBWXVcJF7DdJ7/QwnA7Dp63QgZ9pJ5'
+        'sMdj62RA1Jbdq9XvvBLj2Lgb70lOK8Axz+uwlSa8CtXUf+sfG7DVhQ0MS6ud7R71zwpAOavEBXQU'
+        'jtwDYEHHLIwGk9tTnKBs98JVgoOGyeR513vrBNiVUNg0M23DsR0fTcq5TqCh1FlgdFJmpohvKpi0'
+        '+/iJc7NxL0zgIBrc8Ww6nauLNaK0YRyxU61bFK/fYg1alCvtO0aXDwcOy/+5o9BQvXtro4lKaPiF'
+        'mR/ZxO9xYi+TWnY2n4o817oe90dlpSPtDlXclra2MJDLVygE4Lev0dM56v0y4HKO64qk0dPBN0PN'
+        '4wtq5cI+8z+7+y9OGQm8q3xXiHbZcQaInLQjsfGMoKEH6yuviLe1LVnyJLzO+63xXB0x7RZRrDOU'
+        'CME15EVYX71HPIe7k3vAngMddEeiTbaIaK7XRJloyy2whs1RkilVdwH3fPpKNHE6a9e/JBzSQcIf'
+        'pqBAjUdAnHwzpFNnvmxyb53k0wMRipMvbDnLMDBGTDhHmKQwiqvoeX88FS62mnyFBQAQPrXgW/Wc'
+        'zumyOam87lPLQ2Eauew9RsXXOM1egD7YtsdOT2sciGZ8mdguVymBwqCrPIhAlFS3V8e6v1fCkKkc'
+        'I91hF8U/lqOBT+3J+U3Dvk9L8EcY2xvoL6q3RrcMvAJYNStz4icY9asKej3HmDEXyzkRXxBgA6pN'
+        'lqqDzNULiA/FJAcELDZ74gGLsLwnb0uRkkGEWToNWDFoYP7FZyiFOwzRPAxDSMM2e+hVJgaMbaFD'
+        '5uDjjzgBYkubwKQi9nTn/EJsSaTR5jElvebBeEq/OhyWm/KzopGAT8TidODjwf4V2SUmLN27LLZv'
+        'Gogo6T5JPCuzcvrO1YYOcjbGkSggWPZ479CIl9Pr7AsyXFmHYHeAZQXhW4Qc3MhRmeNST94QOF6g'
+        'e2XzF5a0XxuxYwMXbsKYl9HkgG8RS4S1bAOhhXnfeCifW4OqnnPvsoBGyAV+BlCZn3nek7t6XsO/'
+        'EH5zDyK598OzSolmakx57jbaF0TSbZz+GyGAj+klvTOGdQvdNc9vyfY/K0qigiJPujVAmIFC6OD/'
+        'hbQOT2DtUQ2uBZ/lngF9LLa0ly5Q91dLrdrVs9x99Ye23RpwcfQytzjyDwwXvuOICXT8sm1paott'
+        'pj0q20/9WfLqwPotXvBoqYoihL0tf9fgx2qnWLI6LDKhHXxP2jCSSamurt6Px9riwlc4IDdQT6WD'
+        '7TyOUoIh6pub3lqqlIVDMJJtPuLcFIoDu21Kr9D1ANIBW9QsgoFwIyfbh7s8UQSAsJPiMtP9l8WV'
+        'ldEkLIgnAC7gD5cnyU1+P1WrTmZQZWQ8AllLTJKhqxaYxjTUqFfpafDCBEfnl6gGibwBTtrcQ/Ks'
+        'BhfW9JwqkM0HzgsIt3WsPc+lYesZJg+OMFwEaGtIyZ5NnI+LtDC9ebVc1K0j+Xdjvhg8ihzovEL6'
+        'WnazvvKxBRn4NQLcpovdc1XwGaN96dJNDADqjjnj0cvzsjbleLbelVo/Zfvuv5AjSqqlUsIv/Iu/'
+        'shqlZstRhH+ludXRrJQ0lDdsw8FVN+mj/8lOSpT1cWAkQ0yXDC+1OBNzhLR+2CykOwMFN6H9YgbP'
+        'FRW5bWvuOqmhBnQoxtfm2z8i3mT/sL/+TTWdURCXL2Tnzuggi3/SFaLkP7P/yMduzS0xCDryO5cb'
+        'PDpUeq+Bv6Y3pYLj0dPkswR+uiux/MMjhir9NvZOpy22tezgaLIRMicIrSKVYX4yf6WUrV5Rn/oE'
+        '2HSPmui2Amp8zgL8ie5L7QCe3ZFRKSmVl3mqyQ0M7V078tPiSdSFY+j8t1B3Ruu3uZCvF4zUaAF0'
+        'nSoUBtguV9BV9le0uka3nHQJSwLIIAdk5+fcEywY3GArgFy7SWHVawe//wtQUwuki4zXMdhIlB8o'
+        'Loxg2OtpKxI6Z2JlL6v9Za23rmDakz8ScU8P0OMKymGpibzHKi55jHK2lIG6KChdhkPT+20HSBv4'
+        'Ilw3fxg+4BOItZqstbabMm+4MmW/Ygo1tbR4OqIAkw52Koi9BGJsJGLc7YBjG+3kVuLtAZ7zNke8'
+        'RR6PZO1c7vIMSWf/AZlOKH71tm7CzAGGLv60ZSZ+d+Jw47Wjx70e+aXtdrKBGUJEJ5JDsziABZMk'
+        'VMd26lTnj/+2jbhX9052qmyrevQL6G2qYPwwH7QS/0Y7UHxm6B2SENiVI3A+r6sdQjD7j+0mey6j'
+        'SjDfikNLz7kAVpSDegG0Nx9jnxyR40EdAs1J6b3aTa+IWZvWMzG3cwwE4QgLLci84/qG9//11Oa5'
+        'A4nyH1SxHLOkd+2MUkj75HHhsonyoJFvK+YPg07x6o5z2E0bUhLTNnKD5L/ftk5m3gZ5sHii9svf'
+        'gFB2H8qsEMxe0P2LBg/MnGjK5Bq15RF8skMtEZ/ZlKBaDTgWwWY6KmPrC1CacK5/lIbCc43JPwh1'
+        'UlYteGyn1INDbEx9YNFQqkqHG0/nPlcuKIa4o0PkOiYcWYTrq7KoKrUgyzIHY67fwQoquINXNh3N'
+        'Jf0dTz8gVZoMq8aEGHcwrOPbzB7HXbVos04BnKU8JGuw05/E1QHoNHgj63aSyt+MZ5QKrj+vkt+e'
+        '10oO8W6buntVuTqcz8LdN9IYOP9Gjuxb01yrx29QxEENognsPJocO8BdAcUClOUbFlnjNLinN4Nl'
+        'GnCHhGnwwKphZ2fABcfFag/6GVXSi8ZpZX7TSnMvP2MMU31YPbljDXIwOoAzQJAc/MrJx7Db7J7P'
+        'X1R+V/iZz2TsqQSoWEZKbRdbJo0l0iYKBthXfcq395jeDRn5fOW6Wmh4EpIoQ8TGqd4Pl1r7xE7l'
+        'kmv8FmYrKXnw6eAk4ijuw2flz7ljwzgfpVMr1sYQkNLE/7ofwy3crN99yhZmSm1X2W7VxQvlLpCC'
+        'TriQey+zGjU2pHvDD5EVw98GmfefTIjMVnIKaLZ/9X0i9Qo2OY8LP9tS8a97wpx6PNTatPDY5vJv'
+        'e31uZIIIvl1MJaLxFWqFkbhsU3FpwA8qbAZhaDaxLqUvJkVWpBOm+jBn0yUJdrwYSXc6zEOz+71C'
+        'kqG73R0qRfZdESXxdHBztZlxsUAsP+WTtoKok1sbQnJ10Y5j/71r9YiJ59dFm7uKwMPT3UnccVth'
+        'U+4s4/u/QV3EdCl8V16AhFMI1rVBWcgmuS/SCQKcZEO+GF7XGBguQLFMfUi8zs6pfV9cmtTn497u'
+        'LFzutiBdlUE5flhwb1rVgdVLd+es1zyWqYbkeDQNxsbZizhBtg1CviOekDt88Zydva3avNS4LJyD'
+        'WaVvpyhcTFpH7gIJkfEE/9vfUdDPJnjn3CUfB9wQgg5ar9Xav99G6SW+TbU3n97Ga/UhzFwYbk75'
+        'nN+66FNgPzRgAnJC+1On6vavGLmdMMvCXh7sqeXJItpxv317EmNw0RZ9epms02B90eDWJ0sqp7nF'
+        '4AzRflfELuV4isRmLvy/5GGHCyVxOOCCp8Rz1a4UY3EwA9rTrDceShEN5H0LQ7/titSLArfRV6uV'
+        'NJm2w3oy3UontEVua6zPfXBfzoNNms4RsUkn8rhzYCh3IbD+7gMhqOhQ4hn+7Y0Hmq6/cbH/vx6h'
+        'p4HbqnqFK/algmZ05U9kYDmE1C+EQE/1skMjqPnienU3nZEuaVhEOU7Tx2yqY3jwqFJTAj9RfUar'
+        '+1cLSLSTWMgSbev7W3UGu68KA2cXtnQOGtx55nKukD+FwMHMhVah1I9aryFMhmbhwelUiTvz7Fwa'
+        'OaM3XghauDSQ2biCAp9OLG7sM3AP7q15FH9Eo3oZdyQfVAp81foxYQyC1SOAMLLw2in2R7SG2uqC'
+        'qnINMHWjadlGoQJuPx8RwTi647Rfbpvgg2tZbaZDBEGwq5sbl7yNNmjWkNc6si2JbFzGGDhIHqsC'
+        'oEpyIMRao6q2XglZJFfGeGxR8PgzPSJRu18wg2e7fssF0ADb6wHyNxybdDuqG2wcQ0nOkapi2Sri'
+        'uHB4XO6SK20vDAawRt2qO9U2bAaXJeC+XVNIbtXm26+5MMzxmofGOhZccplx4U8GaLCVHXUGImwA'
+        'BOfYFSyvuIeAoviAikROwebv0ZJt3TpQ6ZfdBgFzAOs2zDsrTnSRz4flotsWkdxWScnkMOjgT0A3'
+        '9be4Nc2kmxlheqdDpCv1ahwE6M75j8cDZBGmkmJZWGhfIldxnmtk6d24fzmzh+fJiTOR60fIlViO'
+        'yr+IjvwgJ00tGMUyigSOuFHu7pmpb9Dly9djMgBHBnsNowwvpMeAsJL3Inw8ohzxAFMqO80bX4/k'
+        'plCxJHWcvMx8svnkzWEq2EOG9iWLBRTM/UR8oG9hEOwWc47UrJYjJF1Tz1DkiUilD/HDhwZxEhRz'
+        'ljwMO+OUn64T8dbCJq1epjpfy5QFD/aMzHluJE0korUROR52xgCZ1gqIiIUsKyphfiVIOg0xJK3a'
+        '6+HowZ7HyPW1Mg/Mhm/tEJMVSwng50P8fnI2eViOmby8Dz00l73lvli3z6DAIqAv+vTzAFmuT3xA'
+        'n9KuKoab/f38hwqLyCni3d2jbUmwIvXLtxVG2YUUFbtzPpf9eVlr4Cu+/VWTq79OnwEc17WLdB0A'
+        'dWBbMISRTPjXN8uZoRoLw44ea4+kR3R8YYgB4mLDt360CFZXZAVhFt7kuOt9RurtYp8CFYfTOO6q'
+        'bRcv44f8eMJ9i38rOjrFhDBuxIGDL908J8ynYJnNAO2bf3imP+jX0XgAJps7GFPLLr/GAr+LSzFq'
+        'yJ7lV7FE7nDvv+TGBhdrjM5XZRpwS5k6icJKHEl8nyuBwTDIqLv2zybdRMN53RvCL95DDmzFmcw5'
+        'l3OE0qu704NDbViBuUWV/+sGg+4vUFkR6ueNCAAJAClTjkynhRXAMIOoYoQ9pVdZ/71ueR3V9h2s'
+        '0q4ZbRuOO2AFT9ByLOKdc/0/7y1QXgDUkaihYugpOq7BXf+n2myBYlp/c6cEBRXKSW/9sKdfWApY'
+        'aD7bdO5GHhqsmgON8elN7rDWIlQYmWEXFOiNWvQ6DsF2T6gx3ynj8XyEo0Cb88In1kEDD8e8vzTx'
+        'cdenXVUWwHJDWjOeiMwAdnXk6uxuk/auY+TlmOaDBLWxp0hCMiPK/iJwZNxqcKakAdqzDSK/Ye54'
+        '+VOJjJbnmkYFi4WacObxc5Ciuu4AD1DTH+3OSQJ4i3wCQZ4CBEAy1mVxRvQaRoh7CaVJGULWlSsZ'
+        'P/DxRtk1D1Vn0CAZcTljcu4QST1JNhh+MCqtzIBKQW0jWBqS0/TxcGJWv9b2lER6hoHtrkS2nNjh'
+        'QLkcRgIjzV8bR/m5mjseCiwgd12nr+pql4IIg+IcFGA/Nt1XKAIk6EtsCcOYht3h0AUqewzsa2W+'
+        'evziHcjGLA5Bq68LYUC0x4feD+AdrX0ZBg97poSm2e+RSzjYOJooUA7FQyIZEKVSbFwi7uzvcZFc'
+        'Mb0svyAByR3XasohgkXrxh49GdwINXalVHNTaT9xO5DUsFKjj/gUluhgJPYJrDndyT6Y4/UHYXNo'
+        'C8/wCqyWzvCK3K8w6JabxZkZu7OlIk0ARMnar9Kzt+AuXi7b5HunkcKcTJbt0sWBn5iNUSLGtnmL'
+        'cedcHLNa8JV85J5/CwffCtsF8aTQ8lxM8fGgGkOmEXE9GXW5myuxLV9xofZ8qmWRj7oBactqyNg3'
+        'q+ERUIjNUVwgbVLqaRKwcGJu8SCXHn+vtIhPU92SRKe7agPaaE99SKxLFUdXpI6BomE2EwzQr+fN'
+        '0BOPAxDR8M5NyBFlymKB9R4B3wXJ+dqetJ3ksbb0We7v800Pzo0w5rTPCvHa8b1CGBDwyEw9JnY7'
+        '34OdeBz7n2AdVsYL9Yn8uxPjwI3pGw9JkmKZvEdgXwj2MvLv5DgJBLxrTfO+yzCgPqDEcJXbYQwe'
+        'yQMxbVazqDK/9P3nJgREOUnEhSpSYhA5TGrzbCHPAXi6uD8GWD5Pw4yxtNqYVyzMBj3WKHmnq19C'
+        'GTyw2S7SSARjz0Lot7I/yyQKSRYdO+RxIfp22Ugu6Rx/IedtXCoOFdxbtY2hjX/uUmzEKn/GBBQz'
+        'JeM1BWWj1B4L6kdSlQivGe5RGwqnv6ramQH23tY4v/zPspdEySEtAAs5JYOXa5oQipQDxNehbScB'
+        'hAIm0NJrtP00s2JkhS2GeYxh65K6Pm24qoFZsrZDoD/Pp11gMDWdYc45onvIwRThms3TLlBuqyIw'
+        'emmrJb5kjEq2Lep4qfWHZWFyBo/+mb8b+M0IsLS1GJbLi7wpE+aFHBe4wV4aBRcATgFgYZMBjXyz'
+        'AoypQ6HJnZ9/f+gL8ppB3nzMLZPdn7jldPueGFAfpmp/BNEW2i7To7rN+QuZrOs6PBVAzD8XVx8O'
+        'FFGAxbFkN1p/iGcwx932BMgxt19DgWU54ZCwh0iltizEkBYm+wihAf+C+cogCjt7GYZQJZKxaN1i'
+        'vlMmPI/DYksNrvQiPbaHU9VMU94xKhRbBuZDLUtsy10jnUAYqhJgkTomrrFts+iCZtTHBDhDFyFN'
+        '5qoUzA6FFQ1BzGYCZqKZwwdtRRJiGsljjQ+HT39yE9m6s2GSqEP4R72U43Vjl32fZN86GUj5s7We'
+        '4lDOwLOTWPegfJ30TACg6ZfqfXr9wPhmtbhZ2MztjQafrsixMp3rWYDu8LTWoLFDvVZULC3OCD3B'
+        '+bnu2BSPNGh/6aFCuQE6kljPvr4WqfkEw7dMvM6GXVYTDNzDkeEUNdRpPGhytr8yUusNnBDTMzDb'
+        'uEzJN93lA7Dho8boCXZvtVeIQaNJ3VV2/Zeh4vgZJDivI04/ZBZItBDkjJcSlZEJSLjxKLV4kcOm'
+        'VU+fB8MSU9L8ZJpGHG9mC1NfJPwErGWdkXudr5QfQSK3On0Bi/eXfb0pq7IQwOtu9VvQLNHYh3js'
+        'gZnm7GYE64RedOiLHuRvmYVpchw7V/4I6jNbrN/R8PhN2JWQLZn/sx/NzJvsZJNFB7Uh8fE3LEPE'
+        'dOu3KEMJhisUj9a2ba+bipbRWw0QZiJzk3awrjPA1kaAMKRd+L7BMo+nwCeVfhMte9YZvXffZpiq'
+        'xz57Tj29Idvj+35YtGffoNKPkPWY3OzxJRVhy0c6CDSO+WfyHZ1rD5XKW/gseq/D2hWDoROPQGwJ'
+        '1I869wKZy00dFqHWKxBVRU3U51qHHXPEmSb5rN6lW9e52hEIgJB6YXxe8yvgPsG1/Mw12AarRzQ7'
+        '1lXsaVbZ8xds4J7DjLIOXeMIuEiyLUl21pKNnswukwLvJNVe9CNnGl+0SOYwtKDJl4EQgzOr0Ymb'
+        'kUJXVOxfp2UwII/hbyLxz0UgqjAvoGsizY2FWNYQ9qzRElm7PDZqvdgJFqQL+Hm/zHAH+37PPcYp'
+        '+QDD6m4JxbzaN0fnBRLJpYa5Eb0aYwv8a94qIUvOVzQEIWt96KZ/EBMuQqKatYnaXQ5tOxBoxkr5'
+        'yFSeQHKifVkzliHIlZ1LmbyWF5hMwofRNCTxTb4sZcQvPAEEfZAt+4Qgr/hADRUEk5OFTKNo2YW6'
+        'BUxziq34JAXUyFSXWzK+YdA03/QF0UaoTcgFkN+8ay8XzblM7JJ3g663p4j9qT2zh9rLDvaOlS0C'
+        'N5n5hY5fWG3shX03I0tigi6YUK34SZXfycatIe9vrGpl4IjiZ5d2ctK6zPR2hgrwcB7/kh994cIk'
+        'I/iTs96BHAI0zgpOU472j9yHbwiKpN2q+He8906ACzx7hQETriNL2SFrooS4sYvp4ZUpjYIn1981'
+        'NcMRRMpNMd4QVWtpvZDpMq0orYPIa47cEBeLH+z6yevupLP9apTih+3dANEbEJB5rdOH4dgDPoJf'
+        'P7s5QifIsoMgBwDoXVnOfStuI0PTro7UqJkak/zaOdcFVYWUirJ2EIjALrUHImxRPAeMmqcDbyWY'
+        'buY0GjomJw01s/a0PJkCFvjc+13WFOzZFYQBLb5XQc/1WiNwYMYdrk+o55oDEf8bpll67ZjvEAfv'
+        '77NFM+5wf6sJ4DaFThZvNDHrQtmS1lEQxal/7I2xR260IoQTGtefodhb46maDiL1EAzxToN9Irr9'
+        'ZRUqPzMjQDGQPHgzrm8RAH4PxL7WlAG0AL826zjk/ci3Qv20PksjtB6Lb5TgbwQ/fXzI+ayrDOmp'
+        'HZQzTNZfLK6fUjaSJWDZY0qQnCUVBNNRu1KJYVdt5pTBIj7buox+K5llso5Wa4wHOHqNwE6LcZZX'
+        '/I1ldzY/Z2JrWpt0eQyw7l1vFjjPq36oUfkTT8ZMAWD2wwiK7GosK7izkiguiVmMqmQMHV3GiRzL'
+        'h0WFuRPV89eaN5dDeDLR1PpzmeIMHszYZ6075wx1Uo9hcAhQ7Tgf1etmpPEVesZ5Le5TwjHaQBlJ'
+        'PuUIbknJhqdGpBNspzvhQ8Ofy5ABur8FzLrfwsiHNWFJHUoKLDpGjYPQq0VtHbT3Mx8tvjqLx1cE'
+        'LXWK6NAsGpxiSsQUUe/ohfxxo4vT4Kn5lQHpSTSEyIHkvmsoqsjW4ufDEPW0QPqNB8/obnK5z7QN'
+        'DPvoBPw29tHOaKc6RyfobBmx5euBHX6hZih4ipVa7Y4Zug4LBDNalfWn6XdZ+10LMcMyzd58v/Ol'
+        'MD0ld4UpOQRtjhp/xOcmOcRdvi1afUbKPeez5gZvVFk2VHbjkIobHYp+dHK/0uvmYsUUHeIscXWi'
+        'gmUVzQ+jrMVycFpqGJVtRPIjOZ9jpp+lMAomktVeHniT0Y5KkehJl/qjHHLPesKCs4b/E97Qigom'
+        '6yHLr0/7F5de+AOo1eJmoGoaAM03BAfx8uGu45W8NoppNExLNdtRibcBgTt8zQegjbHMWmT3yxNr'
+        'q1PxAbfHppmQQ07iCcI65C1MG7j/tabT08W1iyHHXpimwX83LUgqq35FigfPFEnnhMVtRSdcbK3m'
+        'arr/KTVV2+BOplBkRvqZKfk6f8zutU7rejamkCkdH+z2Ri1ilfUFJrlxgtTeo8f+M41b9o2XCPvC'
+        'hZiMsQGRF8eefrWwXci4PmeSrGx3Ckbe35kNU1AXX1UNzPWW0VYYbSQOlKQ2xXBJWXu07eD34FpY'
+        'useP1Ui0agoX7B/QmixR4Aie3n+DyTD3RLDjlnF3ai1W7sx9mSQygnVSFMOkli0AJi7mvAZh3E8x'
+        'KUN9BO936S8UO44qlAwQc8lrpgMxp7m1jxTV13tYAlUB2VmLYh6FWIbiQhAbKeAo7gV1aOeZbsQN'
+        '1pKzRKY3cV9diDYieFdtXfi/KAxIbKAiQn9tRi6cVPuNMrpVIBaVOh8SqJ/qw1FQDQsMUUW1pdJu'
+        '54sKgEvOIptNMxydvud1zzRvqkmtXeryAV/0ObhQV/99Q/e2Li1lKjm31hz8kjePVDz4dj72NKu8'
+        '0Z1Bo2Y3hm/togcQDuFHU4HIXeH9D/CkAu94zzk8qHwlJSBb5wLcPaQxH4lCqRtIxPUG8gdW2JxF'
+        'CiHPytnNNNR/mBRgE7pxm13r2Wt+Ub+7eb1BWZp4IqXS3eg8GMTzLBP3Yxrne2MyDbOyJR5idITt'
+        'hvyLX8LZ9UXwnyLMQW00ei96A/e8iXn4DDDZ2TSczNcMgWDhJ33tJ5Y6NR+8/CjSZ9e1/fAgmiwY'
+        'tX+IQjh8JabENlGA/awvXGUIOZkQ8MvaHqygZZU490nq6EOOzJ8MnvR+Nahe9NUWuZsG/jyO3Tei'
+        'ZGfhiey1RaSdBuB4KJORkDmEt2nysDQ4FsjNOF6cWtOaoTmwZzE8uRnUeD1Ggp0S4EXECIe0gIwP'
+        'X5T91qzdA3nUy8gVXJZaOwXZHJCQagY9TtkcE9sLZKWo5cxd2+ynJcaiMbJRglkLR+GcXpTGcoZo'
+        'EMgxaTqRGq/R8EHQrPStYTeoYmUvPvvodeN3GOiFX/ENdBqXsWi4X3mSXfadvhNAIDCYr/9byEg/'
+        '9yagdhdN/Ao9+SYDKHHWtevtMNVtEV3NkyizAbu0Y7TTamjseOJ0Nab1sDKF266Xkvi7ZFs5LdwD'
+        'G14BoOLGlDHrDwhqd/f4U0FXBO91RK51NTdzdGYQT9yg+jcz+p+Cnqs9NcktYfnm+TuRXWAl7MKB'
+        'OMUHYfRut4gASKlvUaU02J9psjZlQ2PBfsXL9jtXUe0kz2TqaYdtWR0eCraUXhDt5m7qmAmSJKQe'
+        'HB/h+k7pvAzR54jBKDMT2Jb5dp5LFQ5njxkjC5mXWktovYUQlQPJWevGN3vnaD0Ed7tBbheKJjga'
+        'E+QlTig0lZ6CL2p2JT35a9Dh0yxWPeXnbM9RBClMpTkQkL98C1YX8ZZNmFOO+f5pImTAs2f4luBQ'
+        'z/pdPEC9ZQtI7FTZ7rOHEHUKyhl5jfh5FTuCkliJLqfs8eCfubEUuRWzc+ETxl5A4R6bAL7iqL5h'
+        'S6r+pruHyj8bHlUFp0ErbKwAhDl5GurdxtKiA1TP+zIyQtNaJUFAU7I/9HD1Kv4PojBMOetTn5BC'
+        'QQQw83OgdwF9ApytwEs/iI6O8cQyx60ZflfnqPt6GQh2rNEOVSbciUKKdQ6YBxX1KWwT4NoZ/wBi'
+        'YTQdmKIZkTGnrUp5fP/hw5ad/c4Jrb6jhZvP9cZYKbOqu/MZgKXlh+FTLVpyhtd2Pc4DKeG2o2kS'
+        'vXR3fQYGwDPmp3D4AVKHyuTS3pvt0CD7MFCBS3aZs8J0p1210y3MsH2Vu61lfpBMwAgv4JOjU2Ws'
+        'wbY07/Y6cw8ciTh3LNx2NukIuXLPlIpBiY/rpKkDLkLSN/tL1vfWnyZ5nl5BIpCNYa7oXbD3SX4J'
+        'tRyInVdJ0alNpGRw0UOkwgkaUJoA1yA8PmSMeVDSsXyTfF957tjXTrwnK59Rj9UCH0MdhCT/ECUU'
+        'OdLJ+/FDe8cKBLCUhQURDWOtQd5AEmq8OSeoTlt6m5t2XSwDn/H6UrNWu+Gzc2fxQD9JGdW0+n7F'
+        'hiteDbFwEUzhuiLuTN53z0qiptFzb0aI/B0VZEkeIPPLw221RzsuM0H6VcfqywuXPSq965C+aLND'
+        'XZbRRNLZcEHrAoFvk5yzoX08Gd710XnYtsZajfhXPfgv98N06VOYldazaMeAxTGEKZPbqjECYB0A'
+        'EECfrFMv1CbxQZF6g9nmd3304FpGgBXDebJ2WOcVLg+bEBWmC88a8MkIGxikQusvX9wf3N1DVctu'
+        'waa+hh/43tviUXozdW31FDLckgY9JF5eOIuJbYCo59JlovsOHDWCmlit2kxQAF7tinG0CXWKH7CV'
+        'uFV1JiZqPfkWEU6WJG6eWRNdZjNlcPcyvzEwAE1BxpMwjjMK10h+/DSIOratODX2vBval08KnS7e'
+        'CP05mXnAz5LveaQdUi8sWtjaH17IsM7byCTYliAGGo2pRVXR0QngXGrNJUzLldGe7SruixIrngD2'
+        '9GFrxbDii6fxTe6S7bJ3HZsi9VqVe8c/xCtq4u6eXBrxbtBzb3CTGl2kMfXxoAU0X6s+8Xcww9KP'
+        'ZE3awRYuGMYLOM7AXjQtwHCEg46LYGIFvz4HROJ9l/migfOSsCydjn5kpmUCmeO9SaSegZnKrx6G'
+        '5020N6q5nnPNAfw4TgH/RQeABfOiAxiagbMywoB/TyTFlZ8q7n0b7ALBXZkf5Mf7vyLKd90dJSRm'
+        '+zXj8WRLhN4EVofhPsReZ7/WeiCOUaQp76gyhJGDYqIkSdDAjPzc8DRIpdP2RwPR4+/LvEIzC9tk'
+        'VwWaF3EDvbUhweWuxbeCvoyb9M3WPgajt3+YNw4ROb5r2ocgkOPWxmYDY2kHuIYqqfVZFB0gxqM3'
+        'wi7M+8EBAV+u8Eg8Xn3wR0HhYbpukhfTY/c6KGCUc8JksnYM7PvoKMgvX5GDDnhkHxH+O/cfSxva'
+        'eEnqWXTOl8DTT18Y8YjXd+GttYjvVNeszCVxcWF9BjiDP0ldslocX92QjQ8dP5xK/DXxVWQhnyhJ'
+        '3mt5Bc8eu1M8R7CRcvqh+Yl6p98i6Z7tVmrzUKuRkfcI0JGS5bpmdCbZ4zNAfTHKSw9Y/069X0aq'
+        'qyJuWutorO2Usi+L4CuVYl/KFuLPRAm7Of/VKPlmTALRIHnGOD3cBZkSXZWFQZMlF6lLz54mnQ1r'
+        'stHp7Wgo4I/ZGE8UxobcXZCEHUL3UA+qP0h5ExpIq72l5x830bwyjKoXARwBoPiIU7Y3aElcjff+'
+        'jHewbQKCUcAE7AzLjmrcMTMxT6m2e8M8ELG8tUdLZQ9rAeDGi+cFkynoRSMldXby9J7Jb9bGtx9I'
+        'YXhOsdenWUFzV3VXeVtWvL8uYS0MxnhjRNSCyQ8NaNWopSvRkJi6oOu8UegETIHRQ+0uXPwsZQRD'
+        'wDazM8UeB/SRL08aEPreSKpVDpVjoycZruP85aUOh9HZ9/fpzBEM6C44GnCv2Rzxqdmp0Xv/i7aP'
+        'vN6ELZqZseZ816TF4L1neeG3llmO5NYHhKwqgqTGlHJP0uNBFeyn2FOTfbUV1RChhLcQal1oY01v'
+        'Ctq3t8cUYgULeT+8hSUvav9s0//W5KZJHCmuRs6u+vHhIw680XzgMBLkJSeg6dNzDdV8pmvtUxds'
+        '1DuHryqHubFmw0F+WhaaClV5r+hraLGLNknt2c5I8zsVYBb5f9R7Ga3oeQhgJ8IG1mKKW9f2wD7N'
+        'aL360cKTd1KpKFD925wXKaUPdKkXNcy2QpT3Yicy1pAm8bGakxLURtuuu1YBsTyIWR4VS5FbE8N1'
+        'rjudc0nLG5sdy2szPD5+WwTNTJ1EtFIGdJ1xtpmC2WZK/3JU5KTY+vlsXdKoAe6BAsNKmwG5I3ix'
+        'hrgBrbV+xtBHe0xwFP9vsXRhx8qvDEm0M/p3qZjAHuJI7zlM9EcBtS7WOp0tnDIyRb5N70xKIl5B'
+        '7Lwzenads3OFPEEf3CrLwQMxtDOg5hbU2wdiAOEJ//NuU9WziCcUZwt3baFMVwfrTJhtlCT7um0F'
+        '4grvxi8gTedBvOubER9YvAg+CjeHfY2uaU6iwZ+Ft+Qrq0e2WWkALj4AVqwAEooMKEUKe7Iv2Usj'
+        'NEtqfyhn+7korUT6IqDAW2rkceVO6TwQS8e/+J/kfcx07eR81B+7Gg9oSUdal3kgiK/9/epfQCeg'
+        'V5yPFSWxSdF79Oa9NmrFquChl124OPY2jV1IMUrfhUzf+884eOtgo1P8TTeFLm2Z60G5pDkduFK5'
+        'rCQ3+cgBq06V0bgowkpeZeUlGefICWkrZOto+V0JL23OMGMh/gzfIl4qjkAQ+ripj6LhoOJ5ooyO'
+        '90/IAcQ1juokyAPiZLPwB9m45C+DFaP4zQf111so2l4hQ4OYXr752bPZOFJ8h6qNmNAXvNKWe6sr'
+        'l8z6Pio88GGaK1uDJGtgADofnnv3ghlDWSQKgwya5ljUIzECZbdziIP5tYuN9bPVinsCZ8UAr1Lk'
+        'ApdVns0ksQF5k3c9VRxPkaypo54CXR91VxbYP00eR0nO6mVlmjvdX5+NSgUJLD0QCl5Yp17E8mad'
+        'AM4HwWWiO3XlsqlKLprxFb8LU6UD9wlAoholcxHcVhvnyK/rFpg073jqewfSLjrGFqCP+wqu90g1'
+        'JLHh3JC+Nf+xUj3tdq2XF8cpsf2TT+sZNLBRPHLZEyotqKiuFeiHZDWtAj2atzv3252kJ9N4HB55'
+        '7dD0NrqzyT96vN8THB5gioAy2PUajOwJrCpZPv0ob/ku+rGKEVL64aA+69XehkuIr7dPChmWMDf0'
+        'wN0s+raqr+bAkk6dTBZfYUZo6O0v+O+baNEZ0tQXkt0jO9Ww6SVBQFwS0tUNnev1wBNTC2KzsKcx'
+        'gNeWHfZXCvuHy3C7LIMMpAL6QUln20/mhoxSmhSIL+/F2tIElaP9zf5aaFL+6xtZ5O0/IEsjevHW'
+        'WW13dWlm+vuVD7U13Ey5lyjEPCceGZ7/92BTM+d31YJu1aPuTlfjMj96wl9NVkKzo0PzMLC0xqMp'
+        'bgK+MI+AfR2a5C60aoh+n7OPyS8PqcVqn7LzU+sFw8YVAJtP6Q3HF30LOh3hpqRYEei+S7YEkxqn'
+        '57YD4ErmdnHt+pc7bk2v8ZAV9xBe8uiTmgLVZe0IV3WMf2BtKvLYwh7v9k+Ius7NcJiqwFmVyDy/'
+        'FQofY0UaE17WPrvG4x3m34QsbjhpiuF4u1i1zR71R0kU+D0bT0w6ZB+Zh5judHBGaII2BZJBoQjB'
+        '0KtM0W4QQ/2qyZBjzo9qhs8cCYzP/ukOOl0Vq0QHa4L+dRrdRPQNFKId6++XzjyUMvuDffbbFA9w'
+        'FpHKw45PTe4KmBUUV6ChId8AWAnjrbajLXo33QtRZPnYuF3+hzXtx/Cm7rEC3/qRnWWnM1lI4Uq6'
+        'cDDVg/n+KrNIGDEoxHBieNBEfvA550sN7WehLXBm/AqUhgcTaKGjN5r8NS9PT0GCn9ygon5eKX5G'
+        'Q3XfN37QbEU948Rtec5hKGC2FRB3DOMumnXHuG3+rm7WPDLeseqocB4qSAzgXoZaxKQdNDITXjJ4'
+        'UhbuSautYenyWqFBAZ8XOy1VXB6f1ZECzSUsjHhqVAg9iN2hdbGe5RjvATZQ0gglqkHdw5dcbkWj'
+        'uSRQidKEiaSgNkGBHtsEeXXVg96Q+05oiketgCjArsNhr0Oc0/A6MfKvDa02Bh6MXTNPHXJ85qxd'
+        'poANytrV4ZbCnIHXRhjujgXsn63NnOAqC6yj0JhLwyFNZdkaOx+NmW5W9z+5kwDlg3+Z4oLiheX0'
+        'WwCUNWGq5nvQEDdWqmCWXazP0zRF3ZrhsDQgoLuAZVG54M7jNNLgf4rCurp/wACh55EYfKiDHldm'
+        '+3dFVCC8OqGB0dj/0zd7gHHLQZcYSLWCEDz24X4vjqsbpJb60kZr5EMS3G/2fpaSXvq5fw9FhpO3'
+        '8KI+rOdMUIILiyZdcZlTe/AdOGjbgpqPy5/ws5scrmQrOnt/orN9RqrVEPpNsYuFJkAlVYrwmOCv'
+        'Hj4StoFA1m6SB2mgCt2UnqyGrEAfdGDLbJuwjF88hPTu8xneuKkSLYncoKB9EnV5sEw4BjODluuj'
+        'Muk7g4ZnbpAlnumBd055ncFH7TUfRXYp7ZG1SQcpEHxo9Cy7HmNVYFtKB6RmFg2frdAPbqve3Rm5'
+        'Rr7vROvrhSamaJu8lfk/a8u+Gfi1VIi5dCuNVOEBY3mUu5py8IEULCKeOarngmzNsJo8j66Mdcp+'
+        'iRAFc4EJml7VJD2f96vfzULlyvvEhUXRLZKc+C3KzgVSAszfH89UltZ+eWMLLx7cSZKPiLAr8wCx'
+        'D1ZhlFWrVIaD/RB2ikg1hlB9h7OXWYlmLA7Q7oF1pqCGUQjMdxoJBm0UoQRbQ5/qZXEgYjAqVi8B'
+        'yOPe2ZAukwwhpnkgj5ETbiz1DgE3qfLS2LROHDEvkBnl41cVcuE0Im87NV/PEcJnzOsOR0flZ0jy'
+        'QXXhb4DmPfE0NjWGzKrUAZQ24PvRV7MCGt5FM+8pQIW382MYjKDNJG07wg8dWNvpkI2WCFQlpiVT'
+        'RjPcSmvfo+N5XZOISf2bh71kw2X4k8o3AEkI+GW1IZ9HiSYIOreOCOBv5AUhbWwrJykasdrEKBG9'
+        'BdRV72glup9FXmkwb8yjvjYoFcXPIDS3xnDGLjcv4gyqmZnjIRkGLamBQ9SiaOG1vN22MGB/clZJ'
+        'xdp6jNQ0UAnmJznip1yl5VZnhxipp+D4HCrhtsdPQhw6m5k+/bVFzSF6ZAyHnyn+s+XF/dxVBhLe'
+        'i3gNG5lSumzPhTRJutDAvlIkpNSn0qazf+vE0OAd8/xngV3l0hJ+3qoUHCgsf8rBadACyDeHpiaS'
+        'IsUhmv5KJoL8WgjFMZXW+5qObCeR++feQPCQ2PWBg38u+ZSgkpDAj2Ojup7sBNoVOdD4wcXwywPl'
+        '84IL5CtJHTnmv2HhQNr6NNbTDMzVVGj5KgxktuUF3OBIJbsP+sOhmlH+uIqZ8L9t9S08dioNYnMM'
+        'Pyi1hFRFKO2Q47eb681E8SSrHIXK0xmahmJl5qilh1VqZeD/T9FKZ5ZE9YY00MgtYoeY656s+dyr'
+        'tFPAsFtvC1t9131zVxZY/Qh3e9Fww/fqDzvamcTxvP4v7JpdFsfdMltfZ5pDrJG2NjPc+6Q2cx5W'
+        '3an0TRY3xm3mMdHxR1A+0xZi/mYH5YxBSMy0Srfx0j4btU0BdEaXpTIAnKHSygNtxQCVy5mzIyBZ'
+        'KVE4bf1AGlLuB2xC9s4bKi11vaVZUkOoej4S06/AJyw9YzNRs5N9PogHckN0ySZpSMzYoO0VE9U9'
+        'YI1+Hk8We0ac5rrzIf/Zy15RVu9B9u2bMw130Y16wNBlKuDyTWNR8idh0CJrDAZPgkxtpPiHltbJ'
+        'RsHbYsrrABma5wQrQfYsOCMFITdTX+sXhNebJHuqtxuIqyvahw5DpqBxieM1savSKlXZefDeLJU0'
+        'Lrwd+Ek+bifMlFNvshNC82A2BKCHEHRFGQ/WAHsD3QKCTtx0VjG+A1b8Z6C/4j9tqlOCcuH0h/p5'
+        'TZBCTSEnWnkLTvlf8HDUnmWIzr2lq88wnqscRcyutFRsnR3tppnKIlR02CuRCJkM0/5hnxRReYjW'
+        'WRiizQ/ijU98YjaPZB/JcBpzCE7hjoZMoxKV8rXsXz2o9nTNavLTlsKCnCJIsXBTsdJLXbybXniE'
+        'KVrIXdsZBQDQuuYJXDdfYluyyt5EBnO75OXrZOxFV0P1yMjse/xnnlIM2lECxJJQzNhuO/FQxNn1'
+        'fngSOY4BxpcM7qqy4x7Q5vgCOhPFb819sCgq5L+n0XZSZXb1VsSovoGHhPe+XvXIL5zcRjCTgCp+'
+        'o3Ridj6BKIE/g+frXIi/N51PmfYNxmlRABrWVrxKIrb6+IfZbI8dzMQCn+01WUR9ZDG1yVfRLkJW'
+        '8iJFcwmdnz5fWmNLYEqW0PVpjrpkJ1axO4yF37KZazh9zpEkqmfebAH22aMb3eTiVkQHOH84l7bU'
+        'yUQiiMjxc5gsG//ggTO68eT+iXO+WItnwzBKL10Q0UXg+JNurl6E4rfFc6wTlS4AQO5UwwHwtieD'
+        'AXzqDsJIzkXZQTRk8GGcaVa1ajiOIFLBQ3A9/ir3aeb894ysv40VJHAwv49YnWZOBn8P40X7/77h'
+        'SsY+ofBNQPKJ8IK+Jwsbqg5UFvr78FuRJhPlkNF8Mpnc/rQmx/jtXTx7zM5QjCi4XXoLOY3mJZvG'
+        'xr5Bpb60iv9YgSPb4pVrIhwXvQfmtFvDQQDfoDREGpOrBVW7HWaaL5Q1+An64aBPksmAn6rKI+cb'
+        'rMLrwD/5PaZtHDPwNGeHMH7DOzAwAubaItdO0V5ju6dXpAoQDjJbEfIiGPtAbN+S+WGmqb4+/cd8'
+        '80svLVGzKqOGut3q/Yi/yJpMgLAFYXhMuPLTiaYYcBetMzIiQbcumku8ZSOorKmTroMqlfcts0f9'
+        'z/dJTsYIdnuyrz7PnGGf9td9VhA0WHflWXjREG+1UDMOIqeaWdux5/bXJJvko2AzTtk3i+ai8eUc'
+        '42VF+U5f5U5PKsWLPonrRxQWose8PlQptUbGWX6P7R6CY1fZcqR5bb4n/YdgZsnxbaBvQCgGghgq'
+        'dEkHcRUq29g1sTXn6T9HIgIVj6sDb2oLXhX2Zjgxi8uCReJ6ikVN5jZY0BMCmfvu6KhQ8MYBEKzw'
+        'mkOGAhWOuTL5nZpGAOnyn/Q1NjF4PJ4StMbkseS2nmGQp97iAhS0XkADoUqI4306omR3zZpRVZRi'
+        'bl2R8Wph4WHzbVdI7/NI6p8oeVU7ppsicQmEQsYGoylm6S/E6sILKQsNtAJ6CTz2goRrIV5l9P/v'
+        'gb9juxihnjdq0x/B1IKsfAJXMCfSD/VqU2azNNz4tb9s3CYLouzH65e5BbcwaY/xzsZWghu+iS/u'
+        'QBiBQp0LCgrAxvwJEL+3itzaCfi4mKPz5cpOqbHh5BpAxyllbBD53OYP74TRha8PPvJxW/XgMA/N'
+        '7KpziW81WTIqgeX+BmuEZTySKwdfR0Jss37a+u3eGrr04ajaPo55gMgQfnp7nMbu9zIDqCFd33nk'
+        'euTTx325oNWSCALNNwxedjrbsiR7hC3Y+qc+l6fosg/Gp8i0HqF1h0hH3LiHDDrrsmHz8aX9LD43'
+        'zkVL1GpkQm3sPkjQ47xehCNzn/mJPjXqonWOWS5WwxJd6PxypscLYYOrApEWQTUlh2YItTkcSrZo'
+        '/O9d9zZFnN1fUb9dz3GyZPjnoTVlFtD70d31IexqeDNt3PsWkstxxjbR6Ow0pRJi92eh+TEDWI7u'
+        'dlVw7Kz0qfkOqv+WqEV2bZ2NsfqEYbRJFSsNMNXndNZmYjbP2tmohBVGfzH56yLhj4WsELqsFvaH'
+        's5c732b5KwUmMwujq/fUlmVCP4JAHJp+xcPZ8BxKAg97Y4PVw4XT4JGOdDkBe2YDUd9xEiL3nY3N'
+        '6pV94msjDqQgTYBo1ojsBxszcaLJi0U42xZW1Q8sAqGRF/Oijkd3wRVU39hyUSafauGLMvC4I+2v'
+        'mglHuytOu/8h8oj8LQ4u//9BXnuky4webd7+Y3tWisPi+MN/Z67Ebg9+etFht1Vlr6fAtSTiybYF'
+        'BPQCJaV4lftK9PF1WpiGjz4lnTX5tqrKvqaXvKq7zC/RwBGs/7zhVwzQBWPBA+hzyYjTTStFVD5A'
+        'YIi9mz8FojYinXaaGnTs+1J13vrbvAm2IxZLiZhzg3gHjVePRQl6VTrQsj7uvnQS/SKSJ19SWbv3'
+        'tdc/+OMorLdgPV62Gd3RJIdT9//ILADfWtMUASpXLJNLASpwG+QMY86VS8UfUOudUlFhHUAHJUq9'
+        'VSStqABMr99luM3qsmxpYUi+1Br+reM8RpCDJd1+Ulosxa+0a7TMu0pSldlXdeFJvvJqyf3Z3InD'
+        '1IHugjZTCbrRqPnD17xCY9F2Fu8VOuhSS3S/k37eJVcm1BE68MgEK0pyiAPUnRRNAzXRh3Zqs79f'
+        'oApl6vxOXiUmOP4aePEnlVszxxkYOyg+UUn9Zgt7oeD9RluBVsoPfovdP1qkyCCnkv1OX11vvjce'
+        'ElHK8hCI842UlefpWv02GXbWN54zS0eY820IblmhtBeLlHeZusjYVyH9QSsjYbtSLBWx74DUBqJa'
+        'cixC0wxOpVyBv97qGnsTsXzwjlVVKpECvzUG3gUib0yXt7+M7TTwJr1ow0j5VTPbMqN+jAdJqx3a'
+        '7PTwEZu6q3mdJzgV5Sd+BfxVVzw7tUL/nQJjyX/R2CQrmv1QA8jNcAmYEynjCRf3ZjNxAjE11TDj'
+        'j/awXbD+QxFRjqgOM0LTlAxsDNztRD0BWpXtSaoqvBc2JrAf5A35FdHDotWjmAjxsjiWHWnFnRm1'
+        'RX2v6TJ98xvEXO9xtG/KfiMjcidnSSbV8PdykGEHwhu9m5XlAgU3HcoQUcR0HAf7TesvvufQa6an'
+        'UIOKtwJsjYoSiOy/UpaeAYtGzk+xyiJ65v2sM5TPGetINP/Zi2BOUN20EIIG9RewpM8A2VgYY6uP'
+        '/VtZGQ9HYRsMPs1Wk96aJHDhx3SRdAwtgcNa4dmLWY52tr8pdGfvqLX8+Mve13Elsef8AzS525va'
+        't/BdvGyZrjvFuCOVTJfpnS0OMnZvSIWXV5MqB7CHnzogvZBNEuroROJABPaD6v6ox7X+ukAZieRx'
+        'qNVI/mTvyHgP9jxRLj/2rOFqk3RmcU0thZiUovsWP74cZQMwoeqXakyUxBty62XT3ZdVPeRdPaho'
+        'Bxk+Ov3ma1YmgbLfvEQ6/SKuAJu9BWgOPDYGtsA/bHYhoX1r4Cu2H0UsOLIq25EH2CjePLRanNnd'
+        'SGg92qd6W8bQuvn8zgZWNpL+FDe36XFALV5zw0wwoWIi/upVc/uCgnqBIvOacXHTzc/wey3iTvE+'
+        '6iDVb90xqLdyke1mVERKVigGaYjrLAhtM44d4P0tqLbZGPRd9Nrw51LSSS4SYn3gd+tTjAL0Y0sm'
+        'Lb/wR8opq1cMdmZ6aqKABNwrIO+x6TYT6Hc5xOzAsY2sZ8tNa7lp6t5WRTZ3Wc69HKmYWjGCJsCx'
+        'XtTKGsDjdrWwB4pQEDmBaGt42ftbpxpxYvk3HFAHGLpxYd7sK1IopQrqptviYLVwzum/CjfK0LvW'
+        'mIXQnN/4bAKcAvx80XBiDeEYfiagSNYEV55zKCj6AbhdVg6+RPBivqDaWB30szduobtlZAtjFFpz'
+        'bFOYlOLHxszzIFkJj9RxC8wo1M5HO3XaC3cJYjY2HxZNQs6hF727T5naFK+vkljwt2OVIKbiiA0J'
+        'y1ohD6F5bCiZZSynTBLgbGle6rsKq2Z5C3fFEUtS72Ey7gccItnpQdFw70vC8dP6rqr/oyNOJybD'
+        'AiHNdUtF5K/lUFqB3vR/NkEAZZ9YQ2fWIaS7xGn+nAcweymWBrTGuHPi2k0Fi7mLFnsnjm9BJiDa'
+        '1vNUvdhphGAo7wKhd1zWVKl6BStb+i/R5FMbVzOg6huAL8UYnkL2rHS3x3skurcb0Of805eoo5en'
+        'ScM3/VtR6GBRYlVJyZa4Qr3AV5UldQu7tVeZJ/BLPgmI7DBvFBIwlUZzfG7uW73ulRVV1kwURkCW'
+        'URNslSH3e3cVJABB/xoyu1kKmnEcagl8AAlyROJCa1BFe2/+rp4vtVCXbgZqM9KiUO4PVZ0tV2ja'
+        'jurR971TZM7BoFVJ3hJPluO5MC2Dj3BOpvXeQo3JgJNrZ9y42LvfBxtmEXqd8PVwGkMgc09tAnv/'
+        'XGBhbIaUfzV2IBg44gF0IvgrSS634m+ry/yJNrjiRI3AdUmvX4kB42FLEca5TAxx+DdSoNPBeBMj'
+        'CDKiA+HLnjEX8AUukFzhphko630CUTkpFN07SQjrLo3z/KK7c+TyNgjXxcOBkto0E9hTITGZJD2m'
+        '61Yg+5Lh6X8YzV06heLbcbEMuE9DWdrO6o32b0fDwEclV7IMpsl9+tI64LGxBkSN1bsmtKIXJXyk'
+        'KJFx5SFTGmm0fCDkI7t/ZBQQLErsaf7yw1knMDcS+rvgLQ4oC6zrOV9gmfyYck2GLDMWOjbkvVCC'
+        'Hr52GqEB11UN86+/d5DamShgsQUcSCk8tMPouXKDN1T1ZfO4KmalghiWV3eZZgxiarMd7tFRzYyL'
+        '4qELlguFwDPIsadmNBM650/8fQGncJc1A8r/Ok5iKEduoRtVN+4glk4mmvnOpbpqVErMewQ3Riew'
+        'Fu2yAFTKJNu+loS7L9zYYf+lOCGqqxaHl4IDy2SR2jsZrFQARri3FKCgilfdYEByC1QtO2Gy1gFJ'
+        'HQvFPFZCXJQzjxy4jdjY0ph2Fn2Jzwg5GY659cbahzc92+30REGD1kcyZfrlOgEtnD8fSJsubQVd'
+        '1HUXH747nv74d9JxgL6HzYukXW41aRsG/fDlWBYNX1pXVgRKl0FEluIgRn8v/Cy0s71AvuJBh2sb'
+        '9kFkXchcAG6bKsRl92d0iYOGD69YjsSetqkU+gkXWN0hPjEKJJR5EqTqlOs8w2QFAUSzbMjpGmoM'
+        'T8+LcQXePb3YEjVgIsAaDMgGXNpjWB6+UB4A880E72rf8JXdcNYp/iKIDHPxAV91X/BAzEIO9pZF'
+        'gHPXGAx2jr3zafX0H6MSmMY5WpdjiPsTerjibCG5J5vNyY+xqspEnEp6AdqmNH8TpjINeMuemFIg'
+        'VE5vX6IDSKWzOyQ3ZZDIGyAEFxh97LiX57cGmkk6UQJzZgkRfbSB/61mLvsrj+6+dSotJPqTd0sr'
+        'eQoMyT1ylrpYl28LPcyDeincLXWOTOmQP3mjIAwfMm6+y3FhcBdH+Fp6+am00h9yZr3kiwdiXDyf'
+        'NtOx0q9vKKOlgFE/FsL8j+2BZ3gT7vgL9ctMGVoKmRPDm2ref9bVKevV89ENoczf2OAtTtElfnns'
+        'xPHyJMMZLXpA/iLw9HygTz2TFdYPs2lafdN5vR+vtVvsq4/Usoma37PSR5GbQPeGlQotIo6PiR4M'
+        'aizq2FvN2YgfOTovzEfRANupphSlP2i+39YnBLUx3KiU4G3GYAr8ztG6h2rA50/UytcBV948WDEB'
+        'tWmLs8THSfBwdeMyU4LfOtVSaBR27d1mPbytPoB/HdNj9nU9PYLhTnUBr7aZYtGLWqYpXyNIx5d+'
+        'zS0anOhTULO8z+FwkdAXDfLePkYYoXZPZbiIwFo1EcT6IIlRMK4/8sAFkYrFK7Y+cYYA7FAoizsU'
+        'NZM6mzCUQeonCDXzCrJAjithKrwVEaRYcJzZ2kaJeng5bUVR1KOr1MdZBcIGSkIOXMYe+2jJiK4k'
+        'IO+XcjL/HtglC6mFaJ0WScjSLMkFPPxI7Z7/mNmmPsBOCPNL6++zuQWJshCAIpNJmAO7CypEAZaP'
+        'VPIIooXjbUjyV9dg4khOk60M+sLvwEYeGCTegGrcNZ7iOWvqINwd5wo/haweMe3BkFcpC0XnoDT1'
+        'km6PqI5kcN/0/gQAKUfAUK+9Ei1KbICFVvs5QBdBYv/6LIF7+6ZgxqtxMW0P2QFzh/eEDiyGTTNJ'
+        'movM9po0hLH2k2tAMs42Ed9HpndiOjlGDDwX07CF6pHZ0GeL3J71nryfWbL9H4cYNEexXSEW/qcv'
+        'uppwD5yN8TKhon3ShKlQQxd4bHjzd2zgVVymU+guIWxwfgL/OyzI4pzNr3bjeFEktcnkAW8J3OZ6'
+        'MjiSEl2dUKLjhouYhoJgFhy9XltJ7uXp5lgWtugUKR7YltGOmTiXnhOgvfxzsGrfiOCS3lSsqYjt'
+        'wgK+6/fqitxmrjJTA4zDMGHimvSUzi481Kwx2KIdvoLqXHfR8g+nwF70Rlrxt4c6l0GMjNp/s0qu'
+        'nMUNXXGewBjRfGZxIGZJLxAOhOy/drltDCOQF3QB2KmGJinRqV1PbRnU3JyWY/UjuOOQTzOhKoDp'
+        'D3FyCgmoDA8XPeyfcVd0rZU4DBYyqW55geNvUFkp00gKbw1YryOhyhAZnnO0AzDOvJVNKCqxtlP6'
+        'dx//Uks4X1f71JnkicJfC7NZ8JTFeTTiStSzOnOk3Hc7nUYRBZGRRnpruzl7Pv2CpOSz8MJm4v4t'
+        'jimSkK1ibYS504fviL4AC1Cmb/uwGqufbw+wphXloDN/+BU2ZfulmDXtVnJ3Rn5PexErn1DiAEDf'
+        'YMXZThnqeuvTii0C/bBVm2jBJzP5HnPakkF9vz+rYu15Zs6hCLft1pQjnubJ2Y4KqIyCA9QxKEjl'
+        'YhYgPFfqPlmAV7/VTK7iCyfxRJGNUwiRZyZmBB1BEnaNU6IwTyAOBZPsx3JyILPTXUiTXe8hkb2K'
+        '2DunlFtkUeBQhx3mww1m+uNkUZ8TuLIKXVekFOsGwr2ZYIRGQLOoXK677c7NkT2UzLQ3915Msem7'
+        '7p3ZH4O11KPihignqCHmbi4/iV189ZBae3+3mbkNKHABObxHIpaayLAZ9uv/+oTNFVPtpK5GH9Hb'
+        'BHHGTUFuh3zt3nJbIwSa+uq7GVzji8qh3OLS7fHseUK5ETO/oc4hRfrg3wJoioZh29E0IBztVrZ5'
+        'Zvy/mxPFBEj2+v5YOAL6K8bydldSLCVX3Wt0PVHNyoS4kKnXrZmSa45+8fM0F/bCSj9jWVGIlqSQ'
+        'KDDV+CX75aeUFqGfo4doWjzwx2RtsdELZRx+E9lpUBJLbTjyAQaocIB//svA/0uLTAHggJEECHzv'
+        'nPrXstXfWLyq88AtEneGY5pj5KC3wX/5JzKLghNKLYjQ+W1jGrJgd65H8v25Pq+Q5ylVX3t0oSZH'
+        'l17k2En2tHZnmtvA6FA7wD3mMwb0Lrk3ffAAAbtMDWB1pq3YjLdANt8OBv8CzJS1DVEa+7KgeEJP'
+        'IHQxWfZLEUphzZpFD6gwgXnokg3ee4rT/r6+xTajzQDBFCq6RxA9UPmqJmPiEkUOol3i9TXcqf7T'
+        'Fa2r9ui9YiYAiQnl8r6KnQc8G1MtUxMNZK1hiUkIx/d98t6x8pdZ8u7vA1ej+rG6/DATuRl89bsU'
+        'efmBip0My2pruWYBoAbjyC9U4uLO2uU1VSvQQw8PjvhwPBK6hcxXBIi/S17uZeeP04ysI2Uqgfpq'
+        'G3R43xxRP8C7xc83DynVOcTccOChEsmjo38vKAO7fywjCJohMIJoTK9tGlOxH05dJDIPvGE6at3h'
+        'MRLFgf0gDilmFi/MPplkOI2XkH6JiTlAzEvN8qMzBl/XHPCvvMBRnKZxquGAD88ZEjis+CEPXq3X'
+        'ikiXa7eua/fbJZx1PMEL9XxcFiAYupQQfZNGaZGxdQanQ/yINaCTQwjSDreeG++Wt3rx95qTHvxL'
+        '1TADl4TocdWrDKASFbQeVtIUd0NfRWNJ6wGwXcGhPEQkPSsMWxpPqDHivkT2ZT+dcht4xn6vyTz+'
+        'WX3U5ZZvrdO97Olpv5/zR/1s9xqycCtyTlTb8NtsVtfjZtpK2QelKJhdhMmRBsHcwn8TGXOPotKs'
+        'Bgr69UDI8kWdIm5CCNOwStugLLUVGz3ef6N2s+qND4Ay/qixXhxLjJqZhpVXFkO3iRjCVUOUnv2P'
+        'VFd/5MOci3A4u3p5c50pOk7/khxERXN7b3RAO8z8iVR5xUioZrujBmBvdob/9Tjv8TWMiJnutIe4'
+        'hX45cMXgJ69jJwRYBiwXYyb71dNMsYjLGsiHXH1UTdOQOe00I3Puw4krG6/s2hIBxf0o7uZW6Hyn'
+        'G2QMaV7kh3sO80fWE9ryHPeP7fJhHC3+bPVZKxmnGQKzDZS4qNe3lwUH9Sa6bHCz1zrb7f0kZt9p'
+        '117UBxTjYm2C/qekV9vHHAWpJ1UbZ6gj/Tvcz/UEaz3NgCokuuGO9OLXjKeaFmwV6hesYKhsXPj6'
+        'Swp3RGtDBY0y1NyuqVEu10rcA7rJP32Ms6Zjd9VwLcjzhRKqTjknjSzlwDZz4EyVD5lLCfBTjomh'
+        'GujBj90YGUikgUwB4F1c2r2eK5nVMmEVij9yOnoPV2RJVhG3Kh2RcN555ds0E5KAJfgApBGY68L1'
+        'TS3uwKYJ6KxL+epjdRKd8L1vSYKpx5KXBIcPJv4u4IosUBBj3FjiRPGpmWL1Ezcf+5xyYylpZ66k'
+        'yCw90RbALTtVgHt17SMpAwDRVkn3IP/jvlp3zPpx9L+z525sdCXPuzu5XbNs1nlp3K+yGlT0a7ML'
+        'wZ25YrlCI3w/uIPL9dnYepaVXW+B3th9SI7og9CRzloXT7sdcy982rBRkNFvjNTL8qHt8f2qt+l6'
+        'czNYGZwh6SKR6jB05F+DjYEB37Z6YYSOO1y4LtAq1UPSFba+To2+mGb6iS01u4TZPg2TsW6Iy4VP'
+        'B0FLJQl3NcftYDqyCKj5CDS0Q/1GN12/bAZrQE6yduyNXiVjFiO6Yf7fyocg3Y95zQIwvx18rzH6'
+        'nclnR7jb6Ae1mKsxeQas2QYdi3ZZJvoGoaAd5Vy6LR5BLGY/DxIQZD32tbpDNwWDy5PcNtDnJQPb'
+        'xttgjSJjXQqYVWbVgwhW5UFyoROpn78k+92XEqvSs1Vz3FBD/h4sE78TOEjP7IOqirMykT35pH3f'
+        '1TjE/4fH+jO7wKvzMkuhU65sSI664iM6a9d0T06dXZo/OySa3l16kQ3G3XU5Uk4nMxN2tjDehuPO'
+        'DG1C42AqTU7uTKSerASl+yrx7g3WxP1RiWLAiizgZzSkYpy/INv4Mr7RkI6yTFfixU+eunT5swIy'
+        'qtYRkF1gDQdaOm7pqXbEPv9zkhZ/FjaekyAVN9cLNRYHLa7odQG7VqnYUqytVeAltEzOekkdYjB/'
+        '+EiKEVz0Keg+OS6mQN15A4IMx6qNgAo+0BFZvkvdl5HiytnWUGVlqz0yLnJElQk/DofVIkOOPqXX'
+        'pla04JW82Mom+OZKUNkypLzs+VxhYk8AxsSGiYe8X8ELc9Q+Ltr3LekXZ7sHB80XXS+U9M1o3yTq'
+        'MbFIbhNe3Ig+akBXbtrzMcrJr8K2mUGMXLRJqyl6oAI+ch1/QBKQxM757f1AdF5ViW0DbiUZWgWx'
+        'w6zo8xABXyalop2htAGDF84bPBQNzIBvJm7FADYcyhd9/95JnWMe2g5TRtvuibrq1HG4fDCraTmk'
+        'vI9LC4Cujf6kywPWj3PElnVnEM6HsGZUrBUWj7ygXhBi4eM1nz3HCXQtu/preMLNGPdnYuD67gA/'
+        'Ncsa7gERKAjuDJjt67cqNigSRM3vlNNmgxy4BMahFIWamXb3U/o3eg8cNP8/tMNFvaRxI59fbn00'
+        'gI/viXNGOXn5zmNco6S+e5S13EWhhem6HBHYHg/FcoPcg+N1jpdOhxprrgV0K1MZ/AcxzLQMqvXN'
+        '+mzGgx1hKedIb95NVHOekgslCR9kQRuwgEdNRoYx5LmAF8T/5vfo6onuJaUAbR874xQhcq7/Bfto'
+        'gS/yJKNLlVa7BoiYarpw94ybwluv5Lp8H2slOzlK2izSUiagF+J5ANMWbxRZc/z41XpnjTyAErCI'
+        'FUjm4Qww/v3thOA983/FRzibMxtwMTttzxW5mRfXPBum+5QBYDHXsdF7mwwa15jh/bSKZHyUbp1x'
+        '2JGI0uuY7gSqyj0SjnNcscvpAWqaEYsUGF1GaUobXODh0OelS/M1Da3C/R95KG46QAA09vZ3OoYV'
+        '3lwTDMP6UXTovYZO3R8DJO4VKY9Faixz58PbMPowEVIrzKmRJOUrzIKkZVPS6YO/1+DBlcSzO+FO'
+        'WAekLXzFhAcpxVqrD5eMx5t/E5Gdo0qtmT5VEP+nxQ6ldlc0mQGE5MRT4OgMWPPs9+gBAFNJcdjx'
+        'NklZwlwsNj7Cxdx62+1PIIanwLTTBYtG3pykMFwsmoGZ34Jsj3QA+nJ84Y5S/bkvkqUX3k0jrcAg'
+        'rzApE37OvTyCtNNJbuFWLKtnqPcxtoXFnyNmppJ8Dfb8XxSLrRWmQkqHsoIOcJSc4L2OosEmrU9C'
+        'xTYTB3yAID3+wDvgZ2iBOXbrgAmC8IZW7dXovyazztYmSe5t8CSeut22hk5xlTbUKTn1zD5BwDpL'
+        'bgbwxFjDo2rSZDDy5iO11RmbcewuTVHARqs2lWlEhLMZv+C9YEqmvuz28z4Ur1lAMoHLzqKXentI'
+        '0A6vlPEQjO5B7lFBnLTNAETdOnRd0XNvz1AfQxMA8UqwsZJpYwUxzw8a8QNYgdkj40wmyTjXYCwS'
+        'nPJS7vpMCMulAEkMqVAkSkWudKQNmUtc4Byb+kC/xcNx4+ttOQj6V+uj5F7Cw78WrGDGcixkVN5Y'
+        'ouVPlig/PseyKvFa/ePJ7E6/wOHR1zFXESK8H0xX9/PTjfZJ0ND0fneF++dEoMtFnIr6W8B76AxM'
+        'Q9nRO581PGixyLh4flYUL+tY/XBN9s/3YxBWaMs36OtfDjGNvAmpqsK76zuI4yEIyoUfUqqx14ah'
+        '55zM5ECKw33KDV6nG0Yrxj6+QKJtfrU0Qn2Oxku5YoamMDEyxOv0/JLkkYxv7aZK0LKjk+cv3t0b'
+        'OJSuaoMlfd08t6/o/YyGZQK9AFS5lZZ8lecjZNhdGflze+SFIa6T6EFY4pfNOO2QRFaoPNsYl3+8'
+        'nV0aEg0dy1pi4blPu3Uj2xDl6lVvPNHzfXD+FNxlWQorQhxno9cxWXlNgs5QuzteJHW75Du1SPsw'
+        '1Ex1+y6hP5lCuXhBRkE3FALtX5k5mXHVksDGY/lKq31UYA1GRUijmwoiPNHIs0xZKA52a9YUfAzo'
+        'L0B6zljqzFxExPLE94OSKGL9AeiNru6ZTzVrMxzRohASNQm86VoWs4hmjKJIz/jbWz0H5UzGSpdK'
+        'fvWzIH+tBqf1BI+rU7KZhdMwdyfsndXjUUiwe3Pe9L3qiL0DhBxSESfvTwW0mClcsAHI1jT5ZmU4'
+        'FMrIxYo/9C7PV7xcLc0faFpAWNuLepC+IkG7z8lYIGT6vHIjxmQV4wpbK0WMjPhX1kaiK7W+Qxv7'
+        'sowsyVZcFWM6Jw4R1IdghBVaZmjeCWcjPxNlHNkEHg5UuNLU0jLqAqnVxHSzYiq6vjP1jS7LIgSd'
+        'Bnis/g/7nE1IMENET0OqyBiPMEFrVefTGhiZ5Vqc1c9Rz3yVYY6sK1emE4nLGmDtYeY0ptMl8Ibp'
+        'cO7gLDfqZCRVXZ3cWKZyr5gvsj+U/fCPjjDlH5CESe2RGKsOA++VI+VJx7xcRVTEj4jTBSf5xflY'
+        'hgsGGTYNtclWFbgDojZdk3ZZPYB8Pu53nIa2H1J2bLTkpzPNBIfpKm3jPY+d+CpSfspxI4IB85cD'
+        'hui4kQG90Gp9sxBtCqeHZh9aY5JBHw/wZIaOOyG/tUcvb9cnAoZgZsbTsYj2CItMu+Q/x2cXgLLC'
+        'ybC4tZCDYIsrYUDjQ/uWc/Ib8QltB0ZpAqoJ/5eL6PoZbddPargOsQS84z0ZgcxZlMI0EAXfDf0n'
+        '128CsowPE2+J2j6z3BSIEAbKoMeLugvoDyu5KAKdLbGrwf55h9aHxm//u3L+KIH/JQrLKM4+ve09'
+        'mCdtt9wxUMrlOdPJeSn92SEuteks7rLCwo5E8lxygq6OXpPL2IE3CkHshd+XHcUXzFX2YhNNByTM'
+        '/w+pdOZ1R4zQgOJX8/o9qjvtNVAj1rmKdlcvk3GtoevzrvS9RdAHBdGwVFkwJmWGaEYkQvhitin1'
+        'h/va2cfyHMaoORBSfNhSxdrCIX5JDsCMfdiZjvhLjipceYXGEjIhBp70WGOffyrPeLDQ5Byc/AJW'
+        'mUU3y08MpIt3ycSFRfk0IH4QDiJl0xj4fd+50tgw8C33J00dlz3COg8lEpMEc9d9n9LY7tPqxsAz'
+        'XTXqQTp6qcm2LnyyO5++Sag3Afp97rI03xpkbs8a5A7vLAj+LMU9dcG92hB6iZxtoSe2MxJ6w9BK'
+        'qUlngixBwkWwkq7r2qp3H2zp/ybSiBS0OXk77YaqlQbE2FYqwF+/tO/q8qz5Ci68a59Z4UFY5p8c'
+        'eGdyXmcrwF1gAiMI+uHwx9iVYMAszcq4v7OLw0jTr+tAUe4D2HLppslxiWMFCftLzoSE4k6V+avr'
+        'qGp+MPdSifGn9lSxQMkxqhClrCiCkWaWR/K0F6E+zXP4xHJpLNQqyuq3QhVTu6fpv0aJqZ+nqyMl'
+        'wrfDRzQuo/JXLTcQaFvsY+RYvztiCIp/SbU27O/cslU4goyuwE1AiCCiCsTef3PXXmGv29k4nCqy'
+        '0y0T3oLUEK79kTR92hcE4K5IB7MMoFCcoSm55Ejm053BliBdnU2Kq364dawVil2CMsynsjOpujzF'
+        '52yJju1G048kqJNrxnKger8N/njrNDUyLjjs7I4+v5YlPfqt3hbTaHkdlxMq+pxeR5+rO4O1T0BF'
+        'U+olV8wY9Sg5clokTN6ldosEuuezYuRkN2oksz7jQFNvdEuIBGKWacEcWfAnh0hM+vsBX00Q7r/q'
+        'bYuqxPEt6/xa2ZMJIYI3p690VEVOJr0ut1OKJKxN6j+8fIavTI1iJettHTdlYhVvr/Yn2mUQRVp2'
+        'dQT7/DZC66O2LknrAg5WaTIQIOH/4Pdc+/JoWNz1SN7S9ucghRy02Du2JcFF+FvylCA3ISmRY/iC'
+        'Wel1llBqrGLTARPLWpQ0X/FZ++czYzCH1bpHfzLH1ELQlnXOrc3bm/yMVT7z4ogti73y7rGI+Y55'
+        '1a9HOCSddv/C12QpV/LF3Fpn2L4SdII3cO/1W49tnRYWcFlIxVcXKrVOMcEf8nRimaQCpOOY5aJp'
+        'jQ0dUmRSbDjKQISoEI3GoHzLKCaTLade89x8w++7OvGWkucUCNjf9y7qG7AcpXKaH1w1v2y2lB7y'
+        'vdar6XuOuDHSa4GfOPDPSNWCuA0oM681T2pBkJ+/fsc8ef0ZvnZIMpjqXXX//eRYswsY3QfH1VXW'
+        '1wQG3/utfglPeqI45+JTyZLcju4sVteUHnTJWo8sA/ARB3j5qKEVEkkzFCSuJLpRavWnLytAkSJH'
+        'TaV6DyjGI6C3Vpn70jsqEox87McrAKJISFgdqxQBJM+ZMK5/lg0AMQ1Vddd0HHFKciAJ0dlxay22'
+        'vla3VFdYaFSQGTu4NpJ7gK3t/P22Kv5+sbjlJUSZA3az/7Bn8RhoCWPe+Y6DRZi1ZPA2/DFecPtj'
+        'CTRyyucIq/evbKp63Ma+bftlbjYc6DccBhqHzaFGBXZbnm2T5dj+FFMNEE3wBX87TGX0+dRD9+32'
+        'LUBxhCYnZuac8dpNSw54TjL/VgDo1e0U67fTadbY4r7wo501ynllPZhZ0rXEcJcBpjyPgLFokza2'
+        'TC2wGeG6a7hssKxRf6oqbbmI04VGd1Zbnxe5emLse6GmvIy8MnXe0az5dGeOgr1dftBN5gazNXpq'
+        '5sb8vALKnTRQ0dgPcS4ANlvD01cIFrBgW3OrpJxAxcVYYDLctG0DR5/P9Vb2j6GpSS5tcCYBpjiz'
+        'HJGXb5T8BPrpL7oBlVpxwltxMO5cABJ7QEUob8aqkYY2XcseNoAPUhutgmMgQcNPzs5cRR1LXV+n'
+        'xdiKJDidTUPcLoPEe7Tby8r0BI+Wj/v1rpkwePtkBR8M511HdmZQvz2cEPjvro9ly9DyK8YUgMta'
+        '+m8PS6D2gaZD5RCNI6dezcMrSXJMKFuV4elSxZLvB1jYOob+IwZDodyCK6b4/aK9vDF64MCuRxXU'
+        'e19vfuBi9KkqA7+Z1U48ZIpJca3TlCE9jIh/EronFkblqn2d45VRTwtfG94qKcvlEgVqhnPIkW7W'
+        '/wmoNXfTRxRCi79bfEhcgjVSThS+9tRFjlKVG7WXJCNXkg4akSU+vHkGRTHDlg2LWw16m9hiBda6'
+        'Fn2D0eYKXpuDG3OgeX5PL60JHoBt2a4i28pSg2t8ZevPlHrpQibWGXawgxs4Dwmi3k2UR2xdVCOc'
+        'HK2lkptGbKy4sPx/2yxR8v1Qbp1u3DidxzEgj1wuhe1quCBto0AUl0vc30nkdbNRvX4mcYX5LSQ/'
+        'MO14Frcf9bfd9sxwvj67kogX1Qbl9MfYzgoATOw+8q/PXHDRYwBbNQv5xCq4aNiD2LclhYvrwZ2R'
+        'DEx76EmANebAJwGX2+cgnIfABlSiXR/W7BSdsEIq8Q83MJ33hE0LhMg2PmExQ7SwtilXetF7Iuxp'
+        'EW8bBCdqknZcj6HpA4LBvRKdSSfWI5THgetOrUaoos7KQRmm1fYtsf7WSD8VisV4G10auZnc3/6G'
+        'WZhOEA/jqx7lnMkimhfml46Y7b9xXci7sOLohJFZF35xmX1jCvA88vUhVxMXzbztr4m2oGvyC1sS'
+        'PdrjAdIqKdAq9UmcL+3mXZUX8ntHZuV/W0LBe0d7ay4SPHL/KLRkKyL78MUZHbai58aiIJvTqeDC'
+        'DrksOWpx0t8yRb2+ICX9nk2rMgXz5egZGAdvn+vONnK0uB+9LwOHGfLdMZVPTG9MlI1iIBnDoPUU'
+        'c5aM2yK42ak3WJH2UoA61VzhPct7NFDHLHhTmsc3WmqT/T9F1KCjV8s6vqhlLPxx1e6t3dTI0an9'
+        '1lj+e1A9rRFwP5zsnJ3+CoW2hpgGhXzezfNZ2fdBzaOB3HlsQ29oLJ61uhlOz8+62C7MR+xEjpmR'
+        'IOgdZydCZkI9k74ISGHE8FSlr9xEBQR/wc/+V5oO2m6imsiyLPV+w48rWHd1870QIC91bFI9o0NU'
+        'TPHPESPgX8n+NEDEYENiHmy39qWZQP51ynPtO9zP8WBJZAHCQ5+ItbHRiuolzmHHykahK3iLbYkm'
+        '33n+4kCEjX8SivQnQ++YAvnP1NLdQqoAFzMHMbvVXkpi/S95QN55XqUJ4/RoAIX1pDMV+6xp6FIm'
+        'qNLlzSBMzBskExVqpCYLwux5WCIEicKZIK3w99tvgN+A+/Y6dCRNuarYpfGAtRjVRLkbz9AuV+Cz'
+        'Hf9c0hI2KQagW/ug18Pv5s4AtrovCEFjqHhFsMvxDXfPN3uWF+2QUNPGT79PnDUrxkyqltLRC55p'
+        'fz2u6agKQSz5Ed2zJ7Yr1es6HURc39jiv+GL0FOIpVzIj0+CgrTVMyc6+473HEwS5Arw5RZcdUwd'
+        'cjHPLi0M5EdWxQC/5vMMbKMAqsZws9Z0bRyaTxHjKau5MJIKRhv3FRSsM3EbLOl7IUAPm8Fkktgl'
+        '1OzFXsvBjpsriT4RQSShpO4ZugzHuK8s/ioyI7PY6VGOvB9EjhxcfrF0VwUPrzQ0TPt2ApUFm8Kb'
+        'BI3yANVX39nFwW/F2eVaQI022Lwi69/xySOBQNaSAdVS0l8OQBaiUiTlSt0dPmCOi9OJmvoWmKzV'
+        's2R8Zh1bUHJyvHjoLuuOjNYRhuQBp2uSt7iCJZGI7zwZiS2vu44OQmntYhUILk14So3m/j3Jt2nN'
+        'x3YwpookCJdC/IKCpuXx+BRadI24MJtz8ipQgSK9jljClgT/hk3TUSlulgzRaA0zALpP2ul/GXiD'
+        'hlUzvP37a4AYvcvZGR3AaQ5qRIfwlW1oNUtKnKbMu/aHxa5yJZG+exYCObuHMaKRXj2Qb2jBV5qd'
+        '3gBKAc2iWX/WL00U+t5awHgB+Yv7HftCYL3JtRwZxiArc/u/SV43Olb1+0MfhbSxhn08zD9ycf86'
+        'HOtCJDaJE/ehmxJ/XR5Jp8V1iT25Q5Lb6ZAynWo2u+O4L+6l7k3XtnHb6vKyVnIwH1e0taY8PIhB'
+        'BHjipQyRg0zWrcirARo+CW12eAkLW9LTR5yuD990SYEEzEhHGSgaqBWWcrEO+wwslnKNfYFIscbm'
+        'kmnZ62ALWwU6TAaknNNM8bNEX1+1Tv6FhP4EBrAbJz7GsFoc8q0AnbF6Mxvl79/zJxPoprxrhDu5'
+        'Fg4oYvIBhPlhR4gX3u5M4Pz6KBH6yTrabKzBTz3Z1XLVAFY4dX1x2zfJBwuJ6ih2oq1hxcRQVRsZ'
+        'q4F68v6EqPLqNEbJ6gVeFJ1RadBU6O92EgmgwMJIJ5DcXwU64EBy3uY4rjsXbQYWl0QRwbZthu3p'
+        'v0BkxuNvBg+GifmmiosH6/iHuk1dxg3u2gzeNe4lGxJf7tfaFejkONm+vF6GNKknVghGGkDnMmre'
+        'EznhfAGEZI/Y0IOnhWS2J7e+ISK1vDC2oQNXMGX/3UT9fVcvlHnTbS6kIjl413MmOxKpF8DRizJM'
+        'rgN/tSDhN1a45hEjkEkgtxfOxN/Ve0lZ1JXXGQ+dTR/qg0UdjA7y5woHLgJqJPMkKBR0MFP4LlZM'
+        'JOGB6EFluuhDW8kI3nQFSY/5aCqSySsUWxvGbfK6spXcCveJ7LAihO/uSW5oCrnWh8neIQNZAGGT'
+        'ZEUn3kgCu3rdolJO61OOB/fOdwcNkcmUCiZ58a/XbaAyhrbJj35YsV5JB/VPf/0Ps97F0EPP5LJd'
+        'UPZiyB0Qo+nPxFgq1zOQAVtOg56pBnPl+dB0cYbGzWFBASrXqVZVubgxCmLL0vWNkh5dy+liKXjF'
+        '7jBzxotSRqHrtGzW4M2qNJKmwcTwH9j00t3dDcjg3PCGhxU3q6aWC021/sGFlSisG0UnG5uwufLE'
+        'iH/vZBkxKOgfskvXur+Cm9lMnuIl+cjoNDUAXcQFQlYnwKLoTfbfwWaHJ4IBbZ0IS8sYXcyivinE'
+        'sUbyVHnR4R3y/2IuOFC61Gy9+26zdOGYNPLKZm5QiSRT1uvCK+BArhdLy2Ha1WFpZLCiCTCbaVJt'
+        'R2M9RcPi4TaYiHL2IPpzzcSJBTfXOf4oyo7eIMGqrSPKqVJ3Gw2t74xJOyCNndLr0jGrglMxYT2s'
+        'gI8N9YlOKeAH5nK/sKDlxbntEUbkNOr7s8D27K57zqxiATYfMGihzewB4vkUbZEjX6cinNkNrPy1'
+        'EhWabzOAxnI2RRMQOrhAFbkjkWjcy6MYqfPw/FmgN1L5ww8BJqzQmaqt/W6ntXm9y7fjK+CNzLeg'
+        'oLamcQAL2gWZYkshonOrWrLVU3CcZNwoOrSoTB6vNZi74PuUoqqpbAK3HH5vZuHmeFAX1XwWWTNK'
+        'pbo6RoHhirWGZTavwrNg4Yuk/VzYrb54hocaogsGSAdLehEBjjAdo8zEiMiCojW2Mvs9ewQDc9JY'
+        'qVBiAacy9CeSHrMEie7KcUg8Bf3B8/FIoX37klFLdTrzejFk31Q1lWrZwhsIMguVf9WVnbD9NX4t'
+        'CDUPQGvyMcip5QJQyPdHTDJJ2/Dsrzk0hbe5Oj99u6gYzxt5spzXBcwX+Yz84pMe5Tj8M/GhDAka'
+        'DX+wIldirLAKNowVt82yh+F3Cp2zPCnsnML8VZm+uvR+TG1zfvHO1dCgS84U6e2fen8aUi50MuOA'
+        'g7aIM9F4X6QvxVGsLvvXzh3/WK34mssxiAN9xQ2DxCzc6xNw2AsAIq7XqfZcIG2D4PFYpjA/PHoH'
+        'EH7TsLmqz5Wy0m8we4IsfdJ59qI8Q4L/dAeLQ1+JvIgvrJglTFu+FeVdtTS0AndJdK0Sd8RxqDZn'
+        'cn3amp6Y+97HhS4KZOAK71ZVARxcyGEWnxQ0nePan+o9KeumWen5Lygiv0AZVzw+bJUeepfCxPss'
+        '4ksC8LJsDRNh6xKKy81vguZcaQ15VsjZ+W+7uXdjwH+rgChDHeVKhYu8C25I8KvWCtAxRf/Cokjj'
+        'RvC22yDxN+0iC96kuGyXDIM+xeOywOuV99ECygKmCZNeWDtswnNm6N6f5T+5AaptuxLyYseXAbnm'
+        'HngbMOtzw7YYJNW5g6iadVhRWGrcL86Nez2iuoBDHCREueFAluDM37cE2KP6Hfky+zmpsjMaB+T7'
+        'Lkf90JQ9phiMrA+Dg2oMcNzV+rMADJqyTjA3dTjuKCWgzn1HGXwbm/hrxP4L/drlbqCQFn96ugQK'
+        'WmgPP62ijNfy6CYTCYpRid5/ECk6gde+GV1lUeNKDQdk1a4+trB4kly2wOGh2ff8kaqLagmZa9/t'
+        'JkXT5Pi99TR3he1J2qqWynkvcWuoIn03znFVJWM5jAyNVOxqXaDLYNc3c8Jpns1mP4WwpZjxhf5L'
+        '0SZW8qcz5dv3Bc6HF+HRY6STQj93CwDCHQs6KjDa4LfoIK8tPgNmfvFsJSkOxvcaSACkOjnPEs00'
+        '2YdzPfGSUDgfhBk5VYDen3WvX5Txj7DXw9LjkZU3U1CJ+uGb9c0rUPxV/oUnq9D5YBivTuv7aLFd'
+        '7oIKR50ZihZOBqn3+u00KegKhYG5N0x4vLLb+ZPxS5i9W+KIs16hqdK1lkHOH9L/EzT1ZnClh0v3'
+        'Eo+TbVp+GPnXJ8ygynz8q6Yhs1dg4qOT+oNxnBGd9rrk8iUXWQCCsGg3ih3V7rhrP6oigZfTbP5J'
+        'uvZpcldyvVoREKpsqRdXfQ39+Zrqrby2iRewe/i0OdBPKGz77ksd0yCQbNHf81RiQT/8pk6FaG2Z'
+        '+M3iQOm+T9ac9SWpS31ZX0L1JlvovLHC9Y1qksT3gePnVaFk2dlyjFMw1d5Ew1UXUJHEEZjvShWk'
+        '0up0QioCycKgiOQdcRBJ0rZx6WMCdbUtQBEuSdcddQ1x8br+Y0u1BIIjszPtsKJga72qG1Q5lQky'
+        'CKZTyVMtRvzfvvWpuziSbWVCwAt3yx5PE/zzYyktUe6mDsCrlIMJyKG63e5NGYLqYVRDpBrEZ5jF'
+        'P5eXv4DwfF/n0TQcyExyhMmuZKfOagQjKSbw3DEmSAHMrKQxK5CsQKBjizqWMj6g5erwMdIRlQo0'
+        'BO0itlJ2HNSCyjrWWpLdJvRtZnRI+Dgl6EyTm50wBFEMW2qz0cPVFfItMT4RzayGOH2udm/2oKC6'
+        'kovNV0rOfe+byc3dbgkBQLaFrZk6VOhQ3nvHlIQYGHPHgaFRaIqsXlrLxADnqhsJ0lPcbs/P6v0P'
+        'WT/PHkoiMqFzGyP9bQRpYXKpT3r6M1Qvmrw6nY7ijrXZLsuWtQIxOJ3HCavUw6Rjt0bCxTAHpPhP'
+        'tNHYDA/SYhLG2Xa4OCo8fBAPTL70MGTEelw2uQeWdH3U9h3fh8ed569Ay8RmKPn5KJ3EUhlUgmYg'
+        'EVTtrA+IWxH9dCB2wiVTUjiahjD0fnoSrC16rhU8L35VDR7DI73JgKBSc3c24v/zHYj0FyVQrg4N'
+        'DnKDIVQuJ8wuUWvPtFQrzFsIEFqiCenMJ+bcpXGbVUv9QznnBRvuJnqb7NaMLyBJbvl5A4+w10XU'
+        'H9EgUxDmwlA7SnsRmUBJa27AEAwNds+CnEP5bpk/uph7jHLuSz5iwKMcAoOgED49b+MP/tb9ceJ/'
+        'WeJx4xL7DE6jPDhMUCpCOUm9zLzUw9xP5ynBqmAtxHI83EbtmuptxlGzQvzPTZYDyubOjXoAUdfp'
+        'xumFaateeFY4euMDY2kDE2FXTgms7pMA9IK5HolaRXHaACKt4C4J+5HmsPUJcEMSA708E25myeh4'
+        'TSKIfJytwPYvc7PPFBJT/ZWpxApSeR4dFJfTpQSbrBMasnk3G+7KE/0xtYG+SrV/8hCzA9uxNp0Q'
+        'SsU69dUs/RC0SIDEr3H5r4BAamsmzQvUnOEPa9W8v5GeaZdx0KOiqzL9SONrrRrk3Unuq6aOuTiu'
+        'sITCKkb/0ppkbeMVRgh6afUnxseGT+0J9J2ytLI5/HzdLsTLVEeIYuchcRx+Do0x3Ov3oSpQc+2d'
+        '2R5SOZ48X9nd0vcr6FuqMZpRUauLWXLciyfKoi1n2nvuHCrbIzmIPP6CjtxjCnxMksovfSg6ip5b'
+        'JA3Iy09GUvclD4vRbLoOWjQhk8NA6XfsUVb7CcxN3nCqyoMj+YFM/hoKPeQKeHr/AbYdVX7IK8Jx'
+        'LpQ5TuTrHmEFUXbaoFnpjx6S5VV94kX72A1SgS1vLLcq6Ine7N3RMz6zX/6GgOQuf31SG+KXaoo5'
+        'FJ93Gr/NfN8Gd0xSVez7NPuITuOJDhCdlVNlfABCXEcAfRhNT5IAW0s3Aa/kq8Vk8vgYEe3XabmL'
+        'tJv+oPBenN2+tu/69FO/0x3lxECFDlXKyKqPjLvPIrSv2UydTTXyDuvwt18Ow0I094EWWK4kezrM'
+        '8rFB+qlTszKiZZ0G4fZOlh85ZWjyGYHBj6VF8ZoHozEKERgS6T2UXRATPzRBwyDwqia/i30AjEdj'
+        'C1FtbzWKw5DrQqyjzzlgTMCr6f02YgXB4gDEyni74DkNjbQVxTadN34posq05USVo2w3g7B/pCz9'
+        'BsbJlqfoX7dEeN65Mk9yoxMmKJ0R8nP79Qe8is03AXNHAQNhzMw2/ej35LQlhSZhhdJCdUo6d54N'
+        '9BS/+EqVTM+DUBSw52fyGJVMx9OJ2Tl+4vTUVBDdvUUoP1P6wWjbAbk88h4n9cgNBjpCIOJq2Ser'
+        '5NUXJJCShE0xZJArSU3d9IVywSKRQCHZETTQ8WEYB1533MzWKIJn1ZCxhT3cqn6vl2UnuQAC5LY7'
+        'SCVG7WjDTekmqtZdrJr8KRQk2t4Fx5gsnPUXMpllzN/sSGj1thNHXTaMOhvSO1TFhWvtsYRxhf9U'
+        'heVwRt7E45jGTttj8f2+W/tJ4hW3YmMAU3+7Iy9wn+oqUCaLzZSHaSvkBfVHfUboVpHZG0XZtDUk'
+        'ddZGW9tGaJsAwmEJw3qZCLzLMTyBEGoEA5+edF1qjudosdszZBltXWmFh2/nibL+UsMwE+HXnPgL'
+        '/wh953N3E13nZVW0whxV4wXeJskPp3BlGsgqL33V6VhRV6WIrcbej6cOSiS+7+BkD2+sPwUKtX42'
+        'L4HLgVTWb1rDQECmOoBpZceZOdMBZAJvhrpWdAlbIt1hCGutO7mT2TYf8TLeY6/OpWnZZ6ltWu5n'
+        'exrjjq0tMNkRzeU/a6S/Mx7X6BuukvwGeaz9dqmMTPUuIwOzx12Hi9izv8KTcU0AZiI283uUyjGB'
+        'oIP4QkDj8KU4A8xSS3g+u6aEigfA3/eSaXywXJYWaYNvU6rcuCw2z0FcHzNtWy6H93FTZWE4D5ud'
+        'FAj7f2nKc0UUzEGkrZ0kXsaCTxZkwVQAccITxoUhOo+BMN0DVybYaXWDBJJuUG61KO40Ww7eW8Of'
+        'Ro5bBrennzmnpsAqQULWWw2BLmFniPE6UVEO/irZXsStFoaNbf5m2hiBHpxI8xJKOSQkJac4Iy5Z'
+        'FZ7fAw24LrwkkhHEzJYbivUNCUBdeFaaad2Tk6PIdar9ZYrFYbzGI0z9FcRYknp5YPNvaPbp6bHU'
+        'k89xNZV+QKj2UdwQqE80IclPSgO2H78vMHArKCC8Ncntp3HiKryRmpPTc4qKR/VYEIeI3pOtaxjz'
+        'mUs4Q2XrZH8hhjVEjE9kzyKNFzLtST7LGr1KaqgoXn5JAPwZL1UdmwQwtM/reCl9Rq55v9Pr4JVg'
+        'NULK475Ohs1uNypE0lE5VeBIOWae5EMyJ6syBbBSqlfK9kwtw5ggyP6inzwrn0esIK3E0oOex/iK'
+        'GfNfU94+mN8HqPynJGmdytVpO2991qNZclyX1mhds/BkkeZxW6P57byHmvlgW4z4Ott3V9DlN77+'
+        '2/71wvsvI4/+evWOO/96Yw19oN06Gg/qA9K/Kyrieq1baYHzstz86W8Qwa0ZrKeCepSezE9iVdKV'
+        'UL0CS6CzIYKhVW/ZnqU9jwZwsHlezvGlczY+hbxeHnV+yLdz54cjBWgG2raK6aaKjwIqT5FtFGQg'
+        '0m+8703bIIHUKcCe2kOybEmI8HsJNTcw545RmM8S7iOR3aayZ8yEzGdmFmW3qR+Mdls4hgpU9DCI'
+        '/uH5a5/41qp3ojbTva+7jdyPMa0xUazf0Gvp/Yqf7yRCqc+lZx/uFyEMamHofxRtri/1tGDiMur5'
+        'C4kwEOsoNty9qyM+b4NzELoF4zdIsQNrwBpGJVlRQ678Nqthjhj2e3Ju/gMCGUORXyBdx9uleQFz'
+        'GnzSwH44ixWjcF6mCbqttdmjN7q4XTroH8bH56BlhHsnTVlFQaav4NMXppphmw+7FeOeaU0ZHd1C'
+        'UvgufPrVzmo38HsLfAChr1Ys+Ehb9rM1U+SglA/W6ZUztqY1OI8plaM9J6DaI9Q4UjXWUGQVphUN'
+        'fZRXpljO2rlmeC21Eu30wLVsDg/chDFpfX0ZuaYXddAPNO4tr53JgX7WniC2xJ+GOFEZ5LJp9k3o'
+        'eX9hdon+CKEx24xjTZQCDX8f6D089jeGOn7UdhAHHii/+aQYUczhCUyXypAudmX4G13RwSkXTQIl'
+        '63BXF8bt1WiaCXMmH2Dom3oxcrN1+hjqenyPLL0m0kvv29YEzY2LfGXDp1ZHhNuP9JHPQew1GaXx'
+        'ftm+SySxFghi9IBOfb91ie/GXaTWjxInAhX8CB1mlrp3gMboZTBiR9ALPPHDyA3ror566R/AHNj8'
+        'Prk0z57UqfYrnODoFUXzhbhB6Gj+EyGb69V9x/X/6v8ypqZTeDtQOGnr6sMcBKpmywK5oTKpZ4WM'
+        'kCqrHgZ834V1CiEIlFAv0BNFkW0/EwdmCPgBHOd3d/GYjwEo2FGmQ9tZ5My8ZG6ymy/mCwP/fEDw'
+        'sqnvBbqdZqyfcbQWH1Y7o+fQI9KIXQqzzbrIWrneYkra/Xu3IoBdZe5CQrKIvgwymvh+jFF36SiG'
+        'mSUtbHFXJMqrGax2WfgpD2GzRIIWDJrQImk8NRKy2JN2QC3CjiYwu+HJVMGort3DBXIF25G9aBI2'
+        'T06E/xQKOcZhLyRmVgjEY8j4Qva/IuV0+m8h4qbP1LqmzF31jZO5UQ6aYC9GI/DCflnnZAWNUMMY'
+        'Vb9HGt0zVQiGvr/UL6ZBHd1AE/ppiwp51EKU3HIyqbWMDhiULRg4gEb8jaOZbGIDLiFzL1d11PGT'
+        '937goE8/ElRAPJ5Q29wFScQzHdbJRRSl0MT114GHp0Ywo8UR+Q+BREoUF2i8rHS3Yn/0m/B3TrAJ'
+        'kSXlKWFBHogIynvEK60hL3NzkgHvItnfMLZMW5+HYPEFSFmGj4AQ4Bpbt1HGrNSANLEhAQ3vJ0x6'
+        'GfyBXXrnz6D+Same2OeC86oSAECyrmusy9WDXA0pvKPQnsG3zi4YqCbO4vCb4GX3tujyZAGIx0sI'
+        'ZEC449ReHg+JBXExpRj/Vnzlx86yYKhConnJjLG+zPWwA67HJm2MsRPHqMlXHYZVjNlrTkHiqp/d'
+        'ug+PeMYGubP27cTIB7a3oHfXH2fE5ojFbHsis4ma7U7Tx47JKEoHjlDaQcMPgnaDA7LQm/EOGuja'
+        'XvRALN1e7E5Cu7lsZ/XnonyPgdB1Fc54vWYUpFf3efrOvXMsBnW8Z2bx+WNw0ggOwDrZhd7+T5i3'
+        '3HVIxxLm9DPMvJ45MxayrTRJecb9NNH9AamtfvvyWEQCPanh57L8vBCkZcZNR8aaGH9MSZ9en8mS'
+        'oKxgBz+tOGn1TSo8y3r4iXzpEJVXUlRilFs+CjPkXz+LyWRZr0Hx9mMwC+5VRsfp2qk98qC86bzk'
+        '5Y826q7k1R9eOYowkh3UN66/wFUbPg70gz6kaYyg/SPSaZsgr5IeXaxHDFnkhpaO1x5jrU88jG1Y'
+        'zXt0I2Nh3B8oJ2HOvMPgy8xrjDuFI0r4WVYlZHV5FA7umGsZnwYUDU/0t8/72r0NnYGK97pCdHcr'
+        '2m/gMwU4BJ8daTZquSWP8wLytGiTi+Dk68hLX5LfkjiORhZz31o8wM6ssNS1kkTDEjEPTBwZJDq+'
+        'v3sFCHm5bo/gFF0sy3o+MaZbuEmCW8JhUSAg3DJhfi+XMkF28E/lLY5T5yGQfJXmN0DHCmT4K97g'
+        'r+j0QHjs3oWi7Z4O70OEfzj45n4qKtIl2HzkG49rFDquykO4ib6e9Ey/6jeO7kTjtPwCuKJ/zwMw'
+        'EkG62XuTpPUNSIBzXYeVxx5p3zAVcpVQp6nRi+Z0UlJbG/ap8G8g03MIYt7kFwI116wvAWl33o3o'
+        'M1J6QYDBywF1i16nEg/HdmUQKwole/hiKD3bi/BuNd25linpa7JUUZ1J11IjJi4S/5zxh3NmXypE'
+        'CctKJ59W2R55uoKPxIr99vLrGk5ZMIiZlvkscAOVdBG00dRvhkzcPnFCkrViH5SAsVxXai4uho2I'
+        'Yg55gH5mP+SBL5+SQmhja0svvK3e8omniwW1sODNRAkksMa7GIgCNQWqlsTTf70Am0DbVr0szA7i'
+        'Vo4q42TofEIJUkJRHyyR+pCsdg9X2vAThv+AlhPu42+s43VnBjrpSNt3oKm/1rte3isydX3XMOxI'
+        'sXo5b/wkfOfvH/mQNKUiJk7bqk4tBUeF9UQjVgpGAA1TYeCgmrMXfMEmUSUeQgzBoJ42c5CsYSiW'
+        'E98M30Lw/Td7q56yFzc6Cin/sPH4IxX7kVr4Cb0mjuwAXwh+SKytXVEqeWxwwXOKJKui2Xf3dgfP'
+        'SVmpJ8a8rQo3l/qFsIgOyBS5snnlBvFul9rg2Mx+HOKdBKfBAuI+lPfV+NM0YccvGm9pZnbI3YJg'
+        'Vj3lEYsBaj89HThDcXUIiSSSPRw4Pk2jTJVaVz9va5PbJDC+Ar17fpTfqrA/VdkUsRp5xy+R9wZY'
+        't7WyiP+SIRi9BiRT5iypsGNn03YLB1PQLh5IH4s6L+bYX5qA3XCZW5qSs3BTxDiaQmJ1BHM1/a6F'
+        'vRagBTCb9bfRiHupj8VrW9DsQji/KFd1Z7IMsuOIQxZ3upKWx2z5i4I3ut5eqd6s4GHhzzQVRHlR'
+        'ULMEK1/qoRZpFizL47rJiizLs3iFW0GqkKb9AZdSLpLACPcA+9RGfHarmiQDbEMjH+yJpOIpqofg'
+        'a7DeVc0r3HAO4uMWZbDV0UAFinBSN80G+BiFO3OOeeN7GsotD8o8WLN2A65zPWz6TzTOXklFrP0a'
+        'g7cXgZXDB6OeRgQL/OK410bqzQkvSHktCYVPXVqzEy7WuYyugCzzyKuBSEmC9BaDaLmD6qUSJZvD'
+        '/5QLz+oxmaKkytZ18B5wMPzc50KRqJuVknIotqXqDRnZiXPApxsEQuhN9/SnAQ7tK4ID6wdiRb5F'
+        'J+mgGEQbUvH9lRDWC7DGD2AnX9eFEcW1twx8GZyis0tuG2p4vRvMlW19EyTvAl5CwTOSNkUOjDny'
+        'C5E9dqwb+nGhhnJ+8pum4Sc1uu6h2NljeDQolAp6fwfjasrbr6PZNr4/11oYhOaErmlWYnJFhNz5'
+        'GV8htIX1uePIf2Psk7XZnj2EacVONZ9infy4alLsciRmQBV8S+dkP1taYRJ64Qeor+jygiqSeIv+'
+        'L4kq7ioXVvO8YsJhXpQ8m9d45tAf3v7fWepV5VloQHa4Q4G5KCprTOVJPM6LH/04YTnNzh2Yoqyn'
+        'pu4ZLMMpNX+hEyUns/4PgaU7qUYGeqiihJqEnkRp9y8JHLwXyTp/7EAWLov2xMWRvec1qZRB/cPp'
+        '5NgQAYNpXA+HKfbhOOrPAGASO5OVROgg/dtD5PZUImu/2sIVfLEfMba978ChZAO1LS+l+Z0+QGey'
+        'rBRG8W+74bAcOls2wl83hJ059MwIO+hbHRmi3D8F9m0juEpUFdxJn2wBiop8sF+6STw2A0Lgljmo'
+        'iHISv8Jinx7H+uRF0KOBNOTEr5swKH5+mqtkFVfc9IMs+JqKqaKz7I3MF5C8IrgEc4uOpDltOnzJ'
+        'ZcwB5qqmrDVDYlbHh0HZPGaHDDjMU7GGoxhFDKFPTlDmAcqBn6j8q/nqV8042DgzwJB+2GBVf1Mc'
+        'dGnB3UvX6lf0mFIdFd6u4urNbLghOj8ECXcJVHCl6NXIQaXi51hOtwwWw5V+pO2glLca2aHlrIP2'
+        'vQw98wAGHgSxkRiZr1U4tKo+wbBy9yp5FzaO664on6OB5RT+47t/2Jg3BKkV9BO4W84Vk/vEwPtg'
+        'lJPyrYB2cK3tAcl2yJfigxg9SAlwFubRmsul2XCBX8TG10R/TbOeL+GsZ3KZ73AyKGj7olcYtr5N'
+        'B1vK2sDrzJI7zoTPyywQnn5ptsvSPLu8GhOHTIMxNQchs/yY7NvurTszcnZgJYoTklJhvCoIoxQ7'
+        'nTLmJ5jHFhIjCGmGUrtWdzzQ0DCHXOL/HSKaPRD+LA+T6dJMz4w9HoO8GFp8McobP3X1v9vHzyQY'
+        'GZt1aHqOtcZC7HUUDNHFCsXYIhK7ox54YnJc6SY3iKxHUXOHCvF6ZP2lQfU4Xd2liJ1unZLlhWrv'
+        'dR/QhEP0+FeUjAuKUn0fdlmTqmdloKXggFLPP2f5mkhNGLWTAdD9PWr+PuCIgOIPWSEyRg0xPnuF'
+        'N8J+qrHucrWZAa0MAoYrylf3G23OWw88Ym7CYw58fpDrbrnagloFOxPCXPyqdn+7L7MIzYTud9N5'
+        'cm8+F88y2oVsF719gdrEE3OZY92jIdjI14ymvyFNYhKcn12PvPk85vmWOqybEpYC8rC09i4qRQ0/'
+        'b0vZx7AUFD2lksIo0yBuP+5XBhelqUTQP/8sW0UyDuygwAJGrQc/ZtgfJwFVNh8myohEZCwWB5hE'
+        'tWHZJaA4OkXA38gohfs/AI1/lD2Guim2t5xRhj9jgc5FVufFPF7FSLbh22ur4Sq6IzB0shQlfbjA'
+        'aANvpvSYSIANQshLjCFaM9p4dR3xe45/d45TjMSSqNEP1ApQ+SAP33X46UzmlaUj9PolFqNY6skp'
+        'c7OHZEIqaoRTM5OhFxvURbymTrm/9kQiKsFiGozpQQryh/TWOv7BMh5hHytNcQqgWOEN3J70JkCA'
+        'dsburX7jI/kT2k1Gnn7Gb2oqvrurYJBGicZ4Jz9e0ch26OxIL5kaRFYxDAbaoVnX7zaNtn3zDRY+'
+        'lDtpqgd07xKarq66vQiBlp2SeympufX/nIi090Xu/vF5dVhYzAG0XVUVjWvYCcQJ09kLKBHroPlC'
+        'qmoTOge8O886RmKMbauvjX8ErkJQ3MBBEpgTNJzyijEpUqEuDUdZT7XZmp+dP5qENpuqHNm+cdg0'
+        'zqYulHLSu1iETRjcrM0JuoZSM5LP80OU3rCc7wqr7S0NBaHl1nhKbC8PP6/OHIVxe8tPJ1BydlaE'
+        'jD1D64a152JX/zGQnZeTT4rYhW5Jkz3gSThquEB9kLZTUblinh4Q3LKvqFzr2TjSwD9RJELryTbC'
+        't7sYk9tfVO70PVdQju9hDylDZwLWIh7CbDspGD5wfDmkgXMjoNiDE8cBRwCLTSmRUd0OjGpae++O'
+        'kjgIdkzAWCM+Eun7TqVU2aOs+g6OF9VWFi1oNBN3DeBwgeivarK8sk1ye/2Dw84OngqNxQKF6+/1'
+        'tDTiOOunPprCJutC7DbzBNDgjfRdOFrIemAnJy25Qf+YxeX+AZBlK5nydxAh51PrvmM8PoIw/BuC'
+        'P8X5gCXSZqQKt3P/L6/5YXHUvyDQlD8ADQFpiH3RHO3LuAFAlqHz7BA2NyXm7AE6YW3xBzumpNXL'
+        'yDbShkou0NIq1Qv+gYMT5yvmViLKAL/VfPt3va5gnZUKxs/8dVNm9XOgpHEY8zfJ3N+EUP5JAebZ'
+        'xZJtIKXaGMCL1dNzerCO+5QMry+XyqRgyfGtTZMnErtZA4RbVpzvhvnjbDvArMUdtsQjAMofLza1'
+        'JXlBFrayGo+PNO+Z8U2xWbiKAiKPu+jc4PLOcQtdHE6YsGizNrj+W5WCLXbYulfGtDJ0YKMVNnCm'
+        'ZiZDJOISmHNpHjmWR0QL/EQBK3YTOKyka0JMbsEPygZ8V1n8aTccqbr9QKZgaEpoQ27tUu8ZKSVi'
+        'ElBHJUDPSsvzCKvxlqMA2YaY8+gHnlweE+ueEN77cxmNEvg0V4AOLvZKq9DhnBBkP4d90wBVgcEF'
+        'vVGqkh2gzumKfVKmWB+Jffi7ncV918o+hGWTnC2AAqsoqIF5V77m3Zwyk4OmESoTOcPEA8Z2jBpL'
+        'i83yxx1EClyHm5+EOrDnA3y6I1/PtSleQpOVOhQYkIl1Y3kqQf1BYTj5Hj9Owx6iDS2yQCoUvJ+B'
+        '2gctYDOWEO56z0rN1SS5btDiYnrq1GLteeJFreAuTQGcA4iyZLSad6lGWgoyfmT72eDX9SU83EyU'
+        'r+gBWb+SFPYxWUMMOVe0wLMssT23xkGmSLUzwih3gjf7WwzxEYjqsVsfnhUn8uhbESvz86E0Qbb3'
+        'YuOf8cZKk6TqG4bzvl7Z+nQDH0XHyONgFr87nOcGZzRZZrcAB3ufrBdO7Ck+XVnI/XVI+wyXemjI'
+        'bBCpZv0YSrMiLvuy5s/g82O9vGKYl/sPRuw85SSGGIGYWVIjbJpmawKXO42N5GpetEb0lpf2aGLS'
+        'EDLaVaYot9VSMwKnOU97lPoc6Lngquyrezz3I8iPlaz3G7iPsioaB8LxHgPFWBt1zqAEkgxqFHLG'
+        'jEdMMOhoQfDDUFcIaDfK6nqjKuiuw6K9DA90H+XWN6KUEbz4GtW4mUMy8tgwh7SbJiP3gkEqZ2Pi'
+        '8JZBfkAMi3DGfKsTxkYTc7/hlflaYHnvcP2b5vuef9pETERgeH89kByorUu5D29rW+6eT96aLYOE'
+        'jQk8AXxkwz1XZ6D3743kqxWNMcKkJgIgx0nq3Vjsvbbys0nqd1xj6PPTcflTDxdohV+cYkJfdyyO'
+        'MmUovIhUK1UuAWGNZgtSpzW2oRhps80eHVRBfBoBkLy4YJVcCxJeNKtBrrm9k5xJNJVOTMsWRmBj'
+        'c2plOQHFQGwMfJQnJY/RTCcWbBM+53UPHzGQrWTYb8TN+0K2G6JeHO1WZ/dS9y/MJC8bk0rnsqo0'
+        'sLZIDiW2LKSYZO3IUjEz+ASgrCRo9oTYJTWpiv70XVTfulMAQ2KQuwKygVGPqCxUwqBm2BAu6NhN'
+        'krOsVrZJt350b1GCDCmCqIdDKei7dSxMyhTxvlwHQIjyivyrhx96BOQWqD48Tk3S/6/EawU0icoK'
+        'TsaXBn0V6Wo+Ajk+S+roGCFZO3LR3nuHAshI9dS3/sEsexoXFEFpvulrWJRq/fhcBNo9tq1hc5fm'
+        'SvTvH57l+EUhxGpbuA+1MPznLy3xztgqcFB8YcjJf8wPXemSepT9CgcnXtPI2OOLhMBfwXiy677c'
+        'mmwt//cnwmviNiEvra+osMG9hGwTPxfpRK5EvDLTxD1ahEweTyHmUPdIARg5xEXKmTUh4PnoFhsU'
+        'VL3HLp9LeDwD/ba1MCt6S5bOkPA8lTswIzNqe2VFjUo3FtQkAFsv8Kpn1piAsRU3KvgHz+w/m7Cs'
+        'QAk+9Krgt2wHcFs1TzT8HnYI6TfLw5SS6HzkwsEiYK7q+X4Ld3UuGwx+SOmyxiBU/UXo5sTF/Duo'
+        'z7GNAut2MT4WXcBTSB1hhXa9GMxxZbQ+3g8WX0yHFJSGTGo6jXUqjoy9e4oc9wtwgAOtj2TXEaYA'
+        'npjSMlMYfP20UkbCE+dRCMaRygbzQ1mEAIvPhPdB8YydBoUWr5Rxz7pFbMyZDtOlJ7ovnrv1Mp2W'
+        '93cnIWpRu13WPjtY7siIFQnl+9bd9jr3/NZkoDhWmtJGNT55IfePt3FXWdZnw0EoyeVHDD/bq5kr'
+        'csF7DPFO6bVhVjiJz5UPi1FI/js+OyrhttYBKP/beN7saNBf0OYvp9uwMuFu049mq56NMIPHviKG'
+        'i6ppnXAfHn7RxtTA72TzeR553juVr2H/BZmYaG1oi030SHW0LCZrvrdNtHl/Pdko6SxXdwHFRn5R'
+        'oDmgzkuhBKI8BMS/f0RLnEP6VW5IYHc1XKBdSH0ToTpo8DyWt3NfeMBeIy+BgzFca7pGzAXJi2bM'
+        'veK6/9Yc2WiiJUhRtLcdpm4kCEV3rzxRsuNaztjF7vBlveT7VPYEflCARMtlBpmEv/i5jrkvDhzH'
+        '6u0fZsM+eRPS330A+jr0wTvUsqU+nhyD5gbXdUAhZgJmXHaW06PhZ4qeUx0hhzPmqFtUt1aAXcsy'
+        'Q+++c7J9zqWacADKzerQkYw7eemDvz6DheMQM8apxFwOY4GcJ2i718dH8tjjzIBgX/8waH+/+t8C'
+        'JJGpkdZ1/KtiDiSEQoyml8PXPBVZ8qvRVfuj9CHPni06Chxljk1tcsAtMprWu6qHsw85fwUYM5fw'
+        '6n0RVQJO1RzMUvHAhd3F+OqbUWH6IsE/8nSQemdUEPZdJBkWlIXMwEymhTztDI3LpZ2UAKbzuYFf'
+        'Gq9k3q388KW7FTMyPtDm5EnMs85L+yDU6Ha3v99cPunrCOk2IOgDearh3TvZMTscQWJNODceoEFU'
+        'nKqfaQQ2FftzpMUnCZ6Mpaxyye98gJpzmV1xivWpqwL9UKGlgA29Ndnk5T+PEx8RYGqEZKLK5AL4'
+        '6bwO2/Q9c0IQBV8BOOcYmyyGOaf5g4Gt0ILBvSQiL4yH0P2+znG6KzOoqtY58VL/iJ/AtxEE1B31'
+        'Bzc5U9hALorCBtXmF8UCp72fRKxdqZPOBFYf4AJaaVQs9jCPCF8Sr6IaNVLTGeuITmgMwwLA4tv4'
+        'gqQwJaGPgCffsf/NEp8GdSSVfttqrneNb8ZC3IfNaylFIL9iTBXEfqeDkjCu6E3bd8Jm59Dm2rJ5'
+        'ovWWIA0OQYJHZLmLlxWVpStE6MxrEKRWOmRCMdioXPSVGvcthNG/68JHMAW7gZmxA7gkEDYwmti7'
+        'u2ts+9a+vMs7Jo2p/bnGitHMkQYPWHTCkSqtY7IsoA7AMu1adKXzG1EUNAY7DMt9MbNwUnEeBdgu'
+        'H+WzWei4hr1sqWTYvma6TIZXbkrniYTzv+ifhbihJXYpIYjseBW4LghNIZJL4EW6JwwnJZcoVSrp'
+        'uLRO5jFU3w7VxGezNJnQ3R13mzF9tfTiknnaxLJ2gRREeJWEC6Yg86w5NodXwKa6uoOYNns2c2fh'
+        '6IGw+8IAQoGhJacrxGQWxD/v/RGaeV8q358BXfGzOIQNbKAVLSk2DRUeWSAljIMgL1RT4eEZuK0S'
+        'PFSy4+M2Em5KsEZAvMdouRQmUPs20at6XCa4qOQnz/uugSpK+cdbv5tf7QYrA+oU2yc3Fy7qtv0O'
+        'TpXbGf0nidL/5BQWBI/gDL8ckCEkkg0+4HUPHnOh/Dz4+oXOgrdJjmmROn1yMCJXgLFybkcGG2zE'
+        'he4TPKQh0lDVoRckO6qj1VfzAhdsIG7tN5URb3qs1+8w99d+6Z7foYbwIViv2t2m3MCroHasSpai'
+        '/J0n4212Mz98DvZS7Q5bql3IjuUJgDx0yxgSOrS3ek3UR6oBAibMYlqO2HRGJetfSTbk4fBHkESq'
+        'L5RmMFftjEPg5YUIFEfXla7FTjppv6TTaL6z6THQz8UOgkrMjIoKJy+7lMpZXPdbbrURB3SK0qk8'
+        'LM63aJ1FCOGKkwdap6Z2/2rSpOLGcoUbJgSFYzpOPUShBGrIcbra6A0Xsi8MYBE1mMt8Jvk17gTq'
+        '3eFSpGBaJ3Q0wF/t/af74B6xldO+YpzzxUGnmPPDUR4UFHkyTX+HvtzB0EMPuAOXZ906GApvvojg'
+        'LKXV79JSDMmFEELwiBBY+qJGkiQ90UAUXwSn6R75MUFYdplqHQj3iIs2sX1csbGr7hJhtGcGL7Q5'
+        'ygOx3aYDpAaCayy/1G3W0C5oXxJskY6eSsDojlhs4TBtq3iKUCdWs++iEYk0G/FIpKJu+y3nlMmw'
+        'qD8G6RWS1psq315FnBv++H4lohpdz6lYaSzhjxO9evGIcYXIPIFMZ889f4pJgJuwIvv9fxcXp6LZ'
+        '/K4zhuungxqd9qpGmhwUa+SYO4FVimWbgTw2qM8uHsuz6rox2m6fnRgdWielcrSqI5DsAP0Yvia8'
+        '/pkWwB0RcR9d4iiEXFEEC/B1HFJEa8dqxq9HzNoXSA0ss2DkSpNIjTZrulGD5ItH2XyJyV83NYr/'
+        'Ao0IpDjZhruvQNCm+hVDIhUjkaC8yUBdVsHNavZ86IpC6ynixT3tngq1C5XZ9z0BSBqWoZbs5ytB'
+        'mHt7OOUuU7NGX1W4U81GQI8ua/AF2Waw9O+G4CNw4syhFLRzIHKS/OO9Vc1esQjVUQ14FTb3zy2g'
+        'zyGEwDsiTWgBuWmqvzsp3UAT5SPCkRuVEVUTYBz2dUIJVKyiTXEerSF2AdqxylzkUWtDSLzQAj6W'
+        'h5l5sIic0QWyr/2P48bhFHaSUg6OyF4UOQK+dVCb1nElwYgBK9lH8D9yKHx2HM5wNznRWMgiTbw+'
+        '+gOb+9aMl2AemLNkC5Qp+AC8OiuaIShH70EuWyTMqieigF7NRJEqRwJ2UNlPpj57+JdTf636dhHn'
+        'F5E7BhvonedPWgwbSaIt0amw/msF2EqhfcB8nIXttid0TlGygKBbPOGU6dus9k09GbzA/fmlcl+S'
+        'OWhAy446Ox1uCRDPeOC2SpLa3/mCcMakmoiFrqoCU2dqY/YD84gu8NRPUWHGGb3uEHvrWTy6FdhO'
+        'toFMQnNuUYqPHBtUt5LVZrwQyk+Mx7mo4EAqjzazXBL6tprVSVdnl5ZuWD+vsycuSav1hWzfmRv+'
+        'beRNsPuL4hUEjTizc/r1R0+MR5tRQSlmB6SYMSY/4PIpHuD3SAQTFUBQtzpYuNkT0Kuxtjv5baAL'
+        'y6E9hMeH+MW7yfZSONrIt8L2vh73Bdl4BvafWLScAZR+V7FOKP6ubNEwnRELLDMujNQ8hIiXJYEC'
+        'qfVNMxohh9dWIceT0wUpIn5+4smC9a+Jo3zetAyF7Gvgmz4LnLoXNQX0Kb6bvwEw6zp6b8BOnMAR'
+        'Qjkm+d2cABs1WqThRbvPp6bs8Cls5CfZb8YQgjWrAaZqNXK3eicZj5wkcmNlbHyTn1gjBQ8aQ88n'
+        'SfRFirxwxFa4JlmLnebU01jOFZly8H8bN8YjUczZwJ3i5lBYycdEEg7NBG55mgItNXrv223/+SJb'
+        'KNvPNqUoJhiDBXCiKSGKW77qyuQn9KPYXYsylR2w7qIpwNjpIo7tc5ww7ApLHQLI9cGc78zZfSKi'
+        'KBf3f2pSZ0Wfdr/uWj5QKFq1wmN9SLOFe94C4upCqz1CVkxV7RdauYd9NEFF6Mfof1KgR5jxiLEp'
+        '5S2aamYXxOnpYeiVAzKxVxwtefnfGWuVwchBdzGe05qHQwqR7Be5ZI4aVjktW74+m+GSUMGCutpw'
+        'iAhU2j5BHZDZjPDJGnBUGYLhyJJEIttzkzdvfY8d3wuPfG0/5pPKtRxdCYKiFyHWneXLjl5i5+WM'
+        'zb5ArSNqDumOAnY6dS5YC2zUYGDFe+y2EwBHVsw70TGlE5WUhsR1tjXqOYxdTc0ZJ3TSAFeXCKt+'
+        'LpsPC4CmOcyRp6RINrC3pIZT4vZhGkpwH3WslamRbZNYEqrlLSumLmpu55XP8mr64ixD+wryoKEZ'
+        'Ll3WSc1gBZdGvABzixrgprxRcVShrNIRZiscSl5XbQ6yqGu5oXcpS3rAfRyhlMWBEbhNZbLz6Zzi'
+        'fCxflKUTrA4GG6rUU9A94wo/gQnO4776llZcumRZ3ZiJMvdJmVeeU3+Ini94mSi8H+v6+e+KqXwf'
+        'IznFhWZFKFLih7bi80dobn6OBXwgaqclzlhsRc49WID6zRszSJjfJgG3eDSuAfDQP0Z7+UrsFH9e'
+        'EKe9JXE3He7gBjY7pOOWlDZP0DXgUVamz0+j2npje1yYo7f23qROo50XSVhhK/TkJh9+yT61cZks'
+        'sTE8/qDj7dnsRiBgjnIXOn48G/vMHDWuiI1Ytcmhvhs7GAz9f1P6o3NK0xCBnNk7ktD0sopXt9ZB'
+        '0eJBBMQ6SqTDYVwLB3wTez+2fLFB8pveBo5jZxkOA9d7XxwqyAEKOdMO9Y2bKOQU4WfJgRnUrBMv'
+        'zJ/7Qo58NcLRGtMuzG1PjNg4s5Uq3nc6X5wgpdVALQOrJ2/juwDsKGI5aqTBwWwHqQpGTvIovZjK'
+        'ryM71B/NMZnVYZDknNx6xOVe6YYPmRZITpDNFFGawi7uQd8JBar+vkvzpEqFo6gptF9RTcJMhZ2w'
+        'gq02qWJNTIqejxqtnCqkpQ6NG6i+PYLAtpzZYxIV9sQt+oCDFsbSwQC7+mr/XpApjZpgcl67ZMIK'
+        '6mT875rMFWeud9xRs6fGjvPKv0jnaEUI7D6KEQ5jrEu2Om1W3MVy52M5g7xGsNbJ87DfFnG4zscQ'
+        '8oRQujTEYV19HRp7+t7D252XAxQSHmyWpV8ZL2A5Gpes3zq4K9mtEYQqk7PcNl6R19cr77nCENhV'
+        'kQ0QV1QkBVpehVLw/8aJSRLFYl6h/lpusZkpDFbzG3ziOU9gfzMI1sBuzIHTx1wfxPBBVXcxQ0vY'
+        'Wb3A3l8SsqO8UU06LphZEGeEvYmxXUexTT6e+dRJ1UL/OB7C4yxxe9QJN5kwEKAD60ifbMR5Lpn0'
+        '8FwpRhaL+8IkL3I8f+tv/4hZ3Vb3ofRNIWLadJ+NzuKVkcRVVyDA8JRkFvYcKonjJQ/FaXdq2Xd0'
+        'XLaXaYidUpPTNCmPAh6yS32E4ZVbP57hxLlzOgFmlsvSM5D24QoeZWuTYJAcTiPoctETifLxrqXo'
+        'EGbzyHxqXAxylFIJm/lZH7XJsXSv6hMBj+6J1YCFSK5YaUcWany2O/jp91kzoP99gTcV6a4OpeGS'
+        '2D9k9BONSfgMqwd7aOPzuP6aa8myTtObkyQ2vkWIwbzEMeQir23H6WjuuJgbUsf0IX0szQcMFMFG'
+        'BLZ8v0tbSz5iDrSfix3ezS9OPXAcxfdF3mHUHUa46Nol7Y4buqu8rUoa+42pwaQ+a3NNshHz3IYG'
+        'JNysmYEoRVhI/A5nQe2CQH0rZe3FBPyhWzHLr3lLo6OIcTax7mG1m0Tr3vJtn6tdUQCObFf8LUzX'
+        '7dTbU2elljVPE4+zabuptBW3XT1umo/JqIoYb44sll/OX2jQVVIqcZT4zIUUzMjeO7ERfaJMwHzz'
+        'Mgyu55T33abE/LaAIn5vO4AxFMl0RZWOpJWjc6ZEeaQCfhtCLItW1I0grtESiYtGXP7WrVJuzraz'
+        'YbW3dOcCUZgeHTF6Zw9jQFp1IxXbjsP1e1yUoWjD7+8iUuKC6okgX9d/YHDFN3qhieZ5WTJz7QMN'
+        'o+mKV5gxnVNpZ2E3Xum8lIms9mPjJUELtOXl4xUbbEMzEIUAMZ4eRTBXNvUS2LlkoESBy537aqry'
+        '2SY7DWnPQ3hv+9FgN6IlFSCZ32+Y8SgZRN3qQ0m6C9p+aVKbOd3Vc1KoBmXZd5eGQ+kpfvmJnZYa'
+        'wMlhsLWr7RdD9uvAPFhTaZ1dWF3n/RbOpsR9btT7Ym+u2Q75WT6K6Z3PeCT/DNB6mDTTTsBPl5kE'
+        'bL/V10YYDklr9JOobIvV6totEc8q9R5AAOTip/E7X9qUj2OAy2sTl3DvHNGz6Uz83KHxNgRWzaye'
+        'nssS2Cpd6xosck1XJkpThZ2W4K97RKN20EcFxk4mqZk6C9+ypceChgAaemrtVQ2VZimJPipN5tGw'
+        'XcMsK7s7LgmKE7FUa56WngFMmKNxBzkuZHMobhg34nvUymdH9pvuoZwF8crGq2KIUkk3gbGu1+bf'
+        'rChRm4NUTVMB0+gGkTbawrHlAqs9eX3UQSLcob4nC8RDwpN6pB6o45v5LRFDZNpP0PDzrpqASdqr'
+        'aI4wTgj2yVplOQSNuMBeYcib/KSgvl863sY6noe9l48vK0pUQSPgy37PqAO9dOxUAt6qwuQxIg9h'
+        'k8utMeY+JGM0akiLsxMsB+fhPwnTvoK3ZZpFNEdFij9hkRh0BCHnQZwRbtx+XPDTt8CaxfYOE0K7'
+        'H6fPqBzMW3aCYbnZ1jSFs9wnOLMOhEVRsMzHoX7GUuE2i883EtPLg0QkIqoECMqh2CmLj7Bjl5cf'
+        '7w/fDfltjRS7LIV66jbdllP3zqmeRaqrPWt+QNUoFoBQ+ddFIG8umKajTQDR+f9gzunbEkdjcj49'
+        'kbpiRS+BhIqiaZfkasMf8s88iawC2B8oo8qU2HnLxuTeeZMtNcfCo2/YxfTA9rdbyrYQDfYRs4d3'
+        'CWT+dVjsr2uWmhLEC2KTVODBSg/pXJpMKt+g8J7ryuH2Jyhr/1FhX/9oIZdMttGMbdEcb6XkTizV'
+        'q68I3mWA2KZXE8OwvErAGqA/lhgwDrdjQd5lZhqNDGW9pouptM+TqTkxKaHbx+G8COTNxRsJKkOf'
+        '1bTmnPvqHHHKShSrq4yPt8ZEhEYbTjlkwZ0aOGDMif8STfmvF82LZ64uqdyYKjJiDSfhh0TVww5T'
+        'PWtFXDZmzTZBhq5v6UqtfbH9nQYKw4Ef08I4p1Kec62bBofpfbtdi1Uc59ptYH5M6L23JiaftWT4'
+        'gQEfOVIOL/JmMkALDWl0cHt66SVCpRg4Rp/5SrT1AlhrzMDFuRq48Cc9ojcRQJ3Q1Nv8njBcwGWN'
+        'seCX86v/wxJJ9bj9bgLh05b8wMUg6MVwt243Bu7289oQLWNruU8QRmnD3RHwNaoKM3v3HWkjVhaY'
+        'I+P1cgVe8cLt8FMDewSfrOJf0pmtY9oBK/pCprvXtSLaenXl5UaEbn+DT0D6/cK0wCbVyA5QJ6W3'
+        '9mttnYKndDe3ZSE3eVuhSj5bL6L5JnCtCiwaFurRazdgrM1orUPO7yBYyM9B1b7TqUZChZIwdkHC'
+        'mzD+m00ucmVPJcAQxwoyT7dqw7NM5ObWDA9AzVtZYG4qveeLGlLZpWFwO/DFl//YZ3Axcq6JOYLW'
+        'MmpsvcNpiqcFCCL2W7KfKH1CzJ9Q+AW1qiNjPS3R+FPRu8xbqk/zwcN0mB2s0t/9V5uXKw5IYzV2'
+        'KFW6g26t+dWTNbV4wvi3RBy8R+MT1HnpHe6Rb6oOvRUX3v7s+PH8SQUJgIJtXqeYVM1jcOkf3wUd'
+        'BvJg9CKJQn6z0CI6uy+C6suZ3+4QS67exwjhylaJn5ImAKLQk9C8JABrwpueQxsb9l5T688LDcsI'
+        'EBk5kuhHA9J38Eca0GwIuhD1EJMsxKQ7gNeB+rboFu3kUDzFzASyvZ9KMi1xv0Z+vNx6dJf0HAPD'
+        'vmog6HQG0Gd/bxYs9RhwR0QOCQ3QwXuuywpA7yvaPPGV7todjQfP12fwmvv476zIjhphEt4jn9I+'
+        'f1Yhs5An096lAGYrZNOffhqbfv6gL3udghHG/iZ27Ppp4lmmeRw7SXpj9Hc3J2VBCNbEPK6ZSDtA'
+        'nqpHjboMVJwvQFsZKenbGRWZCM/u+BD7BL1X7n0Av+eFCOgPQihw1r8BV9f9oaGHTZo6dV5Gli9r'
+        'byJyYt0Iw/jxum4iVtcbhvAu8UP1OgJkUdJ2xDPwmWElUzDWi8i+9WHOnx3JsKuyfNDxHfhEzitM'
+        '3xts4Uh/1V+3M6kJNagDOLuTMMDEObJVt5sDgr0ASzz9AlBIMuDNp3C2YsUNf/0SvPQ0sA8hiW7X'
+        'bSNahn3MG36zAgxHYFrbBCUHirGwS4ElL4/A3+JqJNzM59CHpz27olcohkjgb/cyS5NA6LG/vd2U'
+        '28Lg0fyRmHU9t3gSV8GKFJw98PatlRpsuPZbgjqU1OdvtpYPQ9xOcJ//oExAt0DSn+uI9ih4hLuM'
+        'OofFacQ5HY9OCru5KkcyECEkO0dp6xmsJTVONtl/4YoUwEcVGBWNWKddMIV09hovdkOgX6a7crtd'
+        'G1QBSjBNIa7hLTnvT9ZdI2ELTIWIYCSuFEAkX8mvoIGBmq/3SRGVFKYlp4YfS5Yhu6Ocrlxui/uj'
+        'EPe1Kg/YWhdpHIpUGyJ2J0zDlYslyyQyqSq2S3IX2L5Wtv4KTdk951zT0BVyA1/0yJzWlq22GQNN'
+        'QY+JgCZkXtij1odJ2D4eu0ewx01XFd1kIa/jpnJ6V6KX53xTS15IYeBFPhjHoTEF4lvnDGL3e2Ba'
+        'M6z4eIw97qmAmEwIEeeug2oMfaSsPaQVHT9thSB4DlzT7vQIoOg9cPaohQAOsrk/SwriIGXidSyo'
+        '9pLETgs+3zPLoOOn03gSjSsNqUmMjIQ42CulaNNCDRmSOa7Gq1zSYb3W4VyqWnhR995YjuOZ8jBX'
+        'scaQdcYgMA4juU9hRsinO689AR8ocvlnbKeRY2hJXDL9rzJKAcitzRsZDMcUlon3g0b7dRjKaJ01'
+        'wiKuXG7QPZt3utNkXMwg8EHTYYWqaBiaKR1VnxzKn2bjt6npyELSnFqAL/IEu2Ik7JMbjuLJxwoR'
+        'ApCl4vwqP9Mdr1kcyKXc9TpWKn4bLMsUNtzg8wSoWB8FN1u6po0kDZxjs/q00M/lPQYDXoV32dNQ'
+        'oiPL0xfZfGiGhEWyvKCAPkM9+n4FyY6XleM++7PokDdX/PD/JIWc7aeNmUaAAftUVtoc0gwxiv6C'
+        '+M/nHs5hQSNPXk+dG0Lw5kyug2WykyULkl+N5XQuIX0C5nRKf/aujxSR1eUy6898SjvRrMkB9vmO'
+        'A2pIKT+KrXvBKSf5ty3lPUiZM+RjlX5Jib+RXMYOQ34n5VAqxptfeM2JCjm9cFL6Asy0R5zPJE0E'
+        'SMJCAsIwZZkvos6g0eeq30BOCw5RVxgAfokSTeaXTJTNPlFQbJLizMLZDEGPVAkrJRgqL2cfbRqd'
+        'E6TdzW3ENY4qOey/FTNWhwbdTU1U4a+HCAnwTmSyPmI8qbCanZw1mBKfiGqSEZZr0VjSR+McijsU'
+        'CutVD9mIEe91EEeoGzR8Pvmd0TXzqNFXsGiGUNa2uXPukzQAKhGashoe66yaw2TbHQR1PBnyrqL5'
+        'xutxA9CX4yEnNnmZ8+bstabZ08w/u8XNazNdDAXxg7vpJWbiaOW/blys8IGa4zIfwz1RCl1TTtCG'
+        'nP1yXRFQR6umPl7xG2cwWwdHrcvGn7E5aKm369kwD2VjKxsvI+xJGFMC8Q3AcBE//pd1X0EceMzX'
+        'H+/bFdSP1w9d9v3WhdKo5MEnLA+p7oH7FWgtSkqicmh/O/Us5A+gO9hYLSZzOg8JxqsL7feX1eTF'
+        'Ko/kNdjgHT2QRB8AUR/VR9N2u83A+e8DvXPdAZYAcPz5+JTx7I59HABznW+/rQ+aFULxD9u60/+Q'
+        'FJgFTg9a43RZijwzbN/+CmnJjgc12JAFxxEZiJED1yVTXUnIIks1f2z+lQ6fdcXyK76SiQk4tfqe'
+        'iE5kIwCqLXj0UD9yQe0jrV3eENE27PH+HaAG6D6JHJuVzj72WehpqXG0J7G+BNKqEs5x7GfjdOwn'
+        'qk1vRkijZLurKtP/exagJbmaqezmYvcPSEO9LphCCChwRf8YZUAWTaDryPOni0WdSsBxJ1Y4nWA8'
+        'Qp006Y2/ICMif7YLanoLFJUES+Ng8IaAIJ1n9GmRf8ptVLv/FTjDSzHIBkyHbfevgBcLvFCZkqvN'
+        'zbSFAbBtwBJ5QJbz1MQ8CJvVcybSpow8JK/rYMGsj2PHhqt2ujPMx2DEIcs3EOEXxCRLCF5rui3S'
+        'UEFlFC+KhqWOIryPxUuqIbQi/p9cF1G51T0Y6zcjBGSVJE1JRJ28owTh2XvxsAPy8Iv3oQ2YL4i/'
+        'lR0eVC/Tu8vVif6ExXgENAfnDO959849bHEk/bl3xU/lefKziYmS05m2kJhiOeuA7QeGq5SmU1m3'
+        'aBI45hTxwm+3G/ZtxyOlPUDkQBpNTlaBkMNFDmddu8MMgjY9glvBjYC5vstVSK/ooLKnkHqEOcZ4'
+        'z0rRplmbMTMu0HSCwOEi4AsvHAXwMMiIIG7on9zZfAYF980GojDelsGPGAHSzRkP70UXTVv8Owju'
+        'MiCAqD8EQeEJ+QZVUOOnZcZrUMDd3P8vf6PBZmo+0jY7T/3C7CNOq9loaL2STGL19uUjmgJYQokN'
+        'DNKwQk4pm3c+4+QgC8OOp7kBYty6KRQopM1HsA7TpQ3/XzORiZJpTyK0/6GN3uAHzQcncFTrDQU7'
+        'wkjx88WW1TUvoJ4c4tHDySM6IkxiWK3aRQ3Kzj2c1Apb1/rHaQGczQJPYm8vibdzxupYnwKc1KaG'
+        'SbWrAiuvNXVz8fx+sCKOj4hkwX4oQI1XBlfA/gKDZBhHvfPNqEDXZ+21VxmSUabszBh6cD7VIwRw'
+        'AzPgOgbybh7gaAkjcwO/g+7tteNI0K5Sm+t3JNlcAztuSLPrRy1zVFZPW8N80tV9uXoRr9IufoG+'
+        '4kgU/TbspI6m0zdo48a+E9CBb2KTEv0VyHfaSkRS/KfF2dGCHhJO4lJrRmoM/4vEKISyqkPL7vON'
+        'BQcO44ghvrdN3fpHeZHmdtsgWmICheJkbbDvsOIxDxt6viuVavX14X8s8l0IrtZHFPwEL54+Cf0M'
+        '17DTGUZbju3rL1YIa9A1GKRcGYKVLWomdQFQMC9gbU4lGYUSJddSrIc8B89vuAKZ43roaStZ2DF0'
+        'DGv8YireuvptzifOnYmoMKrXiPHifCzRKmi27g8u72h2kUQe7rwLudQMe+1C4I38NhL7rMlVt330'
+        'YKS9OR3TS4VK6w3Lqq3bVvRKsLh+uU7iFKKh8NnTn1Vzz93Td65PWooYWOT4/KIxJNgyOG6ivviy'
+        'wOj2w9FN0tL+6/b9nDtVxrH31MBY+VLC8TpTDNqV2nn2hZHpTB6RnXEMhdOxd4vWYys0MgXEbxJu'
+        '52RnE8kg37sZOQBBXZ3tJuMcteiPV4LN3VoIyoSwaakZDjqu0N0nZt2nFq4TnRlnB7UoifM66MZm'
+        'ItLHNOzr0G0uPfbLH2KAvTy4t1Taypl8m2BqHPuUnDS6zganYAY6GPSSWEIJBSJ0jSCv/muHMaVZ'
+        '7oUioh8kZR43QTj/PoW4tA8t6mtdcMMJvwiaJHr6sl/gzbwHk4oZDtI0IE9PWZaWE52ef1fPQ2rM'
+        'K8pHHw0vyl5Jc4kbNBMGz5znS6KiH+jRJiKq4cbeIfiOPrEmBbTyzxze6EA0ONs73HDLCT2yG6A2'
+        'BDWdIJutnpe4nTRv10wAtOqNUCATAJuCjMDD+F+dmF5jJtuHOvDeEeTSMJdOCFE5s+zLiPA5FF7O'
+        '97anpz3MOES4/RiToG03foUj6U5HC5Y5Euk9somXTOxYg545T4Ci3z3TDOkXjR/wBi0yecqClLJR'
+        'Qe0czRZUVaIVe6GjA3Rp9FOCERgp6QYeW43qS/0hffE7ClfvEkfJ65S4wYGGqxGvpQgkJFCYiQQm'
+        'grvMRakSXMieofdidPKFWCJiOpqeank7sVTgtjjSoKXXT4RKEgJatmU1VYubZRvxQjtE/LQndVZq'
+        'niw3mC7gPh5SROBsPi+V2wF3yXbtq7rEx8sKSpTpB74V5sNUcU+Kk5F2qrhJZY4431DrynKpYQNn'
+        '8rEU3MVXot93RqScL8SjKKUMiwgBMVYG82KtyvshgFwckxELaERqSkeFSJ3v3nAX4W88FVc7ZnYO'
+        'lzJ5hDvixRfLplI/h88leafH/pX2vAaOQ3tlbxdUQto9Z2i5FvTK7FiF06sZBlW8/Lfj5qOoEhnM'
+        'KsX8BieLSxUGNKIKFf/gmar3+Z1bKrjqtHVXGgG7fVsyJfMV4cmOxtqY8BDmVmZdr1rYRxvt+vtV'
+        '2LdNPww0BopXBrVsHbsqjUwWskhm30yQslMCLXfz15ytS5CdrChv/JiSQYT1DUVxh6ju+NTnR+iM'
+        '3JeFo91Swe4yG2P8ZbwRbgELf9mu3sHFawXd+qKESTbH/HsRPbDAixnVI8mUjXzoJ9i63URiD0st'
+        'AEWNnhYQdcmGSRXK4quKnIfvIqRLndiKPPinyCZXc7vXu+8fnpsyuND1BAfv2Sm0anjbPbpFAxZi'
+        'J5VMK9VBqhbcjy5Cn0OnuSwVNBsGaGo7LnWVsltXjziy/EE0Vn/s3APVuSEPLTVD0lhyktmljmzQ'
+        'DoI3GqPCnT8d9bPuoij+26q/q+5ZVQaAfFh3z65WVnOYUfVOzW1VN2eUpVAUkFXHqbP7Hj72DFho'
+        'z1QqHgNByPQ2i4YeIS0YRmC0C8Ccq3pTF+0EwMTtPDfmPRN8a18N4V80KMrBmjpQGqwQtqqqK7/c'
+        'cUPEoc5doNGB48PWFNxCbSE9wV18VGgDmVAM2M4BdUqc77lkxrxghC7iWSlDfg5MJPVG9Ru3g1kZ'
+        'iS2DfxTPe2Q+iiWpo4IDjZJE0cpGKFfnlMwfDRyz1pDKPs59IiLJInpXyEfODtMedQ/OYEQo3IC4'
+        'lhbyYxk0X8+yEzxCxI8D2DSbkb2DuhciDzflxTlTbJiqkDfw274n15ZnGzG7eF9WCFZgvc8yao7o'
+        'pO5M0diLrHcBYlRZJYn6aXD/zCka44i1DhhkVtjCLHo20gBiDaa8mywzdqQ/TsRMONr5O2lf+qnr'
+        'e0uxKLzIPkRteHYM0hme10iPvby4jSN98YEnKFIDAUADPnz+gEdWjqzM1lD7mOO6kzXWa4DnF3Mc'
+        'V+94+FNNNXDBCWdsyp5b3Lv4w2FUujzY0rQx4JreN6rmJiKiWQBThDI9mWfgy4JNptFQFI77EwLj'
+        'zSuYnXMeE9tuXKJOYLAAkhtIy7bbVaDn3L7scV8+e5xJgb9D+buvMU3iW8tYUIgzKFv5j49HKxhU'
+        'r8uVcBzdOFdEYGxxOZDcJL8wreKNjrXInZ38ERe5oqHH9sKVuPnoSCYCIZ4NXhUdzhAft29enAR2'
+        'FYfWijjsLa8XMHYGzjN3LzahlBULcc59BieU57lqGxWQh2L6Hft85CUPjy3U9KMVQ+n23KVKLfzD'
+        '5goRdZBNPz520rpoDVyfpOUCqc8YGs5jKMZCCmjI5hRHr0IlDZZT3vkZ+af77u6RU6mC0TA+ARyR'
+        'PvqSBk/cjopK4MJtAkqo5dRz93Wcj1ErB2XPQkV2zfCMzSgJd9naUZdrvfAKS0qFCXzpqDPb3Cvv'
+        'LITgvVCwlDG3UpNmGO7WCaFhbp5ghBFYbAJQk0ylpFx1G7x6bBEb5a19WCFYGme62SQlvqoE/8/3'
+        'JD3LuypYGdC+Rn/uSszQuUsYQeF5+hVkz5TKh1V8wKbmhZeEFwC5qjNJE5pm/o0/dYFQne1WsYCs'
+        'B3ZwtbZu9482LftMth+sUAN9T5ZWcJ+aO8F7H4CVK2mE4osRNELUp6fS94+P70iU/DlH2sckKyoO'
+        '+WUe7lI/sBBRp+PJAGHxbxLToVvEnJ8bE38aI9sMI5mRsB5pN3Ouymsv96+dYS1HLvAwBCJMlfPT'
+        '4nTP0n5lnd7RDKfYJa8F2AQnBIJdIarbLiYS/mZH3y5zGAj+Hsxyvv6JpbLiYoG16qvc3qivJGXo'
+        'xY2G9UFA5b5bIgA+x2c/S4nui/ycSl8hmVKTE7kSVHGpJYUGCpBfmD5UED+/wuW2IVk6hjNOmfs1'
+        'wWzyjsW65wmUi5H35po84VcxAR7JkBB0ryUC/W8GvOBTT6dFppcZsecGL1P8HDPJuASgXy05capj'
+        'nvV2KpibZEwMkJWnMZkdnw7bfsxPOByPCix1EV7bD96ZOfE6ZPcY9LF+jBNESRD74D86dvyj7S75'
+        'B0N7SYH1Nz+7YvHt+wY/JSj94yyJwpbzCMTSuV2Np/0rY8RCgBnjhpoZiByemT08JrTi4fhPpW3r'
+        'n2jReJGhWD3UOjo/OwP4DAsANgLnGK+aoQJB1JtZ1C5tjsMLI1alEozH51zSm8v+Mdn86hTYkxEk'
+        'Tx3TqIAKvbc/6Ry4Vpxi1c6t5K2SwSzvsLfddosYeTpSyxCGi02Mu75UgT+WynBZyn0Kk/gajxHb'
+        'ps88GkOconCMNi0VblbtaFOq9KPjlC0807xvwtID+2cUlCN1nxTM2T3sKFQasHXGxY3mR0davXGt'
+        'JrAqyprOunljDG9XIA29HLHtXgtQDsdZLU3cB0G1Tc5NX3SLYtUpx4T2DOK7IXCbLC1zNRcpuRo7'
+        'TFOYMkj1becmlwtoCKaxATuGkAEj8jHeO307LT3HumLDK43WJ10dX+dZlBewKBrV690W/2oF8Pwd'
+        '+qlTQLWsHWPxVu57zkflLCQ+sJDIpfYlpeCiL60NhskLonIwZQ3vZPrjG04g7AAp5XnSmWe8VtNC'
+        'p/YAs3DFkjMI+SEancD5eTsFIWOqLofgOFhD2WQ/7b24EA5YJ40YvEb0jOVnaVvTlBR/1VNEkS9E'
+        '3AGIC7CT/Yo4hcMdtS5MtC1MA5nxj1ijI6bwtexjvVmtNmGFKMzAmhTtwPjS/1xPkaIX1qACm9KF'
+        'aCI71Fnfk0zVOYo2z1adZ8KTtrHjW/fOULcZ4i6aPI545fZhnbATfCxaRmuhTei/zn2DB2QYUpXl'
+        'brDP8EUFTWS6yu9BXLHVFSJUTvPh9NB5M8Ogpsxxwx1/JZ1VyRgB8KDenQgjpOIuCSUV9nhcBwlv'
+        '3HQ/2bj0nN/k8a4AcEbunJnlmr+tc7CJrKyldQreP483ZsC0TN0qZt5JKplMEaqueOmPuO1A7xc5'
+        'COBP/DqtEiHF/tHGH++kwf+H+JcZpRC4lCIdW1jQfrmOwGyIVW+mG5jWJRb/5JPJhHrT4PMdiWfG'
+        'X076UzIFZXe+HVx5aJZM2lvP9RqVoQrbZgncQQcxsccwM94lRBmhoGXV3dQmrNsE+qfvji3Gl7Ay'
+        'vhYBkYJel88HuidAyoKZwepfyayM2vEsw7zyayTy7oAF2ppdIJ/V6dBe26Z0TlD1476hgXUR2C/I'
+        'VWhJtgvZEUTVn54AKcw5PBzi/7WYWY9c44kHJDHM0ZLJjTXDv8qerLW1TTkqbSoziiN1K44uhjO3'
+        'q35Jtf+CaT7Zg1YFpeyVY7mLWLSbidha/ujsewYyZk40nOCMuyI7GgiWCQkuekFd7OwhgyjUjIQV'
+        'OUwDY0eUiudrfJ9JVN2L2Cj6DAlBtzUirz5uWvWLOf6u7JDX5fF8a+r0bnSzh3s17ZzddrEO41xZ'
+        'viG+9tQd0EB1R6HW5i0HZrOWh0k6NKtPEdjXa/LpAiv/BNBB4pM/gfABqddYw2a3rPcBBK6wiDUO'
+        'WjsymwWmuKgh3lvYpOvFCm1Caqn83ud+yTV2H6f+rqI0ClsAZinS9JslEqwkP+LSbEORErmrfotZ'
+        'QJIUDAsR405fOg59oOF30x0NRMNzQXMNGGPrEf3YWckPBPH8MI5a7K7aHQfq5vGiI0A+fsobidnc'
+        'jMyv2GupHaYRlK18lKaC8qtlnAKlJIXJmOmy45GdfGASs0nWPxDx6gqZ3bvzuDC7Gsi00XdefwjL'
+        'i5G92iTRJR5tdwv8P0YzbD6RWkH1y7j6KTxVzQKjjSC8hm+7lFCe6vqzdwshDCB5jX/PrXML+oBP'
+        'ZDIpBdDf/gScz9+brGQOwCWmAcEU6SYwKldyNLSiwdL0dZTPLYwTPF058U+wglqnz30EwNWxjeAV'
+        'OujU7QoemEQ63/6139J5kgOcCtHYWTQ4O/5U+bt8aUOT4MjH4BRe96yrcBjoBG+NDeQXVJ0rz/dW'
+        'cUte+u58nIjE4AM/IFjinmaLQkzHmBa/aMzuKb2YGe+nB5HNGccnWwZoEbHMNgq05nRWKeCUMNz1'
+        'A3JnxdIporQAvThmNc0fRV6dx48ettLmONjRTQdQgjeKNky/dps+FH62zui1VVg3Fc7RJe0H+dEB'
+        'P+WU7jopu8WXBcTrqzbm6iIx95/HTtmQJiJVp6aeoT5IxLgAO0VZCA6vvWst8JhIkzRGS2pTm4/m'
+        'Xg6d7kUEpGdfaYU8vWPU3baGqI+MwjXOGuGihW3uF5pwVrpDCbq8xkR+DUx1hprJ2aSCRU8ECmHK'
+        'tqiwwQC4tnlgxzZS2YMR4tLRHf+xxJjafZUW3Ck0I4vuR7ksB1ogkR27RgWnVe1LKcDXBq8p1Ckj'
+        'lq0hC1nbpJMRJA+hrQpkI1BocdRVv6ve+xUEz2Ts60X27LVt/uCjw3rk+GWocARAQQvmUjF25T67'
+        '7tCKyAgHlxp1EZFEvWbwyopWnIyhVR3MOn3e1eOucuHBjOXdD6H2BhafXtbnCboRHfvpyPQR2qCT'
+        '11luLbNRh+Buh3kU/3H7noKX9S87XXtj57cIE8q01SXYCe1X3ZsQ7HsspgjSDN1LjxnSaz1af+hj'
+        'eQvKkN/F+c/R6etJ+hGqDt1D9z8ozEj/xVNGkaKz2SQjLRpF+ocDnqgq+NF633q7cqJfMpEjCkX4'
+        '1RXen8dSiGxN2h+Z6Vw3hRMshC0pKCvGf776cDbJLt3Nk5D4sBUJfdCe4WUmz2bpY1qyDKW0O+Cy'
+        'cPGD02xEbeUGxqPPXujO5vGNphdwuOPYMYYQQA0warCtr20CrlBe59MaUeeJDLh06Q38t80QFIaW'
+        'tXoCNmciHGrzj3es9HkjKpb/uUGQXP81AJMBDvDe0XD9jrH0EP9rXZW5hAM/uSCdPSCW13fBwgti'
+        'l1vTw2FvcH+CwWCvTUYJ0JQsXe+NNR7xc5u780gaJHzOVPqPd8MkUnLyDSvm2iOsStK7WnlwcVmG'
+        'qH49BtfntCNMrwHjzKPQn8+KCotf2H637QSDzO38pDX7u5bSNWpv1Poo2nqiiBwo+oKXQPgGG/r/'
+        '5vWJyfJIdjIfmX5b+wq1XXjvD/HgrDDDiS8QJK8oSJSVYKb3S7D01mQSfIVwo1GKMRNBdB2AUrBa'
+        '0c6IBsJHtgX5yr3+FnyadmtsTfo+/wx+aNYkIUdwJfBqM/Wb0ZK8w9GYfk3i/CboOUsK41uaMDxt'
+        '1/CzAk7jiDXxsXskVxQVW2wz389GEI/VzOc7vOLvKr+cOuAHNuNCfiFcW32BDf0IuDg9EoBUktEp'
+        'hUMI5lHfpzyW5/i7cmu93ZFLeSJETo+kMIaBvVkCTBK1P6downVvxvQvpKnRgGwsfhkwHsY3vkov'
+        '9r9Grrjgqw2H6UUdbkCDUlG+d9D2Ei7kNYA9LLnOgxFceyYj+xZuiNUN9CATNI9wbmy3Oe2wDecq'
+        'UCBslDSTPkFL4Xg1x4BznWwkYC7LJgBEOsAz2EpmOerMpKAHKye4wNyJ6PdVCHHbMIHk7Ly/GhST'
+        'Zyxw2JVtwTqUigdQu8rIlh83e5zMfLeAraA5iKtqjOj2P3XX5nN4c0Zk0g2ylQhh9lJRkMtN0JPU'
+        'CP1Vh8kqYmHCm/jZvDM3usa/Dqjlud+XIALHYbvsNktk5U121X6B2pQdSQyIshsgA0Xkw9zFb2GX'
+        '5SsZC3vgU8Dq/lKDEom6fexWBjFM8G1tJ9zF4Ej9Bzb7PaQcjGIm1ozhuY9YH1TO2jRY8Y8H2CL8'
+        'QV3X26lonHgTbxqfcT6eRW9Y9fqW6fAAb0m91rZSqkOs2kKLJ+15vV0k1XDHWboDAQYySuw6nBXp'
+        'sYAiY63civYLUhAW/oTyoArwjkTSsxMO+u56JQR9aPmJQd1CBzlA09Ne0QTJeQ3cjjtVtLH2Ojii'
+        'GSbdfgnPEN/jpw40s/qvVw9GdtHH1QM6+FWe8j+KJfofL8pGueU79gUCu6yRwohxOIbDpNZ0XJpf'
+        'c40RDm46K5llR6xcsSkrYTc2/n7JQRbAqCgT9tz68A3t5/gYsoF4C1x4u9KL87eJPQqyrt9pLigK'
+        'OIMQU0L9MRn0PLzS4zJJz53SGF0/R8UFKkRHj0Id/M5++itiWVkBIhb2B/v2qbQ5YITfEdOYAGfm'
+        'Rfr8ZPFV+1SnzLJ9UhmaliSARL5f+0HHvTCQlRopWYPD51eYiBnxOAlTbhtdxo6q1ephsgQHNvTx'
+        'B3K3+O8ZsJShIOmjIaPxB4IDQ/3Pt1zPmQwed53RzHQO1ZwUyDcDEicN/VghRFl+zh2NQqIQmwZ4'
+        'bJ78KbQ3tCRd5o+rLiRJkAHSH07HO/uky1G3MMNrVsPJhASxYojPrpfADgklS2xjmXgBFx3e4zjN'
+        'GUrdEMfvtDNFEM3ZCX6J123o6EV5SwybVENVzqKO/AlgqaS2lsVLajvQCsm1V4GbCA9txupleVzs'
+        'MHT5tHFikfgl/NtETAtPPZ24ac7Zjcnctl6dSuA2pwgPtGbYMc7bQ1m1KDv0SsEqDaJRNi1oRGpc'
+        'i/Jo1gYqw2rRhJni4it2Zv3LZe+kXXltxflDAe92jcgOMSj3vMPYtoWQ+L4WcHq8+8IlBLWZDJg/'
+        '3buPV5hMBbgMSyI4TR1wDBMNbcsuN6pZWrf4NNfbjlS/kbpEVuJej/SzWB0Yqn6mOcpUcgSddkDj'
+        'n2fU3pCY8iqd2sY6V3YjguwnIzvLVIHpzvnqpOyVf3pPPyGRVpB05u7SbQqiPnTJm3ZdeAisYH4a'
+        '/YRW/4lOCqJd9fLUzs2G+RnCyuaAyB3AbChgvJxwZHcoKjNjSZ0JmwVWWkeN74hdbz4xNhyklKsM'
+        'WkeBeWfhDOPkLgRXzb0EfKNmbY9TkJheJMugRLpKb2nu9Nnwm58vz4vvSdAqelP9bO1cLW+ce9Qu'
+        'ofac+OlI/9wz9TprLgPWHDu/U9skWPBdYS4a/oKMYkzzUd1IEa3OcXO8aPrh/iuiXI0DtCXiASAv'
+        'qsldT4DcpBYoDrytH6SlB5KfmLLjz0nQQFvmGzJuvUhoSFpfQ7jnnHpdhtARIMkHnVN4dtQYoEuI'
+        'cKb3liJXUliJVLgqh/0yzj/JO38iBaDRQ9a0xydHYuNHjTjYjD7puEd9jI6Gg/ZU0HeVSp2Akgmp'
+        'qSNRD3ZwPJ7ay4zLtgVcTisnytZ0MeKq3ht1tcjfWK3Pi8hkPuiusiSnv/fZXkGJSLlPFF9XzdEX'
+        'HHFLD1ZoTnFDJds2n52h/ZwUiztbs4QwaJI3waoxESL9nAMDrSvo/mRORLjT3wcjbjHPxrGUaL+5'
+        'eiQ8zekVaeH7bQ8NDEw6rj06gKpviNiOhi8TAEhH0xWcEcHJznUaQaeWS51gpGGfA9LtDje+NYC3'
+        'l98g/DlMZKLFhANUMEtAmLgVen8dIvjxh/Mq5CYNNvdmNqpy37Mn4kBh45tZmr3lemVXg7LAxTLc'
+        'vot7FUxXZw16mMPWHHS495Smf8JpTp7VCBEA7PE4HwQ0KETPBkL0vaoW52R9TMGsuc+4AtlJ3uUn'
+        'imTu9PQ74N3ieDToEOXcMeJxVieMLOcBJEmKsgtkHJmGSC+uMUJaJIOVKwhRPchTXH3+mB7rUW5J'
+        'oqwbQ6Bt6s/jctGcQEyrljxSWcjJ2Ww2JCx9eZURky3URr9r8h5sFjoX7A/UYF7/5MUef/WPmRNf'
+        'zhY8xsXPg3VqcTHaF9RaKNA0Uw/yjgTrlpYQ6fSEUXyin3DsSVLwMVWYkiF+e/awRRrQHLGGrC66'
+        'nkW3QFoB9UdnQuIyjTo2KUx4lClXS+jYqGow4FEw0hTWEAHybQj/+UnlHfGhMt45MOnmVXE9Rmch'
+        '7Sa+GdHkcVPqUyJVtRjwi0/l2gPfafYrDZTe+CfsRu1S1pTcALqS94MZpabJD7tz1cId8acHM6wX'
+        '/vhhHUxvrfEjBrFCJxJgeJZ0krHZGeIDp5cmlnOafZFfW25u20srDAJnoGePjBxU/az+SYh8ZwXz'
+        'X7m26rq69Qcgq6mZ8ahzC94Tuyox/F5JwCoh7rMABgs8+mrFevBKACUODL8WkBwiKK9WJUVQEzhD'
+        'uNZk4q1LzQDx6g0nDifpWm3M3p1fLV/C+XM1BVQX4oHVfRlFgnGfVMbQ+tzNyLvmdbnKirQmkIlY'
+        'OQS/IuGIqbohtsxUixA6wwHXIidx/EA8nWQEzNLLYUvSG1FFlFXVMWsMGIIIJ/h7hb5wJg6xBUlD'
+        'MkvBst0WLJ/0sD83YRib8SYiUkQbZQmripNUPJO6NE1Lq9z/wSGcNhieoAY9Z9cS8KbmGv26prGV'
+        'ZNh0doLfnGSlks+LqQIvl5sr/LXnYTNeA/wpu5Nt4z69Ihr0d2Ic+uxDvRb4H8nl4Cbvk9/TueG2'
+        'prY/UzRTD5do0hQNg9YpAqdG2ZEWnl2YOTNptZi60GMEmnDcDtvZVmCJ2pa20gBisQ5lHWphBUl0'
+        '0kJTjQQkjHh2EXVkQbUSf7LH5eH2c/BbNftQgL52ocqeFaFgJHvXlk38viAd9+1Nd9y8Nb+Ef+x6'
+        'v8qjjAo+MA4tJ2hsYRPjBaJ1qMUwntwCBxejeslGv4n/E4j9B4HxiFBn4aYv1CFRQ/Dr6xdT+grX'
+        'Skx+u0o7SeGAOlRTnPheqP4SZhDThynHz3378Y8EMC4tCR+iDhKtWGZByRsltDw5bcZRYKxOmOah'
+        'a9HZejklRnQUtZo7uONhLlnqQDkZJq+ElVhSB/jAhc8gw9KpRwxcMjMu8csXxRXHLOYKT5cbQQ5X'
+        'yuxkXgfBxjPZ2KGfz0upF1fObYJNMrrCMHL8AsL2YgwG4WP4Lq0MXl518YBrm7ZwO9wO/33omKYu'
+        'ZDCIcMsfiXZqj4guiEhOE+2cImtDH0JuZpY/lUh5Vv8d3lByl1P/O6vYVdAUl2pNEJZkLIzPeHbX'
+        'lUvB7Jx4zjBTPf9wtKsjTc20Oikb5Xq716By8IExvEuR50sRX1fGh9HqCMOwW/V1LZxSVlu0IZAV'
+        'sxSEBD+yBkX2U5ygQeeRUgN4RXEJVuV+UuCaGi2Gnt6WliOJ7m/oyA6UeuupDAyq1Yz90CY4iwvo'
+        'Qh0I4Apnh0NR6ZxUNDYzad2IMhWfC5lAuZY91i+c/v1GYltHxIXEUW7pfmJSZP2BH0waQ2kcKSOq'
+        'a6zn/j7p7bipW1TQnNXKMnoU50M79aLZ+yYtYKn79OHLH7qA7RfOrGSIiuecyxzpd2HlVMADRKpa'
+        'WHLlj3/UE00i5ziTP0aD2yksS+wFjaMCmKg9KQlqI0/JH2HlBIsflrbOW+rQ+1mqlWFyfWRdiyKc'
+        'N+ADXZpS4Tj7qrr4enUvfJLVwCCW7t31bDFk65LGim90uzxfI8sMjBAcd6tydy1P/8vuACFdHpKp'
+        'sqDQTfUP3+0cZ8w6rVzL2J+LxqijdllCvrPYNvGP84LPlGRB3i19EF4UYuAsySkpKjISMI7Ty4bp'
+        'P9AbTItmwd26BNBaJtDRlj1CXnf3htRunKFcvN6MSPibaMAaDRa56/z2JZZqTduwuH59iZ6LxN27'
+        'SBPu7wL7fKolGuioIKBpekzA5yNfh2v9FsZNBHIDx+NMF7u7HqvbrBxdnzV2doL88Poa5wXgT4jV'
+        'zC/WowlQpdyO+9RGq1LNpj9/V1/t5Y4K8b16zyNN09FKZX+TY2LMv3O2xZUPKmLdpuKDZ2CJ7sE/'
+        'WcsTEFbT9NNjWvjUGOYDDiERf+m6z8ylVHtDl/PM4pZbepqgcpphF3fqCi42R+xb3pBbWeDGhJAk'
+        'QLA9xB3z5sYO5zerhGoBllChH4QJLayglscnffS7QANLypu+hH029hFyEBMrDqY2mVygKEUr9rOr'
+        'Y1V+Xhqo5VoxKDI387r0i9jqJgTK1Ammvezzn/z71LekUy6GAAJlebl1MqKwhirvajBD0x5rDIgg'
+        'YoR9g6cjr5ZnXB1zEK284Ao4gKTY5QlpwKW471oR0ZGgU9ZiiAiM3zgMitvwoGOsTTxebmNwMH8I'
+        'tGZYCDx0nCGnP44o23TzbAbczdKZYMBDqPNTxDanOVldDs/InWE+S/qhvFcGMewdQoUJOrz0JnIL'
+        'nXJUq/gExuuEYnW/+eK2otqT8oOHCISmhPfCt3kOWVxKvizYKiyu2yPaF/GHnXhjCZ/zyfjIeC2b'
+        'CTwFd6HlFN0RtOGB/7m/ZJuHWYFeO/ZAKCIAybd9AOltZjv6FIHZV5f9ct8V57G54qsKx3yuKVOG'
+        'MpiyLWD9yVq6kc0g1qBaOgyurwKjPrDB8Hc6V4GCIcFBjY1DsVTAh/v6qYu+U9Vh42pEw1PADayw'
+        '530LzSi5MwzFnin7S4B7M/MSdgFOj/kGjLjxC/Bt28Ln74+jla/6+RGBfVBDtZnxjKBYg2L0Dg8E'
+        'muQuhVgtTH60kEkHkVd++F4B4S3+Mi0kcieknBY6fs9OpCtrTxKCAYwquLrYgjkQpEOVBZGQq/n7'
+        'rOBT51YTTxMF/JbypBBApZjlIdUw2vzrICzxQQ5NFT27jTsRW4yGQE70IfBSkJgmZIjcdoXRU9ai'
+        'sCJF93vO2JKplJjVu8qNYtb06TXOMci8+1Ff9IxcPgSM5QV5Bg0oIz0Cp2wb2ews83BzyqgN7lGu'
+        'y3nncbzA3nUmyN75GLA/LhhWgQUHngZJKHEe5wddzjH/s+/XQa8w367iU0UxikDuqZLhpTzH9Vnk'
+        '7lMVR9R43dkb4tQTbAiTsHoK0tTEx+93OhmE00S+ogGjT1eq0kB15Gv7Gqjcn99zL2pUkNNfMHgt'
+        '5+KmprUTVaZXw5q2PEDu6QDc5qqY6pfFZBT8txLGOFLH1S6zYvY2ow2VW7s1MZuS2++6FKwcxkcm'
+        'umGtLUC1uTgNVb/0i6OTct2meJaud/djktbqMoqdW1///nVTUrHqpnndze038oHkxRF7GQKExKXj'
+        'LAbadEOLcWQI41Lg2qGWj/oy1mIHio3fy0ZCgLSXjs4WWFxHku7eAivZas4Nc7yXOTOgQ9Kt8iQW'
+        '+8TT1uNglCD31lO6Jwak9WOnzOq/E21EtINW5ZsM28MfxDFnioHfhKjir/x5acOTUEngr9V9OePq'
+        '81jq/LT3wtnZKN5NAn+i5WA/PsP3tbHoQ+zT2NvwcP7QNljpiec2OeQtC67E1gHpAFw+RJfktXk8'
+        'TbhU48rN2LUmGPIrkFvE26MUzZlHd/p7mZcIXi7+ULW61Pv73a2POuKa5TUbD9I+yQVBxTa+vS43'
+        '7lpp+BW0eIGOqMH5VDt8XchoTJg5ul9J0/kjvkV6ZIV7SFXJnMlYONCTaL9ZRw273YE7DNTIVHvF'
+        'PUnUH2Fby/LfHqghk7Ew518TJ2iEH9IRKpb4FNCcMgKPnbkJrGxv80cN0ybXOMCb4QEi/RafOnNy'
+        '5G5GYOFuqiVYE1KTgInjzSrEsiJmlfiYp63QYaEP4GL85uzqiJ27aVJQOddYxB9CFt4OFM1vqjSM'
+        '/ioOtO08FKL6ciA2aHT24DSPe2y33aBHGzJSrBSLVuHDRVYIaLxUnW+KBWBErzQWEMnZ7luzOh5J'
+        'CjWePCtiFKsbwSinEv7OJv/3VoSOekddAh39ViS0JzFWdTL1FE/jCgCA3xLt6Tk3vAksM44pPEiB'
+        'z5jmzIUNQvW8vRwAkW5kPWn/PJB6ATCJkOEj0c6G8r552IoG8Yp2EADcDrU8yBxbkKNCtaiQA3/0'
+        'ytWi5ZUAbru6AyM9LugKmWBhAxXruwECHOHkZ8dlFeU/BsH30SI3pDqNgWzdgt4+EY/q8n0KFtdA'
+        'e2zRSagbUwDoIvaeW2MqWYqofG16Po7QGzAAhqaLL+agwyTfkLZyUsJQori0Mc+eOB50bNA00Cue'
+        'QPCpiucdQWzZHyuVmX6CyehyeBfvct9nmkBYdNyke8I/krle+7iwNZhfLEOR3mc6TxH8n0RIrfRK'
+        'pf8UqWFjDn1rktONnhlqW4565Hs8xqq+b5WwU6yjkhIJzLxEuu9CWkL1LGCvFdDu5hqGa0DI2pJc'
+        'pKj52fxRpWsW0/+OtgiW5a696H7+my5wHxLHH6xgPDzOcG+ECGxMh6ASVWJAOLk46eFwVsFjIwDu'
+        'SNfy0XchKPX7xDwgI6I0eM0xLHV+mZrk4Oa5B7/Won9rg6qw037lwYvQquxLT/+qaQEG4XLCWTDo'
+        'MPBgLsn54Ffb1oc0NBvjSrZdoFknz16eCB9RaGSs8/4h4xgwpwMYK8+27q0DBYQWLxC+62v83uuM'
+        '3riYxGTi8ko1MAONVzGZ8IUydbsNiu79arNcnq9fJTbbpSS84E/qBVmjAEoV0hZCT3vKTBjuXjQ7'
+        '5X+cVgBkqvFkJRRHD0lyS1pyuPnHco/VP2ncVESDEay3s/97xcP76NVa4A24N04DVeHjUkeqmT8W'
+        'cEeNiQM0nLn+KynLNbCNiwtQ1UnDmUo9VwKAfWxHDpLGxB+NGLnnD8f4TW2ptZo94hBdqLnsKyRh'
+        'YvIwWAMyLxpyTj4wSq6gaw8OOoj8uL/DHgb+9a8vUc737f6tT3Rczd6l/Epc7nf+WwTeyICJ2JNn'
+        'eli7NU1p8CWSU3n0tjyjtx8J/VOyCG/3uLeX7JFSNTj09RVJnNl0khDxoZ4E+Q7Q1So4LqeEHsQY'
+        '774cJw8iI42kDrWubc/oJNhItBUH5cPXTCnoS3E8zI0zYOYMrfk8A5r2e5n0nTDDkeK+ByR3nO2p'
+        '3ImKohBnvbOJDOlGbrKezhWrNmZyL4bFwFelU5sqbfSgzUhULyaGpkAmD/mje6Kg1CJ35ofr8xm7'
+        'jbjIendJePn29eEdcfGgeFqL5ED6K43KXWS/DOiiz+ZL5llRFMo5egBaki+2wceBGwj9Bikl+xea'
+        'RncqfmXv9PWEaT79KwMPUOGJA+UHb5EYcORG3UDgtZ9q9ZaJxYZ/seVwnjYgk1/ZbfB10b2qNWBt'
+        'lPkhXipZEAl86l2rkyaWiO5ylB4ejrYk2oyob1mY9QpmzBGMQS5sTuRPCfJGZYSb3YXXp7a4GId4'
+        'B30Z8x66sGhV3k6D2zsPjaTSqxp8bfivgwdvh8UjobRO1lsOAL0+u3gRWJZvMccPIGv5Mbh6w3Rp'
+        'HzYTG7lO3MhzauanM4LQpv+d0CIBqJ2LYV+SNPuH9rYpMUgk7O2Ms3bHDrCEBlYfAaP63EfWAxYf'
+        'zQvA7A8PVNs7JBTVm0kNFM9t9IH9egtnyrhBbk/E+82QE+iVYLJz725zv9Qfxwto3sCKLdYhQILO'
+        'xRP/FASK3LPEY/acFo2vhwnxsfSAUt5GqP41dNbsZG5D8xxDg5dxp4P1xuHrCecxiYeE+kCNkPJH'
+        'vcpTPadQ6Z/r7RWa7IN1QsZHzhhq5UpEQeoIzQqkijdZVCTOIzD7a/tc57b44n/6MgR6bkVw9FL0'
+        'XDSMRjKk590p2PgEouR0oVte1uGVay3lpEeE8mEjxOptOCjLvMRHCOQj06A++87Js3hiQq4+3mBV'
+        'OWVpPnDQqymgMZFSBVou282pH6twt5PaU3O6eFdh1a5RceDgjdb5f8j00+ZfuxRvX1eR+/AKF4Ca'
+        'aqDb+ctDJvpNjmpGjxTeN4llTWf+0P4F3x8EGvo0lbM6P4gzmsZiBcAcKAyXaPCLZHjUDaYWPs9L'
+        'x9uUHRigZvuttoG9/ab5aI6pfrXNs7Oi72ZZ+Q96Bha4aGDOkpfAAxNTDxCQMT+D/GQncGFkmmtd'
+        '4IqzbeKhdNbGSLPCegMu1avjTPDoxzgOY/4kE1ffkwFdZMluPuMhNadKvuR5zoubf6PiK50Sx0yX'
+        'PFmWDUwcuBAQqU5tx0UswsJBx3cmbVER0oQD+/eLXBGfDHXQ/FdvDWKOEjyMVjhEzLDvF8ToPst+'
+        'yH15Mc0kya13A3VTms8LWPpaK/d4RYij+qx3Fkwzcn420y/mndS614ueC1tBEnDImYiRYaHb0k2h'
+        '8mk9hNy4T3o5bD6Q0wP1Qt/BVuekCOMkl/l8ENl30c8qbPbMgRBezHGdoXdi3EO928w2YiNSCbK3'
+        'zvT4zJZxZxbt5g7dDQNkiUIgIy6OWQJcLzblCPXkSEGLfiWz8/W5I0p0fGrrK3LT1TL8ZVLMv30r'
+        'P+Sau4iEtXRib+S3+UkFTzojZbredjN4Y98GE7n7STbhhdjk9Pku6xPdDacjTk9hQAZaIQgYFoHi'
+        'MQT4AqY1V45rNPTzuTawAXrkNew0g1I+nczhjjRIE41B7txGgQ8kEE++wj6FrfnjBMdzljCKEqsI'
+        '8p4/dCQ8e5zqte/UIfxDq/tdyNvIVs1e0Vg5SsNjZk1zSPqcWZSpuETRyXbKA29rzSXnki674hW0'
+        '0cINSJMvzDOsXLdkxGXUAcYY/BOV4NfBw1Kb+QS81LTSomHQUqlkB0iZ+KI0IhwoO7iHW57vVLu+'
+        'zEFhi1orK94IJWpPXJ9hqjuuQVX4gmGXpRqzGBATyKnf0aV6B2XVd5HRczRd+DeJ5xOrtuCX0hg8'
+        'BEjhsMQY5CUfZ0J7oROxTl54bVYS0YylKuy6vtoDlY1cgwPc8chYL0nVB1DX0fi5puOeg58bL+V4'
+        'gcaq3GiLr679LXnyzwvCcHiVnxFNl500RXBx+ssi8v0jYTQgJd/GlaspI6r4XSUFr5xj6VJEkFZb'
+        'VBZOjBrqUyimX1nzQYwmVWvpTDInPM2WirEVbJwdxxmkJ57XfnqikUap7A96kmAXaSaeJLHsv6Yh'
+        'IROKPjcisq3kHJVZ2zB58lLEq2cHfkZSoRsNkP9epNxbjaeHBSQjupcL0RRF5Q2h83mwmGPNM/pZ'
+        'G1qA/K6CgfwGpp7PQ3UvGWCtQORsm/O6dw8esStFERaIZ+X3n9zAnqov7YG5zF4KoyDA/i/EvaAR'
+        'tgmzEr73VlVaGpHEcjZW1XML2kYoFk39QZfTKvRSa35gi+naJKgip5o7FgcZjC+RoLvuVVxzdCFr'
+        '+zxQ16ria9Ho+63DJAyb3AsB78TEknaZ4jhSBMIc8aHt9mxm5S/A2iQXwsZfUzyPPUONQnQrD/sD'
+        'mgoJHIwuxahktaSI/Q/spHiZc1UXUXFVb9wJG47SvVo3Vji190CluVa2kxwtaj4m3nFg/DSjkLi2'
+        'VoxggIjeDCW+wuNll8+UKXFFGscWFLt9lnxGJ+o7juto239RCZRi+Nah6AT68HKj6FQqB9kWi4Ub'
+        '5LEWYX5nbbAdIJiyyjgdXsr2DMskOBJBcZ/MSnzS8O6d4SJK4I/0sKcrigLuQ/MRLqf7v28ouVj4'
+        'MWQqWAuJ3JieTD/ruORlbyvr7xWeV/1aIDVtrwjW93wW+8nJL1kA20BQ1wt5PJmG+T3kGBzxKL7C'
+        'yf5fnFOTYxVnRj8Ch7uvKxkZtEa6+DGvr9Paq1Yxq5/YFELAWKCHKJ9vBeRiun71lKH5+NNp5qVr'
+        '2K4Y9iI8T8iLEq0ShEgL6TqeFQRoTpbpwO7Errx67QykCNixXSmhi1pDAvc5HlSV3ZhcBusBVfn7'
+        'GDEWcpAPM0AL0Ru2FIj/3utV7hraw4j/kjdisnPwSMjM91PW7UFkKAShy9VEhct7T8Ct1wUblUkd'
+        '8lkjlvoBTIazfg+xBhHvAM8VATg0GkzngavsR6rG7EL9tXBqmCuPt/4F/jbbwkk+760neiOwhRha'
+        'aai/ymiG9TcQVdnbAYKI3wZ3HvWdDH0cm09b2UPRzDSjFR5gqew4hfQsYSQv1Sw3Ue4Qvlw6aZ2Z'
+        'hlOQ5mpCo+wkGV2WdY4puXhesD6W3gR82wq5dhLXMTiQWXP7XRKNdVxdLdlled/B0F/2/9u3ZvqG'
+        'sF+U6kMYks47wdD/6H2gIar7yvEcseuzQflZ7TZNql46zadJZJG8b8Qch4MqCUmleTxTdmMYlT9W'
+        '/6lPlcnhVVpyBHcFKQU3e9YH7CEUXWx6gH/8Jr3l7CVY4ptt/1EL9kQY+MGfmJCLnAoMbxvYWzOD'
+        'cwgs18TA3Qy7lLKqp7sRXy1mgPgBtGjXsTLjfEtTVcqu13uDiT2EbpzktIxkRWEOnADqydzLtq+k'
+        '/ax8ADbF62eCsVwIB5ETSToV7cpyqffi1DtR6D9HZ1LXB2jhgZ5vyKrTNPPpTADw4h/ere3lpRbD'
+        '/Xw2BobGkb831eV/27gSdDJJVrw5xNRXe1hodlCLA6UhBoZufn8X5LbjRXzMSfsgseGseIFiTR5q'
+        'YWosc2V3Y8haLIJQLpsT9Aa1KJk9ZNVnmGGkiW+qcWgF40w/Agd0nV7PgueeRZkdju9sDa7Npjjt'
+        '4gwgZCfxJ3KhJdNn8yxjWxXSA9VaBSYGg5qrJeEMvORjjTlfPuYq8rzvIbr3nrZiLIcYYv1MpTDz'
+        'yzpKqnyRKxJgDSHkNkKOzwvWK//TLGyaEnnWJssZVAL+V1WLMrO452R4Q1u7K4fs+rBh6mLQF+fp'
+        'hMlwk6Za3gCHg/+TnRnw0sSzaVC5w8fZnAayOv7g4dyxnbNcYKOT3rDSn4e1myMesV/c6dsitW8p'
+        'LctvOPHerrMtZTPQP2T2D5I5cqCmLLLuX7tMYeYsRfXk02ckBsLw3+wQ2qAKT3w9a+DsKCAm4nok'
+        'sRWEfJBRtVbQ4xHf2dRwoUKYtypcIRt4msKe4qPJuDb7+CLQ2f1uqLlr7kreuDK28S656W1A3yHv'
+        'q/XY+V96UPaYhNoXdOdNBzLNBq78Jloogr0Ru8/1wJ7yUoBT50PZvCwhhRYxBpcgMZwWiAgFIJS2'
+        'U4VW3NiHbpMOORN7cHn0+2twxJWqvtOBKFSLK39zss+14OerDw5eU7E1UH3WgiULKCvMnLKKhdBG'
+        'pLVQaA2J+ko/Q+wbljnriXeiJzleocHSB9SGeEbyZxMMOY2HMdbwcN+WXWg1KhXkUDBF379D1StD'
+        'nYTr69hBJC67zKXhsAAeSVZCT2Uq8lfbStdoQaEZmtYzO8hNmDjSKYRucc7g9/BTbU+Jusry7ZOC'
+        'ySRbzeb9g8Yg6nMrmIsypwVustkpR/W+oPMZjOfoPie3pYQK2FAlZZiFHcvQGy1fSlIe6NN+QCEL'
+        'pSLbsCZAt4i7UndUovqg+l1sZ5nKla7shUCD35YnTAFGgKFe2C9o/IM/eSJ1vNUm0jM7DghgFjpD'
+        '1hoGpYDRcP6yXrwWNbwNVTIsYKlRd9Y74ZlbnYWjIPCDC2EkiCgMhVafEKvnZaKYMBtg9b13b1XQ'
+        'LMToQoDvx+3lNha/94cOLmONEPPim9dIwL6zv4tDq1BVpTvTiP5vIiPV0Eyb54jcM2ZNf+EFc0Rt'
+        '19jKzUwpBaDTxh3NzFYp3a126jCuMyo5bmDFegFN0GequUDqhth44UEZtQZqWTBm2u9b8BpyvwV1'
+        'NJoByww7tvZRS2NuzivKHd6ngOZQ/KtBXByvl4q52RbMhodGP6qCWHnqWb7pGoRg2aUEvm8qIdLV'
+        'ByAvEHNlNQUH2KDbYBnX2BdTJJqQItZvkAjCbZKQrxTJ8NVBPSoouS2090EZJ2jyHh2VRVA4Lhxx'
+        'Rrfp7f7xkffLmUj3NYrMyR4XjsEubqLiHDaser/OIyYSvAutkfnwWM+KcZN4/HHDt9WvYApIzo2+'
+        'JXiWQC1T8Pl/8tO/DSpd3yr3h5SGdhk0VqiasFB0FVvomb3cgb/QsEwPAF4L0RALdFGs7qN0D094'
+        '3s5XERw3Wtw4bcS1WbLpisYvEMD0QBVaBuMVg9lSpEmpQdwUzTPnzADrwna3KvzY+wO209FJYuDR'
+        'sTd6KczQ8vgBt8wDlrKvkm0Qft1uiqMx/LCvUrAQTQ3dTvJvI7ImPb3vY6hUDHjJfFDMqK+fS65S'
+        '+0a/Vj/Bh6JZxAGdyOHfCkIudJHp0mB9EVv8w6z+S7FxCHWRQlobNzhIv1A+zXAegF8UNoqbzZ/b'
+        '/g80zDoG4t9JVvSpVY+R4ekSXL8ljmejsqnX+RA2lggpFEYYBVr31BAUwLz4EZcDFPZF9Bq/+e6S'
+        '+hlvmaOCm1gKsXxJ3kv167idLIN+QQtAGXCvQa8jWGn5B3btUlY+KF/WokIWVSTfAi7IiAMPmFrU'
+        'bGgqZn6tzq1yML87LNREgzFgaRVFLSA65tMonCLNlItPe2w9oI9cij1vQeLvPmFuS3ExW5OEqN+L'
+        'dYTqU4fF9VwlHqFRt/MBOx/BRovyvKktFwOPPMSg5kwa7EkMNFd8OPSpq/qXNhaJ4+xa/OtAquLL'
+        'k0q29broinPTT4WhsttugklHgD7AKP8CVup38QPWKh877a9f4RbbmzKI9A9LDlHOfZvPQsKk+A7t'
+        'Oy5NTl9ey3wAo/kiwev37jfuiHgpPD9/DHp1+bqLFB1lYZNWdBjiyIwKiMu+Re46OBg8dFUuT80G'
+        'Qb/dEa21QuRoeEMTwhszJ/ziztoo69FmnGjmbbXMmtDmo17vm8SlCLdREdcdes6OQCNN2t2QCDiE'
+        'rolLTs8mH3BFm57QO5KqGhxA0tb43imoqd7THg61FC4VHXPJVbF20UbIDqDl8xnuNcAqmj81ebly'
+        '4/o4Nfj+4zRMgSwxAJF1gTY1T1/eM2L/oTO6faJb06yWkHNHfRz5wQye20VA4k2JhPv6u853M97Q'
+        'SXBgQNxmmqdGcI5ZvX2P6WbyO4zGZvxHUynAO85syUtKacEtQ0luTakCMmu/z/IhlTCp3WF3M4M6'
+        'O6wIkysiTybO/kTmdXGCfJRBr7hK/9r0OigGYT77X4TgeTcQ/seaovbqDOvTZq//H7gXUA50raMd'
+        'mruFyJVA3rbiEAxosT8uJ0upqHhnlJY+lhQuCi5HukfMRwvMQoUE/N4yVKm++FaezYFufVuD/3y9'
+        'AEfFNImThZXq7MjFTUEqZmtOOY4rEY+Ip+aiJoohLNRCvv4Z1RP3rH2tbrxkheAJHiZnGu2t2cpz'
+        'iZI4pPfs78daV1+yjSmRzoS8XYBo/XMh9QvvI2XlWLap+c33EUhuqejz6dFIF5hbxBPPprc2NYJY'
+        'iDPqf0u2wLflqq2VbsvoUiuG8f93XgMSjcr5PkZRig8y+4buWAKnjoJba6glwc5C+WulO7ZrnGBZ'
+        'UkfGGYKpjMvmJjSmOuDiaHXf6ur7TlcN6l4BVe5gXCwxM1XYRCgNLm5nMCizIzetO7j2CPopUxw4'
+        'Jj8ZIzqC+BOUKXrDWuocW7trGuPtzWYJVAe3dR5UKOkZoU+ynT/q1pkpnTY9Y0E0xLTQ/qsUkyfX'
+        '7wKuJDdRYRAz1LF0zIf8YlWkIsqgAV3fGReQ8MRzgOKXM6ixwymcr9Qm2nxZqEwKTSQbXgULhXtR'
+        'nI+Js5jReSyYTz+WDCzklXsYOOEPz8n6nMbKMGMZHzTmlt9q3GI8G4xZ1PnoVWmvX53fSJae3Z4n'
+        '37aTfNdYnxuXxfs8VSfs7Q2DdxKAyccVx18cSMFPZGcWVzbyF2PzO0vDJeTCbrr74tHaZVsvQCYc'
+        'cWU5/RiUTCbZPmcelJcaKYe+NxICs0QPj7oCDQCs9ifntOm6KFeazJwTbqJ7auGQXzaDlr8/YW0E'
+        'hzBghG8F5cXHkBCbOOtsHnew6+otUrBq7Od7wDnbaL+4clBJ2xNzSuphkWu0UzhJ3gDWRi4BmvlG'
+        'Rfy7Qj2b+l3fbWgBLgaS57J4BPoNUUhO7EEqe6n5eEzMRL9ek3I8PO7uqnfiET7j97YVdLOaiDK+'
+        'y4nPQZ0aaMYfQ0+ZgBLNXV0PLMMYdiKXSDZaiCL0RmOs6T/T2PGWJa0IkvxX+cf7dPvtgKM5IaxJ'
+        'aQQV8G96AMxtxOzhTyd6K2rIbB32A8yDpnBdrcKClI5s08L4fGiL8ZC/DGhBThqwk+jWu8aVElhe'
+        '1z+i+bFses7pb6uTc8Jd9nbZYqjz8ZlQgTmykumRpFstBhoZLdpilWwrmiH9IPM4/ZcExCc6nDbY'
+        'OMjT+K1HzMYqG26mWzKTkRs/7qxJJvRhFolDe3Opb7gfYDNqqqAJjE8701Gw+XHmHEwPI4dS816F'
+        'PKsnPx/HqdOAdLARf6b3n0W/eQe5WP9w09aoYQCKklhL9SF51m13th3MelUNeD53vWaBrqETEGqr'
+        'V7Z238SiP4Ofp5kKTcxwMJCbHKxKy4bKSVjIxEUgxIpns4ETChlBEmsLDWI0G++qFvcPqPCGeNwd'
+        '1YWV3qQrfhleHMHwWnvWCTBmkheyrJ0hcq7ctDUn0SurdFQJtzLh+ooXmXKu1cptWg7DF5hmUOY5'
+        'TbC4kGpK/AHjtYGLGF4dLgeYcpCSFiv5SFCEps7C/br84FynXaBV1gVd4EDsYGQ4awQB34z6YS9+'
+        '9uswcyyNOnSSnVqe+qFZNgA4BrhPJlwhIdRCsFZodeHwtgcLU2aMmHYold5142EjhliESv6MD0lG'
+        '63oenWS0mEvxx2VT4jciTvt5zB6R0DK8vx7wwLTArgfWeqI460HzdqAvhFUVR/zXkJQ31GrIzWKa'
+        'nuxn7TX38VdIrd9DthNnsyJVEJf9A3wL6Qu4zv06LIAezbKtm0Qbq7tfslpmRxlSfhjj86ix7Sl/'
+        '6V4mbhH+Tfq/ybJ2th0+sHF5kxMskLkBQZdH/EuW/JAPJS0H+v1fIZOOaPIpkh+fKT0Zh0tnLtRv'
+        '8NXF1L+Ae61hDsXtcrjKh8hh/V4ScgEXtkwqWs8uAQdxt74bGmsvK3ZW10OIzR5Vlr+y5iSiBLOZ'
+        'jApCx3JrkUDxwvSB1Nw8TupVVzJy34IwTJLUfHywlLrRxquTyfYRZEvJUgt1l/DmRh9GIL9h54nf'
+        't6ob9c2nQcqBKDHvSm3q9uqcZ1yxT6FTvQIMy8FvvD85M8Vx4SHK/SN+EXmjuVaLKC3TZaSPsLGN'
+        'IKM87P7Wkr6OxLbZG8a+eSffqyxJ1GrqUcHILEfwpA7bDdL3UW3Dgw2chVkakqOXArfuc+zsQzoJ'
+        'vSLsR8Qcw9Lz5h2aJaoboFCmKEw0wH0WD11dJXfonVKkZRCrdDwmPAdOvLmuTUzfDV5Q14Kq49nA'
+        'MR5oZMdcZsrSiOLaSyH+Y/A0FFYw2xaahC2L+mSWBfxhHrmOrSiYJPRMJaRFrZA88PpQCmd37Uby'
+        'ilq/EV28IrBX9Y4bucQZNYABJVTOakgVxTtxMko5xjiUOxcXJ/6XpKiFIR1WbPCyJeV5VGmRLnX8'
+        'znaOxWGSPZofw8GtxOqiER2SdtF5JRJY8As9YDcEARFCwzt3N5U7/uiLzq+QUMvt+nP1hmtd1us0'
+        'BN51xzhQvILrgTOtFg2BTdIVjj3xXXgoEoQzNzk2sQaRZYdtLy3STMeQ5zAkSsftt1oFC/F34Oht'
+        '996ppgIbMmyIrk2WuMfReZIWCnDis7IGsCh0z63nwwRlKN9dmdB4lWNcJxymBkzBuwPrvFW9RREo'
+        'iGHUV5ttJjCYme/29kOAhWlMbLgAT7C7Qx7ta2OdK8QFwhbUeekDLBVQ4LN7qu4M35hMR0RjMQG3'
+        'jgM5KcThvWZRfmFFygo25/2wD46FmeWQrdVIH1x7g47mQpiORht9VcdrSe+0JR2ZIi9OGa6+twPI'
+        'm0vlnNs/v+T1wtosnfyaFWC+FIcYjqsCQ5EYLTOb+OAd72iGDWbSuiBEISCcJU8whD9VhYb18Vje'
+        'zKkfzcKLq83wHZonnLSudB1B2Vja+sGAkFska8sDS8aGGJw94qCd8rNEaa7w321XQzGMvS9+nO1I'
+        'YbSbMnG5WacpwIZhuTpSzigobrnFrK+cwhCSjw3rFTZ1BMHd5UBbLcnoPpmKm8OC1/8BTrevq8do'
+        'rPlJqXZFKDqk4VbzLaF/4FceB3agmFe87Ft8Zm7QjeHHn99TkDsqgm8zjPPjxO41twkU36cCeRqN'
+        'MUahplhoOz7OAFNv6WXKHuK0X3RlZ5ygz+jlYUgW6+FPXt7HxS3aHSpczH6CDPCuWoLXHxnLRY7e'
+        'nUUED1ASvM6pj8mfFaCVcjBQTC9DnPPQaDLML81aZtju/iiBYr9P7FcpJwjXx3GL+YFDp1mR1nkx'
+        'Kt7s3LckBiSlF4PCPbWD5+6gbUIZiwa7qqB89aiLzTYOSsB6YVqlrAFZsbNR600zVJxkLdksh8sx'
+        'po1HsMGqO6cHlsgc2FeE+3wnfASVZKRySJQubcJxyJ/Am+jvA9ygHja63exIVyj1UW+5FHIGxmdi'
+        'G7XjpRqR0VEfsZRDuX0fQgKg56eV5tXGF6AgTNOR6o774BGAp06c+uoNd1Z8LEpXJKQgKAHYR0fj'
+        'F9d5D8IbNTvcPcPQnKPlEh2r9bc3SFqWxfCL4zIG10VfeOyxrvqXxx004lVdERAqkpvleCP7s0LK'
+        'nNMF7jxQPDJrbC1AtnoNWqJV4fVmTQelXh0VLIvlVMXINBr30IeLhOx/NjMR75ompzppXw7tqz1q'
+        'YNBnx99HKEtri4eyQAYQrq0DMQXObm3NVG39Wj5PbSWMFcDPNsAnAJ++KzgBCmmm3zl7woJPDGxo'
+        'd0VHcr3mtowKeGNHytl7oqQUQcoWs7ZwnKa0eeEh79kGtYbpTjUxuMpCZCNBoDidfF3rYCiSA3l5'
+        '+cvIQWBIfZ1ZFkSPlJrhLq6PxdRsFJue4y1ux66NqOgyS5PB5rnXe3BwLtMSN4gPUZb/bMCU1LPh'
+        'wr8lSYMDw+kHcgRfWf4IUPCiKslOJfYR66BXBjJ7TAN1PsUhsxzDR9NY4melxJyTH3WPJOxQlExu'
+        'WQxkxFXy6V0a63gz3yn601IshZL/IqMlzLY2Vlh50H0a7oYnLYg7PNLyS1ZMagl9ofXikIdxOXFb'
+        '7ChDMdWtwc3fArqJheEkVjUI67ZJI/c7i0lWITq2/eboxrQj9cqEdL+ItJS6GkVgY425QO6zfjwy'
+        'RvsDjtvipjGT8pNYINtiyZ6t3jG5Njh5jZSP04bKI04hREYvZJ+yPyD+s0OWPCdn/TaCgia2XuV9'
+        'ayrMUvAT6/hkBCiiFCZnd7nKHdAWWawE9R5sbSZ3ti4zMLHTKvmyMNwTZPdaXcQ8SjJA0pJ4DdlN'
+        'rllTUgDftXgG7Zk2PB48zF119HX31v2FSvXwKKth0RX9kS30H3hKbTObiSxGdz0mni8Tg6Hw2G9q'
+        'Lvax4KY8ESxvVcF5AsnIghp8s+lVjjAL7k2RRzEXshf8dGXm+mx0RUm9g/EVN1Jnt3VfPmLg/nAu'
+        '/hac9YfTWy7zKj8oYQGcUU1556JbLdNQf+7/n4kgxpvieALy/PjppRKpbJEA96DRKbLVMb8fKWTe'
+        'r1puJJLb9be1/WwxUlRS47byZQPnWchjDArzDDf14QwB+lbCa7/2ru398gVEyEUDO/lgFbxXDAvL'
+        'l6+r74q/m3EcFFJ4yomGcxpixv/MQUTfrl/DALM9PLezpR3fDvq+XVaBkQ8wEepeFoF7VwUCaw+2'
+        '725SvTBlCTfl6ma5VSvPXJzlKseMYgg8eVpuPNpKD6Cxa69lOAQmv2Qz/vkwl1bQVmD5FnBbJkri'
+        'iFqfcZ5xBd1jlL/S5OGJogx9y0IG91psxbgWeDq4WqIusvf04NvVnXogAj5IVggdDg9IA1yNuigR'
+        'fxRu9bMSm1hh2wVbw9eWmuHu6eHMvGNtSVGughY7oseXZuNtynGmpBGqg0+yao1LS63Smq6nMizU'
+        'DqpJNlMiU5hBekpeihYx8WghX7I6cxgndNoJ6LAPfqSIE65EhdXrn4RmPrJmAcUo9eLAvI6Y3PWE'
+        'p2nuoPAA6YmR3+b7aGJCBt3HdDlhWnXz2hi33IavLMdaPQcDa26Pfn+9MsWdBkfS8NqLpQkM/tY+'
+        'j2/h4UZdw/vYCu0y6v/tJCErNmzYskJ+kW8H/SblBo06cbGZzZRU+CgZpCT9D7vaOMQeGuUbICNE'
+        'f/AJ8QeJgWnGLX/ls5MvB+zQamuFPYmSwG1gjw90G056Bpq2tLeiV7JMrjsTplOWjlmNzoNNR5XX'
+        'tUENg25JQx5UTI8wgYFj5dnR3LX8KSZpSysQmCvlQ7HtX7MvBXaw/jVmV332OBcLlqQBveEDYJhB'
+        'boyWXWwYk+GY0NBuJ9oyh3vhsitKZ90LLitxO/wrH4k4utwRvNR/f2Q1z1rxcGT/1E29ficB3+/e'
+        'DvobBAE7sIWr1O6xR9jO6mAYZzSVcSD5dpiZ+obnr9ZaWkHnu3gljvw75Xz9s9iV9Zd0+Lm9QcCr'
+        'Yz6k03ATM64z2R1WhtQ+LeIQr1EAwUUhlz/d6Au8v6mHAwVdWZXLWsQBaMIU+1z4hj2MFZMdWw5q'
+        'DS7rJOeIKDFjR5F8etbWdaLxrfR5Eybr1D5D3+K37Bo9lP05H98dIxJrXp/j8C23yQ6AD1vD0T9X'
+        'EIRteSy258F6YNul5d7Zig1Wg2ROspQM3CIdBf54M+YPtW5s6cR5wqaPpmIsV8rnhKPR3c4y98La'
+        'K13Z3RkR78qSutdD1Fj78dzUWkDgE5ppo/CD3ihFzRdnUnpY0B89u13op4g3xZZHJV/ifMqlKusU'
+        'aqHL6kpkknZF/4tuWOKt2xP1iwCOkL8Vnqus3UHUBne4CKWfSVE0sTfqHgRi4+GdhpGWJ/cZCVo7'
+        'v9EM0IBqDicED80eUI0tOUqRFd+HnagaY7s2DkgoaKBy0MOoos5eE+XixtlFTe+VazItkT4aUn7m'
+        'pxazvgZjzlLgTy5AmZ/Z/x5KmW4GJyQhNzYEkJ2q4U9iCOf2Ic3u5plCZIYJaTklWYiayLpgVeWC'
+        'PpH+N4ILBoITeUsHiGha+KKYeJmglJdSWIwYk0DMCqSoyffnSG097yWimFP/uPTUDc3jPL095Seb'
+        'o/fSfwFwIc6cdI4351Q1wX9NXjXKIi1ydr9J49TpJQZT89X/7B8sqVV8RQPzhVxJsl0gh1XpGZGD'
+        'eMkFcgdvWzge9cbqMgQFjno0NMjT7777Rk5dk8+ehF9kG46O9d62vPtNf3OepQHx9CQ+LXAIu3Mh'
+        '/nQjNN4C2WAHhSMQtWVHIcZt/sApojGTqS5unHBtMs4VZ+rBE1EWXuCYvbepQoXLd1zm03ZeYCz5'
+        'KCMw+OAzaN9HTRSgo+uSb0D/O4pRgW/WLC0shXBeHosVIoc0d++QZHCyIFzFJ3LMWGcAewv0wmuL'
+        'OqRv9d4u3AsA0VaYlRrPU55OydHZlgmxMy2PSd/Te7IR4F2EduLowCwxpytfdFopWjSDgc8q1V9v'
+        'VcdNVR+wvAH2guZdTV4PV72A4M+1vaBXHmYeOHzN8CMqo5kANG8dxDWvTmP0NcUL9A8niUfTytmd'
+        'y5EW9BukEJVWWOqqYUe46wq0aZOmYHc0LbGZTJsACp4qpWSYEz3GfYdVpCQ9/LMLJ5KAXOimTlKA'
+        'VRzeh/S+N/lfTLiKZfXF9nOhDl7dkba0OZP7RJ6zXEEY6Bcs40nnb176XywhHXLXqVgFUWFxM05j'
+        'kOpvYCczC9BYKxW4VYFVLC80LGDIxbtVfVaAPWiiqoPE4KtX0yCyBw/oeJx8aneWY+MX/Zy3MPGE'
+        'mCl5+7BRiNIJxRtjWcXkDVJuitMR5ATJa6kAP96nR/J6KUpn+gveSXqOGxhZ3CmEuNTrFJDQ+H5i'
+        'IZyAJHJ3VSmXioY4bP7ZKjHAEWfzEhJbkJP+pqkwxIK0A6iJVMtUs3jmBDNf+oRiJueqb+XewLsB'
+        'Lta5gMNWiM46BPAEVL+ObCzV6C0XGFvXUMPHL/VmF44zCK+ZQusdvlItDTKavgaNXJddMXbnXBuV'
+        'TXtc9jrkiUaxxAfSZhgivF09Anemnqv/oAXnO9SnuxuGB+E/fCff8rNn3TeXtYMCy6VfYGBUisSQ'
+        'cwclu8iF+zYLnHOmqSKXS2bf298C8N+TRq6o8UHuKofL3tBRhWedPHG0l6Sjfziitb6XwhaMions'
+        '8DgH9evSg39dTTZmMxmSwMuob1nTRkbuDE3wITjtdlqINYIJ4NEKmLKBZ9Qk3VWfhS7XCIF5jqpK'
+        'YY3WSc8f5INFHRZtKN8KyslFBvVP8U9Ox/+bbtzJZziH97wZINReiU8AiVorDpfvCpzWp2wfOpnr'
+        'dwzWaZAOi6JH5Ka5uLIvAUZyWs2+wfz+S1Cmh2SWzrStbfBveK8QA6Ub1T7GN475YufMYvl178vq'
+        'xoKHD9fP3UNHk5zGiJl91Zv8kXgFiWvZBnBwYECru1HcaTr6FGzE4s8jThZ+fx+IppnaBPQo1/5v'
+        '3kKt908zfskcZGWedX1vKeTxcCdaTmBXqD8Q2y/1IA0+rMh6htEMC2KHO0GQ1kdgaDQ9IrdKhWaM'
+        'VvMaKGrZ1WEO/ik1dKqcs+SIRiI8nQIMF/v43Fi1tI15HaZxpSw5KPnU9NiX5xc2ZXYb2sGRkRrL'
+        '9OBlEV1dK7LymTkV9wTLSEl2th89/HziWJjWz7x2UL9syWmblbymbXN3X2gUDwXxqJ5UoK+O5Ezq'
+        'yIoTIapZr1cXA7RouT+qoADQigYWMimRW40WmWRLj3XE4JGnheLQJmuw4yzXK5X33UgxfgSbTG5T'
+        '6eBGQwDu/7BzU+xq+7Dq2UxIDIOsCPOlYcSwm+mL7x8QiYNZY8unxlQd07IQsvXVvqyLspP7lAuU'
+        'SpVXP6oOU6E8LTUF8c0nZToKsuZVaZVdy+B+5Qw3Ls/iAeRF199SnsD/O0Dk8JVzvTzWCSHl0OLi'
+        'Btc+ahQtR35qC8SPlh9cNuz3kKJgmfRvhaTJV2ZeBUaMZ85V4p8ToWFaZImNPSy5469FE/IEXU8X'
+        '8zmTkkdmXRs448bOfoND2Qpip+4YtK3uSC2v4TXrCHpE9tB+1R9zWrR8dATBANZIOzE6wKDOyaoT'
+        'sC/YmBwd0+O93GnSlnULajUGOxNMvKD3zHip2t0cUDP3TASUU034zOUMG+RvQMdBXyu32b3npLlz'
+        'ktZRzZ6RjBLDf51F0NGctmJFKiyR4strVDqQvZJS5l/0UqtIfScn+Huo97ajEgg07sUQCYN4dG6b'
+        'Mzfm9/55dsErOh966Y6C9unFbD+/+NYocF+khBiuHaH9vXT485RzWkNxvdUTLGojiZaxEp4IR6GO'
+        'byGwMM1kocNDyEfkaU5sIenqOYyo9KYQ6EYVBDGawFQnvnkW7xwzSNVz6l8i8pi7Ml8RGNR1FXAU'
+        'eLzchXSeVuOpyuLBQmppohXOG5AsxUkGRQfj4oG2gMYjz9AVvw5EADVZVeHoS7dK/J0EBNwXa5jG'
+        'KwdteQQNPJbNtI2ZMEr8tBZbTpr/G1lQgg5+Vzb+13VYKfpeQiX0cTX5aTW1fFg1Nu+lenUYbdTx'
+        'YPRahU3A43ZDyruXnDbZOxo+nQeVKznjnOGxkja4CuAkJtPasCn5wX2hskgin4c6YY57EVdZXjF4'
+        'o5MKxlj4wv1xpTEoEVQSxQnuV+SB6nwHKLRBwn4Gio/1xCv7iFeGNe8D0rGp9dPOS8mCBZMWK+wa'
+        'EKGIsWGwb5Lwuydf/EPSWIuH8jK9VHB3sNfM28BfFW9ZrbEyPEksBS+1s4r7VOQuOW8A3tWynrTt'
+        'o9hCA2P0+XxwMnetvRm0wFKO+rrubDSrQdm1yzIWtU2TW5aNE5GFs+1qqOZbcVezWXcDqcST8pA1'
+        '3yt96oPKFZUy/LKfsZ78gshHj5OIfKi6sPFuqlCieRV6bRyxupdEqh2vst0Gs7C66aWX6ciE9pqD'
+        'lyx+PcS1cNcbge0RWMF/MGRuEclfIYQElXLjvTwMMY6H16tuIbJZf3n6t30fEsxBziezL2l6J8dS'
+        'ZNKpIg9WDIgVTQcaSCcqVrdxJOcpqSbbC7r/1SpDa4NxpHhxh3QxzOwHJOSSVHCBpzqIEu87IpDe'
+        'PNlPtVB6Y38NmCvZ0nRfJ7S+Y3v3lObHvCNQxsoaQs+wan5uFAnPQ50awd8bsvOxoK74U4u/5Q8Z'
+        '8zAnrgh4q1OFtNMPdSUAkTPmc69jL5ElawiNawP8RuO4qsgUFvD+s6/Lyc/X+myYftp1Ok34cOX/'
+        'JfyJ9tqk//18pXXmldo8sGUwNwLOVb8x9FIZtwwsLcBiEH9ak/td+GhuKxT8ZnsqrBdDa5YlI80E'
+        'pGavl/6ylhsFjTkheI+Gb2a5G/T3wuXc+M/YFBN6wHRBqhsTcdcmbq5ZJjpsl+VDdb82/UdDCSTg'
+        'HPqxogX+bxwquC96xBUqUQRRmMVzGz6kuAEh08TVh+LmvlT327M0OwaYK9IV+VPLvoObMAHBs2zq'
+        'a91e/U/jnwypToo1BKDtmTSTtwzkaEjZaWlkhChWAQghEhDyfeFxMER+YOTA8EILe2QaoL6Pmi1v'
+        'Rv2QRFVJvICp7pYggNgW/FTYhCaBMt1RVQdofyeRFeZvi4O8Hxmpgy31wpB7NkgzkC2QzpraxOTg'
+        'FS7UrAPR20kv8DMd/slZsUVQFpw7zRHCmqhhSaSUoMRmUN2UmM+NusW5dQMJfyfTylfWJKzwwV/A'
+        'hDHiOVtShuciiA09RzgkmPAqULt8wOC3EjKcZAsbDWExfIKDpZquFkhXXJ9Wj1gWEKufj2kQb4p0'
+        '8OiWAd1g7esFqwPw4m8VX3ogoapDaNOBSGh6TkPCNY9qScop/qiggwZjXVYbQPSrseewjPh3IaJl'
+        'NTfnf1/O10xF3qo6GX0dCesTBl80yNUnP+W/TY6b0MAF88a/V40VKvguTqjnOZQMr+YwmgSz2Bwi'
+        'GGH7M8L4FzUdHKcpp3FQDQ5x9giDPHvvYnNLMHybEmcaK5Hfk4cUZdSeLROrcdN4ZwvazLDV2dZY'
+        'rO7KgUZVoOt6uy64f2SNqDCi6b1zvqGTu6aYYlQfDYnTh6o6TbYeGohPPBpuiBoXipHpG/31lGeM'
+        '8629cs4ytZacDjEcQTuefUmSPiLTojRnwXX47kgocZ7xwCg4iqOOkqLJAzexN+3DJUNZ9Pa1DgF8'
+        'u7K2flWowKJPr0VPtO0TLhP7cDa/xvCkqq52VBjllrFjdU97pis3rEUPRhZxY9AWD2xZv+8Dbn1J'
+        '3AceP1ZddPl+ge6KXy/tncV0vGUUcwNDrF8Azi6uUSo0XO77UXyCL1qj4Zs9BLlxmeO3768EmnhQ'
+        '/IvHb/rMRiQfTy0roZK5+kIIsao8dG29e2C5u13U0sxObDJmsdzmKj3rgS4qel/SbkW5k64gt1pb'
+        'p6+HBX8h13FFHmNBdD6uPVLH9Ve7NN4jkJOutOm0dwcliGePZ1RkHIf3Ms14sKVTWgegZnmM5FsS'
+        'axa7qEKHgzU2mITjgLgJa3gBu4aRQwSzD9ZoIf5B0lfIaYKrd6T1H/zfgXdxzYW3x4DF2iQHh6FN'
+        '4krVJdveRbmhFxQMtIDIexu05X/Zr+GwtGD3Y4nTBGlk21mG6fbeFoLHfN2v5Y+efxQEZWhjef0C'
+        'AtqwrfXckBCqlTHE0Vba46rvYt9DCYIU1+5TxMvaPzf9Fv1HpjSpJi80hWS321eGLBWg2rBOzZs/'
+        '2P2n0g7wgC5yO40GnKCkia9PZDi2EiXBPZ2M4A4CEdIQMC+zKTLFw6yfq4AxXnBNrOLYhqF8ik0d'
+        'LlN9cVnqA1tVvseiVE0CVHeMfTLDpcoryxNiOCV9Dmbnt0PHhbOxZKB5cpvo3fmO+dnMp6H2Fktx'
+        'uUgP+z1NdcI0DXrYTkgxTT6tta3pIw6OmPN7yaVApZn24K3pCPvSggIb0UV9WIE/g+RLug4x7s9f'
+        'xZbB7C4RBOwQ5NSGJfXOpCOEsxH0D7gbob1yjL30Z+QVDm+8SeK+UoKBOl99nmBCaW7R0v5+VVDr'
+        'Rq9Cafyy39TDM/m+fNekKzQfKWMpOXExzEwqkhHhOt97Wk+8xw4/S9loiLcn2t1lISp/GNayyQnq'
+        'qZyh9Oj2PQbuCnUX/Uw2LFzkrQv3x9OG4TSRsd3F6hoRzUDo8ryETEqS0aOjh8iPOUCLtEqMxWY6'
+        '0zYF/SLwqKvdM4aewxJ9Jxk5JOLSlXw9B6QedwPlDdcVIHvRn4yGKBWxMAzxFMDgXNJZ50tk7caS'
+        'tvDWCOKGFyGk3k4fbWYKFU5sGLL0k9Z/fpig0i5VJGl+4aVdlamNq4ueg6pmPWdILAfQ2GS5B5Bv'
+        'vixfHIuzEkQnfVODAO5uXASu1SRH3vVILtj1uEp949el9GIA0QrE8/kL5g0e7uP2hIL0aieL06jW'
+        '7YD7Mes5oggZnSehbDLjy8hLYJ8Hd84jYdfLkQzuDUnjMVrnl3OPS1B+sOFHCQOeZcb0rooPNt6S'
+        '25Shc0cfNgtbaelylAN6uYxXCuBWX5+f18WMCiXATyIfaK8pp/sgNCaE7bAf2pCcuOgXzMJGACY1'
+        'wwqnCKdrdu+yRfs1hwlQPxhZjAhRSHmev4cagTTXiXYGX+aU6h1QSe0IfzCXmMp8ab3kJfG57D+N'
+        '0YsgogztOgH1EyRWc0Mi9P1d+J72W1cRJDWfKwRlMRKa8/Z0OkZv0j+gIoL4MKspCVuLLr2I3Bcz'
+        '42VJugrGtoqM1pxeE4stbWrVKLRJSF+dV1paI30nBwOrF5WfqA3semtC2SpCe6x9IoOssd5rv8us'
+        'teovA7RMUR5n6HdMgiFVv4zuwNzX3gYES+yt4hMywx/lztWLnFE6rig/GyLawdgf9PTy4SpxObud'
+        'nV19gg2Mwxj7eudteodXcQaWeadhEni1XRsmOKJPO1U0HUmrFQw0gI9518fA4PFFUWU4F8MF7qwQ'
+        'giCLUujzpDKilUss+FibkqElhivRsflLvIiWhnhO7UqsW/eq8sW0bxrhoXkAbRwGI2JR+GTGt1gf'
+        'c8nJKYf+QyXUYGoNwKb0PtxQu1yjezuPWIN7HwSuD45suS+EOPBKPAUM7GCBLzTr6DFx2/Qq4IyN'
+        'ZwzbXODQMD0x8ZnhgonOYiNF3YCcPxCnz4D6b2y9E5wpegH66L8NlV7A/UWl3u8c4KUycWkvm8EY'
+        '4BKuGnu8BXOm1qowOgRNeenTSG2n7VXGu5F1qmPpqLoYJo+pcch+CVRd6et6ggZPDf7fRSEffCkX'
+        '9oVPi7u2lPuA18Q6p/+0pXKZ2OhaVCahPQl2F41jK65lrtxApdwLwR8tlAvX401wOwYOdB+6taUm'
+        'qNoii8C/cpDI1kX/9Uu1qovfrB1gyqMSU5PnDdJnf5tc3hgLm7+c0Y5bPvClaJSvd1KSHhxwRRcz'
+        'LNsDn0MsxmQFHjyJOxLvAq8coT1t38gY5GLdSZqqxxgC4J+yJVgHCXwgU4YVWhzT9mBQnJEMRlUV'
+        '+Y34pX8D7wIoANjcS5y0KNsJLxdqU6C/h4s9xeza0mxz1B1ixd6U5tCPP8T/gy+rD4FzPvNEOmY+'
+        '59zCXyrzo48PMTxEujWrTedj/ZC+tycOtRNLWQcB2f12CKRuLIJziUdhyW8xbXYO+wUq4ueQDu2/'
+        'SGa7GhiKLxqmCMnSvY1liDA+QdNotipRrg6SsmeZlJYJNROkYhDrLFaADBkxHniB4BGtnmRYG9N7'
+        'rxvyxDMyIX7Cu3tiYdH9w2swhlfBBcYWvO9ZPAGloLSVWYnDQKl8BvDy/Cd4iihk4WCOgssQC7nr'
+        '+jrXpVHP1mZfxVVgLKf43GgB52sOCo0dslxlJqq1XGvgOwgptcKrSXXrqDDBfERr3A0d2tepF+TN'
+        'T8AhVkSq2IHLjgRQCuxB7GYkIMxind8/JNAXMcp9oJy9nxsNcGLldjFkDXLGIr92esvE/KfcSMHh'
+        '8DZD1try+pdOPbdF4gEtzqYK6fckEgLkEtz+JHsOxcB8gPM4xW4khleYMK7X2ytyPE3EVIebXh2m'
+        'DgQvBiUqzn00f+NcZa+/k2e3gv2sIokx6Qq3QGnWUmRQ+6NPiw/N63OAcvHYLRJ2DDRViMKfyuuw'
+        'Q8rC7pg/TaIZvVJ+wUUBj2gSL+9wcGvmb1xstxW6geaIzemfbUIQVuS5zutBQp8xFNmEwZWYrwav'
+        '36PfMIJA7O7tJS5D6YnKWjxl8nh7YkcOilFD6+c+U56Y3sSkVBUKSZjoxbR0U4H1dAro5HuDJsLb'
+        '8IYI6BOrXZ55ASpk9g8J35eC/RGpNyM7mUszlVbXaFbID0anYadNYnxa3KYNd8sNswXVUGwVs4vp'
+        'sPlRh8AEve4bpTizdp/YSOZJucyF25GZcPTR64YPmUlX+02h6b0be3KhZ41lfh+1zzINyvvHOJl5'
+        'HkjMllBya7XCgg8q1AOrBRVc7vRhBRe1Y42KrHhZ0124VyFTB3pxMvUnfPtesWB4ELkYYxaA2KTh'
+        'E1JFk1MkWgAmB8BSsjKsKLl9+WAzkw6TOxX8pb97es4/rod8LyQ8eVgTD6VurR1Myb/zKr1Z1EC/'
+        'juEBIlIew8N+lfL2PV4gHmP6bShWNJcZ4/irMyGqnv/awH/IJd35p2o439Oeewo4XUKm0IGcqfHN'
+        'xBJEa5Rb9+ZDbimyQtOs0OFzG98+N/JfVxd0XB/u65khlq6LASVfkS0mzOwjeU5TiKdKgDUgNMzp'
+        'h/28W/CabAVYaowBpH0x+0/JrSKEYUpiaMvyqmbzYH2KvA3WwHds3MuHvAyFQRb34xD1BNGeoIot'
+        'ECr1L4/wyB2jsmJHtCM3d9gZeKS/LlooFSgEqRFBsqw9w6WFPWllFyuriQ7j2sGESU+JXKwe7yy4'
+        'sjN6qHFdB89iL0O3s0adj8ACSdLe538jjmR0Q6SGGAnJOKiGlGdqWK94gf5VjjjAiP/SCKS87JXd'
+        'pRwG0etSyDPKSQxMjcHOv4FL33iHI+DfJXxydjRZHITgKkWQ2k+hgHodrGOI0Cu7YNwG3D5KgNJ8'
+        'UBoiUnhg7wwaffIfMiaegAOzgMnn7iAL05+DwsqO8sqeCky/G2mzS3wOvHsvNFzuGH+ILUxpNe7j'
+        'KL4VteZZf9HdFPQAo3oGVSviMJXiLFv7updsvPiA9yl8T1hknDuhn9yNJfS/T2FbuK1PyrH64mXq'
+        'RQ0mimXZYIpPiV1HUO3db2OkCzZbOV0dSvW/vXJRSumcrjErRo0EtG3qVA4DLkE0PaFrQMYUlI2T'
+        '7YVHvAoiVetMw5s43OQk5XqTZANwMq8F4C5aBGgE6mUeZTT37hsVIl0AXFMU/Ovm/bYWXKmW/vT8'
+        'gSw9JOsu5swHH6tdlHZcY7a60A2kVEpUvXdipl13Ckl/ac8sf1D7gT+rVS+alXAXkOr5OE6SYpHI'
+        'ErsPf3iBBShIvkzeeg72tNJ9T9+9tLiI4cYeuvOMn6xBjzNceaxvMB5/iA8tX3si0vQw1nhDMBCX'
+        'g/d9pBddDzAqv4ZkhQKblJe+LpahiprNBj7UcvhPygbRL6rebC3f8NGL8YCkGmTRMZ5rDjlNIIJi'
+        'HzuJL9lYxBuv0819Gq+GVq/c+9GN09FvJzrRsMR7Cc0MMvZMxHizc0zhSMIdegxbrj8UUhvw7KZk'
+        'W7Np4wAacxf7E3azc1ejV1ojm00Xk6Qof62+vDVKU7wq9PXzTd1tLCI669/4KjskeScQb7WMf/Kn'
+        'LDpoEJuNDqROvxEbii4ts8a4GesWTb8bpGPpkWkGyplb1bqWzjjQJSwbFlm8JkCRXfGE5XJFRdoL'
+        'jZJXLkwb3xGssNuGuxnFNc3/e1ZYfzsqiOwrfJpfhjm0QAOdnDx9k8vtvFq+UmwjJqAj8b1UAg+8'
+        'uNSm6PxW+StpT1EOcB3dTV/WRYQ7cwN3toJDJ0A6JVWo96UNs6tMszt+QUhW0wFDdDM5nsos+lrJ'
+        '2lNA4BRFi961t4m7brplD/GGCpb4kifoZZMPCh6sVAP8MA7DebuWiJVB9tkQFOqY69xq8kovauPG'
+        'gXA29lsT/rudu0Ad13bRq4JO7nUQCHuP/OZtdg1nh/LLoVn6chEt6nniA++CVCIv8Idj4ZWhhmBo'
+        'JYqrXMVHD1i3LEXx+ka7ugWeEnrQmnPUTPjFVoVzh1dnV+76UwrTjHuBLXXP8sePfYrZNzlbRrxe'
+        'h76PBjfxWpaeU3FHnAsOeIZw3mdAU3C+1m/favZQIbylRt/0n2kcUP38sZn+Lp0Z+UggJW+1EyQx'
+        'ls6gopqqlKrFbicaqf8BIfQGi1NmcmHHr2TS4BVUcQPXuCyEubQpsiO8iW6MAzAS2Ip3CvaaxHHO'
+        'df9QLWVDZyi8fuQ9Hu18I8QO8Y5tkLIfOlojYcXJjDdwrOLxu1YDKtZzSkUfRX+csm0IOBJyzrSR'
+        '3tjtCe/+qul44SnAix9OFD4PscIterryfz9z/hYTPHgS7Vw5wySSmRvtDeaxL2A1ye7K278xRjc1'
+        'r661VBPECIZF0mLV4bTYZtwC8Ad9Xbo6VSWRortKSIR80a0LhP+npi2L7jyVOIroNjW1JaAl5CKz'
+        'Fx3UIK3em7+7jDpEc2KlfM4LoAreOIi9S236GkOQBnwYpZzqJBcB1HGmhI1SOigiTK0k6lPBVoGH'
+        'wgb4R5im2KevpUQN8i67moBw8851mE1o4YpyBdDwVeLLmPPDJq7jAQhiJCfEvuiZ7K97II1RSYYx'
+        'RXLAyvfiYXK+X3iVGCtxzgL+UGen7QRUIJCz+lvred8yvOEbQnBphS0K9hoKR9UyHpt+csKMWwIR'
+        'YRDdnIl1HnZXGXOqOLDzT70ykCYST8yC/dZuMPrt7oatNJbNWTZKbVxOGFZDrcAvrIaNzmkJ9ZnH'
+        'eDVlZUGEBaUndd+cwsGI+IyFLG+/4A+zVWL75ARPycTMiU/pOWBLr+WgCriVsfAAvbU7VVxI62Mr'
+        'kjoMFd6m4V1/o2VCVkbS9HV1cF5fH/PCblt97q6OBuscnF65UXIxkCxMVoIDYAJeC8gVqPaI400U'
+        '3x5SmDlkmIWGyhwm0Rm3VQMd3jJUvfN0sjGS+bmuiXlJGT5Qqk4Nw8d3sXqsp9cw4y0GeFGeEwD/'
+        'RZuEWEhZNVwXIdJthTiNPpkraE4exack9nCDVDPMKFxriKGoPnB/9BaCmeKP9dmLGWIqWT+mqiwj'
+        '8rLXdwbiV/1tS1/fmEpR46pHhvZR2PXOfTFMSLLkA2HUJtqCwN7ZSBDncIcRUv29dRv+8SHSGblw'
+        'XmcqpjhFopSi6v1dbk6xtLD7hF0PCesFuihLjA+d+ZlveWhOqM9fDdf1jaEBu8DVojWfkUkMG2N/'
+        '3Uhavf8oXGcWwpNM7KLy5cMHpGtzLp11UMOZWxcXWFRzdLPzlZtKXmLVkl3J2ReB3zPrIKon3cQJ'
+        'PngwiTGbrNzUdwR8aqhKIPGqapoNmRoGpXjDfx8V8bMtU8rqZLX1DQTgIA7zCRoA/zOKQm/amdUs'
+        'l3cUP6Kc4gA/ceXQZlEzXeW6i17xQra/OPG+yZNAPCaRsAZCmCFX82k0UBmomR/5Sat6e64zrq4V'
+        'p1UipCsCO8Kb9arjRAbfnkQ5N4YclldtAV4XZE/Bb2DAWSngC2ysBkG84EoLne1vSoeKpswRR76Y'
+        'Wl3T0+COeLQhzwFqzxDYnxVgZ5KkmUEmjl+wxl1H7b3oCB6INmqWl36+vNEE91ZDhjCYPzw+i2bk'
+        'GqQIxo/rEMEQdbcJ200UUsMbTexu1+sRLH1ikhXPceuiTj0i/+joLl/zn8aham4Re3lZjug0JJ7I'
+        'tf2BbNtSc4V3sPC5lFpO3fKkN0KCiYishT0D7Ke28kz8P9uVlMyRbg8te/cywNPikywiVzsxAey8'
+        '0J6w0qeMtel6ime4WYPrFBxRGBb479aAfPBNCKqRGA0Z4TH6B86R/MK2WROhPZRF3+b/W1ngxH3S'
+        'Fc3xcT6j/SDdF8QQC2nXoY8yJhJHx7NvO5Zloa6PsHVQscaRIHoNeBH9a6F3O+olcnjcf1BsFsTl'
+        '+J1y6wYQqAmBM/qwGpYHlZs41R5TziK75BpE7NgRm7GPjuUciaHkpHZFZS9sBuadx6jSKOUfDMmW'
+        '1gs3YN7tuktXSG21h1y/jwUxhrPRj24Ld2hvxlnGKjPRb9yRKmlIBb90cyvaJPlsE7cNB89gYqQm'
+        'fyqFBsYiFSK9Nx0eqb2rLxkQIBKjbsFb2XCshuKYgpmuKKSynkzSBvyieAQ8xRcvKclht5TJcoQ1'
+        '1487PQD/29XSarLLOy6kuA18tO++4GwObcHg/vrAJP2OUzrA/oUm5Etp0bBXZiJQ+TgqAQNLqkhs'
+        'x1IsY/lZFO54+GUUQ7kbmfuLbHiPUe59T/UU2V2rPUtITl3wn4G03T48cVLEFmEv5QhgkyJNGEBD'
+        'JU2ZVFvdhgGi15jjvbJEV+xyNMBHAztoF1aqDotDXSb34I9xfBDMuLSoHAE2627Nf5EyfCx1duUP'
+        'HRo3syU7m9GFCco6ag5fqE4Gud9WmVfIZa/ptbWiTIY/2j54T6MXDufYEwCdiv8Elfhx1MX/rk+4'
+        '4Zxd7xNDRNcLq2fnGGTvWb432iuXgSjosN2AscHwfzkFhx9VJ6aO/c203+v5jOK0XmOTKs20No7L'
+        'uXH7cEh1KerkooTmgemE/kqeXUR9teKOxd/Zd97YU7jaaHk2HcTIJOuJJym0tXRqomP3Nt/F8+W1'
+        'xXuihwl1fUy2Z8Nz0P1tHPS+asA+t6yZiJwUq01lxuS8e8UsmkrWnHAcRMBRLAGP44ZCz5H/Xhuk'
+        'xJ6Ye21nw4F46Vdcoyr78SP6S0VXAG64BT4akVg06wZHyZmb6sAon+/iduLzEoZ1P2S5cdo3aMOR'
+        'TBPR0e7MrgQTrou23HibavSBmgCsJIQoUqf46Dk6VkY2cohxSAyzlFar5e0OAqAEU84mw+2YbrCt'
+        'tS8zIVmTJy46gd1eQQ94+rAkdrabb+BCtCiaj/N9o595KFneWOp6tzvlD36IT/6DhwCHywFlWIa+'
+        'YS/sZpvA9k3HDbcyWJlrDnHpyH64wBWUC2xN/mt8ULmevO6Rlz5SmgT0vVsSEKroVV4UqcEwMyV7'
+        '4kW+XjwEG8e/lE7s1nqei9ugxe9WOu94IxqUozcRIPoRo+86PCaLhcsdk+paodgzsJfcxLQHTV5S'
+        'A/NiV8O6NH6RuGKExMLEuS3DYE87yzSosDBag/oEZJ/9WUknYzGPay4oeSoIuI2D5GFApxqytJl5'
+        'hshIieDCMDu+xsxVD6GI47PhERjsV2C/c0IcpQlcFPTuJt7VE/QHFnoYnXnznQRfI36p9DVxjBbN'
+        'Zd4BOzFTnP6Pbx/kwSN6UO5nGmbvVXjuI4GkM4P5Oxq+GUFfti1ELsgs6+eiewBSeRfYBsJXQyJX'
+        'KlkIE2k0gX+7SOVVUYbLzQNzqeKsnLd4vlvLo/TMMEteVLEPKsAWLSO9ATmCVFJdQcZ5LSm3lvrO'
+        'MeO1dI5dgVwVsor8gZzjl2vTzu2zgcJKpgYx9Tb1OKtMTeNph0SiWbxv9DsR24kjE1vPNpsXjeQh'
+        'o/x3ud0aIJVUtmfZJGnfRHbcnd91UH09I+QMgESPbuTk7gZSkOSdOXTHX55bSx7IYY4+pg8pfAmP'
+        'gSlb8OSu9u4XUMugszrORHfm331MoTJXUd2Jry3+yAnUL6Pj7pz+G4NE0aoNjjcaJ421L33jquxr'
+        'SAndE7Gu8QkV0vnObRlooJx2sklpyeHqWQeGLwpzGmqeYr3ZpttT1bBpI8nN/I/Qhke+ePz7Evcz'
+        'npbMcb9m739H93MVy//zu7BUtHinBHhKakun4lDZL1NQmszJ6pj4Nl2CtgsxgyCNVAifhFLtTQIk'
+        'hfn2dFgxfqisJJzZ5nCG2w4J0fOnSZMNZ6IOl4izCIxxlMStcR+WHeWf+Q9M39PBGzU0q0C25Wo0'
+        '/aXCuRpyg6Pd+pUrVhxTz9HRxcFsW3dDM5H7fvWqbywB0dV345xG46vlHL9J3xP63ydVhuvRfDl6'
+        'PjjdtLwgfx9hHafzPsLhiRlVxyR7SVBWLxqjgdDTis45qHPrNY1nU8fk1Aw7XxczMmXJpFmYtrJm'
+        'Fz8fXGfeYfGre0pg8rlpaGrO8f+0CaAUacgTlBUS7ULZazRaL63BKLbdY3adVtpWhy7Be9izAigk'
+        'mGnApaeqwca/jdQuzjVUdku9dq/mPCWRGYACkl7QqiFa6iuaHza7gEDqV8mUu+Rc4/biMnCj8R2t'
+        'ZGVEk7foHhIuKGCZwnBa1TNbwaaTqcv6Jh3DxEmJvXl5GZi/3hdLiWZ3A/bqAWgADC+mj7VHUArf'
+        'WM9qRAqrqGiskCN+/xm67k7wR9SIRggoUCSWkJ8iQ/Cxjz0ztyNp3RLf+I0vOYUdw2uUZLnBnF78'
+        '9MTE/b0ZKXS9PDCLRRoR+FqAwjpCoxqRmoLgwllcDa5cSZwMKJ61dvkLvT9I27DGqEiffTOIDkDu'
+        'orYVgN4VZki26RAtXQ19uGkIuZGl0lhfb1hzseRZTsHbqO4/rFV26LYyuGPNlhzPFWvG1pxs+Y+q'
+        'EKfL47Qd38VUrl76wlTz0cIJkrKMrIN/KB6IfWkL0GhKZ8R4lXocHPBEX1hHKq0+srnzoKxMn+mt'
+        'I99TOpeTg68HceJc9rh3NqCYxQnfbiAJHd4Hf3hw6Do4GupXjOozY4FpVZwRXrYKaVjgOGeDCa6P'
+        'E4EoRdxtYQ7+NoKDP3ee6mNM/m/UtEb9Y4yjDjVCLkey3ynnQlZfzT+X6Bfgt9de9c8EU9Dpmmpo'
+        'FEkX1YoOIMlFtX0i4ZtPBFPQSDNyvuSEIS5qp2PaHFZw6+WXWhI8iNCg4WyXG/NBuFtH9mfiHYQ4'
+        'h44gLZ0ui6xagR7EHth/nYVER7VfuamBPoX873hI4GHw0JFFitdNfNzAp0qSvXAqR7UwlRRnc2Dh'
+        'VG0GzeImh+QGzW6ND3dEd0KzVEef0CpBJ9FYHBCvLY3BiHE6n2+KPhSFj7Xu4X5HDhhWac0LNRpn'
+        'dLqnR5e/i0sTnyxqCecW6+14D0+RdASuew0UUu6H4Jl4A6c/jYXbIX1I3sZU2DONcxO3rDuUrzKP'
+        'KXNLQPcv92DcvVnDh8Cd/kM1wUMvMbKOmSluTbwl/OYOoUJ4/DEMRMQna3lVS98zWSzEiwigiDIO'
+        '58KMiKT2+2CVnohaCl4D/z2xo05U6DpFQzpx2dc6LcnRDdXto86n19yavJSz/1GMAZ59JOurdOga'
+        'BfW/AAcFSeYt2sTKGcXcRvyJu+LlEEaCqlaL1ZEhrzqmfGRWNubdVOPbxdQHjvE3OPbIX3V5YC+z'
+        'NacRBCEkh2wfi2MZU6crPGVBg1IKdWbW+zS26JbVemt2RMPEYw4X9ozFHc8jNr5kHM+dNqu1ISY0'
+        'exvOdsb4Ni5nsArTUVZJaBFV5dTYn4hsR+7CJZZ96j3KlPKTJ8+XbMCcKGHXLFaDuFjZupSlI0x4'
+        '/F4ROc6xGG0G3ZHO3zlxPFUxmlg0XrrcvwxrB10srNdIUm1yJxE5K6+ULt31LwE8mj5qeI3rBO3+'
+        'IO4sj75EVseS2cioVHcuMIEalOJOR2IOieHiDU0y2wlQzr3ZAmzDm4Loax7NWXMHEmA8J8x0MMSP'
+        '2yQ224Yx3x9Yh5tLMrb3aNxZWTW11NHUcUFSOwfOiqKVuOT8MKos+uQERHIDSXWjdgmkECKWYI4M'
+        'NfZNi3J2pabOib6XHTW3x1+xz1EJn5tSHvLQh2xsIGinP7ztTkWlbLI3Hs25LM8UxtoTgSvlg554'
+        '4M9csNi19ehBtkVnvu3whUfCKAF1DLx1hox3tjfJawKWrnNp0y+gTMN39pnpKI/LbtotewBQYHu+'
+        'hBaTqk/5T4wVyZEPMVNYVJkaHxE7bO7zkwc/2GrdfHUnxJniT7k+FPQ9xM/DSyMTEQyVk+QR//T7'
+        'jswA1KWXrKBETl/pK9SN2bCCqOgScQ3e8GC6B5TCJ8MKmBakiO85B0iaZ1T7BTaehrIu8sf/RbPp'
+        '3xbS6CAygzo5xbPd21cKlr52Gd0vsDnuyeJb/zcsypWGmEq137I4u+KfHSCnBJP3gShI19M273u1'
+        '+6nrfOIp7ra+l2mDkAVQfV43bFgkS9bcFE2kx0OAZxfq7lTFvBLe1WELpIdIzfdjOX+aUG+bpflf'
+        'TSyy3EZ8XYTvHO8smiiZw2kE8tLio8b2YQG0iRQUUSgZPAqYjSPq2QqpFPDnMNnLk/eIhYaAazxX'
+        'z08kqT7xD3/rb++OIAdwEJvTvX6uyK4SszZJZwbzPWLa7VZElHdQuGp5ZJnlUpE8clywT7KTkNoq'
+        'yOUfOW/5coM6rV1z8fGXqxqaZJVsrAngAyPTUKjg3sTdKsis7YAjPcrOSKuvbtLWh/MJ8m0V4cjb'
+        'l49QIhxtKTD/1qtIRM0u3wYl5YOEo5xKLF0xhjNgumeTMdK8cxJYGqPUfjhl25a/ANtsaLdDZ94r'
+        'VPcHpoKxUnUAvUzaYiAGTCweh1SY23bK/1DPbhcmALno1yiC7uUeIt2xq5rQJp885wKqhK5PGxQq'
+        'Ukju9rd0THLi6oECiI0umo6xElj3YPHEqMDnwhwQOcnGpnM9YvBZ6Q2Ae3wF0SJfpVOTSSIcpkqc'
+        'Sn93uQU3KcktVu7opWyY5HKZoa4gewRS7dfINwbYEVUoeeIN6Zr3S31SfRNxjL7//8n4gpgqrV7d'
+        'heO8I2lyhRg9XVvevQ/33KpGUsloHkEKewq0vAmeNZ3Ti2rLjdDP4vl1vEAkxw3Wpjezsj9RoFUA'
+        '6mglGxUZUQF3Y3F8t2re1hs0HOP/hGFQRtt7EZry9kuhH8qMEZDTv1csMTpkG8FzeA21EhRKOOI5'
+        '8HbFYcDWKay33trq0jMZtqZozBRbFvWrCQwZ6JCHyVRpADzUUslENJ/pGWaXufhZz5N+6scXfRDM'
+        'SV1IWcIoehu0md7qT2OEUGzwgQ0P7mBXssuDKZyKpLxNmvZMNg3I/rGB6HyMXRZVH5hh0rR1MWs3'
+        'x0eGdUCMHFazWbWs6vU6rqMysft4jXB6+TZmdFiSCxxyld+QnS/r5pHLkl2e8r1rSHjdpK2o5oWL'
+        'kRlLaBReJOuF2IgDVr/OIC1ldGb2ibradKfgIPrE6tBaluH9X0UV6qEcbbTWVEKuDkf11EuqOFxW'
+        'O8oUUYwkSeKoqULrZEdd0IrthTvnmNlCHS7yJd+t4FrYn4zaPpAEXwsMdxrve95PHKZqM92MM73I'
+        'fKUtIhDwGf1xw0wxvi3m81Nxdz4ckJRkPTmENVCSjBwsVKWpA7cJA6tNh/ZEHl7bcstr2k7b7Rqd'
+        'U2nqmv9rRiLvpZwr6Q8aa0M2Ex50PGviDqP886P0JEzll4vAsPcUApzeQWJLG/RaKtMPOPLs9Sy6'
+        '83GYwxgcX9DWC2iivAs1a+4I45HanjfnCRcKSQ/iJ2qxXbNuFzoMSXRsEIZZcHbkMvjrsiao6gaT'
+        'Nsc3vIL2+Uwk6G/ikh5ZRLfiPxkJcbsyZsMcGX8SiB2pe2Ga4Un2HZFdio5twdlSBESuvL7hcXs7'
+        '73zksU95bIj2UA7q6B3J4UxYlixxGhiNCL+xbl4gy/qO8r043uPAv5zcITcsNRiQXWpIVAXliS3v'
+        '6ecHyzk6o1PJ5a/+STvYsCFeGUrKzC3TQ/ndjjkJQ5bzebl/wVWDKAhN9I2RE1IKtlDQ6OXl16Dd'
+        'ADNRtoRPmqf7KOC+mwA7fmdFP0J8m7A733Kh+jiLo+g6JYrEbCGcikCy9Xyz5wSpblgeHeS2wrWC'
+        'SsKd+2+U7i8O6gtVCdZH8zWzkYQzxTfebl8S8MqtdeOzJ9wPLG4TauZ+S4WIcmPIvOYaxL4p/JrO'
+        'OQl2kyHzu44y1nlwjLvbLW+IwqqTsFpcLDUdNHG/cesQePMqGzYwIGv6rHS/3/w+zYaemOIOa0k6'
+        '9iVnZUdFk0cOGx0kHZYJwW3+3yi8Fyw/NeuC95pBA3rnhIo62dhN7UZxDBVWYtokOw9hRP65tDyl'
+        'LUMx7JzJ7W+Q7VjUGDUhJjd2C/wlZoxX7BqomSXyKhvv12vrx+kZEa7k5iLDMk+v1xPYeOP710z+'
+        '4P60RBIKjJm8xyoA9cFVkadg0AJl9Pko/B1pV8sHJkVid7DAcnDYKljDtmyZAH4PoAVxRuVFwxcO'
+        'TSsQWsq0YQUFJNaEUmHw3+iHt1PFcSFHyocFjNNuMvJE+sXvdSq+lkXPrs640hgtKdxX9uHwZ6p2'
+        'bOccnG5LMcAdtSJ/6p8cCxsRjuqT6ZnXCgYKmf2sBWa7O4BpoSya6P57+P7VOvWSk2pgT2Bbxca1'
+        '4XhkzIed9SEpsuzD1mMKHEQhG/4ZeCbj8w4NL3TQsyFqnCKSNjUA2W6dzf5Y6i3MKYa52biZHoOZ'
+        'QwBU7LcxRJqyzsCfS3QBtez9zsVLxFKJt3LlBKA8XrdmPlBtkWGlEZp/+yAagUwqCD+Mns/OHNux'
+        'OAQ6U3tVIkHJCMA1LPHMYzENo1RuJSfpfC9pKk8yMOAVJoiM53j01AF9e6mcEnLcWmklBuEoMIYi'
+        'A+NaVyahxOCFojpOEiFcDL3Vb8JazOKkqenTpL9iRN95IVYmyXqmUf6b5RvYSWIYWkIuuJ3qb/Aj'
+        'gGcy4PGLZRUJauh0okaF3fqyHdrSlX7APk5VKtCAxUjvy5cJNZL0DpV0mlT0ZtuTwaqkw7d7T7GA'
+        'sUxtYvu9lMbXRyMqgVx09C91rHTS3xHppEYPML34RNF5ACDgur8kVsQXlysEG1rKtpCsDpUwxC+P'
+        'i1YbzPIg6rHGeWpL5p8/R1fh+JiYnRIdMkIrmAUAFChxyvS2QzV2rztUeR7kFPzjDSrTTUNfiNTt'
+        'piAHxCmAAJb5dFxxemqJ1v6fjy8fKOEgxSmGpE7aQ/q1mJ7Nd3Y8z5zVNUedziq+q1PRQG8k1eXD'
+        'flmNUHTDEEVQWV57hQpeZrFZym1cHdefpakODxKpHlLh++sDWP2VTQvJjqiJj1g7jupRPm6pqX3f'
+        'X9xeZJpxQoXsMv+psCjQMIchQmbfu8lfSNiiWJzfDwTcC6TjHbfEKcLaDmbCLFyZOvtxmwktM4Sj'
+        'zs8vEc7WjFyOMFalycAmDbUlTqjb7lLuVZwXBQ4EQ0VLBfOuh5qMPffGIjEiWb1YbtbhuN1wqOV6'
+        'wIG50iU6swdSpPpQwLz13BuggFux8J701dB/d37AfAus3OMyM5/Af5GBlD04X1YVpH1RviFT1/K7'
+        '01uKlY3Nx4n/Ssb9Yl6cAdK1ZthBBKk0ACrhS5KkkhAELzy8nPDxOgn66aUft5/9CLBdTqg5BgE3'
+        '3iy1FneQfO74Yi85J1gA8rHalF7i58RnKQZ3LgSdZV2e4L2V5lV0w+bZXM0TQiiHUAkqfcYOUIZW'
+        'sscxtG3kzFOvb1qIfEd6B0wYcrZy9pfdd+MKpdK5EAElga0EDKQLXw4ijjIw5V3Tq0l4B7qcdTMO'
+        'Js5yaptivTO7BpYMcKSIPSmV5VrB00VsLATriVal/ktoWUYmwpZCH9qoLK4NQS8PihqEVRjff6uH'
+        'Tamz9PN1to/FmXSQDrkb7+FSKRcinM9j7hGNNrKBqhvwNFbbmd7zzhHZkvd5NWCG+tr5gstOw+3G'
+        'HNdXgXGlKp95xyoyT3Uf2UfLXU/bBZn6Y831uTFMk2JRqe4xUr1AeJ3DrHhRTpbERSzzHBG5uhcX'
+        'c/+7/fA2ZHMatNgW7nE1khJP4mDXdLgEuM1dA1FY5BGx/PPAJSLLLQ46GZUhv50YZxK54V51pJmQ'
+        '2LPRuv68zm6/7Od3eoBC7oSBm3+gFIYdNqsaxaql9pINmRzFQBOgkxeGbBsmr8i3CX8YnkMfj/kq'
+        '4vyhDICgNeherpFNf4qYj6PAcZPIHfI/kAnpQSBXtLodClvaGr8tv11vFOFVHZbU0YhLGa84uiN2'
+        'cAl+0ZxBG6ThV1tD1pY/dcSjO6mD+1cv8aBYvUrg4O8jZyI0x32ephADdSuq6oIe/PKncy7MispL'
+        'tZIvu+/ppD1zouxXzrfqFFMTe/KR0id/S4XuK1cERcJCl/ORIC88fqxFlgqys9qDhBx4FDkeNeuZ'
+        'x3qV7Ns/W6YB1xgGORrW5fvP218NfXYNov4kWBlWApy1ILLv2Os2cv6pXxCzXGhMEhVXAcumT7cO'
+        '2sZcnD4Aduaxi3V7WmR73YfZz2Lcc7W+eD9GKh37aQD4FEEc46BCXZrioX+LpLOUN27gYUFNk+pM'
+        '13TBTKTGp7Ra1uAOkw+tok3NbWuKMtuVEnZpgxPhNHnDEkaUQewr/I6krsqpw2xiwFRa1x2dOoRm'
+        'iqrwos8Er1wUq7z2o80MUVvFyDQ6HiQ+R7qdxnBXhrezaAunRyud9CQyHU7k68zEtyUFnY0dabBu'
+        'V/UD16blZVSuPOXEQ0p7IgWqyRjqFvn8VyRqQ/3zKnKyiSizYZUOwbPUWupoyqZGOZZ/lt4vi06x'
+        'HzPuVVjaH8CQE49lqGVn3Bnm511/R7C+8lrwdvWrzJ2g9nCqv1ZjKUjufdsxDhvKo0ZAGUKOTFKS'
+        'gjITvM2SSQkSAWEh3lBk4gImbrQ1MUfGICHe9VKXFyxXrTrkJVwh+Dsbp3x7N5rYZlxSLMiH0a+a'
+        'AVO1pOSTE29RX1NATrYaLATvgNgURqsyOpfkL3LYBI8ymV3WbZPnn8wW11OVn7xkwweI26STAcIM'
+        'ClhaFzjIUl3cxkf6jq8UFKVY2q1YEw6Dd6zABjF31/EGMTAMJ6owgjOCzyalz6fduuzPMpjDLQcj'
+        '/Mp3xT0Nx2l6Nwrim22RVoW5WiEfceRDu7aAViRNFh6w6UFaG/Hc9Zk3e+AF7viUb0I/FGFWqhEZ'
+        'FU+3OF2m5eY6xoAfDNP/ZDefSHNwJGuavd/Ga56UCh6V765Ko3AYe1tKK8A91XkHyBsHnJkip9Yw'
+        'a2bGyuzKdBgHV1TEUBaXIK96gKlIuWREcrDEKHItxBlgIxzo0gRePdclmmfkoUisRmyORsqiEN6J'
+        'VKMkcbH8Px8l0llQ+Bx/8sCRLqxR6TgnN33MgomcjUN5LAVFG7zlWsIkcmy/3silqpl/y0XnuKPg'
+        'ThOodmdBsLERSFf9zaAnen51HLr7E+JzPB2UBRppNu3dnmaT7Y1o3kdYzomC7HDv4ZFRLrxLApVK'
+        '9mEZm3XuYES2Fo3SOJaMnyY5mKg9AHOzv5NVWUeOhU38EdvuJfuFKgOYfx9kPqaX3lVPzprgxxO1'
+        'OQ6+rsXdGOmy95Cs9mp4qGOyRIrU6FCX3yPaZwBA4tZXcXKk4pQWPLcWeoxmy+syJJT/yOPwnzzE'
+        'ET+I8BiZUmjYXTmDh0ZMGyAwHg7NOdBDIPEtEwvNCpw0Dl1CDUp+J/BKCdFmMhST3WgaGEqj9gr7'
+        'pJEvykpBbu/omzuA3lfnQHv0rvxWGKTDS2iAlw/mg0t+AmNme2DjC63mBRSmAbwOok9M7/lxPL9B'
+        'EKElmg0OlXY9lhE/LKzIgR5tREv15HLRRnvcJbGKOPEsb36Si0PQR1KCMIWonWiVdA+CmsPINHev'
+        'dS3t/YHj7361wWjUem9qhAQdGdbc+r07r9pHAsObskIfnkqv8ADC3HyY4F7brV6f3px3Zou+DO0F'
+        'OYZC/n4p+RV1GdfHldOfZ3P+YxRtxqjH9Op5at1cOlrrw/afMSTkrJ8mL3Ek1ehpjMS6zksTor9q'
+        'zWkrC/arf+pJjApC/4CTdKVXpf/Vd44e+M00JlNbIKB/C1Tw2qYYrziroSdiIeHlL0i5wFp2n+IV'
+        'sFlSxxKeGIbaFfPYgXHisAjwn8cQnkdaTELpTnVqAoR+r78xGQReov2aTbVIMw/U18rlB4e09UJ8'
+        'O5SGz9igpzx5TS/j8jexwYG+UX2ANalrBsN/IRhcrRVN2gsXdVOd8XJMHHY5N2OcI+VemhkqUoUx'
+        'MTMockcjoQ10PzqpDauatavzZL0trDOjVD3RE+HJzvbfn8dLVcZD6yn4roDZm6A1UQhVbW2OSDni'
+        '1EemD1WFxFyg/f6PUG4Ya4+w6B5+NQvrY5jC1B8qFxC+apzW+GFyP9K7RyuSj86O/cN3MW/AEpix'
+        'TySf30n2s1tx8owXR40M6lY5BZHQbXS0Cn1AAEe1YRTaxclTg+C6LGox0uHx9I2fhs9HebBPl1Rs'
+        '33MiyUC+nPA+ly5MKJq9aVq/KNtIfPjufylMqua9P79TAcEh/GaXwFtbYUscpZnL9+Amkl8PwBm+'
+        'Eh8XgxeLS8iyJbH1l7nQGxzXF/AD3+OLQKrjBXFivW8TIZZgLsme62zyJ0conmMZDwC99sgu+DXV'
+        'dS1ji1qn1H1JnZQxneDL1B7cM1JuSokBqV9oaaG8LO8GRGDa+euuUvtP5mkwNjcHx1F2nkP0Z4nM'
+        'jJVAJHdxUdRylB2u+dAIjUZvL72uH4uSqLKLazU7yOSKY0b+bTezsJ9x3kAR1CZTBKc9UzZGsvmi'
+        'NQX18bVJAlEP6po7H+DENzoAVzgVBBiF7fwf/inBKV88JxmGEG/Eu+X2B6FwM9wig0Is+1WF/zk4'
+        '5le4VIMFIURK8SDMxLsa/qB8/vvahQs2encDLaRGA0WmyrxhYPaELBer63WVgt0lxcxAJ8VDhE1P'
+        'kpZ2HJoMDRMcxfh2iWPNdkhoH0tdHtfJwUkGc4GpUbfMl3Zjtqe4Bpf3y3/0GQMDeHQ1cZ2+P8cG'
+        'LlJ9FRKZ+n/V22Mw0l7UmlMMyUQtGT1hZPLZTZGmCFzcOP8+WaWTAguzPefxWrWKSbzzpO6GdDqa'
+        'd2M3RjPYC2cGihUyNe5RivTj/ZKBxlSPZyyD7t7MNc8RuPitGDo7GGYLK1Ld4FYVEyv20902Rj5J'
+        'DbhNP1b2lJWoRWo/c/qZHfgvqJwDEHvLenZG36xoVVWSn042LgAADoIOlegR6dGZZAF/3cN3T6dl'
+        'wZBwBnC37jrLyVA3JyLqyIp+xQl0JLRW5S+a5Ak2pLixS5dpzreyMBaATv2ImF9tYgbCs79Or9FN'
+        'fFj68UtgowN22nO47xYO/KJWrQOmSnNips2DlIrOiJKI9jxXPHc1r8+svOA/jQsYB58jCChAED7t'
+        '1KXVnSiaX5yI0fDf9jG28W0Y2FYsTpexrYnNZwSE4Pi2z/7zg/N3kTpTNCm5OUSmNBJczzvwLbmx'
+        'U2YxcP1NV8mUUJt0fkTD2/HAygdosekM5A9vptwErFaVFdlDEr+zoL3d72dVybCGxBhCOfe/qltm'
+        'iV4I1w8GDO0VHY9AWr1bePi7jAB/d/vuhPVswxMCaKqCC8yN9ZV8xQ8Rgc4KvjWOygZQpvOI+ZI3'
+        'EB8Qiw0ypP/u96iQFDY8GU1uZfdl2CuQRNA252upVVvVM97j/TrAQbpDD4GMXNFX7YqQL9o4EOpR'
+        'Xs3Vawi/xE8XysLRCU/yuk60NYWWk/pQNQ/IAPN1FBlecZGpK9BTDCiXj3ZgsYTAYEeJhUcZSHjb'
+        'Dg6B5WfEu6zUm9Ld3mauaf7W1x6oMBDosShkpkPjmLUcHgf1W9HjZuuGyC3yCLiC0Vw+nkOjPJG6'
+        '7pRKJPYUysklRVUQ2xrKsJHyOf4cqzm3TRBrMJFR9+RepEey2AARI7zU7lZQKjelI11UY6hvR+wL'
+        'c4oKjtgOHgN0XtvyFMA+3SxF3QXq5oIceuMdYvxrM1rO/941NTrqXha/eS00XHOvTvu5fd4ckfbQ'
+        'XwaShmQpx89Dt9ocnrAD4yz1aD9Ytwdzst7HD/w3q5FhqchQ2v0GJGo+p7qB1ACAJ4AEBsJF0ta6'
+        'fLWLl7/J/ckZWi1c3PxaZCnpu9qEVcVGjyBu0/daIE14gZzJvHBiZKEk7OAN0+seeoEp9aB3a2zF'
+        '+lHTNlQj/Hdj0TULnC4W5PsgPepZ0gMupI8NyQhds6R9a1dEhrPSK0m1AfT2mRGfizwBdYOZCxm2'
+        'fExUvNpZiAgHT9z0gqVDeZUPvR88bqtVeZFUcKfhMMmqHLv5ULAtWwu4nqffIUR+DHVi/uzUD+Uq'
+        'urBYZwqRN9UjOnvvN4vOTp5QAEDEsdpyktaPcojhlvK599uPwN/ZP7LIFqqr4F7RqOvDfYV0zW0U'
+        'CkMdRk0RIfVJ9bWVhHvcx2xXGLr7nT9O4T9H9lFXEPw60hIV1XfjLxnesSBD0M/2iKSSzlrYvm+8'
+        'P0r3mQAhNZDfVs9w4GKoS4XaAJaVXEfrRSwF2rjwLhO5DCegE7hhpLcdQPGqegUen4LcZkNse6LR'
+        'MrstwAuGAZu59CuX6O3VUwIss5Gyc+QWC5rTI61CiA5r6NIKKBk2cih6Kl6fP7ANfJqgZIk1p6jy'
+        'CqpCaVJEsCbjQJ7iLytDIVyYyPn3huus2sWzkEbhuw0CZiqVRU4ht7VI4E6eT0xlUFWmJW+5tcBd'
+        'JfKpu/mLHK+rnc1wLpQDcLXUxn2Zpu9zjQ5WbbfxZJqQS72QWbNQobsSo5Gb3G3oeqaETF1WDHnI'
+        '1Gmtdm5BCEh8pg/1FPtTfg6PQT9LHL8Mu+kIIqlNyge080b3a+4zaHpHGM01n6Y4wjaPN5UGkXWI'
+        'GrcqQdr+nHBcKH6KSw3+Gvb4oaCELVzAOCHBQdQ18NhFMtFC7a6VCKdnRy1Wh43+bbiQzRVAn+34'
+        'hu8yJxhr/xJgGyE8AiMePN7F4npTDztj3EysT8fjGTeNwIaU465lsA8Gj/jOSYy70y24vWPKz1L6'
+        'aNi+B18+8mJg18Xii5jdO5YvZdrWhbdoJJZzEy9PmBEfRYl3xEiA9xwPKQ0pu7Xslm1WnU+xl0ee'
+        'KONevo5swBX9ZF9oqMWt7jfCEFj/nq1BMvQAOk5HQsnoMf+V+5Vr3V3/5P9I0DuAk/i6C3+d60v4'
+        'e+tBywNXi9WzconBziMDQA4v/ZIf1FAyPu6wcBvaT4xKvN6cQmLuv3GcwDK2i091p1YEzDX9EO+I'
+        '0Fzi2gxrbHGUWDb/GFsAl+t7E93QN2hjhXMPa6CCjmT9uU4njoFLWC/jglARqjwdlrzkgqa+7iR8'
+        'sF7X7ggtqtcZ61CLSfW/TBrGJ2u6ad5S6lMRBgZlBq2Noc51vlOldTSHh+xXCp0cKoUJ1j3fSlr8'
+        'BYGdPpjJdchA/jPkERUxOhFBpJdAUBLKW46w8EJW5wcZvNwBmAD2HY+Kxj5vIz69yIDb1ly+bxZA'
+        'gKWlK1Lu5bH+awjN4yBkn73R0cdtKboGX1LHWE1MM5lCyM7cZ4OaKmDhnpUGrzDxQUwhw+byHBlW'
+        'aWeEfjFVV9VN4hyOqfYWNHKU4KV02fp50gX3WJXH6UjTSJ5LQAmZz4g/N+kbhBZz/5/WOeGIdhrK'
+        'dWDanOCetIFbI6573q8KA43uEOwtASZVOB8/+YgJMLNQsfHuC26zdIZlu3ZuR5VE9pK+p7s+KUzc'
+        'KS0ZSqt0zHZ955WWo+Uh5N+yB5dIW1nrjmPFsrI7g0AI13WBEUjVF+yqSvGD1LWqGAXF5phqbQRl'
+        'Q79eZwCZvdgXjx4tsSCmhVmAeLi5AvnwTHiN2obKMhl/fFjcVJO257OUPqF3PpyVFiGdryTVXz3X'
+        'hi6zDWiFwn3hYzzsvVkaBtL4pmW3b3cuEg/EVQFe1IyKnibzisw+HQafVylA44aWZVqKm2I5e4nn'
+        '+wQQmedaaeTanJNoRI7xoDwYAK4tEV8mzKtJMCUOaxMfdNCFtBjv/DwoemGx4+gZ91uM0+fXwHtF'
+        'hme/hmzlJ6/hMiDkD7J9bvT6ATrRadS0q5qrApEktkNiNtPNZbBDWvdvoFuOyWLOgeVlbl1JnaPM'
+        'f7yN+k8+xYh326K4WI2PwP1Pu1tGpYkCGfoZ7uR3J3Xgma7fTm+cV22gjr8WcU+6+PepIKn9UJ6e'
+        'l7VB3SqWUgV0uP5ltOK5RiCxjvFA+s5J99x8Wky54LeGhH1jFLMHj51PO2oGwLWnGHmDMh4p/tIP'
+        'j/oGzdhJLR3128HHOdRvCiNzlh8oI8C9LZRtm2yo1FXWN0o1gyjWHJ5dTDCjvT7j8zkNMJGxqmWD'
+        'K40vo+BYwYkF2tpTKhnhpdOzePExSZE4ywiimLUOkWXwxIIIn+RxOzTSYs59403mhcyE/gjbagBt'
+        'wMVc/jAdJphIBzSEQTo35i9CuHuLtB2pILC2ficIununmNYaweuqAW1e5IWX8DBVtLU1HN19R9Oh'
+        'dD+CbP6Cg9LAbcB1Ff6Hs4rMxlISUX0w38o3myEUMyL/xp5jy7F2ysakKzU9azSvDvL+JMD7ZjeC'
+        'WNNqzCc6GBNRcwVw5rpwN8y6Zcot7i/YpCbX9gflS5LbVX1i/mPjq3YLetrbOiWndTHzaOzShoNg'
+        'gXzki7Aeh6bLZVa1QaJNB4SS+HAUVwPOAuktGVevV37SxxHlT6PA0U9sjkcS4JspL+ZoTNtlPxC4'
+        'd52d1/PB2OvFYbOpnOlyv1CWCQA/LBKrSmA+U1wmVzzjqrGwKVAXSYyfP+RYY9OOKwrkhDLoKP5B'
+        'JiTNCxty7DnGkXetMSzacPxuMuBK8nWnISuK0r+4LfEcxyYsuShtTLsl39WrJcBni6voxjTKB6si'
+        'ljKdiww0zAYFh2cU7D0vmrI8AsCNEWucz6Z/BgBdvu5j72ZbpLSvVsdqOcyjnaIFHa1TgdVenPxN'
+        'OqQCbcN/NupSGvpPY8mhT26Qa9CxbQz0mg1LKTO41sl8W0M5wOFiuWuqaSbz5fDf1wT09n56TyML'
+        '2hBZi4fWCHAC8vci1wOAEVBcIEnzmyndmanudHS1qPqjVXW4wLBKtC3DloCPeI7eOyPl5zQX6Ipq'
+        'rrhtv36wH/+amyZPOednpspNQhYp6CxBTAy7h3KAhbULcCby+pAPZkiNB0ljvA7YuGXZGrMTBOFq'
+        'dryeYm42rlAnryQ6ABgxiiEzlVqSBCBrimV5z2xpVueK5JRL2Odi6a99XasdDWj+qhHe2Al0l68f'
+        'BePOIi9IMgyFs8hY31tyTR4P6RI37wirW8oVwf43zYT4P5v9Pw4Lghthh/Q7L6+pUJEirx6VX5pQ'
+        'DkLxrjOaFOw5EvNIBnv3X1DSc9bvVho1rKOInMpjiOeHlT+F0bzTR3z7QExxkqiVcJBWSmglKUD+'
+        'Nnr6reehXFZov0pd0oIkXcw/BOtccTjvXMCBRXYUMb7BFjeXAYxQJDuIhUfwe0uGxc/XfkX9B0gN'
+        'ALx6zGv6ajNEe6g8wsKxR3a8Qm1ruzNEfoU4oMn6YreExeZ/hxBAu3ViDzM2R1Oahx7+31LfqAEP'
+        'Pj5o9Gy+eoa6TI3YyfSKFwsM9KNV3gjTFdM36Ou9nIvXc++0RMhJgOi56ZinQl4jzF+0hwj3dDle'
+        'p7yDozwncM4uM5b7m4Zviy8FwbMS7jj6IFk6M5ytRG33OUl0vButkj0h0du2bO54ytg9F2hwLaId'
+        'dZ/Rfi6Wm5oMj7FYmsoMANuwKsKjIzSkg9Yk5TXEh+9sxRabBw00xCD1PoppHP5JnpxcsY+2Acwy'
+        'T96qaC/z0I+QYaAoWmQi8CpNXgQIrxDo/knQzRbrgbxtmnlmXFThcCUNz2FtpKKZ9stk/sqDzPNh'
+        '7n1oUNlkujlQW83DDuiicDkEgmilZs33wKEi4sS7dKtjgYPJgCDkzSF4HTJ+uu83RMePRQqOs3AH'
+        '2s6T8UDOC6e1hmWoySGXjcmPMN3ZdzxRwU3c/2Zfdvi5L/vj9r+HmQvOsK64urQuI/iJdc/2XTJh'
+        'mqrpp/Q0OIq2juPO68bVyBkIfU1iggqC2gmPfECsLKjcWsigVK4bGCb9Rcf5x6hs4AF+t+nVMslU'
+        '1e1tZvU5HsIkFtM+2wf5uQy08NOwWZOTGr9cR4Nmd+yuwA70q4UYYsHO+q6rSUngj9Uh5vYfuzTK'
+        'iogbf/hnO3ikPLgb/3YruBIukoRU9Uhb+YMXDBecJ0BTfrSrzW6RxnrkQ8BVl9ZB/Sgu0fx85/ve'
+        'XffJkAPgOuTPbogMX67mPIEIoVcQ76A+XY7fo82Rdx4u7wpnJ5fZx2qi3VGHffiUHdGo1QDINS0i'
+        'lau/sDSWfmIKHSs7KerDqkV8NWejCOcOY8EOO55Jqmhg50hn1Gbfz2auYvq7ANQYyvcqdYqx3pUq'
+        'nET19jA78mLQpxTbTuLuPwy+Vho/lCCqsloNCcTR8Wa/6QWr1XFl1IeU1VXeUP2LQ6nkigbVZvL/'
+        'zJPsucqiVptmwyo9vITzUv3R9081J6+sGlu/VZmY9AYaeS6vCgSgxyRD1bpA6Cl1RcLhFzaHZT0U'
+        '8JkAo0mx8ACWm+KkB9ZuZulQBwP4O3zZGqUtW8Ime3kO6hHcIIRM3JGj5dHDWLhf8fWM6hTV9a/4'
+        'h1gYLBsFQ5tjn6YV3TYoGZjs6SFk3X3d7nlTUSVa0rNSGVZ8axGMJHLP+jKRr9Lek1zreTSRvH70'
+        'cCJPjY7jyY7NFZVQTOEZhCqKm1BDcOdf89KIY/5V/1BIqoTbAbRmxSVETAqltKKjZ3q3yVvCxEhp'
+        'B2ceDlEoMPyOcYQqC5VvAewnoyV0zaH94q6LusKFgeDg8X90vlrV2alw4Oy3MtL3yKJ23ZhZ84ir'
+        '/3wfPAA2q53DkMQIpSIjqh+o886EXPgUmL2KSTJ5Hzndrsf2QVYGXuq8oagtMlr2X6BXUl8VUjAy'
+        'hK3ygc95p843TVpGP0d8EMkiwv6FTcIO4TwgaygUPMUDTHj6NoUeJ9Ja1RZQycEEfFSSF2j3g/De'
+        'WADO2v8Ki2qLz3sqpfxBSVh28snAtL03tFtm6hrpowkoDJJHlGC0MwafcW6lll87vfGUG1BNEObP'
+        '56jqEgr01J9QrGspN99cBvNCOC98P7lF6zfrSbwr4VNJiIpO8bygnKXD2byxQ9WDcoq4/3O58Xg0'
+        '31MpmRfqmkD9Lu5sEogGPcwXER824VrWMB0TOUEaFSfBrNRfVPz+AoP7zzWe3Oal+noUNnakkWD0'
+        '7Nd4cDc8NZ8rF3FePcWXOLLSXwJo/NgwdBU5Nx0UGq7gZ9dsMsfgQ6KZMqVqDonMhrXdNB/yKHmZ'
+        'JRujVbFKJ1hZshsPxAM8GwrOluSjR4ippkggjwz8hGanghR3TPHOPLNf8V6YtoWOFop74zSGTSfQ'
+        'S5iyEziPlGtu14Hbjw4yHHV2OzmTPexmb5H+pWvlIJ2VPa3STLzHyKlqhnkNvXhhPwTyVMuXClho'
+        'nCedKIayPV54WjHDOwLrb1WY6snNtl47iB+6zjyJByEOdW+H/gVqvUQWKMs/Tut3pUugxuKXuqVl'
+        'fOeI9IgotBwgLBzxkyHBeFuNwldNskllWoZUpyxsZUSLSSqz4rVLnQcnI0oMzkxOfGko0W30zUsh'
+        'ORoufDszp4IFJh0YALuUiJbuqYdhU6aTuv9kiJ0vAMpUdph0PJU2SIhasRjr3B6KMZiBhIOWb6Px'
+        'v8qo/re+JbFR/+WGh5rxfNanS6SjhOf/JzEmP4DjLXKycwKKdIdFTnEqv6x0VGkgNHl2BaKb1ywN'
+        'a2K2x1jxPAtZGnLIHie0+qAk/GGq6p6zlD+F+0rc9ISChXPab+lpyLyJJm2x6lhF3AIp4XU1tCOu'
+        '70yHq5LGZpK6pECvzllLkhwRgRcV85j8HmbuZpEfMSPWon/Nmy8V1O/6FYeMdPYP61UaTMhIJ00q'
+        'Ag9ylr7Qg12l0N/gC5rIDSd+1YF94EOHEsF3aYvlRuFqlZq4dCgs7plxiWGHnzoI5T+8q5qLLQgi'
+        'id+MOQkrK8SP00lETxurKQKnc4TXaX6juD8SfDV0PWLO8WqCtMtlFUQe8fIXvEpzFKtFLJSWrh92'
+        '6jvNFDo/8frScZrcDZG1B0ZNBSdv8z9Ao7qsQCfNUXFU38+QgFR24gc610zfi56o78zBLcPw/JiC'
+        'vNKVzke02l14y4F+xVyG0MHIQoeI71oHsAyy8rw63+NZ2AK1iZXYN94MNVYaYhPFRdG4ZNaAxJ2F'
+        'KAjhSfJu3DUQ943Bpr4RPLzD5PxLGYW78LpVTbkx5nq2F+FEuxUwV7NSkW1xqyPITzQGP5Nw6f5+'
+        'E9FUZ5PZmMbXf/bSeZaNf5UJwhcwvJ61w4l37ljuoiNMLkzVzfuLKSV9j0QX+Dz646GJt8uhuP+p'
+        '7ZTUM6PMHQMJ9V/Z4VYdHPMcBMvYnZnrCUSSQBZVyPjfADkUQ3Q+3zC7uxEC8/+jmwONatKokYl6'
+        'HhZVlmr/STd1ygJw+MF44J9GT0CELEajWF8+l1MRcKgXi1gK8WzxAD421V91CqiihhYFoKcb/pEF'
+        '1NE8uO8+dkQbq9mvNr2PEGApgJlrOYdLbRysls2xdPdrKwnLHhPsZ2oe2vXkt4QkTWHy1YoQb+n2'
+        'c4Dn4nEJlki7nKRK/tqJvFR4Kml2ZyXUjKmasfcpMkj41ASHAPy/wZvWweMeZ334f2dbR6S0iW2K'
+        'XYiKiDmghutAuRp7Jv7gVxfuE3myNESbViC1jRnrd6wNq9epD2A7hdjo8XKQsQ7oro0YTOrXtR8v'
+        'VNiZ/KZh89oriFuOCE/QSjDRgmraQT1IAwTTrAjjCiQH20ujUgRY6hcjj3SJjqTaMGxrVVQN/8Oq'
+        'kEFkUKq5mYDZOHrnXN70KsUAKl5hox1tdpfBVg4XhCBk0fqcDcf+NeKdXCdfiupTaES0o2KZ19E8'
+        '55SO+E4MQ5ZCz+E0Or4GtBpMM7yc3akFoZSnavyA4huqXAjnh69rq5KLEJoIiFLAodtt/j8WvIhp'
+        'AFCWs0+QaXKkHuAqthr6kJBb14SBbTaYoL9v7AfHdhR+/eBvc7iRZBZOAA3rkKcedYuFtGaYdJTb'
+        'MWxfNdZ5hHcw6yM36v9YMu36WRvp4QzzvQheB/WJ7/CB5+E+SUeNGw6M+R1k/SC/aOkALkvasQn0'
+        'aElRDc+9szpVIRGl07p16vtHPHhyscQ7DaxMreVUSBiaghGEE3zHLS78/c6ajMsuNzLL0aOoP4i0'
+        '67ofQr/N7uiFnzy856dlrNNinvxBA5qSCfpvzuB6QGGSbz+XseBoEY+34Z0zLUYSnan/OGfyxTLM'
+        'qW2jLRuvKhOAkfknmPCokF8nKMtlMRYujFeOf2SEd628Q6stxxsN2c5AVHjukoG/Y5MPqsmaPb+a'
+        'VIk3ZNVyM1kyiBG+FKndBybi1hywBf4bwCdjSfl9SQwMvrzPiWValIeiUT2L6HPIK2r4thPSWq/y'
+        'HTJuZ4+nrTp2grDtLa5Sjtp1mlhX7o9udBT3G6CLGpnjv4c8PveqLnkA+PvhYhiN6HdksclfYP0q'
+        '7Pc6zewvtnSTNFLfeMVNbOHjwbeYt28OS2zE3laP+sH8wQs/TWTW1YBFtQ8OhPJHGT5/0e8r8Fiz'
+        '+OgIU4YvPjThrucFF9knKe2NWgszFdSBea8m8x0tzoRrvlDyL0AO8ykZWoAEh4pqdn6yLtU1Yiup'
+        'ZcILIyzzqcKyFLwJuXZDJt6G306jlq8tntccgc5ML7uT/R7fRpbf5INIvfD9h3fH4Zc9tDuwbRH0'
+        'mCCpcVGHlIx+IKWRqf1BEruUysuuMaYf2JecK2cbCW3g5ZE5IFVUTQy8Qk2c86eDJfYeIVKYx9eh'
+        'ggyQO4WxhSgshOxXJ4uJqEnNAtlXBHMu+T8zXqgnIe5S1rtTbbOqqU/+vvGm7+uTU3Oeg4xIhzGV'
+        'ZiTU+NsxSjCzJ4I2jq0ehm5vPOew+kuY8pDUVX/UHOQjSy3WK+bAUAmbQhUG5wEWckw3mCHkoZcj'
+        'pYyE2sxJ3ut004Q0aJJnt5yQoWwgh77UXkBpJlIf/soEj6tEahN8gw46LCgfRv1Qj45SpNGAIlQE'
+        'k5K+R7bOf6vaYtXhuN6gYxwWs9EcJN9FFGAvesEEgHH4TxeoMMldCw6WArXEQVXD5v/vwvyjyYfW'
+        'qE8GVyriBMbqVR7kD7/wlSXHXKLZVv0pqOZ9GwHWFKOxfHkCzc1M5CP0007QT3f1ibqrOLv1XLdx'
+        'KaX6zv3f/9YC0+CciXDIaPzRh74Un7U3dEQsKQF8k+BqSVdgbeYDByXdA/WeZ3lfJb6rsYFkUeoA'
+        'jejo7Z6+TAjAGvgs1DMPo+gSmBfi9NgEpl99+5JCAXYOzf8csP+zfgSa31jv8AkAXeK6erMvdg5+'
+        'bpQ9UyShe4TdBYdkMF9Rm9ZSl5F8vMehAdPxPLj53vjNpPdApU/3nTlr5edcgZvL2BJdupST8dYI'
+        'TRvpRZ9TxIyBB2JMtrDVeogK87GksDlWf0kvueRE6AQxc0Opwq1PHl3jc/0RdHe/6xywzsApxkSm'
+        'rqFJ9WNMJhSAbfY35xE+P80WLjrrZ/zSuvbSFNFXvqawo5PHU0EJQphmY6+9chWL++RBmWhWThhq'
+        'BGHfJiQzBj6bTBQXo3+p5y2WZueZETbdM0lzlCLoVYyZG3U7/Gnb/EjEDY29IbRFFEn86BB0+1hu'
+        'zJt5GrYvkeNNahM2P6Ob42HmPod3udBYE7Owhf9v2EmfAN1SxABtCGD4Ym6nNqhHwnLzdvFi1dSB'
+        '6xslpmRDmDlgzpUX+EMng5osGpiAfNsnLlXuhuzWCs8OvxWCJBVR17FUl9d2r171EcrUuM+6DU5G'
+        'aYYxZmhGWSVZVtA/v9Sfau1z1pjhn2B7owEP8NnX2bG8I63MtyypEfK02xCDSNBb0QAaV4yjD5zi'
+        'aJNRO+7e6XPD2xo61aBrJfzQ3UeS0qInti9O/ucAeSJNiPkS4Qoduq0e+Wj93d1wyvf5ZHBe+Auz'
+        't42GcVfiOVu/fJV20Ww09k9aaj/4vQDmt1sEQzdMlP1yyurP35LDmMCKBuc5Ko3sZ1D7qoQ9DGNE'
+        'U40+/PF47AtEV29wR2YeIguwWWAccl7PEXRkOI0RwjBmNVYHXmBw6ZA5IWPniYv4ur0eKVBFPrd5'
+        'i86XakNBQP18xSMlV6aFznmAZ9+wafcIKdh9CgKpSrzPNYIWwBsvz7RQJgqAuainH/xzjQNEdPyV'
+        '5tryoqVGnY0VJN1SfxbPtHJBglOAWYWItvs6Ux/ki9ta/iKoqBW1Np3u5sz/oi9BDg2csospvfEU'
+        'yk+NfOZL2BVVceuOh+JWBu+6mmxuQexLaAi5UPl3u6EhuQtjvtL/9ekW0hP2t93DCGTciSfyxsPm'
+        'hdjvqwpeaXmSLHpjSAgX5H5Kk9vf005ay6HlNYXtOZWA/aReFuC6C6sBLVA6uhWYf0zZv1+ZwjD9'
+        'FmFyHX8pmct8vF8VcYbng7G829BJVACNgW0TrBvkSaSIwWhTRIX4H0soMnUys3ygE+u/CIlCKOks'
+        'fZxWL0L11hMqsJ6nneERSsLH39JLkwxHe1cNDSxmpIl8sdM8qvvpNmEQkBNdkR5CiboNSg5xHdhl'
+        't5EJSHZlfCHyBAjqGs+8Rup1TzaCpadrRloZ3hadn58seMoCUkvnzW2UxCxCgsGW2dE9rPMhpAuP'
+        'BYeWh0Zzm02Es6lTcLeeGhFsVNXaesgLQKuBsTBhL7AcRQSyZYgtqYIFa25kBxyf20HXqDOgBjWC'
+        '+wLn69AddVznM8wROhxh+C4si7tEBXsdklto1+O+v+5VQQpm20AXjcz1fyUhZ2kkEXHFS82Vwg5N'
+        'AoF80hCmSIDdFcq2FKYvKhOCW4NUSKygGPKkl73rJEx01hMD05C9ueVXm7K64BSHVGItKyOEINl7'
+        'sSp7hwWHMVZ5Qxid3F40tyxUk4uUeDRUWWA4zYM7Mxq9w5wgN6oihTsB5U4XNYM2WGSeINKLzxIs'
+        'gLmqhqOBpUpgMcntPhEytJx/l2/8cIvJfYT8XGOsTgNqWZDaGyoV16i0/jUiBEA6wiCRl4/0qsm1'
+        'zcF7NBPqgFFU5bbxKqNlRkpoNn2SmvLQED3jjLPiRZerWFeWCiozS98263hWMXnumARyHlc1sDLe'
+        'aJeLwd7vqLVKnlQSrxIAuSl0gfdNIGey2RWgAoEgX46upmiQysc79/X4crRePiK4ywBeYW2yxYTr'
+        'iwSBVu9bIJWxlM4n0eOh4mAiBGKKV9+KVoXP58V4SlrCCwXOUbatZAYiQI0eXj5DQoQNUZ46+qBD'
+        'PsU/biK4Jkk/Ia9Zt/GrbDtFO0fJbR4ykMJcnVYZxq7cwntBvmAsVZEoeElcSIkKI/o7RyuRlJ1o'
+        '+Z9NExqa/65Fi1SD84rMtJinTXQNgCX2024oHkLTKDdk78mN4Qd5eTiJsAe3ca0wZ2b1bdZMJpyS'
+        'SdN3UQcGluuPv1NFugASPkVKKeZcZBN80lxtCHpjUf+4NiTK+JgUf3mV0NIObCKUGWTMX3vJEz5+'
+        'EbB9nA8UCzu+MDExuivroMRymnxSN4BhWrVV3ihU1sOR9oG8VYoJ/bzqrwRQUdIx6UXt+8qC0li/'
+        'oWDbJB+ucuAUimPihSwabP1xZB3Jx/HAHemeMgKrRJRhB9uaWyoZ1z5zKaX7XUQHBEEGxbuYvBxQ'
+        'gwIviXLd1pXah62+TZlTGSiU7A2m7Jr1ruqu0C4vO0eFnxSgwn29SakwNwh79z13aH5MPn2fYHmC'
+        'URAI0hKSu2WMsxSW+QYV/bAKtjtj7JxasvY+XgMNSAB9eEbTh+0Mr3TWWF53JC5CZgZmiJ7JSWKc'
+        'uPupx0FkydxurAacJqRCvDBLSs0NGdPkE9WK5OJCq7NkY7uIeJfJMvRyCfWtbObDc+W8s5ivz8DI'
+        'BIJvC1p+bwzkSAPOBqSUCwczEF08SbSP/8Pz4Q5kPv1VsVXGBZqUsHTFd0rWdgguyzC9Fy+EuFii'
+        'J0Bsk9QiC1Ug8R4GFVDf94d+Xney7Mt2W7gjNIXHMGyr0K8E0I9vCbh3YAD+IIHhE8rOdGCFsOdl'
+        'mGpahMbJnhKh0Atuh4M4q5C7tILBoiS/U+BWifX0zrzhdI+sese+Gh5PcAcsGqagEB0RbZOm0Ia2'
+        '0ij8rMhN+8xA+u5etODs/q5hr7yBiS1VJXgO7w8t6sOcnqVfWInGwTftS8m5FkyHSDMU4SPiNutO'
+        'aup2oSkNZoBTXXPa33MHmNwlhyFT9mDLtjjSFeVaX1TwA+8/Uv9vuYLzWcgspkLRA8JE3QZU7Pa1'
+        '5KY7qw0OscxqblkxwAxK3L/6GXTR1465/Kf0xMyN5v+8V5tl6ODdspRIy0JmK135/jU57LPrrYYB'
+        'd2DT120ZeTXLYCYjESZwjMtjIbOHi6+Ik6sP1PBINq1RVs3Oj4+1RyHB/f5IYA9mPk3r74sBWEvh'
+        'ZyquDuW3aIE+Ln5MaZaBTbuJ/1Z9VWOdRT1gddIba6zO+nqevRH6jz/CRF7Z/dr5w8r1r5GWBins'
+        'fDdFc5TVfzJmM+xbukf7XM41qjYTBCj60BVf0GvqZG6SR2w1WrUIxJU8he1qLwYU7quaNvhTCiKR'
+        'uB7y22/vyx/BWSOB04cOsdqNJvtP5HjPC5wCTB54Jh+6Xcec182D2PrgmhECxO8k5uPreKeI1BIG'
+        'z7qLTRCHK7/jGaqJlueGLfjthoa/1W+izaUENE5xBQYi46aGbz1IoJsmzvDPudaHDIu8LhFtqwJX'
+        'unYecGG0Tl1wTLVEx5vGLHnBw1wVcq6jy07DuvYdks62l1kh/W886Jc838i8AE6OLtoYeI6Wcvre'
+        'E/CrS6Xrbe0m1xSR3S3YbGkeLlJDUVd5+CYsSSL6xVj+WC8wVG4eIuIZTP8jljIRcXyOz4EydV0X'
+        '95fTnjczt0X0jNYJjLlxRsCKkEoiyQOs5y6jLxWJoGPZFfyB16TiKhX3aYFNH81Ql0Z9GM+DPXfG'
+        'NWhcdXfTot3zcKRrl8lrba6WNwX95xAsLmapJv1OXD0hbKwyrvJr/WrzMfMiuVCAAORgdVj2w9Ac'
+        'XdvODuOchas4+kd8rJ/MftHK8fz9Enp+DF7SoBWXzHvQBR2XHs8phLKGpQWBaXBPCJD8ST0m3rPC'
+        '2yHrBFao287vR/UJTjjkQDPuzCdaEKrs7xSqcrx2fQE35rj6fgMm/vl7a1bpMBLP9fQBABt6d39L'
+        'M7qLoVnhiyIJHAok/wOWbWtuzPPIZzwMU/+7xhAkjq73OB6nuauUYzNpM2jM938/kQ951xzVvyq/'
+        'OAJEVjf8OdT2UaXc7YfPkxjHfXS5pR4mkWftnVOYSYIEnPcNQ7FbJ1tkJtnEtO4a9xSZqg4arl+J'
+        'UIBAQUiJ49qq4v+0NedpGbmRwx+uve9jc1r2ID9CeyfBzNbA979z7Eq+6RK0aFfLmymNb1KItyKr'
+        'BBb3N+Zj0W6gWfv0skpok9xtBYpxBBKAQz37ktkZlphsHl9kaRHTr1q9y5nx63Bj2vItPySN17Vm'
+        'tYszwvw7Hz/Xa4oXmet9ix03KwQoV92s8CDQBPRPxZ06WEqxYguU6S2hxAHxPljbgf66de86sp1e'
+        'GpSZwvk1uasOfs8tZuFwTRsdx5HhWq6m1DRkf6kRFBf4ofRntwYihmBRyfoCC7wlXFsfXkxwwvUs'
+        'eXJuBgcrnpD/IqqigyilCk0SIWN2GSyGYjguFGyJcOza2dodNZMzjiGnte8lidMjlBrXXGt0F9YJ'
+        'E1i6Zq3wnB7p8x6zxk8Ba9Cl7djq+LP9e3PaKxlZ43KvIKnI1kXVlCk226D9g2JvPfIdwLFvnYkW'
+        'Z+VS2n8C15bXUKlXqyznRx/yA49mmHDFdGoAmCnFNuyI2vwV3Ir9dUkBr7xE56oqsIpCeV3R31Qv'
+        '7W6ZT3kZkmNO7dTN91AHswjT6eluUxhhw1r5NXoSkit3ktrMauMJCoyKMx9dKaO8237hoDDWJTvx'
+        '9l3i+iPMrgxF56y3fEyXH0QJ7/r9HcCQJDi29KeLikb9b8UatlhtO4i/ysCkcOAbwRx2kcCCzpCA'
+        'zS4wSc9Qiv39BVJ0OwE4i80fuxvBPNT3OjTHelN2VMMtjaAx6yMogiUqYckbFPsF22CWpeJYi9HN'
+        '5GMu8xTGrEEPD9Ddr+mstvNvy+3PTN3Dm3xFEbmyxRJ2vgZ0cC0M/ccp0KscNwW0BdqNe2lsXMux'
+        'M7b9Kgia9ggvurf+l4/F4YiDQfSaX/J9C34aC1YaOj6pnD4H90e4wy+QBHo8oh39ofOks8U2C73R'
+        '1crCUMW298+gOf9vrBcM42oAuffBIBfGbLCY69+iO2rVjRP8LkYcz86ox45ZXIGcS7ZO96RClUmX'
+        'A0GT0Qvrq9ZqaJRtk2Ry0dhYqXrgzR/8xC1JqCYa6kkEDR10/Qptei+K5amwVxxTsb6pzkPLCoVh'
+        'fGZuIdRthcVhwNz1xN6cU/TnF5l8IH0RcZuuOvyJFNLNaLn9lh02JWqzpPR+IRmtNS2cDxcoRhkX'
+        'xRpIdxQOeNJt5GW+qKJf3SEd1/uAlMCeWm5hUjyQRIZRsXI4zZuIvEloqqjHGalMoJephBOCzKBY'
+        'P5JkYrsoANKtFVCBjMqu9HGktdyYYy+Njt4Wk7xnSiMzxsMxYXQsaMbM7QKhnHTftf3QgFKCMojo'
+        'NHRWYGirLuMRVTq0ndKV47ph9peduq3taeHsabjdIU8DEVUAsGyV7zonirQ0ero+EyAbcZ+gWiF7'
+        'Wa/QAV676hv36bAy7si0Xbt+gpmNxYPGEDz8UdlULNGBYtwXr7WYdeMMj1WKA9F9c6xAiB3xqv0z'
+        '5LKD5ABwwFF/9dJl/+Ep80tzDxREcAgJkYSEWo2plhzyz5NTtxWkLs4fF5bRnChdzP38f61OACOM'
+        '/TLluhDy54GW0fKXACTiY8e/02DSvW7IZMC+aFWSxIFHQqkkovOC7jDycg2qDfIqA0b4Se+A4FRl'
+        'K1Y9ZQkJILVQNZ/J+6mdzoiqHCldLbk6oUFx5ea1riYQYJjMzYf2nWkDVeTMNuhNdCelHSDlrhTK'
+        's4pu1gX728mBqMyU7sFibBf47m2N3JuDINjJXgPBvd/7ncxg6lBbHma0BAruMQB/jr5n+0R0k2ut'
+        'eXEuBbYqCDGAzOlZ8AHSif59dlBBtvDCWyEMXVaU7Pxk67bxAd52xKJDjILea6Ue+YW1Iprosvnh'
+        '48NbaVNVhxVzZBzscrwVPMlwNOmXorYxCsJf/vhE4KfYaCAtR8EiF/sdwpSyE525EJMGu5EbY4Xv'
+        'BBoZVTQEbbrzV5Y+R7nMl94Ms/lD16vgUEIQBGNydjddc9H0on1qgKODotO/y6WajnGbb1Uh5znR'
+        'agn9MxbroPc5lo6wHL9VgJLNPx6/DBmwSZrN31TRpz3vvdlONt7y5jH4nwAPD7FMQzUCUtkQwdO0'
+        'PFBVyIQJiIqyPI6MXXe4CkbDfp6XCFs9/FCdU1omsrFVKX1v2nCTSX1MzPmI0kDIMvS1Yf5W3nWZ'
+        '1hZl+0GGdlTQgKq+1vsbENbI3+bcku1eRp2CGIGI5RBud3J0Q+WJvaXslK4w8szg8BlE9H1KYZHy'
+        'khgskKDdXV8hWGU+EQpCUS0QShW03c8GvfR842hh4hBW+2EYy71cEaEi/FPmnHux25NpTXNwkK6F'
+        'znR2U26S3zCz0zw0ypsw7YLl7gt4TQ9bRk6ViTra6IImVAO36+QutPhrHe79me1v5eRzyA9iG5K5'
+        'wVg4QqanLDzzJAAeplQBvn5kv7LTvfS3PYpfzRMm7ohn5CG7K42XBcIlwoBTB9rCQuaW1SlHtdeW'
+        'mnmCknjQ3E5f29IBv3j4cJTrpNaxrUZSJjJVBnuBcKOjqgRxdGRLhZoB1IEQS6PewoDO9Fu5p4ol'
+        'DumOHypD9TX0ViqqM4iEG2MEwgB/ENY01lRXHigJQ1JKM7OiDMrKNQgyuKtFlmOdKUBfXO/3DlEG'
+        'bDpHSnEQ4LTpDyZePkJbS/87598OJSTbneG/rVSbLYsO0BVo76x9dQ/LY0ATRIQ6lHUhXmmp+WXt'
+        'npTlLHWTEG/xREXwmcRiKaSz1O1CpSi3oE2qCxaoFJviF5JPvqgjx6UqdsubW+y11kfGcDNh4A0A'
+        'lIqaSw8OQXJ9NtS639Q1yKgSdxNYZ8TLn3pG2w3poXY36IRxJgqEe/3ij4TWv3qnWKYS4SAN6fnI'
+        'Q5oYR1K3ADEudB/Oa+gamPz7zxiiPZUphlhcOAEwbv0GkrElzql0hck5evk9+kDAJKoVpLwCK+4E'
+        'p89ULp0SR0xGohpDsrwLH73gKR6zq7osoGI1rkMKEaWSkRH1GrQSCqWUiAh/NItAvGmJtgOwe9CE'
+        'KVOXkYy9kLGq9D40nCDWuiNk4LCJnMbqFSAsiJwCHk+gwoRYn+ZxOyyKycfN6wLXtRzjuADYJdkY'
+        'rNg5L8wgwIQ5sHmZUV7saNTKue3fyr9l1GcOAhGrQHgnYlM+XbV0JjyGwXjj8O//+zqLN2Cc5+4v'
+        'AbNMQtHIDYXIoDA+MSs54yc/BBrexl8vj3d9KwEiGTfbDiVOm87myouz1L799pjoN7Mo+KMrEHKS'
+        'K3sk8em93Lc1TLSgc5q1fEGAlEbBA3vCt00xJX8HB+DOXSRLO4LR/q6HLTHnadJk9nc/LggOaH46'
+        '8GhzlqVd3RkxHxs9pjZxGgyf7q2li3InLzhhMosmLItYBe9KTfCexdw36JFNwfQZSQxz7+758Qwy'
+        'e2NsecnUHnpsOXzce/X8BLzYi1BGl4FDclcSobs+yIWO0LEZ2c5FUUHmNUw5sZU6UEYYG8C6q7kN'
+        'jUFfHLhiJqtHVaKyTfLLI/gCLBnSV9IfXzcRTOCcTs8kof7ThaHilPWfrr6sVZa2nQI+FXV15xCc'
+        '5CgrMBbegoeG/LHFtSCAGRikqfHGZ4ZS1X5+ajk1wPsjbPkHJJkK+z/3U+IZOU4FKcTwZilhtmcQ'
+        'uJ8GAtz174EpDyrzBj+Z1H8KI7uHN2m+7gqOo33nsTBEAn/Y4JD88EcFtOHC8CQ3mHsgLP4BVpd5'
+        'Sj4B5ddIXjnXMDENWIM0T2qzxUyMc25UHvQa2M9FAIiOdM13YtdLIYTVvUxSsuj/9QbLcvD01zJ/'
+        'iD1bbYRwcwNR9u/ww2woAwZ03+hYVy904Nw4QslMSxIi2ZK15EKUsQJqUbra5lOaSaGQ5G5qxfzM'
+        'OhXSpKqsQ9LIKNL9yLdAqZE9wcS8js3eLUnvLb+TvNqwtuwAvST0yRzVsGngTRaEBzjgtgYSjsOk'
+        '177eApQyTnujVA9WKoqR3hI8xaz4iOafCFpkXWA14+grlGe+H8quU3OmO4+h8iHsr8d0kd7IUBIl'
+        'lmYUks01gd/ycotl1+coPP4csQBUE3YIczh0gsVfBjMO3UW/mQLqqEUZmBhoROv4aMt42daF4eo7'
+        'iASAyfDp/I1rBNg3tEZHi2OLA2zFY7iMrQyVB/0xJor01W5r6sQCD8308KJdZ/kZaNTAlGmWpm0L'
+        'p2L0zlL40zhSwC4CKlXEd5P/opraRXgKm7LRJWA693ja3nyafDYyWzKxUx4q+bN7WlKH1kpetkt9'
+        '6OX/DupxoeVXfxyfwOEiZlhsPFxMM1yn8TiEc93UTXOSUEAesV0m2UlsXhmmyN9w8Zw6eZntqmG6'
+        'BpENU3zNL53uDUTEnR0Dr5wBi0Kkdh1grWYE6+kEpmBcAR9B3lomDFvXrKHAXLDIQfpzME1GIZvo'
+        '29RHOnUBWPKxXAD0cLYOS45eFw4E1h714b87hTRXThzkbb98MMi6up284nOQUq+X6t7lYq12mHCE'
+        'EexwICL1woVK1KakCPa0rEhToICEcJaItTveEmegkW2QF7r01a6Y1V+Oy9h3FIj8dMcX2xIAhOJ3'
+        '8d26xf5/kDisQ7fbQyqJtCxK6/ZV0n2O5nj2HXzfxdDAWfvu6rZdp+S6KN17xUVoef4vrKVFA/h9'
+        'W7bEVGad3D+yTwhFk66ydGLPXw0A4RKcFFeCdaLWtVGsugiBE/AJLLfFE88I5M12+k+QyQUZh0x6'
+        'en/ta4y9nWjECL9kz4JQU6rw0dMeC8LU23JxOjqAhMXv3jc8oMD5FOwBkOZl2xs62cdC0/PSrFFu'
+        'oM41iq8YAWO4Byv9N8Nw5XUempys9UT/QAzf+KEyux6kqPsKa+A7YKNh7u0KK6aXeLyolQhObQPa'
+        'hzLiuH+y8DzDMjq1oNCvPgZHvWnDvQvX+xTYuU5qRN5sWKeNpXC/JEPkIs3Il7fsaFZ00vpDWj8V'
+        '8UUX4gP82y5lTyaiMI3G3UtyrskS+oCnALMoeRz83swd46OzyeDVge7RaAhmb1ZMm/jqvZiyTbBp'
+        '3vOOR1mfLPDJoUTdb4iZ8v/ujJEL7UesinqqcsKo84w7mHBWZjWgW8tmGv46cwkDrq0Zya8A5oI4'
+        'JHdsAT4Qpc/WQXlVWroFRU79odbGhJVnEtReqayIHdrqVdlHBdE/pxGoi6PR2LiMPTOvz2hSmvQv'
+        'pCCE07YXh/jA20oQ04nScvhGz1ZFejmi394F4sy8x0ofT0cVwX8vkJXIPJBj/FtRDT1TnHyVQCtu'
+        'zHtiNN+6LcilDO8xvs55SEPUeO/Q2UircyOX+GargRrhZQEHt/BCpc9QvlcGhkdKrgkJy8KRJw1/'
+        'AT8+fBsquLoL4B83RSxA6IJocAo3XMdfmHg52OoGbOtJRg5wVxdjrUlJvhtSehB0xU2c587mu3jM'
+        'AxW4KRAoVB3VN/RUGxuQsd5geOuGzizJHbR98x+e7lMCjkdDZcbGfYUkVt4UHvNxo/0yqtXTTOsw'
+        'fgOdyKDFBkGEVXyKfJ3x92rqQhWQigCchZUsvgrUHmYv0cC1FOpxrz8MvEGs7/3S6igOQRo/MVp3'
+        'G3ZGk76AQTq27ufKn/lPnXPG9+Cv2ZlgAaajXG4AcBt2hSLn8g2o/YDu6nQbgF0HfOzE7Bwn7Ee9'
+        'AZV6jtkEz+e4jqEGs5Bve3YbU71SnqpAOm4fHG2XDkD+RxDvc8pEvQQMVdiLMfotDlouZ7Ro2uPS'
+        'XK8P4xPzqDBBZ9T2d4dYA91n3QI3uenY8hYCkC95DcgOm6+niyYe0tkHB8g9+GQT5h8Eau3A+kVb'
+        'IlOguvHDIoKlxVWhz7f+bdS+9lTPyrJbf7THaaakWb3M+X6kyjL6aOHrfL6Dkt6AwpWRiFlXfUiz'
+        'R6wqksgMeD2AdEQKph7HUl07OstTedENUZdDlseCSlOYj5iwJn/2P3HhnmrC4+B+JYQ6kHcxObu8'
+        'v7IvgcglE5I5qzLhx/HPKy/tbpEHYx2EeKimmA8YgM5erdCK9B3GUdZSSw2SDxLVDGm9CPUDGdVS'
+        'VYeR5qFMpnf98QNjsW7Nmc7wr4xBWKbUJaZfepinqkR8rnmViYEjLQk8OBa1lXUwo+XQ4eLFqPDp'
+        'ZCE9uEBlIz4uZFf8YoSDXCNiuOCrNXR4kGyNg2r2GltpqbwoydUjEw0hTvS8u8AXsDTSAIXW/AR7'
+        'kgKGe0bn5Lp0m2OYoHgFv2RBMJfBZV2UMMSdgS/U/cY7xPEnQOaA8yWTcgCVn+w3EDwYj0EL3Auo'
+        'fLOfr9Dzg5Ign6HaSDu8ZIIMq83kBzTGezOGqk38cLY7gnn4OjyzkVKiIoBRQp2tncqg/zaqcw9K'
+        'N0kqf0DtUonQERn1IohDXh4csHq+QHJj3XwZ5koP1Jc6B1MBzRuFvj2t2MF8WajbNBrIAxPyfDao'
+        'DlfXc1H2OmBwl8aRSnnnagVlrUMRmS3cHnU6Th/VhrATItZoOMpGssnEyKPF5piAu75CS615Xrww'
+        'Hqx4za671MbfbYRjm0n3Z3buSMJvlEnetR/91/bfDpODFpqpGIyAeistAFZuyH7u2ib+LeSZiRja'
+        'RgEIJfydymFF24SEMpIhibmWUZvg9DR27tUECdNbsH+fuLOUPnwwoI6/cidBAgx4JMsuRsD8XWbz'
+        'pR1G5mLazeFAtGI3CkFxjduybnshOj0zGp2a8NzRbBh5Ng0MzU44OtBk/NCJnF5eqhR+Sl1Ke3/G'
+        'Bdt85cpzN/aEF6cNF3fGIunagsfgcSdsO9eO6zPF1Axvs791Vvj0ERnjuX2uxE799f/SUlP1umfS'
+        '8jR7hwRKjxG1fOijOB61TdLO8wDzq7QE8O8D1WR18Ki+VPhO3i86qe9dHKiphVcSkhVEzQQVrsSu'
+        'E0OfNHDi3TQz5eB7zbp7z6cq3rrMDw1WUZQTtHj96C4OM06+J8xSvn1rnx1a45W0r2pqdUdSnsb9'
+        'CTi+3NB2rmlSyYHk10eFq7a4XgXpVEn3WJY+uAmhgIDUErMMEeUgLMCnT3JpXmYVHN+9RGzS+z11'
+        'tcE/jNUvoxmlqhDShmE9o25/Z8xHBkrWA/f5sZUeVbStKbjY3rTjKn6nZT7bnu/UgdE/rv/ThUia'
+        '6VjINtpQ4foYextu02lxmsLY+B+j7PSL6QDNVR3zOZzfs0gFV/keToErtMzelWYjn778/W063oCE'
+        't0DEjwduTyw+o7Q+rAKaaHzNqZUmIOfZ1NXPpKYewNJl/LppDGlDA6aq0j4GUPsNC91GLAQNNFEi'
+        'Og24i/0MnRd5TFNHLC/ZvGPGPfsUKNWFRy5QsK5aWvdlWQgpSfQQySfKyAJ8nRyC88SXIkEWLnbN'
+        'WLTeA0Fj8iCGUw6Mj6/rlJ7u/LLotx9VSfbdjLMeubu8eGTueud8ZbDH703tEujyaGKdW/UOOUgs'
+        'lm7bCc681a+htSMGRYqS+kY98fUIu/Oix5DyJThkHb8F5KxEEVU8mui6kqDA1hxfxZ0DJ2RVrBxZ'
+        'bWO/aFj1/2OFTsN/ZaybJc/Dls9NW+tMlJTQaRtOQW3dDNGl79M53DRsp5/+htF1JxqUGmBdAWod'
+        'AaBQioQdz7BRcqyJS9P3KFzhTh1I9fw6xMqozifHjLhlxWEz3f99faj12QPUcmKRtptmIRbSHj/g'
+        'xyBvOnq+T/Y4Mevlb0s9yQPOQ6TfdvxfyZbi0zTivilnawNEudojaQKJ40H8lhmhjtZxQ46j9o7b'
+        'H64bMXJ22Ohz/yKwEx2UU9wDeRvAwyPo35GwHcWiTDNwSfi7in9t1+kO7/xTf80KvUKZ8t62M/MF'
+        'IFxmX3QJNVH8wTMctmL/nvW12WBruATkFrK48NLjru5U4TGgtdXQLF2tNR3lOEBsZ4bNTNBfIAna'
+        'on1RBt11vaQXpLcqQVPri6bOo2JI9ZpjGdyLCPriYVVdA9CjZQMVjz6N9gvtfWaDKttMzhVelzCJ'
+        'FgSNiuOLJzKH39ngb2ZRLxcQeXfioWv20LbwS3cONJ90sgcYMzOe5r0Ymg5DuQk5eK2eXUqHrUfl'
+        'A78M/y7bY28ei3Kih6iKfSEkvGNgF6SUwR+aK4zruiDtu9wBzenS9kx/APpOQ5YKgyQw68eWu+BY'
+        'lkX36UNL0T7+2Xo2yoITJHLX0pUdkM8JH/eM26QnAOvUTflcfiMg2duc/vr4iN9BHNZgbauK1j14'
+        'uJlzn2hPV41qPqE3C10fufZ4y6Az+5BPVCwc9Yjl+b38EwRrBvuT13smXqa4UTXFAw4P9rj2bx3L'
+        'ls78P47xntP3MWA4ICVsxa4O+9kE5YUy6sQVNHvCpCkL95ESGuXWmXY1+sb7NE2DSQ5g8T7QVX12'
+        '7k24GSr2AuWjuoKjPk65g4zTT5eolrJU/0w95HnTO547/oCrRi+FjljA+Ro3zodlqtUueGp/yhPF'
+        'X7Hbxr5iABmouMIAVbZMW+dpwzwvmEG5lhmlOE87T+7gc/JXK5SYloXbu3NEoSAG8IjCDpBt/Ced'
+        'ELHfS7axmcgRmewcxy76IjigMaQFdvelZwEnFTyj6gMcKfMwDZ/zbVe8wCpfXfLzCwDu0836mU9K'
+        '1IgJNAK4QoszrEgPQeuGQV8ZotaKRZqnPYd1UUQlB9qn61lT/jPfkcmODoM0foLK4lS7zXyjacG7'
+        '+4GQRPYc/RQWdIIap+9PpBWWleMISUDq7+zgiwhrMFUEiVJhBsOPvR1vOsQ2f76UN/pXeamb+aiF'
+        'a2Rx5kIZAc2xy4aO20xhOpfPxPHBWyITEJYvYJu/IyFPJ6opx0iEoWpn8OrxoQOQPaByg0TWNCKR'
+        'Qgs3JRxSOm7C1Q5HWqe/NeJIMUdjJR0SInCBQ8l4iMLICm4h71NflwyIgDrpLo1JPIwX6MKfQ6kS'
+        'Y3q6U2LEncRQA88syHFLypFfricBMWsPU0Voi4zTyJJfQRGpi3d8PNndC8S6262KNgcKVPL0sq3Y'
+        'nWGn2yY5WRg8EgmgeexeBaFia0SG4+rm1H1GorKDE3LJG0EP2YBQ83CsoZ2w51P7/WAUgGEaXiE9'
+        'WQ9dEQrJJUqeQwkWBAeOhOC7uh0cxvO71o/evl2T1NuP3oXjjLQoaJrIu6DQrrCjIbXak4v7eFF5'
+        'Tn0Y5b39YlVIcsoJ1ecL80ZyB4f6AQ/QyWgmfvu41mEDJyjDGzDb6Kjg8XP6Pr00nrbujVBFDtZV'
+        'It4IRhi1nX2+e0+7v/SsKdbSfgeyQU/0wk1s7GTrilpjHgXG3aK9AJGlH0YzK0OuDDUt4xtldlfu'
+        'n89AfqdVWDKV3Zi177+MWCRWLvX/3tw2exCXZDtwIEv/sr/MGF95TdNHQbmqtB35zcGs96DnJrXv'
+        'uW1wtGgjRfTd6CPnMk/FSsSTUiRO9eLcd6HgW+IHQDWnBsCe4+7ePmMLKhTW7pjkzFhtYXEg54V3'
+        'ssWjU3xFJ7cjQFgd0VmMjGZjHkGoxjij6cNcV/cd4XSny+tIz3WPAIW0INwSgIZz5D0UfcD2+WHd'
+        'znxDrKndjV+3H2+/y4EoUZm8/rRDCyfCUucDaj/BpWelfakC2u1MOyJXAxqaUVavFi9k9ROGapPO'
+        'RP4eybDvLdiE0fsuu0opxXDhETFcmThizqwbykWACMkpX7N5L/BUMFvNrgO0lYTdLIJAd7iHlEaY'
+        'k72CmoiXvf5GtwA9j4rp9FJUAcH4EofY/kZ8JdcX5t0wNI5ylurAcUm8hkp9flvCd14sB2Ivwv6c'
+        '0y7+c3wmjm8q5MijWVJUGk0DauJeCU8IpF0o0B6VHDzGxWdzGulSFqKJaQfBtdqGu4Uk9T6ijqbm'
+        'OegBb6yK/iEXpg4miGOyovITKVbnrKJ2ixcE9f+GAxSJo8LRKps51xmYl54yPPK2BQ/ZisLFULkc'
+        'bDez0ohkCKpPV+THP8ndD/siYvzm0ruunG82EMgwLrKHd7cICBUREMLY27yfXis6k6YEBpfZswRo'
+        'b/d0P6b08T5liWU/8mHP9Mzf2Ac+E3/q6K2dXqApz1kgkTGzWHSkf2NU1/DJoJc2TZz5UcXCWXpr'
+        'YCtISC9xfvIBtPAztseQ1RfyqagCri7Og6v+x/dQz7j26SSz7FqW15pSIWhZZ53WN61B9vSDKdPU'
+        'PcogrAaT0gltbYgVE7Izt4SdwZUHaMMZUNocEbC/Ey81zrzIc3fjRiiZ7QO9ihtgwhrGBqA27sCE'
+        'XoClXYcdGXFfzAaAzm1jPA4RjL0B0io0B6OWP+lkWRsJWbT71OQzfG+Hu5hgbcpmJQ5J4d5+/NBV'
+        '25XifqScitVyE8p6ZviLw9NkCkABghTiwUrEOSVd5L7PBggWs+ujoErYNgyDsOiHj632srkDEzur'
+        'Lqcf6v+Eu17Dxiq5cOauuwW9cyc27Yh7YJxlFhT3vetsSaTaeP2/jThANN/oO2nc+HleM6YUA0nj'
+        'yLSjlnG2Iu7Vw7MXHcf97U+JpP5RErI20WbeaYWEFgIlxGvvHNR/rkxsQqB1pEtl2GSHq1y6LOQ3'
+        'VhWIRgfaOIlE6krZk2otXqfBz6jfLNg+AcUyFLwQWY2ckrYHaSDM6JJHUjdXLNHzYoOclnIa7BCb'
+        'd/CFGLl9v3+kJRFCyZ1GDNZd9BvaFk+vdUrEkO2ecictZTEVzxSQjoLAuIILuf4ocECuSOjrHUXd'
+        'IMvw9hZMqHTRzEY77pAuSLvyVWXWxNhKKTvLWfKzWOHBMiLwmE3JLfF3scyAgn31Y/bL7074r9V6'
+        'XnzAYxKf7MJPYGZhH8BFbXssAAc6GSaNcZ2N6bvwktFecrK5A0rxAetDSZkRp8n9JbVlLMEVCAAs'
+        'baFxKxyoOMpdV15DxsynpZy8Cza51TtGYvBUGkjsLUbgwpIB94TtXWVfTfehSp3X6S4ilr5zPr01'
+        '21z2Rl23+1RtpTcs7uQKsqAbGEoKU75DUh430V5V7j3y3zjazmDDKiuG+MjLOdOgrQYsj0TFCSK8'
+        'gOVHzQ1LRi4iDrF2hm0HnRWZqlJPIiTUEQsNWZ6M2ossZ9DIROHeY/tbEH9VzFFNf+w+wsOcjRbt'
+        'h7R6XpiW3VVa2CazgYEUWGsJa4U2+sC8HqZTxzcDI+6PsriCBuW6XdmP4JVEDM4eezNNz5RPTRos'
+        '7qYn/HdF72JqN1Z5gDkxgNoUPYdiYmAAinWJJ5vobUfgvcVzQHNkhzlwcJlJBmWAxTfOycuZQw2S'
+        '8oHcPHS6YH6Xswtzb2KN4Kl9F9fOr1H0LX3MdCTT41LLH/XamSIwYQ8nRTtZHdA2RyM9Aw6llvT+'
+        'u/mSE4GTGb0XLQVJ5rcl2YWtL2woi8EVaIxghY4Ua1Ros7BomejvXXfGtE3wKNuQEhT4O6rliq5O'
+        'tHW1D8ffsRxXGjTw0uHI8+FI2+jAv8IlISUzMFTGPLLvNA7MMb5euWaK0QKq01bw+KMpWOxlgteM'
+        '3OLYj3V2hAw93T/66ScOT4x4sLRrRlc2D7yqkiupVQNSkSYsxEI7T2cNWw2e+HyBOl1J/aYy9avE'
+        'jv5N2OyRnE7PFDTIu/v86i9Q+WC0Z2SfApu++/tWSdqxfLC3sO/jDAY/dO4aGTaQ2Azn7qc4lCLG'
+        '1dsk0+ev4tq3WULL74cp99TikmwVpk4UAmAdSLQpxrlceWq01J8K+fAEmIHwOWKUagJkWTSUEfQr'
+        'LS7zTJT9mt5ZcpY2IOLK3TI2rm55JSoVGSGgf0RuZhpznOMjokuw55QSAwFwiDPvCJ+IXmDyFQHv'
+        'ua70uz8Cv/mkesiYWyqcQvLdGeWL1n3XI4P3EY8o5eIf0/YG0ay4lTCycIFb5ZccRwEXCVn/ApIP'
+        'WyqaxBcwQBLy4Q88Wagfvjs3kRjwjvCB/tGe22uA3ulrAbnWSCl+nwu8Y1FR1Mq4T0+cjuGtcaCo'
+        '7tgJBBhfYE7RpgDk4EKKiznlK/VTpqsRTP0Jj7RNA9GYgaHNhS9ElftOnt8NiTOx4I+PuyQy3dIs'
+        '83rVUEKsjVSxpytkrz9qAk+m0z3RK0O4knXSJmBdIqEKXkC1PjTHTQNW2MNoHYLf+gGSqhMSz7dc'
+        'r93tYSVxtFfp+4wPRYwTKBAMqVVnj4QMQ5I90ztQJNYtYBc3rDgoO8T2G1z96iZ74W+nIxyGCEE7'
+        '3xTFL+HdrIsSYLf9Tlddu7V4A1+l8QTWvmignfEwypFco4cFRnY9XdzXKLaT/JZ+YHepO3Ap44Iz'
+        'OAsAOPJJyyaWoMQiR+a74Pmi+soXoTPyAYthsMLBTJ9Sc2YPD2ZzvpbMtOw7on3NZqpOkyKqXiac'
+        'dI0GFFYKAJChxZxurAvuvL1ml54MvinQ/IWfVZzO1X6pnEvjPww67uCeJVugWMdCMdrhbvPOv3Yo'
+        'c52m2x7JFP6MVUPhvyvUH7ThuhwrikGY+s6g+FXitIwwbQGoda7W5dzra+O80vbT3lO35TEp5y6F'
+        'f/g4ecwdACk3mxI0M4EmG8f700kGbuSVMouA3Hei+PXqKPnRV1/UU+wcih0i7CG+6Q+v8ZbMT/LA'
+        'RYLm4mrxfapOGL7cCjBK5CFsoYcw5ZmAe8hwgitbxy1mECTPnTYG2XezgC0w3tlS9sRDRyIFT2/c'
+        'ZKY7gOm6HLymZin1D9M1DTjBFXqtVAcIbrCx0jTDme3kGzah7N5/k5Glo5yFiCh/PFaXBbRXNlzw'
+        'RuZuBq1WCuCnOoVNwwVjJZuXSqTr2yiWlhrVh53mIb5x0JsETog0erRawXfsb3+1sbnd3AqAvMFi'
+        '2Ey30DSWOIWbXj9qvN3b6hJQ3dXC/4ZvasD2pKEkRZjzKHWIXxDEskAPhO8gv45BiEzeILcqmWA7'
+        'cxOKHfle8cpXOXurjx5DdJAoVmx8jkZp3lZ12unxvvMDhlzM7aL/ar/8tZr/RdLHBooHJWa5WPcE'
+        '8yMlpAcyrIOUB5+zwDl7JQeHibYW/K2/x67oey9J0gG7UXMYDTowSE4vAsIXlg9A4Q5bHzBaD+gw'
+        '7gt5gFzVGQy/CHrVKr/hsGbsQb9/2zAtsk4EV3AN2vz/VMTYO8YV2pHA79/JffM733RjBPhIWVEq'
+        'WO6Z6bnXLCPuYqmooH8jHAa2sC0aLg5YkiqYY9RauphJc13npwDYgB2Gj2mMR8EYSmfX4TO9ncCr'
+        '/5FzEU5t7oXj/36ZrCch06Bqn8aS9iYvYOEfyuhwYBs6nw3oU5C44NXoN65EDrHpgxH3LWRJUWTF'
+        '8QWpQxUHVJ6wM+3c2rKAxeK18m/6AgRsYiToK9TPXe56IV/iH6Xx2g9jjLWgMYUPFovYTCZpiNCj'
+        't/4aQof/qDhafYSQUUcLcAxobSGbZueenKgaF7iagR3vG0hxRmJMDpqrEZe6OLmPbVDDuA1d5TXC'
+        '9My66Zdh5BhT5gzsD21HEkf9Hmbcb1ebiClWDPyR7vIk3oowcBOj1k4gLlAQs5Gjvar5LXLtbEU3'
+        'A5aLFOinWV5yeijSFtkOCAZ3HDVavMyVT4QiiWWoANjpsbgpJsZznH2t64RAefRFD+ChRB2Q2/0h'
+        'yTJdBmfrVxigTQsLXQD+RkGX5EtO4gD9EP27entu5DQUidkzbKtHo+iHzHWuqgvit1Iij8wWvi+D'
+        'iHDh7PtC4/nSY5myN+ikPxMId0uPwa4AV6QDtbK69XIUpJvrdyI/cSQY3SbdopNfX6oceWne6rmq'
+        'xvZtCfmiQoC5ChaMXrHW4vnmeLu9soi1HUBMBpDOFEkAXpW5PCVa42wyFKHNsZX+EzMFsQd0gEUJ'
+        '3ImG/xQUY99VkIuUGmm4l/fVMNV41QwGfb3iCNITj5RNAHvbs+IIvPX5ASxtjwwkBQM6pgWvyRJr'
+        'Z/iU8/eMlLZBKpmqDGyj2tWadoTK3zTWlwZYARpY0+nGTNojdXBEHtGsyntu2hvkRqk9gbUgp22r'
+        'EPKfw1R75cPGWOMRzBMopWgyzR/FUeNGzgrjJK/7nuvrsxD95O3ZWhmolVffxHBhKkLZmeGlq+hf'
+        'WecMZC1pOz62TAYcfP+PVNAIJX4B+poJlmzExbh3Abf2TihXeT0zhe2PyLDNHbkkmpY0x25mQFwI'
+        '+YcMIIcLMdmopIpyeqA4hFoxu9aBBRFIBQahd2DXSm4WLqPKgMhEKsMKg2BbmHha0t/T2kY8gE7a'
+        'MmWxqvrZme0WVVH9O1rxHKrQO1mQAiLmxtxwL6LBJA3LFjb9W9qRf5ZrVq70BVf5UevL1XTB/NKI'
+        'rL9o6yhHgwtLMOIeXhVf8Yo5BHTmNufTqPNaY8pp2IVftk8u5tnu4ygMhJoyEBEKVN7fhhd+nUWA'
+        '1MGOMPlezh7mK93CHUwPsRea29z0vKD7fAqMDE2WmB4Epyx16q5XA5uTPjEYA9fEUUVUu928aY2r'
+        'NzGf8m29Zon1l3YfUdVGKmeb8FeuDTdKosAHWKrNR6WHIk5bxF6h48Hle1A6VzasFaYObRZAceTC'
+        '3hzVnjlrGaAnlrBMfm2lJL4pyywvWVkBtkHAKRbBStpuoxN9Y2Rj44oNNoKd82boKWW09glUOLrB'
+        '/2thQjdlGhjiWv7sfcX3l6OOFsTouj+6/kswM6DBMJJhTNGZ5g7F5mPGpAdUpeiWbfjZ+eZgYI3j'
+        'GgoNeuM74KgJwDTOfp5lbQ1SD28TI/l2LLB/NDQ+7Gb4WM5sMVtvFnVlvWe84gNvO72krBcJANvq'
+        'tRDVKrcskf9oxH8aFvP1Ubo8nipZN1WCRE9ZxMk1yppk6zNYszLWKWVQgXyMKeVmikv0lfUbNz8a'
+        'BqgeMaJrBJSJ/v2ZSpw357Dt+myl/O00eDKHuMB+8Br+heDm2HZaYPEhMrEPSOCm4B/bMSXAgnms'
+        'GE/v2igjxkIxTDzPkbgYSus2ZtH6S0f7dFlUKXmtnibYb0JSZIzEFlbRocBKVPpfN5R2k9e9mYU+'
+        '5QESxvw7SgmuODEIQInpFHsxAqIHOVc6HRhgW5i3b0WmKCYcOf3RaeXAgWIP3WLisv9ZOjZbvzrM'
+        '1FRETtJLrkShY+sBR+EcCl4FxQk2dHztwo1BNyIL6z1p0+sP1M0ZSDkgd+kpBTgKSh6G23hZDVUz'
+        'lHXc5X3mnyKJ6Pxww9uZU+UaTIjvZCQCKoyzkGCOtaxli/zcmbrC95oKfbjgaFlfa1M5OFaIDDSs'
+        'YMTM/1gU51XA2fY0CqoNd+IbcA7dGcMyAxY/hS56YOpe5JzNa/aJyXVzBgLapxaj12XRxaMINpub'
+        'PhVc/VCtDSGsZdEpQ14a7TqyWWHvQu+6KaHs6Dn3aKy9cfZMQFz+j8+2Ym7mWENVrYvwHLBfdv2h'
+        'bV2YnWKzRFb/PshiTARdmyFfXISWeu2hWNCUZRjPRnRHhVjNTUMEGb84Qtd+9j1bieu5nIXYcz2S'
+        'Usc9gA8NmocF9glwC9f0k2oGfcm2pbWtkuqFcv45V7bQRbAe74gUGqbRV2FOD0Xjb4C3X4jU7XCk'
+        'B28msefOZV4SiEiZmA6agZQXhDcYJH3yX1uSVGQegHswQA3U2jqpkUZ8iIIz/sGsxxmI8ytk98gm'
+        '/SKnuvkITP4v2IgixHaH16Fc0rsQpf4LQnZiMF19t5Xp3wtBMsBkwOHcsNOYHl0UzOcNZtSgymvc'
+        'gST6VlsSksW1LVyjjHLSAtSB04ZeZv8bBmfAN54Gv4mbvIUFQs+DgYYW9Q703Dfoj254glpHKSz1'
+        'cZX0mImp0wK1CMw07/8z2FA88xIQ7cRnYqK9bhHCVFkhwZH5LQsuCNsTH9ykMHftecuS5nYeadmi'
+        'rqjrAYqHo6pK3Qh2/KSBXNYySnApOoB2ArY/rxj1URCFmtGoBOltNJ/zIQg70kEDAD0BSgXRKdp0'
+        'BHIp4m6dTDo0UAd6d4XEy3I45LhFsFnHJz8ylmekcYl0Ac9hhIsg37WNHzPPU2fTDyGYlzrlZm0r'
+        'Gll/m37Da9ggMjSsLCvlDcQ1omL8Zl8EdBFzTA09w2yFdcNECPTt9nVMJnlhRuD47ksNGja8+qmy'
+        '0uuoCjRgtb27+6WF2/FmpQG8KIeUXe12eHdM59iLzu+u6QYdsQB28l+CWnu7b3BkSTpiEE0lYjxT'
+        'J33qL1eoAhIU/K9vIFuCZe8ZDZwQpd1UNbFDKabfWBTsGVUEE3k6okusanRlK67CvtDEHZnb+dCy'
+        'cgSY6Bzk1ZN2wkx3GbGPKqBSWsE3Z/LZ7f3v71ksJN0KF9VOHZsPExDeS7BM1VAIC0zwHF55mcsy'
+        '2JbG1m5BFhg/Z5KztFgEw43Yvtmpd1YlVTNEZ3XEWS5S8v9iX2nsW+UHgu9PKIDw74gAOpW7x0cV'
+        'gFj1Ax8rqjLVFzTXIH+f+INo7+jdrFq286NGlfNKqgpWaY2qYiKD1VOPSC9d4+knOk8m9SuIHlii'
+        'VXUGu+sI8gOo0g8zQmo3SblbJo2eELZMo+WBG9E97pp9aBw4Ruj5SIk+RHE40SSNlKETnDysAduz'
+        'LQLsKcvzPXmvQhbrtu77lLAyDPsYEYFva1LawcuF1H8FKZYpWXE3RxNDbMQwojRBYaJtMG7JvB90'
+        'YZATgFUNA7FHmlyrfh8EtHSMTFJRLCZ4Y4jEPveVcDwxHveyVNljj2xmkwc+fCZjxD75T37iCavh'
+        'mh2vqeMe/PidEWPpzlcUrwZDj3agBN8rs9Q6iLdE6G6wAz/D94JHJc8h0yQPZdXCrjRKJaokf2zm'
+        'smAwP9m2zR4VEbPv2g1XJF5nEI3JLdhzj3wz7Qtyj4yCvY6skpSMECc5RjhTFD2P2f36/XQ9u8du'
+        'WLIhW64GDaynUs73jyIYZAAx2cGaUGiE4Hbl/RPSxdAyUqIpJjo9gv2pIP/ilcLyZ9dGko9WtQS2'
+        'O56uav8hBn+cztJ1vG37sssmGBuldyPS04YN7Vh0IjiaGhjz8dHamNlbo5LGv7HvG9XaGyDVg8vR'
+        'BU0vRDjU90zFR2xcu9qkfJ3Nm0q781th7Iec5nvgFBWHrQlDlHGTivu1gyVlBymRqA0kZyk7GRum'
+        'D3Wi6m7WmoiJVhz4JD3qtoDhbZStmnPfZaxFKxD+PB3d18GLr8/ctp4rRBj7G9bQifknhyiqrVs5'
+        '38GMuLQvJi3IBRzgCMIL6VAW4A6oqO4poFx5GM0Zn49ioJ9Mgdg0axtyzPSEe170E/SbxJ4K4CbG'
+        'qkd6ueXj6p35dshCmZ7iXN+sNC48q2KVzJu/tC6e6NYJDh0XXM5UVVKd5UsU8zva1EBlWojsjuvi'
+        'CMzv3k5kQrbBOt606McRjcnSC3xsRGvaLnnxa/o4QUAGrXFO4Zhl5OZr38t3ocC5/AuIND90w77Q'
+        'M9k5SgnsoPSEAHAEer32a47R5lEGDPTUD+VvZ04B/r633/vij5rEb+stDyas5Vq/j91Qp5eLDeot'
+        'V9oftkuT8zh7EUPPwLDd8AvB1/gYjJ4QpGAolDlxi0KIzGEYGu4LLW+b4VCk6uFi7ZQXeq7zqhJ/'
+        '569Alnk6wCWLgt03K4cxfsxXz/bIXri+RVr6usQutNVzQPyUV0A1WHOPsLwepnxxV210MgfO8Y0k'
+        'U+97cnailpyxCQFEyCKNBpo+X/EPdy18W/fQcV8seRZpMnr+iLLI9CRcUtswkDVicDG8dm6EH9z1'
+        'Vn/ENVP0qWe6LRUSRe7muAl90iTWtjZA/F08+h+C50IpHmaozQcK8oFJJm/byGaKKYtrI6Iqh7tR'
+        'qfRt0Ig2WVxLU1jJ7timEfwuY2GkLkSWPMPnKrf7EfsN/rwAEzapatkJ5wByPad2YGgUPov+JUVE'
+        'naFtrV2UbAzsh3wqaaMVmWixD0bexofeWGac1zqt2SUouBnMG5Nh6BbnAqo8BBaiDYlGgPhQyMvc'
+        'PXxhsI63/2/AvENoD93ReonxOUvP/ij2eiMuTrmLmQQVQBbOZx0UmzkpS8zFn/1QIqY1yb6Zpg7d'
+        'l0JIaEpQVukwdeEChQfoHCrHZfWdDT0tj2rbpeWbF0nIny1Ti7h52Jt0WrU5tWExrqPZbsrHKF//'
+        'inlg3a3u/4Sm5L6P4I60FhFYqRray12BDCDxhTIQoSUOtqwxev+iCVScaCbZj+Nyt/vgq/F4JiKV'
+        'ebHpEGqqrF6z8PKH/tzXq2jVD3xSeTLu8QXnugK4XUvoXNNnwuYVpTVn3vVCNLkMLXVY/71Tq+3x'
+        'XnH5mnsytP2mHisjNA8LcqeZbpvDOC+3JGkP02SDV0vMMa2JixyV5fY2Dx+NSTHDNgTaYhSEZfXS'
+        '3CKedPY1bsFnP9fmL80B7M/qLnT+3KUn4bKnq2dh+9wzsOuNVo4xsqcc7Wfb5Ag7pVhrTWI6w8Kd'
+        'bGvamulOCaC4nJH4ZQY9FUjM44gQLslPX0AzIGlyXIiTiOpEvmEZJ4G05cm7a4+KpjIBAvd8ufI6'
+        'RkzYb84vz44v83TMS75Pp7WNMzsO84uPlOSAJHdhatdkckBcJRna46otDVGElwYm9Fx6vaNL452F'
+        '14M43e47YrVTXZXgNWlblbQ9RwJuD903Zh6BbtzZ4qMD5JY8TtqrBQYd15inI1gjEd+bK34x5hGi'
+        'kCcoX3HXQVEfh/IlM/PZWVqdFFaKGdsBIS0QDtlOiVkTCuBoIyU23CwvbHiTqisPqty18UuGms7q'
+        'XEwe66PXZJhgvLgmxAzuEem0DtBrrSnMmyoPvKqWJqOm8IJdV1U9D7G78sB7GzgZ8FWunHbfu6hd'
+        'VDOK/TeIUWPMll0kpqWp7ziaTemAXrCTtVc8q4v84CXeCjJzFXJcNpPmcHWMsga5UsZ+MSCcMxRY'
+        '7pdUwshwe/JDRyNhTrmSLmoMMpLH4xFcLqCNMsv6GpepQKKoAcw8x+bnIOC4ForUol3HOo4ow0lb'
+        'Y5Q3ljV8rlwFydKkDeANWNQJRbOxy+MKq971OrgYmjfCgRU9b5ABepaL9bPR5qNjVP8UMG1pf225'
+        'cki+xj86afcADE2XglCMPxhsvkkU94TdzrqthatHwHAbcIumoFe7SSsNM9eJfrO4EBWSdb8q9fip'
+        'JLtDM1Re6N5PtrN5IxqnJWrBzqWkes9LGw7GGFCDQoxrInjh+EpzVgayfX7vBTnbvB9NPKPV0N6b'
+        '1+he1g0le1VHOo0/U2RLoDYfdyPMijdjBBR11DhCTHDj4U1sEstpkrRSoZcGPnMxJ09ZT5mvtN89'
+        'zIMy9/CFrRc9om5WY/nK4r5jLt1NrFy327DXS21YjPEXdSwfLTMBWlUJj46vIY4kqhnJmcxytQjY'
+        'bLnuBiFaveYUv1UQEypYgGEVMwikCbeuqONaIzx8DZ0iHOQtlMYlfOp49TMA/DNkcLCHIAB1KT+3'
+        'NqzKU5MkRx7Q+puxR0vaQFBUfOC3NIucE7hSD1SwTm9t0P3Wnj7Zj+xv8nOD+qUa6D5XLmSdtTqZ'
+        'zYN6E72bhzX604cC1YfIaZi6ZE8078yLsq/4ojyEibcaQ+mlrDdQ5+V6zDvG6OjzilTbMfaU6bbT'
+        'a65r/9PqKrlykCpQarZyjwX4A396XTSec6iZIjEsJiOCctuEQiqJ8iRvaZ6K5ePuhR9hQ6+vGKiq'
+        'i+hF77PxT6Jf9xaiQtVo9M2QzBMl3MGVuR5B1UC8zcUkslzf/YK9GU4AGSRHDVPOBRtQEqx5UdIq'
+        'fYHEl4IsWOLa5/il96cUEOTnViLUAkFFJSfyBU6LsyR/vhWvsVSZjuShKOlSh/331SGgtbVr5Z11'
+        '1DbO6KserBrLVaU97m7jg2UtyfawhUTVyQfhvJul1Lfq2OkyV0+l42PCIveC9kT6XJP6hRmhY+rq'
+        'U/KzkPnLesu0ivdk3vQkBpX+g3JBXJ/Y1rF2LGUArESKbLHso8cROgrvGB7GNATTM4VknQU3haal'
+        'FacT9RGKFVgphyS4PSvPzo2Fev/cqjNtWnSC/stfdgmdvHQf7hjBoXgqZ7zJXCyI5M3cNw70YPt/'
+        'w5AR+pgau6EmRPOcRbmMWdSrMp/nlx2/l2DP1WJ+bug6uL4BN6hpwWrQ2VhZQly1i9mQuwxfLNk2'
+        'Do+jeqblgpw/a7hcJIBerAp5NOe8euT1AFPIf0ICTxJPtMblHXshbBH7HtqOocGURukugon/OJxc'
+        'wllxu4Tu4g2A32vTLnwPbyyHRsk3AzxzcOoEXfmw8vM0Lp4Q8CZzq3T3rgPjhe9uZlz4ywIxBVX3'
+        'cTz3zUJ6Ql4N/bNHqib3LTNi+GcBLJ951mCL45/rx7KpeBoo9cVqdstsKcN7ntuH/csF+jj9GnRF'
+        'HBHKE+vRl8DLqsmFWwLlSluryYp3xmRS4jW6t8XYnLvYNsXhYZ6CfQf1aWXQ1lvMaYU7f7UqKK7+'
+        '/My0rEtueePHxt+7/Ek+dppVpsJLtOLl2qZLykxKwsI0YqnoMXRt8losezo1+nPFxo/xC5QPu3Bf'
+        'fWtn+b2oEvJG96erDBHTiF1LwYYp0dfcbskMg0RcH4ynSCzlV0VuI4uOMjxQT2FrACN9XwfzvFKQ'
+        'At0LluA8GMFQao7zEuoXlxte+ff4EdQomILqDjiuC0bAlbAHQBxw50gN0QsfB5xu9DcJafXrCKpJ'
+        'qsCOmONodA8y20jfO/F54nN+PmKVNQ9R7Bs77GiIvw0OBdRyCvTra1WFfrHJlh/l326rr6XkDt1w'
+        '8PImMFhv+OHNTPE6b74ZdCsvb9LYaEkskFExkcOuCHpftyaeECU6pZBTAHJhYr8Vq8XrBSFdtqVu'
+        'wAs2cm+e7gXD49i9Ks4cTMywZphEC8LM0MFYUzqXdFsnawKGSRqN48IcMNV2HuObsoI4yzNaz85v'
+        'Yq8V8RLFJ1sC8geOcNkZItm81V2BC7/pSGCXpdnXTSN8zFedO75Q90k0NAWAje+7J5FvBoj87wZ6'
+        'nwmCoUlejw3wiL2p9nUA066B8xZZv2mYvuyGx1IU3K8lq4NwOiwLnOnl/LkbddyBbPLimGh6rOj8'
+        '7U4uYOQVhKoInOq7wR2d/iRN/F52xQBvPSsIKM8KMpkIL8URVgqvRcet8XVCxNSyOMBX3EKcpV0e'
+        'Tt+NUzw67M8DWpEvhncZbAbQR5STtPuFgjGm5j0P8mVKpSp9Ds+7AH22VnjiU5c6BWOG1+UzsV72'
+        '0ynA37/veIObaeOUdh6qUAESI3iBZ51rvTeRjVE/L8+DvufyxWL2YMmzGfDT46rTJiz9wqo5s1U0'
+        'aL5iZjokOsQ5wHNENTcboCtK9844wbDyMx0XHVkkZOyP3/m+3yYRGTh5o7v82Cpk9usotsHVY5CB'
+        'xXXwmEl/kPf8uwTU+o0ZJHhIp4pYr2yKPc2tYAmto0fCdRucQgsYYEEYW7W0M4tUob5ylaYalY8/'
+        'g725AG1sLK9QT/Ka0HLA3HIRipx2NlBH7LurCBTHZhMM28Vr7p18ItEflZrTuJBemK6c3ezNYtmB'
+        'dYQOgdMtKDYFk6Gsg3AMuQinKPvvPJ7ga/xHzDdZKvcW+JTVxl5UiD+GMUaWcp66IH5brJPDLZoe'
+        'gROTg2nMQ82f+Hjmqtvbp/fPZytqX61jbaRqIC1cXp1aaENSFHCpn3Tfe/SCYWL4Z9tQlwDJXhMa'
+        'VXIUfv3qOvFrDRp1Yry2iGRidi76zhL7QXWKnjzC6mkzCTPaHbITCZbt1kbhaq+ijQPLOVo4OjE4'
+        '4sOU6u3N6cPIVbGJXEBSHPIem7FskXZm3gZUcaOQPzeicsLZHSHiPVXD2fvEjd46OXjWjpdCEvBW'
+        'je2VvyAFeKV8dVAI/DLbym+wepC5E2DDbpKR72u2o1G+ahnI+zwsOsUUuC3BfnxSxdzk3IyYjygX'
+        'wMQvlGFzPPCgJrhwsLyIXx6CiFXfV7DGHiVFoX4SMGUZ85jyVSyyjo1o1q8wbJUPtzEroISKRSkR'
+        'IxrBgy2HWE6Cz8STbjy+9cNmAJO++JONUYLnwWEHqMX7hRUl2ix7PlODlmSmVtH/rWSw4miKtKNR'
+        'kJBrBMJkhHE84l6gfU+Ovw/OJNJd8S+FwaLEpYi4fZ7YQMtE/UiHABlf5Bq0Lz+pYeOzAp7HFuyq'
+        'X9S2BhQ0oYUNRhtbTlfFDXP40e7l1GlzPPrrMHbFIFgW0yx2fNyRd7Ti56Pe/meyd17YOBMFHlHS'
+        'wzTOU9Hz4cQojeHGgXQOffe6n03V3dFTQGTRPn5qXdvc0Sjj4NgLgetMZJRB/PxR1RAUzoE8xtyP'
+        's0PVHhNBWvFSyqj1Mzdb1vpf6+3wqHKl4GrPeCQhiV7V7VjISoAkLagDVaoVjEsnK2WIuJGqSWbT'
+        'rT+2SNTso1582cSkVNhMiv5Ia0JaK1RCZXt9gxJX178M5n1yPBsdzEWj9yhONyeBCP0bXcuy4MVR'
+        'z+3+7/axC7wS9Ezpnk4BD10e0xCSoiEvu3Ni8loNaqx8ENv+w6f73HZB6YdLRZpw1+rWGO4bo1PO'
+        'GwoSij+8qQ0IZTfyQvzz2+k8tGWSioUUyFo6V5tNjL1MkiDONRPy1l7JPLmEP8cw20L4iBYNjiJx'
+        'S+8xqbdfUxHl/LKosc+8TFk/3UITz14MkVAPdye72iLbdvmLz+aetxqJVxlQgNsPBeVuTAlTwn4M'
+        'x+rLNH7JPyI0IRjVOBNVU9DmZ8GBLDv9YYhoag9YQmTSoGKsrXRropnfzDksmHdCh8j5iKZAWRnS'
+        'QYiJcJXBWDUB7ERsZ2uy4Vn+PdOOYrXOS+2PQpZTj7APdWxTJCQf4xGpUQ5079DAY/eWdoomkDjl'
+        'PjJkLMah3kqMU0XMn0mrzAuamv4GIdA/Y2fB5Z5cGo3RiTdA+HDN5IkNl5V0JEIs53FVHs2HrZc1'
+        '7OckExUYLrIk9XAjd8Ql/zsDmBRItAx+TwvbbICzhW5uu1edRqcuXh/7ScQAzssLqztWpd3wq7T2'
+        'QmlhkGar4t+XQlO6Enfy5KDaVxTbukKIvpSybZ3wm2vhVzAtgwlJ1QEIkKXEqCNUxtcSXN+bFo/h'
+        'WIBvNDbyMQerY+9ODBhV4pQO5BExNopxmUpPL2xZigxbBT5UZMgxh6Q+H5AcjuJ6sPIcz8yKxX0z'
+        'cPvZoqbKCb8H9F3Pd4c+RWwpFT4utF8Xen4ZeUlYf0S1o/HMCzaGtpJZ41KRzM7yBZS9YDNMjUk8'
+        't4HHeVhHh7QZZYDRs4ql/yQaTQ6xqGCUyR7ZEeM6KcmTgikNYSurmSyqZq5g9IwHl6lIya42uTjL'
+        'ULY5OB6IZqA4dkV4uGOuyAZSW/16l78CHfYdUXBgZakXo0AbxbQFIV5K9eGQDQ0Q7tMc4L57kj5V'
+        'SUJqs52dWS0SDbYC+zf5U03WJoAdeNc4A3bUANuzTWHgwnnUfSqpxJSATfaMnCpLV/Qi9Tuu9X2b'
+        'vBcvU+YueCcxPUApGhFynF+VEAms21R81YhuQRonSVthqU5AMzoqFHDC9PObeKUzyaV6EY4w7qv8'
+        'yLof3gq+djG1BiZyl95SP3acgA+hfINjqgx/DIU8ikYs1LehhVeH2CrKkd6mpdPftOFJo0rGuOYU'
+        'D2WGsEpxDrqo6+II9uAV9M78jIRBmMC+kQb+C7su0T5V8fstXZ8A9m3Qdc9bysLbFcGllxDonBTE'
+        'jyxsC4inDyq4NcvbhrIXZxxnqTC45PEpIxptjmVpV/lVGQkZhCbo0pB2RL6leYPK8q0wPiviQ1pg'
+        '8V/No0dp4xk5KvKLyZjxXCnUKIAWl6bZFzRpcjOz0PZjPL+1bm+4AYM8anabrDwPEtuJlaVvhUk3'
+        'XnHmTgPHH5selPAVmdrVrMz9IBmMBcijTIySfbtiZj/IjZ2rKHREYnT9x+v+Neou5A0G+41ghpHm'
+        'qpN9ncP7/R0kpDQ/k9oUZlLpVGXtXoFkat1vXM3ykAtolngAIEq5xQ1XIyojIejA7gmIf0RdmaWt'
+        'Q3rV/br9qoIpJoYRy+9nXjFpTQHTzWwlYJfUUyGR+MLlcbiS6r6fgDlgCN4oOdcFrJb9wzdyBzNx'
+        'IQCaPSKjYoBo5ap9svhjcpgVp2niBzVtgaiM8JSo3Bk0feaQ8LTsvzoXEVCix2M+MMJF0gGHFslw'
+        'CYux5C0i3idH3kMvetRi+l5vjh5iebN7eOhr23spTgneLYB4Wkaie9ioVZJi+A+eC1trnMzvYp41'
+        't9vuSNTWpQMFPYPbTII5B50b1lSjUDD+ijpF02MsJg6lE+aK0NoeszpuWPXTS8xakJfypp62S+kO'
+        'pjuMi1siUgGYRJeUx6Qyn1+NOpfr56E4TOwojw/kj/Y8XO9G0r5sDW+fSnuO3U6RhP3Zl+HMoWma'
+        'FOUxnGvJWY7vqz239ZbjUbBBLEha1+/6qkhL52ZGDW3Gf+2iUdZcRbxiOFaX2aFmFfAoqXzM7c9L'
+        'I5E+gnghe83ITipp6dlJVWPl+5ESCGlJojyrhPrbrYpkttydSa67sR4w8aS877Hb7czf7XHbpgDF'
+        'j1ksVLzwBDO3nv/JHG79Z5yOd/Rmfa39DoOB1V3IFeU4KXRcslSDAjq6MLJ7q5RnbcybQ8UlXNZD'
+        '1vpOnRN9IBab17lTumE4FOkT1VZ+vyUeNUAdv8X/YKaDPRJ9IHc04zK//G8+iPvEXUE3U/c+hfML'
+        'GKJ4rW5j/OtyEdOKAk/nlb8l8nhUsbJuVwNCma8H4Hl5iBa+86rwyFTRS2tAkwCPHBIrm2MGwNGa'
+        'exwsmvKoNcAGITR+/MhltZ9ulh7wtH+bDBlpdVaiGtjz+1M+HXJJcfJqOM5SR8cjtNhOsnZ8lx3S'
+        'gSqZpe12ZC8OnCCq52eTVIH0Ja/e44zkAYCPyE++ne4+t+A1K0RSWc5oYMu3hLst3sfXpAYXFwJy'
+        'y8dUV24S0BBQ4wmtVlnKX3RDB3dcw5c3CoFlwq87aKyaimRjlT8nTJMiBJ6A8czdCleECo8+y46V'
+        'fTH/N6xIycQrEWQ3M1OWLWd11pqpWHXNB/d2VSUILZykuZ2NUI4mQhIIFP5hzoxEQYTWgX7WYlvA'
+        'lL/jQcf+CTy2CKSTvDhISplv6cMfJJuzmjjYCic4xeejG8jrv5LwiYQtLaEQ4g+UPTMSrtfkJp3T'
+        'L0v/bPht9OlwuEd4I+gMk57rNydqVlAsZoSw3J0tOzFLRelWHB0qOrxjLRI0KS07y3D54K+P13xc'
+        'VC+VpYyB0P7O+yb9E8kqpeTsgZ6YMqKULsUSyOrtdOKBhUlQjm+lR5s+sUq+CmchKgnLemYF1AG3'
+        '22tsriQ/7xMxvlbMJ/HtbPI/pP1VZMdGtaAafb0SDbypKwZnBiQu7cn7m6ZP3W+ij+3eBAjANDqP'
+        'kkijZ0e2wcDMSylZQNxTohpfDaMoP4A0tKLa9N57weADFyvAHAtab+px3oQ3qnfRmJAdUGxBdrcU'
+        'eFYp2iV2OGkgp/aMJnN5M/84ya0Fow/+YeTkTiHjyx/fvos2ilXP947SvgI8BT4NT/0amEAGZwXK'
+        'tFGzZcNBnQvKk58EWlZOHIxIjSEHmYEBUaZ0hMVixakl5/apRB3q5ImI8jpCz+lfB0DvtTw9xXr1'
+        'CDsa9b+QhXK2dGIlrYJmRtO/cOmBsJyMnLQiqpjj2cTpRvqzMLzcMFMRCMlk8MAg7cBTnbx6tzO0'
+        'd0syHLN56W4r8ZKOkfvc+4XsiSyj26QImbNmFYN5OXHIZElT+2vULv+h5wFEbkF3IRTzfLmolHfi'
+        'OmoshDCylfT5T8JIh3Vce8Q7rHuPcmXme2s87E76MvN95itl7bc8v3irWBYqWeLDubhuC0KCKSTs'
+        'lPLsTlP1sZM3248BKwxfmysER9yjU6U3YP86peFvxZNcZCSKgRKjPPY+oUqzKOyKQAw7Pd+SFT+9'
+        'shNiKj2WeeF0naWhAfSWEROz6RvALUdnvLxq/LzX3ya6DoMkW6NuADXwD4A4ZNCTvEIfom9pfeu6'
+        'zXF0XgW4lSB8Ep0SzwSY7TC54t52YIZFyWa/bHH1AWuYaj5zNKhtRC1uZLLaGtDMnWv7hYDa7yC9'
+        'mifuj6TkWIa37B3vwNaWotwmUi/bEioAx1oW8O3MitCRuWPZ2wYdAxj/NrMLbGbb/iNQhIa0bYBu'
+        'xUmukM2sRKjtjeXXfhXKGiL4fFHqgbNkqx+jP7ACIbj8/aesVago7jUIc1Aw2HUiwQ2H7IDO/j21'
+        'wTWUGrjZLRsWNpDAn9803etlBm1MwIKuXavi4g2hY+UDJeKAGE+t1VqY3bmEd6ztz8zMH5f01iqM'
+        'NiomgsD6+6UT7aeJ1TjBYlPmdDm5TtG177Vt3QX9k3Fnka38qnHKarJlZ7sWNGEZYwDKd3Nw6vyx'
+        'G9RGQ4rrugvhv3Mvh+3fztn06ptS3rP+dYNyIjxjP5f2796e0DucwWY4LounpptmZgTByIGVMDkZ'
+        'YDXz9HAbLvtGpI9O4MiWw9tul8ayDDnzRPyC8EwsBgn9ThqKsu4CZPRZF4T4fQ8prZIfYeRw0ooz'
+        'c0lUTQg7dKn/Bu80Y/YXTmFQZ66BpE+6rtFKpCUagdodCcSk2fRsCc8ONXxYMER3kfpdBXG/C10b'
+        '9Mwy/Z0DIJv75kKP37cokC3tAnhBGuyaOdRd7V/FR/9/UKa4Sg//VC4GPutRi6XFGfb+xh2axa0j'
+        'JOt9skp6K7ssyIdgESifjkWRqouhOuGNWVlHdzvekGkpzxFWlDDXRtlT7vdlTObZNWB86PN8NpDx'
+        'L5KG43rl/PM/RqLgiYhXM4iGALxGG0f9kGhbeq/D5FmcEJiS0UYXhfUG+e/Lot1yiR9P48E4/1XW'
+        'fbdYSShMQQK99ZeZPm2WFKrQXIKnsC4rbcw3YxvhQiyfZDVFaCMES6gA7CzJqk7K7Qfn2m1p2U4h'
+        'XjKoNVRln4yIZ5LA1Uc2L91KEylgE5kdcnMw5rp6YsdO/22Ba7n1KjvkLU01ECLlQ7ICWg3L5z13'
+        '255EWaqVEmKSEHiCJHLcmYiSnkJxMPy9r1K6epOfwpXDOEvIRkolCy+1A+li8i+3qR4fnuefZv4T'
+        'xxhX+tAqfS8NDze+GkdLvjBRlYIj1lt403BL+ce8tpDUGEY9fXqrFwkLw2+lQafOdyLx5OyS+ora'
+        'MFQOVIbLP59TuFsut/gbEaoO0IIM6ftwDu/bThhuE4JnnMz66WHK0nNdk1ag4QK/aleDRjKz4j1w'
+        'JdFHU/KzS3hXElmk1F0CauQ850yaAaB5oBdz5l5iZhu8wKbYb9+Y8FKfz2LP3GRSj7c1y4j2k1Vi'
+        'W0WHi3yTv7B069t6VyF4BmWdFqgU54GGVYCEEDp+xgDTTS0RQoCzxbxAVf6abW2w1ubd6GI+FWsJ'
+        'gvs81Bj5cNSY4DqbY6LF5i/enohmZjMJz3GrnfY8vEs55KRWbTlZlvbW6bkQjjP8MZM6DtDxeoeK'
+        'ea7UnztyIwVZBypg7cR5cIbDYxL2ThbBKv/mo8WVrpN3SZAZDHCVRUWm5xeBEYC8hkLbEBS+++a8'
+        '/LMmD2fsEIU6zH3OsJ2BbSEBxLBI9rFvM2J7OYCn267QyswjS1FmYpXiSS2DD+jAZEaRb1K5dDqT'
+        '50dOCmlDeNpp9wrbPfPcVWJ2J0TciUDRopTNacuqkFAwNXhDU0t/LvjjNi8NlzIMDVsOJFkro9ig'
+        'fI/mhYfUOxTwP6VYNhdrg54L3hWd36Aw1qjzKGt0LlttYTl3GlP4gSRQmKs5Yrf2fquIYEeGr97S'
+        'Eo22GSHFnX+ZQDJu8yC8rXDhLRkOUDSCJooopeXTVphpuiwZ/DAFux53WpkSCF/ge5cRDs73X685'
+        'RjfH1slPEps/trNV+YgGPV2iBD4H4JhKa5lSZbZ1PcmraJfNF+OhRRyi63keksADplJxfZSuuDBk'
+        'rQ3EJZN4vk5oAY0rw1Ro/OcjSlFLmbDvtnqizHmiLjrSgcMKSWhQtTgq8ucb2mQ/oSApdscr7oV+'
+        'WntNiyKwwdi/KAo5u5xcQA7mxRpbetvCDMca+ML6Bun7MDJ/Jr+dwVj6E9jBEuyItIN1ckl4okS6'
+        'fDgwWFD/cGhGbmOJSwWRX1P7j+pNiJn3p3EzdSeDYXWB3zhwA5Fm8rDsjzrdcAQSHkc/XGiWrHhU'
+        'zL3Hexs3/hROpH5Zk4aq40ZsvgnDUUN9PhmUC9z2e6/uVkHBbX3qYvXILqjyprZKDPapgHQRXnzA'
+        'VEqqNUn4OyA4JFd4j1s9kdwwajkV+apfd3aAGTaIzzpObTd/8zwGWJs098jjJscJxBg2s/gzsKov'
+        'OowRu9vtjVJgy+Kn4TnjIRfztCfNWpXv2AbPOErr0ywdvZuuA6LI2zvBZErz3TvkAD59XRJoPBqh'
+        's5Of8XGgBcbpzatVCNXHNH2G9o2eRyxVYV4tGFBZwUSWmfjiuiy/NtGx+3X6bA7ZiFvaitYd4olU'
+        'LTW3lnpy9O2+SdjGg1RbbDCvbb6RBVqD17iVbS+jXJr17FwjvIefwqMaFmjMaExRwnwz6s+WxlSA'
+        'H3tUJjCK8dVDu9WFbzxyqnO3Cq6dkAU5UW6QaC/SuQx2VuU6Fx1S0yWWOCarHeSZ3Spzyv5EEupX'
+        'BSMQJuJ/mv7/pRtQ3teKaOdTmxwmKs+SDN22AnPcfB9KVE9CVF1FEDQA1sq3CEVetHLNjPaDGe3t'
+        'SV83lM9ipUOxXsRW8QBs/J5634sIU0zMlmYumAeatUcNdvneySXINfMzgHnGqKpO3lcJtmhiVu4a'
+        'qMfrwIDBRF4CwoZpAtGaAnQlUFqApAf8ppJwuHjdNIDmZjmSv7A1WeRDAr9feO0RQft/ZxC8kPji'
+        'WUz9bcwwyDYGtHyfVlzGhsms+wRouTmm1IwSBp10K+Nn0IogdawEIRqh/CPkuvsg77T13qknkKPZ'
+        's8c2gHAPQZGx9zOqVjdia/eU6p1o4Fx0NjJZant+KW0La8BdpiGLepd2n/SAzOoAFVTmU07e8kMF'
+        '7XElsDKR3p7F4iNLzJJ11ZfK7RHgJqqHU9DMdMYbwjZ0XC9cWPGR9k+VCw6hasyzQAv0a8dtVEe6'
+        'Xi7cBKlLHdg5sgeTE++hU6EItxpGU1EOOGCeUTd0bFV7V0XsQJJ4pXeIobe4FAinDtFWmVpJNbJ/'
+        'zmMVdrdiANbcyLrcJ+6bbTKQQrySfWI6MACe0EBsjl6PeTXJlTJVtEIL8mtjHET4MEJwETjQ/cby'
+        '5q4JLNiDdw6WPnktidGsRwJ9O7/ZRuMInJpUboC+cszAYIcb/5yYzEODMkrPLeBNNT65XTBwMuMQ'
+        'kfRcSJpL/8MPcSMfAkZz9JFXKbjjmGQFVsOd1uyUc+qoGaVxNtTZtp/Y4Xb05rV6aHtIktHp9yC3'
+        'gbH9woS6MjqJBKJLqwy8cUSw96wEphnA+9/TkAvw6LsnQ46DlAh4PnKygyMCkLorPrD3/3yTU+d2'
+        'Eah3TKJzdRNZ/XZUhd5XSV945m7Dgotr5kyoum16CQJISl856P5uGxEVLbiQAqyZQWoDpbCImIq9'
+        'mj75cO4bAOQRRCdOqOS59V+9p9W4K23BQlE4czeYkt2IbJLePopIfR2LYRZ8bSSGI1kezU/7YAH8'
+        '9ATbGOKev5oqzVvcgtZqid4qF0j4hSJV0sW3cr91TRagxReT1WO7uE5nCSG0SDxUCveas1fCfSFo'
+        'K/k57igmN8BDUqTCUZ1Z0coh2WKgmb1V/W7SC8X1hSUlc+dzBbBjRyy3xo/bnqHQlFq5cXx2odlI'
+        'OaOp2+j08FAZk4BmTxhROgrevkeUsaSkvzVTmUgeueNPD51pAW4YClNWk5yiyHkC/Y9tasIP75oB'
+        'mTjOIiasbLRFssmYK2WQezdSriFRyaEUs0pi7OJ92uLadZpvxqMGhw7iDXNE/rqfc7U32d2Zw328'
+        'GPhiH0goYrIfbILvogb0BE7FO07el/U4wurdsGZ6U4Ha/NejiZFCmu88ZT5w1gRjS0ireTp5GEdD'
+        '6bHh+ujK3E92OWfUB7qtKXC/ib5CbR9jQxXq0Lfb/wn3SzYmdSq5Vo9b6YSbImA96HTK1S1oA5ht'
+        'kqxR709BbAbLq2obyIm5UtudPS830/0E60N1EQ6VVs83ZcYUQ2JI+9rk1wZqAG980fKM1zPZOtkn'
+        'LDUqy3JoKrpDFoBbVraPTTuO3LnJCMzcOWR2JOu+isGX0yIDrmXVXb609JEwNxEHjyG3dJ+9uvw9'
+        '88DIbrgazbzHlg1nveZqQvSAAs99TLQCAaA5XBtKDQACe5b5XTV7Js7Kc9x+ryKFem6wiYqzL9EW'
+        'eijt0PR8Ehd5yhOEuURam60YYExAXgBrMnfRKktOqWnDfkXvV61OE7qxdbK6uIXwPHvM4jAHLYAl'
+        '55poRcurZPJIVDn112wvl5+VlgnEYrZV3c8RG694iEWrKQZ+nPh6YzOjEMX9E5476fpGV30KqFoW'
+        'CxGbdjrvRjgGIQOnfSKoheB3h3Cq51Wrxq2J/7SGtAWioF9JbZRwGcvZH/iFnq6Yfq+rMjb5PM6j'
+        'q+SlmUa5B0wu3rrXItNFC8enqWOChhPj0MTPX43hOj/AjmHgC6OLFVt5YnguO03/6W5gjEfGEFZr'
+        'PnIvSLN/j2Vs/JVh/LKw4ZmXe4uTBMPuSuNIDZplI2EjLDJcHhFCE4dolE6HvU7EAHk0dmXn93z8'
+        'Ah9RlPIlpUuqoF2E170bXaXDMgM1R1dLYMXBm/BMAhOZi9SNBpuVfrpwXmeSdvPQsKh2UwVGpdiB'
+        'BncTO/Rwoe+QmB5p3rqoe7w4Ui9N1j8MUSJ/JhNekZNVb9zDbPsZufLhg+MNFEV9LXCy+b+CjC+L'
+        'xHXMxWwtrfVS9mG28q+FchCZJvq5olsdfY8fsaC4NhGN8DtUwBgixDnxClt4kLjCENo/5uQuIGdM'
+        'Z55F9+rVu8/kFc+wbZWxPRgVIpnYWbSKFv5La9yUQgl0Vy5dnUS5MBQJbetxnHBMkhg+fGMa2EvR'
+        'Kl0g6xYuzwjtvhU6m/iVInsAGSdq4QpK3/iXjjCLe5EOVdcD5CmIG0AswrIuyKXS9iwOJqFJcA+s'
+        'gVvpUQoUooMX9SibvAu8Syu7gZB3ug8u2nSkMuqonSnsAjZRpoqZ+RH3Zm6kv2XMDs5bmoWeVtJy'
+        'hKXFvPhu8tPNRJvx3zoXOVMdiWpuUJS3VgWVt+f8EmfBDCKAXDKzlADP7Xa770efTAYSNm+L9WLb'
+        'qLQqru/B87i7NulpEij9MCMUIiWa2CsSUmyxXalNqhFU2j6ziFFUnjczSg2q5Sab9LpFtyZJiEYy'
+        'ht2hFH2sOck83ppzQWvG1tIpkI3vwM0QKRZOcP5bNKJn9xHy1rcCZLJYvF6HVdah59GtOT+Kmcks'
+        '98TdgThi3vg8hBLez576cn7QUBiWXHzUPofIPobKFbAwclApV4FZ9W4b62bQf6YGGpVTYVtUt9uq'
+        'imzuQM2TfnHSdLlMD+Vyp/UOW40pl6QZEilw5jbMYNqHf+eluKEblUqj2DzxphCfDcbqs+QdkSSV'
+        'cMB6Vtxis+HPi99wKslbnFCG60XHXwhTneQBq9p6dzqW4iFjp30kJoShma8Z7T2QDJJ+WkV+4lK3'
+        'kGe/WisnybCdo6yDyPAwaUxPzV0dx48rw7R39Hd7T2C49wuyNrI/EXoeIddgyhU+Tv5fERr9wutx'
+        'rwkK6t3c1h4jMVGfRziqdvCrVlOO4Tuh6Kz1+qXqHE56kjEy48w5PpScR6TIc/3VOA9nBgueehYB'
+        'tE7jkJxmMah8NqfrzJxSn3FUr15qebQyubcOu9FLzfh+BnBT+3A8nJ+fA4tRiSnRcJYmW5Z9fgXZ'
+        'n6ZyWzhA7+A/CRHezbuKXEa3HuabhKrSot2NbiI6+HeHC/CiMFv/g/ZW0XdHl+C0JP1/89V1J/rV'
+        'bBkuc84e6kUZ1tcXamrCFBKawb/uaelIC1MnDVS7gHQZ62Ob5w/7dnrVcJGct65XKlMmFY0fBiyM'
+        'hDlLFowkv3aIfK9PXESmeTzN0addMhM2VMp02Kpuiz3RprI+AAe1BkV0dzDYGKYqd1DhnJBoe//4'
+        'f9j/PofPsKE/h/l3iPcemVRyRwEQruUksaRtTgdL0gTyvkTKHxRSU+AgdY7P0UBxXb9+i3HiSHzQ'
+        'PJZW1ZTYG4vVXBfQ6Gi4aUVYSdDat7zrCAi5kXZ/c/PM2IcdRWyCko6huZ65WtGi3Bc2k8G5UKVB'
+        'WXlCXCTPJLnXmWre7UtV7q12qdrk0D5Eis3Ki86IMrjOY3Hs5bvUKfsozPES729h0KwdMmYlM0Sl'
+        'EzOyKHfm150cWUtAb0I9Ikw9/CkjsuYD2OGq1WD04jUJ6ItP30CNhqpYyHrLGX6O9u7mAc+0O2XR'
+        'JlQQeo8djoCH2P4GW55ucsP+nlsxSblC32ifGTNB1U6uN7zlQVXSQ2Y6kUjZB5FFtqAVrzreeVyv'
+        'fNTDirleFSUmlGYt9gewrNlRjIiCO6McheGqzc2j9llvopPmP7jXkyiX/W/DGOSyYq2+S0dRkvmk'
+        '3MmEEecokSKhz4Sx+xTqhOkRljzjKNf3MM5q3HPWd++HlC9pTWvQIq7hPfx/zlyYOYl6355lF1Z3'
+        '4/MgRObBw5/Ml4aqBF7ESWRUundmLB7yN3wNHlExjNDuEQ5jVCgSzOH2mPvBJuebrrBrAS6C0OCI'
+        'rQAL80aoXkeeTcVNIo5WM1GuvB51Hjw+5CCRyrW0IuJiQrNLNkU114800uaw+7MQx7QzUkA5r9Hb'
+        'IkPogwsbGGFq2rJBMOtG/3Z3qmgwG5tTcg1gvvOCahed8UW3ybdeeL5oS6XJPdcYlySUQF0RtNaB'
+        'bAaPeelIXp+OfDokIP1r/Q1B0MMi5BqsPzMHO19V4zbJKu091QoYQ/zw7lVY5sZUVa/iRa3wBLks'
+        'VQhvNss5HFR97JdhDGJ7D0TDc4Q7A3s2iMNwaRRmrRLJNcSlHAPu5LkoIVjYnYIu55mzWjeE07p9'
+        'K6HRmDKSXxaJMASUnHUXlojlBUTX+zJ2gXoMOnieC5zl3nceULdigv3pcC0rwVnxc+bAm0/Z68fW'
+        'd8jAqma3ERMcgGfUskGAsJ/hbQRQ5cUZHLj8wfroSkw/5bMTZc/eWqS5eTiI49eD4gCkMRJjf1uy'
+        'LbQE9KWjxzfq5jcs0aMB+UEbTgHxbw1YivHZvOtBO3TWRlxgcAt0nxbN/UozHLcINQ4b4AMLz3gS'
+        '4B8qGcv9LF1cDm0MhkvodcSpvs4hCJ7HWvBSg/GDouY1gB+AbQsRwx5f2h+yWPWglVGjesKqiyV7'
+        'll1/Fm8l7pE/rR2vS/qG0UNEe908307FWmWYzvpWSi2tzf9CM0FjUu8ynFfCtSgZwSlWbupMAa65'
+        'aoFh5dON0zDW/g21JjY1tjAT+QRDM9s3Sm0o9x0LZhDb73iHdjKXK2nhjbNgNUzTjZvFjx/WK0Iq'
+        '6hlnM47qsHnGt3PCG4Z0rF2EOZ3AryMY83TwxIRKyXdmp2r063pndv0UDxTGwEQH54HHxeBqiDER'
+        'ufxfRPGsjQi1jqOAVMjGFg11LQZIpUnxUEl3kWnc+GJJZHJo7RA8iHasO7ilNXXRxpD9MjsHKzt6'
+        '21w48Mp+lbi2glr1DWHPILtkLAX90vQvYhbdDQ7tLo9VfaV46LFyF4yBEDDi3YZQl61LO0zk0yuE'
+        '1LlzR5kLk3DeFAhlCrEReHgAOxftH9Vx5TBtsWfeHVaC2vfUAOzkom4Pqx/CZRYeyzBxbmhJ/QuL'
+        'spL574E3/vlf/lgDxbRsOL4V/d9vEAcx2/EmyB4vcea8FOB5kr4IQfnpEdhH9NsQVXewCFUj9S4t'
+        'bddZHYkwtd9e4SzO1uw6yAFeVUExazcgsD8NwZfQYaZ3YpZPY5LXLo8oXFgVZFdKXgR7cz+xRNBz'
+        '+05v2dWVf/tzIDFEKQoI9lIJbtQkK8g7H9+vzTXEbbP66iQvyKiALTNG7MxKUcDgMJxQpBZEHejB'
+        'S7155e4iKk3UQY+URZ8C7phbC+gcmC4HEuyhRvOnvJb8VwblZ64jHH73dE1YqedB1520I1kEzIb8'
+        'y8uz5lNhxpHjbeCPvNdCiwqUtRp6OWA7I5/4LoO/V18qTf8g3v6e9AG2fTP1BjihJZxm1pIMdUcz'
+        'FPc/L+oNKyXk098ynSgNBXi0WDqlzFow7M2pIR6P1XV/yvR+vmCXj1ojBbpiPC4Ab0qVLdPlGsuO'
+        'BFY9Lu6fwu3yGLTfOO4Miv7LCyeaDCjeA1l+eQ783dRR85aYuSnD3BIkWqvXx+iF7EyeVT9+40BC'
+        '7BLax2engjE8B+Tmy/zM3LC/hN8q2PbpP3TiVZm95qeNj1QMmpvXIxPrrs074aXvojniKb8kVfrn'
+        'o90Z7xUQFN4OYscmUMA7OvHzNH/sB5Sr5nW6kqTuCKL4+UP7sOe3pNZ26OmJ+hFsA2Oj6A+5BY3D'
+        'XkYBtpnd9qLixo09WsSktI2hqrwAerVj0WWAAIHp5kP9U3SiUWFPABOaRRxMsSsBojYLf0L7twRa'
+        '5bW+9wCsHbEz4O+O3ZXIvYby9eiEV4AHZOKtV1/Hwud4At3k3ShUaPjPzGrRIDD2242kksqOga6t'
+        'Rxut/KYWSwH/A0vGt8iviGSl6yDiqG/bcwdVSzpf0AY2KdC0JttuvtViIuAdl7a4T3TFhlfFX47q'
+        'Ea5epb8/6nspLk56bugVZQfZ1ai7mc/0VPqPWuFfdY0KQwT9LcJZM66tm6wpuPjxUXvIIIHIPQ2B'
+        'QeeLy4vnoiauujIC1kM4tFPV8qIGuoTekS9Sukc/2f9nPsrfUA1MYQm+BoKAFPs5rkaomsj1XYye'
+        'fTkEoBx8uHVjHWu7hzyIYZKXqp6Dx5dj6PVFz534yHyd/irtMW2FJbipLgOPnJFzFGmiYp5B/Lit'
+        'qkT0ygu+vI499QqSwoALezgD3MB1DtcUV+hdFz9/4L+VcqgMfCDzOKgsHcUaIhdXCyWERy3f69np'
+        '84m9GVMwkWf+HbkmeWlx1yqJtMihC9vqv+TBrkQRzqCBgZiT+fym0qWUEfOen7zGIBKyFU/T2tgK'
+        '6fyzh2uTJJu+54Z7k9HuCMjZu3goTj3JIlWUWMqkhEe8uXZpy2lFiszSAQvIjh1bHpt1fVQMsoWK'
+        '73Cm5jE00npuq501BkSlV4pWVdea/NqCZCUSX1P6e/LKyYa2RvL8NvM2JA1OJjfSC61s7jBozqDW'
+        'kuSf9kppbMPPCVB/dnLpGTidmLr5WTT8COT9cmRfhr02wholdc2fiJTuv5Ewu/vCbv0nUajrTS9l'
+        'En/DeOerTHsuYwI4ctKDv3IrjyS7DDuYtgh/ETUL+lhc+95T1GzhSdfVSEiUcYILDdBjaqqW4cmg'
+        'aoB7pMlHygxM2u23tl1AY71OYfW4lI0v6DJUCjN1auzXaN47WonxAZ/KaREjzXsMTeg6E2IwqN8m'
+        'LBwQG9ipiE95sB3gYR4kc9wXKrodmu9BxBW54hIkp6BZguOmUzsnLH7aEFMsLporfMjUvLFmXgOe'
+        '5u4AfYB0gosT+zFio0PJJ/ad/dHuqUcnkhMEtbkf5KQg+b/Mce1wwqzWsSrIPn9nrybbsUqR4eVL'
+        'EJX4pSBetM0PRD0aUVCjs7oIZI9G13GqCtiwEiRZtFLkkNHUYT3xvtBxwc00Xtc2QuypiQh2WbM5'
+        'Aosz68fXLSv7SiRtWOblS4kE12MMX/4IUN0TFS/XW+9MfPIxTwuW0zmIyZH2Di8VOWlKpPrXakOS'
+        'IUIA6JbBjglmo3BqDkNaLWRyHU8dMon2owJ24w3IJ7DdERaApJm9/P+5Wvn4r1tVegWjzbZLCvPK'
+        'N5++81ZpgWWg61fjDOKFMho1p2m88GwnWtZcu7ZkC3QutQE5h1KxT3t4iZGfG49J4EmJK4Oa5XfW'
+        'xJVVnfJAw/qAiLPrqEN8a8niDY75PAj2bNyzfzdSiY/JGWml73ajIN6uTzyWvrA8sxuMziXqLLoD'
+        '6BMX3SE8PNGD6TzkUKclIpE7N78X+B8p57Eb9up+XlsI67phlM+jAt2cBO52M154WDi3JTNKzbzv'
+        '+ilryxOi3cKiHcyYmzyEljRPbcCppwtSKRAJ42lG+A9TH6yjMscyJT1eY5WfKih4IYvOXh25fyBU'
+        'v61djvUKKQxd/yRlxMfW0wy1usFvy0aMrWeKeTvxiF9kfybH6fbTR4HS6vYRptJ5Rs4FesGl/1++'
+        'ydLbFvSsDmXK7jhc5Z/xTiPZ4iWub3FUR4a80kydy63WACg3KWv7nN78dgDek9bQmE10PR7XA/50'
+        'Qx+dq8I5edtgVO2o93fLg2JiER78hIrn7/sji0EpJlU9hRBbVuYy6v24r7x5CmJuRLQDwUt4+gFO'
+        'DQMxvMgY8C+z2BB3yYUEMI0XIKB25DhIjm7BkG4wuPTAfbbiX4MjQCvhRiK5MaSpPw4OakTBv9Ye'
+        'H9L9cw1SsLPU41Oa5/6+HcvAPeCnS2Wra3SSNrN0mtazrkdicBEzxuourCCdUmzGR6WyPZUjW/nT'
+        '1007GaE+NwAEKireriXmOdWpseo3d7DT3Hw7sxjNP6pyKJ4eFGgRx5GF7bJhmZIHJn5TytZrRYk1'
+        '54MVIW5tjCtyV7gn0B8+16IjHiqSQ4TkHTvJEwq+hjb+167pdFt2k5d1ZknjmfZqQCnvISwZVYjB'
+        '3bFSgR/AszM4y385SWjDU3+f7Y+M2zIxPoEAFw5fefimwLzvFP08MXgTIRPlPd/X2+fibEEibh6i'
+        'PCbN7l7J1VwHWNFllMuLQzJQumTEk6JvbgYZ85hMJ5/J6fWBeovHBZi+0gCXK0uRmkKPiihRN5rS'
+        'hFq2X0BJcGl0J7JcyHE8qZXHluKDADofeg/hQu4CN9DBfUH/DS2Bo8ed2Fb64zb+Y2mGk+L8HcSG'
+        'dNXmtDVSmv6qVQu6uJ4K25EhFjJ8AbgMNmReLfaIysUtklpZgq95if6DjgXzytWIaUdMH3Yus1Vn'
+        '2/++dyGbGjLLhbHJkWzw2E8ahvyN+QjCgnsoEGwTqMAsZ8UYDczY+lj07Yno3o5EAU1j1Q75IT1R'
+        'mATk9zUNR3a1sxkH1VY1D/ch0CFctcRzx4Em6+KMOq3+r85Ry6j6Ars9GbsxWBxincLvGss6lquj'
+        'THBg96MqWMIY6Qbj/0jbRCXpjqEv0kq6oeBHVgQFJrJF4uZYsIEWdNCd2UnfVJddCGuoOURpK26w'
+        'DZP/FDBTTumK3+gaHl0gFmpkyC0eWYIbXGUDENkUOa+vivvOVmUjI2pSo1SqrXUAltBkBrP7UAH1'
+        'qZ/xMLnj6rqAjNj/94DCCuIIyVE9gqAfSeXijybUzUVIOuUoCl+HBEFvONQ1gURRNlEF4tGaufDX'
+        '1+GbW5B4eEASYNSAURUUyxejMlHs/RGrzI+eBbJjZqiUjH+uAsyPkarKbNtp/oHHsYLWLU5NNCnE'
+        'ez7nXJP1CzGcXqZM6E5+8Y7j2yAuY0iPztOvUq5zPj1mkyN09p8xdUSExCXtvkRQrtl49B+mx470'
+        'eXrgGTiZiBhRYrmmwbDdX2mzHMb94yTHeM7/cfmB6/eseXGmVUtrjX+zFS+Uouv4SrZmBKTI1ffn'
+        'zXiWWuwFGXzJ3w1Gnq/LvdjEaNunazWdQrVSqY7dK7yGFnIWT2Ulpo3nhxAk/Jalw38+7Z98lOPd'
+        'K06Baf3hA4qufVfg5+5Hg1fbLFBqUZofd5G559093yfmJbrEJ3aw3h59jnZ84dw2GHNJ42VhXecU'
+        'boH2lj/oGJSJsduhFo0DJTj4M6yaKy7hMq8E46Kf0osa0HUmNQYcWdC4WST167YFty5SzrX324dg'
+        'kmFgyWFofDbtBvYzAN6zMeOMhp+35cwY9XX7g8RN1/phUMqUdPYbZZmhD8tViEoLpoVJmHeiN3O7'
+        'jlJpeQud9togUdYrBAAmJ2VbvkNCGMcx3VcjSS3P8xz9nKDFzB+jnPmpCnWwbkbuwR+DVJEeNQHi'
+        'e/1oWUlgFeD7HZmajXt7fwLVg98BchDby4bDu4bFGgAweq1Sqt1MY1YpmUtgJm+l9KWwGVzE+1Fc'
+        'yOXlj/bYAeY6Jiti3blVnTiFVZVOStSd99fHYQFO0czmQwmMEGuTgftlbku9d6YoPP/Istc9qFHi'
+        'm6+5nSgo8kqYHLv3LXyCk+Yg9sYZRbkEt/XjRsCEPTOkOaiSLvPtnXHmb2Sbi4efVhlbn1EMn+2/'
+        'FywHN/91KebS7GdjXQU2x9flm0ibh1qV5NNDLh1UJcfGGKu9uGmnOONfD7SN+WRelLiHhNqOvgAx'
+        'Aq6OMowKefO23oFLSd4F5JxRnxuiVRYm9/WaB8392zMKQOyk1dZObZd9BuZE5vQghaMNivON41Sj'
+        'DgFVratScL+6jldu3nKzYepUM6wwttYzfJck8CGZ8hZQwBsqucZjgqrNDkx3TrZLKqDtPQ4a04eM'
+        'dYGk6IcqSqJBPk54XEU4smPbwSdU6QEteeUIL0yF/mN9zQjXDe1L2bbQLMWNFcRhn52n1PJZV+gA'
+        'ONu0vSTKw6gMdozRnyDk6SlSuZYxptQkru2Zit4CeV/tPRMrYFqLvPujvbWZlBlSnB8UCec1UVuo'
+        'MOgqzkKqFGlsRDS7HrHD0jkyc+jngbSCp/mZfo0FSiEgYYMGo24+AL4PhX73klOtDfhU+o3auOc3'
+        'BaWm/GkhG+la50i5babgiTU1QLMTk59megDbLC2KSsY0gaCRG8W8w9jZTT/xEh25h5dLuLdv7nHQ'
+        'YVXbn9o17RCnt8C4DksmNBMJoBsHP5Xr+43eFNsAhSH51e1QGN5xxJ3fTTGYkT/5S3RvaxBf/FVJ'
+        '5ngIYh/l70Baybh27aEVG0vc7Wac4g32VpsL6qi1EIwjgh1Oug11S/UWCpwdVUDoDX5UR6OR2+iD'
+        '/ukTOBCI2yToqO8H4JFXZXwuXhIPb/RzaLgYe1SF0WFVWwKktO8g+oT5jRDHTA5BYXDpdgc4kDrJ'
+        'W8+etyVRMki+fwC50X8q1mzWQGyKSFKdqxhnULviHfnSPb8TEIqxxJpJTrE54cXChJuKL6zIpYgc'
+        '/pKF5D4YsE40sclS3JXkjOzqShYKyCyDR2nO5xCKp+XTzKNZQdZcVd4Q4N0FrTCRhWmw6JqY6VHa'
+        '4jwc1OnsammYeITnvSfty+ieg+EspqQFTq+LP2iwaZEdO31gq3CNJRGcsngJmJJzDzcZvHBTARq5'
+        'wHIvlTPTdX2E42quJRTxnogh8o+cVjLbYSHD2BMS5V7iTbiYV9Q2zuFMz/VLLvK1MyB+wh79toE1'
+        'hMRvcnqQoqYOPMoooBd0cGVI+2ZnyZ8M9/WPDPxhUDBF3A3vZp98HwYlKJmEk9YX2MmYKXMcVH8K'
+        'CpkerxfwqOmObGfMgb2+Jritj7JfgKuy08+zKvpAIAnNK2LbuzwapEj/cKpIyJabVr00ANDB4Si0'
+        'hfv2gTitTa3z38IEQMT7Q9dgfd8AFWDvQrSxIKkQArkjqiFXW3aYTMdWqBJrHSXShgOfTBg787F0'
+        'bK/cq4pibIeRI76JQNCVcUq4cqZ0ue565y6CsqRMZVbFnEJ7IL8qfttSJis+FTRGAh8I6WUds4CH'
+        'vQWv7F8LTV4K2z3X7bQOR1a8gE0WA+efDsYkpJ1i7L16EDMvNLHupskvLpe2WqZ+7S4/yUMZFDmD'
+        'XRdWINBGiy8QLPp4Dfc25RA+UcI8MA+lYiTRVVsO4zvzFj1xlIbuTNnMoWjiVDDyqwe7fqpJ//gK'
+        'q4tfTQnnReEDiqUlYQ1kRm7Zh5wXrUho4gZU4xq5UrS6ghnjNJF/UAbrtAQWE4QuGaPAa0kqT1yL'
+        '/1V54qUfbht/zBQ2EmS8nmr2ej4rynrGtlnCp5SjWny1SB3NgKhizhsY6AeGI7yAQ7Hzn0gchcTh'
+        'Ak4nx959hvZb7lIyeO79ITrv1LgGJHhedIfJkgq9/GzkkYWmHwoSaLWxPZu1kLQwVCsNPHQ86TIE'
+        'WXXnGA5CJT+L5ZQRdwcDiIoTac4CK8XQNhV/XFps5+notdn967KQBZ1Wcniqtn99LUitGLKTg+S6'
+        'VctagqwJX/Nb+c6wDPPU0uYZMPlawzr5pE2ZJXH3vca31J4h4xiCCaz8v9TAtCoXT4/T1lQgbvK4'
+        'cRIq2utIPR9ueXpYxONzDvpDZd/m2TSq+aWiorLXO18G0JjNaRKK22iW+Ya4qz919Tb5mve4lXzN'
+        'OUdulP4lYROl5S+D0LAXVieAE/u+UfT6WIaU9khju+ZA4Ol8GcYMJQo6dHA8dxq06HGwqk1kezEE'
+        'tezlrR3wGazRKGsYSaabTXKDIH/byZBU5dBOxh9wkW8gOc64mwZ4sM7V9Dcf7HWyoPUXYHKMLudM'
+        'eDV2VOTk52WCdXs7Gz0Lgt6dGfANRxTxscrRBNPrKtXUxi0JF+fnl7HnWLT13vAdtbg8WwbKeVvV'
+        'RwyLRc5q9+N67rHupQm4WiKfO5ArTd+UpygLAisg58D2UrrguKAFkEtcHwyPYjF1Z7lwN+bBk60O'
+        '0HilFq6Gpa9OICyohhI1MMqOpr2FkwyEcNRjEaRdSdfx3IPDwYat91NkvrN2nL9knLfTdIggS5JR'
+        'neDZgZFjw/kKtx0h64XskO19njiWC8XV5kPNETfyWgynFONUCSRyzpxEw8XtWyoGIdwgeuvezaxz'
+        'Gx7S449SPRL0/bK4FppEaOsG0zx+lSntxSpMxZf4RI88xWyCZsjOeA3AiA5Mix9BN2yJP/22Weft'
+        '3bbtatQINlsj8pATNpJczTmPHiESQekWA4ggTfZdj15R/LOXUSBZYNHaim4rMRb7N+T6UTBJgEtG'
+        'hre+PYKbkK0j0uDSmqW5dA0dBLWknNHp3HoU8rf0UuKewAyHGsH+bgVaRdFcJv7UECXxhN7uU1cd'
+        'jAUS0VGLs4AjocBhjPE7C3ifS/YqvC9JHKE9aLq+zzk1pyW3ysbeZmIcpuMmxYcAO+C3gXWEDPD1'
+        '+h1RFEGKG9pIxddyHUGChgb5rMzDuFUWRqHDM7SxmteTGhW6DwxH83YNWL5uGZps8/fwucxtvX4i'
+        'ufxtm2B5n/3tAmAYz1e9RSc7Pv8CRt5+pHgeN1n4eyWjYysvlcbS8daL4Fodp5/19XPOkquC7eAc'
+        'vGPJKoAYjJlY2dG/SfAkTvUJtcAuxncqeZNsOwluMMQWO9iRDuRZekM7HdyFLaZXbvq7QLkl/K05'
+        'kn4YA/4r2so/eJXoEbrMnqq18d7QP4GFEiowuiaLEYLVNMcclrU3lrg8iWX5ibS2tq/g5cKORjDU'
+        'sx0v/9nbx3pRCOmUOgXVDYyxOajn4rfU5zb97Tf9H/suabqfkV5YBE6NZ+MzQF72sDLplat/nD2+'
+        'eBXogRgXlZMwpjBXnRFhMBXuxRqMT0orMAFnfE92FGSlMrisqxv8EbvGdAyaoxBlcWWBv9suDvOq'
+        'GdK1wa+9Aff2cu9qwGY3/x20SVyr3hO82nEvBmE+d7xt1pGk/VU/jj9Xz1uatZqChhyLHC8jNAhR'
+        'euZkkGAC7a8qy+0T/+4uVHG750rfPMeU1TnE77HipmVTMuXRNFUtVb+5FklMrbZ/FkZ3SwEGZaAx'
+        'KDAnNB/Da6IkvbD3OVaQiXae4h2yCGDajQWLKOtgzmYnHbQTZ4KiaDEQtNAQORuhTBAGQYF1VOQR'
+        'Q2Nkmgch9WyqatvqsE87HGGW+oVCEw=='
+    ),
+    'triples': (
+        '6AMAAAAAAAABAAAAAgAAAAMAAAAEAAAABQAAAAYAAAAHAAAACQAAAAsAAAANAAAADwAAABIAAAAV'
+        'AAAAGAAAABsAAAAfAAAAIwAAACcAAAArAAAAMAAAADUAAAA6AAAAQAAAAEYAAABMAAAAUgAAAFkA'
+        'AABgAAAAZwAAAG4AAAB2AAAAfgAAAIYAAACOAAAAlwAAAKAAAACpAAAAsgAAALwAAADGAAAA0AAA'
+        'ANsAAADmAAAA8QAAAPwAAAAIAQAAFAEAACABAAAsAQAAOQEAAEYBAABTAQAAYAEAAG4BAAB8AQAA'
+        'igEAAJkBAACoAQAAtwEAAMYBAADWAQAA5gEAAPYBAAAGAgAAFwIAACgCAAA5AgAASgIAAFwCAABu'
+        'AgAAgAIAAJMCAACmAgAAuQIAAMwCAADgAgAA9AIAAAgDAAAcAwAAMQMAAEYDAABbAwAAcQMAAIcD'
+        'AACdAwAAswMAAMoDAADhAwAA+AMAAA8EAAAnBAAAPwQAAFcEAABvBAAAiAQAAKEEAAC6BAAA1AQA'
+        'AO4EAAAIBQAAIgUAAD0FAABYBQAAcwUAAI4FAACqBQAAxgUAAOIFAAD/BQAAHAYAADkGAABWBgAA'
+        'dAYAAJIGAACwBgAAzgYAAO0GAAAMBwAAKwcAAEoHAABqBwAAigcAAKoHAADLBwAA7AcAAA0IAAAu'
+        'CAAAUAgAAHIIAACUCAAAtggAANkIAAD8CAAAHwkAAEMJAABnCQAAiwkAAK8JAADUCQAA+QkAAB4K'
+        'AABDCgAAaQoAAI8KAAC1CgAA3AoAAAMLAAAqCwAAUQsAAHkLAAChCwAAyQsAAPELAAAaDAAAQwwA'
+        'AGwMAACVDAAAvwwAAOkMAAATDQAAPg0AAGkNAACUDQAAvw0AAOsNAAAXDgAAQw4AAG8OAACcDgAA'
+        'yQ4AAPYOAAAkDwAAUg8AAIAPAACuDwAA3Q8AAAwQAAA7EAAAahAAAJoQAADKEAAA+hAAACsRAABc'
+        'EQAAjREAAL4RAADwEQAAIhIAAFQSAACGEgAAuRIAAOwSAAAfEwAAUhMAAIYTAAC6EwAA7hMAACMU'
+        'AABYFAAAjRQAAMIUAAD4FAAALhUAAGQVAACaFQAA0RUAAAgWAAA/FgAAdxYAAK8WAADnFgAAHxcA'
+        'AFgXAACRFwAAyhcAAAMYAAA9GAAAdxgAALEYAADsGAAAJxkAAGIZAACdGQAA2RkAABUaAABRGgAA'
+        'jRoAAMoaAAAHGwAARBsAAIIbAADAGwAA/hsAADwcAAB7HAAAuhwAAPkcAAA4HQAAeB0AALgdAAD4'
+        'HQAAOB4AAHkeAAC6HgAA+x4AAD0fAAB/HwAAwR8AAAMgAABGIAAAiSAAAMwgAAAPIQAAUyEAAJch'
+        'AADbIQAAICIAAGUiAACqIgAA7yIAADUjAAB7IwAAwSMAAAckAABOJAAAlSQAANwkAAAkJQAAbCUA'
+        'ALQlAAD8JQAARSYAAI4mAADXJgAAICcAAGonAAC0JwAA/icAAEkoAACUKAAA3ygAACopAAB2KQAA'
+        'wikAAA4qAABaKgAApyoAAPQqAABBKwAAjysAAN0rAAArLAAAeSwAAMgsAAAXLQAAZi0AALUtAAAF'
+        'LgAAVS4AAKUuAAD1LgAARi8AAJcvAADoLwAAOjAAAIwwAADeMAAAMDEAAIMxAADWMQAAKTIAAHwy'
+        'AADQMgAAJDMAAHgzAADNMwAAIjQAAHc0AADMNAAAIjUAAHg1AADONQAAJDYAAHs2AADSNgAAKTcA'
+        'AIE3AADZNwAAMTgAAIk4AADiOAAAOzkAAJQ5AADtOQAARzoAAKE6AAD7OgAAVjsAALE7AAAMPAAA'
+        'ZzwAAMM8AAAfPQAAez0AANc9AAA0PgAAkT4AAO4+AABMPwAAqj8AAAhAAABmQAAAxUAAACRBAACD'
+        'QQAA4kEAAEJCAACiQgAAAkMAAGNDAADEQwAAJUQAAIZEAADoRAAASkUAAKxFAAAORgAAcUYAANRG'
+        'AAA3RwAAmkcAAP5HAABiSAAAxkgAACtJAACQSQAA9UkAAFpKAADASgAAJksAAIxLAADySwAAWUwA'
+        'AMBMAAAnTQAAj00AAPdNAABfTgAAx04AADBPAACZTwAAAlAAAGtQAADVUAAAP1EAAKlRAAAUUgAA'
+        'f1IAAOpSAABVUwAAwVMAAC1UAACZVAAABVUAAHJVAADfVQAATFYAALpWAAAoVwAAllcAAARYAABz'
+        'WAAA4lgAAFFZAADAWQAAMFoAAKBaAAAQWwAAgVsAAPJbAABjXAAA1FwAAEZdAAC4XQAAKl4AAJxe'
+        'AAAPXwAAgl8AAPVfAABpYAAA3WAAAFFhAADFYQAAOmIAAK9iAAAkYwAAmWMAAA9kAACFZAAA+2QA'
+        'AHJlAADpZQAAYGYAANdmAABPZwAAx2cAAD9oAAC3aAAAMGkAAKlpAAAiagAAm2oAABVrAACPawAA'
+        'CWwAAIRsAAD/bAAAem0AAPVtAABxbgAA7W4AAGlvAADlbwAAYnAAAN9wAABccQAA2nEAAFhyAADW'
+        'cgAAVHMAANNzAABSdAAA0XQAAFB1AADQdQAAUHYAANB2AABRdwAA0ncAAFN4AADUeAAAVnkAANh5'
+        'AABaegAA3HoAAF97AADiewAAZXwAAOl8AABtfQAA8X0AAHV+AAD6fgAAf38AAASAAACJgAAAD4EA'
+        'AJWBAAAbggAAooIAACmDAACwgwAAN4QAAL+EAABHhQAAz4UAAFeGAADghgAAaYcAAPKHAAB8iAAA'
+        'BokAAJCJAAAaigAApYoAADCLAAC7iwAARowAANKMAABejQAA6o0AAHeOAAAEjwAAkY8AAB6QAACs'
+        'kAAAOpEAAMiRAABWkgAA5ZIAAHSTAAADlAAAkpQAACKVAACylQAAQpYAANOWAABklwAA9ZcAAIaY'
+        'AAAYmQAAqpkAADyaAADOmgAAYZsAAPSbAACHnAAAG50AAK+dAABDngAA154AAGyfAAABoAAAlqAA'
+        'ACuhAADBoQAAV6IAAO2iAACEowAAG6QAALKkAABJpQAA4aUAAHmmAAARpwAAqacAAEKoAADbqAAA'
+        'dKkAAA6qAACoqgAAQqsAANyrAAB3rAAAEq0AAK2tAABIrgAA5K4AAICvAAAcsAAAubAAAFaxAADz'
+        'sQAAkLIAAC6zAADMswAAarQAAAi1AACntQAARrYAAOW2AACFtwAAJbgAAMW4AABluQAABroAAKe6'
+        'AABIuwAA6bsAAIu8AAAtvQAAz70AAHK+AAAVvwAAuL8AAFvAAAD/wAAAo8EAAEfCAADrwgAAkMMA'
+        'ADXEAADaxAAAgMUAACbGAADMxgAAcscAABnIAADAyAAAZ8kAAA7KAAC2ygAAXssAAAbMAACuzAAA'
+        'V80AAADOAACpzgAAU88AAP3PAACn0AAAUdEAAPzRAACn0gAAUtMAAP3TAACp1AAAVdUAAAHWAACu'
+        '1gAAW9cAAAjYAAC12AAAY9kAABHaAAC/2gAAbdsAABzcAADL3AAAet0AACreAADa3gAAit8AADrg'
+        'AADr4AAAnOEAAE3iAAD+4gAAsOMAAGLkAAAU5QAAx+UAAHrmAAAt5wAA4OcAAJToAABI6QAA/OkA'
+        'ALDqAABl6wAAGuwAAM/sAACF7QAAO+4AAPHuAACn7wAAXvAAABXxAADM8QAAg/IAADvzAADz8wAA'
+        'q/QAAGT1AAAd9gAA1vYAAI/3AABJ+AAAA/kAAL35AAB3+gAAMvsAAO37AACo/AAAZP0AACD+AADc'
+        '/gAAmP8AAFUAAQASAQEAzwEBAIwCAQBKAwEACAQBAMYEAQCFBQEARAYBAAMHAQDCBwEAgggBAEIJ'
+        'AQACCgEAwgoBAIMLAQBEDAEABQ0BAMYNAQCIDgEASg8BAAwQAQDPEAEAkhEBAFUSAQAYEwEA3BMB'
+        'AKAUAQBkFQEAKBYBAO0WAQCyFwEAdxgBAD0ZAQADGgEAyRoBAI8bAQBWHAEAHR0BAOQdAQCrHgEA'
+        'cx8BADsgAQADIQEAzCEBAJUiAQBeIwEAJyQBAPEkAQC7JQEAhSYBAE8nAQAaKAEA5SgBALApAQB8'
+        'KgEASCsBABQsAQDgLAEArS0BAHouAQBHLwEAFDABAOIwAQCwMQEAfjIBAE0zAQAcNAEA6zQBALo1'
+        'AQCKNgEAWjcBACo4AQD6OAEAyzkBAJw6AQBtOwEAPzwBABE9AQDjPQEAtT4BAIg/AQBbQAEALkEB'
+        'AAFCAQDVQgEAqUMBAH1EAQBSRQEAJ0YBAPxGAQDRRwEAp0gBAH1JAQBTSgEAKUsBAABMAQDXTAEA'
+        'rk0BAIZOAQBeTwEANlABAA5RAQDnUQEAwFIBAJlTAQByVAEATFUBACZWAQAAVwEA21cBALZYAQCR'
+        'WQEAbFoBAEhbAQAkXAEAAF0BANxdAQC5XgEAll8BAHNgAQBQYQEALmIBAAxjAQDqYwEAyWQBAKhl'
+        'AQCHZgEAZmcBAEZoAQAmaQEABmoBAOZqAQDHawEAqGwBAIltAQBrbgEATW8BAC9wAQARcQEA9HEB'
+        'ANdyAQC6cwEAnXQBAIF1AQBldgEASXcBAC54AQATeQEA+HkBAN16AQDDewEAqXwBAI99AQB1fgEA'
+        'XH8BAEOAAQAqgQEAEoIBAPqCAQDigwEAyoQBALOFAQCchgEAhYcBAG6IAQBYiQEAQooBACyLAQAX'
+        'jAEAAo0BAO2NAQDYjgEAxI8BALCQAQCckQEAiJIBAHWTAQBilAEAT5UBAD2WAQArlwEAGZgBAAeZ'
+        'AQD2mQEA5ZoBANSbAQDDnAEAs50BAKOeAQCTnwEAhKABAHWhAQBmogEAV6MBAEmkAQA7pQEALaYB'
+        'AB+nAQASqAEABakBAPipAQDsqgEA4KsBANSsAQDIrQEAva4BALKvAQCnsAEAnLEBAJKyAQCIswEA'
+        'frQBAHW1AQBstgEAY7cBAFq4AQBSuQEASroBAEK7AQA6vAEAM70BACy+AQAlvwEAHsABABjBAQAS'
+        'wgEADMMBAAfEAQACxQEA/cUBAPjGAQD0xwEA8MgBAOzJAQDoygEA5csBAOLMAQDfzQEA3c4BANvP'
+        'AQDZ0AEA19EBANbSAQDV0wEA1NQBANPVAQDT1gEA09cBANPYAQDU2QEA1doBANbbAQDX3AEA2d0B'
+        'ANveAQDd3wEA3+ABAOLhAQDl4gEA6OMBAOzkAQDw5QEA9OYBAPjnAQD96AEAAuoBAAfrAQAM7AEA'
+        'Eu0BABjuAQAe7wEAJfABACzxAQAz8gEAOvMBAEL0AQBK9QEAUvYBAFr3AQBj+AEAbPkBAHX6AQB/'
+        '+wEAifwBAJP9AQCd/gEAqP8BALMAAgC+AQIAyQICANUDAgDhBAIA7QUCAPoGAgAHCAIAFAkCACEK'
+        'AgAvCwIAPQwCAEsNAgBZDgIAAQECBhRF+JcDnQ2VNCrOaTID5tIMWuYz1anTywRlA87tBA5+KTM6'
+        'Cq688kjyn/gDhdHZsRCPeoVsRmdvH/8pAfXiLo7wBNE9OzUEFZN6zfChWVAimb8ffwFYtp+ZAGkG'
+        'B9f2LESCG6eAFGCWQ3aYdW5cS0j9AZB1CJU/kZQIIhoTB47cDyXXcPH2RoxOoIC/GQOqKEq2Aqv4'
+        'fM11harCC9P5KKup62IOMzdBW3B0Q5/l3QrZnHLz0fNlxQNaso6tQ3QgRmwQm7Adq33tRayWR59F'
+        'arbNWNiCVjgBIoXgde2+Mx3hUwVsQu1Ad3K/lXdIFxr5iBLfouuy2dRlVnMlIogB/P0OtL0BafFO'
+        'qeWy8hBsLKAHTMfewicQPR4fT2whLjn7xHEIKOcqe5aSsUXzC6iKSI7RrE+DApm6APUaXoJyPmvq'
+        'CAs7sdKtSxuXPHb5+HswH9uFwzHZZTGvw2sl1T/nmGZoCWgshNR4iKkDQrtfdkzT3oIXmFboHRBW'
+        'YgDjwcO0pVS/hl72RpvrUjlOtN+gZSWy2pg4Ab9jmfJkdNwPgE3sXalhBciGeA3QG/nxbS31ZUW6'
+        'F8L4H5tSFFnS0oRWOLypaOp0IaXca1+jom22aA/dzQFHMLA0h5CRIVOdnCiV9vYHdO8GUSx0kRmy'
+        'rBfeFdEsI8eTSvaik2Ipv2KEW9qpZ5uRBIWkoJQY8ajwRHAjZ9auAllVA5OVLPYWPkwiUZ+Yq9wL'
+        'nLeZFX+FLX2+SBXpQi13djThfmgyUeUZN+YJWSgkrp0b6H6Y9+gETmQ08ESc/ggTIDwDBNKueqv1'
+        'WD68g9R9+/y3aqXDEbkfx6JPqRbphBY4kCpoF/KqThNg8cdI4TkmYFm199+qzox6XAF6XpuL5KGU'
+        '8hMr1X2t+Tw2HwgGiEuTV6xDlLdxF1JFps6wXv27GlyLgtF+pNG737oCoux4w1nXhnYKqtBZni/i'
+        '+wFIZAbn+CL2+KANAiciQ83Gxb4DSiiUNqU2+NrdmhsJ6QUSp5sfKTmH7jpZBwCodek+aSjT3V9h'
+        'fsYPa1VUerDHsQXhds9YsyJcVj6AExBPI8K84jJDqLspziQcA3QBIniAs43wT/CKPmqudig4VAPP'
+        'DVqLTmhDf0yX/G7WhepVuzaAO6ZTPS8NWOclLlBX/f21lrqCOt0LrKJsEAF+9GDYyRyt/YH7CMtd'
+        'aCkzcVPca7oEgP8MTDEK4NC8uIYD2V75KodaZTkDFdINJFbPD4mXw1UIPaEWb5aD0j69Zl1ekN1c'
+        'F3YXJu7aAwuDpxAmaNXrNUGfAUolPrVtqfdVpCDXDmFHK4axug0mjjYHmAXVxblqeCMdXstUH2er'
+        'QaeDDGTbFCConCsULGsfAk43lUfYOqEpa81Z/fO2jqzklhRO9fA7rppdXu/AZEgL89YFI/x6Algj'
+        'OOkdyCBesG7zREL2RvWaIknBZ8UJCxDg0Mev6gDoEWT+v1YQ9BNqHzT1QE4hMeckNVBG4NufaloP'
+        'S9gVMKiov9XaWGm22gVRvQgLr8CduUHuvjgT0u6Y+nqKH/jOzQMqrZzAZAbSxYdS86Ozl4NWGVJf'
+        'Tv4mkPAQLLyF5SOdb5RbOiMR7pROCuct/sTk6blyS98OhI64FZVkc9CZUiYpt4Spy5MlUxQSGFAB'
+        'uqmkSLxkgD5ZPO0Uh0jBueq5tRz8ixxp2QU+ixEsg09nOw7ybH5TyqXhvLEtX3PL73sQGtyXLev2'
+        'J4R8Xg4yTvhjvpJm8bptrD6iJyl05Ljw8cZgxm6LtQfNe91+e9IyVCTLfZOexAUCay2k7prQPWhF'
+        'pujIVhw7h1sBRiHTmAaWMwQJMITlEBNbMT/oXKmxGHoT6jaw0rRNu7GaYTMo4BUgSbX0Ubin5h99'
+        'ZVQzGQo9he3tgi3JrEOzWz2vcNqkxNYyG/PpJmASL16EnC8vHrOflH0fAyFEhJOZ6APWtVD3BejV'
+        'G2SfFrNv+ztKrc8T7g1BP05MUw6gD2y+pboG4k2n14svEuimLf26WSQ+zabX6M2qKtFQfewoTM6O'
+        'p44LLI6TVZa1SKRAFQFzPxLqENB3/f1ffwsQg01/PaPZ07MyU1jCKSXVBCS1OcqGfVLgjD9OOd1i'
+        '/0tZpmBFoRJJ6WN6BpEVqEOe3Aj6gxemPBIBhgcR0LDhHWE5uO0PGMPCQWDjsWUzrMs96dMp9ADW'
+        'h8Vg+QykxBO8/FtYDbSrrQFVO8fsJJVHeBQCRL5gUGhQJMmpeh5dM4R9wbcvfgde3jj0gC84OZSm'
+        '54XrfBLT9onIRBzsrilwLs9hdCFcHPnjGp1atOlgvjcpwfDyDoCO5hjRFwQAqrjgYpUK3NpMosus'
+        'pt0F6RBu+Xa3TXY6CsD72W+z8+6BIpsCNxNoV97BEEOkGLruqz1MoqNiyi9nHXoXUnrilKSjC0ZQ'
+        'C7ja3aIwKxyuKbIN43Yc/KHHTN/lfkvlIHl//TNtILsP/KB9JnkdOFuiUKznAw+W5XF6oTTKRu95'
+        'TEHo+RwSoBbOJkB0Q2Jc59a1oMYZtjT8fVYK89ha8EuoDQR7rEF/7ZQOiwDJYpxy8n+ykqjagerB'
+        '+QwylSo67HccEhJoWA4jRFbSTipQKuPwvEdDO36FJCYRS6htTxfMyu5QE2xHvWUeiDUmUNfkcAl+'
+        'SbO5dvN2Aoq7zQnZfuhismkBkqzL51MompRfTer4CFW4+60HZeTL57p9BSUK1r0fnlAG9hf06qSa'
+        'K2OiMC2WY6GUKPeFtOtcr9IOuVxvDbp0OjocSxlCqfGbIsyJEKbS0sMbRuumTr4mn9nCU8+zrmth'
+        'DzB+r6trQnbeMXwzuusjcTlaV3oBvBn70uOH1GwkU3jxMSk0AgBgn3uTI7THh3roA+MGncaiBRDj'
+        'pPPjUElq7/qkpj182gmglvuK4dJ0i5+Wn/LdunjbCoO2VR+54atGk+Xje3kfmA8sIPo4uYGXD4Zh'
+        'p05016y5DMfjv5+4WMT79expJzaTcogKxRQyw+itEOrJROzZ/UNhnfCv6fypZzIoQid4FKXN8OWU'
+        'P3EDxRlPfj52Dh1+Hj/STlM2eI/lXNTlIpA2dd96J/eYbEikZQ/7l09oJuvtEr1QFmbrGXtdTzzv'
+        'c469uinT463gsYEEEqXfRCHve/IGlCgquJKIe9On0DcSJGcKDMWHZ4xxJxU2xFpG/Rs0AT/lQa3n'
+        'XMw80Aq3iU0zK38SDNyUUpNKMWUKKL4m2218gHRiBYt+5xHXZPMRnv38Gmg9U5W3NZuckKRwl912'
+        'ino5JZZHjJcXGD+NlgtiWg3w/GiRAHxEThYC6FP9pLjeWn57hERwP0AJTrvNa/x5cM2go7yBuc2u'
+        'ium1xPR4aNGDqc7VE0yNIH+3Zgeax4xr4gEiUwmk5nHkInHuBmAnCVPRz/QloMJG/+KCoOacpfSk'
+        'tdcW/m4Iw/nEg1KD9ZTdiBfyvoxlvYndypU0E9KljPbnqzL7FiuRf/W+JblsZE0xsnIIFViGpXLS'
+        '3ovd6lOvxFjZQ0XoxGNC/M+XRCCT86gW4jzCZ6ZaPjA/cCAxJdfGZSSsH9iFfWrn+Ijw4IMU4d1p'
+        'OUn0Am4MLuU7snZJrSJzJuPBHl/q2wOq1et0bqWoDpoQNzQHsP1xpjkNxvunkG066H+VBHAx3JWo'
+        'PTltBQJyU5CMZLSLAAcmKFjuMWqRNTtTw7LIHiIOycHZmJ3MQ6WFxVw2kBBqspj176rnyr1w2wJI'
+        '+1QZCQEmyyPOIEkYnD2Sww4BVDXVfKrmz6p6iiK6qyW4r0TEyG3a2G0EowS9kYj4T/hOp+bDrBqg'
+        'N6HVvrUMP6IHOvVSRII3UAEdml0/uFlnwxRPbidl8Pv9w7+x4MnoxXQKwBRD0kPyNf5w0sdnh7KR'
+        'J+bV3dK9+1zr+kc9cc7WNSW3G+89J1YdmoduZTyAS0CjEYiE17HFkI/TrSZ4bqAB4hEZV4eGh1Id'
+        'f1U0B8rRMTEf73ScHt81euS1BAZ8VOS4uBuDQSNJB8pBhEA8hXeqNTDTk/WF/qCOllY8EuagtW7d'
+        'S4V+wJejlDzvQb88oiCFL7Jam6GIro0AMp/cFEET2AbsPK1hO11ZpnyK6Og25+GXznq4Vi6SJ2Jg'
+        'jhOJ3dp5qm7LAL1DS5XmJfXchvjiPuyPSf1tNrVrH6YN/AXajgIeZ/CDbQOohAAvjHBLCFfZ9U+j'
+        'OD1mNEg6YPiDTsetMhe1pHCHwr51Cxrky9UL2JJJUM0gC6wxRHb5HceRSkfgQJHiTv9AZvolIe2i'
+        'pCEOC1gz9DCCQnUtuvsBQg++0Y3TDtIu+MWELF9TGMFif63DXaQZfg/QhSfSDOZK9bpMhxD8DbFD'
+        '/FaLRW5rRB35O+bXK1lPsXY8hmy84rss/E9WmIvRBgRhJ5ERkt3msLMCO5DxDuPJEOI7ZqQRenJR'
+        'LiwQMZN5s2Tstj6SQ/82CxITJwQgZTOtY+LXqpicg5nvQvomcX4DFNjfCGkt8E7SBP4fSdAxenN0'
+        '3FALnNlN1r1/qMlmdu42GMSf0gNB1MFD5P2e7hQnqGFHKtSevd5YxeUIZGoBlEzfEp7V57+4JCOl'
+        'n7v4G8O78DBwcXw2yLosSp8jbFBzE4dU+iSvJzNYBsaBqFJT63LLCfrDytGUPa0Eje6loZ9GgcEw'
+        't4WcThWDspORKjEmOKvrbxyn4GvI2d92bsFa+fYQbVcjlziO7twfbJXemFIPFiiuvUq9XrDpNWRt'
+        'mXd/dGegKWJ832JiUXHhfsvNwwxNVTQlGbsTDXWbL5k8sk2RRV8lLHQh5WpkOwKKHOat3Ouvr//5'
+        'gnhjo4zfg844f+vqOR2tN14pR41OSeZxcQatZNuZ1X8BCgxu32IkF+AT2HylYnx0Z5l/RGbNNJpy'
+        'vJ+/YzVAp/ujA+wxr1QvNCPql9ssz0nAebL3JwWVDETQqxK/9P4YaPlZUZDDQ/SD4LCRk84lUEM7'
+        'yQwYTw96HclSMAbNH/DIgEY2GqviU2Gj1AFZhiO4amuXZIyn5wbenqVPN7S2iSlpqve5hQMR9mn3'
+        'o7GTZxdRPyZXdE5eo2dXMnR3ja0a7ZdCU2AdX1tWSW8INTw5d/04yw9vu/fPM4nwLDY4yYtuNivM'
+        'TwlHolAII7NrwgmFNwu7lT/9vVjBBtQOYTI40ka3N2uj1Jc8fTSlif0nS4N90NNCzBDebwgxeDTD'
+        '4vNVGFCh5WtYpPM297bplT0B5KUf0rHAnUUB1cf8BqxUYAUFFqDeASxAXcEoH+dH4IBj5TBC5ZzP'
+        'o014ODuQBYTGqggzwHmMHTpAaIDpJQ6SZcvgUfONRGHeK8QASUjTBSmMIE3hplFr/aJe8xjJL+HW'
+        'n9S70BjL6tg2Kbtq/pLIw+5TsZKr2jnGREp2tj6z99+z0OIt9KiAZOdvMs2ZiXmHgozCU6WdxlZi'
+        'b180yM5dN/edvyjzgvmqwU7q9pihyYRN/+Kz2gfq9QH3s/r/wUQOa17uUHnpXsez4FecYDWm25I7'
+        'ZwaIgaZssO3IaXhsBhC5jRBXwU7LCIUl72uxx061dhqm851d4v/vlfvbZQZsMHiZ4+7BjtIqnC1y'
+        'zIGnlFlCePDBmHInI77STpUN5R/Ge/YkW0557xndGyeNiylOLYZ4o6tduhv145jI8z+iCY5wrPD/'
+        '9LBc0kuO5eidGuRwoy8D4olDMtRr2toE0J4Xm0flgzHAPcKVbPD7j/GMicTOSPPXGQMY0KDjq4X+'
+        'JVMX/ArMx/sCY9vMksjrGeWeYtjShfNO0z45inAeaJvfEDIPxVFp6Q1duRRLt2GRoeHequiHpsQT'
+        'TNnYC7rDo5WRds6gRMgzp3vE8YMufyqDllg5MHxAaj4OxDWvxItmRilQtpozN4sqypY/EHY9qbXA'
+        '8Y1V5VyLztYCsQYlOXw32btE2YiVCRgBGRdV3E0dh402GYE7jnICkMLY3N3DG2cUv9s6LXbQlTRr'
+        'TJg4+2SFtvybw35d5n/oBP0uopWydjzN6pQW7bRtU7BZHqCX3qDcL/q9HTPb+rE3enI1zKLt5XPf'
+        'uWaDqU8JBhahC4W0a1r70++hmZPqk0C/TqlxErb+kLh4pydh0k1EJwpcaRjFsVTTInA1/Atnh9Ni'
+        'wOKCAW7P6a6saDDg8v0Df5p577lSUWm8QYKnxqcDbM9JNGC+1FGtH6fieaIp91t7uwGLRQGsvc/c'
+        'MVGk6DMYpNo2iKBL7J/SKgiUpGa2mi4Tq7nZkBEqtcLZ2MwK5J2mmTTGBzQOOn0VSlgRVHJvUTU1'
+        'uPr0TUDgfn02x3CcxcaU2LEipt6rVGYwbHvtZKt6qLuzyeMiUbX/JFVyOTcQR+/0E49jp0xUGFZh'
+        'edIHnRyQHidsLncLzzY6sCxxiFfB2UqO/UdolpzWTStYxM4zTHiuw7JWSh8tqelFjcrB+Ji/DI2v'
+        'RbrlnOPLE5qAsqYnommRkW1q6bbNvgJifQM5ND1Gi3XjFAhbgF0yeTAyS59+rSEYnmkVIuOUxaFS'
+        'exMDJC4H+rbB9kUEIXF8UgxBpgnYQvfBsC/fXWI97KUAwsebUJk3+0qg4LwsvpnF9cCUs9kSdcji'
+        'D3kMeaj1ZelFTzfeJ8gZuuRhLlgktHDBeTDzMpReekfnXOqCVvmktjggN7LXrj4m+nTePRaLqI1W'
+        'GYcVRvjjJK7qVMuYkdD/nxHoVE8Jfoht90+O/OvoaYeqTN0WF/NumW/M6bn9j+kX7Na2D8KhfloE'
+        'vq4lT0G/fWYGQgcsYKaiDKLOJrHshnGSQoe2GITUNjmyjMLdvDijViSifDYzAiVjwyKLEwjO0w45'
+        'BL2b4V7NzaHyx+QNVQAoaetx4PN2K4XaxFG20soeUqn2OF1TpfCHUlFRJMq2vFf2U2nNJQrORoAY'
+        '3MssN812xCsYRYrVl5d+j9PlnMemNntScwWT4AdbTzTkQKuHkIpZZeWJAYZgsrhnITRgG7FJ4XQi'
+        'hdH9L/Z5P51JlUu2QbblqZCoU28Gdc6v1PGxMYKOrufi72DpdugGMP4B98mDVQxnYSfE/zzDYE6S'
+        'k72Tuqxa268v++K/cY3lTbbUGkKpvJn+IifOJkz0brogBB8meDvAP5um580rpaAWKzAsqBYXYVs8'
+        'UBOuyO1cBpnSrZsNOc3ETL9jbGYgJ4B0kyO0vUNDi3JmiE8Z1B03iC1DDDlYEuYiG3skd8CBOGGL'
+        'zWTyOIePQxbqZoxE4k4owxpQ/kXwn0YViFBxAk4bZWOXZPG72uvq1LWbmX17Nh+C9Q3omOe6EZjN'
+        'cwbVU50rDTmtKUqfphZmb5eyWb/MjeD3CnxUms844z56hsWeLi4DS4XXek/bpH2nB9nYPdjHSIw0'
+        'HhKWg1gNP+e7vpDJBLcphbKhtMpAMQYs+mbLiWsi3MlGp/kS5VDMVnHlxT9b/08xgIMygrEA1hlg'
+        'vLQJv7rh+YORAdaLLpSzqOgt3Q1V0Hi6cxr+c7kofMbZYMVhbuL2ZPLEpj5FjYtyhg+89yhrqs8M'
+        'sxw9XAdHBG1Y+i5z51JH4QPNqpysWs+FE1n23dF1/HI/4TxgEq0q1Njo0+OQKvh1Nt16+EbhtKU1'
+        'qC/sgR/iD1JSYf5ozWwRtFwf/c/1yA78Jfvd/x1lamr4zGcBjgr4KWreskk5Ynvp9TiMVCi8Zmga'
+        'VSh1gFOc7TymqxxCThbGjG+ZQRhjOyowmCqLQLuevEqFYKEnbVebwdmxQkpFRh8QY5IlB/PMmpMl'
+        'V0fLYVfDjRI7e18BV9gyQJJ4IiN2VcpI0IYq4nDlROfMMgrtaMkLUbvPTd2K0uwIt3+vlvBP/ko9'
+        'pe2PpJek07WpKgaEIx7ekP90a71BMlYsVwq/QI0o185+u+RraK5s56HyCnjAMZHXht02OXKkCApn'
+        'yE9ZENFfULyyG2z4mDSyQbY7uOLeClU5Enj3Zh77G59qgV3pxH2IJWvhAYm5XJQNdQG0tlGDIDHL'
+        'tn4+BqiB4Wl8dLgZ0cIDbpX6PdtZelK5YIjd18/7i7usaPneKKonnkxPW6Y2q6i32H1eOh0Wuhzn'
+        '9IY1g3TK2i4CtsloKYkP9ZZRQmF7CsxIf+zvHMMFXGkRVigvt/GgG9JOFxKCvAQqWMwYIah+yMrR'
+        'uwCYMo9faM4JWUU2z3v9FCcyfwSEjAS7R3AP3poTc9Xg0Y2aVSScPNIhJvAjppRdySBf4t3AyprW'
+        '3rRldi96RA0s6HtTbWz5oxnK1RRoC2NVmz1twRXLTzCAkH9mbZVz3Pj/kBlHlueSGlXVOZrRvWRf'
+        'TW7WdUDacuXFgpUpmuSY/88DE7iQLJmETWArwRd8wrRC1fwxJ2yKNr6VIZkVzyGs+Lz65H6PIOUq'
+        'gXt2E18VWgx5AzXHDow3y2LgZqFyZRLE/WkMYzBlYjdUnzuYKuqsuTapPmtzsZXdqLZy3pKnLwNj'
+        'ML+sLYHH5UUsmg/lm6XfHFaMY5JojSAKu12gWG3LNqUEGTOaewmB1rRz5FbOBJcHuawh4kQSPnMU'
+        'Q6/a6iE6Uxu88RhGJyG1bhSE3ZbZ7Bz6nZ/bc6geS5KEj46OvMhvq1++fQkf9awf7FnUkvTakuOy'
+        'M4J/xNdC5wa4OTrxOgEPiax1Xi+3DC7YRqklxzT+N69hquez8xhAoRlCt5q/4OTQIFYwshdOrVXf'
+        'OjVD81MNaLwNrMWbDg6HBctKsZz0mShyy4XFgsQ8HRKM7ToRmtXe/PgCE+cL6ANfwpOiVeCnVkuo'
+        'iuYUT3nsOLlgyK+m5uqNH9YYwvg9tzADRiWR/3vGuRt0mCOCE0CkQ213EEiNu8nXiSrJHLMq5DB1'
+        'fH77GN1vg2Ktbp/Rx/po0cwumW+ekU41d9JA2Gnuxdsq+N7xistx5bAjMMjorNTEJQuEegjxjk2P'
+        'GDVT5VDKo014DcFWu5EqntuXTM529QHHNYpi1K7IU1Z7qoSxLRYTLDWnDlsOhD/+z2AdVkH6KBk6'
+        'BokQeppM7vAkMf24wY+BGV0QBffGtMVhzQhrcdw0JQLVVs5ZK/vb8KakjAJcLBuDT1UEzRxe+7B4'
+        '3V0wJvEVf8KzjlobBeUZPnfJZiiS2SBnKTocjie4SjJLhoP80dqFrEEF4n2IJK1GsCtBhRstpDt2'
+        'Wr4XHEMxnafDR+5SKSN6chJjsKhhJQAOVHobnQ5vwbHU9E9UTTteNkbVB6Q4SKzSM5Yj8pkYwFIz'
+        'a4yC4gXbRl/PC0LKXTJTT9P/eZjMzZK2mQM2/FifwQGC1R4DXFA5bS+0QXvLswQC8E8dfnyJg0Ho'
+        'bhKflDcdRCuQeywFrwsTeb2vO6cId4JffkoebkGmdTRqabaNtBAGDt2wSRNBByl0kMjeTP4ShyNK'
+        'zOBowVcMVvxH8Dkx6A72xQ76ZQfIfEW8YYPtoU+L2GtA4K0v3Fohcw+wBj+60dsNaVGDjJrD2bjn'
+        'J0N/Le0tdcJNJdt1a7+qBWv1oqH2v1UkRhPHV8q8M26bQUFFDGiIiSskNNUui0MbAV3Vt/Ny5tD2'
+        'zTC9mN2QxpJFX0dM1A4bY01xRKqr2fL7oaCjcYAJuvPT00HBIuZSqzlmAUyPkwPj3BMkIvkEnRmw'
+        'rZrNB2BqfbM5FINjbbo6WF0+A46xDiCHyGN1Z5EuPA3JZRMea2Si1A2WEI9qdDjdUzvo7pkKFolG'
+        'WhaJPfBA9pKDgyKPRYkN2Rj7HLwc8fem5AA1YAUZlCJabZAIcrgorCE3N66l4TupIXKriDw8mRTZ'
+        '3WMg2EZ4ZL6z9YMT12HDmPVQe38nhgN9sAisGm48veuSzqurXqITYeT9tFfoUca2PE9csoM45DEq'
+        'qUqS1JcqQMaRvJnDAeHUdUmxV3JHCNHQhj25++eEkCdNAhULchEvihjrQflHVrpEnzc1ww+NjLPT'
+        'j7eJa0jNLn4uO1G7LC7S0fLtB5ztF6RpFjXJt4jY2OzMoI4t7QfChsMRol/ts06RTI61S9hwpXrS'
+        'GFPwsJTJ7tXzS9UEOYSuiiNZV1s0COKkIyq/FFzs1ooveg3a7ScnJ1JOHpsv0bnEtCs3AuUgA+DW'
+        '0xOEOG97zn9LmwPXZ+PfiYwHPhqELOSOe9VVEqI6oKlBuVwn4/Kb8v1bhATYM1SIWbB9lMQHvBCd'
+        'KRzDERF0kc3E+xZiyGfawbVG3YqmmmtdqKkDMiA5OwIh0uhJ0ALlqTKZUr+362bpS+mNeBvOxD30'
+        'aeHFSd9smAaIL+klwErQwNE/9oft2FMPG6BxIWEYlSfdh9B3LDgp7tCFDKYMVL/5vP+EJmLxtEKJ'
+        'GIUZuHN3XWF0MrhIyZXzAfzkL/ehJDyDBE+ZaAJwcqtLI8O+tTKQZtU7k90gfEtu4vzcOIreOP20'
+        'lE4tmfe6wALVBcvySlm9zFFhBSuYPx4O+Cf+E0zID7RAvTg8jte5w8mPmvmETaSAsPap5ItbkUUn'
+        'pP/KSPITUHIBejxaHb31L/YIke/Wha6bmcYuYk6VG7yV9iSy8ed4lYdCFXEkIGdNDysWnuL0KBd4'
+        'Z5EHPdfiLlJ9BFRwlCFk9Up1KrwHc+dhAdgCmoPBt2IXTsGneMgnnLgxCSwqCMYr5MWL6OqiscaL'
+        '8CRY0iteRai2DvkP2ptLSi8U1zK01mJf+o6lANimiQ/zBb1x+ZToN0YIF2hmk/bV14HxSi5D1ct2'
+        'SiipTu9XuvqXWbxpyLpA0ngvlauuqDB3wFpFbbosSlLk6lQUIXxfiw1Ueuspr4UVrOf90udRHE65'
+        '1kkJtsomeTFGQDyRbgadKOF5gSRDaxqPZdtUl7fbR0EJmAHNJxHuW2wa52nomcY0kTiuw+mrXqkR'
+        'za79BoeBHmRcWvgcrV1hcyOhJWby/HCXFMj9K1erojoM0QdkN/WngtqlKgejjxWel+wePBE4T6Va'
+        '8K064Kbfbh1s7oomwGiCbOxeLylzefA1G3syKz+e1zpfecq5t4rBWxV30bnxVsfgYadOOSBTOIo9'
+        'DbYFBw8VhEXd16e8y1CKZdCVLTx2kzIVm35c700CjJ0OgrtH/uc0ei1qqGVCbJd2UMCPom2XiVhD'
+        'byMT5ZBV+ro5qIkv79KWaQTHWXZOvb4sw8cKuChbJgyo+96jlg0pb6C5SGdZbZzNuukFOpeaX9D4'
+        'BX39krri7xMFKcBWiYsC7Bwd0cIWrmUgWNiixEtS2vDPP5We3rYLYUDmDVx8rCcdVwJO+hCP5zBr'
+        'BC7VdpMpLbmaz+J+QKCJZSm52t4cuMdxC8TWmqFZCKewXc7Zczb83TSrTM11hEiBQjbP8hcAmqL9'
+        'QGkTg47vlMGdx5rDDkS1krbeiI36I/IpATDXD3q213y6djNVfesNzFNM7Hg3HlPP04t2A6RoFjji'
+        'B4OJK4IfJD0Iddsv9NUT4BRDw6A/Sdk86RSNS/+HcCuuz51OW1QROfcD8G3nmS5iZlHMMp6qFGWW'
+        'QfGaesA/LhjkxMhtYcgN+YcKuNgoVW/8GhvwRCyKa/kQCCskuYOqywTplRykZny3PqmPdY6/EATA'
+        'flgu/l/d189JEd8dN3i8HFlRFpjtSboFXXAXKUwELNjw+33mMsshR0KAJnYOLPXiw/uEBO8A86Wk'
+        'p63vaiokKWZIEl4jk5FyL9HKOaihHdf8BN5cHL114sq9DTqcrNIqnQdTcnPcenXaHe2wIItW5RDY'
+        'cW27s1RY46ZM2XwVYv7Ep8Lz7jhS2EmzIatJ3FkThBK1X6+rCS3RHyYyLjGDc13D6kNSfsG+6tD8'
+        'y+w2usRG8Mh9pJhE1GwUZ7yYwNDF6AJVQIKXWciFyHEBZxm4HdbwpusYa46/UWg+6JBm+emStfHp'
+        'ZR1f4K6fRVJ/vx0bWLPQX6PbRlUIR7NvL4ffmm3P9Loz0ZgpZIv7H0yfFX8GEpA/0ZzwNhUo2OUw'
+        '2HDBKAi4/8bhBhJbWH27itpjiSZxHGLZTTP3GKbJnhx1KEDI0bM6IQoeqrf7gmRCjQ/N147M0Tcd'
+        'TU380Qp0006gXqOErVaDWv84Zj5LIXgtWdADCnA/Vh4wDMO/VK9lWMQysE8gzehTIqNT8cwW4dDj'
+        'S298J9QITaWKrWmDn89lPxadgt4Zz7yREUsPQf3PITlwDEwbHZS7hbZA3qgD8YakOjSQ6U8U5Xav'
+        'Hb5llguYZoSBYu4DGntt3r95eUjVJxBPAlN/NylzlhGa7fuZEq4aOHP4kOum2axG0cBI8yR8UnZv'
+        'Fz3M2820+uwui9R3CoY53HUpJM+Co9aTD2NhtLtCHhNApJWEYgoeRICskAeFvzhlfLFuh5nVinQY'
+        'rMk6px0yer1NXsmXBkzAQbkYmUrjLCer/yJxerc6e9QMnpbv2EhEt6LlkaCN+fO55bUuaIWpjpq/'
+        'mKdHvcYVEqZObO5YQucB/ULyOTFT5eG5BZ+ZowyV0/MTqQ99KX8fRfXIFVdyDI2MxB7hjqLTns2z'
+        'K237RkQb0gu50iyRUVI7WRfIwRNghU1KGgez61nS1atQg43HeVpLDSeME2LVVjtdpZljozYIM3Uz'
+        'GMAXkNbxTg+JjiU0nvwQBLg7F7EDqaP48fiY0ns/Ib7AmrTrtgafbcTzDOb/HbDUc+CUdcxtAeli'
+        'Gaf3EqfIKzorvtsaCkYZSI76UdLLz/eAArhtC4NgjmNAmxD0RWQP0ZpeDZL1Kzsy895eeKoM8C8e'
+        'VYSyYCq037Sa2P5G0SiYTxa6MIPaiYIdUfDPm5XYa3Tt25yiLoPP1q0mqG1tmZWzSoZZ3RklClLQ'
+        's5ugfaEd9kobidEL0umXW1LZ+/RVymP5Fv4rKYT4gK5O8dGv3M6yRbVYxxwTWSWvI3wgZPwdTk9t'
+        'PmkWPQpQATIPmupDVKO5yMcxgH4daJNp1Z2BWp5vqzTbtqh96p/gZRq+Eo3JYv/hitXwMvE9p1yS'
+        'YnAbpwHd2NaZatjdpQFt0po+sq/nBRyt1/1KWch9Yk2RZvULyqpaHO4xsWJHeq7uj1q7ofSsUagg'
+        'ZbJlhKUZGz7qiDkY/vdVZ1s13N+KyOVxXZp3V6Z4En82OYKQGp2q7C3Av0I2sy1WW0UMwNzOMaje'
+        'wT3SotLI0nd+CEvhu+9MDdqzlOnBHACXHSIlvVwJxGmAqWxnt3hlANklVYiK5zrpHJCBdxa3fn9Q'
+        '5FsA/dJKhuw0qn1Wc/pbHezteUQRYwDTK9TE4+OlujfFS4mAtkOV1tnlGpqA5RxXYaJAzr7eTEEx'
+        'snc0ixP1zZaiGQLKgLqmIr8zyGUjQIs606TMNiGPhLFJf9eTl8f+zD4QUGs4j1QqAqfoYgouJ39V'
+        'Sd9hkADQpNV1NpqrYzqNcM17mCdUAUNBxHIJZ8ncEfE0mvwp3LuVh5tBOSV74RqSJ52NxlXipqEf'
+        'ypDbT9ZqXRg0lcInJzGiPpOVCM1dwJzL9ovhcGoeZD8RXpSuLL6GHwKCKh0Nhj6v6Tpeop/+8LV6'
+        'IL9oWXd/c5KbizxJIN9aypB/ZLPQdghG48L8rYiob6BSG42HgKvG0ctA681ZzS4jTg6LXcugrxgI'
+        'P78fsm7yYkeBxYtdtEQghtR9Mdth4wa8sdMOgRMBnIHa4U9cjFTwXJ5+Ijg6iKv7Zs8ojnaaKeJO'
+        'FTRYa7q7NmQfnuZF7cws/3JcAy2GY+LbLD0szJVz9zULesyBYbLaKahL3F7clvmh5BZRWIzBR9bD'
+        'ht5fDes0XhRCpznYE16BUB1n9img05hSO12mdWBysEMjYh8PZ2fkiJi8AGbg84C6gxv/mfBqsvAv'
+        'OnhKSseve7HWnkaPDXmnuqfzJYNwcwJGlW3/9L2oxCnz3F2aHXIHcE8M6ZRh6DLLveKxCkRQqYBV'
+        '7QarTPl7qvwN/g2Y252InHrl6v8GxuldaBYAUKgfVc66cjizFzLp8l+8bSoXfcsN8LfccHaSlQy0'
+        'sa/a+FGDSp0vrkMmMgFyRC3KKtB9N3YLHsMdw0hHtQxUEbsc7CHOhuWJ35BL/GcFXqlpQvF4Q5ls'
+        'xVMvQG0CFJ/C7GCBbR2vY+UQu+xCWM6+KVpCuZyGYQV7ooSONOkSR1oII4cCMk1LnHLJ+l/M9piG'
+        '5KmuGUl0YRGFivnjYBmmPgAk3d1C601MEUFFTRoT/PM5Z5QWk7lCeLXx2KUgqwtTNhgn1QkXQgXP'
+        '+9iCKLSbnQdRYyzceU2Gli5cNg+VQi8NN1jmxtlC0t9LW1WJDI6eNT9eixFh3X+fApwLL+3QRWHs'
+        'c9Zb9lOJJUKN8mxEYWH1vGunAMuxF7hovDYhMucl6UDWD7x6cV4Es4E2jmWBP+BA3unlgh+/iS/9'
+        'NCBIJ0wIzlNxC9Z9oTMkRfSJOBYFdhzfpQ5EPeoBjFXFx7JMoKuQBIJTuL6eC0yIPRE6bmKEFETy'
+        'RV72bABQYj6jh1Tpou9OMnHL371+awIxDRGnFt+uFIkF2KQEKs95aYaY9vIyTQKeCLDNqv1W1WHt'
+        'gs1gfdMfptfGvZsTi2OpjOoByT0u6A789CUcNun1QOgk6IAzzvgWL+zOeX7ITxuFJHqU0PujHmXe'
+        'yI11UzjlC13rxiYZaQ/W20fsMoHRSKeNZeVf7wFAzRySh2fOSwg+MPN46iF+oj14sHQVT+LMo6yj'
+        'A6zXa8kgGuQ2Ko8J0X1nIakQZ7O5nc/RRF/wan+uJrVNkWCg7yz+pgjiZ3wdLnpumUyshoGyH1RN'
+        'NyYvdV0ai+bokDBDJOrygzdLIiRcHQiaktlscUi4PlQn5JbX7VsKpNnrWyNhdFRCEQMXZGUUCt7w'
+        'fldfhGjc/fh1plIXxomRybUjfiwT5Sr1eNRZH7PqkEbIcSAhFjLJvFpEIRZj/B9szQ9iosv4P593'
+        'X7hEr2sgudXXPdHNDcNykJsAvQ5XRtisKNYXq+PH2RvXtTF0ydpAkfedQfvDjVItVPp2PolVWadR'
+        'UibyLhqQRZnPn0qqCinN183LL1zBY9edjgrFAN2nJR8+tbJ3qbTNcgLcN+1ahCqdrOlWnyoNPBn8'
+        '50gcz/TmE1iGZZLTxhZ46krJsoCzocms2SOuEph2Z1G6AzF0JG4xp2QFT21pnF6yRgLPkRcBnqox'
+        'oREj5AVzoJ4GCiZ+aOqpGekI6W7BTswiCKUE7MD9XjJsIqbBz9sP4qmY80NwuLS98+F6rxlIU7zK'
+        'wYQvM5VVeNRh5l6UsVJML+oE24ewxtllgCySCV338LcVA4/AaVHNM5wkvaq8qXeLRIsUsSbUSJ96'
+        'B+zEvBhsWN28t/vBAXjPmuwODW1XlShFKjOoCddVUCskOG7Ceh4W2MoImMFsb6Pul0hOb5SrtYw1'
+        'TFgYmbgY0qU3APdI+i4jvJaGSshBNAnQ8PB7eh8dtcg8n1Q9ifpSXANF0tFwxddYrBfPkce3B6Lz'
+        'hYxjpFQN1KrOIMSoSw8K4W1wBOvfx10So8veb3iVCMOouO8zrDIKTGnKQdhHjQcFAVyw1m7TDFLo'
+        'zc3GxqYQCn70IDfIH1T+B0bpSRlvgQnAAfsfw5CyocJlRSz2SmfF7T3fxFvVoH6PZsY22TUYjV/K'
+        'KLzFn9hNOsMlh9da6Q28t2uaRiVDyhZDZ6h1TmgDEyZM5B8cdcgLZcY7me2A4AdPpv9gnhVkNRDj'
+        '2I9M/BxBpmsYIDpp9sObfZ4hlo7t1wvuRML8mjmIF/r/4Nj1ZRgXQd65B/047DRWiAUENH7hY8QF'
+        'gB9iRes1ZRX+73Mj0FK15f5hGMeVxRRc0TbaLhljuDoSBTJ2+WCSKHWbR+LX3ezLBb84F25+G70i'
+        'Jj/g9AKoF/pVhfG103e3efVsnBltWH57Hqd1ceDBmPCRn2BVrwk7XSPHeVjsjeTyex5keMJpGcGT'
+        'wrdI2F5QTll7ygQPqx3UU6WYMu2V5oxxlX6ce3Lv6gkmVoQ7lwtOtbA4yMJVKJKcF5GJ1ibcOM4C'
+        'vrKEWSQSw3kpk3g9rX340GXrmDtVZsWpJTYMvAK3Al7RaqbQuljbkB4RWqLZJA3/tUe67NCpo4zv'
+        'VcC4EbW8gCsL6uVYd2FwClggU3vCoAzUpquZkPvxEVCLL4grM/KQhxzGo1CwvU/NOC886HR955TD'
+        'ooK59jmFCsyXi7+u97ogJxo8Mp2VYt5MdoBe1mSy2DUH4LkXa1WNhT7LphXXOIH2vOUBAY9ZXdvp'
+        'JY9Wpz3TXI/hOjY5PD6GpqwlS0Q+221y/pZzt0lUncdynS1oCrqkroMAfnHsaGBi3uvQZ8Z2mCgB'
+        'AIyJuVBvY/c7edn/DYu7YU5AQzOPq4PvKmE2W7OpNEar6Nzsd9LxMLOO3zBqYMOphw6LtWCBQrik'
+        'HCnDgpYFBx17DbEpWa6eYlZCb7CN997gf6D9SBjWTSW0pn8Ef/IM168MFJM99oW2TJG5jddD67sV'
+        'dqFlvOM176zeNNZsDL0echB/1UXr6tWaUU5u9T7XrNQOpu6/G1u09wZ+1/w8gLpIRThzbpFnFZhv'
+        '/j8UZNOIF4FYL51+W7AJkYbE5FtmbEgHNXzFmFXCpVW8qhTXg4kup0+6Lqi0xGUSy36J9J4VaGH4'
+        'FPIK2dK9KVNMM7mikhPZDnjGZY87khlbZCdb1LlfqZX0WckYLVnHC8lswVIYXO5JU9EkIJt64hq9'
+        'ZAEm+XsXRzqTEeJYMtAdlTMpPKOBPhd6KBcgW70w6wgS5J6PF7FmmzgRc+woHqA6XlSaAdpgC8Sf'
+        'UqxdbJpvuERQxYE9xnEqExNxO/KZFI1kfEM9Kd6UkkMYyRMWzAungzaMviOIq7YDpInC4NnYukg8'
+        'UswkYgE02jLOI0c7Z4XRDE4hNwcvwnsvZjp4AkVtNS4nTxg/g/Gq6ruwSdz+COvUL3pSf/4/OEnG'
+        'omfeMnpYO2qSZqUgfecowd0bb5QLPLkhnBrxXxapsTytv0cYM2TMaRSqIXsgkOJOP1EIe6jfptZ0'
+        'qjhjnJOXe76CuoFE3PRnt2BmUP6TbECTQRrGQiet0XjwBMCpK1Jk2R4jm1GgLVkBudILUaPwUnVk'
+        'nTOuR/LyQQe4aGY4ksQlko5X1D6AO1hDP/Gmz0bL8uwoD0bxsRHLE+pm04uQg09kp2war4eXV1td'
+        'vOKSkNPdxfK/3IYZOKmBGJ13PNd30QiGTc50C2OMHNdbvKfgQJICsJ2J0vAv2jx44RP8bSaRiu9W'
+        'xf7bZodFw0bkj1sbI6Gs6N6z9Q+qJ9T4fmneyrxEpLCsHFNpo16UrALuv1Tr4Dmgvi1/ez15pqzN'
+        '+KRS/NZdkwv8RNhzmX5nwdcYwvRgqR3RyI3NSwua+rI1RstMPSF+UEGjhug3yqf1CSRP7EeiEk4L'
+        'qWDkM8a7QaJ373389a3nk5szjPaBPu/ZR+m3bs0ds+AcNErRL7oDqqqfLIBOWSlHXvYVDc9emaGa'
+        'oi/xwZ5KCFGDqTCY2PGiPIRwCtUJ80dBYr05513Jqod73cz0AHEXeMxe+r0X/yCCEGWcb1Z3pilq'
+        'q5zqXpo8xhhPzZvBURSrjMf6cJ8IY+2eoVl3/lPCBntQd1UZg0JVL07gEm0o1+GBGghT6YUT39db'
+        'EKjY6vT94GMCGmiTO8uzLGO8DYszo9O27E55PSAEgiRy7Yivjf+sfp0sQTSZ+FwQQA5aY9ob/KPa'
+        'GDGHkeyFYyHqqgmoDVBSLmRIyjwn8kT7vYI9T154IkjF+7EeUQTKu9Li7nZp2dPgKlGyGPybV5MS'
+        'KAU6oubOU1FHdKksKfZGb1Bo4RsmoeoGQ1t2CTPzMEalV/QOS70Fq+O2niX55pR7qgpea4KgPIYh'
+        'Fj4RWR1BnP3i6yltXJWqFk2yatkJjpZKjKFTNmXh/si3M78ewqhtBOcUsmVxLve06okgfb8bjFAi'
+        'SP6NCRPClqQA+HCQipq8i26YJ7iMZS58hTZq945DwgE4N76IyjcAK/0aJPY9AMv6M8Klu4d4AW4m'
+        'GFMe033yKkLESBYZFOhRF8BUua2maxPw54+mAnGKQi7zlnughgja2+yfeqE/0yjc6L9sBsIL2DJW'
+        '0vzLLi7qeCl/tIbp/q4CQbikc4BY4uFEnwadS9CMCTxmPs7k153mop5ExrpSFNdf/flLvfFMscvI'
+        '4wYwhKRkJNdi2+EY99tsJ8ZYU4ip29FLkYM8oP+8PF7wjrewVBj7oRrf5euPixcur1oOzdAdFUAt'
+        'kulWbF8X+08OPNCT55C6/zNlA9wQszuxtk5Cte6GpC99hLxJIT0m9vpcgrLdv1hzHfO3c+Ay3GXX'
+        'f2xBXpY8P/3tc3ph/k9yiPAFQEHbtYc+huHHF1JOP/TO3H0mlxtg2hsK+ujBC6/kswFGOGGtIhqK'
+        'MNGgfUadVJrn8LO9okyhZ7btKT2on0JkfQUvAjIqssyZ9ZCCvKmDbVlQfvYMNutFxyLhcFwC+cjR'
+        'wv55jVJFtxOP3azVV06OWQqOaeIjhMekpxapIopaZuHnNTwtUqE2gE/dlv/wRRoGiM4qIpzzZE7Z'
+        'eJMV6Li/Wuea/DGKFpUlAyO29uU1vRyQoQrGK8f8DXsTo/s/dcB3RPCk9FJ3BYhoDLxxyhp2moAm'
+        'jATlllTQ5+3GcVOXXYDpEixlr+yS6Wfd8cwDAobFzgHVOWHPEie5GDuiJ4MFIItWIkf88FHeL+ni'
+        'J3O1/4cpQ+4bjPtaPfWuW8T3JF2hBkt+RuN0RoRK3ygjfMdWZz28n3LU8YQPrSq1Ys+nvaGYfY1B'
+        'iomsXac52Z83zPWP2m6JnFV8ncAUjeueDIrXzDM38zFqDetJrlCQ/P0TZtlSZLLSZ4VIEne/yWck'
+        'k+iumShtnkI67EVARgD2icg1tbKEIhZ5zSjaRxtubgtskMGqFiRot0WwegmqokM0tSZETK0giMoD'
+        's18ZQSyMlKVJdag/cDIu1GpQx+vgz72cFh+crSprvW8u/JY6ESvJop04pG257xI7re0tWUMpxoTy'
+        'xAusLXzxxH8q9AOMAONkbkIRHgTjS21YTrUTLhIRqUllQTVji9aNHU4XqTUvjm7L+cMd5KhX9Cg1'
+        '4HZbH1VYmpjSL8+3R4RhQ00oStw+HwzEoGedHkn8qWcQLVlyTgT2v61dQqUz3jxdjWjc9+qElEy5'
+        'o95MDxVel1qgy+Q6mL5fnOTfNzP625wC1wpE4bb/RxywkDi+eR9qxYkaUQjxUIeWu+rYfw5sjo0A'
+        'L7YJaD7TGPsOiOYnTypnEfehyAQBbgAUbdvWJ11j5iRaAfEgDV4pUQTciwLwUgSb2uATQ8+NVewZ'
+        'u2jyVmGHaoWx18+KSaBnhGYOyHiEYPmF8kJYKP4tDYtmNHr53oOj1TdzisYLwqhUEGBkEh3iathk'
+        'Fy014my1FgYJcilE/CWVOdOWNS3GLqQa70ll8snscludZ3neh5BRLI7Z3wLcc+18C4iWac/cJlrJ'
+        'prZ2fUt7jRkU30IbiWPZ3em1QDLXQ961Kz3J6jY0NZGlZC5/D2sb3Xik3osiD8cKQzV4lRc/o77U'
+        'UUHF5RVj/t0I+GKE2Qgz/++6x99kDO8zsSTcI8tj+uGirhd8+MWqy9FwZ0kMWycl6DVcrh/XXPcD'
+        'kC7kCLptehfLrSV4ewpHDBfByxWxZeyXz1kdujBozgUGNR4o8mImqbOguftQ+MEEwsvle0jnc8Mb'
+        'ESVK6Yvgdm/gdraXKBAH7UXxM/QgLTnp/dpeN8MS4xLdxaBk5q+OBKVhAywCoDr2u7lTHhvESdV2'
+        'ULryLKn0YYpTHJQHZkJEMmTVaF8JCBtHSC5jZyTE/4EQ3UJfBQJUEoA7IHuI50o9K+KBqAHCsb3A'
+        'C8YUj5LIg3zIL2pIIMpoqpDmxwld4B2iVdh5KnRT7HfSp6Xgex8tBlSv1cOQdIEqukJ2QI/mlzu5'
+        'Swh0WUp3mExxAWjBjdSR6ixv9mgBavly3ip0n4uypqVBR9f0V/NzMHrqBGbyyOBHeP8LLIRIplGt'
+        '3mDc4eFndFhx0rzVrwt4xgfGBNCf05i7AXJKl50g1RQRDTAbqlhLQixasXhS1hyeszSA+FlR63ET'
+        '34VdtreJsTnLFsPr50Cvtgop63S73JZ8tVzGjYhKtwY/V5t53HjCf+bsARNM7mU1yBWyiuNMMcNN'
+        'HGFVhw5gdTfN1iDbvJn50ykJSsu4Pd687jXhs7+Gezl8BOpYlKyg3yZnVmpIneN3H5qtTLyr8J6h'
+        'Un0D7KTyuDzmWmVAzqDLJtOiJfwZYuT0aPqNVCAuCKfyiJGzqcZ29steWrM+YuHQzPqyzrymIDkw'
+        'X1mnuxenbOdfOT1wPTz1pj0hZluF0dE1bwqE6DUOlnu3ILcPTIVKuFmKBHTatzjpYKaO+FdMQAlL'
+        'DEt3s9zONw+98hb62go7eWPjJ9Wf6Ch4Ew3lhDYl3cb10THyk/0YrB04/QDLeLceHVcUna/rPn94'
+        'cST9xUiFdUq0ncZGLoaYto7mTXFFly5Sx40Dew5ryCOEWiW1F1d0jUitkjwOAX5b8jiDMTK7lrRN'
+        'KBtJBSj2YPjDUBriqW1+UUBReUonAQgIOEjbNoCAAWVkIetEUQo2OohHVsA+AWR2kytJAlDFXRZp'
+        'HJfH57+QDw7lt46kPw1u8z8Mw9H5OzxDZqvE6fUULzYjcQ4tc4hHncDwmiGN7ACmAzer+FrqBZ0r'
+        'oVyJ0CiyepNJiAdarHvWoniWSyGSmwUXpJi4053KcOwIggsUh84wfs7ZQSX4O09eupEsWXGWY9Jt'
+        'zjz7n/BzVPY+TkraDo9/zMDqCQLNXc1VIelW+km0eIZ9PGyH1GApnVzip1c3fTFI910/8RYYg0EZ'
+        '18r5DTMYi8R9Y+sTCyU/0UyMbtjEU74yC3zNjeqTjUbvKTXSa4qVYS1HJSwIg1isNPNynKABrFSP'
+        'cyguMWMX4896/KFr7TnFauemGQapYj9YlsCGG1lfwrK/cTEH1AXW6bQJmsi8fZiPm/WmqA8XjnEa'
+        'p+CTq6tz9OAcJRli4y7NvVU8KENigpSrewD907GBe165dokInhYyfKO62FPVBfw4S4zk3+z/XWdy'
+        'qqbc6RxxXfhzUAACF1PRWP3nrZntuGCo2S84YK4jmrk7D3CwvF0d5tMBCWwfBPOJj0e3b/2kMf60'
+        'F2ogqPJbluI3Eb4MciSmPhDNN5aJX/qbJmRs1Fx+o85NAGWq3az0lcQMszVyAwnghe2MW8PB468t'
+        '4h5zTRYxKbWqBEBxAPDjMkEgE8n15d7kF+XCf3Za/qGvNGTPtk2LNmRzFzWrFZb55tMyQulYxErY'
+        '0Ll+PJoqEk3kwbd30ctMSNEmAj7WtcqYKIOMijvDQgxGiZMxhdjRH5voCGT+V7yxc+aAKyPy/UxD'
+        '3Kih3rQ5X/yHHuulVtU2Bu0k9gB32R3GfjF+1SrICdA0D5biq3X14D70CXxNcsU22ltSESwjZxso'
+        '+dm2fqEREJSqQwtHfcg7Z9LouW0XMwi8EVpJaXEwgAg8SlGsijOKxvppQwgTXHrFEuttts9M4INP'
+        '6kID2N46oaQwYTECUk0I34yK2C8M8SUVmaDVeNBPit7v4UOOljcDMSM7qh4+7AS0fXLAU7jh4UOj'
+        'AqodnpYZXCopnhrxMbq5xBwPpHBq4r6SRv9cEQh7fzLwQkhv/6RHCK38lTqWCba4aaI9hQYPy06Z'
+        'ZCyHDAAgZaU1GZDCzDi/mX0O24pHAJxh1a+mPuW5KvhKaVzmzXDEfeNLH9dFbL5tm8dLHenqjjiN'
+        'XoC6p2S/UKCjBTn1qMDOEju6ek+k3jhQGxMASrqdBPDv1CTOeruNjRa7yTNoCoGAE3j790RBmy+E'
+        'YN0YKqmuASgKeXpwxaPI4l8W/YQKYYgr2sXiqAIS1GnMkgG+lETdTBwLfBgNBsx3IzQwqW6cmF4C'
+        '3uY+48KbAH+DcZrYz6nr3v1szC0PYuIJ9gaIQy9XTv4lAQtXuE06X6o+ZE9CXzN1dr9elEdXHTo9'
+        'YingoA5kZlnjyyeI2i2d13g1adAoCTUTRO58FHh7Bqvm/n6Wqjz2V2VGloALQ2B2P3wwo67uZjIz'
+        '2r5WVRGpllDu3Z9ALAVXhjuE1SmPaRb2RqSpKoyQ+ZNIv+GGLOuQo6H0bpdp4320YSNGLJIpwSMO'
+        'xpH5AGzoIFlgX0fyKk5gxsaG+wYY7s1QerZHCBNnM4zOQRivJ4njcBYbbVBQQT8P/EwX2SCmx6nw'
+        'JHjtTK8i18vr0TJ9CQgFQzosWlYqArkUoUl1TOyTqeOjToqhNSausXPrB5fMbNUDscj6VsO936mN'
+        'zTRi31Eryqw509YHV1kbANfAI83P/LnNQEoARxr1aFTZUIYK4a3aY0Mg/YasUafXByZWeT1Xom30'
+        'fy+dXPS7pQSqVjzDHSNzFCrMW08PrPPjzYH2hAxc5+xP+OsjRDza/zToDOBGK0atIh+wWrsOEvmN'
+        'lyAF0j2DFQuSyNgBr3dZBfSTm9HvnC+sDBdPuaP3Rux2IIOmZaiCvsw7PR1CjeoAMwN5IFNdH4Yn'
+        '8XAuqkZY1CJbrXwz+01L/A5CmO848Lr87qM2zmLuqTIKcMT0Fc/mgQAolMFu1OuwUQjo+ymFiI/1'
+        'WClg29zOJreQloSNDpeEH2f/N3lWRDmg5kQr9tZKXDns+YvtlURr8kslrF19S30PMOHQ67cZ6tXt'
+        '9sI6HbEWidEFP+XjNkNs7UZViTJXSSuneXcbr3p5JZveJJNeHNzS5Voyl7mQzxhlKYXCALvrJat/'
+        'ENcbeWhiXi+tsucA8lgtnM2beTUXtb/d8Jk6gIBLJ/yEe0M5bHIKEGAimJa/xpstVzSnOUxrkPp3'
+        'ZhkNOps+DU7uoM+oRJ816jnhAuyU6jG5M6/sU0/U9w9scTQpqux5gIqRj/ijEb8OZ3ACD3tJxWFx'
+        'EQReJNjTPoKU8JSyMYixfUM29+ZIoz1Ym1YOKPVgXqd682/71ukRYUj/2upjIAk4c/gCrb5hizS9'
+        '5d/YdQ6eXiG07uP+hNklL4MVUEe7F44tBb0cYqUay/gC6BLFX8z3XX7JaEoTZqcdmYOKrUp01exI'
+        '42/pM7OT4jnlxZbjy6EozTo6uFW1ZMpy+RZrtUjJq2ENRAA37W2SssWKFggB628MNBfCJMdbQMy8'
+        '5IxJKDPBZ6vSmnP0T7C0cLFTmdUmGH0EOZNKvGpnCLlxx5GQOYOarQgaaSk1c6sfUJ06PjnEKpME'
+        'AVTP3WcqwgnEW8CeH0g8PhftF06PXCGCq4NFKcTKlM7GE569/cKLpHlSNNwRzDtl2quXfF6gcPOP'
+        'StjvomlVuPLLx+7pmux0j9lTqJ5VUKS3SsnqES6HbJs4bUQw7JOMD3Lhm3uodl3/8EC2KZAPAaUh'
+        'V1FvmcFfZblnKXGyEossPygUHPEdY2eRg5VybO16fK15Ig6RaB4NAp6hx3X3mG3go4ZoSrCCaENK'
+        'LudFNJlEBG1Eq8aa+czmCjVhDu2MaP7Kdg2gssxDr6uPLfZgxwQacOOIBU+AruyCnoMvnC8PWN+7'
+        '0wGmhPQk58i/dp8Y5wn1ai19Iao9SQ2my5wNSA/Q9W/JgC1LrAXrYBqEa5thFes3KkTYtccnHMYm'
+        'TJjUSYdwfGG0k9KOEkofiuZNU4cVI9EZEP81w9pgxBhHL7NaBGYLCCiKupyOQgczs9TDYwMPwXTs'
+        'gZH0V3jnbfwGpklVlTx4JXpXB7uzNZ1BJNLmngavhKCRX0pdX/FPW9F61QOuqJ0lUJNaOKL/H6WL'
+        '4tL8YDSW0+3xbN+EkdOT+zRz/+wLqYMAIt1wNGhtv6U1W1w+UgbpRNPaSHb/RuFHz5iCu2plaDF+'
+        '9OXwpYeekESIjegIfMo8qYl4NXr70KBKgJn1ryQNA0N2M6qiWs1Ajy198LQBRjT+GSbkdxyGxKi2'
+        'iH9EK+h1Nl5djI9JwypXhSYzj10RIwcZigLMZ6o49kpv64OJCiZMacFdJn9TCnHvWi8NVgzO6WOk'
+        'LbMdb5HJxmWcIFKJu20FY3R3PwVCFH6v3BJ7sAc6GPRcDKNdMeJzQFJ66+VCEgX2brqHBhJPvqIE'
+        'Dok+Tja9KyFIdqcbHY0S7+9zV3M+XqvY4zRgD+3G54CH1+oLWRZbz2rVaea9exEhBPEcFSYm7mM7'
+        '1ztXZrGJlRdlTmqkIjoRGEFN3MdIDrgUZGQh0KlSptOsSyHh5WNJRuOY1KHOxr/W7/F1/5K/MUS+'
+        'unrILxnhaYFSo/9y3vtTu9LXgUFJPQZJMsXJqkDO/3hxGi2qcXtr+xAj3it+y+t33IvAgBKcwePK'
+        'rXjQaD+kloCOFd0hdi2Bi91zmtwCaUxSfB8K4euxtcFl2DuttexuicgA3p+nqp9NYXMiLEz7GunR'
+        'qbcd2pONcjddy544EiEkJV4qPlos41KUIfHL5I7wshcrXDVeJ78CNaWC3zYiBmJJqA0HFVdH9elL'
+        'kzsd0xAYsMRkPFEshskcFby5F+yt4eHTbyJts6jvXoEZSczXxYSAiLokKan0O8BkBKCNX+MXTs+P'
+        'nDbYQbu1YoiQ0t9FxSnvs94aWjq99V8M9+POuqHPn/ghD2GHClCbW2o6CnubBRki8SDGNPWfU5Ev'
+        'nn9SwwAT1RSJYV91HtkhrZqgVIDttj2wyXH6xTW5iJ/scKseMTM04THYv9ZCRSnc7wIlL2KL2KWr'
+        'x5g+TFvi88A3qUATrY+7qWlX46aiq0OrcCReYqZ7FD2Xq31en68ejA9s6SAZBDmJBKJCRiIk//Gn'
+        'fFn59xofwJQ8rQ0CRDxT78sjweAw8WLdhKl4yvg2wW269TWX9NIWWbYx0qIgp47kLjL7LOLyKjl+'
+        'Tk/DHFTeMNyjSoAe2Kvv9Elp29OEaFN/Ltzar3LoOCWzEWIvb45Vt/qlZW2bNLiRs/xmuqdr63ua'
+        'GxMdyuUy5XBGo07HVgKN2oe4hCyz3/wML2SvKKVY2kzG8MNrBE1ApJiiRP+gdnLtLh0NkqSJQixm'
+        'I86euqbZ1ga+qLBjtLGs6Kzc1UF+WIv6NrDDSJKb7g2JcSL2DBf2s1dQDOX907JX62cJXzB7bbpP'
+        'ls9WljKQxGwShW2eoLwFjyRwDlw76xO+JxXSgY77dTIQ93QgOVUB7gIRWaWJAiXTyhSMhePepf4X'
+        'SOjbBKGWJcQvieMUjvGcSOo1FckjnedB6tvmS1LN5teEQhmsmOpHJybBwDp09saCHN4B1+BrDV86'
+        'zJcLEITQHr9ZtyEhoFUeKTsAQDSGupUvQCyOgKVEZ2gUZ3VoBzUEcV7ViSm/MWn/letRx4ipNdSg'
+        '2sEmo2Eh+CISYVEqZPAbE7UysnTAYftirSkLRElzEBr7NznYQfzMTy03ToM+WKcOkuhdlAHwl1H2'
+        'PiPCNZGeqh3PZmn8O15LvQh/lU2LiT/X8qN2LdnV1waEJKztMEQVY8f522l3329IUd4Y3Wd//SZa'
+        'c3eKw+UebYtjZna9W97RetaGYlC5CdEQsDcTyoj7rkN9rjkXs/QdB9Spk3EweJdbbArOtUbAqzO/'
+        'zkd0RSSY78aIWWTz1kTatu+zHaMtjHrHO1EGXGCxxB194gYD95uDXgct1hJxkF14mNMPeAgidnJg'
+        '651ahFynl8CjcRVYeT7AIV4JhK2Ro2NRRhEgtHP9AIoo6qDr6drjiR0OJin97ckU8pgfTGDwmhYC'
+        '/tWlD3dEhmGv+xqRPzKKVr0v6OLWe0wAuwgWBQIkjypnG+HWLBn+KMk5H7/3uu8Gw9gjGuWmlrHA'
+        'bfif4rAJo06fCBNRfZBu8Ps2Bb8sxuwzmv/yQ6bX7xo/VA3ny5kfzWr8+3sWuNvYUfOhHLjluv8b'
+        'yWx70ZBllc5FqTsocTxOZRmTvXJhySSZ/FG2x5Ut0syRvIInkyYIEuSLslduhtte5SNuKch2YhAM'
+        'iwJrJ1vot8AV2uCHLh/AZP3Lcf+8Np8zcDw5XViFvWyABNDTO4A6zDTzF7J5MJFmpT6OuI2YO6lV'
+        'pSmpC/XZjXNy7zWv28m8cLjS4LxzsUnpaQXNmy+v5h3iV3iOYBKxmUXVRAWMdQvp0QNDx1GIQqEH'
+        'mBINTpXBlPodc/gueCeIkC/oP50keOYhf0AnBxOpBpwvLK+XOj9MPE92IEpIJvgDODZhxjYeMU9L'
+        'iju7z0JClndY/hwxzeZqsgB3n8wJEkkfF8jnU3lMeNVgojMeimtUo2j957hZIvT7EHdGVdDtFGOa'
+        'kj2GCtLPvHnORdwsSHzQrk3yQNVeID4qYdc2d+Qi0f7EYpWFqG0g1ZjXy+p386szKU0hHQXBU309'
+        'KSPDS/ypAau9RmFQ3Tq1dLJSMCvMqegMVyyUnwk35ZauALeKEpFyIC1Ca876lpQZOP2W1WfdwqL1'
+        '9J+3hESvQIcbB1RYBrchT2CioVgSYyjt2LTDQ4/RQDR/W7n0RKIpQdyHdQDv2k46pOgvtuipdbgU'
+        'DhLtqRrwoERAYxgEP9NqUoQC6Qm+Vntv3zLdONHarEOdnGXuEQnBlwLQORdYSeBcfL+SUgMMNAQH'
+        'OopCi47In6YbWFjEnLgTQ2Rxz7Rl/6gsNyKHMXqU9rTRWAEaZrHJfnnH9tYHeRx+Ru6hF9FBZR10'
+        'EpyOF7bpHpZCKPyZJ4/mHoSCiO6ugxMdZdPhW37nFmnd0lpzINj/eYzWw1voJzuvL3z5iQbdNmoX'
+        '9Z8J7YBou1z4zDZDvFkfAvhSrtCciHfyXo4NHVo59KdArX/1Wr6eiqvVYxZwJ1NwrCYVo+4l29e6'
+        'AeNmCNoNM5YcBeMVGg1DmMn653U5llWEeMmsK68B5iEc5a5vCOY4Nfzvrth6t1uqmLI47xoLotnt'
+        'sUFMdNySZgxAmUCTU+Nz1MAh0GS/jgnJxhzxco2A5Yhvw7R2AY56n3N1gkd6/PX9f7jo3BE98GeX'
+        'anoBCNkv6qFZVRU9u/Sub3hhvkv6xgT0ipph8qMvfsVn2l9YWPKmBqU1n5u3I5E1GEnGbMSbZv9U'
+        '7/2p04Cmoqkd785jbczGDRZ2bi3s+NBqgZgGk8XNurzK3BX6HlpR7pEH4KhMqZHGq+Wx6g0qKD2g'
+        'E5nmfpXFrbmxJnC5OhGGmlKM3nwkovwC4nafVIKMSA2ccs0iFms29aX8p/CUQHWya8P9uNtztpQM'
+        '2fw1pIDdNomqg3NFZoPXuB2MTOcuVByJYVNStAtj8IJGqnaMIr7QycOw5ydRLpSLPpastHVeR8cq'
+        '7LR0o8bGwDjPHKoh3Btf1xFXMTvpSPJeEwp8PNrwJKxiEOYj/4yMIb9LZS1E+983fvWjYPLOCB2R'
+        '3pqmVb/vha4A8N6KNyn+n53dOissx8wTtbGztctWUInNDLFHOJqZp3nJ/SXoM9eghhFkuGYd7hc2'
+        'XoeywtZOYQfjeV41qLs9EnwbgTMV9pp7JCRE9dRW/K25GntdUNTcqsyC/iZAkR/wJ7Z3g5BbApwQ'
+        'JO7TgKNU2kyUnSx7BP9SbwWB5G0ttV8w/I1WmiapajNt9a00q4vbEnnQo8m0P2MGTnC11fnr9lN5'
+        'OtTLiqMO7N+Uq0L8ko/5YQASOY3++m96MgE3Pue9jj98NEvjyt48YcvJ/OWfCkcCJQ4EszCObxok'
+        'zHixT1XwD7x9gFkuZPulqCL+yupCb/p37YkulLYq7ZXoMNQiBmiSfV7uZrx6bs16uMqzg2DkcD6B'
+        'qUTSCZbxDZF2mGngyuNMZ+QMUCgGg2t1sOgjprsKlCXTmAzhL9bRI1EeNfGajdyrxxZVkBWGltAN'
+        'L2ucb4U3UQZ4lWdxoBkv2i9B9RfRJqZAstj/A6xUr42T6fVlSQTl4m4qSIB1P2NGrCgCdKKqvu/S'
+        'kWchthrW0wD9pMN0lakib6giXELbaji8CyfE13H8WufuOi1AFbu0igQH0bv8M3zMsxQ40trym0YN'
+        'PhUTSs5yydLG7utDJkOxN87CSs2jjuIC6x8tgabZdUiq/3R8SPkg6j5mjFdBJxBjr93VzseYzIHx'
+        '2HrGN7kJOmjUzjsmSOaiKg9bzAOTG5MPUBOM5A168keKvfxgDyU2FI9DVrIok9tRAaby1wdRx6Im'
+        '3GvN62QUSNInn7OgKMiEa2MnryYFIPUHGDVCSNVi5nmWDtwkz+Y2y9EX2u0jqQ7FFzqgRwunYHa8'
+        'bIDPdeya/m+j/B0Rd8pVvdVZby5dCWqZ3aLiEzoX/xb0hLf5LDL/YT1GtoCg5a+yv8ssv7ELHXw+'
+        'v/o8ZEMT7uO3u630gS2u1axTzosUb0B3/3yA0jo2RWuQCFECORn6vYreb4ItGlUVLDBXuEAqQBpx'
+        'JukjTZwqixWeuXbkgGHF+gVyQMm9udYALv9hUa6fcTjoaDTF3VBXb3BEdFTku4w4cr7X3cKFuuo6'
+        '+vz1x5C8FzToTVSf1+jr4gTYm/C7qn3kYWkSW23ghMWNKa0U8Msx3/0NJpqqS2tuH3IBpVsB5F8u'
+        'OkS/SSiXhgBYJAgarAaOMM/1ZdBNeNtKvywp8PUMtr+nyTNuHbYZh3utfupVONHDlxLHFKLgcO5k'
+        'Vz/83VhJvSmyjNQ2oY5eV1+iH/ex2WI5Knp+rwb2zlft1HWmL3W/kpn6DY26HgYhqP7sq/9cgbIj'
+        '93ib8kYfSfzDAUIRqCzDruyIb/gd6YAzB8uFhv70xEHtXNM/v4w+DZ8EXkBuOQ3FkqzzVKJJm3Hl'
+        'b6EJLBCx3aw3JCaufpdW8eSja5H61UeN3lHotEPwaZ1TsuQ6tdaUG+Ay9QS7H4hhiq2xwQXCZbtm'
+        '3DWJNd7BWN3PvfzIt/AOTdVOlxYzcAgfU5DeF9b3W4v4r5p/uXaT7vRJoIwBCk+I2TnVQGNLPfYZ'
+        'ss+uB5rUiL1Z2nQXp6MHTFpHcIkdRv2Rf9lk6di1qU18PX20dDCc5lf/mESvI473qxqyrrPynish'
+        'qkpze92ddvP7MxHKlto9ho2Mc3ZbIeo+xhsEHPm+wkZ8CN3+WPkCIVYEP4nHZrzBlQ3OM5ZbbXbv'
+        'OwNkOdf2oxM8M8LdXNvsLXM4DlGUv/+mNjACZ5Tmw5bN2NkDlE3fyQPn8nkxPWgRt7l++Zlc5c8K'
+        'b1MZk8c15RB6aaykEA1xOh337OmhPyp2JMUcfXh0YafM2Ul9b/rXQsKkZ9moqKs8gu9kj+taYRkc'
+        'mEIrv6uzi2joFcTlrYdF2Lm1ztwJkQ+ShXjMe0FtzleCH2PLMamgs9B4HsW2IXb0l6edrZbsn6vS'
+        'uqZi0N0WCbo8qxvd+hdu1lhXdcUugtSrpFbBv/8UBcuslO2w1WLyxcYVpIbwZ9sbO5PvR+LzvoQ1'
+        'dcb7LeqaHHNHQMd8E3MsqJvSCaen2MnTKtPThI7YeM0eHsaJDi2ZvyIbjGDM5exB2LNcb0Spxx7d'
+        'Hsq0Wo+TV+yiIrVZD+ohUhIZu0BtX/JOvXlwsY8hfLMoc8g19yz4AVxD3v9EDralj4GXYjGHZlQN'
+        '7WNeiSGn7VTI3tMjDFeKDMg/HXbjcu9/1VaNorivdLO54/J6rVBiu2H2EkR87UxrkTygz4XkvPnU'
+        '+uz/ziswqN2xIBngg9E/sJYlr/8MqaF5UOElbQMrAEBtY93u3hmKHk/hutFLrZcroI3VhIx0+7Ht'
+        'vOSGAwslIyOTLlppKmuuPfk/z3yNu4b8jQCVKC/ldgjurzhmwH35vx2UO1Fqi+O1+9qIiO4dCBU3'
+        'B1mI8eeg6Hbgf51geFFGfg9hMyzZfErmMcuc6gTcWgBFpin2u/4DNUFnd8Ld209r/7tDNeFe5Q92'
+        '2fz9d8/VDhXcM5vmZjnjBycE2LaBvf5yQ/dtKJxilzbHIFe48xCNHiBH07r2RsV0HXJy0zEVzqAU'
+        'z66GH0hj71FClLOpyP0zh3F0RoBVYQ5F57Kj1fLp/QgEB27IDB8GEVaSXtzXHN8k9KRHU4cKPlEu'
+        'h4qIo8eH6epXAqaBHhuGiBxiKZ4NHt9IJjAW2vbrFF2ftwBuAtkCRApjSTvMAtylKmtCrtuPywZe'
+        'wXqXDJj26ziZuCdKcgRxcrEzAWC+13njnwhpsbbYANGedso8Qkg9nx0xy8foQgG3C/U7W8++xGAH'
+        'PDJdHp7S+L4QaxVSAm+3HO7ABs6/6CLx2MsmIAURlvRuNf2/UU9spFHM/fOebZKYyXKkqZXw8dfh'
+        'GVtNEnmRcMnRn0YKDwsUkfpr+oI4/aoloTcHBgkNE+xF8zxKdf6b/2avBaWWT75c36AuP0VaSUui'
+        'uSzOSkylftxpSxb4OKmk/wHjsEWHglr1Ui/uMrayM9WY3oKrjSNIAY/yIHnUrlITcIkOiYbNxFmK'
+        'v/4LTg42TVzuy6eUP7O07svc347BQ9O7zhl+s43o1dnGnxl6yJ8Z/rWKwpkp+cqTBxAcV+PsZKZf'
+        'O7vnerN1XiWP0KNOtocGBe9fechL/7UdY6xrxzaiYVrCgKIlSwlQI/hV0Heu92oKmdsCmy7H3/Hk'
+        'MVr8/fO4zCOUN0bpaqWgLVI2VjUAL3awMUnk8Py6lmx9fnONZskbkw9J7I+TrjXt7eeX7+mll7K1'
+        '5k1Zk+16wyqv4W2amHCtt/eI/6fALrDh6iOi+dRLnfSCtDUmkbbfyHHUUM4KSH47Z+ngl6mN7flj'
+        'wTauUc++q3da2LSKNwFnHSSAP6JIk4EXwz/QHFSQCAKg9BJIyJxR1z4uyKm/qYEkv1OAcQp+RDye'
+        '7CRWjld6bwTFh/VZlehb04mfefKgWKv+NR3odw8Vtgm+SS516zsfxr+k26eDd5vGNff59VjWXf7f'
+        'bONaFkciVZuMDlbsoZNP8QqZzPDi5O01F2lYKgnfBTpYmSRuUz0sK8/lfMjhcN3CNunKPGJyUFiH'
+        'fRxxHtJe5Lz+f4p9PLWWceTKJi9rK9pepF4RsuOfYhp3lsluoV7rvDgrxX6GDRXKzq4drosO3UPh'
+        'GXG7ivxhqKg75k1XRJYaAE8onfVHRv3PTylsoz3ppqMKDDdDkRrPewG0D9sTbz8eLlv64KC8+1TO'
+        'nEcPHzg1Eq2QYyFWDGYTz9MzYjN79+fC7X7/o2f1Akp0gqWcLIPGVmCQtUsHgXC8L8UzEEDIwvlB'
+        'wxF1Bm2X7wDrZsJ7TF0obnIH++pcNbo+h8pMGq5baFtKqFN2s1HwVdQRtk2Vo0mi08ZMhWuL2ZCa'
+        'aTvlCIOdUQbDn++nVN78VGrifWDYmCLfFVIiPSX+vyw0x1YWfGLCeA+x0KCmlt9dm2ANhncPkNKu'
+        '1fvtITg3EtiDKCsr53tDqLyDUkcDW+gh5s2O1BhfUf/e64uxUVMpD+uOy19iSVP5juHgTGy64u6g'
+        'FdKNVutY81J6CgN2nGjj8+UbgvbAif8lWBBFEml/FzqLS6JLhS6N6Y1f6JyaQ1YCmgGukciyvXFV'
+        'gLskNs0197doU+pX0g8gEDnHDlSxR197PZctjUHhcUbEkab+rRvWqVM64lZQ/AaxyVJFc1zZrcpr'
+        '9Xgw4vuMDBuprWeeXBE4mb72e7B4n1TUIpU7LngwLjpYPNjLQVxvMcu1xsXrUsbV9hOep3NIhbEo'
+        'sMft713iV4rCz/1nmVDsnEKHVT+gdzpHVoOqo/x4gBqaR1dAL6bWYbTq5n7RKTmIOFfTtTA05Uww'
+        'V3MtTnDgojLOqlI1C1nJ1Ljefo4cggd7OawYO6wYV+MSxLNhuRYMUb+KzS7dGtqPs18aUwvwAi5l'
+        'SalyCGUuTnWrhojx6kIsAcCSw9fYkz7L1knjsJtCzQkQ6jAPaAc/CbgzrhTPVN74XMS6j1rOQJm5'
+        'lGpwKAtNd8B/XtLnTDcyS66uh/VM6qB8BLJcX6F5LWMbUR1g9IAUilz37Mq1PrBZxv3I75ecd2ON'
+        'ReriB5/tivIS9hSAdEkFUqxO3YfMq2VV7IIT3titGxozTY0aJFEq5ch09zcvm5kd6LdDAJ6ESZm2'
+        'slS+Bum8RjflOaIgF+6CrvK9P+6rs+I5V8M4ONbaGXiUtcDLjHkLQAzF7C66XkHA12AwcJmM6AEz'
+        'tlRv8A+d6wrXXCHf1BfWgXOrlIiwiRqTP+5M3O43244p2sWXZCvcJogSuN469NuStWU9hAZlkJwS'
+        'iHHPUZJxsPbFwnSsgM4cntRVE996Ulka2/Yc3pxU8ScDyjJ3roXuakot6q0dgT1tlz7FWTMEXcqI'
+        'gccjSvKDbjZSzLBsa3inslCw531LyBk9hDEdUYaB1vxDQyOxQTyWj3t1j7PxJitZ4STlc8jpe+wW'
+        'mZQJziHnT8bFk1MmoMWsJL53pIO4Yuh/1jlgi0FVTz6iQ9ssAMr+mc2MiDOgwdvDS03/dNQmLTx6'
+        '2tiLCx9PrKbz9zzkAWp35/5KQNQwnexh31M6aLRzBynQl9KxvB87mhf0T/WNMUCsAG768KcPGMz4'
+        'Se+cDTpO2w+eMAOIhIW0UUuvyyGVObvZ0hLG20FiRnREl9/6l1IUOtHwFiW2CEOYuBQ9XRggMun/'
+        'sAYCcMYJVa7NDNKGCDrXhEZSnnDA+h/uh6ELXM9PStuiZtDYe4wVgUG5ySLJfhQyl9ZzoQw8yzUD'
+        'XrAGK+ClAmnY6T0WVMp4sNjfzvCAajLBW439Kvy7V8PwfoZclfp51h5w9u/MZb6yJDApxXLG+A8q'
+        'FShl60BKtO0aSqxvJmSbMplz0L+kGJmUqpRwLiqapz4zkawA3bEI7bxs/gLsxIJGPL8j+04N4i61'
+        '8ECrblcJYn654d4QnvoYBJktJ512QkBFI6S3Tbks+U7VVhTs+y/jve2yozIpPZG8o/RtEmupuUk1'
+        'ayTSoOP2SP19O3FDrVw0JCOCAXxtU+NjhkKOVJyGU5Hg8+w5p4TBcyJ+Hs3seUQZfWx+0ME0SgTl'
+        'UX1gN2hYH/lOUkIVW0XPGSyMzVW8K9d0da9ZuJveHriSXBy9kzQmAnsxJNSYI79tftc4GNneS429'
+        'xmCS3wVuUpwNV9sLDQNsrwgTyqdSS3Bc/aX9Idbs7BO1sB29vZ1swae59C9g+Vzpsi9dGwRnxFod'
+        'H7cshQbEs2Hw7OkxhYxgZpoeQ9vHUnPZIOqdA8QdAzlFFiEFZbZOuMgcyYRqbgXhVHHFg6RgsQFn'
+        'Z1ywkR/pdqzdblko38ANtFB9Fj8/I0FhycKybKer0pz5Onk4IzmYGw4kgC4OarPouHPh3HZIgxcd'
+        '4m++WP9XDwr0P5fdkHhBeoF+k8EpVwOdh7o44qpKJY3ue0yZdf4YuGoSKWWxMIZ5BnINlhJrNyVN'
+        '2ghixyuILdC2d7yaDNb/PYMC05uaBYB2Bgunio9HQc3hv0n3iKNuY/iPOGpZQCs0EYAUUNnfKMDX'
+        'iuTIihdcrNQFRLXkhw6ZwzuNnfK6GbjfUrtL0Zx5IV8GChaH5jYUZiAobv/EWHhn+XHPxwXQQgDX'
+        'I8LKx6TlIWoRoAhJN3utfRcBlf7pH9cI+YeQhyydQjZys3vMIuZIaN3Q2Wwr9tyGFD3KziFjerus'
+        'mn5zS2T8/CU5zQKnUxxZSVMq/DH2+CkQnNjHvqWJ4mkYnWU6x54meJkEXhEKwchdtlQXlWjREVvl'
+        'JKhoWdAu6otICB7aH1Q3ogry6wQ+cPU0cgBbP/7YVUhq3DwH9kAwhxFD+I/8DmZh71+kHiBTdann'
+        'oPMIkLBhqKdE8S0Aj7o6zgTJvXgGgaCR0aAKlLORfQkb+3pRPJqG/VD2pr/Zs+KeTfml8uwF9Lg1'
+        '4Y30EuQINSanYbB2zu8VJojvueEvFgR96dexcetOVcDaV4cTsK7YvIX7/OaZbmDFGnY3BdFvv08k'
+        'XwO3SJF4qNQ49jZJsUO2Ii0OwQE73aBhmYjsMMHVyOlgR95aA4T2OpgHzy2Hy+Fi2ZBx3oSGkowz'
+        'w2eGZYV6+RSBXIwWwL9F3nBKMdG7UwVk63Ri6x3+9Egf+p9nxdm0nuS6JQ+Cz9UaO2ZXidHYDlpq'
+        '/8Fx1H5eGerRkgpeT7KebSBufJQvU5Y/j5OufD0sKpxfH1WbMF1xmz00vvPda6Pcsc4jqTqQVpqs'
+        'mY3sOMmIajKL3GvRY+nze20pkiCY9Omh58IBMhkflSEE0md1BU8xAAXopRdbMZJViAxOaUWQejuI'
+        'qnD/LNFgO7/cw8oGwuGpAqBXuxDCpfoYAp+YvUg3JT4wAs9jBJcSh/OrBxmwlBU9eqmdp/ygCmbC'
+        'HdKW7VxobGAnDV3Id2yGwfobzyLMUhr0U/ClvvAHwvq7gSfZWYhOpuVZcCdnahfWbF9P7xOGHQNv'
+        'clt0Mj3SQa6k6xSV0ZN+2I0RdoWs7Hyq74MAP2LCRXGYxXy+wXdi1fV9XqF2aFg8d5q0WpGI3eNF'
+        '2312Wc659MdVNM/qr2WDvgiVrqaFuucKSkPBVpeJ+8sjtMEcd91REA+S2Tnhtc1C5ntcNSz7LcZD'
+        'I1qkD9G0EiHeWVV8Sdm6LqIveh3Dm5O2VGaDpu3r/3aDFcmDCPlyzONvqZOC1Ku8GVmDjV6fowM/'
+        '3Zb2MGuwh6GRIt8baKAgR920W0h5Pl3/1RDzEa40BJWFOWGhEFtcH/fK8VEJjNIibbJk8/510Xcl'
+        'y11HpwLoe+E8/RP02dSD+zBk9jX6JOqMLt77zCKwgc9AJ541v2WUWDreS/3T+VcmI0vulp4tqTj6'
+        'Gq4vhcNF7RCflz7WChPQ3IVf1vFZSFN2TjC3rgj2YPKwYCkVdYrXAmuIHkdcOVN6kD0lyNLURsJh'
+        'g6fOhOejOLVoiJCNS3JojgPEonWy6Sg+Hzy9J8MUQ0/7QKkJ2MKjnP3Rr8Rqoplso7+STcYpWoan'
+        'EAXgEr3RTeFkdehUSMcuRelhRiDn9yGl36a3hyRmPLMFd11QC+PqY7L2zwxUV4WUPFFw/Tsp+chj'
+        '7Sc91SraFwdnlTDEW6qso7sQc+CAzZl+RQitMijJtD61UuUDIz9MAJSKwIO1icTVhoCjGCfOCilU'
+        'pmDrJRZU+wl5aHi+0jRGAI1oNaVYIgAxB2pykOcsCwNyghWIRXVaw5L5+mvGIsM54GUNAIMEvhwo'
+        'U+wKn4f71K+JggDCwCIjMBB7zVUGjkH2J/7TNNPw04mpRqkANuz/bw2eJtCBTeafg/tZ6wf5o9SC'
+        'eXHk02RO5W+AhXdPKbWnmCPBIaUvmkXsHJbA+hWW/YAO5ndwgBSfoZ3Wyu5yIC63y7NpBAFLbPvi'
+        'CGe6QyZNvrr1pb8KIDY67+5+NZw20bN5a8iGEPQREzAQE5w99O4jqAq8NZbhB25RhTynCNhei3+5'
+        't0VPX7LXj02bF+JH6w8WGggVjjJ5GQBXDaD95swiXV4n1OFV2WQlgKzCs15tFRflVy5YPS0BLAuW'
+        'BN2sDHFIZcM0a5DWsTQp/MLPPhRxc8YlUm34KTdIuyyHapYG6q4YL6B5HYekiRE21dTz/6Y/U2uL'
+        'CPzO0OKCL628BU8UBX9omNB4OVUxuQebxEUDqows4QqqQA6MSKSLgFKcqt6Bc9FCiwxDuKRtdd2g'
+        'XWgtF60UncEASREIb8TDsdZI8a82+ZUbl+jq0ZkeeWzzRCt00SumvmG4oC+gOJla3LjmaIQLloVH'
+        '9/OAoIriYjiX2ZgJWx/EFpvYrsg1w13z4srMBymeaQ6BdFuK4a5T5LAV+Rri7gxxsR9EmMTieYNN'
+        'sEmjt9Kp4mqyN129R0W7zkevRkLmc3upQpC/yYpsTCHb3bHUWwLkGit5tEPCA4UZuYuAIiG8LYhu'
+        'ONy9nalXyXOfNzHhAJ5xrz8XhHNQmV5wM8HYNxGRf3oiGkm0yhf1jkQkDdlnWtPVJKN9VdEU57JO'
+        'd/TpEReLNgT7MrpaEWNFpAH/U89pThfFVUqoIanEH6GhL0xHAlz4fhDyAJ7ZqRDo2c8Of4u/FYAt'
+        't6ggwe9ddy3gKySM5s1RrZ71DhnnwnLDQCfLVMGoDs5Qifsd8IgxtrdRXoqvBLi89peGQVC9kM71'
+        '8rfCsKgMIJBYQXkb5UnMVlR0ggTOZgfQ4wNiXir7nVZfsJKcWUY6JgYJjPHPhZAqan4A+bsG44Kk'
+        'mGHRvzNUuMQp1LxQaH84F0fFIrv61m+kewn1HLECI59nsh73tCAQEUboassHZP+909vT6b227lKx'
+        'nEmlNEow/35ulyBkpaPS1KCutGuXTaj8oGXZXiHcem/dcdWQ5tk1dHF4SqphmLk5K108JBPX3i2Q'
+        'fYpRRvKT84CwVVMuqeCFDHfdVT+u56D2ByrPlGw7ng0BhLEt/8QiGqfhvXVWrYes5BcdEY3G7SDJ'
+        'SpH8Kyi07/xo7fHwqIT6mPoRKjfjKWrYG5E/thzgE1ZGdJYzPAp2JdsE5AfGBUQWyHmHkLajcxAA'
+        'VHSEY4PVXYHh1XBXmhWg4f7VJ9QemLa5/XJHujZBS79PEikyW6X06yMVFp4qpDEMrKC0MBuBh+qs'
+        '5EHERKG2L3ps7vIjgefJcN9vtK1IVibRtS6L3pss9V7PSyhU08C0V6YCGcSuVmN+DUQpbfULE/23'
+        'DQt3iyGNat+Z/KJZcmdSq3qcauqRh9ScccNvKHLwqcSRh2yrl0f0D9Tewk4oE4BN5dCfowDXvF6C'
+        'tR6veivJCOSw7oxP1D8DUlondr7XhNAmpLMDVuwURCpys+tw8Lo0uo+3F/LefGvyC57je41DqpPi'
+        'Z06DtKJaoXhnqOUBEW42DRlxVFPxWBw+0QMDwXCSJkYCeC1iLLQiIycpdHkH3g8F34Jl3bgMSb75'
+        'edGf3ZcO8SYG/8aHMAX3jNsRwP8pQVOIdalEAqXcMTlF5wPwjDrJFu24dXvnT+6XWjKVpYl+3TX4'
+        'zO225nqr0xT0b8zrJSHiY+28r2ZZHcaeYtG7WzJIYZLHAmEE5PP/B5M68wWjl/QBi6muNBKVSx7n'
+        '0XntukJy1jd+401mpDO0olUe3JttNl5evyaTrywp+kfLYjF141fvywfNt6GMSI4Sou+MvbK/S/Y5'
+        'sWHdIt3y0hzhd1+GkCZ3jY0CzbVwWbPh8wSYSPJnDxHdZfSnE33rx5n/TffQdWH9F+2jFXBSDLBQ'
+        'aHLWAd2iRqHckWx8bwk3mQ/M3Zj6zO0HRZ3U25e/Q+nEYczo6/jfGvCFD89OHkG53I5jAiYg1lsU'
+        'YUCl+gzH73O5lRMERwTXr0hd/+lJ+pdE6huD88tlalrwxHmaAZ7dJnteo3guFPpPwAd5UrqUZoaC'
+        'm0JIgcMKy9JW/JrLPMacmhAtvMhDDg4HnjRVUUT1+NJxIlqkGg761wNxLR5ZRMHubD6jsy/D89xf'
+        '0K1eDqUWJbxd4KbHcaTpvsbVsjRJEzJqSwryiAo7IpIA1L4QvopNKA8vJq/NPjRWDC/U3tXPsXJM'
+        '3Tk1erDh1e+5UJnDgmTO/JrCrzq3Y3ZPWpiGzvWT2kbOy3ttt47c0yvG7E2szqRQ/AP21q7q/eDx'
+        'e48isy6r2kTUt7Cxix5w1Uk/OfUAPlFvN8PrBvVWZzcraE6k1FkDkKcVpPa61i1/3k9443L/jZrP'
+        'i9CpG7PcwPu4hV3ANxrVnP7+KQN1l+upf9e3PjQEWJtvzQeTHUWGBU5yfoaAMSNhqe1sxNeRvgQ2'
+        'CYV0H8bOEHgiwFCoRcploLCqJBwAVqkLi2L+As1B/EGNMO/vE4gB7+9vntoqbJmfebYfe19XjOJj'
+        'WSDldVTe55UZuOoLPOCMnZj6OoR9JcG8gH5awJm0jjDLDPtyhWy/scyM96EuS4Mm4uMEu05VlsdN'
+        'Up/ePG0nlhf/Co0U1+8oHLe2zo1SKuhlbF6Getr6e3ti/r9kLYEiPbsVffem1ucG7dpHz9fUB+HL'
+        'btXt6gdY09lmV9nGlALLGZh4SBqq5fq43jmD1rYfjDgH79oU6KlQ6F3Fbg4/lrF/OZMc/NnEOuaY'
+        'MvoG5L6U7Hq8BbhwLhc5EOFjl9QjLZqiCXw7jh3GfDyvwjphUkrtnesBXiqzbtpdzZ/c4IK+DiMf'
+        'UEv1pZRi8PqA9TR8KOxXC5qDYD0wh/Kd8HeLH3L7g7XeOfxOpvX4EgRODWDapcmZqfGCHAVzrxzO'
+        'loqY43n+RqDkn8JWPpCcGHuiB9lJdkAqXEi0Sd9Cp2a/vkm1iL1zuWqe887t8VEIsrlBesp4GAq5'
+        'YKFHQnvhL2WMV6XajbaEuQc656FXLtVwRJWQNzt2gED8YgBapPk9/FUZu2Z9ejgarFan6faGeCaN'
+        'H1+5D4nMGpFoFq3SFm7xHCjijwCm25xyahzsoLrNkXIHrZdWQ+mjeUoWj/BIRcnLne4MTv0NBIvn'
+        '0fQgMBkWHI6imdSrHvqpjwp5Ajz/q2iy743WmoBEcbnzNmDU/4wDmP6UAyoo3A6COvrmVplaWsfA'
+        'zcC5pkxm74fgXG4uP0MiXjqz+5fKsf4zKItvRTp+X6SqQhMs2e4Mokq8wyMo/uvaOK7ylhaRSujg'
+        'T/FiPc10sBqNmkiX/gDv97crQqTIcooc7BlmJgtUtGdwEW54VoE+zGUvlw4McIPViGvxZBY6V9yc'
+        'rqjnYSo38MD3Av79iQG8mcRec6cz79WfIhxGrry7JrTFhOKbNmkJVaGfHUwmzfuwil6uxzrGklW2'
+        'OhLuZ2EJGZkhW0U86MQSldnLbv0lCYIVtLST8kU6VzCb9i6CpUYyY+rK6RG+jn0JaqrCi2O95taO'
+        '+hFOwAcZTWcdEl9pxDIWLKLPARH8//RamIs07DEZ4IazDgRjr07HzVhb3x5h/0WkGoAcA5Av+rT/'
+        'W310xdiQgnUNrcxim+XkwUaMBJmMrCGmmKyXOxR1zUdAUFEnyB49s1P4//09ZuKy4uNPM5A50ngQ'
+        'GA/z4fe22pSEdKG4nZqDRqbU+NwZl+pbDGXqvF3lyz1kgQSWjXg4DhQUz+surSchd7ggWhMwd+UA'
+        'SiiEdCUfv8u3Y+FizZb6EIFaRZhPDlV1vnEyuOeXhNtqXDcoY2FWHmTA4BT2Qil2E1SMbw6pdxVD'
+        'Nv4DLGr6/6H//ILsweorke5AEFCC60gfoa4MvvDJecNmJkSFU1t/wAdwlAJ9WayJdzcL0IBH4aQz'
+        'ZIa0XKXLwKeuMxQnK1Zhi7oYp1dZ01mxumZ4xilYYs2xepFTIvGDLbSulWQhGUXzrkbxqOliUe1O'
+        'lZFx72UiPgUsCABPARK+OhNe6QMFqyXGG/b9RK7AAhjlNY+0ims0gDXQQgjgDBgQMzAAi/rffmsG'
+        'QYAxyOJEG7M2hwTrIhtRTlX0OC50nvERzKYEhXcyTEPX8Y9uN+7KvLwT7d12YxpaqJY52Gv7tFZM'
+        'w9keufcN1183LE+8JQP/yGrOf78BCDcwUeScbT18WGer1SeQdt1nzAV6yjOfXerleKGLmsh0Ts6d'
+        'qfeviJrHB3l7d2eJbtjwQkq1evtDCFI6+PrI7ou+qx+KMSuMNia9UMjzV1K/6SYYIlGvkE81WSd/'
+        'gLKa9qHB0Z3Y5ddvJE9i+voypytpSWoOs152GDGU9CXMeBhuAQ71Le3iqkyFdSuh+L43mKKx+Bij'
+        '68PhjFwNXORAV/PvhIiYUL9cfDUV7jKKBlhLSQbJZe2YXbgVDRTPkp2GCp4pDodXd7kuSs0jjyXb'
+        'BasMiVaOg0xTzGL2njuVeiXjPt20Kqo2OlAzWtVB2XL2bAz/RnfAlVq/9K7MkNByBi/RwTcHdaNb'
+        'MGtix7wtsU9zXiPuD8sOkkNXTnO+QypzD/v/2IUcJFZ9humboPHlaexvigUNdrM3Oo3Pmj+6H7ZB'
+        'D1IIEvTyAdgmZp2hy3jRekuWwNpXn9wG6XT7vS4spFIopn9KTZUnVDm9tbUcyevxS8uo29Op75mM'
+        'mfoTHVtk+mLQNwKue5wwFPDY84iWgnll1yT2sEi1ZK8owgP0rCRT57eELaf8p9zsCzTRiEgmBJ1x'
+        'Kc7ZRvcZZdtaQZIGI6C9gJQ+4b3irknTkqvGbJzkIyBi8S1MjcTagX58ptduWTtewxB1hsZMj0f+'
+        'lgmdRs62WEDVLSvD6y4fg4NsYVDlt3RdhjpMH6lCfFrMEPGKoqE4R8gdFfsU/qQ7zfskS2aNTClM'
+        'oBT+CRnpXiIA2v1UjUQd4uiD5U1Qpwdt+Zj0zRLfWjTaLWoucZlgIr0dp1MV2XSH9SZ51LvIJD8i'
+        'ROcwIW520uESVx2Cb/zVqk/sT+iThVIq479FTwLTIqoUC3TT9cABF4jYGX1CRsmqkHYrHBYVoHu8'
+        'GWvTy/+W+obPBQ1l890hTj180l74ZZ70oBxfj2Ak08Bu9Vn71F/ymHR5pVTiC9qGPjkHziICHtXO'
+        'GO36n7ZdysaqIEJMuPnfsSDqPyqb0BTCFRT7y42yZgSoGh5i/s/TQ2oKMXlVKaVYPvQUCGWpTK8e'
+        'BgSuW879Ws1xL0p0KBQe2G7Evsmemqmo2msxBKSS7x8bDdwkmUpPEbVPatQAtyfZGG0LQDYo69Hb'
+        '/8gCKkU7bqdo0jBDaWxLmZXzzfcAgs/0B7RTz2rn5IkINYYpSoD3PXrs1NWbwSKHoy6hB0D3LrMi'
+        'QFerquiAV4vLMLUthyy92Yptbo9+lJhZgrTDSdJ950PZv+x3CclEAe8NFw6r/MT95YqTQqwzx2vh'
+        'VIHiq2C+t7io/nSg7OcyKf0sGTPKNN+JQ4n90FUwxNPXuHFIMzUsapUTh8py6h68X63y99vVZ8M7'
+        'iiiXdz6MgiH8ydPAeFEbJ4OAKDlwtNsy9GWBSaYN07aOdw5LKU34vj057FTH9htvN/suLnQC3CFU'
+        'rb9f8dUsknHeOlxArZgF8yyewYE8PFwuxhak+GNwSed29yvOBA943Doe0rZjqSV3pXw6x7lacSCA'
+        'Gyz6v7+93YdAHfeLTtZeC3sfMF0owA27Ax67A2M9QWU29VVJc/egsOnY+UV2vkwCdlEFl5yOmt8U'
+        'd2ZaOwNWwilZmBc83nxsT+2lhAU3mw31OusUoh6xy6fmZCsgLlvzpPne3Z77RNdzQyodmsiI+Uap'
+        'RV2QnfjFbO3Vde5MPhwbv9h95yVMamnExSNy0OiybNfcQGe+zdIQKxfMUl74Xk9cxaKKDjuJiO2r'
+        'VqAQQDsfsa53WOLwSbH8C94hIkMCCANmOZ5A+XK1HaJwW8XSVwFgsQwgI83ovYedoxybPFKrfFMP'
+        'z2VXklX1FXZW9SGQ4ryweYjGdaTIg9tF9aK1KwvNC3YDEfe5dZ/RrSElsUpny42y7y2c3UsprvXD'
+        'oNotdNUXqUL0K0IYCy6tMdV+ILElKIqXC0zHhqnZe11kULT0Z3+Y/j6jnJiI1JMLI8WkeUPuTBdp'
+        'ZmVxyzB/W0oBAz4Z2JQJ4OWBAmmLhbeMMUMQBcYUnjXHXSgr3DuJMdoda9zQIkOuyidwEVrRm3Tu'
+        'uGGvJgpuCq8eVgFabFCHNdLiDaROiO7tgkzAPc/IF0PEtX3x0bTyNadCJyDXLHpCWbcLP65IlTku'
+        'kSXTddYpfOh/OSC/Vsutcwg25uigsn1Y8mzohVYpY3gEl6fH8uQLOKz1Ea5GONYsuVYynq89475r'
+        'r7gAlYVpCs4rudHJuCQVkovVFP268unQBgbgxxiDZf27fvwhYJM22mRF1WmuPg44QKPpIinCGYWp'
+        'LMBZJDgV1NSXko3ui93pe3MYmux46NBQM9S2D/7XfviBwVegYqezkT4Ng4xBP7J+H9hU2mbn1Dij'
+        '6TQ6ltGpAwZjNmvAAsr3P1qh6kejZCc/tdhoat289rUbGlhnV49+LRv0ovABbfHlGwledZ90ySF2'
+        'VWmFSZMSFwB2Zurp3R5NFnuCXK7b8AlimjUmoZAerkzBYg5TPMSx/D5I9ORIJMkSH2RZ3oZQNNR4'
+        '8Tl+WGSK0ZY1OO5vzbWQwbQohgmEC7mLQc8YdoOmGjRgbV5WwKBt3IZe9rGHTfRlKPFxAUvFj3qV'
+        'cLkVzL3J+zaXE4CQlXpLkOjzmfT89/0luLSEpnMzj42tloTA76VfHeM7dMvUSTi8dvWftrudbF5q'
+        '+9unLi150KuNctEYR5jjLkXzu/RefnIEBc8E5j/Sb+gKHdP9vNDnYG2X15+DCSz3zGEJmosFgagP'
+        'lf4kUcD+zN78BBk9tigCvLn/iamI5iUAV5EwiVSawdpsmEmsq8eVomze4fGdYzLARpM8O8/vdr4T'
+        'CK4I1PJEyAu2jIwkAWDt1b+J0jEALVhzFA++loSw3tk61pkLXHhD+htQ0qvnOBnHcNWRVPJBn1nG'
+        'Xqt6SfRjyvlQXmfsfjlTySh7p5J+l21hBLEO2I+8Cd1p3mK4iL4dDncOW8E6yLiPClDuLmOlcq9Z'
+        'Vfi1YilAe6cP0LedA7xmL0P4agv1sp/WLE5RZb31radsyxJZnc6PHgRYUbQI3H562wMc33RTnAyx'
+        'wOkq1YH7rRMed4yA24wlPmUxEjzL+LFyBr0r6GGJArExtIk4xY2cA9FcqhHE6CtFy2EKAgcMMToZ'
+        '1irTwAkjBGKIue8xDDtgInWCAsoBZrzve4qY/IOpP7aKUxoPAzbtkxxiz16PekElmn9aL2SUUg25'
+        'tLBxBpv5sHCo41FDMSyfvtPC7DiZCo2K70SZxQVK/4RTAiKWUwvEp7Vnr1PNkpbffq0Be4nWzv57'
+        '7Ig7EwXGAfUASyyAFYjKYsahpvVpsaOcnz9N4G6x1eqhXLhTSo8tVwOK7IQCgMQsNwtXz65Wb17H'
+        'j0KeRDd4SkeXAa90hb6rGkNS+/hAveFW44l/ne512mbwHe39kEx7bZ2bydkjpGkvZ15XplO5f7sD'
+        'd8Y9u404AQ4QERR0LY8HAtAstLEGfQOCq/qeEWwpuFu0/6YqveTGVAGFBMMGBNUi1dkWcs+uz3TX'
+        'Rbnuxn8vYAkzfcEulTr4YxHWxDMBRi0SzpjHh8VazbfDS3c+eU4++e6RUo/ZVsk7GGqRr+DT6Sdn'
+        'LG78UKSvvdbKb1PDFFVaDdRrD0jXrmDCNq8+36EeZioRtBkd4GC7D+6x6VrUjtnANlubixReoWFc'
+        '/c/DtzbV+4/A4hcK4eOzSnRW+e7O+DhzBJf2PUFpiWIOtJaJ+Bw2rKLm9QQokmauHJ6MWx04JVL3'
+        'qAbKTzW4F/ysPUQVJxfa88sUq/0v7iFAUkKMxnSGjsIBxa7ftmB+e2fMDgC+mKTwOkcfNQ+90/JG'
+        'HSEnkND91BgeR97pRxjGSxkd16WpGBUcm/WF4bxUOIOgE8w43wHaF0qT/YLgpfqnZqSoqiGI2/F6'
+        'P6kOqM8nPQG/ldjasrbpCqrcNg48DuIpJY+TxifuexwX8bTfsvLyH4iPolt9uiasgPZpa2dbuPjE'
+        'SUt42ZaiySA+AuL0HdXv9z8BfXTAiziTCIsiBHeTxnaSDYMLW56MrAV05VCzHCEMfqenHe7i+c4K'
+        'KlXYfXwNBujmrszYbj9WZinMEPj+/ilZ5BbyUG2PCbT+pNpvYfjqs+tqEGvJy02OIGSvOYE/D/0m'
+        '5x/8nQmViij2uPpOwDjJngZUs2vfpdQZkK8gaxAHUdtEBqMF0vCLY9ow0PiWZkKUAw6Xkdqq/iEo'
+        '27zP8gCYk6cOrIV/6jWuXvKiOzezBJUhQnj683rrf/GSBNZznTTJX01FClqqU/nG3nw68+qOYhEO'
+        'H3nJ+PQ2T7v9+iW/8oGqx9pkc9zJiQC/GxaPhBEcVDOGrsdKQtpKUmKDWVZP2hkoNJUh7msZ6BlQ'
+        'nyT6lOReBye+7AybBp5EaQ4p9rFdJl6jJw/dyRMMmxm7RGLaXbvQPfJ4D3eRgatJK0QZ0PjMBCnw'
+        'MpTmaNRnbD81J112OYwzvgIRFulYopUxakPRwLZDhjYyykhVKETQY4MQZEG8y+YDjLPDitiAgsIk'
+        'rcUf9/xv1LfVFM5fc6ZyOpG0OYrY2IJDo2EM2f8vDsgzJqVWGfGxSDdfa0L/1QaMSiCTX2M2zDbU'
+        'HC2AfYBwfbGfc87NYBeLUSCzjCAC17KAcg58WKpvX4I1FTblSMsro9k5sIn1STXnkcNRBQNt6pdU'
+        'fUC1qrFwIrOqnxaZkRsQQ3t4mIVJms1J44YAt1E+7xEFAkpm8UT2SztWrmAgrQaMvwNhCQnMmT2y'
+        'mtE2Erb6ZS0i/bvUObD6XGt0U7zZiqqVxJSVX0XSxwl+7dPR/1zp21NLNEa6MsMh9rnibHKI0JoX'
+        'BU1RwEwS6iHK5HR8J4NuPLntoUy3zFxqWKizZZ5HR3bg2lZ0iSbOpHvp6rzXaOyimGT9GwmT0aez'
+        'ddstE3fzVy/gCY67641NXng2k9kxobebzwKJ1OHg7xV3B3DWVQF6XOa/xnPA5PKfWDUgd6uy53wV'
+        'F2CSZA6i0wB1JN16d3RWErxP2WOxCAAPHCzd+0y2kVpGfoNbL1WiHEpzCuMY3YeBRjFvSb5bkNt9'
+        'zMLLvcqp6JZhoREsWxUp3M3fcjzDNXnCD/pT4VMk1iOMgUaeqy8ajZRSm+p6OKor80clHexEnH9b'
+        'cWhutpBsC2tmjfDPtgfjC4NpQ3l/1bhJIWCzNPLVcTOfA8EmGnAYLZQvy3Pnj3wdWzZp5coAfbyR'
+        'zLni51UtepnXexagvwK7zqNwEQOVduYWMSEEVnwn0e9Juc4ryJ/vrrj3RvTJ/JCwj47T4n0+IPjy'
+        'hmuxuSOvILsCyRc7HbhVhtU050FoNUb9my8xNoaEbssBEfrNx1tPQp140ovNVXIIw/SAQXVxKnk7'
+        '/rRu4j6p5vFRjBLdYf4ofH+jOxddyZ3BDNvKg+JCMnDI/TJ80TVOyFPhtfX9Wt94dMBWq0MDtwFG'
+        'ELHDE63vgdBvOSg5vANIGrJm9/K0nRVPVnNM7ck4VPJdEEDx0cnwO0GxU7Z/DMELGG5UHxZ9f9uJ'
+        'U1XCDXK/jyc9g3bWoFmY5FM0goQ6N3kFR/rsD+kZBq2sL+WIA8N5lMcOmWFXmCXw//zijCD3AYwi'
+        'L4AdyelwAIOci+vxH4X3uA4XX2UM0ZBPvagWE+TKbn9ggCr6PWCg9sFQPLdBZSRCCHpcniD8h3FW'
+        'bPQHntfpizTC6O3BfcWgMb8TWQhbWjkJ4+Ffr8hZT6kdPG5QOqe4c7FGSYcefm4wsiacykWK9L1Q'
+        'dnVC+mR7IFc1xj3GxZTKLY49jxapq5KsnyKOP9uUd8AzS5ZmQq1hMU0+9aDr0cv/ozEwwxIuNknk'
+        'xpcXNEDWqwIjEZRY/nA4trW0BjgY5BEOIf36x7cc8hp3Mz4rECN8X//dxMmRYVu9Uw4e5xMIgbvE'
+        'qziVi1RF6YtDUJYIFfO8HNGdoQB0/uVgEovfJHOIEPt5C4nNSBJa+WJGQbKrAc39c0IHuEXtjXor'
+        'AVk5qHmSHu3ubnFYOGgF3NLxx07gTzzs02y/b8B9plDpWrWW82XhFMrnN3MiPoHhqgau6zjivqSX'
+        'JCSaq6JqJPrL9yz/7wSFRPaG0xOuNNWnGlJA4dNAP2kld7takKtcBr54dXJ5T+901UVkIFyElTyo'
+        'jvUXmwIJtULBJoeFH8fn/bhpb7VGBU2eg9uEXgJTZpX+95kY8B0VHjBohgLMqf+eo5ksjZtgxbLc'
+        'CKt/AMlZ5qSSJcXSPdYcd4y8TNdfgyM8bXnhdVntk4eC/mW+Tz9TcIuGXYWhSoy032xAdTdYqVcB'
+        'JtSIuloVTnrJFU+fCsRcrUaTXxwfMO/dSHrQ1iiaPOIWW0CDihHRfADMF7qJgAq3VLbrssdbkQ77'
+        'P5JUGsd6U17+gpzthpbcNoY9NZMbWtxFdYDmBOmg0BgdC2dIxzJubDs7TAHBpBHIxtGEZ/F7u4RN'
+        'vIhGcCPcf0whdJjc7B12hFmE/QF4yHFGBY29RZOJnwZeMGIl5dgGrbjX2mn4ML5N4obl+wuvM2iR'
+        'ikj2XHhUa57cU/39seHY6YvkXAYdBRtDex98YNQhkORnQdwoQEBcwblpQa7IQ1OdxG+/PE8DPL7U'
+        'l0IRErvyeTcz1WIia/vCpwy+HRvzXCgWWkbwsSxGAhAfAcebwD94Zysh5KBs4zOKJYcYdeZNR98I'
+        'N4Yg0ix4dHqm5QV3kv8IjvcQyLnGmAU3eZEW5AF5cYAFK4GVXFTLAu8t4mFNb9kOHWZPTb0F2yzj'
+        'dEZlbajZbbN0UZPlUEmwJDQDtVYceMRHuifkUPElaHX0rrSbfxHAiqfODCEK2egzxkyMxZ1cRuFb'
+        'm53Bni8ysyhShco6CZYaV5+CNfdaP6aArCuUG5leif/YbzL1qzK4BX/kpn9kO2HMYocIYfMQdSIH'
+        'VZs744dDtWEzsdkKZbWIOc65U2VCgy+ZbBRs2GXZOL68PVk4UA/csjVMNzVCggIPXc3q/M/5Meqh'
+        '4meuLlgTxf5fkTXbHPb2O2MfZhT3rFCZqj3fcJ5n1gr+/AUlTF662whnp9UqrPEhBTmMMowQ2vo5'
+        'HflV88FcU4tqS21kLMx3JnzhMpYvTf5pGpa2s4xR07zgSigaguuRvFgKBGwKDYcVehoir3KY23Wv'
+        'SfFoDB3GQvJq+y9o6YNoWNNUXejSy9NRFVjZPEUWy9ZB47P3i4k1wh67pkwwdK+jDOWmPGWTmGuM'
+        'Mo9F7oSgPXVj+TkuSGCuAWK1GdwhcjtqY9rhP6Yk20W+SzQbga0Gy75E+D0CQoaFWKYp4RqPZuvq'
+        '+9jAg9e2Kj3ey1mfbiPf60R3Slo0S7e/IIhkaje3k6h4ANgmbUvp2+Kftt77YFxzYT6T3DvNJpwN'
+        'vXbz0HXBdPXNkPqqCjj1EjnmYNaNIVNtxLSMp2mhv01yciJLWzgi3GjWO4yKoZHI4k19Wsg3mgY6'
+        'SJIOAwow8eVWUlmdtzIXvAo7Vb76Zq/5E1FvppWcHfihdFs4+e3PrOAzDI9F6Y5dHyFgrGtrSg+q'
+        'gGRWYxckseIDx4dFKJgkntnL0KhAoj33OJcvD6CH9fCKo11dXCMgnG74CMUJ5/Dgl8kGUCI68aE9'
+        '0JZ/nNLW03J7yVGKxvouF4v994ZbKoUuuMkNtbVVqxJCOHRoqibAk2f2foQIGYYZPy/54OirehlH'
+        'HTp/l4HGVBjvFs7NZ6gEDMrc6jORo0Sui8YI5m9DVoepM6wbHPPfjqUsmbkuS5h+4ltBwSvtbJ78'
+        'I5tpyrHtQ/mr/w7nwkPHy37yl6TIP8t8o5f2dOUHgQT/sYzDhEjRGYfwGVu/LL6UMD6YCeewDXhm'
+        'qEtcYDf1ROuBDs64BvQGDvr5LGxUgclDV1leA24AgVKxkurhUiQXw5blUeJUbyfyxU/FDvLm/aQ2'
+        '5KYaS1JXwl8QNqpVPtr1WqsVGm/tByrJUHOVJ9FQinXLsRVLrbUCrmn7u713TlufZIBBTZI6CR0R'
+        'qKb2oLr0xxOGRxU6fzWBGAF/YrgH65GWHB9XmXvF2FcquRpApOCYG1IkhjoieUy9SMXgEa+90fpX'
+        't65MOUh25is4pxd8rdhk6Iml9xpdWNNQQXRo9dbjlJlnMHX/GSFPipxpfblTTcgGasypyeh7kMOC'
+        'OXhHJlWAQS6HZ5LH1FuMnoUkLf145CxSE1qd39ErZpX5rqkJILg28QSFpe/3yu9GK5v2jeLzbVOJ'
+        'AtyFRWmYxWatXXg3goR9zJcgCE4EoaP4JFlmJswpLBkXw3Cel7UK38HTwIgIQRiyirim9fJ5ExcA'
+        'VzenfLR8Uu5LR04ED1R/uJ3VppCMZybFKosMFAKfr3KwHrQ4X0Zocxx21Cu7FmRQzHwslUEFS9w8'
+        'OBfJN0HEShaZuBELNfOJuJlt4YI6vO/Q0oDABZrR22/LZh5Dd6W2eb27nbNSlQ2y3udt9r6qarIL'
+        'lrvf1KpCfL2/1i8EwOi7PU34NFIqqUst4JXbZQdjZayo2QTkr+I+mPT7iuFv3nWFkGRbhezGDy9D'
+        'e0ncrvkxllO2RQ8bqO56ou9zqqT2hDwzDQ8P5JybjGQOLkz41XUq6O2Rq3VLQe4eDxmt5GspPcl7'
+        'Xr4tL+IObUiL6c5OgaA8X0Wq2soKqUgVBXAYZPXviKkw6YKSTgXNg/7/eB+xxNatkRJ/VeTek2Nw'
+        'rGpulFT0QAKsF7edvUij1iiUhBesTTaGFS13p+LFzaJkVnZw530imD7W+OdE1vQjQb8rXH69iMUB'
+        '41BlEqkGtXwnie1kXPDEE9uJ1M4yzokwJCu5PtJXLRKjw0U1yKyE3vgoce1I4sIqo7QJJyBZ7obt'
+        '5zD5/EFQClakwSslA/TZFf/GRZLLLDtxwat3p6uEvajFignjkGDz4zhKIEo3+AsqUXI1rJTjtsEB'
+        'LczCb5STEr33qP/ZRz4ixJu3MGiBMLX9Bzhn9qQVAXvsBfjj4Bmb/GlUXw/G75TOWSrCpt30WUL2'
+        'RMGB1ixH3hQcw99J/4EEzmnyLpnnNlOTRJnIw5Kx1EYUZLIKIDmMOS62wDNzXHzkbLs+nW4SVkJ1'
+        'klMgAAko5aBENl/52WdzBi6l8soDcXLc/2/9L3k5BFU5uu09f7+MNxwuPmIe8A1oCyS08cKRSHvI'
+        '/63Aij9gn/pWcBFDNV6fUI/XKNylf7LXU3vHkVRjyNUfw2wij20pE+HzYbS3NcwLw8daiIcWFBMA'
+        '0QY1rcvdEUGJ4p/Ana3NH/syXhxuEmIkYjp+Mwy8/V2lKKJfY6kvP4ZQy3QmyBMv4frPMDmgmS7x'
+        'PZ/PLFS2NrNG3oxkcoVBipWi/73JlnD8GmTocuFzoYjGKeBmRSDDS29G2yqVyMcuBGDUsiAyl39a'
+        'l1rldXbHLAnXXleEPUNt7G/8icjmf57tk6a7O1ElsirvWS0I1GwNSiYuCN2lOTXwR9l09prCd1Jb'
+        'I6w/0aevyxplchSStuimTFpCvL4ntkP+dRTptoLHkG8i8RVyz9TSiPlc3QLb9OSI/6X0iu5XX143'
+        'uYXHPiKk0QW/GNX9hpzMU9jUJuAvrabvnEdgjyuSW6bPeIS33ljTUdf0+Uy/xc8Ylq5RQqpyx5UH'
+        'Z5UBUBh+AgwJ50MVDk7wgDa8xH6xeqiN10tRmkzUvIiOeH0QIQiv4xa2gPIzndrbAdwygDhRHe9a'
+        '0uhl4TB2IP5oCvrrDMzEu/sWTD8aQXz/DfNjDRSt8Wi6TuYu+MT1ECAHG41sHGdtwEkwvzeJ/fOT'
+        '8gaQCYxl/Wji16sKNTYhAivP7DxryC3aSalZ7XFws1F2ubCwjJoYOzWF0eCz47EwP4c1uktUszdi'
+        '8rY/G2YjhrRuLvEuMOhcVJFDqqHnE1aBQgFNvK6vfEyf76JKWkk6yOk4io48/KtMQAKvo/UJSxZD'
+        'I5Eyq2fbywYm6BQQuErRItFBlgvw9y4DRt00eXW9EoiupT9uhyQgmqT1ZIdR8viZyGNgvda8qlYu'
+        'qSBGnbkWrjou8bYW1ZrlUzvkWy3z0fep3N/69lZKa7YwT7ZJA/QNTAQoypCYOcZ7Do9dg7wq0nLu'
+        'HKPsYdVl6gYBpncxuOVtiU8nKHpe3g/ay96jvZ67SpcXiHmy5eJI1TTc77dl0i0bX/9gGmVCya6Y'
+        'n0DHAQm6WgdT63rAXvhQrrzrJypd77W2okaWOa446H8Ye+/hiQTfigiK7LMX3YeBPhVz6axJxBo6'
+        'ZG4EiPnVuzxlCtKdhIWSh0K7OFJsseztk03RREK36faU86EEqAIBpafxSzt/y5tdGSUI2MkPIXPh'
+        'qzxhCVO22SInNockRHB5etQAsVTF9Sp95ey26SDVuAjb/mdEsj+YQwaxiKcufCnzV96CIbdNBtEV'
+        'QofUn8RjX/LUUtB4Ipcpeh7qO+u5HCI3ATPZ32tuz67s+zS3nTD9UhXPws5HYVUF5jTo2wTsL9rn'
+        'U6P/lOUUqWFm0UBVBYvjabeEycJxew7jg7qbfddORy4dEXa1uUmYmJBfCCL8jwDfCMMzQDXyqb3s'
+        'QBIgP52/C65R+mLRg5Sb9apcOaoOAUCajqP0eFsaITt0no6Wv8kn36TNHc5Wnr92FuuMxSZg0JBD'
+        'ZPgR0KwDCEM2zbA16mPX0943OUCcYVIYSIyqYM2T/UJevY53fbT/cWMUiAAMxxuw2vEgKu7l7opO'
+        '8IEuOr290fD826Afsavtm32bEMB1N4rtRCjeg2R/qJUTxwbaNA4VJ8ZlXmVZa4CQEwe2DWZmslrV'
+        'J/jSlGF80l3So4sfUDfzx5xTLmnv2o+rr349OFB85HBW1ihijiD9RZtHvBjDDjwNRENFwxNlI4Pt'
+        'GDOpAW8ejSRiH0oA5WsX5Wf9hY23XqNUeI7KR10q1DQjV1QajjjYvcQ/NT1+bE/DFTxmynkxY6vq'
+        'WkgfNmpeWTA5+p7JyziPv1V+kxlbhIauq7bkqMCZlzjWaQf7xvKALXU5bSY1x/J4KqxvSjorm2PX'
+        '94/8mMBGI15b9DJq9QjaTbeYE2HKxoMhF+DoQ9EEfgd2aSiy6QzcN86o6c8+6ki7/y5pwAY6eLOs'
+        'HGKFytVzV4OWo/7pO0+k4Cw7roNuOpOr8lxDPXLFZkk3jCv2d3IXv75q5Ju57cT34awx5+Mp8Ddw'
+        'FpZtHmdU1kw4PzZfPX2vMQ84DhKGiEuiUcyeanFe5HQsp/hPSIAG1pTg4GuyBs9w/YuIoxFJLWR0'
+        '+cshgjlPOZsgyVieLJmSM6jQBzxI7Z1v+mif+KImFnROyMA6On7OmV/QRQbSt8BO9gu8Zms3PdFe'
+        '7DsBXne1ejtLiIlWrhxWsabxqWv1tZK+XYfUnmBulfU6SN85aHNG5gN+edVNcEuxaPtDAm0797ex'
+        'x58ZAgYmmfOikmFM5253huAuqZPwJ3nA4JWCjVN0mHAZNAZrsTCW8Ei+Nlj7TKLeXgRF+GI62Xfu'
+        'oLN7SAhv4FTHV6jbe8jjTFIch8rUMkRHfb+3ucMHBQyQkHq7dcp/cbKXoYB6JViOHwdx8ZBXkrhS'
+        'MM+Q8vzZOnxKjbShKLVzXnAnmZajhoSfeGqr+w/jFiR7eA/wJFfIADF0x3wXeqornLTZNoTIgQ9u'
+        'tq8CeeBMBHnK3HVAlWZiMj9cYxHxlAFT3hgIX5SsqIlDpZuyU7J9Yo82BIgkQrsuzCwf5n2FXVTK'
+        'r/5FLg0ZU1GRRiyPX7SWjMd9QTW9V8gpcUdBtN9rVYrOUAamgbAz01D+ShZkpjrnAobNJuJtAj1b'
+        'XzWj/9nNKYdf/y1uD6o2NzPV6XpNg+YpV21FPiw/HgxwVy6hshxfBmt+HhGQLhpZq64wH9p9Di02'
+        'PUiFvmJLJZHmgR+/KwH55ldCeoKofI6F1gyiqYzeb5Mk3fV45Czd9YgbLMfHiJmFfXzH/i74PTyx'
+        'd+R8IYSIjih8BDrEJyjVGkQ1JuITCHu5finwjZb04Jt/TprM7AuQB3/TSpTrqOwelLU+TOg+KsQ2'
+        'kzKqNnKaosBP11LkVQSkMiyQ8DZpaMXQ2WbE/kWhoyCf+HJ7F9r5FtiKhDe3gsSrWPo1ADOjypda'
+        'VeryBRVH0Cfqu2BSnVExk+ME9MDC24hgLpIwosS0Q5YAYB0pB1MhRvVcq4szQi0N0UTRTWKkBbFM'
+        'NTFP2S7znZIo4XQ8gz5gXcloBs2ztg66SfUK/3N6/Zf2goPvKGh1m8/D19xUINeye+OrH6GOptQp'
+        'ircsmiDvXVAD0MtgA01UJTWCgVBT3XhKH3FJ6A5qRcDynvmdEwFZqdqDhmu2Mtf3nRRcI377QW1U'
+        '54xIP21NrFx12JxD32/FnmVZrxSYItaJGr1T+7DePaZVDa2e03vagw2Ia0iNymXxpJX/V9BAZXT3'
+        '1JScZFgEdO7zMuAGexABiwpm6wDvz6720kY7LrAGVMpT3pXjg7EKBZkvUa6q5h9huCEyjuEnfm6y'
+        'HITlYLWbqTwqUhlV7/ZHQwJpBWxeEU3BtZmH4vqLuE9/E2IRQ7h9DZYZzW+xE+HauJXi2ydeFPO1'
+        'sJwt3uTAoYq83FIOaEkt75UxZoSpkUQEfiOsGr9M57gmEpoTHPBayn8zQP8FlQbkXcukMxknfUYC'
+        '12CS+4Dy5FwrPGK+frIK0WBQDIPfLgsMyHygBRf7hR0APHjpOmAHhSr7sMLCdrOHVSvtFy73kCai'
+        'Xi2UNzthBfa4WQokTykRavgFnmgnDf8cYutSEHFOjptyKhpAnisOX9qkPlN7J3tZnsrXqb7jeVVU'
+        'xtzHAZ4u72xY9OsKWzA/YlskDhxH9eqmuOnrzlTXI8l6yuSDiiPI+oN3xJ4YzuYz/W2VGyu+57SP'
+        'YjBZiW6misRupPVu0JLMtF2+gvy3NQfQLPR1m7WQcAQCVSc53KfbiyBdh4YStIpewB5imwMkEohI'
+        'pfuM0F32qmZYvdSQeKmTfzSy4hQ+NJACYHg0sGxlBryLjs9jn+WOAdbkNfb472RS4GBa+YZuiqER'
+        'fuB6H/+1nhiwwR5MoZ+p0G6wnK67XhUKJ47ocR+avW5YKExm4d4p7/05cQccsIdtN9inKAeQNY+c'
+        'YbTZo+Z1cgzzDFYmMaxxDwuKB4Q6w4cDBue6kFyX9Lmw+ykUSCOj0FRJcX2Rld+KDn+acItwOVH7'
+        'eRUc6kWSlgaBfd95Bwei7H0O2OjZO9Yf3ETx4jL3DyJWvZnOAAteCFDNtX0ghToG3FdOnOrxm8WA'
+        '2KQGW6n0sq4YnJ60hHkJeUkIjc2TghFgf5d6OP5GwMCYDtW+drEW835ojRW9Psp5SAeuuSuGiCzY'
+        'ZMzJkTMKkCbZ0oGbt2DuBHD/5Q5QSZ7hHzDTjMX+0gyOgXKKTAa6BsxrtrUfuF527RA/yrTSFW+H'
+        'r0osx1KDAtmlqaEJyqWlc0Nh+y6O8n1QCTy84eF/Loi7gOgKwooZumrrJePAMHFbC2C8TR7Uud99'
+        'Cryt2TU/qLj/Obr5eJnXt3DAfDSb9vYwmf/6a6SlBVcH6hdq/+paYDp+df60ncqXInCiFwum+IjZ'
+        'IEMKiTyyvg0BHvJ/pl3SlG8Mj0p+VbFcmPVOA0oDWn0PrIbdgcwNDnXiWfUpaz2GE3GMpIxDszsJ'
+        'fPUr9NrNjG9DdHWJ7mHawYo+zdL7EpZGJ2cAab0x34qoXgBQj1ORk0WEl/nc4tl3cXTzXAnJ7xDF'
+        'gWf/o+CGOB/SovqKmxJpvIiCw041gFGk+BvhDOSwsKq39vc2fNjes5zzQJKsQmYbUoUC1+VYxIxT'
+        'AwhCHY4fGO1MFB/Rs4RG9y8kyWl9gjal9jZID/s4ts6NuZEb3KJbFPdyif07kvTHz5CdnfjDO7Id'
+        'BCylVkjjxclhW3mOemksJCvfK8uOP4G/8wzq9a4p7NTDn0sMwEPa2J6E1r9TJyAnUojD1XXhmSOZ'
+        'L57q4uKiBZrU5afg4PyFwdnVh4DHCI0vXwsngGouQh43eEvVj/tmOhzCX5/V7s/sO740eFGPIT45'
+        'JLooSxtBbof+OCOlvdtaFyo9WXGtAhkX8lF7EArd7ux+6opxjY2T2bI3joVboWEJQFI4zs34dNNO'
+        '32kCjERVLtdn/nZWf2vnvHJoyznleDGNC+RqCCvnhcg7Iou3uFUBEPhswj23xiTJLgDpkIkgRRNN'
+        'M7YvOUmc6drADMFZRvTMwOyHVo9CPS5ljM+ctruFOJLaMuJYcyKaqZqVUbkajvT14cLZ4C+ImoLQ'
+        'TfhmttYGg3Q4ZJcjSW/jzpRtNN28wK1y8T4UF0FJn7qIbcHBUi0P6QeI7j1s/ro1CHa1jz8tXJ7A'
+        'oTaEVnm0LeBD5RvhWWQFy6kk8VstNNENrKuzB0T11W7nUGbNKUkJAnlRnKXV3KUY8NADdbh0S5Kk'
+        '3XpDByLXszAB41tM1qjzC2dvP6DjsUZnlPeSBC6d2DVfCbD27D7g4VzG3V5HKshZKGNaqmx/3aD+'
+        'xbHFG3BIL39wcthJQX/dBAFj6XhSNlv7AHF2CsAr8DlvYBpW6MNJbhAuq6FJXAXBgyYQQK9Is4bk'
+        'fStHPz/FDxQEfya91DdQl54Bry18nZA84QZwuwbSuTLEcvCCRKITyH+xLjyY3xYLXi0pKCKBHzii'
+        '1zYjv7bkEQD7DMp+1mhgNIm0n3nV44Oy0F2Ny2gzlYeQrpQq+4XrBHPLpOaVEpW4ehMB069hI2mh'
+        'x4DmZlXbMt4tlPyg+BxQsjBex7Ocm64FTzF1+wfkRkUoiE3IKbAnF2YSQtLc33Wz3qpc6DwFOjA3'
+        'MQeUm3Bvarocg+k7g4+fmveDBRWj79diS6hCX62V712SY3ZoaI7tTIDoIgUfT5jkVfbJ1cXgIsFL'
+        'I87Sj5I6RmNUY6L22E654S+RFhiHMzpF3KBCyJXE07te/WNl8yM8QMz9QrEar1/qqDPxYhO5gfe6'
+        'YJm0S9qFSakGUY60aPqizgBTGOIZTEBqBvY4QhrWAuBXHLJrX9D4rRG/s3dY/FBCZIO9cPt12qva'
+        'PBPGg9aB+vjontR140AAfsgBO0m8iPzZEz3nFhw5G+qD90+r5gyD7dmKA1iRVc3fZ47mztoAZcMa'
+        '9CWM9cNIycjUFqfr53YfHs39AxzH0/5M4mjh1VGk1fVmXomMvfj7VomKSJTjIEPhBHV2AZ41wGZ4'
+        'GwKaw/ZTkYVHzrgux741O0dM8PQnCVcZ0TmeMZPWRoFyI2Vkf4qYPsKqFHGFS+23JxMaX0I4JxfC'
+        'VhxDCf+Ivcx7IvMyuTOeiv8HrRsdBjz4pqIKus3wrfDWrORt/T4GzN6zlzbBM7zX7vGci2Nk8KSD'
+        'sUSSMOUAzTvNJWuSth9Jse7zjyKJizrZobpRmQZU+d/OFHqDRL0/1FLO9qfeKV9reR/81YL9hqfD'
+        'XVuiCDcTqPiAegvjJbs8w6dUg4FGsV0hnbLVjDk/HJVe63vYF+lQBq62TlYQu9obYUPfio/hccBp'
+        'TH2HmAAxg0H4ZF8srsI0Dqp5tFZ8kpaAduQjff+32ryrul27tBwb7XlviEOQW4jOKXDBByuK/MVz'
+        'GJ8ONMUdTzo5FODrDd+OdmN1WEmEjh9PaF5dZ9tTj2vCLgF8vlvPj3IihxBjdhjKVPmILMwSLUo+'
+        'pIPy0wQVnhhr+Kzum7SuR0mZDVKiV/9/HH13lyjo91joP33ZSBBtEOghADJkRjvazNpJO+1ztEXT'
+        'rOl1vLfZpp2Yc4yDNXGx8SeakelLKL0G4mD+aN1ZMUIqC1CraIFOhlpaWaZ8oavig5HPkXIT9mWA'
+        'JAyUy5BBguJvuVf3qWsih70ldqKoRbSTY5OsVULKsn3103S5N+reBBT7xecJ1smRUM1LddtdksSY'
+        'QyUpOdZb1bJ3NzO9qKZoOuYT69zmvShH43Sj69YhdPYfvTxrzXxcE1wD3R612wQXt96nQCbj8r73'
+        'QStr5tJ24vyQeu+bJYjx6l0CKI6bFJTYSJJea8qkejyjUhXhP3LLclwqWNjdNunqJeirl84GAEWq'
+        '3R5U1kwF6nSiKG+dYTvccbJEzQqpPUhsF0P97Z2mF/xKEPTTxKDGApByzXVcaOdx+QtxoSJhkLnM'
+        'cPr4T5okiLeuu5ca+gQ6YLIA0GONLn6a5ddi5FT5U7gd9YNlCwlEy010KhNKLA4XPrWUrQp/YlrL'
+        'ZNWGpT68M1DtGzSs8KuMnEhhRk0RYc74h5XfHpQ12r6oY+Bs29J7pt44neF3aTBScQuX80OQ4JtQ'
+        'm+YlLX1AiZxmLX1WMYZ4twiTgT3cjtStCkybCEjJwxVOYi3quAzvbAbebYvGiP6MbePkOksk6xkF'
+        'GnFRNyNVYFYMBSe+LNWKEEgxPpczLny1zoFJq4gsMDWNUsPG6qXHrkyD+n74rNm+g5W1AOldgjQf'
+        'VxUsYD8JsXKHF5yMaip4NbuSypl2qNOIM4uk32tgv23y1qwgpBbbj03ria+amNT6QQ/WGn9OnQ3D'
+        'ifVe7kuTs1BhnD7k589EJzU0t+kggjH21Xgb/j0XWV63wdEeZNHBvuGiT8gV1asmd2N/7jFZWhCQ'
+        'nlU6CKHDbFbZg9l+ClU+KHzyZjnbkMv18SxdwreyV5Bxk8IWrNF1+CaqWIbZrtQTnVZynnc7eRQJ'
+        '8zJy55ITLy2uDZVHhqNp4hc9Cw0L59s+HatT8fjviMl65GiTLCCwnMWqQ0lzhQ3xd/ihah6sDFv2'
+        '5deyoQX+qMGJJE79FUW3U9rDd6vp1S5jXsBkjkKGRh+NeR+emnp1TwXfhtQD1XFKrWgTNf/4RoqE'
+        'KV8dkIwY+KQdhd5cRAj/FDYpFRjjgwr3givpHBP/gnWfNi7la5iOAI20pMoPtaeJQ4FsMSbTqd3x'
+        'ZV1nk/k5vRj6xUfuDGwDImX3t/HGLYZxxIh1V+6DdlsUqh1RgBw9q/tMzyoCkEUEJStX+74krFI1'
+        'h6JvWlAA679BR/efh4x8r24yVuijtEcRL62M8i29LQDBsOvZ5fbYv6RbYYoJcZpLMbl0VQQkC2Ri'
+        'McKRC2+aXBEi4VqOlkRfaopfH+pnEHunSrte/G+wUUO3P0Nc9XUROrNyTIULpJW+XQKERYUKLUaz'
+        'DBN6F5bXuGPXo56KhJ4ikKudj7ZKhr5oCmTfxYnGFuuq3b1hZ8SHvQlp7Rb6E2uyRVqn0X/QmUbf'
+        '6PVNGP2aeYd6pd0i6Rj/dtIBgMzKnZGolcK52Veai65SxDKWdaP+Fg/yVxFBKH80RlhIlmEPS8f0'
+        'pUCo6xp1gHmcxYweLSchqf388WzE8RE89G+UpO8cq7v7zkN4+RtWWocXX4tcGQ5BV6ZN3Bp8vbY6'
+        'GptHo0OGAaQqJATpn6QRQtmNH3Z6eg9LssZPGQJ385HbRnDcLLpfAd5L8JNzFuLo1k/CfyhF2GgE'
+        'UM5YNC3cSLikTeN749kyWl9p1pyx7V96zQp1Lxd/3sOIEULd9dKSlGiriNNPDBprINpttCIN6QXP'
+        '2NzC0wP41eOLxtYJ3ilGGgGyBRgtBEuhm8+j9t9R/sk1s2yA1Of/EkSzwjVRdb9kqshQkAHEN1dW'
+        '2/DtN0e8VNx6z82BR5WTUYvcMgZrwkjfhmxcUx+4e96WS19j+LTTtdfqEF+FdODyk40BwV/Zpxj/'
+        'qd+bwYkh5XYkqwg//FVNKcR902yH3SqIk/rUu8Iu1AaXJf628vtXyXenWJsL0byngjfw/PKZv+g1'
+        '5WvxAtZ3gdchFuNAk6vlfd1wEicMAV0gXZl+R+jTS9IBvYz+9qZU2kkKzeGLDdcEX+GuB1PJW/cb'
+        'syddymYPfiAaqU2ysqT0BvXv6tNp9xCJ6YUNYo9gn+pHXQitjORAr57W7x6zItdK8R0c8j0mnruh'
+        'Cz17Eh5B2s6OE2YFyDnFYquZdo+HH0H1LTkB9XrDjG3xXLTS0jXyiIiyIpC87wMbEDhgVWYynilu'
+        'DBlIsBUp1lgcJLOeGWloVfNNaDYRjW1vmg78rRWHeDrOlKYsfvBv26XpnzUrn61QgHdxYK11pG7i'
+        '3N/CO+zwCKr3vCCxrAxnJy868mDVnFTBi7L7S4fWkcMyEtUb+53OLhz1mI0YBp0KZZZ/J4rM0nzw'
+        '3JAsOoMYcMrC7VVdTdgTMonFLM5zZ7LWmRVNsL/NVpV8IzH1Ol56YUXdb78hMqCap7CCYUS8n21Q'
+        '/8MgJGTosQnA3GTBek2DQjkC7vwlRiWgktLAqQ/OYNf0Dny6nCBvN0/O4QFWNaTZWGueSl8UmXt4'
+        'bZAdl8DuafJrQkyu8ve+iWGQx6lr1TDHTw23S0hHt/OYIPyspn6F51GWZ/Gyhbss/meDrzsLvURv'
+        'FRj1k7e0Y0RgPtMYk7IerkSMs82Sq/9pAkzTlgrgzWmpZmvVfe4+e5fgvJlchPRqdCuEGfdVCAoO'
+        'nS/gs8X49cbb1a6Qcyzz2Y+N4xIwMeaXN9oNYV80iCSlTi/ecsT/EzthAO8vm9gEsvz+EqTCCoEz'
+        '+B3CsElps7DCSiph8yNNJcwBbPp34oVtTQjKQvCH292+svHy0bNYmN1ULoyUvI3a/wuUh6sNA6vB'
+        '8I+anIgD4FpyqjF9GO0oRolqZsVlZAsExCQdezCpAfxjx6RDLYPWVSKBs8JPatzwfq1jt/cpixW8'
+        'SxELct14dx371xUAjKMRb/XGB+HraZnmESKkpwTZFSHzSUFw+dqYoBk6wgpp4ig3kFwbXS2rXg76'
+        'H5cMmKrR52SD91En/8Ib3YA4FNIkgsLRbBJWbQmaZo8zpzY1ojF8oGLLbRrx0CILvIPISt2owgYr'
+        'CBo7ZQuqm7VeOwBYQUCelzjMSNHtyHXe0QFau/HXz8pLxEbUuWDJ5rTE73GUZk7EgB+KcAgs9Y1q'
+        'XuR20DZwmJETnrkH7jFYqmMyIvOXqOS7Sxm7xwSTkwdrVJz1wf3P4y6u0GCJPhlLHcettnAE60c/'
+        'ChY+H355kiARKbRu9BjQ8ovXvof13LTmJLc7h4V2DIoRtymKcWuuR02qe7LGbJJJ8ts5d2NAZpkD'
+        't2utblCRN+ipFIdH0blNWkoy7xqzNjUSRvW2CZvb4TedlOa/0o4/cPNq98wMd2bdYDpqy1WWUhjg'
+        'hUkpU+2NJOvU6sE4FtBo9+5HJ8sWZO+IgcFunEuG90ScT4VM8+ehHDcL/yNeHV3cyC+KwSgfBnsS'
+        '3jXZ0c9ricN1DEt1R6OqSP8IxQ/vm0wdNtMKciMM5q97nDl8Kj0Q6bFxvfNYxFdb1grH5yuhQQuW'
+        'qCceE7wKs1VxzLzrXiyCFAfD8jzMTuM8RUhsTeJRbJ5jY26N0BQedcD1tTOusj7VrZYs/uGWitx3'
+        'VOdRHspJAE2cd1/qzCr4vhkso59ardBA0/zoDeCJkDF5JNvqWUOX46tRcOXdh/yd6niRCkJoVxGU'
+        'ATUdLi2ZJiSgvijiJNrHOkzsXkRJt44JPDZMotfUcKsm+kwo2osjd6zLgSZsOVomx4FnqM0ardf+'
+        'dLa0D4DT1nd7/1DIENw6ajXutWOJEOBGteJ+1WSdw32aAFOwDanM0ii3ZM5WHXd1tbgKdD2k827O'
+        'sTJsNpPI6UmM7WgdFl3ANqlq52CFMS6jwOcSQInovUONzrPDowNxb0g283ZbnRdLJybhe6giVOv5'
+        'spFKAbI6SsxNY+v4hhfA9s9Pv3oQ1/tbi/x9CKLiCB+E/BBEqSdp4V6vKQ6fWBEAa7yllPjG/sFT'
+        'sExYUFVXOdorUu6BNlMT9Tt33NFo6xyT0vaUCoM7qlKvDSS8moaGIksdM9ME523MQSOaoVuKny0H'
+        'YJ44BNa59TVQ9rhAxPeKPzXB5lLCzRQNQCYkaVZ+5UVsmiAayU6Bzix70wUzIulZFVm4/9C+WjlE'
+        'DH5wgxIBq6zBe3f/3SUuYsM942D1IRA2Z7JDuVEl3uzGcNJL47Vs5KOo19GexuJb4DTUtT++j5fN'
+        'xbIq9L7Nx570AK50X0BgIg4DYX5BzgUomRm6szb2o35kDtAyYHZuH/gC48NVqzNll3AYZ9fNOyeb'
+        'MFcNS9AinwbKFBlNuhE6qO1/gfDi6db+YUkaFIgBmufwQvHhQkIG7etykDmnI4VIgMF0s+hKP5xP'
+        'YPPxqqkGusEM+WAQDkIWs0/X2tKWSrTFWKscw4kxxMG7bP3CF5Pb2tuGB/8FKBULWAaADgAd5lTW'
+        'vay3n8mmHGdHmu+/bRecnB9KQJwB5fnX0Lmg/V+QoSl8iOnbHll9lxW1rQpeNN77TfxBvhw7AMDA'
+        'IfFYWEv/L02adqZKx8XW+cofsBusHDRifCs2bQbaLOnu0Sp6vPkHT8XO92Y1zEQg1ZTaLi9XYmjK'
+        'roMOGdlHu8J+2HvPNZeJu7euYvNAGrUurxEl0UJFkdZm6h3JWWKNRabsFfGVxWV0sBQF5tyF3vAH'
+        'i4uD00gPGgZiKX173BmByZvj8pYzTskurdMTnSlMVMisOB54aQ9TCrBhYRA/entKIBcCr6LMVPYM'
+        'Q5+bFNjvR376lO/423CL9jLcL+kAq49+dl/ZLmqr5nOeg+Hs8kt55ewtSkrrjo4U0ykbt4qEDYv9'
+        'iBbef5K3uMiEmaYvGkfDbIlcBvPWnOZfJrLIQSxgZ5CYXBBzAYAejfRAca7bJ/h5R/4BOQfI2LCM'
+        '44WB3e2xl1whOu9020GpT8Sp2HW0jeiravUNI64tUyR1bgnbj5oKaj2eT0PR9M26JR3mpfIioOW8'
+        'Vs5TPc9O1Ai+P4QmyC1V4mv0oLxpSUOSDQNtT2R8Xe8JaGh32BeL/x6IuvVTxC7yL0/h5U5R4y2p'
+        'cCjLizGxF465HslETKa9Xigt3cIXR+Wtgf6XJI+uPwImg70F1Uy5VDLjOi1rNmihWxWxB0F1LVtp'
+        'sMrUuBYhKcvumvS5Jij5kvCNKhBHC7nyPHiXoBlJldlzj5xFeTWyUCaoIa/exPEZe+PWnIGAYqSE'
+        'PTwUX9/0rVlJ7snsIv3mkgI968mdPN0+4hOnWD+YD9Zd33mDfX1NG5XOcjeNZdFI+/GZoCEmVTTy'
+        'uFzYCkmEwA0BiTGdKQBRYBHtk2KgYtZ5l90Dr6DnGFvI1VFDqp7DIOvGMnNMW5DPCpx8ZzEt59ph'
+        'QgHAjmiC42JK0WudgrbVdSBU6E0NKn/2plwOpM9fbmYf2xXYv0c4Jmf/xozq8enyiSBZNIs75mPZ'
+        '22E+1WMloF2b8GEo+SD6Dipexa8Xg26amhwyCCgypWylksrPeeb4GVlUFdXZsQQlSz6PVkiaEP+E'
+        'oEEfFPs5F/TSnsqhxa8E916YFjrne8T2fQ9rkY3LYch11TxajZchTg2eU2IDRnLN8fB36ZCczvB3'
+        'Lfv0WMONsMGLLLUk1zlu9zO735EaMVQM15xxQAoiB6AbymBh6LtxvSdHfE7NKGbaDQlKuHOwIJ2D'
+        'YGv+TKTXqkxLJPjbxiQ63tAryInC1P0RuARt9NfK4No3GGdCwY3YM/R7YIWkLNeAAyYvKjq16Ybr'
+        'TAndWoPG3tqM6E1cSG23EQoGGllEN2qJj1Ch4kQP5MHGWhzIsLJTQV8bMqI+cQokKpItf4kj1I7i'
+        'CuxhbJ86arqLPyDgY1CEvKtjpyt3b4YNEEdqmz1mgi+FWsVk31jrhe2d3SKRXd9jfYU/jHjOlZN3'
+        '+Wa3YIbDzJ+nZTO0fQhXv/kZNKVrwSANMuwiWtBdEbAqnB4u2TbfsFiYJK9wu9rNncOM2U5mv1XU'
+        'CZlbO/ubrPuGd4GuDuVEsa01+E10ZDH9kQ/GdDmxgL21E5V+fuX5QPYtdPFgYGor01/Qqp2f/2pJ'
+        'SE8Lo/ZJsJXT48irC/T2qp3b3sM2qUeCJ0v8ry0Hx3zsG3Gn7wrIxKh48rhCeBMfZ5J+FER309El'
+        'MX+0dYcVEtyvjhyV5saQsQxlIg8ftD0xmq7xqvCWcwb2+2NgYU3PvCl2LLu6hi/TJ0X2AZLbgts2'
+        'AasxGVf3AsQn7s9ACZUFftCvmKva/OQcGwwivrNTGAGNy46HjSCEo8nrQymaDrEfCPtDuh5purQV'
+        '2/f67inCkaHOnPWHm0bC8YczchJktwJxZnAwHCLiBr1v6YDwIMS/hjjUDg1qkId0os9iPmIRB/Zs'
+        'LesUaTOsnhyybzPmGGpu8CkqYAQD2naUcjsEwT6JiInRTRZWgHrs9lmdegUjRn+H/CYVxFgbapTu'
+        'FeO3vk6fvCm0ZohMFN2BFHNb1JV+DIOCLdE4t9n1x6I7YdaJSPxoQj0Shi6sm126OHXAc6wAJ3nE'
+        'ODEg04AvAVvrqGlNMbDZzyNZJ8r5ViwHd4HFgOyZwHCp8+Ka9U0eyckkNLSBUKr+YbJunl012t6v'
+        'VQAfmnMrD+1vb+7uglOAT71jfP/AVA84AjDbvbgYAxOpua9kJvcz1bJEbiP6T8UxO20jqKIcD2e7'
+        'lAUo5jTgoGV+K02oCUTo57UMBigwOlFFTeSexSRs2xHv1m4bdUQYpersH/pZhS1TAugGH4U7+xr3'
+        'ZiIf7p5NI/HYVewj2fHGulXrKP0HS2nqJKoGmoiCfFepVkaUzo7dJIWyIqMSj7x46mIp5Rvf79cH'
+        'l/DFqzwoXUKqC45RNA+Mb8vxW4RaoOCh7kOuu7irMhIN+9OKLw2AgZMdaRkgA2fTKLhx2waE4QyS'
+        'JZoDPrLdZJ9Bk9jgfFr3I/TVYZcO7x8zsdRUajLanTOTojXt0hHD6sgs43+w6BuV75+2PrYpzd5v'
+        'MGeVCzkivmKwTzGOtLy4PDo5d8b1D68Rx792jBDp73xKNbmCq9Xfh6I1H9o29qVNewAHjvv2g3QD'
+        'UfcBqZJo+BTzGdx6q1vyCKGKNYcMZYpwUdPQqDUKU9GJM1BeIn6pLAEICZsM2Fg+r18JSU8NxEIz'
+        'aU3yNPks1j0l80OnMe0DbiL24spqH2kC33uWOmZIvaTgXw2koKB2AXCoHPrDx/WrsQYXLQ32FNWI'
+        'j4xb0aANYeOtIykAjnGc1S7h+LwoRuvIZWvHwy9zOUqvnNKj4bb7laKRj60L3wh+cqheHsCDZytY'
+        'gfy8c0isxOklYDStjheDm1jYz02kHWeyLK2Ppk1f+cx5HqmHEpaQqhdzbEzW5sGfarvGRBI3JqD9'
+        '9m0e2BMFIc45Dab7I3eEacq32n2cjY3fjFbjxprBx7Ju2r3NDEPw4T9JZcFNN5grF3ulg3PEN8Lt'
+        '8RqXsRDWJy+pQ1tznelkJ+XmTUuYDFC1xpTkbkGGGV8HKJBZKx05uSJrq6VOIGqWizUDY/ikGIZH'
+        'fVkYspY6JIYYfroctBf8h+Yr0P3dNoKbyGsOkN9xTmLAqC94IbgwmMMuFUthafFk99HF9MLO+dvX'
+        '7Rx4UalFPxl9KpaPCI3uMln2iCbDw8wJ09VsGZK+yJxYsYfg3CGRC5bfGg2rrilPJ+E++PESo+EG'
+        'ZQNk6Foh1K6P/2P4dqFSbhw9NZ60IQxnB4NS1FWwTuzl5oMTplSdZBg0w7dAp5sylVSiy/3IPNQW'
+        'P2PNWYmElLy6yN6KqPAUIImiowCikeaQf9mwN/Ya546QaQrOtSoe/ucAbwUkiIv82Tlvt0Wk+oU4'
+        'qoi92eaTEi/R2wpsOCJVTmMWQJhAA0l+dFS8s8q+uuAsm0BgjbpaX6JsPzYOF0m3CyM03rBW1C/7'
+        'P1hT07cH/S4DVbiF/t1OdpIE1kt6Mqxhaofs5KpAOdcd27XdKGXGlvhETA0XusUJN+9N0wv+wUDw'
+        'yWjvKm3oot5sDU2ga0Zncm1COrzrs7Wuu2bnWh5NX6fk7SSZqXPG/wBnonfmHHDWJVxZzNpcO31V'
+        '74K6M8/8oa9qgIFurqWeOGeyRigGnqjzonhpdbRJsnySED4zhJiNxc0XA9C9TK91DZ6JbF0O3L9p'
+        't6LLi6eexuGmei62krmU6VcsO/WoFaps5o9S7gUMWtqvpDS/v8otcpK4Uy5Nc2Sw2EWbV/aVZtxI'
+        '2U6uMniHe7nAR1IGV9D6+LWb90imwfmFpEmhL+l3fzHPkBgSbfe9NFNHn4Au508ReWCZzFuHLQ+O'
+        'jkz/xJzpS3c9MEgWq8AdO3jmLYGdWPcQhpJqpraGwCmBxj7kk0qMftFAguxN0a28VBe7AoGBrTi6'
+        'ugxVj0mP4pca1KL3K4/l0dUvq5KPiNTOoZswi1JQaysfJWTJPla1qWIVJjUvo6NSVOEDcNxs55zF'
+        'nyHRalMOspFqt5zWvu6LvJfBEFE3Y1unv5qdSbOz6Q0Jfyu4gSeiGd57LeQEH7qXVIobz36E4diu'
+        'Y50JpXFWCs8FAR0hDMGZyxGQ1R2rTGY8CNPjfHokAUBti5EBiJZcvU7FM85b6WyYfmzcNjKrS0LU'
+        '7usfakEf3D74IEFU7qKrrew/U1pD70PiCGvHow3bGM16fQvm9gK/xpzfnkWG/9cj/HphhHjjDzvH'
+        'U6fu8IwC5ej+dfDib/+ydbPEz91DNRMB+l5kvBmEqtJ7GyWlNZwJUvCSTTJIu0fmaWKO0bJJiol1'
+        '8Ad+5MoHRPZfhdS0CEHeOBTAJwV7DTE8Vp4JK40G+K4Eh4881OMxjXGWHCIGReWnM2BczGObIiV+'
+        'xZMLPFY5ghXDZejBQ7k/GHFwiGbwF9b/Loiu9ewkpX4z2dDzSaSu9QStAzT5ONdCZVUQv6SWpq8w'
+        'qGwiNy7ecbHbirGYnaZ9HxSTKYKc6HqDYxGOlnyoFLnDyF0RfkHGWop6AU3zIhVpWO3fm3I3fBIq'
+        'Kt/Q+IQpIkMXzjXYuTk27tCe+RHdhPx3TmhPpxE7qwyJRe+XHMOtVtsnYlEvKvrEZ2lSgDqcZ3mh'
+        'A3LvqAqZ3Jsp0aPEuC9wrkeazHZ0j/c+D46+D/lCKU1cmVtyxN+zk5mjHHC2EwHLkwwTWjmEF+y1'
+        'QtlblZzFjMmOUPXbRwvTvcG/M/bUEqofgtAknn3P+RNNKya2mbNObcTWmYK1yIHGZAGHYJL3aHFX'
+        'GtjHZuYiE81Gt6PFLz2eZA3S4IhIuacra4DuVAFoTOg+AxsPrTNHTW/8JLCu2L/JRXsZMdkI+LsM'
+        '1uExgDziVo+YN5bgbpg+1s0XeDntKCkJU29lw8Bnf1wFsMAQ4EtNnDqLg9CK3bIvYdcZ+eQiZ5cy'
+        'tTra+/po2fr8oG1dxnoQpNBGTTfifbuEAOUGLt1FmaFyuN8Xxsn04jQdptkBy9Jrz8tucj8MhEIU'
+        '5x8qz6cSXSj+QKHbF/SdT/NMowGxc2O4HcBtaFdfX45m5lsqZyKDiXKgUtFiI8u7gBM6kmITh4CI'
+        'i4KyjfQaamSMYF794hHKVYvSQfLHM06NDdbLi0sFZeR1pTBJeESPoTi3Gb8LvAVKmpR80D2gUHmZ'
+        'ttucWQgRL+pJamKg+PqVRP9lT5LXvsF2LnrcWGsaqRxIWQihv8wkoX7gtcnZUm8GWefAYc1Udap4'
+        'AHZGsSl4eKzavpfUOXtdKMJNuL4v40FSuj4x6LpTFF3YcQaxQIzzaQGt3U84pdio5hCH4aSA1wZl'
+        'zJ9oWlfcKkqB8TeLtY7Gmfx7yiLsRmi7RhEcq983QH565ZPaGM/y4xdS3LP8po4c2Vvt+H46DN/5'
+        'WGH/PkIgP7wgMffrAT/ILDzyu7M7KUKsJcQ65V/0FxKrmbkpnxBv9baNH7hIWD7gTwOAmfQxoaif'
+        'rVlsfAiEnS24ndjIt8QXMMcSJIAJI4B6n9X1MNTzHazqZCrBgtwYV6t1eP+CUYevacZjErTLFHKb'
+        'DT9fF/8aGssC+oFK8A6ukaqiP5tN+2Zf69BhjxAMHDxuwcyb/aX2uSVFfjjQa9H5fIrfLiJ6oP3w'
+        'FFeCRuh8mOBu8pz64f6pNNMQxCFKByIsjWbQFQjW2TMx6Xt7+cHf294fSJSJOp3B/FP/VTkic5+f'
+        'RscNlhLNYYr/XfQm9L0NHd6M1WOqGAwPWSAknUkGNe2UMLY1YpzI3/mQfqxjinytUsVzN+ivAlyc'
+        'Zf7JGR+Wg9dg4RkjxGvcrTi9ozrBQYNNiF6pFwgb3fWf6bT6cs+vm9PzYYHQZwC/4uCtSczjHq8W'
+        'ObYEGP8Ct6Hmg5FX5ZHpLFQ9egSod4RjdVMzHS7I1hn5RDq/LvAfPkvYoDx8ZNWk2FPI8w3KhumL'
+        'lLp6Rg+LYwtneI4Ft1UdwzV5vLlmIym3LXHxA9PhYDJ+jKHws9WXIUWpSZH/rdigqUcSWbyuvFHB'
+        'KIEo/tVhWU9+2XdpVNevTSR7hw2M3xugBQnsAp4F41W2xWCIY1Zh1gymsUdWVRhh77c1eYUN6221'
+        'nNU/uAaFM/f3vxMM7N2H6X5aIFaPjPqRel9QRA10hsMaE+8YJR22Oopqcpv73q45KFVSjqQ1K6Nz'
+        'v9TiAZqSo7df6la4GnSgfo9tVigiK1rItSj0AomLw2Sl4gAJrWCHMvD5m4nQ98dFWm3gi0hS+IRr'
+        'uND/ysZaUzuDuvr1OOVhhWgqT4tOluYRP5iPG5f4AsBJJ+vS14Jjh9ORywM9fKokUEvSx+ndIQAm'
+        'HDqvwAs63aD2Yxzt0RHMU3sJpUYGokIFYjo4t1Oo0BGNWzRomehyAAuZFlhrZihPbmHJIZu+eTmO'
+        'z03miwrq8e7SmKnhEr/YFJNEqwGBAPg9Wv57YNmbX3L+Obmu3IDq3F9OGLmaO87S9hkwGX/nnH72'
+        'ooA9Tkj92AV0EgF4cnjDAr/JPVDnQ61aikGPeyglvAcfJlQTAepXNDsUYfhP99pvemoBGR1Jzcgg'
+        'mOQfthlnlifWFjpYYuHKbV+hGuw5PUG5Hmexw9oUrOIyUcnRMK3UDOm1QumTXDzZlAZ157lOFDOw'
+        'lX+FzxZXA4317sR8fr+Q+RfsQCpUAp1qZYt6llwQL3CRh+S2onZ4lkubWz0WL/11txyW6zTFqqrs'
+        'qusbpGW4i/eMZgndJ0nyXr7C7WevHRRnbTxs2gTKgxaHuR09T/UlVspIHpx5SMbRUHzHcNetoTq9'
+        'kP5vxMttWyc455rcVVRXhPHQUFIyDPEWVMNIBP7fqLIoffgoSIPoA9btI8nku8nOV+JfjEJQBYIO'
+        'B88kkzEIex1PDfkXLqkLkfSxhQ2tHPLnExeuNIhGWMIw2ZMq64b3m8MEvgKsizty0EXT6XjHU7+n'
+        'JbxEochsDn1CJ92exfThG5EJd+YVJGj8fUWuBp/6tb8fATIFSpXZBCO+3nTkOS9lhI6yfdZJHcuE'
+        'paJ2Z+PoNg/lRHMPL1VYVoG1pDH2fbzoSa9KihaDdI3cBeR5QSKq+n0BsBAqIjphcc2+gIW2jzs1'
+        'UrUWOvJjx++QsyhXM5l7eNiP/JSOeI8XHqiljv523abIu3aypF0xprIeIgLYTMeaIogc7hFJxuRM'
+        '4ZJ7lT5CDb6LAWzTYh8RxITVIutieGChiQnwUTpckjm+AG+P7c8t1lpRsKww2WB6fnxxEdt4vlfF'
+        'vCwsmD9tfQtoALp1eKp91W17huezhvP6ntwpV6Un37ErfRvuArAAeLioEty85MKa7XgooROU67pL'
+        'TkzFPmQ4uoNhMa81T/STYiAP8dkMVW9WVcCPR5QbiZOSv3laovH+xaWke2FGgLtijBVLmSzC5Dfk'
+        'wsw69b0ByQxb8cSKc//it4Nnmv9+eJIp6q41LxXo0JNzf/u1K7GjwuR7GJak2tM6ZA6ShtwTs+ar'
+        '1ABCFLROuaCtoZRoFQd+TCtJbiWa8MAQN/Sjgm70+WmX+kE6TtHVqCvUvGd+HKta53weXt7wl9ka'
+        'yWUq4qYNZrTw52UNt/IIvmC5j+2dWxI583hip0cgRCRQYiAly0iJMcUjhZezuaUvtA1JRd1r3AdB'
+        'ocNGaRSTw0FAcBRXEjUgU/IK9y8QiMw38mMPgw12vClY6t8VYuERBmXt9c9O7jKYGCd9kl0WhkuY'
+        'VR8K1emeLhdxE9N8JuLRjuh7OvEIj8FgQzAfAmT0fREljLENGpTGJaKwYx/ZPO3CFCMF2jLDX9Rr'
+        'xnC3JprQHoRhN2KgrB88MmlWKXX8a/PpW+m3oqlGD4v+YdVb4clrHFb+WP9BYkB5I7Z8Ybjj1IFA'
+        'Wgqvt5aSCfnuGATK5a6503P21Ockt33TRDwS/p6yu/JtKBF0YnyVxBdz7BHx4yfr31kUx6mdJO0I'
+        'W2fekzxodV8Rfnw+KrXUuJXroD+N298CQ/PXckcfmalkE0ghX4GK/CJfQ6tt3qbR3IV1q6dhBFW+'
+        'uTgqZOBr3uhHwhPRh2TqjQIY5D6ZNZ3Pg2BZUyN4uNFxTIwGzydsNxSg8rC+yJ6c7wjPOnDTe8tz'
+        'ArtnLkpbYaEA8zYt1bwNajZ4+ItyNf0kexHccJ2vHrCPdNU0LHhr+jnuy2YYmfS9msk51r4XVN89'
+        'p8Fh9D8R26UduFHFutb6su8AzWMfMbI5DhVAWrc1J4KJL3hSQW3s4sE7bLITYfLDwx40oU+gfpI5'
+        'DfPNPMIObcb80CVZ8OpCXTVXSz0ZgJJ0TJZJ4t5soQjMYNICt4YJd6E2h5y+TgCBUddjPS+pQGsI'
+        'RUTBOhjeY/n2H0JCvBTXhRYuoIdWQ118BfcPwbYewSW/D/zmutADD88bTa97drUNF/Kf+Xp2w6Rq'
+        'xDbqcy4F+Lxl8DDnlaUn9+1rxZDvknR8F/GHVj+0tYSA9LCtqJFMK+nhC3LMM1wfKCmc8QcJTeO/'
+        'HmhdBoXnqziw+wBmygKYYmMFTBHWXR6dcZqv17sMWi5fuDYcZYap2OoIy2KelDy+glIyxVVdB5nd'
+        '3niEASYY/S3KdlI8Asdm2YIdYdGNAHMVbQhD3op4DHj3ucl814x163poHoCkNr3wom9dpP97AbUN'
+        'WRwjBerHavJiTaTUN+0w+hN7e9Ha3EHk7WMmkzOyzcFBffUD1d3LMDeLRxTpsyFQMM11ygJvNE8/'
+        'SyxAcqgtEq9xA8HIhaW8+65DiBO7mXY51qF8FT5ItJ2opevEdzFPqlA7qcYyf8MjigwBq3nU+C7P'
+        'VV6pqBwTL6fOqmmpft2VNRpeQZTS4/skvI/UU7Wk/QzidMlrmPFv1dnNEufZGo3peHbzmckjrs5n'
+        'ptU3eTL5gufGkwj3u/nxnUoZdTrh2ueDV9l5jVMaYKzDvjwddA6uD8Nx/sbGpQXwCVMhwQj0mzYv'
+        'GS9W+DAQQO2PlMAbpR7MYVADASovDU9bYOHLfoldJ0zzMmugX15RkiVIVoSfpWrI6T90dvoqUN/o'
+        'nlZdvZ/u8AsoGQdQsA4uELS+He7qgTBOQ5Jtv+gzxCqMW2oZJJHHzClrnF7xfi8TKpllm8/2+7wC'
+        'WCQtex/uZUdugj5rFDhH8DuVifp/4aR66N1AyTymk+ChPQOKG/jJeyJpBVzaUUB61VlNPSeUoDzX'
+        'IcIpxxf1TW10yVY1kgSrwKDdUYtJ45IsTZgmdgioav1zuoGhr4rZGeHM6kN47lyh4Ic6EEklNRww'
+        'X/94cxY1C7TxkpPLGg/wCC6CtAw/VgsQF0/sH0WFEt6yYzkTSY9ECvoFGG2WoyYy7cOb8N0RsO2e'
+        'lZ9Yau0GEpnzLa1YGlv9MNFuBmwydGJAq2B8JAJLUEkEhnOEN/nnOvMdMTuR3kbhe2CpOF+Q2elL'
+        'TaWnxwFm1KAUrp8xGMLwigXLUoEzuckJQcUueNsb1ojHLT/nLGaqC3wIy6Q05Z10YpoIm4vQWuGC'
+        'SeBVtCULDJcuFrkm5FazIvPRs8brVp6OBqs3A2ozErtYKBW8l75ee33ea6wnhQa6XqOcsaxxf8A3'
+        'e5DEa2b8WqCz+dsRzUn03pvzOHsAFEKFq/dWg1eV5i2PTpwlq0xFuezbMGHJaXFE4ePbrfXCeGbC'
+        'GwgXXel0dUM5SYUsfxn9YKSZ5xspnDvx51W7KvMihdK1Z9J7d1A7KZWxwWapC8jlxDRdpI2n+0ur'
+        'LxKRmoXA66z+29pUpo4ge98NhfY68JO1kB8U42wSo40LiwUwdA0ATdpa/Cg6RpSFjkCt6LK5S7I+'
+        'Bk6tWxKRZ7f9Ah667E1/lSQu6jpdZ8hpFIEUcO5ceSgsK2w7m66/oAe10qHaVKiJAFOrKfbDF6QB'
+        'vycSM9vZp809tuurXbXgl95iOUQyD3I1SnpncQZUAtXRLPSTG4eVvubOMP/kwKhDr1feV2ItaV/i'
+        'h2jnXFUjbLpUzWU+2jO8LMrJffEVxrs2BFxL7y49nc1MqXSi4kLlDHUsl8yy909IVvIDC42hTOXW'
+        'YqtgyZSHryUUBuX1MLcxwYlC5F7JSn1DDpS4xnePSIvX32hDrsya7W4Okq5uku+DEknJZwdR6bVP'
+        'iubmeEJSx3LgxV+n9Kv4vfmODk4erNNcc0m6odmn/w63YYv0osjSMyFAQcrSjfheqvoBizDWMnXg'
+        '3q+GkGikiaHao3oL9y5LdZWKo6HbIc4bBuHI/VhMRH12b01Bocj3xRG7g1NtTZLOUwBXNOTf3g9T'
+        'BoiYgI8pNQUZQxGBZby7S0oBgQlbTDyWIZgIpgDY0tBmDWVxrfyI3nVBMqL4dExrIRrinpxdQWwV'
+        'cVtEivYIj3pJuioT7oU6kmsBzgdmk6EP7HqSzcOaoB/nQjTNCgSnHBEmrN0O1PPavXh5LhlUDjMr'
+        'tLJtGwK9K4trr2OLIlQ2azlqYhSfEfKqR1srK+la8/lnotkjEjJmoLgDNXN0W5md/+Kr5x5y8RdK'
+        'f9b0wlUn7IwXdKgrr1fUF0y77l7mQOBnMQhwrCqZz184JwGYjhcQSMUietCWxp32L1eoJi73/5PH'
+        'V2GCkfXKvvp9DcTiGzMlyryi+9IHi3gY00iNJG2wyIRAShSFna0g7QHEdB2ETOzDIrIIKbSIPqzC'
+        '2EAz4rqsAkL2o0LULi27+JyJi0kr0C9o4I1hJfmr2SpyEkN4HEw/xDKZxBcyvuQjmcK7AB0s7WZM'
+        'V3wTDYRGLWCJgP4mligqi+E3mkZA1gfMXieeJFOeb422djLutSaUmagC0/rib6HPwzonRPq+piQP'
+        'cr5M/rYDLcimJZt5AafOIo5xWpGIR03QxTtfmv/RUU0Wg45Is8vdgtY/JeUntobJFcGFiaWjZ4bb'
+        'vP4bk2qrFQOgc1U9psjbyU+PVjthqrVjbjcGHD1lNzZMqF1DKzZdWib+k7Zf+K/7b9/gdnKpAwaS'
+        '3hBiltvNBBZyRrpvpAbG7MzbPLMWlSpKBxPhpMMi9SilHTP0cf8LDDxkTHoVABnA9NflFlWUCgoA'
+        'jdMET2lTXXFmPSDTKvzLx1/sA8MXkdZBAZB5dSOKTCidY2r/mF1f9cHWve9/NgoqXgJ1DG65cgNj'
+        'mRv5LHhD94xSpI4xl5oVZpeiDRsS/d9lb6g9wt8bUMxOj7dxG481tUCt0pPX9AQ3oJvedVO240vb'
+        'wUQl8+ORy1V0+tJiHwD+2vBlgvJT1Jdd/APHomHHhc8ZBiU221mWFg/RBT9tu0LxeQyuoqyVMFmz'
+        'k0s0uNzheu0y+n04HjDDXbLJxUSLKbeA2qQ/ruBAxRicZPn4G/sdnYWOvgW51yOpd8LqYJJsuIW7'
+        'yphCVvhlP+2yzFMlRbfu1eJNB57YxK/mCXKxjNJdKCVuk/X028kHqTcuv42Vovedfl5QX5FUjnt2'
+        '9Pum9hwaJMkye0DVkFQlS95dciLTIj1YOBLfSAQ5M1n0f/8MMbRU7d/SsHWOZqrv+zDEUAfFU04b'
+        'bPZbNS+eUQGNf1L9zgbQOstirN3MrQcwqM9wudgDpQQWW1p42myj0xkp6rhDigAJ7RfaH3GTzaUb'
+        'hYO7mrRosA219+nz4A5KUNpFgrYrvbl0lTa+/Ow4OuBLEISzt2QhGuOP326kpz3cmR8Z8aGO/H/u'
+        'yFvON5JWrHykLlv86OYYv3F8OI9VWGtpUNgZdLhOBEeJBMEGGsP5k+b2xlF4lHJ2oOp+Yufr0lmi'
+        'VE1SInnb8cEG/65wjPlKiZtMIt2q0BdONJjp3UO/deMBH4woJy1WNr8ReYTY4MZO94HTgvBmGwMl'
+        '3kEiIh80GMu/XpmaquISNK+Zl8+7iKbr/+xb9gmVvvlT82VhpwrvGUDofEhzGHgYp1i2OGXeglqI'
+        'qKcatc48e4q81rWBKZxX1+mu+wCRyyak2hF9cBO6udnm5LQYKqvWA1YlmD0yZdSE8h+1WaGhgqWk'
+        'RizsE/RD7OywilNJj0ud/QhSAmr1EHv+RBEBtJYZzyTNYGwr8LEpQgwLpVcF/+Azi/nUys9VSbCP'
+        '537t3hYLnE5BGsSF+JAkElGMMn4HUM/16kdCKbPp63ZL5Eb3dmTvD4Mjp58cGnD38873kOoCC5Ji'
+        'vbx51QcygZJgviXK1iL7R7S3Cn9+y2OAk7pXtBZwHwPsAOE7JzPmQ06gYHh0mnI+Cdy+ASpcSGEk'
+        'HnpDnFl86xvN7haGycq0GdtYUZB0+6rzPj38217IHJWpDjp5fxITUhEzEUmG+51EZ9UATYnz/17R'
+        'gs3ALxn7jg9fvvfLQrLA/T4r8lUaUYiziYJcOv9eijU2VR7vsa9L3bbSp9LPjdWmrnuaGQQsV+JP'
+        'kfMMAmoZWC1x1GNiJx+j1LEg9rx4wYLqiwHxcVqQVnvC9FNp2a2YQsR9jTeKhhgCP9F1mRIg91Sc'
+        'Bb+cMnVpA4W3V7K2sjX+mEji0UQgK9U7SiAgyt+rCqjpcJDpDG2HnztX15ovIZJNF71M2ByZLDpR'
+        '32SBPIx3tQ3brOsi2RVcvgDYInoXjAj0Cmfwo3wK82Sl+7uea0sZvQ6RmS8ImtQj4ur9oEds0CqB'
+        '9izwvqHkzVuCnSGhFvyZfWx5FMyk7sH6BthnNLt1cb2jDD/k9aAO10LOIrv/Wy9d+/3QrZNiPIO7'
+        'qhdGOe7QUlDfxKkq8512PWVsvEQ9PGDTKrmHEsJOD1+RzKTd/Ku8O6/e4EdnxrLNRUnful9zP7ua'
+        '8WX6Pf8kWjHi/qCdzpaRv1f/xQlrf3/hZrCDoNxn/LRAumbhkSy8rX+KisTr1055lVzqKfn4auNs'
+        'c40+mqKhx1pWLz+bePC5GoHFwcVmnX8fW4pgL2fvoFxXBoAAWPK3hmnX1ukT0e2v9Hx6JQWd5F9M'
+        'ScZ82I4GiZCpyj5Ejr8eZfqWxyzFSG0FkQT/73ejFLw9Xt+fhJ5XmUNJpwufyGzY22vWhkIcIj82'
+        '+jkKVaurU1/Bg28kWaxv272p7S2JDmJ4DprbWJHFfMLRgKUsSN+6EY8MaI7dtitfi1F1BN54ETQA'
+        'x0l6+1XECJ+ZtU1Z91EgmgkV1r4hJ47ZWG1dfLlkkTfUZC7ue/SCwMSXD6UogvT6B8j9wJxIll0Z'
+        'HmgIJ9YAgQWcy0xztBpMTKShy5prDwm7FdcCX1QlP30KeA3C68TXc0jwQ9CJCymdgHGvWpjubkIk'
+        'F9q1g7r3AgX6cr2Kngwq68twrp3B3ac8AGx+wv8NuYz83enOms121ZSoFSXYl1+o9IMfkU8OHdRY'
+        'tgoFfBMPlqnFOA6Z/sK7TYkmXveJgQJ9mZrphIP6bxe6Wl/1BOoomIlGJ4vytaqrNldFp6DN+PQj'
+        's1MEAvbgRKTf+ipkWKZFA8kKkAh7dKrTK6888MAuTPCe8olJOB076QOLQjaufRgVCiTtMX0VUtuV'
+        'UN+KC4LGc3GRn2ifXoScd33CX1pFuG7ubCAtOchfKvJpmIzA7LgAlwr5L7vnjEclrJ1J/GwKJQ0A'
+        '4mCJRNO4L8CqIZVxdBTk9VRmGDlKTws884LQBish34ZY8Xw5O7U/Uzmzzhtcfft9T+IMNxybkfvu'
+        'J+fWDPfovv6cs9dI4Zntuu0qXOgVZKAcZ3O/wu9AQjJuD/Zm9o3DdDYn+jqgOX85L0faEDK+OZuw'
+        'gEwa0fOpnCqREMr9gyWpgD8+jWq9j13LYU/nTiO8YEFKYneVgIvRJZW2ubMxXrck7oJBXu5r0qQQ'
+        'XkBBj/x7xZ/giEDAagzHHwZQgJiaCjPLA8c8FyLSd1Y1QdGKpg3UWrAGQuturFqE0wE0pG/WZzzs'
+        'CD1wHvHHRgOXq2JQ72ulLCdUAt1xADMKUffsnMD7Rs01soe2oO+IRq1hwOMlSOwJa1dQcpIYJSdT'
+        '+eyg9a7o3pODPz1CTNhnYzR8rgD53ge1Lvkbkawj1gaCrr73qt/zMZxLTRL6eu5BwGMhl8ukgqSd'
+        '5IispIogbv1aGLpPQtQUW66ql9iGWua6Y4I0d3byxQ96qfJ55VJb2xSoqqA8BErNhn715LQhT/ID'
+        'jeNIKsJEqp1zXxaxZuXvMSciU5mcRdUmE+w7Li3iDJl3Xo4gLzjNUy/wFzqlHP0zUkgvJL2IJgTg'
+        'hILsHIYh13d2tnP2Dzu4klA8tNZmeQxdoviNclDcxhfdzQYiZge4ClOqCyuTA0qh8u7TAuRqFgvt'
+        'f5zkF09kn2x8DiuTz9kmjUtQj1w7mw8ETw3oOSeAhNl2OKv0mQTqVjt7ZjaaMVuneUfnwWj4vy/i'
+        '+Ymhu3ltn54xQUDM3IZo3RKAF1kVxurWjbWORAgJbTZJ613sXOns+1KcACBVCCahNzQSyYXfU4ad'
+        'Tb6XAro9ltxHOmp45nCCgt3/bM8196oFNwf6TnLEGSSRnTNFGC/pefATx4LO1BYjf9OfPis9guUg'
+        '8IZOU8ypEcW5RVuEu7GbO2HK+07VdtpTEjy5jxO45ZPxEtOmF6IjA+pSn92dGgf8hLA0LVVn7MGj'
+        '+wWp1o9yxxH7XyAfIfuNBFa3neE2+Q4CMaCUHgJRM8W1ttVCUdo8E70dyBeft3qhEYETuneYSa+H'
+        'URC27fdjQosvMop5g3bzqUtTM7ygznHdTV95u8BzlmkfldRiEj1agMo4MSfBLQxBQHZBZQ10OsP2'
+        'sBijStrvrhZqB1Glr3EqvcY8Sab1W2zotlJ5pWskh5bFLs2OKSioHSB2pNerfgWsku1qk0QK/g63'
+        '7suzp4jtgBID6dpP/+bOdO+Q/iq/GIl1YSaB6qCrqOlv4QmTyZopN3zHpWyvgNs2h5TRm4URecLY'
+        'CeLHmaR6aT/JKsLGkBMyQqFQocqAakSSfuow7+6Y4GTtb+jtrgI6vvP6m5T74dKPgwRAyMMKAsCY'
+        'xV7p7y/j0fbgtTfIdUmH06es5zVS45GfTE11AWymPpewxFUoOcqwfvH7+ZlRXNIXiPPErL8k72av'
+        'X/FfXzRrDdwbp5ZGG8tyusugeCme757iSqzmpiACeax2kB5ZPiDuAXi3sgwKNKEdpbBOqolGF8be'
+        'ibMx/IAfMWwX34KGHsjiiz4k2pHA7FqpC4HQQPf+JYJQ65IfM3f05hoT0cqgO+uqpurC7AGgYTAW'
+        'l8pAkPw24QVTrymBgc9myGkAhaEaU3rujD0LxZQGJ/Y2la2GWDElLEGWn2Yb1e9ZjPJRiO1u5zKo'
+        'iSUoFp87oVQQyTcVC3y9vZ0NOdj5MyOGH4lhZHHHsuZeELtrJsoJjkJV64DrxKDxZy+AXvaQuRa9'
+        'Dx5CnwfogJH6/FrG4WUqryA1fsJrRoO4MLLOjzaBmqZB7+iXkBvx1/65z1kwovFyVN8kd872OQ/R'
+        'RjqSF2xKpH74wvhSuUkTwSfiR8L30SWCozLtA7unsx1EWykuliHbBgUKIh7ZQm1Pme8RSOfkDJ+x'
+        'tA3awGtNZiKyyE7KZaP2HBsZPqkJpw+nUyWLagTCjiIxgrLhZoKpjbDnl5A9GHDbsqZbjGO+V681'
+        'QqcIninpExuh/DuM9bZrduviZkzfmIJMzhTAEo5XoX7rdnkn+Mr1KAt863LzpDxVnt5aSLRrhVRk'
+        'ZQQ2dmprzzHVTYupwec2YWUWsyQOaVvp76MSxFYvProMhpCjnhCVz18kR4KgR/+PdIk33t0fjP36'
+        '1NS4YfkAevJeHXPnzebUpaQ2VrZ0te85EDUlpvSoo6S6nuuAVh3aJC/CtiSQbbtsbsITzwX20rRM'
+        'eehOPuyJE32GT1LZA4icANi7D993plWt69QPwhR3Vh7MtevRzE8kC8FaNW4a3UqIVAhbR4juy2nJ'
+        '7zNnNyS0hpwie9MDtCswvnpnoPiOTYvXHCeD/SLcAPkTav5cAlsCOLwi9/zWjahxmi4vfLVzZX2r'
+        'kFjGSpHwzEoXO/pedF1cR5kbCit3J1rlkhHUF45JSGFnqEOJtAMScnHrLp8oAjX0byoNalTMnLMw'
+        '/ROrbzAtKNoUfk6eGOB+xYL0O1fPxeBYmBrzE8kwIMXatT70TlCCF18HQfmJwPTP+Rkf67ebQoHD'
+        'Q1telSUau8/IPvEa9jmgf7mqSZKd3YKY4Rj3p+UufVv2+uBjgniqCht1YHC3KwmQyIkLzF9ORCSb'
+        'LUgjN+5RsR9ElBb+UG6UJrrMUaDx/9BlJpjZ13FZ0e/sHnNvNPRcl2QHqcJ6HM8cRGJofk/jjOSq'
+        '1PLEWVIh/0gxfxbPqicFgE+IgCv7HjZ2IdH5wdJJIuqDp+683gFnKYsXqmuWqO6SD0sL8cswol1k'
+        '9IWLfdhwuF+ysV00kZ43nQvqQBnuWGDabyHg1StBOdN7H9InZthCJEMjMODSOzxJ2xsnU5g4qE5E'
+        'YjSdEZAbHzf2fEJEtQs7s7fFhiokr5NbsSXWPOfLEdy3oQy3MCD33pCQGrptpajRZpBKiY+oabPn'
+        'nnPvolTdPbVpGAtW27TpQ/LOx910GOgRxl+58V6ihF93xsMHS3VlkOf4eXdajiLWS2xGlZcd1YLG'
+        'Dftd2XS/ZSYGFXz5FqngjEI7tNoARpNfOkx2fxMFwMO2ucMvZdkmnMBMoQFC2YWk6xEQF3+2/3nY'
+        'rkVeVW6RRwiFtQINI3afbylmv+1hqDbJzwhr/TAhajLucoirawom300vs+BjJGIVrviejWty5ALM'
+        '303JpoEz2UAhHRKRz6piEmVCV5Nsu9T+UnD9uUWoBTXK6rWh31ySpk1vMVAhXSnk+RvB8KdAzZF3'
+        'CD1maC8Zot70dklExNutIjhlMOtsLQGPPpLsUS+2yKuBzFhnCs2BgEoRDgrfgQ+L1ANb5GQmuU4S'
+        'dZ8qVnxeBdcBv8d+IoEO8UWhYA+T2PBzDYRq5ZarTU/9CZrh50ob3By229pjDu8hrWVUhq9/ZSw0'
+        'FNfUPOr2AUM0ZZve69I8wEVW1A71tJBA05lalr2G5vyOcEHLLrYdW/AbIaMR+/iPcnQBJPLvAT4s'
+        'Ikxvjkyy9C34Noz59nh2ztsrm4xCvOZFpkLGLygz7fdkH3o1WNWyzK8Md4fxndbuG+nBeEkRMp2H'
+        'qkvG6KsuOf2o73yYyRJA2NPJ0JnC4qXFej0yGmbc4cfkZOuXpDrDF6P9D5dIjaYAGrZoUSNh2ebl'
+        'xbIlPDx3j8d3vLV436WoEMKd7o/TfVPaXhUIZ6rAUVtuUgA42uSBceYrigF611oUQAnscoi6dFWE'
+        'o0FahkLlmf2kiq2gBGbyeoSvK/mbq915r0x2rVa+E7v/u6YrjpQq/RODJq27xFVtaTQyLaFuXH0F'
+        'TpXNb/qFBMVYwALzmIL1shSzAUt0bkNYyTu/FLs0N6KjbLr32julDYgnZa0tTY5StmFWWScj4kuv'
+        'lFZ1I7rcbKim9IKaV3ITd02HHE4ZCpdtEUESzlIsBrHDA6/5iHu4wYVeyoBueBennuykheBuAJ6i'
+        'En0zeex5jkgIDNck9Lqad9xYqPeHCIYfqVtlFBY9v2RAvcYHGF1fl3U9GUXl0VdieHqJqcREzRXb'
+        '61C1ImAB+fe73POz7SAzI11GM+h6IpoAtw1Eqp9O04pfA3USjRRBKOp9Gf4Jpcieotm9WhOLoY+k'
+        'LvFuB/dbTh/ZmkMIxk2jopm6DdJf6ovMcTf9YcXTFcfM57d/dicVuCQLaUYzrWfHTVncTfbIgPGP'
+        '/oprnZQY/V1JP4ln8EsBO3N19P8ESOHRTmSh8xOv6nFIERFawefb7A4FFbsCxEVC3QQTHM/mZMW/'
+        'ki+Luyxh6TBONQY8iD+16yyeVi2WEqhsAj7OBTPd1Q/ixxcsVkwdIX1NhCv/3rppbENbIgV2a0kr'
+        '28C0QccceULZks3/iBiE9ULF3an5dmS3b1NMI5q9GU3EfiA367v5S+ryYcctTQDqXnaK3HyQGLvu'
+        'o2LUkTV2DZuZUbX9uJg0acOwpM/eafpVmDk9xpwi6vZYYWfcYYd5WI22UCRkHaVSQOzKD8lZUA4G'
+        'AzIkhl6UwOgHi2ubYhcFHE5snjI6r/9fVvIb/c49EPr3GBhhs+9C5CDA0hySFlyTLnmeEFqahKz9'
+        'e/fGzcBjWK8olHg0A2sp4GNChWxMwMDNoIUL6gqrhH/XG4fi/A03IfSWEA5CGm7fFYuhc4cShZue'
+        'tpOTVwy8SEwI9/qyiRev2RZ5D2NbOqtKwldCeGfEYh5ajPb4XsL1WXTe5Dxz7cafYssIKaeie60P'
+        'Qn4pcFMy52n2PLBme1/gVXrEyHZ+xPOzJUdIGpeME1gwsRFCrAideCyuq5KDoK/4J4EbcAIjSVuA'
+        'Lsa3GdXX2bhFu3AJQX2RywhVI9RSwmFq0LTkl/scw6thiAlqBRfRNPTI1IPOoejsmaTJrRECH3VN'
+        'NoPubnyIfER8jRvQtQEABJ0/L4UaBbFd5cZkaD/plN5inxWtTKhyIWuq/d/oXUbE88fFacq1bxeM'
+        'Hoexs0Bgpkoly9gm6RQESPQG2TVnTpvAxzoCbHlFuCXnW3PgGAKBZlZRXiTpp/fZV9M9tu5eNKP1'
+        'Cy+pvSiI315wS3TJnyRkekfYJTJN2tnBz5uhjrOYMV5LTkkepgYgeooDTzvS1+Vc/mXHA7R+yW1+'
+        'RXYEe5tWgLsl147TEyKDnYGkGSOtR083CQ16YTZayzMj6ZwD5ix/1+E4ZJjuk3KTUbc1auAMJCKq'
+        'wP3NovuwPQzxTtVTWZ4TfDXCp+olHQw4dkP9b2J+KBAKmQt3t+y50R/2+jHRN1qZ9PfHtsSDQIfZ'
+        'HY+BL/hdDOrnRLvLAIyTczF9ckIzR/SY/bSeEToYqbB+b2zTV7MYHeyMTVhrhYkG5SlQNOKIa2iB'
+        '03PTHsZos4mArAjxpDP8uE6EkzlzlatQpGM9ZhytCXNghG/JM30pVWJkBuCKo/x+7LJZHy4USw66'
+        'siDK5vJNTbFWaA5Wwlpu6YhLtfIb+GWU1biMKwasgGxhSL4PRGstAGs4ysvnAQcT43prFilhrxd+'
+        'duiACHJF1B/2il7BmHtbAyGGpQbbqAu7fCqIQKmE7dmRSTtCzAh32A0Un0vOORXA4ItJltGAsIBW'
+        'mVWW2VOCSuvtrc6tu+/wVxXVWwTgQBUgoxDeF5QZhdCEzCB4cvXJN4DDkF6e97yN31KWlCkBKerK'
+        'T0ggSLqXT6pv5j5C2cebX901+7b9CblVSUS5eTr9fpbPt3zlq773H1Tm1f7MzvxJb526qNP0BwM6'
+        'vbyldZGecWE2/rRSGyW6E0SYgnO4E0sgLuQikwKdJ0Qg6BE9Y1rFsR/d7HJwpX+heieXK+4xW6qX'
+        '3twXMaSx7Aieub9LTi3I42CEOh4krUie07p+9xkUNuUGugVMGLb9qMO9gPvP1kPoMt9t9f49pCC/'
+        'GwohCdaCV2Ug1TjPkxlfjI9AG5afaAosqqOTZtexNzCy6CLGwIR/x2LpZscxcuu6TTydA0dXbiqW'
+        'EhMmFeAbo2tbCycWDfT0KyFbwXpRsMqams71KLKRM+tcnX4C2YFTfBDO8JABk2SVM2r/wTWyelSI'
+        '5Yt3h5VYrLi8gFkZk++ABnStvG5EtSBE+wcaY+2FVtJWXcEGuGXNdWJvnsAQNoI5Z45XrKhpwnRQ'
+        'JdqDobZePUi04jKmMV+sfmv16DZotDq6hr0T1rVUdbbNk3MUCyrQOTBizdQ0UxnbPcfTJQn8230D'
+        'UBCBx02fGayTGlfUW6HWkKatJRMEjcyok9JNAC6ECJ+LAWV1fwxAkiL5OHCp35tk8PgX0JDIrxHb'
+        'D24pha/P4yth+2P0KQzsbOy2U9sZL1GI/kO/vFADO1oovSDLutq/Q+/AeS8Ov03PrtezelvuOYdP'
+        'LimtypBYE70lz+cW/EQ/Z3Ho+HljzdeR0oHOBYAjbnNa+YU9Rm75odLvC480l09vBoWoQdJVvXZ0'
+        'f9b37oHOVaBJ3jqxxe98++k56bi3E2CkBEXLCD1aHDLu/PHETRCLEfaXoBNU8VgITpG0EAYH1rcl'
+        'ZhHgBZf+IT63OryJeA7PABlTOw3a+2XO6trwLi+b1dR1V453zbh84Q/Gqrp4ds0ZRnj/6vnSGDm1'
+        '65RiK0KdUGJFyr+IJHYhGHz/XUBGgIvu2TfciRcTi4DTIQhUySGURYZThc/SssxRTczDzVHRodSB'
+        '9fISEc5FSmV+LY3ZdspPTAHcdkCx5kvL+bqR0t7HhWOVbeSe10av6BrsL4Hjy2hxqPVjFlkv+ruL'
+        'JqAujtFQTJVKWYJQPTS/raJ15V/DcLiDGG6KVSfFXmkDC5KemtxIUyocHGQpTMNN/sYDo8UqSJWL'
+        'ZwnELP9LKKh9kE7bt1LfnraAAVG1vm38crS5xnvNd48DxL6w9s6XFOYVwV3OdMCTZvuVZJDm2815'
+        'kBYuKaYPZyIQKDEymBoyvxS2w7JPE+TbBYkQOIEI5DezNlcWLileCmphI+CVo6g11wl2Y4+uOujf'
+        '0V1LVHFHK7VDpemh/ZUs5ZTyKyX/45dNDYBmjbU/O62brQd47MpxUMSjQmzrAKR+8k1IUN9iZca0'
+        '66OB+mQzMf3+6ymjSE7AGN+YvunZR4dvAlgl86xPuvK8EjZfeqIQiVhjKfxlfMquChLE5zQcbVBl'
+        'rx5m7NCdoKxiAGCU2Tj3f2/YrJ1UGuab2ZcWTAlZynEa9jkCxFZEwynmo0eLyTMep5vWbhh52SdS'
+        'z+jZZkApUSoOnVBAcWiq/97nxdOHe3k9VzrOxT8QIhpSbZtCBAXyUZ6cn1LpT09ZR/pTRf1yJ/1A'
+        'GxoBDeg8rZ7wwTQsqR2GREqEK8gkUbicHb6giUiOsrINczvftU6Ox+nFn466b/QfrzB7Q5CqouGI'
+        'Q/hUXht89UI1xe457niQIhQatxs6gYniNfaxLyqXLRw21pJo5WyzW3ecsRGVGo5Ds+ZDFFPD5YH+'
+        'T8/iP2OCsj9PtLunr839z4CUSdR1W8vrf4ESqXdkViupbb010uvko05unTV0JxE7Ps54L0QNHEEg'
+        'ulnY17io88XvgFk0j17cNLjWznXcv9tF7xh7LzadDN/H7EZPzgjW6u5Jo3yxx8Dm/hbB0bzZMdqA'
+        'IKCuDKtEzHdm2eT9wfd0czrFAfPHp7BEzzLL9Ozr+kSlYfF3Rsb362F4Wj4zqMK6GgJydNX0zuSE'
+        'h6R1hTo/aQf6xFiO26M4noU+RHWVrHsH/mMEr4oDGrH9CGeXhVAHnu0obAtWVfLbOJZflp359U/L'
+        'D9MgtX0vOub/lv63Y6Ob7Lz0+x+Jk20M9h6jGPxdWJzcoHIkxdA7373/07SolZ5WrKdRStSoV0mN'
+        '8pao1sEme7MPCXt53YckBANungeiQQrgY8bEylPfL8rZXv8+JNak+zY7ZTaYClsnHofUQ1+rRJ6X'
+        'fwmzT4nmhGmE+hBQrnC/XJYWeD5lVk2iDvfkC0pT115Dp7ZBZZ9FESTB1D1Vyp2Ju3PkBXXODyqT'
+        'qIKyIrHzkP6orK2t4SqUaoCtv4CpXPE+giA+mYvYh4yTU0JOaVugGI91t5Qq+SPQUoXIpwNccnbM'
+        'taPKeCuntVhU7cpUUN1JI5GtjJDfwoTLEO66l2w85rG1Vv3qkgNGHFg6JtypZGGW+KNz9z8Hwnrl'
+        'PRoRgBjSdocx3yqGJqopLJzcFoTwvTiMOjlZVIBK6qMTvV1r2gpJO+szqND62M4k0urXCbaH+vsF'
+        'bv14eVfpWyoCj7yJZY4sOJEhVi/5TTaMwtbnlc3IHfqBwR6Cfs3ToNPl2JHszkPmQiGnC1L26XUw'
+        'px8KlVp4iU6M87394SbQk/HSxdnmc5YxW7b2pJR2/b6wCiOeLBbEYt88Z+HOkO8N3yNnsiU0ISM/'
+        'lMqZs1dUh3/OOkg/DWf1WvqcgcGmXyNwdPr0t6Se4tm+4TXW91oeounqpMODNocSzUhQ9puAc2aS'
+        '37vn2QayaIUVe7QnTTdKRNZByd1alIBEVNa5B7h/vY+R5wAQLjxSaznIP/yfzmgLkX6IzHf2IOOj'
+        'EpbX0dOXUF4nFWmTs3+ADBrFUhjFn/NLIeQ/6ObuFjIwBChkWITf1M0l8tSlccZ5IZFAObR2cQ9Z'
+        'wt7vei1VkpkEH6EFBHbYz6iQdSA/owaV/D2haWkD2EKNHGBAGQCLEHM2Yc/RgFuNBWIqi1P7WseW'
+        'Bqm0b+0+GIlZFSAK2T09Hltqn4XmfsmbImHCQkjxd5MXRlb6A7zXF9wF18wYhEwb5zN4PZSXXFfW'
+        'tN2pYsVy9WlNeFFBoUpEyB4hTwvbmdwe0C5ywOCiJer3zWHI6Vnw8GJREuDy3UKRgD1JNuphjHPZ'
+        '8hViPYhS0skGj8munzxnPA4RRvmUbY0ZtmAmokuLrWQFTyAFjkJmD+l7mQLvg2dgmZ+smPYlC3WM'
+        'tyio5miNlgLg0KoxrsBOQQV7uZuwt46DOvkrlCjg/bTmFFx+3umEnU3NZBJrIHmXQO3x/D8d1Puh'
+        'lHI25s91KDdBGQ+2a0Dq3R5PEZ/sIDPsbRistb2SQPrmvJJgxeqRzJ0qkqx084vSUTrGTHubGie6'
+        'PM71ZtiDn2DFMV+2SZu8hbVgl/CVweiFGcNSq1O5i/xdurmKC/5XQle/pe0nHbL0gUUMHpc2NVf3'
+        '9mjH5s+g8sF9VdZ0RVU2SsNynwvoefgjtpse/V5tTwKbTnXTsgAFAtmdZO2/pkdVdoEua4M8kWsx'
+        'mApqHKAI+LgJry8zRUeBVtiqcdmWKo4P9RE6RMCzaUz6jN7k+7IEUIDr1HhELEnw0Fbfw+x9ueNO'
+        'udYtZfuI8TemKWv+8mGyPEdW5O0HOtzMvnYvni8Rs2KxovQf64XECvQA7up5a1ObFesVn9n/Psex'
+        '1rs5AZWFWo0zepKu1l2uMScv5nArsBLCLaq+td3GWoRaxNdg4KfBacR38ErDvzCcBhGmFWsjwLDh'
+        'qVY27MwepaB6zjqtX9DHzXfvAn6U6iKU5w3ggDcgrnjcRRF1Jvt8I8K1KXUwxNiq2+gSsixXKDCp'
+        'VW8wTSLpqskmUHzU8sW9OQ3TOSdILmuBcUMY9+dtbhh0EL2kYp9xkty8rmobEpKbERr3pEPBZKSa'
+        'ZjA2a+zV+ExIa1t2F4gFI9DYT4a0xSTqFPewEMToryFldikH3UEtBeoFSWEwPg7aa/icJG9L6CBr'
+        '0H51qEnRg9fScQ3ozXjDnipzq6T4tAAk4YFCwAddSPLLnIkL5PizkxCtu9RW/YwLaI+Qb/hc/SqS'
+        'wyU3Fl4oqfu/kfDlTAsxKm39fUQGkmn2xM3EZwnrh5dVFYC3CTiMQrtUGJzjhJ4jNS9ZS3KuFZsT'
+        'nlZT44KjG3FbVvpcF1faOX7lW4/aItnL9xjNSODWISbvR0i5ifIzj4l7lChGi/M5yj+Ip3ggpoG7'
+        'Zk3mcDsTZENHKYvO9bB/uVMqCY5/mg1h5DjP3Jfg6qQ9cHxR79RRLI+qRnAHIbn1KEErCCDz2FiS'
+        'IH8eWRyURDu53ICuJfmxGHuBAVn9VfI5s+n+wW2uVrSy8W61u70yOcuCV4+VyVSLno7bKmIDlqU0'
+        'OMMGi/V4ae0Bl3oZvD30pbIAi+hNA3O3yRzA1cNETH0OxKuycPBKfW32I5HEuwbng/KEqQObrH21'
+        'FP4HY5JHndbas4ejTCPqi5y5x14GiLC72ZfO3/pNgX5peNHi0fNLBMaEWh9515TKBnfmCbDqrmJL'
+        'LtC+3O7Tgl+yty/wwCSAhSVloANt7b9cxdjRsW+0vOCistqCmncYDTmxXpV17G3bTGoLXFuNCLqT'
+        'A1WRBJ3acBIxQzE4cfr34pnPtNS/d9W9+ldxArfnL7vcdmRjEw4+j1Asweiryq/8AYTMKouh7KuE'
+        'pSt2o0bv5YmNnFA+G+4OSiHYKM0Tdj6ZOYCHVhnZZR7JSFwyFchKMnNF7j3vZxHbRz0EmMOTKc61'
+        '2XBlxYRntI/tmkXsEFVigpW2jj0lN/E0LO/85PP8DanulqqzO6gqE4g0kCk22Go/7kg2cFHX7nem'
+        'QEiSotaQ/HwsYeOT0EGQsQWxH7tct+p5kj7OVYIAyAIdtPfYtd5wqDv/hzOoRxSKeqm2B8s5DW02'
+        'ZBP4CMWZTsBrZMmxD6G7roW43J95xd4NHl3XoiGCuXGHOPds+cz4KazPOEYw+yGYc2dVEyoyfXTW'
+        'KUJs/n5D2D/d7YOmb4MsHpvsSYipdgd8frmDAVRHQ0qRJcmXziXf9t0ZYe8+ufd4/TV2QqrdNSIg'
+        'kdfy+Mfnbla3s+1hRt8gAR12PV9H/BF7OgbaRyRAzOKjDhKO+zn4QOhBdtUF0nS37X5tBmnjmjlN'
+        '2qErA1C2sQ2wNOOK9ed7KGFahdwprnfpcP8IpC8iltgP/ybd4Jpl6QJiYSlm3gmvU1ULONT6sh7W'
+        '7bvVW1EHZjMD4YdnRKzlePtCUEX3ClNDwCAfa7pkNxdemXyNwH7GnohPV9Thle7jsNqqsyhx46zv'
+        '3EJjZyylE1MUH2r4jujsWYLsRpO9QHY3FROEmrOAHRVhQ+kAfjE8o/h2eUtopG/GlkuvLuqCF6wo'
+        '6rzNyu8tXhRBDH91TkNOVv+0yAsX85moAzW8tvw/NnuVOu+u6b0jY3d2OU6uc1nwObMMhMWpmIqY'
+        'mpvx4HaeNbNmFkhvn1SrUURswwjAGNc77JeR0VawEtO8Gm6syXrvfzAcsoiKqGEDWtsFtGO7yhns'
+        'E8GRkHiBjMP7QGpAexLulJKhcCUe/eQKVXxcpWlXk6URlW1LmEB4Xic31ySjVPAT/nlOUPv3cDEN'
+        '1iRXOHt3FitbcVLQ+OuOwZ09Blg98QGBpr57yYW0DRhyYYQL12nTOAOcBc9MYggcuR1NU1kSlGmu'
+        '8Wz4D4u4eWNdsso2r23vQbYjFF9dcRaxMokD1+jLGDz96RavgOpvLu8j1qV/GUw9jO7sYNKVdxt6'
+        '1hUjaLm+zNF/7bLpEdoC6hdkVJwU5EUX4sZkR3M9X004z1NJU03bDaIsSawTa+pXNBwJZyYofvUc'
+        'PJZAMC+3cITLB2r/t6QUpI64IzKNOQK900ITw/Uh36RrE/TlUSr7klgHWG5VnBXuIld9F4sOhCQA'
+        'y0RlOF9WXP8wYg4mZ27tPOBn1r5+Vc2tf70u2joclhzSDBo8fKIuZUb0GntXwYIj3rrsWJbj699m'
+        'w3yeIuYl2GzTIRL+q8kQ94m4PZ8KdG3JwrG/WXUjYDjQ5zsaE4CESECSmCaJpObl1iAP2XLuLb+J'
+        'zi7u6vYdDTrjNgpRqj14Myo4FAA6HLb8/e5tI0jBw32r8tRDuEnEyo9p99l+oeNbrxfvtYIWv1YA'
+        'lwQSdJ7FUlClQVpqyheCO/3WHHWp0s43NpPzpqK7+4nWhb2c5fFLlz2HNprH9NzIU0+A2kUUBNlP'
+        'fpM27nlf+AS6m+DazJfe1ySFgn+yrB6WfNAxKvxbQTiW7nt/iXGIgx1Nx7P9TlE/rJHK0JXziEYU'
+        'waSfIi8zDG5eRyWiSl5dz8TRRszzJTKW6trtfICJG7jVAlv12rJtNS2v10rw5kpqEntwqGEXSqGR'
+        '6+RASgbeEoJb9MUlBFMb4/rlq10rUCgBux41OmegbJ2p2rzmRsHx1TxEkg6Ihx3uPn/Sy2LoKZYN'
+        'LbVm9CRUh3+mIqkVjlRjQwhUHRfIxHHULkUIzmQLnTvjxlROtb5T6YoIvsa9ycmz11kCZbqMjmxp'
+        'XVbYugZzhoJ+Zj4ifI9qvR66V49i0azDMndL42ZOjgqSI9j6jLCmOeEw2ozk/4psFBIwkH3MDX96'
+        'jzZJag57iOONRJRNlq0Gjc8mb3qL2ljRBD6vbhE/o6njjzqCOQXkHiORH1BEQxc4HPjfJYIQiQUh'
+        'QhlbSU4JzPUCRayLYuqs4nLyJLZe/iasFjLtQtDUVKRvB2G9/zg+/LOQmjhpADBHvOl/YDYEQJVR'
+        'MtfZQiwzFjyxEAVjF/Bnv0VtOOdxzDGBk7o0Y7NGeW1CPIoHK4WtyqL65CKj7vmOZY4mqRvGw2+L'
+        '1acGk8bffQbCik3Zcve6z9a4VMNXThSrV66pgxGlT8TjgO298py6wvORy1Q9YbnkFlCVF/AWAIky'
+        'rjuTkuIqQUS/vVtvjV6G1o2WsGHEmDMutyykhl59xkZUs3nCWRymsNcECZp10v8bvpBzvUsumZBF'
+        'FSM8MctPTdaWKttZPbEdYu9lPEOOiiwZ3Q6SoCMpe0+RWr+5SI43BkYixMXTzZF5OhWzO52pdqAb'
+        '6Y3mRvhzSETxCe+vvK8OUAlhvgQPZgdOCiM8G5XYjTUx3s4Flkdn8wxql4IAf0yhruKN9gEacql6'
+        'uKqCIHuWm3NqwuwYBKPlQTxUQjJFVKLyH1mpr0KaC2ySSQZwS4XcYuYP/ySBJ8oEnWtCdCRdyrOa'
+        'gqOMvBAsvDKGmv0ReXWnhEE9s6X3eX0UQTWYmsYaq224ucMwIaRfVFXO3ZEq5OOxWDUHXXJQzagH'
+        '1lvp9r7gQa45sBjWMo81+Bsdveaj7mot9x23dsMm3hgIraek2QG//HyprrVdFFrK+JIXvuCTI8n2'
+        'fNggxnM4ZtA2fAnpxm2bmRthEKRvguAB9rkWVwAYzUOT8PH2URokzSONb12mSZ4fXi2UiJ263A7S'
+        'aOEtHhT/tF7rT164gqbJy4GMvK48TNLrINL7RUPUJEU+SghIYNTSL8VFtaYcXgguOHY9+OaOukgS'
+        '28aAFwlM57cxFNJOzzQaaRhKNIe1vhHQP2NLNzI36RQUnqepiszmoReiJFi6gXEvgTPpJdzNN9RQ'
+        '86OHl8TAOI0i56k/ixDbU/y1b6h0ZCEOeoOdnpk1qxmKfFDg93gIC0Jj+mmd9bOjO6yKYUkXsxbi'
+        'CdFb5ok1Zfl7kohLu6fxxUMVaw01mzij4ns3o7VWoT12LpNCCeZSkqQyOOuQyKBCqccP6UKeuHlm'
+        'crtpNr8q8Q7m3TQf5TryGehbFqJBTa2tOyNhcYK1SXJlOdX6J9D1tE0/RY36H335VWdeXpdau5Kx'
+        '9nf8sKwuxg/3R7rhifCoeQ30VokW6PBsQJLqQJV5XltnQ8oOyfb/8VMS5Q26PcANqoY3hT4mu6QJ'
+        'QH44tne+evqsFFSD3I0nUI7jeQhL5ev5eIuG2t50crmGM5Nhj5DZmpiYi3m2yiczFGmlAQ25KeYR'
+        '4XGkiMb1JwjFKEZ0Fc0yUq4e5xdapGQI+ny7l2ctCyHEAJl5d6fhtPs1rpf9bWgJLFdyOluqXRoA'
+        't2B/DLzvbCN/5ZqFJFswag/wY8t13XjaGfB5nNpbN1QjgcO891ciPzTiCuxh1AhZOU+Ry2AH5GqI'
+        'Yluq1t+GP0t+oqGsKOCtePIxLM8fOh+7JHVBvdZuTqjr1mdKua3RBd+1xg5xvT12/KloXl8M9YXG'
+        'yXGpcoUPmpH7tOvApi8puPY3u1pKPNlHYCL4MTEh8igdVgXg+WzwNSprKGua/RWqgZa9JjDmciA8'
+        'Cz7oAfIWGh5ZoNXWjfthgYaI+artkQ/Qmw8YDd6yNcPwYDZ9pJVY0uRqJk19TENqqLgmEv4jOUH0'
+        'WbQpJGrxk7apzMCIyU151AfI7jmEGrP4Mj8LA/ITSLBGn/V5ajIto5lm06br+M1pmWtits0jBVax'
+        'hveqca1s4dv5lBy8Ml19kdam9JbdnzPTxu+7NkljgbjUr6pCGTddq1tqZPPPTwM/jsyF4ajA3h3J'
+        'XIinFEzI8bqmx3TQy7A7Dz46DDtedAciAW4IbNmYivu/9N3SRi/B89kj44GVZ35skUiEQL2xQ9Jw'
+        'xb3K3ADU9fDh9VhAncSC276VSd6RK6iAJNN1tK2+hEON1HBKUAiQaRd7vQ34v4+rSwsZf5FchOyx'
+        'U0+Yx1uuW+fjb5aq8RKpfnlOuzC7H//dHeP58td9VD2+AYepe7RL87ne31jaAcBQsfxdmPnParJ/'
+        'Hd2NIDnQYB5j/eEV5K+Nh06Yp7G7TnATM1Hblh1mgzAcT5oJtUvRZ5FOk8uQpxb3cnONtimZ1+lC'
+        'CphESXINGJ6od6LEl8fV2OYZfCrZGDIQlCyz9WIcPnsk6xyR1kFMMJMj/nuNq3x8ajizEc4PgzCO'
+        'xwU+rTNM0657FoIrCKigLmCLJBI9mXLcyrAn3WMj3sSnQzvCBSyAPavWoxx8W/r+K4cGyV1t/5oZ'
+        'tzWJQe+NYpssZkoHHy7SykSl32lmCtcV9T7aPK8Hmv55Y+7h4CkFktCSVejBN5fPRkPqKwwW1LPm'
+        'gC27SdSowYK7v6Lo+/mOMfWcdh0CD0Ryhwm6tFrerQkYTMyFFuNqUR4xzdAGFww1X2yZ1w5ROr8J'
+        '2czPenHy1DSckgQ0xcuOHvD3FwGcKbYps7osCh1bIBnAvsEB9F05qcNRX+VQJFDswgZagG1G3OEP'
+        'Iy2IGTGeJU9qqg5FL0DA7diTppzj+iU7swaG+mNZhABd3u48c1QEC6jAG7R1fx/tYXgDoTqXv007'
+        'g9LFWKdq++U6iPyLFPRTFwnBLTERv7yY1eqO8OEBY1kIn4bCMuO/d4M5ofIS/PxTaLu85x4pJKpo'
+        '+VL4q9h0iBBonsS8qoh3W8fZmJdGDfIgPu6p4qlb6iNvg8bvBEpDgG2Fo+AsN6317ST1rpkdM2i3'
+        'ufTIHwrkbkmjmZ+G3LFxTSiIVsDalsMUOrB1Hj+UQ4zuLBls/aavZQdkC8BVfPp2EHsuVIGs0Ui6'
+        '76X6K6t1Tjts0KFo6iqTxzJX8MbYiXcL5seX8293HR7NKbEcbisJR3LgfwvQrfJKV3DbhPdegEVA'
+        'g0UztMcWJBLZ/uInmI0q+gojUW2u5J5PfY+mZXtXm0fuvakdq82fbIdrs5L0+Ga8DClusEgWd9nF'
+        'SxFzgV0e3ZS+5OZBfzUDBpkRmFUAoT7PjNrLDDNkICOfuWWyDm4ZbEyU8zj5tfAN1B/zURRCMVVs'
+        '0jyWLt1Kas6qH+9XcDKk5nvzZxI/5LzsmpZHfxBesH256nm9qIdaIsKNUBkcPJK+Kh1AMIY7vbWg'
+        '8fK4Uby9kvLixKJAoMFQt/qX8zN+SnQ3bQ6D9Ect0inLKqedk3rJG2VijTTmuiU1UR9iulskIC+a'
+        'lbUOxZPlEsNbVcsTl2SPBlz1TcreY4c7d8kbrjE/wRVYONjA/CoQPFPsUlgi/ks6+jaEFI6zss3e'
+        'xlm/C8JTR9P/Wj1eG4fuX+h/VfNZXcyNtzJ3CUihwOQR6pLabpWLOK3w1prX6PXVaMZqbkNKzJf5'
+        'HrXwQDjsXOXXZD1IY80WEp6BacwfHTl2r7nYHzzgeU952xhXseTIcJo9LazCicqgRBwY2x4yuQeG'
+        '//+dkGI6KK7HvTCCSeFrCBnLuaeMeHG5OewMGTgRxgGHmFcA5WfKTJU5tiRqGlXgP2hwL8rCClOX'
+        'wWJZbesFR0cAskaT4Fc44CFuDuSPT8Rftgv2ZWW6hxkQlM9zbzgu65yaaQ9MfnkLoElihryY+gNA'
+        'L5cdvjzJxc02gkrxxp1RlNrT20z0N3dlNPnS6ig8umfjbVPGMkQg2VMAwOctCxUMBlzpmCOPv+b6'
+        'EUPd4fgwXK2IN6fETtQeodyeo7t2RRD465hLkViNgwJCDD9Ai1oQkFZDdJb3ulauAQitopQrwAfS'
+        'dfyoMW2cmZDORGKqoh9yMPMof+B1CimLwjYyZ/L0+W75f+apMLjGBIKxm8lOGEjFeS0PcTtaJpgh'
+        '5FzwXXgAII8OoHEEhqgsdVhUuSsdKufgwv6w6k3n1llmfjowARQy5I34GKp1+CIRmbpyLLfKBJWY'
+        'l9phhC9exkgnOyjjPhXUlNT+hMH7uRk8P/UO6bU6ayZxWWEHm6+GOd/e/zWt1vi7ixhgSbhpwJiL'
+        'IdX1au2U84xiJCTcdNtYW9n3ks+hKDkAMpRpllyOtt3wFjPDzpARm7mPArxpQKorfzSbCYv6VUZr'
+        'jJMEQ0HBo4xMTGIEh56qni4/fFvPJDN8xlXiJ/iN9A25IiEY0lTyZdbGNfpk4oR9i2yOVw+qqtZw'
+        'g9hNAd2w4DV146b1c+dsqQLaRTGwmsZX3O4UMG+oOHI3ADUAkP3e/jAxJRsQ5uxc1K2A5dXf3Vpj'
+        '1MjQ7K1n4pcwjZS8MfDMn8NWTi3wvnRhy/r0JaPjjJ17kL0NyqI303IO64tUU6fKAdgagODo5BvB'
+        'b95Gzh0PZ6+MQ0kq6NDMEz1q299IHDxv2aBDbLslryEdWYyYrm15x4xsdpWqIVBrRfhaAvmKYJJ/'
+        'ZvIabwzUoFD4FGUWotk6e2ELIDjH89Vj+Ol+Vo0QwMIqys91mKW9AjKBO4IJRTffk5ybYA9pvQVZ'
+        'WdO6xrTPQO2lSHjtToxfnt5PJD65HPY046e0MztF1jFMAU37EQCHh6h+GVE5d+ACt5VOgk45f0HK'
+        'X0kT0F317BomCxtzDnm3Z1Pr6DWKFkOZkmjPudIHgYnXiNyjgfBv16rdTc1bw8yWaDwfpUM72WGj'
+        'N4AVeRQgsLxDJ4FraBtJNXLWl9VEZEKYkRVscx5VsKrv/5iJg+VPi+jepzh9p+YmoQgtM7VOgHst'
+        'enZSYbKmiupE7TET/iA3wCphCoPY968Gogask6SxMi6ECSPZzOCWf9d3Nh/hCSb09Kb8H9coEy36'
+        'yZFNA/qcQnv8DBK2DzW6hBjP50AIOmMga19YBy9BQS0aQ5klmCSyOQcE3a2srxa40sJNutSkI8YE'
+        'kIKHqMGGPf68X/jedjqhzVrjkW+dNgd2FIEeF1f1XzVUmW/ZoXb2yxQuyWlndyGWtnN40rc6a4FK'
+        'V4irPn2eaz1BLiAHZYTsLTEjAVO/X0B5vi39hgCCRmUCBhBk5L2ZVgNtl7/i7lX23dUqBUd0iVtN'
+        '5iU6SIDcZXaOO8OocJn6JWn1mgPCVEJAdS4Ynzo9kek6v4lgCt/sPZc95NcvSf/rOqUePy9w1PKR'
+        'ntwQcGm6+Tlg5R/Nu65iIoAcMJRUJAZwoxKZCKeARVp538yvmsPX1Ag2JeFzTZoaoOYdaqPzM40B'
+        'yn3RIWoVUTERfAV/YvGnuFbLA1v6uAl1Nu0BAFy+msAsgRvsNtKUYW1KDnXOYHMOqEoSJTyeoXwt'
+        's6oVRLvUKHZEMhFIo1MYqe8X/AuSKXdgPkfygtWA8IlcWmHBW3a0eEX9jsGK958IAakmbO2nOEKI'
+        'dI7Qmz3398qrHimUhyDbfpD5YrEQtJol6Kkjceu1nvocoOLnTkh061QRmhpyLGj5rAKh9suCYAYp'
+        'aE/8x6jDvb8zyUjNdzhqajTi7SXWeDPvtJduR/GuRMp41hjyYgDktfHaxOLC1XSdWJ1oNCGn1QUr'
+        'AUhIn2vRxze6Ae3TD8cPf3jEg4om/eRobZx682NxO3sFHaU9R+lQPgNpL3iiMOJ98o1CFmbW7q/K'
+        'y4dqI/gtmNL0jaoECuSrXIbmOU6oT1Al7FbpxrG5wlWbduDNAYhFZ29nOwNz0VqqYAGEzvolbATk'
+        'e6asB1qz1DpsLSq1SO0MZEGtlql//u0uJwzOCtu4rWHJSEzDga6sLaAHSi4P4IF8+IJwURSe4b0k'
+        'DrEX+oNWwy2x9+v5nP0ATYrEZ+XcyiJHXFKHyXp6k3YNFnmrBgvyDqjy+RhEGabdYFpKxgierHFq'
+        'LmRzevu5qfRFM/0fXogvkYYvj+9tqpqCKBz3SvhnEBU97+sYJ9I573qWzYzPnqAwjWOovKwqxQv8'
+        'O9uSAdlZ8uJRwv92XHxVFoC1T3ejZuBbDjxQ2XJyMR5XC3JpfOYhOVzy7aD5Xvk/KgyhLQr73MV3'
+        'WqnSkIwSQeSS6ke4mMPVQ5H0Xytq/YzJbN435PUOvBsVcuVbfEwhYHckGiwvWjhU720Ydccgm9In'
+        'PvaiHcoOiT1MX0Y+HFc/aqtiZ4Tf7wMDRh6tn4prbUmAcjaawsOznddEEc3gxtTVDD0WX2bsvoZG'
+        'BVYtisGaRDmWv3T75EmkMqLXOxQlxY6q/Fabez5KGn4Bxzw6khG7xpuvDxntckoPu61tGcwyfFF/'
+        'TGQTM1mkhcLhLL4F6N09/bQaPnLHq+QdNjPgG6o5Ik+Zx23oWx3Lv1Mnd16p9QxF/vZxXHUI0ECr'
+        'ks4tihDEyH9FL6Rq5Uf1sQptElolouGNoFY2cZUNT2xz8yzR42l22wcaoLrxMTSSZtoU+lUbEfRm'
+        'T9lKl3gz/ajlYUMzVT2tAUlluIaTehedloWyvWsuMre22JB5OCf/C9O8TSb6GeUslWTxt0uUwKl7'
+        'G1kiWSS2f1Ul2El27FnYlhKIsnjKbjw5Te1Esp7aIc4yp2BOprjMclE4cJQITPQdF6QvOSyc3TD4'
+        'FWw9KE/2r8J1H6ozADQZRWFgI75zPmnU5Ct0lX/E/1X9HmItU/FzpmaDEub40lUTPF6fKwGKesAn'
+        'i9HRfFnYs63zCGr2LYVj63660dPq/8AwHl18fu2FqOIYCqyRB3j24bvODROydlh+MK1ht/XWCjLq'
+        'cpYIdh9RijokGx3Zav2GIIlwSk4Qt2igcYSAgMpsOfvXPuA/GDTBfeb+HK96Dp/O7lhPj3h0xoqG'
+        'byZp25Tm18UYoN9M6S1zOU9vcEmtCDFEQyxiBXhMzx0et8SfsfVG+Lp5QlbLNwPFyxMaNcLv4R+U'
+        'waBZUXW3+BO+042seO69BwYRPgKD5HhHxkpNis5d5svbcmyK4wz5QZ0c2Bssdi9Qt3p/DB+sKA8r'
+        'Ip4PGn6XTYy7cD+AMyPAN62NU9WRm4zkCt6hi+uT3+hKokSKV2QPA8MJpQ6TiEGQczE6lQCQpRdz'
+        'VMIbZJBJzWE6VNKbDyPO8NXx/EdcZBh7Pzn3Sf0DeQsT7Jld0PVJd2Yt3RbWgHGYkksKgbwkH9sh'
+        'w4W3blyKEFryTvjA9pTGlFJ38snZDsvcwvLmXaoayz0JMlO8jz/9vwVIXIJpXaxsn7Uretvi4lEo'
+        'FS/CNwjP8mSXMzVOXTu9Jm8Bty4+mvIu8hrun4XD5ywb65K2XfmMPUdLSTBPpQqw8lCmcOoW+/db'
+        'VaegjCA4HrOX5jexUsDnhHWCq6bw00cNHAYZtltHUSEnUNXXp7ZOflvH+yRO1pJ9NVKJUk6PvYSe'
+        'Z2Yog+CwGYR48cQNC9FrWI57RC7Vymgz4bN7/2jmzuR+mqvPvkaRBwuJKE9wVug1i6E0+gHtQFa3'
+        'cwHhyJmRzOiJGlK4En/3DnM1rmb7NOw3XTvIOzSV46B6+/gfOGMcKv1JuAIcyfbUq/07X6N7bDxu'
+        'nxHVmXGYZYr3qGJp3s3yFT3VLgQ089rkaR4FoP2OL1NpHK+irMEo9IJYtEgHqu2nzdFUJCJjTTM2'
+        'PnEfNwSnT1HLeihWetTQP0UdkCdtmhWhCCYrrbJQljFK+Uwel9O0KxtIY+QZ9SjwB6Bk2KQ/+fr3'
+        'hNFigdDeZU4HYW69ZCGb9FziPHBj0Qyr/VCJ2ksv7IfmQX7nziM7GgvH+ITHg+NnXoQQoQJB24S6'
+        'CkegkqMTOUcMr4iUu8ofoJdGvbn6aZa2mb9y0N/rv0LTzowLnOCxo99kZM4DellpM5BWtcWxDoou'
+        'h5PW17NrbnQsrWw28P2iKfUKt/1+aU+ubZXca2/s1fqnPNCfjUZFlBKsjOn3PspJIqsV8bB09xvp'
+        'OzbWpAT1ESDsZxXEGoqpz3ZStImmTRFVxAcGbmhvtZDydIhwa9sFnQ/qhfGmUWE8IDt5dNCLNbDV'
+        '6jzC17XInVEuvxVLkxBAdYYRt1k+e8QWgiy2RVZtN00b2OfzFcI/yySfuo4cosP9J3TgCPgkWKZ+'
+        'JEPjR+JWhhJn4YYhmRQqHUyBewoStHp6Hj83zLcC4Ek5lN2zp2P1dpTEdqzCIvsVdvM53q37v8xF'
+        'KjXxWV1kaHPAVhiFPAVqqEBvIexdAwYhFzr0u8cEQgL397RpVNs5R1lodVKy1rroW9w7AR9HYq+q'
+        '4fdyx9HGP9MTUNwWg/cCsoZsN1QmvTlDwUi6YdGCuPvoviaEa7cJQHjflqII7dg6F1iYNvoGmqyo'
+        '+9eGW05SBevdNDiqxLb/M04MCvFBS0xRNX6UMQI/b1W9tn8776QB/1gDyv5bt8HTWLoHyeVWchHE'
+        'xfS/fSiwYOq5GpwCI24hXiGpkqbiwiN6Ovl8L/OH6wgvkRqjYJoyvcwNfQkY9ObyCgA1lKUMki7c'
+        'iPppQpf158xkMxt0hhLevfLOzxrxzFj+mP5HnrTCQFBcC/CTri91hMUHV8v53O0VRGHQUG1VY2wH'
+        'M1wSE/RXiynCSYZ9AzGBBIlpBM7O0mWNtedu+58FtMKDkGnxEvK8g5wdJ6hd4BtR8xeWlK6xfjAa'
+        'sod9NSuwNN3+CE3vE5bxJ858UiZ3BZhBoMRonKGSDh7zm5aPFU+I3MShaQLmRFJrcO0UUt85vTuu'
+        'uW8TUlPX1vInUJFq4p0OxWCtHPZGjjlJz8Vypvpc59Ky+vUB6KgU8dSESOh96If89/KZDcommiL3'
+        'aG+omCAce4C412GqUPQZ73zq/IhzB+02T+pSy/XnET6tcEts7JZ8EOsTsZcfqjrtdFha8EUOXqe8'
+        'QLcQM/oM1Y3lI+v++yZAkp5CBduoxsPYezc7bpW62SwVRkwpqrNDC/+3YgpTDQ6ly+XCaiEFdere'
+        'jV2/uN+0MS+uZ40rARPDChQzglKHCAv+9QFKJhy8p9+lgFZIizOeJ1ox0lhdke+ZPRwmn7dVtIs+'
+        'P+9sjhEtFTMJ+qzArd7yfr6eWCaxDEYkgKGjb3CsWG4c/bU5FM2W/BJT3tf3nknsGHWi3uDm8sem'
+        'ofBbCAjK6lkGB9OpDAD483nTJ99JLCGVccTDTlqBFv8pU8HgpVGJ8Kc142lntIzhuftcXToojG+F'
+        'JXq/yweXBpkR8XAjAGflkqei0UlqyOPr/0+BdVlJt/kLlsAWUaLv6nDS92n5dydMKqnik71VCibs'
+        'yZsOnNR7FtSPfaCJMCZT++Xi4CltyXg1HSXZiZNyfelVY7cOXl93De1Y0zrqpdMNhC1GLB2RBlt2'
+        'LNWv8kXap1EkPpFLlf0wbURceYksCwb3IGvh82TqlQGEDuATCMPr8gnh0Tb7xG8akK7wihWZorHJ'
+        'zES07WlBC6LzeYaqOKH/R+QCgqDx7krFwfJAZvrY5tShc6CYnmDqsn+aEyRh7D19Xu/lwRBuZ4d2'
+        '2KmEEF53Z7zKinDPgwbTG9w/dFmZB6rKDHe02ZkaGyQ0AJVWzvA1O5Yso1rV7yK5S3+8b6J0OTKj'
+        'SV+pTyygqiEFKMlBBZzXucSmvveowmcfIyZKPLmUlimg0QRGsRIbf4NtqoA/1kn3mgW5+iVxKAcO'
+        '9fRaJdGw6JNESZp2m1+CX3M+2KJO2oJh4ggK6nkXptuBxL1PrLH8K+Xke6fnwGRcmK2ygSnuI64y'
+        '977jS14kbjmK9F19SL0ioU1nWWWCxnrv8lWDxKws8mVKEAbFNbdbcnWmfLPZVHQPh6ZdNHrZc9y/'
+        'KGSQyd8VC3bwyuuz71ZxEg5CJk+cAn3al9jhjuCc8Ex9O4RsdfWH3U9htyRx0drxi/Raxv975tko'
+        'QtbaZlkKI6hhB2oK69QDH9kw4FFLUCClpNJ+MwTxOINNJgGmVoJG8dqesfAXn2NK23DQy2JYnaAY'
+        '8BYgRHX3utqH7AW/jb+L6gEH4e+emrvV/rBCfSHEoD8mU9AxcQPwXUENu2W3PPVDRuvnlWK+aiwA'
+        'QSbG38wIFtZ0WUSzj2snU9XE0M5V9pQ37WhQrAFtCuJwwJL4OBi23ZH5N1RzBF7Jj6bgxBsOPb99'
+        '1DqktiCz7hlCKS3cCto5rGYR0QzS+7X8ouAw8Y5kiYqZDdyWtMTbRm76lrsu4JEwMvw8ZVNgpTKh'
+        'KlUH5yBFvAOrXx74dUHSwJYN0jNVLMAYWzQv1mALfAqr0MkxQ7fYzl9Zx0BWy58FBfzPmryXdjL8'
+        'WU7+D55A0vlY/Aj9FNEbhrKHrf9ymaY51sGFrkgbD8U4PQ7g/lUG71CvbwccvPq0APnoHtNlbhN/'
+        '9bFlP4Gi5by73/R9lKjXpnQDBOj2MvBcn0/pFceH3rSOdDD2AUKzo5AASPu2LgDYLfvo5kCMoPH4'
+        'HVcAn7SyUzpX3xXgiZICpOX3AZ4PWqrjXbeW5aPvOOU/aHJp7p/1gMux1N3OCgdQ6e/kSuY6Lp5m'
+        'dQi+V2hatsukv25Y4Nq90ETtLw/+7Gfe228m60skvBHj+OPHEuP2z3N3AmnOeCVGGQxvdqpt6AiC'
+        'WC8NIJCLE3ugwTm2ndOxvgHu5v722DbLnKmoeg+KWV0v9HrC8QetEo4Fvcu8lmrTsZDUPE//DIvX'
+        '9Sc5GBbyJzGJ7iJjuC26ov+0jArH3GYOf+jhgipsxVv3VPa6E+ecC47Ax/ffbFrx/UyinGq4PYWv'
+        'ySpiCbSxnT1XL1n58n3NcNVs1G9WAbF5qBjfS8OjozH13gMHXxKIIslNYFBzpbJrQHwxV9DDNKRk'
+        'm5vMICtm7T76HxcJOK+g4LYsu3rIUQ6P8X3RxAN0HeSSyoZpgsHv/MMVhOPk84zTy94MydhTTrMl'
+        'SVBE6NJ+8qFTcSkzPtPAbaJwJfyjJzGU4a966YzOwB3iA5523jqMeRiOVZ/laT7twGLyzqIrTgMb'
+        'v6mmOm3kbDQrNi9wwctAB0QOp6QFvNooEGgGh3s1C7rec4h0K4FssE2RCm3AbXECFlh5z3ArR4ti'
+        '+Skd2vsvwhZYLwvq1D1nwK6VA9HBCTRu+oWvnjLSmo22FRwi0t61Ai8sp0zwHePBkZaSC+i0NcIj'
+        'Lk++aLBTKDWQKUvP+Tn8+jh8bYSvFpPDmaOOugBMECs6GOCL6xVlXd4FtSRONzO3jGFQvh9aCUEa'
+        'wOzx+54Xld6G/PEGfOuoW+oaB0b8mG9USvJWKpqFiqvs8EJqLF4EvTm14yU+VnjlhPYoeXtUWHnc'
+        'x22c0ZK5AT5ImysJ/ZBhxpozJU0x2IF5wmQE6Bw7dntDHqMmsbtGax15HjO7eeBPBZUa4eQ5gaqj'
+        'u1jnoO+o99SUVMdFBTOo/eCo6aC5TftVYMKzsc1h1snTqcsSl+ymsYfbg+inR7y2tYvwNfQAYpBJ'
+        'fHw4UnAcmM+dC9yaOpuKISQFXr9/PmtlIgHvIIik9xwYARGI071dAqCb/o5YxooecRFjAC5cqF1u'
+        'LASHxCNVi6mGIjr2xJBD4GBNieECNxLWedI5D1vMnEtJWidCLmus66Fkz9/ZVdySVw86qF0vAYl8'
+        '3QANinoM47fNL21hLH8DK5uQJDM+0IaoKxDgrIaAfyN5FXjWDsgobvDrltbUGL2D1tgHfUzMb2Uv'
+        'oWUS6r1tIZSKy57TIb4K++SCOWj8z5UHIfny9eEfCJKgyuEM4BFr2EnWV8lsKbo2r37Q/eIH6ul+'
+        'afNvnm0rnFtfCMcSPauofb6cUwuV9Rb8sF/XEhtQ3/5ebhBNYy9DJjyRFrroDM2YjMae0VxLz3pR'
+        'DTYS6la9tVpGIJ0VZ1PeTnXQ4oXbdmGZ3SdAQ5a8pehTFFam2qwPWyFPdL6vD5qLDCk9kjDUdjnV'
+        'WY94eIHPYYWl0Vv/Qcm1ZHJ+VH0VAF+yGAfYr7yuhfbS46uLC6dDTzvPKNCDAamUJWw7OuALstoz'
+        'xcToiBML9PMpxB+mxxyhZTq/I0ABZqTvlLYh//yzso+ksotkPdIAfs5j/74jatNVqKoU6w5VKfP5'
+        '3rvW+EUbQa/yNHM1TXejGOrVwSgI69dqqhZDfv5odAgEF7zWF/bkOTOJqmaYKVCaajtBNPH82+h7'
+        'jI1HGG6PtWcOhq2Mfzij/k8d5T7BZ6+2JsOa9H2unIvNw8BCHCYmbpUp3ruE+uqGMA8VWeGkT7u1'
+        '4k4r77Q/R2jmmQG1kX4KkF/khBFjpInClgkiGVtaFdv5RgmdXehXeU5diXGEb4Pz5Y2cNnXVlZ1K'
+        'oTExUSzpD9e9End/expcxFR8c706/n8BQpjP3N0agjKsyi9M04rA8mFh1nEXFKiykNizdS+8TkTq'
+        '+Lgx9ebcj+Cnxxxmq5d6LYb54vK4v5oql00crBWBnp39ZtJzukjz5uKraQ2n2IEkLu0omDvOOr0t'
+        'swu2JX43rNraEVx6UxYpIOraXtUeidajfsDvVH4tc4tSvUHdShvYMHnE4AtXHXDHc3hNHpfanSO4'
+        'KIyhyvU6jBqPVSWRCMAb3mxG6yyq0J7vzg7Cz9FSxY73RkQDEkqYJV7hm+QQY6PFh8UGnuJiI7/y'
+        '8MD7ZzH0bjFl2uXTyoqZ03+RBfbwmzfzX4b+zLBrt/4kdX3KP2ji8geDGpPoao0QHEkcgUpxc84+'
+        '4mD9o9XB2SwMjJqZ6LajKCu98SVxmFWopjVaIX9soPYb//7uI/yGMblcItaCX35m5TbSVdik445p'
+        'MzXuEliokanh1fW8FXueI9pHccND2OtafRJadm6/nAF45Gouzf1/g6QZu8wdsB8HCbdUbgdidPLg'
+        'EnGfxr27iveiiks72Q1qrC8EBJIeyV+hOy3+mutm+Xo6o2BKTyQn6sjvRosaR7sr/YALKNetc50S'
+        'yzjih3pJ7Z8hG0Y0UqQGDsZcWOMLVe6gEzdZCYzOlJ1E2E1ts+QhAb+04uElZEGiphtLqA61KkrQ'
+        '7oYA8rKDKJIP0SWGEsEWWuMgW/ob5ZQ/2lkha8xYp/2ZzMsBgIlk0AJVGN7D/biRNXp7JJogJlPR'
+        'mhWi1fmSvgO6/dVbOEaK8bjOO0jDu3RwD95btNRItEvluScgVb5VUZfgPM4znQKKubT+TCH1hxiA'
+        'YXsW4T9VMEM2aUbgzgUzy2wfxSZXBsah+uwaDhQglIzNuXxMRerhvO9oWrUFA0c0q5YJQHjevqPh'
+        'R1p5vM6BN/vv/pF1NBNbSu/BoE8CA1SeHhwqY5I3IUnfg+PwSrzxapTduIWzRqSICUJfWPfg1ljg'
+        'Z5i56nHMIKWpTvkokB/+pxTyf502UdsbhUQnr55qBXU9zLH1IbjRMkCaia8vYiN2yFsAZ8EWyW/a'
+        'dXRjcKMqPS69zC5dNGGazAxvAljE8EnYEzcDLW7E8OGVT7suqA0UU4AhQMVkwQm2BDUuBpb62uRk'
+        'Bjuf2Uo6G0XyavF03lsemUSEZSm4vcDDJ+nUvPAc9NAB06VYWJKgEvM7GuyVKAioCsbiQaTsyEIG'
+        'F3G03Wr50URBX+eHBepo/IX3Dm9pZ4wVWkRWQOUE6kvHPuIwaj662jVWl93iDau7GKZ9vSX5e8nw'
+        'qMbP2ic9Q9kAUyuGmTc1SX70H/tdfnTmNmvUkZ4wtouLsH9+Jthlt2ZqwbPH/ApsNmlX8WbuGH7L'
+        'eyT02TedlklN0HMScc8Mfzmxa3+ZsfMMr3hYnWfWG06DlOVkQ+7CYj/h6DZNX5xsftIQQttr+72E'
+        'LcaHdejGc9Ssb/Gcsf0+UKces//0KNIh56WlT4OesK+g5dRiEaKCJyAUMY6V5/iV3MHYqkfmWZfN'
+        'r4qIA3Iqu2xBG6PeK/BpMUWp8lhjovf63/PGgyw9TsvnLqgLVtvOIyvn8CLL/guj9GaV1SAKuZWy'
+        'pqFE7f4quRYFK6jRFtXNbJoxBjJCoOcxm0/1jtRqetc/20ZbZdKPyhBE5I9nMuPtG/LOqQItfKTv'
+        'iEC2IkF2JX6xcjQjr7U+eITSjfJ73luFf2vgSJnVHGLKWDtFA+FQL+P7Zagp4Jh95lWhTRmmWDZA'
+        'r+p5BqGEqtHgo/gJU8uIqzpTsL4SXU3JVlGhgRaI23DDJhSne6kQF4rVpLqzSyFZQu4w6IPlVJQo'
+        '5cSq1ZUBFVhyhdaIFPX8StIgveR2xIcMfEM7PqQ486y0yis5tkrKQ1iWDMjv35rNabO62pey1rtu'
+        'J8Drme0a6Mj7cZXGVfHk7ejR8d9F/BHOV7eQGi+ytw8A13DAZ2NMmcJKdkUXlp9RZIhz2VCWw2ly'
+        'wViA0K0DS8ZOLvSrDQbSYhq1iPgoSOj5ejVzpKyoaXdVhQdCXJHab/NNWnknoQ1IDO6EwgzO1/UN'
+        'qJ6h8GiPXEzmJnO2w8t7Mr2dEhmNwarmEoSKC3hc+WVhl5B6WG7TOmF1oqb7u+f12gdLYYWChBuD'
+        '6i3cyQEOJiqpOn+9yypU+vIDj5hsdDtcYFSQ7ksucv84tB7FAsJrDthcshVu7yjHl3m+sM2IORrD'
+        'CXLrahzpHIelR+qq6zfG4ct/JWkEM6V/VDiYQdA4cl7YDca4tpWZAvpxwOLtI864S+GyaS0fLg1w'
+        'wZY1I8YQOpb2/GNQtTEJrlHGZ+wb4NbiFCtt+oVW8gZqgGUWd5bVZqARB98AVa/LB/nvAtRkKkQS'
+        'uecrSlP/F1Ge0xnkOiX164UWRX4gbMaaA9uazCntDFIi1ThFapm76IL3zcEk1BGSjf5nY42EGM3r'
+        'kE+Osdz4a12JkPLFTwlQOsVjctkIY7aoarTgDL6SDGrI8olz/WpOC7p60eAnn1cpKLFFhosUXip6'
+        'aK1E9C+55HKJIJJFlyG1zcAGkpItgAefeNTGnaW0qrULQYhY40x7VYMK5kw0fYU10Ff1ln3kkobx'
+        'dLDZXo6T8ezqgPREEev/2E9ro+nEM86Kks+PF4K0U5/fRJEIK85WOKod/gU9qx8PAEUR4zIaMAMT'
+        '7egQ5hG/BA+AXMhmFGf1G0N9UCrK4eMtQbacNURRUoEwQvrdrM0Hapu3anbFead6coBy3juLtaYZ'
+        'nSkLhv4/TwiPJu77auXPE9xQ9J87uJhWJGJm+aqEchEeiHpDbBPdTkVhNIlW68mIaoazHmGC8bFY'
+        'KoQcXl1orOf7x5TnhiViryy84BMrzh2UcORYrXRwWGsfu+G0QuRePTYY58F3ZSV2iPaabsZjPjw/'
+        'L7ukCfJcq66CDmaMzB/VlbR8RI+UsA5kHbCznRWH6dbTG9j+dikkW6b/TLdzrWBrAUotT5PJ3dmd'
+        'jsf8gdlLNlNw/jeJGXgNiuXDpXrCERQlKPlX0xx5HLaambpEOgXZlnLY8ZnW27bDsjMArpgfrPby'
+        'ioBMRnGPkJiQ0hQnR3mJUsZCvTLU3BlZt6EoSIw72mBA/cgaS8wD39vsQB4kjgkmhWwpzfBr3/Hr'
+        'IH8TSclNILP615oViDfZcjglICe+GtQIDba5cjl6xCyRoQkWBQ1lXBXWZjR/46DL0Xjkg5QCWKgn'
+        'SyS9/yCf1RLBX5kSqv2zpWbkE4NoBjYK/ut4JXbGY3pMyKy+Xhx3hJHFBi3o2GLmw9Y4ZKL3ZPVe'
+        'HoeyY5FTy7NZoNJ4ISTbacfFUp0wlwg0tIV4JPxLWh53vhi4QLOeaqJaXwspnNJNWTE5wMbH2BpD'
+        'Lcb6kj69V6JVh/2u94CkmocZ/N4X7noWobXUj97s8HL4V8TKBt1lUEjwcYrVi0/ENjQOSCTHg+F1'
+        'scpuiN33If8lkTZ0eAHvaStVxRzSjpO2u7BAAt2m+nO25HGqNwjVGBA9wGXVuR9gAE/uHLN5e/7s'
+        '3YST3lRiElr0HMihgUT6A0e3ByOL/z6V/u3d6dztbZ0tmqJ+7VeDFz7nKPyKrnJi8E5MmAXCWwAv'
+        'NJ0etq4J4LLd6MazCEDCBFuucoN+/E1QKNXNlSaQyC97IgmYZVQpZ+6RzMMJy/huuUeGyzxFwvam'
+        'nX8i3nkF4R2YxXshVMSrwPdUcb0LgIld8n5Y1xBZMC0P+qIxO4LnsmKYwqXz68b0ggNb4KrKN5jv'
+        'kIpH1WixLlc9zhUrH3NrlCYyLWmqvtmcgsFK5GCv/idEjtRlGjACgP4Dh8JfdoU2BxMB7C0v/Mz0'
+        '6kFhdKVHUiHe4iqua/MTAvAaOIKdtc858FGsYlArC+q+IGiH09azxVtGx7hqB0/0O1KQNFBEqI3Q'
+        'Obi3CSEB68wM5uQw1l5NgYX5P7ytmqMCiSrDOTWzRkjlGTH2boT+05mbm+sSEJ8ILUGZgXTOrIyK'
+        'slYrfc2BZjISjQGQZXecKp5mBILJX2Aeev5EFRQBmZJsy2OpvIbjda756NHnfxw8ZoY/uearTQK+'
+        '5UlXYza8b2IFAkkEevWoH1aaHD3nW5BVaWTUcbPKli3KA/kQvHMKSQRkZ32umg01qhKkDRuTAjmT'
+        'B4wYSJMi/UC1d4E9yuKCDDOlB7xjBaa1mOtKvHT4GwpLbDghPmItMZPrufEhlgPI/yyu58QDUbuX'
+        'posYfbU5myuiZwdeELq5tSbmElfYbN4ek2ElY0p7gkwEpF4wLPgNiqrxoZm9PMYrpWBmaY7V3FYA'
+        'Y5a7OT8ebugbaPGfNSysmL2KhrG4rR6iCA/nK2YKYJUELCWr09LdLrBBrGK0wmdUs6RZgeGcL+kD'
+        'iU55F4nZBSVdxinpS3UGNibx3L6QfY4Nyr1ibvouTtIKtXw7KhgC5RU2oZanmjzAXfMhY/9rI7ZZ'
+        'VEVlF5Cde/DrZUrHkEFCaobbLlegm5z0rvfnzFFVEeihjEfQMKQi3ldfV6fevKhbyXoQmMuvOD9/'
+        '25l/lhLdpuihMpwn9iIPmKegJ+Vg/r81Vq1z7LCvcqCOPTK8nURbGgADRsAdDqglH6e+Bdq+iqDC'
+        '2tryLsJr2vZu5D86xZ+e88uA5vx9yo6m9BLTSmnD2/bf6SfXHyTexrwFcNekKOzDLrbCbs3qp29G'
+        'zEL2UHbLcX3mRY0QhhLICKZGXPBte0WeKV3bOJp0wK3nhPBZhWZwLu4+Dok/bYvLKUZUrtxW6kZe'
+        '5q20AmUZtSGbfp+wF1zrF7MqiB4LZDejer7ZvQ6pvRp78YdQXhl2QBh+QaJPsnYViEnYDoxxIz4S'
+        'wqzPJxZCKgdTktQMH4tc/9DOmyqv89ABKYM86km7r7Jw9dN/RgxwjAyQyY/iIgN+HvpsavssP0Zk'
+        '/upI+AcHMs0BO3xd8xF5cTaGP0E8wdJsNWfHiWQUFOEr0kVUVurWbPCcAU7EDjgzz9u5HcyUGVd+'
+        '+BLISbBKkcrCpWWWq+L7m6rHTwwSF+xgz9I/It8TEN1OsTKbvYoFPSih5s0y1e7JtikeDSPyFscm'
+        '4JPtifV38eXuLjfpvPipzI19jnHyFEDdqFnNL7IDRVKk6RhrPnfrfjhZ9Q6VFh3syZnJj0yhXTOO'
+        'id9Jvpz6Ze68A1dnSBjiriUs3QWjlKQf7yIs5aBAJy5erMH7B7X75myKawO/BRTLb6KxvBAgprK3'
+        'jU/QmE+M333lcyPdkxhXKe4Cb8CnMPxilMcnmPx3bFbLhW9TkzFZTn76KXAW/39i8U1OmB8H7KPP'
+        'Q3EqTEhw3lBtvrheDXD1vl8NS8YXe/qaO755C+UJ/Bh8kz57ZELImbl+n2dBoIRm4gjtE8VG2UCg'
+        'ag6u6ddTq3C0yHheZAYo3oG+pNUQ+d38ihbRpHW7NgeNtoGqhI8YRuAQS76PMDVJqKRJLJqbHrQj'
+        'MToKQlXxAL9ttwmhxeyuaaseek/HtU8A9Sbb1toWonMKT7+n7Um6NxktD0k1d0hti581WPsw/0xJ'
+        'KxrJFSsA429I3PUsmcqbQBvme0fASDIHkz6htvOkXAhF3u0NE0ZU8z0WMdaijSBAsb9wMQJQy2h3'
+        'kLxO6FFWVDiKLqr1A5DbcIvnReQyaBZG3SXUZuvEBWRAIUNrpsvItLAZLUuTmLj6ajCqJP0O+d84'
+        '5F/+7khXl+2f/bv2VZrdMExeay2lvnhoTA4g77l4HL2UJfbuWgv3WL2DGSeAPbuviU8i+XKhqIuB'
+        'wqx6345lYMeM0v268uqAnJzuyVXfTM9kvUcRxhEMrvc8LWnygOb3R6TzRJUNONylN+CjTD6iOFdo'
+        'tL/4rFad2mu3Yoxwhb5Qxdsf8vd0CTop0bNj8Fq/L+KyfIAo6iAEIPqasJQTC/6bZbxRZpy4ZBtx'
+        'HbtE3C0j2yJ1TJ7CCbKW3JqjAmeQzVbsKhs4V4AQrLW47RguwMiPRzIaHc9qkWr7VwEupUGLYPMg'
+        'cXTSkKvdrfw+k5GaG8CUIu2JLQ1zC0y0YMcaXG7M0ePn4t5AcN4Lp/iE6EtjyOL9sphPGX4H4jaJ'
+        'WheSiZha2FJYajr06S2UxBssfGDreJfeetn74xc4iow2ImG+BxbeDAmdTiEisxym7mDrnUrnz2VX'
+        'FEdf/A5bFULCus88xbR3R+fHXYz2bzxdRGnScILScORKhDzaxzuIWfBXEeZ9l2RA8E7sb0R0Nj+P'
+        '/mACafJGYMfcRFq2s1ttpHI+23uMPoH+EAaflMJF/+B7WjRyzekDUl2ckYksiHSB85rUd8d20qL0'
+        'WtQV5DC3dlJIWcepBr68fQA6Q48ggOVkk2ebDEexW/oVXfNbTLS9imVqYPU+s/l4JhtUjkvjhqyJ'
+        'WEBxFy1N0IiwcsCFfrPy0me737dIPfc1HjaYNIO3DIn4eDFLAkqhaBty4tx94IANyhF7kIjGULdO'
+        'Anv65gDnEKxidr2DtucOFDh8hj+zcu+DdhhwTZ75z5EBqDNsFR5Zvlbpe/e7L+N9+rPJWcfhBUFn'
+        'Yxva7YhJ8EEEehk/BO/MgGc4tySGi2VizuTuWpKkbxFDqZfoP/uZF6uKw2T2X3Z3VrLiogdl0hCm'
+        'il4UDuZbxwGnKcYL0iJoIeq30audN1Ae0TS8CqRs2KmCY6Pkb2hYyZlJZ7VVDTvBczz/rl9xTcNH'
+        'tV8WdmHFJtkVrGOej+fU5GzkCB+eKCzBRqLFNV+U/xvQJIKb8Cs+kmjcCPP8qsLWgjBsSU8WdMPc'
+        'DUq/WRqdImX7neXUIQTxGbslnFTYtw28hIcqB4zVvoDrpnsf5T0Kw+cxU/KkRt5j8MTGTUKM3V6O'
+        '3LeHIcx1WQJw1giYp/9o2z8ojRbnPsMN+tx2R4JxZnD9SfV4qldU1wUAbk6is/M4aID9hBrO1zvb'
+        'iR2g9SMSmrFmzzZk9CtXzderOYRG1WwlVcGcKNd+YjMeksmTASxNdnGlQSWqNu4hEPoE24ZA630k'
+        'zDbQW7y7I4nka2uU5CZ5a1/J+Lpq0fFoJMFKlk1UszZQUB6PU4jIGMSFerNiNib5KoPhPG3waN4H'
+        '6HhGNj7bYFVEQy4CDSOgNtgt8K6OOCDpQjYAxk6f3NSuWpPbR9IbjPR9mwgMIQnkdFrQ44WS2PJV'
+        'NRsj6bdKPcmhtNNGMbGRzRxMpGwqikPcPJzn/GKlNf+wSq6H70dm79KsGJOJu41l0o3jRRudpw2p'
+        'bnu54UpbN0RjWUIHstZAuFM3aOHVLAfdV0PEYNooGFBLv7UtKIpEJGkcpHdXJHQDbBAKsBnG/v1l'
+        'hYhf+NMVgcGLebbpVM8LKUJ0onk+hGrp+1ugeaqEd4IITO1TOpD0XwWf4XHYCTBGEEuqWfT50gQk'
+        'aFjdIDcpexK2ANTX0Ktf2/phyoGmDue94Ox7SU3lL0M36TnPBaJovVgfU9qWlUwGwH5fdLCXy5+B'
+        'jSKun+41ta5ZNsg1n0sVZwqloffBYP4xbDGeUX1kQVD7Tn6/XtR9xoz/614hPPI0rbukbvRNUkv2'
+        'WQXeijtRutsTXD0p79NDYY+rBA4ntCyjTWIdoIg/rymu08jAjodcSfiv7i7Ak1kRl0OOFUI8RM0I'
+        'VYJ/3XG/Lpo5BHPZv/BiJtgOD6tVcyxFfCfpsizyPhOEtYQFf7PmoCehSGRfzHOanTQxiMmhbYZS'
+        'hmKpprTjy1xcCcTXkIi/5v/vi/0h7r3n8AMThzaJJF50IjiFUsrN8TIQlWOFRNtsy9qU9WU1yXgc'
+        's+yaQPH0Q58LUEGrcxDl3FIuef7aQOiVn8zg2UecghuDJKQiXuh0wQX+exOjnep10NobiWqf0U5B'
+        'h68umLBoh0YvNOwFQvxhuIbGyGkg+Ya41VvpcGH/V0tEc42rQlprNLBIJCssPQ8JmTXhOYyjsK/I'
+        'M1lVxH8vPNRqXsTASFtonwqUKCzkfzmMW7aiuanTY5Y8blj1Mi2Ny2BkZ0FkUn804aTqznik042K'
+        'sZGh0jV1Hml72yOHXQm7HkGdQWqoHKPRK2YFiD03IVMn7aFwIxrcGPK3qT1ea7uvmR6cqDLbIE/A'
+        'cDO6Yi+I3jFPAwi9rgmFaDxyDojElN4yonYKnRQX85zKLsaL2z/QJUS5L1+lzdvB6u4wXs+vxzUF'
+        'eM1uxJthCl085rHTLaNwjUGUoWFjD0U+nKlcifLI7cgQigOwlQHEHLnbHYU+wxSz7doQqYL4ngZk'
+        'ocPbaT6KKoRaKqRjwZiaBkJBp2pNGudnSRX45/wBIywwCrE8QJKZUuKHzgNJyBzCGex05Cb0S47w'
+        'FGe3hXmLJ1ExS/jQA2lgTpkhnxrPF+q1rm+9ynGOwre+mx1p7Bo6znq4soLPU5MHo5s7ZmVnF/h3'
+        '3h7HNanvGFBD32GPNzMZBCrKBoXo3XGzXEHJInfYEZ/VVaNDnPW5wjYyAnwXecMDEbphs42Xn9CP'
+        '9YCN0rxEUcnBWr/6D/ffEpiGchaAu2p/apbAti+XlykCKhk76szjD/Ks+E9H0cDKT+5XLe24zu5M'
+        '1NISK2BIvO4+ug42DPCbisqNLoPf1bKR811eqbrXBS9OmlhbRaLm84aO1gkVauiHN39zZwh+iIaY'
+        's6Z04jRXFNf34JNbFFqO0gF2HHjTWqMgQX/UYrhUSz4nuEqo7hxQbRtk1TBKpGMpBlFohOY1tnWt'
+        'Y7YWLgtseqai6YwiGYlTsJwD/G4R2b4SJEyowZUiNdBQxI5X82UEkHCDcJycJSVIOwcmYX3bLb/F'
+        'DbbG4HMZG121VYzmMiV3UZcfsht0Usv49SGVXudnVycQJMCMRYdAq+M4JpM73XfwqhnRjp6AQMUh'
+        'jhyigZOHgIBCQVCVqQPHdt/fMhc3wWs9qJg3I+6+k1gGSJefgDQgOmGNgxE/hOWOgNGE4j9goXrh'
+        '/xxegf2p39m/HIBlLQi/ZAItYKtYeB5gtgfq0tLvLp1jDX9YAhmafEza+7cfVA2LEdVeYpmkstCr'
+        'AxE0qsyJtG4/VUijjxnXGb/xAW268KbNuUUBVajcJbic/+IQ3b6OAXHECNZiQU46geyuHjNSnCZP'
+        'ot7Ep/EP0eInkO28cIz05/z9NsaQjLsB0joRfJBOqRjGq7LXLqNF/UZka4my3IfTMUUwChSIbX1m'
+        'iDKy629KlmkF4P4r90KoQWBGTnItfPhNI2ZNQda9raiyPcE5al9pn96vr3XQ+rsuJJInHIGP5Gxi'
+        'H1/d3NG8Q/Dsw7wVHB/2heHHMqpbvi3/os3s9aodlhF0/yOFefnNZcfl3nVDm89UIb5UdbUGzzPZ'
+        'Lc4Nnb4F0Ez+rR1xjd4KlloTxltKdccZgS43w9UGA4+G5VUUYFjg7qVG/BiH1pUjmtPi2XhxOe9j'
+        '9wY+c2rK4E9OQ8SMfnQxQ5BFlSsTlLaH5lP19xglFQcQOJPvVdAQZv/vMfQ6H3XW3h7qwMrJOE8d'
+        'vIMYt2KkDAEvQNRnC+BV9EYJwyA0LvIh4c19c3iUtOSVB0sIwotV38wK2A12D2T5lISx24pNS/d2'
+        'ezQJ+1QXKwBCo5ZIaqE6QoEallTE1mxA610QN8eWOVb6J/pApgvIqe8Z1WpXphbZZL4wIAjJ03Tr'
+        '0lnEjaGB+AWO6b8Kyl/D11cokIQh6dAqw0vykiI1ip25UpJFf/sACnCKEs35IzT4nzB/f3Ilu39I'
+        'cSSo6HHqgWful39RuvF55NEO/TJo3iOHBjYXX5aGpZJjoZ6je0JCu/XxLUtYf6Gd8I25lfQcD/GL'
+        '7cTe+mQBkvFZm4xT8tgslbhcvdaSvjRJHufIjMyPbmxqipC+BpuFuLb0rsCKmAAw5kLFKfi/lOvX'
+        'F4BIieJibjTT/0Jvb0iFOPbEchl18hfpboNt2utz4/glHoJsyQ31e31CStmFYl2Mb5fRvCTd18hF'
+        'UHA7hREoXJ6JZ+hseN60Fq5ohiO9pw+ZDerw+8ONsIQEXr5S4GonZgXFxZrjwmUMSH5br8VlYs9x'
+        'mEIFGUDkhh1W5zDS0/THVOpfZs0MbaYn6dtswI2Jn8CwdCVpWF79NpHgvE7W5mVstOyB9Ybw7rUN'
+        'Gyp8wBwS5W9Si0w8a9eP+rIz7McXT1GjPSuOyZyZxxYNXy7HwIBmEznn3C40m3aOxx5joMeXrLEQ'
+        'AsqeZBzIx80ktCfwriqCgWyUkW3KJ8Myo0E0SdTBJVKN6EwvcmJEEFp623aDpiZF5Ey19pmJ7hkC'
+        'KYiz6iy1wqjWfy19BymNsTvZ+tZdvrOr7VNDlNKGEtuhJ3cytLaZbV3jp4tTX6RJoGczGLJJ8+3C'
+        'usGoplJ2YbXAZFtMO98c4jwcdaEqokUFrGM6EDeS4U6Mkvn1crJV5jwz6xiKLtoK7kmsihSKxWcc'
+        'oM68CqTDaA+0YxQ7LVbgde8mMEcGPBpmxKmFeeE4xUhqovUDUwklBhEcv5IvJtb4lb9L4n8K/x1N'
+        'snSpRRdxrCr4dkETXi393l5rOc1qW5q+3UiA2MUja/eP9dRyud06DtG7WWYy7SsRWTLPW4iesRyT'
+        '81STDymh0rqna3M3ZxXgPDL9WK3PC6FVkdNnmKWZkZFe+PxmzkR9akjuMnWhihzb1KkbjoHzEF2w'
+        'eR5BLI3auFdVoZQImjAHDSaUc7JLiCIuXT3zHpA1JZiupO8rmhB3Bl599Wk8SNBq3XPTAxl9uYWX'
+        'yOGvqeIZkFpWt1jXlP/fOhkqNIEFcS1o+mLEQcBjO5Dyqw6S1BPECiu6cnsD/iRIDQmZcKqEpztp'
+        'wW4OlTj1c8FZxsWmvXrDxOGaMY9k0xKjX67XpjskrEH1KiIqP1xzOQEdMAIeDCTBmxJeMD0mwUUs'
+        '6Fz0TS2pdqchjm4vbbwPK7rm4BSYJufr61lAxgmTVyZaN7XJ1gT//+G7W1Oq+GWS39pzRP1DdPGC'
+        'S1b7bI0GlxbP7h8JquGMgP9t/BrpE1a0tARSNht8DlVtdky/srWLozLxM6fzRYQ1iKqmg6kSvj/J'
+        'nWzBBX3cqEfBkc+Brvt6qM9pgOG80Iz5n+dha6bqzsrX/f5xRgxOCbbW+KpK4lCUszhDII4HUxrR'
+        'ER1vt5uAnCVihaJY+EJaAl4c0DWwFVpHQrrI1zrFpmYohhpphYf5V09LjlndHwosUABpFA/BxNIP'
+        '+WFtdvV6+q24RWN59nnBxzObU01umdExExptJ9mUIjkqyiQ/cYyhBI4upMktxPEgif792g+7pqmU'
+        'ki45JheWGOC1sEuXD9rmqm0pPFos2+h26IWPgeFMTa0DLFoDMclGTrzwah95VgtGy/HMw2kfGTHw'
+        '9WyjecXon4Dt8ynSZAbkLrk8+X3S56dOvwfwf4c1DDHFXiwY9Op0sbaCrrK2em63G/9JnHmEgt35'
+        '0Ehxp5xCClYl+qebIpqhChcJSfzuEit+fpB5LtAbpUp8prA0WKzOH7tfQDM7n+bB0a4jMReQMOyX'
+        '0YkCSMF3DX7S1oYsDZiuy59H9MdZCg2CsaMyVwTfh4dXJXCnF9WDlz0saopACc3ze5tXNUe+9Usm'
+        'eqqWrC8dqh0F7q+bjZqfIg/DhBhSVSyJ5VcipcG3W3c90cql+NOVvqMXxoWXT13LCnUnfHKmjD3I'
+        'rZH6kYwXaGcXIFdnDt72CM5PhOPlWIBdmWOjVeGs2UziFSi8dUdjbkoPIIP6/m0Cq/S+exo++11e'
+        'XX6ZJ0gWad2ZvPypS3M3eRLbAkTZE2X+HjRLVqgl3JrNUtEPaQlFhp2qidNZJ3Ni/PMMmsjS75Xr'
+        'tNCGRN6IbmdA3w8oeFRSzT6sCI2HtyDWJ1avKD9tXB8CBDRDoXC+Jp0JOJeXGu4J8tEBnd1VRPE2'
+        '98ADCprmIuyO+mWNcDsZz4DJB4pmxqpp4xfdEnP9o99i74CN+xgHNPmS6p7GM/LGLbDVM2FHd2ih'
+        'FrMQYjiev9SXbPueojK1qV4IHw2XF42EaQ5K3KZ5Zk4G7P+6iNynj/3J0ZLTUUjUcTNYbpRSmjzv'
+        'oMizROWouxPMeKyCCeIwqjZG5kjTEhs1+EoSWtv72DotTw3846DCF0PaIK+TdsSARE2VXTZzWT+t'
+        'pELN0+o2evIOrwbFjCjg61BmV27IRiWLqSaU28wGS/7Fu4g0AfH+rVjESJZcZBzEcLSsBYKLpFPj'
+        'c2vBu7peasm1Do7nj7jF+j8w+dl1dR5nx5/GnvFei0EadSFR3sRPz7lcG3v7M7iJ3KN3FZry615L'
+        'gEk0pe4C/6bjY6AU1XloxOYgCLNHZTitHM/lz1z5iJCYTs2AHJq3iM6oqsi6yk7X4k7pJ5bMvFfl'
+        'WqNqHRnQAUleX6vSFkEigHCNEV86rZk19U7Kt2+nBF9lD5piqgXE/osubJepD8jkKkvdRhzuy3ON'
+        'v22gcc/3VIqzyIBRtBHYpAhxBR2iGVH11yO+fPNSzZweh5mU5c6SiC+U/PGsAjXw9yuQvHgx8PqK'
+        '2rVd5+aayayVb54gGM3JG8Nc8LxHJ8DQPbxpDdgs+ksjfYSM80j3xVQ+rQ673qD7LK0V6ndn00w0'
+        'X24/0FpbMr8IEsB5MGAMELvBcrDAQ5I15PGjjhw4jrsbmtkz16eGD+PGKk7NZoDSZOJB5nObs+lH'
+        'jN840bCy9BMVlLEThi9gAQg4B2Hpdat6aEDtSHRt/0n4k+uajjgpRHlaYkatsm0InyaVkYBfu5KR'
+        'GFIpzXLAJ+krVpcevnRRsnxpRQv2hjTIRSQebQTLEWLpcMWJ6FOeTkDKrr3rcFGc0AEPBl9hx8av'
+        'x1DX1kZho3PIYDhexapnyaPrqzQdnoxl5eRt4FoliMikDtW2MEGRgVnPPXhKZhZ5fdrwFyHctXpV'
+        'dvQ/UGGw0yOftHU75KHN5uiVRvV/GyJqk27qCgFeqIZh3hv+SzeWi/0I8Dn3vxXnbIpfwhEwZDuS'
+        'IPXL84uqRn0vIHh9jHlzQq8yRdAd6t7Z2sJ81wlq7Lb8eh65AJztbuyszZipTddnwMMW6Iq1ByYn'
+        'CRrFWPOWxEVkRyjfp2Xw5XtGQtOvALBDCuCBVXR75UvB9u/GWwje+4q3d8FSjWjhYQGZzGAZjYjw'
+        'Ln6wO9BP4PPVuk7pzXdA37jtYVU8gNgUqaQa+5YrOQg35RT4JXNruwAxvFp2HGsDPlvYugmFO16Q'
+        'dsJzeI4XMWcdEmXEAvB1rZ03+qcsDyZRf6ibbLd1qjlYONFRlyH7Q2dosD0zVTUGHHBhcnHxJDvJ'
+        '7SF6xT+GAMVT3TQsvXyTE1EPkF3Y9AExipjl/LAhn+Z8Mvmf3lfwvGtFLx2nf2OYzb1r64JrdJNx'
+        'xcPTqJVJa7kSZLHi2aZhz5vzdXU66WBMfGy9O3Z1xhG+TF4NNmgNQNqxtfNi5vhgsgIg/og/QdRU'
+        '3EY7K1Hyl6lnjizvL5PmqKPEqjXrF5yygyB/9A6g26/3GEa8Aq93z6fd2tQnnkgZ/W3lPl8aHqk4'
+        'awEWnN+IhVYaKee6e144HvE2caDBBuTPVGfog8Lry320oXvLPZsB2LafuChlRb6bqIgpC/wdnNuo'
+        'pg+NV9UIhAmvRGJoQt/0PnGkDg49epZelL4p0U9HNdUp4Ed6uK0gGnC+0s9SucBfEn55thZocSyM'
+        'XoQD6vr6vn2TRxb/xhvHKhDoxw3Ac2Hchx0XTaj5p5/TotggrWgLBftbhkpR832P3Y6L+iHfn3FS'
+        '7rWJCqypcYviLGvhOv2fA0IbwN3Jks88DwLuwBEDfkTywDG83sxGQT4rO3m0N0q3Te5y+Qhj5x3N'
+        'PX/3OijI/Gc58m6AnrlBSEVYgcgNFERegSx8D2F1RcZN34f17mOA2GopCRriJ0U04V/LKoj7K64I'
+        'vSDb3qzcIvGurkJPAFVt/4KRb+4oOv3iCFTDbKGpv8OszThMMfNXlGLtIkj/zUYtQptdGptEbkdV'
+        'hsvza6IsmwWxSaKCKI/FL5orTt+yWSs9PmhkpgQFZ8oY9M5DxFK/GIQoVI+SQG7d94uE29ljb9od'
+        'PJrUivChjQlK1Qp7umwwdCHN8TvAcMUojzMSgjR/inypl00EtZq4YBZirBRZsLqtqxB882ZcaDY4'
+        'yaVhK9752SKD7cyx0bi0tSEfL3xyZfxAb7ddE7R4euJXmrPrYdqGwu6CwUswKUaY1zLiu9GOFk0p'
+        'YQcVbKNx5QIt3YvDxoZIky26tRi3CHIrXGk/+/f+SzlfsQq1pZihxtpY1wb64Eonl/T3g4B+ArkY'
+        'vqkaZQ4N9Htsp/waJc0wX1ExFSad4UOLThkUMflZSPwuNYyoj6G5YWTuMy6kR5JzyKdBHC6CcGNz'
+        'QFKNM/2TGbQMSWbGaBYRZqi7tqXptSKWMC1b+WvB8HX1xEXwN1+l0M/SxYInhkjJ+Rb0/4e48hiO'
+        'CxV/yssiijyKkA4tA/yh+iyt7GuxFsutcMVxas1vEcyeuVISSxLwwm7dJ+Yf9ID017SYVvyjyvVF'
+        'LReBp9ws2VeDMA8bMUF6B3muDZQycE/m0qufbMJbs8+eV1Qfn8pNDnm3zK8H3rGyLaByo2Lx8MF4'
+        'I2uEOLHdJE9F1RrnsTamKxXjrwXdz3UhwxtpP0a/p6jdxVIaLFYIcwUfnkuUZBe1MlFVP0hNXap7'
+        'wZjiVrUcVv4GRlvl+/eIWPCdc+YcAq4MRaQM26tCvGD0Vnv5yXHJxgmN/GEDg4bUtN+zB1cOJrmy'
+        '/rYLEQDNrthYjrMZiNHljKrvEbshQlSwTcb5VSZQ73/7e98AtbBtaipiwum1QKSDKhzd39Nidbcz'
+        'AsTM41YNNjldwjUkNfM+I2tid9W/LEmhAFBIEjLEeBQBd2cc2FBGaypocW01bUrQWQfeQZRnVT+f'
+        'b7OMOVwjrKlegeAL+S89jgwF9BSiVrnq6BkaIx7IX/R9p6mUc2FPetxDRk/XRq58NJKpWlMSj1lk'
+        'cXHiIT4aNW0S70d+YKpRh6LEMJJofUzEgnNntTeSrHOCxCcYv0CcWi3GCuBs4y2Bwowocemqbb0g'
+        'iM8xTlLJgFbIFOXo3O4egbSlH44qhG7ZcwEYcplSS2ABxoALOO+p6i1ailJtrwosFjpLUpkDQ+z4'
+        'SLvQPXP9foeWFS9o1iCuZCO2KjcYJPZbKzi54Cpdsxs4vwHVFNXD3MU5E/Zu3MAe2qunRZCvLta3'
+        'UvtZgKHJiAqaN96ikIs97QVyR9adZjf//nqLgRow2yPdSvd0FrXe8Vh0t9zlHdBWqct1Lytzjwbf'
+        '/9EG+t+Wr8WsyvsbaxnDXBiKbYJWJAHjTlGZyc42PKkX/RvXHHEIlqTuaVQpuA30ytcYPLX9l6+i'
+        'oD/0xZKy4bBMiu4JQzK2/DCeggX7naXCgx3Ki7RS6GxCagDa1jHWpbXmS2kZQi5qf2zbOkGjLjlx'
+        'i9Wb+v0/3YLPAAeXR/6wRsj2ONXpX1KbiJIb/BDHKyubCQtkzKBleGq4dcXX0SNB7W15BS7J2OvM'
+        'NI8a7jJt7ZuqkoVKRY3kxCK9ETMLdMiVJYgPIiXvW2pnS25XghlWYOMp9qAzLgNXzEpo5KgknGNu'
+        '48cAD4jxJwW3rcNIG38lVBYwzEtumKymI7vLbIFZbto2NAGkHm0MnW1fQZIpz+rFxRozbsSpK2qR'
+        '5NdYlb29tOe54XHCqv74WQbNZ6mGsoiLG5rgLsUmiH3YXJiL+J31K4KiWyy6gZE7XzB+FaCCzwEF'
+        'tnD8gT3NMrB2gDSjL1wuR6Fyppwvod6KnTH2LMyu2vH19qPxnPraCSIydC9NaJaD8lYm6w8OuOPW'
+        '5fqiZvPqDPnrVJ+lk4iKiuXCLYZDfxAzcOTe3yDO+0pZ+WOKN+BYzdGsA/V+Oci6RxdZ6FnTbiaJ'
+        'e3B2GJyq5qB95qxzUtidzenIubd5b2TsJH25xRQHY3n2Oci8SeAl60HevNIDOKQJMJNe8/I3OAez'
+        'JEhHatltNXMP4MGwcykMG9f1nWSXy6TaLy6DEM9wC7wdWsmaD+tXh04zGmQZZzRhxVWYKnLi9358'
+        'ohhR6p8t4LMxXB1jIB4nAaI7oa1pEANuh3wFTqvX8lX1SwsM1N1+F9cvQ+dybcskylU5zyuYPRBH'
+        '73e86cZmBk7gRegodQMs8DVmq6vH7/rBLlCz7DSjHxUUHWlPaEvXOjhBnIp+bDWcyMfve9pL7ll2'
+        'TTn4Q2UUVcrtkfLk9H+9mLQ6vvXP6ZQnt377rsiZiVPGZdb+zWfG4RGuWdOjiqiJfVK+yXO1Jjfn'
+        'l6OpvCjlk6sYM7/zObqiXl2hoHFyYc/g3+PT1GiH2o1N5DzqWSafw1eJBp8/SCpVtcymxFTs0x0t'
+        '+JxbBXSe3fX1hyXknY93Bzlnjs9o7MEFRqk4M9aiclbe9QBlynQWYEXzN9s2QwF4fRXsomQY/aVs'
+        'ZR8ngNPaPO4NiInL27L5rmTXmtoBHEhNY2d6YL3BASNmlGfXjQ02wgnyBhH8d1z1cpjiI93FqlD5'
+        '5rLASG4iiSFis+pyVv54jAdzTSSadjQlpu5RFUTjAUL9CWz2RLEv6umGN6twrh2gcMQx837dsWmd'
+        'hhHXOVQk7/9eAAAXzX8qx8yqUG+S/X8Rs9P0DxK7FHid0/JIVLaQeICehJhqUfAn2Zff2epHjDqS'
+        'eRxEvQR8mn6NWVhcHd+mUWorGvSLzRRx4R7qlLtsK3dXcangxFxxo2SS5wtxu1VrAvFCDba4F5Nc'
+        'aQcsPOxeCEtoS8Nr5UIm6kuAepvbnbefz0om2I2YF/hjjVyu45IKSDKFHQ2qD8oOAh1JDMKuHLSA'
+        'NX8sPZTuIXu7cxXJgjxhheeEFkAQX9HFqlY2XxfMvoHOHp0yRl8vi878Ue5vmJ2Cy+5w1Iz6bX9I'
+        'yiYtNlqqw4SgIeI6sr8AdlS8KbQ38sVNboRy7xBbqxJ3vtnWK6dja1/1FEsmPcjKdZb7lGvTj94H'
+        'fZdcl1gcDS9/el/utdiH4f50PaGiMudCtn3qGI0F6tOD1T9EfyzNjyr1/mKwsniwyyUaZ8XatHoy'
+        'fnoUBjhOWj5mk6i23suNHQjgy/MqjzISgnGsi0mJS6yjn1kt9gsiVPveu3lkMsOpecGxI8V8tBHE'
+        'N1NHBFQjFQZqoiWXgbFpDaT62LfKrONQV909l5r2Lf0UQ9PyODaxSOkyvvlS7gR/a5wuVjV+3y/6'
+        'NZN866/16S0GuADznarRrknEsqApOh2z34lNR6w+hto5689AUaEPGDQq6D6vbg5e27Z4RYD1sKKs'
+        'fWVMAgqOSTVsDrKzbq09KQl6/8A0nh/bOpuJGCZw/yWinaeqlekib9c0b38uAW9E7YYtq77pGVLO'
+        'TpQMJNSVF3pp1bHBRH/+fmX8PhwyNf1w7rvmIEnh4qkWq3874M6HEVIQA2k4cIvxAFaMczbxeywW'
+        'RJHg6oyIlIfgrVyJ1SlFbcnsMgQBixEQ/dUd6Eb8Z4/9N+f8rDf9j+z4WgaV+EmwsNMFqDf+m4MU'
+        'Tj91IdYfP+4drhAMAbnclJwBU7SjhOrvaX8ihdTdjkkp4Lr+yKfbB2P1afuR59EqugfQO3LLO5Ab'
+        'K/fZRuaDvOjhCwBGYUEqtagNKYmKAgN/00I7FaIBc3Wt9iu560BTfxpmCI9tfFegtBRAw5c/tvNg'
+        '1t1mncEfDnXP3pIgGkpteczEasqsbBNPQgEunX+cy2oPv9Ftz8j9w+w76wnlQM3sZwf8/tFtXmma'
+        '/1hUhJkQ7f1msRAKlLHhux8Fo8afIrQnL57p4bZYg3o8HM/jf0wLvTcjOswzYGLfHum6ZGqLj5qR'
+        'g5RDbse7v7LGjeYleXIECljWcBJQfuGS5pHKjqE8qYdDU9alfZ/ZReS+GyY9PcoTaSJZ0Td+Ixw8'
+        'bCQaXJc00SiXDbNss+c2VQ8LmnCdFvMstUi8HA45/yUaqJvcl0n677fJVefPR/jTHV8HOClS/rUh'
+        'Rnz08qYA3rbgvwZoZPxQff8vn83zm81j9ll4KJzkwRJN6Tu2O2GtycIyjdSNzS1mkFOGNpCRSKM/'
+        'TtRLB0CDCvrhJ29ZiJfwIfql7uPvRJdEmhO8//lmhgpN1ZYYFA8DyQBEHwRE99yTg5i6W73nspfN'
+        'B0nY9O1QMXwocxJpYZMUtMI7Qv/6OiqVbZMpTQUGxG4Khkl/Op6F7nYbvow4vwfSpgEyMV09I1un'
+        'xE5UtWkY+lgnnOsggHCjy3OA7JZeH6c1iDPYo+5+DRII/ASjgFvGwDIBd4HUACggG2tbJDOQZPrb'
+        '6nbcqepywCsCoY7zJXjyrvX0DML80Fe2GY3NS8SPFKW3jfckYkJEOPEqy54Z/ebApNn0R6CicFVY'
+        'b9wHocgqFL4LFVcrOFp07jBfyrm4Ya2Ih6TjCFLi9/bqBjZ1zfLii0LbJd2EmvpM5SoEFgSqqeRB'
+        'nzUykCEy9bSKXknVaxdu1vZ8gFy0NCrdlCf3z+qmzUFMtmRkOZa5EhUBy/Hn1Ba1xVMccUJ1Wc8p'
+        'K2/NDmo2yWD5PGg2SwNplo2lIQHimrtd+wLajnXF8AtgygLduX6y0/3DVqu4oH97kO05zdJQdJZi'
+        'URaPS2g6CV6FW87TRx1rzm+9KY+iI9Nenu8J0TE0zSq3FBxjVnvzgtDGjoFUjSn1uky2hz8J9gva'
+        'FLVXNuJEGCFu1UDpuL1S6jdMzg5Se+jesUvaWaL9zDboa1HQYcCxhB8/TMZ5GUTYScIWlonZkAl6'
+        'YjlCNflS3pA1m3vCZSp4LcXaeitcdoini+TIDeMEdz8fPWih5ZeoS40YUQJe6671CBVls+58kYz/'
+        'RsieR++OBqb5ncoAvBdzONWbn6HFgiAOa9zQGbRkf+d7lOBd+spiu1yBo2AYMR5fJMgo0wfrU0PI'
+        'l/FXuC1yT3saj8iv4GughwcwzIUrxxWQCCT/3MxMsfT6D+mjvmyI03ppimssoX7XHmwqVAfit7Ua'
+        'EMqytSeicBt2qKKvd1WIk7SlR5b1ts1yfaP8XKePBQ5yCpyo6xE26gGpr6E+gBTXD03pzKsWz8Lk'
+        'LQY21tMDIloFycjtSXXF1BAWhkNItwAimzgoMlUqF7Qq6aw57yZ11MPp4jd8xhDZf3FV4L3FSWEd'
+        'gQBD0JxSvtWVTUE1AM2My2ukFHKo0VxqdWEUuLJiTruqvTfyhah031DplQ32wlX8z4DbWgOPtbs+'
+        '6ujKjUniI4rkKmEbf6yWnjiUwRPY/rbnYlX19rYS9iEqSzp73Wsnyq4V8GuzbQ6+FvivqQTSvzF8'
+        'wAq7wFYtcIonDRKFgYWPw8wd7JPkInZPh2zaw7tUWvZ/P+ehF6t4TOkq54EpaLGWkMhFKIA+JwYb'
+        'y2yr/aFjdTiRZV4bJzA2xR5JujuUXljaTw9z4uIf54xkC9rbBTobK7ygmx8TGHjPPDVD/9jCoTwV'
+        'LUO4Mx3vIz9eFESu1Vvrf6yt9KHRgAak24x/pH67mcbpKuHiXZzSWRt+QMLTYEUrmvrvc4YWvjp+'
+        'FEVVE50vk50olYEH6DYa9P6EcsOOItn2P+dw8IcMNWF1OdzmheS7s/+XMrFcGaYDcw0hI4QGLAMy'
+        'nSqdmHcOvZeg/qzq37dfx3aJ8DP4z86lDx2xsrXz+oY/tRIgzlRnRTW0RdIkgJZ7rN7BAdJIqbQ+'
+        'AAa9URCd7CSYzE7NmEKNSA+YwyHbJ0vI0AhplygIWKWxPLCwH/RdQDnCnzX0313BudkFXA7ouiWt'
+        'Lk8FLo2tcF7cY50006RlepZnNQOd7YdCl4Jb22iU5mYhEKwZT/sHVB9J81pRLfPpgAP+yWcOCF9U'
+        'QFuc2CF0k/BQr9lGo+2H1+vRiaA7bO1H/dmy1XZzO26Lh68RrmCKl9FM3BLWKRTAVqrDazqGGVDY'
+        'R6IUKdoK9Y7IkPWuWhJEN0eq3VRIWoT+kiBu9Tzifis45YzkZ+pK7wfnOnQ4apFx3xl8EwBz9JRI'
+        'hJmY/NxJjwHIIzkp8zvPRvFqb2AumhQFi2Z+lPfsDoFRBlD6uktWopdcBTlMyruT39Hj8aPuDvBf'
+        'zcGgJqbMCDzcxFW9FeXflDSVUpcGdPybGDWjibQcySE/6lnxL81UCI8u6H7chaumsK45dxGbzo0c'
+        '8iT0kB51jVIabAQKsY5aJSC0Je19oNyGqDtTZaQg3XI5PQUHR1opJ3GlqUq2uYn7Y0u8hmMoSjCa'
+        's+k1zT8TJM8hTxA8/m4flFAmULTegmSn6tZ75dMjKsebRtOVti+ryW+k9R3iLh0ug3xu0O9mSeTF'
+        'V6VmHb7ElXsYxISOtNPrIpzt4qtKlzQ7sfvNePITrvMch4sGg7XrAKZqsXIc/8NVKbu4Zp4Pxqar'
+        'AIXhOYRzcRMlWK7mqz12OW7W13Vvq4voFMOcLBukaJa+92y+aH8VLKx4zfYBcXufG/6lG24UE5ic'
+        'Kq/qa+USh/9myJi6TJKvIglq1mxBf2WJEAoWM+wKX+iQQM90f1YAaBp54ElfwHv34USWeBwTZz4s'
+        'xZzax1ZOToD7DPnbq6AMp/bFoRMpDfSTCwUN4/5tLhd1YbRafc9mDugm86VHDGz7w4bUNJA7OTl4'
+        'HSuEH+6Y7lji75p2v7+bVMS5kx3COayEaiAeU8w6frzvGZ+hrvgULeR6BvwyKP5RAlizqIfTRtN5'
+        'CcXoOG5ExLU3NtArZ2vfhSeHbWPx2865XeyDEe2eTXFQgX5HddryKQuywXpBzLcZSgow+KjY117g'
+        'bisRNMIccryKksqnXZN9b5dgFC2jluz6gimDXuPV2pSns3El6ZPGtR/lP2TY/JSCuwwwkU1AiEIF'
+        'fF+vrBNaddoC4F+ZwJGdp1YgZuvTxMTlUzt759Zw6mAG0asAsLmfTpIXe4GlxmljlKB2e3OJPOGS'
+        'MXgCmKzqfn7DZN1aWorbe/wBlZN3Jci4URtFv9bzWXSEWH8FQ4R7pzNvVNVZIRhXDJLLAGFLOB5A'
+        '5Co2soWEXsd8en6iGDi2sbVPV19fGD+elSnZvC/xL9wzUtGkCEwinqKE3lWImIt1eUJxWQFhABhG'
+        'ufsk/HESI4lUp19GiNRxHv7R6j893BYFeN1cfrEAVu0JThZoHhAEpOx45424oKtK2TcE4hND4gys'
+        'KApQ7yOZ/DRTFhzqr5fMuDtmNgSq1QmbZnTJ7v46mGi3wRTM0xDX4E/M79cTJ17TUT2n+WG2tdYZ'
+        'tZDNpWwSkcT+/oNiqD4hoVUIcYxkld3t5Y68yJYUtAJ3Av9pZOj2L8gSrDHfd8r3EtD/AGxf4mV6'
+        'HDMTr6q/JTJzYOETkS8SwskiUX9N9RbYd98hYIn7IGxszCgQhkkGGFygcS3NX9R40ZW7/Ec/9NFR'
+        'kl3krOEiYnd319gtl8aA6lOrC5JtbPX1iXhehRfUHBVWxcF4U8KHvTf4D8gsOitzXqtpguMz04Vd'
+        '29Q81rufpHbLwIsB7PWuJFRsaHwT2kifwJsWyQow48rj98+1k+K0V91z1YrQEn7VUYxJzTnQ5ugZ'
+        'HrRX/XYzxa3o0m0UaiVsRDrDhVNM5zk18lQx7h+iDDaaAmdc6LgMsc8gebeleCG6RdfrMzs59uWC'
+        'AWwI1emUqRSH2KNVuV+XIr7tsXrQkUEOKVmSw8iNQd3QDH9MyUZE+UZ0G1vjkhBUTVRJN9J46Yv6'
+        'WOh1JNds6RTuQxT26aTi4F5BLYRgrKF7P/b7nulcpNmKKK4GAQ5IFa5ZXWT1Yep0wMCY+QNd/HzA'
+        '9331KXHHFbEQGuLP0xu216JbGy6ROpyffKLD35j+15qG207A8IKj5Mz+i1wJkRpqpOD0iCcTGWMo'
+        'R0RnWNRboTRH5BEldjh9Z3v8RJKwUV8s7DPwLIFrS37IVLdn2lmFJxYCy3DXpmxo70a1UJ7NOj8h'
+        'p4ib+nYW0K8wX0EmN/5j1jB73fb/2Kka4XkTGFynTC2L8kf31ooeCvCXah6M3CRrwmF/CoYJIw0w'
+        'zqnviWS47tvkobnibSEnu0BYkSDk7S1qzhiiBFH73tKZB9rwyIfl6BynFStFRTy+tKCbSX4gNWA8'
+        'IE+J+9HIlK5UN0Ri2ySQ+d/zwCVgvOTDMad8GpTmJUNNUhLdbOPJb2y5nybTdlhmZU+xzf9bYCgg'
+        'vVkzOmlzUevB/9Yhb4t4ncVudOnLorVzoLG7ADW1q6NbUnz8QFfL1rvGH7r0lvxf164cKblggAWO'
+        'O0mWOItGcSlvIwSYual9bYBLQ9Iug/XjMqKWHgct1QKzjnxQWY0f43Nma8Ewor40OPZJklryXNMu'
+        'agfGlvTybTZ52hpkD0tbjqvrFILbD0KzpiO8rykOADRPWbbQskxpKw3WqLn7yr3eTz2QU4RNzZtf'
+        '0BHdRUJMgyDyoYqWRoLy2JTU2y+K/aGZ1SgWHI3v5D6yRTkoTr0q0Li2hsB3h4RkP4IYCtOhfOds'
+        'SBEtnw8L4Om9nX9jAXeF721tgC2LtLdX5czm7IqdV9Iu77P8h+gdCcFboitmvD+eqE7xjQV+Xy2s'
+        'uQ8DHzwSDaTb83FpqpclUEj7ET6xfDACGH9LXyXN97uqljLQ/3o/yp7Jg4/F7VSK2IRuvsV28tGH'
+        'Z+Mb7z8Lj+d2XnLFem+s9VCzCAyMdbL36cHoGsrTnFT2dWoJFv0TyQW+sIo1rWnIAH0aFftLJMa0'
+        'ZdN9lO9qxV7c+fdYQNP44PT2grR/qZMRoSEBi92JB83tpcnU8h+igl7rxdAVNig07cG4mccxHvZC'
+        'JOUpzv7uDrZsLlvoFU7qpPl/vStXD2LA65YYARdQL0RDEI6GiUN8pDISPzUVY+i+3spsHY8TLtW8'
+        '0HFWQT4pTMUx1OHIzo2UNoGrQ31V7ugBmMqW2cJIOaUi95qCAmoDrFTBWh/xquFCKS6R82mKFVaL'
+        'qgHM2M4Dnd8S294GiM/jte1oMvyA3WS5CnPes0WFhWD8omAd1CMzhlTRbzMdexEmL8uhyUEPilk1'
+        'EvWU8Bny3rQHpP8SEsz+9yCJeJ+8YHbCuEZXWfGbvYKWnmEBKE5xx7ihm/ZUa5n0COvZ0DI3UjHm'
+        'rVjNoflImBwEjyaaDWFBAg1b63RU0l0a0SIukANERikuQ6UhljMhEHRF9kqMD3DRXE7GNUUt+niu'
+        'C6gDHVbfjmbkpFe3ZPzWrLztOU8zdiHsZnY7fWVHxbCfxuAyhviicwARxH3bGDYPBYYHJE3m/zNt'
+        'kop4bvUWQJDjaWNs0Lyoy2y/gLhdtyL099OSJ0mo7bLDkLj0CD3RcACYLM/N8nvIASpYVyaoMXlS'
+        'aEVGjo3PbnC+EiIPpSFq9E+1tMi4vaefRB7c6aGT1/x20A+tWhrP9vy4/lAlUraEpNc6YqB2we0h'
+        'YG8r5IRMe6bZfnKtoquYxK9bhcl+jFGbDiNd88ZCQLCYvjTdg4Ll2fYhEIYj9d9flsopDydikspQ'
+        'v4iMdzY6/xenX0h3hAW5aokeV8cGbL+FNJZuXIe6NYommGZ3COYt7cb4IWkHem6D+h1A4iIR02Ae'
+        'pBOIJFfRwlEDe3/TVLDFwflMnQf5eEsbPI+v5EgebzB4y70Y4fvKdlhXK2HHzVy9k9uO8N2ttGlK'
+        'OLIv8xHcKHNJlDOnB+6v66WqT6+BZylJ1SWvw2qDU05e+0kD+JHGXZa6n4VIs2ue4LD2fcm5lLdN'
+        'oxeoNoW8kE6XNXZ/tuHemTtIIbnkGUuP5Qre2RTXWqyScnL5sEx4Mdk6xB49/aFoCH59MJynF7M9'
+        'N8FO5YoOs2qUfKEw1fmKy/1rG7bfvGYxhnUxBwjtzr2jZZkfh4inb0lv/L+Ivcrj1zf/edJVj1Fj'
+        'rld6sBOitkzuxKpEZaj1pdEhWfuW/JdR5DxhSMGVhKchwp809dFkYgF4IoVd0qxYMAVocMTuNOJp'
+        '9d2FoW4yJuzpI8uLqZWOB5EDP1uFEamibS4fRMdW2iY8S9YLJS7Vzy9AyJGBlK+KkZ31Yv6KMuaG'
+        'fRSFrlvx6vS7dDc1yuE7f6DtlS1SqIJU8Ml/eJLM5Q07X7oWYkLKFIbxWx6Mqj2QutSN2CtRaYDj'
+        'tFr8+dhlr+Tl1hDgaW0MyBnme80Dz9tefae0AjUZ9D8DRHsamA0srQyaTuNpxZZlhK07iUSTh1wn'
+        '+BY7F64aZgiCVLHCuYwXI+56qLjgQKveuPYk8EI0fmHmtwxDxkzU7BuL9+JFttlHJ5CEGkQxXOsB'
+        '+ZJM6zWUQI06/hwFUUzZIMNhbXJVTXpgnFO3GfejqJ2DXstQjtREdIjvyaKTICMpA5lmMaXKcIXi'
+        'PIn4hwmZRwPy709Lw3llU2xjnB7OFWbHwOKsyf+JHotT6+VbPbskzXPZ0UTa+Ch8LhtObWKu0vAc'
+        'QWa3jHkBOxPGPWaTpuOzUylcpDcMmZu6fZaFXlqNfMPj55wK0HZC5rjDZlMB22Fjto+zQueKT8xg'
+        '7K3R7IirSJKrDSkvKWMkKyjK0kICoShBxdOLxAAxHzy7YXN7sdvZ6bEj48dwcTRTj9sY2cHP1zkr'
+        'q+BUE+VcZKzcSKX8DwLnMv7j7m78dGPCHbX+a6kKHZv6m5KDbVDlcPWik12Zw2uEa/ur0kPukC1m'
+        'yVcIPFnwyc0J0pkIJlRMRMMAzNAc+Qkkc7u2YuqcvaIl3SVUw6p/S5H6n2tzJwRojmigEqYIpfMt'
+        'oKt8Vxt+MhSOFfq5KjdKIJI5J48Gdt9wla4ppQYYcLXDhKSaVJFYRzg8SMzOJryGhdKk0gp+SljA'
+        'NLrl92tv0bHVQtnZ4jqe+bhl/vDeCYCjo2I/CQgH8D3wJO0Eo/HPdHgqaEGvvzWbEWrmbG8UwZRw'
+        '7vQxJPe7m+F5RG152fnjwajjJN/rmVrwfXuo4nzCbp5c4fgYHc2hecEX4vmVULnMLNblhcGFtiDn'
+        'V4kWdarIqZ4GJwRQhJ3iUXTmgQRA/WXb7IylPVmEoo4oSZRqlUAARCzWnoJ8l0sMNP5H8k7QOruA'
+        'x4pNQq0a+QejI35YiizfjXE+JeJ5w5wS5yZs//ECxgGghmXE58z8z32zXfFlfIgECAt+d6n7J0/1'
+        'U/0WNKcVGIJ5vE8jgLh+UpOaX+rPO+Vsnp5q7/onLaiDcWPWBiob/vuuSjLK/gezD9KAtJ86dJ8Q'
+        'C4pffa/Ldr5k1l3tlW+GkPsiqoq0sKNnta7fQ0j6eju0i3V0n926IrHCJhf7qYn0VHmqgqaMUPoV'
+        'iEaj6cbiY2pi1zN0kvJbaAJHrIB1FNcezb1ayiC20NBfz+xqnAWXZ8KcaJ23Rs/v4nDgNxx05tJk'
+        'BOYHQd6ocdgAFKefL83XW88hv3ZNR+GUGA5lplyYqWoHatETFAwe2S4+rIjZ+kG9yWBfX2DwSQOE'
+        'WZsjqgszZJW9vDU1vtAlvPiUdE4p7lF5IqD053Rcd2gc5qbqNBnXRW+v7euQT9scqdi3cFubrnsr'
+        'mTcyVaDjxcDbQzZ1yn6NVhHk+T4LKLMXjhaC7EjSdnjG5Vv8rUhb83c2l4eD0js7AcFRKh65QeOP'
+        'g9s8AWaqzdpgIXNCMKF8qxiKZsi6vOr+L7GAh74fLh4H3PXGYaF3BxGIXqu5aKL7DyDXE8ne3oOJ'
+        '1ctep2YxLzsdrL90ULkN1xF5hY5Wx3CrGOKB4hIySoRp+C+B2EtlWsnwfFQ9g7eYuGCk6KjiyA/A'
+        '49jydMRicPynMTh0HsGcc3NTmbi0axB/B00ZJcPi6mM0t5NRYmttvJz6PpfyowJncEIPvldG/nUN'
+        '4EqkqyNTvH+6zm40Lxt2h0/pNdcs9ip19ylWcXxzsBHsAHWyJFWk/Wwo0tgizmIR/cIRb4hV30jK'
+        'TkA6WthVloomiXmh/BRnPSyVsIMiQ1t1BL9AFQg1Z1zv8aKwfaaRu2a56sOWWcIfpw3qbnoMXso/'
+        'z6462VOoq8m5azjcfBRHoQGjHjbcuhmvSi4W57csA5/OvMr8TO9wri0aTWdk9CGjjt8oI5CliI8z'
+        '10NJo+MZhSijSCN3ksI0uMz7TpCor3tDcYCs1gRS8KGzg1dyVxVqstM+MhkWd4lVt/v5TWF7VTUA'
+        'KxC1CfwZKxK2dYrrmDEQVyNevH2bY0kIyaaFrhszBh9XEtQejrwk56z1tzM0xwynX0ycToOo1OHs'
+        '++NRefM2Puy3NQnfnQ4fU7z6LxFvhrO5g7ZnGVFIc6nCPPQk5gyKlAFsRnYQmJTvEBf7HuIM6DjT'
+        'n6p9TvI5PWgQx99g+nA+De5CXbGYgozeolgkSzkC3eIQpA2iXwCFX6VeqaU/dHyPkhLSMtVVeZtQ'
+        'sSnoAbtnP9KLVln6B/Am5YtGyk+jxObp9r7hvhX5gRtgcemi1h2l2Ok34vGO9WxiEjXiiS8aweba'
+        'rtB6H+/Zf/eN8hmoz4Cp7Kl41hxcdaaQ3Xn/wKYeeUim5sLZJqPt4YZh9ucbU9ndP6g1spcz4dXf'
+        'aGEe3VcZPNtG00/EKGIkPMLOpMago6yY/DcmqueD28wAtCIHDrnPzyIwaES0O2+T026DNdNNLG23'
+        '1ld50MCuNhPiQgpc8AP64vXds7ORYZCe3YVQ1HdLVnb4KtSovm3iVD4gGa9EIDF7SKwve9UWQW25'
+        '2vxze23otnGVxpNkEz9V4HiucaVNuVYzofTWQNa/WLTxCoQvFxmX9dVf0sTeXfLIpvKzS7Uvx9l1'
+        'uECLfbGxG0MUqi6YMPv3vyaIkak2jPkQA4+nN9xaQV8/QcoopqvEdWtoYSeTbJhjo/6Vh6bZzwxw'
+        '/P97pvjdKSC3mGIQtTsCZxaIuRujBxU0EEFrF4Y4IBxV9TUTWc82aLdeRT0MYK45woh6u0pZjWK6'
+        'b0Du3LVHgLyiTMmGEiGL8EkAia9msK+W5r5MXXifcoSJjK1lJG3PanJeaPtkqpk7BQUjpN1mwRga'
+        't7jolFOfRX+fPtIi0H5CxoRkqlnY22Kuia6lSPRx3ZdYuOvxlUx/qhNhblOdG0JVO1ji2rz/Zuz3'
+        'hmOAEjJK0u/Jhg2gTVDvcVgB4M02cvJzH6X3fS2g475sNcC1lKVebZqdrwv1+PqkR5vCdZEhc+/B'
+        '+1GIscyBXbrk4Da5oXrt6Bj9/C1WdHB/fpHHgpHvFtXRX7UJ0Co3HiZXJcFd1lQPcITdGWre7xh6'
+        'VmCsHzec4AtjvnHrb0cnn/EiJHgI8Yc57GcBzqgvkzEUXv67tQA9Jv6BneqmMC7EdqdA8fSFPM1Q'
+        'Vomc7oOMHqcDkFXhAS2hEO3KUSjc+d3C9FbmB2z5fNSGXuYLOV6odB5Xvk705Y4M+B7jwOsaRLLE'
+        'miF1kexqwJABPwnsquYyuqinYrQYLSVEAQ9CnpisPNuktdKtn4SYdaGeSaY15iOKR/aGHEiYhdky'
+        'tMzXNht34HF5OlcIsxA3gOKnO/yQAjPGmq0d8m9tabZbBS9LT5RH4HmqGO8dK/+9TJStov4DicCL'
+        'WOOLkz1tKt/j5ZxlAdzAPrIrSaaevNQHf6Kfuopoy/agQMG1ViGLcfk2AtxTYC3tewmNRVPBH9D+'
+        'CobPzdMh2x4aSZvgmXD+PM4ap3U32owVNi506JuRYeD9aQfpc8aSMJZPTvP1HB8l+nzEvydLGZmQ'
+        'G05AtLtzac2tZbAZiJEBVQ9GQoHoFh24Rpas1NSoHoj7dTU4pKNhB/ykuzRal2/f6WjFITJLakR5'
+        'KGyk51OQrsCSxNHdisstp5YLfEqZZ8yE5Tg99DkOOGncfVpS13bDzjBWS+PumRDURqngmO7C03Rc'
+        'qDIZPEfRhdqxsbtxSBpO7HtnmDXxQkX0UUGnKK27faUAOHLoD12a4XTbIXEUdqNuIoyaEnOFIx19'
+        'dyBlh7s/+J6HfdUB/ydGD5PlhtNtZywNH5t+uwgYDaRaOpIxExdioDPEjb9y+PuTV0ypiUQOxnQD'
+        'ev2b1/Iv1Aez5nhP7Z6ZIjet8iNDs/6UsC9GdpuuA3vRItKvchGT1pR/hfQ9I6mvLHlEt/2r/x6H'
+        'jH2dlpQ8fEHZFRIdVDS8yGENn3QeBXPg+vLRBAORBnWOC2JV9dpFDjYyQhtcOnE9WKHFLLwQYMQm'
+        '7s2XdEECrX5rmGsUpVpK7J4CTdspT4HWGJMvZZBMcENxaEaO2rEzwGT/0Cnn+a6pL0RfRqIFC38W'
+        'mpha0U1o8hx24EPVp1xFrxgDeSBLRe+Fz6hDRys2EHjLpeS81GoQrKr1H5SsZwlcYEMLw4IfKDD9'
+        'usWcePm5kj1ggiVcI4PcIMd08AwsN75a0v2KEEO7WrikYpJNXlGyp4UkNUWHwFFOuQVc78uyH4u4'
+        'aUBm6jTs+CVL7IldYsKvfTjrGFouH8kM6R3WOLMG8rC+qLdN4+5KwX9TMmptd8ffth3K07a/ZDy+'
+        'gFe/ixfRIaXohCdhE8MmVXI7cj2cpzlYXGaZCB3FFw0mrJCJSeA0VTYAILQqnURMdrJiS0YXpC6t'
+        'vS28/YrEk7ogE1LsU70Fsi4OAJuHVo2zXfQGKioz91Alv9GrC/nQnQXrfnvqnH93xQ0oKp3XpQZ4'
+        'cXMYqoxoP3iYAS+4IxOW1RjiGxtNvGz/lLHn73vJluOFMgGnYwLomD5E/FrLdibb8fYfz0/BpCGi'
+        'UIvV4AArBO6xpjFpSZp4fwcYX45gCMoZH9rUSA8M2+ioCoWG1Zv9z6S8WDFtQEySwysdx7FfPHWJ'
+        'RrPQlf1DoPHjWFabduOToHnKK986MyFSDC0H4ObyBhQu5PZeVxSEqJQNjK8QnP+nCoTTQO8wtrQG'
+        'T6aKfHELyAdsMqlHEsdbkTIZlaZzQJg0XAqhvTZwSMVtixpjS837GFGY/EkmZ/bnXOR+aL+Q9S+1'
+        'HNEomD+adiXlF41nrsbW6ngV9JSuWNUly0JD1xpEGrQ/mYfwz/ddsv7ncAVtjiMM+afoAg7Ag8Dp'
+        'gyfSEmCuPexj05kW4ufpu4IIY0BSNGaenKKkMFs1kiGlL1pQOA6KTGa+vHbIGWnJY9yk7oOJu6kV'
+        'CVzzFtDuzx9EXluRVnTMCN7AM3h8Q47nkzpy9qkQRiWsOaCGHcZvl4CVxHVJFxE6yryBjkthNh3x'
+        'c2BVEuiOLcNMNodroQgIXGTKkE7pYESdt/QiuvHUxj0khBDfZUH/GPSQh8Is1nJOeUxWPEzGAPfT'
+        '6FdUeAPkayjsqc9vaZqkAsuFf8FP4aLiBUeLbA0QquybQHqwt6Dw7h4PIfkyb1wDefC8DiGYUeD8'
+        'VFhaVCEbDUzhT6BfjV56fYEauUIwo4rJYWajSSZ8r4O9AQ6XMbD+ttmzCfXqeuV1aH3gT03mghxd'
+        'Gcmj/mSQsPc2VSSa50zxBDDTo5cUAThJwpcSRB3SlNJ59gLoE0jrvsmS6VKV/jjxTNK7nuMMm0PV'
+        'VsqKj7+nO1hwDLUerYytwNX2NjWy/cNVs8W0+ZJUaWpDuZP2aHRg4agia9KAj4OoQaSTG5ZuMyeL'
+        'pwES1K7213D/QCE2IBSbq6VsE6Y/hYzpIti+LZxfLadUl3G1O/fpYbGbxHao2DmWCWTtP6XFfwGV'
+        '4q7SkUL5sn8h8Q03EVcG6jTXcrogSalGKdB1k/f5YciHOVbsR49BsMqIGW50OPP/6HkRF9sym75J'
+        'R1gMyLy40fQhFXAio/y5GZW4L4Ma/itlDoJTMOOM58QdKqPRfMUK2rgOff2Ao/ruUCwt3guRkLYI'
+        'FMMPz9S5ZO8xM6J7mEDIg1NDlLpDgS6avINYSB2RIHPY+r638SDgKF/dv83R1MCuFMmZD+NKE2CA'
+        'HLOojjlN88fKrsckEVGcR6+g0X+6IZXfaHyxdT8w4ydEiWRKueXjjMfcZ9WNvbcOwvpS+MQGyGGS'
+        'f7vJxuNRQNLQOrIbhKiBqUhYgKkaKUYkrArsifWXxSGwzZOWgxGkK3FDTHgTzQLUbwvS6MHCgU3w'
+        '0yjDkiOjMaE9bSJBh4qPmIitsDjFsXr+0DYrZeqzG5bc96lgFYjfIJm4T8v+6OmwXRoCBPnyNIXK'
+        '5ORkSNdw24F/wzmNfyVMyXj9iaak4YyzeIA3SdtUKhEq3j91fYTpTyY5JqlnXjRO1LYcxQDJNDnO'
+        'xf7fIeyvzWHlRXuVZ5QvjaYeOXdTwvyrsRcKZsgdjfOQVMVVmLKWkBVaIFvopOBc4HSRHnwqjUVB'
+        'BZEnbQ/gX79DA2MTnV2r9WAxeDwuU+7mDPyiXWaiDawUdGipitGM1vBTP3IjzdGRyS1B2HhIAMPx'
+        'bbwWTkAgVEO8hCzXs/0owlgcQ0MHrq2m1+DPvKFyVYuwa8QZLOqWv4bf5SNh2B87Pmvj0IYZN+2f'
+        'GIZB0OGtODJZQt7Mw9ANm+/zw8j456z2DwlA760lUqVHqYbF/qXEq2uYjwGReueymFREf8ordVyf'
+        'e1AYVNQY6/MvgZF4cZrEuWofq7o+xExghw0v8gCl2FRBt5+btMLmQDG9CV218B33CIrmiXv7ghG/'
+        'laIj6JsoT3WD4M2vNIcsW6VyjdL1N2yRqyWB4Nyxh9l1d//m9edSHdyje5Of2mKyk+jUkZ6t+TfD'
+        'YinNKxTrt7U+Q4L4vRF43hGW9iIW4ekFvG869m6ZvlWKfRC+i0jYDFnj7BNMieVYMsLgqGhaGIsp'
+        'MViIjHIgZUWGZGJ67B0ajtsaqhj5Rxd1dRjuQyiNBdn3chNAsCWlekD9lejjAniO8Ml3tdkmuvuw'
+        'oqOuMcXj+2Fks/cbXv3nXPa8Ou5MqhLY+HlcJr0U/vd5BYsWvqvvAQwI69/EclFvAl96fRHudZef'
+        'n5vJZGBx8HuFVBTjGW0i8yNEUfW7o+9XXWgT0dJY5wC8ZNmyOs212LfvppRcya39VU/EcN02ZMx/'
+        'cISLcg6WS3VXMt7s12seJiGL5XnmJ71u9Yqak75pn1W6qTGE4RQpsQhD3J2KqIVv3N7P2411t3HK'
+        'R0FleN/WnUly9T69DS1Euwl29a+8K8AGLrHx/tKMx6fv+BIVzzuFqiLyaT9laYJDsc7LjzLrfEBC'
+        'Jl6Kz1bf/hpx221KL7hVRmTar+r3xXHzPp4/BZrsqfc2gKp2wfhzyFOHrjeusf4KpLc/mMO+C2xJ'
+        'WTM3rGKgFcaUeBj3hemw3M64id7CxapeVDiTN+BWK3n2zh6I54g+x5EQCh9uE/09ZxaCMRwPfTho'
+        'TsJ3ubaicDjZGhVW7uWja4oHUOD0bBZGEYNQacph/9+XxPjwBXkCGYlYe1JSruX4MgliOOwhza4A'
+        'YgPT+YqVMGcuB2e4S+oa79+V+iW8dDph9+H2+X/L5mKIAt04C4qmTwjBWg3ZPAwd5uA4Od58d0vV'
+        'rIqYz7dk9CpwQFhusoNEIiIZefVpF6qikY1v9JvlyjccrZSyXY65CAq6L9s7pjF/SK7YWNXIcEj/'
+        'IlbcBFCRV4+tuCHZptIHMcR0SzHmNjBvLPxVBXm5/uq2VoA4z9oTrFOpanwzekakBuIkmSwUmisy'
+        'LVjDwAjxQA289X4QfDZ3XItRKQYvO0M1q+33wiOQo9m46F3h5JCo5lbrJbg6Qte9B6p6FrulXSFz'
+        '1DcvPJsI9wtqcbdKYD3eE2o6/UCzaHkrTi23TpHBsGoz9fT3AAgCsxAzEp/OHPOVqONKApdCtqkq'
+        'AMk6E8ZZKg/qPtb2F0SncwZKx4kTjN3KpnFYrpKoIYE+WtsobZK3PgLTzlwz4Nci99zIURRPQyy/'
+        'Orcub+6AhylsLibiEtCK/gUlGaU7MkLtMT76hXfwkqSuQy/XGdI+G5+Ae+IgWpB4RxIDda1K+oG1'
+        '1t3UrGyl5PfVYDNflSSSthdjJc6RJ20ucwcAE8oScIstBNecahFyFv/H/Gx4bFNbu1fnkJFb4oLL'
+        '/5jzDw0xVIONywbZ3+TIdKybNBHGnn+lkh5Uw6QWptxZV+zFdZal+mqQtFyHeE1SDX4Qcvttre28'
+        'p9YW0e7O1hZDjQSc5SwzBB8Kmh8GAlYzsShySEy+rJ8m5NJ4343ykOWvs2v0A7WYugnUB6n4quZj'
+        'DfFWJMKxCTJpjMVKCu2ztAjIcjfRntyflYu2z2ewsTDUVb0L7QFBtl/KIdX8aw+SBGJ7ozmyDqB/'
+        'J9rduey4J8dmfTpn3BgKLCDiHoDEjfY5km2d+jOiEgedrOVSZT4Zp4//ECKjtnqFKdcuCh0oW13m'
+        'PS73fvuBj+M40tE0EBHUOunRfQug6CDfYvV5cSmKqG/604aaGHD77NJTX/mJsw/tkyhd/3+pAe2P'
+        'aWsi6wvn/F3eEi9Js2MPptCjiVvpJvw9ix45HzP5a1DpMuvWcVWnaFG+08nbEU4MrpxghhK64T0H'
+        '1/qOpmuDa6g39V/G6CFxWVuoE4zf67jKWBw150AIvfdhIROkperJogzfpBIDWCC18/MI9I5PMqGI'
+        '68cPKhWwZAvNHLEZI7zbrgkiwzxJx1489Lwhw5QVuNXemN3ZO1oSLQ5DQQ0cvIrDpbefmD997cCk'
+        'mB66Me45nD0/TrWfo5cIBx6gyBFhdlzzMkqc38tHm42HTIFCwPagAU6K4VLqThhWZGhQnrL7AbHS'
+        'gtXmmdS+sTWWk84yum6WhrBmrxC+zWran54LhO29EzG3P2p2vCs7+axzf96kUCA1T6QjLuYuYUTz'
+        'jKjSKoLO58cgVZSKTEezUiycdNup04SQqBVnuvuKNCKBQ+aLbcLr5C3bXx2Hc4d+PMJ8wfviMTMb'
+        '4tk/d3v/x8/VBOX1m3UbA6Ks5DLlbm+h4Lq/s/8Z+I3olVggxexhnzBKrjsLpHpLCq2t2yrB0kQf'
+        '3Y3bZz3A6fbjfcJI8aqxDzDSQ8IvHQS5dWfLwnDwSe9Ecq/NgEq7V8lZ/A7lIFs3/J72nIp4wQr+'
+        'VmFXLbU2btSdnPVHge5J/KnFqN9VAoYMoY1r9TkUjbqQsb3vRpOnMULNd24qbAGHTCRP/mcqTxoo'
+        'AxPDEayFLxglKMd9CNupfVhteYHgIGGqbHWq6yPDiXAC7ynj6Ri96/5wtEH9WLhOK7hyikOl5mkW'
+        '+0i3OXFP8Oby8pljE0IUOtG5rRn5qWvWcgy2CPr01PDCkXZX4qzzrf0Tj8r111qmuORaNL++wkfs'
+        '6VXhdVXcUoI/JWuUY7GV2lQK0GM8yo5GL71m6SQmR3PUUQAgjxAMzodeglTPCfDMEVzEa8N4JOPr'
+        'ZGiF5+RYYYusHX3UEjI3UAeJb0p/r4XLKTvFdaTiBwdPzLrJhK8kXwH0wm9EeWwG2lZR2J/n4QuT'
+        'NlzCP8HGrIcUEfWq5BynQzthxQXQSf8xZ7bWAq09F9HJcNXGQjKwSffq9/FOXmh5UDjGZivuFNgd'
+        'lfJvM7/L+QGDyGbZZ2JcKiVvRKG83jq0fDeae6Zk+U8hjay5mzJYexpu1TmM7chSJ9VmyOnHqrxQ'
+        'lCveY+bOT7dnQmssEClbmxo3FYDBAFVVrodoO5FmlZ0HZmrH9YHF+EOj4uEn3CDQcwUkmBMhar37'
+        'PNPKrJxoEjeuR7oEZpcDC4PkBq04pyrxcMjNG+3ntxdHITUImUm4UpPaCnPcNAMCHbUMxvcHLmU8'
+        'y3/h9HwBjD4zvcOFFHPRltcES1YQNPxHjQkRZmA3FFpdt3aF3EzdXB4MSAJCzsogjj692DeiCNr1'
+        'YVTZsuDH/w02sE+R6n1LuAiUt1N/KnZJTmYq724GCJCWaVMMc+nbtQ8xlOCDNgrezjC2iUX8r7bG'
+        'qs/uLbtX+kQxXhPxbGEVy8iquX4Ga+wp7iXTSB9jhWErmXy2KS4ktRD0XLodPg5LZgFwxDFh+b7n'
+        'M2v8a1jCU7kd2s1ryODheMsEFoXNVGODELcGfkHk50rnHpHaIeZrpQbwceZ3lGD//YKtjZaiopI1'
+        'EoFtECF+jXY+oZLWZ1aEkBRDD0kHqG8Bmvn0tIKecvoDQb/dt++s4jPiUVbqBYCdBuecqpLzUaGu'
+        'Mh3GdBiUnEUDJSukMEkzdteK+iI48thxXCArp16sojwbkd6MWthQbT7piIN8D42sm7qxBlsxRPrN'
+        '3/vyMPwkzbREkWAIdZ74OdzpmUQ/mdbJULtB2Mk0kUhxRYu+wU83pbWzYAemWKEtZw/krtb1V8uz'
+        'FP0yZvpENZMeTOfsRKTyPvTKKnbxhqKwFIDjm1t6Zz0yCGM7hlG4izx9Xz36jsKUYYdPAqe7Gm/r'
+        '+0RtMr1d0axJiBjKn3FfjOyrKgbZZ1CfVW+sD40OELXZleR0jgyzHCzgYWTDxg7HpanAMycLDbee'
+        'fP9DWeba5ZGS9KyJmG91njZGpoJ3uGD/vU2UHDLKX5nSNpQumwHGwYoXGP5qPG9gKqJDaRf1L1UD'
+        'WiXgbWM6DeqdaRIfdFFGpWWLMsD2bUqZP2XoYKgL4dKW6mSBTdQjMfiB7jZCJCqnnO5c+SXdBTg1'
+        'h6fWRoG6YfG+JYdaVJgCj3rL2tpCIXNXqG6U3oRsQvkLnQMowLcJdS9Jf5j/s4xLjL+5NG8KfFN7'
+        'NantTLSMAZN5xs89AwVgZgCipU4Z0TdBNakobyJ4S7m+nDAhw4QgXaDAjgtX1oKTbAfBeFD3CHtu'
+        'WtsymutMobM46hBQGensGhZJNYtMHLQ0AIPivhuJDP6PJqVAPr9mCnmZnbNxu8SKeI7Zhr7ms5Du'
+        'l/7oqH09BBiLw/bUfi/zbQ/isqFRmmqSg9var6q4qAWN0iFOTMp3o9qjiPUH/k8sv8ub8uWJnG6r'
+        'lMV8tNNpV8aZ46j8HzDAU/iMeG166naXABQAX+jISamKTP4/p7kxPWg8t5m6KXdB5xmHuRmRHi8g'
+        'W3RBEhoXgY+JYAy4F+jOuab48AAO1RaSKkGI3ph2ahNwsO6n+Hg/wrLZtQsw5JS6ZFJF14dosX2Y'
+        '645AQc7YECy9zLDKzR4owxmNgge12orPyUaWBYLE2oMXzfnOUkqDmBCUpXDpkyBiRdrw9PgmFXQG'
+        '4dKW49c+EQvs2yks+8sacG10FCdvAOzZjgwSNOJI//6xfxbVIt0GOn/fD+uuAkl812nv3ZNnJB4U'
+        '7uT2BSDp760ZbxmDNUPWiOCkhIrTIbqo0CyFJPAfXZVc+Z6EPktUK/9LlciXo4Jej/w/tQ49N/XH'
+        '1O3IPfZlK/u4yVMhHFLD1Zph5vp56opRhWpWmlcMskIosxsSmrIJ2FgaRSblcnlMjQ5NRtyhHUHm'
+        'J0gCEsvyZOSG3XoZxkFuGv4CWlggI7W4BRkCZ7z1ZR6MQ11r4j9QlFHNu0ib0FrdIO6TWbrcpE0b'
+        'Dqfq0tGdo59y4zH9Sr2aONZUEYO1BYDCMhipFJX0bvi6qGK5YtsJsFmqj6zcnuiizelaHYH7iBDh'
+        'HsclKQ89PJakHOpI/Zu9s8VZZe80Bm3fut662PK4ak9SRFu/NCsWy1xvBsHgKPtOPXWPnM6uA9rr'
+        'J+DAA37oCm1XrDliP5UfL/wFZ7h3FNcQBdUzWKIzRoSNp405h1rc++Ru4U5UWNN2Oj9+hW1IXZIQ'
+        'lKEgPUG5rJd+U5c7Bjf/D9PG/kkmp1xeNTKfcFWrDC+DhxPx8ngfKUe27tOULTeljcO9gooucXA5'
+        '1YRy1DSfDXc7anCZRaLz05N9XcoNDNO50OhmvgzGR969N86Z9N0udxDt3S7Boy3gGKGw2Hudb0KS'
+        'aeb/3Ak5CGP7iUzOtJHOFJ7GFs6yep+ESH6FVqOalEZnInlWWyaVnk8aF/hY6e53YrJlRMM2Z7JV'
+        'gTtJISDzEN0ir7wV9nevnQToxb+7SJRzJD5MKtQTgOk5sGLbOyxl+1Bi29HoGMnxN0KuSZfzdGPa'
+        'DZbVqvuw8twV7/Xaqf+sTiFXOXI8m19DQV9lcv5dc4ZNa5wGdkT0djo1ibtpLO7pl/y3BET05zMy'
+        'LelxHoCDrMSlni/nON85bq6+GvROHhxXs2ly1V1OntDBu8SlRrnAokOp/C4e5AmSLCqcuCwZKc65'
+        'W91aPZaObYer/fdBOC+7Rx/RE8B1RJG1qHsxxgC71N3H1/CTUzlFUbSB+XoEHwqfPPsDPEtEusMH'
+        'zFqTrkTuva2KTNGPJuZ2FsOqJDhry4BXK9oUdZDvYMa5FN9HoutKpKOrT/WD2bjXKzQwH9HQtQGl'
+        '9cR4UX4zgLw9qT+3FQ4Cn/tz0a6mFBU0rKupYlRhAIJL/g8j4fDDyxspa3wDb8mI7bJWoRcbVkoc'
+        'U5JhKRXe1+MIwcfa0jhnDzfQrMFxpXAQpp6ZV1jLkzmET7Tz+vmgggpRKOB9D/Nd58QSZp5nj7LN'
+        '5RoVcOzd3z1T6tr5u90vzUn/nzQXmGxTUlgTfR/J2kOTBtUOJukERCq9qVyqjydRH+8w8SRvCe/K'
+        'Z5bdIVPJmRuKLRWmWQFl0HNIFxy5S45lvhcyWHyUNxUFYMc3bjGytWhYCFaHp8KXlimZ1904/4LY'
+        'Y/CEocmYa6/lSuuycsRTTzsoo7CfT+Qz6sjGezFOoQb9nZakttkJQtr00MmIb1lE2RX/r92TO9ZZ'
+        'Sui6d6e1YWib6D5sLgT/TXrTXsHHWa57GMV4xZeF7itobyxlZ8is35ux0GMU5+NP/QhM/dN2DSV8'
+        'ilDVtUoSsvgoLG0a9/fZHg+VVc0l2Kqe7LE3DkC4n2Oqdzc08F9gOHyJWcXKAJs59U4O4FUgb2LZ'
+        'LRx6y5AC8WuCHtv1jwg55BgGpGZ/HxzyT+eEIkiAosG9ilVMzcmTj1LMtjBv3vUg+RQ6IqV9QCkU'
+        'HZIjP/wIfezkkUXMTXQe1JaxGlN42H7/oAIjWjtSQpHl9bhQFnNSLmiHNVZC/p+a05t9MQN9/bJa'
+        'DcTNN3yeVyPKkosF85IfjcTIiIfxYGaoUeG76QgwLpbbwM+kr1P3VNGHuIU2D/GsieI5bgCbJzVF'
+        'Jo1QxJ4FYnY7dcqju3aBP8HBhoT1sfEcCtZZOela6DQsksYn3nrnjC6aM+KZHY6KJiEPGs/6lJIs'
+        'VEzm3LEEaPDCGE2cBRBZcJw4r7yIG0ut09rzjaLTrmj6YHKNn7f8ifG00X8N5iiiECq51o9uhTyJ'
+        'lRbApbX5ag60RxCh94X1Rz3ILQ+RMtbuk1RfCLKfJ+4P/7lmyBDvzrO87MzOjCMzE97kkPWI8LEB'
+        'JTKJXWWpzVWxNLTxFSCYnDiKZujcmNo4ZG2hId7z5cWbGkfvdgzTLq9xMjbRhJiO1b0lKgCLPz5j'
+        'NacH/QLBbykCdPmp/AAebr/Q8K6Vdor8JlCiuhs7RLlF4F4z6/Z4QWl3LDt5dc5KMYYr4BrmGMUk'
+        'dzvBvXn04AeIKVCU3835uIOJhukiQ3sJV3yo6X1wpcQQXZRvimXKzDttKx/eeukzbpMu3yrz5Vkh'
+        '6mah6jdAQxzFth9+fVo8OXrCzSwA4hhQwGI6Pp7MiSD8D/J9kSivpNjkIEhaD4WIt+FcYkwrSFGU'
+        'YeaK+l2BIb/epoVHvJFD8/F/odeGTa/JMrFKZS44uBJExsx3aWznXmHCTwwKB8iEsp63RWdDwTJV'
+        'EsDYBKw3aLzNxWGpLcLxBPyD8hVT7HDNVwJUtYn6gguGc9+AtWNvAYmPivUfgSEzCLVG0pQYpa83'
+        '/mDs3/u8t0iZ/CeH4z2jrqF5r3S8LETjgUVseIAxArGIIzd/ViOzx5A65BBb9MPEXxHht332ORH+'
+        'OIDdXqufr5FafFr6hawqTcpsyqaGjjlaQUuxnxqwxu4RPqtkxA4q2Oz2jG+g511BaDzuFjl1BH08'
+        'gq/SmBkKN/opuDZud2M1RpAmkATPhxp+pOOvKK8jaMiFEqAc9+fZUFnj6lH8vX+eUZqGCEbfGCXL'
+        'sGk7nmTpewjJEBO41oDF5Nw1FDMbV/eBs65mNPVU3usMcczvfEHfx9B9iVvaZkRqgPyTR6vZ1scz'
+        'R1tqOkLsnckWFZKPQo3efGhri4ckixUvQYlVrH72lYgNq+cJ0h8WX0sfOFenYkbvoB8JrtquQKuy'
+        'SExFKZ8WYxqI0kAYhp2SWf/wirEnIxl26Hz1ovnOq7lKArfclGMld+okcZuHGOikaKQvYr/vpqCs'
+        '45ukUawmUpflM/YXN+8TPOhc5x8wks+Ngjmx+B4cFFnFggef3Ffbv3RNmH3VWp0Q2zPy2BuUaZVD'
+        'V3JPSN7EiOnKCAKwNolaepkyyjIuRp2HwSI8DuFMYU0roNHOSrZK0rADWF6py5s7xSz4HPMDfRHS'
+        '/kdvpyoL88sOMn4wRgs6Qye+tx+0Ex1pGtG2zCJREC32AJXP/w/EuizSOZMD2ewAVVEItW1oUnEs'
+        'EjoeF12FNabmvWOnx2A6gfuI0Lwoq+Cn2ryNC98Wwh5CQvpXxGyzkj6sVQol/466bL2aMHrWsL7S'
+        'mg8wPi4qwellhxUUA9N4bHg7rkjHfVzS+zF2bbIMpQEfU4hxDPmpYZvcyN64/RXMk+5sAVLIkD0J'
+        'GRg+egd2rIEPqtYNQ9HA9CeSPF1amXVxO6ktQmX2Oiz9YhWvk45zC774tNf9CQN8cTZPazJOlhBj'
+        'BhP8g8BGbZAcPlyoySCEVVyygfL5JJsOHj2TL+yzeJ1kWhoVgquEz7C2Clv+yRE4f+Q7ub6VaJNH'
+        'KTH0Z/A9X//W+QScsyvdGdJjSWdHvU/p+Cbce7GaqPoi3YS3uk20KZEqxpqzBhWMnflOXpSQ3X1O'
+        'cmxtV/0UAQjLQhU675I78bGM8+MtIXQnnmpB51fOgA4Uuq6stjDz6sqMNOsWUiBjoHTiEEXa7TgG'
+        'W9emHOchwUy0plF44GzROl7rT1X+zSexCyAVON4zFUI4CG8F8cToP3gL0WYPrY6ps133Mk8pFqS7'
+        'aINHC38VP51LilSF3Xf4EILw1wEMoig7iNmar4j1FrSH1GpLa4miuxTWNOjTSQgNjS6QAy7qdISR'
+        'TLW54SAuAtETA9InXmPI5qYJA4gmRiISMquGhA108PMMOxYvGwXemmCr8sP1M7lgn7Qog4KTUhAi'
+        'K2g6pSbNveZtBg/UmhV/DiG3Mf5d4/ndP32mIT4DkQHkw6Ry74tU+QPyw2IQ8bKGnE2RNtcFF4Qw'
+        'lZM7EuHOnnIbv/d7o72ZA63Zw62UHKDKsOriwIuaTqU/WeP5vqwOQln/zS6IBfV4tKKFxvvyD4vC'
+        'HgrQ2ZXOMiLDQCDOjt5Gj+thaGAZPO9SSB2dPDOIS0MqceOaNEfYerZGmjYr3UOMocXTvFPRb1MX'
+        'EFPTLJ3WVzmlrFG0i5BCSILrJQC8DsWrdtGCTjxDf2jOXCdgR55rpHh409zaexC9IL/8EBWLlKPi'
+        '4IOrRsQewAztEjw8Nmpet4MREhO3Op1dxFeoChSj/6ZlhZlNAMpGZFaJSnIcrKMCI3eycYvgYxGw'
+        'q58jVwvlah/ELzhzhZAygjDDSHXVQgDJt0O0/F7nlZCqBen3Eg2FWY+/fTNyGEKGdG+vXopXWSua'
+        'CJzBhj9fhN8M3GEdUwFQ3XfH+RDuSR+tsSvufPnuDb8SMp7vh6uBLfv/D+Ci6o2J0B81R5R7VCUG'
+        'xqo73oSqSPpazcrKVhmAT7EuF9ipu5i7V5n7DvkjARmsmhRZjoUOXKYGQ/ls/ldp2MJ8Scx00dFT'
+        'Vo7knxqvYH09VwfzVnL8dSEe1Ucj6c5RvwtXHIsNKq7GntEpVzOsCz5RPq+TncJJ0U9PcCmdkvHA'
+        'CB5vtA3FFsYQEcqT6H0JpyZJJX+w9ga7gzUcxYiRwLta5XXU3F1cTr5vEsPGfA7ixT+KhuE7h2ww'
+        '1vI917DHKb9zb2Ak1swCSG9M5Ye+1Pb46AOWIrbymb5l//GOlzM6VHnfKSdWjSZxKPLB7nv9Z4V/'
+        '5NM6AdJq1QEEMIgnSAEMSvxS3wXeUQta0FwkPa43HdE7oToGoDKptiQ125fvD6kWK7ALYRh2f07r'
+        'S4c2UrlcyUohkDgkw3UJMmdksB/CWH8WXlL/JtQkMOKAX+7Uj2ujUMZSsr5fA2twjnI6y6lqdHKt'
+        'Q/O+7CiVS1JntP0VeWHEQVz0dWqDRQCqrTucoidZMc6Ab6IahiyMzMvS5mmJQj7v1/n9yAl6tYS+'
+        'RL45FaDKpQT6HNAzLfQo/xkWdEvnsE0zQq79bLi7afLyxOZicxaEOuif9t7V3pDPzjDU0g4GiyAn'
+        'KIyWhaVwvPxTR+tyaMeQbdM/7MkF7jk+Hi8yD6fP9nYRQqjtwySx2IEiecv5wkwcewkW+OUrmoN6'
+        'hVKy1e2Kv4hUXz72O3mfi29n6WlP5LiuzjGIW1eAovK0SWz/93Hcp7Wz34LQs91jTbw69TiKbsXQ'
+        'Zmk2E78qRWuUVAso8q90YFelCbu/4DHLuVgd3p/5bp9tuGK7K+OXef3M/Lge3xhVN7UGTimV/C5q'
+        'A+seZYOuhuhk/ynKgeM+wp7IpyCuzdeRlIMlIpojl5niScCPLlYrWFcN+psAyZVhDfl4caUzHPQC'
+        '9B2d+EXeHoeqXi7NLWDVi9pXZRXse2FRckYkGtaFpXDFn0Y8Ku00tPE4gsXjV//NvtYbR//q9TpV'
+        'BN2AKmpWDkyp5UXAa9gtObxxJWf94g3lNhpBOtUQd1Rj6PPKY8kmU1n9/393PgNPj8k676Xahk9g'
+        'WgLy8hiQ5TViSrXg32BbmyEI72EMx5foYLzxYNwP7pxbWWVcnR0jJt8v37C8Tv4L6GXSDHGB7cQO'
+        'FPlHf4+ZsKH4NTWZTMHpnFb9NUXQD1mL7uWy0d1Fv/KlZ0SpClebdg8xw9jG+7uu0X7rLilyJh3K'
+        'Nq37w7YqcLXxxXNRck3KS9wl7pUbQIU52v639TmVi7P5DXY4it1eAtfmKLHmI1CZy5cqQn4BG/m/'
+        'q9hdoOcQ3Xo1U3mvEtZC68ycvng/bKtglN3vx4Mhu2DvllPChUwWSLEoB6U0zs9DLXXjV1rqxxlG'
+        'N4L4hPGcAa5fipKfCnHuVedoUzioexk0iI7iay8vaOvKS2BRINwYjTvUQvL5aOKo85wcVIMLYUPk'
+        'GaWnweuy44+e+XeCCnT1zd8qoFR08XjlWm5V7a4b0QuSqUA0nFYyw2s+uaQ7yUkW/R28LAKlH3i/'
+        'hhugySswFhkNrV96vOwyEJtdPEXOzj3S7ox6UyZznXwy2GsJ4bKrLSEVAvJ6amodMP5DlKM+AE/W'
+        'M1lvlajtX3fm5q90cOlyxek3R5kNaxVDxYaD4mzfObaRAxfI3RfyoCs87/LZL5ZjzVhpFVaRkcjE'
+        'h+LQ7kVGrK0aGZ22M9F/L8GEjlY9KNwMH/dudcokQR0aobFsycGZYY1wSeUOe0vtUnjKyn1XL8Pi'
+        'm5q1QPbbCJ8UwhAGNgoQcCbBHI5ujK5GeV4C5i5pjt8cxym1Gcml72EokVuz3YBIo99dG74Let1t'
+        'uajWKSQ1jk3wmfUrFqIQcPSGxoA2uosvOC7eWt8xatt5r1+EUUTmWwvbmFqR3i6EmGcJ3vkaaygP'
+        'nb030Sp0I39bcBJzz4z8yIF9CKkaWvLKPcLDhDlNnpxQhr3RaH86d+hkLCeqSne/23EF6S3lR6ox'
+        'O+99fXxt8PYsJW6Lx0afs0KEOj3D2XO4M/unzQep3uUXDO0w9erBPcn1WM3L4x5JXkdkA5e0VEDZ'
+        'SKzJR+YJEyLoMv2Up+bA1+yB9rpCiz5wPq8GnBzIeI5yqwvA/jKm8bCuWPAyIUZQZkiJbGJsd32d'
+        'x8dE3Fix5MhvIzvmrl9LOPQXRQ7036yKqua/ou0DecA7g+aLbfstXgqS8JSvaHeTasS7TKayJQ+l'
+        'eCo6YwI7Suf6vTuuzDAaju4Ps0mikensYe0bzmKp3V9s12aMwKN9ilJVJyvDx1nTr3gvZlw2Bl6A'
+        'rigNJFLXYWJwwrPGTiqf3SpLFRKOKLMbLhkNdlBK5G2Moj38NP62tXCQFMTK+0PmwnNvCfK6WgmV'
+        'xSQR/lw1W4p6kQyMIHqNK9nUbTfXcatd2uzJ9b86Xf0Y5F9i9Ghtnuay9iKXRVk/sqAjwcjV0zX7'
+        'iSZ/5MHTa7P1ulu2ngzjVZVMVnRDY0ROY6nBagtxpOs7kVEfGOUhURt9CBhuI4tw2q+J0scuOrpM'
+        'zdjSRmcTE7PMv8AZN3PWJQ2m9Ias9WDvxqG3lgzDjCyp81RqTHr06MRIgoneHMSnHf+8qWT9KeAf'
+        'VkBFHmm4NCMhqyvvfGVK8p66qh+r/E7ucb/UJY7pn3+0ZkdeDJuHTQugxgLTZ8f/izIrESX6hUc6'
+        'EIdR6INcSRipFnpdZubrYWXngklfyqcaihu2cQV9k++j27FzogJ2IhqWB/L598y5h0RNJ4OKrrMe'
+        '80Zt5Sr6Cbb5/mrXcWmVfkFYY9MPZ3oln2xGQQeoHasJ0fkikmWhoXefntuwmzb+hb5WFvyqu3BU'
+        'ToB70cd6ldZv740jSMCncypiA0JRS/jM+R1lqYyDXlpT3F8tvpI8838yZsyMqnF4XuOJ10tYPK4X'
+        '+JVxb/1TazuqsqD43mbfvAKeLK2vMzOIdm0DjrtFuHhiQumdW6+JZj1y3tfh6+UuqNavjJd4j8QQ'
+        '+CGSj93aNugfxxaeh9u+E05HK4zFGDrzJXfjjc4PJ24hSA0Ds0nAxAusP0hSvcKSIRVtTbMse7XG'
+        'Yb+BUOY2+KD6JD12xjxRuqo/292t3C7e0vPqYr4YuaP1ivVB9K3F7xhq5uhoFl+x/njdLLLGe13D'
+        'IDZmtNPWbG7jbVxNmg56SIPkpitrrjgla5tHD3lQMT7+DoURi29kAENOc+d7T0OxYWBFIG/edtok'
+        'myMXMkzuD0Jv/T45sqjMRYIO15GRNXHqPPAJCCz+nIiVRIcdta6VUaKeegGVAJsUBNs9Z1CEV7fV'
+        'wzWX9w5Vmw8EtKlC9w0P/8cm4/2C7Al0PwU0e3aGObgDFrwInIJTuegDGxu119c+zTEaJy2gS+pL'
+        'rVAgbzn+1cr8Z0zkC23rHG7zDm56QuvXY4CBZsGeUARCHSVjKtnF5uKHY8Pq4Z7bijSd9BFGGLLH'
+        '8WwUb9Hd65wnPvXv+Ah0yQA+dJqu3xLoJygQNJqlGWjluNwARY2UmoKmfQq6xpGCPf5Dzw596uEp'
+        'PB5KxsgX3f3WfZNLokUyg/E/0biuYt1hrSV3IJAq19EdzJlE/9iQsfvSfhHzLsJZlcvnN0tr0Cl5'
+        '6b/TnQXbICXKhrrxlwyjuT7Gn6pDr7ofi+PvxCHeKlx6Pq3rSmz7itkpNXMkeRwzHi8eGHGVBZEQ'
+        'wQBF/kNNeMOM/R40ocdV2TIV1vtQXyiDc8JXnDFIroKGJMLmgBNz3LC+cXLjTTYqFj9TGChN+miQ'
+        'M71lpUwjyxiMSAxtPhGV1fmeXgPID/87QAWbni4cetQak/T/oWMrM7L4u9+eNwHQXj7K0tvJvSoB'
+        'uWc+cHjtRb4cUWEo7Vta3m7yiNfglGdRJZr/k/Vd7XKk11Wqxf53FgbVUPSPQtWh9e9V5sQ7nZ4J'
+        'XbphcD5Xb1TkAeAyZe1MRxezlfBMG4//xUh2n+Mah7cXIzyYHkOjRKrNiJ7Le5bthWRiB9w7OjPx'
+        'm/lt9RDMjI8GtajzZltczEmbeywirWZCaK3WmNoD1Wkj9jf+oS2/OIwEAfWPhvSGP9YlCtYAXzDV'
+        'f+r49DGWuGenJb0zop3zLtGzJ3EWvo7xcbc618i9fC8ycgWdcUkUGze8Kf9cfNoX1WUCjKmjSX8F'
+        'nooRrUA3bDeukP7NebQy/pdMRL1wxyM93IbTK+OoxC0Ul9ZhS/nfyZQIaX//gbiCWTw4PLJUhh8v'
+        '86xYPJjrM9HDzVDpchILDmWkXb6zeF4wA/I9R1TB1bYuW+3C9Ppf+QhJbrVuJbYZ1stUUO1K3jZZ'
+        'c2mZIoJ48GZ9xdwQGuUI+iT00N1hEkXQvW+3EE+t8MRXlFZdPmdd6pDQ++B/hMV0opIKhivEFlA2'
+        'qZ5Vz/v+LURtLT35bF8k08E5lGJG8WYSkaeIAiKIjfv0DAOlfwiErT8m1WkDbAKuRRL33267wIay'
+        'JpeL1ERENF3TGHdk9AtM43IcmhQ2KJVBjlDUpWrBJMYgKH2J1+w7Dbchk2T7frxOTPMlFic7VV5o'
+        'e5IZVfB4GiMnBv6NkJ6Uwnfnykb20GOjaHypY0xk3PBUVMHYffAsGdX+iozMFoeeIJWmf06LaRqi'
+        'f90qJPyaJLxbmCgXnrEexgVYWoM566TvlrJcEHHY4slCVW6TmM4mOGF05ufa/hrlMo6mU+jRXE3O'
+        'ro3dlIGvHirM1DCplP0HGIJtj4CnES7gpUjby9l2ZFcIxcVE8xWID1ISJ/ehK+CHw6jc/XFuUg5l'
+        'C0aAt8EbfWJpmtgn8fnvjoEeHXDAxvcIURNhATcMh7dw164tqEWOwaU7MTTz+PCpLmI4Bz2mt8Di'
+        '9bS+/cyGJXwa8/xUndPlxd38h9CeFZ/B47iJ4Hn8+KYYTuoSH6GGY38MFEsGHe0g1wL18cv/GJ3u'
+        '5ThUZgr1j9re9ulO7nOP1OShWfs+4hiH8Fm8xgEXjQ7+ZGLH04gQVJPax+swPbtKY0bW4jDXlD1O'
+        'HfC+osQvx0bO0SOvGO17c9wyLdg0vwdSq6NDvYRh6Y43xlozfxyD/bQptZCXiFzrfl99itT6uC1h'
+        'd40FLqiEIL1L/6lh+A2AXfp9td1sytfv8M4V1k/6AfS4usq9xy6HeDfX6Agv89oJivPQENeL268J'
+        'IFEEPogi0itS0ANtDgS9pHLskn/nkahaqDnwTkhuLJX9PPplclRbTKtBdwfDeYfH/Rz2xS4C/rH3'
+        'iEANe+xjCmB49GwYOJi74PZRTnZLES9Z4xq/iUNQDTUFibvsxnm5Ri5CqbK8eRjR6FlebcpqUSTd'
+        'FWINAVqzBrVQpSf9/HgrajYvQiRiZGQOSwPeYQEJEXg2BgP2gWwCnFP0JjmbthZy/TCRAtV28MSW'
+        'WqMC2my9CJ3xwlBzXP/+YDflBGz2N7eE91UKM0jwdk01SgQb+Uhjie4I6FuqG/B28yJBNHBeVi0N'
+        'aW4mBZwCorRIH6supYkR2MUKkPgmvcVPquq3EZoeDn7HJX63M0+v70wrRTZR7ueAK2Dws7I3CPJO'
+        'tHmKFEEgp7kTItM/goo3eTafd988yjRjNEir/QFpLeRwaj7NaeH5DYGNXANLkWBBM/OfjffAEfeC'
+        '1jK20AemNN+mt8lCD7QBF/N9vUaCee5QXSQg30VGv3y2SJccjcJRtnqR652vz1hURSCaWfb/yg4T'
+        '4L2Tp6XTDUOER5vb2VljWJybmtXEc6hCoOEJcvTY1TkGx/rX9JsGFtTgtIRldP/k5VMqVih+it8V'
+        'aEXKVbtaQ3WyKo4efkZ9dDcX4VSasbcafW9n2ImVl/S0ofRSxpzb8K31kbsXuNUIF3+Rfgg3VrqS'
+        'FIQsnhnIt3Z6c3i5ZXqF6J7cfiMB4NCyuTsmduhkcm88shEWGuf4o6FPdCEtD9eiZua45z7mnPlC'
+        'gcSetaL22Sq2LqHgPEn801oekrKArTcdz4NBD/PgHf60MpuAH3YETRZOVps5ANOjQIobVe9D8gaF'
+        'rY3XaQ4WGw/GjMzne2O43yugkNM4Hw6LfeSqgDAp4FltXLt18hov+Nc6ccjhP9kxloo+CgA3tdhA'
+        'M/+A7Mwptum39Nv/CxAxemH+PAocI6Row+J3o5gYAGVvlNvQtsMLVz9ftTDT2++lFeKXrmUqTi8U'
+        'C9pLdkUKH+Y+19H8fJgkwfRUU1dx+P2n1fXWcdfRiLIBXLWVdqE3uL33OPazXrNPcCrPv8wzY5cm'
+        'Tn6O7eJTxmp1RbXXdKRElAIam0UFHRx9+5XnY6WYxQEOuU6mt9JiBgl7yIMh/Pqxt7T4e3++XX3Y'
+        'b5EAl5lnIFWx/nECFewGeJf06gR5iE2X8NAyGleIhV/9G9ikNregmdZvlnTwjtXOF2s3gUquKwst'
+        'nlLZgPX+19B3Cf2bV0fUbao2A1Ru+cX9GnSS49qLebYFFuVEeiZWmNcJ6EYvY8LTpeqyuKFxlEEk'
+        'r2T8U7hAIKyTYcpVipQNHquOyu78wb1tcExoPMi7JsBO73XnE+xdr6ZrHCFHXJX/pAnBv2pQ0loG'
+        'vhf2KAA7DWjqi9WJzm92ecSmZ3QW7gpsteDgzNeKeiO426bNNdPMYPTM8IkBS731L7Z9nxplW6V7'
+        'om+cNyWvi4t1tueCaBGAlwuZ5ipAiBVHuquoKfGV5arOD/zbvMUJskfbmHe4sW42l1EbQ1TLeENO'
+        'bnUK4i6VX3VyP8tqFRIIntPiXiRJaIITvGKaST2DDp5fg7H0/8zJEDosg7cErLeHdHLj2QaDqssM'
+        'Lqdy1srvMU87C/WYY149sMQZbWstdj/OwoCsR0e/c7jynhErM9rjyHXA3Af5xMG62WQstIwRL0b7'
+        'kGpiInggWPxyhqmwTeglLproNoIgwnLkI+jsQryabEIRaV1sNv7lIslff8fEkkIVcrzshBrmh7dB'
+        'PtyJcAB34rLL5Omp8jx5qteX27dsyvGkZNQXF3eMOODqsrUwlSSqIwMmDKe0cZmQuMhFGrXCsx+v'
+        'P8kEESuVDxOzfUTliRu0mdhlEXQ3TDevikfRC8syK5sMk1QQd22hJmuKQT31vAOwYa1ggHyGoYdQ'
+        'Qwvi8Rs0VfooZadHv2nN2+bj6ssctpx9evbKiqJSPsDRvvY+8P5l3DMMjTbGtFxa1tr7IKA2hcxE'
+        'ngt9FPVptN56Qj4qQYwKfvphJl5HyGDby4nzEtigB8MRa213Qjnw9f3jGlkR7kZzbZLVNCxMeSAc'
+        'b/N3TQWijE9ivivcZCeuxzWTbgzXB6JDFSHRQFXLhMwafeXAW0K46EJNspJ8QOiFfeyxthfh6/Mi'
+        '/qoutW0L/7Apm9Hlkuh1MCle5zE+9MyPPZwL7WDpAos0cyktDubDYOfSpzIkFa4cPQ0W20b9JwHF'
+        'l5Fg8UF+fqNbw3RgNdC11tOrNyxXbvMD32unEsV4IGaQiFTi2ZeSeAw5QIRaQvhc8qlt8vV6ULjq'
+        'f7jHbb85GjcV0B+/yjSll5QCC4obIJWDi5wwk5MlaWA04h7xW5je1Re620JTTQjMqDO54m/IeWG8'
+        'NdfXkYtnK0x7ctuGeu/wn1KOQ7XA6zOqgzSzBIT7IpYmKL/8JTowTB3RBWIc6MnOcZFCqMXTehGR'
+        '3FfdFizCUGr7d7Rz5yz0dufIJVjORwXHkBqrEsnbOQmrjDFOwd9qXQjzO4dZjv7zocT9Be6e23ph'
+        'i6U1Qcp4fFeFuTgFd+NIwHWGnrf42WL0t3c8vX1xrZql8HG7O3FPZZcsWOf5yknk/JnhR2vQ44Gt'
+        'WO9znf/oftru2wCsvqlz0PVC+q77vkdvdL2AThBoGo97SvmEQbf1bXALmqrhali306fHv89I7Yg1'
+        'P5OFh2wRA3iHMHTYI5PLGxVG4zIOX6qe7Q6ygPnkbwMG7mK4mZbGjxnynbiLi2PS51vVlNS8RaT2'
+        '41fmptN3bWWiGIhaiasoaOMBpbIm8G9VVkog0zAhEc02IUqbM486D9bSyQErEtPG4HLNOJPBG3ID'
+        'pEY6oRrA0wiQ0ZujGZK2DzAeGToSdNOUF5sSRoOJEQkOcWqYyC/CKwxjDtUoZLeJfC67gsanZD/z'
+        'niSB/iJSpqKFyCXvU77C75dhztMvZsQ86eNFqKsH0O9C/anrnGjcvvx4OJE8KnxalU1qFb4u8/AL'
+        'Yrnf3mNCebH8XowNu8JTsNloofDUn/6a8wkEwrikUQ2MqNpuCUAApybiN6xCKDdiXtKSz7O/MMsC'
+        'eQc2unNE8H/kePIq05FJbTuZghfJC7dlXXfxFk8VekiP1yT8mAakF/eofzSlS98TcDCGpZmuZwbp'
+        'dmlWyGmQEPoO6MiiaLf23kFQuiMs+XO+pslBWqeiMMeMHoEof2ob/XdXpOgzKq4O13/00YmEjrij'
+        'tAj1eYNsEv7bUBjr97DFoqXaveASqP9IrIuvS61pqqTPVhho9SROj9Iudnl6lCjlpJtx43HM4HDd'
+        'AYJKjU+ri1VDuZSbY3NX90ZM1R6aleIwAhxCDV+I+deinWjZHdneSKZuKMksJklAnX4IzhA9zP3P'
+        'E9lz86AlWMg4weG2NwQXXZuBaNpqSjIvE8I4rbDuykpNolFucjX0FhOjgtMxPco7PAusrDATEWFo'
+        'ONCFe5RY/xxeskih2d+iyx+wrB/euFiuEx64EHp5zrqpKlxWE8S7YRCuCSQ+8XGLgPTgAWrMs4J8'
+        'X6irXdI7X0DziCyQgQ1Hd2Gb9hXgs840yQPgSlMJnqbkgw9q1Rnvvjb7qHDw69J3HQLfWnEGAv8e'
+        '751htEa/j/umyFkI51C/RToZgXfp5tzvSy87TrWOF9N+r+Ku6Xvk08idrJBnQSh3JBYZUT3YHB5g'
+        '+nI9PbW81CsesahdZ9uSy/8QYY+F6iVRVWlegEThTrQq/YwbQbf5jB0A2y7JZZo9lArqkIK5cmno'
+        'Kf96+KL0VOr+lxHTBZ85tjddyKPpVG3QueQKqUFE4jW8ceCAnRHf9WR+s9sQwmb9fOTz+dWk6SUz'
+        'MYpTay24EXwIinBsGNhH/SvvXqo7OMjk8ZBoxrqpAD6lKimtF0O6blSLa/t+AISR+FcqzOEytyW2'
+        'N3mT19T0zi5EuGjcans0Rx0aUclHQwnEyIfusgPostns4ze2tMYdewXc4NCTn80rzQN0aywtD/kR'
+        'Y9gYqF0PBkLmt6flNaWYVKjHmgH7rpFvnvpaifiSzHyAonDy0ui038Z9evDxteBpgl/QxEP1j6of'
+        'ihOqp+tXFRKPr5sbadAyiI/8wSQC3gg7qGWRwuVC8rylxW+z/qjUg+LyXJzfXvNg7NpLldmJi71n'
+        'auW217AvAud/X4c50ArfLpVI6ydtUSaLWSNLhhY5+SgZYw1yGLQEsFpNF5f7UJz+uGWzQAFW6Czu'
+        'nevbmvPRC/D31069lirlMGvqeLHLHD+ognQHDuDFC5ZLcMBnexxetGcmpbB/TMRczVBHKIdkRa2m'
+        'b2PvEiX4fh/+FBZ4gzeLEkzTL2TAhx+YJlEfvJRiGshoIF8CDmb060JtC3U+5eRFnOGgp9AJbZdo'
+        'hLCgob+Wzk3KE7y8YjxNjUYocTfZp3vUivCyyII6294zc3ctUq3VzE9PojuLJJotG+Zfb8Vo1Idw'
+        'e41HYk9HxqBGaxQXRWUFjfVPhJLG8DgvBlOST5puvrv/GhYNraviL0kF65g4o+X/rzC61m/bdjYP'
+        'QTkd1Q24FvnPZtI3OQ5Hx+A0qDAOJwUVQpAZM4fFFsRyHYRJ+rQoxtT72zqUKMj7h0UWUDkWPwGx'
+        'YVFIfYh6LjwJqfC5haeyl7kSMpaHvzxp0wAMGRtZ3O8tTL1agPY0qty25SHYAZj8U3CtLSePTwe6'
+        'W7T+0IABe6RSzDF9VFZ3F5IARxrrNJT7RFuL56MbhnVOP/xBxZqjBtHmb6I9fKH8C7Mrb4wMUzu+'
+        'wcq1njLnLTt/wRwb/z4AIXPT1KpLhy85aTAwb2SsGSx3eCBzVTa8jO2Z3Xqb57AM1YcNAxClLvb2'
+        'L8tJ7MJb5LjIfFZ/TBJNGsuMI3Elf3zSTCsUJ3yZ/aetkgXqSaj9dso1+oL9RdJ71PpIq22ZnGl0'
+        'qDxZfMrM3REgncUrZF68RT7ORHED7NZ+NcCULIuSteTTMSp3HN2VDOU0gikoxgy4Y7jKpyu5CBBy'
+        '74ZkCa/D4dr4CyZzB7meO7an4Uqu9RwFUFiLUJ8ewCgmZOFyVKdSBm4VXHPRL4N7jc/knCnA3MxO'
+        'JsOd2dV+YwNPLxsScDSsfZDRPDRiuRhhVe6qxnpaEZQ4Upp9cqnLgyrMmsy/kUWp9UWqGVNwNrm0'
+        'y0slh3ZmxorJDQwTq8eYPOetiT5Ej6fnF78kwhVibIr+Dp1IAgiIywaerUQm4xGxKquz0x9e2wLQ'
+        'P4Yd4BCzzMhmrUd6g9EgNHmGu3oHd5o/6t9viOQoQLGEumM6BJJe45oJ+2IZ/HaagiRNczuimlGB'
+        '+Mh2weoavsz1NQTRRqI/hYP6zHI9hFEnE9i1kXwz9nWpEIygZCTcTUuvKO5SNSgu1Xt9ur+mUR3C'
+        '9csHa2dK6EvrLXswvhzI7bAWRi1OHtjVFjxEk0dZZ09mSJBzRuS390/4hqQClc750Q3Ldmj2NkOd'
+        'SnbR52M/Yqe7IRn2POH9N4sh/CmnZh5EPpiLd2+sIjUpOfDw3FcxN/+hFsgS4zN7PcgVb9/Ck32d'
+        'WkKJiF62XaD+NA300ec1nrYmR2Rr3HoGkDB4iubmCSLxER9W01obkUWMcFYa4ealAVYAA15JeQzC'
+        'DQZyLARmhMaNYWuB3dtHjYmil0pdTAX9fIZsJJCBBfKjghZiHF7noPI6OsHem4Ivr+pqIdok5CfP'
+        'VTvo17giIV6119tlNOv1oT+5XRLcD4boBZ5TK6WLGclCfBm7kU4AUbqOr7d1iOpKvurdPmVfJWur'
+        'w6sSw9Lc2apgsCTYTBDF5ZZ0RwnNw7IiLLBbUFng1BUKOzhcr+Y0GQEpJLt7Bqybp+0lKq4sN1PY'
+        'GMx3H1KTIdle3j2E/w/lJtlR33AWaxm2mHlcf/Dq8+Zn7btHnuV5lsn1geSs3+vi31MfpQhwiOPd'
+        'fCqwsFi9CmLfjTFDip0mhMv6A8BW0hMnHfDJ3HlY2cRezQIa4TMhX03kDJLgGqfhGuovTNV7rquN'
+        'QBbU46809ay7bYg/2u7r9jrtZ9QgCVeMFYL1MM1Yk5IKGuWhqziD/R3TWCxuGI0gRjcvyaYCgAv4'
+        'm1WhgovRW2GyXnrRHBSaThhBQf8k8bW6jVQp5GI/h+AsA2PJn8wqmhJfm4Now3GOxyFVOGt+/fUE'
+        'nkQ+lBk8idyq/Vz3zJgkcDN/HvgnKXSBJ04rtjL0GswvlZhhIsf9hIPCwTDVOleNdnkOk7GcDnml'
+        'pfHVR1lPiJvE9K8vXoqBzu1j66l1/o3k70N67h2DRshZxIZ114bTJTL47DPCTJvwrAIxlL9Lpn4B'
+        'vcXC5iLEuY+U3YM6isv2VEQZY3RKKjyOXaH8LF6LZ37gjJvZVIYOC7rqdfMl4BuP60IKNkm3RB/u'
+        'qaSoLb5QB+5IA2/QOmVl+vb1L9UTfPN01SefGfBLPhTFuoPoLzBShCg46IpdwW4R+oOrVkvFL25e'
+        'duGCO5B/EGUqbYgm1o9nFrkpJAAnsri9RNexpHrHEbFO1MgO9dkxJl8rcaEmzM5KXRAkAjskRn0E'
+        'RA96j7Z7nEsmW+WvJO66+TuYsLPBP2/JynZdfwR76HlLNtd744P96fla0TA0ETEirFn/qh/RwDzW'
+        'BzqdskLNEemHemvEsrQ1CI4sdYNAf2EvlNJ51dSMG4ndjmnz1G85PyA7ZsnaWyb7dPPWa4+O9FDt'
+        'B5OyrmNJh/28J3304qX7IVtbrmRngLLQ4J54dayC3CNO+7KyEX1bHvqd6kBusy5XpZz2yg6OOZut'
+        'puvzZvPahBjdZ5tRR3WcQbx28muPlwbhmAoHqhEjL2UhdyESIKnaTt/xLmZL0oQkfMwofqv+4qb5'
+        'hFoo2O9RINS3sQcycEDvqxhRYX28du4Hvl1bN0DbG9q3srOuWqAgfrRaorR+ssFn4buAInMYKzNX'
+        'aMsaiYyzeZ31TMc45/f5HU0N0dlrP2clLdoJUQQJpK6RU2BJFbj1X8Df+uAJS5aIwKUKMASGPQKf'
+        '3O1aEYrqMwAxVCjrZeS0dniRCsDtvYeMr5E/kzvb3YqOMBHZcMDpWhnP7qZLRGl+TbqXkPlK5Bv7'
+        'NkppPTXGOYGoYHZhofjO03kue6Pa3crKiZjeWBJa3A1EHPlJddwNI+AItSnZ1PjIAQ2hlhOn5Vje'
+        'BBFD66ggIH0FXq01snDgNqMYGWIh8Apr/IbslpKIL40O68hI9xsvb8SJizwsxhBnoM4BJOnIlW7q'
+        'Wm+MTfio4ksqPzP/3cKrXI6FvqKiZMrIM/RjIQju/TRg/7BxWpYIRWgcXo6yRr+VvI+s8grG/oC4'
+        'eOd6poQmykX/cJLyiVsPx7fB3XdxoqGcqEFXs/4EVnHc/5DPvZGdcBlqhvpaWVrFupLBjYU3icRj'
+        '7sNMOp6nyNoWEXWX2DLYAAErsKFvjeXH8NZ7AB8LJHbaxpzruNSy/hNPVUibm+r/BTQ1pKfo8s4T'
+        'JXkVeobCzA8IFukUZ7UrEWDQEHiqBwIrAooiLWR2ZQraxYYC3yDH1ZwFRwO/0skrcOVGkOKK5IVB'
+        'suJueLUA9Exj/0fgJXqw6YCZYhr6enMnEhZpZwZ5fKeuPn/XjEcNFgJmDDmAiT46LtI+X/Gk8Nco'
+        'edD8Gdw6TH7/TIKua4CW2nvjzb7j8sLuiN+ETUiNZhdTT4Rd34az87TYTQTtYcL5qeWKGUwwqr6a'
+        'UJ+7ESkW7/FcE2/XPrYerC3yPwCxGN4HJJDeIbkq4YlYisD6p8pdfYYDbKRCPYbx1MMkhVQUGr8H'
+        '5S2wG4M/KX0QDnaJuF2NW1gxfRy2PUGnaCQhhc0UlKM4zEoCX5IJiukLcwcvneqqIkPmw1cixUc1'
+        'CY2V5LsNEoaJY6UwqHKLQKbDWNusiN/oLu/6YDra5Z1GDd8y8kPx58Po9icv7WMCvZzfwaaAIdQb'
+        'f5uXuGIWplYT5XHhztXuh7lJ7oThDqPv8mm/vMAz/JKdF0tkqVSX1NGTVSJNGSI3O2L3LWo1yKjT'
+        'AOW+B+Cyu9A1u/ngD2/egnOIQQI9aJ81Bjh3fntWxBfhAu+fnx7hrkntTnvqYwYgEdO/i0suAVI0'
+        '57v801QTJxOicD4by8Ve6U1RU57icJAjR0DGebum52p+URmkCWD+No5upBDTClECiH9S2T8SYWU1'
+        'XgIvxjmJO7uLeS58uqOTVCYxOkmGp9MlxvhXh/kVLfrKqA5AEs7OCBrarjOqzLapiQVlS5ZIOJiO'
+        'J0Z5x+WQqUEs6LcoKoKDix7FTm/NVvfk20phJnIygQrSKjH6+hv/9siNZwKirwq5YoZADcGU14W/'
+        'vGRLuSWSj9lv3dodwtLV1uzpedYSOD7ZxZb9apk5DJj0gEixdewuTTNm5u8DuU6UrT411kaUBq7V'
+        'RBzb3t0mv5PUFVdRcH5b6RHxfIcRofiZ67kc8DaPqVtIrJN9RYaOcYrZNAgmaQAMjdcwirYaXOTx'
+        'lJ7mAs5e81iPU0vgPuP8hV2uNxZCwueQT1B9d99J+GYnQhdeB4teoXKv9NDlaLzrZOwj/R+kURNy'
+        'XPAlV+dZx3Jy/nvNKAkZGYPGWHUQ2UXT0N7pJPwOCPsq5PrHlWg+SPbWr1z5Nl8kKIDx6A0GOxNd'
+        '0t0w7HtaMr7bSMaQUZS8sHi8CqxoFA0OudxhiNow4AfPBfzD+XPDe6Gw7z5B+eLgnxJlO5YzKCnR'
+        'CZPx+WGV28A3XLygjdgNrZxR8shmzbyUAoTb5GtuMITBUNxKdUM6glqJDxYDIt1TXg0DSYkOdxuL'
+        'rVyd/0tEO27farU2VtvJN6YEMuEZDcn02YBJcyER+tAjJrtHVo8V2bEAB94uvIKNUwMmhUIXsrO0'
+        'U9i/3A8DRRxEmHIpvgRIK32FKF+PCLYp7EVTY/+VaZCteS90ZhYVJRtG2eSpkh8b1ivMtd8ZR0gJ'
+        'x65gSsTExsyCb3nuEt9o/jXzIHXutpbrnSkAfWj6dxZfuNW9GgqsWLfSJLz2YmZlRtGxv7N14Iup'
+        'LKscUW14aFsGq04qPIPITxtvsL/8ivF3VD+VSPmQghAJVKAx5+hLnuwn2QhJ7OYrY1Cunh5rQDHV'
+        'ym9R9ZqgO+IKfu8UUS+S1Rzr6920Cto+YI3d0ZVIXQ/oABQo6BgrOyt/ykbvhYezdupofJ5yqspS'
+        'p+eCGC/opRW0RMLTyFD+SzoD+XS2Dmpsr3USmknb7sOsNLymowFw9LsNB3+CBw2C0489LHV7Vwkb'
+        'oyEkkQi4+q1U0uiiVxmSohjRRFn6Y6CGDCqLRewMaBu8l95aaXdn/TvEC4TWfrK/VSFNNJnfslzm'
+        'Tz5q9AyUpI/abH/U0OYx4V541c4NIGLLyk4J6OF/bUdXSiLKgsrJ82tK0kcBPyKptpvfGvGFAhQ2'
+        'QKTU5jFgaymy0FCssOBUtLH9xZpvH4hKAZu+Ffwm6OaB5XmVG9S09q33nEKl9oMhgYh/lLlLfNM4'
+        'CwGab7v7c2e9hrUmytfYlBGVHx9JusDAX94HeLfiMTjOphGTcUDkmxBwzKkwrszcsdDVPzjHDnVx'
+        'tD7O1Lo7ABmuxQ9NaCCNn1/UynuAmwy9nHSKS3BXxoHoaHGIvQ1ibaBpyQ4vShzL+5F3LpOPorz8'
+        'ltJl2ETZVm+evrQifKxeDZ9to8IFSEf3NoXk+BkeR6AsJwYmw9YGg+xm19s7w1sVZfDOnDhiA9nF'
+        'UalNdzo1v/jMFHFW41E9eYB7z1ouTXivFIgYY/DLjewmzgI485mPhMpUgafx3riasMu1Rf9nyLeb'
+        'wWrhLQbppDNiWLJ7edqAy9ZL27YEuIqRoJ6kZcPhy9ftWAZh/aGCKElKAu4SpJYdn7qpLeIRT0rw'
+        '8whAbZfR4DwLJEO3/gmNEIatagRmkEc6Xrfwr1bE4BLGRYj5NRmS37rKHPbGQjieq9/EL2dIKZc3'
+        'lAlivgdCv/cqtUP4kQqZqwG+CrG0W2/VtZPSTbJqi/xX6epUpQEfmuRfZD7mwj6NjRNOT4pj67Rs'
+        'RUaOc1E6Rd4Y+UbNiarbrhZ4sm8VL7IjSNxAPW4Ru1TdQssdmFNCiVn9ZNFOMYYfap5cSQqX88ZA'
+        'GsJN4ZBZOOajsUUFyHbyNdBERHZ1I4hp76HMkqxqXy/gwxwUpItKFbgP+BUiXve8y4jGoM+dk/LU'
+        'wqZWKPEcgXmLQLUjapxAFbD/sXRJ+1fnm4LykgLfnvSgP2LvdwATzkdspVLKKZppP/pRo9ApUFjI'
+        'EQTycCzKE3wrdJA+3ke3y9q7PneIZlirt6S49LRjFNJ/5yayrv6hY0yjcje2WBOUwmoSFV3cnpWD'
+        'tKL+Tbeo3iuU4Vlgy4Le3jWyD8mWMRgYNXsit1WCEzEexBxVqjabu+kntYCmZoMMiztp3SRQdKpq'
+        'gKwRsua23jLSILhz8/KKsA18QwLUhvcaCdmYjKDyYrSpVul7fTfQxNBFMT5FRZBTjA+yVWiyhZRt'
+        'KGCU8v/DlmWYpXVwuc/WQxOGfHHdj4xikXT60rFNZomTFEClIr7IGt+NFxpGokEoPWO0zoSlXM/z'
+        'H6bZWz2c5Gld2ByIZtq4bodk9Wi2RjTgcavIOIZxytKWZFsUWd4xctxMNghFclMH3vcF98hhYDa/'
+        'h3pMfVLpEec8QEwonVSW+aonUXK6dIe9fZr5jDADQFIFzV3IQhibI6XTaU7o/8ZiNKr7lDDHNwFy'
+        '5LTTINoo4hz41J0VtqWT2HBjPYlVX0euAPwjJipvkMIHZAZg2TIoZWU3+i6/2HeGJQL/kJjtyVf5'
+        'G3JhCOr8+HtHCzStN3zhgepM9UeyAZGiVzwkqhedlABswpMz7goJpBZb1iglWY5NJ6Zkr3vgEPE4'
+        '1SeefG/Z1ZuXyvqt7uU3tK5pUYgwLbFksAggnDj/1GbFl08YH6Phs/kuubgT+iKlHHOtglRnJib2'
+        '9+Sp9kgTAllDfTI4uboYIMe/11rq+KGerI6P7SgzQot2nehshRAj/w9J1B9fiKqpxGslFi3M/7MT'
+        'ArEF48tuIIgotmKVOozEZmvgz+7sYqkHWx3O7UuCVjQRWFQvdnsFtZZvJO0DjG6OvERPXjJ8ZU1C'
+        'CmWrrwbvUDCiw2kNW120Fm2bc27iit1wnC/9+gBVuhHkUhSDCGhrXKkHG9iNAPAWf+JTrWDHDahI'
+        '8MletJ4ne7dtp/m2h3vuATvv0TCJRcKGu+6n+SbuuHbPo6lCbK4JoVsCJ3sYQk0pch6VLp4GsOj/'
+        'ByyDowca515+nLur1KULiR5fvDUYT17927u1/wPaGZFq0LLhhYIQxNdhkLtF8bqda8Ttpc0vezyP'
+        'pIfrvwrj0voUaYmtMmd0og4Nw+Sbvfn1cDxFZgA6KhFRHjgY5IAoTKclZc6xdhkvzZTzXIMuuVyS'
+        'u/rl6CcNHbALh7esYEuJWvoFBF28qGxVN4+zF2997GZVadZNyeaTTANiAzQd4JnY0k3pJ4Adjlle'
+        '7lkwmiIBRgjB7SaQTi3mNDhmzmQ2Z4umMlW1qATGjLVIQA8zSywceBP1VyI9dh0OwOLXE/6x4vfN'
+        'jRHUyVJMMPRUJdtcUj7UTY+aaVPEddkiL18COoDuzL9X1U6/D6DKHPKJQmGQ8Icq01NalVr1OadT'
+        'aMpQiuqOxHUlaKJ0q39SixtqscMgymQio05lmagb3bNfub4WVlvr5eOQdLT1nG52uvETdabZHcDf'
+        'SaWF38dVWhl21zUH11C3jMma9z8AGMatm2Awpmrbk4bHEoGoOPZ3pTVuITFV3pjXF0bC4bfCM+mA'
+        '78BKFcCLAWoZSSxoAU3HW4/QPDLpFrxGnIUhvBrKFvGFwV4L0yyuK1z1Fe1FW027HZOgHGTce+yW'
+        '+XBwvQubTr3sexdPqS953i/3X6S3x6GkA+0frxbA6yVUX6j7FVhgaF4TzJ2bJhz6GUzHaZeaIMwB'
+        'nZXTYTOaGrA+QwLyin6E1Xv5Nm1C4k5prQ1gu83K08Yb+NH1PVOMVmWIiWXjqEU/XHL/va2HrCse'
+        'UPw8dX081YtS2yZaLZhPMS9IOSj/2Q7ZV14vcmccZ9X8pADYeh/weHb0P2TYoQXzQiF1riS4kemX'
+        'dRb35ycSw7AQOBrpJEVcwUfLqnLZOFWQgG5r4MXuhuqvBSSbos0wuSiC+szBAhnnTNsGnCzv276a'
+        'wM87Dag7dNp02dFJqZVLMIi5mt2oj0fLUdYPDswz6ROhkXBje730nGuIWvsGG0Rxw27cj9afd3fS'
+        'q+jiXwFFCXr8iuZFYSRI3NNZFCjV2S+qkbUhxoyrX8ScykvQRTGWl1G9p60JGhPY3QRaPca+iEwK'
+        'zvTjO3XtEjjdfM3wj9CXtahBlqjp1PQUG56E/uedk8FY/tdd4Wbfe7sJg9qVXoqfNFBriwXIDCf1'
+        '+qG79oeXHqBRDkjBRPZOyt0TWTV/wluqAi+W1IcMW9QV41LRPl9XvUOausX00XESWfXq5vJFAdAb'
+        'kENOWJuWlqhzDIHupd3m2Ohsodu4zrGmhPBguOfwiSfuOXsmcMIBTUM95eOECh3gIrfyoBTzAF0p'
+        'sK7JU9zxttLIogC3dCbkpk/yjIztolZahG1CN7mhAdpnT0eDpNVDyIxTzO7yIx8YRO2ioOmjsN5k'
+        'DkbbOFN2bBfbgkSsPxcdyA/Q5fmgqw/qrYknVEeaPmqAIqS7pyoUq2gQlnp3qfRHSJZ+2uJ8VymV'
+        'dYLGoimdXYyxTAlo4j+xNduTd5xMQnDDxPhKmX+XDBFIRfG1ozBux8lcJ4lmcsb/ed05FdeVBGtO'
+        'sG+JAfERYG6J/r4eGED4IGOoAIaUd2Yv1WGlba08OBr45/aOjJyekRWSiz4pv4afErBvkgYSgsv8'
+        'uJgzwrKiRr2OHg9euN79WpI4xUJhMd1sHg3mwUZdnW5yDTiw08r1kLvQqFvsfd0Elbai/IgPKv+T'
+        '4ICmu+WEL+HbUlBqYV5/AV+Ug44cLAH/BbmAXol4Bi88qiQqDYYK33VmSHWq2J+OvKipauEoWesI'
+        'vcN73Vt2AsY/4zDJmYdJ9SFqJPkCpezoLSVR2Tr/T2j51+YVAREBHj6q2j2Z/ZYDO/c4IRAZn8QL'
+        '+yknRH4NYWW38fQPELqQVCKmeBuMsGjsrCEr5j/c7oHMdli+spyrUrXsdOvjW7I1RPv8/Y4j+Iij'
+        'xAKLHxAIt1KpcfFjmqsn7wLJJuHXrZMLUOZMp2o1SqLYUAI92k5R1ecewGaXA+bj7Fe74nh+E3k+'
+        'MknMtIk/h5ts3BMGKfHgmjlu3R/gVzxx+ap4kplE9MdJwRSeVq9k3cB9b8AKqCWCoKS3cs5tGkP0'
+        'TZMhtdx0Vf5ukA9i7KbXjYSQzD7Ghvm2cDMcQDmwRUve7PHak+t9+6/79qSik4qlTU7p0axaVeZZ'
+        'SM715O0KJ3Tco6ImtDN++HW+mCECuUAGX3QkUq13+KHnwocZMqpvhZtVkZ3yWTfO6grm9wR5gnSX'
+        'GsE2GqeJQm7Fiip3rH8cewQh+rNTYdCmSSiR9OjWKXdjFa+sh3OxFtnOoPWFt85luM42yFSiooxs'
+        'NFpDIUbJgg5QPSSZdlZt0nacKPNSpkyeyHxG6JVRFBOstEFyMbrpG83XIixFVOWOQH2O7Pl3/9hn'
+        'ybCCsJdv6DdwXytnl4Wb1n1vNlfhvjbkD30By0pT+PXx7R8TXQSVgAvazqIZaSpJdZXPQC6ayFZB'
+        'P+Nj5KsU0k0MmCKpyx+JmilNNhOd6w96E6+Sx6bl6oa/OzvVlzGXxof2NNX2m1GxWmZ6rGjwA8bI'
+        '4FSsqegYoUrFjQAT8JLiTVedGTqtWB2kJaI1A4IaVpfJeEBs0TwUN/yKFTD+pIhpcfbP6EKTyAx4'
+        'QPUuQizLZn54wLrrMxxywCtm3tvUiNUZXUOm81uicPw1I9vgKclNr/ZU3DZ0+wNbq3J0FyWs6hbx'
+        'UVOy4WbgF/OUbt36uXjDgTTgCSj6zB8v/ssWwS956FAXIiA3UrjoWdrJe06Jfr78sCG0AXcaLDZ7'
+        'tHMM0lWGCb8GB9pSbLk0/CAr4R4sNheF8SE2Zn8F+y6byFHivdV3OtAz59F9OhxBe/vSVdFUxJDw'
+        'xon1L9/OBaZRWmfd/AwQ7HQ1NMK+oXVvZqJGhSpbO+4/wGSjaMOyOcJWinZukxeBD20YNL3LMCXI'
+        'OrVmW17vi3nyPLcte5sH+Og0eD7lX3Gv4A0S8PlmN+aAxGqewMtW4Oz80TDpcUd9xbQ/R6ARksMt'
+        '8tZrM+7wHo1CVomaz9ickGZnyyHgZJfNyLda6Nw6cQVfC5h5h7qFHXSt8ym24dyEi2R/EL579NcH'
+        'Abz501AA+SqNtd6uq7FDphAyTiaET9AlOiG+Tt2/NS9f5DhkmTwbnd5Pm7VxDM1frUgYG5D2Wob5'
+        'iym1gqNRZfrJn8TRY88cp5rQLABZ9IwDReI9Q2cnTCP6zW3MGzPe5LKwsR5tXtOURGrxSiPO2l0d'
+        'AzWDm/PFTIShhoOMYqLrUZDF+KeMhdFizpwBJPqL0MLWXM8zqrRfqGRLgtbArlVdnkOTXHoDsdk1'
+        '95aWq5PQsCgX5vral0LgP8bH29Zyw2kZGRjb4ys0tvJRJ7eN9Hp4tgkpTNE/VTe+2+zrL+M+jWa0'
+        'P5p0Ut9n3oiUMeWB/s+QhdKtmnFjOmIBFGZAi4v3i9m3gu8fdsthJEHZTjfvaSeuPw3Z+8KWE8iA'
+        'trR7xmAecTLtdnMp3cUMSTyjlmSqHjh/t5QGzMbGylNRikOmC1Bg8huvm8NlKsaftTY8s1924C93'
+        'tuYnmdU8p/wug16dbkG/mbHkGXHqD0xOl68DsQOw3Bb2KCtqyr6Fe49Ex169vcdoSAfsRZD1+TXH'
+        'tvRp4XwWQDY4d4zOOXEXOGdFyrqGi87SzDG+IKJtJE2MlS6cEpo0twaGezM6TCVygTMDMK0nJgn3'
+        '/j4xVVWTLa95rvSsHHgaIKwMLLduLlSDUMQhxsJmqUz5ysxyBthSiXkcvoGS2uWdJc2YddGLQFyO'
+        'le7iXqru++5A6NhmkXovY1YQ8H0wdXe1LkJP+A2goBF/cY3vreC9PmeWO8HzjDfRwa7kCEvBM/+o'
+        'cnkakezbaUoNJjffQDjZ6/28tl2d39rv3+fF4p7hUMKUrBoMQeNLTOSbTOd5Q5eKlzEBl0NEthPy'
+        'o6m6DZrJz7I3ZeDJ+nvkIKvTJLaQQlJRnEulQP82mNrxAqWiY+VenUvgNMMmVtJ4Pjeb6QPOuwgh'
+        'R7TNQG5A/BF79KfmzMaRIjHGbD1RbjNbUKEVK7OtNSq56kKuPzahMZNCRcy3Ix5NMTE5OvKj6hTS'
+        'aqV8JJfWcZvUOUpmanH0gK8JpRNDpkwfXde2j85594vqSPv6rqJ76v4ELUG+UBXTtW+78xG77tYT'
+        'ljnT61wAm9u6E1stsHPqREpAvu1U0RORveHuyUY+HVccVj4KpFDsI4vv+WUBjr/rUhKdSWjeq9D0'
+        'Gs1qntTPk1njLwPLWmh2nZc5tu3NcutmWa4HZQ2YW0MNWjHeo46UICCWNc5cwPk2AGl6BAmvxgFD'
+        'nR6Ul3+5Ke1m6oeorGqVhYqFPN0/OT2hpCxDyBzn1FEQiIxDyCRfUbD7CDyssEAEQF299JpFckYE'
+        'N3Rl6HF2h3vICyn7o5pOi9hHzkyfBhfuyM1Rjk8Fk0DPyak3OnmE8n/pJbBiOkmE3LOybnbIOum9'
+        'A/3ZAELU6d7I8CeA6vrc/rZ9fx1SzhHLuJqaJ2dUzQModqW6VGusTsuesjur3SV4jrNV86TvjPtE'
+        '93046FvLKoJEC+gdj3tL5kzbFlRyPvAZq5zXuBGRierMz1rQqSBHKgQTfDW5QQh7sBqwLfG4xopn'
+        'uleH854Cwx5b350QpyTDQZL+7NiFw/1iYI+Xz1bSR+GewIHzlTPSxGFvAiN6JUtx18i9niutd5KD'
+        'xOTCW7DoooPTI/H2nYlqrssKPYvzQiJNKWlg71N/v6DYFJ6v0a/KFbsxiIlZO6WKXkGTQMT4HwDg'
+        'VrCxnPXkaUwIpYGVZMEYERk+NxXFEpmwAppX7RBlbGLoY3aC1ui74icSRO5yawlLe10M/MPycwT4'
+        '9HNLSnFwt6WKc9wcEG9jlM6PlqScJngZfcpg028Feqz+Vodt13YnbLRf5iWAMNtUKd/Af+mQ8deV'
+        'o8givBytgoIVY4mKFu86+vTxu4sW89lLAWfuUtYLw8NKGTaRaqaIcpu+p2XeLQ8buonzT8EuYJCv'
+        '3VM55V8HUNcn/zBYhhDMaSeBmsxBW54jiUsoIeG2+FydncIN3QpZHxmNvfrJeNk9qkXpeuBavwSF'
+        'zVRfk+vvActorND+BIXUJHu15Zcb7mpDoXM/58wOgQFFz6Y7UJh7KZqCNmbFJqN0MU69q2ukypb3'
+        '+WayBsqrR+vze4GvUHiQCsdBSK6iZDB6r8XXTO+fNrWP9Gi7YUVnx+OqpfPvxUPH3eU0dtBjm+XA'
+        '6TbnPVIQG3j5phpqVwAYk/XTodZ+sCyMM3fLAXwvMWfI8+Y/Uyj9oq8E4u7yjr2hzNGBW3Y1OUDS'
+        'qwuT5E7jdfYI83yNAy6HAF5iNNrCQXvi+ToK6hsk+nYHqYXljt1tKAO3AXCmVVWO0YgLoszrXbtE'
+        'dUUMwrcPf6zVpVsT938pgS7uVQUY6mjIGLNMKiVH3KT+AWAxCI84f9NIfxVHjo8AR7ECfWPzx+L7'
+        'tXB2yeXX+r0k6LWoCALCiOxMMnVKAVw2QAOfoZp/nkzIxXTh/40YXlJ1avtgsj5kV2n6PPu4W6Mr'
+        'nMUdVQKK9jcjTc+tjfzTSXeN9niM7KbRUFDNsd8Q5aZb30OgRfwoyk7DR1N09b3saDu3yfF+q0iE'
+        '6dCIEzXH/62dbuUwIuwhW1DUFXbxJHk/2Px+UDCu7fSkaeijzQGNrQJvfjygrYnNv5mW+1J/F/5E'
+        'U8unztos/wLKSL3TDQaPdYgR9LSaHVNd9tQTlNAcn1cGBh+IZ0XmjrWzCuaG9KiY629OFuLOuD6+'
+        'EWonYjsr89fKSZKp01RuwDb01OqhgG5zLtoRCzWtTZ1Srnyo7Y5a1xGtJmGX7wKPpU+RTctM+c7c'
+        'B9+XFFefP9zo0rX1uRJH9XLv1Dc3WF8IJwY4svrjFVdsObiOr42CHj01jfNNJQ81akg7Rjfvyq6o'
+        'l+4Or8ajOZhKhiRVyXXM1lCbJQEBm3kXm1tIdLGKyt9eTTANGfSu7mpMOY5CBKBdCyBZFaIA4eLO'
+        'we21hHUmCYH/KBUrvwkYEG2jVTEhGWkBZ39JzWRDu8ZXKSwWsLQMp97O3Eg6Wkq2jN2o3N02j0hd'
+        'GgBqr6uTJMYC8dA4b+/QrdrKUFMnt8WjiIbZPBb9w9zOnAqOeplvW8sUFC6OlDMy8lHTH6PC+DC5'
+        'HeCzZmIJDpx/IVHFS9W/BwL1VEdJ/FOWVrFMLdmxINY8Q0TE1/VdtES706X5uE7nKhiXneP/rAkZ'
+        'FO3jDs0lYxCr5oaT+CtDMPM3ExVJidQCHpg6kyC1Sh2dJdoEV3QChkxiZtuJe3FLNbX2pWWSFtH4'
+        'qwyMVN36oZD2ib57PRO1pbqkzL1VtnxxDJv9u1oIlnKz3AUT7jvXeIOkcoVgDuWlxF0mUH5pi7RV'
+        'R6mkeqKDgLLcfgJEOjX6VFZ1C2UGxZZ8DM27Lb1rCXRzxB6WbJP6GCYQ5E6Xw4AOudupSfMqHG5G'
+        'NlcbYeT8mm7qRGfrs8Zq4xZykoU0mp1hHMaa45Lyw7BdIuuoqmdlCOMB5IrQqU/CytCq7EUPhOJK'
+        'bq+ltl20QtiNHX5WAsca4vZhGcdd5gdzMMb4j+VxxXVwxrkL2c4CzxkwHBPFDa7IVngIzlBEb+fb'
+        'ZmZNhsoq747VVIM8PaI0pva+XKm9sGHZijTgyR2ktdQu5YFV7+VWO3JkSOGD2JTsdqAxVucSxt8B'
+        'clqiJ6dlEsq7OZaH3pBoJLPlrrRD6PBlKGELG/DPfikRAGaHL3I/9kFHkvBdtYgIr3mIW7mbXsv8'
+        'a/7qOGdeL46UibOdx9h+IypomeCX05vti7KO09He6agW0WU6cRhhv4YJrcyGGPjgjzXDelsk81dK'
+        'lQrdl2OH08lT3LULkhKGrD1pAyZm/rC8K09P/2TdCCv4gv1gNPawYEOXtZSVi0/5GUE+AShJIWcW'
+        'AociA5sSM32mnmz124rdua9aWqlNoPpn6QwvzNVgOoKurj2UYjUF1pH1LDRt6YoSUMKIRfOAUNci'
+        'v5JqVON5iAH8sYOuuOCZVx+TdszAELswnj99G0fkRZmnWWX1hIwUWxYk6XY9I5oZmVWSpATnGdZh'
+        'vVD5FfX79yRtB3cD8Od+l+NTl+eUa5+bwLehZ3tAuZE5kZCyB2gIdGpre7DR/dU7t+Er+5lFlRK7'
+        'jWEtYn5E3prcHnCasDLw2Y5YpmVFFY4p48Tl9v2j10jNmoV/Df4eysSG4Le7ZenFvuGYmDSGLuoX'
+        'ff0K+gngtb/srkOghkUT2DoUFlp71xo+8XxvpF98KoKcWiTIAh+IDE7WjovbDrPh1gZBe5AKdOeu'
+        'D+4xvyjhSDw0FJ5hmu300Y8MhSo/atXQeG9QQTEGpZ/sBpTRnwkJDO6frtPm0yQtFF03rCBjGqbt'
+        'Cf4x68mieghS1LbQZ9exAIwnbovriUgw8iqsO8EtiXJ8NlpH9creCzvhzr2GQgz4zEsoH+i3e7YD'
+        'xAm/fJUDikGbUK8x3qe8MqkO3XjMtvDceJEMwKWQDmvlDqqe4Qn6vtyfBXvzpD7pXhMrOinrAvWY'
+        'rBeml8QlfxK5cGKKUc/1QJGUK61YYIGrd93jyyKS+XcqK7ndbjYCv0Xzj9YcmcOyQ7bAIMBNub73'
+        'TmWZZOrHniYZVjCFpfz0kc9MP0+lLFCWI0riLUo/2rg4kxvJoxWl5KH4n7VDWXeqeV3HYZ4IWl90'
+        'F0YfDDAhvHgyyTN84zWlpx7T/X2rXaOeqh5wGqhU3u2wp7ncAL49vYACHEJJ89eWHBnpkOKSd34j'
+        'GFbi2WoTVX/GlbZC+QpGQl3T9q1y06znS8vvxQFKD4OM3e5kP3rxHND3tlmB2J99UrRLQ/+uC4d3'
+        'yVFSP5HFneyfCK7YzF6jf3xhg+OMTrReuD+Yanm8AbMuIXVoCIpPxdk1mNMQbnjblbS/26f1//n7'
+        'Q1tbR6EKCofsoqm2VUAJnY5mYt0cE/7gmmYmyCp4ryhNT5Rk4d5Niht+48+umbF4a8s6XjMRQncI'
+        'xmCa77cSMFNrN/hlbD7DGCXLz+9VftiQudy9P40klH78caX3TX5Rk1AtMcAkVsMCpL+9gzEwWFBK'
+        'ksPg+d6FpiUQG8ryDZJsL1i+DJ2t2qUMNNHB8g4oNrqVSdsdqKRJmtPKUgO9rfOB2BChQszehwWE'
+        '4Q+/DncOGVnbEoPJsvuBJfymu6Hr9jizYuej4X82C6N9f0UyKgD9Pk48hm8zw58jte5txeLmgv1f'
+        '+yNX0xqppTrcIpNYyTDIS3oSh8KxjGNCX6spEMLM+dNBF5uDPGutj+W2hHblIs/me1z3YYW5yhDy'
+        'aLtcOr21WbinGtBqd5nqqf1JEmCRaxYcSsVaaRM8XzJqQQS/jQLd2Ip63l4OpixWVTO6kMj0fQIz'
+        'lq45gN54fUF5OEy5VKEBvSlGs5BOxJTWVH4OOkG9Ymaa9zUCUgSFPtN/ZOUqKQDRrI7TtJRCn1ja'
+        'ePbfvhadhEMAeSa0zjYAaJKjvFe5Mj5/zqA7l666FFg7KK62NFSmtrEj8E/F/uomEoNqfHL9+uU4'
+        'YUtooSxBOmVkqYj08xzNpIDVAyySBIKiC2i1WCRf233ZpJrZ9dPfJbrUxf9N8iKpN+4fO9ONY32e'
+        '4k0qlSYZba+709lkRJ9ZrqQaVnEG5kj5Tl63OJcNLpI+nlpner2aY1NDU02TPC5ZLJGX1fbep7my'
+        'tJd7DRRHSMSSzHz8yP7Gi+82abo45GpbQQsOxK3UEw+CejSxADC3gzknS8Q7Gvs8HpnpoKbST7Eq'
+        '7mKHTnLwlrj1uejm3vPfB5LqvXJpKboQISs8nPnKfqZ+MtI3etCH+M2xrQroFyNo+iPSUa73US3+'
+        'N8nkCjOEoqZuQEXfgXbXxDRl2/8BDNa0YKVNnQZTCdqLq3PKxj7gOLGt45x427LgbybFZAYiNtPj'
+        'tEhVajIbEGntEEhy61lLMP68IN3Yco8SahyKiH2AIySHHJJXVrhNpAKYus89gpF7w3i+yKgs5xWj'
+        'idjWYj7sTlHwjHHk+6d2r9pZAEL4nBsmty/W7vV9B3/fit7RE8jLYBzVPZhYvRughzbM1TJY8oU9'
+        'h2lGy9ln+LrMnbaQN4fGMbLcRjfLpkukClyGczVz3ELI10cqE4ZtqiZfswO5+FniIcWeqhAQ6nHO'
+        'dnfrDfKNigE8QOuZeM4ddFlTg5AEVv7xLwnqcQauNRok2zlsN1XtYzLvLfMMaVfdqNm68k13Gyd+'
+        'mzEXJYPICoQMEXTjpah9erplBFlWe2/BPHRZi722f/cS8UMmBB011bZYPRaa/9mHUm2W5Wo48OgO'
+        'zLJEAA68Kb4vZG9RUteo3jFWqtb5zJwhW3UVE+QdO8IeO1lwLki5BXQu27JLuITa4NvLe7tcLkCM'
+        'C5b67SvqAhS6nalGU+JUzeW3AR6WmeU/tBkoEPJQjWeHymgZQaLSfPviEjJSE6mXuRBLiPjBX8e/'
+        '9N4qmEw1q4QEfoAEOTe46K215UpVktqTFYYY5MUA0Yg+MkkBZnI7fHTxdHJANAkUgdIgOSPHZXCf'
+        'MsRgTfGFWDi9p2iFET48Ig+z3eaqzahjwD7eYH3kR1mQtfq2fzh+oL2o5RlvGnaCR50NmPb2vR6W'
+        '/KqPy5CkizPS7icf8i04vZNLYEXzFYvDJ1s+l2HI2/vx/iI5xkchr2DUt7EW2f9kj2snormOR1LC'
+        'apYhRejvw4etLYMljAv+FJiQvb+UzXWJSGbEGnDZ2FEgJ6aNbHzTuDh+4Lw+Tm3jAA0EhfZWEz2m'
+        'qcaYYfPwB0ruOvhKH8+GoFjIOY3hPNFrxU7hWr+ELeT40xJQz/5ZYxV7B+EV1lcZf2Wr4sHa20IZ'
+        'fTwrWuwhpCNaaT4ZYlPfAEVayqOABWSoWo5e5ZXyKPdILTBsSoMzvHLY3VBM0DxAw4z/2fq4aQP/'
+        '0CgCdTX0BuBrCxt7dSExLJ3UmbzJZB0x5UkPvEdB3ygl3zzQ2IDX+0WGQ+vqYEYV7kR/cLLdPqQQ'
+        '//ksxuSsYV5AYTRt9sHUZwDNSoiMb3lz0y91+ptI19OhiiCjpk50bT6bfsohtNhbI4Mms79apezX'
+        'WtUd8xxoc20TGTCWTLMSvuNDA7RLEqtHpR3vy36iZXEZIG0rxHrJccU/0WoH/CPvpLcvjTPMQsyK'
+        '0S5j+dL4Tg3Q/kC59xjOZN9th+ec+t//62mQQ8XuoSbqthe55SfSndYqYV66kLeMuYtQEm6WhQLR'
+        'kEHIVxLMEGMTpmMoJmJ08hSIphH+o/wcZDCYbDvTqEiF2RN2MR5dIubSW4iPo4/QK6C4rQm+WLXi'
+        'tu4iUspzuKBoR1lG7CHNBtJBgZeew3XnoUmz3djNp5r+msbcil8h5OXEQyn3Vzu/PUp1MqY4IoiT'
+        '6nfzrgSk5wbiufnfZu8OdrPebr7JP/QiSas2KDzkqOGvyTkYu/w6JhLu3ArzahxUolKhuY74j07M'
+        'ewb8d7UxuzVBf4RfetW5Uczc4ig50CY3cYDRyMTYLskzchscHST9LzGuPWdDfaFxECW6WOffhEyY'
+        'vhHXXDApfWXNFWvySS9A1knHmh/+myRBg7OJJeOFpuOefwUBTaIxlQeOJNZiHk80Pgq7RE/biL15'
+        '0+mP57/08eHmYImywstn5Qayx+LVL6UFLPiWarQ/n8ddgPUdNdVeKaGq+gXWXaV25Qcl7C40OtS8'
+        'EcsfTEs5V2lK4dHW2XOxe6JMH0y1iT0D3fYTRNpk+Leom07jeKZfY5BIDj2PAAHt3fiFplTraHxK'
+        'CCpZD74cQ9xO2HNLFs2bK0VAajl1ARvd0GcqCSxZnNbOQj6PeD4MZ0Uu9hHhZPdX1GgElR26uPec'
+        '7xEd/uHXWkxqOaDCkZ62lh4EqyrLBRuVFixvfMDO2P2qoc44Hw5Vp30ick82u5kKN4tivCUIIbh9'
+        '+K8NLLPcB5OReV65I5ZkWw1vJfFh8INWQr3CgEaWEo5Ll4mkVr/cBn08cIAxbiXpOPSaO6TzhQM6'
+        'be16OjrcTwrqQkmwBisJbPjzXs1T8/UVkJnaMFGKE7iyaaHBMWFC7XYw2jGgUkO+NEewDrKhQdGF'
+        'I9zWHvNMA+aDlQJNbMdU4Y6CQmFKeOm70iqc2WE4EWWTE6dijJE8Rpee+onHCGsftJUGzKlkYvqD'
+        'nxt92S886hnYyqLW7AjW8zg4h/qLLXZVSeXumsxT2vvdG6Tu5QN4ZT9ULYX4U28R1mXdD/wrmg4P'
+        '0VuOnBnTLTCJnICzMFUBsVr1M163qmUeTRRrTJhgkCttXxIh4cBmy1dPNVDHzJwdNzpodWkWvfHN'
+        'wD3Moz+ew0blL3f58RnpVMaM5q2+jq29yPKg4y/yG6TamhSoh3ob3MMMS4sWUb+V2fum9ENceFmB'
+        'g5OsZOsHnUUg2hozBY+3OUM1Fpni12WUSwT6qukG/mUaJ0zUANmHzsV2VwKuy1A4B3RqQgS5bPRT'
+        '5IvXaycPTNBVJZ5sGTxhnm16JQKovR3SgJC2B/gyTL9vnTHmdT+M7Wdy3HZaLalxpRbGLYqwABbS'
+        'K5s91BsDYmYYvNqmgevLpE/UIIE/6sZ6JeJ9qJcfSI10hItp9vUFGmLHZM8L1XE6lcUL+/YFZFho'
+        'DViGAEFljb+dwSbjSRZN6Jy8J5uWcvrKN2S5l5YU4vCEr+NSGO/0Zv2qhshiq044PXy3Arux5A4m'
+        '/g7qKgA0M/om0a43WLvQH7HO/G3vItVIVC08a65IMBP51K4+KyJs4b0KokBrwY2h9IHdn77MJwbq'
+        'gDjcO0dbltRBHxaUfX8tmKH77MgZGZb1/Hr7Rsi9YeGiZVhfwmpZXXB1wvJS1ae3K+5ThodryoED'
+        '7mHefAvav7fl8eRiM4gHrQR6JTFpSZoL9tdUrxNXAGT72dz3GlhdDj+c52kFKZief/1U/syuhNu/'
+        'DwKkYZKDGHXGv0hYIKiWwlmOdTfz1bKxJTiYAAtSCMsFfykybsYTXPKsxak6osnqcVLOkiWAaVyt'
+        'mUsSDPc+wBpMGu1/b/3irCpk3DuxsdgKHMF/JJt8i7d/xHblTt+5AFAbvjB23ujGa1C9lS7XsWei'
+        'Gi8TeOhwgAeH92NyMJsCD+4umzKnlnIjP3sp36uGxtlwiO+9cxLeQFcUENceI+FPbvdBWqhxpTo8'
+        'b21p4XsLoYE6mTa6o+bW4cKVBFoLMbVeApe4/w5mcQ/0vhrhQ6oGY2e8IfJ3waLxuaD6VjQCZsLX'
+        'nkqtkeGDz9oefz3N0y++Ag5Jxis+lADlCh9iAWXrh7IamntK+ZZoBXB9QtHXes9GtupLKhsap3e9'
+        'db4EBsJpNAkpE8rB1SN/paabFGYwRRI1zzUbdOtmHGXpt/9uLLAfd4JWRajiDWatGIOmkxMNOqUT'
+        'VIqR3DlhV/NuRpIZ4cipIcnDaiuxldCPbxS3mGuB2aeTT4FaFVC1HYtXjjhKhvbLOWJ268c+loFY'
+        'lncNw6DOBI5zsc+wLz44UUNbiDVT6ulZhJQquQD6KVHE1SWKBT/prDN67ShqQaZzA8GUykW0CkCe'
+        'w6tbPiw8xjhfaGfd54W+EIsT4fFtDOiQk94KXWy588vkzKvDDoVcM5o7O35WNiFs/R7iXbXcpDU4'
+        'e3Apu74wf27nx3wmne3hrzFoKRntc1J4HXYTQYbjab6AH/qE7hlN9yByzi0F7CNT17PW0sFOtMkK'
+        'oWik9jsSqjAPVnOfSe3vmYIqAFMlCXGVUseLINSGSndqbN0b5ltCPNW3IIJWD9iwzeIwy/mSGKR5'
+        'caJ09KjuhiXafLO+u0KO7h4Bcmeb0JVGj/Hn8C13J865JM5k/sSlpFncwEoYx3yHBIPzvKN8kgxC'
+        'VSZa6yz0RwvbJb8LiHjLl7lYtHA1ZXQcJ89YMJj5wEeN6y3w2Y8NHgUhVTSBo9rrXTLU1dqiyOGO'
+        '73gwUh/k9FWFrWk5oIZqYpKkExun/j9xd65n9KiKZl5PgI2+xEEYI+ljUPIAmOsQhGC+jN2a93qc'
+        'ijtgu7LpPCkxx/AtXPcSXmjd2G/Mxl4WFuu8sguKL9GoAwWa0VzT+t/KyOGKSk6Pd+Qd8AeK1H5P'
+        'uzozWv8f1kHoLGa5PjABM8nUTHD3b1EkAYicAiVB/QAeOKmWlV8DSzQxCgD3Q+2UnY5XBjb0qUMt'
+        'BXSoJ68cYYEFZ3JCnUbjSNNwKXkeY13o1s4uWTWeTClaSO9kitALZqQJGPikel0UGUX2YEs1v5xd'
+        '2gyoMjDu5mQDQVrcJYe5sXkRktKy3mMfpUMHMQozD7R6Gq5t2Z4iZdpmmp0vKbDrwgKsLYdjBswC'
+        'dNi9eJWoXrsI9/zE5XqnbjMZ2rz5lglUzsz/nDXeoE/7gykr8IX7S+37NwBDBLU2moWLCyHE6dfb'
+        'TRJ/7K8cY6SmU4vGg39zFVG5TsJL10nnowNbSZ2yeSRQihPDDmFBqW0gW+yPTldFrM/202/beeRm'
+        'Ac53xJCwz5ljM1PzjE5iAHyLpx0DzKFCw4ZBHmY6b+rHvczIXKx9pDOQVXP96ffKY/XDInfOatLy'
+        'fdtBhbN2SXVMwEtl9yq6Rp7BEXdis/nx9AUHePdH2gNNqzeTfHjfGE2aYJBdgdOPqAcr8cWrJUyw'
+        'xN3w2+s/y1qnq7TYrU1lG2hlrIhCsKNpDxWjO/o1YR0uxtfYTNMwcXvVB/SHR+IYmEmkNEwBgYSF'
+        'Gx2x7yx+P6mDlsUTlLoqtRauqIrL/SfOpt0jr4ygKX/sWElQwfVf4vFCI3f+V9mS0M5V3Wd5Rd+J'
+        'V1YJNhptPqzsyMo/zH0B3HzcbHpZO6O4YyjbjiqgPICKQ1XK253v9CQ/RAJH/3LfNw5druXAr0Uf'
+        'YJLAj37RZu1u6t9LT2XLE3smW56o2cfWo/iCaNtmyshOlyGWCDsMiYd4zSp8+88h97ioT3qAIRWH'
+        'MidqsWYRAjtJmBH05XSabKxva2tHnmuliYpWdKG3eGMHO7H036dpyJlBinHkfcENWssnKQZBdHaU'
+        'Lvlu0rs8SpCIDacaQOSCFV/pFii0bnzLvB/Qm4yaLAcX/LiPiYCjE/TAf7AMIdOgoYnYY++eo0c8'
+        '7aO7EEgdSMVKdMtqFQOSwvsFEwVLinwozFyrk5XxdU3lQ3qOHI4l/VmBVsLHrnaJYF/mSWjSqVyn'
+        '11ODPtK+3JDuHNvJ8CSjTQXsYtIHtVFvjZUFxp90dRi9FlX3J8KYea2v9qbdayMBQPpoiDYYG+Ah'
+        'CVuAbovUYwhNRPdJCtOo235SEedandkIzGeiO9CQuj1U4FmYTv0gv8I4HOBjSIDEEtJOloEaf3hR'
+        'ffqn+vTROhoxMOXmUtSEGF62p6zwiAloHPrSCrKCWGObCGsZKf8JIefUJCPxz6+GqYoaxaHdY/PV'
+        'EUNjkfr3Ya1+rn9eKyE2Cwpr0aGatfNsR9/qvj2zjfOt5MJVpGeq9bbXAk1biZHyFYQQohcokOJm'
+        'XO/IIuLrbZnAGnaElIi1w2/q/IR2Mkpg2xblyd2tXmXky3sBwwCSisT6Nmswm7tnF3GQfj5nw3RU'
+        'ocdnjt1MF1rlEgOZNxU3kQKDGm+eJ2nX0wnbXXyybgEAPIIpgmSHSDYESqZbKzmK0HHPTY3epTUf'
+        'CeFcgnp1ZdwC/WIBbQor51MNSBJG6CdIC+I8S1r8TBKqCG3ggbn373lVK7A5jmPhtyIVzFGEj/S6'
+        'gsnyvkWuZZOkK3lWj1UlDo3/EvrQyoa/ltbCkMgQ4s/CUWcI/XjATjrbzyl10SFrUoOduEC89cK5'
+        'OKvjHURT6ztbvPIch9lO3gZc/2wKPqrJnMguN5UhKuKAavZ7pDPfaNulVUyKoZh24s8yvHrzHbWV'
+        'g0Y+FjHgk0n5oBuUXxUGhbI+34s0TGgr9RhrW9S3zsyIOJ0FNSL9h+fEboq9ItPDdk47Rsme2erw'
+        'LKEBHqhYBi5N6v7vBMjP3z32NAGADPqHnY8bcyZ68dm8II1hv436XUBeQwb/DgsXlCKCNrupCdhc'
+        'wdE/pA0gGUoO9RRRFmMpjmLeKj510q0cB0JGdQktP3o6bDckhRdmShOsT5pSr+DmaDH1kp3hP1La'
+        'GQMqiOOIB4FW6kFoV25QI2KkelBssgm+PDZ/D7wmicpjv/1aKXKg9AG48qScye+TjfFlQfMw7MT9'
+        '8PNs1+Vkg1+D3UfAxeLr2OtfmE6mohMOkPUmTzfoQBPF0K0trpDbnKEvL/9FqG4YlspIfbqeNSu7'
+        'Ol/7NYJzPljehGYy63Bc07ULB9FtOWgRhE4teF4Cfh5QwJWxcEd8Z9/JaqYv2qGXhawKedgauL64'
+        'dtxqzo2d7tLE1j0GLd7yE+lJHNBtI2PutWiI9geWUyQ/ozMlrXoI11q6TF9hv67aOGuOMdk9d2Y1'
+        'U+lL2vihCwImG3/5AIWZj4Fdg6R/SIAveui0sxRl/b8p2s+TNd7RQhnSDPV2HFF3DTIYSve1veA4'
+        '8ilrjYsqltcm8NOmklX2MBuOqM4ftamn0Ak0xGT6SEOQUlQrp8Gz6q5ee0nKxhecu2tvj+r9zS/a'
+        '0p4HJj8kZIRX7Q6a5QUQR8mQ2ECleAFN4UWmgou/RrmNPYPUId6IViMNir1CRwZEXCckAnoWaKWG'
+        'hkSn0WxeDn4Z8PtX2klruCtBJehkPY32RA9P4cqwpuHJ1eCxq1rowj8Djd01WgD3fMV/gxX1Y/69'
+        'dfbZYLe4Lviwu61c5zlDiISp8TVJ+/wRJFsT+kC0ntiW7r9Ka2Vis5ptGXRedoBa0oIk9DlqODCF'
+        'dl3awQFxDYpkWmpoyDnLo7UR0ug2OGBTuumXcTSczlX53v9n1JgPoJEpmCYYusC+W/Ake1SkNCoi'
+        'yuT7MtSiXbY5WN5JjuZ+5EQuzg8oDcvrELIiDyTX6YOumB5zQdowvLBk+2Ignj8IqPuxMjnkJ7tw'
+        'Ru8LY5TmhgFdHPB9FfvElSAD+D3sz+FtfTpYdxR1ibEpH35X4AhOdfxi/3r2i9wDK7enRDDqPCu3'
+        '1X3KqxebgEjgSrtZX/OgwflVNuldsan2GkECAhz9CSey4bxM2o/GKiCvaNYbTlrqpJKm9tuCUm7N'
+        'YqQzkqY8zRBdLUwa0apbeRvZYzD7H7MlyxUOw38IrI0AdCn4S70jO7CJMSeXL3G6ma0/hCZDxehO'
+        'Dv3cT2H78zf73QWabItb4R5UjqqYa+R64ONpm05bHTeCsTzIVPeO2nKsD0aIpH8XkGp+QKyk+j9E'
+        'j+OMeMImn2sAIq4bPbMpqPaUlnQVSSgR3iY2RZKkkfZNdHMq2SGrLm/y9qJNrsKBNv1gb/DOGhgA'
+        'uvXVNGX/0ZxomgXaF/2teUoLUnFyAeaCJOI6pIyXV25KmQCgVmt2PMFro7Llt9jiCg0inSmZJq28'
+        'nS4KRsjBzCkVer5SvlmVD0j/opVFvorFyFe2SCXkID0nfLFSdh3E6XMVetnVk83k6K9DoINRigrk'
+        'lpZvymFX8PHOzQQ33kKqW15IuLWJRG0GHBQ58i0cNI0lsfM8ovveYEfA9czXUXiwiQ5bkoBDtkKR'
+        'jpRqhrqymr4yzSAO/YiwukzftESHkOzVEWbigkvHctgS2GesovcN1+yyA/rjWs8I7cBe8GUEmaXM'
+        'spLMAuLdPNqktlFuP7Ei9hp/U/Py3NDioV9eiBlDI+jelsdjRzdV4ekbdNqVVP+w0noZaeHQWG1j'
+        'DBnx9WKfpKJwr7rOOTkD+poe6NnsIcXpPDemPWwKsAe4V/0tN74gl0/bO4wq1ZPXh3KuSG4oG2nx'
+        'fhbIa43NSXt0LV8k20xnKxz0zI02xLTjWjUo6G0Djo45Pryx6TKExjEpLZvDYBW9T+RgN9LrNLFk'
+        'ohFLNBZGv/8Y7syDbYZEbHP6rYAZn+x/IgrYm5oL3q6rNz60bkKxYU4w7YuC40HfV2BHWYkazeOv'
+        'tv6asUIm7vm/bUVbVlCQCUwuuX5uBRa+nzRu7CXKne/bdWX1V+aUMJwM9n3cDtZZOw7oAnKEeRgE'
+        'N3J9W53cGcHS4yKCy7V6HmIOxpafXo8Iw3WYI6cJ3darHJx29l5QXY5HkEIwH9QtwnELg4jkwH4i'
+        'g5DYI2OxpZSe67jPQSLdFGh6MVLpceeRVZH30bpm/oCqmduprSzraxK9qvdze0Z0dZOig4m5glmT'
+        'mEmPxXFmVj39J6CPcriljJpJ8nXoKIXxxF6ncaRxSk9oPeJur0nlJXMhytjXZ+2VW7Xb0RXo0Keb'
+        '+gT2Xdcehp9gDtt2veZVYZESTyaYPFcljsLP5UcDMvDpSNGSY0CEevRfYriIC28V6OrVUqLiTXWB'
+        'qRfXqvcL8bnxoIk/sk7cOYRr6RqUK6IVyFDs2TDfHQNonfdzvHAFlAIB1M3Yh0bS4vDlE5QBc8tE'
+        'je7uSJxC1yYFw1JfTw1xAy3/ucVsrGHBBSc9Y2iPvedftIXsiiYUULC8xTmqA/7GF7R1jW41gfda'
+        'b5kes11KDWYtVpmrsfxwvQTJpkyKLWpwFg9U2qYxHSudj9NM0MwiG7DYqnLbOLJoGUghn4Lrnlpb'
+        'iEA1QMT3DOhlYoad9VnuAWCYpEPeEOt3+SxjnIKHkY6qsGbUlgkcBy1wbXVrISQkfvlxUuM5DHSG'
+        '/fp1HOeXGb4/kiEvcVt+m3K+idgbSjNtcpHRSln55AdXBCCJTIsZY1LYZUdcc+cVCHyINalqg8SJ'
+        'rdOa1hjosLWD8BPQXefLYn6Oka4MnnmMjjoaOpwuuFhFSIPuPX13Uz8b2paMPJw7wFdmyKhy2EiZ'
+        'aXTjOz6yRlv/RB+mQPuaLKs0E++3jRDkU5HnRjWAXIw6f8gvpEdHRI+kdXrsm1ZPZW3srq6dRt0S'
+        'cFGSigUjdsE0FtV5lI1ZwjYB5GyCr39sm88H0dhoHsLcEZlvespuZ7F2ErxWaoY711s62AVwdnyZ'
+        '8lCud7c6DuuyqGlxk0tn6UWhyeXIMl/0ivEWMDHYqoeX9L5+/OmB5vN4S2Ea8H24DdrRGaeXbJ5j'
+        'FWxwWPXcEtIru1R4vz8XaAFzrboK+DErN7LyA3eNuSRrP60Q+sP5r8VlJeDpawHADnncUzZboyqE'
+        'l/M5tHrr/ZeiB+yxzzpvat6gzRaDNquMR3aB3Xh4DjF+2kCd2FeQvPum2Wd28FYbkTqCmLufsMRK'
+        'cEYAu2deTg7L9qo+LcN2efHfqQzU+gPJv5j1YRz2BaOD7DbtN8QxX1TSqyVOtvcn9yKtJkI5PuA1'
+        'OHsW0ixivDZT6KqOLoq1Ql/+NFqQU1RRNrmjIigSj3sfCjTkhXlZBLQilmRowAfZFOj7ua+EmboX'
+        'mxZJUynhzY7qQAnl+vp3/H1gVEIA0hkTbUgYoWB3LSRdR3lDI3YASADKeIExJskvP7ZB2lMEKlO8'
+        '0Mb7zifF7mkLETXoIEHiLaBLPsDi8e6p5EXw49tVc11p6xiL579A+F+ysp5SAl/dDd3KQPIdGDjD'
+        'qSPtHv9+TMQF8s3qEoFn8jMNm2rtHsUmYzo4+HurZby1UQGylMDroOt1sOPtl0+qf2TJgYyMFbWq'
+        'z1w9QAX7rpQOIOgXleraXaTVwGa4Eo0+dSK6U9590lNJDVQTRoPEaTo7rhDBrlclhvHe4HHvXwQv'
+        'wMC+yve5SQmULODwdzbNXbgtnznEShWBr9w7HqvVBgOpoBkHiMYnjAF2yeASuMGqTueBp8M/SW23'
+        'uB5XpsRCQOjAppLioBxgwdmMcjxeewJVEJzYlAtla/8JGvAAJQ4OSoolOyFHAuSXmjEJ7NsP3H32'
+        'jNhb13oqgukvY5+57Cn3JJiWtBCQ5mqjnLRHsef71P1kJXUoPNxGe9IwxMoHpHvrPmRmEqGJqbMC'
+        '/GX2UytwBzf4pFr1BcnK/3pcQrYcJrCJ/PVPq8PoamEDLSHr7YndRKPWjQV5FJ9yMlFilsaccIRL'
+        'JJeysRN7zVIb9TQZMXv1HvUK4c71DaZSKg+C/OTYghjK1YVAfe9dbU8p9m5R/jceHqJ8yY+oH94N'
+        'xaEamxZDhveGsYvJKc+M+erbQrfMqxz2BTGMkYS4lWG3T9V9cHfT6zyHdzByW35tGSs9DCHpBnxa'
+        'UXPnkoA9Uq9xQWXq9IWhNa0kF5KM+sX1KfeyCpRk7g86AOFYSQ/cwL1Wc1s2Qy5Pl3wdVg/tAmNF'
+        '+YcDTslX+d+/phZunIf4iZPthHvr+QDfeGNIfEDc7ccrUu5juNA8xTCMV1+6qukae1afX2OyEpHw'
+        'Zu5NF0diGTB/V6AvNF4esmO8bzi32ogAG73s6tIGj3AWn4yy6nlpKAH1yzO7kB1sH6t2uyCbBqCr'
+        '1N9Ml2ZbGp/3SMXwy8k8sL3eMm2utlloVjhBkEKvnm3jsERs7TYLNUZAB8O/7U2KcIi2RsS3JW49'
+        '0ReHd0sh6j5oeZpeCMoRHBbhTGxfSPS/nkVIaxY+SoCkYgues/Le0Mj/L1Ss4RWQ3yJwX26J1eWZ'
+        'PDfu8NSGuvvJGSprh+Ja1CyhvVx847f36t3kPJX3gVELZz76bnPaXWtIKcmTpX4mOcYFjSNIzyFE'
+        '1zFOKOf9fV6rwnMa69qC59ByYOeCY2MPj3lVg89infBgTzZkHz2PYNahhBX9cDWoRcsKG7KDLTaW'
+        'WKUGTyY3Nz3kkCxl2S2G8qI6MZe4+hBUvcU7b1VaIAHd0gy8gDz+0lM5fLxL3KpSgiKRblVey0ej'
+        'EHrHk/zJxwSf9bNBG93XfZPlc8wMxyFrKE/zoEVGeJvg8VXnTYGgNX6KGvDI1QU1idS5FinLUcIg'
+        '5NgZG4Y3X+RBbNX3EwbzRP9gOYUZarvrF8tqiUnVadbjuPrMPEHTYDZAR4Q2Io5P0ob96EzHAdaw'
+        'X9Ja3gG6nmwkP7fBxyYejG29xImnY91V5u+emd6HqeJW7v35zhIX8YUZOsAVIB9kFqHAXU1gXSQ6'
+        'WPINJQL2/xvFinBS8h2PMXfzUiCds1MdncAFDOUslKX2z4xNRNXsnN1hNv/pmkgBEJkzQS3ABBjc'
+        '87l18L0NeiYd5AFOFve/NFWHAnSWGz4CbWWiuu6CPX2WAOIY1aJ3gdbeJ0NZf6IWwD57ksJQ7exH'
+        'sejgPPFzPbjpMYBMhukuveBGuvlTacMPTnnJ0RZLISLdAuQIsfJ4dqNCVrvHg8PFf0FEvCVr7/il'
+        '9HbcH8pghSP14YTGh57TPwR4Lz94IwBoP2oeiyJ4WuNqhwA9z6cXUj6kGqR3dphTN4DmhsplvYC3'
+        'eq6a6AGVXNJKGBhoEGhviMWDn61izTeH+lU2T7BMhPYOaaBWEVH2rwkgyOpB4QdGrBcDfKpH+j9g'
+        'XPinWVUix2X2Ej9MyzZiluu9+ueraTFhUYUqiwpGVvEYQLUK4fjoJs7uHzDp2Pb4E0/koJ3k4jRv'
+        'yDhgGoZgB2shhOhpwibGAitwfNCGrHiS5AEsHcumTqJjtr9LHNpfCFPie/cbLhUUvfi4O9pA0tET'
+        'CXWTv563EV9rzIxkXJH6iCDprdEHCMpuaMxoQeTdBxuXU+MBgX96pSBQHtmXskF44Q9wGImpdwLs'
+        '69UX3AxpCn2/LjfnTdwMhr7+/w4C/ogHaDsj32lWp2T2GtKvNq6h+Q/HZA51t4tEE4GGv2JC4/sI'
+        'MK9XOnA/yQPIq1tGkibnaY56wSu+BBjnegfer4xOhm3cHmVcJoVvYCvwcNtN90okFJiTkdQK/iQn'
+        '9S4yGiplUzskeQlKtw1AVqdbx+/fzLT3IdmqKctpycC1EpvybzJs4sJum6UyXjUVCanuYCHn48GC'
+        'm8J8zStpycfjUBMS84Rji9iyifWXO2oVKNF2jkwJ+DfXUmlOwBc221dSG2+3qlMwY57MVd4kEHvT'
+        'EUeVg/QvYm58cBV9sx1U99rnyXJswo7krZNuluFODUlxj4xqrYXVFQ2liDoXW0Tf4Nvy7d54pqm1'
+        'w5F/Jg7F9MZyVfuTCRPeKRsLpHAq9HG0OQwcqL28HYUOPmU8IHzPKAbailpmsjIRfy57KYPaosVl'
+        'SZVi3StfRhNraRCxCUXeCc2xH5PAwviSLa2NEExwLPSCMXWj1752ezoFm/sNAwzh5AMFDOLVY0Di'
+        'Nf8q/YCsIrqC630veIbNQyctsN7ZiAwZGQKS2zJ9E8LSw5eXuWoQx8bYx+7I02U+Tc6Mr5v7IGtC'
+        'VlxEsX6X0Dtu/726AefBcKEfPEoVit/rCjNh0kcfXMStmuO+Wn0qvIUahqBtquyLTvDB+VSjjXxI'
+        'Gg3j1MRte5xeH88jOPXYC5NxPOOhY+m5Rf9iZ3jXfNh2vdKsIKCU9vRJTUO4M4oCAM4ChYvIrDJT'
+        'xdhMSj+71UFIWJuvtSjgXQ0IRCZV9gOEZUOdAqWNvxJCr3wDYl+2cLn7edhz8tw6KaGzJwG9rjMy'
+        '/yUKm/4FJTvY9w1KvNhnE7f2Ptc/+ldUZ+AHsK54ddRDuOptYUH2IvYWdTUcoBtcFOHu4hGPypuf'
+        '1AW1aahYxiKi/EuFSI1nWcidR+OM3R8sa8a6Mfdc3CXXUgLG14wbyfV7+/LORWwqxoQGNPRURH6q'
+        'VOfRwpGqYDnIBh7qA4RUyPjo1X3ro141TBOewQUhLs09apbmPzCeLOdGQ9K/GyN7Wn3TH7XVvbX1'
+        't4OmtSWR66I5ou1BqyCPMzB1HtiSCDfpc4HOHOpkrAitvnqza8bGNBfpUYu5ZMhfB7MwZA+Jmh5H'
+        '4GF+FsGCuBKNX+uvchfAD2De+oI32SfBOwKm5MEEKmmNgQLnDEVceK+oWwZtbHHsWY6mNTfHgptu'
+        'tSStq9oF59au9y8sn7c4bbnvQZ+YSYwk/jNVANU7pu8r9oZAQs3TrYFTJBMg7ow3DXVNdnfjdSsf'
+        'twHupY+XGcuznf1OQb8FL0ovmagA1wMVi8uaYSq7NkyVtfxs/e4VKzRgfwKk1bhuHJUiivHsHCh3'
+        '1btrV7n7Tkh5ZWhxR4blzxgoVm6sK8wj+MhU4iFbzt8feFRwd8GLesutr6oEHxMnprIdKhXhDD4J'
+        'D84IIx5ZLnSIQyk/eHJ7JrjmgaJb/ulc/qp1JtXYn6ICqiGQ2+4iBm+B+nPFTz2s0/Q9JEeyEFLq'
+        'gC+CdvTbyvk/JMROLnZhv0OHpLy5Tq8Hln6k7A83foeLtJHrotymZGVpQtBHzYljAdvYLpgdgg9r'
+        'AyBdz6Olr78aS0NEKrjlVvv5IUeILNjFJJvQYYXcm4HwQ9oJ4glibW6hS3AwnuOUKNUipQ7TWBFb'
+        'qAtmLsH1yCLKQtWw4MjMCAkFaDvUEOugINaKb3uEWcn3KdSlD4qFC6s8RAIvBqt9y7wK5ONpWqhm'
+        'A8y0f/FhwbtylltgNiK2w8aHSqcJ3Cuguq2Am1F62cnvDXiNh1hyxC2jDXfX2LCaltIPw1XoIYFq'
+        'LT57mJSfKmv0DLhlj9yPjGP0+kRKjZxJkDoAPu+5l1VBAZ5EJ6RUMgc28hqlJ34bylEzFohI+r0v'
+        'fjNsL6RXNABV1JkewSLogYbEZNmPS/UUEVK8JzpLeCxyI0GNjcf/QTNhGJu1OjrejyA4ZhsSHgQG'
+        'lGD62/+co4Dy8ZQO1Y6xg2DxBspK/YCtecQTtq8HuEgM5+pd7JmESsTdhodCn7jOzDBwP6vtqnb3'
+        'hkonk+5Wm9mZ1wKfSEP8ogAhxC+H2z4rxs01LxWWIlj0RyfwKtjkHE2wUb+mEP9t2CY4FfzLA50+'
+        'n3HlPVmwACv1QojlIo+xzdKFQt5/oRJK1mpPLEgPii9m9VgmV5MQ941Hy3CqyDWIcDvwmIMbvb2/'
+        '3cHesrfBw77+yGwraqsF8sn/a4NNLUmbzQ92kbyymKgMdsVCL+NZYvzKMmXDOyeZ7CuUJZehl8xB'
+        'AVVVVZfblIe0/rtrWyhH7BcKM4XzPG71bdQQUc3jMPASKp9UWBAfeXgo3GiMk3wGYcAlGPmMXcVK'
+        'PKW3qRcmSSehWlVXBjG1NhZsQX55P1UeTpjTrPefwi/Id6N7OIqSXUSjsSeP1ZXXAMQef+QWNUrw'
+        '7VpnSjlAlqTWy6FPQUKlRddOA0mZe3Y0MPUzge3loskP9qK32j6KOWKbxmZSTclaUqB9GHjYJJai'
+        'ohOoDbnAXmC/VGBxRpDwMT356knbvBU+It5qULme6JlUTUfwfXlrsxVRO5AQUomp+TLQmxkc1bLX'
+        'eirKcQV/yQyskksfpC5Khbkvb8MjARH55fkfA2/hkspKqsJFShVq5E6PVVuXJwbV1IepSzogMz6H'
+        'iBoC2nK/sxUGHNq+KGbEtU5++DLx9UGlA4E7mwMECu8Jd/T5s/c+SK5XddIxAaUjINBW53bD0sfk'
+        'jsWglMguv1vL/dYyPdc3P8JHZhzgYfr+fwFjAdFGtQRPYvFBNVGLfkHEdJkJjAB7w1pajMiIdPUn'
+        'VbQgAAD8YuLmtTsExLTQx6meBmIUqsYVsZmeZIsR4CROA3LQrkrGrrYUB4y1H7nqyVkmByq6mz7H'
+        'BSZpBQCmLA/rGzvCHpoCYojQ2TbzJHHy7uxAdHpABKGrc+i+3/kwqvKzzwC7VAX+IJGyIBtJrbfk'
+        'cYpYCAw4sq5CKmQAey0Nd6L0gVsqHaDKrIFiuLyLaf772q2NDwFFDd+ZcBzyI3qMXyqFDSf6KxG3'
+        'YyUS2oEH3Wun1XTdQ5/Ul15t3evVtErpXSJ3FOz/Q4snmnitCPzFlbqiZLAwFdaLccKfp99CqTE3'
+        'l8K8KLkhniF/q2rbDE4RYCk52ZBp/5EDJJnB3OmgaYbJ0yKpUf/OkS0gGN8XW5TxF/fyBBQf6zw/'
+        'CUFcKmB3xuBFQ5/sn6B/+PbXWvhpEdRFvdk2N4sg4Ge1cOBkWtX0CTVfux3MbWl/zTFn6s4cue9F'
+        '9ZWBir3rBlVcCLqYgncKAohkRvzK995gPAb2C06x/HmY5SDfboiic+PUQ2NwvocP2Ig6lxN0mozU'
+        '9u0CCtNDqO6Ss943AQNFl1oK85+G5H8XAQ6daizdQKt6EOZdOoVYLnF++nwo5Yp08JIs4EckKmOa'
+        '6mOXWbXVAt8HDuaczyJNSXzoXS+6vUqXOUiPsQZ553Dy9neeT83y98+pWNTud2EUG2g0p1Fit456'
+        'bmWh+Koo35A3k7W1WP6KZNUKGWM/xO0c7MGUyIypVvlRunh15V0k/IRMhiElPmF13Sh39FkmxJLW'
+        'DJRGqgY2LrZRUU8+fexbo+dwUqMa7X/AS4TDgPR04Ki6uawNxPzWPTQJM+LxM1Qf45ipc+k3Ceiv'
+        '9AevGD1F3K1ivg5h+1Fo9y7wds5w4mjnWZDxY5wg6BfSQYUh7iGtB2GbGTojvy38aX3T2OKK6MGE'
+        'MMFHJXcJtcIyDpICRGZ5ZSeO+n6FBCnCOpXSA3Q4yDVHZ+9/NUl5BfzFeVQ6bkTgTwfpW4C9uQbo'
+        'nSkcs4QZhM00Kq4OE/IFFTyKMJvH5qUvuM/dvzJ97FRB9py+GHorV/UgWnRlP9MPFTsn15qMJ5Uh'
+        'Og6Ab/uYGqNXEevndY30f52jl4p1O1ZImPgLRdK7Z+mCPZaHK1sP+JjWLBfh0YLYh03JbDhesvKT'
+        '9AO6dUWebESeThQWCg3WOwuse80Y992jFPy1kbsN4JWLOmujKQxOl7L/vqrkyBHge9nRrGUKK4l3'
+        'zal8J8zzb5IP9LH9+5pOSF/OsStV4g1n+kqx5yjB8JJof32P93oW2k/cfoszasgHwPejS2dr71cy'
+        'Q7hIkmX0NptM7smtuAJOafQ6AxFqKasGf+M/82r/viGkoRdRLPXbUvV7uh4yKuMJZCfgmohM09fy'
+        'A9WamdsOyNZzkkfFZBoPxaTVOLtptEeuDKeT+nt2uAb3ssQI6Ejey2N7jNxvxN8Kz6mrLy8mKxfv'
+        'Ca8hIWlCIfaoSTwSEd47Yu5pyDCPycU6SdFjqjanOQ40ParMjCR5v5std6h3CmNI7NTI3SbaDrbn'
+        'KA23Cn4ifHFLbOdG2H5UkUwTvEE2jIUimKzyRr9gTxiI774DDt5+nwHmugqqCjCapoYp6NDUFLgW'
+        'AnHQacRTzjvEWP0iuO4/x8pY++LDy4NE+x1QZFVPtUyX+JajN1QlaSjm6FtcGqANrEmqfMEtfWQd'
+        'MhHd8wppU0/adOgdyEZuXILhmyv/pU62bO01x2tBdjNNeZmQcdtSKkFaDYtjwQB3NvDBhOPhz29n'
+        'UvGEsT/fHWDIPVEl7q7Hbtv5B4rFv1CYshnFYoqkwjahnPLQR0JjU8/2ycmeWTKeKfME50ZU6lCO'
+        'A6KlRco20cuiHpx3+HGRdgTTk2TcjPVHg2H055I1JlPdrs2rXJWXkEZ6kCYNdG1LZc+mr84VgdSD'
+        'UQOLsM7sgZTej9TPF2fcI8RdPI7i2OmH7mmx1+NyhJXrJbUBdEjeyYpjEjrQ/J83jhozJQdpK95h'
+        'CtqE+kBKqOzwgtDiKZAOXfOjnpAmZJHdzznFmXZ6kYhrrmW3p226+nobGCkX4GgsE6DR2q25LX3A'
+        'eAmlZh9kz3JdDhXEsUmr4UU7SnHO1UM14peHPbqPiS8U4mfVUq/5yGMsF0XyHh7LdoAdHS4pye/p'
+        'WGFKBQ4iuMABoiOq0Ug5QygQSOvYB3IpRkWL3I6Wkz/+2cPTyeSs3AeE+QQuGT3v5N7NYkS6x92U'
+        'B8LDtyTZ4eVb/OshOGGAl6V9DkWh/b55z/OD7aLbPsu/zF6rtzPlKv0OJqOiBF82GNwxKjXgRgIm'
+        'CquW5dVx2v3VwwxYFGoJWUg6QUDiDQmZSSCAft8wwC0ujOslTFj2Doybzlvl10DkURMmjV9WS8gX'
+        'WszaTCv1kkYI1essDxHE0oaguY9yLThuAikqXkvZ8jHT8oGhOyPwpAci9vICPukle4l+9wmEsW/q'
+        'io1mM2QYbLApHcelx8GdejCmsetx3/wVtLCi1zCZJzU1biRaFdlqAkwZYfcWZPu1hRzGlsIv/qP5'
+        'XFaYpCkEr7Kl0mKfT+4Eaj6p4kLYMk123ogUYNG8pZonvKZIeRPTkyazvF17cyMqK/cBKw4Um/8b'
+        'KGfLesDGXvj00me5HwFC81/B6gsqVRm0QzwwpAMPjsOxIKaOQUSnWD5RNzwPEp/fsUPF8Kv9M4OA'
+        'BSXna9ZwbBpD73Rl16LsjxjSB/9nNuTdmR+NtDBf9N1+qnQmDJWSKQnrXfurzN99nXZSospzX5Gp'
+        'v9URwPIcghYmkYJP9055eD15tG1dF43s25MJ55jYL41lLKd46XAqNY3qGHiqJhenoTCfoHTEVwCP'
+        'iYd6PwXgphGdWtj8I+nz3vcRWOphQ+ENTlIjP0K930ttQRqEdeEVH76XbFubo/aByQ1RF5lE+vWV'
+        'slP/aaHFzDyvEJ48FLyTSHEYiLZ5P2z12KN4DUKbKMk5YLtdwqNgSFdymC3lsI5H4i7vCHyqrzdP'
+        'AKFKrHJ2zzEBhVb7lRJyaIoQ1qE/LPUb+///DBtOOqJf0Pt5qZcFNJVWvsLc86tzC5GioMEZCQYj'
+        'etKwJASp2qhuLoPOzUDS6uR4KPSmUo+MwT/FIF8zGWJBgicB6z+Uo8DnOZcSQP+Q3b6H+Io+vr2B'
+        'fnoNiy+0IyTPrUj/D/NrS3yAULavUr/f7hl/IVzvDgNGjrvVvEVsrb5BfhFh8lM9n8bcsdsvGwn3'
+        'WEyIpZlLLDa26zXGChlzOQFOlKlTqzVNLzx+1UzVOuchy4pfInDZBkYZPQ+Dc4uIN2u5Beum6/L1'
+        'QknmVxx/B5HPg9lDNZgE8ZDI/BRxPpa1Ce+GBAY8vY815eAdN1hOk40L7FyX76ZRZQUqfnKHGXdM'
+        'mYZePfGJ7VeMalDuytvGUHDFUjfs0YWC9TTiiDVbXkuyrXLMxeKpXOEaQRII347vapOzokNib5Ef'
+        '4/yibVefdCmv/ZiF24IjDYE0ZvfqpX4UVkQGtP7G/fWjRkwuUE69hWIOncbGwbYCToI3DCPefd2u'
+        '6OoMzpF2xrSHonCaNAzKnZ4oiBzDufJgTz/wA0bhj3bvPCo3xCMjUmuSt1BHHFKrk7Fbo76AuHpQ'
+        'pzKvpPCMDZRzkYuNMi+UsfHZspgw/lCVHcy8QzcHOf/A6KYsAOdn6NfgAMEcs9ZP3pXkg/rIu/bo'
+        '/Eo2aCXA8/aV/xKT6ga1U2wQVxF2My7hZWpKd+SJkU5fGCoFYhcEfCI3NhHE8sru5j/Mp4ogt5Z2'
+        'o0wxTsr0bR4cbXslM6rjuLWPoyCWVciD6uRPq+ZHyDJyasOoOvIYNxgUuCD9I9WLlLBwhh+TzDQH'
+        'MPdKnEiyZBYjrH1dhapCMoVf1c6VgQsnpvAmQTu8CxV152cw61H/qmN8uCg1Ssz2i3a1Q9MIpXLd'
+        'NxCWOLOU4jAroBY9wTRyQW87KxK1ZXsVfJqsUevp3dIt+BdErlPnbOr3W2Xm+f431tS0gE+5DDVm'
+        'S1pgj8b7V0L8LgqVTNgSTtYd2xzLvHHhTgSliDzOodTIekjUHp0HbvymO8+/J5kKU3VL6B1ePWTF'
+        '02C3z+fyJ326q3XRotLTfRZuZMFInJRTfC16crrDyl1pmNKT2LFP0kFXNF4v+ybTm3u5HzBmOWLk'
+        'oQjKFtE4mWlcFcVwj51cjUHAO7xp2xwarq5drBQ+Q/Q09kWDO2XsNm0v6BXoS1zRkCABF7B9wrtv'
+        'GOrquoIvANBbcpRNCIm2iS/Sdb8MnZyCp4gTdqikdPU5bh1C8r7Dytxs/e55pvqk1C1D4vOmA5ea'
+        'hkmv3mafoPwt+8O2TkZZ6n8sy6jljtdb+MCdAGw5sAIxCM9YyoxUwzt8ldv1sb2HPjwv2RiXccb/'
+        'PDywd6eMpqQQKDjuqj2M0vPnVIe7p9lsfyNdDvanWMHvXXrlpl1WVivYXSI/tzu/yr8fAybsZllw'
+        'QvEBiJEeTMgF2YYwt4Pk8Rdog/eN7aWErjPsJLNgmmVcFDWUlgnqqYZ6STZU61fY9axnv0aDbLVD'
+        '6gQAHZI5nQ+lYO7dkUQnK+aO567kNg+D165WG13pUnAL/MPeoRuC6Do1jweLzPaQJoxwdEu/jgPd'
+        'icbSlsE89NkEFrUFPMTU5U0O5ltMnLYC9gjAUGnUfRwICjyX+4wdGjXhJ/GMltd+loxj3RYqUevX'
+        'CRHj74VO7ST86JVeBVii5cWEACLi84DQLxdSNWYXf5rjDkNtaY6U2kIoScGC3KeNb5y+kT+Q7esp'
+        'uBSSdAzCV2onrqj5Dwfa4ssIy1h1/V+5E8hnW2YCTzPC8UQ0vDI7kA5yF8YIRbHzqmxcWmFix152'
+        'cgMsTDUDYWAststX1k/D0tdjExUiE2BTEScK5ewyYKtQ8wIXyxmnIDf/wEfTgAJ3Iimcldli9Kuj'
+        'ARDOVJmx5Nuj/pK7XQSzsa8c3iPpceMMnSt8Ybs47zmQ9rgHqTEmxn2Cw/0Tud2AHTOZg81K/O2b'
+        '9Ci98GuixLSS1ZqrDMDKhrfAHp7DyeAqO7b+7vVsFz52B0mONqjZaleyuilq1OVbe/s53NpEozLg'
+        'AH1tU7OLS2dS6ZYAMCD2nde1bifPY0vxWxrdcUZBW+SbDeHqyxpAativV3o/n36B5G7fBxnlKmNi'
+        'r9Vil+XkkiHKWb67UaZrJcUlET0zwpHfgeMQeqEnFLCgPBPjAX0vBQrZgLWjN1d7Wx2Q6dQatHB6'
+        'vt4mrazWeXKZp/UVffgFeU4vkD8jMRXM88oqodbUOYMUKRQQqGLpgLBh5ROM0HWJTE0MxzARyL+t'
+        'jn5XbFkXhfFJWs5YSsxAXBQlLX6sALDDia3Ha357XYWOTSMEa4VTn7zvVk8mGqD9BN3w+KLxGLwg'
+        'CO5i6JM/ws22is6VX5Ktryg5lhD6bmM3be9+NXfderzQPcis6dLjiSy3RTVPlgDoe1RBcj92ecdR'
+        '0KG5mBx7k5PSSjV4MlK4YOpJ4EcYjHUcKKzmC835RAipQrAW2qp0TumwyL+R7zPkgOSW8nHx12LV'
+        'JZ4xMocEKEUrQSeZpgKz'
+    ),
+}